@@ -0,0 +1,76 @@
+"""
+Benchmark: ArgosBackend (modelos carregados uma vez, lotes por par de
+línguas) contra a tradução antiga palavra a palavra.
+
+    palavra a palavra - argostranslate.translate.translate(word, lang, "en")
+                        por palavra, tentando até 8 línguas com "auto"
+    lote              - ArgosBackend.translate_batch: uma tradução por par,
+                        com a língua detectada (ou uma por língua com "auto")
+
+Mostra o tempo de carregar os modelos separado do tempo de traduzir.
+Precisa do argostranslate e dos pacotes pt->en e es->en instalados.
+
+Uso:
+    python benchmarks/argos_backend.py [palavras]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from mython.translator import MYTHON_KEYWORDS, ArgosBackend  # noqa: E402
+
+WORDS = ["repita", "diga", "enquanto", "retorne", "senão", "tente", "importe", "quebre"]
+AUTO_LANGUAGES = ("pt", "es", "fr", "de", "it", "ru", "zh", "ja")
+
+
+def word_by_word(words, source_lang):
+    """A tradução antiga: uma chamada por palavra (e por língua, com "auto")."""
+    import argostranslate.translate
+
+    found = {}
+    for word in words:
+        for lang in (AUTO_LANGUAGES if source_lang == "auto" else (source_lang,)):
+            try:
+                translated = argostranslate.translate.translate(word, lang, "en").strip().lower()
+            except Exception:
+                continue
+            if source_lang != "auto" or translated in MYTHON_KEYWORDS:
+                found[word] = translated
+                break
+    return found
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    count = int(argv[0]) if argv else 200
+    try:
+        import argostranslate.translate  # noqa: F401
+    except ImportError:
+        print("argostranslate não instalado (pip install argostranslate)")
+        return 1
+    words = [WORDS[i % len(WORDS)] if i < len(WORDS) else f"nome{i}" for i in range(count)]
+
+    for source_lang in ("pt", "auto"):
+        start = time.perf_counter()
+        word_by_word(words, source_lang)
+        old = time.perf_counter() - start
+
+        backend = ArgosBackend()
+        start = time.perf_counter()
+        found = backend.translate_batch(words, source_lang)
+        total = time.perf_counter() - start
+        stats = backend.stats
+        keywords = sum(1 for value in found.values() if value in MYTHON_KEYWORDS)
+        print(f"origem {source_lang!r}, {count} palavras ({keywords} keywords):")
+        print(f"  palavra a palavra: {old * 1000:9.1f} ms")
+        print(f"  lote:              {total * 1000:9.1f} ms  = carregar {stats['load_seconds'] * 1000:.1f} ms "
+              f"({stats['pairs']} pares) + traduzir {stats['translate_seconds'] * 1000:.1f} ms "
+              f"({stats['batches']} lotes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
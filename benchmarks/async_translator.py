@@ -0,0 +1,97 @@
+"""
+Benchmark: backend assíncrono do LibreTranslate contra um servidor local.
+
+Sobe um servidor HTTP/1.1 local que imita o /translate do LibreTranslate
+(com uma latência fixa por requisição) e mede, para as palavras de um
+arquivo:
+    sequencial  - uma requisição por vez (concurrency=1)
+    concorrente - todas ao mesmo tempo (concurrency=N), conexões reaproveitadas
+Depois derruba o servidor e mostra o disjuntor: as primeiras chamadas
+falham ao conectar e as seguintes falham na hora, sem rede.
+
+Uso:
+    python benchmarks/async_translator.py [palavras] [latência ms]
+"""
+
+import json
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from mython.translator_async import AsyncLibreTranslateBackend, BackendUnavailable, CircuitBreaker  # noqa: E402
+
+KEYWORDS = {"dizer": "say", "se": "if", "enquanto": "while", "retornar": "return", "repetir": "repeat"}
+
+
+def serve(latency: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            time.sleep(latency)
+            body = json.dumps({"translatedText": KEYWORDS.get(request["q"], request["q"])}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    ThreadingHTTPServer.request_queue_size = 256
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    count = int(argv[0]) if argv else 64
+    latency = float(argv[1]) / 1000 if len(argv) > 1 else 0.05
+    words = list(KEYWORDS) + [f"nome{chr(97 + i % 26)}{i}" for i in range(count - len(KEYWORDS))]
+    server = serve(latency)
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    print(f"{len(words)} palavras, latência {latency * 1000:.0f} ms por requisição")
+
+    for label, concurrency in (("sequencial", 1), ("concorrente", len(words))):
+        backend = AsyncLibreTranslateBackend(url, concurrency=concurrency)
+        backend.translate_batch(["aquecer"])
+        start = time.perf_counter()
+        found = backend.translate_batch(words, "pt", "en")
+        seconds = time.perf_counter() - start
+        keywords = sum(1 for word in KEYWORDS if found.get(word) == KEYWORDS[word])
+        stats = backend.pool.stats
+        print(f"{label:>12}: {seconds * 1000:8.1f} ms  ({keywords} keywords, "
+              f"{stats['requests']} requisições em {stats['connections']} conexões)")
+        backend.close()
+
+    server.shutdown()
+    server.server_close()
+    backend = AsyncLibreTranslateBackend(url, concurrency=8, breaker=CircuitBreaker(failure_threshold=3, cooldown=30))
+    print("\nservidor fora do ar:")
+    for attempt in range(4):
+        start = time.perf_counter()
+        try:
+            backend.translate_batch(words, "pt", "en")
+            outcome = "respondeu?"
+        except BackendUnavailable as e:
+            outcome = str(e).split(": ", 1)[1]
+        print(f"  chamada {attempt + 1}: {(time.perf_counter() - start) * 1000:7.2f} ms  "
+              f"disjuntor {backend.breaker.state:<9}  {outcome}")
+    backend.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark: i18n.detect_language em programas grandes.
+
+Para cada língua (o mesmo programa em inglês, traduzido para pt e es),
+mede a detecção completa, a detecção por amostras (sample=True) e a
+repetição com o mesmo texto (cache pelo hash do código), e mostra a
+língua e a confiança detectadas.
+
+Uso:
+    python benchmarks/detect_language.py [linhas]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from mython import i18n  # noqa: E402
+
+STATEMENTS = [
+    'say "Hello, {n}!"  # greeting',
+    "ask number age_{n} \"Your age: \"",
+    "if age_{n} > {n}:",
+    "    say \"adult\"",
+    "else:",
+    "    return false",
+    "while counter_{n} < {n}:",
+    "    counter_{n} = counter_{n} + 1",
+    "for each item in items_{n}:",
+    "    add item to list_{n}",
+    "define total_{n} = value * rate",
+    "try:",
+    "    open file_{n}",
+]
+
+
+def program(lines: int) -> str:
+    return "\n".join(STATEMENTS[i % len(STATEMENTS)].format(n=i) for i in range(lines)) + "\n"
+
+
+def timed(func, *args, repeat: int = 5, **kwargs):
+    best = float("inf")
+    for _ in range(repeat):
+        i18n._detection_cache.clear()
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    lines = int(argv[0]) if argv else 20_000
+    source = program(lines)
+    print(f"{'língua':>6} {'KB':>6} {'completo ms':>12} {'amostra ms':>11} {'cache µs':>9}  resultado")
+    for lang in ("en", "pt", "es"):
+        code = source if lang == "en" else i18n.translate_code(source, lang=lang, source_lang="en")
+        full, result = timed(i18n.detect_language_with_confidence, code)
+        sampled, sampled_result = timed(i18n.detect_language_with_confidence, code, sample=True)
+        i18n.detect_language(code)
+        start = time.perf_counter()
+        i18n.detect_language(code)
+        cached = time.perf_counter() - start
+        print(
+            f"{lang:>6} {len(code) / 1024:>6.0f} {full * 1000:>12.2f} {sampled * 1000:>11.2f} "
+            f"{cached * 1e6:>9.1f}  {result[0]} ({result[1]:.2f}), amostra {sampled_result[0]} ({sampled_result[1]:.2f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark: dicts sem aspas nas chaves ({name: "John"} -> {"name": "John"}).
+
+As chaves sem aspas são aceitas pela gramática (pair: (STRING | NAME) ":"
+expr) e recebem aspas no transformer, então o pré-processamento textual
+não olha para chaves: arquivos sem dicts não pagam nada e chaves dentro de
+strings nunca são tocadas.
+
+Primeiro confere os casos de correção (dicts aninhados, chaves dentro de
+strings e f-strings, dict vazio); depois mede a vazão do pré-processamento
+(normalize_operators) e da transpilação completa em 10 mil linhas.
+
+Uso:
+    python benchmarks/dict_literals.py [linhas]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from mython.transpiler_lark import normalize_operators, transpile_string  # noqa: E402
+
+CASES = [
+    ('dict d = {name: "John", age: 30}', 'd = {"name": "John", "age": 30}'),
+    ('say {a: {b: 1, "c": {d: [1, 2]}}, "e": 2}', 'print({"a": {"b": 1, "c": {"d": [1, 2]}}, "e": 2})'),
+    ('say "use {x: 1} here"', 'print("use {x: 1} here")'),
+    ('say "{x:.2f}"', 'print("{x:.2f}")'),
+    ('say {msg: "a {b: c} d"}', 'print({"msg": "a {b: c} d"})'),
+    ('dict e = {}', 'e = {}'),
+    ('set s = {a, b}', 's = {a, b}'),
+]
+
+
+def check():
+    failures = 0
+    for source, expected in CASES:
+        try:
+            output = transpile_string(source + "\n", lang="en", use_hybrid_translator=False)
+        except SyntaxError as e:
+            output = f"SyntaxError: {str(e).splitlines()[0]}"
+        if output != expected:
+            failures += 1
+            print(f"FALHOU: {source!r}\n  esperado: {expected!r}\n  obtido:   {output!r}")
+    print(f"casos de correção: {len(CASES) - failures}/{len(CASES)} ok\n")
+    return failures == 0
+
+
+def program(lines: int, with_dicts: bool) -> str:
+    out = []
+    for i in range(lines):
+        if with_dicts and i % 2 == 0:
+            out.append(f'dict d{i} = {{name: "item {i}", size: {i}, tags: {{kind: "x", n: [1, 2]}}}}')
+        else:
+            out.append(f'say "line {i}"')
+    return "\n".join(out) + "\n"
+
+
+def best_of(func, arg, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    lines = int(argv[0]) if argv else 10_000
+    ok = check()
+
+    def transpile(code):
+        return transpile_string(code, lang="en", use_hybrid_translator=False)
+
+    print(f"{'entrada':>10} {'etapa':>12} {'ms':>9} {'MB/s':>8}")
+    for label, with_dicts in (("sem dicts", False), ("com dicts", True)):
+        code = program(lines, with_dicts)
+        size = len(code.encode("utf-8")) / 1e6
+        for stage, func, repeat in (("normalize", normalize_operators, 7), ("transpilar", transpile, 3)):
+            seconds = best_of(func, code, repeat)
+            print(f"{label:>10} {stage:>12} {seconds * 1000:>9.2f} {size / seconds:>8.2f}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+"""
+Benchmark: i18n.translate_code em um programa em português de 5 mil linhas.
+
+Compara três versões do tradutor de palavras-chave:
+    original   - a versão antiga: por linha, um re.sub por palavra (as
+                 maiores primeiro) e, para palavras fora do dicionário, uma
+                 varredura do dicionário inteiro chamando remove_accents
+    por linha  - por linha, consulta ao índice em cache (palavra a palavra)
+    tokens     - translate_code atual: uma passada de tokens sobre o texto
+                 todo, com strings/comentários intactos e frases
+                 ("senão se", "caso contrário") pela trie
+
+As saídas diferem onde as versões antigas erravam: palavras dentro de
+strings e comentários eram traduzidas e frases de várias palavras viravam
+palavra a palavra ("senão se" -> "else if"). O benchmark mostra quantas
+linhas mudaram e alguns exemplos.
+
+Uso:
+    python benchmarks/i18n_translate.py [linhas]
+"""
+
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from mython.i18n import get_dictionary, load_dictionary, remove_accents, translate_code  # noqa: E402
+from mython.patterns import WORD_RE  # noqa: E402
+
+STATEMENTS = [
+    'diga "Olá, {name}! Se quiser, continue."',
+    "perguntar numero idade_{n} \"Digite sua idade: \"",
+    "se idade_{n} > {n}:",
+    "    diga \"Você é adulto\"  # maior de idade",
+    "senão se idade_{n} == {n}:",
+    "    retornar verdadeiro",
+    "caso contrário:",
+    "    retornar falso",
+    "enquanto contador_{n} < {n}:",
+    "    contador_{n} = contador_{n} + 1",
+    "para cada item em itens_{n}:",
+    "    imprimir item",
+    "função calcular_{n}(valor, taxa):",
+    "    total = valor * taxa  # sem acento: funcao, senao",
+    "classe Cliente{n}:",
+    "    @método estático",
+    "tentar:",
+    "    abrir arquivo_{n}",
+    "exceto Erro como e:",
+    "    diga e",
+]
+
+
+def program(lines: int) -> str:
+    rng = random.Random(lines)
+    names = ["Ana", "João", "Maria", "José"]
+    return "\n".join(
+        rng.choice(STATEMENTS).format(n=i, name=rng.choice(names)) for i in range(lines)
+    ) + "\n"
+
+
+def original_translate_code(code: str, lang: str) -> str:
+    """A tradução antiga (lang -> en), como era antes dos índices."""
+    dictionary = {v: k for k, v in load_dictionary(lang).items()}
+    for word_lang, word_en in list(dictionary.items()):
+        word_lang_no_accents = remove_accents(word_lang)
+        if word_lang_no_accents != word_lang and word_lang_no_accents not in dictionary:
+            dictionary[word_lang_no_accents] = word_en
+    translated_lines = []
+    for line in code.split("\n"):
+        for original_word in sorted(set(re.findall(r"\b\w+\b", line)), key=len, reverse=True):
+            normalized_word = remove_accents(original_word)
+            translation = dictionary.get(original_word) or dictionary.get(normalized_word)
+            if translation is None:
+                for dict_word, dict_translation in dictionary.items():
+                    if remove_accents(dict_word) == normalized_word:
+                        translation = dict_translation
+                        break
+            if translation:
+                line = re.sub(r"\b" + re.escape(original_word) + r"\b", translation, line)
+        translated_lines.append(line)
+    return "\n".join(translated_lines)
+
+
+def line_translate_code(code: str, lang: str) -> str:
+    """Por linha, com o índice em cache (palavra a palavra)."""
+    index = get_dictionary(lang).reverse
+    translated_lines = []
+    for line in code.split("\n"):
+        translations = {}
+        for word in set(WORD_RE.findall(line)):
+            translation = index.lookup(word)
+            if translation:
+                translations[word] = translation
+        if translations:
+            line = WORD_RE.sub(lambda m: translations.get(m.group(), m.group()), line)
+        translated_lines.append(line)
+    return "\n".join(translated_lines)
+
+
+def token_translate_code(code: str, lang: str) -> str:
+    return translate_code(code, lang=lang, reverse=True)
+
+
+def best_of(func, code: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(code, "pt")
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    lines = int(argv[0]) if argv else 5_000
+    code = program(lines)
+    # Aquecer dicionários, índices e padrões
+    token_translate_code(code, "pt")
+
+    print(f"programa: {lines} linhas em português (pt -> en)")
+    print(f"{'versão':>10} {'ms':>10} {'µs/linha':>9}")
+    results = {}
+    for label, func, repeat in (
+        ("original", original_translate_code, 1),
+        ("por linha", line_translate_code, 5),
+        ("tokens", token_translate_code, 5),
+    ):
+        seconds = best_of(func, code, repeat)
+        results[label] = func(code, "pt")
+        print(f"{label:>10} {seconds * 1000:>10.2f} {seconds / lines * 1e6:>9.2f}")
+
+    old_lines = results["original"].split("\n")
+    new_lines = results["tokens"].split("\n")
+    changed = [(a, b) for a, b in zip(old_lines, new_lines) if a != b]
+    print(f"\nlinhas diferentes (original x tokens): {len(changed)}")
+    for a, b in list(dict.fromkeys(changed))[:6]:
+        print(f"  - {a.strip()}\n  + {b.strip()}")
+
+
+if __name__ == "__main__":
+    main()
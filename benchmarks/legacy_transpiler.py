@@ -0,0 +1,179 @@
+"""
+Benchmark: translate_line do transpiler legado (mython.transpiler).
+
+Compara a versão atual (tabela por primeira palavra) com a cadeia de
+`if stripped.startswith(...)` de uma revisão anterior do arquivo, lida com
+`git show`:
+
+    1. Equivalência: toda linha de examples/*.logic (com e sem contexto de
+       classe/decorator) e o resultado de transpile_file de cada exemplo
+       precisam ser iguais às saídas da revisão de referência, gravadas em
+       tests/data/legacy_transpiler_baseline.json junto com o hash da
+       revisão (verificadas também pelo pytest, em
+       tests/test_legacy_transpiler.py; não precisam do git).
+    2. Tempo por linha de uma construção do início da cadeia, de uma do
+       fim e de uma linha sem construção (Python puro), e de transpile_file
+       nos exemplos (tradução mais detecção dos imports do cabeçalho).
+
+A comparação de tempo lê a revisão com `git show`. Por padrão, é a
+revisão gravada no baseline; depois de um rebase, o hash gravado pode não
+existir mais: passe a revisão equivalente como argumento (e regrave o
+baseline com ela).
+
+Uso:
+    python benchmarks/legacy_transpiler.py [revisão]   (padrão: a do baseline)
+    python benchmarks/legacy_transpiler.py --write-baseline <revisão>
+"""
+
+import importlib.util
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from mython import transpiler  # noqa: E402
+
+BASELINE = ROOT / "tests" / "data" / "legacy_transpiler_baseline.json"
+
+# Contextos de translate_line: (in_class, has_staticmethod, has_classmethod)
+CONTEXTS = [(False, False, False), (True, False, False), (True, True, False), (True, False, True)]
+
+TIMED = [
+    ("início (say)", 'say "hello"'),
+    ("fim (exit program)", "exit program"),
+    ("sem construção", "print(total)"),
+]
+
+
+def resolve_revision(rev: str) -> str:
+    """Hash completo da revisão `rev` (SystemExit se ela não existir)."""
+    result = subprocess.run(
+        ["git", "rev-parse", "--verify", "--quiet", f"{rev}^{{commit}}"],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise SystemExit(
+            f"revisão de referência {rev!r} não encontrada neste repositório "
+            "(rebase?); passe como argumento a última revisão com a cadeia de ifs"
+        )
+    return result.stdout.strip()
+
+
+def load_reference(rev: str):
+    """Importa o mython/transpiler.py da revisão `rev`."""
+    source = subprocess.run(
+        ["git", "show", f"{resolve_revision(rev)}:mython/transpiler.py"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    ).stdout
+    path = Path(tempfile.mkdtemp()) / "transpiler_reference.py"
+    path.write_text(source, encoding="utf-8")
+    spec = importlib.util.spec_from_file_location("transpiler_reference", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def example_outputs(module) -> dict:
+    """
+    Saídas de `module` para cada exemplo, no formato do baseline:
+    {"nome.logic": {"lines": [...], "transpile_file": "..."}}, com uma
+    string por linha quando os quatro contextos concordam e uma lista
+    (na ordem de CONTEXTS) quando não.
+    """
+    outputs = {}
+    for example in sorted((ROOT / "examples").glob("*.logic")):
+        lines = []
+        for line in example.read_text(encoding="utf-8").splitlines():
+            translated = [module.translate_line(line, *context) for context in CONTEXTS]
+            lines.append(translated[0] if len(set(translated)) == 1 else translated)
+        outputs[example.name] = {"lines": lines, "transpile_file": module.transpile_file(str(example))}
+    return outputs
+
+
+def read_baseline() -> dict:
+    """{"revision": hash da revisão de referência, "examples": saídas (ver example_outputs)}."""
+    return json.loads(BASELINE.read_text(encoding="utf-8"))
+
+
+def write_baseline(rev: str):
+    revision = resolve_revision(rev)
+    baseline = {"revision": revision, "examples": example_outputs(load_reference(revision))}
+    with open(BASELINE, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, ensure_ascii=False, indent=1, sort_keys=True)
+        f.write("\n")
+    print(f"baseline de {revision[:12]} gravado em {BASELINE.relative_to(ROOT)}")
+
+
+def check_examples() -> int:
+    """Número de diferenças entre a versão atual e o baseline nos exemplos."""
+    expected = read_baseline()["examples"]
+    got = example_outputs(transpiler)
+    diffs = 0
+    lines = 0
+    for name in sorted(set(expected) | set(got)):
+        if name not in expected or name not in got:
+            diffs += 1
+            print(f"  {name}: só em {'baseline' if name in expected else 'examples/'}")
+            continue
+        lines += len(got[name]["lines"])
+        for number, (before, after) in enumerate(zip(expected[name]["lines"], got[name]["lines"]), 1):
+            if before != after:
+                diffs += 1
+                print(f"  {name}:{number}: {before!r} != {after!r}")
+        if len(expected[name]["lines"]) != len(got[name]["lines"]):
+            diffs += 1
+            print(f"  {name}: número de linhas difere do baseline")
+        if expected[name]["transpile_file"] != got[name]["transpile_file"]:
+            diffs += 1
+            print(f"  {name}: transpile_file difere")
+    print(f"equivalência: {len(got)} exemplos, {lines} linhas, {diffs} diferenças")
+    return diffs
+
+
+def best_of(func, line: str, repeat: int = 7, number: int = 20_000) -> float:
+    """Melhor tempo médio por chamada, em µs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func(line)
+        best = min(best, time.perf_counter() - start)
+    return best / number * 1e6
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "--write-baseline":
+        if len(argv) < 2:
+            print("uso: legacy_transpiler.py --write-baseline <revisão>", file=sys.stderr)
+            return 2
+        write_baseline(argv[1])
+        return 0
+    diffs = check_examples()
+    reference = load_reference(argv[0] if argv else read_baseline()["revision"])
+
+    print(f"{'linha':>20} {'cadeia µs':>10} {'tabela µs':>10}")
+    for label, line in TIMED:
+        before = best_of(reference.translate_line, line)
+        after = best_of(transpiler.translate_line, line)
+        print(f"{label:>20} {before:>10.2f} {after:>10.2f}")
+
+    examples = [str(path) for path in sorted((ROOT / "examples").glob("*.logic"))]
+    lines = sum(len(Path(path).read_text(encoding="utf-8").splitlines()) for path in examples)
+
+    def transpile_all(module):
+        return lambda _: [module.transpile_file(path) for path in examples]
+
+    before = best_of(transpile_all(reference), "", number=5) / lines
+    after = best_of(transpile_all(transpiler), "", number=5) / lines
+    print(f"{'transpile_file':>20} {before:>10.2f} {after:>10.2f}")
+    return 1 if diffs else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""
+Benchmark: normalize_operators em entradas de 10 mil linhas.
+
+Três perfis de entrada:
+    condições  - toda linha é um if/elif/while com frases naturais
+    misto      - 1 condição a cada 5 linhas (o resto é say/atribuição)
+    sem cond.  - nenhuma condição (só o custo de varrer o texto)
+
+Uso:
+    python benchmarks/normalize_operators.py [linhas]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from mython.transpiler_lark import normalize_operators  # noqa: E402
+
+CONDITIONS = [
+    "if age is greater than or equal to {n}:",
+    "elif score is less than {n}:",
+    "while count is not equal to {n}:",
+    "if name is \"Ana\" and age is at least {n}:",
+    "if item is not in items:",
+    "whenever total equals {n}:",
+    "if x is over {n} or y is below {n}:",
+]
+STATEMENTS = [
+    "say \"value is {n}\"",
+    "total = total + {n}",
+    "items = [{n}, {n}, {n}]",
+    "result = compute(total, {n})",
+]
+
+
+def program(lines: int, every: int) -> str:
+    """`lines` linhas, com uma condição a cada `every` (0 = nenhuma)."""
+    rng = random.Random(lines * 31 + every)
+    out = []
+    for i in range(lines):
+        if every and i % every == 0:
+            out.append(rng.choice(CONDITIONS).format(n=i))
+        else:
+            out.append("    " + rng.choice(STATEMENTS).format(n=i))
+    return "\n".join(out) + "\n"
+
+
+def best_of(func, arg, repeat: int = 7) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    lines = int(argv[0]) if argv else 10_000
+    print(f"{'entrada':>10} {'linhas':>7} {'ms':>9} {'µs/linha':>9}")
+    for label, every in (("condições", 1), ("misto", 5), ("sem cond.", 0)):
+        seconds = best_of(normalize_operators, program(lines, every))
+        print(f"{label:>10} {lines:>7} {seconds * 1000:>9.2f} {seconds / lines * 1e6:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
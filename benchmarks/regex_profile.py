@@ -0,0 +1,76 @@
+"""
+Perfil: quanto do pré-processamento é gasto dentro do módulo `re`.
+
+Roda, para cada examples/*.logic, as etapas textuais do pipeline -
+detect_language, i18n.translate_code (en -> pt/es e de volta),
+translator.translate_code e normalize_operators - sob o cProfile, e soma
+o tempo próprio das funções do `re` (compilação de padrões, cache de
+padrões e os métodos de re.Pattern). As traduções online/offline ficam
+desligadas para o perfil medir só o código local.
+
+Uso:
+    python benchmarks/regex_profile.py [repetições]
+"""
+
+import cProfile
+import pstats
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from mython import translator  # noqa: E402
+from mython.i18n import detect_language, translate_code  # noqa: E402
+from mython.transpiler_lark import normalize_operators  # noqa: E402
+
+
+def _is_re(func) -> bool:
+    filename, _, name = func
+    if "re.Pattern" in name or "_sre" in name or "re.Match" in name:
+        return True
+    path = filename.replace("\\", "/")
+    return any(part in path for part in ("/re/", "/re.py", "/sre_", "/functools.py"))
+
+
+def run_corpus(sources, repeat: int):
+    for _ in range(repeat):
+        for code in sources:
+            detect_language(code)
+            for lang in ("pt", "es"):
+                translated = translate_code(code, lang=lang, source_lang="en")
+                translate_code(translated, lang=lang, reverse=True)
+            translator.translate_code(code)
+            normalize_operators(code)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    repeat = int(argv[0]) if argv else 2
+    sources = [p.read_text(encoding="utf-8") for p in sorted((ROOT / "examples").glob("*.logic"))]
+
+    # Sem rede nem Argos: cada palavra cai direto no "não é keyword"
+    translator.set_backend(translator.ChainBackend([]))
+
+    run_corpus(sources, 1)  # aquecer caches de padrões e dicionários
+    profiler = cProfile.Profile()
+    profiler.enable()
+    run_corpus(sources, repeat)
+    profiler.disable()
+
+    stats = pstats.Stats(profiler).stats
+    total = sum(entry[2] for entry in stats.values())
+    regex = {func: entry for func, entry in stats.items() if _is_re(func)}
+    regex_total = sum(entry[2] for entry in regex.values())
+
+    print(f"arquivos: {len(sources)}  repetições: {repeat}")
+    print(f"tempo total: {total * 1000:9.1f} ms")
+    print(f"tempo em re: {regex_total * 1000:9.1f} ms ({regex_total / total:.0%})")
+    print()
+    print(f"{'chamadas':>9} {'ms':>9}  função")
+    for func, entry in sorted(regex.items(), key=lambda item: item[1][2], reverse=True)[:12]:
+        print(f"{entry[1]:>9} {entry[2] * 1000:>9.1f}  {pstats.func_std_string(func)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark: custo do MythonTransformer em função da profundidade de aninhamento.
+
+Gera programas com N blocos if/for/while aninhados (e um statement por
+nível), parseia uma vez e mede só a transformação. Também conta quantas
+vezes cada nó é visitado - deve ser 1 (nenhuma subárvore é transformada
+de novo pelos níveis de cima).
+
+Como cada linha é indentada com 4 espaços por nível, o tamanho da saída
+cresce com o quadrado da profundidade; a coluna ns/byte (tempo por byte
+gerado) deve ficar constante.
+
+Uso:
+    python benchmarks/transformer_depth.py [profundidades...]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from mython.parser_cache import get_parser  # noqa: E402
+from mython.transformer_lark import MythonTransformer  # noqa: E402
+from mython.transpiler_lark import normalize_operators  # noqa: E402
+
+HEADERS = ["if x > {i}:", "for item in items:", "while y < {i}:"]
+
+
+def nested_program(depth: int) -> str:
+    """Programa com `depth` blocos aninhados."""
+    lines = []
+    for i in range(depth):
+        lines.append("    " * i + HEADERS[i % len(HEADERS)].format(i=i))
+        lines.append("    " * (i + 1) + f'say "level {i}"')
+    return "\n".join(lines) + "\n"
+
+
+class CountingTransformer(MythonTransformer):
+    """Conta as chamadas de métodos do transformer (uma por nó visitado)."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = 0
+
+    def _call_userfunc(self, tree, new_children=None):
+        self.calls += 1
+        return super()._call_userfunc(tree, new_children)
+
+
+def measure(depth: int, repeat: int = 5):
+    code = normalize_operators(nested_program(depth))
+    tree = get_parser().parse(code)
+    nodes = sum(1 for _ in tree.iter_subtrees())
+
+    counter = CountingTransformer(source_code=code)
+    counter.transform(tree)
+
+    best = float("inf")
+    for _ in range(repeat):
+        transformer = MythonTransformer(source_code=code)
+        start = time.perf_counter()
+        output = transformer.transform(tree)
+        best = min(best, time.perf_counter() - start)
+    return best, nodes, counter.calls, len(output)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    depths = [int(d) for d in argv] or [25, 50, 100, 200]
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 20 * max(depths)))
+
+    print(f"{'profundidade':>12} {'nós':>6} {'visitas':>8} {'saída (KB)':>11} {'ms':>9} {'ns/byte':>8}")
+    for depth in depths:
+        seconds, nodes, calls, size = measure(depth)
+        print(f"{depth:>12} {nodes:>6} {calls:>8} {size / 1024:>11.1f} "
+              f"{seconds * 1000:>9.3f} {seconds / size * 1e9:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
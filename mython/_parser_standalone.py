@@ -0,0 +1,11211 @@
+# Gerado por `mython --build-standalone` com Lark v1.3.1 - NÃO EDITAR
+__version__ = "1.3.1"
+
+#
+#
+#   Lark Stand-alone Generator Tool
+# ----------------------------------
+# Generates a stand-alone LALR(1) parser
+#
+# Git:    https://github.com/erezsh/lark
+# Author: Erez Shinan (erezshin@gmail.com)
+#
+#
+#    >>> LICENSE
+#
+#    This tool and its generated code use a separate license from Lark,
+#    and are subject to the terms of the Mozilla Public License, v. 2.0.
+#    If a copy of the MPL was not distributed with this
+#    file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#    If you wish to purchase a commercial license for this tool and its
+#    generated code, you may contact me via email or otherwise.
+#
+#    If MPL2 is incompatible with your free or open-source project,
+#    contact me and we'll work it out.
+#
+#
+
+from copy import deepcopy
+from abc import ABC, abstractmethod
+from types import ModuleType
+from typing import (
+    TypeVar, Generic, Type, Tuple, List, Dict, Iterator, Collection, Callable, Optional, FrozenSet, Any,
+    Union, Iterable, IO, TYPE_CHECKING, overload, Sequence,
+    Pattern as REPattern, ClassVar, Set, Mapping
+)
+
+
+class LarkError(Exception):
+    pass
+
+
+class ConfigurationError(LarkError, ValueError):
+    pass
+
+
+def assert_config(value, options: Collection, msg='Got %r, expected one of %s'):
+    if value not in options:
+        raise ConfigurationError(msg % (value, options))
+
+
+class GrammarError(LarkError):
+    pass
+
+
+class ParseError(LarkError):
+    pass
+
+
+class LexError(LarkError):
+    pass
+
+T = TypeVar('T')
+
+class UnexpectedInput(LarkError):
+    #--
+    line: int
+    column: int
+    pos_in_stream = None
+    state: Any
+    _terminals_by_name = None
+    interactive_parser: 'InteractiveParser'
+
+    def get_context(self, text: str, span: int=40) -> str:
+        #--
+        pos = self.pos_in_stream or 0
+        start = max(pos - span, 0)
+        end = pos + span
+        if not isinstance(text, bytes):
+            before = text[start:pos].rsplit('\n', 1)[-1]
+            after = text[pos:end].split('\n', 1)[0]
+            return before + after + '\n' + ' ' * len(before.expandtabs()) + '^\n'
+        else:
+            before = text[start:pos].rsplit(b'\n', 1)[-1]
+            after = text[pos:end].split(b'\n', 1)[0]
+            return (before + after + b'\n' + b' ' * len(before.expandtabs()) + b'^\n').decode("ascii", "backslashreplace")
+
+    def match_examples(self, parse_fn: 'Callable[[str], Tree]',
+                             examples: Union[Mapping[T, Iterable[str]], Iterable[Tuple[T, Iterable[str]]]],
+                             token_type_match_fallback: bool=False,
+                             use_accepts: bool=True
+                         ) -> Optional[T]:
+        #--
+        assert self.state is not None, "Not supported for this exception"
+
+        if isinstance(examples, Mapping):
+            examples = examples.items()
+
+        candidate = (None, False)
+        for i, (label, example) in enumerate(examples):
+            assert not isinstance(example, str), "Expecting a list"
+
+            for j, malformed in enumerate(example):
+                try:
+                    parse_fn(malformed)
+                except UnexpectedInput as ut:
+                    if ut.state == self.state:
+                        if (
+                            use_accepts
+                            and isinstance(self, UnexpectedToken)
+                            and isinstance(ut, UnexpectedToken)
+                            and ut.accepts != self.accepts
+                        ):
+                            logger.debug("Different accepts with same state[%d]: %s != %s at example [%s][%s]" %
+                                         (self.state, self.accepts, ut.accepts, i, j))
+                            continue
+                        if (
+                            isinstance(self, (UnexpectedToken, UnexpectedEOF))
+                            and isinstance(ut, (UnexpectedToken, UnexpectedEOF))
+                        ):
+                            if ut.token == self.token:  ##
+
+                                logger.debug("Exact Match at example [%s][%s]" % (i, j))
+                                return label
+
+                            if token_type_match_fallback:
+                                ##
+
+                                if (ut.token.type == self.token.type) and not candidate[-1]:
+                                    logger.debug("Token Type Fallback at example [%s][%s]" % (i, j))
+                                    candidate = label, True
+
+                        if candidate[0] is None:
+                            logger.debug("Same State match at example [%s][%s]" % (i, j))
+                            candidate = label, False
+
+        return candidate[0]
+
+    def _format_expected(self, expected):
+        if self._terminals_by_name:
+            d = self._terminals_by_name
+            expected = [d[t_name].user_repr() if t_name in d else t_name for t_name in expected]
+        return "Expected one of: \n\t* %s\n" % '\n\t* '.join(expected)
+
+
+class UnexpectedEOF(ParseError, UnexpectedInput):
+    #--
+    expected: 'List[Token]'
+
+    def __init__(self, expected, state=None, terminals_by_name=None):
+        super(UnexpectedEOF, self).__init__()
+
+        self.expected = expected
+        self.state = state
+        from .lexer import Token
+        self.token = Token("<EOF>", "")  ##
+
+        self.pos_in_stream = -1
+        self.line = -1
+        self.column = -1
+        self._terminals_by_name = terminals_by_name
+
+
+    def __str__(self):
+        message = "Unexpected end-of-input. "
+        message += self._format_expected(self.expected)
+        return message
+
+
+class UnexpectedCharacters(LexError, UnexpectedInput):
+    #--
+
+    allowed: Set[str]
+    considered_tokens: Set[Any]
+
+    def __init__(self, seq, lex_pos, line, column, allowed=None, considered_tokens=None, state=None, token_history=None,
+                 terminals_by_name=None, considered_rules=None):
+        super(UnexpectedCharacters, self).__init__()
+
+        ##
+
+        self.line = line
+        self.column = column
+        self.pos_in_stream = lex_pos
+        self.state = state
+        self._terminals_by_name = terminals_by_name
+
+        self.allowed = allowed
+        self.considered_tokens = considered_tokens
+        self.considered_rules = considered_rules
+        self.token_history = token_history
+
+        if isinstance(seq, bytes):
+            self.char = seq[lex_pos:lex_pos + 1].decode("ascii", "backslashreplace")
+        else:
+            self.char = seq[lex_pos]
+        self._context = self.get_context(seq)
+
+
+    def __str__(self):
+        message = "No terminal matches '%s' in the current parser context, at line %d col %d" % (self.char, self.line, self.column)
+        message += '\n\n' + self._context
+        if self.allowed:
+            message += self._format_expected(self.allowed)
+        if self.token_history:
+            message += '\nPrevious tokens: %s\n' % ', '.join(repr(t) for t in self.token_history)
+        return message
+
+
+class UnexpectedToken(ParseError, UnexpectedInput):
+    #--
+
+    expected: Set[str]
+    considered_rules: Set[str]
+
+    def __init__(self, token, expected, considered_rules=None, state=None, interactive_parser=None, terminals_by_name=None, token_history=None):
+        super(UnexpectedToken, self).__init__()
+
+        ##
+
+        self.line = getattr(token, 'line', '?')
+        self.column = getattr(token, 'column', '?')
+        self.pos_in_stream = getattr(token, 'start_pos', None)
+        self.state = state
+
+        self.token = token
+        self.expected = expected  ##
+
+        self._accepts = NO_VALUE
+        self.considered_rules = considered_rules
+        self.interactive_parser = interactive_parser
+        self._terminals_by_name = terminals_by_name
+        self.token_history = token_history
+
+
+    @property
+    def accepts(self) -> Set[str]:
+        if self._accepts is NO_VALUE:
+            self._accepts = self.interactive_parser and self.interactive_parser.accepts()
+        return self._accepts
+
+    def __str__(self):
+        message = ("Unexpected token %r at line %s, column %s.\n%s"
+                   % (self.token, self.line, self.column, self._format_expected(self.accepts or self.expected)))
+        if self.token_history:
+            message += "Previous tokens: %r\n" % self.token_history
+
+        return message
+
+
+
+class VisitError(LarkError):
+    #--
+
+    obj: 'Union[Tree, Token]'
+    orig_exc: Exception
+
+    def __init__(self, rule, obj, orig_exc):
+        message = 'Error trying to process rule "%s":\n\n%s' % (rule, orig_exc)
+        super(VisitError, self).__init__(message)
+
+        self.rule = rule
+        self.obj = obj
+        self.orig_exc = orig_exc
+
+
+class MissingVariableError(LarkError):
+    pass
+
+
+import sys, re
+import logging
+from dataclasses import dataclass
+from typing import Generic, AnyStr
+
+logger: logging.Logger = logging.getLogger("lark")
+logger.addHandler(logging.StreamHandler())
+##
+
+##
+
+logger.setLevel(logging.CRITICAL)
+
+
+NO_VALUE = object()
+
+T = TypeVar("T")
+
+
+def classify(seq: Iterable, key: Optional[Callable] = None, value: Optional[Callable] = None) -> Dict:
+    d: Dict[Any, Any] = {}
+    for item in seq:
+        k = key(item) if (key is not None) else item
+        v = value(item) if (value is not None) else item
+        try:
+            d[k].append(v)
+        except KeyError:
+            d[k] = [v]
+    return d
+
+
+def _deserialize(data: Any, namespace: Dict[str, Any], memo: Dict) -> Any:
+    if isinstance(data, dict):
+        if '__type__' in data:  ##
+
+            class_ = namespace[data['__type__']]
+            return class_.deserialize(data, memo)
+        elif '@' in data:
+            return memo[data['@']]
+        return {key:_deserialize(value, namespace, memo) for key, value in data.items()}
+    elif isinstance(data, list):
+        return [_deserialize(value, namespace, memo) for value in data]
+    return data
+
+
+_T = TypeVar("_T", bound="Serialize")
+
+class Serialize:
+    #--
+
+    def memo_serialize(self, types_to_memoize: List) -> Any:
+        memo = SerializeMemoizer(types_to_memoize)
+        return self.serialize(memo), memo.serialize()
+
+    def serialize(self, memo = None) -> Dict[str, Any]:
+        if memo and memo.in_types(self):
+            return {'@': memo.memoized.get(self)}
+
+        fields = getattr(self, '__serialize_fields__')
+        res = {f: _serialize(getattr(self, f), memo) for f in fields}
+        res['__type__'] = type(self).__name__
+        if hasattr(self, '_serialize'):
+            self._serialize(res, memo)
+        return res
+
+    @classmethod
+    def deserialize(cls: Type[_T], data: Dict[str, Any], memo: Dict[int, Any]) -> _T:
+        namespace = getattr(cls, '__serialize_namespace__', [])
+        namespace = {c.__name__:c for c in namespace}
+
+        fields = getattr(cls, '__serialize_fields__')
+
+        if '@' in data:
+            return memo[data['@']]
+
+        inst = cls.__new__(cls)
+        for f in fields:
+            try:
+                setattr(inst, f, _deserialize(data[f], namespace, memo))
+            except KeyError as e:
+                raise KeyError("Cannot find key for class", cls, e)
+
+        if hasattr(inst, '_deserialize'):
+            inst._deserialize()
+
+        return inst
+
+
+class SerializeMemoizer(Serialize):
+    #--
+
+    __serialize_fields__ = 'memoized',
+
+    def __init__(self, types_to_memoize: List) -> None:
+        self.types_to_memoize = tuple(types_to_memoize)
+        self.memoized = Enumerator()
+
+    def in_types(self, value: Serialize) -> bool:
+        return isinstance(value, self.types_to_memoize)
+
+    def serialize(self) -> Dict[int, Any]:  ##
+
+        return _serialize(self.memoized.reversed(), None)
+
+    @classmethod
+    def deserialize(cls, data: Dict[int, Any], namespace: Dict[str, Any], memo: Dict[Any, Any]) -> Dict[int, Any]:  ##
+
+        return _deserialize(data, namespace, memo)
+
+
+try:
+    import regex
+    _has_regex = True
+except ImportError:
+    _has_regex = False
+
+if sys.version_info >= (3, 11):
+    import re._parser as sre_parse
+    import re._constants as sre_constants
+else:
+    import sre_parse
+    import sre_constants
+
+categ_pattern = re.compile(r'\\p{[A-Za-z_]+}')
+
+def get_regexp_width(expr: str) -> Union[Tuple[int, int], List[int]]:
+    if _has_regex:
+        ##
+
+        ##
+
+        ##
+
+        regexp_final = re.sub(categ_pattern, 'A', expr)
+    else:
+        if re.search(categ_pattern, expr):
+            raise ImportError('`regex` module must be installed in order to use Unicode categories.', expr)
+        regexp_final = expr
+    try:
+        ##
+
+        return [int(x) for x in sre_parse.parse(regexp_final).getwidth()]
+    except sre_constants.error:
+        if not _has_regex:
+            raise ValueError(expr)
+        else:
+            ##
+
+            ##
+
+            c = regex.compile(regexp_final)
+            ##
+
+            ##
+
+            MAXWIDTH = getattr(sre_parse, "MAXWIDTH", sre_constants.MAXREPEAT)
+            if c.match('') is None:
+                ##
+
+                return 1, int(MAXWIDTH)
+            else:
+                return 0, int(MAXWIDTH)
+
+
+@dataclass(frozen=True)
+class TextSlice(Generic[AnyStr]):
+    #--
+    text: AnyStr
+    start: int
+    end: int
+
+    def __post_init__(self):
+        if not isinstance(self.text, (str, bytes)):
+            raise TypeError("text must be str or bytes")
+
+        if self.start < 0:
+            object.__setattr__(self, 'start', self.start + len(self.text))
+            assert self.start >=0
+
+        if self.end is None:
+            object.__setattr__(self, 'end', len(self.text))
+        elif self.end < 0:
+            object.__setattr__(self, 'end', self.end + len(self.text))
+            assert self.end <= len(self.text)
+
+    @classmethod
+    def cast_from(cls, text: 'TextOrSlice') -> 'TextSlice[AnyStr]':
+        if isinstance(text, TextSlice):
+            return text
+
+        return cls(text, 0, len(text))
+
+    def is_complete_text(self):
+        return self.start == 0 and self.end == len(self.text)
+
+    def __len__(self):
+        return self.end - self.start
+
+    def count(self, substr: AnyStr):
+        return self.text.count(substr, self.start, self.end)
+
+    def rindex(self, substr: AnyStr):
+        return self.text.rindex(substr, self.start, self.end)
+
+
+TextOrSlice = Union[AnyStr, 'TextSlice[AnyStr]']
+LarkInput = Union[AnyStr, TextSlice[AnyStr], Any]
+
+
+
+class Meta:
+
+    empty: bool
+    line: int
+    column: int
+    start_pos: int
+    end_line: int
+    end_column: int
+    end_pos: int
+    orig_expansion: 'List[TerminalDef]'
+    match_tree: bool
+
+    def __init__(self):
+        self.empty = True
+
+
+_Leaf_T = TypeVar("_Leaf_T")
+Branch = Union[_Leaf_T, 'Tree[_Leaf_T]']
+
+
+class Tree(Generic[_Leaf_T]):
+    #--
+
+    data: str
+    children: 'List[Branch[_Leaf_T]]'
+
+    def __init__(self, data: str, children: 'List[Branch[_Leaf_T]]', meta: Optional[Meta]=None) -> None:
+        self.data = data
+        self.children = children
+        self._meta = meta
+
+    @property
+    def meta(self) -> Meta:
+        if self._meta is None:
+            self._meta = Meta()
+        return self._meta
+
+    def __repr__(self):
+        return 'Tree(%r, %r)' % (self.data, self.children)
+
+    __match_args__ = ("data", "children")
+
+    def _pretty_label(self):
+        return self.data
+
+    def _pretty(self, level, indent_str):
+        yield f'{indent_str*level}{self._pretty_label()}'
+        if len(self.children) == 1 and not isinstance(self.children[0], Tree):
+            yield f'\t{self.children[0]}\n'
+        else:
+            yield '\n'
+            for n in self.children:
+                if isinstance(n, Tree):
+                    yield from n._pretty(level+1, indent_str)
+                else:
+                    yield f'{indent_str*(level+1)}{n}\n'
+
+    def pretty(self, indent_str: str='  ') -> str:
+        #--
+        return ''.join(self._pretty(0, indent_str))
+
+    def __rich__(self, parent:Optional['rich.tree.Tree']=None) -> 'rich.tree.Tree':
+        #--
+        return self._rich(parent)
+
+    def _rich(self, parent):
+        if parent:
+            tree = parent.add(f'[bold]{self.data}[/bold]')
+        else:
+            import rich.tree
+            tree = rich.tree.Tree(self.data)
+
+        for c in self.children:
+            if isinstance(c, Tree):
+                c._rich(tree)
+            else:
+                tree.add(f'[green]{c}[/green]')
+
+        return tree
+
+    def __eq__(self, other):
+        try:
+            return self.data == other.data and self.children == other.children
+        except AttributeError:
+            return False
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self) -> int:
+        return hash((self.data, tuple(self.children)))
+
+    def iter_subtrees(self) -> 'Iterator[Tree[_Leaf_T]]':
+        #--
+        queue = [self]
+        subtrees = dict()
+        for subtree in queue:
+            subtrees[id(subtree)] = subtree
+            queue += [c for c in reversed(subtree.children)
+                      if isinstance(c, Tree) and id(c) not in subtrees]
+
+        del queue
+        return reversed(list(subtrees.values()))
+
+    def iter_subtrees_topdown(self):
+        #--
+        stack = [self]
+        stack_append = stack.append
+        stack_pop = stack.pop
+        while stack:
+            node = stack_pop()
+            if not isinstance(node, Tree):
+                continue
+            yield node
+            for child in reversed(node.children):
+                stack_append(child)
+
+    def find_pred(self, pred: 'Callable[[Tree[_Leaf_T]], bool]') -> 'Iterator[Tree[_Leaf_T]]':
+        #--
+        return filter(pred, self.iter_subtrees())
+
+    def find_data(self, data: str) -> 'Iterator[Tree[_Leaf_T]]':
+        #--
+        return self.find_pred(lambda t: t.data == data)
+
+
+from functools import wraps, update_wrapper
+from inspect import getmembers, getmro
+
+_Return_T = TypeVar('_Return_T')
+_Return_V = TypeVar('_Return_V')
+_Leaf_T = TypeVar('_Leaf_T')
+_Leaf_U = TypeVar('_Leaf_U')
+_R = TypeVar('_R')
+_FUNC = Callable[..., _Return_T]
+_DECORATED = Union[_FUNC, type]
+
+class _DiscardType:
+    #--
+
+    def __repr__(self):
+        return "lark.visitors.Discard"
+
+Discard = _DiscardType()
+
+##
+
+
+class _Decoratable:
+    #--
+
+    @classmethod
+    def _apply_v_args(cls, visit_wrapper):
+        mro = getmro(cls)
+        assert mro[0] is cls
+        libmembers = {name for _cls in mro[1:] for name, _ in getmembers(_cls)}
+        for name, value in getmembers(cls):
+
+            ##
+
+            if name.startswith('_') or (name in libmembers and name not in cls.__dict__):
+                continue
+            if not callable(value):
+                continue
+
+            ##
+
+            if isinstance(cls.__dict__[name], _VArgsWrapper):
+                continue
+
+            setattr(cls, name, _VArgsWrapper(cls.__dict__[name], visit_wrapper))
+        return cls
+
+    def __class_getitem__(cls, _):
+        return cls
+
+
+class Transformer(_Decoratable, ABC, Generic[_Leaf_T, _Return_T]):
+    #--
+    __visit_tokens__ = True   ##
+
+
+    def __init__(self,  visit_tokens: bool=True) -> None:
+        self.__visit_tokens__ = visit_tokens
+
+    def _call_userfunc(self, tree, new_children=None):
+        ##
+
+        children = new_children if new_children is not None else tree.children
+        try:
+            f = getattr(self, tree.data)
+        except AttributeError:
+            return self.__default__(tree.data, children, tree.meta)
+        else:
+            try:
+                wrapper = getattr(f, 'visit_wrapper', None)
+                if wrapper is not None:
+                    return f.visit_wrapper(f, tree.data, children, tree.meta)
+                else:
+                    return f(children)
+            except GrammarError:
+                raise
+            except Exception as e:
+                raise VisitError(tree.data, tree, e)
+
+    def _call_userfunc_token(self, token):
+        try:
+            f = getattr(self, token.type)
+        except AttributeError:
+            return self.__default_token__(token)
+        else:
+            try:
+                return f(token)
+            except GrammarError:
+                raise
+            except Exception as e:
+                raise VisitError(token.type, token, e)
+
+    def _transform_children(self, children):
+        for c in children:
+            if isinstance(c, Tree):
+                res = self._transform_tree(c)
+            elif self.__visit_tokens__ and isinstance(c, Token):
+                res = self._call_userfunc_token(c)
+            else:
+                res = c
+
+            if res is not Discard:
+                yield res
+
+    def _transform_tree(self, tree):
+        children = list(self._transform_children(tree.children))
+        return self._call_userfunc(tree, children)
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        #--
+        res = list(self._transform_children([tree]))
+        if not res:
+            return None     ##
+
+        assert len(res) == 1
+        return res[0]
+
+    def __mul__(
+            self: 'Transformer[_Leaf_T, Tree[_Leaf_U]]',
+            other: 'Union[Transformer[_Leaf_U, _Return_V], TransformerChain[_Leaf_U, _Return_V,]]'
+    ) -> 'TransformerChain[_Leaf_T, _Return_V]':
+        #--
+        return TransformerChain(self, other)
+
+    def __default__(self, data, children, meta):
+        #--
+        return Tree(data, children, meta)
+
+    def __default_token__(self, token):
+        #--
+        return token
+
+
+def merge_transformers(base_transformer=None, **transformers_to_merge):
+    #--
+    if base_transformer is None:
+        base_transformer = Transformer()
+    for prefix, transformer in transformers_to_merge.items():
+        for method_name in dir(transformer):
+            method = getattr(transformer, method_name)
+            if not callable(method):
+                continue
+            if method_name.startswith("_") or method_name == "transform":
+                continue
+            prefixed_method = prefix + "__" + method_name
+            if hasattr(base_transformer, prefixed_method):
+                raise AttributeError("Cannot merge: method '%s' appears more than once" % prefixed_method)
+
+            setattr(base_transformer, prefixed_method, method)
+
+    return base_transformer
+
+
+class InlineTransformer(Transformer):   ##
+
+    def _call_userfunc(self, tree, new_children=None):
+        ##
+
+        children = new_children if new_children is not None else tree.children
+        try:
+            f = getattr(self, tree.data)
+        except AttributeError:
+            return self.__default__(tree.data, children, tree.meta)
+        else:
+            return f(*children)
+
+
+class TransformerChain(Generic[_Leaf_T, _Return_T]):
+
+    transformers: 'Tuple[Union[Transformer, TransformerChain], ...]'
+
+    def __init__(self, *transformers: 'Union[Transformer, TransformerChain]') -> None:
+        self.transformers = transformers
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        for t in self.transformers:
+            tree = t.transform(tree)
+        return cast(_Return_T, tree)
+
+    def __mul__(
+            self: 'TransformerChain[_Leaf_T, Tree[_Leaf_U]]',
+            other: 'Union[Transformer[_Leaf_U, _Return_V], TransformerChain[_Leaf_U, _Return_V]]'
+    ) -> 'TransformerChain[_Leaf_T, _Return_V]':
+        return TransformerChain(*self.transformers + (other,))
+
+
+class Transformer_InPlace(Transformer[_Leaf_T, _Return_T]):
+    #--
+    def _transform_tree(self, tree):           ##
+
+        return self._call_userfunc(tree)
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        for subtree in tree.iter_subtrees():
+            subtree.children = list(self._transform_children(subtree.children))
+
+        return self._transform_tree(tree)
+
+
+class Transformer_NonRecursive(Transformer[_Leaf_T, _Return_T]):
+    #--
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        ##
+
+        rev_postfix = []
+        q: List[Branch[_Leaf_T]] = [tree]
+        while q:
+            t = q.pop()
+            rev_postfix.append(t)
+            if isinstance(t, Tree):
+                q += t.children
+
+        ##
+
+        stack: List = []
+        for x in reversed(rev_postfix):
+            if isinstance(x, Tree):
+                size = len(x.children)
+                if size:
+                    args = stack[-size:]
+                    del stack[-size:]
+                else:
+                    args = []
+
+                res = self._call_userfunc(x, args)
+                if res is not Discard:
+                    stack.append(res)
+
+            elif self.__visit_tokens__ and isinstance(x, Token):
+                res = self._call_userfunc_token(x)
+                if res is not Discard:
+                    stack.append(res)
+            else:
+                stack.append(x)
+
+        result, = stack  ##
+
+        ##
+
+        ##
+
+        ##
+
+        return cast(_Return_T, result)
+
+
+class Transformer_InPlaceRecursive(Transformer[_Leaf_T, _Return_T]):
+    #--
+    def _transform_tree(self, tree):
+        tree.children = list(self._transform_children(tree.children))
+        return self._call_userfunc(tree)
+
+
+##
+
+
+class VisitorBase:
+    def _call_userfunc(self, tree):
+        return getattr(self, tree.data, self.__default__)(tree)
+
+    def __default__(self, tree):
+        #--
+        return tree
+
+    def __class_getitem__(cls, _):
+        return cls
+
+
+class Visitor(VisitorBase, ABC, Generic[_Leaf_T]):
+    #--
+
+    def visit(self, tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        for subtree in tree.iter_subtrees():
+            self._call_userfunc(subtree)
+        return tree
+
+    def visit_topdown(self, tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        for subtree in tree.iter_subtrees_topdown():
+            self._call_userfunc(subtree)
+        return tree
+
+
+class Visitor_Recursive(VisitorBase, Generic[_Leaf_T]):
+    #--
+
+    def visit(self, tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        for child in tree.children:
+            if isinstance(child, Tree):
+                self.visit(child)
+
+        self._call_userfunc(tree)
+        return tree
+
+    def visit_topdown(self,tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        self._call_userfunc(tree)
+
+        for child in tree.children:
+            if isinstance(child, Tree):
+                self.visit_topdown(child)
+
+        return tree
+
+
+class Interpreter(_Decoratable, ABC, Generic[_Leaf_T, _Return_T]):
+    #--
+
+    def visit(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        ##
+
+        ##
+
+        ##
+
+        return self._visit_tree(tree)
+
+    def _visit_tree(self, tree: Tree[_Leaf_T]):
+        f = getattr(self, tree.data)
+        wrapper = getattr(f, 'visit_wrapper', None)
+        if wrapper is not None:
+            return f.visit_wrapper(f, tree.data, tree.children, tree.meta)
+        else:
+            return f(tree)
+
+    def visit_children(self, tree: Tree[_Leaf_T]) -> List:
+        return [self._visit_tree(child) if isinstance(child, Tree) else child
+                for child in tree.children]
+
+    def __getattr__(self, name):
+        return self.__default__
+
+    def __default__(self, tree):
+        return self.visit_children(tree)
+
+
+_InterMethod = Callable[[Type[Interpreter], _Return_T], _R]
+
+def visit_children_decor(func: _InterMethod) -> _InterMethod:
+    #--
+    @wraps(func)
+    def inner(cls, tree):
+        values = cls.visit_children(tree)
+        return func(cls, values)
+    return inner
+
+##
+
+
+def _apply_v_args(obj, visit_wrapper):
+    try:
+        _apply = obj._apply_v_args
+    except AttributeError:
+        return _VArgsWrapper(obj, visit_wrapper)
+    else:
+        return _apply(visit_wrapper)
+
+
+class _VArgsWrapper:
+    #--
+    base_func: Callable
+
+    def __init__(self, func: Callable, visit_wrapper: Callable[[Callable, str, list, Any], Any]):
+        if isinstance(func, _VArgsWrapper):
+            func = func.base_func
+        self.base_func = func
+        self.visit_wrapper = visit_wrapper
+        update_wrapper(self, func)
+
+    def __call__(self, *args, **kwargs):
+        return self.base_func(*args, **kwargs)
+
+    def __get__(self, instance, owner=None):
+        try:
+            ##
+
+            ##
+
+            g = type(self.base_func).__get__
+        except AttributeError:
+            return self
+        else:
+            return _VArgsWrapper(g(self.base_func, instance, owner), self.visit_wrapper)
+
+    def __set_name__(self, owner, name):
+        try:
+            f = type(self.base_func).__set_name__
+        except AttributeError:
+            return
+        else:
+            f(self.base_func, owner, name)
+
+
+def _vargs_inline(f, _data, children, _meta):
+    return f(*children)
+def _vargs_meta_inline(f, _data, children, meta):
+    return f(meta, *children)
+def _vargs_meta(f, _data, children, meta):
+    return f(meta, children)
+def _vargs_tree(f, data, children, meta):
+    return f(Tree(data, children, meta))
+
+
+def v_args(inline: bool = False, meta: bool = False, tree: bool = False, wrapper: Optional[Callable] = None) -> Callable[[_DECORATED], _DECORATED]:
+    #--
+    if tree and (meta or inline):
+        raise ValueError("Visitor functions cannot combine 'tree' with 'meta' or 'inline'.")
+
+    func = None
+    if meta:
+        if inline:
+            func = _vargs_meta_inline
+        else:
+            func = _vargs_meta
+    elif inline:
+        func = _vargs_inline
+    elif tree:
+        func = _vargs_tree
+
+    if wrapper is not None:
+        if func is not None:
+            raise ValueError("Cannot use 'wrapper' along with 'tree', 'meta' or 'inline'.")
+        func = wrapper
+
+    def _visitor_args_dec(obj):
+        return _apply_v_args(obj, func)
+    return _visitor_args_dec
+
+
+
+TOKEN_DEFAULT_PRIORITY = 0
+
+
+class Symbol(Serialize):
+    __slots__ = ('name',)
+
+    name: str
+    is_term: ClassVar[bool] = NotImplemented
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __eq__(self, other):
+        if not isinstance(other, Symbol):
+            return NotImplemented
+        return self.is_term == other.is_term and self.name == other.name
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self):
+        return hash(self.name)
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, self.name)
+
+    fullrepr = property(__repr__)
+
+    def renamed(self, f):
+        return type(self)(f(self.name))
+
+
+class Terminal(Symbol):
+    __serialize_fields__ = 'name', 'filter_out'
+
+    is_term: ClassVar[bool] = True
+
+    def __init__(self, name: str, filter_out: bool = False) -> None:
+        self.name = name
+        self.filter_out = filter_out
+
+    @property
+    def fullrepr(self):
+        return '%s(%r, %r)' % (type(self).__name__, self.name, self.filter_out)
+
+    def renamed(self, f):
+        return type(self)(f(self.name), self.filter_out)
+
+
+class NonTerminal(Symbol):
+    __serialize_fields__ = 'name',
+
+    is_term: ClassVar[bool] = False
+
+    def serialize(self, memo=None) -> Dict[str, Any]:
+        ##
+
+        ##
+
+        return {'name': str(self.name), '__type__': 'NonTerminal'}
+
+
+class RuleOptions(Serialize):
+    __serialize_fields__ = 'keep_all_tokens', 'expand1', 'priority', 'template_source', 'empty_indices'
+
+    keep_all_tokens: bool
+    expand1: bool
+    priority: Optional[int]
+    template_source: Optional[str]
+    empty_indices: Tuple[bool, ...]
+
+    def __init__(self, keep_all_tokens: bool=False, expand1: bool=False, priority: Optional[int]=None, template_source: Optional[str]=None, empty_indices: Tuple[bool, ...]=()) -> None:
+        self.keep_all_tokens = keep_all_tokens
+        self.expand1 = expand1
+        self.priority = priority
+        self.template_source = template_source
+        self.empty_indices = empty_indices
+
+    def __repr__(self):
+        return 'RuleOptions(%r, %r, %r, %r)' % (
+            self.keep_all_tokens,
+            self.expand1,
+            self.priority,
+            self.template_source
+        )
+
+
+class Rule(Serialize):
+    #--
+    __slots__ = ('origin', 'expansion', 'alias', 'options', 'order', '_hash')
+
+    __serialize_fields__ = 'origin', 'expansion', 'order', 'alias', 'options'
+    __serialize_namespace__ = Terminal, NonTerminal, RuleOptions
+
+    origin: NonTerminal
+    expansion: Sequence[Symbol]
+    order: int
+    alias: Optional[str]
+    options: RuleOptions
+    _hash: int
+
+    def __init__(self, origin: NonTerminal, expansion: Sequence[Symbol],
+                 order: int=0, alias: Optional[str]=None, options: Optional[RuleOptions]=None):
+        self.origin = origin
+        self.expansion = expansion
+        self.alias = alias
+        self.order = order
+        self.options = options or RuleOptions()
+        self._hash = hash((self.origin, tuple(self.expansion)))
+
+    def _deserialize(self):
+        self._hash = hash((self.origin, tuple(self.expansion)))
+
+    def __str__(self):
+        return '<%s : %s>' % (self.origin.name, ' '.join(x.name for x in self.expansion))
+
+    def __repr__(self):
+        return 'Rule(%r, %r, %r, %r)' % (self.origin, self.expansion, self.alias, self.options)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if not isinstance(other, Rule):
+            return False
+        return self.origin == other.origin and self.expansion == other.expansion
+
+
+
+from contextlib import suppress
+from copy import copy
+
+try:  ##
+
+    has_interegular = bool(interegular)
+except NameError:
+    has_interegular = False
+
+class Pattern(Serialize, ABC):
+    #--
+
+    value: str
+    flags: Collection[str]
+    raw: Optional[str]
+    type: ClassVar[str]
+
+    def __init__(self, value: str, flags: Collection[str] = (), raw: Optional[str] = None) -> None:
+        self.value = value
+        self.flags = frozenset(flags)
+        self.raw = raw
+
+    def __repr__(self):
+        return repr(self.to_regexp())
+
+    ##
+
+    def __hash__(self):
+        return hash((type(self), self.value, self.flags))
+
+    def __eq__(self, other):
+        return type(self) == type(other) and self.value == other.value and self.flags == other.flags
+
+    @abstractmethod
+    def to_regexp(self) -> str:
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def min_width(self) -> int:
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def max_width(self) -> int:
+        raise NotImplementedError()
+
+    def _get_flags(self, value):
+        for f in self.flags:
+            value = ('(?%s:%s)' % (f, value))
+        return value
+
+
+class PatternStr(Pattern):
+    __serialize_fields__ = 'value', 'flags', 'raw'
+
+    type: ClassVar[str] = "str"
+
+    def to_regexp(self) -> str:
+        return self._get_flags(re.escape(self.value))
+
+    @property
+    def min_width(self) -> int:
+        return len(self.value)
+
+    @property
+    def max_width(self) -> int:
+        return len(self.value)
+
+
+class PatternRE(Pattern):
+    __serialize_fields__ = 'value', 'flags', 'raw', '_width'
+
+    type: ClassVar[str] = "re"
+
+    def to_regexp(self) -> str:
+        return self._get_flags(self.value)
+
+    _width = None
+    def _get_width(self):
+        if self._width is None:
+            self._width = get_regexp_width(self.to_regexp())
+        return self._width
+
+    @property
+    def min_width(self) -> int:
+        return self._get_width()[0]
+
+    @property
+    def max_width(self) -> int:
+        return self._get_width()[1]
+
+
+class TerminalDef(Serialize):
+    #--
+    __serialize_fields__ = 'name', 'pattern', 'priority'
+    __serialize_namespace__ = PatternStr, PatternRE
+
+    name: str
+    pattern: Pattern
+    priority: int
+
+    def __init__(self, name: str, pattern: Pattern, priority: int = TOKEN_DEFAULT_PRIORITY) -> None:
+        assert isinstance(pattern, Pattern), pattern
+        self.name = name
+        self.pattern = pattern
+        self.priority = priority
+
+    def __repr__(self):
+        return '%s(%r, %r)' % (type(self).__name__, self.name, self.pattern)
+
+    def user_repr(self) -> str:
+        if self.name.startswith('__'):  ##
+
+            return self.pattern.raw or self.name
+        else:
+            return self.name
+
+_T = TypeVar('_T', bound="Token")
+
+class Token(str):
+    #--
+    __slots__ = ('type', 'start_pos', 'value', 'line', 'column', 'end_line', 'end_column', 'end_pos')
+
+    __match_args__ = ('type', 'value')
+
+    type: str
+    start_pos: Optional[int]
+    value: Any
+    line: Optional[int]
+    column: Optional[int]
+    end_line: Optional[int]
+    end_column: Optional[int]
+    end_pos: Optional[int]
+
+
+    @overload
+    def __new__(
+            cls,
+            type: str,
+            value: Any,
+            start_pos: Optional[int] = None,
+            line: Optional[int] = None,
+            column: Optional[int] = None,
+            end_line: Optional[int] = None,
+            end_column: Optional[int] = None,
+            end_pos: Optional[int] = None
+    ) -> 'Token':
+        ...
+
+    @overload
+    def __new__(
+            cls,
+            type_: str,
+            value: Any,
+            start_pos: Optional[int] = None,
+            line: Optional[int] = None,
+            column: Optional[int] = None,
+            end_line: Optional[int] = None,
+            end_column: Optional[int] = None,
+            end_pos: Optional[int] = None
+    ) -> 'Token':        ...
+
+    def __new__(cls, *args, **kwargs):
+        if "type_" in kwargs:
+            warnings.warn("`type_` is deprecated use `type` instead", DeprecationWarning)
+
+            if "type" in kwargs:
+                raise TypeError("Error: using both 'type' and the deprecated 'type_' as arguments.")
+            kwargs["type"] = kwargs.pop("type_")
+
+        return cls._future_new(*args, **kwargs)
+
+
+    @classmethod
+    def _future_new(cls, type, value, start_pos=None, line=None, column=None, end_line=None, end_column=None, end_pos=None):
+        inst = super(Token, cls).__new__(cls, value)
+
+        inst.type = type
+        inst.start_pos = start_pos
+        inst.value = value
+        inst.line = line
+        inst.column = column
+        inst.end_line = end_line
+        inst.end_column = end_column
+        inst.end_pos = end_pos
+        return inst
+
+    @overload
+    def update(self, type: Optional[str] = None, value: Optional[Any] = None) -> 'Token':
+        ...
+
+    @overload
+    def update(self, type_: Optional[str] = None, value: Optional[Any] = None) -> 'Token':
+        ...
+
+    def update(self, *args, **kwargs):
+        if "type_" in kwargs:
+            warnings.warn("`type_` is deprecated use `type` instead", DeprecationWarning)
+
+            if "type" in kwargs:
+                raise TypeError("Error: using both 'type' and the deprecated 'type_' as arguments.")
+            kwargs["type"] = kwargs.pop("type_")
+
+        return self._future_update(*args, **kwargs)
+
+    def _future_update(self, type: Optional[str] = None, value: Optional[Any] = None) -> 'Token':
+        return Token.new_borrow_pos(
+            type if type is not None else self.type,
+            value if value is not None else self.value,
+            self
+        )
+
+    @classmethod
+    def new_borrow_pos(cls: Type[_T], type_: str, value: Any, borrow_t: 'Token') -> _T:
+        return cls(type_, value, borrow_t.start_pos, borrow_t.line, borrow_t.column, borrow_t.end_line, borrow_t.end_column, borrow_t.end_pos)
+
+    def __reduce__(self):
+        return (self.__class__, (self.type, self.value, self.start_pos, self.line, self.column))
+
+    def __repr__(self):
+        return 'Token(%r, %r)' % (self.type, self.value)
+
+    def __deepcopy__(self, memo):
+        return Token(self.type, self.value, self.start_pos, self.line, self.column)
+
+    def __eq__(self, other):
+        if isinstance(other, Token) and self.type != other.type:
+            return False
+
+        return str.__eq__(self, other)
+
+    __hash__ = str.__hash__
+
+
+class LineCounter:
+    #--
+
+    __slots__ = 'char_pos', 'line', 'column', 'line_start_pos', 'newline_char'
+
+    def __init__(self, newline_char):
+        self.newline_char = newline_char
+        self.char_pos = 0
+        self.line = 1
+        self.column = 1
+        self.line_start_pos = 0
+
+    def __eq__(self, other):
+        if not isinstance(other, LineCounter):
+            return NotImplemented
+
+        return self.char_pos == other.char_pos and self.newline_char == other.newline_char
+
+    def feed(self, token: TextOrSlice, test_newline=True):
+        #--
+        if test_newline:
+            newlines = token.count(self.newline_char)
+            if newlines:
+                self.line += newlines
+                self.line_start_pos = self.char_pos + token.rindex(self.newline_char) + 1
+
+        self.char_pos += len(token)
+        self.column = self.char_pos - self.line_start_pos + 1
+
+
+class UnlessCallback:
+    def __init__(self, scanner: 'Scanner'):
+        self.scanner = scanner
+
+    def __call__(self, t: Token):
+        res = self.scanner.fullmatch(t.value)
+        if res is not None:
+            t.type = res
+        return t
+
+
+class CallChain:
+    def __init__(self, callback1, callback2, cond):
+        self.callback1 = callback1
+        self.callback2 = callback2
+        self.cond = cond
+
+    def __call__(self, t):
+        t2 = self.callback1(t)
+        return self.callback2(t) if self.cond(t2) else t2
+
+
+def _get_match(re_, regexp, s, flags):
+    m = re_.match(regexp, s, flags)
+    if m:
+        return m.group(0)
+
+def _create_unless(terminals, g_regex_flags, re_, use_bytes):
+    tokens_by_type = classify(terminals, lambda t: type(t.pattern))
+    assert len(tokens_by_type) <= 2, tokens_by_type.keys()
+    embedded_strs = set()
+    callback = {}
+    for retok in tokens_by_type.get(PatternRE, []):
+        unless = []
+        for strtok in tokens_by_type.get(PatternStr, []):
+            if strtok.priority != retok.priority:
+                continue
+            s = strtok.pattern.value
+            if s == _get_match(re_, retok.pattern.to_regexp(), s, g_regex_flags):
+                unless.append(strtok)
+                if strtok.pattern.flags <= retok.pattern.flags:
+                    embedded_strs.add(strtok)
+        if unless:
+            callback[retok.name] = UnlessCallback(Scanner(unless, g_regex_flags, re_, use_bytes=use_bytes))
+
+    new_terminals = [t for t in terminals if t not in embedded_strs]
+    return new_terminals, callback
+
+
+class Scanner:
+    def __init__(self, terminals, g_regex_flags, re_, use_bytes):
+        self.terminals = terminals
+        self.g_regex_flags = g_regex_flags
+        self.re_ = re_
+        self.use_bytes = use_bytes
+
+        self.allowed_types = {t.name for t in self.terminals}
+
+        self._mres = self._build_mres(terminals, len(terminals))
+
+    def _build_mres(self, terminals, max_size):
+        ##
+
+        ##
+
+        ##
+
+        mres = []
+        while terminals:
+            pattern = u'|'.join(u'(?P<%s>%s)' % (t.name, t.pattern.to_regexp()) for t in terminals[:max_size])
+            if self.use_bytes:
+                pattern = pattern.encode('latin-1')
+            try:
+                mre = self.re_.compile(pattern, self.g_regex_flags)
+            except AssertionError:  ##
+
+                return self._build_mres(terminals, max_size // 2)
+
+            mres.append(mre)
+            terminals = terminals[max_size:]
+        return mres
+
+    def match(self, text: TextSlice, pos):
+        for mre in self._mres:
+            m = mre.match(text.text, pos, text.end)
+            if m:
+                return m.group(0), m.lastgroup
+
+
+    def fullmatch(self, text: str) -> Optional[str]:
+        for mre in self._mres:
+            m = mre.fullmatch(text)
+            if m:
+                return m.lastgroup
+        return None
+
+def _regexp_has_newline(r: str):
+    #--
+    return '\n' in r or '\\n' in r or '\\s' in r or '[^' in r or ('(?s' in r and '.' in r)
+
+
+class LexerState:
+    #--
+
+    __slots__ = 'text', 'line_ctr', 'last_token'
+
+    text: TextSlice
+    line_ctr: LineCounter
+    last_token: Optional[Token]
+
+    def __init__(self, text: TextSlice, line_ctr: Optional[LineCounter] = None, last_token: Optional[Token]=None):
+        if isinstance(text, TextSlice):
+            if line_ctr is None:
+                line_ctr = LineCounter(b'\n' if isinstance(text.text, bytes) else '\n')
+
+                if text.start > 0:
+                    ##
+
+                    line_ctr.feed(TextSlice(text.text, 0, text.start))
+
+            if not (text.start <= line_ctr.char_pos <= text.end):
+                raise ValueError("LineCounter.char_pos is out of bounds")
+
+        self.text = text
+        self.line_ctr = line_ctr
+        self.last_token = last_token
+
+
+    def __eq__(self, other):
+        if not isinstance(other, LexerState):
+            return NotImplemented
+
+        return self.text == other.text and self.line_ctr == other.line_ctr and self.last_token == other.last_token
+
+    def __copy__(self):
+        return type(self)(self.text, copy(self.line_ctr), self.last_token)
+
+
+class LexerThread:
+    #--
+
+    def __init__(self, lexer: 'Lexer', lexer_state: Optional[LexerState]):
+        self.lexer = lexer
+        self.state = lexer_state
+
+    @classmethod
+    def from_text(cls, lexer: 'Lexer', text_or_slice: TextOrSlice) -> 'LexerThread':
+        text = TextSlice.cast_from(text_or_slice)
+        return cls(lexer, LexerState(text))
+
+    @classmethod
+    def from_custom_input(cls, lexer: 'Lexer', text: Any) -> 'LexerThread':
+        return cls(lexer, LexerState(text))
+
+    def lex(self, parser_state):
+        if self.state is None:
+            raise TypeError("Cannot lex: No text assigned to lexer state")
+        return self.lexer.lex(self.state, parser_state)
+
+    def __copy__(self):
+        return type(self)(self.lexer, copy(self.state))
+
+    _Token = Token
+
+
+_Callback = Callable[[Token], Token]
+
+class Lexer(ABC):
+    #--
+    @abstractmethod
+    def lex(self, lexer_state: LexerState, parser_state: Any) -> Iterator[Token]:
+        return NotImplemented
+
+    def make_lexer_state(self, text: str):
+        #--
+        return LexerState(TextSlice.cast_from(text))
+
+
+def _check_regex_collisions(terminal_to_regexp: Dict[TerminalDef, str], comparator, strict_mode, max_collisions_to_show=8):
+    if not comparator:
+        comparator = interegular.Comparator.from_regexes(terminal_to_regexp)
+
+    ##
+
+    ##
+
+    max_time = 2 if strict_mode else 0.2
+
+    ##
+
+    if comparator.count_marked_pairs() >= max_collisions_to_show:
+        return
+    for group in classify(terminal_to_regexp, lambda t: t.priority).values():
+        for a, b in comparator.check(group, skip_marked=True):
+            assert a.priority == b.priority
+            ##
+
+            comparator.mark(a, b)
+
+            ##
+
+            message = f"Collision between Terminals {a.name} and {b.name}. "
+            try:
+                example = comparator.get_example_overlap(a, b, max_time).format_multiline()
+            except ValueError:
+                ##
+
+                example = "No example could be found fast enough. However, the collision does still exists"
+            if strict_mode:
+                raise LexError(f"{message}\n{example}")
+            logger.warning("%s The lexer will choose between them arbitrarily.\n%s", message, example)
+            if comparator.count_marked_pairs() >= max_collisions_to_show:
+                logger.warning("Found 8 regex collisions, will not check for more.")
+                return
+
+
+class AbstractBasicLexer(Lexer):
+    terminals_by_name: Dict[str, TerminalDef]
+
+    @abstractmethod
+    def __init__(self, conf: 'LexerConf', comparator=None) -> None:
+        ...
+
+    @abstractmethod
+    def next_token(self, lex_state: LexerState, parser_state: Any = None) -> Token:
+        ...
+
+    def lex(self, state: LexerState, parser_state: Any) -> Iterator[Token]:
+        with suppress(EOFError):
+            while True:
+                yield self.next_token(state, parser_state)
+
+
+class BasicLexer(AbstractBasicLexer):
+    terminals: Collection[TerminalDef]
+    ignore_types: FrozenSet[str]
+    newline_types: FrozenSet[str]
+    user_callbacks: Dict[str, _Callback]
+    callback: Dict[str, _Callback]
+    re: ModuleType
+
+    def __init__(self, conf: 'LexerConf', comparator=None) -> None:
+        terminals = list(conf.terminals)
+        assert all(isinstance(t, TerminalDef) for t in terminals), terminals
+
+        self.re = conf.re_module
+
+        if not conf.skip_validation:
+            ##
+
+            terminal_to_regexp = {}
+            for t in terminals:
+                regexp = t.pattern.to_regexp()
+                try:
+                    self.re.compile(regexp, conf.g_regex_flags)
+                except self.re.error:
+                    raise LexError("Cannot compile token %s: %s" % (t.name, t.pattern))
+
+                if t.pattern.min_width == 0:
+                    raise LexError("Lexer does not allow zero-width terminals. (%s: %s)" % (t.name, t.pattern))
+                if t.pattern.type == "re":
+                    terminal_to_regexp[t] = regexp
+
+            if not (set(conf.ignore) <= {t.name for t in terminals}):
+                raise LexError("Ignore terminals are not defined: %s" % (set(conf.ignore) - {t.name for t in terminals}))
+
+            if has_interegular:
+                _check_regex_collisions(terminal_to_regexp, comparator, conf.strict)
+            elif conf.strict:
+                raise LexError("interegular must be installed for strict mode. Use `pip install 'lark[interegular]'`.")
+
+        ##
+
+        self.newline_types = frozenset(t.name for t in terminals if _regexp_has_newline(t.pattern.to_regexp()))
+        self.ignore_types = frozenset(conf.ignore)
+
+        terminals.sort(key=lambda x: (-x.priority, -x.pattern.max_width, -len(x.pattern.value), x.name))
+        self.terminals = terminals
+        self.user_callbacks = conf.callbacks
+        self.g_regex_flags = conf.g_regex_flags
+        self.use_bytes = conf.use_bytes
+        self.terminals_by_name = conf.terminals_by_name
+
+        self._scanner: Optional[Scanner] = None
+
+    def _build_scanner(self) -> Scanner:
+        terminals, self.callback = _create_unless(self.terminals, self.g_regex_flags, self.re, self.use_bytes)
+        assert all(self.callback.values())
+
+        for type_, f in self.user_callbacks.items():
+            if type_ in self.callback:
+                ##
+
+                self.callback[type_] = CallChain(self.callback[type_], f, lambda t: t.type == type_)
+            else:
+                self.callback[type_] = f
+
+        return Scanner(terminals, self.g_regex_flags, self.re, self.use_bytes)
+
+    @property
+    def scanner(self) -> Scanner:
+        if self._scanner is None:
+            self._scanner = self._build_scanner()
+        return self._scanner
+
+    def match(self, text, pos):
+        return self.scanner.match(text, pos)
+
+    def next_token(self, lex_state: LexerState, parser_state: Any = None) -> Token:
+        line_ctr = lex_state.line_ctr
+        while line_ctr.char_pos < lex_state.text.end:
+            res = self.match(lex_state.text, line_ctr.char_pos)
+            if not res:
+                allowed = self.scanner.allowed_types - self.ignore_types
+                if not allowed:
+                    allowed = {"<END-OF-FILE>"}
+                raise UnexpectedCharacters(lex_state.text.text, line_ctr.char_pos, line_ctr.line, line_ctr.column,
+                                           allowed=allowed, token_history=lex_state.last_token and [lex_state.last_token],
+                                           state=parser_state, terminals_by_name=self.terminals_by_name)
+
+            value, type_ = res
+
+            ignored = type_ in self.ignore_types
+            t = None
+            if not ignored or type_ in self.callback:
+                t = Token(type_, value, line_ctr.char_pos, line_ctr.line, line_ctr.column)
+            line_ctr.feed(value, type_ in self.newline_types)
+            if t is not None:
+                t.end_line = line_ctr.line
+                t.end_column = line_ctr.column
+                t.end_pos = line_ctr.char_pos
+                if t.type in self.callback:
+                    t = self.callback[t.type](t)
+                if not ignored:
+                    if not isinstance(t, Token):
+                        raise LexError("Callbacks must return a token (returned %r)" % t)
+                    lex_state.last_token = t
+                    return t
+
+        ##
+
+        raise EOFError(self)
+
+
+class ContextualLexer(Lexer):
+    lexers: Dict[int, AbstractBasicLexer]
+    root_lexer: AbstractBasicLexer
+
+    BasicLexer: Type[AbstractBasicLexer] = BasicLexer
+
+    def __init__(self, conf: 'LexerConf', states: Dict[int, Collection[str]], always_accept: Collection[str]=()) -> None:
+        terminals = list(conf.terminals)
+        terminals_by_name = conf.terminals_by_name
+
+        trad_conf = copy(conf)
+        trad_conf.terminals = terminals
+
+        if has_interegular and not conf.skip_validation:
+            comparator = interegular.Comparator.from_regexes({t: t.pattern.to_regexp() for t in terminals})
+        else:
+            comparator = None
+        lexer_by_tokens: Dict[FrozenSet[str], AbstractBasicLexer] = {}
+        self.lexers = {}
+        for state, accepts in states.items():
+            key = frozenset(accepts)
+            try:
+                lexer = lexer_by_tokens[key]
+            except KeyError:
+                accepts = set(accepts) | set(conf.ignore) | set(always_accept)
+                lexer_conf = copy(trad_conf)
+                lexer_conf.terminals = [terminals_by_name[n] for n in accepts if n in terminals_by_name]
+                lexer = self.BasicLexer(lexer_conf, comparator)
+                lexer_by_tokens[key] = lexer
+
+            self.lexers[state] = lexer
+
+        assert trad_conf.terminals is terminals
+        trad_conf.skip_validation = True  ##
+
+        self.root_lexer = self.BasicLexer(trad_conf, comparator)
+
+    def lex(self, lexer_state: LexerState, parser_state: 'ParserState') -> Iterator[Token]:
+        try:
+            while True:
+                lexer = self.lexers[parser_state.position]
+                yield lexer.next_token(lexer_state, parser_state)
+        except EOFError:
+            pass
+        except UnexpectedCharacters as e:
+            ##
+
+            ##
+
+            try:
+                last_token = lexer_state.last_token  ##
+
+                token = self.root_lexer.next_token(lexer_state, parser_state)
+                raise UnexpectedToken(token, e.allowed, state=parser_state, token_history=[last_token], terminals_by_name=self.root_lexer.terminals_by_name)
+            except UnexpectedCharacters:
+                raise e  ##
+
+
+
+
+_ParserArgType: 'TypeAlias' = 'Literal["earley", "lalr", "cyk", "auto"]'
+_LexerArgType: 'TypeAlias' = 'Union[Literal["auto", "basic", "contextual", "dynamic", "dynamic_complete"], Type[Lexer]]'
+_LexerCallback = Callable[[Token], Token]
+ParserCallbacks = Dict[str, Callable]
+
+class LexerConf(Serialize):
+    __serialize_fields__ = 'terminals', 'ignore', 'g_regex_flags', 'use_bytes', 'lexer_type'
+    __serialize_namespace__ = TerminalDef,
+
+    terminals: Collection[TerminalDef]
+    re_module: ModuleType
+    ignore: Collection[str]
+    postlex: 'Optional[PostLex]'
+    callbacks: Dict[str, _LexerCallback]
+    g_regex_flags: int
+    skip_validation: bool
+    use_bytes: bool
+    lexer_type: Optional[_LexerArgType]
+    strict: bool
+
+    def __init__(self, terminals: Collection[TerminalDef], re_module: ModuleType, ignore: Collection[str]=(), postlex: 'Optional[PostLex]'=None,
+                 callbacks: Optional[Dict[str, _LexerCallback]]=None, g_regex_flags: int=0, skip_validation: bool=False, use_bytes: bool=False, strict: bool=False):
+        self.terminals = terminals
+        self.terminals_by_name = {t.name: t for t in self.terminals}
+        assert len(self.terminals) == len(self.terminals_by_name)
+        self.ignore = ignore
+        self.postlex = postlex
+        self.callbacks = callbacks or {}
+        self.g_regex_flags = g_regex_flags
+        self.re_module = re_module
+        self.skip_validation = skip_validation
+        self.use_bytes = use_bytes
+        self.strict = strict
+        self.lexer_type = None
+
+    def _deserialize(self):
+        self.terminals_by_name = {t.name: t for t in self.terminals}
+
+    def __deepcopy__(self, memo=None):
+        return type(self)(
+            deepcopy(self.terminals, memo),
+            self.re_module,
+            deepcopy(self.ignore, memo),
+            deepcopy(self.postlex, memo),
+            deepcopy(self.callbacks, memo),
+            deepcopy(self.g_regex_flags, memo),
+            deepcopy(self.skip_validation, memo),
+            deepcopy(self.use_bytes, memo),
+        )
+
+class ParserConf(Serialize):
+    __serialize_fields__ = 'rules', 'start', 'parser_type'
+
+    rules: List['Rule']
+    callbacks: ParserCallbacks
+    start: List[str]
+    parser_type: _ParserArgType
+
+    def __init__(self, rules: List['Rule'], callbacks: ParserCallbacks, start: List[str]):
+        assert isinstance(start, list)
+        self.rules = rules
+        self.callbacks = callbacks
+        self.start = start
+
+
+from functools import partial, wraps
+from itertools import product
+
+
+class ExpandSingleChild:
+    def __init__(self, node_builder):
+        self.node_builder = node_builder
+
+    def __call__(self, children):
+        if len(children) == 1:
+            return children[0]
+        else:
+            return self.node_builder(children)
+
+
+
+class PropagatePositions:
+    def __init__(self, node_builder, node_filter=None):
+        self.node_builder = node_builder
+        self.node_filter = node_filter
+
+    def __call__(self, children):
+        res = self.node_builder(children)
+
+        if isinstance(res, Tree):
+            ##
+
+            ##
+
+            ##
+
+            ##
+
+
+            res_meta = res.meta
+
+            first_meta = self._pp_get_meta(children)
+            if first_meta is not None:
+                if not hasattr(res_meta, 'line'):
+                    ##
+
+                    res_meta.line = getattr(first_meta, 'container_line', first_meta.line)
+                    res_meta.column = getattr(first_meta, 'container_column', first_meta.column)
+                    res_meta.start_pos = getattr(first_meta, 'container_start_pos', first_meta.start_pos)
+                    res_meta.empty = False
+
+                res_meta.container_line = getattr(first_meta, 'container_line', first_meta.line)
+                res_meta.container_column = getattr(first_meta, 'container_column', first_meta.column)
+                res_meta.container_start_pos = getattr(first_meta, 'container_start_pos', first_meta.start_pos)
+
+            last_meta = self._pp_get_meta(reversed(children))
+            if last_meta is not None:
+                if not hasattr(res_meta, 'end_line'):
+                    res_meta.end_line = getattr(last_meta, 'container_end_line', last_meta.end_line)
+                    res_meta.end_column = getattr(last_meta, 'container_end_column', last_meta.end_column)
+                    res_meta.end_pos = getattr(last_meta, 'container_end_pos', last_meta.end_pos)
+                    res_meta.empty = False
+
+                res_meta.container_end_line = getattr(last_meta, 'container_end_line', last_meta.end_line)
+                res_meta.container_end_column = getattr(last_meta, 'container_end_column', last_meta.end_column)
+                res_meta.container_end_pos = getattr(last_meta, 'container_end_pos', last_meta.end_pos)
+
+        return res
+
+    def _pp_get_meta(self, children):
+        for c in children:
+            if self.node_filter is not None and not self.node_filter(c):
+                continue
+            if isinstance(c, Tree):
+                if not c.meta.empty:
+                    return c.meta
+            elif isinstance(c, Token):
+                return c
+            elif hasattr(c, '__lark_meta__'):
+                return c.__lark_meta__()
+
+def make_propagate_positions(option):
+    if callable(option):
+        return partial(PropagatePositions, node_filter=option)
+    elif option is True:
+        return PropagatePositions
+    elif option is False:
+        return None
+
+    raise ConfigurationError('Invalid option for propagate_positions: %r' % option)
+
+
+class ChildFilter:
+    def __init__(self, to_include, append_none, node_builder):
+        self.node_builder = node_builder
+        self.to_include = to_include
+        self.append_none = append_none
+
+    def __call__(self, children):
+        filtered = []
+
+        for i, to_expand, add_none in self.to_include:
+            if add_none:
+                filtered += [None] * add_none
+            if to_expand:
+                filtered += children[i].children
+            else:
+                filtered.append(children[i])
+
+        if self.append_none:
+            filtered += [None] * self.append_none
+
+        return self.node_builder(filtered)
+
+
+class ChildFilterLALR(ChildFilter):
+    #--
+
+    def __call__(self, children):
+        filtered = []
+        for i, to_expand, add_none in self.to_include:
+            if add_none:
+                filtered += [None] * add_none
+            if to_expand:
+                if filtered:
+                    filtered += children[i].children
+                else:   ##
+
+                    filtered = children[i].children
+            else:
+                filtered.append(children[i])
+
+        if self.append_none:
+            filtered += [None] * self.append_none
+
+        return self.node_builder(filtered)
+
+
+class ChildFilterLALR_NoPlaceholders(ChildFilter):
+    #--
+    def __init__(self, to_include, node_builder):
+        self.node_builder = node_builder
+        self.to_include = to_include
+
+    def __call__(self, children):
+        filtered = []
+        for i, to_expand in self.to_include:
+            if to_expand:
+                if filtered:
+                    filtered += children[i].children
+                else:   ##
+
+                    filtered = children[i].children
+            else:
+                filtered.append(children[i])
+        return self.node_builder(filtered)
+
+
+def _should_expand(sym):
+    return not sym.is_term and sym.name.startswith('_')
+
+
+def maybe_create_child_filter(expansion, keep_all_tokens, ambiguous, _empty_indices: List[bool]):
+    ##
+
+    if _empty_indices:
+        assert _empty_indices.count(False) == len(expansion)
+        s = ''.join(str(int(b)) for b in _empty_indices)
+        empty_indices = [len(ones) for ones in s.split('0')]
+        assert len(empty_indices) == len(expansion)+1, (empty_indices, len(expansion))
+    else:
+        empty_indices = [0] * (len(expansion)+1)
+
+    to_include = []
+    nones_to_add = 0
+    for i, sym in enumerate(expansion):
+        nones_to_add += empty_indices[i]
+        if keep_all_tokens or not (sym.is_term and sym.filter_out):
+            to_include.append((i, _should_expand(sym), nones_to_add))
+            nones_to_add = 0
+
+    nones_to_add += empty_indices[len(expansion)]
+
+    if _empty_indices or len(to_include) < len(expansion) or any(to_expand for i, to_expand,_ in to_include):
+        if _empty_indices or ambiguous:
+            return partial(ChildFilter if ambiguous else ChildFilterLALR, to_include, nones_to_add)
+        else:
+            ##
+
+            return partial(ChildFilterLALR_NoPlaceholders, [(i, x) for i,x,_ in to_include])
+
+
+class AmbiguousExpander:
+    #--
+    def __init__(self, to_expand, tree_class, node_builder):
+        self.node_builder = node_builder
+        self.tree_class = tree_class
+        self.to_expand = to_expand
+
+    def __call__(self, children):
+        def _is_ambig_tree(t):
+            return hasattr(t, 'data') and t.data == '_ambig'
+
+        ##
+
+        ##
+
+        ##
+
+        ##
+
+        ambiguous = []
+        for i, child in enumerate(children):
+            if _is_ambig_tree(child):
+                if i in self.to_expand:
+                    ambiguous.append(i)
+
+                child.expand_kids_by_data('_ambig')
+
+        if not ambiguous:
+            return self.node_builder(children)
+
+        expand = [child.children if i in ambiguous else (child,) for i, child in enumerate(children)]
+        return self.tree_class('_ambig', [self.node_builder(list(f)) for f in product(*expand)])
+
+
+def maybe_create_ambiguous_expander(tree_class, expansion, keep_all_tokens):
+    to_expand = [i for i, sym in enumerate(expansion)
+                 if keep_all_tokens or ((not (sym.is_term and sym.filter_out)) and _should_expand(sym))]
+    if to_expand:
+        return partial(AmbiguousExpander, to_expand, tree_class)
+
+
+class AmbiguousIntermediateExpander:
+    #--
+
+    def __init__(self, tree_class, node_builder):
+        self.node_builder = node_builder
+        self.tree_class = tree_class
+
+    def __call__(self, children):
+        def _is_iambig_tree(child):
+            return hasattr(child, 'data') and child.data == '_iambig'
+
+        def _collapse_iambig(children):
+            #--
+
+            ##
+
+            ##
+
+            if children and _is_iambig_tree(children[0]):
+                iambig_node = children[0]
+                result = []
+                for grandchild in iambig_node.children:
+                    collapsed = _collapse_iambig(grandchild.children)
+                    if collapsed:
+                        for child in collapsed:
+                            child.children += children[1:]
+                        result += collapsed
+                    else:
+                        new_tree = self.tree_class('_inter', grandchild.children + children[1:])
+                        result.append(new_tree)
+                return result
+
+        collapsed = _collapse_iambig(children)
+        if collapsed:
+            processed_nodes = [self.node_builder(c.children) for c in collapsed]
+            return self.tree_class('_ambig', processed_nodes)
+
+        return self.node_builder(children)
+
+
+
+def inplace_transformer(func):
+    @wraps(func)
+    def f(children):
+        ##
+
+        tree = Tree(func.__name__, children)
+        return func(tree)
+    return f
+
+
+def apply_visit_wrapper(func, name, wrapper):
+    if wrapper is _vargs_meta or wrapper is _vargs_meta_inline:
+        raise NotImplementedError("Meta args not supported for internal transformer; use YourTransformer().transform(parser.parse()) instead")
+
+    @wraps(func)
+    def f(children):
+        return wrapper(func, name, children, None)
+    return f
+
+
+class ParseTreeBuilder:
+    def __init__(self, rules, tree_class, propagate_positions=False, ambiguous=False, maybe_placeholders=False):
+        self.tree_class = tree_class
+        self.propagate_positions = propagate_positions
+        self.ambiguous = ambiguous
+        self.maybe_placeholders = maybe_placeholders
+
+        self.rule_builders = list(self._init_builders(rules))
+
+    def _init_builders(self, rules):
+        propagate_positions = make_propagate_positions(self.propagate_positions)
+
+        for rule in rules:
+            options = rule.options
+            keep_all_tokens = options.keep_all_tokens
+            expand_single_child = options.expand1
+
+            wrapper_chain = list(filter(None, [
+                (expand_single_child and not rule.alias) and ExpandSingleChild,
+                maybe_create_child_filter(rule.expansion, keep_all_tokens, self.ambiguous, options.empty_indices if self.maybe_placeholders else None),
+                propagate_positions,
+                self.ambiguous and maybe_create_ambiguous_expander(self.tree_class, rule.expansion, keep_all_tokens),
+                self.ambiguous and partial(AmbiguousIntermediateExpander, self.tree_class)
+            ]))
+
+            yield rule, wrapper_chain
+
+    def create_callback(self, transformer=None):
+        callbacks = {}
+
+        default_handler = getattr(transformer, '__default__', None)
+        if default_handler:
+            def default_callback(data, children):
+                return default_handler(data, children, None)
+        else:
+            default_callback = self.tree_class
+
+        for rule, wrapper_chain in self.rule_builders:
+
+            user_callback_name = rule.alias or rule.options.template_source or rule.origin.name
+            try:
+                f = getattr(transformer, user_callback_name)
+                wrapper = getattr(f, 'visit_wrapper', None)
+                if wrapper is not None:
+                    f = apply_visit_wrapper(f, user_callback_name, wrapper)
+                elif isinstance(transformer, Transformer_InPlace):
+                    f = inplace_transformer(f)
+            except AttributeError:
+                f = partial(default_callback, user_callback_name)
+
+            for w in wrapper_chain:
+                f = w(f)
+
+            if rule in callbacks:
+                raise GrammarError("Rule '%s' already exists" % (rule,))
+
+            callbacks[rule] = f
+
+        return callbacks
+
+
+
+class Action:
+    def __init__(self, name):
+        self.name = name
+    def __str__(self):
+        return self.name
+    def __repr__(self):
+        return str(self)
+
+Shift = Action('Shift')
+Reduce = Action('Reduce')
+
+StateT = TypeVar("StateT")
+
+class ParseTableBase(Generic[StateT]):
+    states: Dict[StateT, Dict[str, Tuple]]
+    start_states: Dict[str, StateT]
+    end_states: Dict[str, StateT]
+
+    def __init__(self, states, start_states, end_states):
+        self.states = states
+        self.start_states = start_states
+        self.end_states = end_states
+
+    def serialize(self, memo):
+        tokens = Enumerator()
+
+        states = {
+            state: {tokens.get(token): ((1, arg.serialize(memo)) if action is Reduce else (0, arg))
+                    for token, (action, arg) in actions.items()}
+            for state, actions in self.states.items()
+        }
+
+        return {
+            'tokens': tokens.reversed(),
+            'states': states,
+            'start_states': self.start_states,
+            'end_states': self.end_states,
+        }
+
+    @classmethod
+    def deserialize(cls, data, memo):
+        tokens = data['tokens']
+        states = {
+            state: {tokens[token]: ((Reduce, Rule.deserialize(arg, memo)) if action==1 else (Shift, arg))
+                    for token, (action, arg) in actions.items()}
+            for state, actions in data['states'].items()
+        }
+        return cls(states, data['start_states'], data['end_states'])
+
+class ParseTable(ParseTableBase['State']):
+    #--
+    pass
+
+
+class IntParseTable(ParseTableBase[int]):
+    #--
+
+    @classmethod
+    def from_ParseTable(cls, parse_table: ParseTable):
+        enum = list(parse_table.states)
+        state_to_idx: Dict['State', int] = {s:i for i,s in enumerate(enum)}
+        int_states = {}
+
+        for s, la in parse_table.states.items():
+            la = {k:(v[0], state_to_idx[v[1]]) if v[0] is Shift else v
+                  for k,v in la.items()}
+            int_states[ state_to_idx[s] ] = la
+
+
+        start_states = {start:state_to_idx[s] for start, s in parse_table.start_states.items()}
+        end_states = {start:state_to_idx[s] for start, s in parse_table.end_states.items()}
+        return cls(int_states, start_states, end_states)
+
+
+
+class ParseConf(Generic[StateT]):
+    __slots__ = 'parse_table', 'callbacks', 'start', 'start_state', 'end_state', 'states'
+
+    parse_table: ParseTableBase[StateT]
+    callbacks: ParserCallbacks
+    start: str
+
+    start_state: StateT
+    end_state: StateT
+    states: Dict[StateT, Dict[str, tuple]]
+
+    def __init__(self, parse_table: ParseTableBase[StateT], callbacks: ParserCallbacks, start: str):
+        self.parse_table = parse_table
+
+        self.start_state = self.parse_table.start_states[start]
+        self.end_state = self.parse_table.end_states[start]
+        self.states = self.parse_table.states
+
+        self.callbacks = callbacks
+        self.start = start
+
+class ParserState(Generic[StateT]):
+    __slots__ = 'parse_conf', 'lexer', 'state_stack', 'value_stack'
+
+    parse_conf: ParseConf[StateT]
+    lexer: LexerThread
+    state_stack: List[StateT]
+    value_stack: list
+
+    def __init__(self, parse_conf: ParseConf[StateT], lexer: LexerThread, state_stack=None, value_stack=None):
+        self.parse_conf = parse_conf
+        self.lexer = lexer
+        self.state_stack = state_stack or [self.parse_conf.start_state]
+        self.value_stack = value_stack or []
+
+    @property
+    def position(self) -> StateT:
+        return self.state_stack[-1]
+
+    ##
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ParserState):
+            return NotImplemented
+        return len(self.state_stack) == len(other.state_stack) and self.position == other.position
+
+    def __copy__(self):
+        return self.copy()
+
+    def copy(self, deepcopy_values=True) -> 'ParserState[StateT]':
+        return type(self)(
+            self.parse_conf,
+            self.lexer, ##
+
+            copy(self.state_stack),
+            deepcopy(self.value_stack) if deepcopy_values else copy(self.value_stack),
+        )
+
+    def feed_token(self, token: Token, is_end=False) -> Any:
+        state_stack = self.state_stack
+        value_stack = self.value_stack
+        states = self.parse_conf.states
+        end_state = self.parse_conf.end_state
+        callbacks = self.parse_conf.callbacks
+
+        while True:
+            state = state_stack[-1]
+            try:
+                action, arg = states[state][token.type]
+            except KeyError:
+                expected = {s for s in states[state].keys() if s.isupper()}
+                raise UnexpectedToken(token, expected, state=self, interactive_parser=None)
+
+            assert arg != end_state
+
+            if action is Shift:
+                ##
+
+                assert not is_end
+                state_stack.append(arg)
+                value_stack.append(token if token.type not in callbacks else callbacks[token.type](token))
+                return
+            else:
+                ##
+
+                rule = arg
+                size = len(rule.expansion)
+                if size:
+                    s = value_stack[-size:]
+                    del state_stack[-size:]
+                    del value_stack[-size:]
+                else:
+                    s = []
+
+                value = callbacks[rule](s) if callbacks else s
+
+                _action, new_state = states[state_stack[-1]][rule.origin.name]
+                assert _action is Shift
+                state_stack.append(new_state)
+                value_stack.append(value)
+
+                if is_end and state_stack[-1] == end_state:
+                    return value_stack[-1]
+
+
+class LALR_Parser(Serialize):
+    def __init__(self, parser_conf: ParserConf, debug: bool=False, strict: bool=False):
+        analysis = LALR_Analyzer(parser_conf, debug=debug, strict=strict)
+        analysis.compute_lalr()
+        callbacks = parser_conf.callbacks
+
+        self._parse_table = analysis.parse_table
+        self.parser_conf = parser_conf
+        self.parser = _Parser(analysis.parse_table, callbacks, debug)
+
+    @classmethod
+    def deserialize(cls, data, memo, callbacks, debug=False):
+        inst = cls.__new__(cls)
+        inst._parse_table = IntParseTable.deserialize(data, memo)
+        inst.parser = _Parser(inst._parse_table, callbacks, debug)
+        return inst
+
+    def serialize(self, memo: Any = None) -> Dict[str, Any]:
+        return self._parse_table.serialize(memo)
+
+    def parse_interactive(self, lexer: LexerThread, start: str):
+        return self.parser.parse(lexer, start, start_interactive=True)
+
+    def parse(self, lexer, start, on_error=None):
+        try:
+            return self.parser.parse(lexer, start)
+        except UnexpectedInput as e:
+            if on_error is None:
+                raise
+
+            while True:
+                if isinstance(e, UnexpectedCharacters):
+                    s = e.interactive_parser.lexer_thread.state
+                    p = s.line_ctr.char_pos
+
+                if not on_error(e):
+                    raise e
+
+                if isinstance(e, UnexpectedCharacters):
+                    ##
+
+                    if p == s.line_ctr.char_pos:
+                        s.line_ctr.feed(s.text.text[p:p+1])
+
+                try:
+                    return e.interactive_parser.resume_parse()
+                except UnexpectedToken as e2:
+                    if (isinstance(e, UnexpectedToken)
+                        and e.token.type == e2.token.type == '$END'
+                        and e.interactive_parser == e2.interactive_parser):
+                        ##
+
+                        raise e2
+                    e = e2
+                except UnexpectedCharacters as e2:
+                    e = e2
+
+
+class _Parser:
+    parse_table: ParseTableBase
+    callbacks: ParserCallbacks
+    debug: bool
+
+    def __init__(self, parse_table: ParseTableBase, callbacks: ParserCallbacks, debug: bool=False):
+        self.parse_table = parse_table
+        self.callbacks = callbacks
+        self.debug = debug
+
+    def parse(self, lexer: LexerThread, start: str, value_stack=None, state_stack=None, start_interactive=False):
+        parse_conf = ParseConf(self.parse_table, self.callbacks, start)
+        parser_state = ParserState(parse_conf, lexer, state_stack, value_stack)
+        if start_interactive:
+            return InteractiveParser(self, parser_state, parser_state.lexer)
+        return self.parse_from_state(parser_state)
+
+
+    def parse_from_state(self, state: ParserState, last_token: Optional[Token]=None):
+        #--
+        try:
+            token = last_token
+            for token in state.lexer.lex(state):
+                assert token is not None
+                state.feed_token(token)
+
+            end_token = Token.new_borrow_pos('$END', '', token) if token else Token('$END', '', 0, 1, 1)
+            return state.feed_token(end_token, True)
+        except UnexpectedInput as e:
+            try:
+                e.interactive_parser = InteractiveParser(self, state, state.lexer)
+            except NameError:
+                pass
+            raise e
+        except Exception as e:
+            if self.debug:
+                print("")
+                print("STATE STACK DUMP")
+                print("----------------")
+                for i, s in enumerate(state.state_stack):
+                    print('%d)' % i , s)
+                print("")
+
+            raise
+
+
+class InteractiveParser:
+    #--
+    def __init__(self, parser, parser_state: ParserState, lexer_thread: LexerThread):
+        self.parser = parser
+        self.parser_state = parser_state
+        self.lexer_thread = lexer_thread
+        self.result = None
+
+    @property
+    def lexer_state(self) -> LexerThread:
+        warnings.warn("lexer_state will be removed in subsequent releases. Use lexer_thread instead.", DeprecationWarning)
+        return self.lexer_thread
+
+    def feed_token(self, token: Token):
+        #--
+        return self.parser_state.feed_token(token, token.type == '$END')
+
+    def iter_parse(self) -> Iterator[Token]:
+        #--
+        for token in self.lexer_thread.lex(self.parser_state):
+            yield token
+            self.result = self.feed_token(token)
+
+    def exhaust_lexer(self) -> List[Token]:
+        #--
+        return list(self.iter_parse())
+
+
+    def feed_eof(self, last_token=None):
+        #--
+        eof = Token.new_borrow_pos('$END', '', last_token) if last_token is not None else self.lexer_thread._Token('$END', '', 0, 1, 1)
+        return self.feed_token(eof)
+
+
+    def __copy__(self):
+        #--
+        return self.copy()
+
+    def copy(self, deepcopy_values=True):
+        return type(self)(
+            self.parser,
+            self.parser_state.copy(deepcopy_values=deepcopy_values),
+            copy(self.lexer_thread),
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, InteractiveParser):
+            return False
+
+        return self.parser_state == other.parser_state and self.lexer_thread == other.lexer_thread
+
+    def as_immutable(self):
+        #--
+        p = copy(self)
+        return ImmutableInteractiveParser(p.parser, p.parser_state, p.lexer_thread)
+
+    def pretty(self):
+        #--
+        out = ["Parser choices:"]
+        for k, v in self.choices().items():
+            out.append('\t- %s -> %r' % (k, v))
+        out.append('stack size: %s' % len(self.parser_state.state_stack))
+        return '\n'.join(out)
+
+    def choices(self):
+        #--
+        return self.parser_state.parse_conf.parse_table.states[self.parser_state.position]
+
+    def accepts(self):
+        #--
+        accepts = set()
+        conf_no_callbacks = copy(self.parser_state.parse_conf)
+        ##
+
+        ##
+
+        conf_no_callbacks.callbacks = {}
+        for t in self.choices():
+            if t.isupper(): ##
+
+                new_cursor = self.copy(deepcopy_values=False)
+                new_cursor.parser_state.parse_conf = conf_no_callbacks
+                try:
+                    new_cursor.feed_token(self.lexer_thread._Token(t, ''))
+                except UnexpectedToken:
+                    pass
+                else:
+                    accepts.add(t)
+        return accepts
+
+    def resume_parse(self):
+        #--
+        return self.parser.parse_from_state(self.parser_state, last_token=self.lexer_thread.state.last_token)
+
+
+
+class ImmutableInteractiveParser(InteractiveParser):
+    #--
+
+    result = None
+
+    def __hash__(self):
+        return hash((self.parser_state, self.lexer_thread))
+
+    def feed_token(self, token):
+        c = copy(self)
+        c.result = InteractiveParser.feed_token(c, token)
+        return c
+
+    def exhaust_lexer(self):
+        #--
+        cursor = self.as_mutable()
+        cursor.exhaust_lexer()
+        return cursor.as_immutable()
+
+    def as_mutable(self):
+        #--
+        p = copy(self)
+        return InteractiveParser(p.parser, p.parser_state, p.lexer_thread)
+
+
+
+def _wrap_lexer(lexer_class):
+    future_interface = getattr(lexer_class, '__future_interface__', 0)
+    if future_interface == 2:
+        return lexer_class
+    elif future_interface == 1:
+        class CustomLexerWrapper1(Lexer):
+            def __init__(self, lexer_conf):
+                self.lexer = lexer_class(lexer_conf)
+            def lex(self, lexer_state, parser_state):
+                if isinstance(lexer_state.text, TextSlice) and not lexer_state.text.is_complete_text():
+                    raise TypeError("Interface=1 Custom Lexer don't support TextSlice")
+                lexer_state.text = lexer_state.text
+                return self.lexer.lex(lexer_state, parser_state)
+        return CustomLexerWrapper1
+    elif future_interface == 0:
+        class CustomLexerWrapper0(Lexer):
+            def __init__(self, lexer_conf):
+                self.lexer = lexer_class(lexer_conf)
+
+            def lex(self, lexer_state, parser_state):
+                if isinstance(lexer_state.text, TextSlice):
+                    if not lexer_state.text.is_complete_text():
+                        raise TypeError("Interface=0 Custom Lexer don't support TextSlice")
+                    return self.lexer.lex(lexer_state.text.text)
+                return self.lexer.lex(lexer_state.text)
+        return CustomLexerWrapper0
+    else:
+        raise ValueError(f"Unknown __future_interface__ value {future_interface}, integer 0-2 expected")
+
+
+def _deserialize_parsing_frontend(data, memo, lexer_conf, callbacks, options):
+    parser_conf = ParserConf.deserialize(data['parser_conf'], memo)
+    cls = (options and options._plugins.get('LALR_Parser')) or LALR_Parser
+    parser = cls.deserialize(data['parser'], memo, callbacks, options.debug)
+    parser_conf.callbacks = callbacks
+    return ParsingFrontend(lexer_conf, parser_conf, options, parser=parser)
+
+
+_parser_creators: 'Dict[str, Callable[[LexerConf, Any, Any], Any]]' = {}
+
+
+class ParsingFrontend(Serialize):
+    __serialize_fields__ = 'lexer_conf', 'parser_conf', 'parser'
+
+    lexer_conf: LexerConf
+    parser_conf: ParserConf
+    options: Any
+
+    def __init__(self, lexer_conf: LexerConf, parser_conf: ParserConf, options, parser=None):
+        self.parser_conf = parser_conf
+        self.lexer_conf = lexer_conf
+        self.options = options
+
+        ##
+
+        if parser:  ##
+
+            self.parser = parser
+        else:
+            create_parser = _parser_creators.get(parser_conf.parser_type)
+            assert create_parser is not None, "{} is not supported in standalone mode".format(
+                    parser_conf.parser_type
+                )
+            self.parser = create_parser(lexer_conf, parser_conf, options)
+
+        ##
+
+        lexer_type = lexer_conf.lexer_type
+        self.skip_lexer = False
+        if lexer_type in ('dynamic', 'dynamic_complete'):
+            assert lexer_conf.postlex is None
+            self.skip_lexer = True
+            return
+
+        if isinstance(lexer_type, type):
+            assert issubclass(lexer_type, Lexer)
+            self.lexer = _wrap_lexer(lexer_type)(lexer_conf)
+        elif isinstance(lexer_type, str):
+            create_lexer = {
+                'basic': create_basic_lexer,
+                'contextual': create_contextual_lexer,
+            }[lexer_type]
+            self.lexer = create_lexer(lexer_conf, self.parser, lexer_conf.postlex, options)
+        else:
+            raise TypeError("Bad value for lexer_type: {lexer_type}")
+
+        if lexer_conf.postlex:
+            self.lexer = PostLexConnector(self.lexer, lexer_conf.postlex)
+
+    def _verify_start(self, start=None):
+        if start is None:
+            start_decls = self.parser_conf.start
+            if len(start_decls) > 1:
+                raise ConfigurationError("Lark initialized with more than 1 possible start rule. Must specify which start rule to parse", start_decls)
+            start ,= start_decls
+        elif start not in self.parser_conf.start:
+            raise ConfigurationError("Unknown start rule %s. Must be one of %r" % (start, self.parser_conf.start))
+        return start
+
+    def _make_lexer_thread(self, text: Optional[LarkInput]) -> Union[LarkInput, LexerThread, None]:
+        cls = (self.options and self.options._plugins.get('LexerThread')) or LexerThread
+        if self.skip_lexer:
+            return text
+        if text is None:
+            return cls(self.lexer, None)
+        if isinstance(text, (str, bytes, TextSlice)):
+            return cls.from_text(self.lexer, text)
+        return cls.from_custom_input(self.lexer, text)
+
+    def parse(self, text: Optional[LarkInput], start=None, on_error=None):
+        if self.lexer_conf.lexer_type in ("dynamic", "dynamic_complete"):
+            if isinstance(text, TextSlice) and not text.is_complete_text():
+                raise TypeError(f"Lexer {self.lexer_conf.lexer_type} does not support text slices.")
+
+        chosen_start = self._verify_start(start)
+        kw = {} if on_error is None else {'on_error': on_error}
+        stream = self._make_lexer_thread(text)
+        return self.parser.parse(stream, chosen_start, **kw)
+
+    def parse_interactive(self, text: Optional[TextOrSlice]=None, start=None):
+        ##
+
+        ##
+
+        chosen_start = self._verify_start(start)
+        if self.parser_conf.parser_type != 'lalr':
+            raise ConfigurationError("parse_interactive() currently only works with parser='lalr' ")
+        stream = self._make_lexer_thread(text)
+        return self.parser.parse_interactive(stream, chosen_start)
+
+
+def _validate_frontend_args(parser, lexer) -> None:
+    assert_config(parser, ('lalr', 'earley', 'cyk'))
+    if not isinstance(lexer, type):     ##
+
+        expected = {
+            'lalr': ('basic', 'contextual'),
+            'earley': ('basic', 'dynamic', 'dynamic_complete'),
+            'cyk': ('basic', ),
+         }[parser]
+        assert_config(lexer, expected, 'Parser %r does not support lexer %%r, expected one of %%s' % parser)
+
+
+def _get_lexer_callbacks(transformer, terminals):
+    result = {}
+    for terminal in terminals:
+        callback = getattr(transformer, terminal.name, None)
+        if callback is not None:
+            result[terminal.name] = callback
+    return result
+
+class PostLexConnector:
+    def __init__(self, lexer, postlexer):
+        self.lexer = lexer
+        self.postlexer = postlexer
+
+    def lex(self, lexer_state, parser_state):
+        i = self.lexer.lex(lexer_state, parser_state)
+        return self.postlexer.process(i)
+
+
+
+def create_basic_lexer(lexer_conf, parser, postlex, options) -> BasicLexer:
+    cls = (options and options._plugins.get('BasicLexer')) or BasicLexer
+    return cls(lexer_conf)
+
+def create_contextual_lexer(lexer_conf: LexerConf, parser, postlex, options) -> ContextualLexer:
+    cls = (options and options._plugins.get('ContextualLexer')) or ContextualLexer
+    parse_table: ParseTableBase[int] = parser._parse_table
+    states: Dict[int, Collection[str]] = {idx:list(t.keys()) for idx, t in parse_table.states.items()}
+    always_accept: Collection[str] = postlex.always_accept if postlex else ()
+    return cls(lexer_conf, states, always_accept=always_accept)
+
+def create_lalr_parser(lexer_conf: LexerConf, parser_conf: ParserConf, options=None) -> LALR_Parser:
+    debug = options.debug if options else False
+    strict = options.strict if options else False
+    cls = (options and options._plugins.get('LALR_Parser')) or LALR_Parser
+    return cls(parser_conf, debug=debug, strict=strict)
+
+_parser_creators['lalr'] = create_lalr_parser
+
+
+
+
+class PostLex(ABC):
+    @abstractmethod
+    def process(self, stream: Iterator[Token]) -> Iterator[Token]:
+        return stream
+
+    always_accept: Iterable[str] = ()
+
+class LarkOptions(Serialize):
+    #--
+
+    start: List[str]
+    debug: bool
+    strict: bool
+    transformer: 'Optional[Transformer]'
+    propagate_positions: Union[bool, str]
+    maybe_placeholders: bool
+    cache: Union[bool, str]
+    cache_grammar: bool
+    regex: bool
+    g_regex_flags: int
+    keep_all_tokens: bool
+    tree_class: Optional[Callable[[str, List], Any]]
+    parser: _ParserArgType
+    lexer: _LexerArgType
+    ambiguity: 'Literal["auto", "resolve", "explicit", "forest"]'
+    postlex: Optional[PostLex]
+    priority: 'Optional[Literal["auto", "normal", "invert"]]'
+    lexer_callbacks: Dict[str, Callable[[Token], Token]]
+    use_bytes: bool
+    ordered_sets: bool
+    edit_terminals: Optional[Callable[[TerminalDef], TerminalDef]]
+    import_paths: 'List[Union[str, Callable[[Union[None, str, PackageResource], str], Tuple[str, str]]]]'
+    source_path: Optional[str]
+
+    OPTIONS_DOC = r"""
+    **===  General Options  ===**
+
+    start
+            The start symbol. Either a string, or a list of strings for multiple possible starts (Default: "start")
+    debug
+            Display debug information and extra warnings. Use only when debugging (Default: ``False``)
+            When used with Earley, it generates a forest graph as "sppf.png", if 'dot' is installed.
+    strict
+            Throw an exception on any potential ambiguity, including shift/reduce conflicts, and regex collisions.
+    transformer
+            Applies the transformer to every parse tree (equivalent to applying it after the parse, but faster)
+    propagate_positions
+            Propagates positional attributes into the 'meta' attribute of all tree branches.
+            Sets attributes: (line, column, end_line, end_column, start_pos, end_pos,
+                              container_line, container_column, container_end_line, container_end_column)
+            Accepts ``False``, ``True``, or a callable, which will filter which nodes to ignore when propagating.
+    maybe_placeholders
+            When ``True``, the ``[]`` operator returns ``None`` when not matched.
+            When ``False``,  ``[]`` behaves like the ``?`` operator, and returns no value at all.
+            (default= ``True``)
+    cache
+            Cache the results of the Lark grammar analysis, for x2 to x3 faster loading. LALR only for now.
+
+            - When ``False``, does nothing (default)
+            - When ``True``, caches to a temporary file in the local directory
+            - When given a string, caches to the path pointed by the string
+    cache_grammar
+            For use with ``cache`` option. When ``True``, the unanalyzed grammar is also included in the cache.
+            Useful for classes that require the ``Lark.grammar`` to be present (e.g. Reconstructor).
+            (default= ``False``)
+    regex
+            When True, uses the ``regex`` module instead of the stdlib ``re``.
+    g_regex_flags
+            Flags that are applied to all terminals (both regex and strings)
+    keep_all_tokens
+            Prevent the tree builder from automagically removing "punctuation" tokens (Default: ``False``)
+    tree_class
+            Lark will produce trees comprised of instances of this class instead of the default ``lark.Tree``.
+
+    **=== Algorithm Options ===**
+
+    parser
+            Decides which parser engine to use. Accepts "earley" or "lalr". (Default: "earley").
+            (there is also a "cyk" option for legacy)
+    lexer
+            Decides whether or not to use a lexer stage
+
+            - "auto" (default): Choose for me based on the parser
+            - "basic": Use a basic lexer
+            - "contextual": Stronger lexer (only works with parser="lalr")
+            - "dynamic": Flexible and powerful (only with parser="earley")
+            - "dynamic_complete": Same as dynamic, but tries *every* variation of tokenizing possible.
+    ambiguity
+            Decides how to handle ambiguity in the parse. Only relevant if parser="earley"
+
+            - "resolve": The parser will automatically choose the simplest derivation
+              (it chooses consistently: greedy for tokens, non-greedy for rules)
+            - "explicit": The parser will return all derivations wrapped in "_ambig" tree nodes (i.e. a forest).
+            - "forest": The parser will return the root of the shared packed parse forest.
+
+    **=== Misc. / Domain Specific Options ===**
+
+    postlex
+            Lexer post-processing (Default: ``None``) Only works with the basic and contextual lexers.
+    priority
+            How priorities should be evaluated - "auto", ``None``, "normal", "invert" (Default: "auto")
+    lexer_callbacks
+            Dictionary of callbacks for the lexer. May alter tokens during lexing. Use with caution.
+    use_bytes
+            Accept an input of type ``bytes`` instead of ``str``.
+    ordered_sets
+            Should Earley use ordered-sets to achieve stable output (~10% slower than regular sets. Default: True)
+    edit_terminals
+            A callback for editing the terminals before parse.
+    import_paths
+            A List of either paths or loader functions to specify from where grammars are imported
+    source_path
+            Override the source of from where the grammar was loaded. Useful for relative imports and unconventional grammar loading
+    **=== End of Options ===**
+    """
+    if __doc__:
+        __doc__ += OPTIONS_DOC
+
+
+    ##
+
+    ##
+
+    ##
+
+    ##
+
+    ##
+
+    ##
+
+    _defaults: Dict[str, Any] = {
+        'debug': False,
+        'strict': False,
+        'keep_all_tokens': False,
+        'tree_class': None,
+        'cache': False,
+        'cache_grammar': False,
+        'postlex': None,
+        'parser': 'earley',
+        'lexer': 'auto',
+        'transformer': None,
+        'start': 'start',
+        'priority': 'auto',
+        'ambiguity': 'auto',
+        'regex': False,
+        'propagate_positions': False,
+        'lexer_callbacks': {},
+        'maybe_placeholders': True,
+        'edit_terminals': None,
+        'g_regex_flags': 0,
+        'use_bytes': False,
+        'ordered_sets': True,
+        'import_paths': [],
+        'source_path': None,
+        '_plugins': {},
+    }
+
+    def __init__(self, options_dict: Dict[str, Any]) -> None:
+        o = dict(options_dict)
+
+        options = {}
+        for name, default in self._defaults.items():
+            if name in o:
+                value = o.pop(name)
+                if isinstance(default, bool) and name not in ('cache', 'use_bytes', 'propagate_positions'):
+                    value = bool(value)
+            else:
+                value = default
+
+            options[name] = value
+
+        if isinstance(options['start'], str):
+            options['start'] = [options['start']]
+
+        self.__dict__['options'] = options
+
+
+        assert_config(self.parser, ('earley', 'lalr', 'cyk', None))
+
+        if self.parser == 'earley' and self.transformer:
+            raise ConfigurationError('Cannot specify an embedded transformer when using the Earley algorithm. '
+                             'Please use your transformer on the resulting parse tree, or use a different algorithm (i.e. LALR)')
+
+        if self.cache_grammar and not self.cache:
+            raise ConfigurationError('cache_grammar cannot be set when cache is disabled')
+
+        if o:
+            raise ConfigurationError("Unknown options: %s" % o.keys())
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self.__dict__['options'][name]
+        except KeyError as e:
+            raise AttributeError(e)
+
+    def __setattr__(self, name: str, value: str) -> None:
+        assert_config(name, self.options.keys(), "%r isn't a valid option. Expected one of: %s")
+        self.options[name] = value
+
+    def serialize(self, memo = None) -> Dict[str, Any]:
+        return self.options
+
+    @classmethod
+    def deserialize(cls, data: Dict[str, Any], memo: Dict[int, Union[TerminalDef, Rule]]) -> "LarkOptions":
+        return cls(data)
+
+
+##
+
+##
+
+_LOAD_ALLOWED_OPTIONS = {'postlex', 'transformer', 'lexer_callbacks', 'use_bytes', 'debug', 'g_regex_flags', 'regex', 'propagate_positions', 'tree_class', '_plugins'}
+
+_VALID_PRIORITY_OPTIONS = ('auto', 'normal', 'invert', None)
+_VALID_AMBIGUITY_OPTIONS = ('auto', 'resolve', 'explicit', 'forest')
+
+
+_T = TypeVar('_T', bound="Lark")
+
+class Lark(Serialize):
+    #--
+
+    source_path: str
+    source_grammar: str
+    grammar: 'Grammar'
+    options: LarkOptions
+    lexer: Lexer
+    parser: 'ParsingFrontend'
+    terminals: Collection[TerminalDef]
+
+    __serialize_fields__ = ['parser', 'rules', 'options']
+
+    def __init__(self, grammar: 'Union[Grammar, str, IO[str]]', **options) -> None:
+        self.options = LarkOptions(options)
+        re_module: types.ModuleType
+
+        ##
+
+        if self.options.cache_grammar:
+            self.__serialize_fields__ = self.__serialize_fields__ + ['grammar']
+
+        ##
+
+        use_regex = self.options.regex
+        if use_regex:
+            if _has_regex:
+                re_module = regex
+            else:
+                raise ImportError('`regex` module must be installed if calling `Lark(regex=True)`.')
+        else:
+            re_module = re
+
+        ##
+
+        if self.options.source_path is None:
+            try:
+                self.source_path = grammar.name  ##
+
+            except AttributeError:
+                self.source_path = '<string>'
+        else:
+            self.source_path = self.options.source_path
+
+        ##
+
+        try:
+            read = grammar.read  ##
+
+        except AttributeError:
+            pass
+        else:
+            grammar = read()
+
+        cache_fn = None
+        cache_sha256 = None
+        if isinstance(grammar, str):
+            self.source_grammar = grammar
+            if self.options.use_bytes:
+                if not grammar.isascii():
+                    raise ConfigurationError("Grammar must be ascii only, when use_bytes=True")
+
+            if self.options.cache:
+                if self.options.parser != 'lalr':
+                    raise ConfigurationError("cache only works with parser='lalr' for now")
+
+                unhashable = ('transformer', 'postlex', 'lexer_callbacks', 'edit_terminals', '_plugins')
+                options_str = ''.join(k+str(v) for k, v in options.items() if k not in unhashable)
+                from . import __version__
+                s = grammar + options_str + __version__ + str(sys.version_info[:2])
+                cache_sha256 = sha256_digest(s)
+
+                if isinstance(self.options.cache, str):
+                    cache_fn = self.options.cache
+                else:
+                    if self.options.cache is not True:
+                        raise ConfigurationError("cache argument must be bool or str")
+
+                    try:
+                        username = getpass.getuser()
+                    except Exception:
+                        ##
+
+                        ##
+
+                        ##
+
+                        username = "unknown"
+
+
+                    cache_fn = tempfile.gettempdir() + "/.lark_%s_%s_%s_%s_%s.tmp" % (
+                        "cache_grammar" if self.options.cache_grammar else "cache", username, cache_sha256, *sys.version_info[:2])
+
+                old_options = self.options
+                try:
+                    with FS.open(cache_fn, 'rb') as f:
+                        logger.debug('Loading grammar from cache: %s', cache_fn)
+                        ##
+
+                        for name in (set(options) - _LOAD_ALLOWED_OPTIONS):
+                            del options[name]
+                        file_sha256 = f.readline().rstrip(b'\n')
+                        cached_used_files = pickle.load(f)
+                        if file_sha256 == cache_sha256.encode('utf8') and verify_used_files(cached_used_files):
+                            cached_parser_data = pickle.load(f)
+                            self._load(cached_parser_data, **options)
+                            return
+                except FileNotFoundError:
+                    ##
+
+                    pass
+                except Exception: ##
+
+                    logger.exception("Failed to load Lark from cache: %r. We will try to carry on.", cache_fn)
+
+                    ##
+
+                    ##
+
+                    self.options = old_options
+
+
+            ##
+
+            self.grammar, used_files = load_grammar(grammar, self.source_path, self.options.import_paths, self.options.keep_all_tokens)
+        else:
+            assert isinstance(grammar, Grammar)
+            self.grammar = grammar
+
+
+        if self.options.lexer == 'auto':
+            if self.options.parser == 'lalr':
+                self.options.lexer = 'contextual'
+            elif self.options.parser == 'earley':
+                if self.options.postlex is not None:
+                    logger.info("postlex can't be used with the dynamic lexer, so we use 'basic' instead. "
+                                "Consider using lalr with contextual instead of earley")
+                    self.options.lexer = 'basic'
+                else:
+                    self.options.lexer = 'dynamic'
+            elif self.options.parser == 'cyk':
+                self.options.lexer = 'basic'
+            else:
+                assert False, self.options.parser
+        lexer = self.options.lexer
+        if isinstance(lexer, type):
+            assert issubclass(lexer, Lexer)     ##
+
+        else:
+            assert_config(lexer, ('basic', 'contextual', 'dynamic', 'dynamic_complete'))
+            if self.options.postlex is not None and 'dynamic' in lexer:
+                raise ConfigurationError("Can't use postlex with a dynamic lexer. Use basic or contextual instead")
+
+        if self.options.ambiguity == 'auto':
+            if self.options.parser == 'earley':
+                self.options.ambiguity = 'resolve'
+        else:
+            assert_config(self.options.parser, ('earley', 'cyk'), "%r doesn't support disambiguation. Use one of these parsers instead: %s")
+
+        if self.options.priority == 'auto':
+            self.options.priority = 'normal'
+
+        if self.options.priority not in _VALID_PRIORITY_OPTIONS:
+            raise ConfigurationError("invalid priority option: %r. Must be one of %r" % (self.options.priority, _VALID_PRIORITY_OPTIONS))
+        if self.options.ambiguity not in _VALID_AMBIGUITY_OPTIONS:
+            raise ConfigurationError("invalid ambiguity option: %r. Must be one of %r" % (self.options.ambiguity, _VALID_AMBIGUITY_OPTIONS))
+
+        if self.options.parser is None:
+            terminals_to_keep = '*'     ##
+
+        elif self.options.postlex is not None:
+            terminals_to_keep = set(self.options.postlex.always_accept)
+        else:
+            terminals_to_keep = set()
+
+        ##
+
+        self.terminals, self.rules, self.ignore_tokens = self.grammar.compile(self.options.start, terminals_to_keep)
+
+        if self.options.edit_terminals:
+            for t in self.terminals:
+                self.options.edit_terminals(t)
+
+        self._terminals_dict = {t.name: t for t in self.terminals}
+
+        ##
+
+        if self.options.priority == 'invert':
+            for rule in self.rules:
+                if rule.options.priority is not None:
+                    rule.options.priority = -rule.options.priority
+            for term in self.terminals:
+                term.priority = -term.priority
+        ##
+
+        ##
+
+        ##
+
+        elif self.options.priority is None:
+            for rule in self.rules:
+                if rule.options.priority is not None:
+                    rule.options.priority = None
+            for term in self.terminals:
+                term.priority = 0
+
+        ##
+
+        self.lexer_conf = LexerConf(
+                self.terminals, re_module, self.ignore_tokens, self.options.postlex,
+                self.options.lexer_callbacks, self.options.g_regex_flags, use_bytes=self.options.use_bytes, strict=self.options.strict
+            )
+
+        if self.options.parser:
+            self.parser = self._build_parser()
+        elif lexer:
+            self.lexer = self._build_lexer()
+
+        if cache_fn:
+            logger.debug('Saving grammar to cache: %s', cache_fn)
+            try:
+                with FS.open(cache_fn, 'wb') as f:
+                    assert cache_sha256 is not None
+                    f.write(cache_sha256.encode('utf8') + b'\n')
+                    pickle.dump(used_files, f)
+                    self.save(f, _LOAD_ALLOWED_OPTIONS)
+            except IOError as e:
+                logger.exception("Failed to save Lark to cache: %r.", cache_fn, e)
+
+    if __doc__:
+        __doc__ += "\n\n" + LarkOptions.OPTIONS_DOC
+
+    def _build_lexer(self, dont_ignore: bool=False) -> BasicLexer:
+        lexer_conf = self.lexer_conf
+        if dont_ignore:
+            from copy import copy
+            lexer_conf = copy(lexer_conf)
+            lexer_conf.ignore = ()
+        return BasicLexer(lexer_conf)
+
+    def _prepare_callbacks(self) -> None:
+        self._callbacks = {}
+        ##
+
+        if self.options.ambiguity != 'forest':
+            self._parse_tree_builder = ParseTreeBuilder(
+                    self.rules,
+                    self.options.tree_class or Tree,
+                    self.options.propagate_positions,
+                    self.options.parser != 'lalr' and self.options.ambiguity == 'explicit',
+                    self.options.maybe_placeholders
+                )
+            self._callbacks = self._parse_tree_builder.create_callback(self.options.transformer)
+        self._callbacks.update(_get_lexer_callbacks(self.options.transformer, self.terminals))
+
+    def _build_parser(self) -> "ParsingFrontend":
+        self._prepare_callbacks()
+        _validate_frontend_args(self.options.parser, self.options.lexer)
+        parser_conf = ParserConf(self.rules, self._callbacks, self.options.start)
+        return _construct_parsing_frontend(
+            self.options.parser,
+            self.options.lexer,
+            self.lexer_conf,
+            parser_conf,
+            options=self.options
+        )
+
+    def save(self, f, exclude_options: Collection[str] = ()) -> None:
+        #--
+        if self.options.parser != 'lalr':
+            raise NotImplementedError("Lark.save() is only implemented for the LALR(1) parser.")
+        data, m = self.memo_serialize([TerminalDef, Rule])
+        if exclude_options:
+            data["options"] = {n: v for n, v in data["options"].items() if n not in exclude_options}
+        pickle.dump({'data': data, 'memo': m}, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls: Type[_T], f) -> _T:
+        #--
+        inst = cls.__new__(cls)
+        return inst._load(f)
+
+    def _deserialize_lexer_conf(self, data: Dict[str, Any], memo: Dict[int, Union[TerminalDef, Rule]], options: LarkOptions) -> LexerConf:
+        lexer_conf = LexerConf.deserialize(data['lexer_conf'], memo)
+        lexer_conf.callbacks = options.lexer_callbacks or {}
+        lexer_conf.re_module = regex if options.regex else re
+        lexer_conf.use_bytes = options.use_bytes
+        lexer_conf.g_regex_flags = options.g_regex_flags
+        lexer_conf.skip_validation = True
+        lexer_conf.postlex = options.postlex
+        return lexer_conf
+
+    def _load(self: _T, f: Any, **kwargs) -> _T:
+        if isinstance(f, dict):
+            d = f
+        else:
+            d = pickle.load(f)
+        memo_json = d['memo']
+        data = d['data']
+
+        assert memo_json
+        memo = SerializeMemoizer.deserialize(memo_json, {'Rule': Rule, 'TerminalDef': TerminalDef}, {})
+        if 'grammar' in data:
+            self.grammar = Grammar.deserialize(data['grammar'], memo)
+        options = dict(data['options'])
+        if (set(kwargs) - _LOAD_ALLOWED_OPTIONS) & set(LarkOptions._defaults):
+            raise ConfigurationError("Some options are not allowed when loading a Parser: {}"
+                             .format(set(kwargs) - _LOAD_ALLOWED_OPTIONS))
+        options.update(kwargs)
+        self.options = LarkOptions.deserialize(options, memo)
+        self.rules = [Rule.deserialize(r, memo) for r in data['rules']]
+        self.source_path = '<deserialized>'
+        _validate_frontend_args(self.options.parser, self.options.lexer)
+        self.lexer_conf = self._deserialize_lexer_conf(data['parser'], memo, self.options)
+        self.terminals = self.lexer_conf.terminals
+        self._prepare_callbacks()
+        self._terminals_dict = {t.name: t for t in self.terminals}
+        self.parser = _deserialize_parsing_frontend(
+            data['parser'],
+            memo,
+            self.lexer_conf,
+            self._callbacks,
+            self.options,  ##
+
+        )
+        return self
+
+    @classmethod
+    def _load_from_dict(cls, data, memo, **kwargs):
+        inst = cls.__new__(cls)
+        return inst._load({'data': data, 'memo': memo}, **kwargs)
+
+    @classmethod
+    def open(cls: Type[_T], grammar_filename: str, rel_to: Optional[str]=None, **options) -> _T:
+        #--
+        if rel_to:
+            basepath = os.path.dirname(rel_to)
+            grammar_filename = os.path.join(basepath, grammar_filename)
+        with open(grammar_filename, encoding='utf8') as f:
+            return cls(f, **options)
+
+    @classmethod
+    def open_from_package(cls: Type[_T], package: str, grammar_path: str, search_paths: 'Sequence[str]'=[""], **options) -> _T:
+        #--
+        package_loader = FromPackageLoader(package, search_paths)
+        full_path, text = package_loader(None, grammar_path)
+        options.setdefault('source_path', full_path)
+        options.setdefault('import_paths', [])
+        options['import_paths'].append(package_loader)
+        return cls(text, **options)
+
+    def __repr__(self):
+        return 'Lark(open(%r), parser=%r, lexer=%r, ...)' % (self.source_path, self.options.parser, self.options.lexer)
+
+
+    def lex(self, text: TextOrSlice, dont_ignore: bool=False) -> Iterator[Token]:
+        #--
+        lexer: Lexer
+        if not hasattr(self, 'lexer') or dont_ignore:
+            lexer = self._build_lexer(dont_ignore)
+        else:
+            lexer = self.lexer
+        lexer_thread = LexerThread.from_text(lexer, text)
+        stream = lexer_thread.lex(None)
+        if self.options.postlex:
+            return self.options.postlex.process(stream)
+        return stream
+
+    def get_terminal(self, name: str) -> TerminalDef:
+        #--
+        return self._terminals_dict[name]
+
+    def parse_interactive(self, text: Optional[LarkInput]=None, start: Optional[str]=None) -> 'InteractiveParser':
+        #--
+        return self.parser.parse_interactive(text, start=start)
+
+    def parse(self, text: LarkInput, start: Optional[str]=None, on_error: 'Optional[Callable[[UnexpectedInput], bool]]'=None) -> 'ParseTree':
+        #--
+        if on_error is not None and self.options.parser != 'lalr':
+            raise NotImplementedError("The on_error option is only implemented for the LALR(1) parser.")
+        return self.parser.parse(text, start=start, on_error=on_error)
+
+
+
+
+class DedentError(LarkError):
+    pass
+
+class Indenter(PostLex, ABC):
+    #--
+    paren_level: int
+    indent_level: List[int]
+
+    def __init__(self) -> None:
+        self.paren_level = 0
+        self.indent_level = [0]
+        assert self.tab_len > 0
+
+    def handle_NL(self, token: Token) -> Iterator[Token]:
+        if self.paren_level > 0:
+            return
+
+        yield token
+
+        indent_str = token.rsplit('\n', 1)[1] ##
+
+        indent = indent_str.count(' ') + indent_str.count('\t') * self.tab_len
+
+        if indent > self.indent_level[-1]:
+            self.indent_level.append(indent)
+            yield Token.new_borrow_pos(self.INDENT_type, indent_str, token)
+        else:
+            while indent < self.indent_level[-1]:
+                self.indent_level.pop()
+                yield Token.new_borrow_pos(self.DEDENT_type, indent_str, token)
+
+            if indent != self.indent_level[-1]:
+                raise DedentError('Unexpected dedent to column %s. Expected dedent to %s' % (indent, self.indent_level[-1]))
+
+    def _process(self, stream):
+        token = None
+        for token in stream:
+            if token.type == self.NL_type:
+                yield from self.handle_NL(token)
+            else:
+                yield token
+
+            if token.type in self.OPEN_PAREN_types:
+                self.paren_level += 1
+            elif token.type in self.CLOSE_PAREN_types:
+                self.paren_level -= 1
+                assert self.paren_level >= 0
+
+        while len(self.indent_level) > 1:
+            self.indent_level.pop()
+            yield Token.new_borrow_pos(self.DEDENT_type, '', token) if token else Token(self.DEDENT_type, '', 0, 0, 0, 0, 0, 0)
+
+        assert self.indent_level == [0], self.indent_level
+
+    def process(self, stream):
+        self.paren_level = 0
+        self.indent_level = [0]
+        return self._process(stream)
+
+    ##
+
+    @property
+    def always_accept(self):
+        return (self.NL_type,)
+
+    @property
+    @abstractmethod
+    def NL_type(self) -> str:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def OPEN_PAREN_types(self) -> List[str]:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def CLOSE_PAREN_types(self) -> List[str]:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def INDENT_type(self) -> str:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def DEDENT_type(self) -> str:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def tab_len(self) -> int:
+        #--
+        raise NotImplementedError()
+
+
+class PythonIndenter(Indenter):
+    #--
+
+    NL_type = '_NEWLINE'
+    OPEN_PAREN_types = ['LPAR', 'LSQB', 'LBRACE']
+    CLOSE_PAREN_types = ['RPAR', 'RSQB', 'RBRACE']
+    INDENT_type = '_INDENT'
+    DEDENT_type = '_DEDENT'
+    tab_len = 8
+
+
+
+# Parsers pré-compilados: grammar_key → tabelas LALR (zlib + base64)
+PARSERS_FORMAT = 2
+PARSERS = {
+    'e046d1250568cbb3fbd64b7e48c539179b8f27e8e82944f988670240cbec6d58': (
+        'eNrs3Qt8o1Wd/3HmFiCEECAECBBCGCA3wjWEEAJ0ZjqZ0rQdJjMgKlvLM4VMHGbG6ZTLKvW2ulWz'
+        'XtbRGjVqXbte6q6rbl2z1dWItbu6u3YteK9tY2sNsXaztZuuWvs/53xOM4N7Y/17QRheryff9Dqd'
+        '0/f3/J48zZRXbHrbR888Sf336FFvduPejiMdR+U906GOw12dh9V98/7OhzsPtxsHD9ynXj71SOfh'
+        'B/Yd6NjfdfSeo95Hj2bX3Xa0+aSuR4+mzc3riPXEBmIjsYkwEScTpxCnEmbiNMJCnE5YiTMIG3Em'
+        'cRZxNmEnziEcxLnEecT5hJO4gLiQuIhwERcTbuISwkNcSmwmLiMuJ64gvISP8BMBIkhcSYSIq4ir'
+        'iWuIa4nriOuJMHEDESFuJKLETUSMuJmIE7cQtxK3EQ3EFmIrsY1oJLYTCWIH0UTcTjQTSaKFaCXa'
+        'iJ3EHcQuIkXsJvYQdxJ3Ec8j7iaeT7yAeCFxD/EHRDvxIqKDuJcwiL1EJ3EfcT+RJvYRGeLFxH7i'
+        'AeIAcZA4RLyEOEx0EUeIbuJB4iHiYeIR4g+JlxIvIx4leoiXE68gXkm8ing18UfEa4jXEn9M9BKv'
+        'I15PvIHIEn9CvJF4E/Fm4i3EnxJvJY4SbyPeTvQR7yByxDuJdxHvJvLEe4j3Eu8j+on3E39GfKCr'
+        'M2vad/+Bg4c7xY6UNbe3NyVa23Y1tl99tCN7+v3thzvv73y4/b79Hfd3iY0qe2p3V2f7vY8c6ew6'
+        '+rq1ze3II4c6xUeKPe5I58NHujv2H82e0q5e295+NHtqUr7TVrkBdmdPY2s8th9uOty9v1PvheKr'
+        'GeCL+nPig8SHiA8THyEGiY8Sf0H8JfEx4q+IjxOfID5J/DUxRHyK+Bvi00SB+FtimPgM8Vni74jP'
+        'EZ8nisQXiMeILxIjxJeIUeLviX8gvkx8hfhH4p+Ifya+SowR/0J8jRgnHieeIL5OfIP4JvEt4tvE'
+        'd4jvEhPE94hJYoqYJkrE94kZYpb4ATFH/JAoE08SFeJHxDzxY2KB+FeiSvwbsUj8hFgi/p2oEcvE'
+        'fxA/JX5G/JxYIX5BrKpoOYkB3LJO53qdG3Ru1LlJp0nnyTpP0XmqTrPO03RadJ6u06rzDJ02nWfq'
+        'PEvn2TrtOs/R6dB5rs7zdJ6v06nzAp0X6rxIp0vnxTrdOi/R6dF5qc7NOi/TebnOK3R6dfp0+nUG'
+        'dAZ1XqkzpPMqnVfrvEbntTqv03m9zrDOG3RGdN6oM6rzJp0xnTfrjOu8ReetOm/T2aBzi86tOrfp'
+        'bNS5XWdC5w6dTTpv16lP7FqSOlt0tups07lT5x06d+lM6dytc4/OO3XepfN5Ou/W+XydL9D5Qp33'
+        '6PwDne06X6SzQ+e9Og2de3V26rxP5/060zr36czofLHO/Tof0HlA50Gdh3S+ROdhnV06j+js1vmg'
+        'zod0PqzzEZ1/qPOlOl+m81GdPTpfrvMVOl+p81U6X63zj3S+Rudrdf6xzl6dr9P5ep1v0JnV+Sc6'
+        '36jzTTrfrPMtOv9U51t1HtX5Np1v19mn8x06czrfqfNdOt+tM6/zPTrfq/N9Ovt1vl/nn+n8gM4B'
+        'nX+u84M6P6Tzwzo/onNQ50d1/oXOv9T5MZ1/pfPjOj+h85M6/1rnkM5P6fwbnZ/WWdD5tzqHdX5G'
+        '52d1/p3Oz+n8vM6izi/ofEznF3WO6PySzlGdf6/zH3R+WedXdP6jzn/S+c86v6pzTOe/6PyaznGd'
+        'j+t8QufXdX5D5zd1fkvnt3V+R+d3dU7o/J7OSZ1TOqd1lnR+X+eMzlmdP9A5p/OHOss6n9RZ0fkj'
+        'nfM6f6xzQee/6qzq/Dedizp/onNJ57/rrOlc1vkfOn+q82c6f65zRecvdK7qPGm9nv861+vcoHOj'
+        'zk06TTpP1nmKzlN1mnWeptOi83SdVp1n6LTpPFPnWTrP1mnXeY5Oh85zdZ6n83ydTp0X6LxQ50U6'
+        'XTov1unWeYlOj85LdW7WeZnOy3VeodOr06fTrzOgM6jzSp0hnVfpvFrnNTqv1XndevEYZVPXkY7D'
+        'R8QDhUzz+pNO6qg/kuDBx8b9HfsPH01/KmveqV7Nw430BvkQ4/RDHcaLO/e2i08gH7Zs+eFPNp70'
+        'ik1v23jSurVrN83iJrup8Y49DUmRXel99x05eocYm6892tW8Tj1KubupMbntaNZ0uHNvt9F59I7m'
+        'J+94rXixYefOxtZtR9OnZDc0bFNp2tXQuq2tRd7d2CbeqF7X2Jras6tR3t10166m3erexjv2NO2W'
+        'd05JNLY27mrgtZtSycbGnfLeyTt3tW3bs1W/dncbH2/a1ri9qZW7TS0723bt5rPuaErynrsamlK8'
+        'uSGVauTNG5NNKe6kGu5Ub9yQaNRvaWvQX3ZjSxtv27Q1KT5U3dvZsIdPtqmlYffWHeojduo3io/Y'
+        '2djAZ7mrgb+KeVvT1t1Nba0Nu+5Wf7Otba27m1r38PVs3dWo/5Ibdzc06z9qR+PWZv332tbYymfb'
+        'vqd1q/oixd9V5fa2XSpTDerTbtrWmOSeKdWYbNzKEmwRn76Zd+Pvtmn3np0sysatDXpNmlrX1sTU'
+        '+LytjTt3861LNfMBO3a13cVfsokv62Sx2A3J5N36S0w26u9Sw9rf2HRn466m7ertG+VfXt0RX8k2'
+        '3i11N3+Vk5tatyb3bGPtd+7h3VobWvjy7mrardZ2fdN2vbK79+xScjY2Pk//OVt3tLXxl9jYoldv'
+        'w26WWZhpwsnJu4ThJqRs0N+6jcLOTtZ1l3a5GbPdzetVPe7rPmAc2XfwQLvRsX//0fSGO8TGJ3Bv'
+        'FAx2qxcXRRHSN8l7M+Je9tT9+7qOtO/v6Dqi3vp38nWnpBp3NoBYvCojPj69Rd5LyTdu7Dhy8AH1'
+        'htvlJzYlt+xq2Mp7bpKv2NDVrd7c3C1esKjPfrjzwU7RY/XaT8tPsTO5J6VemhUvbdratqdVfW3N'
+        'XeJPMsvPtFH9Samm5/OJvydf3JRsu6txl3r5NfJl816xA7Q/0GEcPqhe+RH5ypO3trVsUZ0Sr9kn'
+        'X7MhtadFffIb1DKk7tiiXhqRn7Ft1zb9GW3qD0yKv7Z68X3yRVPrnpYtvL05I998e1tTq3rphfWF'
+        '6zp4WC1c84R81R6xg+zCp/gk56qv8oGOI+njvsrb1GdONrYmJBPxisfUl33o8EGxF/E96JLLeJr6'
+        'uL37Hty3l4XbLL9g9Qeod1qW35WL5L0bN8iF7jpyeN+B+4/7gx5ed9yr9x98qPOwevXL1BelvvZj'
+        '79ujJKj1rX/1r2I59+za1ch3R5zhyi9dIE7tVt89ccosv6YWsSnw8lvUy7ubWhp5+a3y5TPv27e/'
+        's73zYfEndh33R35oXZ3H/n1HOg93gLVffYrtTbu01o8e/7foPnRI/y0+rZi27EnubtopCy1e9TH1'
+        '1W1rurNpG3+BUfUt7Xz4EB8SgpTaZMWL48d/4q5D4mtQr/6ceq/tyaad6sVp+eLp6lvR1X3vkcMd'
+        '+lv0I/6mbdsa+MNn+TC1b4sXq/JFW8cR8dnv7RZIOwyjs6tLveknxz7jA937j+w7tP8R9foaxduz'
+        'ZbeoE1/iz48t397O/Z1Pwb5BGWH5Og/cfyStXvuLY9/c+/Yd1pU+Rb6r2EzE5qa/tRZV3NTuXU2t'
+        'CfUKh3yFZe8+46nfjEPy1aeor7Vj7171qjPUn6uXLXNw3wH12gtU8VvlfiteulB9NrFeXcbhfYfk'
+        'ZqRefbF8tVn9dY79PTzylZtSO5NN/J0vFy93N8tJnzalT75DPLoSozl9avpxsS88nj4t/Xj2lPbW'
+        'xruSquKPpy3iOF0cVnE8KI4zxGETx5niOEu888myj8rv4+mzxWEXxznicIjjXHGcJ47zxeEUxwXi'
+        '/cX+KneAx9MXiuMicbjEcbE43OK4RBwecVwqjs3iuEwcl4vjCvGBp7a3N7S2tbZfc738aK84fOLw'
+        'iyMgjqA4rhRHSBxXieNqcVwjjmvFcZ04rhdHWBw3iCMijhvFERXHTeKIiePm4/+Ea+SfEBfHLeK4'
+        'VRy3iaNNHA3i2CKOreLYJo5GcWwXR0J8tBgrDSmx4Rz3ea6Tn2eHOJrEcbs4msWRPP49rpXv0SKO'
+        'VvkZxM7a0iA/g0mdW6XUJ2tt293OqZZcvWRjSr365IQ6PZArmV3fpmJDgxxTj2fN8n2OfYj4rMm2'
+        'VnnvdP0xx962fneb+qxNrdxZv+Vu9fIutUvLO2ozF29oUp9h056UAi1e0aC+DNMuPZse727euEaq'
+        'uYioqhBVFaKq6SfEYRHH6eKwiuMMcdjEcaY4zhLH2eKwi+MccTjEca44zhPH+eJwiuMCcVwojovE'
+        '4RLHxeJwi+MScXjEcak4NovjMnFcLo4rxOEVh08cfnEExBEUx5XiCInjKnFcLY5rxHGtOK4Tx/Xi'
+        'CIvjBnFExHGjOKLiuEkcMXHcLI64OG4Rx63iuE0cDeLYIo6t4tgmjkZxbBdHQhw7xNEkjtvF0SyO'
+        'pDhaxNEqjrZ0tbt5U72CH9cVXBQLtigWbFEs2KJYsEWxYItiwRbFgi2KBVsUC7YoFmxRLNiiWLBF'
+        'sWCLYsEWxYItigVbFAu2KBZsUSzYoliwRbFgi2LBFsWCLYoFWxQLtigWbFEs2KJYsEWxYItiwRbF'
+        'gi2KBVsUC7YoFmxRLNiiWLBFsWCLYsEWxYItigVbFAu2KBZsUSzYoliwRbFgi2LBFsWCLYoFWxQL'
+        'tigWbFEs2KJYsEWxYItiwRbFgi2KBVsUC7YoFmxRLNiiWLBFsWCLYsEWxYItigVbFAu2KBZsUSzY'
+        'oliwRbFgi2LBFsWCLXY3m+rA/o31WhLrtSTWa0ms1ZJYqyWxVktirZbEWi2JtVoSa7Uk1mpJrNWS'
+        'WKslsVZLYq2WxFotibVaEmu1JNZqSazVklirJbFWS2KtlsRaLYm1WhJrtSTWakms1ZJYqyWxVkti'
+        'rZbEWi2JtVoSa7Uk1mpJrNWSWKslsVZLYq2WxFotibVaEmu1JNZqSazVklirJbFWS2KtlsRaLYm1'
+        'WhJrtSTWakms1ZJYqyWxVktirZbEWi2JtVoSa7Uk1mpJrNWSWKslsVZLYq2WxFotibVaEmu1JNZq'
+        'SazVklirJbFWS2KtlrqbT5Zr9WO535vkaYxi9l7NbFks27JYtmXBbFks3bJYumWxdMti6ZbF0i2L'
+        'pVsWS7cslm5ZLN2yWLplsXTLYumWxdIti6VbFku3LJZuWSzdsli6ZbF0y2LplsXSLYulWxZLtyyW'
+        'blks3bJYumWxdMti6ZbF0i2LpVsWS7cslm5ZLN2yWLplsXTLYumWxdIti6VbFku3LJZuWSzdsli6'
+        'ZbF0y2LplsXSLYulWxZLtyyWblks3bJYumWxdMti6ZbF0i2LpVsWS7cslm5ZLN2yWLplsXTLYumW'
+        'xdIti6VbFku3LJZuWSzdsli6ZbF0y2LplrubT5FL55BL9zw1T490HxIDtevIAwz7bXI9W+W9Vnnv'
+        'XHnvRfKeS55DninunC1fdVr9nP4z8uHANfLe6+W9sHy3lLizQ77qr9epb4l41fPEnQvlq86WpxjW'
+        'ro4HO9vVKK//yV+V73u9vPclea9R3kuos4XDnUe6Dx849p775R9ul/e88l5Q3nu5vGdRJ5Xy3mXy'
+        'z3y9uNOiPo06PVWnJ2ufpHm/eGNU3vm2eNsZXZ1H2ju6uvbdf9wf41Vf6cFDnQd+6Ss9qhbuofRT'
+        'XvlhcRYtvmPiXl7eu0Wd1ckvxa/OA+W9M9UJinzrafLev8vX3Srv/Zu8d7O8Ny/vBeQ9q3w/q3qY'
+        'JV8XkfcMeaZu7tq/zzjuD35IvvKUjq4XH3vVhepV8u9Uf1WP/HSny3tvkvec6txY3mtSp8PyA87q'
+        '6HrkgNFefwC4t/M+9aF/I9/tUnnv4/KeTy5aTtw5S75qWH1J9x7u7Djuz/+CfL8b5L3PynuXy3v/'
+        'LO+dJ+99bYN+WGOkj33IY/KVVvVT4vS+A8d94d/aoAh0HNh78IFjr31Cvvacw50PHJSODos38Whq'
+        '7bu7Ufxh58g7p4o7V8g7p4s7V8o7Z4k7zfLOBeLObfKOXZ7f7rvv2Ee7xVsukHcuFXe2yTtXSEBG'
+        'R9exdW+O6ceazdeJO5vlnZ36EVVzo7hzibzzAnGnQd7xyfN59XXue+CQeMh37NM8It4lIe90ylU5'
+        '3LHv+D/jpeKNZ8g7Lxd33PLOq8Wdq+WdN6pvcccjx975teJNV8k7RynNoc6O4/6ct4u3xuWdd8q/'
+        'ykP7jhxb/OZ3i7edL++8Vz+0b36/fCd1ieyBzgMseZP8Bm6Vb/yEOoUXf5Hj/Df/g3hrSN75nHzr'
+        'Qx37D3d3HXvrn6v12y8qtsaq+aviA66Td8bVI5GOB+7d23HsA74rHwLcJ58atf+4v+LX1dfese+4'
+        'v9ek/Ohfqm5zSXxuj7wzIxf1kX2d+/cee+MPxRuH5J0K39T9+4+9beHYA/O1V9Xkqw7Jr7z+qp/J'
+        'h2D3HTzc3tlxvOGTeEj4SJdYteMfaslXn9/Rfb9cys69ep+RLxz70FPklne7emwl721XD5XkvYvl'
+        'Pbt6WNbxlL94i1O+2SbvudbpNeg8DlZLUL7dqx4j8Why7972Iwef2pOWbepRY/dx5lpuVA8w5dM3'
+        '9h3oPu7118jPd6O8t0P9PcWj084HDh33uZL6AwXw7gPH1rulTX5gUt67U967Vt67W+2tYtfY+0t7'
+        '6z3qr2o8dXN40To15OUOqP7o/7RFvWSdfNR36qPMpOaT5aVas3jpSfnGs9SV29Pq56NOThQyH1x3'
+        '0klpM3Ea8QRhIU4nrMQZhI04kziLOJuwE+cQDuJc4jzifMJJXEBcSFxEuIiLCTdxCeEhLiU2E5cR'
+        'lxNXEF7CR/iJABEkriRCxFXE1cQ1xLXEdcT1RJi4gYgQNxJR4iYiRtxMxIlbiFuJ24gGYguxldhG'
+        'NBLbiQSxg2gibieaiSTRQrQSbSq6my2cAP00/bP0z8WZzoo4x/mFOLtZFd/Ek/gS1rEA6/m7buBP'
+        '2yjj1Mwmvl8mEZmT5c0pLMypfKFm+arT5I1Frb7UKPHaM6ez8FZ8ncH3zcaXeab8gLPkzdmsoV3e'
+        'P0feOOTNufLmPHlzvrxxsrQXsJgX8v29CJUu+Q598r6QPyfPHE7LXMxyu/lWXAIED7Qv5Vu4WX7Y'
+        'ZfLmcnlzhbzxyhufvPHThgByg6z7lfItIXlzlbzp1H9mWf6Zl2auph3XyjddJ2+uh0wYqTdQiYh8'
+        'y43yJipvbpI3MXlzs7yJy5tb5M2t1Oo2fDeAdwvf8a0o2ibfr1HebKdZCQTtkK9qkje30/dmmpOk'
+        'cS2UqxWDbfL9dsqbO6C2S95PyZvd7AF76OSdVOUu+ZbnyZu7qdDz5f0XyJsXIv4eef8P5E079X8R'
+        '9eiA+V4KeL98h7S82SdvMvLmxRRvv7z/gLw5IG8OyptD8uYl8uawvOmSN0fYHrrl/QflzUPyFUOZ'
+        'h+X9R+TNH8qbl8qbl8mbR+VNj7gRp2/7DxrHnb49JL6FmZfLN79C3rxS3rxK3rxa3vwRfXsNlXwt'
+        'W9Ufy7f0ypvXsUm+Xt5/g7zJshv9ibz/RnnzJnnzZnnzFnnzp/LmrWwhR+X9t8mbt7P7vJM65+Sr'
+        '3iVv3i1v8vLmPfJNpsx75f33yZt+Ve/THz2a3dC2h6uBF6ut37o2CX6+Xr54htwA7kjvSqfSu8XZ'
+        'zp70nem70s9L3y1mx/PTL0i/MH1P+g/S7ekXpTvS96aN9N50Z/o+caZ3fzqd3pfOpF+c3p9+IH0g'
+        'fTB9KP2S9OF0V/pIujv9YPqh9MPpR9J/mH5p+mXpR9M96ZenX5F+ZfpV6Ven/yj9mvRr03+c7k2/'
+        'Tpwfvj79hnQ2/SfpN6bflH5z+oPy6/pLuUW8Jf2n6bemj6bfln57ui/9jnQu/c70u9LvTufT70m/'
+        'N/2+dH/6/ek/S38gPZD+8/SH0x9JD6Y/mv6L9F+mP5b+q/TH059IfzL91+K05lPpv0l/Ol1I/216'
+        'OP2Z9GfTf5f+XPrz6WL6C+nH0l9Mj6S/lB5N/336H9JfTn8l/Y/pf0r/c/qr6TFWZ0g291/SX+tu'
+        'tv0Wt8jf/s6Y+QgT/7e2LWYGmdm/kz2RGXSvaPSJzfFX2BwzH5U3fyFvfl93xDP1aXFLYYPc/s56'
+        'Jm1/v6tNT227P5Qbntz+1KZ3tlimWXU1Rg0N+9qqfU8NjXPqDx+y+uFDkcYU2UyKPHwosokV2RmK'
+        'bCYqHiTOIGzEmcRZxNeJswk7cQ7hIM4lziPOJ5zEBcQ3iAuJiwgXcTHhJi4hPMSlxGbiMuJy4gri'
+        'm4SX8BF+IkAEiSuJEHEVcTVxDXEtcR1xPREmbiAixI1ElLiJiBE3E98i4sQtxK3EbUQb0UBsIbYS'
+        '24hGYjuRIL5NfIfYQTQRtxPNRJL4LtFCtBITxPeISWKKmCZKxPeJGWKW+AExR/yQKBNPEhXiR8Q8'
+        '8WNiQUV3s0MqnpAD4eev5Zyo+aB4QO1ob+cy8CH5oF5dau043H6jOoUyq4fW566V42bVhvPk53lS'
+        'tuG69bINE5kv8yV8Wf0x5/8enj/cqx+/7JAnv//pZOIpZxFrpxa/nVOIEw+m/i/nC5xw3fdMOHOo'
+        'ny9kre2qUUfaD+3v7mq/Wl1DDAlmv7PzCM6D33HsVEKfWDzNMwqneIxlamrdtvbEnvvUxLxgbWJ+'
+        'Te0RF9Yn5j/qifkEZp6gO08wMZ+gtk9QhCfozhP4ULGesBFnEmcRZxN24hzCQZxLnEecTziJC4gL'
+        'iYsIF3Ex4SYuITzEpcRm4jLicuIKwkv4CD8RIILElUSIuIq4mriGuJa4jrieCBM3EBHiRiJK3ETE'
+        'iJuJOHELcStxG9FGNBBbiK3ENqKR2E4kiB1EE3E70UwkiRaiVUV380Xq6YXt7R2H7+9iwFyvivAF'
+        'YaMi73xIDhJ5pywnjkto+qTUNKA0XfwoP5ZsXpEvues/K/9naE1BawpaU5iawtQUpqYwNQWmKTBN'
+        'gWkKTFNgmgLTFJimwDQFpikwTYFpCkxTYJoC0xSYpsA0BaYpME2BaQpMU2CaAtMUmKbANAWmKTBN'
+        'gWkKTFNgmgLTFJimwDQFpikwTYFpCkxTYJoC0xSYpsA0BaYpME2BaQpMU2CaAtMUmKbANAWmKRRN'
+        'oWgKRVMomkLRFIqmUDSFoikUTaFoCkVTKJpC0RSKpuA6pTBdUt9c3qA3lxICSggosbmUgFACQgkI'
+        'JU7HS3go4aGEhxIeSpyOl2BRgkUJFiVYlGBRgkUJFiVYlGBR4nS8hI4SOkroKKGjhI4SOkroKKGj'
+        'hI4SOkroKKGjxOl4CSQlkJRAUgJJCSQlkJRAUgJJCSQlkJRAUgJJCSQlkJRAUgJJCSQlkJRAUgJJ'
+        'CSQlTsdLWClhpYSVElZKfCdLkClBpgSZEmRKkClBpgSZEqfjJU7HSwAqAagEoBKASgAqcTpewlEJ'
+        'RyVOx0ucjpc4HS9xOl7idLzE6XiJ0/ESp+MlTsdLnI6XOB0vcTpe4nS8xOl4iXPhEqfjJU7HS5yO'
+        'lzgdLynFnvo2NgviGRDPgHgGvTPonUHvDGxnYDsD2xnYzuB1Bq8zeJ3B6wxeZ/A6g9cZvM7gdQao'
+        'M0CdAeoMUGeAOgPUGaDOAHUGqDNAnQHqDFBnEDqD0BmEziB0BqEzCJ1B6AxCZxA6g9AZhM4gdAah'
+        'MwidQegMQmcQOoPQGYTOIHQGoTPQnIHmDDRnoDmDyRlMzmByBpMzmJzB5AwmZ1A4g8IZFM6gcAaF'
+        'M/Cbgd8M+GcUgEslAPVsmx+sX3tayKfVM1g31ze4Vr3BlbFRxkaZDa4MkTJEyhAps8GVkVJGShkp'
+        'ZaSU2eDKgCkDpgyYMmDKgCkDpgyYMmDKgCmzwZVxU8ZNGTdl3JRxU8ZNGTdl3JRxU8ZNGTdl3JTZ'
+        '4MrwKcOnDJ8yfMrwKcOnDJ8yfMrwKcOnDJ8yfMrwKcOnDJ8yfMrwKcOnDJ8yfMrwKbPBlVFURlEZ'
+        'RWUUlfkel8FUBlMZTGUwlcFUBlMZTGU2uDIbXBlaZWiVoVWGVhlaZTa4MsLKCCuzwZXZ4MpscGU2'
+        'uDIbXJkNrswGV2aDK7PBldngymxwZTa4MhtcmQ2uzAZXZoMrs8GV2eDKbHBl5fsycdZWlmdt18uz'
+        'tsvFS49J4j9Vp3RXHHchMnuqcfDA3n3153pX16tnouzJnrb/4P37jI797QcO6ucDyZ+VPPWSpXht'
+        'ZR1PIOfxyM/k+/wvly+PfeaOAzw1Xf2g9mle1JS/3+KBQx2H93XpL/h6+QX/mq5yZs1rX9pB/unB'
+        'd+RX9qtc+vyvftajLnZ669tLQm8vK2wvK2wvK+wrK+wrK+wrK2woK2woK2woK2woK+wkK+wkK+wk'
+        'K+wkK+wkK+wkK+wkK+wkK+wkK2whK2whK2whK2whK2whK2whK2whK2whK2whK2whK2whK2whK+wd'
+        'K+wdK+wdK+wdK+wdK+wdK+wdK+wdK+wdK+wdK+wdK+wdK+wdK+wdK+wdK+wdK+wdK+wdK+wdK+wd'
+        'K+wdK2waK2waK2waK2waK+wWK+wWK+wWK+wWK+wWK+wWK+wWK+wPK+wPK+wPK+wPK+wPK2wMK2wM'
+        'K2xLK6qavqfzYwB1mfxnkvaz/QcC9Wb45bo8KPesJfl0Jq6LHv+PWs5XF0QD8t3U1Y5PqGdf7TuQ'
+        '7jy870jHAaOTJ1ZtkO8VfCb/rEV9c2+SW8tvfZGvVNehM4+pOaL+5Z/4MjIjXIJt/oVcutCz9WfQ'
+        'Jy4b/++Xjfmhdb8w8Vu7fqx+AJAxntlXkn9vrxhfJU79fiSL/nx1qfjq+unHP+jTj7PWKxgqTiOe'
+        'ICzE6YSVOINYT9iIM4mziLMJO3EO4SDOJc4jziecxAXEhcRFhIu4mHATlxAe4lJiM3EZcTlxBeEl'
+        'fISfCBBB4koiRFxFXE1cQ1xLXEdcT4SJG4gIcSMRJW4iYsTNRJy4hbiVuI1oIxqILcRWYhvRSGwn'
+        'EsQOoom4nWgmkkQL0aqiu/ma+oWQH8HBDgc7HOw4sOPAjgM7DuwAsAPADgA7AOwAsAPADgA7AOwA'
+        'sAPADgA7AOwAsAPADgA7AOwAsAPADgA7AOwAsAPADgA7AOwAsAPADgA7AOwAsAPADgA7AOwAsAPA'
+        'DgA7AOwAsAPADgA7AOwAsAPADgA7AOwAsAPADgA7AOwAsPOdt/Odt/Odt/Odt/Odt/Odt/Odt/Od'
+        't/Odt/Odt/Odt/Odt/Odt/Odt0PMrgBce+IZZ8+aZ5w9W59oxknJ18RJyYlnnP3P0/66Z9rDHvVQ'
+        'Z1E+jv2dPra8/rnw1Du11ivyYeXTXpfw2oXBD6kLgzccv0zq0719A5cDn5PPVawvU+R/5iP/ueXT'
+        'uPD5tNfid7kO/+0a3Fg/U6xwpujhTNHDmaKHM0UPZ4oezhQ9nCl6OFP0cKbo4UzRw5mihzNFD2eK'
+        'Hs4UPZwpejhT9HCm6OFM0cOZooczRQ9nih7OFD2cKXo4U/RwpujhTNHDmaKHM0UPZ4oezhQ9nCl6'
+        'OFP0cKbo4UzRw5mihzNFD2eKHs4UPZwpejhT9HCm6OFM0cOZooczRQ9nih7OFD2cKXo4U/Rwpujh'
+        'TNHDmaKHM0UPZ4oezhQ9nCl6OFP0cKbo4UzRw5mihzNFD2eKHs4UPZwpejhT9HCm6OFM0cOZoocz'
+        'RQ9nih7OFD2cKXrUmWJUPo3k5FTj1rbWbfyWoHfy22jUa9Qr3q5+gnZTXcoyUnxI8SHFhxQfUnxI'
+        '8SHFhxQfUnxI8SHFhxQfUnxI8SHFhxQfUnxI8SHFhxQfUnxI8SHFhxQfUnxI8SHFhxQfUnxI8SHF'
+        'hxQfUnxI8SHFhxQfUnxI8SHFhxQfUnxI8SHFhxQfUnxI8SHFhxQfUnxI8SHFhxQfUnxI8SHFhxQf'
+        'UnxI8SHFhxQfUnxI8SHFhxQfUnxI8SHFhxQfUnxI8SHFp6TE6gC+DoAAAAIACAAgAIAAAAIACAAg'
+        'AIAAAAIACAAgAIAAAAIACAAgAIAAAAIACAAgAIAAAAIACAAgAIAAAAIACAAgAIAAAAIACAAgAIAA'
+        'AAIACAAgAIAAAAIACAAgAIAAAAIACAAgAIAAAAIACAAgAIAAAAIACAAgAIAAAAIACAAgAIAAAAIA'
+        'CAAgAIAAAAIACAAgAIAAAAIACAAgAIAAAAIACCgAN/MsZbEjXLRePbdM/uNf+Xzl7ub42hnHx9QZ'
+        'xy1rV/ObP6OfF90SUbvKoY7DHQ+oX7zVbJUfd+v/OoI//6wfwbfVL96N6Yt3UYoVpVhRLt5F6VeU'
+        'fkXpV5R+RelXlH5F6VeUfkXpV5R+RelXlH5F6VeUfkXpV5R+RelXlH5F6VeUfkXpV5R+RelXlH5F'
+        '6VeUfkXpV5R+RelXlH5F6VeUfkXpV5R+RelXlH5F6VeUfkXpV5R+RelXlH5F6VeUfkXpV5R+RelX'
+        'lH5F6VeUfkXpV5R+RelXlH5F6VeUfkXpV5R+RelXlH5F6VeUfkXpV5R+RelXlH5F6VeUfkVVvxp0'
+        'GbIW9ZzOB0VXRKqy/KtwcXxF1Fn8OlkNyiJeOlO+9HTP4VUlT5Uf8Uw7mxeVUDX6pvxr/0R8gcf3'
+        '6Rvyyz5HPxbKblxbnpbz5Kv+m3P+rPXFD/3yerZcID9At7C7ecvazyhbfiE3tlnZxW+rLpYyO9ar'
+        '53TsUN+hrb/JB5zqezomv4Dfu0dS2+qnBmV2sCQ7WJIdLMnWlWTrSrJ1Jdm6kmxdSbauJFtXkq0r'
+        'ydaVZOtKsnUl2bqSbF1Jtq4kW1eSrSvJ1pVk60qydSXZupJsXUm2riRbV5KtK8nWlWTrSrJ1Jdm6'
+        'kmxdSbauJFtXkq0rydaVZOtKsnUl2bqSbF1Jtq4kW1eSrSvJ1pVk60qydSXZupJsXUm2riRbV5Kt'
+        'K8nWlWTrSrJ1Jdm6kmxdSbauJFtXkq0rydaVZOtKsnUl2bqSbF1Jtq4kW1eSrSvJ1pVk60qydSXZ'
+        'upKqGI3PlX8EqUr6H+v/++3mqcXYLtdlTv26F/kx35f3vqkeTiXqlfkhlUlRmRSVSVGZFJVJUZkU'
+        'lUlRmRSVSVGZFJVJUZkUlUlRmRSVSVGZFJVJUZkUlUlRmRSVSVGZFJVJUZkUlUlRmRSVSVGZFJVJ'
+        'UZkUlUlRmRSVSVGZFJVJUZkUlUlRmRSVSVGZFJVJUZkUlUlRmRSVSVGZFJVJUZkUlUlRmRSVSVGZ'
+        'FJVJUZkUlUlRmRSVSVGZFJVJUZkUlUlRmRSVSVGZFJVJUZkUlUlRmRSVSVGZFJVJqcrsEADUtWlp'
+        '4vtSx4mf1zy3fl6TtbW361+Txr9ku0adm2yVF2dP/M6AZ9bzNX6ln9s0rVU8s0dtxL+JfmfuXM8W'
+        '8rhkc6LsJ344e6LRv7lG3/6/Xq/64rP+elVz/XrVW/X1qns4db2HU9d7uF51D2ew93AGew9nsCoe'
+        'JM4gbMSZxFnE14mzCTtxDuEgziXOI84nnMQFxDeIC4mLCBdxMeEmLiE8xKXEZuIy4nLiCuKbhJfw'
+        'EX4iQASJK4kQcRVxNXENcS1xHXE9ESZuICLEjUSUuImIETcT3yLixC3ErcRtRBvRQGwhthLbiEZi'
+        'O5Egvk18h9hBNBG3E81Ekvgu0UK0EhPE94hJYoqYJkrE94kZYpb4ATFH/JAoE08SFeJHxDzxY2JB'
+        'RXdzcu2K9Yq6Yt1y4glTJ2byf37K9I2/zadMn/gVXb+uMd1aH1HDekQZjCiDEWUwogxGlMGIMhhR'
+        'BrPJYDYZzCaD2WQwlAyGksFQMhhKBkPJYCgZDCWDoWQwlAymkcE0MphGBtPIYBoZTCODaWQwjQym'
+        'kcE0MphGBtPIYAwZjCGDMWQwhgzGkMEYMhhDBmPIYAwZjCGDMWQwhgzGkMEYMhhDBmPIYAwZjCGD'
+        'MWQwhgzGkMH8MZg/BvPHYP4YDB6DwWMweAwGj8HgMRg8BoPHYNQYjBqDUWMwagxGjcGMMZgxBhPO'
+        'ULt827P2X72o7ek1v7XfR3vi8dWJf/XyO/9XLzvXfiH55+Up2x3P9V+8qH4W8Y/H/SSTx2e75LrI'
+        'v09e/f/t1D+cTMnXqV8499UNa/+nEbd6y26xpuqfZ35Krume//Xx7Vee9Y9v71z7TUmfV48M7jrx'
+        'yODEI4P/cZowi7eJhwonHhk80x8ZPO8/PRf+FetPPBe+u/nutU3vdPVLjZ9/YtOrFzsh/3dRJ3a/'
+        'E7+x/Pd203tB/XLIafpySA+XQ3q4HNLD5ZAeLof0cDmkh8shPVwO6eFySA+XQ3q4HNLD5ZAeLof0'
+        'cDmkh8shPVwO6eFySA+XQ3q4HNLD5ZAeLof0cDmkh8shPVwO6eFySA+XQ3q4HNLD5ZAeLof0cDmk'
+        'h8shPVwO6eFySA+XQ3q4HNLD5ZAeLof0cDmkh8shPVwO6eFySA+XQ3q4HNLD5ZAeLof0cDmkh8sh'
+        'PVwO6eFySA+XQ3q4HNLD5ZAeLof0cDmkh8shPVwO6eFySA+XQ3q4HNLD5ZAeLof0cDmkh8shPVwO'
+        '6eFySA+XQ3q4HNLD5ZAeLof0cDmkh8shPVwO6VGXQ174tH9JzXs2PJd+Sc09az8M+Ik65f+DE78r'
+        '5cTFomfWxSJORQbEY4wTV43+j1eN2kW5n5DlvlWV+0X1YfhZPQx7GYa9DMNehmEvw7CXYdjLMOxl'
+        'GPYyDHsZhr0Mw16GYS/DsJdh2Msw7GUY9jIMexmGvQzDXoZhL8Owl2HYyzDsZRj2Mgx7GYa9DMNe'
+        'hmEvw7CXYdjLMOxlGPYyDHsZhr0Mw16GYS/DsJdh2Msw7GUY9jIMexmGvQzDXoZhL8Owl2HYyzDs'
+        'ZRj2Mgx7GYa9DMNehmEvw7CXYdjLMOxlGPYyDHsZhr0Mw16GYS/DsJdh2Msw7GUY9jIMexmGvQzD'
+        'XoZhL8Owl2HYyzDsZRj2qmHYoV00OyWLe+vPx11ARRYVWVRk4ZCFQxYOWThk4ZCFQxYOWThk4ZCF'
+        'QxYOWThk4ZCFQxYOWThk4ZCFQxYOWThk4ZCFQxYOWThk4ZCFQxYOWThk4ZCFQxYOWThk4ZCFQxYO'
+        'WThk4ZCFQxYOWThk4ZCFQxYOWThk4ZCFQxYOWThk4ZCFQxYOWThk4ZCFQxYOWThk4ZCFQxYOWThk'
+        '4ZCFQxYOWThk4ZCFQxYOWThkFQdDnxtlYuvlAJJvesq/uMnE5avUyVLmFnn3f7hGkNnCk/KazYLS'
+        'M/mMqf6vbTK3ya/4Kf/WJtOgnlIh/xq3/c+/fSCzTS5Zo3z3+r+p2SuX0ye3Wa/6X5pcl3mLWubO'
+        'R/Xv5U2oCw33rW3OrerF++ub81f05txHDfuoYR+bcx9t7KONfbSxjzb28Yus+ihlH6Xso5R9lLKP'
+        'UvZRyj5K2Ucp+yhlH6Xso5R9lLKPUvZRyj5K2Ucp+yhlH6Xso5R9lLKPUvZRyj5K2Ucp+yhlH6Xs'
+        'o5R9lLKPUvZRyj5K2Ucp+yhlH6Xso5R9lLKPUvZRyj5K2Ucp+yhlH6Xso5R9lLKPUvZRyj5K2Ucp'
+        '+yhlH5Xpo5t9dLOPbvbRzT662Uc3++hmH93so5t9dLOPbvbRzT662Uc3+5SWdN3D67SHHB5yeMjh'
+        'IYeHHB5yeMjxXLMcLHJ4yOEhh4cczzXLwSIHixwscrDIwSIHixwscrDIwSLHc81y6MihI4eOHDpy'
+        '6MihI4eOHDpy6MihI4eOHDpyPNcsB5IcSHIgyYEkB5IcSHIgyYEkB5IcSHIgyYEkB5IcSHIgyYEk'
+        'B5IcSHIgyYEkB5IczzXLYSWHlRxWcljJYSWHlRxWcljJYSWHlRxWcljJ8VyzHM81yyEnh5wccnLI'
+        'ySEnx3PNcgDKASjHc81yPNcsx3PNcjzXLMdzzXI81yzHc81yPNcsx3PNcjzXLMdzzXI81yzHc81y'
+        'PNcsx3PNcjzXLMdzzXI81yzHc81ySvG+R49mxvS/9PiKOgnN1F1/V7vO4zqP6zyu87jO4zqP6zyu'
+        '87jO4zqP6zyu87jO4zqP6zyu87jO4zqP6zyu87jO4zqP6zyu87jO4zqP6zyu87jO4zqP6zyu87jO'
+        '4zqP6zyu87jO4zqP6zyu87jO4zqP6zyu87jO4zqP6zyu87jO4zqP6zyu87jO4zqP6zyu87jO4zqP'
+        '6zyu87jO4zqP6zyu87jO4zqP6zyu87jO4zqP6zyu87jO4zqP6zyu87jO4zqP6zyu87jO4zqP6zyu'
+        '87jO4zqP6zyu87jO4zqP6zyu87jO4zqP6zyu87jO4zqP67xy/eJfvpykLh099J9/o/hz7Icp++uP'
+        'JT5Lufspdz/l7qfc/ZS7n3L3U+5+Wt1Pq/tpdT+t7qfO/dS5nzr3U+d+6txPnfupcz917qfO/fS4'
+        'nx730+N+etxPj/vpcT897qfH/fS4nx730+N+etxPgfspcD8F7qfA/RS4nwL3U+B+CtxPgfspcD8F'
+        '7qfA/RS4nwL3U+B+CtxPgfspcD8F7qfA/RS4n+b209x+mttPc/upbD+V7aey/VS2n8r2U9l+KttP'
+        'SfspaT8l7aek/ZS0n3b2085+9oZ+1Y8HftVnqMgeNX/kGf7Y4Veux4H68BvRw2+AfgzQjwH6MUA/'
+        'BujHAP0YoB8DnOQPUJMBajJATQaoyQA1GaAmA9RkgJoMUJMBajJATQaoyQA1GaAmA9RkgJoMUJMB'
+        'ajJATQaoyQA1GaAmA9RkgJoMUJMBajJATQaoyQA1GaAmA9RkgJoMUJMBajJATQaoyQA1GaAmA9Rk'
+        'gJoMUJMBajJATQaoyQA1GaAmA9RkgJoMUJMBEA/QlgHaMkBbBmjLAG0ZoC0DtGWAtgzQlgHaMkBb'
+        'BmjLAG0ZoC0DqiYHeXKS8HCxeqj4ZOaDzLgPMog+qN7r0ImL8icuyp94Bufv87X4dJs8JxpQvzHq'
+        'JfUhMKqHwCBDYJAhMMgQGGQIDDIEBhkCgwyBQYbAIENgkCEwyBAYZAgMMgQGGQKDDIFBhsAgQ2CQ'
+        'ITDIEBhkCAwyBAYZAoMMgUGGwCBDYJAhMMgQGGQIDDIEBhkCgwyBQYbAIENgkCEwyBAYZAgMMgQG'
+        'GQKDDIFBhsAgQ2CQITDIEBhkCAwyBAYZAoMMgUGGwCBDYJAhMMgQGGQIDDIEBhkCgwyBQYbAIENg'
+        'kCEwyBAYZAgMMgQGGQKDDIFBhsAgQ2CQITDIEBhkCAwyBAYZAoMMgUGGwKDa3g//rrd39QO2LwqJ'
+        'J55veeIZRyeecfT/94yjrt/Sc/Oz69u2q1+akZLPV/mvHv0E5VtfIt/6dB8HqYsYD8qPOP4Rkfq/'
+        'bRyUr/2NPjY6Ur90MMdUHGIqDjEVhxiHQ4zDIcbhEONwiDk4xBwcYg4OMQeHmINDzMEh5uAQc3CI'
+        'OTjEHBxiDg4xB4eYg0PMwSHm4BBzcIg5OMQcHGIODjEHh5iDQ8zBIebgEHNwiDk4xBwcYg4OMQeH'
+        'mINDzMEh5uAQc3CIOTjEHBxiDg4xB4eYg0PMwSHm4BBzcIg5OMQcHGIODjEHh5iDQ8zBIebgEHNw'
+        'iDk4xAAcYgAOMQCHGIBDDMAhBuAQA3CIATjEABxiAA4xAIcYgEMMwCEG4BCTdkjNwW4J4FvqX3ZI'
+        'bN+V9x6TT1FW50o/1udKBVQUUFHgXKkAjgI4CuAogKMAjgI4CuAogKMAjgI4CuAogKMAjgI4CuAo'
+        'gKMAjgI4CuAogKMAjgI4CuAogKMAjgI4CuAogKMAjgI4CuAogKMAjgI4CuAogKMAjgI4CuAogKMA'
+        'jgI4CuAogKMAjgI4CuAogKMAjgI4CuAogKMAjgLfugJGChgpYKSAkQJGChgpYKSAkQJGChgpYKSA'
+        'kQJGChgp8Ii4wGXbApdtC1wDLnD1tsDPBQpc+y9wubfAJd0Cl/ILXBEucNG4wMPrAtfiC1wmLnDV'
+        't8AF5QJXiwtcAy5wAbvABewCV5kLXHMucH24wPXhgrL8YP0c/0va7TBuh3E7jNth3A7jdhi3w7gd'
+        '5hx/GL7D8B2G7zB8h+E7DN9h+A7Ddxi+w/Adhu8wfIfhOwzfYfgOw3cYvsPwHYbvMHyH4TsM32H4'
+        'DsN3GL7D8B2G7zB8h+E7DN9h+A7Ddxi+w/Adhu8wfIfhOwzfYfgOw3cYvsPwHYbvMHyH4TsM32H4'
+        'DsN3GL7D8B2G7zB8h+E7DN9h+A7Ddxi+w/Adhu8wfIfhOwzfYfgOw3dYeXjoOfVbAh9Z93R/S+DD'
+        'x/188Ovq54OP1E8DhilOkeIUKU6R4hQpTpHiFClOkeIUaUyRxhRpTJHGFGlMkcYUaUyRxhRpTJHG'
+        'FGlMkcYUaUyRxhRpTJHGFGlMkcYUaUyRxhRpTJHGFGlMkcYUaUyRxhRpTJHGFGlMkcYUaUyRxhRp'
+        'TJHGFGlMkcYUaUyRxhRpTJHGFGlMkcYUaUyRxhRpTJHGFGlMkcYUaUyRqhSpSpGqFKlKkaoUqUqR'
+        'qhSpSpGqFKlKkaoUqUqRqhSpSpFOFlVj/vDZ2hjVkHes+6Xf7/u0T5NfWu/Hp+jHCP0YoR8j9GOE'
+        'fozQjxH6MUI/RujHCP0YoR8j9GOEfozQjxH6MUI/RujHCP0YoR8j9GOEfozQjxH6MUI/RujHCP0Y'
+        'oR8j9GOEfozQjxH6MUI/RujHCP0YoR8j9GOEfozQjxH6MUI/RujHCP0YoR8j9GOEfozQjxH6MUI/'
+        'RujHCP0YoR8j9GOEfozQjxH6MUI/RujHCP0YoR8j9GOEfozQjxH6MUI/RujHCP0YoR8j9GOEfozQ'
+        'jxH6MUI/RlQ/XlY/w/h7fYYxCoRRIIwCYRQIo0AYBcIoEEY5wxjFwygeRvEwiodRPIziYRQPo3gY'
+        'xcMoHkbxMIqHUTyM4mEUD6N4GMXDKB5G8TCKh1E8jOJhFA+jeBjFwygeRvEwiodRPIziYRQPo3gY'
+        'xcMoHkbxMIqHUTyM4mEUD6N4GMXDKB5G8TCKh1E8jOJhFA+jeBjFwyjfrVFYjMJiFBajsBiFxSgs'
+        'RmExCotRWIzCYhQWo7AYhcUoLEaVh0ePTdLmn8pB2nPiHzKeuJp44mri7/hqIhfXj7z26P/nZcWX'
+        'P3o0e/LOXW2JXQ0t6rJfs3rW8CvqU+AxPQXGmAJjTIExpsAYU2CMKTDGFBhjCowxBcaYAmNMgTGm'
+        'wBhTYIwpMMYUGGMKjDEFxpgCY0yBMabAGFNgjCkwxhQYYwqMMQXGmAJjTIExpsAYU2CMKTDGFBhj'
+        'CowxBcaYAmNMgTGmwBhTYIwpMMYUGGMKjDEFxpgCY0yBMabAGFNgjCkwxhQYYwqMMQXGmAJjTIEx'
+        'psAYU2CMKTDGFBhjCowxBcaYAmNMgTGmwBhTYIwpMMYUGGMKjDEFxpgCY0yBMabAGFNgjCkwxhQY'
+        'YwqMMQXG1BR4pfTwY+njyLq1K2cf1jLGkTGOjHFkjCNjHBnjyBhHxjgkxiExDolxSIxDYhwS45AY'
+        'h8Q4JMYhMQ6JcUiMQ2IcEuOQGIfEOCTGITEOiXFIjENiHBLjkBiHxDgkxiExDolxSIxDYhwS45AY'
+        'h8Q4JMYhMQ6JcUiMQ2IcEuOQGIfEOCTGITEOiXFIjENiHBLjkBiHxDgkxrEwjoVxLIxjYRwL41gY'
+        'x8I4FsaxMI6FcSyMY2EcC+NYGAfduCLxKvm/OTutq/NI+/59RzoPd+xX28cN8hLrPfLeJ9fJH0q/'
+        '+tf1cEs9vLlIfvZnxTO2/mjtt0O8Xf3vxl9T32+bdKsmaNUErZqgThPUaYI6TVCnCeo0QZ0mqNME'
+        'dZqgThPUaYI6TVCnCeo0QZ0mqNMEdZqgThPUaYI6TVCnCeo0QZ0mqNMEdZqgThPUaYI6TVCnCeo0'
+        'QZ0mqNMEdZqgThPUaYI6TVCnCeo0QZ0mqNMEdZqgThPUaYI6TVCnCeo0QZ0mqNMEdZqgThPUaYI6'
+        'TVCnCeo0QZ0mqNMEdZqgThPUaYI6TVCnCeo0QZ0mqNMEdZqgThPUaYI6TVCnCVWn19Yff38UAJMA'
+        'mATAJNvqJA4mcTCJg0kcTOJgEgeTOJjEwSQOJnEwiYNJHEziYBIHkziYxMEkDiZxMImDSRxM4mAS'
+        'B5M4mMTBJA4mcTCJg0kcTOJgEgeTOJjEwSQOJnEwiYNJHEziYBIHkziYxMEkDiZxMImDSRxM4mAS'
+        'B5M4mMTBJA4mcTCJg0kcTOJgEgeTOJjEwSQOJnEwiYNJHEziYBIHkziYxMEkDiZxMImDSRxMKgd/'
+        'XN8JhvROMA2EaSBMA2EaCNNAmAbCNBCmgTANhGkgTANhGgjTQJgGwjQQpoEwDYRpIEwDYRoI00CY'
+        'BsI0EKaBMA2EaSBMA2EaCNNAmAbCNBCmgTANhGkgTANhGgjTQJgGwjQQpoEwDYRpIEwDYRoI00CY'
+        'BsI0EKaBMA2EaSBMA2EaCNNAmAbCNBCmgTANhGkgTANhGgjTQJgGwjQQpoEwDYRpIEwDYRoI00CY'
+        'BsI0EKYVhF4xISpyQnSpCfG6uosG7WIWF7O4mMXFLC5mcTGLi1lczOJiFhezuJjFxSwuZnExi4tZ'
+        'XMziYhYXs7iYxcUsLmZxMYuLWVzM4mIWF7O4mMXFLC5mcTGLi1lczOJiFhezuJjFxSwuZnExi4tZ'
+        'XMziYhYXs7iYxcUsLmZxMYuLWVzM4mIWF7O4mMXFLC5mcTGLi1lczOJiFhezuJjFxSwuZnExi4tZ'
+        'XMziYhYXs7iYxcUsLmZxMYuLWVzMKhevr0MwawhzQJgDwhwQ5oAwB4Q5IMwBYQ4Ic0CYA8IcEOaA'
+        'MAeEOSDMAWEOCHNAmAPCHBDmgDAHhDkgzAFhDghzQJgDwhwQ5oAwB4Q5IMwBYQ4Ic0CYA8IcEOaA'
+        'MAeEOSDMAWEOCHNAmAPCHBDmgDAHhDkgzAFhDghzQJgDwhwQ5oAwB4Q5IMwBYQ4Ic0CYA8IcEOaA'
+        'MAeEOSDMAWEOCHNAmAPCHBDmgDAHhDkgzAFhTkF4w3E/4wqoR+3ZOo0vahoVaFSgUYFGBRoVaFSg'
+        'UYFGhUftFYRUEFJBSAUhFYRUEFJBSAUhFYRUEFJBSAUhFYRUEFJBSAUhFYRUEFJBSAUhFYRUEFJB'
+        'SAUhFYRUEFJBSAUhFYRUEFJBSAUhFYRUEFJBSAUhFYRUEFJBSAUhFYRUEFJBSAUhFYRUEFJBSAUh'
+        'FYRU+P5VgFIBSgUoFaBUgFIBSgUoFaBUgFIBSgUoFaBUgFIBSkUJ+ZP6OeX34TAPh3k4zONgHgfz'
+        'OJjHwTwA5gEwD4B5AMwDYB4A8wCYB8A8AOYBMA+AeQDMA2AeAPMAmAfAPADmATAPgHkAzANgHgDz'
+        'AJgHwDwA5vnOz+NgHgDzAJgHwDwA5gEwD4B5AMwDYB4A8wCYB8A8AOYBMA+AeQDMA2AeAPMAmAfA'
+        'PADmATAPgHkAzANgHgDzAJgHwDwA5gEwD4B5AMwDYB4A8wCYB8A8AOYBMK8AvLG+IZyqN4QFBCwg'
+        'YIENYQEIC0BYAMICEBaAsACEBSAsAGEBCAtAWADCAhAWgLAAhAUgLABhAQgLQFgAwgIQFoCwAIQF'
+        'ICwAYQEIC0BYAMICEBaAsICABTwsAGEBCAtAWADCAhAWgLAAhAUgLABhAQgLQFgAwgIQFoCwAIQF'
+        'ICwAYQEIC0BYAMICEBaAsICABQQsIGABAQsIWEDAAgIWELCAgAUELCBgAQELCFhAwALUFhSEN9Uh'
+        'fFlDqAKhCoQqEKpAqAKhCoQqEKpMhioeqnio4qGKhyoeqnio4qGKhyoeqnio4qGKhyoeqnio4qGK'
+        'hyoeqnio4qGKhyoeqnio4qGKhyoeqnio4qGKhyoeqnio4qGKhyoeqnio4qGKhyoeqnio4qGKhyoe'
+        'qnio4qGKhyoeqnio4qGKhyoeqny3qrCowqIKiyosqrCowqIKiyosqrCowqIKiyosqrCowqKqPLz5'
+        'Uf0/EX+xenDxlhM/0zvxM70TP9P7v/9MT/0U7kmxoT6T/qnAn9Y3+5/qzb7GZl9js6+x2dfY7Gts'
+        '9jU2+xpPea2x59fY7Gts9jU2+xpPh62x59fY82vs+TX2/Bp7fo09v8aeX2PPr7Hn13j+bI2tv8bW'
+        'X2Prr7H119j6a2z9Nbb+Glt/ja2/xtZfY+uvsfXXePptjQlQYwLUmAA1JkCNCVBjAtSYADUmQI0J'
+        'UGMC1JgANSZAjQlQYwLUmAA1JkCNCVBjAtSYADUmQI0JUONXYdQYBDUGQY1BUGMQ1BgENQZBjUFQ'
+        'YxDUGAQ1BkGNQVBjENR4JnGNZxLXGAs1xkKNsVBjLNQYCzV+FUaN6VBjOtR4UnSNp0HXeFZzjWcu'
+        '13haco0nKdd44nON5zjXeG50jSc313hOdY3nVNd4MnWN503XeIp0jSdF13gadI2nOtd4qnNNjai3'
+        'Pqee2vrmp/3U1qNrv+7rWvWY/23iRfWD2evUi2+vP+T7F6q/SvVXqf4qnV+l86t0fpWyr1L2Vcq+'
+        'StlXafkqLV+l5au0fJWWr9LyVVq+SstXafkq9V6l3qvUe5V6r1LvVeq9Sr1Xqfcq9V6l3qvUe5V6'
+        'r9LrVXq9Sq9X6fUqvV6l16v0epVer9LrVXq9Sq9X6fUqvV6l16v0epVer9LrVXq9Sq9X6fUqvV6l'
+        '0KsUepVCr1LoVZq8SpNXafIqTV6lyas0eZUmr9LdVbq7SndX6e4q3V2ltKuUdpUtY1XVpu/Z/PzW'
+        '5t5f9emt75DLsl725AP1JzB8QU/HjRtURVScRjxBWIjTCStxBmEjziTOIs4m7MQ5hIM4lziPOJ9w'
+        'EhcQFxIXES7iYsJNXEJ4iEuJzcRlxOXEFYSX8BF+IkAEiSuJEHEVcTVxDXEtcR1xPREmbiAixI1E'
+        'lLiJiBE3E3HiFuJW4jaigdhCbCW2EY3EdiJB7CCaiNuJZiJJtBCtRJuK7uZc/TTpdg3BBAQTEEwI'
+        'MCHAhAATAkwIMCHAhAATAkwIMCHAhAATAkwIMCHAhAATAkwIMCHAhAATAkwIMCHAhAATAkwIMCHA'
+        'hAATAkwIMCHAhAATAkwIMCHAhAATAkwIMCHAhAATAkwIMCHAhAATAkwIMCHAhAATAkwIMCHAhAAT'
+        'AkwIMCHAhAATAkwIMCHAhAATAkwIMCHAhAATAkwIMCHAhAATAkxKwDv1//2q5Ro1O99VB3GJBmEG'
+        'hBkQZnYGMy7MuDDjwowLMy7MuDDjwowLMy7MuDDjwowLMy7MuDDjwowLMy7MuDDjwowLMy7MuDDj'
+        'wowLMy7MuDDjwowLMy7MuDDjwowLMy7MuDDjwowLMy7MuDDjwowLMy7MuDDjwowLMy7MuDDjwowL'
+        'My7MuDDjwowLMy7MuDDjwowLMy7MuDDjwowLMy7MuDDjwowLMy7MuDDjwowLs3Lx7vpJ1DdwYMGB'
+        'BQcWAFgAYAGABQAWAFgAYAGABQAWAFgAYAGABQAWAFgAYAGABQAWAFgAYAGABQAWAFgAYAGABQAW'
+        'AFgAYAGABQAWAFgAYAGABQAWAFgAYAGABQAWAFgAYAGABQAWAFgAYAGABQAWAFgAYAGABQAWAFgA'
+        'YAGABQAWAFgAYAGABQAWAFgAYAGABQAWAFgAYAGABQAWAFgAYAGABQAWBSBf3wnW6Z3AigArAqzs'
+        'BFYgWIFgBYIVCFYgWIFgBYIVCFYgWIFgBYIVCFYgWIFgBYIVCFYgWIFgBYIVCFYgWIFgBYIVCFYg'
+        'WIFgBYIVCFYgWIFgBYIVCFYgWIFgBYIVCFYgWIFgBYIVCFYgWIFgBYIVCFYgWIFgBYIVCFYgWIFg'
+        'BYIVCFYgWIFgBYIVCFYgWIFgBYIVCFYgWIFgBYIVCFYgWIFgBYIVCFYF4T11CC4NwQYEGxBsQLAB'
+        'wQYEGxBsQLABwQYEGxBsQLABwQYEGxBsQLABwQYEGxBsQLABwQYEGxBsQLABwQYEGxBsQLABwQYE'
+        'GxBsQLABwQYEGxBsQLABwQYEGxBsQLABwQYEGxBsQLABwQYEGxBsQLABwQYEGxBsQLABwQYEGxBs'
+        'QLABwQYEGxBsQLABwQYEGxBsQLABwQYEGxBsQLABwQYEGxBsQLApCO9dO1UIq1OF99VdfF67sOPC'
+        'jgs7Luy4sOPCjgs7Luy4sOPCjgs7Luy4sOPCjgs7Luy4sOPCjgs7Luy4sOPCjgs7Luy4sOPCjgs7'
+        'Luy4sOPCjgs7Luy4sOPCjgs7Luy4sOPCjgs7Luy4sOPCjgs7Luy4sOPCjgs7Luy4sOPCjgs7Luy4'
+        'sOPCjgs7Luy4sOPCjgs7Luy4sOPCjgs7Luy4sOPCjgs7Luy4sOPCjgs7LuzKRX/9VOEXOHDgwIED'
+        'BwAcAHAAwAEABwAcAHAAwAEABwAcAHAAwAEABwAcAHAAwAEABwAcAHAAwAEABwAcAHAAwAEABwAc'
+        'AHAAwAEABwAcAHAAwAEABwAcAHAAwAEABwAcAHAAwAEABwAcAHAAwAEABwAcAHAAwAEABwAcAHAA'
+        'wAEABwAcAHAAwAEABwAcAHAAwAEABwAcAHAAwAEABwAcAHAAwAEAhwLw/ufi/zNXXbK0ySfj/7cX'
+        'XP6svkPa9A7ppBlOmuFkh3RSECcFcVIQJwVxUhAnBXFSECcFcVIQJwVxUhAnBXFSECcFcVIQJwVx'
+        'UhAnBXFSECcFcVIQJwVxUhAnBXFSECcFcVIQJwVxUhAnBXFSECcFcVIQJwVxUhAnBXFSECcFcVIQ'
+        'JwVxUhAnBXFSECcFcVIQJwVxUhAnBXFSECcFcVIQJwVxUhAnBXFSECcFcVIQJwVxUhAnBXFSECcF'
+        'cVIQJwVxUhAnBXFSECcFcaqCfEBA4Kdre9Rl4xM/ZT7xU+bf/u8gvZP/fUzLn8lf/PQM+ZHz7+uv'
+        'ohuob+079NbuYmt3sbW72NNd7Oku9nQXe7qLPd3Fnu5iT3exp7vY013s6S72dBd7uos93cWe7mJP'
+        'd7Gnu9jTXezpLvZ0F3u6iz3dxZ7uYk93sae72NNd7Oku9nQXe7qLPd3Fnu5iT3exp7vY013s6S72'
+        'dBd7uos93cWe7mJPd7Gnu9jTXezpLvZ0F3u6iz3dxZ7uYk93sae72NNd7Oku9nQXe7qLPd3Fnu5i'
+        'T3exp7vY013s6S72dBd7uos93cWe7mJPd7Gnu9jTXezpLvZ0F3u6S+3pf14/630MAG4AuAHgZra7'
+        'ceDGgRsHbhy4ceDGgRsHbhy4ceDGgRsHbhy4ceDGgRsHbhy4ceDGgRsHbhy4ceDGgRsHbhy4ceDG'
+        'gRsHbhy4ceDGgRsHbhy4ceDGgRsHbhy4ceDGgRsHbhy4ceDGgRsHbhy4ceDGgRsHbhy4ceDGgRsH'
+        'bhy4ceDGgRsHbhy4ceDGgRsHbhy4ceDGgRsHbhy4ceDGgRsHbhy4lYMPikfF6odqbvU7lj507J8m'
+        'rMfFZlxsxsVmXGzGxWZcbMaFigeJMwgbcSZxFvF14mzCTpxDOIhzifOI8wkncQHxDeJC4iLCRVxM'
+        'uIlLCA9xKbGZuIy4nLiC+CbhJXyEnwgQQeJKIkRcRVxNXENcS1xHXE+EiRuICHEjESVuImLEzcS3'
+        'iDhxC3ErcRvRRjQQW4itxDaikdhOJIhvE98hdhBNxO1EM5Ekvku0EK3EBPE9YpKYIqaJEvF9YoaY'
+        'JX5AzBE/JMrEk0SF+BExT/yYWFDR3fxhqfhJqXiTUjyRuVy9/iN13Zv02POi24tuL7q96Pai24tu'
+        'L6y9sPbC2gtrL569ePbi2YtnL569ePbi2YtnL569QPYC2QtkL5C9QPYC2QtkL5C9QPYC2QtkL5C9'
+        'CPYi2ItgL4K9CPYi2ItgL4K9CPYi2ItgL4K9CPYi2ItgL4K9CPYi2ItgL4K9CPZC1wtdL3S90PVi'
+        '1otZL2a9mPVi1otZL2a9KPWi1ItSL0q9KPXC0wtPL+XwKgiDdQgv1xD8QPADwQ8EPxD8QPADwc82'
+        '58eDHw9+PPjx4Geb88PCDws/LPyw8MPCDws/LPyw8MPCzzbnR4cfHX50+NHhR4cfHX50+NHhR4cf'
+        'HX50+NHhZ5vzg8QPEj9I/CDxg8QPEj9I/CDxg8QPEj9I/CDxg8QPEj9I/CDxg8QPEj9I/CDxg8TP'
+        'NufHih8rfqz4seLnO+mHjB8yfsj4IeOHjB8yfsj42eb8bHN+APkB5AeQH0B+APnZ5vw48uPIzzbn'
+        'Z5vzs8352eb8bHN+tjk/25yfbc7PNudnm/OzzfnZ5vxsc362OT/bnJ9tzs8252eb87PN+ZXij9YV'
+        'v0crDqI4iOIgioMoDqI4iOIgfIPwDcI3CN8gboO4DeI2iNsgboO4DeI2iNsgboOADQI2CNggYIOA'
+        'DQI2CNggYIOADQI2CNggYINIDSI1iNQgUoNIDSI1iNQgUoNIDSI1iNQgUoNIDSI1iNQgUoNIDSI1'
+        'iNQgUoNIDUI0CNEgRIMQDWIziM0gNoPYDGIziM0gNoNoDKIxiMYgGoNoDMIwCMMgJQgqCH9Rh3CD'
+        'hhACQggIISCEgBACQggIISCEgBACQggIISCEgBACQggIISCEgBACQggIISCEgBACQggIISCEgBAC'
+        'QggIISCEgBACQggIISCEgBACQggIISCEgBACQggIISCEgBACQggIISCEgBACQggIISCEgBACQggI'
+        'ISCEgBACQggIISCEgBACQggIISDIeNtJ8oLZSUpECBEhRIQQEUJECBEhRIQQEUJECBEhRIQQEVIi'
+        '/lKf1jf75Vn9x/ifCYmz/Ky8ePKg+j2T6+Uvd/mrupxXaDlh5ISRE0ZOGDlh5ISRE2YQhgEUBlAY'
+        'QGEAhRmEYRyFcRTGURhHYRyFcRTGURhHYRyFGYRhOIXhFIZTGE5hOIXhFIZTGE5hOIXhFIZTGE5h'
+        'BmEYVWFUhVEVRlUYVWFUhVEVRlUYVWFUhVEVRlUYVWFUhVEVRlUYVWFUhVEVRlUYVWEGYRhcYXCF'
+        'wRUGV5jveBhjYYyFMRZmswlDKwytMLTCDMIwgzAMtDDQwkALAy0MtDCDMIy3MN7CDMIwgzDMIAwz'
+        'CMMMwjCDMMwgDDMIwwzCMIMwzCAMMwjDDMIwgzDMIAwzCMMMwjCDMMwgDCvtH68rvkgrjqA4guII'
+        'iiMojqA4guIIfCPwjcA3At8IbiO4jeA2gtsIbiO4jeA2gtsIbiOAjQA2AtgIYCOAjQA2AtgIYCOA'
+        'jQA2AtgIYCNIjSA1gtQIUiNIjSA1gtQIUiNIjSA1gtQIUiNIjSA1gtQIUiNIjSA1gtQIUiNIjUA0'
+        'AtEIRCMQjWAzgs0INiPYjGAzgs0INiNojKAxgsYIGiNojMAwAsMIJYgoCJ/4Tf4oT/3I7BT5I7Pf'
+        'u99V9cl6QV6pCxKjIDEKEqMgMQoSoyAxChJjm4/Rkxg9idGTGD2Jsc3HqEuMusSoS4y6xKhLjLrE'
+        'qEuMusSoS4xtPkZrYrQmRmtitCZGa2K0JkZrYrQmRmtitCZGa2K0JsY2H6M8McoTozwxyhOjPDHK'
+        'E6M8McoTozwxyhOjPDHKE6M8McoTozwxyhOjPDHKE6M8McoTozwxtvkYHYrRoRgditGhGMJjVClG'
+        'lWJUKUaVYlQpRpViVCnGNh9jm49RrBjFilGsGMWKUawY23yMfsXoV4xtPsY2H2Obj7HNx9jmY2zz'
+        'Mbb5GNt8jG0+xjYfY5uPsc3H2OZjbPMxtvkY23yMbT7GNh9jm4+pdv91XfEHtOI4iuMojqM4juI4'
+        'iuMojsM3Dt84fOPwjeM2jts4buO4jeM2jts4buO4jeM2Dtg4YOOAjQM2Dtg4YOOAjQM2Dtg4YOOA'
+        'jQM2jtQ4UuNIjSM1jtQ4UuNIjSM1jtQ4UuNIjSM1jtQ4UuNIjSM1jtQ4UuNIjSM1jtQ4ROMQjUM0'
+        'DtE4NuPYjGMzjs04NuPYjGMzjsY4GuNojKMxjsY4DOMwjFOCuIIwtHY+29y+djp7vjqd/ZR8w5bM'
+        'teofqslX3yFenble/+RwVb3P3xz3S1c61VPBPl131a1dJXCVwFUCVwlcJXCVwFWC3TEBrwS8EvBK'
+        'wCvB7phAWQJlCZQlUJZAWQJlCZQlUJZAWYLdMQG2BNgSYEuALQG2BNgSYEuALQG2BNgSYEuALcHu'
+        'mMBcAnMJzCUwl8BcAnMJzCUwl8BcAnMJzCUwl8BcAnMJzCUwl8BcAnMJzCUwl8Bcgt0xAb0E9BLQ'
+        'S0AvAYwEAhMITCAwgcAEAhMITCAwwe6YYHdM4DGBxwQeE3hM4DHB7piAZQKWCXbHBLtjgt0xwe6Y'
+        'YHdMsDsm2B0T7I4JdscEu2OC3THB7phgd0ywOybYHRPsjgl2xwS7Y4LdMaFKUZCK1TnKe+W/j3qu'
+        'PaHpvz33+du15302qLIPPxue7aX+Jd2Y+C7/2lbpM/J3wdrb2/cdSHce3nek44DR2d51pONwe0T9'
+        'UtgXyOsGE/LeLRKX+tnK+evV/7T0s7+OBVVuJ+Uf8qxx93eP6hX7ovrJ6ufEiw/LFy9TDD+/9nNX'
+        'm3prce3FVfXbPL4g11T96sDL160tfLv6bbyPrWnerD7ui/Uf41eZXAaTy2ByGYwsg5FlMLIMZpXB'
+        'rDKYVQazymBIGQwpgyFlMKQMhpTBkDIYUgZDymBIGUwng+lkMJ0MppPBdDKYTgbTyWA6GUwng+lk'
+        'MJ0MppPBWDIYSwZjyWAsGYwlg7FkMJYMxpLBWDIYSwZjyWAsGYwlg7FkMJYMxpLBWDIYSwZjyWAs'
+        'GYwlg3lkMI8M5pHBPDIYRAaDyGAQGQwig0FkMIgMBpHB6DEYPQajx2D0GIweg5ljMHMMJp6hdv2R'
+        'X7V9/M9m5KPZ37ddX/XiXRue7r+2/9Jatc5VjRmtn+y9X5/sZahMhspkONnL0JwMzcnQnAzNydCc'
+        'DM3J0JwMzcnQnAzNydCcDM3J0JwMzcnQnAzNydCcDM3J0JwMzcnQnAzNydCcDM3J0JwMzcnQnAzN'
+        'ydCcDM3J0JwMzcnQnAzNydCcDM3J0JwMzcnQnAzNydCcDM3J0JwMzcnQnAzNydCcDM3J0JwMzcnQ'
+        'nAzNydCcDM3J0JwMzcnQnAzNydCcDM3J0JwMzfl/7N1/fPuJXR92zpc6/EgCKOIwIGgpvxSM+f1D'
+        'xuKHIRFCx1dhJnVV1zhDHVSoxsZAaNVO0zTXoWqPrkbYrVu3qur6oeqxut7W+uGpD2/e1ke90gKl'
+        'PyJjsAE7IMAIxXNV12Vet9Pn6bMvW9omKXfJ5e4f3vkmlyP3/T5fr/fbH8lyXnLykpOXnLzk5CUn'
+        'Lzn5IDn/6AHC/j2EeRDmQZgHYR6EeRDmQZgHYR6EeRDmQZgHYR6EeRDmQZgHYR6EeRDmQZgHYR6E'
+        'eRDmQZgHYR6EeRDmQZgHYR6EeRDmQZgHYR6EeRDmQZgHYR6EeRDmQZgHYR6EeRDmQZgHYR6EeRDm'
+        'QZgHYR6EeRDmQZgHYR6EeRDmQZgHYR6EeRDmQZgHYR6EeRDmQZgHYR6EeRDmQZgHYR6EeRDmQZgH'
+        'YT6A8FMDCO8ZNMT40/cfLPBsg4hFIhaJWERhEYVFFBZRWERhEYVFFBZRWERhEYVFFBZRWERhEYVF'
+        'FBZRWERhEYVFFBZRWERhEYVFFBZRWERhEYVFFBZRWERhEYVFFBZRWERhEYVFFBZRWERhEYVFFBZR'
+        'WERhEYVFFBZRWERhEYVFFBZRWERhEYVFFBZRWERhEYVFFBZRWERhEYVFFBZRWERhEYVFFBZRWERh'
+        'EYVFFBZRWAwo/OOHTijed8ISAUsELOmEJRCWQFgCYcmTgCUelnhY4mGJhyVPApawWMJiCYslLJaw'
+        'WMJiCYslLJawWPIkYImOJTqW6FiiY4mOJTqW6FiiY4mOJTqW6FiiY8mTgCVIliBZgmQJkiVIliBZ'
+        'gmQJkiVIliBZgmQJkiVIliBZgmQJkiVIliBZgmQJkiVIljwJWGJliZUlVpZYWfInuYTMEjJLyCwh'
+        's4TMEjJLyCx5ErDkScASQEsALQG0BNASQEueBCxxtMTRkicBS54ELHkSsORJwJInAUueBCx5ErDk'
+        'ScCSJwFLngQseRKw5EnAkicBS54ELHkSsORJwJInAUueBCx5ErAUKP4n/0k34d8YegXehB/UJfjT'
+        '//Hfl+f/+ScG//wf7AOA4HcsO/hvvIy/O/n33D/QnBn8P35Jfqt+5qEI/9R9ERYUYUERFhRhQREW'
+        'FGFBERYUYUERFhRhQREWFGFBERYUYUERFhRhQREWFGFBERYUYUERFhRhQREWFGFBERYUYUERFhRh'
+        'QREWFGFBERYUYUERFhRhQREWFGFBERYUYUERFhRhQREWFGFBERYUYUERFhRhQREWFGFBERYUYUER'
+        'FhRhQREWFGFBERYUYUERFhRhQREWFGFBERYUYUERFhRhQREWFGFBERYUYUERFhRhQREWFGFBERYU'
+        'YUERFhRhQREWFGFBERYUYUERFhRhQREWFGFBERYUYUERFhRhQREWFGFBERYUYUERFhRhQREWFGFB'
+        'ERYUYUERFoIi/NlX8rO+oFr+6SDhv+vp/qcPT41+RriLwl0U7qJUF6W6KNVFcS6Kc1Gci+JclOOi'
+        'HBfluCjHRTkuynFRjotyXJTjogAXBbgowEUBLgpwUYCLAlwU4KIAFwW4KMBFAS5KblFyi5JblNyi'
+        '5BYltyi5RcktSm5RcouSW5TcouQWJbcouUXJLUpuUXKLkluU3KLkFkW2KLJFkS2KbFFWi7JalNWi'
+        'rBZltSirRVktSmdROovSWZTOonQWxbIolkWlUAyC8XMP9f66+3ovEVAioKTeSyCUQCiBUAKhBEIJ'
+        'hBIIJRBKIJRAKIFQAqEEQgmEEgglEEoglEAogVACoQRCCYQSCCUQSiCUQCiBUAKhBEIJhBIIJRBK'
+        'IJRAKIFQAqEEQgmEEgglEEoglEAogVACoQRCCYQSCCUQSiCUQCiBUAKhBEIJhBIIJRBKIJRAKIFQ'
+        'AqEEQgmEEgglEEoglEAogVACoRRA+GcPEP7LewhlEMoglEEog1AGoQxC2Z4v81DmocxDmYeyPV/G'
+        'ooxFGYsyFmUsyliUsShjUcaibM+X6SjTUaajTEeZjjIdZTrKdJTpKNNRpqNMR9meL0NShqQMSRmS'
+        'MiRlSMqQlCEpQ1KGpAxJGZIyJGVIypCUISlDUoakDEkZkjIkZXu+zEqZlTIrZVbK/iTLyJSRKSNT'
+        'RqaMTBmZMjJle75sz5cBKgNUBqgMUBmgsj1f5qjMUdmeL9vzZXu+bM+X7fmyPV+258v2fNmeL9vz'
+        'ZXu+bM+X7fmyPV+258v2fNmeL9vzZXu+HCj+5w/77F9BvAzxMsTL9C7Tu0zvMrbL2C5ju4ztMq/L'
+        'vC7zuszrMq/LvC7zuszrMq/LoC6DugzqMqjLoC6DugzqMqjLoC6DugzqMqjLhC4TukzoMqHLhC4T'
+        'ukzoMqHLhC4TukzoMqHLhC4TukzoMqHLhC4TukzoMqHLhC6juYzmMprLaC4zuczkMpPLTC4zuczk'
+        'MpPLFC5TuEzhMoXLFC7jt4zfMvzLAYB/8bt76D1/eD01eBTo3Hv+V581+NXvwtH33Bt/5F0/OP+9'
+        '7/zB7/mRH/neH1oIXlr9qcGJ9wGOwefeMP/9P/wj7/eX/uzgL/0wv0R+7hP/QPqtb5v6rm99+9Tb'
+        'gr/ZxdAHeAUlODq/ZfBP+/85HJ97/Yv/h/zPg/9ucEr+y/vXI5/9K4MXV97zsE5+8H6dVCWxKolV'
+        '66QqkFWBrApk1TqpymVVLqtyWZXLqnVSFc+qeFbFsyqeVfGsimdVPKviWRXPqnVSldKqlFaltCql'
+        'VSmtSmlVSqtSWpXSqpRWpbQqpVXrpCqsVWGtCmtVWKvCWhXWqrBWhbUqrFVhrQprVVirwloV1qqw'
+        'VoW1KqxVYa0Ka1VYq8JatU6qMluV2arMVmW2KlFV0a2KblV0q6JbFd2q6FZFt2qdVK2TqiBXBbkq'
+        'yFVBrgpy1TqpynNVnqvWSdU6qVonVeukap1UrZOqdVK1TqrWSdU6qVonVeukap1UrZOqdVK1TqrW'
+        'SdU6qVon1aBN2g/r5F9CvAbxGsRr9K7Ru0bvGrZr2K5hu4btGq9rvK7xusbrGq9rvK7xusbrGq9r'
+        'oK6BugbqGqhroK6BugbqGqhroK6BugbqGqhrhK4RukboGqFrhK4RukboGqFrhK4RukboGqFrhK4R'
+        'ukboGqFrhK4RukboGqFrhK6huYbmGppraK4xucbkGpNrTK4xucbkGpNrFK5RuEbhGoVrFK7ht4bf'
+        'GvxrAYDjF0qtOyi1n38otcX7UtvgYYOHDaW2gcUGFhtYbCi1DTo26NigY4OODaW2AckGJBuQbECy'
+        'AckGJBuQbECyAcmGUttgZYOVDVY2WNlgZYOVDVY2WNlgZYOVDVY2WNlQahvIbCCzgcwGMhvIbCCz'
+        'gcwGMhvIbCCzgcwGMhvIbCCzgcwGMhvIbCCzgcwGMhvIbCi1DXI2yNkgZ4OcDX+uGwBtALQB0AZA'
+        'GwBtALQB0IZS21BqGzht4LSB0wZOGzhtKLUNqjao2lBqG0ptQ6ltKLUNpbah1DaU2oZS21BqG0pt'
+        'Q6ltKLUNpbah1DaU2oZS21BqG0ptQ6ltBKZPXnjj0OcEb4P4hed/GXxH2E8Eb0f6xQfjT98brzFe'
+        'Y7zGeI3xGuM1xmtw1+CuwV2Du0Z1jeoa1TWqa1TXqK5RXaO6RnUN5xrONZxrONdwruFcw7mGcw3n'
+        'Gs41nGs41ziucVzjuMZxjeMaxzWOaxzXOK5xXOO4xnGN4xrHNY5rHNc4rnFc47jGcY3jGsA1gGsA'
+        '1wCukVsjt0ZujdwauTVya+TWWK2xWmO1xmqN1RqkNUhrIlILmJw+7L5/yEGdgzoHdQ7qHNQ5qHNQ'
+        '56DOQZ2DOgd1Duoc1Dmoc1DnoM5BnYM6B3UO6hzUOahzUOegzkGdgzoHdQ7qHNQ5qHNQ56DOQZ2D'
+        'Ogd1Duoc1Dmoc1DnoM5BnYM6B3UO6hzUOahzUOegzkGdgzoHdQ7qHNQ5qHNQ56DOQZ2DOgd1Duoc'
+        '1Dmoc1DnoM5BnYM6B3UO6hzUOahzUOegHjg4eyiEH70vhC0QtkDYAmELhC0QtkDYsvS2eNjiYYuH'
+        'LR62LL0tLLaw2MJiC4stLLaw2MJiC4stLLYsvS06tujYomOLji06tujYomOLji06tujYomOLji1L'
+        'bwuSLUi2INmCZAuSLUi2INmCZAuSLUi2INmCZAuSLUi2INmCZAuSLUi2INmCZAuSLUtvi5UtVrZY'
+        '2WJly5/kFjJbyGwhs4XMFjJbyGwhs2XpbVl6WwBtAbQF0BZAWwBtWXpbHG1xtGXpbVl6W5belqW3'
+        'ZeltWXpblt6Wpbdl6W1ZeluW3palt2XpbVl6W5belqW3ZeltWXpblt5WoPiXHhR//L3ibYq3Kd6m'
+        'eJvibYq3Kd7GdxvfbXy38d3mdpvbbW63ud3mdpvbbW63ud3mdhvYbWC3gd0GdhvYbWC3gd0GdhvY'
+        'bWC3gd0GdpvUbVK3Sd0mdZvUbVK3Sd0mdZvUbVK3Sd0mdZvUbVK3Sd0mdZvUbVK3Sd0mdZvUbUS3'
+        'Ed1GdBvRbTa32dxmc5vNbTa32dxmc5vGbRq3adymcZvGbQy3MdwWgu0Awi8/rLX/iYMGBw0OGhw0'
+        'OGhw0OCgwUGDgwYHDQ4aHDQ4aHDQ4KDBQYODBgcNDhocNDhocNDgoMFBg4MGBw0OGhw0OGhw0OCg'
+        'wUGDgwYHDQ4aHDQ4aHDQ4KDBQYODBgcNDhocNDhocNDgoMFBg4MGBw0OGhw0OGhw0OCgwUGDgwYH'
+        'DQ4aHDQ4aHDQ4KDBQYODBgcNDhocNDhocNDgoMFBI3DwKw+FsHNfCE0QmiA0QWiC0AShCUIThCYI'
+        'TRCaIDRBaILQBKEJQhOEJghNEJogNEFogtAEoQlCE4QmCE0QmiA0QWiC0AShCUIThCYITRCaIDRB'
+        'aILQBKEJQhOEJghNEJogNEFogtAEoQlCE4QmCE0QmiA0QWiC0AShCUIThCYITRCaIDRBaILQBKEJ'
+        'QhOEJghNEJogNEFogtAEoQlCE4RmAOH8Vfuhz82n/kMf+nzxUJR/Rz525GNHPnbkY0c+duRjRz52'
+        '5GNHPnbkY0c+duRjRz525GNHPnbkY0c+duRjRz525GNHPnbkY0c+duRjRz525GNHPnbkY0c+duRj'
+        'Rz525GNHPnbkY0c+duRjRz525GNHPnbkY0c+duRjRz525GNHPnbkY0c+duRjRz525GNHPnbkY0c+'
+        'duRjRz525GNHPnbkY0c+duRjRz525GNHPnbkY0c+duRjRz525GNHPnbkY0c+duRjJ8jHe1/0XbJ/'
+        'MHhi8KsvfAPTW4JvUfq1V1qAAvw/8PSH/wrKB/fems7Dhnn9/YbZk6A9CdqToD0J2pOgPQnak6A9'
+        'CdqToD0J2pOgPQnak6A9CdqToD0J2pOgPQnak6A9CdqToD0J2pOgPQnak6A9CdqToD0J2pOgPQna'
+        'k6A9CdqToD0J2pOgPQnak6A9CdqToD0J2pOgPQnak6A9CdqToD0J2pOgPQnak6A9CdqToD0J2pOg'
+        'PQnak6A9CdqToD0J2pOgPQnak6A9CdqToD0J2pOgPQnak6A9CdqToD0J2pOgvSBBv/4A4Q33EPZB'
+        '2AdhH4R9EPZB2AdhH4R9EPZB2AdhH4R9EPZB2AdhH4R9EPZB2AdhH4R9EPZB2AdhH4R9EPZB2Adh'
+        'H4R9EPZB2AdhH4R9EPZB2AdhH4R9EPZB2AdhH4R9EPZB2AdhH4R9EPZB2AdhH4R9EPZB2AdhH4R9'
+        'EPZB2AdhH4R9EPZB2AdhH4R9EPZB2AdhH4R9EPZB2AdhH4R9EPZB2AdhH4T9AMJvPKzUv8dBi4MW'
+        'By0OWhy0OGhx0OKgxUGLgxYHLQ5aHLQ4aHHQ4qDFQYuDFgctDloctDhocdDioMVBi4MWBy0OWhy0'
+        'OGhx0OKgxUGLgxYHLQ5aHLQ4aHHQ4qDFQYuDFgctDloctDhocdDioMVBi4MWBy0OWhy0OGhx0OKg'
+        'xUGLgxYHLQ5aHLQ4aHHQ4qDFQYuDFgctDloctDhocdDioBU4+M2Ppo3ZyP+9wXb/iL8n//IhHP9a'
+        'OA6E40A4DqTiQCoOpOJAKg6k4kAqDqTiQCoOpOJAKg6k4kAqDqTiQCoOpOJAKg6k4kAqDqTiQCoO'
+        'pOJAKg6k4kAqDqTiQCoOpOJAKg6k4kAqDqTiQCoOpOJAKg6k4kAqDqTiQCoOpOJAKg6k4kAqDqTi'
+        'QCoOpOJAKg6k4kAqDqTiQCoOpOJAKg6k4kAqDqTiQCoOpOJAKg6k4kAqDqTiQCoOpOJAKg6k4kAq'
+        'DqTiQCoOglT8VtEnuDz7RwZXZfeFl6WugiPzt1940epNwQna+91MUHAP/tRTL++3brw0IXrfQ4j+'
+        'kRAdCdGREB3ZMEeydCRLR7J0JEtHsnQkS0eydCRLR7J0JEtHsnQkS0eydCRLR7J0JEtHsnQkS0ey'
+        'dCRLR7J0JEtHsnQkS0eydCRLR7J0JEtHsnQkS0eydCRLR7J0JEtHsnQkS0eydCRLR7J0JEtHsnQk'
+        'S0eydCRLR7J0JEtHsnQkS0eydCRLR7J0JEtHsnQkS0eydCRLR7J0JEtHsnQkS0eydCRLR7J0JEtH'
+        'snQkS0eydCRLR0GWrgY/qOf4/qu2v/bwyRHvefjIjqd8ZMf/6fOTXj/4jwZgLvI/7Un8Twd/m+vn'
+        'Uxd8P+xPBCH8Vx/rj0qCJvixwW/Sh5S6/gvl9L3Bb9O//mj+bQr+ET/z6Q/8TsMPq5yCj9f6Hwbv'
+        'A/ygf8NuHmrqQk0dq6ljNXWsn47107F+OtZPx/rpWD8d66dj/XSsn47107F+OtZPx/rpWD8d66dj'
+        '/XSsn47107F+OtZPx/rpWD8d66dj/XSsn47107F+OtZPx/rpWDEdq6lj/XSsn47107F+OtZPx/rp'
+        'WD8d66dj/XSsn47107F+OtZPx/rpWD8d66dj/XSsn47107F+OtZPx/rpWHscq6ljNXWspo7V1LGa'
+        'OlZTx2rqWE0dq6ljNXWspo7V1LGaOlZTx0Gx/JsHAAcAnABwAsCJPXXCwQkHJxyccHDCwQkHJxyc'
+        'cHDCwQkHJxyccHDCwQkHJxyccHDCwQkHJxyccHDCwQkHJxyccHDCwQkHJxyccHDCwQkAJziccHDC'
+        'wQkHJxyccHDCwQkHJxyccHDCwQkHJxyccHDCwQkHJxyccHDCwQkHJxyccHDCwQkAJwCcAHACwAkA'
+        'JwCcAHACwAkAJwCcAHACwAkAJwCckHYSOLh91T58/9n/4MP3f/vwyOiT7x8ZnQnImYCcCciZgJwJ'
+        'yJmAnAnImYCcCciZgJwJyJmAnAnImYCcCciZgJwJyJmAnAnImYCcCciZgJwJyJmAnAnImYCcCciZ'
+        'gJwJyJmAnAnImYCcCciZgJwJyJmAnAnImYCcCciZgJwJyJmAnAnImYCcCciZgJwJyJmAnAnImYCc'
+        'CciZgJwJyJmAnAnImYCcCciZgJwJyJmAnAnImYCcCciZgJwJyJmAnAnImYCcCciZgJwJyFkQkN95'
+        '7ScuvvYTFz/SP3HxY/qHLN7/NMlnv/LdP/ly/MDF/+vh8vm7iv1csZ8r9nPFfq7YzxX7uWI/V+zn'
+        'iv1csZ8r9nPFfq7YzxX7uWI/V+zniv1csZ8r9nPFfq7YzxX7uWI/V+zniv1csZ8r9nPFfq7YzxX7'
+        'uWI/V+zniv1csZ8r9nPFfq7YzxX7uWI/V+zniv1csZ8r9nPFfq7YzxX7uWI/V+zniv1csZ8r9nPF'
+        'fq7YzxX7uWI/V+zniv1csZ8r9nPFfq7YzxX7uWI/V+zniv1csZ8r9nPFfq7YzxX7uWI/V+znQbHf'
+        '/a5ePvmVwd87OH7y7x78yw9w/+T//NOeB/ztwddqH+IxlP+xpwdpGvwdPsBZlK8M/tM/O/hPP8wD'
+        'Kf/nBn+H5wZ/h//fd6Llf3zwb3/AO+n/fiXcj8G9dzO4916254D/7uFjQ4effuHhz/uCD73+f154'
+        'pLM/eFbx5OOeeuijn9NHXX3U1UddRdRVRF1F1FVEXUXUVURdRdRVRF1F1FVEXUXUVURdRdRVRF1F'
+        '1FVEXUXUVURdRdRVRF1F1FVEXUXUVURdRdRVRF1F1FVEXUXUVURdRdRVRF1F1FVEXUXUVURdRdRV'
+        'RF1F1FVEXUXUVURdRdRVRF1F1FVEXUXUVURdRdRVRF1F1FVEXUXUVURdRdRVRF1F1FVEXUXUVURd'
+        'RdRVRF1F1FVEXUXUVURdRdRVRIPxridPPfXiZ4U/97yK5974znd+zw/90R/2sb9fE3yf5y8/PEP8'
+        '+YdniHeDL03e9WTogdCTv37/xUqfoT5DfTutj1IfpT5KfZT6KPVR6qPUR6mPUh+lPkp9lPoo9VHq'
+        'o9RHqY9SH6U+Sn2U+ij1Ueqj1Eepj1IfpT5KfZT6KPVR6qPUR6mPUh+lPkp9lPoo9VHqo9RHqY9S'
+        'H6U+Sn2U+ij1Ueqj1Eepj1IfpT5KfZT6KPVR6qPUR6mPUh+lPkp9lPoo9VHqo9RHqY9SH6U+Sn2U'
+        '+gGlpx/L5B+DcAPCDQg3INyAcAPCDQg3INyAcAPCDQg3INyAcAPCDQg3INyAcAPCDQg3INyAcAPC'
+        'DQg3INyAcAPCDQg3INyAcAPCDQg3INyAcAPCDQg3INyAcAPCDQg3INyAcAPCDQg3INyAcAPCDQg3'
+        'INyAcAPCDQg3INyAcAPCDQg3INyAcAPCDQg3INyAcAPCDQg3INyAcAPCDQg3INyAcAPCDQg3INwE'
+        'EF731CvyPWF/+KV+T9iT3/PUwwsunxv8QNrL/O/4Jonf8Z0MvxP8/g0Hf9lrX+y/9sX+R88X+7m3'
+        'DL5Kvnn+q+SX+av+4OnXzkv29f9L/zX/k9c/9cLR/abg6P74xz25a09+3OsCBcH4JOM9xhuMNxpv'
+        'Mj7Z+BTjU42Q8WYjbHya8Yzx6caI8RnGZxqfZUSMzzY+x/i9xu8zPtf4/cbnGZ9vfIHxhcYXGVHj'
+        'LcYXG6PGlxhjxpcaX2Z8ufEVxlcaX2V8tfE1xtcaX2fEjHHj640JI258g/GNxjcZ32xMGt9ifKvx'
+        'VuNtRsL4NiNpfLuRMp41vsN4YqSNtwfjXU8+4fF0/tn703mIhCEShkgYImGIhCEShkgYImGIhCES'
+        'hkgYImGIhCEShkgYImGIhCEShkgYImGIhCEShkgYImGIhCEShkgYImGIhCEShkgYImGIhCEShkgY'
+        'ImGIhCEShkgYImGIhCEShkgYImGIhCEShkgYImGIhCEShkgYImGIhCEShkgYImGIhCEShkgYImGI'
+        'hCEShkgYImGIhCEShkgYImGIhCEShkgYCiR84lN+Uv3zHfE7wZda+d8ILoFPehTydfdChgkZJmSY'
+        'kGFChgkZJmSYkGFChgkZJmSYkGFChgkZJmSYkGFChgkZJmSYkGFChgkZJmSYkGFChgkZJmSYkGFC'
+        'hgkZJmSYkGFChgkZJmSYkGFChgkZJmSYkGFChgkZJmSYkGFChgkZJmSYkGFChgkZJmSYkGFChgkZ'
+        'JmSYkGFChgkZJmSYkGFChgkZJmSYkGFChgkZJmSYkGFChgkZJmSYkOFAyBueeuFdJn918Ba4J298'
+        '7UZ87UZ8lb8g9AFOQ2fqjz9/pr6ybsQ3PfX4fVbP/s1BwD958O/8zP0HfO8Eh+OnPPWK/xzjwtMv'
+        'wecYP/nU4Ddm8Hl9z/7Fd9//lJ+Pe74mn3v6rW9/R/AA81k/t+z5PfqLwR790fwzrws+QiAYJ8ap'
+        '8QvGLxo/b7SN42C860nocTH/0/vFPGIxj1jMIxbziMU8YjGPWMwjFvOIxTxiMY9YzCMW84jFPGIx'
+        'j1jMIxbziMU8YjGPWMwjFvOIxTxiMY9YzCMW84jFPGIxj1jMIxbziMU8YjGPWMwjFvOIxTxiMY9Y'
+        'zCMW84jFPGIxj1jMIxbziMU8YjGPWMwjFvOIxTxiMY9YzCMW84jFPGIxj1jMIxbziMU8YjGPWMwj'
+        'FvOIxTxiMY9YzCMW84jFPGIxj1jMIxbziMU8YjGPWMwjFvOIxTxiMY9YzCMW80gg4c2BhGAz/8EB'
+        '7r87+Fd/8unBo/HwU/ffKvns+CC+n/bCCn+2OfjlMy+K/JPXDz596cmnf7gBf+7j3/nOyfTb0/c/'
+        'pe/tH8Ef5/XcJ7zjbZl3vPMdf+g7fbzk3/hgnqoF3fC3Bn/lf1IPjAx+h4Mr+vXBkfQZjyl9831K'
+        'R6V0VEpHpXRUSkeldFRKR6V0VEpHpXRUSkeldFRKR6V0VEpHpXRUSkeldFRKR6V0VEpHpXRUSkel'
+        'dFRKR6V0VEpHpXRUSkeldFRKR6V0VEpHpXRUSkeldFRKR6V0VEpHpXRUSkeldFRKR6V0VEpHpXRU'
+        'SkeldFRKR6V0VEpHpXRUSkeldFRKR6V0VEpHpXRUSkeldFRKR6V0VEpHpXRUSkeldFRKR6V0VEpH'
+        'pXRUSkeldDRI6Wc+PnPZA2EMhDEQxkAYA2EMhDEQxkAYA2EMhDEQxkAYA2EMhDEQxkAYA2EMhDEQ'
+        'xkAYA2EMhDEQxkAYA2EMhDEQxkAYA2EMhDEQxkAYA2EMhDEQxkAYA2EMhDEQxkAYA2EMhDEQxkAY'
+        'A2EMhDEQxkAYA2EMhDEQxkAYA2EMhDEQxkAYA2EMhDEQxkAYA2EMhDEQxkAYA2EMhDEQxkAYA2EM'
+        'hDEQxkAYCyB8looYfOL94An8Dz+JvF/nBkX0vwyOhVf7z8t98tlPvfbmw9e+1nzta82X/s2HT/78'
+        '0y/Luw+ffM5Tr5g3TH3+0y/jG6ae/N6Pyt+Y4DfiGwbL6CO2BH7f4wU9fH9Bjzucxh1O4w6ncYfT'
+        'uMNp3OE07nAadziNO5zGHU7jDqdxh9O4w2nc4TTucBp3OI07nMYdTuMOp3GH07jDadzhNO5wGnc4'
+        'jTucxh1O4w6ncYfTuMNp3OE07nAadziNO5zGHU7jDqdxh9O4w2nc4TTucBp3OI07nMYdTuMOp3GH'
+        '07jDadzhNO5wGnc4jTucxh1O4w6ncYfTuMNp3OE07nAadziNO5zGHU7jDqdxh9O4w2nc4TTucBp3'
+        'OI07nMYdTuMOp3GH07jDadzhNO5wGg8Op899lPDGIRImSJggYYKECRImSJggYYKECRImSJggYYKE'
+        'CRImSJggYYKECRImSJggYYKECRImSJggYYKECRImSJggYYKECRImSJggYYKECRImSJggYYKECRIm'
+        'SJggYYKECRImSJggYYKECRImSJggYYKECRImSJggYYKECRImSJggYYKECRIm/DlNADEBxAQQE0BM'
+        'ADEBxAQQE0BMADEBxAQQE0BMADEBRDDOjF83fsP4JeM3jR812savGZfGsfFe45eN3zJ+3vhVo2uc'
+        'GL9idIzfNn7B+EXjwjg1zo2e8b5gvOvJ739FPUMNNsDQYBW+5E3/eS9+HPW/B8+bP/8x8kP35T8p'
+        '8pMiPynykyI/KfKTIj8p8pMiPynykyI/KfKTIj8p8pMiPynykyI/KfKTIj8p8pMiPynykyI/KfKT'
+        'Ij8p8pMiPynykyI/KfKTIj8p8pMiPynykyI/KfKTIj8p8pMiPynykyI/KfKTIj8p8pMiPynykyI/'
+        'KfKTIj8p8pMiPynykyI/KfKTIj8p8pMiPynrk7I+KeuTsj4p65OyPinrk7I+KeuTsj4p65OyPinr'
+        'k7I+qVQmg9R8QSAheAPwNwxen37f4F+1nxo85PzCRySfcL8XEpAkIElAkoAkAUkCkoS2SLCSYCXB'
+        'SoKVhCZJIJNAJoFMApkEMglkEsgkkEkgk1A9CXIS5CTISZCTICdBToKcBDkJchLkJMhJkJPQXAmA'
+        'EgAlAEoAlAAoAVACoARACYASACUASgCUACgBUAKgBEAJgBIAJQBKAJQAKKE+ExwlOEpwlOAo4U85'
+        'gVMCpwROCZwSOCVwSuCU0L4J7ZuAKwFXAq4EXAm4Epo5wViCsYR9krBBEhZCQtsndHhCsSfsjIT1'
+        'kLBWEhZCwjpKWEcJeyhh5SRsl4R9krA6EvZCwl5IBMK/6JHxH73vuiTGSYyTGCcxTmKcxDiJcRLj'
+        'JMZJjJMYJzFOYpzEOIlxEuMkxkmMkxgnMU5inMQ4iXES4yTGSYyTGCcxTmKcxDiJcRLjJMZJjJMY'
+        'JzFOYpzEOIlxEuMkxkmMkxgnMU5inMQ4iXES4yTGSYyTGCcxTmKcxDiJcRLjJMZJjJMYJzFOYpzE'
+        'OIlxEuMkxkmMkxgnMU5inMQ4iXES4yTGSYyTGCcxTmKcxDiJcRLjJMZJjJMYJzFOYpzEOIlxEuMk'
+        'xkmMkxgnMU5inMQ4iXES4yTGSYyTAePo43Pun6I4RXGK4hTFKYpTFKcoTuGbwjeFbwrfFLcpblPc'
+        'prhNcZviNsVtitsUtylgU8CmgE0BmwI2BWwK2BSwKWBTwKaATQGbIjVFaorUFKkpUlOkpkhNkZoi'
+        'NUVqitQUqSlSU6SmSE2RmiI1RWqK1BSpKVJTiKYQTSGaQjTFZorNFJspNlNspthMsZmiMUVjisYU'
+        'jSkaUximMEwJQSqA8JanXvgErdcHt9wXP/bb9933W5qMNBlpMtJkpMlIk5HWb2lA0oCkAUkDktZv'
+        'aU7SnKQ5SXOS5iTNSZqTNCdpTtL6LY1LGpc0Lmlc0rikcUnjksYljUsalzQuaVzS+i1NTZqaNDVp'
+        'atLUpKlJU5OmJk1Nmpo0NWlq0tSkqUlTk6YmTU2amjQ1aWrS1KT1WxqeNDxpeNLwpP3RphlKM5Rm'
+        'KM1QmqE0Q2mG0votrd/SRKWJShOVJipNVFq/pcFKg5XWb2n9ltZvaf2W1m9p/ZbWb2n9ltZvaf2W'
+        '1m9p/ZbWb2n9ltZvaf2W1m9p/ZbWb+mA9ejL+uVb8OXX33z6Q/9+2Zf/Qd2XPBb/vnhPifeUeE+J'
+        '95R4T4n3lHhPyfWUXE/J9ZRcTwn0lEBPCfSUQE8J9JRATwn0lEBPCfSUJE9J8pQkT0nylCRPSfKU'
+        'JE9J8pQkT0nylCRPSfKUCE+J8JQIT4nwlAhPifCUCE+J8JQIT4nwlAhPifCUCE+J8JQIT4nwlAhP'
+        'ifCUCE+J8JQIT8nulOxOye6U7E4J7ZTQTgntlNBOCe2U0E4J7ZSYTonplJhOiemUmE7J55R8TmmH'
+        'qSAhYy9bQgbpeLbzvLVXxMuZX/q4AP/2/QKclpBpCZmWkGkJmZaQaQmZlpBpCZmWkGkJmZaQaQmZ'
+        'lpBpCZmWkGkJmZaQaQmZlpBpCZmWkGkJmZaQaQmZlpBpCZmWkGkJmZaQaQmZlpBpCZmWkGkJmZaQ'
+        'aQmZlpBpCZmWkGkJmZaQaQmZlpBpCZmWkGkJmZaQaQmZlpBpCZmWkGkJmZaQaQmZlpBpCZmWkGkJ'
+        'mZaQaQmZlpBpCZmWkGkJmZaQaQmZlpBpCZmWkGkJmZaQ6SAhX/YooXAvIUNChoQMCRkSMiRkSMg4'
+        'hTJAZIDIAJEBIuMUynCR4SLDRYaLDBcZLjJcZLjIcJFxCmXwyOCRwSODRwaPDB4ZPDJ4ZPDI4JHB'
+        'I4NHximUoSRDSYaSDCUZSjKUZCjJUJKhJENJhpIMJRlKMpRkKMlQkqEkQ0mGkgwlGUoyTqEMLBlY'
+        'MrBkYMn4o8wwk2Emw0yGmQwzGWYyzGScQhmnUIagDEEZgjIEZQjKOIUyIGVAyjiFMk6hjFMo4xTK'
+        'OIUyTqGMUyjjFMo4hTJOoYxTKOMUyjiFMk6hjFMo4xTKOIUyTqGMUygTMP7yR8Z//J7xDMYzGM9g'
+        'PIPxDMYzGM9gPIPxDMYzGM9gPIPxDMYzGM9gPIPxDMYzGM9gPIPxDMYzGM9gPIPxDMYzGM9gPIPx'
+        'DMYzGM9gPIPxDMYzGM9gPIPxDMYzGM9gPIPxDMYzGM9gPIPxDMYzGM9gPIPxDMYzGM9gPIPxDMYz'
+        'GM9gPIPxDMYzGM9gPIPxDMYzGM9gPIPxDMYzGM9gPIPxDMYzGM9gPIPxDMYzGM9gPIPxDMYzGM9g'
+        'PIPxDMYzGM9gPIPxDMYzGM9gPIPxDMYzGM9gPIPxDMYzGM9gPIPxDMYzGM8EjL/i8XD9HymepXiW'
+        '4lmKZymepXiW4ll8Z/GdxXcW31luZ7md5XaW21luZ7md5XaW21luZ4GdBXYW2FlgZ4GdBXYW2Flg'
+        'Z4GdBXYW2FlgZ0mdJXWW1FlSZ0mdJXWW1FlSZ0mdJXWW1FlSZ0mdJXWW1FlSZ0mdJXWW1FlSZ0md'
+        'RXQW0VlEZxGdZXOWzVk2Z9mcZXOWzVk2Z2mcpXGWxlkaZ2mcxXAWw1khmA0gfOVjn/2J+z6bI2GO'
+        'hDkS5kiYI2GOhDl9NgfEHBBzQMwBMafP5riY42KOizku5riY42KOizku5riY02dzeMzhMYfHHB5z'
+        'eMzhMYfHHB5zeMzhMYfHHB5z+myOkjlK5iiZo2SOkjlK5iiZo2SOkjlK5iiZo2SOkjlK5iiZo2SO'
+        'kjlK5iiZo2SOkjl9NgfLHCxzsMzBMuePco6ZOWbmmJljZo6ZOWbmmJnTZ3P6bI6gOYLmCJojaI6g'
+        'OX02B9IcSHP6bE6fzemzOX02p8/m9NmcPpvTZ3P6bE6fzemzOX02p8/m9NmcPpvTZ3P6bE6fzemz'
+        'uYDxVz18o95Q8ODtqx9Zf/896yzWWayzWGexzmKdxTqLdRbrLNZZrLNYZ7HOYp3FOot1Fuss1lms'
+        's1hnsc5incU6i3UW6yzWWayzWGexzmKdxTqLdRbrLNZZrLNYZ7HOYp3FOot1Fuss1lmss1hnsc5i'
+        'ncU6i3UW6yzWWayzWGexzmKdxTqLdRbrLNZZrLNYZ7HOYp3FOot1Fuss1lmss1hnsc5incU6i3UW'
+        '6yzWWayzWGexzmKdxTqLdRbrLNZZrLNYZ7HOYp3FOot1Fuss1lmss1hnsc5incU6i3UW6yzWWayz'
+        'AeuvefHbA/5y8N0qX/vUq+Hje4OnHL/4IXy8+ZOve0x8/j7xOYnPSXxO4nMSn5P4nMTnJD4n8TmJ'
+        'z0l8TuJzEp+T+JzE5yQ+J/E5ic9JfE7icxKfk/icxOckPifxOYnPSXxO4nMSn5P4nMTnJD4n8TmJ'
+        'z0l8TuJzEp+T+JzE5yQ+J/E5ic9JfE7icxKfk/icxOckPifxOYnPSXxO4nMSn5P4nMTnJD4n8TmJ'
+        'z0l8TuJzEp+T+JzE5yQ+J/E5ic9JfE7icxKfk/icxOckPifxOYnPSXxO4nMSn5P4nMTnJD4n8TmJ'
+        'z0l8TuJzEp+T+JzE5yQ+J/E5ic9JfE7icxKfk/icxOckPifxOYnPSXwuSHzs8TD/+xTnKc5TnKc4'
+        'T3Ge4jzFeXzz+ObxzeOb5zbPbZ7bPLd5bvPc5rnNc5vnNg9sHtg8sHlg88Dmgc0Dmwc2D2we2Dyw'
+        'eWDzpOZJzZOaJzVPap7UPKl5UvOk5knNk5onNU9qntQ8qXlS86TmSc2Tmic1T2oe0TyieUTziObZ'
+        'zLOZZzPPZp7NPJt5NvM05mnM05inMU9jHsM8hnkhyAcQxh8umlDwXXVf/9hvP3nfbwtkLJCxQMYC'
+        'GQtkLJCxoN8WAFkAZAGQBUAW9NsCJwucLHCywMkCJwucLHCywMkCJwv6bQGXBVwWcFnAZQGXBVwW'
+        'cFnAZQGXBVwWcFnAZUG/LVCzQM0CNQvULFCzQM0CNQvULFCzQM0CNQvULFCzQM0CNQvULFCzQM0C'
+        'NQvULFCzoN8W4FmAZwGeBXgW/NEuMLTA0AJDCwwtMLTA0AJDC/ptQb8tELVA1AJRC0QtELWg3xbA'
+        'WgBrQb8t6LcF/bag3xb024J+W9BvC/ptQb8t6LcF/bag3xb024J+W9BvC/ptQb8t6LcF/bYQsJ4Y'
+        'sP4Hg+1eGaiOD37ZGyj/rkD5Nzx+X+8feP7cee51P/g93/9DwXe0rgxeEAz+i28evAHuGx/i8ReD'
+        's+ibPuyzKHi58XLoI/e9uy/tKzDf/Ngb773vjaLeKOqNot4o6o2i3ijqjaLeKOqNot4o6o2i3ijq'
+        'jaLeKOqNot4o6o2i3ijqjaLeKOqNot4o6o2i3ijqjaLeKOqNot4o6o2i3ijqjaLeKOqNot4o6o2i'
+        '3ijqjaLeKOqNot4o6o2i3ijqjaLeKOqNot4o6o2i3ijqjaLeKOqNot4o6o2i3ijqjaLeKOqNot4o'
+        '6o2i3ijqjaLeKOqNot4o6o2i3ijqjaLeKOqNot4o6o2i3ijqjaLeKOqNot4o6o2i3ijqjaLeKOqN'
+        'ot4o6o2i3ijqjaLeKOqNot4o6o2i3ijqjaLeKOqNot4o6o2i3ijqjaLeKOqNYtAbk4+M5+8ZlzAu'
+        'YVzCuIRxCeMSxiWMSxiXMC5hXMK4hHEJ4xLGJYxLGJcwLmFcwriEcQnjEsYljEsYlzAuYVzCuIRx'
+        'CeMSxiWMSxiXMC5hXMK4hHEJ4xLGJYxLGJcwLmFcwriEcQnjEsYljEsYlzAuYVzCuIRxCeMSxiWM'
+        'SxiXMC5hXMK4hHEJ4xLGJYxLGJcwLmFcwriEcQnjEsYljEsYlzAuYVzCuIRxCeMSxiWMSxiXMC5h'
+        'XMK4hHEJ4xLGJYxLGJcwLmFcwriEcQnjEsYljEsYlzAuYVwKGH9LwPh9A8ZfGrxv+yxfDv6Db33q'
+        '1fhTef49W8tOfi54p/tbH78g+l/lfkXuV+R+Re5X5H5F7lfkfkXgVwR+ReBXBH5F0lckfUXSVyR9'
+        'RdJXJH1F0lckfUXSV0R8RcRXRHxFxFdEfEXEV0R8RcRXRHxFxFdEfEXEV2R7RbZXZHtFtldke0W2'
+        'V2R7RbZXZHtFtldke0W2V2R7RbZXZHtFtldke0W2V2R7RbZXZHtFqFeEekWoV4R6RZpXpHlFmlek'
+        'eUWaV6R5RZpX5HdFflfkd0V+V+R3RXBXBHdFbawECXnbw8X3fcGpmHjcCD9wvxEqZFTIqJBRIaNC'
+        'RoWMio1QAaQCSAWQCiAVG6HCSYWTCicVTiqcVDipcFLhpMJJxUao4FLBpYJLBZcKLhVcKrhUcKng'
+        'UsGlgksFl4qNUKGmQk2Fmgo1FWoq1FSoqVBToaZCTYWaCjUVairUVKipUFOhpkJNhZoKNRVqKjZC'
+        'BZ4KPBV4KvBU/NFWGKowVGGowlCFoQpDFYYqNkLFRqgQVSGqQlSFqApRFRuhAlYFrIqNULERKjZC'
+        'xUao2AgVG6FiI1RshIqNULERKjZCxUao2AgVG6FiI1RshIqNULERKjZCJWD9bS/+xLH54GuZ5ED6'
+        'Jw1+/fXBr7/9I7obgkexv+f5fH3UfWmTemyA1fsGWNUAqxpgVQOsaoBVDbCqAVY1wKoGWNUAqxpg'
+        'VQOsaoBVDbCqAVY1wKoGWNUAqxpgVQOsaoBVDbCqAVY1wKoGWNUAqxpgVQOsaoBVDbCqAVY1wKoG'
+        'WNUAqxpgVQOsaoBVDbCqAVY1wKoGWNUAqxpgVQOsaoBVDbCqAVY1wKoGWNUAqxpgVQOsaoBVDbCq'
+        'AVY1wKoGWNUAqxpgVQOsaoBVDbCqAVY1wKoGWNUAqxpgVQOsaoBVDbCqAVY1wKoGWNUAqxpgVQOs'
+        'aoBVDbCqAVY1wKoGWNUAqxpgVQOsaoBVDbCqAVY1wKoGWNUAqxpgVQOsaoBVDbCqAVY1wKoGWNUA'
+        'qxpgNWiAZwPG7w0e9Q0ecgSfVP/P73808E8Gf8l3PB5B/xz0ddDXQV8nfJ3wdcLX0V5Hex3tdbTX'
+        'mV5nep3pdabXmV5nep3pdabXmV6HeR3mdZjXYV6HeR3mdZjXYV6HeR3mdZjXYV6neJ3idYrXKV6n'
+        'eJ3idYrXKV6neJ3idYrXKV6neJ3idYrXKV6neJ3idYrXKV6neB3fdXzX8V3Hd53bdW7XuV3ndp3b'
+        'dW7XuV0ndZ3UdVLXSV0ndR3RdUTXBWQ9EPDkxa8E/oXgAEoP1sSvD379A8Fr3m9/RPK3INmEZBOS'
+        'TUg2IdmEZBOSTUg2IdmEZBOSTUg2IdmEZBOSTUg2IdmEZBOSTUg2IdmEZBOSTUg2IdmEZBOSTUg2'
+        'IdmEZBOSTUg2IdmEZBOSTUg2IdmEZBOSTUg2IdmEZBOSTUg2IdmEZBOSTUg2IdmEZBOSTUg2IdmE'
+        'ZBOSTUg2IdmEZBOSTUg2IdmEZBOSTUg2IdmEZBOSTUg2IdmEZBOSzQDJdwYCgsepvzL4huFgNTbu'
+        'V2MNhhoMNauxxkSNiRoTNSZqTNSYqDFRY6LGRI2JGhM1JmpM1JioMVFjosZEjYkaEzUmakzUmKgx'
+        'UWOixkSNiRoTNSZqTNSYqDFRY6LGRI2JGhM1JmpM1JioMVFjosZEjYkaEzUmakzUmKgxUWOixkSN'
+        'iRoTNSZqTNSYqDFRY6LGRI2JGhM1JmpM1JioMVFjosZEjYkaEzUmaoGJ/+yxFX4BhDoIdRDqINRB'
+        'qINQB6EOQh2EOgh1EOog1EGog1AHoQ5CHYQ6CHUQ6iDUQaiDUAehDkIdhDoIdRDqINRBqINQB6EO'
+        'Qh2EOgh1EOog1EGog1AHoQ5CHYQ6CHUQ6iDUQaiDUAehDkIdhDoIdRDqINRBqINQB6EOQh2EOgh1'
+        'EOog1EGog1AHoQ5CHYQ6CHUQ6iDUQaiDUAehDkI9gDD14s8uz//M/Sr5Z4MXPl4hHy6XHfyfn/6A'
+        'HzP3fp8v98KHzr08Hy732kfKfSgfKeej+L7vY/bD5T60z5PzSYh/6fEj5e4/YO6D/GS57wo+LDL8'
+        'ukFeBlH/oXzodcFfGHxq9icYn2h8kvEe4w3GG403Gfcfz/3JxqcYn2qE3u8Dud9shI1PM54xPt0Y'
+        'MT7D+Ezjs178ed7PF8gz6v8Z9f+M+n9G/T+j/p9R/8+o/2fU/zPq/xn1/4z6f/EHh0eNtxhfbIwa'
+        'X2KMGV9qfJnx5cZXGF9pfJXx1cbXGF9rfJ0RM8aNrzcmjPj7fdz5NxjfaHyT8c3G241J41uMbzXe'
+        'arzNSBjf9oE+Oz1pfLuRMp41vuP9PnP9iZE2zoxfMn7Z+BXj3Lgw3mv8qvFrRsf4deM3jN98v098'
+        '/y2ja/y20TPed/8Z7+94vGFnH27Y/+7+hm0A3QC6AXQD6AbQDaAbJDdIbpDcILmBcAPhBsINhBsI'
+        'NxBuINxAuIFwg90Guw12G+w22G2w22C3wW6D3Qa7DXYb7DagbUDbgLYBbQPaBrQNaBvQNqBtQNuA'
+        'tgFtA9oGtA1oG9A2oG1A24C2AW0D2gatDVobtDZobWDawLSBaQPTBqYNTBuYNsBsgNkAswFmA8wG'
+        'kQ0iG/LQCEz8gccHfa17CU0SmiQ0SWiS0CShSUKThCYJTRKaJDRJaJLQJKFJQpOEJglNEpokNElo'
+        'ktAkoUlCk4QmCU0SmiQ0SWiS0CShSUKThCYJTRKaJDRJaJLQJKFJQpOEJglNEpokNEloktAkoUlC'
+        'k4QmCU0SmiQ0SWiS0CShSUKThCYJTRKaJDRJaJLQJKFJQpOEJglNEpokNEloktAkoUlCk4RmIGH6'
+        '4UWgzw0ejf/Bj9mXTYOXQD93cJ1/WM/GM4+Rect9ZHZFZldkdkVmV2R2RWZXZHZFZldkdkVmV2R2'
+        'RWZXZHZFZldkdkVmV2R2RWZXZHZFZldkdkVmV2R2RWZXZHZFZldkdkVmV2R2RWZXZHZFZldkdkVm'
+        'V2R2RWZXZHZFZldkdkVmV2R2RWZXZHZFZldkdkVmV2R2RWZXZHZFZldkdkVmV2R2RWZXZHZFZldk'
+        'dkVmV2R2RWZXZHZFZldkdkVmV2R2RWZXZHZFZldkdkVmV2R2RWY3iMwfevgBGH9nkJiZV80bDYIX'
+        'rj79efofVGD+cPD78qP5p4aev6aH7l+P+5bBj29//g55oXR+PCid7358pPJ/iFZLtFqi1RKtlmi1'
+        'RKslWi3RaolWS7RaotUSrZZotUSrJVot0WqJVku0WqLVEq2WaLVEqyVaLdFqiVZLtFqi1RKtlmi1'
+        'RKslWi3RaolWS7RaotUSrZZotUSrJVot0WqJVku0WqLVEq2WaLVEqyVaLdFqiVZLtFqi1RKtlmi1'
+        'RKslWi3RaolWS7RaotUSrZZotUSrJVot0WqJVku0WqLVEq2WaLVEqyVaLdFqBdGaG8AY/OiZZ797'
+        '4OKdr6poPXnP0Aebrf/8MTD/QmAOBeZQYA4l5VBSDiXlUFIOJeVQUg4l5VBSDiXlUFIOJeVQUg4l'
+        '5VBSDiXlUFIOJeVQUg4l5VBSDiXlUFIOJeVQUg4l5VBSDiXlUFIOJeVQUg4l5VBSDiXlUFIOJeVQ'
+        'Ug4l5VBSDiXlUFIOJeVQUg4l5VBSDiXlUFIOJeVQUg4l5VBSDiXlUFIOJeVQUg4l5VBSDiXlUFIO'
+        'JeVQUg4l5VBSDiXlUFIOJeVQUg4l5VBSDoOkfM/D+7zfFbx2lf2Yj0oQkc7gK9gP6W77Ix/bB+2/'
+        '+bAP2v/iha59MhcI+t6HHykz7EfKfN9rPznltZ+c8tpPTnk5fnLKcy/TT075o74bKP+Vg5v8q+//'
+        'n/+VQYUEP27ux4LrPPfid0b8QvBOiO9/5f/Izi96SX5kZ/5hDf/poET/2ONTgn97/5Sg7TJru8za'
+        'vpRpO9DaDrS2A63tNYO2O63tTmu709rutLbXDNrOtbZzre1cazvX2s61tnOt7VxrO9fazrW21wza'
+        'rra2q63tamu72tqutrarre1qa7va2q62tqut7Wpru9raXjNoO97ajre2463teGs73tqOt7bjre14'
+        'azve2o63tuOt7XhrO97ajre2463teGs73tqOt7bjre14azve2l4zaLvh2m64thuu7YZru7DaTrm2'
+        'U67tlGs75dpOubZTru2Ua3vNoO01g7bDru2wazvs2g67tsOu7TWDtvuu7b5re82g7TWDttcM2l4z'
+        'aHvNoO01g7bXDNpeM2h7zaDtNYO21wzaXjNoe82g7TWDttcM2l4zaHvNoO01g7bXDNrBdTn/qv/m'
+        'iaAzfmNwbb5f3n/glV+E3/SSFOHCY/G96b74ThXfqeI7VXyniu9U8Z0qvlONd6rxTjXeqcY7VXWn'
+        'qu5U1Z2qulNVd6rqTlXdqao7VXWnOu5Ux53quFMdd6rjTnXcqY471XGnOu5Ux53quFMdd6rcTpXb'
+        'qXI7VW6nyu1UuZ0qt1PldqrcTpXbqXI7VW6nyu1UuZ0qt1PldqrcTpXbqXI7VW6nyu1Uq51qtVOt'
+        'dqrVTtXZqTo7VWen6uxUnZ2qs1N1dqrAThXYqQI7VWCnCuxUc51qrlO9eRp0x+JgJQY/u/rp4OHe'
+        'D774nPih4N9aenx88dOsXLBywcoFJBeQXEByAckFJBeQXEByAckFJBeQXEByAckFJBeQXEByAckF'
+        'JBeQXEByAckFJBeQXEByAckFJBeQXEByAckFJBeQXEByAckFJBeQXEByAckFJBeQXEByAckFJBeQ'
+        'XEByAckFJBeQXEByAckFJBeQXEByAckFJBeQXEByAckFJBeQXEByAckFJBeQXEByAckFJBeQXEBy'
+        'AclFgOSHBkjeM3jQ994BiB9+bI+Pv//pKx0iOkR0tEcHjA4YHTA6zqYOHx0+Onx0+Og4mzqYdDDp'
+        'YNLBpINJB5MOJh1MOph0nE0dWjq0dGjp0NKhpUNLh5YOLR1aOrR0aOnQ0nE2daDpQNOBpgNNB5oO'
+        'NB1oOtB0oOlA04GmA00Hmg40HWg60HSg6UDTgaYDTQeajrOpw06HnQ47HXY6/mQ7CHUQ6iDUQaiD'
+        'UAehDkIdZ1PH2dQBqgNUB6gOUB2gOs6mDlcdrjrOpo6zqeNs6jibOs6mjrOp42zqOJs6zqaOs6nj'
+        'bOo4mzrOpo6zqeNs6jibOs6mjrOp42zqBKp/5OF1jWrQc+96ZB29X4qXWF9ifYn1JdaXWF9ifcnz'
+        'Jc+XPF/yfAnyJciXIF+CfAnyJciXIF+CfAnyJcGXBF8SfEnwJcGXBF8SfEnwJcGXBF8SfEnwJbqX'
+        '6F6ie4nuJbqX6F6ie4nuJbqX6F6ie4nuJbqX6F6ie4nuJbqX6F6ie4nuJbqXzF4ye8nsJbOXsF7C'
+        'egnrJayXsF7CegnrJZ6XeF7ieYnnJZ6XXF5yeSkVl4GMH32UsHIvoUtCl4QuCV0SuiR0SegquC4Q'
+        'XSC6QHSB6Cq4LhddLrpcdLnoctHlostFl4suF10F18Wji0cXjy4eXTy6eHTx6OIxGGtDgweCHxc4'
+        '6XLS5aTLSVfTdXHp4tLFpYtLF5cuLl1curh0ceni0sWli0sXly4uXVy6uHRx6eLSxaWLSxeXrqbr'
+        'UtOlpktNl5quP9MuPF14uvB04enC04WnC09X03U1XRelLkpdlLoodVHqarouUV2iupquq+m6mq6r'
+        '6bqarqvpupquq+m6mq6r6bqarqvpupquq+m6mq6r6bqarqvpupquG3j+44+ef+zec4/nHs89nns8'
+        '93ju8dzjucdzj+cezz2eezz3eO7x3OO5x3OP5x7PPZ57PPd47vHc47nHc4/nHs89nns893ju8dxT'
+        'dz2Mexj3MO5h3MO4h3EP4x7GPYx7GPcw7mHcw7iHcQ/jHsY9jHsY9zDuYdzDuIdxD+Mexj2Mexj3'
+        'MO5h3MO4h3EP4x7GPYx7GPcw7mHcw7iHcQ/jHsY9jHsY9zDuYdzDuIdxD+Mexj2Mexj3MO5h3MO4'
+        'h3EP4x7GPYx7GPcw7mHcw7iHcQ/jHsY9jHsY9zDuBYz/xCPjX71nfIXxFcZXGF9hfIXxFcZXGF9h'
+        'fIXxFcZXGF9hfIXxFcZXGF9hfIXxFcZXGF9hfIXxFcZXGF9hfIXxFcZXGF9hfIXxFcZXGF9hfIXx'
+        'FcZXGF9hfIXxFcZXGF9hfIXxFcZXGF9hfIXxFcZXGF9hfIXxFcZXGF9hfIXxFcZXGF9hfIXxFcZX'
+        'GF9hfIXxFcZXGF9hfIXxFcZXGF9hfIXxFcZXGF9hfIXxFcZXGF9hfIXxFcZXGF9hfIXxFcZXGF9h'
+        'fIXxFcZXGF9hfIXxFcZXGF9hfIXxFcZXGF9hfIXxFcZXAePCI+M/c8/4GuNrjK8xvsb4GuNrjK8x'
+        'vsb4GuNrjK8xvsb4GuNrjK8xvsb4GuNrjK8xvsb4GuNrjK8xvsb4GuNrjK8xvsb4GuNrjK8xvsb4'
+        'GuNrjK8xvsb4GuNrjK8xvsb4GuNrjK8xvsb4GuNrjK8xvsb4GuNrjK8xvsb4GuNrjK8xvsb4GuNr'
+        'jK8xvsb4GuNrjK8xvsb4GuNrjK8xvsb4GuNrjK8xvsb4GuNrjK8xvsb4GuNrjK8xvsb4GuNrjK8x'
+        'vsb4GuNrjK8xvsb4GuNrjK8xvsb4GuNrjK8xvsb4GuNrjK8Dxn/ykfH33jPuY9zHuI9xH+M+xn2M'
+        '+xj3Me5j3Me4j3Ef4z7GfYz7GPcx7mPcx7iPcR/jPsZ9jPsY9zHuY9zHuI9xH+M+xn2M+xj3Me5j'
+        '3Me4j3Ef4z7GfYz7GPcx7mPcx7iPcR/jPsZ9jPsY9zHuY9zHuI9xH+M+xn2M+xj3Me5j3Me4j3Ef'
+        '4z7GfYz7GPcx7mPcx7iPcR/jPsZ9jPsY9zHuY9zHuI9xH+M+xn2M+xj3Me5j3Me4j3Ef4z7GfYz7'
+        'GPcx7mPcx7iPcR/jPsZ9jPsY9zHuY9zHuB8w/lMPz7b2Bw8B/stH1d99r/qW6luqb6m+pfqW6luq'
+        'b6m+pfqW6luqb6m+pfqW6luqb6m+pfqW6luqb6m+pfqW6luqb6m+pfqW6luqb6m+pfqW6luqb6m+'
+        'pfqW6luqb6m+pfqW6luqb6m+pfqW6luqb6m+pfqW6luqb6m+pfqW6luqb6m+pfqW6luqb6m+pfqW'
+        '6luqb6m+pfqW6luqb6m+pfqW6luqb6m+pfqW6luqb6m+pfqW6luqb6m+pfqW6luqb6m+pfqW6luq'
+        'b6m+pfqW6luqb6m+pfqW6luqb6m+pfqW6luqb6m+pfqW6luqbwPVxfu3DvzI4Jvj3vW6+7fzDl4g'
+        '+wf5Px78Ff/VI/Rfu4d+B/od6Heg34F+B/od6Heg34F+B/od6Heg34F+B/od6Heg34F+B/od6Heg'
+        '34F+B/od6Heg34F+B/od6Heg34F+B/od6Heg34F+B/od6Heg34F+B/od6Heg34F+B/od6Heg34F+'
+        'B/od6Heg34F+B/od6Heg34F+B/od6Heg34F+B/od6Heg34F+B/od6Heg34F+B/od6Heg34F+B/od'
+        '6Heg34F+B/od6Heg34F+B/od6Heg34F+B/od6Heg34F+B/od6Heg34F+B/od6Heg34F+B/od6Heg'
+        '34F+B/od6HcB45JPj8lXg7/1QPO/uP/omH8X/Of/9WsfLHj/wm/wcnJ08HJy8BJw+cXfD//auwRf'
+        'e5fgq/BdgsG7ZXc+ot8Mn3vLIJY7Q+/+yf/ENwv+Nw9FFwT9cBD0j5LKy3/B/QHyvw3+R/0u9V/+'
+        '8+7/pv/w6Q/3PdXLr7jdEHxP1z96/p/3Jf1gwT/9eBq+4/40/MTfE1RIMD7JeI/xBuONxpuMHzU+'
+        '2fgU41ONkNE23myEjU8znjE+3RgxPsP4TOOzjGMjYny28TnG7zV+n/G5xu83Ps/4fOMLjC80vsj4'
+        'eSNqvMX4YmPU+BJjzPhS48uMLze+wvhK46uMrza+xvha4+uMmDFufL0xYcSNE+MbjG80vsn4ZuPt'
+        'xqTxLca3Gm813mYkjG8zfsH4RSNpfLuRMp41vsM4NZ4YaePM+CXjl41fMc6NC+O9xq8av2Z0jF83'
+        'fsP4TePS+C2ja/y20TPeF4x3PVn5YOL9UCPfPaiRj5lvTisN3qL+Qu32PujvVHv3w3eZ/PfBWyJ+'
+        '7LEJfuK+CUKaIKQJQpogpAlCmiCkCUKaIKQJQpogpAlCmiCkCUKaIKQJQpogpAlCmiCkCUKaIKQJ'
+        'QpogpAlCmiCkCUKaIKQJQpogpAlCmiCkCUKaIKQJQpogpAlCmiCkCUKaIKQJQpogpAlCmiCkCUKa'
+        'IKQJQpogpAlCmiCkCUKaIKQJQpogpAlCmiCkCUKaIKQJQpogpAlCmiCkCUKaIKQJQpogpAlCmiCk'
+        'CUKaIKQJQpogpAlCmiCkCUKaIKQJQpogpAlCmiCkCUKaIKQJQpogpAlCmiCkCUKaIKQJQpogpAlC'
+        'miCkCUKaIKQJQpogpAlCmiCkCUKaIKQJQkET/JlHxt91zziMcRjjMMZhjMMYhzEOYxzGOIxxGOMw'
+        'xmGMwxiHMQ5jHMY4jHEY4zDGYYzDGIcxDmMcxjiMcRjjMMZhjMMYhzEOYxzGOIxxGOMwxmGMwxiH'
+        'MQ5jHMY4jHEY4zDGYYzDGIcxDmMcxjiMcRjjMMZhjMMYhzEOYxzGOIxxGOMwxmGMwxiHMQ5jHMY4'
+        'jHEY4zDGYYzDGIcxDmMcxjiMcRjjMMZhjMMYhzEOYxzGOIxxGOMwxmGMwxiHMQ5jHMY4jHEY4zDG'
+        'YYzDGIcxDmMcxjiMcRjjcMC44nv+nm/nNwffvvJnH97A9rqgrf/cw/djf+Hgl889qv/Oe/UR6iPU'
+        'R6iPUB+hPkJ9hPoI9RHqI9RHqI9QH6E+Qn2E+gj1Eeoj1Eeoj1AfoT5CfYT6CPUR6iPUR6iPUB+h'
+        'PkJ9hPoI9RHqI9RHqI9QH6E+Qn2E+gj1Eeoj1Eeoj1AfoT5CfYT6CPUR6iPUR6iPUB+hPkJ9hPoI'
+        '9RHqI9RHqI9QH6E+Qn2E+gj1Eeoj1Eeoj1AfoT5CfYT6CPUR6iPUR6iPUB+hPkJ9hPoI9RHqI9RH'
+        'qI9QH6E+Qn2E+gj1Eeoj1Eeoj1AfoT5CfYT6CPUR6iPURwL1P/7aN7a+Kh5ZPXx75Q8OLvHXnl+9'
+        'Mj7C8cN6VvXnB5F+7nXv+PYnbwt+uN0/CX7W3Vsn3+GXf//pwTe2/rf+ord9x3c9/+8+v8O+KPhW'
+        'g/fkvzBohb/wuNzefr/copZb1HKLWm5Ryy1quUUtt6jlFrXcopZb1HKLWm5Ryy1quUUtt6jlFrXc'
+        'opZb1HKLWm5Ryy1quUUtt6jlFrXcopZb1HKLWm5Ryy1quUUtt6jlFrXcopZb1HKLWm5Ryy1quUUt'
+        't6jlFrXcopZb1HKLWm5Ryy1quUUtt6jlFrXcopZb1HKLWm5Ryy1quUUtt6jlFrXcopZb1HKLWm5R'
+        'yy1quUUtt6jlFrXcopZb1HKLWm5Ryy1quUUtt6jlFrXcopZb1HKLWm5Ryy1quUUtt6jlFrXcopZb'
+        '1HKLWm5Ryy1quUUtt6jlFrXcopZb1HKLWm5Ryy1quUUtt6jlFrXcopZb1HKLBoxX/6PPKIIv539u'
+        'UImvop+A9a4nP/Hi70P7Y8F5W311fb5Q++kP9qnNT37EfmOC59GJ5/93flQaWntVvvYb4PnLg7d6'
+        '/Ht/Y9Zf+Cm0Tz4x+ELyL35U/kYFuNLv/ggC+kuPR8b33B8ZMUdGzJERc2TEHBkxR0bMkRFzZMQc'
+        'GTFHRsyREXNkxBwZMUdGzJERc2TEHBkxR0bMkRFzZMQcGTFHRsyREXNkxBwZMUdGzJERc2TEHBkx'
+        'R0bMkRFzZMQcGTFHRsyREXNkxBwZMUdGzJERc2TEHBkxR0bMkRFzZMQcGTFHRsyREXNkxBwZMUdG'
+        'zJERc2TEHBkxR0bMkRFzZMQcGTFHRsyREXNkxBwZMUdGzJERc2TEHBkxR0bMkRFzZMQcGTFHRsyR'
+        'EXNkxBwZMUdGzJERc2TEHBkxR0bMkRFzZMQcGTFHRsyREXNkxBwZMUdGzJERc2TEHBkxR0bMkRFz'
+        'ZMQcGTFHRsyREXNkxBwZMUdGzJERC46Mjde+gn7tTR//0S+aX/j6+9k3PF90r30B/VH9BfRfflxM'
+        '2fvFFLeY4hZT3GKKW0xxiyluMcUtprjFFLeY4hZT3GKKW0xxiyluMcUtprjFFLeY4hZT3GKKW0xx'
+        'iyluMcUtprjFFLeY4hZT3GKKW0xxiyluMcUtprjFFLeY4hZT3GKKW0xxiyluMcUtprjFFLeY4hZT'
+        '3GKKW0xxiyluMcUtprjFFLeY4hZT3GKKW0xxiyluMcUtprjFFLeY4hZT3GKKW0xxiyluMcUtprjF'
+        'FLeY4hZT3GKKW0xxiyluMcUtprjFFLeY4hZT3GKKW0xxiyluMcUtprjFFLeY4hZT3GKKW0xxiylu'
+        'McUtprjFFLeY4hZT3GKKW0xxiyluMcUtprjFFLeY4hZTPFhMf+W1xfTaYnqFP819YWt+yrt/8rXF'
+        '9GRz8JXlrw1+P75n8IXlX334QvN1wReafy3YW2f5dz49KIrB+vq4wVPddz2pPS60P3K/0BIWWsJC'
+        'S1hoCQstYaElLLSEhZaw0BIWWsJCS1hoCQstYaElLLSEhZaw0BIWWsJCS1hoCQstYaElLLSEhZaw'
+        '0BIWWsJCS1hoCQstYaElLLSEhZaw0BIWWsJCS1hoCQstYaElLLSEhZaw0BIWWsJCS1hoCQstYaEl'
+        'LLSEhZaw0BIWWsJCS1hoCQstYaElLLSEhZaw0BIWWsJCS1hoCQstYaElLLSEhZaw0BIWWsJCS1ho'
+        'CQstYaElLLSEhZaw0BIWWsJCS1hoCQstYaElLLSEhZaw0BIWWsJCS1hoCQstYaElLLSEhZaw0BIW'
+        'WsJCS1hoCQstYaElLLSEhZaw0BIWWsJCSwQL7a+/uh5RZj7oR5T1x3xf3Oc7Jd8p+U7Jd0q+U/Kd'
+        'ku+UfKfkOyXfKflOyXdKvlPynZLvlHyn5Dsl3yn5Tsl3Sr5T8p2S75R8p+Q7Jd8p+U7Jd0q+U/Kd'
+        'ku+UfKfkOyXfKflOyXdKvlPynZLvlHyn5Dsl3yn5Tsl3Sr5T8p2S75R8p+Q7Jd8p+U7Jd0q+U/Kd'
+        'ku+UfKfkOyXfKflOyXdKvlPynZLvlHyn5Dsl3yn5Tsl3Sr5T8p2S75R8p+Q7Jd8p+U7Jd0q+U/Kd'
+        'ku+UfKfkOyXfKflOyXdKvlPynZLvlHyn5Dsl3yn5Tsl3Sr5T8p2S75R8p+Q7Jd8p+U4F+f4bD++w'
+        '+Y7BOtt68YsUnx189u7ffEU1QJDi7xy8PfQlf5a6/dgAU/cNMKUBpjTAlAaY0gBTGmBKA0xpgCkN'
+        '8P+yd/fxze53fdhzLIIKCk9xEiXYKCHkAUURwnESE0ISRU5CglA8vKKqqupA0VSqGsyIQp+MkIXt'
+        '2kVeaXdwy0bb116bq3nuVvo4z1271XVdr61sYxcSnEiIRwNGpIXS0npud+t669jnNCyENDnJIfnn'
+        'fO379n3OuS+9P5/f77ouPcxrgHkNMK8B5jXAvAaY1wDzGmBeA8xrgHkNMK8B5jXAvAaY1wDzGmBe'
+        'A8xrgHkNMK8B5jXAvAaY1wDzGmBeA8xrgHkNMK8B5jXAvAaY1wDzGmBeA8xrgHkNMK8B5jXAvAaY'
+        '1wDzGmBeA8xrgHkNMK8B5jXAvAaY1wDzGmBeA8xrgHkNMK8B5jXAvAaY1wDzGmBeA8xrgHkNMK8B'
+        '5jXAvAaY1wDzGmBeA8xrgHkNMK8B5jXAvAaY1wDzGmBeA8xrgHkNMK8B5jXAvAaY1wDzGmBeA8xr'
+        'gHkNMK8B5jXAvAaY1wDzGmBeA8xrgHkNMB80wF994v0ys/PDuLdHH5vz9cOzgAD3b4xw5+HOw52H'
+        'Ow93Hu483Hmq81Tnqc5Tnac6T3We6jzVearzVOepzlOdpzpPdZ7qPNV5qvNU56nOU52nOk91nuo8'
+        '1Xmq81Tnqc5Tnac6T3We6jzVearzVOepzlOdpzpPdZ7qPNV5qvNU56nOU52nOk91nuo81Xmq81Tn'
+        'qc5Tnac6T3We6jzVearzVOepzlOdpzpPdZ7qPNV5qvNU56nOU52nOk91nuo81Xmq81jmscwznqcz'
+        'D3Ae0jzcef7zyOZRz5ObF4o88XmO87KRl5Q81Xmq84Hq//mhnP/syG+B3wK/BX4L/Bb4LfBbUM4F'
+        'jAsYFzAuYFzAuIBxAeMCxgWMCxgXMC5gXMC4gHEB4wLGBYwLGBcwLmBcwLiAcQHjAsYFjAsYFzAu'
+        'YFzAuIBxAeMCxgWMCxgXMC5gXMC4gHEB4wLGBYwLGBcwLmBcwLiAcQHjAsYFjAsYFzAuYFzAuIBx'
+        'AeMCxgWMCxgXMC5gXMC4gHEB4wLGBYwLGBcwLmBcwLiAcQHjAsYFjAvgFuAscFhArgBggd8CsQW2'
+        'C6gWpKAgBQX8C9wXSC8gXoC6gHEB40LAePeB8TeNGBcxLmJcxLiIcRHjIsZFjIsYFzEuYlzEuIhx'
+        'EeMixkWMixgXMS5iXMS4iHER4yLGRYyLGBcxLmJcxLiIcRHjIsZFjIsYFzEuYlzEuIhxEeMixkWM'
+        'ixgXMS5iXMS4iHER4yLGRYyLGBcxLmJcxLiIcRHjIsZFjIsYFzEuYlzEuIhxEeMixkWMixgXMS5i'
+        'XMS4iHER4yLGRYyLGBcxLmJcxLiIcRHjIsZFjIsYFzEuYlzEuIhxEeMixkWMixgXMS5iXMS4iHER'
+        '4yLGRYyLGBcxLmJcDBj/Lw+Mr0eMSxiXMC5hXMK4hHEJ4xLGJYxLGJcwLmFcwriEcQnjEsYljEsY'
+        'lzAuYVzCuIRxCeMSxiWMSxiXMC5hXMK4hHEJ4xLGJYxLGJcwLmFcwriEcQnjEsYljEsYlzAuYVzC'
+        'uIRxCeMSxiWMSxiXMC5hXMK4hHEJ4xLGJYxLGJcwLmFcwriEcQnjEsYljEsYlzAuYVzCuIRxCeMS'
+        'xiWMSxiXMC5hXMK4hHEJ4xLGJYxLGJcwLmFcwriEcQnjEsYljEsYlzAuYVzCuIRxCeMSxiWMSxiX'
+        'MC4FjPceGD9v9DbhCxgvYLyA8QLGCxgvYLzA7wK/C/wu8LsA7gK4C+AugLsA7gK4C+AugLsA7gKx'
+        'C8QuELtA7AKxC8QuELtA7AKxC8QuELtA7AKqC6guoLqA6gKqC6guoLqA6gKqC6guoLqA6gKqC6gu'
+        'oLqA6gKqC6guoLqA6gKqC4wuMLrA6AKjC4wuMLrA6AKjC4wuMLrA6AKjC1QuULlA5QKVC1Qu4LiA'
+        '40Ig4a99ul0UaX3Ou37v23PBk80/8PG+J0Fw7eSPDP/0J+wayf/6kJgfHhV/WWLKElOWmLLElCWm'
+        'LDFliSlLTFliyhJTlpiyxJQlpiwxZYkpS0xZYsoSU5aYssSUJaYsMWWJKUtMWWLKElOWmLLElCWm'
+        'LDFliSlLTFliyhJTlpiyxJQlpiwxZYkpS0xZYsoSU5aYssSUJaYsMWWJKUtMWWLKElOWmLLElCWm'
+        'LDFliSlLTFlUyqJSFpWyqJRFpSwqZVEpi0pZVMqiUhaVsqiURaUsKmWZLAeJ+d/cKBtKeFXQnTfV'
+        'ivqtqNhK8GN//TP3Ga7/ZOyjPcP1R4MDcz38wenhD/7s8KtvDz4w7W888z8UaOOxT8aHAv3N0c3Z'
+        'bwo961nVuZCr2o/5uLlHDqPu1P6tZ/7hWxv7ZBy+vx0cmNcM/wPx4aoQG371D4ZfvSnwOvzqRcOv'
+        '/vjwq6nhV28PXuj0d+5vKrxueEnx7wb/nqvh788Mf/IDw9+ZefTFB4dfvOXRFz8x/OIbHn3x/uEX'
+        '3/zoi2DJ+FejJWPFkrFiyVixZKxYMlYsGSuWjBVLxoolY8WSsWLJWLFkrFgyViwZK5aMFUvGiiVj'
+        'xZKxYslYsWSsWDJWLBkrlowVS8aKJWPFkrFiyVixZKxYMlYsGSuWjBVLxoolY8WSsWLJWLFkrFgy'
+        'ViwZK5aMFUvGiiVjxZKxYslYsWSsWDJWLBkrlowVS8aKJWPFkrFiyVixZKxYMlacD6xYOVasHCtW'
+        'jhUrx4peX7GArFhAViwgKxaQFQvIigVkxQKyYgFZsYCsWEBWLCArFpAVZwAr1pEV68iKM4AVW/gV'
+        'W/gV5wMrdvIrzhFX7PlXLCwrzgdWnDKs2OWvODtYsdlfcR6x4iRhxdZ/xenEipOLFScCK1aplWCV'
+        '+t+ffJvsWcFrefYfdjqlEds1bNewXcN2Dds1bNewXfO/v0bvGr1r9K7Ru+YUdw3iNYjXIF6DeA3i'
+        'NYjXIF6DeA3iNae4ayyvsbzG8hrLayyvsbzG8hrLayyvsbzG8hrLa05x15BeQ3oN6TWk15BeQ3oN'
+        '6TWk15BeQ3oN6TWk15BeQ3oN6TWk15BeQ3oN6TWk15BeQ3oN6TWk15BeQ3oN6TWk15BeQ3oN6TWk'
+        '15BeQ3rNKe6aU9w1wNcAXwN8DfA1wNcAXwN8DfA1wNeQXuN1Dc01CteYXEN6DeI13NfoXZOPNflY'
+        'E4w1UViDf436Nc7XyF4jey2Q/X/cf3ra9wbPbzrQ3dVlf8O6B/l7Yfw+mhrPfuJW0a+N5G+Sv0n+'
+        'Jvmb5G+Sv0n+JvKbyG8iv4n8JuubrG+yvsn6JuubrG+yvsn6JuubkG9Cvgn5JuSbkG9Cvgn5JuSb'
+        'kG9Cvgn5JuSbdG/SvUn3Jt2bdG/SvUn3Jt2bdG/SvUn3Jt2bdG/SvUn3Jt2bdG/SvUn3Jt2bdG/S'
+        'vUn3Jt2bdG/SvUn3Jt2bdG/SvUn3Jt2bdG/SvcnzJs+bPG/yvMnzJs+bPG/yvMnzJpCbQG7Svcnl'
+        'psbbJHiT0k26NwVgk9lN1jfR3ZSKTeQ3Qd4Ujk1R2cR6E+vNgPXfe3JhzwfPa/g/A9kB9a8avlr7'
+        '897znre+e+7d75n66uAs+oeHO5WfDz7gfvi7v2f0u68PfvNDY0/6pTcEv/TXn/xTrwt+KTnc1H7P'
+        'cEfz1if93vTw97Lf8aRfeU3wK3/vSb8yFfz51z/2pF96bfBLr3vyf9j/aHr4TovPG74r8vMf/eP+'
+        'N78m+JcG5wd//yNu6f7mKKc7crojpztyuiOnO3K6I6c7crojpztyuiOnO9pgR1x3xHVHXHfEdUdc'
+        'd8R1R1x3xHVHXHeUyY7U7kjtjtTuSO2O1O5I7Y7U7kjtjtTuSO2O1O5I7Y7W2hHeHeHdEd4d4d0R'
+        '3h3h3RHeHeHdEd4d4d0R3h3h3RHeHeHdEd4d4d0R3h3h3RHeHeHdEd4d4d0R3h3h3RHeHeHdEd4d'
+        '4d0R3h3h3RHeHeHdEd4d4d2xNO0o7h1R3hHlHVHeEeUdUd4R5R1R3hHlHVHeEeUdUd4R5R1R3pHh'
+        'HRnekeEdGd6R4R0Z3pHhHRnekeEdGd6R4R0Z3pHhHRneCTL8Dx52WLWR3za/bX7b/Lb5bfPb5ret'
+        'b9oYtzFuY9zGuI1xG+M2xm2M2xi3MW5j3Ma4jXEb4zbGbYzbGLcxbmPcxriNcRvjNsZtjNsYtzFu'
+        'Y9zGuI1xG+M2xm2M2xi3MW5j3Ma4jXEb4zbGbYzbGLcxbmPcxriNcRvjNsZtjNsYtzFuY9zGuI1x'
+        'G+M2xm2M2xi3MW5j3Ma4jXEb4zbGbYzbGLcxbmPcxriNcRvjNsZtjNsYt8Ftw9nmsI1cG8A2v21i'
+        '22y3UW1LQVsK2vi3uW+T3ka8DXUb4zbG7YDx//XA+A+MGO9ivIvxLsa7GO9ivIvxLsa7GO9ivIvx'
+        'Lsa7GO9ivIvxLsa7GO9ivIvxLsa7GO9ivIvxLsa7GO9ivIvxLsa7GO9ivIvxLsa7GO9ivIvxLsa7'
+        'GO9ivIvxLsa7GO9ivIvxLsa7GO9ivIvxLsa7GO9ivIvxLsa7GO9ivIvxLsa7GO9ivIvxLsa7GO9i'
+        'vIvxLsa7GO9ivIvxLsa7GO9ivIvxLsa7GO9ivIvxLsa7GO9ivIvxLsa7GO9ivIvxLsa7GO9ivIvx'
+        'Lsa7GO9ivIvxLsa7GO9ivIvxLsa7GO9ivIvxbsD4//6ITcW/GWneo3mP5j2a92jeo3mP5j2M9zDe'
+        'w3gP4z2M9zDew3gP4z2M9zDew3gP4z2M9zDew3gP4z2M9zDew3gP4z2M9zDew3gP4z2M9zDew3gP'
+        '4z2M9zDew3gP4z2M9zDew3gP4z2M9zDew3gP4z2M9zDew3gP4z2M9zDew3gP4z2M9zDew3gP4z2M'
+        '9zDew3gP4z2M9zDew3gP4z2M9zDew3gP4z2M9zDew3gP4z2M9zDew3gP4z2M9zjc43AP6j0c94jd'
+        'o3KP5j3g9xjdY3sP1T0p2EN8D9w9YdgTjT2M9zDeCxj/wyedGGTfOTwvOAxewveu0S+VH+23x9/z'
+        'nu/41tq3fft73lv7jtp7vmvxfe+1ic/92PAcwSup3pf7R0+5jPwrw9//c8Pf/0RfUA4u+O4N/82f'
+        'orsZ1b8+eluzPzP8n/jtri6/eviTfzP00W5tHH1ElfzbUZXsq5J9VbKvSvZVyb4q2Vcl+6pkX5Xs'
+        'q5J9VbKvSvZVyb4q2Vcl+6pkX5Xsq5J9VbKvSvZVyb4q2Vcl+6pkX5Xsq5J9VbKvSvZVyb4q2Vcl'
+        '+6pkX5Xsq5J9VbKvSvZVyb4q2Vcl+6pkX5Xsq5J9VbKvSvZVyb4q2Vcl+6pkX5Xsq5J9VbKvSvZV'
+        'yb4q2Vcl+6pkX5Xsq5J9VbKvSvZVyb4q2Vcl+6pkX5Xsq5J9VbKvSvZVyb4q2Vcl+6pkX5Xsq5J9'
+        'VbKvSvZVyb4q2Vcl+6pkX5Xsq5J9VbKvSvZVyb4q2Vcl+6pkX5Xsq5J9VbKvSvZVyb4q2Vcl+6pk'
+        'X5Xsq5L9oEr+8f3GLruL7wG+B/gecHvA7QG3B9wecHvA7QG3B8AeAHsA7AGwB8AeAHsA7AGwB8Ae'
+        'kHpA6gGpB6QekHpA6gGpB6QekHpA6gGpB6QeIHrA5gGpB4geIHqA6AGiB4geIHqA6AGiB4geIHqA'
+        '6AGiB4geIHqA6AGiB4geIHrA5gGbB2wesHkA5QGUB1AeQHkA5QGUB1AeYHiA4QGGBxgeYHjA3wF/'
+        'B8FDf/zMe43M5tPyGpl/8hn7YUXBQZ4frnu/5YE5eVoOTPCGU9/y6P/hGfMuef/Pw9nxe0abgEMt'
+        'eqhFD20CDpXpoTI9VKaHzo4PdeqhTj3UqYc69dBe4FC1HqrWQ9V6qFoPVeuhaj1UrYeq9VC1HtoL'
+        'HGrYQw17qGEPNeyhhj3UsIca9lDDHmrYQw17qGEPNeyhvcChoj3UsIf69lDRHiraQ0V7qGgPFe2h'
+        'oj1UtIeK9lDRHiraQ0V7qGgPFe2hoj1UtIeK9lDRHiraQ3uBQ317qG8P9e2hvj20FzhUu4dq91Dt'
+        'HqrdQ7V7qHYP1e6hvcChvcChEj5UwodK+FAJHyrhQ3uBQ118qIsP7QUOrf6HVvhDi/mhdfvQKn5o'
+        'E3Bo2T+0QTi03h/aShzaShzaQxzaPBzaLhzaJxzaGRzaCxzaCxwGC8I/fWD88hHjI4yPMD7C+Ajj'
+        'I4yPMD7i94jfI36P+D0C9wjcI3CPwD0C9wjcI3CPwD0C94jYI2KPiD0i9ojYI2KPiD0i9ojYI2KP'
+        'iD0i9gjVI1SPUD1C9QjVI1SPUD1C9QjVI1SPUD1C9QjVI1SPUD1C9QjVI1SPUD1C9QjVI0aPGD1i'
+        '9IjRIziP4DyC8wjOIziP4DyC8wjHIxyPcDzC8QjHIw6PODySgqNAwj/7iJObfz0CcQzEMRDHQBwD'
+        'cQzEMRDHQBwDcQzEMRDHCu2Yi2Mujrk45uKYi2Mujrk45uKYi2OFdozHMR7HeBzjcYzHMR7HeBzj'
+        'cYzHMR7HeBzjcazQjik5puSYkmNKjik5puSYkmNKjik5puSYkmNKjik5puSYkmNKjik5puSYkmNK'
+        'jik5VmjHsBzDcgzLMSzHHspjZo6ZOWbmmJljZo6ZOWbmWKEdK7Rjgo4JOibomKBjgo4V2jFIxyAd'
+        'K7RjjXSskY7V27FiOtZdx/rpWK8dq75jbXWs5Y6V1rE+PFZ2xyrsWC0eK8ljhXas0I4Dxv/8odAW'
+        'Rn5P+D3h94TfE35P+D3h98S6fILxCcYnGJ9gfILxCcYnGJ9gfILxCcYnGJ9gfILxCcYnGJ9gfILx'
+        'CcYnGJ9gfILxCcYnGJ9gfILxCcYnGJ9gfILxCcYnGJ9gfILxCcYnGJ9gfILxCcYnGJ9gfILxCcYn'
+        'GJ9gfILxCcYnGJ9gfILxCcYnGJ9gfILxCcYnGJ9gfILxCcYnGJ9gfILxCcYnGJ9gfILxCcYnGJ9g'
+        'fILxCcYnGJ9gfILxCbgncJ5weILcCYAn/J4Qe8L2CaonUnAiBSf4n3B/QvoJ4idQn2B8gvFJwLij'
+        'jYfb4sTo/n62MrxHfvrg+1tGvjt8d/ju8N3hu8N3h+8O3x2+O3x3+O7w3eG7w3eH7w7fHb47fHf4'
+        '7vDd4bvDd4fvDt8dvjt8d/ju8N3hu8N3h+8O3x2+O3x3+O7w3eG7w3eH7w7fHb47fHf47vDd4bvD'
+        'd4fvDt8dvjt8d/ju8N3hu8N3h+8O3x2+O3x3+O7w3eG7w3eH7w7fHb47fHf47vDd4bvDd4fvDt8d'
+        'vjt8d/ju8N3hu8N3h+8O3x2+O3x3+O7w3eG7w3eH7w7fHb47fHf47vDd4bvDd4fvDt8dvjt8d/ju'
+        'BL7PHq5BHVN8RvEZxWcUn1F8RvEZxWf4nuF7hu8ZvmfcnnF7xu0Zt2fcnnF7xu0Zt2fcngF7BuwZ'
+        'sGfAngF7BuwZsGfAngF7BuwZsGfAnpF6RuoZqWeknpF6RuoZqWeknpF6RuoZqWeknpF6RuoZqWek'
+        'npF6RuoZqWeknpF6hugZomeIniF6xuYZm2dsnrF5xuYZm2dsntF4RuMZjWc0ntF4huEZhmdCcBZA'
+        'OP+I9yW7fSx4tvuPPRRdflR0l4hcInKJyCUil4hcInKp6C5JuSTlkpRLUi4V3SUwl8BcAnMJzCUw'
+        'l8BcAnMJzCUwl4rukptLbi65ueTmkptLbi65ueTmkptLbi65ueTmUtFd4nOJzyU+l/hc4nOJzyU+'
+        'l/hc4nOJzyU+l/hc4nOJzyU+l/hc4nOJzyU+l/hc4nOp6C4puqTokqJLii49xpcwXcJ0CdMlTJcw'
+        'XcJ0CdOlortUdJdoXaJ1idYlWpdoXSq6S8IuCbtUdJeK7lLRXSq6S0V3qeguFd2lortUdJeK7lLR'
+        'XSq6S0V3qeguFd2lortUdJeK7lLRXQa+L554W77cIHg23+XTdqExuKY2vK73jLie9i/uX4rxpuFh'
+        '+vGP9zBV3za66ffNw+vGn4yLs+3q3x7ec/1EHrEPVNPD/+uP68D9xENPPmf0Wt+unuzqya6e7OrJ'
+        'rp7s6smuguwqyK6C7CrIrmbsasauZuxqxq5m7GrGrmbsasauZuyqxK5K7KrErkrsqsSuSuyqxK5K'
+        '7KrErkrsqsSuSuzqwq4u7OrCri7s6sKuLuzqwq4u7OrCri7s6sKuLuzqwq4u7OrCri7s6sKuLuzq'
+        'wq4u7OrCrhLsKsGuEuwqwa4S7CrBrhLsKsGuEuwqwa4S7CrBrtrrqr2u2uuqva7a6+q7rr7r6ruu'
+        'wuoqrK726+qtrhWxa9XrKrquMutaxLq6sKsuuxquaxXqKsiuvutaALoatasuu0qwq8G7GryrZrta'
+        'uqt7u3qyqye7QU++//75/Png+fwf+CgF8OiH3jNM98fYltU3jiqhPPxDn8Y18OT8v7/61uH/9cdc'
+        'Az8ZHK+fH9bAvwi2Sz9T/TmP588Fx/fqs2/4/DS84fP9exLXHz0Cn33z589+EsEn8Q2fPxgk/meG'
+        'xdb2GpBH2f8xJ08feji9/pA9wY09wY09wY09wY09wY09wY09wY09wY09wY09wY09wY09wY09wY09'
+        'wY09wY09wY09wY09wY09wY09wY09wY09wY09wY09wY09wY09wY09wY09wY09wY09wY09wY09wY09'
+        'wY09wY09wY09wY09wY09wY09wY09wY09wY09wY09wY09wY09wY09wY09wY09wY09wY09wY09wY09'
+        'wY09wY09wY09wY09wY09wY3NwI3NwI3NwI3NwI3NwI3NwI3NwI3NwI3NwI3NwI3NwI3NwI3NwI3N'
+        'wI1dx01Q+92H3eELR2fRAxIGJAxIGJAwIGFAwoCEAQkDEgYkDEgYkDAgYUDCgIQBCQMSBiQMSBiQ'
+        'MCBhQMKAhAEJAxIGJAxIGJAwIGFAwoCEAQkDEgYkDEgYkDAgYUDCgIQBCQMSBiQMSBiQMCBhQMKA'
+        'hAEJAxIGJAxIGJAwIGFAwoCEAQkDEgYkDEgYkDAgYUDCgIQBCQMSBiQMSBiQMCBhQMKAhEEgofcR'
+        'G6rgqZ9/algdn8rnugTPP1ke/l98Es9B758K+tonv2928JTP5vBXPurW6qdG7wgSGr6b0hPvyfAf'
+        'FW3//oPAfyB4dfVPf2o/EPD5n64fCPgzDz30d0c9dKuHbvXQrR661UO3euhWD93qoVs9dKuHbvXQ'
+        'rR661UO3euhWD93qoVs9dKuHbvXQrR661UO3euhWD93qoVs9dKuHbvXQrR661UO3euhWD93qoVs9'
+        'dKuHbvXQrR661UO3euhWD93qoVs9dKuHbvXQrR661UO3euhWD93qoVs9dKuHbvXQrR661UO3euhW'
+        'D93qoVs9dKuHbvXQrR661UO3euhWD93qoVs9dKuHbvXQrR661UO3euhWD93qodugh372QUJhJOGO'
+        'hDsS7ki4I+GOhDsS7pzF3gFxB8QdEHdA3DnDvePijos7Lu64uOPijos7Lu64uOPizinxHR53eNzh'
+        'cYfHHR53eNzhcYfHHR53eNzhcYfHnTPqO0ruKLmj5I6SO0ruKLmj5I6SO0ruKLmj5I6SO0ruKLmj'
+        '5I6SO0ruKLmj5I6SO0runNbfwXIHyx0sd7DceSjvmLlj5o6ZO2bumLlj5o6ZO1cF7lwVuCPojqA7'
+        'gu4IuiPozhWDO5DuQLpznePOlY07FyruXIW4c23hzgWHO+e+dy5b3LnccedCxZ3LJHcuk9y5PnLn'
+        'Usidqx53rnPcuaRx53rFnesVdwHjn3viemUuFxT/zz+w/osj1o99bsA6GBHjx43nGF9gfKHxPcYX'
+        'GV9sfInxXOMnjHHjecbzjRcYUeOFxouMLzUmjPcbk8aXGTHjxcZLjC83Xmp8hfEy4+XGK4xXGh8w'
+        'vtKIG68yEsarjaTxVUbK+GpjyniNMW281nid8Xpjxvga4w3G1xpvNL7O+EnjTcabjbcYaWPOeKuR'
+        'MWaNtxlvN95hfL1xZXzQeKfxLuMbjKzxjcaHjJzxbqNr9IyfMvrGTxs/Y/ys8XPGzxu/YFwbv2j8'
+        'kvHLxo3xK8bA+FXjw8F4X+4XHhivjhiHMA5hHMI4hHEI4xDGIYxDGIcwDmEcwjiEcQjjEMYhjEMY'
+        'hzAOYRzCOIRxCOMQxiGMQxiHMA5hHMI4hHEI4xDGIYxDGIcwDmEcwjiEcQjjEMYhjEMYhzAOYRzC'
+        'OIRxCOMQxiGMQxiHMA5hHMI4hHEI4xDGIYxDGIcwDmEcwjiEcQjjEMYhjEMYhzAOYRzCOIRxCOMQ'
+        'xiGMQxiHMA5hHMI4hHEI4xDGIYxDGIcwDmEcwjiEcQjjEMYhjEMYhzAOYRzCOIRxCOMQxiGMQxiH'
+        'MA5hHAoYX99/VkBzWM6/+KD6+0eqw1SHqQ5THaY6THWY6jDVYarDVIepDlMdpjpMdZjqMNVhqsNU'
+        'h6kOUx2mOkx1mOow1WGqw1SHqQ5THaY6THWY6jDVYarDVIepDlMdpjpMdZjqMNVhqsNUh6kOUx2m'
+        'Okx1mOow1WGqw1SHqQ5THaY6THWY6jDVYarDVIepDlMdpjpMdZjqMNVhqsNUh6kOUx2mOkx1mOow'
+        '1WGqw1SHqQ5THaY6THWY6jDVYarDVIepDlMdpjpMdZjqMNVhqsNUh6kOUx2mOkx1mOow1WGqw1SH'
+        'qQ4Hqn/p/l7ye4M9xy8/sP59I9YRrCNYR7COYB3BOoJ1BOsI1hGsI1hHsI5gHcE6gnUE6wjWEawj'
+        'WEewjmAdwTqCdQTrCNYRrCNYR7COYB3BOoJ1BOsI1hGsI1hHsI5gHcE6gnUE6wjWEawjWEewjmAd'
+        'wTqCdQTrCNYRrCNYR7COYB3BOoJ1BOsI1hGsI1hHsI5gHcE6gnUE6wjWEawjWEewjmAdwTqCdQTr'
+        'CNYRrCNYR7COYB3BOoJ1BOsI1hGsI1hHsI5gHcE6gnUE6wjWEawjWEewjmAdwTqCdQTrCNYRrCNY'
+        'RwLWNwHjnxu6jg0vxoyeg/7Tw194/vAXfmH41TuGX/WGX6WG72D0Bd+29B3f9a3f/Ufeu/Sd71n6'
+        'ruBVzt3hxZmfGn717OHP9odfff79lfH3j+6KPd9f5/nBf/pXHhL0jaMERSUoKkFRCYpKUFSCohIU'
+        'laCoBEUlKCpBUQmKSlBUgqISFJWgqARFJSgqQVEJikpQVIKiEhSVoKgERSUoKkFRCYpKUFSCohIU'
+        'laCoBEUlKCpBUQmKSlBUgqISFJWgqARFJSgqQVEJikpQVIKiEhSVoKgERSUoKkFRCYpKUFSCohIU'
+        'laCoBEUlKCpBUQmKSlBUgqISFJWgqARFJSgqQVEJikpQVIKiEhSVoKgERSUoKkFRCYpKUFSCohIU'
+        'laCoBEUlKCpBUQmKSlBUgqLIRSUoKkFRCYpKUFSCohIUlaCoBEUlKCpBUQmKSlA0YDwYLgw/Ptzu'
+        'fO9wXfjVQHXw4Z/f9NjoPUqzH8R7Eu9JvCfxnsR7Eu9JvCe5nuR6kutJrieBngR6EuhJoCeBngR6'
+        'EuhJoCeBniR5kuRJkidJniR5kuRJkidJniR5kuRJkidJnkR4EuFJhCcRnkR4EuFJhCcRnkR4EuFJ'
+        'hCcRnkR4EuFJhCcRnkR4EuFJhCcRnkR4kt1JdifZnWR3EtpJaCehnYR2EtpJaCehncR0EtNJTCcx'
+        'ncR0ks9JPielYzIQ8uGHovv9o6KLkRAjIUZCjIQYCTESYoouBkQMiBgQMSBiii7GRYyLGBcxLmJc'
+        'xLiIcRHjIsZFTNHF8IjhEcMjhkcMjxgeMTxieMTwiOERwyOGR0zRxSiJURKjJEZJjJIYJTFKYpTE'
+        'KIlREqMkRkmMkhglMUpilMQoiVESoyRGSYySmKKLwRKDJQZLDJaYhzLGTIyZGDMxZmLMxJiJMRNT'
+        'dDFFFyMoRlCMoBhBMYJiii4GUgykmKKLKbqYoospupiiiym6mKKLKbqYoospupiiiym6mKKLKbqY'
+        'oospupiiiym6mKKLBYz/5RNFl0sGO+B/Nfz+h4bF9+vDb3/tM+JV3MEds5cPNzsf8+2XX/+0PjDB'
+        'X+j9w7/Qo0NU/ZZnu1X3Pw1/4Wm9SfWvH0qyPyrJuJKMK8m4kowrybiSjCvJuJKMK8m4kowrybiS'
+        'jCvJuJKMK8m4kowrybiSjCvJuJKMK8m4kowrybiSjCvJuJKMK8m4kowrybiSjCvJuJKMK8m4kowr'
+        'ybiSjCvJuJKMK8m4kowrybiSjCvJuJKMK8m4kowrybiSjCvJuJKMK8m4kowrybiSjCvJuJKMK8m4'
+        'kowrybiSjCvJuJKMK8m4kowrybiSjCvJuJKMK8m4kowrybiSjCvJuJKMK8m4kowrybiSjCvJuJKM'
+        'K8m4kowrybiSjCvJuJKMK8m4kowrybiSjCvJuJKMK8m4kowrybiSjCvJuJKMK8l4UJK/8cD4ZSPG'
+        'CYwTGCcwTmCcwDiBcYLfBL8JfhP8JsBNgJsANwFuAtwEuAlwE+AmwE0QmyA2QWyC2ASxCWITxCaI'
+        'TRCbIDZBbILYBKoJVBOoJlBNoJpANYFqAtUEqglUE6gmUE2gmkA1gWoC1QSqCVQTqCZQTaCaYDTB'
+        'aILRBKMJOBNwJuBMwJmAMwFnAs4EjgkcEzgmcEzgmOAwwWFCChKBhH/zIOGbRxKSJCRJSJKQJCFJ'
+        'QpKEpEJLApEEIglEEoikQktykeQiyUWSiyQXSS6SXCS5SHKRVGhJPJJ4JPFI4pHEI4lHEo8kHkk8'
+        'kngk8UjikVRoSUqSlCQpSVKSpCRJSZKSJCVJSpKUJClJUpKkJElJkpIkJUlKkpQkKUlSkqQkqdCS'
+        'sCRhScKShCXpoUwyk2QmyUySmSQzSWaSzCQVWlKhJQlKEpQkKElQkqCkQkuClAQpqdCSCi2p0JIK'
+        'LanQkgotqdCSCi2p0JIKLanQkgotqdCSCi2p0JIKLanQkgotqdCSAeN/+8A4N2KcwjiFcQrjFMYp'
+        'jFMYpzBOYZzCOIVxCuMUximMUxinME5hnMI4hXEK4xTGKYxTGKcwTmGcwjiFcQrjFMYpjFMYpzBO'
+        'YZzCOIVxCuMUximMUxinME5hnMI4hXEK4xTGKYxTGKcwTmGcwjiFcQrjFMYpjFMYpzBOYZzCOIVx'
+        'CuMUximMUxinME5hnMI4hXEK4xTGKYxTGKcwTmGcwjiFcQrjFMYpjFMYpzBOYZzCOIVxCuMUximM'
+        'UxinME5hnMI4hXEK4xTGKYxTGKcwTmGcwjiFcSpg/JsPn4z0PwwvS/7i8KuvG341fCZednX4fLJ/'
+        'F/xM8H3+0W8Mfzj7+0c/m40Nf+LfPzzRPxa83ueXq2/wd3yD/5E3BP+x299mx//oP/0tw//0J2q/'
+        '/6l8YdmTNvTV3xy9d/63D/9yT9nd/7+fdudAwVP2XvxxfgjeJ+ys5+6hXcujdk1r17R2TWvXtHZN'
+        'a9e0dk1r17R2TWvXtHZNa9e0dk1r17R2TWvXtHZNa9e0dk1r17R2TWvXtHZNa9e0dk1r17R2TWvX'
+        'tHZNa9e0dk1r17R2TWvXtHZNa9e0dk1r17R2TWvXtHZNa9e0dk1r17R2TWvXtHZNa9e0dk1r17R2'
+        'TWvXtHZNa9e0dk1r17R2TWvXtHZNa9e0dk1r17R2TWvXtHZNa9e0dk1r17R2TWvXtHZNa9e0dk1r'
+        '17R2TWvXtHZNa9e0dk1r17TmSWvXtHZNa9e0dk1r17R2TWvXtHZNa9e0dk1r17R2TWvXtFJLa9e0'
+        'dk1r17R2TQeF9x8eGH/3iHEG4wzGGYwzGGcwzmCcwTiDcQbjDMYZjDMYZzDOYJzBOINxBuMMxhmM'
+        'MxhnMM5gnME4g3EG4wzGGYwzGGcwzmCcwTiDcQbjDMYZjDMYZzDOYJzBOINxBuMMxhmMMxhnMM5g'
+        'nME4g3EG4wzGGYwzGGcwzmCcwTiDcQbjDMYZjDMYZzDOYJzBOINxBuMMxhmMMxhnMM5gnME4g3EG'
+        '4wzGGYwzGGcwzmCcwTiDcQbjDMYZjDMYZzDOYJzBOINxBuMMxhmMMxhnMM5gnME4g3EG4wzGmYDx'
+        'fwxep/fjo6erd4e3b/5g9f1jw9961tjHu4AFF9j+6CfrBdGf8ieXPzZ2/wT9f37/BP0X+NDEsbH7'
+        'WvipUS1k1UJWLWTVQlYtZNVCVi1k1UJWLWTVQlYtZNVCVi1k1UJWLWTVQlYtZNVCVi1k1UJWLWTV'
+        'QlYtZNVCVi1k1UJWLWTVQlYtZNVCVi1k1UJWLWTVQlYtZNVCVi1k1UJWLWTVQlYtZNVCVi1k1UJW'
+        'LWTVQlYtZNVCVi1k1UJWLWTVQlYtZNVCVi1k1UJWLWTVQlYtZNVCVi1k1UJWLWTVQlYtZNVCVi1k'
+        '1UJWLWTVQlYtZNVCVi1k1UJWLWTVQlYtZNVCVi1k1UJWLWTVQlYtZNVCVi1k1UJWLWTVQlYtZNVC'
+        'Vi1k1UJWLWTVQlYtZNVCVi1k1UJWLWSDWgg9MP7BEeMcxjmMcxjnMM5hnMM4h3EO4xzGOYxzGOcw'
+        'zmGcwziHcQ7jHMY5jHMY5zDOYZzDOIdxDuMcxjmMcxjnMM5hnMM4h3EO4xzGOYxzGOcwzmGcwziH'
+        'cQ7jHMY5jHMY5zDOYZzDOIdxDuMcxjmMcxjnMM5hnMM4h3EO4xzGOYxzGOcwzmGcwziHcQ7jHMY5'
+        'jHMY5zDOYZzDOIdxDuMcxjmMcxjnMM5hnMM4h3EO4xzGOYxzGOcwzmGcwziHcQ7jHMY5jHMY5zDO'
+        'YZzDOIdxDuMcxjmMcwHjz3lgnBkxnsN4DuM5jOcwnsN4DuM5fuf4neN3jt85cOfAnQN3Dtw5cOfA'
+        'nQN3Dtw5cOeInSN2jtg5YueInSN2jtg5YueInSN2jtg5YudQnUN1DtU5VOdQnUN1DtU5VOdQnUN1'
+        'DtU5VOdQnUN1DtU5VOdQnUN1DtU5VOdQnWN0jtE5RucYnYNzDs45OOfgnINzDs45OOdwnMNxDsc5'
+        'HOdwnONwjsM5KZgLJDw7kPDh4Zr9g49O1avv+xw7nr8zPG/PVGvDb/9R9Y99zvBnP3ds9CK77F8b'
+        '3uUNPyDqjBDlIcpDlIcoD1EeojxEeYjyEOUhykOUhygPUR6iPER5iPIQ5SHKQ5SHKA9RHqI8RHmI'
+        '8hDlIcpDlIcoD1EeojxEeYjyEOUhykOUhygPUR6iPER5iPIQ5SHKQ5SHKA9RHqI8RHmI8hDlIcpD'
+        'lIcoD1EeojxEeYjyEOUhykOUhygPUR6iPER5iPIQ5SHKQ5SHKA9RHqI8RHmI8gGi3/Mg4b0jCQUS'
+        'CiQUSCiQUCChQELBqlgAogBEAYgCEAWrYoGLAhcFLgpcFLgocFHgosBFgYuCVbGARwGPAh4FPAp4'
+        'FPAo4FHAo4BHAY8CHgU8ClbFAiUFSgqUFCgpUFKgpEBJgZICJQVKCpQUKClQUqCkQEmBkgIlBUoK'
+        'lBQoKVBSsCoWYCnAUoClAEvBQ1lgpsBMgZkCMwVmCswUmClYFQtWxQJBBYIKBBUIKhBUsCoWQCqA'
+        'VLAqFqyKBatiwapYsCoWrIoFq2LBqliwKhasigWrYsGqWLAqFqyKBatiwapYsCoWrIoFq2IhYPx5'
+        '/3kndjuP/W49sfv8h3zPjvJdku+SfJfkuyTfJfkuyXdJsEuCXRLskmCXJLok0SWJLkl0SaJLEl2S'
+        '6JJElyS6JMolUS6JckmUS6JcEuWSKJdEuSTKJVEuiXJJlEsyXJLhkgyXZLgkwyUZLslwSYZLMlyS'
+        '4ZIMl2S4JMMlGS7JcEmGSzJckuGSDJdkuCTDJeEtCW9JeEvCW5LaktSWpLYktSWpLUltSWpLclqS'
+        '05KcluS0JKclAS0JaEk9lIKIRD4iIgH933zsU/zuBZ/yiDxn7Jn6lLfg7seXP3r8PinH5Qvu94yR'
+        '4Z7xCx+aZGLUJGVNUtYkZU1S1iRlTVLWJGVNUtYkZU1S1iRlTVLWJGVNUtYkZU1S1iRlTVLWJGVN'
+        'UtYkZU1S1iRlTVLWJGVNUtYkZU1S1iRlTVLWJGVNUtYkZU1S1iRlTVLWJGVNUtYkZU1S1iRlTVLW'
+        'JGVNUtYkZU1S1iRlTVLWJGVNUtYkZU1S1iRlTVLWJGVNUtYkZU1S1iRlTVLWJGVNUtYkZU1S1iRl'
+        'TVLWJGVNUtYkZU1S1iRlTVIOmuSLHiRkRxIqJFRIqJBQIaFCQoWEij1jBYgKEBUgKkBU7BkrXFS4'
+        'qHBR4aLCRYWLChcVLipcVOwZK3hU8KjgUcGjgkcFjwoeFTwqeFTwqOBRwaNiz1ihpEJJhZIKJRVK'
+        'KpRUKKlQUqGkQkmFkgolFUoqlFQoqVBSoaRCSYWSCiUVSir2jBVYKrBUYKnAUvFQVpipMFNhpsJM'
+        'hZkKMxVmKvaMFXvGCkEVgioEVQiqEFSxZ6yAVAGpYs9YsWes2DNW7Bkr9owVe8aKPWPFnrFiz1ix'
+        'Z6zYM1bsGSv2jBV7xoo9Y8WesWLPWLFnrNgzVgLGXxwwHnb7Px6W3P84vNb9JQ+0nzuiXUW7inYV'
+        '7SraVbSraFeZrjJdZbrKdBXmKsxVmKswV2GuwlyFuQpzFeYqxVWKqxRXKa5SXKW4SnGV4irFVYqr'
+        'FFcpruJbxbeKbxXfKr5VfKv4VvGt4lvFt4pvFd8qvlV8q/hW8a3iW8W3im8V3yq+VW6r3Fa5rXJb'
+        'BbYKbBXYKrBVYKvAVoGtIlpFtIpoFdEqolU2q2xWJaMa6Hjug4SXjCQskrBIwiIJiyQskrBIwiIJ'
+        'iyQskrBIwiIJiyQskrBIwiIJiyQskrBIwiIJiyQskrBIwiIJiyQskrBIwiIJiyQskrBIwiIJiyQs'
+        'krBIwiIJiyQskrBIwiIJiyQskrBIwiIJiyQskrBIwiIJiyQskrBIwiIJiyQskrBIwiIJiyQskrBI'
+        'wiIJiyQskrBIwiIJiyQskrBIwiIJiyQskrBIwiIJi4GE8bEnXjP8V4JXTDzviX1RbiX4/vljT7yi'
+        '4tuD96d+wYOc7khOjZwaOTVyauTUyKmRU7M81gCqAVQDqAZQzfJY46jGUY2jGkc1jmoc1TiqcVTj'
+        'qGZ5rOFUw6mGUw2nGk41nGo41XCq4VTDqYZTDaea5bFGVY2qGlU1qmpU1aiqUVWjqkZVjaoaVTWq'
+        'alTVqKpRVaOqRlWNqhpVNapqVNUsjzW4anDV4KrBVfPQ1xirMVZjrMZYjbEaYzXGapbHmuWxRlyN'
+        'uBpxNeJqxNUsjzXwauDVLI81y2PN8lizPNYsjzXLY83yWLM81iyPNctjzfJYszzWLI81y2PN8liz'
+        'PNYsjzXLY83yWAvYR5+yPD5aGYfr4wvv7f+J4D2GXzT8oernju6118eCK8/PDu61f2nw54Mbya8O'
+        'nmXXrS4H/+KJh3wUR/moy0ddPuryUZePunzU5aMuH3X5qMtHXT7q8lGXj7p81OWjLh91+ajLR10+'
+        '6vJRl4+6fNTloy4fdfmoy0ddPuryUZePunzU5aMuH3X5qMtHXT7q8lGXj7p81OWjLh91+ajLR10+'
+        '6vJRl4+6fNTloy4fdfmoy0ddPuryUZePunzU5aMuH3X5qMtHXT7q8lGXj7p81OWjLh91+ajLR10+'
+        '6vJRl4+6fNTloy4fdfmoy0ddPuryUZePunzU5aMuH3X5qMtHXT7q8lGXj7p81OWjLh91+ajLR10+'
+        '6vJRl4+6fNTloy4fdfmoy0ddPuoB48kHxn9hxLiBcQPjBsYNjBsYNzBuYNzAuIFxA+MGxg2MGxg3'
+        'MG5g3MC4gXED4wbGDYwbGDcwbmDcwLiBcQPjBsYNjBsYNzBuYNzAuIFxA+MGxg2MGxg3MG5g3MC4'
+        'gXED4wbGDYwbGDcwbmDcwLiBcQPjBsYNjBsYNzBuYNzAuIFxA+MGxg2MGxg3MG5g3MC4gXED4wbG'
+        'DYwbGDcwbmDcwLiBcQPjBsYNjBsYNzBuYNzAuIFxA+MGxg2MGxg3MG5g3MC4gXED4wbGDYwbGDcw'
+        'bmDcwLiBcQPjRsD4yx4Y90aMmxg3MW5i3MS4iXET4ybGTYybGDcxbmLcxLiJcRPjJsZNjJsYNzFu'
+        'YtzEuIlxE+Mmxk2Mmxg3MW5i3MS4iXET4ybGTYybGDcxbmLcxLiJcRPjJsZNjJsYNzFuYtzEuIlx'
+        'E+Mmxk2Mmxg3MW5i3MS4iXET4ybGTYybGDcxbmLcxLiJcRPjJsZNjJsYNzFuYtzEuIlxE+Mmxk2M'
+        'mxg3MW5i3MS4iXET4ybGTYybGDcxbmLcxLiJcRPjJsZNjJsYNzFuYtzEuIlxE+Mmxk2Mmxg3MW4G'
+        'jGMPjCdHjFcxXsV4FeNVjFcxXsV4ld9Vflf5XeV3FdxVcFfBXQV3FdxVcFfBXQV3FdxVYleJXSV2'
+        'ldhVYleJXSV2ldhVYleJXSV2ldhVVFdRXUV1FdVVVFdRXUV1FdVVVFdRXUV1FdVVVFdRXUV1FdVV'
+        'VFdRXUV1FdVVVFcZXWV0ldFVRlfhXIVzFc5VOFfhXIVzFc5VHFdxXMVxFcdVHFc5XOVwVQpWAwkv'
+        'fpDw0yMJ6ySsk7BOwjoJ6ySsk7Cu0NaBWAdiHYh1INYV2joX61ysc7HOxToX61ysc7HOxToX6wpt'
+        'HY91PNbxWMdjHY91PNbxWMdjHY91PNbxWMdjXaGtU7JOyTol65SsU7JOyTol65SsU7JOyTol65Ss'
+        'U7JOyTol65SsU7JOyTol65SsU7Ku0NZhWYdlHZZ1WNY9lOvMrDOzzsw6M+vMrDOzzsy6QltXaOsE'
+        'rRO0TtA6QesErSu0dZDWQVpXaOsKbV2hrSu0dYW2rtDWFdq6QltXaOsKbV2hrSu0dYW2rtDWFdq6'
+        'QltXaOsKbV2hrQeMXxIwHt5N+kvDU6vvfGx4+vXlo6f8PLL9xaNzqj8T/PRLH9D/wgh9C/oW9C3o'
+        'W9C3oG9B34K+BX0L+hb0Lehb0Legb0Hfgr4FfQv6FvQt6FvQt6BvQd+CvgV9C/oW9C3oW9C3oG9B'
+        '34K+BX0L+hb0Lehb0Legb0Hfgr4FfQv6FvQt6FvQt6BvQd+CvgV9C/oW9C3oW9C3oG9B34K+BX0L'
+        '+hb0Lehb0Legb0Hfgr4FfQv6FvQt6FvQt6BvQd+CvgV9C/oW9C3oW9C3oG9B34K+BX0L+hb0Lehb'
+        '0Legb0Hfgr4FfQv6FvQt6FvQt6BvQd+CvgV9C/oW9K2A8Vfc33L8J8OrCy974spb9j8Ov335g/4v'
+        'Gun/88Efe8XY79Y3LQnu8L780V/147qD+8qHVvhbo1bY1grbWmFbK2xrhW2tsK0VttXBtjrYVgfb'
+        '6mBbD2zrgW09sK0HtvXAth7Y1gPbemBbD2wrgG0FsK0AthXAtgLYVgDbCmBbAWwrgG0FsK0AhuOH'
+        'njX82KVnBU2wrQK2VcC2CthWAdsqYFsFbKuAbRWwrQK2VcC2CthWAdsqYFsFbKuAbRWwrQK2VcC2'
+        'CthWAdsqYFv2t2V/W/a3ZX9b6LeFflvot4V+W+i3hX5b6LfFfFvMt8V8W8y3xXxbvrfle1u7bAdR'
+        '+cphpGLDFeWlwcXr+P0Fvb8aXLx+1X0C//Lw28R/1vOqsn/6d+vTql49PEzDt4fL/tDwMCXvbwH8'
+        'veAoftWj76vno9fRFoMDnbo/ksHTbj48fNrN7+a3WPqYD+VX34v728PjNDX26fga49z7Q5/qFxm/'
+        'Znic3j08Tn9/eJymf9etecFx/uDwFsJ/1nF67dj9q/t/YvSGpT9q3/KjQQO+buzT/o28XvKYN/J6'
+        'eoG9/okSy/7xIbCZ+9uefzK41fM19zn9G8Nv33BfeeNBv31tcCfoZaM7Qb/x6G9QfcXom38anLu8'
+        'ceyjfhzld/8OPo7y4zr6H65+05DBb/EgBK+cqM5/7sfxWZTt6ncP32vtY3ksgjcT/XPDv+WTH5WP'
+        '+oh83f0xfnVwjN90XwEHw2/fPPbZD6R8+j6QMncz9tlPpPzsJ1J+cj+R8i1P3jhuBXvJ9NhnzDty'
+        'vuyx38k7cr71vh2/IjhQmYez3eePznZPne2eOts9dbZ76mz31NnuqbPdU2e7p852T53tnjrbPXW2'
+        'e+ps99TZ7qmz3VNnu6fOdk+d7Z462z11tnvqbPfU2e6ps91TZ7unznZPne2eOts9dbZ76mz31Nnu'
+        'qbPdU5e7Tp3knjrJPXWSe+ok99RJ7qmT3FMnuadOck+d5J46yT11knvqJPfUSe6pk9xTJ7mnTnJP'
+        'neSeOsk9dZJ76iT31EnuqZPcUye5p05yT53knjrJPXWSe+ok99RJ7qmT3FMnuadOck+d5J46yT11'
+        'knvqJPfUSe6pk9xTJ7mnTnJPgy3e7IOEd4wknJNwTsI5CecknJNwTsI5CecknJNwTsI5CecknJNw'
+        'TsI5CecknJNwTsI5CecknJNwTsI5CecknJNwTsI5CecknJNwTsI5CecknJNwTsI5CecknJNwTsI5'
+        'CecknJNwTsI5CecknJNwTsI5CecknJNwTsI5CecknJNwTsI5CecknJNwTsI5CecknJNwTsI5Ceck'
+        'nJNwTsI5CecknJNwTsI5CeeBhLfdS8j+AxAuQLgA4QKECxAuQLgA4QKECxAuQLgA4QKECxAuQLgA'
+        '4QKECxAuQLgA4QKECxAuQLgA4QKECxAuQLgA4QKECxAuQLgA4QKECxAuQLgA4QKECxAuQLgA4QKE'
+        'CxAuQLgA4QKECxAuQLgA4QKECxAuQLgA4QKECxAuQLgA4QKECxAuQLgA4QKECxAuQLgA4QKECxAu'
+        'QLgA4QKECxAuQLgA4QKEiwDC2++3zqfDteId9yc368HO+uuftkX2Z4f/0W8bbiV/q+U2WAa3hr/7'
+        'aXadRoZ+VYauhOdKeK6E50p4roTnSniuhOdKeK6E50p4roTnSniuhOdKeK6E50p4roTnSniuhOdK'
+        'aq6k5kpqrqTmSmqupOZKaq6k5kpqrqTmSmqupOZKaq6k5kpqrqTmSmqupOZKaq6k5kpqrqTmSmqu'
+        'pOZKaq6k5kpqrqTmSlyuxOVKXK7E5UpcrsTlSlyu5ORKTq7k5EpOruTkSk6u5ORKTq7k5EpOruTk'
+        'Sk6u5OQqyMk7gyAkh0vnS4N7LF9V/ZC/8Yf8jT/kbxyMzzMixmuNzzemjdcYrzM+13i98RxjxvgC'
+        '42uMLzTeYHyt8Ubji4yvM77Y+BLjTcZzjTcbbzHSxluNcSNjzBrPM55vvM14gRE13m680Ph64x3G'
+        'i4wvNb7SeKcxYcSNSePLjJjxYuMlxruMbzC+3HipkTW+wniZ8XIjZ7zC+Ebjlca7jVcZCePVxlww'
+        '3pd718PuKTwm8D0PbM+j3ZP7nsew58HredR67iX3PE49D1DPA9TzyPTcS+55EHoOe89h7znePce7'
+        '50D3HNqeQ9tzMHvuJfcczJ6D2XMwew5mz8HsOXw9h6/nuPUct57j1nPAeo5Uz73knsew51HrOW49'
+        'x63nuPVUQ0819ASlJyg9QelJQU8meoLSk4meMPSkoId/j/se9z3ue8D33Evukd5DvId4D/Geh7JH'
+        'eg/xHuI9qHsY98DtYdxzL7nnXnIP3B6HPQ575PWw6rmX3EOuR1fPveSee8k995J77iX33EvuuZfc'
+        'c022515yz73knnvJPfeSe+4l99xL7rmX3HMvuedecs+95J57yT33knsB428IGI8+CSvQ/Oujc4E+'
+        'zX2a+zT3ae7T3Ke5j3Ef4z7GfYz7GPcx7mPcx7iPcR/jPsZ9jPsY9zHuY9zHuI9xH+M+xn2M+xj3'
+        'Me5j3Me4j3Ef4z7GfYz7GPcx7mPcx7iPcR/jPsZ9jPsY9zHuY9zHuI9xH+M+xn2M+xj3Me5j3Me4'
+        'j3Ef4z7GfYz7GPcx7mPcx7iPcR/jPsZ9jPsY9zHuY9zHuI9xH+M+xn2M+xj3Me5j3Me4j3Gfwz6H'
+        'faj7OPaJ7VPZp7kPfJ/RPtt9VPtS0Ee8D25fGPqi0ce4j3E/YJy9v0H7ruAy/Dc+9VWL/254aT03'
+        'uuXx6If+1BOfVpV720j7Ne3XtF/Tfk37Ne3XtF/Tfk37Ne3XtF9jfo35NebXmF9jfo35NebXmF9j'
+        'fs33Nd/XfF/zfc33Nd/XfF/zfc33Nd/XfF/zfQ32NdjXYF+DfQ32NdjXYF+DfQ32NdjXYF+DfQ32'
+        'NdjXYF+DfQ32NdjXYF+DfQ32NdHXRF8TfU30NcrXKF+jfI3yNcrXKF+jfA3vNbzX8F7Dew3vNbXX'
+        '1F7LzHXg5t33biLBGc7c/QnQPxt++188LPL/cARlAMoAlAEoA1AGoAxAGYAyAGUAygCUASgDUAag'
+        'DEAZgDIAZQDKAJQBKANQBqAMQBmAMgBlAMoAlAEoA1AGoAxAGYAyAGUAygCUASgDUAagDEAZgDIA'
+        'ZQDKAJQBKANQBqAMQBmAMgBlAMoAlAEoA1AGoAxAGYAyAGUAygCUASgDUAagDEAZgDIAZQDKAJQB'
+        'KANQBqAMQBmAMgigfNP9qfC/CApmfvj99wyhvHn47X957+hHgt/+vZ8Rl6M/lrPi4Fz9l4d9G1yO'
+        '/ubhgQpe7hYa7prfm8s/9QV0bwwNq/r3Bb/4DLtT94eG//jnv+U9u6fcrHviDt7Tc6dudH/u0+eW'
+        'XGd03+byUVA+ve/PuclZ+eyduuBOnXvMf/HhZt3o1t3HeM+u8J82YvVfDX/z14Y//ZRurP768Nf/'
+        '9fAfvzH8zd+mIKv/ZviT/3b4kx9jVQYf3VD9d8M/8TEWZvXDI7M/8jE85aT674f/+tvHPsYnPHyU'
+        'z5h46o283z92/2GrH7r/sNWuTcmzwkGCghExftx4jvEFxhcaX2R8sfElxnONceN5xvONFxhR44XG'
+        'i4wvNSaMSePLjJjxYuMlxpcbLzW+wniZ8XLjFcYrja804sarjITxaiNpfJWRMr7amDJeY0wbrzVe'
+        'Z7zemDG+xniD8bXGG42vM95kvNl4i5E23mpkjFnjbcbbjXcYX2+803iX8Q1G1vhGI2e825gLxvty'
+        'xYft6QtG29MxEsZIGCNhjIQxEsZIGCNhjIQxEsZIGCNhjIQxEsZIGCNhjIQxEsZIGCNhjIQxEsZI'
+        'GCNhjIQxEsZIGCNhjIQxEsZIGCNhjIQxEsZIGCNhjIQxEsZIGCNhjIQxEsZIGCNhjIQxEsZIGCNh'
+        'jIQxEsZIGCNhjIQxEsZIGCNhjIQxEsZIGCNhjIQxEsZIGCNhjIQxEsZIGCNhjIQxEsZIGCNhLJDw'
+        'B7wzffWdwYn2EMQLvS19ycb0UVX0gu3WH/yEbUyDjd2PDZvod8UTbBeeeK5y7jjYwb8nOFBj1d7w'
+        'WW/PG/7j+cO3Cv7u6nM/J7jq8YLPCS7hBuOXjZ80PmRcGR80PmD8hPH+YLwv9y1P62lC8Ii9cnjb'
+        '7FPwaLSe/fb5+bn5x4f/D4n/9Pl9v+2j861PeZ1X9npI+w89tN+zRu03rv3Gtd+49hvXfuPab1z7'
+        'jWu/ce03rv3Gtd+49hvXfuPab1z7jWu/ce03rv3Gtd+49hvXfuPab1z7jWu/ce03rv3Gtd+49hvX'
+        'fuPab1z7jWu/ce03rv3Gtd+49hvXfuPab1z7jWu/ce03rv3Gtd+49hvXfuPab1z7jWu/ce03rv3G'
+        'td+49hvXfuPab1z7jWu/ce03rv3Gtd+49hvXfuPab1z7jWu/ce03rv3Gtd+49hvXfuPab1z7jWu/'
+        '8aD9vm2Y3ZcHV/+C5ziV708yx5xk/ldPS86CfP3ssBGfMa1XecjQi0cZmpChCRmakKEJGZqQoQkZ'
+        'mpChCRmakKEJGZqQoQkZmpChCRmakKEJGZqQoQkZmpChCRmakKEJGZqQoQkZmpChCRmakKEJGZqQ'
+        'oQkZmpChCRmakKEJGZqQoQkZmpChCRmakKEJGZqQoQkZmpChCRmakKEJGZqQoQkZmpChCRmakKEJ'
+        'GZqQoQkZmpChCRmakKEJGZqQoQkZmpChCRmakKEJGZqQoQkZmpChCRmakKEJGZqQoYkgQ3/4/grW'
+        'UrD+fftnzhMqT35HH3H+Rz5zDswfDv1ODkz1GXFggr/Yc4Z/saetZP/ow8dGff/wIyg+HHI1oXP/'
+        'GVL/4bFgs7748Dy8Hx19LLwyjivjuDKOK+O4Mo4r47gyjivjuDKOK+O4Mo4r47gyjivjuDKOK+O4'
+        'Mo4r47gyjivjuDKOK+O4Mo4r47gyjivjuDKOK+O4Mo4r47gyjivjuDKOK+O4Mo4r47gyjivjuDKO'
+        'K+O4Mo4r47gyjivjuDKOK+O4Mo4r47gyjivjuDKOK+O4Mo4r47gyjivjuDKOK+O4Mo4r47gyjivj'
+        'uDKOK+O4Mo4r47gyjivjuDKOK+O4Mo4HZfwdD8ty4olPVichQUKChAQJCRISJCRISJCQICFBQoKE'
+        'BAkJEhIkJEhIkJAgIUFCgoQECQkSEiQkSEiQkCAhQUKChAQJCRISJCRISJCQICFBQoKEBAkJEhIk'
+        'JEhIkJAgIUFCgoQECQkSEiQkSEiQkCAhQUKChAQJCRISJCRISJCQICFBQoKEBAkJEhIkJEhIkJAg'
+        'IUFCgoQECQkSEiQkSEgEEr7z/uVmPzBclZceYLz0iU+oBiMFRgqMFBgpMFJgpMBIgZECIwVGCowU'
+        'GCkwUmCkwEiBkQIjBUYKjBQYKTBSYKTASIGRAiMFRgqMFBgpMFJgpMBIgZECIwVGCowUGCkwUmCk'
+        'wEiBkQIjBUYKjBQYKTBSYKTASIGRAiMFRgqMFBgpMFJgpMBIgZECIwVGCowUGCkwUmCkwEiBkQIj'
+        'BUYKjBQYKTBSYKTASAUwvutBwodHEqZImCJhioQpEqZImCJhioQpEqZImCJhioQpEqZImCJhioQp'
+        'EqZImCJhioQpEqZImCJhioQpEqZImCJhioQpEqZImCJhioQpEqZImCJhioQpEqZImCJhioQpEqZI'
+        'mCJhioQpEqZImCJhioQpEqZImCJhioQpEqZImCJhioQpEqY8TlNATAExBcQUEFNATAExBcQUEFNA'
+        'TAExBcQUEFNATAERjK5xbfyi0TN+yfge4yeMnzd+2Xi/8bPGTxk3xgeMnzN+xfhJo2/8gjEwrowP'
+        'Gj9jfMj4aeNXjQ8H4325//qB8atGjKcxnsZ4GuNpjKcxnsZ4GuNpjKcxnsZ4GuNpjKcxnsZ4GuNp'
+        'jKcxnsZ4GuNpjKcxnsZ4GuNpjKcxnsZ4GuNpjKcxnsZ4GuNpjKcxnsZ4GuNpjKcxnsZ4GuNpjKcx'
+        'nsZ4GuNpjKcxnsZ4GuNpjKcxnsZ4GuNpjKcxnsZ4GuNpjKf5neZ3mt9pfqf5neZ3mt9pfqf5neZ3'
+        'mt9pfqf5neZ3WlCmAwnf/fD0rN83fF30b3PN9Xd6sfWRONdc3xv8d66qy88OfvJ7n+2tVp8d/IHv'
+        'e7Y3An32E8+G/JcjlDNQzkA5A+UMlDNQzkA5A+UMlDNQzkA5A+UMlDNQzkA5A+UMlDNQzkA5A+UM'
+        'lDNQzkA5A+UMlDNQzkA5A+UMlDNQzkA5A+UMlDNQzkA5A+UMlDNQzkA5A+UMlDNQzkA5A+UMlDNQ'
+        'zkA5A+UMlDNQzkA5A+UMlDNqZobNGTZn2Jxhc4acGURnEJ1BdAbRGURnEJ1BdAbRGURnEJ1BdAbR'
+        'GZ01Q+oMqTOadkbTzmjaGU07o2lnNO2Mip1RsTO6dUa3zujWGaU6o1RntOmMNp3RpjP6c0ZxzijO'
+        'GcU5E8Sl9sQz1XKPB9c833d//eaHg+s333P/fSf4/T/28JKFl49esvAWj+RbPJJv8UgG4/OMiPFa'
+        '4/ONaeM1xuuMzzVebzzHmDG+wPga4wuNNxhfa7zR+CLj64wvNr7EeJPxXOPNxluMtPFWY9zIGLPG'
+        '84znG28zXmBEjbcbLzS+3niH8SLjS42vNN5pTBivMiaNLzNixouNlxjvMr7B+HLjpUbW+ArjZcbL'
+        'jZzxCuMbjVca7zbiRsJ4dTDel/vj9xZ+NbDwJx4W3ReN+m3WIzzrYZ/Vb7MezFmP4qyHb9YjNesh'
+        'mvUQzXpsZh3/WUd81hGfdahnHepZx3jWUZ11VGcdx1kHcNYBnHUAZx3AWQdw1iGbdchmHatZx2rW'
+        'sZp1kGYdnVkP2KyjM+uRmnWQZh2kWf02q99mpWJWKmalYhb5WQGYlYpZAZglfxb5WdZnIZ+FfBby'
+        'WbpneZ4FeRbkWZBnQZ4leJbgWWZnKZ3lcpbSWRJnwZoFaxalWU5m4ZnlZFZ1zgYy/uT9q8O/M3j+'
+        '65+6vwtaDaQs37fMZPD9945eLvDY2KPFeWz0lg9vDp6zV3fT5dH3F8GPft/9O6Gkht82gj/5i8Pv'
+        'f/KRuOvhF4Phn1t5Rl9PDS4nfvPwns8n/LJh8/7W/U8FN7G+/xl3oIKD8+7hwfmkXl9dva+3XLD0'
+        'rY2eDHE1fCLW+0dP3eoPL7YGHwP8rQHX9YenU60Orwb/reA5icFv/en75/q+Ifj3bdzL/qVA9uY9'
+        '5dwbHhtZzr09ePueP3OP/vcOf/IHPuOeBhw85KvDo/JRH7LWfe98V3BItx6ufA8sSEsWpCUL0pIF'
+        'acmCtGRBWrIgLVmQlixISxakJQvSkgVpyYK0ZEFasiAtWZCWLEhLFqQlC9KSBWnJgrRkQVqyIC1Z'
+        'kJYsSEsWpCUL0pIFacmCtGRBWrIgLVmQlixISxakJQvSkgVpyYK0ZEFasiAtWZCWLEhLFqQlC9KS'
+        'BWnJgrRkQVqyIC1ZkJYsSEsWpCUL0pIFacmCtGRBWrIgLVmQlixISxakJQvSkgVpyYK0ZEFasiAt'
+        'WZCWLEhLFqQlC9KSBWnJgrRkQVqyIC1ZkJaCBem/uYfxDwMYf/Y+238lyOIPfvbdnJ6Gd3P6hDxb'
+        '/Il3hPqS4T2vz76b02ffzen/55nhf86Fn+rff+zhU52+5ykfQvWh3+pzoz7wlI/4ev9TP5bpzz/x'
+        '8pzcHw5q5L995m8y/+QnZZP5+MPC+wEL77KFd9nCu2zFXbbiLltxl624y1bcZSvushV32Yq7bMVd'
+        'tuIuW3GXrbjLVtxlK+6yFXfZirtsxV224i5bcZetuMtW3GUr7rIVd9mKu2zFXbbiLltxl624y1bc'
+        'ZSvushV32Yq7bMVdtuIuW3GXrbjLVtxlK+6yFXfZirtsxV224i5bcZetuMtW3GUr7rIVd9mKu2zF'
+        'XbbiLltxl624y1bcZSvushV32Yq7bMVdtuIuW3GXrbjLVtxlK+6yFXfZirtsxV224i5bcZetuMvB'
+        'ivtDz+gPds796GOfrE923n64SvLKJz66SjYastGwKW2ISENEGiLSEJGGiDREpCEiDRFpiEhDRBoi'
+        '0hCRhog0RKQhIg0RaYhIQ0QaItIQkYaINESkISINEWmISENEGiLSEJGGiDREpCEiDRFpiEhDRBoi'
+        '0hCRhog0RKQhIg0RaYhIQ0QaItIQkYaINESkISINEWmISENEGiLSEJGGiDREpCEiDRFpiEhDRBoi'
+        '0hCRhog0RKQhIg0RaYhIQ0QaItIQkUYQkb9wf0KYDDahf/Epn+e38eTP8/vh+zfj/7XhT/53D4Ze'
+        'MTK0wdAGQxsMbTC0wdAGQxsMbTC0wdAGQxsMbTC0wdAGQxsMbTC0wdAGQxsMbTC0wdAGQxsMbTC0'
+        'wdAGQxsMbTC0wdAGQxsMbTC0wdAGQxsMbTC0wdAGQxsMbTC0wdAGQxsMbTC0wdAGQxsMbTC0wdAG'
+        'QxsMbTC0wdAGQxsMbTC0wdAGQxsMbTC0wdAGQxsMbTC0wdAGQxsMbTC0wdAGQxsMbQSG/vv7iwjv'
+        'CAz9yMPtrm8KPfFuBG8fGdliZIuRLUa2GNliZIuRLUa2GNliZIuRLUa2GNliZIuRLUa2GNliZIuR'
+        'LUa2GNliZIuRLUa2GNliZIuRLUa2GNliZIuRLUa2GNliZIuRLUa2GNliZIuRLUa2GNliZIuRLUa2'
+        'GNliZIuRLUa2GNliZIuRLUa2GNliZIuRLUa2GNliZIuRLUa2GNliZIuRLUa2GNliZIuRLUa2GNli'
+        'ZIuRLUa2AiN/6f5q6/cHRv7yU94t+n1PfrfoQnC56a881MuPjOg8js7j6DyOzuPoPI7O4+g8js7j'
+        '6DyOzuPoPI7O4+g8js7j6Px/7N17QOz5XR/8ZkcjMQmb7LCEXCaEEBI2JGSXndyWS9jZbBJydnbF'
+        'TUvp08oTNSWOFjVmUystRaVWxyliRaQXWyQDGZF4maCdUIsgSKeIFFpjEiWcxMuIyWBqwYK2PPTM'
+        '7zUH1qdJc9vsnt2Df/jZs2cv2eH1/nw+3+/cxtEZR2ccnXF0xtEZR2ccnXF0xtEZR2ccnXF0xtEZ'
+        'R2ccnXF0xtEZR2ccnXF0xtEZR2ccnXF0xtEZR2ccnXF0xtEZR2ccnXF0xtEZR2ccnXF0xtEZR2cc'
+        'nXF0xtEZR2ccnXF0xtEZR2ccnXF0xtEZR2ccnXF0xtEZR2ccnXF0xtEZD+hMXUjIXv8SExImSJgg'
+        'YYKECRImSJggYYKECRImSJggYYKECRImSJggYYKECRImSJggYYKECRImSJggYYKECRImSJggYYKE'
+        'CRImSJggYYKECRImSJggYYKECRImSJggYYKECRImSJggYYKECRImSJggYYKECRImSJggYYKECRIm'
+        'SJggYYKECRImSJggYYKECRImSJggYYKECRImSJggYYKECRImSJggYSKQ8DMXEhbKEiZJmCRhkoRJ'
+        'EiZJmCRhkoRJEiZJmCRhkoRJEiZJmCRhkoRJEiZJmCRhkoRJEiZJmCRhkoRJEiZJmCRhkoRJEiZJ'
+        'mCRhkoRJEiZJmCRhkoRJEiZJmCRhkoRJEiZJmCRhkoRJEiZJmCRhkoRJEiZJmCRhkoRJEiZJmCRh'
+        'koRJEiZJmCRhkoRJEiZJmCRhkoRJEiZJmCRhkoRJEiZJmCRhkoTJQMJ0ICH4KM1bQ9efp3hb8BTH'
+        '+5+MH7BxM12eXt6XftXvS4MnET54Q96cvvuOUlT/Ueni/Iu7Q01/Zd9A9e6v4jdQFUv/gm//q98L'
+        'lPgFa+yVv/9EfIXLzPmLHB4IXvQwezExf6E8MWdMzBkTc8bEnDExZ0zMGRNzxsScMTFnTMwZE3PG'
+        'xJwxMWdMzBkTc8bEnDExZ0zMGRNzxsScMTFnTMwZE3PGxJwxMWdMzBkTc8bEnDExZ0zMGRNzxsSc'
+        'MTFnTMwZE3PGxJwxMWdMzBkTc8bEnDExZ0zMGRNzxsScMTFnTMwZE3PGxJwxMWdMzBkTc8bEnDEx'
+        'Z0zMGRNzxsScMTFnTMwZE3PGxJwxMWdMzBkTc8bEnDExZ0zMGRNzxsScMTFnTMwZE3PGxJwJJuYH'
+        'Lt6plT//iMClsokMExkmMkxkmMgwkWEiw0SGiQwTGSYyTGSYyDCRYSLDRIaJDBMZJjJMZJjIMJFh'
+        'IsNEhokMExkmMkxkmMgwkWEiw0SGiQwTGSYyTGSYyDCRYSLDRIaJDBMZJjJMZJjIMJFhIsNEhokM'
+        'ExkmMkxkmMgwkWEiw0SGiQwTGSYyTGSYyDCRYSLDRIaJDBMZJjJMZJjIMJFhIsNEJjCRuegObypL'
+        'mCNhjoQ5EuZImCNhjoQ5EuZImCNhjoQ5EuZImCNhjoQ5EuZImCNhjoQ5EuZImCNhjoQ5EuZImCNh'
+        'joQ5EuZImCNhjoQ5EuZImCNhjoQ5EuZImCNhjoQ5EuZImCNhjoQ5EuZImCNhjoQ5EuZImCNhjoQ5'
+        'EuZImCNhjoQ5EuZImCNhjoQ5EuZImCNhjoQ5EuZImCNhjoQ5EuZImCNhjoQ5EuYCCT97/lqEjwZP'
+        'Ks6d//qPg1//3FN2qb5ZP6vuxlygfdLgt9yEH1RnL+4r7cWPw0fWzQd5Dt6g3VL+JuWsV/Bng37w'
+        'wdLvp8J9fe/6ju95V983f8d3fsu3933Pe9/5nr6W4FNuPlR6Xih4KdPzrv0PTn39xV8V/PavlD7/'
+        'sOFrXee+4/pTAFc+ZcQsGjGLRsyi2bJotiyaLYtmy6LZsmi2LJoti2bLotmyaLYsmi2LZsui2bJo'
+        'tiyaLYtmy6LZsmi2LJoti2bLotmyaLYsmi2LZsui2bJotiyaLYtmy6LZsmi2LJoti2bLotmyaLYs'
+        'mi2LZsui2bJotiyaLYtmy6LZsmi2LJoti2bLotmyaLYsmi2LZsui2bJotiyaLYtmy6LZsmi2LJot'
+        'i2bLotmyaLYsmi2LZsui2bJotiyaLYtmy6LZsmi2LJoti2bLYmDp589nyYeDWfILF1tHZ3nrWEJi'
+        'CYklW8cSGUtkLJGxRMYSGUtkLJGxRMYSGUtkLJGxRMYSGUtkLJGxRMYSGUtkLJGxRMYSGUtkLJGx'
+        'RMYSGUtkLJGxRMYSGUtkLJGxRMYSGUtkLJGxRMYSGUtkLJGxRMYSGUtkLJGxRMYSGUtkLJGxRMYS'
+        'GUtkLJGxRMYSGUtkLJGxRMYSGUtkLJGxRMYSGUtkLJGxRMYSGUtkLJGxRMZSIOMXL84kP3V+JvnV'
+        'sokVJlaYWGFihYkVJlaYWGFihYkVJlaYWGFihYkVJlaYWGFihYkVJlaYWGFihYkVJlaYWGFihYkV'
+        'JlaYWGFihYkVJlaYWGFihYkVJlaYWGFihYkVJlaYWGFihYkVJlaYWGFihYkVJlaYWGFihYkVJlaY'
+        'WGFihYkVJlaYWGFihYkVJlaYWGFihYkVJlaYWGFihYkVJlaYWGFihYkVJlaYWGFiJTDxSxfdIVz+'
+        '8pFVElZJWCVhlYRVElZJWCVhlYRVElZJWCVhlYRVElZJWCVhlYRVElZJWCVhlYRVElZJWCVhlYRV'
+        'ElZJWCVhlYRVElZJWCVhlYRVElZJWCVhlYRVElZJWCVhlYRVElZJWCVhlYRVElZJWCVhlYRVElZJ'
+        'WCVhlYRVElZJWCVhlYRVP6dVIFaBWAViFYhVIFaBWAViFYhVIFaBWAViFYhVIFaBWA0kZAMJpTu2'
+        '+LeWukPwroQfPX9XwnTwNPGHgr8oWEV+7GmP2jo2bin97sLFSwD/kqVNljZZ2oRoE6JNiDYh2oRo'
+        'E6JNiDYh2oRoE6JNiDYh2oRoE6JNiDYh2oRoE6JNiDYh2oRoE6JNiDYh2oRoE6JNiDYh2oRoE6JN'
+        'iDYh2oRoE6JNiDYh2oRoE6JNiDYh2oRoE6JNiDYh2oRoE6JNiDYh2oRoE6JNiDYh2oRok55Nejbp'
+        '2aRnk55Nejbp2aRnk55Nejbp2aRnk55NejYx3QwQ/fJFO7mt3E62ENhCYEs72SJhi4QtErZI2CJh'
+        'i4QtErZI2CJhi4QtErZI2CJhi4QtErZI2CJhi4QtErZI2CJhi4QtErZI2CJhi4QtErZI2CJhi4Qt'
+        'ErZI2CJhi4QtErZI2CJhi4QtErZI2CJhi4QtErZI2CJhi4QtErZI2CJhi4QtErZI2CJhy89pC4gt'
+        'ILaA2AJiC4gtILaA2AJiC4gtILaA2AJiC4gtILYCCb9y0Qs+Wf5KUBC2QdgmYJuAbQK2CdgmYJuA'
+        'bQK2CdgmYJuAbQK2CdgmYJuAbQK2CdgmYJuAbQK2CdgmYJuAbQK2CdgmYJuAbQK2CdgmYJuAbQK2'
+        'CdgmYJuAbQK2CdgmYJuAbQK2CdgmYJuAbQK2CdgmYJuAbQK2CdgmYJuAbQK2CdgmYNuPftuPftuP'
+        'ftuPftuPftuPftuPftuPftuPftuPftuPftuPftuPftuPfpux7UDAv3vCXg4cvJz390uj64b8qMzc'
+        'tQcm9cwH/3o8dv839r2j9xvuD07xLcELtT786C+k/lfBAW7x/I1MU8GTTP/+/ID3DcHv/+rlM/BP'
+        '/Wfgg/uqK0+/0b/o4vKp+K/4TUz/4fwl4gNBR1gK4h3s4G8qtbTSq3Cu3Fdat3/t4t3Dv3y+p39T'
+        '6Y+CLf63g419+fwp6vqge6w8sV35L27Yrvzrl230qdxGg/v+95Yuxy9f0nRT9NHVL9joHqsGV2pu'
+        'IyVei09kc/u8jW3tpvnoiA8k/kPp89muPyLBe2S+KfSFPkHiNy4/CODytayXjf+r+bT79Q9weHrp'
+        'zvhx6P3rF9eQ7eXnt47cPh25fTpyDXnkEurIJdSRS6gjl1BHLqGOXEIduYQ6cgl15BLqyCXUkUuo'
+        'I5dQRy6hjlxCHbmEOnIJdeQS6sgl1JFLqCOXUEcuoY5cQh25hDpyCXXkEurIJdSRS6gjl1BHLqGO'
+        'XEIduYQ6cgl15BLqyCXUkUuoI5dQRy6hjlxCHbmEOnIJdeQS6sgl1JFLqCOXUEcuoY5cQh25hDpy'
+        'CXXkEurIJdSRS6gjl1BHLqGOXEIduYQ6cgl15BLqyCXUkUuoI5dQRy6hjlxCHbmEOnIJdeQS6sgl'
+        '1JFLqCOXUEfBJdR/LB1//iR4YURwmspfyHhNWcYJGSdknJBxQsYJGSdknJBxQsYJGSdknJBxQsYJ'
+        'GSdknJBxQsYJGSdknJBxQsYJGSdknJBxQsYJGSdknJBxQsYJGSdknJBxQsYJGSdknJBxQsYJGSdk'
+        'nJBxQsYJGSdknJBxQsYJGSdknJBxQsYJGSdknJBxQsYJGSdknJBxQsYJGSdknJBxQsYJGSdknJBx'
+        'QsYJGSdknJBxQsYJGSdknJBxEsj4T+W3zV6T8KLgqYpPJ/7SZ3P+pZfm/GXwl22cH8fzwfn5Ny+3'
+        'hctt4XJbeDy2hV+/5fHZFjbPL9R/Poj4b5U/9e/oa69/BeKpb1XZumgZkXLL+JqKoGUE5TNBeST+'
+        'ny9u7BKh8o1d/P3Bu+W2L8bPXeXx84yKwFZQnql8RHmW8mylUrlVeY7yXOU2JaxUKbcr1crzlBrl'
+        '+coLlBcqL1IiyouVWuUlSp3yUqVeeZnSoLxceYXSqNyhvFJpUl6lvFppVl6j3KncpbQodytR5bXK'
+        '65TXK29Q3qjco7QqbUq70qG8SelU7lViyn3Km5X7lbcob1XepnQpb1euKA8oceVB5aGgPBLfuXyJ'
+        '9+VLvG+el3h7/qrxWkN/an4p+X8J4vynwfMst1x/beX7yy2+Uouv1OIrtfhKLb5Si6/U4iu1+Eot'
+        'vlKLr9TiK7X4Si2+Uouv1OIrtfhKLb5Si6/U4iu1+EotvlKLr9TiK7X4Si2+Uouv1OIrtfhKLb5S'
+        'i6/U4iu1+EotvlKLr9TiK7X4Si2+Uouv1OIrtfhKLb5Si6/U4iu1+EotvlKLr9TiK7X4Si2+Uouv'
+        '1OIrtfhKLb5Si6/U4iu1+EotvlKLr9TiK7X4Si2+Uouv1OIrtfhKLb5Si6/U4iu1+EotvlKLr9Ti'
+        'K7X4yqDF/9fP2eKDJyK+tbQXXDb7y2Z/+X6eJ0+P/+3zF+I0B3dJHym/nr703XrBceAziaqK4Ms6'
+        'gvLZoDwS/53LG4OvuCGcnwm/v/QU2+X1weX1wRP63PJHL47xyfKOV2PHq7Hj1djxaux4NXa8Gjte'
+        'UN6n3Ko8R3mucpvyO0pYqVJuV6qV5yk1yvOVFygvVD6qvEiJKC9WapWXKHXKS5V65WVKg/Jy5RXK'
+        'x5RG5Q7llUqT8irl1Uqz8hrlTuUupUW5W4kqr1Vep7xeeYPyRuUepVVpUz6utCsdypuUTuUh5V4l'
+        'ptynvFm5X3mL8lbld5XfU96mdClvV64oDyi7Slx5UPmEsqdcVT6pfEr5feUPlD9U/kgpKH+s7Ct/'
+        'onxa+YxSVA6UP1U+G5RH4h97yr8yIHjN2UZp2f6SXgv28cuRfXnJf1NO6fKedeU9N+5NzZc1sX/3'
+        'Ud+cfv7e11x5dtea3bVmd63ZXWt215rdtWZ3raFda2jXGtq1hnataV1rWtea1rWmda1pXWta15rW'
+        'taZ1rWlda0zXGtO1xnStMV1rTNca07XGdK0xXWtM1xrTtcZ0rTFdaz7Xms+15nOt+VxrPteaz7Xm'
+        'c635XGs+15rPteZzrflcaz7Xms+15nOt+VxrPteaz7Xmc635XGs+1xrMtQZzrcFcazDXmsi1JnKt'
+        'iVxrIteayLUmcq2JXGsG15rBtWZwrRlcawbXGr61hm+t0V8bjL/fu9jimssS6kioI6GOhDoS6kio'
+        'I6GOhDoS6kioI6GOhDoS6kioI6GOhDoS6kioI6GOhDoS6kioI6GOhDoS6kioI6GOhDoS6kioI6GO'
+        'hDoS6kioI6GOhDoS6kioI6GOhDoS6kioI6GOhDoS6kioI6GOhDoS6kioI6GOhDoS6kioI6GOhDoS'
+        '6kioI6GOhDoS6kioI6GOhDoS6kioI6GOhDoS6kioI6GOhLpAwu7N8xLJUnPfu2b9i9qDPvEFHpdr'
+        '/6zYtX/WY/lC2hvu5bN7Fzf7d57f7M+U+0WjftGoXzTqF436RaN+0ahfNOoXjfpFo37RqF806heN'
+        '+kWjftGoXzTqF436RaN+0ahfNOoXjfpFo37RqF806heN+kWjftGoXzTqF436RaN+0ahfNOoXjfpF'
+        'o37RqF806heN+kWjftGoXzTqF436RaN+0ahfNOoXjfpFo37RqF806heN+kWjftGoXzTqF436RaN+'
+        '0ahfNOoXjfpFo37RqF806heN+kWjftGoXzTqF436RaN+0ahfNOoXjfpFo37RqF806heNQb+4evF5'
+        'uMPn77xpCt5v88ngt4KvB/y5pwWf9NMXKv0tnzp/kcE/Dy4Pf//itQQvLL+W4C4nw7sc3+4K/k1/'
+        'cPFluy8rf9nu3R7puz3Sd3ukg/IM5ZlKVPl65W6lRXmt8nTldcqzlNcrz1beoFQqb1TuUVqVW5U2'
+        '5TnKc5V25TalQ3mT0qncq4SVmHKfUqXcrrxZqVaep9yv1ChvVd6iPF95gdKovE15ofJK5UVKRHmx'
+        'Uqu8ROlS3q7UKS9Vrij1ysuUBiWuvFx5QHmF8qByh9KkvCooj8T/8IaYSsEROlvqfDfMW7X+qJSl'
+        '4Gs2B4MsFc5//arg13988d7zn9OnWyWhVTxaaW/FvJXvVpRbGW5luBXeVkBbkWxFspXFVhZbIWzF'
+        'rhW7VtBaCWslrJWwVsJaCWtlqpWpVphaYWqFqZWiVnxaiW5luJWiVopaKWrVoFs16FZto1XbaNU2'
+        'WvWEVh2iVdto1SFatYZWPaFVM2jVBVp1gVZdoFX8WwW+VdJbJb1V0lslvVXEW0W8VahbxbhVcFvF'
+        'uFVUWyWvVfJaZa1VkFqlq1WQWoPM7F/86D/uR9/uR9/uR99uRLcT0E5AOwHtBLQT0E5AOwHtBLQT'
+        '0E5AOwHtBLQT0E5AOwHtBLQT0E5AOwHtBLQT0E5AOwHtBLQT0E5AOwHtBLQT0O5H3w5COwHtBLQT'
+        '0E5AOwHtBLQT0E5AOwHtBLQT0E5AOwHtBLQT0E5AOwHtBLQT0E5AOwHtBLQT0E5AOwHtBLQT0E5A'
+        'OwHtBLQT0E5AOwHtBLQT0E5AuxHdHkD4k4tPqvmN6wf+K3NIdCLRiUQnC50sdLLQyUInC50sdLLQ'
+        'yUInC50sdLLQyUInC50sdLLQyUInC50sdLLQyUInC50sdLLQyUInC50sdLLQyUInC50QdCLRyUIn'
+        'C50sdLLQyUInC50sdLLQyUInC50sdLLQyUInC50sdLLQyUInC50sdLLQyUInC50sdLLQyUInC50s'
+        'dLLQyUInC50sdLLQyUInC50sdLLQGSD49MUJ/87yxh7zs4/52ce0gxgCMQRiCMQQiCEQQyCGQAyB'
+        'GAIxBGIIxBCIIRBDIIZADIEYAjEEYgjEEIghEEMghkAMgRgCMQRiCMQQiCEQ87OPkRBDIIZADIEY'
+        'AjEEYgjEEIghEEMghkAMgRgCMQRiCMQQiCEQQyCGQAyBGAIxBGIIxBCIIRBDIIZADIEYAjEEYgjE'
+        'EIghEEMghkAMgRgCMe0gFkj4zOW7uy/v8S/f0/1Ev6fbq98WSi/s/8ru84vXX4tz5dtKG//BE3pU'
+        '8vWhpSPSDfepFn/6uD8wwQ3jx649Fk/UFecX9bh89rF4XBKjIc+W1Vz7zz1/jBL/pPRng4cp8UOl'
+        'P3wM7oAT/zRUymDpn/Y5HqrEj5R+N1n63S/zQUv8aOmfkAo96t3z1x++DyT+WelPf85H8b89+tOq'
+        'fit488yfnb9f7nXBWfy/l37dVPp1Mvj14cWbY2puuf4xk88OPj7y6GJb6yhvaz22tR7bWo9trce2'
+        '1mNb67Gt9djWemxrPba1Httaj22tx7bWY1vrsa312NZ6bGs9trUe21qPba3HttZjW+uxrfXY1nps'
+        'az22tR7bWo9trce21mNb67Gt9djWemxrPba1Httaj22tx7bWY1vrsa312NZ6bGs9trUe21qPba3H'
+        'ttZjW+uxrfXY1npsaz22tR7bWo9trce21mNb67Gt9djWemxrPba1Httaj22tx7bWY1vrsa312NZ6'
+        'bGs9trUe21qPba3HttZjW+uxrfXY1nqCbe3Pn4zbWvDa283Pubf91ZdMl7e4y1dO33g72lP99dK/'
+        'pVdfqfiS31n5Fb52+n8E33DwdbH739Fz//0PBh94+JOlLfC3v87weG8wAY4vJsDPlydAnwnQZwL0'
+        'mQB9JkCfCdBnAvSZAH0mQJ8J0GcC9JkAfSZAnwnQZwL0mQB9JkCfCdBnAvSZAH0mQJ8J0GcC9JkA'
+        'fSZAnwnQZwL0mQB9JkCfCdBnAvSZAH0mQJ8J0GcC9JkAfSZAnwnQZwL0mQB9JkCfCdBnAvSZAH0m'
+        'QJ8J0GcC9JkAfSZAnwnQZwL0mQB9JkCfCdBnAvSZAH0mQJ8J0GcC9JkAfSZAnwnQZwL0mQB9JkCf'
+        'CdBnAvSZAH0mQJ8J0GcC9JkAfcEEOHm899ZEw9eQWBP64nbXRH35b/hg6W94LBbZ4Bjxq6V/2pe1'
+        '0v7F9e98vvLbpUXrLy+y1FbOUr8s9ctSvyz1y1K/LPXLUr8s9ctSvyz1y1K/LPXLUr8s9ctSvyz1'
+        'y1K/LPXLUr8s9ctSvyz1y1K/LPXLUr8s9ctSvyz1y1K/LPXLUr8s9ctSvyz1y1K/LPXLUr8s9ctS'
+        'vyz1y1K/LPXLUr8s9ctSvyz1y1K/LPXLUr8s9ctSvyz1y1K/LPXLUr8s9ctSvyz1y1K/LPXLUr8s'
+        '9ctSvyz1y1K/LPXLUr8s9ctSvyz1y1K/LPUHWfqfF58T+cpbrj9b/Yag4f6v8229NtjeTy/QtJbR'
+        'DEAzAM0ANAPQDEAzAM0ANAPQDEAzAM0ANAPQDEAzAM0ANAPQDEAzAM0ANAPQDEAzAM0ANAPQDEAz'
+        'AM0ANAPQDEAzAM0ANAPQDEAzAM0ANAPQDEAzAM0ANAPQDEAzAM0ANAPQDEAzAM0ANAPQDEAzAM0A'
+        'NAPQDEAzAM0ANAPQDEAzAM0ANAPQDEAzAM0ANAPQDEAzAM0ANAPQDEAzAM0ANAMBmv/vegNOtN5S'
+        'WgJLrwt9dCv+QKK99KeCjpzoKP3hl9CUE7Hyy0zHrhG7kV4yda2RBq34Y4nO0v/CR/fhjybuLf2p'
+        '/0s7Try59Ejdf0vwqRHX/uP++bX/uHKHfiR+Vkpa8Il0Pxwk7a+FLl9ifgNeTV9/n9lC6ZvBLu+p'
+        'L98V9iXcST8t9BV9dXLk83118o1yoXh+3fnqa/9Lv7zLxc8k/u7numP8nPvsLaHzl+x///kLLxfL'
+        'W8mgrWTQVjJoKxm0lQzaSgZtJYO2kkFbyaCtZNBWMmgrGbSVDNpKBm0lg7aSQVvJoK1k0FYyaCsZ'
+        'tJUM2koGbSWDtpJBW8mgrWTQVjJoKxm0lQzaSgZtJYO2kkFbyaCtZNBWMmgrGbSVDNpKBm0lg7aS'
+        'QVvJoK1k0FYyaCsZtJUM2koGbSWDtpJBW8mgrWTQVjJoKxm0lQzaSgZtJYO2kkFbyaCtZNBWMmgr'
+        'GbSVDNpKBm0lg7aSQVvJoK1k0FYyaCsZtJUM2koGbSWDtpLBYCsJhW6WF2pfj0hwKHzBLV/oQ2y/'
+        '5toD8+5bSuHcLG0XXxs8Tv+ilJiDIDFfn/j+0uP4IeWDym8qP6Hco+woM8oPKO9Tvk/5WeWXlB9W'
+        'Pqy8V4kp/1b5m8qK8i5lSFlVIsr3Kgnlp5T3Kz+pPKz8uPJuZUB5j/JdyrcE5ZH400Pnr7V9Sfm1'
+        'tj/otbY/6LW2Pxj8ZV93uZJdvlrgcgv7Eraw87cL9lwL1Q24kVWUg3+thb6n9CLA0rs4rny0dPHx'
+        'jND560SPbBRJG0XSRpG0SiStEkmrRNIqkbRKJK0SSatE0iqRtEokrRJJq0TSKpG0SiStEkmrRNIq'
+        'kbRKJLXCpFUiaZVIWiWSVomkVSJplUhaJZJWiaRVImmVSFolklaJpFUiaZVIWiWSVomkVSJplUha'
+        'JZJWiaRVImmVSFolklaJpFUiaZVIWiWSVomkmZK0SiStEkmrRNIqkbRKJK0SSatE0vhIWiWSVomk'
+        'VSJplUhaJZJWiaRVImmVSFolklaJpFUiaZVIWiWSQbf/+osR+SflEZkyIlNGZMqITBmRKf85KSMy'
+        'ZUSmjMiUEZkyIlNGZMqITBmRKSMyZUSm/DemjMiUEZkyIlNGZMqITBmRKS5SRmTKiEwZkSkjMmVE'
+        'pozIlBGZMiJTRmTKiEwZkSkjMhU8Gs8MHo0XBc/LlG6gr5T+6JtLf3R76Y/+fXBb+KzQ9Q9T/ong'
+        'ufxnh65/t8zfCO40KkPX3+PyjcHv3/pV2daCjeiZpTjfyHvb/3Vbe06ofFUf7w8eqOeGLl+deLlv'
+        '3DT7hlcBVoc+z2cMPPm/e+a2/3vjSxyW/tKj0v/789I/4DE4qyb+rPzM/p9d64ulpzNPSv/0vyj9'
+        'yRvyXbXh0MUrx650lXpg1cVGdmwjm7aRTdvIpm1k0zayaRvZtI1s2kY2bSObtpFN28imbWTTNrJp'
+        'G9m0jWzaRjZtI5u2kU3byKZtZNMm77SNbNpGNm0jm7aRTdvIpm1k0zayaRvZtI1s2kY2bSObtpFN'
+        '28imbWTTNrJpG9m0jWzaRjZtI5u2kU3byKZtZNM2smkb2bSNbNpGNm0jm7aRTVthpm1k0zayaRvZ'
+        'tI1s2kY2bSObtpFN21ambWTTNrJpG9m0jWzaRjZtI5u2kU3byKZtZNM2smkb2bSNbNpGNh3sILdf'
+        'bGT75Y0sbSNL28jSNrK0jSztPydtI0vbyNI2srSNLG0jS9vI0jaytI0sbSNL28jS/hvTNrK0jSxt'
+        'I0vbyNI2srSNLM1F2kaWtpGlbWRpG1naRpa2kaVtZGkbWdpGlraRpW1kaRtZOng0qi/y8D/lYVYe'
+        'ZuVhVh5m5WFWHmblYVYeZuVhVh5m5WFWHmblYVYeZuVhVh5m5WFWHmblYVYeZv13z8rDrDzMysOs'
+        'PMzKw6w8zMrDrDzMysOsPMzKw6w8zMrDrDzMysOsPMzKw6w8zMrDrDzMysOsPMzKw6w8zMrDrDzM'
+        'ysOsPMwCNCsPs/IwKw+z8jArD7PyMCsPs6zMysOsPMzKw6w8zMrDrDzMysOsPMzKw6w8zMrDrDzM'
+        'ysNsIOB5wX1U8BXr1yLx8uDm6iOJTPB7NU/Ji9BgtY+WVvsve7V+fuj6h3S+P/h23BecP4tw5dZr'
+        '+8ZHyyNnqXSeeeH1B/H8mY3qa//qx+QBfZK/CDx4QqrtC39MyE9+6OivBf/nwX/RRc/6oJ61oGct'
+        '6FkLnqdZ0LoWtK4FrWtB61rQuha0rgWta0HrWtC6FrSuBa1rQeta0LoWtK4FrWtB61rQuha0rgWt'
+        'a0HrWtC6FrSuBa1rQeta0LoWtK4FrWtB61rQuha0rgWta0HrWtC6FrSuBa1rQeta0LoWtK4FrWtB'
+        '61rQuha0rgWta0HrWtC6FrSuBa1rQeta0LoWtK4FrWtB61rQuha0rgWta0HrWtC6FrSuBa1rQeta'
+        '0LoWtK4FrWtB61rQuha0rgWta0HrWgjaUyR0/XVF9wYH3BdfjPbPlEd7zmjPGe05oz1ntOf85+WM'
+        '9pzRnjPac0Z7zmjPGe05oz1ntOeM9pzRnvPfnDPac0Z7zmjPGe05oz1ntOc4yRntOaM9Z7TnjPac'
+        '0Z4z2nNGe85ozxntOaM9Z7TnjPZc8OjUnveo6qBHveTimrJ4y/VrytVSh6oLnX/4zI+dPwf60+Xn'
+        'QJdla1m2lmVrWbaWZWtZtpZla1m2lmVrWbaWZWtZtpZla1m2lmVrWbaWZWtZtpZla1m2lj1my7K1'
+        'LFvLsrUsW8uytSxby7K1LFvLsrUsW8uytSxby7K1LFvLsrUsW8uytSxby7K1LFvLsrUsW8uytSxb'
+        'y7K1LFvLsrUsW8vwLcvWsmwty9aybC3L1rJsLcvWMmfLsrUsW8uytSxby7K1LFvLsrUsW8uytSxb'
+        'y7K1LFvLsrUc6Hnp9Vu2K79QwlN/3nPj95RhrIGxBsYaGGtgrIGxBsYaGGtgrIGxBsYaGGtgrIGx'
+        'BsYaGGtgrIGxBsYaGGtgrIGxBsYaGGtgrIGxBsYaGGtgrIGxBsYaGGtgrIGxBsYaGGtgrIGxBsYa'
+        'GGtgrIGxBsYaGGtgrIGxBsYaGGtgrIGxBsYaGGtgrIGxBsYaGGtgrIGxBsYaGGtgrIGxBsYaGGtg'
+        'rIGxBsYaGGtgrIGxBsYaGGsBjJddSPjFsoR1EtZJWCdhnYR1EtZJWCdhnYR1EtZJWCdhnYR1EtZJ'
+        'WCdhnYR1EtZJWCdhnYR1EtZJWCdhnYR1EtZJWCdhnYR1EtZJWCdhnYR1EtZJWCdhnYR1EtZJWCdh'
+        'nYR1EtZJWCdhnYR1EtZJWCdhnYR1EtZJWCdhnYR1EtZJWCdhnYR1EtZJWCdhnYR1EtZJWCdhnYR1'
+        'EtZJWCdhnYR1EtZJWCdhPZDQEJwcXl5+LdvfK73R4mXlX3x3cJP/8lIP+d7Sr/9NMJ9fEdC5r9RU'
+        'vu8anIPgeYDSHl667b/y4dLf0nih6+6yrh26dujaoWuHrh26dujaoWuHrh26dujaoWuHrh26duja'
+        'oWuHrh26dujaoWuHrh26dujaoWuHrh26dujaoWuHrh26dujaoWuHrh26dujaoWuHrh26dujaoWuH'
+        'rh26dujaoWuHrh26dujaoWuHrh26dujaoWuHrh26dujaoWuHrh26dujaoWuHrh26dujaoWuHrh26'
+        'dujaoWuHrh26dujaoWsn0HXH+QD6ayU7r3zUVV784wGnptDl+/cu37/3uZ7FKL8BLf5zpZ50+Wa+'
+        'J8+Xn7zq0SmfC57uffWj7/CfX/ozzaGb6nNUf/qL/RzV11wcf4vl4+9Vx9+rjr9XHX+vOv5eNQCu'
+        'Ov5edfy96vh71fH3quPvVcffq46/Vx1/rzr+XnX8vWoqXHX8ver4e9Xx96rj71XH36uOv1dN0quO'
+        'v1cdf686/l51/L3q+HvV8feq4+9Vx9+rjr9XHX+vOv5edfy9GsyPO8+Pv68MHN11/bWL8QeC6dFS'
+        'cnX9jaEPBX/q7vNXFtwX/Dr6uEELftC/de1H9qR4YcFrzx/KdwaP0+sulrbnlZe2A0vbgaXtwNJ2'
+        'YGk7sLQdWNoOLG0HlrYDS9uBpe3A0nZgaTuwtB1Y2g4sbQeWtgNL24Gl7cDSdmBpO0DtwNJ2YGk7'
+        'sLQdWNoOLG0HlrYDS9uBpe3A0nZgaTuwtB1Y2g4sbQeWtgNL24Gl7cDSdmBpO7C0HVjaDixtB5a2'
+        'A0vbgaXtwNJ2YGk7sLQdWNoOZPbA0nZgaTuwtB1Y2g4sbQeWtgNL24F4HljaDixtB5a2A0vbgaXt'
+        'wNJ2YGk7sLQdWNoOLG0HlrYDS9uBpe0gCN3rQ1/oo5zjH3jaU/2znN8QKn9Q6JVXldLxxovr6lnh'
+        'OBSOQ+E4lIpDqTiUikOpOJSKQ6k4lIpDqTiUikOpOJSKQ6k4lIpDqTiUikOpOJSKQ6k4lIpDqTiU'
+        'ikOpOJSKQ6k4lIpDqTiUikOpOJSKQ6k4lIpDqTiUikOpOJSKQ6k4lIpDqTiUikOpOJSKQ6k4lIpD'
+        'qTiUikOpOJSKQ6k4lIpDqTiUikOpOJSKQ6k4lIpDqTiUikOpOJSKQ6k4lIpDqTiUikOpOJSKQ6k4'
+        'lIpDqTgMUnHPo0fNPwxaZutFy3xuuWUeU3FMxbGWeQzHMRzHcBzDcQzHMRzHcBzDcQzHMRzHcBzD'
+        'cQzHMRzHcBzDcQzHMRzHcBzDcQzHMRzHcBzDcQzHMRzHcBzDcQzHMRzHcBzDcQzHMRzHcBzDcQzH'
+        'MRzHcBzDcQzHMRzHcBzDcQzHMRzHcBzDcQzHMRzHcBzDcQzHMRzHcBzDcQzHMRzHcBzDcQzHMRzH'
+        'cBzDcQzHMRzHcBzDcRzgaLveLeI/HVzTt1++P+Dy9XqX7w/4ah5pr7/99ldv+ZI/oObLeqFex0Wz'
+        'ryo3+1PN/lSzP9XsTzX7U83+VLM/1exPNftTzf5Usz/V7E81+1PN/lSzP9XsTzX7U83+VLM/1exP'
+        'NftTzf5Usz/V7E81+1PN/lSzP9XsTzX7U83+VLM/1exPNftTzf5Usz/V7E81+1PN/lSzP9XsTzX7'
+        'U83+VLM/1exPNftTzf5Usz/V7E81+1PN/lSzP9XsTzX7U83+VLM/1exPNftTzf5Usz/V7E81+1PN'
+        '/lSzP9XsTzX7U83+VLM/1exPNftTzf5Usz/V7E+DZv+mCwm/VpZwRsIZCWcknJFwRsIZCWcknJFw'
+        'RsIZCWcknJFwRsIZCWcknJFwRsIZCWcknJFwRsIZCWcknJFwRsIZCWcknJFwRsIZCWcknJFwRsIZ'
+        'CWcknJFwRsIZCWcknJFwRsIZCWcknJFwRsIZCWcknJFwRsIZCWcknJFwRsIZCWcknJFwRsIZCWck'
+        'nJFwRsIZCWcknJFwRsIZCWcknJFwRsIZCWcknAUSOi8kPLss4WnPCCQE5ZnKR5RnKc9WKpVbleco'
+        'z1VuU8JKlXK7Uq08T6lRnq+8QHmh8iIlorxYqVVeotQpL1XqlZcpDcrLlVcojcodyiuVJuVVyquV'
+        'ZuU1yp3KXUqLcrcSVV6rvE55vfIG5Y3KPUqr0qa0Kx3Km5RO5V4lptynvFm5X3mL8lblbUqX8nbl'
+        'ivKAElceVB4KyiPxey8k1JclhEgIkRAiIURCiIQQCSESQiSESAiRECIhREKIhBAJIRJCJIRICJEQ'
+        'IiFEQoiEEAkhEkIkhEgIkRAiIURCiIQQCSESQiSESAiRECIhREKIhBAJIRJCJIRICJEQIiFEQoiE'
+        'EAkhEkIkhEgIkRAiIURCiIQQCSESQiSESAiRECIhREKIhBAJIRJCJIRICJEQIiFEQoiEEAkhEkKB'
+        'hJhX6CSagw93UT6hfCYoj8Tv+0qe8wreEFEVCohdng4uTweXnzX+hL+H582h6x/YNB48S3H/+bPe'
+        'K6VfvuXiKZ1Pl5/SedYzgqd0gvJB5TeVn1DuUXaUGeUHlPcp36f8rPJLyg8rH1beq8SUf6v8TWVF'
+        'eZcypKwqEeV7lYTyU8r7lZ9UHlZ+XHm3MqC8R/ku5VuC8kj8rY++R7s/uEd72033UR2f75mZ4Cmk'
+        'D14jEtxBd4XOv9GtvvyNbrcZpbcZpbcZpUF5hvJMJap8vXK30qK8Vnm68jrlWcrrlWcrb1AqlTcq'
+        '9yityq1Km/Ic5blKu3Kb0qG8SelU7lXCSky5T6lSblferFQrz1PuV2qUtypvUZ6vvEBpVN6mvFC5'
+        'Q3mRElFerNQqL1G6lLcrdcpLlStKvfIypUGJKy9XHlBeoTyovFJpUl6lPBSUR+Jvv3je4X9ZK6v8'
+        'XKv8sKv87Kr80Kr8tKr8YKr8RKr8RKr8KKo83FUe4CoPcJVHtsojW+UhrfIgVnkQqzxsVR6vKo9X'
+        'lceryuNV5fGq8ghVeYSqPDRVHpoqD02Vx6TKg1Hl51PlJ1LlManymFR5TKrsk1X2ySohqBKCKiGo'
+        'IryK9yohqOK9CvQqwqvQrmK6iukqpqtgrsK3itsqbqu4reK2CtgqYKsQrYKyCsMqKKvAq+KoiqMq'
+        'cqqwqGKlCosqAqoCAVcuThb/snyyqEagGoFqJ4tqEqpJqCahmoRqEqpJqCahmoRqEqpJqCahmoRq'
+        'EqpJqCahmoRqEqpJqCahmoRqEqpJqCahmoRqEqpJqCahmoRqEqpJqCahmoRqEqpJqCahmoRqEqpJ'
+        'qCahmoRqEqpJqCahmoRqEqpJqCahmoRqEqpJqCahmoRqEqpJqCahmoRqEqpJqCahmoRqEqpJqCah'
+        'moRqEqpJqCahmoTqQMIDFxLeWJZQQ0INCTUk1JBQQ0INCTUk1JBQQ0INCTUk1JBQQ0INCTUk1JBQ'
+        'Q0INCTUk1JBQQ0INCTUk1JBQQ0INCTUk1JBQQ0INCTUk1JBQQ0INCTUk1JBQQ0INCTUk1JBQQ0IN'
+        'CTUk1JBQQ0INCTUk1JBQQ0INCTUk1JBQQ0INCTUk1JBQQ0INCTUk1JBQQ0INCTUk1JBQQ0INCTUk'
+        '1JBQQ0INCTUk1AQS4l/Zxwde+XwfH/gk3pyChenBR7/yrD3YxR+6KXbL4N2Qryi9KOOLfqy+4dGP'
+        '1Z8He3j3+autviF47L7x/ENcXhP8/sM35UfqXfm5L/SJeu84fwvbYvA4/fXg14nXXjvkfE/8b1x0'
+        '7TeUu3aTrt2kazfp2k26dpOu3aRrN+naTbp2k67dpGs36dpNunaTrt2kazfp2k26dpOu3aRrN+na'
+        'Tbp2k67dpGs36dpNunaTrt2kazfp2k26dpOu3aRrN+naTbp2k67dpGs36dpNunaTrt2kazfp2k26'
+        'dpOu3aRrN+naTbp2k67dpGs36dpNunaTrt2kazfp2k26dpOu3aRrN+naTbp2k67dpGs36dpNunaT'
+        'rt2kazfp2k26dpOu3aRrN+naTbp2k67dpGs36dpNQdfuuXiH3t3Xv2c0/jNlE81MNDPRzEQzE81M'
+        'NDPRzEQzE81MNDPRzEQzE81MNDPRzEQzE81MNDPRzEQzE81MNDPRzEQzE81MNDPRzEQzE81MNDPR'
+        'zEQzE81MNDPRzEQzE81MNDPRzEQzE81MNDPRzEQzE81MNDPRzEQzE81MNDPRzEQzE81MNDPRzEQz'
+        'E81MNDPRzEQzE81MNDPRzEQzE81MNDPRzEQzE81MNDPRzERzYOJvBldHiVffUmoVvY/Jq0bOnxl/'
+        '9tMuL4kvL4kvX0LyRF4N/63LF4JdpvgyxV/OB8X+rRvzg2L/n/P3v8bvKw3YPyj9b/2J0tte/3aQ'
+        '9aeXp++PlH4zlvja4Bnfv/OUPzkFJ6WPXPtP/pIO7N/0qFdQ32IRbrMIt1mE2yzCbRbhNotwm0W4'
+        'zSLcZhFuswi3WYTbLMJtFuE2i3CbRbjNItxmEW6zCLdZhNsswm0W4TaLcJtFuM0i3GYRbrMIt1mE'
+        '2yzCbRbhNotwm0W4zSLcZhFuswi3WYTbLMJtFuE2i3CbRbjNItxmEW6zCLdZhNsswm0W4TaLcJtF'
+        'uM0i3GYRbrMIt1mE2yzCbRbhNotwm0W4zSLcZhFus6a22Yfb7MNt9uE2+3CbfbjNPtxmH26zD7fZ'
+        'h9vsw2324Tb7cJt9uM0+3BYswn0XT3ScgtABQgcIHQR0ENBBQAcBHQR0ENBBQAcBHQR0ENBBQAcB'
+        'HQR0ENBBQAcBHQR0ENBBQAcBHQR0ENBBQAcBHQR0ENBBQAcBHQR0ENBBQAcBHQR0ENBBQAcBHQR0'
+        'ENBBQAcBHQR0ENBBQAcBHQR0ENBBQAcBHQR0ENBBQAcBHQR0+NF3+NF3+NF3+NF3+NF3+NF3+NF3'
+        '+NF3+NF3+NF3+NF3+NF3+NF3+NF3MNYRCPh/AwF/mHj204PnuN9a6qOfSlSWflVI3Foqe4nnXCuJ'
+        '55b+322lP3E1ES6VTyaqSiX41P6PB+fp3090lv7RfxCUR+LvvGgzt5fbTIyuGF0xbSYGWQyyGGQx'
+        'yGKQxSCLQRaDLAZZDLIYZDHIYpDFIItBFoMsBlkMshhkMchikMUgi0EWgywGWQyyGGQxyGKQxSCL'
+        'QRaDLAZZDLIYZDHIYpDFIItBFoMsBlkMshhkMchikMUgi0EWgywGWQyyGGQxyGKQxRCIsRZjLcZa'
+        'jLUYazHWYqzFWIuxFmMtxlqMtRhrMdZigYRvPn936DuCN2p8y2M+mIOr2J8pfQLT4ziiE5XlF1T8'
+        'u1u+tC/c+eLG9LdeNOcz8ekSny7x6ZKbLrnpkpsuuemSmy656ZKbLrnpkpsuuemSmy656ZKbLrnp'
+        'kpsuuemSmy656ZKbLrnpkpsuuemSmy656ZKbLrnpkpsuuemSmy656ZKbLrnpkpsuuemSmy656ZKb'
+        'LrnpkpsuuemSmy656ZKbLrnpkpsuuemSmy656ZKbLrnpkpsuuemSmy6B6RKYLoHpEpgugekSmC6B'
+        '6RKYLoHpEpgugekSmC6B6RKYLsnsCnLzrsuP6bj8mI4v58x6/WukH/qh8ctP6biRPqXj7waJvqO0'
+        'E90R7ER3J+JB1PuD3/h06TdeHfzGJxIPBb/x7ovvRvpYecvqtmV1B7//bRdb1g+Vn9V42Jh42Jh4'
+        '2Jb1sGnxsGnxsGnxsFc2PmxoPGxoPGxoPGxoBOV3lLBSpdyuVCvPU2qU5ysvUF6ofFR5kRJRXqzU'
+        'Ki9R6pSXKvXKy5QG5eXKK5SPKY3KHcorlSblVcqrlWblNcqdyl1Ki3K3ElVeq7xOeb3yBuWNyj1K'
+        'q9KmfFxpVzqUNymdykPKvUpMuU95s3K/8hblrcrvKr+nvE3pUt6uXFEeUHaVuPKg8gllT7mqfFL5'
+        'lPL7yh8of6j8kVJQ/ljZV/5E+bTyGaWoHCh/qnw2KI/EE0/Zu5pgNf2nX/a3hn/7TbADnM+rb7r2'
+        'KF3uAzfeHfblDvAY7gDfcTGx/1V5Yvea2L0mdq+J3Wti95rYvSZ2r1Hda1T3GtW9RnWvGd1rRvea'
+        '0b1mdK8Z3WtG95rRvWZ0rxndazj3Gs69hnOv4dxrOPcazr2Gc6/h3Gs49xrOvYZzr+Hcayr3msq9'
+        'pnKvqdxrKveayr2mcq+p3Gsq95rKvaZyr6ncayr3msq9pnKvqdxrKveayr2mcq+p3Gsq9xrHvcZx'
+        'r3Hcaxz3msO95nCvOdxrDveaw73mcK853Gvy9pq8vSZvr8nba/L2Grm9Rm6vgd8bDL2/d/Gsxo/e'
+        'Un5WI/5LTys9rTHw6BeK/Yvg1uQ7H9MRGTx18KFr/9In/esPv+vyy7kun+O9fDvfk/DtfN5W+4zS'
+        '94w9aj5+903/xrSgN//itd78V/rcey5f1XLZ8S473v9xDrj+ysvhUh95cr1Q7XvOX/v/34LXsL/3'
+        '4imfv3AySDgZJJwMEo4ECUeChCNBwpEg4UiQcCRIOBIkHAkSjgQJR4KEI0HCkSDhSJBwJEg4EiQc'
+        'CRKOBAlHgoQjQcKRIOFIkHAkSDgSJBwJEo4ECUeChCNBwpEg4UiQcCRIOBIkHAkSjgQJR4KEI0HC'
+        'kSDhSJBwJEg4EiQcCRKOBAlHgoQjQcKRIOFIkHAkSDgSJBwJEo4ECUeChCNBwpEg4UiQcCRIOBIk'
+        'HAkSjgQJR4KEI0HCkSDhSJBwJEg4EiQcCRKOBAlHgoQjQcKRIBEcCR4JBLSXBsCd1wA8v/QH//CH'
+        'xlO3vvcffNe7+t45MPCd733ne7/tOwfGS78xee2vuKv0B/3X/opQ14PvCP5s6ofK74MfvvZnv/Yt'
+        'Dzx0rz//vmu//JrYQw89EPzqu0u/evChB+8PfvWia39PS+kPfqz0T3r4Hd8Y/NmB0knkfRfH1R8o'
+        'H1eHoByCcshxdYjNITaH2BxywTyE6BCiQ4gOITrkgnmI1CFSh0gdInWI1CFSh0gdInWI1CEXzEPA'
+        'DgE7BOwQsEPADgE7BOwQsEPADgE7BOwQsEMumIe4HeJ2iNshboe4HeJ2iNshboe4HeJ2iNshboe4'
+        'HeJ2iNshboe4HeJ2iNshboe4HXLBPITvEL5D+A7hOwTXEMVDFA9RPETxEMVDFA9RPOSCecgF8xDT'
+        'Q0wPMT3E9BDTQy6Yh9AeQnvIBfOQC+YhF8xDLpiHXDAPuWAecsE85IJ5yAXzkAvmIRfMQy6Yh1ww'
+        'D7lgHnLBPOSCecgF85AL5iEXzENBsP7+RWv9dYqHKR6meJjiYYqHKR6meBjfYXyH8R3Gd5jbYW6H'
+        'uR3mdpjbYW6HuR3mdpjbYWCHgR0GdhjYYWCHgR0GdhjYYWCHgR0GdhjYYVKHSR0mdZjUYVKHSR0m'
+        'dZjUYVKHSR0mdZjUYVKHSR0mdZjUYVKHSR0mdZjUYVKHER1GdBjRYUSH2Rxmc5jNYTaH2Rxmc5jN'
+        'YRqHaRymcZjGYRqHMRzGcFgIhgMI33v+OSEfKI3cf3DR3kbL7W0EjBEwRsAYAWMEjBEwRrS3ET5G'
+        '+BjhY4SPEe1tBJMRTEYwGcFkBJMRTEYwGcFkBJMR7W2ElhFaRmgZoWWElhFaRmgZoWWElhFaRmgZ'
+        'oWVEexuBZgSaEWhGoBmBZgSaEWhGoBmBZgSaEWhGoBmBZgSaEWhGoBmBZgSaEWhGoBmBZkR7G2Fn'
+        'hJ0RdkbYGfGTHUFoBKERhEYQGkFoBKERhEa0txHtbQSoEaBGgBoBagSoEe1thKsRrka0txHtbUR7'
+        'G9HeRrS3Ee1tRHsb0d5GtLcR7W1EexvR3ka0txHtbUR7G9HeRrS3Ee1tRHsbCVR/X0n1ammTbAsu'
+        'Cwdvjtc+b3ypr33+hxdxHyrHPSnuSXFPintS3JPinhT3pLgnxT0p7klxT4p7UtyT4p4U96S4J8U9'
+        'Ke5JcU+Ke1Lck+KeFPekuCfFPSnuSXFPintS3JPinhT3pLgnxT0p7klxT4p7UtyT4p4U96S4J8U9'
+        'Ke5JcU+Ke1Lck+KeFPekuCfFPSnuSXFPintS3JPinhT3pLgnxT0p7klxT4p7UtyT4p4U96S4J8U9'
+        'Ke5JcU+Ke1Lck+KeFPekuCfFPSnuSXFPintS3JPinhT3pLgnxT0p7klxT4p7UtyT4p4U96S4J8U9'
+        'Ke5JcU+Ke1Lck+KeFPekuCfFPSnuSXFPBnH/RxfbTIHiFMUpilP4pvBN4ZviNsVtitsUtylgU8Cm'
+        'gE0BmwI2BWwK2BSwKWBTpKZITZGaIjVFaorUFKkpUlOkpkhNkZoiNYVoCtEUoilEU4imEE0hmkI0'
+        'hWgK0RSiKURTiKYQTSGaQjSFaArRFKIpRFOIpthMsZliM8VmCsoUlCkoU1CmoExBmYIyhWEKwxSG'
+        'KQxTGKb4S/GXoj8VCBi6EPBrBIwSMErAqD42CsIoCKMgjIIwCsIoCKMgjIIwCsIoCKMgjIIwCsIo'
+        'CKMgjIIwCsIoCKMgjIIwCsIoCKMgjIIwCsIoCKMgjIIwCsIoCKMgjIIwCsIoCKMgjIIwCsIoCKMg'
+        'jIIwCsIoCKMgjIIwCsIoCKMgjIIwCsIoCKMgjIIwCsIoCKMgjIIwCsIoCKMgjIIwCsIoCKMgjIIw'
+        'CsIoCKMgjIIwGkD4xxcT7bvLE22MhDESxkgYI2GMhDESxky0MSDGgBgDYgyIMRNtjIsxLsa4GONi'
+        'jIsxLsa4GONijIsxE20MjzE8xvAYw2MMjzE8xvAYw2MMjzE8xvAYw2PMRBujZIySMUrGKBmjZIyS'
+        'MUrGKBmjZIySMUrGKBmjZIySMUrGKBmjZIySMUrGKBmjZMxEG4NlDJYxWMZgGfOjHGNmjJkxZsaY'
+        'GWNmjJkxZsZMtDETbYygMYLGCBojaIygMRNtDKQxkMZMtDETbcxEGzPRxky0MRNtzEQbM9HGTLQx'
+        'E23MRBsz0cZMtDETbcxEGzPRxky0MRNtzEQbCxgPXz6Le/mcxl95TsOzg79SutW/fD73Sfce/O8/'
+        '/6azbwue2viBJ/WBNDhs7nw13uXzg+fvjfrO4OA+Uvp18HE1a8HHQf2T4HH7bGm8v6b8wvB/HTTM'
+        'Hzp/7ui1wd/4Ty/2gGh5D5iyB0zZA6bsAVP2gCl7wJQ9YMoCMGUBmLIATFkApkz+KZN/yuSfMvmn'
+        'TP4pk3/K5J8y+adM/ikjf8rInzLyp4z8KSN/ysifMvKnjPwpI3/KyJ8y8qeM/CmzfsqsnzLrp8z6'
+        'KbN+yqyfMuunzPops37KrJ8y66fM+imzfsqsnzLrp8z6KbN+yqyfMuunzPops37KkJ8y5KcM+SlD'
+        'fsp0nzLdp0z3KdN9ynSfMt2nTPcp83zKPJ8yz6fM8ynzfMognzLIp6wRU4GMHz7/ZKzbg+j9yIWM'
+        '15ZlpMlIk5EmI01Gmow0GWky0mSkyUiTkSYjTUaajDQZaTLSZKTJSJORJiNNRpqMNBlpMtJkpMlI'
+        'k5EmI01Gmow0GWky0mSkyUiTkSYjTUaajDQZaTLSZKTJSJORJiNNRpqMNBlpMtJkpMlIk5EmI01G'
+        'mow0GWky0mSkyUiTkSYjTUaajDQZaTLSZKTJSJORJiNNRpqMNBlpMtKBjOQN0YSDV8TfWfqkhhvm'
+        'NYQ/ehGR2XJEMiKSEZGMiGREJCMiGRHJiEhGRDIikhGRjIhkRCQjIhkRyYhIRkQyIpIRkYyIZEQk'
+        'IyIZEcmISEZEMiKSEZGMiGREJCMiGRHJiEhGRDIikhGRjIhkRCQjIhkRyYhIRkQyIpIRkYyIZEQk'
+        'IyIZEcmISEZEMiKSEZGMiGREJCMiGRHJiEhGRDIikhGRjIhkRCQjIhkRyYhIRkQyIpIRkYyIZEQk'
+        'IyIZEcmISCaISOryHHLDnEOcAGZKJ4DLV1ldnkO+rHPIP7vo7HPlzj6vs8/r7PM6+7zOPq+zz+vs'
+        '8zr7vM4+r7PP6+zzOvu8zj6vs8/r7PM6+7zOPq+zz+vs8zr7vM4+r7PP6+zzOvu8zj6vs8/r7PM6'
+        '+7zOPq+zz+vs8zr7vM4+r7PP6+zzOvu8zj6vs8/r7PM6+7zOPq+zz+vs8zr7vM4+r7PP6+zzOvu8'
+        'zj6vs8/r7PM6+7zOPq+zz+vs8zr7vM4+r7PP6+zzOvu8zj6vs8/r7PM6+7zOPq+zz+vs8zr7vM4+'
+        'r7PP6+zzOvt80NlHLzv75Q3TE9zPg4H2r0PBt4pcdvavrLP/2Ff0eezxD9zyVP1A9rGLkVdZ/uCl'
+        'rJGXNfKyRl7WyMsaeVkjL2vkZY28rJGXNfKyRl7WyMsaeVkjL2vkZY28rJGXNfKyRl7WyMsaeVkj'
+        'L2vkZY28rJGXNfKyRl7WyMsaeVkjL2vkZY28rJGXNfKyRl7WyMsaeVkjL2vkZY28rJGXNfKyRl7W'
+        'yMsaeVkjL2vkZY28rJGXNfKyRl7WyMsaeVkjL2vkZY28rIGUNfmyJl/W5MuafFmTL2vyZU2+rMmX'
+        'NfmyJl/W5MuafFmTL2vyZT2zk/XUTNZTM1nP82Q9Q5P13F/W83tZT+lkPW2T9XRd1rM+WU8MZT2X'
+        'k/V8W9ZTQVnP7GQ91ZX13FHWE0NZT/dkPVeV9VxV1hNKWc9HZT3LlPWMUNYzQtlgXv/4DX9jHPSR'
+        '15QuMh7XfP/z85vfeHDz+xMXec+UV9ycvOfkPSfvOXnPyXtO3nPynpP3nLzn5D0n7zl5z8l7Tt5z'
+        '8p6T95y85+Q9J+85ec/Je07ec/Kek/ecvOfkPSfvOXnPyXtO3nPynpP3nLzn5D0n7zl5z8l7Tt5z'
+        '8p6T95y85+Q9J+85ec/Je07ec/Kek/ecvOfkPSfvOXnPyXtO3nPynpP3nKDnBD0n6DlBzwl6TtBz'
+        'gp4T9Jyg5wQ9J+g5Qc8Jek7QczpKLojM+PnN753Bkwc/ef5a1+8v/XLi4v3Gz7j+fuMrnyq9yP+n'
+        'Lj5+5s7yswwrwT9xMviNTyR+tzR3P1r6fx97WtAFPh7M4H9x075XL3hGaOraI/U5I/ovL9+rd3nq'
+        'uLxF+nzv1bsSf9K9Ve9fXQzZZ5aX6rwhmzdk84Zs3pDNG7J5QzZv1cqbtXmzNm/W5s3avDUsb+Tm'
+        'jdy8kZs3cvNGbt7IzRu5eSM3b+Tm7W15kzdv8uZN3rzJmzd58yZv3uTNm7x5kzdv8uZN3rzJm7f2'
+        '5Q3gvAGcN4DzBnDeAM4bwHkDOG8A5w3gvAGcN4DzBnDeAM4bwHkDOG8A5w3gvAGcN4DzBnDeAM7b'
+        'PfPmcN4czpvDeXM4b0rmjeO8cZw3jvPGcd44zhvHeeM4b3XNW13zhnPecM4bznnDOW845621eTM6'
+        'b0bnLeN563feNp23KuctwHlbcd7Cnbdb5+3kedt03i6ft8vnLfF5+3reap63jOft3XlLdd5SnQ/m'
+        '+b++eNnof6N4g+INijfw3cB3A98Nbje43eB2g9sNYDeA3QB2A9gNYDeA3QB2A9gNYDdI3SB1g9QN'
+        'UjdI3SB1g9QNUjdI3SB1g9QNUjcQ3UB0A9ENRDcQ3UB0A9ENRDcQ3UB0A9ENRDcQ3UB0A9ENRDcQ'
+        '3UB0A9ENRDcQ3WBzg80NNjfY3IByA8oNKDeg3IByA8oNKDcw3MBwA8MNDDcw3OBvg78N+jcCAT99'
+        '06xswfFsqrToflHHqn8TPDAHpfH0p9f+ntKafKUUkdJ3sV05KW3J//b84PXh4IUVU4/+kJ7eYOP+'
+        'mdJf8qHSr1uDs9n0TbkgB4/8K0sH48/7aL//K7u9+5HQU/X2Ln2xaLSUT/O7WvSuFr1r0djVqXd1'
+        '6l2delen3tWpd3XqXZ16V6fe1al3depdnXpXp97VqXd16l2delen3tWpd3XqXZ16V6fe1al3depd'
+        'nXpXp97VqXd16l2delen3tWpd3XqXZ16V6fe1al3depdnXpXp97VqXd16l2delen3tWpd3XqXZ16'
+        'V6fe1al3depdnXpXp97VqXd16l2delen3tWpd3XqXZ16V6fe1al3depdnXpXp97VqXd16l2delen'
+        '3tWpd3XqXZ16V6feDTr1zMWs/kMQ9kDYA2GPgD0C9gjYI2CPgD0C9gjYI2CPgD0C9gjYI2CPgD0C'
+        '9gjYI2CPgD0C9gjYI2CPgD0C9gjYI2CPgD0C9gjYI2CPgD0C9gjYI2CPgD0C9gjYI2CPgD0C9gjY'
+        'I2CPgD0C9gjYI2CPgD0C9gjYI2CPgD0C9gjYI2CPgD0C9gjYI2CPgD0C9gjYI2CPgD0C9gjYI2CP'
+        'gD0C9gjYI2AvEDB7+QHgj+8Hfqa+9nve+873vLf06Rfx9dLrTi5ei1K+TLgxrhCuf2Dqdz0BL46/'
+        '/DDQx/DDQD/w/1+DEn9W+s3/Xvqr/8pClDgs/fmj0v/789JvfoF1MfE/ymvpPy5tYV/kYpQ4Kf3j'
+        '/6L0dz6R69HnXY0yF6vRu8urUcFELJiIBatRwWAsGIwFg7HgDqZgPhbMx4L5WDAfC+5gCsZkwZgs'
+        'GJMFY7JgTBaMyYIxWTAmC8ZkwR1MwbQsmJYF07JgWhZMy4JpWTAtC6ZlwbQsmJYF07JgWhbcwRQM'
+        'zYKhWTA0C4ZmwdAsGJoFQ7NgaBYMzYKhWTA0C4ZmwdAsGJoFQ7NgaBYMzYKhWTA0C4ZmwdAsuIMp'
+        'mJ0Fs7NgdhbMzoLJVjBCC0ZowQgtGKEFI7RghBaM0II7mII7mIKBWjBQCwZqwUAtGKgFdzAFc7Vg'
+        'rhbcwRTcwRTcwRTcwRTcwRTcwRTcwRTcwRTcwRTcwRTcwRTcwRTcwRTcwRTcwRTcwRTcwRTcwRTc'
+        'wRSCqf6zF3vdf6Z4n+J9ivfx3cd3H999bve53ed2n9t9YPeB3Qd2H9h9YPeB3Qd2H9h9YPdJ3Sd1'
+        'n9R9UvdJ3Sd1n9R9UvdJ3Sd1n9R9UvcR3Ud0H9F9RPcR3Ud0H9F9RPcR3Ud0H9F9RPcR3Ud0H9F9'
+        'RPcR3Ud0H9F9RPcR3Wdzn819NvfZ3IdyH8p9KPeh3IdyH8p9KPcx3MdwH8N9DPcx3Odvn799+vcD'
+        'AXOf++mh84+yWy6dbi+fK7p8rujy20qfLM8P/dzFbvJ95d2kqKsXdfWi3aSouRc196LmXrSbFPX4'
+        'oh5f1OOLenzRblLU6otafVGrL2r1Ra2+qNUXtfqiVl/U6ot2k6KOX9Txizp+Uccv6vhFHb+o4xd1'
+        '/KKOX9Txizp+Uccv2k2KGn9R4y9q/EWNv6jxFzX+osZf1PiLGn9R4y9q/EWNv6jxFzX+osZf1PiL'
+        'Gn9R4y9q/EWNv6jxF+0mRf2/qP8X9f+i/l/UnYvGQNEYKBoDRWOgaAwUjYGiMVC0mxTtJkVDoWgo'
+        'FA2FoqFQNBSKdpOi2VA0G4p2k6LdpGg3KdpNinaTot2kaDcp2k2KdpOi3aRoNynaTYp2k6LdpGg3'
+        'KdpNinaTot2kaDcpBpNp/qvz1Xy/9jh+NV+i4WtM0ZXSv/Srckf7wZviVj/4yb2+dH78oh+Yn794'
+        'HdFd5dcRHQaufuFxe8SCF+Z88tq/+klx2/+LTxpJgYa3lzQ8Lg/ML5WeSPve0r/znuC5tuyT/vMD'
+        '4i1P+2p8gMCHHv0k5G8Ej9XC5TtdLs8RT91zROlNNFfuuZalm+SNLr9cinPq9r6+b/22b3lv33d8'
+        '23vf9Z53fkdf6YmKvtcFz1Q0lBrLJ0p/9I9Kf/TZ0h/VBV8j9CsXV03/w6Hk6V8fgAnKM5VnKc9W'
+        'KpVblecoz1VuU8JKlXK7Uq08T6lRnq+8QHmh8iIlorxYqVVeotQpL1XqlZcpDcrLlVcojcodyiuV'
+        'JuVVyquVZuU1yp3KXUqLcrcSVV6rvE55vfIG5Y3KPUqr0qa0Kx3Km5RO5V4lptynvFm5X3mL8lbl'
+        'bUqX8nblivKAElceVB4KyiPxf3ch4DcJqCCggoAKAioIqCCggoAKAioIqCCggoAKAioIqCCggoAK'
+        'AioIqCCggoAKAioIqCCggoAKAioIqCCggoAKAioIqCCggoAKAioIqCCggoAKAioIqCCggoAKAioI'
+        'qCCggoAKAioIqCCggoAKAioIqCCggoAKAioIqCCggoAKAioIqCCggoAKAioIqCCggoAKAioIqCCg'
+        'goAKAioIqCCggoCKQEDu/E0Bo8F28OHyN8pe+xPPL90zvq/0R387VGoXixeXGBPlS4xbabmVlqB8'
+        'RHmW8mylUnmfcqvyHOW5ym3K7yhhpUq5XalWnqfUKM9XXqC8UPmo8iIlorxYqVVeotQpL1XqlZcp'
+        'DcrLlVcoH1MalTuUVypNyquUVyvNymuUO5W7lBblbiWqvFZ5nfJ65Q3KG5V7lFalTfm40q50KG9S'
+        'OpWHlHuVmHKf8mblfuUtyluV31V+T3mb0qW8XbmiPKDsKnHlQeUTyp5yVfmk8inl95U/UP5Q+SOl'
+        'oPyxsq/8ifJp5TNKUTlQ/lT5bFAeif/7p/aXyc7e8uV+meyvXuT728v5Dst3WL7D8h2W77B8h+U7'
+        'LN9h+Q7Ld1i+w/Idlu+wfIflOyzfYfkOy3dYvsPyHZbvsHyH5Tss32H5Dst3WL7D8h2W77B8h+U7'
+        'LN9h+Q7Ld1i+w/Idlu+wfIflOyzfYfkOy3dYvsPyHZbvsHyH5Tss32H5Dst3WL7D8h2W77B8h+U7'
+        'LN9h+Q7Ld1i+w/Idlu+wfIflOyzfYfkOy3dYvsPyHZbvsHyH5Tss32H5Dst3WL7D8h2W77B8h+U7'
+        'LN9h+Q7Ld1i+w/Idlu+wfIflOyzfYfkOy3dYvsPyHZbvsHyH5Tss32H5Dst3WL7DQb7/Q/D02fVr'
+        'vh+4pfyFN/Hea3+Uqnjn93x7X+nbcoLV+Huv/anEb3+dv/Jv31Iackvnb4r75dI4/LWLTAyUMxGR'
+        'iYhMRGQiIhMRmYjIREQmIjIRkYmITERkIiITEZmIyEREJiIyEZGJiExEZCIiExGZiMhERCYiMhGR'
+        'iYhMRGQiIhMRmYjIREQmIjIRkYmITERkIiITEZmIyEREJiIyEZGJiExEZCIiExGZiMhERCYiMhGR'
+        'iYhMRGQiIhMRmYjIREQmIjIRkYmITERkIiITEZmIyEREJiIyEZGJiExEZCIiExGZiMhERCYiMhGR'
+        'iYhMRGQiIhMRmYjIREQmIjIRkYmITERkIiITEZmIyEREJiIyEZGJiExEZCIiExGZiMhERCYiMhGR'
+        'iYhMRIJMLF/e+Vze+dw8zx27BHrpteb+1LzzWfk/Vthg9bu3dL9zs30d6l9ZYX/94j7jl0zretO6'
+        '3rSuN63rTet607retK43puuN6Xpjut6Yrjef683nevO53nyuN5/rzed687nefK43n+sN5nqDud5g'
+        'rjeY6w3meoO53mCuN5jrDeZ6g7neYK43mOtN5HoTud5ErjeR603kehO53kSuN5HrTeR6E7neRK43'
+        'ketN5HoTud5ErjeR603kehO53kSuN5HrTeR6o7jeKK43iuuN4nozuN4MrjeD683gejO43gyuN4Pr'
+        'Td16U7fe1K03detN3Xrjtt64rTfs64OBt3oB4SMgNIDQAEIDAQ0ENBDQQEADAQ0ENBDQQEADAQ0E'
+        'NBDQQEADAQ0ENBDQQEADAQ0ENBDQQEADAQ0ENBDQQEADAQ0ENBDQQEADAQ0ENBDQQEADAQ0ENBDQ'
+        'QEADAQ0ENBDQQEADAQ0ENBDQQEADAQ0ENBDQQEADAQ0ENBDQQEADAQ0ENBDQQEADAQ0ENBDQQEAD'
+        'AQ0ENBDQQEADAQ0ENBDQQEBDIGDt/KOzfyq42PqNL/rYH/TSt5R66U3RM9evPTDx/3h+7FkvPVj5'
+        '8/cyfih44+J/evTTiB3B47lxcTJ6dflk1CJiLSLWote2SFqLpLVIWouktUhai6S1SFqLpLVIWouk'
+        'tUhai6S1SFqLpLVIWouktUhai6S1SFqLpLVIWouktUhai6S1SFqLpLVIWouktUhai6S1SFqLpLVI'
+        'WouktUhai6S1SFqLpLVIWouktUhai6S1SFqLpLVIWouktUhai6S1SFqLpLVIWouktUhai6S1SFqL'
+        'pLVIWouktUhai6S1SFqLpLVIWouktUhai6S1SFqLpLUESfvNCwk/WZYQJSFKQpSEKAlREqIkRJ2R'
+        'o0BEgYgCEQUi6owc5SLKRZSLKBdRLqJcRLmIchHlIuqMHMUjikcUjygeUTyieETxiOIRxSOKRxSP'
+        'KB5RZ+QoJVFKopREKYlSEqUkSkmUkiglUUqilEQpiVISpSRKSZSSKCVRSqKURCmJUhJ1Ro7CEoUl'
+        'CksUlqgfZZSZKDNRZqLMRJmJMhNlJuqMHHVGjhIUJShKUJSgKEFRZ+QoSFGQos7IUWfkqDNy1Bk5'
+        '6owcdUaOOiNHnZGjzshRZ+SoM3LUGTnqjBx1Ro46I0edkaPOyFFn5KgzcjRgvPkFB8RjMQ5Ggq8t'
+        'KQ2X0mC4Id9I81uXH090c14bnH8Az49f43n58vOnzsvPt4LW9uJS63nfLeUvjo/fcUv5a93jP1/6'
+        'o9K3ysd/9pbyl8bH54Lb8P98vgf+p2AP3C79+sHSr/9OsATuBP/g4HNr3156trj8U+gqb4p/N3je'
+        '+L/c0E+4Bdv+75b+ux/3zfu/nn8t7zuDjwP57ctb2stb2svvFPhSLmeDi967roX3Buy6H7m4g/qw'
+        'Y1HcsSjuWBR3LIo7FsUdi+KORXHnobjzUNx5KO48FHcQijsIxR2E4g5CcQehuINQ3EEo7iAUdxCK'
+        'OwHFnYDiTkBxJ6C4E1DcCSjuBBR3Aoo7AcWdgOJOQHEnoLijT9zRJ+7oE3f0iTv6xB194o4+cUef'
+        'uKNP3NEn7ugTd/SJO/rEHX3ijj5xR5+4o0/c0Sfu6BN39Ik7+sSdeeLOPHFnnrgzT9xhJ+6wE3fY'
+        'iTvsxB124g47cYeduONN3PEm7ngTd7yJO97EnWvizjVxp6p4cLL4nVKfL31QVPxdwdT86MWB+VXl'
+        'A3M3Gd1kdJPRTUY3Gd1kdJPRTUY3Gd1kdJPRTUY3Gd1kdJPRTUY3Gd1kdJPRTUY3Gd1kdJPRTUY3'
+        'Gd1kdJPRTUY3Gd1kdJPRTUY3Gd1kdJPRTUY3Gd1kdJPRTUY3Gd1kdJPRTUY3Gd1kdJPRTUY3Gd1k'
+        'dJPRTUY3Gd1kdJPRTUY3Gd1kdJPRTUY3Gd1kdJPRTUY3Gd1kdJPRTUY3Gd1kdJPRHcj42KNXo8Qv'
+        'lN/g+82l4+GT7YVJxdL/8u8o/S8PNqr3fVXezvDxi5a6Jjg9gtMjOD2C0yM4PYLTIzg9gtMjOD2C'
+        '87/bu+7AOIqrb0knnaobNr2KJsvYMr3EmMj22RaWTkKFA4w5Vncrac/XsnfnAjghpNlEAZKIVJIA'
+        'XyCE3nsIoYfQQmghhBBCCwFCaKHz7e48aVf7Zla3M7tnQ+APfvbc+d3vvXlv5s2b2dkICZwICZwI'
+        'CZwICZwICZwICZwICZwICZwICZwICZwICZwICZwICZwICZwICZwICZwICZwICZwICZwICZwICZwI'
+        'CZwICZwICZwICZwICZwICZwICZwICZwICZwICZwICZwICZwICZwICZwICZwICZwICZwICZwICZwI'
+        'CZwICZwICZwICZwICZwICZwICZwICZwICZwICZwICZwICZwICZwICZwICZwICZwICZwICZwICZwI'
+        'CZwICZwICRwdCoW5Z1boGbH238hwvXErj37kPS/nRtaPJJZrcdRxfkVuuFZOx+3td1XkCkPXDk/p'
+        'ktSckh5combSee1rI4WhG1eONGkDde3y83IGnE/gVwQuIPBrAhcSuIjAxQQuIXApgcsIXE7gCgJX'
+        'EriKwNUEriFwLYHrCFxP4AYCNxK4icDNBH5D4BYCvyVwK4HfEbiNwO0E7iBwJ4G7CNxN4B4Cvydw'
+        'L4E/ELiPwP0EHiDwIIGHCPyRwMME/kTgEQKPEniMwOMEniDwZwJPEvgLgacI/JXA0wT+RuAZAn8n'
+        '8CyBfxB4jsDzBF4g8CKBlwj8k8DLBP5F4BUCrxJ4jcC/CbxO4D8E3iDwJoG3CLxN4B0C/yXwLoH3'
+        'CLxP4AMCHxL4iMDHBD4xoGNSGcEywHLACsAAYCVgFWAQsBqwBrAWsA6wHrABcDLgFMCpgNMApwNu'
+        'ATgDcCbgloBbAW4NuA3gtoDbAW4PuAPgjoA7Ae4MuAtgI+CugLsB7g64B+CegE2AswCbAWcD7gU4'
+        'B3AuYAvgPMC9AfcB3BdwP8D9AQ8APBDwIMCDAQ8B/ALgfMBDARcAHgb4RcBWwIWAiwAXA4YAlwAu'
+        'BVwG2AZ4OOBywHbADsAwYCdgF+ARgN2APYC9gH2ARwJGAI8CPBrwGMAVgMcCrgQ8DjAKeDygBNgP'
+        'GAOMA8qAA4CDgEOACmACcBVgEjAFmAbMAGYBvwSoAuYA84AFwNWAawDXAq4DPAHwRMCTANcDfhnw'
+        'K4AnA34V8BTArwF+HfAbgN8E/BbgBsCNgKcCfhtwGPA7gKcBng54BuB3Ab8H+H3AEcAzAX8A+EPA'
+        'HwH+GPAngD8FPAvwZ4A/B/wF4NmA5wCeC/h/gL8EPA/wfMBfAV4A+GvACwEvArwY8BLASwEvA7wc'
+        '8ArAKwGvArwa8BrAawGvA7we8AbAGwFvArwZ8DeAtwD+FvBWwN8B3gZ4O+AdgHcC3gV4N+A9gL8H'
+        'vBfwD4D3Ad4P+ADgg4APAf4R8GHAPwE+Avgo4GOAjwM+AfhnwCcB/wL4FOBfAZ8G/BvgM4B/B3wW'
+        '8B+AzwE+D/gC4IuALwH+E/BlwH8BvgL4KuBrgP8GfB3wP4BvAL4J+Bbg24DvAP4X8F3A9wDfB/wA'
+        '8EPAjwA/BvwEcFI5zP+A5YAVgAHASsAqwCBgNWANYC1gHWA9YAPgZMApgFMBpwFOB9wCcAbgTMAt'
+        'AbcC3BpwG8BtAbcD3B5wB8AdAXcC3BlwF8BGwF0BdwPcHXAPwD0BmwBnATYDzgbcC3AO4FzAFsB5'
+        'gHsD7gO4b3lOHg5msnklk9ZXE03DlXG5vzA4snG4KpdXlVhe+9OUVbKcjUrJZDSfWSVr39s4XJtX'
+        'ZTkaS0q53Eh4uDImxYZkrbnB+EN0UJVSKUkd2ThUkQiX61eMJuW1sjoydM1wXV6V0rmBjJrS/h42'
+        'Fi8ryRpGGq7OqkpGVfLrRoar0to3pOTIcI2U6lcGC0ZjQCrkMyPDlao8KK/Vfm2LrJrJSoPaQiia'
+        'zeQUosOG4SnGj0VjGuF+KbZKV2t4ekpa1699LSnF5KFMMi6r+jcny3ElH83LakpJS0lNk6Erl08a'
+        'umrjcH1G1b4ia8ssOa9/sV5JZTPaaiwr5YdyIytHhutymYIak40GzQDVmuTCoGKYUF+HBdolddVI'
+        'YTiQklMZ3azLJ+m2DaSllDwyHFzaHWrtDXVrf9L+vfbzaWL51VKyoH1ctkDTcSApDRq/VKFKa7T/'
+        'Ny5oHNEE13aRf9CTV0cKiTcrJk3SCF87XNcLOiyWB0YKy8v0re5gQDN8oD3U0zOSqNH+rLfV6W1l'
+        '80cSDQHD7lP0v1c0ztdlJ6ZpfzFlJqbrf11ePiaqAVhHQ0f0tbbbZJYvOHS80EDjgkPZUivGpNbq'
+        'BOki5yOR8x1EBsZEVhnS7FqXH4rEHeogrnJMXE24s5dOcBckcRcHiVUmwZ7e7rbwUpu4KY0rjmtc'
+        '2dx40p4rjttzZfOe42VPa7F93KIFSXSNEtf8T1vhLy8/tWYS/Fcmax5RA47SHRpBTIJjTOrCfR0L'
+        'tS7tPborZKNTlS6k+rUYHceiupG0srWsNu3WGzqqlyY5kJfX5sfLrWrU29hSa8akVrT2LLfJq5By'
+        'q8aLq2zUmtjSak1pPa1H26XlpHV2aVoTW1rdmLTytiV2F1EG7C6iDLBF1ZtxG2rvQXaTkznZbje9'
+        'jS2wYUxgZWRZW7tdYuWaISVpExlsNBrZMieb1lvS2W23njay262nNbGlTbFYL4ysl0bWS7NFTTWJ'
+        'LQ7Ze6IiLg/YiWlNbGnTzL5Y0hdeZO+LgUI6Zu8LvY0tcLrZF4vaW9GoXEkmU1tfGI1smVuYY0p3'
+        'qLev227BKlXOF9S0PYhJK1vsDJPqQm3QtwdcZb8qS6vsVI1GtsyZYzKrF3WGe9vCfXZvrI5l0nkl'
+        'XbA5ZG3jaDtb+JZmZ3Vh0wayyLJVjVlHw25lNWyXNu9hw2ZlKY8Nq7eyxW5tGcfCi9E4lo6jcSwd'
+        'Z0vbxowdFIjl9jgMNDqF4bYmsaUhu7IVg3LeTkxrYkvbzpTW1YekZQtImtbElra92ReLQ+2hXjRT'
+        'xeWknJftfUFa2WJ3MElqM7ydZDqDSGpNbGk7WuYUbMAcNmDOyYA7mf4cbu2wK7zlCmnOCa1zjomu'
+        'hD/Mm3NwdGXz+F/YuoX+rZaRxIHG15qWl43PGRIH06jsbFqfJAs2MnXHxmc3HTtX+/+sw8YzaGix'
+        'fOT2Z3cxh4toOBRpbwvbrVDX1HBY7Yqda1Y2z5o9/oentjQdqx52bHrFzsfm9U/d/nbj6G8PXWEb'
+        '+PSfs/1YdYvxM65/ZFfLdNDZ3mkfucsOsSfph7DdZTdTVmvP0WiyqpRy6+yzVbDRaGTL3N2yhuhq'
+        'tfd6WZOdXhNb1B6mqG6KqFl2UbPYovY0vXGRsRyxjwUxbRbCYwFpZYttMhl2tC5HiVdKWoUSL72N'
+        'LXCWdcxagp1XG7MGlDRlzNJb2WKbzVGmtxtlrnkVZa5aE1vabHP+aEXLJSlnnz8kh/lyL8vq66hF'
+        'oS40X8prY3IWzZeklS12zpjYoGbE1vZ2u87BAX3Vm7TpXdMIzWzJc82Q6WjtXbTMHjIpKR8bsoeM'
+        '0ciW2WJ60aJWnL7HJJy+621sgfNMgZG2XjvHwBolP2QXqLexBe5tak1b0ZYdag9Fh/XsPpYROtoa'
+        '7gxH59l9aDZaIM92ELgvEri3XeAcJHCOg8D9kMB97AKbkcBmB4H7I4H72gW2IIEtDgIPQAL3swd1'
+        'i11iZWOLk8gDkcj97Rx3Rxx3dxB4EBJ4gJ1jczPi2Oxkx4Mtc0tbj32sCCSVHKoP6G1sgYeYAhe3'
+        'LUIC9UsE7QL1NrbAL5gFKl1gW2e4FY23tboIJZOW7MNufaP5Cfsn5pux2NvXhdfm+UIWr82NRrbM'
+        'Qy3ri8V4fRHH64u4w/pigTmot3Z1hdCCpUrKZmX7mqW6kbSyxR5mim0L94S60VyhpHOyiuYK0soW'
+        '+0VzNuvttLt8PmN3+XyGLarVdKe2MBIWUNJ2cVWNehtb4ELrcrKj88gQXk6mMqtlvJzUW9liF5k8'
+        'eylpS56StuQd05bFpv904oVbBi/cMk4Lt5ClhNLd2YFKKGomhUooWhtb4BLLfNjahsJ8jaSgMNfb'
+        '2AKXmjHY1dqHpuzKrFTIoRg0Gtkyl5kye9pDoS67zFxSlrN2mUYjW2abKVNbAqOaZaW21rVXLYON'
+        'RiNb5uFmbtUTWtQZXmxPAYM5OZZJx3P23Aqa2ZKXWyrdhmS7txMJdm8nrWyx7ZYgag0vRg5VpUrp'
+        'uN2ltCAyWtliO0w7LAz1RkIh+1Is2C/n18hy2m4HaGZLDluqUm2LlqOqlBJbhapSWhtbYKdl9bOs'
+        's7MHr36GMpkcXv0YrWyxXdb+ag+h+VPrr6Qcy+P+0lvZYo8w1e9pRUNeICetRqOT3sYW2G2pZne3'
+        '9eJqtqrkcTVbb2TL7LFEa29nN5KZy2dUJNNoZMvstYx7uOgeGEA1d23ccyy591kW0KFWezgFtMVt'
+        '3C5Qb2MLPNKSgHVigckMFqi3sQVGTIGdXSiCApmsPXyqGvU2tsCjLPW0vg5UTyukUD2t4BDjR1si'
+        'sb0P14eTBVwf1trYAo8xk+KevoW93a0oaKpzhf68KtnDprZxtJ0tfIVlbdoWRnQrU0q6gHYKjEa2'
+        'zGNNwh197b1tXWgpXZ0qJPNK1r6Wrm0cbWcLX2lJZds6QohwXknJiLDRyJZ5nJnOLbRTLe9fZ0/n'
+        '+h3oRS3FmLYj2xbjYoyyWonjYozRyhZ7vOlUh3eizatAIqMgn9fb2AIlcyZa1NmxEFeNgrFMqh+V'
+        'jWoaoZktud/soL4evPVcWdAPjds7yGhky4xZRs6udpSNVeaySXs6po2ceiNbZtwSVqGu1m5c4KvO'
+        'yVlJRSU+LaygnS1cRgvZA9FEl1eRIbSJzmhlCx4w97z7tHVSN6X4U1PQFkUqrgDVNY59wJY/aOk9'
+        'XT7qPV0E6j29kS1zyOTc3hmhc05m1tA5j33Alq+YnA35ds6GCDtno5EtM2HZ70I77Rm0055x2N1d'
+        'ZQ4J7aHwUlRbq0rK6UF7da26kbSyxSYtKU/bMTjlUU7AKY/WxhaYsu4S9IVRkMUyhTQKMqORLTNt'
+        'Wd32htCyTEuX0LJMb2MLzJgkl7R1o3pO5YCi5hBJo5EtM2vJUFopJSKJUiKSnAR+yRxcu0NHhrqR'
+        'uwdVebWs5tDgCs1syaol3Wtv60LpXlLJonRPa2MLzFm8qBOVRwK5jIp019vYAvNmB3V2L8bBaJx2'
+        's3eQ0ciWWbBW/Nt6entwxV/J5XO44q+3ssWutsyBfd3dIeTywVhBVWW702tzIGlmS15jKZa0deBi'
+        'iZaOoGKJ1sYWuNZSdMQTVSCOJqmqxrjjBLXOuiMdwTvSa/CO9Bq2tBMsSVnnYlwzyGfiuGZgNLJl'
+        'nmg5oHQULsBonYs8U29jCzzJ7O6u7s6l3a324SiYVTP6cVJ7d0MzW/J6k+oRfZjqlwqYqt7GFvhl'
+        'S1T2dqIw19aEKMz1NrbAr5jdjUtPFajwVNnoWHY62VJV7ejqpFRVjSOsqKpqtLLFftU6bGqG7KYM'
+        'm5rdVMqwaTSzJZ9iSm4LL2rvQ2l5UEnHkoU4kgzNbMlfQ4neQegw6AJ0GHQBW+DXkcCD0c4UEjjH'
+        'QeA3zNg8ui3Ubl+AV65T5GTcHptGI1vmN8eF0uK+RSFKKMULMZkSSnozW/K3TPWXhsIhWlY+KKdl'
+        'WlY+2s4WvsFydoFS1K2UcFU32Cg5l3U3mjK7W9twWVeVFFzWNRrZMk+1DKfLutHwXJkfUu0DtDac'
+        '6o1smd+2bMd2d6MzXJWyqmbQvGw0smUOWzPGjo5W+xbvXvYt3r3Ysr5j2QDqoe3USDnaTg1pZYs9'
+        'zUJxWQgVRitjQ3IMHS80GtkyTzepasld2xL7dFelJXHKwDo7VdLKFnuGJcsJ9/Sh0a9KTucKKiod'
+        'kFa22O9a9wjaFuGqY1KJ4aqj3siW+T1zRTe6fY425A9BO7+HOGzTft+coNpQHlahpNFukOKUf41Y'
+        'Knq96NywtsZGFb28g5ufaVlztHe24jVHMiPhNYfeyJb5A3OGX9jZaT8cEejPZJL2GV5vYwv8oeUY'
+        'Xyeq5gTCmTTKEPU2tsAf4T62n5Eom20P8NlseT/G8uxHJMrm2OXNYcv7iTVHwie9mu2imtmifmoN'
+        'kdYe+wK9rMUuq4Ut6yysJj640YIObjhI/Jllsg11L8LLlLLd7fx2Z0v7Oea3Hzqp0oxOqjhY7xeW'
+        's/DocGvZXDu3uWxJZ1sW4j1HLLSLWmEXtYIt6hzLNgZF1Eq7qJVsUeda6jcLu1vRCFp2ol3YiWxh'
+        '/2fZWKQKW28Xtp4t7JfmyZG+sLbW7lmEd5XKonaBUbbA8/Rnw6oyqjKopM0xtNK4HkR/JKxOGzJG'
+        'H/8aKQzXyGuzUjqnZNIjK82vT45GyX0i+rZGdJ7+Y28HNenS6OJ/uZ5qJRUpNxJOvFRBuL6i4cbh'
+        'oCEwvvfIBoNZeHhKXk5lk/pTd+QhuJHwcIPWkl8XVdJxbYrKjczSaXUXknInPFhoPBOnN4wUlp+v'
+        'i34jSH6COL1xmUlKX9SP8kq8EzTO0ppPKuW0lUpS+8l8yvwW5YzwcO2AkszLalQ/rLBB+9lq0zZy'
+        '4v2gbtrEBxrY1Ex8pLWBhomPjc8/0f6vaZKYVK39lIZlOi7/lQv6o19JBLV/OmZywqJMiMUFHCyG'
+        'G2IZbbVXMG6PsVgRCJULEfo1IlTbn8zEVo3/Ke5uTdRqv6J1Z6JO/zVPOvJCN4zHenInr3vyIh4a'
+        'vnblxYgRtZfslKpz0joqG3Y3bSyCzSWcbPRXotHYlAmxuZSPTZ22JFIG0y47qxhCl/ER2kYqDOpj'
+        'hRyPEmr6X6j0KoToXc5pL/KEGpVQQIjQFXyEao2n26h8KoX4XMnHp2H0mTgqpSohSlfxUarRn6ij'
+        '0gkK0bmas8eMchmVT7UQn2s4+Rg1KyqfGiE+13LyMepdVD61Qnyu4x8iZZVuoDohQtdz+jOzv+qF'
+        '6NzAOyQa5xiphBqECN3IOcMWGO4zWYjNTXxspuonh6NwTQeN1RQhVjdz+pD+2AKVzlQhOr/hpKM/'
+        'l0ClM02Izi2cQ5DxNAOVz3QhPr/lzWBlunW2EGJzK6dHS/F4NJ+JMl1ohhCr3/GxmkmeSYga4cak'
+        'NlOI2m2c7mQUyKl8thTiczvniL1GSqoFekq0lRChO/gITdZfER0dUhiZ/tZCnO7kNFJSSvXHJSqh'
+        'bYQI3cVpJP0MelQ/j03ltK0Qp7s5OemnudmcthPidA/nXKLfr0Wls70Qnd/z0Zmij90Oq+wdhEjd'
+        'y0eqPrcul5dT0ZQUUzN2RjsKMfoDYsQoCdk5TTee+4/qd9Xotdmofi+OpwWb+3iZ1TtxEivb3M/L'
+        'qca4gIdGSKxs8wAvoaAy4EOZ5kFeOrXGZVE+1Gke4mXUMJBRo7IUG/KhWPNHXlJ15GIgH4o1D3NH'
+        'm34/XCqb96Fi8ydub4rpFyz4ULN5hH9MIhdJ+FC3eZTbSimmlcQqN4/xj5ISoxYgVrl5nJuQfg2G'
+        'D7WbJ3gJTdafdmNncGIFnD8jVngvBu28kasP9W21jaPbaub2vLw2q479U9mLrOBJzBHt0GCOxmWP'
+        'dI7GP9cXNHjbEO7Mov+7scs3x33siY5/4dAxsa5G+x+VauLEGnOvcaxxPfq+7EWG9JTX/cPfCWKZ'
+        '1V95OuE0diecwbK3WMb1NJ3mOIdGWcS421rHcRqXuZt3t/Jx+xsHN+ttrzRmxDtH737l4/UM4oWy'
+        'YeSixp2sdCes0a8bMG6NRkNI4oUA9PoGPPAwDiVYbzVZbBwIo//s1GgUWJPDOHvjAaxqcchJQq1+'
+        '6WvUOCXg7SD9d/cGTlzODp0raeMX27KJa2qYH13H/pUbaL9ykz+j5LP4sAalL5ATbhGNml8zDmJF'
+        '96FMW+TOX7qW/jkk1YAMF/TEy/7BZcTEw2wXcPCpR9k+9bhLn3rSH596DpuDsqhGPjV6ofPmNLaV'
+        '3JWex/k4ffmPUxfj7mqO1MW4prqYtPmzaO8XcB2UVtlA1h67RJmRDo7eLPuZH/teRAZ0qseiMfAV'
+        'tiXInefuHTrxBltmlX6lQiqHXfpd9oD7Geqsl/zqrMRutcypZw/2R+ye4uuQxJxa5kctte4mx31q'
+        'fZkc/4m6oL4o438eDt6Hw8ucfZFYxvalw0vo7Uewvb3Hpbcf6Y+3/4vX2+EVFV7a2HjXtyeOXhLD'
+        'ixWNXuF17VX/O64tVu96lZY54jPetMyRvNekZJXq11wxHbPbRmQ3T3au/40f9MFb0sgt17NnHd7J'
+        'r05JD8mqkpfSMfl/dQZ83ePOSPy4lqemcTY72s91Ge3n+TOR/YfLUB+zVeazocM4e5Z301spukNs'
+        'entj8+iOTWxDsQnsTS4bBio/d2lGd4idD3pr8+iOTWxDseNMb3PZsPZzl2Z1h9hRrnc2j+7YxDYU'
+        'O3r2X7yQo55zQ2acWvm/kMC+i/eaKEfukHG2r+RbTmzJ+e8+QxZ/z2uLJ3as4wnd3eqYH+1R5y50'
+        'Z9X5smZ433NLbWJziOXsH1BKUrSzqMggjf8TI9mH2FtSRXhLk8OIVOrdW/1YiMmZHAbad6SURvyI'
+        'knGgk7zIhnPZNhx7n30pN8HfC5bW9T7GVsPHjZHV9nPteZvh7FlqU3/isakTa+rcHUlbz54nvsKe'
+        'J2hmSpziy7TZMakM2Yj5LBzlEHiol2uX9JBivdkLN+gowzrWFaXfZqRDOdahiEt43Gn0xZJqVOGJ'
+        'RomL2HG0hB3Il1oC2ZM4CviuTbsrbYSyx45K37XpdqWNUO21o8p3bY5ypY1Q6bIj6Ls2x7nSRqiI'
+        '2FHtuzZxV9oI1eA6asoo1/Hhq7/Q5i/KILx4lLqjtoz2vBnt4i87odP9IVSHCVGu/bKTOdMfMvUU'
+        'MvhGEuRpCc602iFdqDd+NqloSx8p6e0k28CnpMPeHVv/xLvsIGRrn/jA66l4Mp/ODps7pdBZbMKe'
+        'QtEZ39aEdM764MzGz/rizFP5lFzN7oet6nl6b9t6jz12Gp9iDlGaLYHOYh47nU9nhygthc5iiegW'
+        'lPSAcokZUvok78O0gfyuL3E6g1NNB39mWyBxGFffLvQ6hmdyKu3g0KVQWiyItyyj3B0gTxTDdwY8'
+        'd+c6/Vd9ceatuFR0cGW29onjuHpV8tqVt+ZS2cGRS6GymCNvg1VmX6CIVD/FdXF+xN2I7oknb+uT'
+        'jon19ZR69U/Y3z+53pdS9nZC+m1wqd8Ih35iPrp9SfXj6T+x7GgHIf2uCvjff2KFux1Lqh9P/4mV'
+        '8nYS0u+0EsSfWHFv55Lqx9N/QoffOnbB+k1wXS9S8mzXE+GVm2AibBRX9AZ2NN5N6022mol7/ZkN'
+        'dxVX8nw26Ysr/ddfbLbcjVJfwFfyI52vZ/vjBNcMPIT+pSfOurvXeiSeZ6fcj7F0EPPFPfh0uIVL'
+        'B2Y/iPnTnqXUgdkPYhlWE58Od3jbD2JZ1KxS6sDsB7FMqZlPh3u97QexbGh2KXVg9oNYxrMX5WAQ'
+        '7T0pSIun2Fp8gZ0ZXOlpmcD7EzlzNhdzJJoaKDnEOWxRsxs8LoHN9cEUz7rU12GFQ9FXbHZr2Qz0'
+        'dde/YjPhPF59X2IrVZoocOcVYnPt3p9aK7nzJbHZfB9eK10S+FT5kli+sO+n1krufEksI9mP10qv'
+        'fbrGJaH7+Dv2/9RayZ0vCb0hoOMAXiu99enyJaG3FnQc+Km1kjtfEnqVQsdB2EqsN10hQ73P1qs1'
+        '4N2KKFFfxS7d+XZrf8fBpbZM4qoGd9sFbLskrmvwpfZ8yOZhk1UBT20itsL6goBNJlW5U3zEW2cQ'
+        'W2rNL6HiHkeB2Orp0BIq7rGriy2IFvgT/qVwdbE1zmElVNxjVxdbtnyxhIp77OpiK5FWAcWrNu2o'
+        'Lra4WFhCxT12dbH1wqISKu6xq4stARZTFGe8WBYpPr3Ku6yd94IDT7L9kIARtuYxQmLeZOauGNsA'
+        'iX0n+5LYLxFQ/xKulW/pLCOW3i+lWIbx0j5kmR1LFQKfwTs+Opb5Yngnv+vi8rueyTz3bh05mfnR'
+        'UZPdXSCywp8hoU3A/tM/t7/wwHO4gP23/tz+wuWN5WXUq8SGbG9tt7/wsNr4jhSPe/r29I52PjYN'
+        'xndyhf68KsXynr48vaNDhFKqkMwr2eQ6T1+f3hHmo1RnfCeurFbisqcvUO/opDxxhRzEg8eOzgmU'
+        '8jxRl8daJS6eTIlrh+u6Lpvs8bGgI7g02q3KnUYOGzsUjcRCobskGrnrI7FY6uHSqNnXPhIrJPeW'
+        'RCN3fSRWIe6j3ExDn4KQWvOqvHzExPtB70h+1Q5g99hzk909VPGi1yNfhKUWmqGRWvNd99iyqlL2'
+        '2FH8qi1k99i7tB5jK5b4wOseO5pysIGWwCClwpt5fx2DFavP5VUlPThR/gbfSmSUtLdp9wpeSqPf'
+        'ymWTisd597GinArZrKx6m3ivFOWUzKzBnMTyheMocUJzFBQnva7jZL+SzkRR7xVL7DuFMqodz/7+'
+        'AVM8HtWOL5VSy1wpJRYWEq9Sx7hUyiHHoyglFlf9pVLKnfuJpeKxUinlzv3EsvE4e1QePy8hrQY2'
+        '81RB5tYsybb/Kpf9lfZ6DBxgazV+zkZara0SP4rpSccM+qGCyv7oZK/7YMgPBU72emJRuFl+mcdT'
+        'aAqITSIJPxRw5ydiE8YqPxQ42esZIMlmOT7jRiy/vrmMKCk/VHDwlMu8HlHSfihwmdcjSoab5alc'
+        'I8plXo8oWT8UcOcnYiPKl/xQ4DKvRxSVssVmXDkzQYmGXIUtpwfzQ96WaHJ8hMh3BhQ153F5Js/H'
+        'h9xknZQwHbG4LvDRIVeXq/JqWc15vCe6WsRAuYyKDCQWdmsoKz+as6Ko+wE76s4o6WJorQ8ayOyR'
+        'u2yqxxPkOh/4r3LFXyzETvCBP4WkWNSdyEvyLB43p/EXC9OTfODvzsnF5s31PvB35+Rij8B82Qf+'
+        'FJJij6t8hZfkuV45udhTJyf7wN+dk4s9PPJVH/i7c3KxZ0BO8YE/haTQ8xpntp84yfiv42usRGp8'
+        'VovIXsomewFPP/iR03y9pLo5xPjxXmc73yipZsd7nex803v6x3ud63yL9aKgccsrRPHqT0FcbCil'
+        'ag5hcYrXYbGxlIqd4nVUnOo5+1O8DopvU8pL1EU+YnljSVezw9w8b2Vb81yv3fU7zHeRWQsUiOJd'
+        'JTXlaXwk72Pb8Qqv7Xg6ZToxHnBxLgZNM74jr9WUydm+6klR8QwRWnE5KedlOi0xa30X03KwBOrY'
+        'h7me1vXBMb8npofDM0wPu9RDrD++z9KD6gJuLpsvbX+MiOlxdqVneoj1x5mUsI1LEyvwBNuhnq7y'
+        '5fb3H3jP9LkqX+54/6ErpmNsXq5ivNxVLNH6ER+b11lsxHKqH9O27Nbl8nJqon58h92PH/rjcT/h'
+        '5loedM9VzOd+ys21moOrmEeeRXmIp5Cb6AndyUG+B/w3xd0YP/NYw8Qu03x5Yv3nXDxnuOFZzAPR'
+        'u03z5XnwX/ivnSfrzLO5eDo8se5xL4htQ53jv3aebDedy8Vz25LFgthm1P/5r50n+1G/5OK5c8l6'
+        'QWy36jz/tfNkV+p8yvvdjFdlKalsRp3oxSZXcl7FM+NTNMP/yicLJXJsf3WYmVb7kx9csAm0dBj5'
+        'V3PF8jp/sotfb+628SQ3uXATaLltsFQeIJbZXLS528aTvOhi2g6/lOqPS84KOo/ZewRLWa27xBcd'
+        '9gqWslJ3KaWOs06Rk/EJ/Gyfklr6Mk6WB7H9+q5pHu+gXM7JcYErjmKzyxWcHL/GLpA73NNyesCN'
+        'ZmIzypUUzaQiXpe3uKR+fBWFpSopE+bqh5eU5dWcLLvYnvyq19F2jeeWTBzpir5YIF7rvYnd0ReL'
+        'tusoM5+Uy8kTpif9QbfPMx9bUte/3nvFEvXTPfb9G3hJDhVHsgjbJ6ZM9zgibvRZKU/8/iZekmlf'
+        'LS+24LjZZ6U8WS/8hpdk3lfLi5VPb/FZKU9qp7+lTFW5pBKbaKo6gbPutrm/xPdWSqetkZJqISey'
+        '6ju5pNPc7yh3GufXZeXokJLOi6jhcO/5FOMHpHQ6k5fySiaN+/GQkvbjbfw2SMjTee5aHvI6Ebgd'
+        'q8C0sv2IHK0bPTmydwc/qcQ3g4zjIWJ2ulOA0nDQl/MzdwlQ+l7Ql0M0dwtQ+hGLklhqco8ApUQl'
+        'g5JYIvJ7AUpZFiWxNOJeAUonsSiJJQ1/EKB0Z4BBSWyX9D4BSj9nubfYhuj9lHPhMSmZFJmB33B4'
+        'DEZSB3N42n034Ms5twe4lEtcx55a2aqxdRCbOB7k66CpUj6vKv2FvOZcsZicoxjdQZcbacsSpoJi'
+        '09BDfJ10L40iT/eIzVh/pLHPpOOKY+ZTm8wMKpqS0Yxa/MMKG4qg8zDtkTz8W/hKFviOlI57S+hP'
+        'rgg1OX5p7MPyzm7G2EPXZFwgDgczatTI5TlVeoS250b5VaaRtbHeWyM/6o5Rk/O3xj6taA0vntDO'
+        'VmXG27laEypk6Mcc1LL+LIquWCaVlVQll0l7a+fHOQkFpHwmVfzjP8VQecIdFbPLK8KdrPd6UQ03'
+        'bowfrtZkC/Xpn/3gPd6+48Z1ccZPUkYwip1wijSOlHntvPlvo5ks/pyqi1ga9Beswfhf8WRhXowt'
+        'n3LLpCrc17Ew1E3nIhZBf3XNhfqevgmX4sVwebpILk1F5dj0EuUECdBwreaVclooVP7m1qQNA4V0'
+        'TM+UonrGV/xlXsWQecYtGXbKPOGqvRg+f3fLpz5X6M/FVCU7LpWccLleDJdnXXMhT7AreVmVUD8F'
+        'hbj8wy0X2mu8JlyeF8PkOfc9RHuvwYTr8mK4PO/aKpR786SJLsIphskLrplQno6WJrrtphgmL7pm'
+        'QnkcEJjUCzF5ifI6Gfq8bqcUXNodau1lzWhi8/w/uVkF2kM9PW4n2WIovcxNqQEMFQ0d0dfa7nbS'
+        'LYbbv7i51ermciImVlN4hZtYlcGJ0ZNidfBXuUnVaJm7k7HEiuGvUQaFcQmQnU5FrpDydln4b7cU'
+        '6uNKjDmbimW1r2Mu4xRG41FWzcQLMY8LEv8pjkUT/dOxlPWX7B1pxHt87aFCf20eJ/k3vCF/oXvy'
+        'sMjW5PXzkn8Tk0e/VlR5QswB3iqeRhP7G2O2vNzhaAJtvTzqBalCkteQb3urwbUuNRh1hbiymleD'
+        'd7zV4GaXGozWXwaSmYwqoMZ/vVXjNpdqBEZdKcM9oLzrrQb3uNSgEjTIZtbwavAeZfKnL92LLINt'
+        'PnuE73OrlthzhkdbUGI59ge0ZZHVhLhPqBWi4YZoVP930VxeUqP7eVuD/LBIkuZJLItxPVmKfOTe'
+        'TE6b3Ie4PSM43rz7j3h6dPljt8ol2mYwN7nZqiXaZ3h8nPkTj5w3EZ7h8ZnkSeVumdUb3btaUukD'
+        '2PwZHh9ILit3GVMyjimxYz/l5R71nsMjFnSrenKuuMLrLnZQY/KqNU6KiB0sCrj0BCYbT84UVWI2'
+        'dLuhQenyYOkvPKjCbFnWQXzv2QR8g5gve+fC3Zz2wCZQp5riLNSND3eqPOL6Ka8ng77klzXljDts'
+        '7eUf5FzuVZhPS0h90qvWB70SV7tSQCwfrPNDASZXsfSunsKVWkNEXJ9xcKKspFDS1JnRqFU0SVcP'
+        'wM72gj9+1eCDqon7aX71gj9+NdkPBV7wwq82btj4rRHEdwoldxjnGWjgpR+EKOYBHB+eoZnqmj7n'
+        '00OJl2d4/OzMNEy9IV/IJuWJXcX98Q/q3ODwpKFP5Zbpfuic+MAr5cQ6dAtflPPk3DU99meUU151'
+        'LgtOKy78z6c5ZKb3aiW2mlm6KWRLCn8lPSSrSl5Kx2S+oW14RjRqEULm9QO9HYy3ckd8zI5NM+3F'
+        'KE9KfltjOlVZbU2X4l0gNc9EU4CYwbYpmuEYhwP9sdW25ZRNCm1dKasOD3COC3VPzrBs555G4hV/'
+        'HtncnsMiMNzbv+bJeZUdOPiQFQ2DjljldkfmZMcgVVT2gjQa+2TLaHSceDKAHVSyjaKd/NA3Ic10'
+        '86SVmEPvzFrxTqjAI0H3HZaIzSxdNWIXH1RL5GeWrhrRiBRIvBc0fx6dqdKcPy+n5HTe2+F316Jo'
+        'NFE/NN9VP9PjhdJumNUNNWzj1PYnM7FV458f9MQ6uxfFo4n6ofkmNa+tswdm9ZCDdaqj4VCkvS0M'
+        'Sc4GT4+g7lkUlybqh+ZrYmf6EmJNmNvKOocQi0n2u9A8MdGsomg0UT80X2jntRM1Y1bWFRtiVdo7'
+        '0Wa7ZOe22HGN1+bcCxMO85rTk1MInnTDHJdahV12w+0zec4k3OV1583Faj7I23njSpGedEKLS3YP'
+        'uuyEx7w25zxM2LqOFo0FT4y6t0uOzTPdGfW5mb5cY78Pph3jNC3K4z2x674uCcZc2vUNj521UJj7'
+        '/99vvoA='
+    ),
+    '0990a594f368cfe492e5bb0ae832407a79d1e9fbf50d6fae1592ce45f538836f': (
+        'eNrsnQl8G2ed/ltFUdR0MlUvtVWn7lSVoqpqqx7q3apyIkdxbSVpDkq5jKuonYQkii0btUDAXMVA'
+        'uCPELe77vllYDnEssBYr9mCX/9ZQAUJtBQzq0GVZr5f/+873jZOyy7FdoC1NPp93ntFhRXr1fX7v'
+        '874zkmaWV+884Sj3374D5+z3bh+fGj8g93x7xyfLxUl3f+Wu4m3FybFCac8t7uVjpoqTu3fsGd9V'
+        'PvDEA+fsO7D/6MyBkaPK+w5YK0eORjzIMsSLLEd8yArEjxyDrESORTRkFaIjxyEB5HjkBORE5CTk'
+        'ZCSInIKcipyGhJDTEQM5AxlAzkRM5CwkjJyNRJAoshqJIecgceRcJIGch5yPXIAkkQuRi5CLkUuQ'
+        'FHIpchlyOXIFciVyFXI1cg1yLZJGrkMyyCCyBlmLZJEhZB2SQ9Yjw8j1yAgyiuSRDchGZBNyA7IZ'
+        '2YJsRbYhj0FuRB6L3IQ8Dnk88gTkiciTkDHkycg4cjNSQLYjReQW5FbEQnYgO5GnILuQ3cgepITs'
+        'RSaQSaSMTCHTyFORCnIbcjvyNOTpyDOQfcgzkWchM8izkecgz0WehzwfuQN5ATKLvBB5EfJiZD/y'
+        'EuSlyMuQlyOvQF6JvAo5gFSRVyM15DXIa5HXIa9H3oC8EXkTUkfejLwFeSvyNuTtyDuQdyLvKhf3'
+        '+3bcuqc0WRRlav/KsbHh3IaNm4fGLjwwvn/VrWOTxVuLt43dsmv81rKoXvuPmS4Xx26+fapYPvDC'
+        'gxVv6va9RfGXovBNFW+bmh7fdWC/f8y9dmzswP5jRuWd1sqqOL3/WOrloSK5fHJ6V1EVSPFs3s2T'
+        'eg/yXuR9yPuRDyAfRD6EfBj5CPJR5GPIx5FPIJ9EPoV8GvkM8lfIZ5HPIX+NfB75AvJF5EtIA/ky'
+        '8hXkq8jXkL9Bvo58A/km8rfIHNJEvoX8HdJCvo38PfIPyD8i/4R8B/ln5F+Q7yL/D/lX5E5kHvke'
+        '8n3kLqSN/AD5IfIjpIP8GOkidyP3IPciPeQnyE+RnyE28nOkj9yHOMgvkPuRf0N+ifw78ivkP5AF'
+        '5D+RReS/kF+7kj+KATh/tFKP0mVKvUqXK/UpXaHUr/QYpSuVHqtUU7pKqa70OKUBpccrPUHpiUpP'
+        'Unqy0qDSU5SeqvQ0pSGlpys1lJ6hdEDpmUpNpWcpDSs9W2lEaVTpaqUxpecojSs9V2lC6XlKz1d6'
+        'gdKk0guVXqT0YqWXKE0pvVTpZUovV3qF0iuVXqX0aqXXKL1WaVrpdUozSgeVrlG6VmlW6ZDSdUpz'
+        'StcrHVZ6vVIV7PKjSvNKNyjdqHST0huUbla6RelWpduUPkbpjUofq/QmpY9T+nilT1D6RKVPUjqm'
+        '9MlKx5XerLSgdLvSotJblN6q1FK6Q+lOpU9RukvpbqV7lJaU7lU6oXRSaVnplNJppU9VWlF6m9Lb'
+        'lT5N6dOVPkPpPqXPVPospTNKn630OUqfq/R5Sp+v9A6lL1A6q/SFSl+k9MVK9yt9idKXKn2Z0pcr'
+        'fYXSVyp9ldIDSqtKX620pvQ1Sl+r9HVKX6/0DUrfqPRNSutK36z0LUrfqvRtSt+u9B1K36n0XUrf'
+        'rfQ9St+r9H1K36/0A0o/qPRDSj+s9CNKP6r0Y0o/rvQTSj+p9FNKP630M0r/SulnlX5O6V8r/bzS'
+        'Lyj9otIvKW0o/bLSryj9qtKvKf0bpV9X+g2l31T6t0rnlDaVfkvp3yltKf220r9X+g9K/1HpPyn9'
+        'jtJ/VvovSr+r9P8p/VeldyqdV/o9pd9XepfSttIfKP2h0h8p7Sj9sdKu0ruV3qP0XqU9pT9R+lOl'
+        'P1NqK/250r7S+5Q6Sn+h9H6l/6b0l0r/XemvlP6H0gWl/6l0Uel/Kf210qM8avxX6lG6TKlX6XKl'
+        'PqUrlPqVHqN0pdJjlWpKVynVlR6nNKD0eKUnKD1R6UlKT1YaVHqK0lOVnqY0pPR0pYbSM5QOKD1T'
+        'qan0LKVhpWcrjSiNKl2tNKb0HKVxpecqTSg9T+n5Si9QmlR6odKLlF6s9BKlKaWXKr1M6eVKr1B6'
+        'pdKrlF6t9Bql1ypNK71OaUbpoNI1StcqzSodUrpOaU7peqXDSq9XqlZ08qNK80o3KN2odJPSG5Ru'
+        'VrpF6Val25Q+RumNSh+r9CaPmL4tL0+NT06JOdTOCc9RR40vTbKYl3l3je+aPGB9Zv/KTe7VzMSs'
+        'ZXL2tWrveOEpxe1j4gHkjG7NZwvLj5pZXj3qqKMPrnWNuAtey28aHhrNHtjvmyxuny4UD9wwct8N'
+        'd4iLg5s2DW3IHrC8+5cNZl31bR7ckN2Yl7veTRu3bHV3Nop7uTcObdiybfOQ3F1+4+bhre6e94Zt'
+        'w+7d/LmhDUObB7l2+ZbRoaFNcm/Fps0bs9vWqmu3buTvfdmhdcMb2B3Ob9q4eSuPun54lHtuHhze'
+        'ws2DW7YMcbN3dFg9oy2Dj3FvXJYbUrdsHFTPfyi/kduWrx0Vf+rubRrcxoMtzw9uXbueV6duFH+x'
+        'aWiQR7lxkJeyMju8duvwxg2Dm29yX9najRu2Dm/YxvNZu3lIvUjv1sER9V+tH1o7ol5XdmgDj7Zu'
+        '24a17pMUr9XVdRs3u7pl0H3Y5dmhUfZ8W4ZGh9bSBWvEw49wN17b8q3bNtEp3rWDqk+GNxzsE9/Q'
+        'Y9cObdrKe7hlhD9Yv3njjbzIYZ7WCtHZg6OjN6mnODqk3qXBg6/Y95ihzcPr3Nu98sW7O+KZZLnb'
+        'lpt4KSuGN6wd3Zal7zdt424bBvM8vRuHt7p96xlep3p267bNLjneoceq/2ft+o0beRHevOq9ZVvp'
+        'ZsHMMJys2DwkqIKUZeqt8wp2NtGvmxWgEeCdHjnaNcMt03sKUztKe8YK47t2HRC2snbcMnXgBhH2'
+        'BOteAYN4BhtvENnwjgPW5XLvWHnDMbt2lKfGdo2Xp+StI78UV/m3DG0ahGRxr7i8/3Xytn+VjzM+'
+        'Vdrt3vM66aDRNZsH13K/K+WjLStPu7fmVywTlzT3sSeLTy0K57p/dIl8iE2j27a4d3q7/JPlazdu'
+        '2+A+tZHV4n/yyZ1N8m5bhh/HI+927za68cahze7li+TllduF58d2jxcmS+7fdsV1K9ZuzK9xbSWu'
+        'cJ/Olm1598KH3C7YcsMa9wFMr3zAjZuz6gF/vcy9Wbxo9+Iv5UXfhm35Ner2M+T9vddvHN7gXjzZ'
+        'u9Rv5dKk22/5Afk3x2wTBWUzlIrrzpfXrdw9PmUdep75k9wHHx3akJOwiCtWyStW7J0sidLEY71T'
+        'PvVj3b/bvuOpO7a7XZc/Rd5vufs/uJc/7RG9FZJ7t3lkX5enJnfsufWw/+kXh1+9q1QpTrpXf1Ne'
+        'vdJ99ofu+2p55TFuFy89/Zd73C7dtnnzkHp/dsqnLlDestV9/0bWymeUF5WBi4+TF7cO54e4mBYX'
+        'j79lx67iWPE28b+VD3uzbluCY9eOqeLk+C732rj8+3XDmwF1ZOSwpz+9dy9Pf+RsCWh+2+jW4U3S'
+        'z+KaZ8lnlR1+zHCWN/6tLjxuSRWXavJS8ba9vPiPLzvsQct7xf/u3qkv77RudHiTe+m94tIqt/vL'
+        '0zdPTY7ztox83315G7OD/Lcvd//GrdfiUlRcCoxPiQe+eVpwOV4oFMtl95bPLD3a7uldUzv27rrd'
+        'vfrZrtG2rdkqDMQzvXupv7YXdxUfAPc/SCDor+KeW6cs98o7lt7HW3ZMYt/8FRIdUT5EOVPv4nny'
+        'Gt+WrZuHN+TcK/zyCm37jsIDOl9EF/mE3Oc5vn07nLscqs7aWdqxx732dNdYG2SFFU/ia25/Tt9c'
+        'Lkzu2Curj3ufU12Huq/lEGPXuTbesml0mNf7wjsOTI94ROmyNlibrBuszaIqbbG2Wtusx1g3iorz'
+        'WOsm63HW460nWE+0nmSNWU+2xq2brYK1XdSIonWLdatlWTusndZTrF3WbmuPVbL2WhPWpFW2pqxp'
+        '66lWxbrNut16mvV06xnWPuuZ1rOsGevZ1nOs51rPs55v3WG9QLhn1nqh9SLrxdZ+6yXWS62XWS+3'
+        'XmG90nqV6OCq9WrrXfJpr5Q+q1mvsV5rvc56vfUG643Wm6y69WbrLdZbrbdZb7feYb3Teo/1Xut9'
+        '1vutD1gftD5kfdj6iPVR62PWx61PWJ+0PmV92vqM9VfWZ63PWX9tfd76gvVF60tWw/qy9RXrq9bX'
+        'rL+xvm59w/qm9bfWnNW0vmX9ndWaHhH5xhqR//0J4r8vj3jdGLNti3oTR8bEc8q4pUl2qmcNSG6V'
+        'Pbpc9mjGWnaDmD2LlCM6407ru9ad+48ZGxvcsHHD2EUXHTj80sXikvUdcY0Yfga3rH/AbZc84FJK'
+        'XlohC5xbD+6UQ5KsmHdaHtGWi+YTbYW4wT+2YejGUbcQ32n5RTtGtJWiHSuaJtoq0XTRjhMtINrx'
+        'op0g2ominSTayaIFRTtFtFNFO020kGini2aIdoZoA6KdKZop2lmihUU7W7SIaFHRVosWE+0c0eKi'
+        'nStaQrTz5GsVA0V+UD6780W7QLSkaBeKdpFoF4t2iWgp0S4V7TLRLhftCtGuFO0q0a4W7RrRrhVt'
+        'VLS0aNeJNijaGtHWipYVbUi0daLlRFsv2rBo14s2Ip6FT4zyg6Nb3K4c3rB14wGe2ejGDXLPwxXe'
+        'ze6wdKeIN3K0F+/Hho1bx9y/5GZ3ULtz/8rRoS1bDl3vGXYfxCuvlTurcm5s23zYPTa6D7tC3eBe'
+        'Neje17dZjep3To/4Hs7+POhK16dvFaX9z+fPFUsuqyuX/Uq47FfWvGjfE+07on1ftLtEa4v2A9F+'
+        'KJpHtOWi+URbIdqPRPOLdoxoK0U7VjRNtFWi6aIdJ1pAtONFO0G0E0U7SbSTRQuKdopop4p2mmgh'
+        '0U4XzRDtDNEGRDtTNFO0s0QLi3a2aBHRoqKtFi0m2jmixUU7V7SEaOeJ1hHtfNEuEC0p2oWiXSTa'
+        'xaJdIlpKtEtFu0y0y0W7QrQrRbtKtKtFu0a0a0UbFS0t2nWiDYq2RrS1omVFGxJtnWg50daLNiza'
+        '9aKNiPZj0bqi3S3aPaLdK1pPtJ+I9lPRfiaaLdrPReuLdp9ojmi/EO1+61fTI375BnnkG6S5b9By'
+        'a0F0+oLo9AXR4QuiwxdEhy+IDl8QHb4gOnxBdPiC6PAF0eELosMXRIcviA5fEB2+IDp8QXT4gujw'
+        'BdHhC6LDF0SHL4gOXxAdviA6fEF0+ILo8AXR4QuiwxdEhy+IDl8QHb4gOnxBdPiC6PAF0eELosMX'
+        'RIcviA5fEB2+IDp7QXT2gujsBdHZC6KzF0RnL4jOXhCdvSA6e0F09oLo7AXR2QuisxdEZy+Izl4Q'
+        'nb0gOntBdPSC6OgFweWC6OwF0dkLorMXRGcviM5eEJ29IDp7QXT2gujsBdHZC6KzF8SbtDA9csxS'
+        'h52qOmxRdNii6LBF0WGLosMWRYctig5bFB22KDpsUXTYouiwRdFhi6LDFkWHLYoOWxQdtig6bFF0'
+        '2KLosEXRYYuiwxZFhy2KDlsUHbYoOmxRdNii6LBF0WGLosMWRYctig5bFB22KDpsUXTYouiwRdFh'
+        'i6LDFkWHLYoOWxQdtig6bFF02KLosEXRYYuiwxZFhy2KDlsUHbYoOmxRdNii6LBF0WGLosMWRYct'
+        'ig5bFB22KDpsUXTYouiwRdFhi6LDFkWHLYoOWxQdtig6bFF02KLosEXRYYuiwxZFhy2KDlsUHbY4'
+        'PbJy3wF3dp/bPOhOMvLBo+VQfexSZXgZlWGn5+ijjrK+i8wj30O+g3wfuQtpIz9Afoh4kOWID1mB'
+        '/AjxI8cgK5FjEQ1ZhejIcUgAOR45ATkROQk5GQkipyCnIqchIeR0xEDOQAaQMxETOQsJI2cjESSK'
+        'rEZiyDlIHDkXSSDnIR3kfOQCJIlciFyEXIxcgqSQS5HLkMuRK5ArkauQq5FrkGuRUSSNXIcMImuQ'
+        'tUgWGULWITlkPTKMXI+MID9GusjdyD3IvUgP+QnyU+RniI38HOkj9yEO8gvkflemR7SDRWHkV25N'
+        '2OkFPy/4eeHOC3deuPPCnRfuvHDnhTsv3Hnhzgt3Xrjzwp0X7rxw54U7L9x54c4Ld16488KdF+68'
+        'cOeFOy/ceeHOC3deuPPCnRfuvHDnhTsv3Hnhzgt3Xrjzwp0X7rwA5wU4L8B5Ac4LcF6A8wKcF+C8'
+        'AOcFOC/AeQHOC3BegPMCnBfgvADnhTQvpLmSQQaRNchaJIsMIeuQHLIeGUauR0aQUVemR1YtFbX9'
+        'qqj5KGo+ipqPouajqPkoaj6Kmo+i5qOo+ShqPoqaj6LmgyofVPkoaj7g8gGXD7h8wOUDLh9w+YDL'
+        'B1w+4PIBlw+4fMDlAy4fcPmAywdcPuDyAZcPuHzA5QMuH3D5gMsHXD7g8gGXD7h8wOUDLh9w+YDL'
+        'B1w+4PIBlw+4fMDlAy4fRc0HYz4Y88GYD8Z8MOaDMR+M+WDMB2M+GPPBmA/GfDDmgzEfjPlgzAdj'
+        'PgjwgZoP1Hww5oMxH4z5YMwHYz4Y88GYD8Z8MOaDMR+M+ShqPoqaj6Lmo6j5KGo+ipqPouajqPko'
+        'aj6Kmo+i5qOo+ShqPoqaj6Lmo6j5XJj1paRzCklnpx/+/PDnBzw/4PkBzw94fsDzA54f8PyA5wc8'
+        'P+D5Ac8PeH7A8wOeH/D8gOcHPD/g+QHPD3h+wPMDnh/w/IDnBzw/4PkBzw94fsDzA54f8PyA5wc8'
+        'P+D5Ac8PeH7A80OcH+L8EOeHOD/E+SHOD3F+iPNDnB/i/BDnhzg/xPkhzg9xfojzQ5wf1Pyg5qeq'
+        '+SHOD3F+iPNDnB/i/BDnhzg/xPkhzg9xfojzw7TfBeG4R8Lk9o89pZWT5ZFVAvvfOrcNLBX7l6hi'
+        'r1HsNYq9RrHXKPYaxV6j2GsUe41ir1HsNYq9RrHXMJuG2TSKvYbnNDyn4TkNz2l4TsNzGp7T8JyG'
+        '5zQ8p+E5Dc9peE7Dcxqe0/Cchuc0PKfhOQ3PaXhOw3MantPwnIbnNDyn4TkNz2l4TsNzGp7T8JyG'
+        '5zQ8p+E5Dc9peE6j2GtYT8N6GtbTsJ6G9TSsp2E9DetpWE/DehrW07CehvU0rKdhPQ3raVhPwxga'
+        'DtRwoIb1NKynYT0N62lYT8N6GtbTsJ6G9TSsp2E9jWKvUew1ir1Gsdco9hrFXqPYaxR7jWKvUew1'
+        'ir1Gsdco9hrFXqPYaxR7zfX48RLmE+X07C53UXpqeu+u4lh5ajcL5kNyddddaP2VPM51ktw7Tu6l'
+        '5d4WuXe63Ps3uReQe+ml42E7xM4Fcmev2LlY7jxd7AzJnfXuBFrsPF/s+OXOnNg5Te58UjwLvTz+'
+        '1OKYuz5+8JmM1MX1J7qr5WO3FqfG5Gc0xm6ZVAfbvin++iK58w2xs0Y+jRPdxfnJ4tT05J5DLycr'
+        'n9zx8o7/KXbi8qqcvOoY9ziR3AvLvWG5d73ce4J7DNA9GrD0IPLQmZg6i73HLB0r3CDvd1xZPLHx'
+        'cnnHrYf9l++Xt+ilvcU9D3xB+Qm3vyvWA678snzEK+SeJnv+arl3QF4Xcw/EyT1d7r1C/vGqQmn3'
+        '3tL0nu2H/n6lXOVbIfe+Iu97jdz7tty7Uu59Xe6dI/eeKfeOlXub5F7Kfa/dJ1TetaNwWLf/QB72'
+        'GC8/5dB/8UV5N798qUtXXSsfY6W8e0XsnCJ3vih21snbni3vfsJ4+fY9hbGlQ7Dbi7e4j/4T9wjK'
+        'jt0PYO5Y+RpMefO5Yuc4uXOhfGY3TxbHD3sez5D/6SVy7xy5d7bcu0XunSz/wqOOLRasQ39xlvtW'
+        'uGeuWzv2HHr+I2GXlfE920u7D135dnHlyZPF3SWJogBtjCOaB2/+qvifTnAP5cr/MyKv+rXYOdc9'
+        '9iivWi+v+nuxc63cebLsBfDdWxKPI8+lH5vi8NUV8qDUjlsOPfa/i786Ve58T+wMyp0NEsPCePmw'
+        'd+Zj6mhw/onyfztL7r3gaHXMc+SfxM6A3CnLo2b8v+qw2UHT5N8muyPgvjTxDpQmD3tDXyMfKOse'
+        'VnWhmBzfcdh/nb9R3qzJhw+JnTPkzs/Ezvnytu+Cx/jth+7+I3n38+Te3ytX7i2OH/a/teXtV7l9'
+        '6R5nreyYOuxd+w95a1Du3Xv0wcM6P5d7Cfn/NuQDVsZ3TU6XD/3JL13XFnYJLx5ELX+W51BP7J1W'
+        'BYQ3IL9Geu1CubfW4x5KHN998/bxQ4+3yj1UfIv8tNeuw17X1Tzb8R2HvZaL3Qf4zSLQkc/3TLmX'
+        'ccG8fUdx12GuTcv//2Py5dzP+7xr16Eb455Dh9MPXvcW9wXula9v6boPue/UzbtKhcNMcp/841W3'
+        'lCbHiuOHW6HpHuUs316eKu4+7BjkuLz6tPHpW3cX90wVt6tiJi8c4u5l4rnm5M4zxc5q9xicfHVr'
+        '5VUrxY4hr3qc+2TGH9g3o/J+q+T9fKqTiodBN/JEcWtU7hTdg8Xbt4u354Gmyyfdo7DTh9tgI4Vw'
+        'z9SOPdOHXT0kHuxS+SfO0VQC+b4vPc5l7hs6PiVe/d7DHv4k+QSTbg2S78iwfKDB3zDu4dxcLh9G'
+        'F2Vp+28MVifJ/7PwgOozoolH9Midkx84krmVYGkku9Il7Tfr5FHyyOUJ+0SncdrF2NabNnH8+j53'
+        'UfVEOYp35OVPyOJ5rwynZ3lukH910tIS1U+ZzM2RL+fIl3Pkyzny5Rz5co58OUe+nCNfzpEv58iX'
+        'c+TLOfLlHPlyjnw5R76cI1/OkS/nyJdz5Ms58uUc+XKOfDlHvpwjX86RL+fIl3Pkyzny5Rz5co58'
+        'OUe+nCNfzpEv58iXc+TLOfLlHPlyjnw5R76cI1/OESznCJZzBMs5guUcwXKOYDlHsJwjWM4RLOcI'
+        'lnMEyzmC5RzBco5gOUewnCNYzhEs50iUcyTKOeZ0cwTLOYLlHMFyjmA5R7CcI1jOESznCJZzBMs5'
+        'guUcwXKO6Drn5r2T/1LndO5Bzh2S/gd1wDK4NKl7qZrUtZjUtZjUtZjUtZjUtZjUtZjUtZjUtZjU'
+        'tZjUtZjUtZjUtTBdC9O1MF0L07UwXQvTtTBdC9O1MF0L07UwXQvTtTBdC9O1MF0L07UwXQvTtTBd'
+        'C9O1MF0L07UwXQvTtTBdC9O1MF0L07UwXQvTtTBdC9O1MF0L07UwXQvTtTBdC9O1MF0L07WY1LXw'
+        'XgvvtfBeC++18F4L77XwXgvvtfBeC++18F4L77XwXgvvtfBeC++18F4LZ7SwYAsLtvBeC++18F4L'
+        '77XwXgvvtfBeC++18F4L77XwXotJXYtJXYtJXYtJXYtJXYtJXYtJXYtJXYtJXYtJXYtJXYtJXYtJ'
+        'XYtJXYtJXYtJXcs1+Sl/DpO7hnOk4R5uSzi/1eSn7jsg7iSe9t+5Zw2dJs8aOnFsrLhLfupVBafx'
+        'ybGLmYZ4xUv7kdy7381sh+7l3vxe96TIoVF1Htnpy9zhfZmcDzDOzmP5eSw/j9fn8fo8Xp/H6/N4'
+        'fR6vz+P1ebw+j9fn8fo8Xp/H6/N4fR6vz+P1ebw+j9fn8fo8Xp/H6/N4fR6vz+P1ebw+j9fn8fo8'
+        'Xp/H6/N4fR6vz+P1ebw+j9fn8fo8Xp/H6/N4fR6Tz2PyeUw+j8nnMfk8Jp/H5POYfB6Tz2PyeUw+'
+        'j8nnMfk8Jp/H5POYfB6Tz+Puedw9zwA7j8nnMfk8Jp/H5POYfB6Tz2PyeUw+j8nnMfk8Jp+njMy7'
+        '3gsJxn4tM9ubJWKnLw0rL1fDSpthpc2w0mZYaTOstBlW2gwrbYaVNsNKm2GlzbDSZlhpw1gbxtoM'
+        'K21Qa4NaG9TaoNYGtTaotUGtDWptUGuDWhvU2qDWBrU2qLVBrQ1qbVBrg1ob1Nqg1ga1Nqi1Qa0N'
+        'am1Qa4NaG9TaoNYGtTaotUGtDWptUGuDWhvU2qDWBrU2w0ob4toQ14a4NsS1Ia4NcW2Ia0NcG+La'
+        'ENeGuDbEtSGuDXFtiGtDXBvi2vDQBrw24LUhrg1xbYhrQ1wb4toQ14a4NsS1Ia4NcW2IazOstBlW'
+        '2gwrbYaVNsNKm2GlzbDSZlhpM6y0GVbaDCtthpU2w0qbYaXNsNJmWGm7aBvuWuFOXVzYeZzcBHg2'
+        'xwPHCbzeE3nnT4Kmk3n1Qd6CU+jtU3m9pwFxCF5Phx9DPvAZcjMgN2fKjcl7dRZ9F5ZXnS03EVCN'
+        'QsJqgI8B0jl0WFze71y5SfBunse7eb686gK5ScrNhXJzkdxcLDeX8F6neHcvhbvLcMvl8g5XyM2V'
+        '2O4q3vyrAeMa6LwWv6VdcmU5+IRcZtt5nfy7jNwMys0auVkrN1m5GcKr6/BVDhzWy1uG5eZ6uRmR'
+        'm1Gsk8e4G+RVG+VmExjfgIk249Yt8patcrNNbh4jNzfKzWPl5ia5eZzcPB7HPwHrPRFfPQkKxyD7'
+        'yfJ+43Jzs9wU5GY79i/C9y3yqlvlxqI27cDeOykLT6EC7JJ32C03e+SmJDd78cKE3J+UmzK1aora'
+        'MY2XnypvqcjNbVj9drn/NLl5OpZ8htzfJzfPpEw9i5I/Q4V4trzlOXLzXLl5ntw8X27ukJsXUBxm'
+        '5f4L5eZFcvNiudkvNy+Rm5fKzcvk5uVUslfI/VfKzavkFR/beUDuV+Xm1XJTk5vXyM1r5eZ1cvN6'
+        'uXmD3LxRbt4kN3W5ebPcvEVu3koheBu14h2U0nfKW94lN++miL9H7r9Xbt5HtXy/3P+A3HxQbj4k'
+        'Nx+Wm4/IzUepbR+T+x+Xm0/IzSfl5lMUyE9TcT4jr/orufms3HxObv5abj4vN19gHPqi3P+S3DTk'
+        '5sty8xW3WJzxaDl46ObgdXLl6A/KoAMPh35xD3IuF0/5YRPNz3w04OJ2++mi2//gbjEf9p//2H70'
+        'Q/H5j7OORJEHFUUeJQmEyHXMHQeORJEjUWQkvHQI5F6WZmx4sDGNzbTZxvs21rUxgo13bN5/m5dp'
+        '4z4b9m2qi00BsEHYZtpsU45sbGADgY25bKi1qTU2UNpULJsOtuHNhlSbd9jGeTYw25QYG7/ZOMem'
+        '922mzTY1w6Ya2FQoG3PZkGgDsA3YNhXS5j2w4dCm8NmUTRub29QUmzfSpqzZlDWbwmVTi2wcYVPG'
+        'bOqUjadtqrVNfbbxiI2bbQqtDXg2xrQp2jblyYZNmzphg4xNzbUZFmxm5LaLw9lLazLPUWsyfdZk'
+        '+qzJ9FmT6bMm02dNps+aTJ81mT5rMn3WZPoA2GcM6QNXH7j6wNUHrj5w9YGrD1x94OoDVx+4+sDV'
+        'B64+cPWBqw9cfeDqA1cfuPrA1QeuPnD1gasPXH3g6gNXH7j6wNUHrj5w9YGrD1x94OoDVx+4+sDV'
+        'B64+cPWBqw9cfeDqsybTh7E+jPVhrA9jfRjrw1gfxvow1oexPoz1YawPY30Y68NYH8b6MNaHsT4E'
+        '9EGtD2p9GOvDWB/G+jDWh7E+jPVhrA9jfRjrw1gfxvqsyfRZk+mzJtNnTabPmkyfNZk+azJ91mT6'
+        'rMn0WZPpsybTZ02mz5pMnzWZPmsyfdZk+i7MkaWTdfeodWcH/hz4cwDPATwH8BzAcwDPATwH8BzA'
+        'cwDPATwH8BzAcwDPATwH8BzAcwDPATwH8BzAcwDPATwH8BzAcwDPATwH8BzAcwDPATwH8BzAcwDP'
+        'ATwH8BzAcwDPgTgH4hyIcyDOgTgH4hyIcyDOgTgH4hyIcyDOgTgH4hyIcyDOgTgH1BxQc6hqDsQ5'
+        'EOdAnANxDsQ5EOdAnANxDsQ5EOdAnAPTjgtCdN8BEcxF6vm6XHde/WeaN+z3bFznHv8Yk8c//qdJ'
+        'hHuSXWeZe2LS/+Ljqvf85sdVbXntP8tr/6QTi9g+zl7Mv8Q9seKcR/K01O3Id8v52R+9m+JLY6jf'
+        'wxh6tMcdQ12ZR76HfAf5PnIX0kZ+gPwQ8SDLER+yAvkR4keOQVYixyIasgrRkeOQAHI8cgJyInIS'
+        'cjISRE5BTkVOQ0LI6YiBnIEMIGciJnIWEkbORiJIFFmNxJBzkDhyLpJAzkM6yPnIBUgSuRC5CLkY'
+        'uQRJIZcilyGXI1cgVyJXIVcj1yDXIqNIGrkOGUTWIGuRLDKErENyyHpkGLkeGUF+jHSRu5F7kHuR'
+        'HvIT5KfIzxAb+TnSR+5DHOQXyP2uTI+cKzz/VFk63yUtnxCX7pbOuXCZvHjew7ECUCKlsx+yBbvz'
+        'RTd9Vz6Nr7rddMHSGWirZY2+3/2aE688AS25lFBCKqHouFvH3Tq21rG1jq11bK1jax1b69hax9Y6'
+        'ttaxtY6tdWytY2sdW+vYWsfWOrbWsbWOrXVsrWNrHVvr2FrH1jq21rG1jq11bK1jax1b69hax9Y6'
+        'ttaxtY6tdWytY2sdP+v4WcfPOn7W8bOOn3X8rONnHT/r+FnHzzp+1vGzjp91/KzjZx0/6xhZx8iu'
+        'ZJBBZA2yFskiQ8g6JIesR4aR65ERZNSV6ZEL/6JPPfv3ox/sqWcX/b5++WP1h+yL57ifxJdntz5U'
+        'Z+j81n64+MiarlrT/TOt5B45gvy/WLbdf4z7NZryXHh3wvMROcyxlOuuiMvrvNJXD8m6Lgve195x'
+        '4H9c4H1YLeu6Byzck/BlxWRxVy31/h/WeC9ZmpC8Xi3qhZiQhJiQhJiQhJiQhJiQhJiQhJiQhJiQ'
+        'hJiQhJiQhJiQhIgsISJLiAlJiOQSIrmESC4hkkuI5BIiuYRILiGSS4jkEiK5hEguIZJLiOQSIrmE'
+        'SC4hkkuI5BIiuYRILiGSS4jkEiK5hEguIZJLiOQSIrmESC4hkkuI5BIiuYRILiGSS4jkEiK5hEgu'
+        'IZJLiOQSYkISIsCECDAhAkyIABMiwIQIMCECTIgAEyLAhAgwIQJMiAATIsCECDAhAkyIABMiwISI'
+        'FyFyTIgcEyLAhAgwIQJMiAATIsCECDAhAkyIABMiwIQIMCECTIgJSYgJSYgJSYgJSYgJSYgJSYgJ'
+        'SYgJSYgJSYgJSYgJSYgJSYgJSYgJSYgJSYgJSchNSqklmD+rYDaA2QBmA5gNYDaA2QBmA5gNYDaA'
+        '2QBmA5gNYDaA2QBmA5gNYDaA2QBmA5gNYDaA2QBmA5gNYDaA2QBmA5gNYDaA2QBmA5gNYDaA2QBm'
+        'A5gNYDaA2QBmA5gNYDaA2QBmA5gNYDaA2QBmA5gNYDaA2QBmA5gNYDaA2QBmA5gNYDaA2QBmA5gN'
+        'YDaA2QBmA5gNYDaA2QBmA5gNYDaA2QBmA5gNYDaA2QBmA5gNYDaA2QBmA5gNYDaA2QBmA5gNYDaA'
+        '2QBmA5gNYDaA2QBmA5gNYDaA2QBmA5gNYDaA2QBmA5gNF+ZLD86nP+eedH3ZEtuvUGybsG3Ctgnb'
+        'JmybsG3CtgnbJmybsG3CtgnbJmybsG3CtgnbJmybsG3CtgnbJmybsG3CtgnbJmybsG3CtgnbJmyb'
+        'sG3CtgnbJmybsG3CtgnbJmybsG3CtgnbJmybsG3CtgnbJmybsG3CtgnbJmybsG3CtgnbJmybsG3C'
+        'tgnbJmybsG3CtgnbJmybsG3CtgnbJmybsG3CtgnbJmybsG3CtgnbJmybsG3CtgnbJmybsG3Ctgnb'
+        'JmybsG3CtgnbJmybsG3CtgnbJmybsG3CtgnbJmybsG3CtgnbJmybsG3Ctgnbpsv25fsOyG/bzqpv'
+        'AM533bWQK5aON3+LBY8oUEaBMgqUUaCMAmUUKKNAGQXKKFBGgTIKlFGgjAJlFCijQBkFyihQRoEy'
+        'CpRRoIwCZRQoo0AZBcooUEaBMgqUUaCMAmUUKKNAGQXKKFBGgTIKlFGgjAJlFCijQBkFyig0RqEx'
+        'Co1RaIxCYxQao9AYhcYoNEahMQqNUWiMQmMUGqPQGIXGKDRGwTAKhlHWPaLQGIXGKDRGoTEKjVFo'
+        'jEJjFBqj0BiFxig0RuE96kJy5RIOc+AQA4cYOMTAIQYOMXCIgUMMHGLgEAOHGDjEwCEGDjFwiIFD'
+        'DBxi4BADhxg4xMAhBg4xcIiBQwwcYuAQA4cYOMTAIQYOMXCIgUMMHGLgEAOHGDjEwCEGDjFwiIFD'
+        'DBxi4BADhxg4xMAhBg4xcIiBQwwcYuAQA4cYOMTAIQYOMXCIgUMMHGLgEAOHGDjEwCEGDjFwiIFD'
+        'DBxi4BADhxg4xMAhBg4xcIiBQwwcYuAQc3G4SuLwHTkAXuIeOvnuzjj/ZZyBLM5AFgeSOJDEgSQO'
+        'JHEgiQNJHEjiQBIHkjiQxIEkDiRxIIkDSRxI4kASB5I4kMSBJA4kcSCJA0kcSOJAEgeSOJDEgSQO'
+        'JHEgiQNJHEjiQBIHkjiQxIEkDiRxIIkDSRxI4kASZyCLw0ocVuKwEoeVOKzEYSUOK3FYicNKHFbi'
+        'sBKHlTisxGElDitxWInDSpx3Mg4ycZCJw0ocVuKwEoeVOKzEYSUOK3FYicNKHFbisBJnIHNlCvkB'
+        '0kXuRu5B7kV+iPSQnyA/RdrIzxAbmUd+jvSR7yN3Ifch30Mc5BfI/a5Mj1y9lOYOqDSXIM0l+E8S'
+        'PEKCNJfgP0nwnyR4cgleYoKXkcAECUyQwAQJTJDABAlMkMAECUyQwAQJTJDABAlMkMAECUyQwAQJ'
+        'TJDABAlMkMAECUyQwAQJTJDABAlMkMAECUyQwAQJTJDABAlMkMAECUyQwAQJTJDABAlMkMAECUyQ'
+        'wAQJTJDABAlMkMAECUyQwAQJTJDABAlMkMAECUyQwAQJTJDABAlMkMAECUyQwAQJTJDABAlMkMAE'
+        'CUyQwAQJTJDABAlMkMAECUyQwAQJTJDABAlMkMAECUyQwAQJsE+AfQLsE2CfgPcEvCfgPQHoCUBP'
+        'QHgCwhMwnQDmBDAngDnhwnzNvgM7wx4Wp/ruZOXapWNXu9WxqyREJiEyCYpJUEyCYhIUk6CYBMUk'
+        'KCZBMQmKSVBMgmISFJOgmATFJCgmQTEJiklQTIJiEhSToJgExSQoJkExCYpJUEyCYhIUk6CYBMUk'
+        'KCZBMQmKSVBMgmISFJOgmITBJAwmYTAJg0kYTMJgEgaTMJiEwSQMJmEwCYNJGEzCYBIGkzCYhMEk'
+        '8CWBL8kImoTBJAwmYTAJg0kYTMJgEgaTMJiEwSQMJmEwCeVJF430o+nTLCOP/0M/zHKd7JYp6Zfv'
+        'eNzv5hFOOU2lmhQjQIoRIMUIkGIESDECpBgBUowAKUaAFCNAihEghd9S+C3FCJDCdilsl8J2KWyX'
+        'wnYpbJfCdilsl8J2KWyXwnYpbJfCdilsl8J2KWyXwnYpbJfCdilsl8J2KWyXwnYpbJfCdilsl8J2'
+        'KWyXwnYpbJfCdilsl8J2KWyXwnYpbJfCdilGgBTuS+G+FO5L4b4U7kvhvhTuS+G+FO5L4b4U7kvh'
+        'vhTuS+G+FO5L4b4U7kvhjRQmTGHCFO5L4b4U7kvhvhTuS+G+FO5L4b4U7kvhvhTuSzECpBgBUowA'
+        'KUaAFCNAihEgxQiQYgRIMQKkGAFSjAApRoAUI0CKESDFCJBiBEi5Ns/8ps3dQ7sflQcqHg3ffflb'
+        'fT548Ky4O9xhcc3BJb3PuCfJrRUXP+J+M557a3Zp0DxeDZppTJzGxGncm8a9adybxr1p3JvGvWnc'
+        'm8a9adybxr1p3JvGvWncm8a9adybxr1p3JvGvWncm8a9adybxr1p3JvGvWncm8a9adybxr1p3JvG'
+        'vWncm8a9adybxr1p3JvGvWncm8a2aWybxrZpbJvGtmlsm8a2aWybxrZpbJvGtmlsm8a2aWybxrZp'
+        'bJvGtmn8msavaQbNNLZNY9s0tk1j2zS2TWPbNLZNY9s0tk1j2zS2TVMY0q6bhpYWPv4FDjJwkIGD'
+        'DMU8Aw4ZcMiAQwYcMuCQAYcMOGTAIQMOGXDIgEMGHDLgkAGHDDhkwCEDDhlwyIBDBhwy4JABhww4'
+        'ZMAhAw4ZcMiAQwYcMuCQAYcMOGTAIQMOGXDIgEMGHDLgkAGHDDhkwCEDDhlwyIBDBhwy4JABhww4'
+        'ZMAhAw4ZcMiAQwYcMuCQAYcMOGTAIQMOGXDIgEMGHDLgkAGHDDhkwCEDDhlwyIBDBhwy4JBxcVgn'
+        'ysQvZJlY5q6S5pbKRFSViSx4ZMEjCxdZuMjCRRYusnCRhYssXGThIgsXWbjIwkUWLrJwkYWLLFxk'
+        '4SILF1m4yMJFFi6ycJGFiyxcZOEiCxdZuMjCRRYusnCRhYssXGThIgsXWbjIwkUWLrJwkYWLLFxk'
+        '4SILF1m4yMJFFi6ycJGFiyxcZOEiCxdZuMjCRRYusnCRhYssXGThIgsXWbjIwkUWLrJwkYWLLFxk'
+        '4SILF1m4yMJFFi6ycJF1uVgvQXC/dW/NsoPfJ+vxHvxKyO951Nc/jsTU98nmn3K0PK9w+A+N5G6k'
+        '/Rvxx4+Kofp60S3uJ/rcb8GVHXrklKojH5M98kUdD/rTsX+Kk6f2B8bG1Bf+ju3dNV0eu8g9fHiP'
+        'qHUP/cdlRx5max37vcNbh/id2nFRzh5MdXWHgKeIP/6jldnRR8wP/3m9f84f/svvU1+aN+lODTcc'
+        '1k37jymU9mzfsfQrqJbH/fb0LfuP3VW6dUdhfNfYnhLnVkY9/23CLT9YoH5ZlZ9H/dLvH9APPfD4'
+        'Hn6ytSxn8n9gj+9fKb9efXxyR1k93w/JZ/VHGvf3rzz41Er8bu/fPshPaf3WN2Lj0uTrLtK1Rbq2'
+        'SNcWky+LkG0Rsi1CtkXItgjZFiHbImRbhGyLkG0Rsi1CtkXItgjZFiHbImRbhGyLkG0Rsi1CtkXI'
+        'tgjZFiHbImRbhGyLkG0Rsi1CtkXItgjZFiHbImRbhGyLkG0Rsi1CtkXItgjZFiHbImRbhGyLkG0R'
+        'si1CtkXItgjZFiHbImRbhGyLkG0Rsi1CtkXItgjZFiHbImRbhGyLkG0Rsi1CtkXItgjZFiHbImRb'
+        'hGyLkG0Rsi1CtkXItgjZlhuyNz3SFrDd2vXZP/nnPW94kP2yX39KZXzy1vLYU8cnpboV4n3y6f4p'
+        'OsztjDfK+vPHnF+05aM+/kF/bmWz+gTYyD/LSr9l6Ujw+eoToWWOBJc5DlDmOECZ4wBljgOUOQ5Q'
+        '5jhAmeMAZY4DlDkOUOY4QJnqVaZ6laleZapXmepVpnqVqV5lqleZ6lWmepWpXmWqV5nqVaZ6lale'
+        'ZapXmepVpnqVqV5lqleZ6lWmepWpXmWqV5nqVaZ6laleZapXmepVpnqVqV5lqleZ6lWmepWpXmWq'
+        'V5nqVaZ6laleZapXmeMAZYpYmSJWpoiVKWJliliZIlamiJUpYmWKWJkiVqaIlSliZYpYmSJWpoiV'
+        'KWJliliZElOmlpWpZWWKWJkiVqaIlSliZYpYmSJWpoiVKWJliliZIlamiJU5DlDmOECZ4wBljgOU'
+        'OQ5Q5jhAmeMAZY4DlDkOUOY4QJnjAGWOA5Q5DlDmOECZ4wBljgOU3Wq59dH6y1f5oPd3/fTVtqU1'
+        'u7PVml0FX1bwZQVDVjBkBUNWMGQFQ1YwZAVDVjBkBUNWMGQFQ1YwZAVDVjBkBUNWMGQFQ1YwZAVD'
+        'VjBkBUNWMGQFQ1YwZAVDVjBkBUNWMGQFQ1YwZAVDVjBkBUNWMGQFQ1YwZAVDVnBiBSdWcGIFJ1Zw'
+        'YgUnVnBiBSdWcGIFJ1ZwYgUnVnBiBSdWcGIFJ1ZwYgULVrBghThRwYkVnFjBiRWcWMGJFZxYwYkV'
+        'nFjBiRWcWMGJFbxecQ3ymH3qZ6GWuYd8bjx48fNu6n+suHiPvFh3L94kqXFXfp+39C3Z31b8zMDP'
+        'DPzMUNdnwGgGjGbAaAaMZsBoBoxmwGgGjGbAaAaMZsBoBoxmwGgGjGbAaAaMZsBoBoxmwGgGjGbA'
+        'aAaMZsBoBoxmwGgGjGbAaAaMZsBoBoxmwGgGjGbAaAaMZsBoBoxmwGgGjGbAaAaMZsBoBoxmwGgG'
+        'jGbAaAaMZsBoBoxmwGgGjGbAaAaMZsBoBoxmwGgGjGbAaAaMZsBoBoxmwGgGjGbAaAaMZsBoBoxm'
+        'wGgGjGbAaMbF6HG/r866E/cbBSmPqsOtjz+YrE6R9nmC7KS7pWkWXNPct/MORrw73D584tJEbx5L'
+        'zWKpWSw1i6VmsdQslprFUrNYahZLzWKpWSw1i6VmsdQslprFUrNYahZLzWKpWSw1i6VmsdQslprF'
+        'UrNYahZLzWKpWSw1i6VmsdQslprFUrNYahZLzWKpWSw1i6VmsdQslprFUrNYahZLzWKpWSw1i6Vm'
+        'sdQslprFUrNYahZLzWKpWSw1i6VmsdQslprFUrNYahZLzWKpWSw1i6VmsdQslprFUrNYahZLzWKp'
+        'WSw1i6VmsdQslprFUrNYahZLzbo4PGnfgf3Lh27YNjjqTkk8bn0e+2PmGTcnHC9zwiPeaE8+eF7D'
+        'C92Bavywbtr5S46hjEyzSvWIioDyy5JGniueuPteBTx/iq8AunkpC0bUWF6l8FQpPFUqTpWKU6Xi'
+        'VKk4VSpOlYpTpeJUqThVKk6VilOl4lSpOFUqTpWKU6XiVKk4VSpOlYpTpeJUqThVKk6VilOl4lSp'
+        'OFUqTpWKU6XiVKk4VSpOlYpTpeJUqThVKk6VilOl4lSpOFUqTpWKU6XiVKk4VSpOlYpTpeJUqThV'
+        'Kk6VilOl4lSpOFUqTpWKU6XiVKk4VSpOlYpTpeJUqThVKk6VilOl4lSpOFUqTpWKU6XiVKk4VSpO'
+        'lYpTpeJUqThVKk7VrTiFpZn/x9Q54DVm/jVm/jVm/jVm/jVm/jVm/jVm/jVm/jVm/jVm/jVm/jWo'
+        'qkFVjeGsBlw14KoBVw24asBVA64acNWAqwZcNeCqAVcNuGrAVQOuGnDVgKsGXDXgqgFXDbhqwFUD'
+        'rhpw1YCrBlw14KoBVw24asBVA64acNWAqwZcNeCqAVcNuGrAVWPmX4OxGozVYKwGYzUYq8FYDcZq'
+        'MFaDsRqM1WCsBmM1GKvBWA3GajBWg7EaBNRArQZqNRirwVgNxmowVoOxGozVYKwGYzUYq8FYDcZq'
+        'zPxrzPxrzPxrzPxrzPxr5KAaM/8aM/8aM/8aM/8aM/8aM/8aM/8aM/8aM/8aM/+aC/P2h9PM/107'
+        '98jn9pAPk8VH0nKIO+Stl0Pen7xfbnnULhO93/O7loluXZrwh7wHJ/xNFRLqlPM65bxOOa9TzuuU'
+        '8zrlvE45r1PO65TzOuW8TjmvU87rlPM65bxOOa9TzuuU8zrlvE45r1PO65TzOuW8TjmvU87rlPM6'
+        '5bxOOa9TzuuU8zrlvE45r1PO65TzOuW8TjmvU87rlPM65bxOOa9TzuvU8Tp1vE4dr1PH69TxOnW8'
+        'Th2vU8fr1PE6dbxOHa9Tx+vU8Tp1vE4dr1PH69TxOgW8TgGvkxXq1PE6dbxOHa9Tx+vU8Tp1vE4d'
+        'r1PH69TxOnW8Th2vM1LU3fJq7Tuw80XqIzb73KnJDnm+0sGrXu/+ru3Y2OCGjRvGLrrQPTL6kjs4'
+        '2XhkQv72q7rtMvemMw675kp3uvP8ow+76lL3Kr9E1f2Mwsmew268xL1x/+H353ffzjv8Xu55GSPv'
+        'O+yalHun6cP/zn2e+a3u4eksh6fzhcPvcIX7KLY8a22n/M0579bhvPuzcSMp+SNy2cGtXJqS93jK'
+        'Upx6v4pTDeJUgzjVIE41iFMN4lSDONUgTjWIUw3iVIM41SBONfBfA/818F8D/zXwXwP/NfBfA/81'
+        '8F8D/zXwXwP/NfBfA/818F8D/zXwXwP/NfBfA/818F8D/zXwXwP/NfBfA/818F8D/zXwXwP/NfBf'
+        'A/818F8D/zXwXwP/NfBfA/818F8D/zWIUw1s2MCGDWzYwIYNbNjAhg1s2MCGDWzYwIYNbNjAhg1s'
+        '2MCGDWzYwIYNbNjAJA3c2MCNDWzYwIYNbNjAhg1s2MCGDWzYwIYNbNjAhg1s2CBONYhTDeJUgzjV'
+        'IE41iFMN4lSDONUgTjWIUw3iVIM41SBONYhTDeJUgzjVcP2+6+BHA3zuOb+7H7UD5hOW/a4Bc4+s'
+        'CiePjW3fUZga27Vjqjg5vovfoqTQXSD+2P1yzXM86ss1R66StaK0VCs+pWpFk1rRpFY0qRVNakWT'
+        'WtGkVjSpFU1qRZNa0aRWNKkVTWpFk1rRpFY0qRVNakWTWtGkVjSpFU1qRZNa0aRWNKkVTWpFk1rR'
+        'pFY0qRVNakWTWtGkVjSpFU1qRZNa0aRWNKkVTWpFk1rRpFY0qRVNakWTWtGkVjSpFU1qRZNa0aRW'
+        'NKkVTWpFk1rRpFY0qRVNakWTWtGkVjSpFU1qRZNa0aRWNKkVTWpFk1rRpFY0qRVNakWTWtGkVjSp'
+        'FU1qRZNa0aRWNKkVTWpFk1rRpFY0qRVNakWTWtGkVjSpFU1qRZNa0aRWNKkVTWpFk1rRpFY0qRVN'
+        'akWTWtGkVjSpFU1qRZNa0aRWNKkVTWpFk1rRpFY0qRVNt1bsPbgYd5xbKyYk2/IU8JFXqTPA80fL'
+        'QfW4qdv3FsfG9+wpTY0fPJds5B/VueEji3IQHubrWEb+4w71iMvkHy5fN7pxkBvuk8Pumo0b3TXS'
+        'kZ68JMZpBuG71G/AjzTlQ23Zutkdz493zzmfPPIVlUfOp/6/nk/NdzVm7zhw5GeH/qJ/dqi8tEB+'
+        'kZr7dhhPO4ynHcbTDuNph/G0w3jaYTztMJ52GE87jKcdxtMO42mH8bTDeNphPO0wnnYYTzuMpx3G'
+        '0w7jaYfxtMN42mE87TCedhhPO4ynHcbTDuNph/G0w3jaYTztMJ52GE87jKcdxtMO42mH8bTDeNph'
+        'PO0wnnYYSDsMpB0G0g4DaYeBtMNA2mEg7TCQdhhIOwykHQbSDgNph4G0w0DaYSDtMJB2GEg7jKAd'
+        'RtAOc98OA2mHgbTDQNphIO0wkHYYSDsMpB0G0g4DaYeBtMNA2mGo7rjj29RSWPucCmtdwlqXsNYl'
+        'rHUJa13CWpew1iWsdQlrXcJal7DWJax1gasLXF3g6gJXF7i6wNUFri5wdYGrC1xd4OoCVxe4usDV'
+        'Ba4ucHWBqwtcXeDqAlcXuLrA1QWuLnB1gasLXF3g6gJXF7i6wNUFri5wdYGrC1xd4OoCVxe4usDV'
+        'Ba4ucHUJa10Y68JYF8a6MNaFsS6MdWGsC2NdGOvCWBfGujDWhbEujHVhrAtjXRjrQkAX1Lqg1oWx'
+        'Lox1YawLY10Y68JYF8a6MNaFsS6MdWGsS1jrEta6hLUuYa1LWOsS1rqEtS5hrUtY6xLWuoS1LmGt'
+        'S1jrEta6hLUuYa3rwjz9lz6Tc2dtx8nly//VkvBTl4q+XxX9Hr7s4csehuxhyB6G7GHIHobsYcge'
+        'huxhyB6G7GHIHobsYcgehuxhyB6G7GHIHobsYcgehuxhyB6G7GHIHobsYcgehuxhyB6G7GHIHobs'
+        'YcgehuxhyB6G7GHIHobsYcgehuzhxB5O7OHEHk7s4cQeTuzhxB5O7OHEHk7s4cQeTuzhxB5O7OHE'
+        'Hk7s4cQeTuzhxB5O7FH0exiyhyF7GLKHIXsYsochexiyhyF7GLKHIXsYsucapPJgDeKCd7rnT3Qm'
+        '+UN+LOm2pVHwE2oUtBkFbUZBm1HQZhS0GQVtRkGbUdBmFLQZBW1GQZtR0MZtNm6zGQVtTGdjOhvT'
+        '2ZjOxnQ2prMxnY3pbExnYzob09mYzsZ0NqazMZ2N6WxMZ2M6G9PZmM7GdDamszGdjelsTGdjOhvT'
+        '2ZjOxnQ2prMxnY3pbExnYzob09mYzsZ0NqOgjfdsvGfjPRvv2XjPxns23rPxno33bLxn4z0b79l4'
+        'z8Z7Nt6z8Z6N92y8Z+M9G+/ZmM7GdDamszGdjelsTGdjOhvT2ZjOxnQ2prMZBW1GQZtR0GYUtBkF'
+        'bUZBm1HQZhS0GQVtRkGbUdBmFLQZBW1GQZtR0GYUtF2T335wefO/3POHnrbE9kcV2w5sO7DtwLYD'
+        '2w5sO7DtwLYD2w5sO7DtwLYD2w5sO7DtwLYD2w5sO7DtwLYD2w5sO7DtwLYD2w5sO7DtwLYD2w5s'
+        'O7DtwLYD2w5sO7DtwLYD2w5sO7DtwLYD2w5sO7DtwLYD2w5sO7DtwLYD2w5sO7DtwLYD2w5sO7Dt'
+        'wLYD2w5sO7DtwLYD2w5sO7DtwLYD2w5sO7DtwLYD2w5sO7DtwLYD2w5sO7DtwLYD2w5sO7DtwLYD'
+        '2w5sO7DtwLYD2w5sO7DtwLYD2w5sO7DtwLYD2w5sO7DtwLYD2w5sO7DtwLbjsv10TjsVcN+/7OA6'
+        '2ir3F52eoRbqRm6V0O87eOkmeemZBy/dKy8969G63j+y+Xct988s1YmqqhNHLXPrhCvzyPeQ7yDf'
+        'R+5C2sgPkB8iHmQ54kNWID9C/MgxyErkWERDViE6chwSQI5HTkBORE5CTkaCyCnIqchpSAg5HTGQ'
+        'M5AB5EzERM5CwsjZSASJIquRGHIOEkfORRLIeUgHOR+5AEkiFyIXIRcjlyAp5FLkMuRy5ArkSuQq'
+        '5GrkGuRaZBRJI9chg8gaZC2SRYaQdUgOWY8MI9cjI8iPkS5yN3IPci/SQ36C/BT5GWIjP0f6yH2I'
+        'g/wCud+V6ZFnL8FcVjB7gNkDzB5g9gCzB5g9wOwBZg8we4DZA8weYPYAsweYPcDsAWYPMHuA2QPM'
+        'HmD2ALMHmD3A7AFmDzB7gNkDzB5g9gCzB5g9wOwBZg8we4DZA8weYPYAsweYPcDsAWYPMHuA2QPM'
+        'HmD2ALMHmD3A7AFmDzB7gNkDzB5g9gCzB5g9wOwBZg8we4DZA8weYPYAsweYPcDsAWYPMHuA2QPM'
+        'HmD2ALMHmD3A7AFmDzB7gNkDzB5g9gCzB5g9wOwBZg8we4DZA8weYPYAsweYPcDsAWYPMHuA2QPM'
+        'HmD2ALMHmD3A7AFmDzB7gNkDzB5g9rgwP0d9kGlkVA5fz300Dl+Hj1ruXHSFXAR5wPj1vCOHwY4c'
+        'BvsTfq2Qe4Qs/0oxpzpyHOyRfxzs+YdXUbeiHOV5BH6m5o++EnbHUnB6jQpOGsFJIzhpBCeN4KQR'
+        'nDSCk0Zw0ghOGsFJIzhpBCeN4KQRnDSCk0Zw0ghOGsFJIzhpBCeN4KQRnDSCk0Zw0ghOGsFJIzhp'
+        'BCeN4KQRnDSCk0Zw0ghOGsFJIzhpBCeN4KQRnDSCk0Zw0ghOGsFJIzhpBCeN4KQRnDSCk0Zw0ghO'
+        'GsFJIzhpBCeN4KQRnDSCk0Zw0ghOGsFJIzhpBCeN4KQRnDSCk0Zw0ghOGsFJIzhpBCeN4KQRnDSC'
+        'k0Zw0ghOGsFJIzhpBCeN4KQRnDSCk0Zw0ghOGsFJIzhpBCeN4KQRnDSCk0Zw0ghOGsFJIzhpBCeN'
+        '4KQRnDSCk0Zw0ghOGsFJIzhpBCfNDU4vWIL5IwpmHZh1YNaBWQdmHZh1YNaBWQdmHZh1YNaBWQdm'
+        'HZh1YNaBWQdmHZh1YNaBWQdmHZh1YNaBWQdmHZh1YNaBWQdmHZh1YNaBWQdmHZh1YNaBWQdmHZh1'
+        'YNaBWQdmHZh1YNaBWQdmHZh1YNaBWQdmHZh1YNaBWQdmHZh1YNaBWQdmHZh1YNaBWQdmHZh1YNaB'
+        'WQdmHZh1YNaBWQdmHZh1YNaBWQdmHZh1YNaBWQdmHZh1YNaBWQdmHZh1YNaBWQdmHZh1YNaBWQdm'
+        'HZh1YNaBWQdmHZh1YNaBWQdmHZh1YNaBWXdhnl2C+dUK5gAwB4A5AMwBYA4AcwCYA8AcAOYAMAeA'
+        'OQDMAWAOAHMAmAPAHADmADAHgDkAzAFgDgBzAJgDwBwA5gAwB4A5AMwBYA4AcwCYA8AcAOYAMAeA'
+        'OQDMAWAOAHMAmAPAHADmADAHgDkAzAFgDgBzAJgDwBwA5gAwB4A5AMwBYA4AcwCYA8AcAOYAMAeA'
+        'OQDMAWAOAHMAmAPAHADmADAHgDkAzAFgDgBzAJgDwBwA5gAwB4A5AMwBYA4AcwCYA8AcAOYAMAeA'
+        'OQDMAWAOAHMAmAPAHADmADAHgDkAzAFgDgBzAJgDwBwA5gAwB4A5AMwBF+YX/iX/7PrIix7st1e9'
+        'SH3HQv4H7sdQXrxk+bcqywexfBDLB7F8EMsHsXwQywexfBDLB7F8EMsHsXwQywexfBDLB7F8EMsH'
+        'sXwQywexfBDLB7F8EMsHsXwQywexfBDLB7F8EMsHsXwQywexfBDLB7F8EMsHsXwQywexfBDLB7F8'
+        'EMsHsXwQywexfBDLB7F8EMsHsXwQywexfBDLB7F8EMsHsXwQywexfBDLB7F8EMsHsXwQywexfBDL'
+        'B7F8EMsHsXwQywexfBDLB7F8EMsHsXwQywexfBDLB7F8EMsHsXwQywexfBDLB7F8EMsHsXwQywex'
+        'fBDLB7F8EMsHsXwQywexfBDLB7F8EMsHsXwQywexfBDLB7F80LX8/iPrM0fWZ4587fNvW5Vxz79+'
+        'pSjyR5ZnRLF4yaN1kdtditLk11/+jwHhpUuJ4C0Hf4SdRGCQCAwSgUEiMEgEBonAIBEYJAKDRGCQ'
+        'CAwSgUEiMEgEBonAIBEYJAKDRGCQCAwSgUEiMEgEBonAIBEYJAKDRGCQCAwSgUEiMEgEBonAIBEY'
+        'JAKDRGCQCAwSgUEiMEgEBonAIBEYJAKDRGCQCAwSgUEiMEgEBonAIBEYJAKDRGCQCAwSgUEiMEgE'
+        'BonAIBEYJAKDRGCQCAwSgUEiMEgEBonAIBEYJAKDRGCQCAwSgUEiMEgEBonAIBEYJAKDRGCQCAwS'
+        'gUEiMEgEBonAIBEYJAKDRGCQCAwSgUEiMEgEBonAIBEYJAKDRGCQCAwSgUEiMEgEBonAIBEYJAKD'
+        'RGCQCAwSgeEmgpctfUnYP3FW6gD4DYDfAPgNgN8A+A2A3wD4DYDfAPgNgN8A+A2A3wD4DYDfAPgN'
+        'gN8A+A2A3wD4DYDfAPgNgN8A+A2A3wD4DYDfAPgNgN8A+A2A3wD4DYDfAPgNgN8A+A2A3wD4DYDf'
+        'APgNgN8A3A3A3QDcDcDdANwNwN0A3A3A3QDcDcDdANwNwN0A3A3A3QDcDcDdANwNANwAwLmSQQaR'
+        'NchaJIsMIeuQHLIeGUauR0aQUVemR16+VNs+r2qbSW0zqW0mtc2ktpnUNpPaZlLbTGqbSW0zqW0m'
+        'tc0ELhO4TOAygcsELhO4TOAygcsELhO4TOAygcsELhO4TOAygcsELhO4TOAygcsELhO4TOAygcsE'
+        'LhO4TOAygcsELhO4TOAygcsELhO4TOAygcsELhO4TOAygcuktpkwZsKYCWMmjJkwZsKYCWMmjJkw'
+        'ZsKYCWMmjJkwZsKYCWMmjJkwZkKACWomqJkwZsKYCWMmjJkwZsKYCWMmjJkwZsKYCWMmtc2ktpnU'
+        'NpPaZlLbTGqbSW0zqW0mtc2ktpnUNpPaZlLbTGqbSW0zqW2mC/MrlmB+m4I5DMxhYA4DcxiYw8Ac'
+        'BuYwMIeBOQzMYWAOA3MYmMPAHAbmMDCHgTkMzGFgDgNzGJjDwBwG5jAwh4E5DMxhYA4DcxiYw8Ac'
+        'BuYwMIeBOQzMYWAOA3MYmMPAHAbmMDCHgTkMzGFgDgNzGJjDwBwG5jAwh4E5DMxhYA4DcxiYw8Ac'
+        'BuYwMIeBOQzMYWAOA3MYmMPAHAbmMDCHgTkMzGFgDgNzGJjDwBwG5jAwh4E5DMxhYA4DcxiYw8Ac'
+        'BuYwMIeBOQzMYWAOA3MYmMPAHAbmMDCHgTkMzGFgDgNzGJjDwBwG5jAwh4E5DMxhYA4Dc9iF+ZVL'
+        'nx8ZUJ8ficBfBP4igBcBvAjgRQAvAngRwIsAXgTwIoAXAbwI4EUALwJ4EcCLAF4E8CKAFwG8COBF'
+        'AC8CeBHAiwBeBPAigBcBvAjgRQAvAngRwIsAXgTwIoAXAbwI4EUALwJ4EYiLQFwE4iIQF4G4CMRF'
+        'IC4CcRGIi0BcBOIiEBeBuAjERSAuAnERiIuAWgTUIgzREYiLQFwE4iIQF4G4CMRFIC4CcRGIi0Bc'
+        'BOIiMB1xQXjVEgi2AmE1IKwGhNUUotXwsBoeVsPDanhYDQ9S3G/Y4YpViI4chwSQ45ETkBORk5CT'
+        'kSByCnIqchoSQk5HDOQMZAA5EzGRs5AwcjYSQaLIaiSGnIPEkXORBHIecj5yAZJELkQuQi5GLkFS'
+        'yKXIZcjlyBXIlchVyNXINci1yCiSRq5DMsggsgZZi2SRIWQdkkPWI8PI9ciIK9MjB/YdEPNYMXf9'
+        'V/d7EqoHL77X/QzCq/+Sl/vzr/Q82PX+2p+rX9zDEgXxNB8RJ6G85shS8aN3qZiV0P+648CRNeMj'
+        'Z/L9AUvFrz34DT0XuSPP6w5e/LZ7CPX1R0qJKiX46nNiDPjzVJIjh5r+F2Vj50kyCp/sWSog1OGg'
+        '5y/+V0cfdAFhaDzVs1RDVEX5P5SSN/zuOCaKyoVH/xF/svmhzF+/NXu9UfbBT+Vr/Zr8hGVn5zfc'
+        'rnnTkTp65Oj9kST2h5ZPBttPixD7aIxk9aUDez9hlSjNKlGaVaI0q0RpVonSrBKlWSVKs0qUZpUo'
+        'zdpQmrWhNGtDadaG0qwNpVkbSrM2lGZtKM3aUJq1oTRrQ2nWhtKsDaVZG0qzNpRmbSjN2lCataE0'
+        'a0Np1obSrA2lWRtKszaUZm0ozdpQmrWhNGtDadaG0qwNpVkbSrM2lGZtKM3aUJq1oTRrQ2nWhtKs'
+        'DaVZG0qzNpRmbSjN2lCataE0a0Np1obSrA2lWRtKszaUZm0ozdpQmkWhNItCaRaF0iwKpVkUSrMo'
+        'lGZRKM2iUJpFoTSLQmkWhdIsCqVZFEqzKJRm9Sntrg29eWnV8Itq1TADDxl4yMBDBh4y8JCBhww8'
+        'ZOAhAw8ZeMjAQwYeMvCQgYcMPGTgIQMPGXjIwEMGHjLwkIGHDDxk4CEDDxl4yMBDBh4y8JCBhww8'
+        'ZOAhAw8ZeMjAQwYeMvCQgYcMPGTgIQMPGXjIwEMGHjLwkIGHDDxk4CEDDxl4yMBDBh4y8JCBhww8'
+        'ZOAhAw8ZeMjAQwYeMvCQgYcMPGTgIQMPGXjIwEMGHjLwkIGHDDxk4CHj8vAWycP3ZcT4dxkx5C++'
+        'jrxB7Nwld94tdn4gdz4idn4od74gdr4j6TnF/Q3XzM4cR9JyHEnLcSQtx/GxHMfHcgCWA7AcgOUA'
+        'LAdgOQDLAVgOwHIAlgOwHIDlACwHYDkAywFYDsByAJYDsByA5QAsB2A5AMsBWA7AcgCWA7AcgOUA'
+        'LAdgOQDLAVgOwHIAlgOwHIDlACwHYDkAywFYDsByHB/LwVkOznJwloOzHJzl4CwHZzk4y8FZDs5y'
+        'cJaDsxyc5eAsB2c5OMvBWQ4KcuCWA7ccnOXgLAdnOTjLwVkOznJwloOzHJzl4CwHZzmOj7kyhXSR'
+        'u5F7kHuRHvIT5KfIzxAb+TnSR+5DHOQXyP2uTI+89dF80trI+b/tnLW3HVyReb27IvP2pXDwfQaD'
+        'PF7N49U8Xs3j1TxezePVPF7N49U8Xs3j1TxezePVPF7N49U8Xs3j1TxezePVPF7N49U8Xs3j1Txe'
+        'zePVPF7N49U8Xs3j1TxezePVPF7N49U8Xs3j1TxezePVPF7N49U8Xs3j1TwmzWPSPCbNY9I8Js1j'
+        '0jwmzWPSPCbNY9I8Js1j0jwmzWPSPCbNY9I8Js3jzjzuzDMY5DFpHpPmMWkek+YxaR6T5jFpHpPm'
+        'MWkek+YxaZ4ykHdN8w6Jg4vHt+RhlHvl3r3y1y58e8cnx3fzG+Y/9siv+HmnvKt7xEWX48aj+TsQ'
+        'HmCwd8kv6l+xZWjtxg3ZLW5/Xed2INe4V5ztduC7f9/6xsi/PdTLG9WjjhJTCPHvT73O8R75Ey/u'
+        'RGwD3y92ZGnjyNLGI2W1eKP6aaK3LHMD8cPsiNNf5qLGex+qdOemq6eJN/phOfi879EQet3QsUau'
+        '/f/B/fL+pRNA36VOAC0wbS0wbS0wbS1wAmiBE0ALnABa4ATQAieAFjgBtMAEt8AEt0BoLhCaC4Tm'
+        'AqG5QGguEJoLhOYCoblAaC4QmguE5gKhuUBoLhCaC4TmAqG5QGguEJoLhOYCoblAaC4QmguE5gKh'
+        'uUBoLhCaC4TmAqG5QGguEJoLhOYCoblAaC4QmguE5gKhuUBoLhCaC4TmAqG5wAS3QHYukJ0LZOcC'
+        '2blAdi6QnQtk5wLZuUB2LpCdC2TnAtm5QHYukJ0LZOcC2blAdi6QbAtE6AIRukB2LpCdC2TnAtm5'
+        'QHYukJ0LZOcC2blAdi6QnQtk5wIT3AIz2wIz2wIz2wIz2wIz2wIz2wIz2wIz2wIz2wIz2wIz2wIz'
+        '2wIz2wIz2wIz24Ib0j+wtIJnqBW8IvwV4a8IeEXAKwJeEfCKgFcEvCLgFQGvCHhFwCsCXhHwioBX'
+        'BLwi4BUBrwh4RcArAl4R8IqAVwS8IuAVAa8IeEXAKwJeEfCKgFcEvCLgFQGvCHhFwCsCXhHwioBX'
+        'hLgixBUhrghxRYgrQlwR4ooQV4S4IsQVIa4IcUWIK0JcEeKKEFeEuCKoFUGtyGytCHFFiCtCXBHi'
+        'ihBXhLgixBUhrghxRYgrQlwRposuCB88chjw4OkUR86iOHIWxZGzKP5bULZG5dLeu2+Q6w0f+m9f'
+        'sna698iXrE2PfPhIFT2y4nDkZIq/nNNa+W5Qn/xu0D/+wsNHfu9ZaZf/xZ+V9tGl2fQ71Wy6xGy6'
+        'xGy6xGy6xGy6xGy6xGy6xGy6xGy6xGy6xGy6xGy6xGymxGymxGy6xKSmxKSmxKSmxKSmxKSmxKSm'
+        'xKSmxKSmxKSmxKSmxKSmxKSmxKSmxKSmxKSmxKSmxKSmxKSmxKSmxKSmxKSmxKSmxKSmxKSmxKSm'
+        'xKSmxKSmxKSmxKSmxKSmxKSmxKSmxKSmxKSmxKSmxKSmxKSmxGy6xNymxNymxNymxNymxNymxNym'
+        'xNymxNymxNymxNymxNymxNymxNymxNymxNymxNymxNymxMyjxBSnxBSnxNymxNymxNymxNymxNym'
+        'xNymxNymxNymxNymxNymxNymxGy6xGy6xGy6xGy6xGy6xGy6xGy6xGy6xGy6xGy6xGy6xGy6xGy6'
+        'xGy6xGy6xGy65E6iPrZ0BPQ/mUxPgN8E+E3A3QTcTcDdBNxNwN0E3E3A3QTcTcDdBNxNwN0E3E3A'
+        '3QTcTcDdBNxNwN0E3E3A3QTcTcDdBNxNwN0E3E3A3QTcTcDdBNxNwN0E3E3A3QTcTcDdBNxNwN0E'
+        '3E3A3QTATQDcBMBNANwEwE0A3ATATQDcBMBNANwEwE0A3ATA/X/27j8u9v2uD7zn3kQTQxJMxhEN'
+        'wYiYmJCEqEGd4Khkgok5TmhFOrJlepdO2TZoQ24m49JZMlsRZFfSnW6rbNsHlJ3HY7s8liJleUxb'
+        'LO2wdNy2UpbtlMW2lAEEo9ExkomxFWjLnvk+uZBW26at+X39580595h7D/N8vd6f+QwMzwL3LHDP'
+        'AvcscM+S9ixpz3oy/SxwzwL3LHDPAvcscM8C9yxwzwL3LHDPAvcscM8i/WzgoHhfan/lrtTSSi2t'
+        '1NJKLa3U0kotrdTSSi2t1NJKLa3U0kotTVWaqrRSS8OVhisNVxquNFxpuNJwpeFKw5WGKw1XGq40'
+        'XGm40nCl4UrDlYYrDVcarjRcabjScKXhSsOVhisNVxquNFxpuNJwpeFKw5WGKw1XGq40XGmllmYs'
+        'zViasTRjacbSjKUZSzOWZizNWJqxNGNpxtKMpRlLM5ZmLE1AGrU0amnG0oylGUszlmYszViasTRj'
+        'acbSjKUZSyu1tFJLK7W0UksrtbRSSyu1tFJLK7W0UksrtbRSSyu1tFJLK7W0UksHmP/6/RXhy+6u'
+        'CDP8ZfjLgJcBLwNeBrwMeBnwMuBlwMuAlwEvA14GvAx4GfAy4GXAy4CXAS8DXga8DHgZ8DLgZcDL'
+        'gJcBLwNeBrwMeBnwMuBlwMuAlwEvA14GvAx4GeIyxGWIyxCXIS5DXIa4DHEZ4jLEZYjLEJchLkNc'
+        'hrgMcRniMqhlUMtotQxxGeIyxGWIyxCXIS5DXIa4DHEZ4jLEZZjOBBD+xv0XdLypcSxt/CSyxz/T'
+        'uA34m/d195an1F1W3WXVXVbdZdVdVt1l1V1W3WXVXVbdZdVdVt1lccvillV3Weqy1GWpy1KXpS5L'
+        'XZa6LHVZ6rLUZanLUpelLktdlrosdVnqstRlqctSl6UuS12Wuix1Weqy1GWpy1KXpS5LXZa6LHVZ'
+        '6rLUZanLUpelLqvusvBl4cvCl4UvC18Wvix8Wfiy8GXhy8KXhS8LXxa+LHxZ+LLwZdHIMphlMAtf'
+        'Fr4sfFn4svBl4cvCl4UvC18Wvix8WXWXVXdZdZdVd1l1l1V3WXWXVXdZdZdVd1l1l1V3WXWXVXdZ'
+        'dZdVd9lA+eZ93b3kru4m+ZvkbxK8SfAmwZsEbxK8SfAmwZsEbxK8SfAmwZsEbxK8SfAmwZsEbxK8'
+        'SfAmwZsEbxK8SfAmwZsEbxK8SfAmwZsEbxK8SfAmwZsEbxK8SfAmwZsEbxK8SeImiZskbpK4SeIm'
+        'iZskbpK4SeImiZskbpK4SeImiZskbpK4SeImUZtEbVLdTRI3SdwkcZPETRI3SdwkcZPETRI3Sdwk'
+        'cZNMTwYQfu6+1b78rtVyWi2n1XJaLafVclotp9VyWi2n1XJaLafVclotR1WOqpxWy8GVgysHVw6u'
+        'HFw5uHJw5eDKwZWDKwdXDq4cXDm4cnDl4MrBlYMrB1cOrhxcObhycOXgysGVgysHVw6uHFw5uHJw'
+        '5eDKwZWDKwdXDq4cXDmtlmMsx1iOsRxjOcZyjOUYyzGWYyzHWI6xHGM5xnKM5RjLMZZjLEdADrUc'
+        'ajnGcozlGMsxlmMsx1iOsRxjOcZyjOUYy2m1nFbLabWcVstptZxWy2m1nFbLabWcVstptZxWy2m1'
+        'nFbLabWcVssFmP/Wh54AbqzuFwffS711X3JfdldyUzhO4TiF4xSOUzhO4TiF4xSOUzhO4TiF4xSO'
+        'UzhO4TiF4xSOUzhO4TiF4xSOUzhO4TiF4xSOUzhO4TiF4xSOUzhO4TiF4xSOUzhO4TiF4xSOUzhO'
+        '4TiF4xSOUxxOcTjF4RSHUxxOcTjF4RSHUxxOcTjF4RSHUxxOcTjF4RSHUxxOATgF4JSum+JwisMp'
+        'Dqc4nOJwisMpDqc4nOJwisMpDqdInwp4/O17D+N3HqZ5mOZhGoRpEKZBmAZhGoRpEKZBmAZhGoRp'
+        'EKZBmAZhGoRpEKZBmAZhGoRpEKZBmAZhGoRpEKZBmAZhGoRpEKZBmAZhGoRpEKZBmAZhGoRpEKZB'
+        'mAZhGoRpEKZBmAZhGoRpEKZBmAZhGoRpEKZBmAZhGoRpEKZBmAZhGoRpEKZBmAZhGoRpEKZBmAZh'
+        'GoRpEKZBmAZhGoRpEKZBmAZhGoTpAMLfedITv9boib8SvL1P6XP5pXHx6FOfr18bt/0fvbn/lqe+'
+        '2G/u/6/fbxvBl0P+/JNP22fpJeAPv/iH+n74h575oaE/0Nf4UvrHpSf/6s+Ilp3/qJbdp7/4tIyl'
+        '7r6Wee/pf/cnOv7dJy3zY41/9JPBaaTc+Pw0Wufxjz75k7/a+OD4yQeXjQ9+sXHB8PONP9D4/fgr'
+        'G7EKCuoXHt39kXh38C0Q//f93fuv2mCLNtiiDbboRLNokS1aZIsW2aJFtmiRLVpkixbZokW2aJEt'
+        'WmSLFtmiRbZokS1aZIsW2aJFtmiRLVpkixbZokW2aJEtWmSLFtmiRbZokS1aZIsW2aJFtmiRLVpk'
+        'ixbZokW2aJEtWmSLFtmiRbZokS1aZIsW2aJFtmiRLVpkixbZokW2aJEtWmSLFtmiRbZokS1aZIsW'
+        '2aJFtmiRLVpkixbZokW2aJEtWmSLFtmiRbZokS1aZIsW2aJFtmiRLVpkixbZokW2aJEtBovs790/'
+        'e/s7d1fwS569LXn2tuTZ25Jnb0uevS159rbk2duSZ29Lnr0tefa25NnbElxLcC3BtQTXElxLcC3B'
+        'tQTXElxLcC3BtQTXElxLcC3BtQTXElxLcC3BtQTXElxLcC3BtQTXElxLcC3BtQTXElxLcC3BtQTX'
+        'ElxLcC3BtQTXElxLcC3BtQTXkmdvS4wtMbbE2BJjS4wtMbbE2BJjS4wtMbbE2BJjS4wtMbbE2BJj'
+        'S4wtEbCE2hJqS4wtMbbE2BJjS4wtMbbE2BJjS4wtMbbE2JJnb0uevS159rbk2duSZ29Lnr0tefa2'
+        '5NnbkmdvS569LXn2tuTZ25Jnb0uevS159rbk2dtSgPnv32P+83eYCzAXYC7AXIC5AHMB5gLMBZgL'
+        'MBdgLsBcgLkAcwHmAswFmAswF2AuwFyAuQBzAeYCzAWYCzAXYC7AXIC5AHMB5gLMBZgLMBdgLsBc'
+        'gLkAcwHmAswFmAswF2AuwFyAuQBzAeYCzAWYCzAXYC7AXIC5AHMB5gLMBZgLMBdgLsBcgLkAcwHm'
+        'AswFmAswF2AuwFyAuQBzAeYCzAWYCzAXYC7AXIC5AHMB5gLMBZgLMBdgLsBcgLkAcwHmAswFmAsw'
+        'F2AuwFyAuQBzAeYCzAWYCzAXYC7AXAgw/4Mv9u8rCZ677DaOJ/9Jp8Rf+EL6vAR/x+PG3/Ez/lxr'
+        '9/5g9w8d7JbV1bK6WlZXy+pqWV0tq6tldbWsrpbV1bK6WlZXy+pqWV0tq6tldbWsrpbV1bK6WlZX'
+        'y+pqWV0tq6tldbWsrpbV1bK6WlZXy+pqWV0tq6tldbWsrpbV1bK6WlZXy+pqWV0tq6tldbWsrpb1'
+        '1LKeWtZTy3pqWU8t66llPbWsp5b11LKeWtZTy3pqWU8t66llPbWsp5b11LKCWlZQyw52y3pqWU8t'
+        '66llPbWsp5b11LKeWtZTy3pqWU8t66llTbgc1Mc/bHD4RIPfexrPBT7a2Ir/8lHwVcl7je/8/TNP'
+        'e9bR3vhO6Re8e6D/PcGTux9u/OodvT/UG/zq7zT++P9zf+n18btLrw2yNsjaIGuDrA2yNsjaIGuD'
+        'rI3797zeYGyDsQ3GNhjbYGyDsQ3GNhjbYGyDsQ3GNhjbYGyDsQ3GNhjbYGyDsQ3GNhjbYGyDsQ3G'
+        'NhjbYGyDsQ3GNhjbYGyDsQ3GNhjbYGyDsQ3GNhjbYGyDsQ3GNhjbYGyDsQ3GNhjbYGyDsQ3GNhjb'
+        'YGyDgA3UNlDbQG0DtQ3UNlDbQG0DtQ3UNlDbQG0DtQ3UNlDbCIzt35+3XnP30k/ReavovFV03io6'
+        'bxWdt4rOW0XnraLzVtF5q+i8VXTeKmJWxKyIWRGzImZFzIqYFTErwlWEqwhXEa4iXEW4inAV4SrC'
+        'VYSrCFcRriJcRbiKcBXhKsJVhKsIVxGuIlxFuIpwFeEqwlWEqwhXEa4iXEW4inAV4So6bxUZKzJW'
+        'ZKzIWJGxImNFxoqMFRkrMlZkrMhYkbEiY0XGiowVGSsyVmSsyFgRriJcRbiKcBXhKsJVhKsIVxGu'
+        'IlxFuIrOW0XnraLzVtF5q+i8VXTeKjpvFZ23is5bReetovNW0Xmr6LxVdN4qOm8VnbeKAeb/97l3'
+        'aflLwWXLP7p7A/fHH2v8qvKhu3fm2An+4T9+7s/2BNe/B/c5+Bt3zztKclCSg5IclOSgJAclOSjJ'
+        'QUkOSnJQkoOSHJTkoCQHJTkoyUFJDkpyUJKDkhyU5KAkByU5KMlBSQ5KclCSg5IclOSgJAclOSjJ'
+        'QUkOSnJQkoOSHJTkoCQHJTkoyUFJDkpyUJKDkhyU5KAkByU5KMlBSQ5KclCSg5IclOSgJAclOSjJ'
+        'QUkOSnJQkoOSHJTkoCQHJTkoyUFJDkpyUJKDkhyU5KAkByU5KMlBSQ5KclCSg5IclOSgJAclOSjJ'
+        'QUkOSnJQkoOSHJTkoCQHJTkoyUFJDkpyUJKDkhyU5KAkByU5KMlBSQ5KclCSg5IclIIc/H+N08FP'
+        '3d1JrjWOrsHu/+jd7t+BcQfGHRh3YNyBcQfGHRh3YNyBcQfGHRh3YNyBcQfGHRh3YNyBcQfGHRh3'
+        'YNyBcQfGHRh3YNyBcQfGHRh3YNyBcQfGHRh3YNyBcQfGHRh3YNyBcQfGHRh3YNyhcIfCHQp3KNyh'
+        'cIfCHQp3KNyhcIfCHQp3KNyhcIfCHQp3KNyhcAe/Hfx2rPodCnco3KFwh8IdCnco3KFwh8IdCnco'
+        '3KFwh/OdAMfhl8o7fAVP3H68cXL+tJ58/eKH7r7Q76cb++CffKm+D9q/+7kJPosvbnzLY/BZ+qeN'
+        'z0ut8Xvf8PRzz0mugl75xNhu4OufPbd1f7nxeTx68qvgnZj7gq37zxvNtNl4+vBzjXp6f+OffKTx'
+        'EAWr99HdEbRi9Vas3orVW7F6K1ZvxeqtWL0Vq7di9Vas3orVW9F2FW1X0XYVbVfRdhVtV9F2FW1X'
+        '0XYVbVfRdhVtV9F2FW1X0XYVbVfRdhVtV9F2FW1X0XYVbVfRdhVtV9F2FW1X0XYVbVfRdhVtV9F2'
+        'FW1X0XYVbVfRdhVtV9F2FW1X0XYVbVexeitKr6L0KkqvovQqSq+i9CpKr6L0KkqvovQqSq+i9CpK'
+        'r6L0KkqvovQqSq+ikiq6r6L7KkqvovQqSq+i9CpKr6L0KkqvovQqSq+i9CpKr2L1VqzeitVbsXor'
+        'Vm/F6q1YvRWrt2L1VqzeitVbsXorVm/F6q1YvRWrtxLoP75rkfj/Ghwrq/dPvGN3y/cQx0McD3E8'
+        'xPEQx0McD3E8xPEQx0McD3E8xPEQx0McD3E8xPEQx0McD3E8xPEQx0McD3E8xPEQx0McD3E8xPEQ'
+        'x0McD3E8xPEQx0McD3E8xPEQx0McD3E8xPGQw0MODzk85PCQw0MODzk85PCQw0MODzk85PCQw0MO'
+        'Dzk85PCQw0MADwE8tHwPOTzk8JDDQw4POTzk8JDDQw4POTzk8JDDQ9IPAx4njf77a+5tHjcK9Csa'
+        'H7ziJ3/6/jLnoPENmD979yf+0JM/8bjxwZ9q3OKc3j9H+cDdc5SqoqwqyqqirCrKqqKsKsqqoqwq'
+        'yqqirCrKqqKsklkls0pmlcwqmVUyq2RWyaySWSWzSmaVzCqZVTKrZFbJrJJZJbNKZpXMKplVMqtk'
+        'Vsmsklkls0pmlcwqmVUyq2RWyaySWSWzSmaVzCqZVTKrZFbJrCrKKqBVQKuAVgGtAloFtApoFdAq'
+        'oFVAq4BWAa0CWgW0CmgV0CqgVXyqnFY5rQJaBbQKaBXQKqBVQKuAVgGtAloFtApoVVFWFWVVUVYV'
+        'ZVVRVhVlVVFWFWVVUVYVZVVRVhVlVVFWFWVVUVYVZTVIwtl9M37irhlP+Tvl75S/U/5O+Tvl75S/'
+        'U/5O768kT0k8JfGUxFMST0k8JfGUxFMST0k8JfGUxFMST0k8JfGUxFMST0k8JfGUxFMST0k8JfGU'
+        'xFMST0k8JfGUxFMST0k8JfGUxFMSTxE8RfAUwVMETxE8RfAUwVMETxE8RfAUwVMETxE8RfAUwVME'
+        'TxE8RfAUwVMET1XlKYmnJJ6SeEriKYmnJJ6SeEriKYmnJJ6SeBrI+KXn31ni+XeW+GJ/Zwk/XOPm'
+        'ya5//ien/Ze8scT5/UumH7VFLmyRC1vkwha5sEUubJELW+TCFrmwRS7sjgu748LuuLA7LuyOC7vj'
+        'wu64sDsu7I4Lu+PC7riwOy7sjgu748LuuLA7LuyOC7vjwu64sDsu7I4Lu+PC7riwOy7sjgu748Lu'
+        'uLA7LuyOC7vjwu64sDsu7I4Lu+PC7riwOy7sjgu748LuuLA7LuyOC7vjwu64sDsu7I4Lu+PC7riw'
+        'Oy7sjgtL48LSuLA0LiyNC0vjwtK4sDQuLI0LS+PC0riwNC4sjQtL48LSuLCdLoLdcdF4G+mXvPd9'
+        'f2L0A+/94Mj7UqPBO0f/+cYVaOOy//HHG+foX26Y+WTjH2y4enjy0SuevrslffwPOKpxVOOoxlGN'
+        'oxpHNY5qHNU4qnFU46jGUY2jGkc1jmoc1TiqcVTjqMZRjaMaRzWOahzVOKpxVOOoxlGNoxpHNY5q'
+        'HNU4qnFU46jGUY2jGkc1jmoc1TiqcVTjqMZRjaMaRzWOahzVOKpxVOOoxlGNoxpHNY5qHNU4qnFU'
+        '46jGUQ2gGkA1gGoA1QCqAVQDqAZQDaAaQDWAagDVAkAfef4ttT8PjyH3bxb9gkZMnz+TfEG+29UX'
+        '5wHkV+6fx/7zu+exlzbHpc1xaXNc2hyXNselzXFpc1zaHJc2x6XNcWlzXNoclzbHpc1xaXNc2hyX'
+        'NselzXFpc1zaHJc2x6XNcWlzXNoclzbHpc1xaXNc2hyXNselzXFpc1zaHJc2x6XNcWlzXNoclzbH'
+        'pc1xaXNc2hyXNselzXFpc1zaHJc2x6XNcWlzXNoclzbHpc1xaXNc2hyXNselzXFpc1zaHJc2x6XN'
+        'cWlzXDqBXFoglxbIpQVyaYFcWiCXFsilBXJpgVxaIJcWyKUFcmmBXAYL5FfvL+leevdqRt0lXd0l'
+        'Xd0lXd0lXd0lXd0lXd0lXd0lXd0lXd0lXd0lXR2uOlx1uOpw1eGqw1WHqw5XHa46XHW46nDV4arD'
+        'VYerDlcdrjpcdbjqcNXhqsNVh6sOVx2uOlx1uOpw1eGqw1WHqw5XHa46XHW46nDV4arDVYerDlfd'
+        'JV2dsTpjdcbqjNUZqzNWZ6zOWJ2xOmN1xuqM1RmrM1ZnrM5YnbE6AXXU6qjVGaszVmeszlidsTpj'
+        'dcbqjNUZqzNWZ6zukq7ukq7ukq7ukq7ukq7ukq7ukq7ukq7ukq7ukq7ukq7ukq7ukq7ukq7ukq7u'
+        'kq4eYP7o59uroME3zk09idXn9Hsif+3z8oYqeP/GZxpPdZ6/q3r+XPj8u6B+vpwQf/1DXsSL//3g'
+        'JeHa/YHxY3cHxis7/cpOv7LTr+z0Kzv9yk6/stOv7PSr+xc+rmz3K9v9yna/st2vbPcr2/3Kdr+y'
+        '3a9s9yvb/cp2v7Ldr2z3K9v9yna/st2vbPcr2/3Kdr+y3a9s9yvb/cp2v7Ldr2z3K9v9yna/st2v'
+        'bPcr2/3Kdr+y3a+s9Str/cpav7LWr6z1K2v9ylq/stavrPUra/3KWr+y1q+s9Str/cpav7LWr6z1'
+        'K2v9ylq/stavnCCvbPcr2/3Kdr+y3a9s9yvb/cp2v7Ldr2z3K9v9yna/Crbtb9zfZdbBuAHjBowb'
+        'Im6IuCHihogbIm44uOHghoMbDm44uOHghoMbDm44uOHghoMbDm44uOHghoMbDm44uOHghoMbDm44'
+        'uOHghoMbDm44uOHghoMbDm44uOHghoMbDm44uOHghoMbDm44uOHghoMbDm44uOHghoMbDm44uOHg'
+        'hoMbDm44uAHgBoAbAG4AuAHgBoAbAG4AuAHgBoAbAG4AuAHgBoAb0m4CBx/zFOJJY3yscd0R3FT+'
+        'q/v7yZ9n45aNWzZulcYtIreI3CJyi8gtIreI3CJyi8gtIreI3CJyi8gtIreI3CJyi8gtIreI3CJy'
+        'i8gtIreI3CJyi8gtIreI3CJyi8gtIreI3CJyi8gtIreI3CJyi8gtIreI3CJyi8gtIreI3CJyi8gt'
+        'IreI3CJyi8gtIreI3CJyi8gtIreI3CJyi8gtG7ds3LJxy8YtG7ds3LJxy8YtG7ds3LJxy8ZtYOM3'
+        'f79O5MHX9f1UQ9UXxY8juPxC/XrN4HH4s48+U2/I8fHG5+UjjX/HR5881h8OPfPMp7w48kz6gyMf'
+        'eOY7gtdITp8OfnLp0433ogm+xax+f5Hx43dfbfSVLwguMoJRNU6MXzROjTPjl4xz48J4ynih8eXG'
+        'Vxi/bLzIeLHxlcZLjCbjpcbLjJcbzcZXGa8wXmmEjK82wsbXGC3G1xpfZ7zKaDVebbQZX2+8xvgG'
+        'o934RqPD+CbjtcbrjG82Xm+8weg03mh8xHiT8Wajy3iL8S3GtxrfZrzV6Da+3fgO4zuNiPE2o8f4'
+        'LiNq/IDx3cb3GL3G242Y8Q6jz/g+453Gu4zvN95tPDZ+xfhV46PGrxm/btSM3zA+ZvymcWl83Kgb'
+        'nzB+y/ik8dvByDz+xP2h+zfuDt1N/DXx18RfE39N/DXx18RfE3+N4dDdRGITiU0kNpHYRGITiU0k'
+        'NpHYRGITiU0kNpHYRGITiU0kNpHYRGITiU0kNpHYRGITiU0kNpHYRGITiU0kNpHYRGITiU0kNpHY'
+        'hGATgk0INiHYhGATgk0INiHYhGATgk0INiHYhGATgk0INiHYhGATgk0INiEYjO81eo23GzHjHUaf'
+        '8X3GO413Gd9vvNt4HIzM49/6kvp2iNNP+9shPvn8V2F9bn5KWnCNN/To+dc5n/95aV8oPy8t8/i3'
+        'n3vT1banGndc/6JRHh8c+7bgUQl+5GbwWtg/Gws5O4acHUPOjiFnx5CzY8jZMeTsGHJ2DDk7hpwd'
+        'Q3Z3yO4O2d0huztkd4fs7pDdHbK7QzZ2yMYO2dghGztkY4ds7JCNHbKxQzZ2yMYO2dghGztkY4ds'
+        '7JCNHbKxQzZ2yMYO2dghGztkY4ds7JCNHbKxQzZ2yMYO2dghGztkY4ds7JCNHbKxQ86OIYs7ZHGH'
+        'LO6QxR2yuEMWd8jiDlncIYs7ZHGHLO6QxR2yuEMWd8jiDlncIYs7ZHGHLO6QxR2ysUM2dsjGDtnY'
+        'IRs7ZGOHbOyQjR2ysUM2dsjGDjk7hpwdQ86OIWfHkLNjyNkx5OwYcnYMOTuGnB1Dzo4hZ8eQs2PI'
+        '2THk7BhydgwFJ4R/ef9E6C/dPREKeyIUhjkMcxjmMMxhmMMwh2EOwxyGOQxzGOYwzGGYwzCHYQ7D'
+        'HIY5DHMY5jDMYZjDMIdhDsMchjkMcxjmMMxhmMMwh2EOwxyGOQxzGOYwzGGYwzCHYQ7DHIY5DHMY'
+        '5jDMYZjDMIdhDsMchjkMcxjmMMxhmMMwh2EOwxyGOQxzGOYwzGGYwzCHYQ7DHIY5DHMY5jDMYZjD'
+        'MIdhDsMchjkMcxjmMMxhmMMwh2EOwxyGOQxzGOYwzGGYwzCHYQ7DHIY5DHMY5jDMYZjDMIdhDsMc'
+        'hjkMczjA/Dv3d8yf9DyoBb8W/Fq4a+GuhbsW7lq4a+GuhbsW7lq4a+GuhbsW7lq4a+GuhbsW7lq4'
+        'a+GuhbsW7lq4a+GuhbsW7lq4a+GuhbsW7lq4a+GuhbsW7lq4a+GuhbsW7lq4awGuBbgW4FqAawGu'
+        'BbgW4FqAawGuBbgW4FqAawGuBbgW4FqAawGuhbQW0lo832kBrgW4FuBagGsBrgW4FuBagGsBrgW4'
+        'FuBakG4JHFz95z7tCV6B/5UndL4of6rp9f09wa/f3RO0ykerfLSq51YxaRWTVjFpFZNWMWm9vydo'
+        'FZhWgWkVmFaBaRWYVoFpFZhWgWkVmFaBaRWYVoFpFZhWgWkVmFaBaRWYVoFpFZhWgWkVmFaBaRWY'
+        'VoFpFZhWgWkVmFaBaRWYVoFpFZhWgWkVmFaBaRWYVoFpFZhWgWkVmFaBaRWYVoFpFZhWgWkVmFaB'
+        'aRWYVoFpFZhWnFvlplVuWuWmVW5a5aZVblrlplVuWuWmVW5a5aZVblrlplVuWoPA3NzL+No7GW1k'
+        'tJHRhkQbEm1ItCHRhkQbCG0gtIHQBkIbCG0gtIHQBkIbCG0gtIHQBkIbCG0gtIHQBkIbCG0gtIHQ'
+        'BkIbCG0gtIHQBkIbCG0gtIHQBkIbCG0gtIHQBkIbCG0gtIHQBkIbCG0gtIHQBkIbCG0gtIHQBkIb'
+        'CG0gtIHQBkIbCG0EtBHQRkAbAW0EtBHQRkAbAW0EtBHQRkAbAW0EtBHQhlpbAOFfPXmq86rgDZpf'
+        '0Hiq86/vXdTvXLRz0c5Fu8Zox6Mdj3Y82vFox6P9vjHaQWkHpR2UdlDaQWkHpR2UdlDaQWkHpR2U'
+        'dlDaQWkHpR2UdlDaQWkHpR2UdlDaQWkHpR2UdlDaQWkHpR2UdlDaQWkHpR2UdlDaQWkHpR2UdlDa'
+        'QWkHpR2UdlDaQWkHpR2UdlDaQWkHpR2UdlDaQWn3MLbz0s5LOy/tvLTz0s5LOy/tvLTz0s5LOy/t'
+        'vLTz0s5LewDl39zL+Oo7GR1kdJDRgUQHEh1IdCDRgUQHCB0gdIDQAUIHCB0gdIDQAUIHCB0gdIDQ'
+        'AUIHCB0gdIDQAUIHCB0gdIDQAUIHCB0gdIDQAUIHCB0gdIDQAUIHCB0gdIDQAUIHCB0gdIDQAUIH'
+        'CB0gdIDQAUIHCB0gdIDQAUIHCB0gdIDQAUIHCB0EdBDQQUAHAR0EdBDQQUAHAR0EdBDQQUAHAR0E'
+        'dBDQgVpHAOH2Qz/94af7B38oeD/GNz4pjfiXPfrQT4/9vUe+p+Gw8WVB8UeP7rn85h2XTlw6celU'
+        'JJ3UdFLTSU0nNZ3UdN4XSSc/nfx08tPJTyc/nfx08tPJTyc/nfx08tPJTyc/nfx08tPJTyc/nfx0'
+        '8tPJTyc/nfx08tPJTyc/nfx08tPJTyc/nfx08tPJTyc/nfx08tPJTyc/nfx08tPJTyc/nfx08tPJ'
+        'Tyc/nfx08tPJTyc/nR7dTow6MerEqBOjTow6MerEqBOjTow6MerEqBOjTow6MWqMTPypR/8lh/X4'
+        'X376i/S0Hn/6ITO/dpeZLpnpkpkumemSmS6Z6ZKZLpnpkpmu+8x0yUyXzHTJTJfMdMlMl8x0yUyX'
+        'zHTJTJfMdMlMl8x0yUyXzHTJTJfMdMlMl8x0yUyXzHTJTJfMdMlMl8x0yUyXzHTJTJfMdMlMl8x0'
+        'yUyXzHTJTJfMdMlMl8x0yUyXzHTJTJfMdMlMl8x0yUyXzHTJTJfMdMlMl8x0yUyXzHTJTJfMdMlM'
+        'l8x0yUyXzHTJTJfMdMlMl8x0yUyXzHTJTJfMdAWZecHvykyQhZNGFr5U38oryMwLH32pvbNZ8MD/'
+        'TuOFz//gJ+bLH8rkpXdl0q1MupVJtxbp1iLdWqRbi3RrkW7d0a07unVHt+7o1h3duqNbd3Trjm7d'
+        '0a07unVHt+7o1h3duqNbd3Trjm7d0a07unVHt+7o1h3duqNbd3Trjm7d0a07unVHt+7o1h3duqNb'
+        'd3Trjm7d0a07unVHt+7o1h3duqNbd3Trjm7d0a07unVHt+7o1h3duqNbd3Trjm7d0a00upVGt9Lo'
+        'VhrdSqNbaXQrjW6l0a00upVGt9LoVhrdSqNbaXRrp+6gO77i0XPvDbsTHM1e9Oj+FYCn776nK+IV'
+        'gIhXACJeAYh4BSDiFYCIVwAiXgGIeAUg4hWAiFcAIl4BiGAWwSxiZ0Voi9AWoS1CW4S2CG0R2iK0'
+        'RWiL0BahLUJbhLYIbRHaIrRFaIvQFqEtQluEtghtEdoitEVoi9AWoS1CW4S2CG0R2iK0RWiL0Bah'
+        'LUJbhLaIVwAi0EWgi0AXgS4CXQS6CHQR6CLQRaCLQBeBLgJdBLoIdBHoItBFkIiwF2EvAl0Eugh0'
+        'Eegi0EWgi0AXgS4CXQS6CHQRrwBEvAIQ8QpAxCsAEa8ARLwCEPEKQMQrABGvAES8AhDxCkDEKwAR'
+        'rwBEvAIQ8QpAxCsAkUD3ix967nV3PdcDYA+APQD2ANgDYA+APQD2ANgDYA+APQD2ANgDYA+APQD2'
+        'ANgDYA+APQD2ANgDYA+APQD2ANgDYA+APQD2ANgDYA+APQD2ANgDYA+APQD2ANgDYA+APQD2ANhD'
+        'Xg95PeT1kNdDXg95PeT1kNdDXg95PeT1kNdDXg95PeT1kNdDXg9yPcj1qLse8nrI6yGvh7we8nrI'
+        '6yGvh7we8nrI6yGvh+2eAMRXPoB4zx2IKBBRIKJARIGIAhEFIgpEFIgoEFEgokBEgYgCEQUiCkQU'
+        'iCgQUSCiQESBiAIRBSIKRBSIKBBRIKJARIGIAhEFIgpEFIgoEFEgokBEgYgCEQUiCkQUiCgQUSCi'
+        'QESBiAIRBSIKRBSIKBBRIKJARIGIAhEFIgpEFIgoEFEgokBEgYgCEQUiCkQUiCgQUSCiQESBiAIR'
+        'BSIKRBSIaADiJY+eexPLH2i8aWu86QHIr9wB6QWkF5BeQHoB6QWkF5BeQHoB6QWkF5BeQHoB6QWk'
+        'F5BeQHoB6QWkF5BeQHoB6QWkF5BeQHoB6QWkF5BeQHoB6QWkF5BeQHoB6QWkF5BeQHoB6QWkF5Be'
+        'QHoB6QWkF5BeQHoB6QWkF5BeQHoB6QWkF5BeQHoB6QWkF5BeQHoB6QWkF5BeQHoB6QWkF5BeQHoB'
+        '6QWkF5BeQHoB6QWkF5BeQHoB6Q2AvPThQPTX7r4kIuZAFHMgijkQxRyIYg5EMQeimANRzIEo5kAU'
+        'cyCKORDF6IrRFaMrRleMrhhdMbpidMXoitEVoytGV4yuGF0xumJ0xeiK0RWjK0ZXjK4YXTG6YnTF'
+        '6IrRFaMrRleMrhhdMbpidMXoitEVoytGV4yuGF0xumJ0xRyIYpDFIItBFoMsBlkMshhkMchikMUg'
+        'i0EWgywGWQyyGGQxyGKQxRCIsRZjLQZZDLIYZDHIYpDFIItBFoMsBlkMshhkMQeimANRzIEo5kAU'
+        'cyCKORDFHIhiDkQxB6KYA1HMgSjmQBRzIIo5EMUciGIORLFA88se6u0dd/XWB2AfgH0A9gHYB2Af'
+        'gH0A9gHYB2AfgH0A9gHYB2AfgH0A9gHYB2AfgH0A9gHYB2AfgH0A9gHYB2AfgH0A9gHYB2AfgH0A'
+        '9gHYB2AfgH0A9gHYB2AfgH0A9gHYR14feX3k9ZHXR14feX3k9ZHXR14feX3k9ZHXR14feX3k9ZHX'
+        'R14fcn3I9am3PvL6yOsjr4+8PvL6yOsjr4+8PvL6yOsjr4/tvgDEyz+rVyTB9URn43ric3BZ8uEX'
+        '9v3gD/b/YPDKxNV/4o9xizc/ev5rxD83XyP+hfqV4d718o/+5E8//yXiX2pfIh7/qoc1W7tbs3Fr'
+        'Nm7Nxq3ZuDUbt2bj1mzcmo1bs/H7F2viFm7cwo1buHELN27hxi3cuIUbt3DjFm7cwo1buHELN27h'
+        'xi3cuIUbt3DjFm7cwo1buHELN27hxi3cuIUbt3DjFm7cwo1buHELN27hxi3cuIUbt3DjFm7cwo1b'
+        'uHELN27hxi3cuIUbt3DjFm7cwo1buHELN27hxi3cuIUbt3DjFm7cOozbu3F7N27vxu3duL0bt3fj'
+        '9m7c3o3bu3F7N27vxu3duL0bt3fjwcJ9xQONV9zR6EejH41+JvqZ6Gein4l+JvpJ6Cehn4R+EvpJ'
+        '6Cehn4R+EvpJ6Cehn4R+EvpJ6Cehn4R+EvpJ6Cehn4R+EvpJ6Cehn4R+EvpJ6Cehn4R+EvpJ6Ceh'
+        'n4R+EvpJ6Cehn4R+EvpJ6Cehn4R+EvpJ6Cehn4R+EvpJ6Cehn4R+EvpJ6EegH4F+BPoR6EegH4F+'
+        'BPoR6EegH4F+BPoR6EegH4F+1voDCa/8rB29gp9h87ONb7P6vV6nCg5l+cY//Tx7AU9KQncpGRCP'
+        'Ac05ICUDUjIgJQNSMiAlA1IyICUDUjIgJQNSMiAlA1IyICUDUjIgJQNSMiAlA1IyIB4D4jEgHgPi'
+        'MSAeA+IxIB4D4jEgHgPiMSAeA+IxIB4D4jEgHgPiMSAeA+IxIB4D4jEgHgPiMSAeA+IxIB4D4jEg'
+        'HgPiMSAXA3IxIBcDcjEgFwNyMSAXAwIxIBADAjEgEAMCMSAQAwIxIBADAjEgEAMCMSAQAwIxEAQi'
+        'dF+Nj3/HYz6oGQc99IMe80GP+aDHfNBjPugxH/SYD3rMBz3mgx7zQY/5oMd80GM+6DEf9JgPeswH'
+        'PeaDHvNBj/mgZhz00A966Ac99IMe+kEP/aCHftBDP+ihH/TQD3roBz30gx76QQ/9oId+0EM/6KEf'
+        '9NAPeugHPfSDHvpBD/2gh37QQz/ooR/00A966Ac99IMe+kHNOEjAIAGDBAwSMEjAIAGDBAxqxkEQ'
+        'BkEYBGEQhEEQBkEYBGEQhEEQBkEYBGEQhEEQBgMIX/1w5/bs3Z1bwp1bwp1bwp1bwp1bwp1bwp1b'
+        'wp1bwp1bwp1bwp1bwp1bAqsEVgmNkqArQVeCrgRdCboSdCXoStCVoCtBV4KuBF0JuhJ0JehK0JWg'
+        'K0FXgq4EXQm6EnQl6ErQlaArQVeCrgRdCboSdCXoStCVoCtBV4KuBF0JuhLu3BKQJSBLQJaALAFZ'
+        'ArIEZAnIEpAlIEtAloAsAVkCsgRkCcgSkCUQSLCWYC0BWQKyBGQJyBKQJSBLQJaALAFZArIEZAl3'
+        'bgl3bgl3bgl3bgl3bgl3bgl3bgl3bgl3bgl3bgl3bgl3bgl3bgl3bgl3bgl3bolAc/jhxLd9t8uG'
+        'ABwCcAjAIQCHABwCcAjAIQCHABwCcAjAIQCHABwCcAjAIQCHABwCcAjAIQCHABwCcAjAIQCHABwC'
+        'cAjAIQCHABwCcAjAIQCHABwCcAjAIQCHABwCcAjAIQCHyBsib4i8IfKGyBsib4i8IfKGyBsib4i8'
+        'IfKGyBsib4i8IfKGyBtCbgi5IfU2RN4QeUPkDZE3RN4QeUPkDZE3RN4QeUPkDbE9FID4msZrTo0f'
+        'hhV/WeM7iOMtD3X3FXdfc5FUd0l1l1R3SXWXVHdJdZdUd0l1l1R3SXWXVHdJ2pK0JWlL0pakLUlb'
+        'krYkbUnakrQlaUvSlqQtSVuStiRtSdqStCVpS9KWpC1JW5K2JG1J2pK0JWlL0pakLUlbkrYkbUna'
+        'krQlaUvSlqQtSVuStiRtSXWXhC4JXRK6JHRJ6JLQJaFLQpeELgldErokdEnoktAloUtCl4QuiUSS'
+        'vSR7SeiS0CWhS0KXhC4JXRK6JHRJ6JLQJaFLqrukukuqu6S6S6q7pLpLqrukukuqu6S6S6q7pLpL'
+        'qrukukuqu6S6Swa6v/bRp3xDfPAzM7/sKT8z8xn/smeCP/Z1D624c9eKI5yOcDrC6QinI5yOcDrC'
+        '6QinI5yOcDrC6QinI5yOcDrC6QinI5yOcDrC6QinI5yOcDrC6QinI5yOcDrC6QinI5yOcDrC6Qin'
+        'I5yOcDrC6QinI5yOcDrC6QinI4COADoC6AigI4COADoC6AigI4COADoC6AigI4COADoC6AigI4CO'
+        'kDlC5ohWHAF0BNARQEcAHQF0BNARQEcAHQF0BNARQEdEYCQA8aqHFvzTd4e+lBZMacGUFkxpwZQW'
+        'TGnBlBZMacGUFkxpwZQWTNGVoitFV4quFF0pulJ0pehK0ZWiK0VXiq4UXSm6UnSl6ErRlaIrRVeK'
+        'rhRdKbpSdKXoStGVoitFV4quFF0pulJ0pehK0ZWiK0VXiq4UXSm6UnSl6EppwRRkKchSkKUgS0GW'
+        'giwFWQqyFGQpyFKQpSBLQZaCLAVZCrIUZCkEUqylWEtBloIsBVkKshRkKchSkKUgS0GWgiwFWUoL'
+        'prRgSgumtGBKC6YUU0oLprRgSgumtGBKC6a0YEoLprRgSgumtGAq0Nz6UG+dd/U2CuAogKMAjgI4'
+        'CuAogKMAjgI4CuAogKMAjgI4CuAogKMAjgI4CuAogKMAjgI4CuAogKMAjgI4CuAogKMAjgI4CuAo'
+        'gKMAjgI4CuAogKMAjgI4CuAogKMAjgI4St4oeaPkjZI3St4oeaPkjZI3St4oeaPkjZI3St4oeaPk'
+        'jZI3St4ocqPIjaq3UfJGyRslb5S8UfJGyRslb5S8UfJGyRslb5Tt0QDEqx99qf+U7eCe8WWNn679'
+        'b72y2vb8K6vPv6/88+8r/7l4X/ng7df+auPm/wvmHebjX3//DQuDwZPn13zh1UfwhQEve/JZf75H'
+        'nu+R538+xWezPb7h4SWmG6fycafycafyccfxccfxccfxccfxccfxccfxccfxccfxccfxccfxccfx'
+        'ccfxccfxccfxccfxccfxccfxccfxccfxccfxccfxccfxccfxccfxccfxccfxccfxccfxccfxccfx'
+        'ccfxccfxccfxccfxccfxccfxccfxccfxccfxccfxccfxccfxccfxccfxccfxccfxccfxccfxccfx'
+        'ccfxccfxccfxccfxccfxccfxccfxccfxccfxccfxccfxccfxccfxccfxccfxccfxccfxccfxccfx'
+        'ccfx8eA43m6NPHl69sLG07N0/BsfBT9ONT36wWd+9L0fHP3AyI8GbxX+9Y1vov3DjY9e9+SjTLyj'
+        '8f932fj13w2+X+6bGu9u8FN3P7HxG4Pfem1g7Dcbv/FzTwf3GMFV2G81fuMvNH6j3vjorzQ++pXG'
+        'R3+j8WblL02N/8n3j3zgvenx9z0z/v7gX/2ixp/4jcZHP9L46OONjyYbHwWXav/6kUu1n/Dc9SeC'
+        'v9Xr7pfjx4Ll+M2N/5SxP/O0/7z25340bHz/yUcfftFI+kee+eCfer+fG1t/8lv3b9PwJx41/q6v'
+        '/4J4yhI8rfjBxteUfta+r/gNj/7d9/x81d17fuZdVeVdVeVdVeVdVeVdVeVdVeVdVeVdVeVdVeVd'
+        'VeV1Ul4n5d0U5FVTXjXlVVNeNeVVU1415VVTXjXlVVNeNeVVU1415VVTXjXlVVNeNeVVU1415VVT'
+        'XjXlVVNeNeVVU1415VVTXjXlVVNeNeVVU1415VVTXjXlVVNeNeVVU1415VVT3lVVXkPlNVReQ+U1'
+        'VF5D5TVUXkPlNVReQ+U1VF5D5TVUXkPlNVReQ+U1VF5D5fVHXlHlFVVeQ+U1VF5D5TVUXkPlNVRe'
+        'Q+U1VF5D5TVUXkPlXVXlXVXlXVXlXVXlXVXlxT3vqirvqirvqirvqirvqirvqirvqirvqirvqirv'
+        'qioflEbn80/An//S5i+ON7321KrjySZ7/kubP0Nf2vzGR1/IP33m8exn6IfPxN8UfF6Cn1/1M4/u'
+        'fn5V/O/fXf3PW+jzFvq8hT5voc9b6PMW+ryFPm+hz1vo8xb6vIU+b6HPW+jzFvq8hT5voc9b6PMW'
+        '+ryFPm+hz1vo8xb6vIU+b6HPW+jzFvq8hT5voc9b6PMW+ryFPm+hz1vo8xb6vIU+b6HPW+jzFvq8'
+        'hT5voc/b5PM2+bxNPm+Tz9vk8zb5vE0+b5PP2+TzNvm8TT5vk8/b5PM2+bxNPm+Tz9vk81b4vBU+'
+        '77nGvE0+b5PP2+TzNvm8TT5vk8/b5PM2+bxNPm+Tz9vk884K88GCffOnPkf4seBg3tX4rXa/9fgj'
+        'jd95y+86U7bdnSkXnCkXnCkXnCkXnCkXnCkXnCkXnCkXnCkXnCkXnCkXEFxAcAHBBQQXEFxAcAHB'
+        'BQQXEFxAcAHBBQQXEFxAcAHBBQQXEFxAcAHBBQQXEFxAcAHBBQQXEFxAcAHBBQQXEFxAcAHBBQQX'
+        'EFxAcAHBBQQXEFxAcAHBBQQXnCkXSFwgcYHEBRIXSFwgcYHEBRIXSFwgcYHEBRIXSFwgcYHEBRIX'
+        'SFzgZAHIBSAXSFwgcYHEBRIXSFwgcYHEBRIXSFwgcYHEBWfKBWfKBWfKBWfKBWfKBWfKBWfKBWfK'
+        'BWfKBWfKBWfKBWfKBWfKBWfKBWfKBWfKhYD8t3w6W+LDL3rmmd739L/n7qdybTee237R/PSZ2pO/'
+        'zf0z7/c8/Wn+KJr4twafuI8GayS4PGgUxEXj2fi33T+3f39QIW+9//X/HrxzQffD10/83N3XT6z4'
+        '+okVBbKiQFYUyIoCWVEgKwpkRYGsKJAVBbKiQFYUyIoCWVEgKwpkRYGsKJAVBbKiQFYUyIoCWVEg'
+        'KwpkRYGsKJAVBbKiQFYUyIoCWVEgKwpkRYGsKJAVBbKiQFYUyIoCWVEgKwpkRYGsKJAVBbKiQFYU'
+        'yIoCWVEgKwpkRYGsKJAVBbKiQFYUyIoCWVEgKwpkRYGsKJAVBbKiQFYUyIoCWVEgKwpkRYGsKJAV'
+        'BbKiQFYUyIoCWVEgKwpkRYGsKJAVBbKiQFYUyIoCWVEgKwpkRYGsKJAVBbKiQFYUyIoCWVEgKwpk'
+        'RYGsKJAVBbKiQFYUyIoCWVEgKwpkRYGsKJAVBbKiQFaCAvn2h4vav+oMtcrfKn+r4K2CtwreKnir'
+        '4K2CtwreKnir4K2CtwreKnir4K2CtwreKnir4K2CtwreKnir4K2CtwreKnir4K2CtwreKnir4K2C'
+        'twreKnir4K2CtwreKnir4K0St0rcKnGrxK0St0rcKnGrxK0St0rcKnGrxK0St0rcKnGrxK0St4ra'
+        'KmqrDk+rxK0St0rcKnGrxK0St0rcKnGrxK0St0rcKtOrAYTv+F3nolffnYvW1NqaWltTa2tqbU2t'
+        'ram1NbW2ptbW1NqaWlvDag2rNbW2RtcaXWt0rdG1RtcaXWt0rdG1RtcaXWt0rdG1RtcaXWt0rdG1'
+        'RtcaXWt0rdG1RtcaXWt0rdG1RtcaXWt0rdG1RtcaXWt0rdG1RtcaXWt0rdG1RteaWluDbA2yNcjW'
+        'IFuDbA2yNcjWIFuDbA2yNcjWIFuDbA2yNcjWIFuDbA2BNdbWWFuDbA2yNcjWIFuDbA2yNcjWIFuD'
+        'bA2yNcjW1NqaWltTa2tqbU2tram1NbW2ptbW1NqaWltTa2tqbU2tram1NbW2ptbWAs3f+bCk/+Ld'
+        'kl63pNdpXqd5neZ1mtdpXqd5neZ1mtdpXqd5neZ1mtdpXqd5neZ1mtdpXqd5neZ1mtdpXqd5neZ1'
+        'mtdpXqd5neZ1mtdpXqd5neZ1mtdpXqd5neZ1mtdpXqd5neZ1mtdpXqd5neZ1mtdpXqd5neZ1mtdp'
+        'Xqd5neZ1mtdpXqd5neZ1mtdpXqd5neZ1mtdpXqd5neZ1mtdpXqd5neZ1mtdpXqd5neZ1mtdpXqd5'
+        'neZ1mtdpXqd5neZ1mtdpXqd5neZ1mtdpXqd5neZ1mtdpXqd5neZ1mtdpXqd5neZ1mtdpXqd5PdAc'
+        'CTT/duMM+qHGi1gveP/Iez8QvL/G++5eaXr89icf7DQ+6GycYd/28FWRb7i7GtkkdpPYTWI3id0k'
+        'dpPYTWI3id0kdpPYTWI3id0kdpPYTWI3id0kdpPYTWI3id0kdpPYTWI3id0kdpPYTWI3id0kdpPY'
+        'TWI3id0kdpPYTWI3id0kdpPYTWI3id1EdRPVTVQ3Ud1EdRPVTVQ3Ud1EdRPVTVQ3Ud1EdRPVTVQ3'
+        'Ud1EdZPRTUY3bfdNVDdR3UR1E9VNVDdR3UR1E9VNVDdR3UR1Uxg2A0E9D7dmX/7Uc7dmv3BHYwuN'
+        'LTS20NhCYwuNLTS20NhCYwuNLTS20NhCYwuNLTS20NhCYwuNLTS20NhCYwuNLTS20NhCYwuNLTS2'
+        '0NhCYwuNLTS20NhCYwuNLTS20NhCYwuNLTS20NhCYwuNLTS20NhCYwuNLTS20NhCYwuNLTS20NhC'
+        'YwuNLTS20NhCYwuNLTS20NhCYwuNLTS20NhCYwuNLTS20NhCYwuNLTS20NhCYyug8V2N57fBD+l+'
+        '41PBK/TRh6cEHwFkG5BtQLYB2QZkG5BtQLYB2QZkG5BtQLYB2QZkG5BtQLYB2QZkG5BtQLYB2QZk'
+        'G5BtQLYB2QZkG5BtQLYB2QZkG5BtQLYB2QZkG5BtQLYB2QZkG5BtQLYB2QZkG5BtQLYB2QZkG5Bt'
+        'QLYB2QZkG5BtQLYB2QZkG5BtQLYB2QZkG5BtQLYB2QZkG5BtQLYB2QZkG5BtQLYB2QZkG5BtQLYB'
+        '2QZkOwDy3b/n254/Ln+pv+v59zycMZvuvp2w7IxZdsYsO2OWnTHLzphlZ8yyM2bZGbPsjFl2xiw7'
+        'Y5alrix1ZakrS11Z6spSV5a6stSVpa4sdWWpK0tdWerKUleWurLUlaWuLHVlqStLXVnqylJXlrqy'
+        '1JWlrix1ZakrS11Z6spSV5a6stSVpa4sdWWpK0tdWerKUleWurLUlZ0xy8JXFr6y8JWFryx8ZeEr'
+        'C19Z+MrCVxa+svCVha8sfGXhKwtfWfjKwlcWjbIMlmWwLHxl4SsLX1n4ysJXFr6y8JWFryx8ZeEr'
+        'C1/ZGbPsjFl2xiw7Y5adMcvOmGVnzLIzZtkZs+yMWXbGLDtjlp0xy86YZWfMsjNmOUj5934aN8lP'
+        'Tg/Jp/4TLo+DC9ofbfx/fBbDPpZ+gcvggac+U69B9j75XMXf/nDGfv3dQWpXYncldldidyV2V2J3'
+        'JXZXYncldldidyV2V2J3JXZXYncldldidyV2V2J3JXZXYncldldidyV2V2J3JXZXYncldldidyV2'
+        'V2J3JXZXYncldldidyV2V2J3JXZXYncldldidyV2V1R3RXVXVHdFdVdUd0V1V1R3RXVXVHdFdVdU'
+        'd0V1V1R3RXVXVHdFdVdUd2V0V0Z37cldUd0V1V1R3RXVXVHdFdVdUd0V1V1R3RXVXVHdVQa7QYJi'
+        'DyD+xR2IPSD2gNgDYg+IPSD2gNgDYg+IPSD2gNgDYg+IPSD2gNgDYg+IPSD2gNgDYg+IPSD2gNgD'
+        'Yg+IPSD2gNgDYg+IPSD2gNgDYg+IPSD2gNgDYg+IPSD2gNgDYg+IPSD2gNgDYg+IPSD2gNgDYg+I'
+        'PSD2gNgDYg+IPSD2gNgDYg+IPSD2gNgDYg+IPSD2gNgDYg+IPSD2gNgDYg+IPSD2gNgDYg+IvQDE'
+        'Ox4O0r/Iwz4P+zzs87DPwz4P+zzs87DPwz4P+zzs87DPwz4P+zzs87DPwz4P+zzs87DPwz4P+zzs'
+        '87DPwz4P+zzs87DPwz4P+zzs87DPwz4P+zzs87DPwz4P+zzs87DPwz4P+zzs87DPwz4P+zzs87DP'
+        'wz4P+zzs87DPwz4P+zzs87DPwz4P+zzs87DPwz4P+zzs87DPwz4P+zzs87DPwz4P+zzs87DPw37g'
+        'oe/3/Ut6ggX7NY0991k8SY+9627BvqnxL/59X67f91Cjb76r0QOxORCbA7E5EJsDsTkQmwOxORCb'
+        'A7E5EJsDsTkQmwOxORCbA7E5EJsDsTkQmwOxORCbA7E5EJsDsTkQmwOxORCbA7E5EJsDsTkQmwOx'
+        'ORCbA7E5EJsDsTkQmwOxORCbA7E5EJsDsTkQmwOxORCbA7E5EJsDsTkQmwOxORCbA7E5EJsDsTkQ'
+        'mwOxORCbA7E5EJsDsTkQmwOxORCbA7E5EJsDsTkQmwOxORCbA7E5EJsDsTkQm4MgNu+8fwG+I/i6'
+        '/3cFQH698Rvnja8A+0iDyvc2noFl4t//gOctd3iO4DmC5wieI3iO4DmC5wieI3iO4DmC5wieI3iO'
+        '4DmC5wieI3iO4DmC5wieI3iO4DmC5wieI3iO4DmC5wieI3iO4GmMn/myL3v0ZY3/e6LoiKIjio4o'
+        'OqLoiKIjio4oOqLoiKIjio4oOqLoiKIjio4oOqLoiKIjio4oOqLoiKIjio4oOqLoiKIjio4oOqLo'
+        'iKIjio4oOqLoiKIjio4oOqLoiKIjio4oOqLoiKIjio4CRe9+kHFwJ+OYjGMyjsk4JuOYjGMyjsk4'
+        'JuOYjGMyjsk4JuOYjGMyjsk4JuOYjGMyjsk4JuOYjGMyjsk4JuOYjGMyjsk4JuOYjGO1cgzEMRDH'
+        'QBwDcQzEMRDHQBwDcQzEMRDHQBwDcQzEMRDHQBwDcQzEMRDHQBwDcQzEMRDHQBwDcQzEMRDHQBwD'
+        'cQzEMRDHQBwDcQzEMRDHQBwDcQzEMRDHQBwDcQzEMRDHAYjHD6ezCx5OeDjh4YSHEx5OeDjh4YSH'
+        'Ex5OeDjh4YSHEx5OeDjh4YSHEx5OeDjh4YSHEx5OeDjh4YSHEx5OeDjh4YSHEx5OeDjh4YSHEx5O'
+        'eDjh4YSHEx5OeDjh4YSHEx5OeDjh4YSHEx5OeDjh4YSHEx5OeDjh4YSHEx5OeDjh4YSHEx5OeDjh'
+        '4YSHEx5OeDjh4YSHEx5OeDjh4YSHEx5OeDjh4YSHEx5OAg8/8ODhn/NwxsMZD2c8nPFwxsMZD2c8'
+        'nPFwxsMZD2c8nPFwxsMZD2c8nPFwxsMZD2c8nPFwxsMZD2c8nPFwxsMZD2c8nPFwxsMZD2c8nPFw'
+        'xsMZD2c8nPFwxsMZD2c8nPFwxsMZD2c8nPFwxsMZD2c8nPFwxsMZD2c8nPFwxsMZD2c8nPFwxsMZ'
+        'D2c8nPFwxsMZD2c8nPFwxsMZD2c8nPFwxsMZD2c8nPFwFniIPyyMN90tjHMgzoE4B+IciHMgzoE4'
+        'B+IciHMgzoE4B+IciHMgzoE4B+IciHMgzoE4B+IciHMgzoE4B+IciHMgzoE4B+IciHMgzoE4B+Ic'
+        'iHMgzoE4B+IciHMgzoE4B+IciHMgzoE4B+IciHMgzoE4B+IciHMgzoE4B+IciHMgzoE4B+IciHMg'
+        'zoE4B+IciHMgzoE4B+IciHMgzoE4B+IciHMgzoE4B+IciPMAxHt+35++PW6cYd/2WX769p/9jC14'
+        'svnqxn/tv/e5W/8X9JvvBH/B28/Ik9o/8HnxiQn+gu9o/AU/b15E+4MPLRu/a9malq1p2ZqWrWnZ'
+        'mpatadmalq1p2ZqWrWnZmpatadmalq1p2ZqWrWnZmpatadmalq1p2ZqWrWnZmpatadmalq1p2ZqW'
+        'rWnZmpatadmalq1p2ZqWrWnZmpatadmalq1p2ZqWrWnZmpatadmalq1p2ZqWrWnZmpatadmalq1p'
+        '2ZqWrWnZmpatadmalq1p2ZqWrWnZmpatadmalq1p2ZqWrWnZmpatadmalq1p2ZqWrWnZmpatadla'
+        '0LI/+IVfIYefkQoZ+LQ+McF/wB999Hu/SDf21+6+T2Ku8Qd+j8/X2M/e/YHfePTZfdHuM1MuP/Ql'
+        '8V5wwUP+U40H7NP+xAw+fPdL5rnvfon/0+CNN/5Q47Yt+Cd/ObhtSzw8LTrWz9f6+Vo/X+vna/18'
+        'rZ+v9fO1fr7Wz9f6+Vo/X+vna/18rZ+v9fO1fr7Wz9f6+Vo/X+vna/18rZ+v9fO1fr7Wz9f6+Vo/'
+        'X+vna/18rZ+v9fO1fr7Wz9f6+Vo/X+vna/18rZ+v9fO1fr7Wz9f6+Vo/X+vna/18rZ+v9fO1fr7W'
+        'z9f6+Vo/X+vna/18rZ+v9fO1fr7Wz9f6+Vo/X+vna/18rZ+v9fO1fr7Wz9f6+Vo/X+vna/18rZ+v'
+        '9fO1fr7Wz9dBP/9w8P4tL33mmZEP/PH0M+kPjnzgmbcG31Y25i62/w8+bjAJvqDsdS5lhx52/Pvv'
+        'dvyjFwaGgvEVxouMFxtfabzEaDJearzMeLnRbHyV8QrjlUbI+GojbHyN0WJ8rfF1xquMVuPVRpvx'
+        '9cZrjG8w2o1vNDqMbzJea7zO+Gbj9cYbjE7jjcabjDcbXcZbjG8xvtX4NuOtRrfx7cZ3GN9pRIy3'
+        'GT3GdxlR47uN7zG+1+g13m7EjHcYfcb3Ge803mV8v/Fu47HxA8HIxP+rRrn8WEPLe4Ny+cP3V/vf'
+        'Ffx6uPHr28avvy74dfLzrsCDsh1rLPjP6Wb7I8EnppG2+M83CvxjjY/+t8bXhoefeeaDmff/6Ogz'
+        '7x/54AdHP/A+Ef3OIKI/GzT8Mw9xbL6LY7M4Notjszg2i2OzODaLY7M4Notjszg2i2OzODaLY7M4'
+        'Notjszg2i2OzODaLY7M4Notjszg2i2OzODaLY7M4Notjszg2i2OzODaLY7M4Notjszg2i2OzODaL'
+        'Y7M4Notjszg2i2OzODaLY7M4Notjszg2i2OzODaLY7M4Notjszg2i2OzODaLY7M4Notjszg2i2Oz'
+        'ODaLY7M4Notjszg2i2OzODaLY7M4Notjszg2i2OzODYHcfyvG3ELLiG+/AWNuI087PqPgxECIwRG'
+        'MH7ZeJHxYuMrjZcYTcZLjZcZLzeaja8yXmG80ggZX22Eja8xWoyvNb7OeJXRarzaaDO+3niN8Q1G'
+        'u/GNRofxTcZrjdcZ32y83niD0Wm80XiT8Wajy3iL8S3GtxrfZrzV6Da+3fgO4zuNiPE2o8f4LiNq'
+        'fLfxPcb3Gr3G242Y8Q6jz/g+453Gu4zvN95tPDZ+IBiZJ88jGh5+tQHk5Y3K+7XGRy98QaNEUs81'
+        '9+OBhpw/9vC1sH/r7vutXvXC4Gthg1E1ToxfNE6NM+OXjHPjwnjKeKHx5cZXGL9svMh4sfGVxkuM'
+        'JuOlxsuMlxvNxlcZrzBeaYSMrzbCxtcYLcbXGl9nvMpoNV5ttBlfb7zG+Aaj3fhGo8P4JuO1xuuM'
+        'bzZeb7zB6DTeaHzEeJPxZqPLeIvxLca3Gt9mvNXoNr7d+A7jO42I8Tajx/guI2r8gPHdxvcYvcbb'
+        'jZjxDqPP+D7jnca7jO833m08Nn7F+FXjo8avGb9u1IzfMD5m/KZxaXzcqBufMH7L+KTx28HIxEcb'
+        'uH+5gf0geAuA/ybQ/arGb7y1kYNw46P/o3He7Wp89LcbH72t8dFU46M3Nz56X/DOfn88eF/Af+Xr'
+        'ZR6/svH+g596cO4OtnLs6buDczz99HMn53Yn5z9x/+6JL/Duie8N/gf/0N2z9MXGewn+8N0v/mDw'
+        'bxxzMBj7hcb7CwX/U6/1P/Uj90etbwqOVj96/3f8i8HbGvzJ33XUCt598eNPf46/zD84cH2i8V/x'
+        'GbxOGPuXd2/IGPnUN5B4feN3nm68kfp/8Cz2vvvP7CeDz+z4w/nqk3fnq6j6iqqvqPqKqq+o+oqq'
+        'r6j6iqqvqPqKqq+o+oqqr6j6iqqvqPqKqq+o+oqqr6j6iqqvqPqKqq+o+oqqr6j6iqqvqPqKqq+o'
+        '+oqqr6j6iqqvqPqKqq+o+oqqr6j6iqqvqPqKqq+o3orqrajeiuqtqN6K6q2o3orqrajeiuqtqN6K'
+        '6q2o3orqrajeiuqtqN6KKqyowopao1G9FdVbUb0V1VtRvRXVW1G9FdVbUb0V1VtRvRXVjNGgTt7/'
+        'b7XA4t1x/fHffO758h9r5PPZh7PXv4EmBk0MmhgtMVpitMRoidESoyVGS4yWGC0xWmK0xGiJ0RKj'
+        'JUZLjJYYLTFaYrTEaInREqMlRkuMlhgtMVpitMRoidESoyVGS4yWGC0xWmK0xGiJ0RKjJUZLjJYY'
+        'LTFaYrTEaInREqMlRkuMlhgtMVpitMRoidESoyVGS4yWGC0xWmK0xGiJ0RKjJUZLjJYYLTFaYrTE'
+        'aInREgu0fOBT37Lq3Y1CSQc0amO/8PRzP+npd+7elPadwf/HB711Q6OBvuwFjR3jCeCnvr3uTfDM'
+        'L/N5fR8aNP1PNDboZ/3p9I/dL8OrYBn+t8En6v1j/+jpux8K3vhHTzW27WbjTRJ/7qng1FVpPB4f'
+        'NH7dqBonxqlxZvyScW5cBCMTnwj+VY1v3Y5/d2P5/J+Nj/56sMv/1P1i+aPBMSQb/NHGQ1QOns0/'
+        '1fhD/939H2oK/tMnH3rkn+iRYT0yrEeGLZ9hdTKsTobVybA6GVYnw+pkWJ0Mq5NhdTKsTobVybA6'
+        'GVYnw+pkWJ0Mq5NhdTKsTobVybA6GVYnw+pkWJ0Mq5NhdTKsTobVybA6GVYnw+pkWJ0Mq5NhdTKs'
+        'TobVybA6GVYnw+pkWJ0Mq5NhdTKsTobVybA6GVYnw+pkWJ0Mq5NhdTKsTobVybA6GVYnw+pkWJ0M'
+        'q5NhdTKsTobVybA6GVYnw+pkWJ0Mq5NhdTKsTobVybA6GVYnw0E5fMi39z7xUQgQ5e69vDb49X9/'
+        '/+2/b/Dtv3/6U/on/jPBn/nx+9cEXhf8eur+f+OFwa9/4uHE88a7E88YdGPQjUE3Bt0YdGPQjUE3'
+        'Bt0YdGPQjUE3Bt0YdGPQjUE3Bt0YdGPQjUE3Bt0YdGPQjUE3Bt0YdGPQjUE3Bt0YdGPQjUE3Bt0Y'
+        'dGPQjUE3Bt0YdGPQjUE3Bt0YdGPQjUE3Bt0YdGPQjUE3Bt0YdGPQjUE3Bt0YdGPQjUE3Bt0YdGPQ'
+        'jUE3Bt0YdGPQjUE3Bt0YdGPQjUE3Bt0YdGPQjUE3Bt1YgG7683/RfOvTFs3YD95R/wONZ3af1a0z'
+        '81n7LAV/43f/+34w/efd67Y/ed9Zfy7YabP3l01/pPHL/+HhsumFd994nXHZlHHZlHHZlHHZlHHZ'
+        'lHHZlHHZlHHZlHHZlHHZlHHZlNFdGd2V0V0Z3ZXRXRndldFdGd2V0V0Z3ZXRXRndldFdGd2V0V0Z'
+        '3ZXRXRndldFdGd2V0V0Z3ZXRXRndldFdGd2V0V0Z3ZXRXRndldFdGd2V0V0Z3ZXRXRndldFdGd2V'
+        '0V0Z3ZVx2ZRRYRkVllFhGRWWUWEZFZZRYRkVllFhGRWWUWEZFZZRYRkVllFhGRWWUWEZBZPRZBlN'
+        'llFhGRWWUWEZFZZRYRkVllFhGRWWUWEZFZZRYRmXTRmXTRmXTRmXTRmXTRmXTRmXTRmXTRmXTRmX'
+        'TRmXTRmXTRmXTRmXTRmXTRmXTZmgK//Hh7dm+e37NzT+h3drdALFCRQnUJxAcQLFCRQnUJxAcQLF'
+        'CRQnUJxAcQLFCRQnUJxAcQLFCRQnUJxAcQLFCRQnUJxAcQLFCRQnUJxAcQLFCRQnUJxAcQLFCRQn'
+        'UJxAcQLFCRQnUJxAcYLBCQYnGJxgcILBCQYnGJxgcILBCQYnGJxgcILBCQYnGJxgcILBCfgm4Juw'
+        'RicYnGBwgsEJBicYnGBwgsEJBicYnGBwgsEJyicCGj/1cK765jsQWSCyQGSByAKRBSILRBaILBBZ'
+        'ILJAZIHIApEFIgtEFogsEFkgskBkgcgCkQUiC0QWiCwQWSCyQGSByAKRBSILRBaILBBZILJAZIHI'
+        'ApEFIgtEFogsEFkgskBkgcgCkQUiC0QWiCwQWSCyQGSByAKRBSILRBaILBBZILJAZIHIApEFIgtE'
+        'FogsEFkgskBkgcgCkQUiC0QWiCwQ2QDEXGMRNl6FefyPGovww//ZB4jgQND67/kqsC/8L/z6M5/6'
+        'TuCvCZ6j/E8PX/L01P2XPGWDp9D5h5i98i5mM2I2I2YzYjYjZjNiNiNmM2I2I2YzYjYjZjNiNiNm'
+        'M2I2I2YzYjYjZjNiNiNmM2I2I2YzYjYjZjNiNiNmM2I2I2YzYjYjZjNiNiNmM2I2I2YzYjYjZjNi'
+        'NiNmM2I2I2YzYjYjZjNiNiNmM2I2I2YzYjYjZjNiNiNmM2I2I2YzYjYjZjNiNiNmM2I2I2YzYjYj'
+        'ZjNiNiNmM2I2I2YzYjYjZjNiNiNmM2I2I2YzYjYjZjNiNiNmM0HM/uwDiH98B2IWiFkgZoGYBWIW'
+        'iFkgZoGYBWIWiFkgZoGYBWIWiFkgZoGYBWIWiFkgZoGYBWIWiFkgZoGYBWIWiFkgZoGYBWIWiFkg'
+        'ZoGYBWIWiFkgZoGYBWIWiFkgZoGYBWIWiFkgZoGYBWIWiFkgZoGYBWIWiFkgZoGYBWIWiFkgZoGY'
+        'BWIWiFkgZoGYBWIWiFkgZoGYBWIWiFkgZoGYBWIWiFkgZoGYBWI2APE/33/d0i8GL/H8uQcgL78D'
+        'MgfIHCBzZMyRMUfGHBlzZMyRMUfGHBlzZMyRMUfGHBlzZMyRMUfGHBlzZMyRMUfGHBlzZMyRMUfG'
+        'HBlzZMyRMUfGHBlzZMyRMUfGHBlzZMyRMUfGHBlzZMyRMUfGHBlzZMyRMUfGHBlzZMyRMUfGHBlz'
+        'ZMyRMUfGHBlzZMyRMUfGHBlzZMyRMUfGHBlzZMyRMUfGHBlzZMyRMUfGHBlzZMwFMv78/VPVoWDN'
+        '/HTj18Ed7l8MpPzM/VXZjwT/fP7u9dmXBM8nGr9/1HgD+5e+0K6qB/f0/8vzPynq+R+x+sXxI1b9'
+        'pKgf+1z+pKgv9p+1+hceXvH5Jbvo/2fv/gNize/60DcHEggkkcQkJhGJBowa1EQTnJAJTshk82uy'
+        'RmO5ekWL01Fpz81FGnZtqeVyr23VYmyhV0b8ragEQSgo0lFbijBCrTMaHB1ASUTJhEwwkCFEb0ec'
+        '3p3nxYGzbYwx7m52k+Mffpdzzv7I8Hp/3t/nOw/zTOmiKV00ZbMypZKmVNKUSppSSVMqaUolTamk'
+        'KZU0pZKmVNKUSppSSVMqaUolTamkKZU0pZKmVNKUSppSSVMqaUolTamkKZU0pZKmVNKUSppSSVMq'
+        'aUolTamkKZU0pZKmVNKUSppSSVMqaUolTamkKZU0pZKmVNKUSppSSVMqaUolTamkKZU0pZKmVNKU'
+        'SppSSVMqaUolTamkKZU0pZKmVNKUSppSSVMqaUolTamkKZU0pZKmVNKUSppSSVMqaSqopB+pVk7w'
+        'huIfBhX0o9dfjwUV9GOfET8Vc/2AmKc+6RN9JsyPP6EfuXb/Mx+1zzv8iZvt7luutrvTRsy0ETNt'
+        'xEwbMdNGzLQRM23ETBsx00bMtBEzbcRMGzHTRsy0ETNtxEwbMdNGzLQRM23ETBsx00bMtBEzbcRM'
+        'GzHTRsy0ETNtxEwbMdNGzLQRM23ETBsx00bMtBEzbcRMGzHTRsy0ETNtxEwbMdNGzLQRM23ETBsx'
+        '00bMtBEzbcRMGzHTRsy0ETNtxEwbMdNGzLQRM23ETBsx00bMtBEzbcRMGzHTRsy0ETNtxEwbMdNG'
+        'zLQRM23ETBsx00bMtBEzbcRMGzHTwYj5yev7JVaDEfNT1yPmh4MR89PXX//X4A2cn7mpqD/lZ46f'
+        'OX7m+JnjZ46fOX7m+JnjZ46fOX7m+JnjZ46fOX7m+JnjZ46fOX7m+JnjZ46fOX7m+JnjZ46fOX7m'
+        '+JnjZ46fOX7m+JnjZ46fOX7m+JnjZ46fOX7m+JnjZ46fOX7m+JnjZ46fOX7m+JnjZ46fOX7m+Jnj'
+        'Z46fOX7m+JnjZ46fOX7m+JnjZ46fOX7m+JnjZ46fOX7m+JnjZ46fOX7m+JnjZy7wM/3E/yHff1bz'
+        'aPyQ78/eBOXdgrIoKIuCsigoi4KyKCiLgrIoKIuCsigoi4KyKCiLgrIoKIuCsigoi4KyKCiLgrIo'
+        'KIuCsigoi4KyKCiLgrIoKIuCsigoi4KyKCiLgrIoKIuCsigoi4KyKCiLgrIoKIuCsigoi4KyKCiL'
+        'grIoKIuCsigoi4KyKCiLgrIoKIuCsigoi4KyKCiLgrIoKIuCsigoi4KyKCiLgrIoKIuCsigoi4Ky'
+        'KCiLgrIoKIuCsigoi4KyKCiLgrIYBOXnnnBBCcKxXw3Ho3rC//PXDfNfgsaZCV6oP779WnfaRd13'
+        '9zo33N3nhrvXV5d8dRfz3OC2gdfcXnHbwIrbBlbcNrDiZoAVNwOsyN+K/K3I34r8rcjfivytyN+K'
+        '/K3I34r8rcjfivytyN+K/K3I34r8rcjfivytyN+K/K3I34r8rcjfivytyN+K/K3I34r8rcjfivyt'
+        'yN+K/K3I34r8rcjfivytyN+K/K3I34r8rbgZYEUMV8RwRQxXxHBFDFfEcEUMV8RwRQxXxHBFDFfE'
+        'cEUMV8RwRQxXxHBFDFeEZEUaV6RxRQxXxHBFDFfEcEUMV8RwRQxXxHBFDFfEcEUMV9wMECwPWI4t'
+        'H7AULR+0nFj+zPIhy6nlzPJhS8lybvmI5cLy0WB58P53XZ8a/kqge/bmjpefvPrxqhS6KXRT6Kbc'
+        '8ZJyx0vKHS8pd7yk3PGScsdLCvIU5CnIU5CnIE9BnoI8BXkK8hTkKchTkKcgT0GegjwFeQryFOQp'
+        'yFOQpyBPQZ6CPAV5CvIU5CnIU5CnIE9BnoI8BXkK8hTkKchTkKcgT0GegjwFeQryFOQpyFOQpyBP'
+        'QZ6CPAV5CvIU5CnIU5CnIE9BnoI8BXkK8hTkKchTkKcgT0GegjwFeQryFOQpyFOQpyBPQZ6CPAV5'
+        'CvIU5CnIU3Sn6E7RnaI7RXeK7hTdKbpTdKfoTtGdojtFd4ruFN2pQPcvXOt+UqB7rvp1cAPM84Kr'
+        'hfmby83PvbrcXAN0DdA1MtfIXCNzjcw1MtfIXCNzjcw1MtfIXCNzjcw1MtfIXCNzjcw1MtfIXCNz'
+        'jcw1MtfIXCNzjcw1MtfIXCNzjcw1MtfIXCNzjcw1MtfIXCNzjcw1MteQXENyDck1JNeQXENyDck1'
+        'JNeQXENyDck1JNeQXENyDck1JNeQXGNxjcU12581JNeQXENyDck1JNeQXENyDck1JNeQXENyDfq1'
+        'QMov3myHz0BYB2EdhHWTap2HdR7WeVjnYZ2HdR7WeVjnYZ2HdR7WeVjnYZ2HdR7WeVjnYZ2HdR7W'
+        'eVjnYZ2HdR7WeVjnYZ2HdR7WeVjnYZ2HdR7WeVjnYZ2HdR7WeVjnYZ2HdR7WeVjnYZ2HdR7WeVjn'
+        'YZ2HdR7WeVjnYZ2HdR7WeVjnYZ2HdR7WeVjnYZ2HdR7WeVjnYZ2HdR7WeVjnYZ2HdR7WeVjnYZ2H'
+        '9cDDQnVSvKg6KVaCc4fFJ9T2ONga/+vq1vhRvwHmP9wEZ19wtgRnS3C2BGdLcLYEZ0twtgRnS3C2'
+        'BGdLcLYEZ0twtgRnS3C2BGdLcLYEZ0twtgRnS3C2BGdLcLYEZ0twtgRnS3C2BGdLcLYEZ0twtgRn'
+        'S3C2BGdLcLYEZ0twtgRnS3C2BGdLcLYEZ0twtgRnS3C2BGdLcLYEZ0twtgRnS3C2BGdLcLYEZ0tw'
+        'tgRnS3C2BGdLcLYEZ0twtgRnS3C2BGdLcLYEZ0twtgRnS3C2BGdLcLYEZ0twtoLgLF1X7lFQucvX'
+        'X39f8PUv3Www//3VBjNjg5mxwczYYGZsMDM2mBkbzIwNZsYGM2ODmbHBzNhgZujL0JehL0Nfhr4M'
+        'fRn6MvRl6MvQl6EvQ1+Gvgx9Gfoy9GXoy9CXoS9DX4a+DH0Z+jL0ZejL0JehL0Nfhr4MfRn6MvRl'
+        '6MvQl6EvQ1+Gvgx9Gfoy9GVsMDMQZiDMQJiBMANhBsIMhBkIMxBmIMxAmIEwA2EGwgyEGQgzEGYQ'
+        'ybCYYTEDYQbCDIQZCDMQZiDMQJiBMANhBsIMhBkbzIwNZsYGM2ODmbHBzNhgZmwwMzaYGRvMjA1m'
+        'xgYzY4OZscHM2GBmbDAzNpiZQPsvBz9wG7zv+zW3AhaP6J0Ut996dWfhbz8pGK33bqu4d1vFY3xb'
+        'xafubopPz3soVj6lG8lgY7hVffv2cXcn9a/cOWeNvb66T1i9+4dDXxJcrf/Hm6v1r726Ws9r+7y2'
+        'z2v7vLbPa/u8ts9r+7y2z2v7vLbPa/u8ts9r+7y2z2v7vLbPa/u8ts9r+7y2z2v7vLbPa/u8ts9r'
+        '+7y2z2v7vLbPa/u8ts9r+7y2z2v7vLbPa/u8ts9r+7y2z2v7vLbPq/m8ms+r+byaz6v5vJrPq/m8'
+        'ms+r+byaz6v5vJrPq/m8ms+r+byaz6v5vH7P6/e8vWZezefVfF7N59V8Xs3n1XxezefVfF7N59V8'
+        'Xs3nbSTyQfumPmPuL/l4CQoy/SXVi73rLP3qp+0LE/yPfV/1f+wnNWR+7WaEPPXOs3mMkAMj5MDs'
+        'ODA7DsyOA7PjwOw4MDsOzI4Ds+PA7DgwOw7MjgOz48DsODA7DsyOA7PjwOw4MDsOzI4Ds+PA7Dgw'
+        'Ow7MjgOz48DsODA7DsyOA7PjwOw4MDsOzI4Ds+PA7DgwOw7MjgOz48DsODA7DsyOA7PjwOw4MDsO'
+        'zI4Ds+PA7DgwOw7MjgOz48DsODA7DsyOA7PjwOw4MDsOJPvACDkwQg6MkAMj5MAIOTBCDoyQAyPk'
+        'wAg5MEIOjJADI+TACDkwQg6C2fHrgYTnVzltVjm9sdo8Iw/9xbOqf/EvqjdH/6frS9fm4NL1P1/f'
+        'i/InQR+tPWIp83S96uc/fVr8UNR/uflB0+HrHzT93au8FeWtKG9FlV0Uu6LYFcWuKHZFsSuKXVHs'
+        'imJXFLui2BXFrih2RbEril1R7IpiVxS7otgVxa4odkWxK4pdUeyKYlcUu6LYFcWuKHZFsSuKXVHs'
+        'imJXFLui2BXFrih2RbEril1R7IpiVxS7otgVxa4odkWxK4pdUeyKYlcUu6LYFcWuKHZFsSuKXVHe'
+        'ivJWlLeivBXlrShvRXkryltR3oryVpS3orwV5a0ob0XBLgaxW785LsxdPYSBhxMeTng44eGEhxMe'
+        'Tng44eGEhxMeTng44eGEhxMeTng44eGEhxMeTng44eGEhxMeTng44eGEhxMeTng44eGEhxMeTng4'
+        '4eGEhxMeTng44eGEhxMeTng44eGEhxMeTng44eGEhxMeTng44eGEhxMeTng44eGEhxMeTng44eGE'
+        'hxMeTng44eGEhxMeTng44eGEhxMeTng44eGEhxMeTng44eEk8PAb16Mi9iN3JsVvXk2KUzJOyTgl'
+        '45SMUzJOyTgl45SMUzJOyTgl45SMUzJOyTgl45SMUzJOyTgl45SMUzJOyTgl45SMUzJOyTgl45SM'
+        'UzJOyTgl45SMUzJOyTgl45SMUzJOyTgl45SMUzJOyTgl45SMUzJOyTgl45SMUzJOyTgl45SMUzJO'
+        'yTgl45SMUzJOyTgl45SMUzJOyTgl45SMUzJOyTgl45SMUzJOyTgl45SM00DGxmfWzeOxmk/05vHN'
+        'mxH6UUE5F5RzQTmXkHMJOZeQcwk5l5BzCTmXkHMJOZeQcwk5l5BzCTmXkHMJOZeQcwk5l5BzCTmX'
+        'kHMJOZeQcwk5l5BzCTmXkHMJOZeQcwk5l5BzCTmXkHMJOZeQcwk5l5BzCTmXkHMJOZeQcwk5l5Bz'
+        'CTmXkHMJOZeQcwk5l5BzCTmXkHMJOZeQcwk5l5BzCTmXkHMJOZeQcwk5l5BzCTmXkHMJOZeQcwk5'
+        'l5BzCTmXkHMJOZeQ8yAh6eABCXWvve/vf8N9931N8Ol7P1795Litq48Y/VDw2W6/Wd21Bj+Dvhu8'
+        'k7l1cwn0dVeDtsxPmZ+yQVvGqIxRGaMyRmWMyhiVMSpjVMaojFEZozJGZYzKGJUxKmNUxqiMURmj'
+        'MkZljMoYlTEqY1TGqIxRGaMyRmWMyhiVMSpjVMaojFEZozJGZYzKGJUxKmNUxqiMURmjMkZljMoY'
+        'lTEqY1TGqIxRGaMyRmWMyhiVMSpjVMaojFEZozJGZYzKGJUxKmNUxqiMURmjMkZljMoBo+0n5p2f'
+        'v/eo3/n5Xz/1R7WvfFwe1f7W9Y8ep4ML4/92855u6uo93VtPCd7TDZb3WN5ryVv+2HJo+RPLn1qO'
+        'LLcsT7Y8xVJneZ+l3vJUS4Ol0fI0y9Mtz7B8lqXJ8kzLsyyfbXm25TmW51o+x/I8y/MtL7B8rqXZ'
+        '8nmWFssLLZ9v+QLLiyytljbLF1pebPkiyxdbvsTyEku75UstBcuXWb7c8lLLyyxfYflKy8str7B0'
+        'WL7KErK80tJpeZUlbHm1pcvyFstXWyKWbstrLVHL6yz3WV5veYPljZY3Wd5siVnebzm2fMBStHzQ'
+        'cmL5M8uHLKeWM8uHLSXLueUjlgvLR4Plwft/+97PxN978/bem7eP+I/CBz+gf/+vVXeon05v6Gau'
+        'T4nfE+yvszeXZ39ue12vvurVV73eqtdb9XqrXm/V6616vVWvt+r1Vr3eqtdb9XqrXm/V6616vVWv'
+        't+r1Vr3eqtdb9XqrXm/V6616vVWvt+r1Vr3eqtdb9XqrXm/V6616vVWvt+r1Vr3eqtdb9XqrXm/V'
+        '6616hVWvsOoVVr3CqldY9QqrXmHVK6x6hVWvsOoVVr3CqldY9QqrXmHVK6x6hVWvqeo1VbC8xtJt'
+        'ea0lanmd5T7L6y1vsLzR8ibLmy0xy1uC5cH7f+fm87Zff+vO2VbN1SVXIxONTDTa0jSi0YhGIxqN'
+        'aDSi0YhGIxqNaDSi0YhGIxqNaDSi0YhGIxqNaDSi0YhGIxqNaDSi0YhGIxqNaDSi0YhGIxqNaDSi'
+        '0YhGIxqNaDSi0YhGIxqNaDSi0YhGIxqNaDSi0YhGIxqNaDSi0YhGIxqNaDSi0YhGIxqNaDSi0YhG'
+        'IxqNaDSi0YhGIxqNaDSi0YhGIxqNaDSi0YhGIxqNaDSi0RjQ+N3rmfHuYAP97ptT0J+9khL7b1cP'
+        'TAOlCZQmUJpAaQKlCZQmUJpAaQKlCZQmUJpAaQKlCZQmUJpAaQKlCZQmUJpAaQKlCZQmUJpAaQKl'
+        'CZQmUJpAaQKlCZQmUJpAaQKlCZQmUJpAaQKlCZQmUJpAaQKlCZQmUJpAaQKlCZQmUJpAaQKlCZQm'
+        'UJpAaQKlCZQmUJpAaQKlCZQmUJpAaQKlCZQmUJpAaQKlCZQmUJpAaQKlCZQmUJpAaQqg7FShfHHw'
+        'mMIAyu9Vv64Lnr8QlE3u+rlqp8HXv3/nyiz2vOqXf3D92/8ueMcy/7CH+jTc/VCfo+CwaDeAGLn9'
+        '1urjCL7u6rcOb33v1SdPDQYfGrX38KcD3B/84v7NsdJLr2ZcG7pt6Lah24ZuG7pt6Lah24ZuG7pt'
+        '6Lah24ZuG7pt6Lah24ZuG7pt6Lah24ZuG7pt6Lah24ZuG7pt6Lah24ZuG7pt6Lah24ZuG7pt6Lah'
+        '24ZuG7pt6Lah24ZuG7pt6Lah24ZuG7pt6Lah24ZuG7pt6Lah24ZuG7pt6Lah24ZuG7pt6Lah24Zu'
+        'G7pt6Lah24ZuG7pt6Lah24ZuG7pt6Lah24ZuW0D3D69/1uqtgb0/uvPueezV1S8Pbp749q4n3Xni'
+        '21KA8D3XDwH42uDvfO/dn7G5Fzj/4+sB+vvBHzn8n49qbn9z9fEZ31L9mx52aHP7H1R/va/6/761'
+        '+pt/w8nN7Xj1T/7D6p/8BM9wbieqf8e3Vf+OT/CI6/Y3XT2CpeNvfiDJ7W+v/tO/o/o3fDKnOn/t'
+        'ic6f3Gxa/0J4O4S3Q3g7pLZDajuktkNqO6S2Q2o7pLZDajuktkNqO6S2Q2o7pLZDajuktkNqO6S2'
+        'Q2o7pLZDajuktkNqO6S2Q2o7pLZDajuktkNqO6S2Q2o7pLZDajuktkNqO6S2Q2o7pLZDajuktkNq'
+        'O6S2Q2o7pLZDajuktkNqO6S2Q2o7pLZDajuktkNqO6S2Q2o7pLZDajuktkNqO6S2Q2o7pLZDajuk'
+        'tkNqO6S2Q2o7pLZDajuktiNI7Z/eHOXVXn3ifchRXshRXshRXshRXshRXshRXshRXshRXshRXshR'
+        'XshRXgirEFYhnRCiK0RXiK4QXSG6QnSF6ArRFaIrRFeIrhBdIbpCdIXoCtEVoitEV4iuEF0hukJ0'
+        'hegK0RWiK0RXiK4QXSG6QnSF6ArRFaIrRFeIrhBdIbpCjvJCkIUgC0EWgiwEWQiyEGQhyEKQhSAL'
+        'QRaCLARZCLIQZCHIQpCFEAixFmItBFkIshBkIchCkIUgC0EWgiwEWQiyEGQhR3khR3khR3khR3kh'
+        'R3khR3khR3khR3khR3khR3khR3khR3khR3khR3khR3khR3mhQPPRzabkrVebkk4AOwHsBLATwE4A'
+        'OwHsBLATwE4AOwHsBLATwE4AOwHsBLATwE4AOwHsBLATwE4AOwHsBLATwE4AOwHsBLATwE4AOwHs'
+        'BLATwE4AOwHsBLATwE4AOwHsBLATwE7yOsnrJK+TvE7yOsnrJK+TvE7yOsnrJK+TvE7yOsnrJK+T'
+        'vE7yOpHrRK7TeOskr5O8TvI6yeskr5O8TvI6yeskr5O8TvI62e4MQLzvpud+j4cwD2EewjyEeQjz'
+        'EOYhzEOYhzAPYR7CPIR5CPMQ5iHMQ5iHMA9hHsI8hHkI8xDmIcxDmIcwD2EewjyEeQjzEOYhzEOY'
+        'hzAPYR7CPIR5CPMQ5iHMQ5iHMA9hHsI8hHkI8xDmIcxDmIcwD2EewjyEeQjzEOYhzEOYhzAPYR7C'
+        'PIR5CPMQ5iHMQ5iHMA9hHsI8hHkI8xDmIcxDmIdw4KFw4+H3rx6gyUMXD108dPHQxUMXD108dPHQ'
+        'xUMXD108dPHQxUMXD108dPHQxUMXD108dPHQxUMXD108dPHQxUMXD108dPHQxUMXD108dPHQxUMX'
+        'D108dPHQxUMXD108dPHQxUMXD108dPHQxUMXD108dPHQxUMXD108dPHQxUMXD108dPHQxUMXD108'
+        'dPHQxUMXD108dPHQxUMXD108dPHQxUMXD108dPHQFXh4/01h7F0VRgSICBARICJARICIABEBIgJE'
+        'BIgIEBEgIkBEgIgAEQEiAkQEiAgQESAiQESAiAARASICRASICBARICJARICIABEBIgJEBIgIEBEg'
+        'IkBEgIgAEQEiAkQEiAgQESAiQESAiAARASICRASICBARICJARICIABEBIgJEBIgIEBEgIkBEgIgA'
+        'EQEiAkQEiAgQESAiQESAiAARASICRCQAcXz3tecDwbXnB262yD999W531BY5aosctUWO2iJHbZGj'
+        'tshRW+SoLXLUFjlqixy1RY4CFwUuClwUuChwUeCiwEWBiwIXBS4KXBS4KHBR4KLARYGLAhcFLgpc'
+        'FLgocFHgosBFgYsCFwUuClwUuChwUeCiwEWBiwIXBS4KXBS4KHBR4KLARYGL2iJHuYtyF+Uuyl2U'
+        'uyh3Ue6i3EW5i3IX5S7KXZS7KHdR7qLcRbmLUhHFL4pflLsod1HuotxFuYtyF+Uuyl2Uuyh3Ue6i'
+        'tshRW+SoLXLUFjlqixy1RY7aIkdtkaO2yFFb5KgtctQWOWqLHLVFjtoiR22RowHw4vUR4S8FJykf'
+        'vD5ZeWfw9cn1Dz38bPD1n10/GGa/+uWHrv/2vwzCcXr9aWnPCf742fWtIq8Jvv7wo3pPTXDPzD+v'
+        '3hj0hPuZidL16/6S4KT3/PqF/anghfvI9cnv9wRfX9w9mH4w+KWPXv8jvi34+s+vv/7K4HvzFzeb'
+        'naJuixs1caMmbtTEjZq4URM3auJGTdyoiRs1caMmbtTEjZq4URM3auJGTdyoiRs1caMmbtTEjZq4'
+        'URM3auJGTdyoiRs1caMmbtTEjZq4URM3auJGTdyoiRs1caMmbtTEjZq4URM3auJGTdyoiZsxcTMm'
+        'bsbEzZi4GRM3Y+JmTNyMiZsxcTMmbsbEzZi4GRM3Y+JmTNyMiZsxccMlbrjEdVvcjImbMXEzJm7G'
+        'xM2YuBkTN2PiZkzcjImbMXEzJm6KxYPo/383m50/uNrsJIBIAJEAIgFEAogEEAkgEkAkgEgAkQAi'
+        'AUQCiAQQCSASQCSASACRACIBRAKIBBAJIBJAJIBIAJEAIgFEAogEEAkgEkAkgEgAkQAiAUQCiAQQ'
+        'CSASQCSASACRACIBRAKIBBAJIBJAJIBIAJEAIgFEAogEEAkgEkAkgEgAkQAiAUQCiAQQCSASQCSA'
+        'SACRACIBRAKIBBAJIBJAJAIQ//16YPx6MDDKNwPjr/jo56Ofj34w+sHoB6MfjH4w+sHoB6MfjH4w'
+        '+sHoB6MfjH4w+sHoB6MfjH4w+sHoB6MfjH4w+sHoB6MfjH4w+sHoB6MfjH4w+sHoB6MfjH4w+sHo'
+        'B6MfjH4w+sHoB6MfjH4w+sHoB6MfjH4w+sHoB6MfjH4w+sHoB6MfjH4w+sHoB6MfjH4w+sHoB6Mf'
+        'jH4w+sHoB6MfjH4w+sHoB6MfjH4w+gMYf/kpuxM2aPT3Vxv9cdnal9eJ+Ymgcv/qcXkvdfAi/lH1'
+        'XdxP2QtVud4X/mWwvfkf1y/cbwaj5u/dun478IXXbwe+PHg78Em37trpRIKX+dath70D/dLgHeia'
+        'W3f+Fd8R/KHa4A8FW9cfr7lzV8WcOTZijo2YYyPm2Ig5NmKOjZhjI+bYiDk2Yo6NmGMj5tiIOTZi'
+        'jo2YYyPm2Ig5NmKOjZhjI+bYiDk2Yo6NmGMj5tiIOTZijo2YYyPm2Ig5NmKOjZhjI+bYiDk2Yo6N'
+        'mGMj5tiIOTZijo2YYyPm2Ig5NmKOjZhjI+bYiDk2Yo6NmGMj5tiIOTZijo2YYyPm2Ig5NmKOjZhj'
+        'I+bYiDk2Yo6NmGMj5tiIOTZijo2YYyPm2Ig5NmKOjZhjI+bYiDk2Yo6NmGMj5thIMMeefDel0UDJ'
+        'U27dgfgfgq/rrr9+bwCz/tZj+ujs+58wj85+6q07V3YPBIluCF6oQvUX3nB9u9t7r/aVY/I2Jm9j'
+        '9pVjYjcmdmNiNyZ2Y2I3JnZjYjcmdmNiNyZ2Y2I3JnZjYjcmdmNiNyZ2Y2I3JnZjYjcmdmNiNyZ2'
+        'Y2I3JnZjYjcmdmNiNyZ2Y2I3JnZjYjcmdmNiNyZ2Y2I3JnZjYjcmdmNiNyZ2Y2I3JnZjYjcmdmNi'
+        'NyZ2Y2I3JnZjYjcmdmNiNyZ2Y2I3JnZjYjcmdmNiNyZ2Y2I3JnZjYjcmdmNiNyZ2Y2I3JnZjYjcm'
+        'dmNiNxbErvE6U8dBpp526zPqRzvf/wk/F+jpt6433CeCMy4444IzLjjjgjMuOOOCMy4444IzLjjj'
+        'gjMuOOOCMy4444IzLjjjgjMuOOOCMy4444IzLjjjgjMuOOOCMy4444IzLjjjgjMuOOOCMy4444Iz'
+        'LjjjgjMuOOOCMy4444IzLjjjgjMuOOOCMy4444IzLjjjgjMuOOOCMy4444IzLjjjgjMuOOOCMy44'
+        '44IzLjjjgjMuOOOCMy4444IzLjjjgjMuOOOCMy4444IzLjjjgjMuOOOCMx4E5xnVvrrz45zPDsbs'
+        'Z11n6RlBlppuXZ9Gz1+dRiedRiedRiedRiedRiedRiedRiedRiedRiedRiedRiedRicBTAKYBDAJ'
+        'YBLAJIBJAJMAJgFMApgEMAlgEsAkgEkAkwAmAUwCmAQwCWASwCSASQCTACYBTAKYBDAJYBLAJIBJ'
+        'AJMAJgFMApgEMAlgEsAkgEkAkwAmnUYnOUxymOQwyWGSwySHSQ6THCY5THKY5DDJYZLDJIdJDpMc'
+        'JjlMUpLEMYljksMkh0kOkxwmOUxymOQwyWGSwySHSQ6TTqOTTqOTTqOTTqOTTqOTTqOTTqOTTqOT'
+        'TqOTTqOTTqOTTqOTTqOTTqOTTqOTTqOTAfhnBpqDzX+iuok4qf7V24Lt/bOut/fJYKP22df7j3Dw'
+        '9bNv3TkwXQ++fs6dknnn0+Lv6B/q+674O6pr8GPS31idyHd3TzCn+6u/qoUe+uqfVr/6RLsouDv2'
+        'O6t/x+OtlR7qlaCZ/uT2d1b3vXcX1FH1P/q7q//RD1XVO2uvX52Rj9NXt99+Z/dc/UNX5fXg/c+9'
+        'dddDUa6ehnL1bJSP8VCU5109FGXeoJo3qOYNqnnjZ974mTd+5o2feeNn3viZN37mjZ9542fe+Jk3'
+        'fuaNn3njZ974mTd+5o2feeNn3viZN37mjZ9542fe+Jk3fuaNn3njZ974mTd+5o2feeNn3viZN37m'
+        'jZ9542fe+Jk3fuaNn3njZ974mTd+5o2feeNn3viZN37mjZ9542fe+Jk3fuaNn3njZ974mTd+5o2f'
+        'eeNn3viZN37mjZ9542fe+Jk3fuaNn3njZ974mTd+5o2feeNn3viZN37mjZ9542fe+Jk3fuaNn3nj'
+        'Z974mTd+guUBy7HlA5ai5YOWE8ufWT5kObWcWT5sKVnOLR+xXFg+GiwP3v8519uw+//w6gJmgcMF'
+        'Dhc4XOBwgcMFDhc4XOBwgcMFDhc4XOBwgcMFDhc4XOBwgcMFDhc4XOBwgcMFDhc4XOBwgcMFDhc4'
+        'XOBwgcMFDhc4XOBwgcMFDhc4XOBwgcMFDhc4XOBwAcAFABcAXABwAcAFABcAXABwAcAFABcAXABw'
+        'AcAFABcAXABwAcAF8hbIW7APWwBwAcAFABcAXABwAcAFABcAXABwAcAFABcQXwhAPO960/UbwSbs'
+        '+QGQl1SBvDGYZe23l70ey16PZa/HsiG2TM2y12MZpWUv0rKXbNmLtGz4LXutlvla5mvZK7eM2bIX'
+        'cJm2Za/jstdx2eu4jOCyl3OZxGUSl724y0Aue42XvcbLXuNlr/EyrMte6mUv9TK6y+gue+GXCV4m'
+        'eNm3YRnkZd+GZd+UZayXsV5mb9m3aBnyZQSXWV9mfZn1ZdaXWV/2PV32PV0mf5n8Zd/hZQFYFoBl'
+        'AVj2/V6Wg2UIlsVhGYJlcViWg2U5WCZjOZDxgjsyYr9WhfG5N4cgbdeHIO+7miGrvvGrNKyaIau+'
+        'x6u+x6u+uau+q6u+gau+c6u+c6u+Zau+Lau+Eau+Eau+A6u+A6te+lUv9qoXe9XLu+p1XfW6rnpd'
+        'V72uq17XVa/kqldy1Uu46iVc9RKueu1WvWirvo+rXrRV38BVr92q127VDFk1Q1ZlZlVmVmVmVSBW'
+        'xWNVZlbFY1UuViVhVQRW2V9lf5X9VehXMV/le5XvVb5X+V4FexXsVZRX4V3FdRXeVUBXeVvlbZWw'
+        'VXxWmVrFZ5WU1UBK891nj98YbFE/73rL+rvBtVzLnS3r7Z95SvXHoqt/+8N2qbd/tvpLwRb19s9V'
+        '//Lj7E9vv+sp/l3fW92pPZ4PTj7eFvX2TNDy1f8d0aud6sfdmt7+heqfv96XvvDWXZ8i3RO86J8f'
+        'vMjV/+0/Fny0Z3Bx8QU3By8fEdZNYd0U1k0p3ZTSTSndlNJNKd2U0k0p3ZTSTSndlNJNKd2U0k0p'
+        '3ZTSTSndlNJNKd2U0k0p3ZTSTSndlNJNKd2U0k0p3ZTSTSndlNJNKd2U0k0p3ZTSTSndlNJNKd2U'
+        '0k0p3ZTSTSndlNJNKd2U0k0p3ZTSTSndlNJNKd2U0k0p3ZTSTSndlNJNKd2U0k0p3ZTSTSndlNJN'
+        'Kd2U0k0p3ZTSTSndlNJNKd2U0k0p3ZTSTSndDFL6oltXtzfd/6NBJFtvtoKxqzG+TcY2GdvG+DYg'
+        '24BsA7INyDYg24BsA7INyDYg24BsA7INyDYg24BsA7INyDYg24BsA7INyDYg24BsA7INyDYg24Bs'
+        'A7INyDYg24BsA7INyDYg24BsA7INyDYg24BsA7INyDYg24BsA7INyDYg24BsA7INyDYg24BsA7IN'
+        'yDYg24BsA7INyDYg24BsA7INyDYg24BsA7INyDYg24BsA7INyDYg2wGQtsfk7Do4j/jV6g7iCXMD'
+        '2xcGL8wHqkkpB0k5v/3bLs1+O3jhXnzr6nPoYj9fDdYX3bpzX+ELgy31F9/yk8e/UvvQEP/lWhO7'
+        'pfqRyL9xe7W2+g/4kpsZfSqJOUnMSWJOEnOSmJPEnCTmJDEniTlJzEliThJzkpiTxJwk5iQxJ4k5'
+        'ScxJYk4Sc5KYk8ScJOYkMSeJOUnMSWJOEnOSmJPEnCTmJDEniTlJzEliThJzkpiTxJwk5iQxJ4k5'
+        'ScxJYk4Sc5KYk8ScJOYkMSeJOUnMSWJOEnOSmJPEnCTmJDEniTlJzEliThJzkpiTxJwk5iQxJ4k5'
+        'ScxJYk4Sc5KYk8ScJOYkMSeJuQDUS27d+XyN2K/f2Wo/6c5zIcjIk5EnI09Gnow8GXky8mTkyciT'
+        'kScjT0aejDwZeTLyZOTJyJORJyNPRp6MPBl5MvJk5MnIk5EnI09Gnow8GXky8mTkyciTkScjT0ae'
+        'jDwZeTLyZOTJyJORJyNPRp6MPBl5MvJk5MnIk5EnI09Gnow8GXky8mTkyciTkScjT0aejDwZeTLy'
+        'ZOTJyJORJyNPRp6MPBl5MvJk5AMZ7TelvX8FYg+IPSD2gNgDYg+IPSD2gNgDYg+IPSD2gNgDYg+I'
+        'PSD2gNgDYg+IPSD2gNgDYg+IPSD2gNgDYg+IPSD2gNgDYg+IPSD2gNgDYg+IPSD2gNgDYg+IPSD2'
+        'gNgDYg+IPSD2gNgDYg+IPSD2gNgDYg+IPSD2gNgDYg+IPSD2gNgDYg+IPSD2gNgDYg+IPSD2gNgD'
+        'Yg+IPSD2gNgDYg+IPSD2gNgDYi8A8aWfFm84B5uCV1Wvgh6x0v6yW5/SG/tefevxemPflz/8KvHd'
+        'wVXiS292IO83Vg6NlUNj5dBYOTRWDo2VQ2Pl0Fg5NFYOjZVDY+XQWDk0Vg6NlUNj5dBYOTRWDo2V'
+        'Q2Pl0Fg5NFYOjZVDY+XQWDk0Vg6NlUNj5dBYOTRWDo2VQ2Pl0Fg5NFYOjZVDY+XQWDk0Vg6NlUNj'
+        '5dBYOTRWDo2VQ2Pl0Fg5NFYOjZVDY+XQWDk0Vg6NlUNj5dBYOTRWDo2VQ2Pl0Fg5NFYOjZVDY+XQ'
+        'WDk0Vg6NlUNj5dBYOTRWDo2VQ2Pl0Fg5NFYOjZVDY+XQWDk0Vg6DsfKywEPw2cpfV73DMPjMkt++'
+        'VaXyFX7r9surZw/Bu/MvCA6K928XvNtV8G5XwdvyBW/LF7wtX/C2fMHb8gVvyxccDRccKRfAK4BX'
+        'AK8AXgG8AngF8ArgFcArgFcArwBeAbwCeAXwCuAVwCuAVwCvAF4BvAJ4BfAK4BXAK4BXAK8AXgG8'
+        'AngF8ArgFcArgFcArwBeAbwCeAXwCuAVvC9W4K/AX4G/An8F/gr8Ffgr8Ffgr8Bfgb8CfwX+CvwV'
+        '+CvwV+CvQEcBwwKGBf4K/BX4K/BX4K/AX4G/An8F/gr8FfgreF+s4A2xgjfECt4QK3hDrOCqq+AN'
+        'sYI3xAreECt4Q6zgDbGCN8QK3hAreEOs4A2xgjfECgH0r7wZfO81+I75O+bvmL9j/o75O+bvmL9j'
+        '/o75O+bvmL9j/o75O+bvmL9j/o75O+bvmL9j/o75O+bvmL9j/o75O+bvmL9j/o75O+bvmL9j/o75'
+        'O+bvmL9j/o75O+bvmL9j/o7BOwbvGLxj8I7BOwbvGLxj8I7BOwbvGLxj8I7BOwbvGLxj8I7BOybu'
+        'mLhjg+8YvGPwjsE7Bu8YvGPwjsE7Bu8YvGPwjsE7Rvs48PDywEPwXv5zrsZa0b+zaEoVTakiJUVK'
+        'ipQUKSlSUqSkSEmRkiIlRUqKlBQpKVJSpKRISZGSIiVFSoqUFCkpUlKkpEhJkZIiJUVKipQUKSlS'
+        'UqSkSEmRkiIlRUqKlBQpKVJSpKRISZGSoilVhKUISxGWIixFWIqwFGEpwlKEpQhLEZYiLEVYirAU'
+        'YSnCUoSl6FtZZKbITBGWIixFWIqwFGEpwlKEpQhLEZYiLEVYiqZU0bv3RT1WNLOKZlbRzCqaWUUd'
+        'VzS6ikZX0egqasOiCVY0wYpatGiQFQ2yohYtatGisVZUtEXTrWi6FU23YqD5Fdfv7r4sOIrquL6z'
+        '6JuDr7/qZvrtmH5nXJ9xfcb1GddnXJ9xfcb1GddnXJ9xfcb1GddnXJ9xfcb1GddnXJ9xfcb1Gddn'
+        'XJ9xfcb1GddnXJ9xfcb1GddnXJ9xfcb1GddnXJ9xfcb1GddnXJ9xfcb1GddnQJ8BfQb0GdBnQJ8B'
+        'fQb0GdBnQJ8BfQb0GdBnQJ8BfQb0GdBnQJ+RfEbymUl0BvQZ0GdAnwF9BvQZ0GdAnwF9BvQZ0GdA'
+        'n4nMWeAldOMhy0OJhxIPJR5KPJR4KPFQ4qHEQ4mHEg8lHko8lHgo8VDiocRDiYcSDyUeSjyUeCjx'
+        'UOKhxEOJhxIPJR5KPJR4KPFQ4qHEQ4mHEg8lHko8lHgo8VDiocRDiYcSDyUeSjyUeCjxUOKhxEOJ'
+        'hxIPJR5KPJR4KPFQ4qHEQ4mHEg8lHko8lHgo8VDiocRDiYcSDyUeSjyUeCjxUOKhxEMp8PDKmzf9'
+        '/+r6cXd/enXwdIHGBRoXaFygcYHGBRoXaFygcYHGBRoXaFygcYHGBRoXaFygcYHGBRoXaFygcYHG'
+        'BRoXaFygcYHGBRoXaFygcYHGBRoXaFygcYHGBRoXaFygcYHGBRoXaFygcYHGBRoXaFygcYHGBRoX'
+        'aFygcYHGBRoXaFygcYHGBRoXaFygcYHGBRoXaFygcYHGBRoXaFygcYHGBRoXaFygcYHGBRoXaFyg'
+        'cRHQ6Lx156Msvyt4O/FV1zexvjv4OnwzSspXz+LhpcxLGZQyKGVQyqCUQSmDUgalDEoZlDIoZVDK'
+        'oJRBKYNSBqUMShmUMihlUMqglEEpg1IGpQxKGZQyKGVQyqCUQSmDUgalDEoZlDIoZVDKoJRBKYNS'
+        'BqUMShmUMihlUMqglEEpg1IGpQxKGZQyKGVQyqCUQSmDUgalDEoZlDIoZVDKoJRBKYNSBqUMShmU'
+        'MihlUMqglEEpB1BefXNkfXA1OS5JuCTh0uS4BOISiEsgLoG4BOISiEsgLoG4BOISiEsgLoG4BOIS'
+        'iEsgLoG4BOISiEsgLoG4BOISiEsgLoG4BOISiEsgLoG4BOISiEsgLoG4BOISiEsgLoG4BOISiEsg'
+        'LoG4BOISiEsgLoG4BOISiEsgLoG4BOISiEsgLoG4BOISiEsgLoG4BOISiEsgLoG4BOISiEsgLoG4'
+        'BOISiEsgLoG4BOIyANEVgDgLPvL21p0fiH1B9ZQp+CHZ+eCU6atvxscfQnOrzqNy6jwqp86jcuo8'
+        'KqfOo3LqPCqnzqNy6jwqp86jcuo8KqfOo3LqPCqnzqNy6jwqp86jcuo8KqfOo3LqPCqnzqNy6jwq'
+        'p86jcuo8KqfOo3LqPCqnzqNy6jwqp86jcuo8KqfOo3LqPCqnzqNy6jwqp86jcuo8KqfOo3LqPCqn'
+        'zqNy6jwqp86jcuo8KqfOM3LqPCOnzjNy6jwjp84zcuo8I6fOM3LqPCOnzjNy6jwjp84zcuo8I6fO'
+        'M3LqPCOnzjNy6jwjp84zcuo8HKfOw3HqAjTB0m15rSVqeZ3lPsvrLW+wvNHyJsubLTHLW4Llwfsj'
+        'N1PkzVdTpBaIWiBqgagFohaIWiBqgagFohaIWiBqgagFohaIWiBqgagFohaIWiBqgagFohaIWiBq'
+        'gagFohaIWiBqgagFohaIWiBqgagFohaIWiBqgagFohaIWiBqgagFohaIWiBqgagFohaIWiBqgagF'
+        'ohaIWiBqgagFohaIWiBqgagFohaIWiBqgagFohaIWiBqgagFohaIWiBqgagFohaIWiBqgagFojYA'
+        '8ZrqfuO7qgOjM7iU7f4b3+95JN7n+Z7qe/I/8xC/6hs+n8obVv7at3deezM4f1dOGuSkQU4a5KRB'
+        'ThrkpEFOGuSkQU4a5KRBThrkpEFOGuSkQU4a5KRBThrkpEFOGuSkQU4a5KRBThrkpEFOGuSkQU4a'
+        '5KRBThrkpEFOGuSkQU4a5KRBThrkpEFOGuSkQU4a5KRBThrkpEFOGuSkQU4a5KRBThrkpEFOGuSk'
+        'QU4a5KRBThrkpEFOGuSkQU4a5KRBThrkpEFOGuSkQU4a5KRBThrkpEFOGuSkQU4a5KRBThrkpEFO'
+        'GoKcRB/h90GrP79W7WopeeirUPWrR+DN4nc+/YEHB9/+7X2D8Qce+PZ3DAQ/rzVb87E/OP6dT3v7'
+        'Px564GF/9BV/h4cmvrOh52ted9/bvj761rfdF/zD/vzWx/g5seB93e+s/mv+p+C9s+7u/5AHqn8i'
+        'iOLrbjY6v/+kO9ubs+vPAHlqsNG57yav75PXZnltltdmeW2W12Z5bZbXZnltltdmeW2W12Z5bZbX'
+        'ZnltltdmeW2W12Z5bZbXZnltltdmeW2W12Z5bZbXZnltltdmeW2W12Z5bZbXZnltltdmeW2W12Z5'
+        'bZbXZnltltdmeW2W12Z5bZbXZnltltdmeW2W12Z5bZbXZnltltdmeW2W12Z5bZbXZnltltdmeW2W'
+        '12Z5bZbXZnltltdmeW2W12Z5bZbXZnltltdmeW2W12Z5bZbX5iCvr7/Z6Ny62ui0ANECRAsQLUC0'
+        'ANECRAsQLUC0ANECRAsQLUC0ANECRAsQLUC0ANECRAsQLUC0ANECRAsQLUC0ANECRAsQLUC0ANEC'
+        'RAsQLUC0ANECRAsQLUC0ANECRAsQLUC0ANECRAsQLUC0ANECRAsQLUC0ANECRAsQLUC0ANECRAsQ'
+        'LUC0ANECRAsQLUC0ANECRAsQLUC0ANECRAsQLUC0ANECRAsQLUC0BCDecOsJ+RDbFz3qD7F9483h'
+        '5PT14eThVWZaZaZVZlplplVmWmWmVWZaZaZVZlplplVmWmWmVWZaZaZVZlplplVmWmWmVWZaZaZV'
+        'ZlplplVmWmWmVWZaZaZVZlplplVmWmWmVWZaZaZVZlplplVmWmWmVWZaZaZVZlplplVmWmWmVWZa'
+        'ZaZVZlplplVmWmWmVWZaZaZVZlplplVmWmWmVWZaZaZVZlplplVmWmWmVWZaZaZVZlplplVmWmWm'
+        'VWZaZaZVZlplplVmWmWmVWZag8y86foW7D8PfjLmzXf/sMzvBL8Ue8LEqhqn2Hc+pPoxuT3sLTf9'
+        '8/KrLLXLUrsstctSuyy1y1K7LLXLUrsstctSuyy1y1K7LLXLUrsstctSuyy1y1K7LLXLUrsstctS'
+        'uyy1y1K7LLXLUrsstctSuyy1y1K7LLXLUrsstctSuyy1y1K7LLXLUrsstctSuyy1y1K7LLXLUrss'
+        'tctSuyy1y1K7LLXLUrsstctSuyy1y1K7LLXLUrsstctSuyy1y1K7LLXLUrsstctSuyy1y1K7LLXL'
+        'UrsstctSuyy1y1K7LLUHWbq/CsJTT7/mVvBtuvf44HuPD773+OBP8vHB1w8Nvv3Wq4ejvePT7LHB'
+        'X3PrUXxiXfUF23uolR61Z9Y9tqd1b703XO8N13vD9ZEfrn/9QL2eu//qoTHyhBuuX/tJX7YEV+VP'
+        'fzQ/MSE46ayt/hvufgboX/iQv9hH/uZngD7yVzNfd32Xyr8M3iV6W/Xr/eCj16p3qTyk6aH/uof+'
+        '7/6vv7nsefXVZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/Y'
+        'ZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/Y'
+        'ZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/Y'
+        'ZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU/YZU84'
+        'uOz5+3cfGfyj4Mig58bIa+88QouRCCMRRiKMRBiJMBJhJMJIhJEIIxFGIoxEGIkwEmEkwkiEkQgj'
+        'EUYijEQYiTASYSTCSISRCCMRRiKMRBiJMBJhJMJIhJEIIxFGIoxEGIkwEmEkwkiEkQgjEUYijEQY'
+        'iTASYSTCSISRCCMRRiKMRBiJMBJhJMJIhJEIIxFGIoxEGIkwEmEkwkiEkQgjEUYijEQYiTASYSTC'
+        'SCQw8r/dgHj3FYhuILqB6AaiG4huILqB6AaiG4huILqB6AaiG4huILqB6AaiG4huILqB6AaiG4hu'
+        'ILqB6AaiG4huILqB6AaiG4huILqB6AaiG4huILqB6AaiG4huILqB6AaiG4huILqB6AaiG4huILqB'
+        '6AaiG4huILqB6AaiG4huILqB6AaiG4huILqB6AaiG4huILqB6AaiG4huILqB6AaiG4huILqB6Aai'
+        'G4juAMQ33IB40xWIKBBRIKJARIGIAhEFIgpEFIgoEFEgokBEgYgCEQUiCkQUiCgQUSCiQESBiAIR'
+        'BSIKRBSIKBBRIKJARIGIAhEFIgpEFIgoEFEgokBEgYgCEQUiCkQUiCgQUSCiQESBiAIRBSIKRBSI'
+        'KBBRIKJARIGIAhEFIgpEFIgoEFEgokBEgYgCEQUiCkQUiCgQUSCiQESBiAIRBSIKRBSIaADiG68P'
+        'omeD/cf/fr0f6Q8q5ZuqXwefAXU7+Lr3BtA3XQGKARQDKAZQDKAYQDGAYgDFAIoBFAMoBlAMoBhA'
+        'MYBiAMUAigEUAygGUAygGEAxgGIAxQCKARQDKAZQDKAYQDGAYgDFAIoBFAMoBlAMoBhAMYBiAMUA'
+        'igEUAygGUAygGEAxgGIAxQCKARQDKAZQDKAYQDGAYgDFAIoBFAMoBlAMoBhAMYBiAMUAigEUAygG'
+        'UAygGEAxgGIAxQCKBYC++fq26rcHQL7l4+z/H/pD/7bmb/HRvp/M3v+jt3+p+gk2H+MSIPhom9sr'
+        '1d/92x6pBJcm49X/9E/kAiB4Nb6/+qfvvhT4uJcB/yB41R7pw5UXV/9Dvr0mSOm9Y5Z7xyyfMccs'
+        'wXnlj3+iBy5PvEOWvpsWftVVC/do4R4t3KOFe7Rwjxbu0cI9WrhHC/do4R4t3KOFe7Rwjxbu0cI9'
+        'WrhHC/do4R4t3KOFe7Rwjxbu0cI9WrhHC/do4R4t3KOFe7Rwjxbu0cI9WrhHC/do4R4t3KOFe7Rw'
+        'jxbu0cI9WrhHC/do4R4t3KOFe7Rwjxbu0cI9WrhHC/do4R4t3KOFe7Rwjxbu0cI9WrhHC/do4R4t'
+        '3KOFe7Rwjxbu0cI9WrhHC/do4R4t3KOFe7Rwjxbu0cI9WrhHC/cELfyt947p7/XHvf54LI/p/9at'
+        'cXWsf/8PP+l7f+hTXyHx65+8/61g3/4Pbyrld64qpVel9KqUXpXSq1J6VUqvSulVKb0qpVel9KqU'
+        'XpXSq1J6VUqvSulVKb0qpVel9KqUXpXSq1J6VUqvSulVKb0qpVel9KqUXpXSq1J6VUqvSulVKb0q'
+        'pVel9KqUXpXSq1J6VUqvSulVKb0qpVel9KqUXpXSq1J6VUqvSulVKb0qpVel9KqUXpXSq1J6VUqv'
+        'SulVKb0qpVel9KqUXpXSq1J6VUqvSulVKb0qpVel9KqUXpXSq1J6VUqvSulVKb0qpTeolMSn3ZPC'
+        'gqu4/169c/7v9JbNt90kpesqKX2S0icpfZLSJyl9ktInKX2S0icpfZLSJyl9ktInKX2S0icpfZLS'
+        'Jyl9ktInKX2S0icpfZLSJyl9ktInKX2S0icpfZLSJyl9ktInKX2S0icpfZLSJyl9ktInKX2S0icp'
+        'fZLSJyl9ktInKX2S0icpfZLSJyl9ktInKX2S0icpfZLSJyl9ktInKX2S0icpfZLSJyl9ktInKX2S'
+        '0icpfZLSJyl9ktInKX2S0icpfZLSJyl9ktInKX1BUr79BsTXX4GIAxEHIg5EHIg4EHEg4kDEgYgD'
+        'EQciDkQciDgQcSDiQMSBiAMRByIORByIOBBxIOJAxIGIAxEHIg5EHIg4EHEg4kDEgYgDEQciDkQc'
+        'iDgQcSDiQMSBiAMRByIORByIOBBxIOJAxIGIAxEHIg5EHIg4EHEg4kDEgYgDEQciDkQciDgQcSDi'
+        'QMSBiAMRByIORByIOBBxIOJAxIGIByC+4wZE6M7T3YFIAJEAIgFEAogEEAkgEkAkgEgAkQAiAUQC'
+        'iAQQCSASQCSASACRACIBRAKIBBAJIBJAJIBIAJEAIgFEAogEEAkgEkAkgEgAkQAiAUQCiAQQCSAS'
+        'QCSASACRACIBRAKIBBAJIBJAJIBIAJEAIgFEAogEEAkgEkAkgEgAkQAiAUQCiAQQCSASQCSASACR'
+        'ACIBRAKIBBAJIBJAJAIQ/Xe/V/sfg4P2f3R90H4SfBzFP65+HfyswG7w+7dvHsf2vFt3fjbrMngq'
+        '8/9xw2vritcAXgN4DeA1gNcAXgN4DeA1gNcAXgN4DeA1gNcAXgN4DeA1gNcAXgN4DeA1gNcAXgN4'
+        'DeA1gNcAXgN4DeA1gNcAXgN4DeA1gNcAXgN4DeA1gNcAXgN4DeA1gNcAXgN4DeA1gNcAXgN4DeA1'
+        'gNcAXgN4DeA1gNcAXgN4DeA1gNcAXgN4DeA1gNcAXgN4DeA1gNcAXgN4DeA1gNcAXgN4DeA1gNdA'
+        'wOvtNyBefAViEIhBIAaBGARiEIhBIAaBGARiEIhBIAaBGARiEIhBIAaBGARiEIhBIAaBGARiEIhB'
+        'IAaBGARiEIhBIAaBGARiEIhBIAaBGARiEIhBIAaBGARiEIhBIAaBGARiEIhBIAaBGARiEIhBIAaB'
+        'GARiEIhBIAaBGARiEIhBIAaBGARiEIhBIAaBGARiEIhBIAaBGARiEIhBIAaBGARiEIhBIAaBGARi'
+        'MADxfwYgLqoj42m1d56/vkbGEBlDZAyRMUTGEBlDZAyRMUTGEBlDZAyRMUTGEBlDZAyRMUTGEBlD'
+        'ZAyRMUTGEBlDZAyRMUTGEBlDZAyRMUTGEBlDZAyRMUTGEBlDZAyRMUTGEBlDZAyRMUTGEBlDZAyR'
+        'MUTGEBlDZAyRMUTGEBlDZAyRMUTGEBlDZAyRMUTGEBlDZAyRMUTGEBlDZAyRMUTGEBlDZAyRMUTG'
+        'EBlDZAyRMUTGUCBj4O4m+tagab7z3tnhvbPDv+XZ4fVhVkv1bsp7B4mP6UHip/zscPBmv9F9td8Y'
+        '1irDWmVYqwxrlWGtMqxVhrXKsFYZ1irDWmVYqwxrlWGtMqxVhrXKsFYZ1irDWmVYqwxrlWGtMqxV'
+        'hrXKsFYZ1irDWmVYqwxrlWGtMqxVhrXKsFYZ1irDWmVYqwxrlWGtMqxVhrXKsFYZ1irDWmVYqwxr'
+        'lWGtMqxVhrXKsFYZ1irDWmVYqwxrlWGtMqxVhrXKsFYZ1irDWmVYqwxrlWGtMqxVhrXKsFYZ1irD'
+        'WmVYqwxrlWGtMqxVhrXKsFYZDlrlnwQgPlgF8bbgQ4kLt787+I13BL/x0epv9Fz9xkjwG0M3hF55'
+        'C6FRhEYRGkVoFKFRhEYRGkVoFKFRhEYRGkVoFKFRhEYRGkVoFKFRhEYRGkVoFKFRhEYRGkVoFKFR'
+        'hEYRGkVoFKFRhEYRGkVoFKFRhEYRGkVoFKFRhEYRGkVoFKFRhEYRGkVoFKFRhEYRGkVoFKFRhEYR'
+        'GkVoFKFRhEYRGkVoFKFRhEZ9g0dJGiVplKRRkkZJGiVplKRRkkZJGiVplKRRkkZJGiVpNADxwPV9'
+        'RNvBruTBe7uSe7uSx+gdzTs/cFP83h+6tyl5om5KvitolOp7UpvVKfL3gsfG/NPr21ufGbzL+c/u'
+        'fL547POrXw7fPDjv9UELffD2D9QFnw8fLB8Klgfv/+fBLCrU2PL+VfU4LnL7uKb6W9/9afcu2d/0'
+        '3ljwLto/qb4GH/ddsn9xU/AvutojTij4CQU/odknNPuEZp/Q7BOafUKzT2j2Cc0+odknNPuEZp/Q'
+        '7BOafUKzT2j2Cc0+odknNPuEZp/Q7BOafUKzT2j2Cc0+odknNPuEZp/Q7BOafUKzT2j2Cc0+odkn'
+        'NPuEZp/Q7BOafUKzT2j2Cc0+odknNPuEZp/Q7BOafUKzT2j2Cc0+odknNPuEZp/Q7BOafUKzT6j0'
+        'CZU+odInVPqESp9Q6RMqfUKlT6j0CZU+odInVPqESp9Q6RP2DhNBekaunsfzpidXS+XJQvTh4LPF'
+        '/q+bzxb7VUYmGZlkZNImcBKVSVQmUZlEZRKVSVQmUZlEZRKVSVQmUZlEZRKVSVQmUZlEZRKVSVQm'
+        'UZlEZRKVSVQmUZlEZRKVSVQmUZlEZRKVSVQmUZlEZRKVSVQmUZlEZRKVSVQmUZlEZRKVSVQmUZlE'
+        'ZRKVSVQmUZlEZRKVSVQmUZlEZRKVSVQmUZlEZRKVSVQmUZlEZRKVSVQmUZlEZRKVSVQmUZlEZRKV'
+        'yYDK6GfENA0+L6fp4z9R++HD9P8OXpcXV4fpW4OeetntHwlesP/n+jHmrwjeRfqe67t6viXou395'
+        '3X8Dwa76X13//knw9b++/vrHgj//vTcHx8vXH1m1eTW/Z2RzRjZnZHNGNmdkc0Y2Z2RzRjZnZHNG'
+        'Nmdkc0Y2Z2RzRjZnZHNGNmdkc0Y2Z2RzRjZnZHNGNmdkc0Y2Z2RzRjZnZHNGNmdkc0Y2Z2RzRjZn'
+        'ZHNGNmdkc0Y2Z2RzRjZnZHNGNmdkc0Y2Z2RzRjZnZHNGNmdkc0Y2Z2RzRjZnZHNGNmdkc0Y2Z2Rz'
+        'RjZnZHNGNmdkc0Y2Z2RzRjZnZHNGNmdkc0Y2Z2RzRjZnZHNGNmdkc0Y2ZwJq33dT6BtXIGaBmAVi'
+        'FohZIGaBmAViFohZIGaBmAViFohZIGaBmAViFohZIGaBmAViFohZIGaBmAViFohZIGaBmAViFohZ'
+        'IGaBmAViFohZIGaBmAViFohZIGaBmAViFohZIGaBmAViFohZIGaBmAViFohZIGaBmAViFohZIGaB'
+        'mAViFohZIGaBmAViFohZIGaBmAViFohZIGaBmAViFohZIGaBmAViFohZIGYDEN9/7wr9sb9Cvz54'
+        '/zfVH+u5dwPyvUv0J9Al+r8JKiR4JOeDQYU8cPsXqxNl3/Iey3stecsfWw4tf2L5U8uR5ZblyZan'
+        'WOos77PUW55qabA0Wp5mebrlGZbPsjRZnml5luWzLc+2PMfyXMvnWJ5neb7lBZbPtTRbPs/SYnmh'
+        '5fMtX2B5kaXV0mb5QsuLLV9k+WLLl1heYmm3fKmlYPkyy5dbXmp5meUrLF9pebnlFZYOy1dZQpZX'
+        'Wjotr7KELa+2dFneYvlqS8TSbXmtJWp5neU+y+stb7C80fImy5stMcv7LceWD1iKlg9aTix/ZvmQ'
+        '5dRyZvmwpWQ5t3zEcmH5aLA8eP/YzV75B6rD+DXVv3pDzZ3bLdbtkZaYXGJyicklJpeYXGJyickl'
+        'JpeYXGJyicklJpeYXGJyicklJpeYXGJyicklJpeYXGJyicklJpeYXGJyicklJpeYXGJyicklJpeY'
+        'XGJyicklJpeYXGJyicklJpdgXIJxCcYlGJdgXIJxCcYlGJdgXIJxCcYlGJdgXIJxCcYlGJdgXKJw'
+        'icIlCpcoXKJwicIlCpcoXKJwicIlCpcoXKJwifOlAMcP3H2fxS8H12bvfFR+xvfxtkt69tX/5uc/'
+        'dH35v26ZHrZXurOBemzeynj87oje+Yy+vqEH4u94oG/w7Q8O9b0s+JT+xYcGyeN3q2Sj+dxb9zZN'
+        'f92myYXA825d75uudlF/h+3TD14f1hwGhzX/9u4Z86za6i/9u3vXZPfeNb13GfaE+DnQuVuPh58D'
+        'Hb8+cg+OpcMPbVofJ2fvt3/QG66x1zz8Axv/Lufwt3+y1j/zTQ/9Mz+pn/6buOujF65uXNqwxd+w'
+        'xd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+w'
+        'xd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+w'
+        'xd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wxd+wD9+w'
+        '09+w099wGrphw79hw79hw79hw79hw79hw79hw79hw79hw79hw79hw78R7PT//c2hxvddHWqkHWqk'
+        'HWqkHWqkHWqkHWqkHWqkHWqkHWqkHWqkHWqkHWqk6UrTlaYrTVearjRdabrSdKXpStOVpitNV5qu'
+        'NF1putJ0pelK05WmK01Xmq40XWm60nSl6UrTlaYrTVearjRdabrSdKXpStOVpitNV5quNF1putJ0'
+        'pR1qpCFLQ5aGLA1ZGrI0ZGnI0pClIUtDloYsDVkasjRkacjSkKUhS0OWhiwNWZquNF1putJ0pelK'
+        '05WmK01Xmq40XWm60g410g410g410g410g410g410g410g410g410g410g410g410g410g410g41'
+        '0g410oHm//fmx85Wqvd4nFT/6heDe2l+6OYmz6+/upfzt4K/Z/LepvPepvPepvNRewDD/U+q/TR7'
+        'AkPypjMbb+nMrM7M6syszszqzKzOzOrMrM7M6syszszqzKzOzOrMrM7M6syszszqzKzOzOrMrM7M'
+        '6syszszqzKzOzOrMrM7M6syszszqzKzOzOrMrM7M6syszszqzKzOzOrMrM7M6syszszqzKzOzOrM'
+        'rM7M6syszszqzKzOzOrMrM7M6syszszqzKzOzOrMrM7M6syszszqzKzOzOrMrM7M6syszszqzKzO'
+        'zOrMrM7M6syszszqzKzOzOrMrM7M6syszszqzKzOzOrMrM7M6syszszqzKzOzOrMrM7M6syszszq'
+        'zKzOzOrMrM7M6syszszqzKzOzOrMrM7M6syszswG/ffDV5ofSmpT9fg/eEvglddvBPwnVwk7TO4w'
+        'ucPkDpM7TO4wucPkDpM7TO4wucPkDpM7TO4wucPkDpM7TO4wucPkDpM7TO4wucPkDpM7TO4wucPk'
+        'DpM7TO4wucPkDpM7TO4wucPkDpM7TO4wucPkDpM7MO7AuAPjDow7MO7AuAPjDow7MO7AuAPjDow7'
+        'MO7AuAPjDow7MO5QuEPhDoU7FO5QuEPhDoU7FO5QuEPhDoU7FO5QuMP5ToBj6uZ6sffqtpkcCTkS'
+        'ciTkSMiRkCMhR0KOhBwJORJyJORIyJGQIyFHQo6EHAk5EnIk5EjIkZAjIUdCjoQcCTkSciTkSMiR'
+        'kCMhR0KOhBwJORJyJORIyJGQIyFHQo6EHAk5EnIk5EjIkZAjIUdCjoQcCTkSciTkSMiRkCMhR0KO'
+        'hBwJORJyJORcKOaAyAGRAyIHRA6IHBA5IHJA5IDIAZEDIgdELgDxI8Fu+Y+qFfmQifuD+nvf7T8I'
+        'fu9Hb7C87QrLLiy7sOzCsgvLLiy7sOzCsgvLLiy7sOzCsgvLLiy7sOzCsgvLLiy7sOzCsgvLLiy7'
+        'sOzCsgvLLiy7sOzCsgvLLiy7sOzCsgvLLiy7sOzCsgvLLiy7sOzCsgvLLiy7sOzCsgvLLiy7sOzC'
+        'sgvLLiy7sOzCsgvLLiy7sOzCsgvLLiy7sOzCsgvLLiy7sOzCsgvLLiy7sOzCsgvLLiy7sOzCsgvL'
+        'bgDix25ukP4tHvZ52Odhn4d9HvZ52Odhn4d9HvZ52Odhn4d9HvZ52Odhn4d9HvZ52Odhn4d9HvZ5'
+        '2Odhn4d9HvZ52Odhn4d9HvZ52Odhn4d9HvZ52Odhn4d9HvZ52Odhn4d9HvZ52Odhn4d9HvZ52Odh'
+        'n4d9HvZ52Odhn4d9HvZ52Odhn4d9HvZ52Odhn4d9HvZ52Odhn4d9HvZ52Odhn4d9HvZ52Odhn4d9'
+        'HvYDDz/+uLpB+l23B259Ep+m/Ug+RCf4aPqhW3eeaP4TN2cUX3t1RvEeW7z32LG9J3gZf/KReBlv'
+        'P6fO5Vlbdat3/Zreflr1l4OX9fbTq3/5CNx6fvsZddUDleo/7WO8uLebqr/7zOrvfpIv8+1nVf8J'
+        'n139J/wvD5W//ezqL3/Ms/Cfuv4Moy8N3pD86Zv6eu5VfR0ZV0fG1ZE5dWROHZlTR+bUkTl1ZE4d'
+        'mVNH5tSROXVkTh2ZU0fm1JE5dWROHZlTR+bUkTl1ZE4dmVNH5tSROXVkTh2ZU0fm1JE5dWROHZlT'
+        'R+bUkTl1ZE4dmVNH5tSROXVkTh2ZU0fm1JE5dWROHZlTR+bUkTl1ZE4dmVNH5tSROXVkTh2ZU0fm'
+        '1JE5dWROHZlTR+bUkTl1ZE4dmVNH5tSROXVkTh2ZU0fm1JE5dWROHZlTR+bUkTl1ZE4dmVNH5tSR'
+        'OXUUBOxnbiR85EpCgYQCCQXFVQCiAEQBiAIQBSAKQBSAKABRAKIARAGIAhAFIApAFIAoAFEAogBE'
+        'AYgCEAUgCkAUgCgAUQCiAEQBiAIQBSAKQBSAKABRAKIARAGIAhAFIApAFIAoAFEAogBEAYgCEAUg'
+        'CkAUgCgAUQCiAEQBiAIQBSAKQBSAKABRAKIARAGIAhAFIApAFIAoAFEAogBEAYgCEAUgCgGI6esf'
+        'RGkNRsXPfsbcDHV7pe5jnRl/6u+Euutg2Enxw8+H3/nk4J6k4Gak7upHFl8fFN85OX7cnBf/iiKO'
+        'LT70X3nvZqjPjJuhfu4zYoDce6vp3ltNj8yQ8DCgV1XvKv1MfGLKz1/vP7qC/cfMzcHKf7Y/Ldmf'
+        'luxPS/anJfvTkv1pyf60ZH9asj8t2Z+W7E9L9qcl+9OS/WnJ/rRkf1qyPy3Zn5bsT0v2pyX705L9'
+        'acn+tGR/WrI/LdmfluxPS/anJfvTkv1pyf60ZH9asj8t2Z+W7E9L9qcl+9OS/WnJ/rRkf1qyPy3Z'
+        'n5bsT0v2pyX705L9acn+tGR/WrI/LdmfluxPS/anJfvTkv1pyf60ZH9asj8t2Z+W7E9L9qcl+9OS'
+        '/WnJ/rRkf1qyPy3Zn5bsT0v2pyX705L9acn+tGR/WrI/LQX703cFHoLP3/3B6mlCcITw1dUjhAfv'
+        'n737PtsfCvj8wvWVb3fw9dy9NnritpHRmKuOxnu9dO/5XY9BG83f+Rii+98VjI9fvLkf4vuv7iGs'
+        'uB+i4n6IivshKu6HqLgfouJ+iIr7ISruh6i4H6LifoiK+yEquq2i2yq6raLbKrqtotsquq2i2yq6'
+        'raLbKrqtotsquq2i2yq6raLbKrqtotsquq2i2yq6raLbKrqtotsquq2i2yq6raLbKrqtotsquq2i'
+        '2yq6raLbKrqtotsquq2i2yq6raLbKu6HqKi4ioqrqLiKiquouIqKq6i4ioqrqLiKiquouIqKq6i4'
+        'ioqrqLiKiquouIoCqmi6iqarqLiKiquouIqKq6i4ioqrqLiKiquouIqKq6i4ivshKu6HqLgfouJ+'
+        'iIr7ISruh6i4H6LisLzifoiK+yEq7oeouB+i4n6IivshKu6HqDhdrwRdunDzg5GV67sgVu2ynlQf'
+        'SAyWOsv7LPWWp1oaLI2Wp1mebnmG5bMsTZZnWp5l+WzLsy3PsTzX8jmW51meb3mB5XMtzZbPs7RY'
+        'Xmj5fMsXWF5kabW0Wb7Q8mLLF1m+2PIllpdY2i1favkyy5dbXmp5meUrLF9pebnlFZYOy1dZQpZX'
+        'Wjotr7KELa+2dFm+2hKxvMbSbXmtJWp5neU+y+stb7C80fImy5stMctbguXB+xdvjoW/4epYuAaI'
+        'GiBqgKgBogaIGiBqgKgBogaIGiBqgKgBogaIGiBqgKgBogaIGiBqgKgBogaIGiBqgKgBogaIGiBq'
+        'gKgBogaIGiBqgKgBogaIGiBqgKgBogaIGiBqgKgBogaImv+fvfuPi32/6wPfXJKQEEISQkhCJpNf'
+        'JARCSDL5QSaEnPw8yeRyKLKSjsUaU0dMT+NoNQeZ4tJMLUFLp8KaQtdBrJ1i1m0rTkfE1nrE0tpK'
+        'BSvrTn9oDJmIOBGMCuwcuhT2zPfJgdvHaozxam5y6R++c382mXm+3q/P9ztfBiBqgKgBogaIGiBq'
+        'gKgBogaIGiBqgKgBogaIGiBqgKgBogaIGiBqgKgBogaIGiBqgKgBogaIGiBqgKgBogaIGiBqgKgB'
+        'oiYAsXz1BXynAYg/uP2kpwQL6UnBX/+JKzBfdwGmFphaYGqBqQWmFphaYGqBqQWmFphaYGqBqQWm'
+        'FphaYGqBqQWmFphaYGqBqQWmFphaYGqBqQWmFphaYGqBqQWmFphaYGqBqQWmFphaYGqBqQWmFpha'
+        'YGqBqQWmFphaYGqBqQWmFphaYGqBqQWmFphaYGqBqQWmFphaYGqBqQWmFphaYGqBqQWmFphaYGqB'
+        'qQWmFphaYGqBqQWmFphaYGqBqQWmNgCRvwBzv1ve9KBbbt2+oFGHRh0adWjUoVGHRh0adWjUoVGH'
+        'Rh0adWjUoVGHRh0adWjUoVGHRh0adWjUoVGHRh0adWjUoVGHRh0adWjUoVGHRh0adWjUoVGHRh0a'
+        'dWjUoVGHRh0adWjUoVGHRh0adWjUoVGHRh0adWjUoVGHRh0adWjUoVGHRh0adWjUoVGHRh0adWjU'
+        'oVGHRh0adWjUoVGHRh0adWjUoVGHRh0adWjUoVEX0PgXlz8e+9PBobpweY3++eC7zn7yS/7QP/jK'
+        'y++qcvtK/dLOL/gjbStXS/bmRZIaJalRkholqVGSGiWpUZIaJalRkholqVGSGiWpUZIaJalRkhol'
+        'qVGSGiWpUZIaJalRkholqVGSGiWpUZIaJalRkholqVGSGiWpUZIaJalRkholqVGSGiWpUZIaJalR'
+        'kholqVGSGiWpUZIaJalRkholqVGSGiWpUZIaJalRkholqVGSGiWpUZIaJalRkholqVGSGiWpUZIa'
+        'JalRkholqVGSGiWpUZIaJalRkholqVGSGiWpUZIagyT91BWIb74A0QREExBNQDQB0QREExBNQDQB'
+        '0QREExBNQDQB0QREExBNQDQB0QREExBNQDQB0QREExBNQDQB0QREExBNQDQB0QREExBNQDQB0QRE'
+        'ExBNQDQB0QREExBNQDQB0QREExBNQDQB0QREExBNQDQB0QREExBNQDQB0QREExBNQDQB0QREExBN'
+        'QDQB0QREExBNQDQB0QREExBNQDQB0QREExBNQDQB0RSAWP1Db29efu4auU/k+pP7x/V3mFx/Vcn1'
+        'p/OPuMH503/ez6k++LKAW79cPaZ9Ecety28CeNH9v//ROHoFX5/wpi/1awX+5VXlfvaickMqN6Ry'
+        'Qyo3pHJDKjekckMqN6RyQyo3pHJDKjekckMqN6RyQyo3pHJDKjekckMqN6RyQyo3pHJDKjekckMq'
+        'N6RyQyo3pHJDKjekckMqN6RyQyo3pHJDKjekckMqN6RyQyo3pHJDKjekckMqN6RyQyo3pHJDKjek'
+        'ckMqN6RyQyo3pHJDKjekckMqN6RyQyo3pHJDKjekckMqN6RyQyo3pHJDKjekckMqN6RyQyo3pHJD'
+        'KjekckNB5f6rx9xXYQdXQT/40KP3ZRxfWlJ+5uJXCt3/LzP7kJ9CD1bOv778hP8wuNz72atE/dWL'
+        'RLVKVKtEtUpUq0S1SlSrRLVKVKtEtUpUq0S1SlSrRLVKVKtEtUpUq0S1SlSrRLVKVKtEtUpUq0S1'
+        'SlSrRLVKVKtEtUpUq0S1SlSrRLVKVKtEtUpUq0S1SlSrRLVKVKtEtUpUq0S1SlSrRLVKVKtEtUpU'
+        'q0S1SlSrRLVKVKtEtUpUq0S1SlSrRLVKVKtEtUpUq0S1SlSrRLVKVKtEtUpUq0S1SlSrRLVKVKtE'
+        'tUpUq0S1SlSrRLUGibp7/TUF18+OPd4/o3/wq47+4cc/cf11xX/MIfbnrn6u+28+4eLnuh/+5Qcf'
+        'aP60TunQKR06pUOndOiUDp3SoVM6dEqHTunQKR06pUOndOiUDp3SoVM6dEqHTunQKR06pUOndOiU'
+        'Dp3SoVM6dEqHTunQKR06pUOndOiUDp3SoVM6dEqHTunQKR06pUOndOiUDp3SoVM6dEqHTunQKR06'
+        'pUOndOiUDp3SoVM6dEqHTunQKR06pUOndOiUDp3SoVM6dEqHTunQKR06pUOndCiTDmXSoUw6lEmH'
+        'MulQJh3KpEOZdCiTDmXSoUw6lElHUCZrV6eLxMXpopOEThI6SegkoZOEThI6SegkoZOEThI6Segk'
+        'oZOEThI6SegkoZOEThI6SegkoZOEThI6SegkoZOEThI6SegkoZOEThI6SegkoZOEThI6SegkoZOE'
+        'ThI6SegkoZOEThI6SegkoZOEThI6SegkoZOEThI6SegkoZOEThI6SegkoZOEThI6Seh0uugEohOI'
+        'TiA6gegEohOITiA6gegEohOITiA6gegMQPz8FYgbFyC6gOgCoguILiC6gOgCoguILiC6gOgCoguI'
+        'LiC6gOgCoguILiC6gOgCoguILiC6gOgCoguILiC6gOgCoguILiC6gOgCoguILiC6gOgCoguILiC6'
+        'gOgCoguILiC6gOgCoguILiC6gOgCoguILiC6gOgCoguILiC6gOgCoguILiC6gOgCoguILiC6gOgC'
+        'oguILiC6gOgCoguILiC6gOgCoguILiC6AhD/5uqbtOZrHnyT1lTwTVrr10+LXp8/vzLPn8Gjsv+o'
+        'et19/bTon9c59N9e/mrcteDOxr+7+tmFf6ZpujVNt6bpVjHdKqZbxXSrmG4V061iulVMt4rpVjHd'
+        'KqZbxXSrmG4V061iulVMt4rpVjHdKqZbxXSrmG4V061iulVMt4rpVjHdKqZbxXSrmG4V061iulVM'
+        't4rpVjHdKqZbxXSrmG4V061iulVMt4rpVjHdKqZbxXSrmG4V061iulVMt4rpVjHdKqZbxXSrmG4V'
+        '061iulVMt4rpVjHdKqZbxXSrmG4V061iulVMt4rpVjHdKqZbxXSrmO6gW37h6rDxny8OG1EEoghE'
+        'HTaiJERJiJIQJSFKQpSEKAlREqIkREmIkhAlIUpClIQoCVESoiRESYiSECUhSkKUhCgJURKiJERJ'
+        'iJIQJSFKQpSEKAlREqIkREmIkhAlIUpClIQoCVESoiRESYiSECUhSkKUhCgJURKiJERJiJIQJSFK'
+        'QpSEKAlREqIkREmIkhAlIUpClIQoCVESoiRESYiSECUh6rARDUD8+ysQH7oA0QNEDxA9QPQA0QNE'
+        'DxA9QPQA0QNEDxA9QPQA0QNEDxA9QPQA0QNEDxA9QPQA0QNEDxA9QPQA0QNEDxA9QPQA0QNEDxA9'
+        'QPQA0QNEDxA9QPQA0QNEDxA9QPQA0QNEDxA9QPQA0QNEDxA9QPQA0QNEDxA9QPQA0QNEDxA9QPQA'
+        '0QNEDxA9QPQA0QNEDxA9QPQA0QNEDxA9QPQA0QNEDxA9QPQA0ROA+A+XDz99V9AZv3h98/OxePi8'
+        'vB/3E/cze30Qvf4lAY+ZQ+fG1Y8kfc/FjyS94ynBjyQF41PGbxhF49PGjvEZo2R81njIeJLxZKPW'
+        '+E3jKcZTjTrjaUa98XSjwXiG8UzjWUaj8WyjyXiO0Ww813ie8XyjxXiBETJeaISNFxkvNl5ivNR4'
+        'mdFqvNx4hdFmvNJoNzqMVxmdxq7xaqPLeI3xWuN1RsR4vfEG443Gm4xu481G1HiL0WO81eg1+oy3'
+        'GTeMdxjvNN5lvNt4j3HTeK/xPiNmvN942PgtY8/4baNsfM74HWPfODB+1/i88XvG7xt/YBwaR8Zx'
+        'MO7c+o+XHw5/bVCHv1T94+C7w14ePCu8+ad7Nvh3v2qfDd4Kzg1P9qzMrU/6wP1J1T8MfkL6hp+Q'
+        '/uWr4+c3XRw/++S7T7775LtPvvvku0++++S7T7775LtPvvvku0++++S7T7775LtPvvvku0++++S7'
+        'T7775LtPvvvku0++++S7T7775LtPvvvku0++++S7T7775LtPvvvku0++++S7T7775LtPvvsEu0+w'
+        '+wS7T7D7BLtPsPsEu0+w+wS7T7D7BLtPsPsEu0+w+wS7T7D7BLtPovskus/xs0+w+wS7T7D7BLtP'
+        'sPsEu0+w+wS7T7D7BLtPsPusjr4gb//pCsT7LkD0A9EPRD8Q/UD0A9EPRD8Q/UD0A9EPRD8Q/UD0'
+        'A9EPRD8Q/UD0A9EPRD8Q/UD0A9EPRD8Q/UD0A9EPRD8Q/UD0A9EPRD8Q/UD0A9EPRD8Q/UD0A9EP'
+        'RD8Q/UD0A9EPRD8Q/UD0A9EPRD8Q/UD0A9EPRD8Q/UD0A9EPRD8Q/UD0A9EPRD8Q/UD0A9EPRD8Q'
+        '/UD0A9EPRD8Q/UD0A9EPRD8Q/UD0ByB+5eqe1b/jYYCHAR4GeBjgYYCHAR4GeBjgYYCHAR4GeBjg'
+        'YYCHAR4GeBjgYYCHAR4GeBjgYYCHAR4GeBjgYYCHAR4GeBjgYYCHAR4GeBjgYYCHAR4GeBjgYYCH'
+        'AR4GeBjgYYCHAR4GeBjgYYCHAR4GeBjgYYCHAR4GeBjgYYCHAR4GeBjgYYCHAR4GeBjgYYCHAR4G'
+        'eBjgYYCHAR4GeBjgYYCHAR4GeBjgYSDwsP2Ye7zt0a7Z4GDwzdXC/BMV7v/1yC8b+XxwOPnV64+L'
+        'Lh+3v37O/jF3Re5nJZ7z0OP5ifvgc7GHhz7+iS//o/f/99WF+/TFhXvchXvchXvchXvchXvchXvc'
+        'hXvchXvchXvchXvchXvchXtcb8f1dlxvx/V2XG/H9XZcb8f1dlxvx/V2XG/H9XZcb8f1dlxvx/V2'
+        'XG/H9XZcb8f1dlxvx/V2XG/H9XZcb8f1dlxvx/V2XG/H9XZcb8f1dlxvx/V2XG/H9XZcb8f1dlxv'
+        'x/V23IV7XH3H1XdcfcfVd1x9x9V3XH3H1XdcfcfVd1x9x9V3XH3H1XdcfcfVd1x9x5VrXIvHtXhc'
+        'fcfVd1x9x9V3XH3H1XdcfcfVd1x9x9V3XH3HXbjHXbjHXbjHXbjHXbjHXbjHXbjHXbjHXbjHXbjH'
+        'XbjHXbjHXbjHXbjHXbjHXbjHg3NC8cE54faPPLka1vv/5386MXzydq76p4KDw+1/Uv2Pf4Kzw+1P'
+        'Ptnd11+5H5PH0jni/kkgOEt85va3VVfDI6/cP3v7R6v/pb/AeeL2R6r7+MeeHFyj3/8ft3X/f9zF'
+        'EePOrf/8VX/uenDaCs5fv149fz14nYL7Pd9avVXzBU9g/+Xyy5lWg+PXf33kiewXg9tH/+1qx45e'
+        '7NiEHZuwYxN2bMKOTdixCTs2Yccm7NiEHZuwYxN2bMKOTdixCTs2Yccm7NiEHZuwYxN2bMKOTdix'
+        'CTs2Yccm7NiEHZuwYxN2bMKOTdixCTs2Yccm7NiEHZuwYxN2bMKOTdixCTs2Yccm7NiEHZuwYxN2'
+        'bMKOTdixCTs2Yccm7NiEHZuwYxN2bMKOTdixCTs2Yccm7NiEHZuwYxN2bMKOTdixCTs2Yccm7NiE'
+        'HZuwYxN2bMKOTdixCTs2Yccm7NiEHZuwYxN2bMKOTdixCTs2Yccm7NiEHZuwYxN2bMKOTdixCTs2'
+        'Yccm7NiEHZuwYxN2bMKOTdixCTs2Yccm7NiEHZuwYxN2bCLYsb92dbPmMxc3a0YAHAFwBMARAEcA'
+        'HAFwBMARAEcAHAFwBMARAEcAHAFwBMARAEcAHAFwBMARAEcAHAFwBMARAEcAHAFwBMARAEcAHAFw'
+        'BMARAEcAHAFwBMARAEcAHAFwBMARAEfIGyFvhLwR8kbIGyFvhLwR8kbIGyFvhLwR8kbIGyFvhLwR'
+        '8kbIG0FuBLkRF+cj5I2QN0LeCHkj5I2QN0LeCHkj5I2QN0LeCNsjAYhfv/otGl9z8Vs0Pgzah7n5'
+        'cPC3fer6M+XrBxq/8FXr5a+wPKrW7vWHyo/zD5V/4/IrerqeUD1HffrqHPXjF+eopHNU0jkq6RyV'
+        'dI5KOkclnaOSzlFJ56ikc1TSOSrpHJVUY0k1llRjSTWWVGNJNZZUY0k1llRjSTWWVGNJNZZUY0k1'
+        'llRjSTWWVGNJNZZUY0k1llRjSTWWVGNJNZZUY0k1llRjSTWWVGNJNZZUY0k1llRjSTWWVGNJNZZU'
+        'Y0k1llRjSTWWdI5KarOkNktqs6Q2S2qzpDZLarOkNktqs6Q2S2qzpDZLarOkNktqs6Q2S2qzpK5J'
+        'KrWkUktqs6Q2S2qzpDZLarOkNktqs6Q2S2qzpDZLarOkc1TSOSrpHJV0jko6RyWdo5LOUUn1lnSO'
+        'SjpHJZ2jks5RSeeopHNU0jkqqQ+TQR/uXH6o/GPBVcJnrn/HyfU3pVx/U8pjsAgffHHR0cc/8Vj6'
+        '1pTS4+LmTHBj5r9Xz4Nf9Idin726Qn3PxRXqqGofVe2jqn1UtY+q9lHVPqraR1X7qGofVe2jqn1U'
+        'tY+q9lHVPqraR1X7qGofVe2jqn1UtY+q9lHVPqraR1X7qGofVe2jqn1UtY+q9lHVPqraR1X7qGof'
+        'Ve2jqn1UtY+q9lHVPqraR1X7qE4f1emjOn1Up4/q9FGdPqrTR3X6qE4f1emjOn1Up4/q9FGdPqrT'
+        'R3X6qE4fVeajynzUFeqoTh/V6aM6fVSnj+r0UZ0+qtNHdfqoTh/V6aM6fdSpYTSo2t+8epxgnYcx'
+        'HsZ4GONhjIcxHsZ4GONhjIcxHsZ4GONhjIcxHsZ4GONhjIcxHsZ4GONhjIcxHsZ4GONhjIcxHsZ4'
+        'GONhjIcxHsZ4GONhjIcxHsZ4GONhjIcxHsZ4GONhjIcxHsZ4GONhjIcxHsZ4GONhjIcxHsZ4GONh'
+        'jIcxHsZ4GONhjIcxHsZ4GONhjIcxHsZ4GONhjIcxHsZ4GONhjIcxHsZ4GONhjIexwMPuV+3mDL5W'
+        '6r99qV8r9VuXR9JCcCTdu1qkH7xYpBOCMyE4E4IzITgTgjMhOBOCMyE4E4IzITgTgjMhOBOCMyE4'
+        'E4IzITgTgjMhOBOCMyE4E4IzITgTgjMhOBOCMyE4E4IzITgTgjMhOBOCMyE4E4IzITgTgjMhOBOC'
+        'MyE4E4IzITgTgjMhOBOCMyE4E4IzITgTgjMhOBOCMyE4E4IzITgTgjMhOBOCMyE4E4IzITgTgjMh'
+        'OBOCMyE4E4IzITgTgjMhOBOCMyE4E4IzITgTgjMhOBNBcH776rv6Jx968NUW/4aMNBlpMtJkpMlI'
+        'k5EmI01Gmow0GWky0mSkyUiTkSYjTUaajDQZaTLSZKTJSJORJiNNRpqMNBlpMtJkpMlIk5EmI01G'
+        'mow0GWky0mSkyUiTkSYjTUaajDQZaTLSZKTJSJORJiNNRpqMNBlpMtJkpMlIk5EmI01Gmow0GWky'
+        '0mSkyUiTkSYjTUaajDQZaTLSZKTJSJORJiNNRpqMdCCjfP3U0fU93T/0Ojb4GfDPXd/Qvf4h9Udc'
+        'u37u8gcO/3Fw0vidqxN6QZ1MqZMpdTKlTqbUyZQ6mVInU+pkSp1MqZMpdTKlTqbUyZQ6mVInU+pk'
+        'Sp1MqZMpdTKlTqbUyZQ6mVInU+pkSp1MqZMpdTKlTqbUyZQ6mVInU+pkSp1MqZMpdTKlTqbUyZQ6'
+        'mVInU+pkSp1MqZMpdTKlTqbUyZQ6mVInU+pkSp1MqZMpdTKlTqbUyZQ6mVInU+pkSp1MqZMpdTKl'
+        'TqbUyZQ6mVInU+pkSp1MqZMpdTKlTqbUyZQ6mVInU+pkSp1MBXWyf/1h4XWxXP/Q6Z/nbdHLHy4O'
+        '3d+/X3GFcnBZKN8cfFb4u1eXrj0PaZSMRslolIxGyWiUjEbJaJSMRslolIxGyWiUjEbJaJSMRslo'
+        'lIxGyWiUjEbJaJSMRslolIxGyWiUjEbJaJSMRslolIxGyWiUjEbJaJSMRslolIxGyWiUjEbJaJSM'
+        'RslolIxGyWiUjEbJaJSMRslolIxGyWiUjEbJaJSMRslolIxGyWiUjEbJaJSMRslolIxGydj3GcWS'
+        'USwZxZJRLBnFklEsGcWSUSwZxZJRLBnFklEsGcWSUSyZoFE+f/kznf8meE7v9x4B5OLexiwgs4DM'
+        'AjILyCwgs4DMAjILyCwgs4DMAjILyCwgs4DMAjILyCwgs4DMAjILyCwgs4DMAjILyCwgs4DMAjIL'
+        'yCwgs4DMAjILyCwgs4DMAjILyCwgs4DMAjILyCwgs4DMAjILyCwgs4DMAjILyCwgs4DMAjILyCwg'
+        's4DMAjILyCwgs2TMkjFLxiwZs2TMkjFLxiwZs2TMkjFLxiwZs2TMkjGL4GwA5PeDI0e1TapIPnQf'
+        'yd979gc/+K0f+ug3ffiD3/nRb/3oB7/9I3e+84Ov/0T1r6arlzM2951bfxBI6qhKejhYNa+6Pe+F'
+        'm/fCzXvh5j1lMI/XvBdunrl5r+a813beqznv6YR5L+o8iPMgznuJ53mc90rPYznvBZ/3gs97wedZ'
+        'nfe6zyM7j+y8d2Ge3Hlvxrw3Y96bMe/NmKd63nsy7z2ZZ3ye8Xnv0Dzq86jPe7/miZ/3fs179+b5'
+        'n+d/HtJ57+W8NMwjOy8U80IxLxTzQjEvFPPe/Hlv/ryIzIvIPArzkjIvKfOSMg/GvMDM0zIvN/O0'
+        'zAvMvMDMC8x8YOfwkQ/9fn9wRXN09bBK3UMeVsl6WCXrYZWsh1WyHlbJelgl62GVrIdVsh5WyXpY'
+        'JYtDFqMsOFmaspZVlpEsI1k4slRkAch657Pe+ay3POttzXojs97IrHcw6x3Meuuy3qysNyvr7cl6'
+        'X7Lel6z3Jet9yXpfst6JrHci6y3Ieguy3oKs1z7rRc9ykPXOZ732Wa991muftayyllVW5rIeVsmK'
+        'Xlb0snKVlbKs6GWlLCteWYHKSlJWhLIilBWhrOxkpSUrJlkxyYpJ1kbJSktWTLISkZWBLPVZGchy'
+        'nsU2i20W1CyFWTSzFGY9rJL1sErWwypZD6tkPayS9bBK1sMqWQ+rZD2skvWwStbDKlkPq2Q9rJL1'
+        'sErWwypZD6tkA+DHwXL8tepyvA+6LwD9m7d/KPhr/8/Vb2V8R/AXPnf7h70JP+z/6x8O/rbK4+Zn'
+        'Cb6Iz1p8rP3fHqp+HcK9q03xNy8ea8vZFDmbImdT5GyKnE2RsylyNkXOpsjZFDmbImdT5GyKnE2R'
+        'sylyNkXOpsjZFDmbImdT5GyKnE2RsylyNkXOpsjZFDmbImdT5GyKnE2RsylyNkXOpsjZFDmbImdT'
+        '5GyKnE2RsylyNkXOpsjZFDmbImdT5GyKnE2RsylyNkXOpsjZFDmbImdT5CDN2RQ5myJnU+RsipxN'
+        'kbMpcjZFzqbI2RQ5myJnU+RsipxNkbMpcjZFzqbI2RQ5myJnU+RsipxNkbMpcjZFzqbI2RQ5myJn'
+        'U+RsipxNkbMpcjZFzqbI2RQ5myJnU+RsipxNkbMpcuKasylyNkXOpsjZFDmbImdT5GyKnE2RC2J+'
+        'cnWu/tqLc/USgEsALgG4BOASgEsALgG4BOASgEsALgG4BOASgEsALgG4BOASgEsALgG4BOASgEsA'
+        'LgG4BOASgEsALgG4BOASgEsALgG4BOASgEsALgG4BOASgEsALgG4BOASeUvkLZG3RN4SeUvkLZG3'
+        'RN4SeUvkLZG3RN4SeUvkLZG3RN4SeUvILSG35Ay3RN4SeUvkLZG3RN4SeUvkLZG3RN4SeUvkLbG9'
+        'FID474+vnyH7vkf+DNkX/LT9/61ekQafpf7t4MR4ev0A6PUDoH8G9zcvHl+89av3lV0/DfrV9Hvz'
+        '/sfl8zr/IdggZ5fde/91uf933P9/t158UcLLSnhZCS9r32Xtu6x9l7XvsvZd1r7L2ndZ+y5r32Xt'
+        'u6x9l7XvsvZd1r7L2ndZ+y5r32Xtu6x9l7XvsvZd1r7L2ndZ+y5r32Xtu6x9l7XvsvZd1r7L2ndZ'
+        '+y5r32Xtu6x9l7XvsvZd1r7L2ndZ+y5r32Xtu6x9l7XvsvZd1r7L2ndZ+y5r32Xtu6x9l7XvsvZd'
+        '1r7L2ndZ+y5r32Xtu6x9l7XvsvZd1r7L2ndZ+y5r32Xtu6x9l7XvsvZdDtr3/OriInVxcZF3cZF3'
+        'cZF3cZF3cZF3cZF3cZF3cZF3cZF3cZF3cZF3cZHHKo9V3tkuT1eerjxdebrydOXpytOVpytPV56u'
+        'PF15uvJ05enK05WnK09Xnq48XXm68nTl6crTlacrT1eerjxdebrydOXpytOVpytPV56uPF15uvJ0'
+        '5V1c5CHLQ5aHLA9ZHrI8ZHnI8pDlIctDlocsD1kesjxkecjykOUhyyOQZy3PWh6yPGR5yPKQ5SHL'
+        'Q5aHLA9ZHrI8ZHnI8i4u8i4u8i4u8i4u8i4u8i4u8i4u8i4u8i4u8i4u8i4u8i4u8i4u8i4u8i4u'
+        '8i4u8oHmv1BzeXHx5ou9VgCwAGABwAKABQALABYALABYALAAYAHAAoAFAAsAFgAsAFgAsABgAcAC'
+        'gAUACwAWACwAWACwAGABwAKABQALABYALABYALAAYAHAAoAFAAsAFgAsAFggr0BegbwCeQXyCuQV'
+        'yCuQVyCvQF6BvAJ5BfIK5BXIK5BXIK+AXAG5gvVWIK9AXoG8AnkF8grkFcgrkFcgr0BegbwC24UA'
+        'xBNqrp8TuH5O4Po5gcfygfnBcwWf+VP8+NSj9pzAQzUPPgZ+VfAxcE3Ng58xHg7++Ik118+xXq+R'
+        '6zXy1fP0qgeQz6o3Px79dfKky3VyM1gfT6558MuXSsEf1wbr5FPVP/GO6o3B36guwtfd/w/F6hm2'
+        'Kfi47L/eXndMWndlte7Kat3Bdt3Bdt3Bdt3Bdt3Bdt3Bdt3Bdt3Bdt3Bdt3Bdt3Bdt3Bdt3Bdt3B'
+        'dt3Bdt3Bdt3Bdt3Bdt3Bdt3Bdt3Bdt3Bdt3Bdt3Bdt3Bdt3Bdt3Bdt3Bdt3Bdt3Bdt3Bdt3Bdt3B'
+        'dt3Bdt3Bdt3Bdt3Bdt3Bdt3Bdt3Bdt2V1brz7brz7brz7brz7brz7brz7brz7brz7brz7brz7brz'
+        '7brz7brz7brz7brz7brz7brz7brT57pj7rpj7rrz7brz7brz7brz7brz7brz7brz7brz7brz7brz'
+        '7brz7borq2B81CgZe8ZvG2Xjc8Znjd8x9o0D4zPG7xqfN37P+H3j08aO8QfGoXFkHAfjzq2n1Hzh'
+        '+/n3qT+/+vtvH627+V/OT3D/yHv3Tw1ehBu3/2LNxffm3frh6oL5mhq3Wn8p+GC37vJq9eEfd7G6'
+        'IdMbMr0hzBvCvCHMG8K8IcwbwrwhzBvCvCHMG8K8IcwbwrwhzBvCvCHMG8K8IcwbwrwhzBvCvCHM'
+        'G8K8IcwbwrwhzBvCvCHMG8K8IcwbwrwhzBvCvCHMG8K8IcwbwrwhzBtSvCHFG1K8IcUbUrwhxRtS'
+        'vCHFG1K8IcUbUrwhxRtSvCHFG1K8IcUbUrwhvhviu2H9bkjxhhRvSPGGFG9I8YYUb0jxhhRvSPGG'
+        'FG9I8UaQlacFAoJ++HeXPy/3z1nYZGGThU0WNlnYZGGThU0WNlnYZGGThU0WNlnYZGGThU0WNlnY'
+        'ZGGThU0WNlnYZGGThU0WNlnYZGGThU0WNlnYZGGThU0WNlnYZGGThU0WNlnYZGGThU0WNlnYZGGT'
+        'hU0WNlnYZGGThU0WNlnYZGGThU0WNlnYZGGThU0WNlnYZGGThU0WNlnYZGGThU0WNlnYZGGThU0W'
+        'NlnYZGGThc3AQn3N5dekveria9J+OfgLT/+fFurnq1j2q88XPtoflQYfT/52dTV/mT40vV3xcOXD'
+        '4fv/Hf64B2faq3/jK+//jX/kDm6ouby1/X0Xt7aLbm0X3douurVddGu7qOeKeq6oGIvqtahCiw5g'
+        'RQewooAWBbToAFaU06KcFuW0KKdFOS3KaVFOi3JalNOinBbltCinRTktymlRTotyWpTTopwW5bQo'
+        'p0U5LcppUU6LclqU06KcFuW0KKdFOS3KaVFOi3JalNOinBbltCinRTktOoAVxbUorkVxLYprUVyL'
+        '4loU16K4FsW1KK5FcS2Ka1Fci+JaFNeiuBbFtegAVpTaotQWxbUorkVxLYprUVyL4loU16K4FsW1'
+        'KK5FcS06gBUduYqOXEVHrqIjV9FZq+isVXTWKjpkFR2yig5ZRYesomNV0bGq6FhVdKwqBlvgGfc1'
+        '3/67F4+Qvj34GYZnBsDXg5/Hry6E++G/c+tZNY941PQJwUVG49Xf98bLv+/ZNZdPJb//4qnkHe/f'
+        'jjduxxu3A/sO5TveuB30d7ybO97bHe/mjpDseFN35GFHHna8xTtiseOd3pGOHW/4jjd8xxu+IzI7'
+        '3vcdydmRnB0KdgRoB4YdGHZg2KFgR7h2YNixwndEbUfUdgjZkbgdidvhZUfwdnjZoWdHDHfEcEdW'
+        'dljaEcodydmRzR3Z3JHNHdnckc0d+Hbg25HUHUndQXFHYHcEdkdgd8DckdsdWnfEd4fWHbndkdsd'
+        'ud0JSDVdLcinXjyCXLIgSxZkyYIsWZAlC7JkQZYsyJIFWbIgS977EjMlSkrolCzIEhAlIEoklBAo'
+        'ebdL3uaSt7nk/S15D0vetZJ3reTtKnm7St6nknem5J0peS9K3oSSN6HkTSh5E0rehJKXveRlL3m9'
+        'S17vkte75IUueYVL3vSSt7nkhS55oUte6JIFWbIgSwJWsiBLclaSs5IQlUSqJGclkSrJUkl6SmJT'
+        'kpeSvJTkpSQoJdEoyURJJkoyUbIgS6JRkokS/iXgS4iXgC9BXWK0xGiJyhJyJQ5LyJUsyJIFWbIg'
+        'SxZkyYIsWZAlC7JkQZYsyJIFWbIgSxZkyYIsWZAlC7JkQZYCzc+pufzuib9zeZb+SWfpXRJ3Sdwl'
+        'cZfEXRJ3SdwlcZfEXRJ3SdwlcZfEXRJ3SdwlcZfEXRJ3SdwlcZfEXRJ3SdwlcZfEXRJ3SdwlcZfE'
+        'XRJ3SdwlcZfEXRJ3SdwlcZfEXRJ3SdwlcZfEXQR3EdxFcBfBXQR3EdxFcBfBXQR3EdxFcBfBXQR3'
+        'EdxFcBfBXQR32dtlb9c+3kVwF8FdBHcR3EVwF8FdBHcR3EVwF8FdBHch3w1kNF9dZ/8MD3s87PGw'
+        'x8MeD3s87PGwx8MeD3s87PGwx8MeD3s87PGwx8MeD3s87PGwx8MeD3s87PGwx8MeD3s87PGwx8Me'
+        'D3s87PGwx8MeD3s87PGwx8MeD3s87PGwx8MeD3s87PGwx8MeD3s87PGwx8MeD3s87PGwx8MeD3s8'
+        '7PGwx8MeD3s87PGwx8MeD3s87PGwx8MeD3s87PGwx8MeD3s87PGwx8MeD3uBh+de9d5HLy4Mynqv'
+        'rPfKeq+s98p6r6z3ynqvrPfKeq+s98p6r0xXma4yXWW6ynSV6SrTVaarTFeZrjJdZbrKdJXpKtNV'
+        'pqtMV5muMl1lusp0lekq01Wmq0xXma4yXWW6ynSV6SrTVaarTFeZrjJdZbrKdJXpKtNVpqus98qQ'
+        'lSErQ1aGrAxZGbIyZGXIypCVIStDVoasDFkZsjJkZcjKkJURKLNWZq0MWRmyMmRlyMqQlSErQ1aG'
+        'rAxZGbIyZGW9V9Z7Zb1X1ntlvVfWe2W9V9Z7Zb1X1ntlvVfWe2W9V9Z7Zb1X1nvlQPPzLj+hfH9w'
+        '2n/+1TMw33DxDMwBkAdAHgB5AOQBkAdAHgB5AOQBkAdAHgB5AOQBkAdAHgB5AOQBkAdAHgB5AOQB'
+        'kAdAHgB5AOQBkAdAHgB5AOQBkAdAHgB5AOQBkAdAHgB5AOQBkAdAHgB5AOQBiQckHpB4QOIBiQck'
+        'HpB4QOIBiQckHpB4QOIBiQckHpB4QOIBiQcIHiB4YN0dkHhA4gGJByQekHhA4gGJByQekHhA4gGJ'
+        'B6wfBEBaah78BpLRAMgLah78KPxTnlj949AVmDdcgDkE5hCYQ2AOgTkE5hCYQ2AOgTkE5hCYQ2AO'
+        'gTkE5hCYQ2AOgTkE5hCYQ2AOgTkE5hCYQ2AOgTkE5hCYQ2AOgTkE5hCYQ2AOgTkE5hCYQ2AOgTkE'
+        '5hCYQ2AOgTkE5hCYQ2AOgTkE5hCYQ2AOgTkE5hCYQ2AOgTkE5hCYQ2AOgTkE5hCYQ2AOgTkE5hCY'
+        'Q2AOgTkE5hCYQ2AOgTkE5hCYQ2AOgTkMwLzwCsQ3XoA4BuIYiGMgjoE4BuIYiGMgjoE4BuIYiGMg'
+        'joE4BuIYiGMgjoE4BuIYiGMgjoE4BuIYiGMgjoE4BuIYiGMgjoE4BuIYiGMgjoE4BuIYiGMgjoE4'
+        'BuIYiGMgjoE4BuIYiGMgjoE4BuIYiGMgjoE4BuIYiGMgjoE4BuIYiGMgjoE4BuIYiGMgjoE4BuIY'
+        'iGMgjoE4BuIYiGMgjoE4BuIYiGMgjoE4DkCErw5MCxcHpooDU8WBqeLAVHFgqjgwVRyYKg5MFQem'
+        'igNTxYGp4sBUoatCV4WuCl0Vuip0Veiq0FWhq0JXha4KXRW6KnRV6KrQVaGrQleFrgpdFboqdFXo'
+        'qtBVoatCV4WuCl0Vuip0Veiq0FWhq0JXha4KXRW6KnRV6KrQVXFgqkBWgawCWQWyCmQVyCqQVSCr'
+        'QFaBrAJZBbIKZBXIKpBVIKtAVkGgwlqFtQpkFcgqkFUgq0BWgawCWQWyCmQVyCqQVRyYKg5MFQem'
+        'igNTxYGp4sBUcWCqODBVHJgqDkwVB6aKA1PFganiwFRxYKo4MFUCzS+6Wm9vu1hvJwCeAHgC4AmA'
+        'JwCeAHgC4AmAJwCeAHgC4AmAJwCeAHgC4AmAJwCeAHgC4AmAJwCeAHgC4AmAJwCeAHgC4AmAJwCe'
+        'AHgC4AmAJwCeAHgC4AmAJwCeAHgC4AmAJ+SdkHdC3gl5J+SdkHdC3gl5J+SdkHdC3gl5J+SdkHdC'
+        '3gl5J+SdIHeC3In1dkLeCXkn5J2Qd0LeCXkn5J2Qd0LeCXkn5J2wfRKAePEjb5l/W/CTMi/5wg8x'
+        '3P6G6k+pfbD6f76x+s89Cs8y3P76i8cgv/6+yI99OH37m6r/9kT1Tz4mn3B46VWKPnWRonMpOpei'
+        'cyk6l6JzKTqXonMpOpeicyk6l6JzKTqXonMpOpeicyk6l6JzKTqXonMpOpeicyk6l6JzKTqXonMp'
+        'Opeicyk6l6JzKTqXonMpOpeicyk6l6JzKTqXonMpOpeicyk6l6JzKTqXonMpOpeicyk6l6JzKTqX'
+        'onMpOpeicyk6l6JzKTqXonMpOpeicyk6l6JzKTqXonMpOpeicyk6l6JzKTqXonMpOpeicyk6l6Jz'
+        'KTqXovMgRS97ZIruBClqDYzsVo18XfABw8HtmqcGa7067tx6+eWVyL8PrkxecfHUzMoT79MvPNG/'
+        '6juqN3N//vZPPbH6T7TVfCX/sPAnbw9Uf9byUf6uiDu3XnmVxa+/yGLdU4MsBqPW+E3jKcZTjTrj'
+        'aUa98XSjwXiG8UzjWUaj8WyjyXiO0Ww813ie8XyjxXiBETJeaISNFxkvNl5ivNR4mdFqvNx4hdFm'
+        'vNJoNzqMVxmdxquNLuM1xmuN1xkR4/XGG4w3Gm8yuo03G1HjLUaP8Vaj13ibccN4u/EO453Gu4x3'
+        'G+8xbhrvNd5nxIz3Gw8bfcG4c6v96o73OQ/1PNTzUM9DPQ/1PNTzUM9DPQ/1PNTzUM9DPQ/1PNTz'
+        'UM9DPQ/1PNTzUM9DPQ/1PNTzUM9DPQ/1PNTzUM9DPQ/1PNTzUM9DPQ/1PNTzUM9DPQ/1PNTzUM9D'
+        'PQ/1PNTzUM9DPQ/1PNTzUM9DPQ/1PNTzUM9DPQ/1PNTzUM9DPQ/1PNTzUM9DPQ/1PNTzUM9DPQ/1'
+        'PNTzUM9DPQ/1PNTzUM9DPQ/1gYeO6x+D+qr9+YUHvxPxn1QfML3+YYbr3634qPzgwqseeZr7VHCa'
+        '67z8WYZicFp79Zd6Fru9eHG0+1vVo92X6WB2O+NZ7Iefcf+/wx93lRT82pTm+3/jn+qY1nX5Av79'
+        '4AV9zdWx7U0Xx7YWNd2iplvUdIuablHTLWq6RU23qOkWNd2iplvUdIuablHTLWq6RU23qOkWNd2i'
+        'plvUdIuablHTLWq6RU23qOkWNd2iplvUdIuablHTLWq6RU23qOkWNd2iplvUdIuablHTLWq6RU23'
+        'qOkWNd2iplvUdIuablHTLWq6RU23qOkWNd2iplvUdIuablHTLWq6RU23qOkWNd2iplvUdIuablHT'
+        'LWq6RU23qOkWNd2iplvUdIuablHTLWq6RU23qOmWoKZfW/O4+Y1t//FP9BvbXneVlH97kZSwpIQl'
+        'JSwpYUkJS0pYUsKSEpaUsKSEJSUsKWFJCUtKWFLCkhKWlLCkhCUlLClhSQlLSlhSwpISlpSwpIQl'
+        'JSwpYUkJS0pYUsKSEpaUsKSEJSUsKWFJCUtKWFLCkhKWlLCkhCUlLClhSQlLSlhSwpISlpSwpIQl'
+        'JSwpYUkJS0pYUsKSEpaUsKSEJSUsKWFJCUtKWFLCkhKWlLCkhCUlLClhSQlLSlhSwpISlpRwkJTI'
+        '1ScSP3HxicSLnxp8IhGMTxm/YRSNTxs7xmeMkvFZ4yHjScaTjVrjN42nGE816oynGfXG040G4xnG'
+        'M41nGY3Gs40m4zlGs/Fc43nG840W4wVGyHihETZeZLzYeInxUuNlRqvxcuMVRpvxSqPd6DBeZXQa'
+        'u8arjS7jNcZrjdcZEeP1xhuMNxpvMrqNNxtR4y1Gj/FWo9foM95m3DDeYbzTeJfxbuM9xk3jvcb7'
+        'jJjxfuNh47eMPeO3jbLxOeN3jH3jwPhd4/PG7xm/b/yBcWgcGcfBuHPr9Y98tns8OBu8oebyS1Pf'
+        'dfGlqa1e+1b/P7YG/+QbLx96fPgHHzzz+AsWZBvCbQi3IdyGcBvCbQi3IdyGcBvCbQi3IdyGcBvC'
+        'bQi3IdyGcBvCbQi3IdyGcBvCbQi3IdyGcBvCbQi3IdyGcBvCbQi3IdyGcBvCbQi3IdyGcBvCbQi3'
+        'IdyGcBu7bey2sdvGbhu7bey2sdvGbhu7bey2sdvGbhu7bey2sdvGbhu7bdC2QdtmQbax28ZuG7tt'
+        '7Lax28ZuG7tt7Lax28ZuG7tt0tEWwHjT5Vnz/YGn7gdHi9vPufi6t7nqT/o8KueM2/XVf2Vw1Lj9'
+        '9Op/fBROG7cbql8B+Izqv+0PO7w/s/pXn1X9q1/iBxy3G6v/hmdX/w3BeeR9T/hiv5bxzZfPWzUH'
+        'l0HRP7dDW3AV8vfv//f8CvgC4zu33nJ1ZnvJxZktYiVFrKSIXRSxiyJ2UcQuithFEbsoYhdF7KKI'
+        'XRSxiyJ2UcQuithFEbsoYhdF7KKIXRSxiyJ2UcQuithFEbsoYhdF7KKIXRSxiyJ2UcQuithFEbso'
+        'YhdF7KKIXRSxiyJ2UcQuithFEbsoYhdF7KKIXRSxiyJ2UcQuithFEbsoYhdF7KKIXRSxiyJ2UcQu'
+        'ithFEbsoYhdF7KKIXRSxiyJ2UcQuithFEbsoYhdF7KKIXRSxiyJ2UcQuithFkWAX9Vx+6cFPBbvo'
+        'rZe76WeDBPU+8l7DePCn3lbz4LtPfyn4UacbAaZqOLLVP9kX/Pz02y//vT8b/Hvfcfnv/fXgX/LO'
+        'B0l9+MPVP3zXxadR9//6ZvXqI/hRy5dXy/XOrXdffhL1ouCZuPdcnS+7Ln40JuZ8GXO+jDlfxpwv'
+        'Y86XMefLmPNlzPky5nwZc76MOV/GJCEmCTHlHBOImEDEBCImEDGBiAlETCBiAhETiJhAxAQiJhAx'
+        'gYgJREwgYgIRE4iYQMQEIiYQMYGICURMIGICEROImEDEBCImEDGBiAlETCBiAhETiJhAxAQiJhAx'
+        'gYg548TkIiYXMbmIyUVMLmJyEZOLmFzE5CImFzG5iMlFTC5ichGTi5hcxOQiRm1MPGLiEZOLmFzE'
+        '5CImFzG5iMlFTC5ichGTi5hcxOQi5nwZc76MOV/GnC9jzpcx58uY82XMaS/mfBlzvow5X8acL2PO'
+        'lzHny5jzZcz5MhYE8OYjA/a1QTbee5mdbw2y876rcCxUbySfXtyi+2tB0mJXnyflrfJBgAcBHgR4'
+        'EOBBgAcBHgR4EOBBgAcBHgR4EOBBgAcBHgR4EOBBgAcBHgR4EOBBgAcBHgR4EOBBgAcBHgR4EOBB'
+        'gAcBHgR4EOBBgAcBHgR4EOBBgAcBHgR4EOBBcgfJHSR3kNxBcgfJHSR3kNxBcgfJHSR3kNxBcgfJ'
+        'HSR3kNxBcgeRHUR20EYfJHeQ3EFyB8kdJHeQ3EFyB8kdJHeQ3EFyB2VjMAD1/ourk/tAYg9+1urW'
+        'X79o+SE0htAYQmMIjSE0htAYQmMIjSE0htAYQmMIjSE0htAYQmMIjSE0htAYQmMIjSE0htAYQmMI'
+        'jSE0htAYQmMIjSE0htAYQmMIjSE0htAYQmMIjSE0htAYQmMIjSE0htAYQmMIjSE0htAYQmMIjSE0'
+        'htAYQmMIjSE0htAYQmMIjSE0htAYQmMIjSE0htAYQmMIjSE0htAYQmMIjSE0htAYQmMIjaGAxsOX'
+        'TdoVLJq+L/l4HJzL3/iEL99HBH+25+NbV+fjN14kZ1hyhiVnWHKGJWdYcoYlZ1hyhiVnWHKGJWdY'
+        'coYlZ1hyhiVnWHKGJWdYcoYlZ1hyhiVnWHKGJWdYcoYlZ1hyhiVnWHKGJWdYcoYlZ1hyhiVnWHKG'
+        'JWdYcoYlZ1hyhiVnWHKGJWdYcoYlZ1hyhiVnWHKGJWdYcoYlZ1hyhiVnWHKGJWdYcoYlZ1hyhiVn'
+        'WHKGJWdYcoYlZ1hyhiVnWHKGJWdYcoYlZ1hyhiVnWHKGJWdYcoYlZzhITv+f+93/4ILyY/fpPaaD'
+        '8hcvL7jzwVFl4PKY/y3BH3/NxVNjezX3r+h3L75h6S8H55bBx88HKj/2J/pA5X+5ejIvfvFk3rc4'
+        'fn5LYPFra65/18T/73dNXP6mhFdVS+n6F088Vh8Ouf5dE1+G3zUxdP2I2fVX5H5pi+PyEbZvqF5L'
+        'Xj9i9jh5xOwDX9nP8lfBfk/10PWoH3j/Us31b8L0cgQv8k9Ut0LwwsSDF+ajt2NPqq67J1kaHwxO'
+        '+l/nQHv73cEptnqufZk7+3/5z/XFDP4Lp2r8CNdj+7Jq+PJGzZOCGzVff/WRx3ddPFKT8pFHykce'
+        'KR95pHzkkfKRR8pHHikfeaR85JHykUfKRx4pH3mk3NxIubmRcnMj5eZGys2NlJsbKTc3Um5upNzc'
+        'SLm5kXJzI+XmRsrNjZSbGyk3N1JubqTc3Ei5uZFycyPl5kbKzY2UmxspNzdSbm6k3NxIubmRcnMj'
+        '5eZGys2NlJsbKTc3Um5upNzcSLm5kXJzI+XmRsrNjZSbGyk3N1JubqR85JFyjyPlHkfKPY6Uexwp'
+        '9zhS7nGk3ONIuceRco8j5R5Hyj2OlHscKfc4Uu5xpNzjSLnHkXKPI+UORMqtjpRbHSn3OFLucaTc'
+        '40i5x5FyjyPlHkfKPY6Uexwp9zhS7nGk3ONI+cgj5SOPlI88Uj7ySLnmTPnII+Ujj5SPPFI+8kj5'
+        'yCPlI4+UjzxSPvJI+cgj5SOPlI88UsEF7F+5urv2kYu7a+MAjgM4DuA4gOMAjgM4DuA4gOMAjgM4'
+        'DuA4gOMAjgM4DuA4gOMAjgM4DuA4gOMAjgM4DuA4gOMAjgM4DuA4gOMAjgM4DuA4gOMAjgM4DuA4'
+        'gOMAjgM4DuA4gOPkjZM3Tt44eePkjZM3Tt44eePkjZM3Tt44eePkjZM3Tt44eePkjSM3jty4u2vj'
+        '5I2TN07eOHnj5I2TN07eOHnj5I2TN07eONvjAYhvuL6jcf3bM69vYjxaFyIPboU98wkf/8RX6R2N'
+        'Dz7ujuHB5wE/eb8sv+DB8RuvqjX6kGpNq9a0ak2r1rRqTavWtGpNq9a0ak2r1rRqTavWtGpNq9a0'
+        'ak2r1rRqTavWtGpNq9a0ak2r1rRqTavWtGpNq9a0ak2r1rRqTavWtGpNq9a0ak2r1rRqTavWtGpN'
+        'q9a0ak2r1rRqTavWtGpNq9a0ak2r1rRqTavWtGpNq9a0ak2r1rRqTavWtGpNq9a0ak2r1rTiS2vY'
+        'tIZNa9i0hk1r2LSGTWvYtIZNa9i0hk1r2LSGTWvYtIZNB9X6oQDEK6og+gMQr739PcFf+KtXj438'
+        'HCiToEyCMgnKJCiToEyCMgnKJCiToEyCMgnKJCiToEyCMgnKJCiToEyCMgnKJCiToEyCMgnKJCiT'
+        'oEyCMgnKJCiToEyCMgnKJCiToEyCMgnKJCiToEyCMgnKJCiToEyCMgnKJCiToEyCMgnKJCiToEyC'
+        'MgnKJCiToEyCMgnKJCiToEwSMknIJCGThEwSMknIJCGThEwSMknIJCGThEwSMknIJIqTgYdv+tM9'
+        'C/Dtf+SzAI+VJ5AvH67+hif8yW4MPeJx5IPqP/+SJ36xjyMnrrbxxsWFzrSQTQvZtJBNC9m0kE0L'
+        '2bSQTQvZtJBNC9m0kE0L2bSQTQvZtJBNC9m0kE0L2bSQTQvZtJBNC9m0kE0L2bSQTQvZtJBNC9m0'
+        'kE0L2bSQTQvZtJBNC9m0kE0L2bSQTQvZtJBNC9m0kE0L2bSQTQvZtJBNC9m0kE0L2bSQTQvZtJBN'
+        'C9m0kE0L2bSQTQvZtJBNC9m0kE0L2bSQTQvZtJBNC9m0kE0L2bSQTQvZtJBNC9m0kE0L2XQQsm++'
+        'AvHCCxAZIDJAZEjIkJAhIUNChoQMCRkSMiRkSMiQkCEhQ0KGhAwJGRIyJGRIyJCQISFDQoaEDAkZ'
+        'EjIkZEjIkJAhIUNChoQMCRkSMiRkSMiQkCEhQ0KGhAwJGRIyJGRIyJCQISFDQoaEDAkZEjIkZEjI'
+        'kJAhIUNChoQMCRkSMiRkSMiQkCEhQ0KGhAwJGRIyJGRIyJCQISFDQoaETCBh5Oob0SdqHvx00L9A'
+        'YgaJGSRm7IgZMmbImCFjhowZMmbImCFjhowZMmbImCFjhowZMmbImCFjhowZMmbImCFjhowZMmbI'
+        'mCFjhowZMmbImCFjhowZMmbImCFjhowZMmbImCFjhowZMmbImCFjhowZMmbImCFjhowZMmbImCFj'
+        'howZMmbImCFjhowZMmbImCFjhowZMmbImCFjhowZMmbImCFjhowZMmbImCFjhowZMmYCGd9y+QjN'
+        'Z4N7vx++/vD2+sPb668E+Yr4NckveSz8muS/dnXI+NWLQ8acRpnTKHMaZU6jzGmUOY0yp1HmNMqc'
+        'RpnTKHMaZU6jzGmUOY0yp1HmNMqcRpnTKHMaZU6jzGmUOY0yp1HmNMqcRpnTKHMaZU6jzGmUOY0y'
+        'p1HmNMqcRpnTKHMaZU6jzGmUOY0yp1HmNMqcRpnTKHMaZU6jzGmUOY0yp1HmNMqcRpnTKHMaZU6j'
+        'zGmUOY0yp1HmNMqcRpnTKHMaZU6jzGmUOY0yp1HmNMqcRpnTKHMaZU6jzGmUOY0yp1HmNMpc0Ci3'
+        'Lz9NjAcPZf71AMh8Fcizg3sCT779g9W/P2/8U+MXjVmj2/hlI2d8zPioMWYsGcvGx41V4zuMG8YP'
+        'GR8wfs74JuO7jZ83WoxR48PGPzB+xPgB42uM7zdGjI8Y324kjQ8F486tj1zFZeQiLgvisiAuC+Ky'
+        'IC4L4rIgLgvisiAuC+KyIC4L4rIgLgvisiAuC+KyIC4L4rIgLgvisiAuC+Ky4GVYEJcFcVkQlwVx'
+        'WRCXBXFZEJcFcVkQlwVxWRCXBXFZEJcFcVkQlwVxWRCXBXFZEJcFcVkQlwVxWRCXBXFZEJcFcVkQ'
+        'lwVxWeBpQVwWxGVBXBbEZUFcFsRlQVwW0FkQlwVxWRCXBXFZEJcFcVkQlwVxWRCXBXFZEJcFcVkQ'
+        'l4UAxLdegei+uIe6CMQiEItALAKxCMQiEItALAKxCMQiEItALAKxCMQiEItALAKxCMQiEItALAKx'
+        'CMQiEItALAKxCMQiEItALAKxCMQiEItALAKxCMQiEItALAKxCMQiEItALAKxCMQiEItALAKxCMQi'
+        'EItALAKxCMQiEItALAKxCMQiEItALAKxCMSit2uRi0UuFrlY5GKRi0UuFrlY5GKRi0UuFrlY5GKR'
+        'i0UuFgMQyUd+BcSngkP5t/khq9v/5YnBh+TB2DUOgnHn1rdfbt2lYOv+jeAf+Z3qn5itXvGVgy9Q'
+        'rak+B/Md1w8VPfKholfWPHio6Du/wAtz/2/8gerf+EW+PLd/5MnewH9U/Ycerdfqk7eTVRd/Vi/Z'
+        'Z2//aPW/9Rf93NBHL819JPjR7DuX15IfC/549PInS58fMP6uq1X3gYvuK1h1BauuYNUVrLqCVVew'
+        '6gpWXcGqK1h1BauuYNUVrLqCVVew6gpWXcGqK1h1BauuYNUVrLqCVVew6gpWXcGqK1h1BauuYNUV'
+        'rLqCVVew6gpWXcGqK1h1BauuYNUVrLqCVVew6gpWXcGqK1h1BauuYNUVrLqCVVew6gpWXcGqK1h1'
+        'BauuYNUVrLqCVVew6gpWXcGqK1h1BTuuYMcV7LiCHVew4wp2XMGOK9hxBTuuYMcV7LiCHVew4wp2'
+        'XMEyLQSrbuwKxKcvQKwAsQLEChArQKwAsQLEChArQKwAsQLEChArQKwAsQLEChArQKwAsQLEChAr'
+        'QKwAsQLEChArQKwAsQLEChArQKwAsQLEChArQKwAsQLEChArQKwAsQLEChArQKwAsQLEChArQKwA'
+        'sQLEChArQKwAsQLEChArQKwAsQLEChArQKwAsQLEChArQKwAsQLEChArQKwAsQLEChArQKwAsQLE'
+        'ChArQKwEIFJXIOIXIFaBWAViFYhVIFaBWAViFYhVIFaBWAViFYhVIFaBWAViFYhVIFaBWAViFYhV'
+        'IFaBWAViFYhVIFaBWAViFYhVIFaBWAViFYhVIFaBWAViFYhVIFaBWAViFYhVIFaBWAViFYhVIFaB'
+        'WAViFYhVIFaBWAViFYhVIFaBWAViFYhVIFaBWAViFYhVIFaBWAViFYhVIFaBWAViFYhVIFaBWAVi'
+        'FYhVIFYDEH/z6sfLf7b6QVpwC/vTT6geY8Yfm3cqH9ycedbHP3F91/L6ruX1XcvHzE+ZfPfVjahn'
+        'XNyIuutG1F03ou66EXXXjai7VuNdN6LuuhF1142ou25E3XUj6q4bUXfdiLrrRtRdN6LuuhF11768'
+        '60bUXTei7roRddeNqLtuRN11I+qujrnrRtRdN6LuuhF1142ou25E3XUj6q4bUXfdiLrrRtRdN6Lu'
+        'uhF1142ou8Fm/V+DV6MY/K6/4NX4r7fXbPM1D+uveVh/Tf+u6d81/bumf9f075r+XdO/a/p3Tf+u'
+        '6d81/bumf9f075r+XdO/a/p3Tf+u6d81/bumf9f075rXZk3/runfNf27pn/X9O+a/l3Tv2v6d03/'
+        'runfNf27pn/X9O+a/l3Tv2v6d03/runfNQ/rr6nhNTW8pobX1PCaGl5Tw2tqeE0Nr6nhNTW8xtqa'
+        'Gl5Tw2tqeE0Nr6nhNTW8piTXtPEaXWtqeE0Nr6nhNTW8pobX1PCaGl5Tw2tqeE0Nr6nhNQ/rr5G+'
+        '5sc51jy6v+bR/TWP7q95dH/Nj3qseYJ/zRP8a57gX/NDIWse5F/zIP+aHyZZ8zz/muf51/wwyZof'
+        'JlnzdP+anzdZ85D/mof81zzkvxZonrj8ZoBYcKn5twLd1Qv19eqfHAl+MuhjV/dE/tLlPZG/HNwT'
+        'SV88uHb/T3z3Q8Fza9/7oCyC69ngn//b1Tszv3Dxp74xuMT9nqsD6+7FgXVLYLYEZktgtgRmS2C2'
+        'BGZLYLYEZktgtgRmS2C2BGZLYLYEZktgtgRmS2C2BGZLYLYEZktgtgRmS2C2BGZLYLYEZktgtgRm'
+        'S2C2BGZLYLYEZktgtgRmS2C2BGZLYLYEZktgtgRmS1K2JGVLUrYkZUtStiRlS1K2JGVLUrYkZUtS'
+        'tiRlS1K2JGVLUrYkZUtStkRkS0S2rLgtSdmSlC1J2ZKULUnZkpQtSdmSlC1J2ZKULUnZksWtAOLf'
+        'uYT4geA+3OQVkL0LINuAbAOyDcg2INuAbAOyDcg2INuAbAOyDcg2INuAbAOyDcg2INuAbAOyDcg2'
+        'INuAbAOyDcg2INuAbAOyDcg2INuAbAOyDcg2INuAbAOyDcg2INuAbAOyDcg2INuAbAOyDcg2INuA'
+        'bAOyDcg2INuAbAOyDcg2INuAbAOyDcg2INuAbAOyDcg2INuAbAOyDcg2INuAbAOyDcg2INuAbAOy'
+        'Dcg2INsBkI8Hly3xiy8n+YXqQ/MfuPiD1eC6ZupP92jkP3zoq/Vrkr734i74kx4Kmjf6xKCZgvEp'
+        '4zeMTxs7xmeMkvFZ4zgYd2593+PiZ4GuLxevLxf/DC8Xg3swC4+RC8fgEPfw8++v1Uf/CvLvXn7g'
+        '8WvB6W/6suz/anDq/HuP/OiuK+j/TLDuv/PiOzQT1eU8fPtOsHv+/sU+e0v1J/V+uvp//uVDweXa'
+        'f6oJFtyv1AQLLhifMn7D+LSxY3zGKBmfNY6DcefW9//p2uRv1Hy1tsnMxdcEvKP6DQIPvuP0Z6rv'
+        'z3H1P/1ucOKf/TP5qDR4ZUPV5/q/Yl+9/+3qWHt8cazdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zd'
+        'd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zd'
+        'd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zd'
+        'd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zdd6zd'
+        'd6zdd6zdd6zdd6zdd6zdd6zdd6zdD461PxDsueruu/3Sp/7x++xzX9pau3PrE9fPJ18f3a6Pbl/K'
+        '0e3Bd2u9uHrN+fi57f8PHjyV8nB39UA2d/WjMB968IXVD/+ECjtSYUcq7EiFHamwIxV2pMKOVNiR'
+        'CjtSYUcq7EiFHamwIxV2pMKOVNiRCjtSYUcq7EiFHamwIxV2pMKOVNiRCjtSYUcq7EiFHamwIxV2'
+        'pMKOVNiRCjtSYUcq7EiFHamwIxV2pMKOVNiRCjtSYUcq7EiFHamwIxV2pMKOVNiRCjtSYUcq7EiF'
+        'HamwIxV2pMKOVNiRCjtSYUcq7EiFHamwIxV2pMKOVNiRCjtSYUcq7EiFHamwIxV2pMKOVNiRCjsK'
+        'Kmz+q/a5uODAOVzV/iUd9v7h1QdnDRcfnN3zwdk9H5zd88HZPR+c3fM+3/PB2T0fnN3zwdk9Hyfc'
+        '88HZPR+c3fPB2T0fnN3zwdk9H5zd8+bf88HZPR+c3fPB2T0fnN3zwdk9H5zdE5h7Pji754Ozez44'
+        'u+eDs3s+OLvng7N7Pji754Ozez44u+eDs3s+OLvng7N7AZP//ZG/QuE0uMj7waufbl+1SU5tklOb'
+        '5NQmObVJTm2SU5vk1CY5tUlObZJTm+TUJjm1SU5tklOb5NQmObVJTm2SU5vk1CY5tUlObZJTL8yp'
+        'TXJqk5zaJKc2yalNcmqTnNokpzbJqU1yapOc2iSnNsmpTXJqk5zaJKc2yalNcmqTnNokpzbJqU1y'
+        'apOc2iSnNsmpTXJqk5zaJKc2ySlhpzbJqU1yapOc2iSnNsmpTXJqk5zCdGqTnNokpzbJqU1yapOc'
+        '2iSnNsmpTXJqk5zaJKc2yalNcmqTnAZEslcefp6HMx7OeDjj4YyHMx7OeDjj4YyHMx7OeDjj4YyH'
+        'Mx7OeDjj4YyHMx7OeDjj4YyHMx7OeDjj4YyHMx7OeDjj4YyHMx7OeDjj4YyHMx7OeDjj4YyHMx7O'
+        'eDjj4YyHMx7OeDjj4YyHMx7OeDjj4YyHMx7OeDjj4YyHMx7OeDjj4YyHMx7OeDjj4YyHMx7OeDjj'
+        '4YyHMx7OeDjj4YyHMx7OeDjj4YyHs8DDwpWHH+PhL9QFHoJRazzFeKpRZzzNqDeebjQYzzCeaTzL'
+        'aDSebTQZzzGajecazzOeb7QYLzBCxguNsPEi48XGS4yXGi8zWo2XG68w2oxXGu1Gh/Eqo9N4tdFl'
+        'vMZ4rfE6I2K83niD8UbjTUa38WYjarzF6DHeavQabzNuGG833mG803iX8W7jPcZN473G+4yY8X7j'
+        'YaMvGHdu/dDVbZO3X9w2eYiEh0gIxm8aTzGeatQZTzPqjacbDcYzjGcazzIajWcbTcZzjGbjucbz'
+        'jOcbLcYLjJDxQiNsvMh4sfES46XGy4xW4+XGK4w245VGu9FhvMroNF5tdBmvMV5rvM6IGK833mC8'
+        '0XiT0W282YgabzF6jLcavcbbjBvG2413GO803mW823iPcdN4r/E+I2a833jY6AvGnVuLV79s6W7N'
+        '/cuyV1x8lenXXf5aslZfXvrDj8rhNDgIfuzR/JGEL/udyH9UvbwLXqlXVl+p77z1I9cf6V3fF7q+'
+        'L/RV9JHeH3VTyEd9T7m/Nr/0u0P/+KqRixeN3KCRGzRyg0Zu0MgNGrlBIzdo5AaN3KCRGzRyg0Zu'
+        '0MgNGrlBIzdo5AaN3KCRGzRyg0Zu0MgNGrlBIzdo5AaN3KCRGzRyg0Zu0MgNGrlBIzdo5AaN3KCR'
+        'GzRyg0Zu0MgNGrlBIzdo5AaN3KCRGzRyg0Zu0MgNGrlBIzdo5AaN3KCRGzRyg0Zu0MgNGrlBIzdo'
+        '5AaN3KCRGzRyg0Zu0MgNGrlBIzdo5AaN3KCRGzRyg0Zu0MgNGrlBIzdo5AaN3BA0cu6Rl/ffG1ze'
+        '/5Or38D93ovfwN1YF3ykEYyDYNy5tXR1m+SZF7dJmuqC2yTB+KfGLxqzRrfxy0bO+JjxUWPMWDKW'
+        'jY8bq8Z3GDeMHzI+YPyc8U3Gdxs/b7QYo8aHjX9g/IjxA8bXGN9vjBgfMb7dSBofCsadWz96Faz3'
+        'XgSrWbCaBatZsJoFq1mwmgWrWbCaBatZsJoFq1mwmgWrWbCaBatZsJoFq1mwmgWrWbCaBatZsJq9'
+        'DM2C1SxYzYLVLFjNgtUsWM2C1SxYzYLVLFjNgtUsWM2C1SxYzYLVLFjNgtUsWM2C1SxYzYLVLFjN'
+        'gtUsWM2C1SxYzYLVLFjNPDULVrNgNQtWs2A1C1azYDULVjM6zYLVLFjNgtUsWM2C1SxYzYLVLFjN'
+        'gtUsWM2C1SxYzYLVHID45OVPg+4Fqfo/rlL1zotUtUhVi1S1BP/Yj105GrpwFOIoxFGIoxBHIY5C'
+        'HIU4CnEU4ijEUYijEEchjkIchTgKcRTiKMRRiKMQRyGOQhyFOApxFOIoxFGIoxBHIY5CHIU4CnEU'
+        '4ijEUYijEEchjkIchTgKcRTiKMRRiKMQRyGOQhyFOApxFOIoxFGIoxBHIY5CHIU4CnEU4ijEUYij'
+        'EEchjkIchTgKcRTiKMRRiKMQRyGOQhyFOApxFApA/J9XIJ58ASIMRBiIMAlhEsIkhEkIkxAmIUxC'
+        'mIQwCWESwiSESQiTECYhTEKYhDAJYRLCJIRJCJMQJiFMQpiEMAlhEsIkhEkIkxAmIUxCmIQwCWES'
+        'wiSESQiTECYhTEKYhDAJYRLCJIRJCJMQJiFMQpiEMAlhEsIkhEkIkxAmIUxCmIQwCWESwiSESQiT'
+        'ECYhTEKYhDAJYRLCJIRJCJMQDiT808tLv3aXfv/sz/QTnODi+cern6J8xV0k//PghQm+TzRV/R8Q'
+        '3HBYDB5x+vEv5nI5OGi/9/4/+Pi4br7+MvzH3jWyX2jwnIeuf7ffl/Ob8Jevyvc/XJRvu/JtV77t'
+        'TmPtOrhdB7fr4HYd3K6D23Vwuw5u18HtOrhdB7fr4HYd3K6D23Vwuw5u18HtOrhdB7fr4HYd3K6D'
+        '23Vwuw5u18HtOrhdB7fr4HYd3K6D23Vwuw5u18HtOrhdB7fr4HYd3K6D23Vwuw5u18HtOrhdB7fr'
+        '4HYd3K6D23Vwuw5u18HtOrhdB7fr4HYd3K6D23Vwuw5u18HtOrhdB7fr4HYd3K6D23Vwuw5u18Ht'
+        'OrhdB7fr4HYd3K6D24MO/gkdfL9O3h08Ap0PgHRUgcSCU/2rbr/a6/Fqr8ervR7BeJJRa7zOeLLx'
+        'WuM1RsR4yHi98RTjqcYbjDrjjcbTjDcZ3cabjXojajzdaDDeYjzD6DHeavQabzOeadww3m48y2g0'
+        '3mE822gy3mk8x3i38S6j2Xiu8XLjPcbzjDbj+UaL8QIjZLzQuGm81wgbLzLeZ7zYeInxUuP9xsuM'
+        'mNFqPGy8wnil0W70BePOrX9x+XD8Xwqu9wpXD179j8vvIP5XdkjEGx+hIWKHRLzHEe9xxJsb8a5G'
+        'vIER71zEOxfxlkW8LRFvRMQbEfEORLwDES99xIsd8WJHvLwRr2vE6xrxuka8rhGva8QrGfFKRryE'
+        'ES9hxEsY8dpFvGgR72PEixbxBka8dhGvXcQOidghEZmJyExEZiICERGPiMxExCMiFxFJiIhAhP0I'
+        '+xH2I9BHMI/wHeE7wneE7wjYEbAjKEfgjeAagTcCaIS3CG8RwiL4RJiK4BMhJRJI+cmL3zd3/4w5'
+        'd59DsfofRqo/kV79Dz9aPaSuPG6+suyTt//KU6p37b6YU/1PXd1wbLy44Rh1wzHqhmPUDceoG45R'
+        'DKJuOEbdcIy64Rh1wzHqhmPUDceoG45RNxyjbjhG3XCMshF1wzHqhmPUDceoG45RNxyjbjhG5Snq'
+        'hmPUDceoG45RNxyjbjhG3XCMuuEYdcMx6oZj1A3HqBuOUTcco4Gi1cv7Sy8Mmuinrx66+Pe2TK8t'
+        '02vL9NoyvbZMry3Ta8v02jK9tkyvLdNry/TaMr22TK8t02vL9NoyvbZMry3Ta8v02jK9tkyvLdPr'
+        'Vem1ZXptmV5bpteW6bVlem2ZXlum15bptWV6bZleW6bXlum1ZXptmV5bpteW6bVlem2ZXlum15bp'
+        'tWV6bZleW6bXlum1ZXptmV5bpteW6cWr15bptWV6bZleW6bXlum1ZXptmV6Sem2ZXlum15bptWV6'
+        'bZleW6bXlum1ZXptmV5bpteW6bVlem2Z3sDHv7xKy7Mu0nJDWm5Iyw1puSEtN/zPuSEtN6TlhrTc'
+        'kJYb0nJDWm5Iyw1puSEtN6Tlhv+NN6TlhrTckJYb0nJDWm5Iyw0ubkjLDWm5IS03pOWGtNyQlhvS'
+        'ckNabkjLDWm5IS03pOVG8Gr8q+DVCG6efCB4NXZvvyP4Cz9zuYxvVaq3CoKvS/jvwa2Cf311+P+l'
+        'i8P/TZG6KVI3ReqmSN0UqZsidVOkborUTZG6KVI3ReqmSN0UqZsidVOkborUTZG6KVI3ReqmSN0U'
+        'qZteupsidVOkborUzf+vvTMPbOMq136j2HGiKE3aqhvdU0rTdEn3jS64id2axHbqJF3UVrZiK4lU'
+        'Wxay3KhlXwwtyoXLtblc4ONyEUZsYhdi34XY96UIKKIVpbS0CLUqiwHxSfM7sWSdGcWaGTlJG/7g'
+        'acfu8XvO/J73vOfMhqU6sVQnlurEUp1YqhNLdWKpTizViaU6sVQnlurEUp1YqhNLdWKpTizViaU6'
+        'sVQnlurEUp1YqhNLdWKpTizViaU6YbATS3ViqU4s1YmlOrFUJ5bqxFKd4NaJpTqxVCeW6sRSnViq'
+        'E0t1YqlOLNWJpTqxVCeW6sRSnViqU2HlC9XXypxK1v3ibNV3kfLvX3rGz9zKp9LuLbmhoR25Lx/8'
+        'n7z+qqUZn7z+SuXjw6dY+PjwZqvy8WFFHkB+g/wcySC/RR5EHkKyiAVpRZYgbcjvkKXIMsSKLEds'
+        'yArkcGQlsgo5AjkSOQqxI0cjxyDHIschxyPPQU5ATkROQk5GTkFORU5DViOnI89FzkCeh5yJrEHO'
+        'QtYiZyPnIA8j5yLnIeuQ85ELkAuRi5CLkUuQS5HLkMuRK5ArkecjVyFXI5uQa5BrkXbkOmQ9sgHp'
+        'QDqR65EbkC7khchG5PfII8gfkEeRx5A/Io8jTyB/QnLIn5E88iTyFFJAnlZkvPur1RmyV1kHf202'
+        'Q35JeYg8aW4mmM8H0GY/TrZFx/fJ9XwNTecH0GoTxnu99vJh1bzx9dlhVJLTz8o9e7a/31oZmFQl'
+        'oa4TCdVBQnWQUB0kVAcJ1UFCdZBQHSRUBwnVQUJ1kFAdJFQHCdVBQnWQUB0kVAcJ1UFCdZBQHSRU'
+        'BwnVQUJ1kFAdJFQHCdVBQnWQUB0kVAcJ1UFCdZBQHSRUBwnVQUJ1kFAdJFQHCdVBQnWQUB0kVAcJ'
+        '1UFCdZBQHSRUBwnVQUJ1kFAdJFQHCdVBQnWQUB0kVAcJ1UFCdZBQHSRUBwnVQUJ1kFAdJFQHCdVB'
+        'QnWQUB0kVAcJ1UFCdZBQHSRUBwnVQUJ1kFAdJFQHCdVBQnWQUB0kVAcJ1UFCdZBQHSRUBwnVQUJ1'
+        'kFAdJFQHCdVBQnWQUB0kVAcJ1UFCdZBQHSRUBwnVQUJ1kFAdJFQHCdVBQnWQUB0kVIeSUL8x+47x'
+        'tJJNv1lZk+wSaxInQDoB0gmQToB0AqQTIJ0A6QRIJ0A6AdIJkE6AdAKkEyCdAOkESCdAOgHSCZBO'
+        'gHQCpBMgnQDpBEgnQDoB0gmQToB0AqQTIJ0A6QRIJ0A6AdIJkE6AdAKkEyCdAOkESCckOiHRCYlO'
+        'SHRCohMSnZDohEQnJDoh0QmJTkh0QqITEp2Q6IREJyQ6QdAJgk7WJE5IdEKiExKdkOiERCckOiHR'
+        'CYlOSHRCohMSnbDuVAD5VmXb5yPwMAAPA/AwAA8D8DAADwPwMAAPA/AwAA8D8DAADwPwMAAPA/Aw'
+        'AA8D8DAADwPwMAAPA/AwAA8D8DAADwPwMAAPA/AwAA8D8DAADwPwMAAPA/AwAA8D8DAADwPwMAAP'
+        'A/AwAA8D8DAADwPwMAAPA/AwAA8D8DAADwPwMAAPA/AwAA8D8DAADwPwMAAPA/AwAA8D8DAADwPw'
+        'MAAPA/AwAA8D8DAADwPwMAAPA/AwAA8D8DAADwPwMKDw8G2Fhz95X8zrwi6yKKnlJS1Kvnlpi5LD'
+        'XlYS78vL//eKFiVVvbJFyUqvKotyh9q/ldzypHc7GW270vR3lKafLv/8ErGHMqT84LuVW9uK4j/c'
+        'wX+4Q/n592ZLQJ+ySP7+s+KRBeUCfrxN7SaMuXdfiFsyDt2E0eSbMD7JKmDj2187pf+hhUO3YeyH'
+        '2zB+8IzcVVN20paX0qXutc4PK9XghaIa9DH7+5j9fcz+PmZ/H7O/j9nfx+zvY/b3Mfv7mP19zP4+'
+        'Zn8fs7+P2d/H7O9j9vcx+/uY/X3M/j5mfx+zv4/Z38fs72P29zH7+5j9fcz+PmZ/H7O/j9nfx+zv'
+        'Y/b3Mfv7mP19zP4+Zn8fs7+P2d/H7O9j9vcx+/uY/X3M/j5mfx+zv4/Z38fs72P29zH7+5j9fcz+'
+        'PmZ/H7O/j9nfx+zvY/b3Mfv7mP19zP4+Zn8fs7+P2d/H7O9j9vcx+/uY/X3M/j5mfx+zv4/Z38fs'
+        '72P29ykz7Y8qi9/4Iha/fha/fha/fha/fha/fha/fha/fha/fha/fha/fha/fha/fujyQ5cfuvzQ'
+        '5YcuP3T5ocsPXX7o8kOXH7r80OWHLj90+aHLD11+6PJDlx+6/NDlhy4/dPmhyw9dfujyQ5cfuvzQ'
+        '5YcuP3T5ocsPXX7o8kOXH7r80OWHLj90+aHLD11+Fr9+IPMDmR/I/EDmBzI/kPmBzA9kfiDzA5kf'
+        'yPxA5gcyP5D5gcwPZH4g84OAH9b8sOYHMj+Q+YHMD2R+IPMDmR/I/EDmBzI/kPmBzM/i18/i18/i'
+        '18/i18/i10/F52fx62fx62fx62fx62fx62fx62fx62fx62fx62fx61do/nG5blTeWn6TUjf+pJLu'
+        'rCLdBQEyCJBBSAxCYhASg5AYhMQgJAYhMQiJQUgMQmIQEoOQGITEICQGITEIiUFIDEJiEBKDkBiE'
+        'xCAkBiExCIlBSAxCYhASg5AYhMQgJAYhMQiJQUgMQmIQEoOQGITEIAgGQTAIgkEQDIJgEASDIBgE'
+        'wSAIBkEwCIJBEAyCYBAEgyAYBMEgCAZhLwh7QfJcEASDIBgEwSAIBkEwCIJBEAyCYBAEgyAYBMEg'
+        'kAcVMn46+2bSqxQyflbJey8XeS9E3guR90LkvRB5L0TeC5H3QuS9EHkvRN4LkfdC5L0QmIXALETe'
+        'C0FbCNpC0BaCthC0haAtBG0haAtBWwjaQtAWgrYQtIWgLQRtIWgLQVsI2kLQFoK2ELSFoC0EbSFo'
+        'C0FbCNpC0BaCthC0haAtBG0haAtBWwjaQtAWgrYQtIXIeyGgCwFdCOhCQBcCuhDQhYAuBHQhoAsB'
+        'XQjoQkAXAroQ0IWALgR0IaALgUQI9kKwFwK6ENCFgC4EdCGgCwFdCOhCQBcCuhDQhYAuRN4LkfdC'
+        '5L0QeS9E3guR90LkvRB5L0TeC5H3QuS9EHkvRN4LkfdC5L0QeS+k0P3z6qsojyv7fvebWgErlWes'
+        'ZJODfrf/F8r7MR8Wb5T/aPkqyLXeR5RXZ6Yrd3a0Ltp7Z0ev8s75X5Z/9OZXDh6m/I+diw7xUN6r'
+        'QfrVnMhXKyfkV5WJxyMmngkywgQZYYKMMEFGmCAjTJARJsgIE2SECTLCBBlhgowwQUaYICNMkBEm'
+        'yAgTZIQJMsIEGWGCjDBBRpggI0yQESbICBNkhAkywgQZYYKMMEFGmCAjTJARJsgIE2SECTLCBBlh'
+        'gowwQUaYICNMkBEmyAgTZIQJUsEEqWCCVDBBKpggFUyQCiZIBROkgglSwQSpYIJUMEEqmCAVTJAK'
+        'JkgFE6SCCVLBBDlgghwwwfwzQSqYIBVMkAomSAUTpIIJUsEEqWCCVDBBKpggFUyQCiZINhMKEL+u'
+        'dmi34tAHnhX3bCoXG6fKd0LM26K/qczNHxJzc5i5OczcHGZuDjM3h5mbw8zNYebmMHNzmLk5zNwc'
+        'Zm4O48QwTgzjxDBODOPEME4M48QwTgzjxDBODOPEME4M48QwTgzjxDBODOPEME4M48QwTgzjxDBO'
+        'DOPEME4M48QwTgzjxDBODOPEME4M48QwTgzjxDBODOPEME4M48QwTgzjxDBODJPIwhgyjCHDGDKM'
+        'IcMYMowhwxgyjCHDGDKMIcMYMowhwxgyjCHDGDKMIcMYMoxdwvgyjC/DGDKMIcMYMowhwxgyjCHD'
+        'GDKMIcMYMowhwxgyzNwcZm4OMzeHmZvDzM1h5uYwc3OYlB5mbg4zN4eZm8PMzWHm5jBzc5i5Oczc'
+        'HFacnxHvUX+qvJmo3E94FW8s+m3lDsObxe74G5X/4sHqXLFHyRUPVeaTnWI+mYTiSSiehOJJKJ6E'
+        '4kkonoTiSSiehOJJKJ6E4kkonoTiSSiehOJJKJ6E4kkonoTiSSiehOJJKJ6E4kkonoTiSSiehOJJ'
+        'KJ6E4kkonoTiSSiehOJJKJ6E4kkonoTiSSiehOJJKJ4E30nwnQTfSfCdBN9J8J0E30nwnQTfSfCd'
+        'BN9J8J0E30nwnQTfSfCdBN9JuJ2E20nmk0nwnQTfSfCdBN9J8J0E30nwnQTfSfCdBN9J8J3EIJMK'
+        'I9lqRr6oMPK7ytWWSwVPb1F+9+Fn/ffMlfL146UhmTPP/F4ZF2W74LOzd/L+WLmT95FDb1E/9Las'
+        'Q2/LOqAvN+19XfvXSo7d729RH1/T/YfZi9afVbaYHq2Use8TZWyEMjZCGRuhjI1QxkYoYyOUsRHK'
+        '2AhlbIQyNkIZG6GMjVAARCgAIhQAEQqACAVAhAIgQgEQoQCIUABEKAAiFAARCoAIBUCEAiBCARCh'
+        'AIhQAEQoACIUABEKgAgFQIQCIEIBEKEAiFAARCgAIhQAEQqACAVAhAIgQgEQoQCIUABEKAAiFAAR'
+        'CoAIBUCEAiBCARChAIhQxkaoAyLUARHqgAh1QIQ6IEIdEKEOiFAHRKgDItQBEeqACHVAhDogQh0Q'
+        'oQ6IUAdEqAMizNIRyoEI5UCEOiBCHRChDohQB0SoAyLUARHqgAh1QIQ6IEIdEKEOiFDGRihjI5Sx'
+        'EcrYCGVshDI2QhkboYyNUMZGKGMjlLERytgIZWyEMjZCGRuhjI0oRcRjlQr0FFGBTgPgNABOQ940'
+        '5E1D3jTkTUPeNORNQ9405E1D3jTkTUPeNORNQ9405E1D3jTkTUPeNORNQ9405E1D3jTkTUPeNORN'
+        'Q9405E1D3jTkTUPeNORNQ9405E1D3jTkTUPeNORNQ940yE2D3DTITYPcNMhNg9w0yE2D3DTITYPc'
+        'NMhNg9w0yE2D3DTITYPcNMhNw9o0rE1Tek6D3DTITYPcNMhNg9w0yE2D3DTITYPcNMhNg9w0UE8r'
+        'JPyxktfeIvJalLwWJa9FyWtR8lqUvBYlr0XJa1HyWpS8FiWvRclrUbCKglWUvBaFrih0RaErCl1R'
+        '6IpCVxS6otAVha4odEWhKwpdUeiKQlcUuqLQFYWuKHRFoSsKXVHoikJXFLqi0BWFrih0RaErCl1R'
+        '6IpCVxS6otAVha4odEWhKwpdUeiKkteiQBYFsiiQRYEsCmRRIIsCWRTIokAWBbIokEWBLApkUSCL'
+        'AlkUyKJAFgWBKKxFYS0KZFEgiwJZFMiiQBYFsiiQRYEsCmRRIIsCWZS8FiWvRclrUfJalLwWJa9F'
+        'yWtR8lqUvBYlr0XJa1HyWpS8FiWvRclrUfJaVKH58QN+caQsXtpKPlvQffInlHFRPg79B+WjfLtu'
+        'H+/+U8X6IWH9GNaPYf0Y1o9h/RjWj2H9GNaPYf0Y1o9h/RjWj2H9GNaPYf0Y1o9h/RjWj2H9GNaP'
+        'Yf0Y1o9h/RjWj2H9GNaPYf0Y1o9h/RjWj2H9GNaPYf0Y1o9h/RjWj2H9GNaPYf0Y1o9h/RjWj2H9'
+        'GNaPYf0Y1o9h/RjWj2H9GNaPYf0Y1o9h/RjWj2H9GNaPYf0Y1o9h/RjWj2H9GNaPYf0Y1o9h/RjW'
+        'j2H9GNaPYf0Y1o9h/RjWj2H9GNaPYf0Y1o9h/RjWj2H9GNaPYf0Y1o9h/RjWj2H9GNaPYf0Y1o9h'
+        '/RjWj2H9GNaPYf0Y1o9h/RjWj2H9GNaPYf0Y1o8p1s8dWuQ/Ixb5YiG4cU/5U9GHFvyH7i9t1pfS'
+        '/vzseFb7TY0+q50XVzJKtYK1Rdl4PkNJsE9WyoVpUS7EKRfilAtxyoU45UKcciFOuRCnXIhTLsQp'
+        'F+KUC3HKhTjlQpxyIU65EKdciFMuxCkX4pQLccqFOOVCnHIhTrkQp1yIUy7EKRfilAtxyoU45UKc'
+        'ciFOuRCnXIhTLsQpF+KUC3HKhTjlQpxyIU65EKdciFMuxCkX4pQLccqFOOVCnHIhTrkQp1yIUy7E'
+        'KRfilAtxyoU45UKcciFOuRCnXIhTLsQpF+KUC3HKhTjlQpxyIU65EKdciFMuxCkX4pQLccqFOOVC'
+        'nHIhTrkQp1yIUy7EKRfilAtxyoU45UKcciFOuRCnXIhTLsQpF+KUC3HKhTjlQpxyIU65EKdciFMu'
+        'xCkX4pQLccqFOOVCnHIhTrkQp1yIUy7EKRfilAtxyoW4QvNTFZpfJmhOQHMCmhPQnIDmBDQnoDkB'
+        'zQloTkBzApoT0JyA5gQ0J6A5Ac0JaE5AcwKaE9CcgOYENCegOQHNCWhOQHMCmhPQnIDmBDQnoDkB'
+        'zQloTkBzApoT0JyA5gQ0J6A5Ac0JaE5AcwKaE9CcgOYENCegOQHNCWhOQHMCmhPQnIDmBDQnoDkB'
+        'zQloTkBzApoT0JyA5gQ0J6A5Ac0JaE5AcwKaE9CcgOYENCegOQHNCWhOQHMCmhPQnIDmBDQnoDkB'
+        'zQloTkBzApoT0JyA5gQ0J6A5Ac0JaE5AcwKaE9CcgOYENCegOQHNCWhOQHMCmhPQnFBoLhz6Csyh'
+        '61rNLHN5J/K6Uk1+6HMwB33l+/TsU+XrlHdy/KX69oMHldsP/vrseQVhudOryoXuvKrjv+1jYEqN'
+        'rS3fbmrWsOzPGy80B+HvVcBsfH+Zl5lKOfV6UU4lKaeSlFNJyqkk5VSScipJOZWknEpSTiUpp5KU'
+        'U0nKqSTlVJJyKkk5laScSlJOJSmnkpRTScqpJOVUknIqSTmVpJxKUk4lKaeSlFNJyqkk5VSScipJ'
+        'OZWknEpSTiUpp5KUU0nKqSTlVJJyKkk5laScSlJOJSmnkpRTScqpJOVUknIqSTmVpJxKUk4lKaeS'
+        'lFNJyqkk5VSScipJOZWknEpSTiUpp5KUU0nKqSTlVJJyKkk5laScSlJOJSmnkpRTScqpJOVUknIq'
+        'STmVpJxKUk4lKaeSlFNJyqkk5VSScipJOZWknEpSTiUpp5KUU0nKqSTlVJJyKkk5laScSlJOJSmn'
+        'kpRTScqpJOVUknIqSTmVpJxKUk4lKaeSlFNJyqmkUk79o3J59ApxeTQFgCkATAFgCgBTAJgCwBQA'
+        'pgAwBYApAEwBYAoAUwCYAsAUAKYAMAWAKQBMAWAKAFMAmALAFACmADAFgCkATAFgCgBTAJgCwBQA'
+        'pgAwBYApAEwBYAoAUwCYAsAUAKYAMAV5KchLQV4K8lKQl4K8FOSlIC8FeSnIS0FeCvJSkJeCvBTk'
+        'pSAvBXkpkEuBXIqrpCnIS0FeCvJSkJeCvBTkpSAvBXkpyEtBXgryUrCdUoD45+zdIL9Tpsd/zf77'
+        'y5R/L87+u72l/O//Pvjfd/ejxc14391hLQfywCgdv6HccbOmU2UbbWBxIzfML2o5tJY7tJYzupZj'
+        'wfah0oLt0Kc9n8lrOUvL3pnnDcpabnHLwT7zbAw3Y+JpaZldoLxYLFDSLFDSLFDSLFDSLFDSLFDS'
+        'LFDSLFDSLFDSLFDSLFDSLFDS1Idp6sM09WGa+jBNfZimPkxTH6apD9PUh2nqwzT1YZr6ME19mKY+'
+        'TFMfpqkP09SHaerDNPVhmvowTX2Ypj5MUx+mqQ/T1Idp6sM09WGa+jBNfZimPkxTH6apD9PUh2nq'
+        'wzT1YZr6ME19mKY+TFMfpqkP0yxQ0pSJacrENGVimjIxTZmYpkxMUyamKRPTlIlpysQ0ZWKaMjFN'
+        'mZimTExTJqYpE9OUiWmKuDTVYppqMU2ZmKZMTFMmpikT05SJacrENGVimjIxTZmYpkxMUyamWaCk'
+        'WaCkWaCkWaCkWaCkWaCkWaCkWaCkWaCkWaCkWaCkWaCkWaCkWaCkWaCkWaCklXq0da/rNz5QNv2S'
+        'OaZXqpjJ8m0+z/q3gbZVXP9+4foMrs/g+gyuz+D6DK7P4PoMrs/g+gyuz+D6DK7P4PoMrs/g+gyu'
+        'z+D6DK7P4PoMrs/g+gyuz+D6DK7P4PoMrs/g+gyuz+D6DK7P4PoMrs/g+gyuz+D6DK7P4PoMrs/g'
+        '+gyuz+D6DK7P4PoMrs/g+gyuz+D6DK7P4PoMrs/g+gyuz+D6DK7P4PoMrs/g+gyuz+D6DK7P4PoM'
+        'rs/g+gyuz+D6DK7P4PoMrs/g+gyuz+D6DK7P4PoMrs/g+gyuz+D6DK7P4PoMrs/g+gyuz+D6DK7P'
+        '4PoMrs/g+gyuz+D6DK7P4PoMrs/g+gyuz+D6DK7P4PoMrs/g+gyuzyiuX9qyd982rKw6l1Xofqmg'
+        'OwvdWejOQncWurPQnYXuLHRnoTsL3VnozkJ3Frqz0J2F7ix0Z6E7C91Z6M5Cdxa6s9Cdhe4sdGeh'
+        'OwvdWejOQncWurPQnYXuLHRnoTsL3VnozkJ3Frqz0J2F7ix0Z6E7C91Z6M5Cdxa6s9Cdhe4sdGeh'
+        'OwvdWejOQncWurPQnYXuLHRnoTsL3VnozkJ3Frqz0J2F7ix0Z6E7C91Z6M5Cdxa6s9Cdhe4sdGeh'
+        'OwvdWejOQncWurPQnYXuLHRnoTsL3VnozkJ3Frqz0J2F7ix0Z6E7C91Z6M5Cdxa6s9Cdhe4sdGeh'
+        'OwvdWejOQndWodvaMvsayQ3iZQwPM9AP0/zDyq8tV35NccFby88K/WoR1y1uVB71s82Ww1HFIitE'
+        'o6WZsrvUpPI9rjOVl0AcXjHPa4R5cpgnh3lymCeHeXKYJ4d5cpgnh3lymCeHeXKYJ4d5cpgnh3ly'
+        'mCeHeXKYJ4d5cpgnh3lymCeHeXKYJ4d5cpgnh3lymCeHeXKYJ4d5cpgnh3lymCeHeXKYJ4d5cpgn'
+        'h3lymCeHeXKYJ4d5cpgnh3lymCeHeXKYJ4d5cpgnh3lymCfHOc1hnhzmyWGeHObJYZ4c5slhnhzm'
+        'yWGeHObJYZ4c5slhnhzmyWGeHObJYZ4c5slhnhzmyWGeHObJYZ4c5slhnhzmyWGeHObJYZ4c5slh'
+        'nhzmyWGeHObJYZ4c5slhnhzmyUF3DvPkME8O8+QwTw7z5DBPDvPkME9OccXKCs0fEDTnoTkPzXlo'
+        'zkNzHprz0JyH5jw056E5D815aM5Dcx6a89Cch+Y8NOehOQ/NeWjOQ3MemvPQnIfmPDTnoTkPzXlo'
+        'zkNzHprz0JyH5jw056E5D815aM5Dcx6a89Cch+Y8NOehOQ/NeWjOQ3MemvPQnIfmPDTnoTkPzXlo'
+        'zkNzHprz0JyH5jw056E5D815aM5Dcx6a89Cch+Y8NOehOQ/NeWjOQ3MemvPQnIfmPDTnoTkPzXlo'
+        'zkNzHprz0JyH5jw056E5D815aM5Dcx6a89Cch+Y8NOehOQ/NeWjOQ3MemvPQnIfmPDTnoTkPzXlo'
+        'zis0rypn8ce897ccdthY9xEVtCcE2gXQLoB2AbQLoF0A7QJoF0C7ANoF0C6AdgG0C6BdAO0CaBdA'
+        'uwDaBdAugHYBtAugXQDtAmgXQLsA2gXQLoB2AbQLoF0A7QJoF0C7ANoF0C6AdgG0C6BdAO0CaBdA'
+        'uwDaBdAugHYBtAugXQDtAmgXQLsA2gXQLoB2AbQLoF0A7QJoF0C7ANoF0C6AdgG0C6BdAO0CaBdA'
+        'uwDaBdAugHYBtAugXQDtAmgXQLsA2gXQLoB2AbQLoF0A7QJoF0C7ANoF0C6AdgG0C6BdAO0CaBdA'
+        'uwDaBdAugHYBtAugXQDtAmgXQLsA2gXQLoB2AbQLCtpHttR/TGH2/vf/LZF+aM//0J7/occUnt2P'
+        'KRw1u6LZpmzw21tmv/jwSW5NmGECm2ECm2ECm2ECm2ECm2ECm2ECm2ECm2ECm2ECm2ECm2ECm2EC'
+        'm2ECm2ECm2ECm2ECm2ECm2ECm2ECm2ECm2ECm2ECm2ECm2ECm2ECm2ECm2ECm2ECm2ECm2ECm2EC'
+        'm2ECm2ECm2ECm2ECm2ECm2ECm2ECm2ECm2HmmmHmmmHmmmHmmmHmmmHmmmHmmmHmmmHmmmHmmmHm'
+        'mmHmmmHmmmHmmmHmmmHmmmHmmmHKmmHKmuHWhBlmrhlmrhlmrhlmrhlmrhlmrhlmrhlmrhlmrhlm'
+        'rhlmrhnmxhllQjl6Xhd8lAsr5ZvcnjVbv8dUysbXirKxSNlYpGwsUjYWKRuLlI1FysYiZWORsrFI'
+        '2VikbCxSNhZxXRHXFXFdEdcVcV0R1xVxXRHXFXFdEdcVcV0R1xVxXRHXFXFdEdcVcV0R1xVxXRHX'
+        'FXFdEdcVcV0R1xVxXRHXFXFdEdcVcV0R1xVxXRHXFXFdEdcVcV0R1xVxXRHXFXFdEdcVKRuLmK+I'
+        '+YqYr4j5ipiviPmKmK+I+YqYr4j5ipiviPmKmK+I+YqYr4j5ipiviDWKeLCIB4uYr4j5ipiviPmK'
+        'mK+I+YqYr4j5ipiviPmKmK9I2VikbCxSNhYpG4uUjUXKxiJlY5GysUjZWKRsLFI2Fikbi5SNRcrG'
+        'ImVjkbKxqLj82ArNLxE0H7ZcoVmRB5DfID9HMshvkQeRh5AsYkFakSVIG/I7ZCmyDLEiyxEbsgI5'
+        'HFmJrEKOQI5EjkLsyNHIMcixyHHI8chzkBOQE5GTkJORU5BTkdOQ1cjpyHORM5DnIWcia5CzkLXI'
+        '2cg5yMPIuch5yDrkfOQC5ELkIuRi5BLkUuQy5HLkCuRK5PnIVcjVyCbkGuRapB25DlmPbEA6kE7k'
+        'euQGpAt5IbIR+T3yCPIH5FHkMeSPyOPIE8ifkBzyZySPPIk8hRSQpxUZ7z5OofnnyocrlK3etNey'
+        'XJknLVBpgUoLVFqg0gKVFqi0QKUFKi1QaYFKC1RaoNIClRaotEClBSotUGmBSgtUWqDSApUWqLRA'
+        'pQUqLVBpgUoLVFqg0gKVFqi0QKUFKi1QaYFKC1RaoNIClRaotEClBSotUGmBSgtUWqDSApUWqLRA'
+        'pQUqLVBpgUoLVFqg0gKVFqi0QKUFKi1QaYFKC1RaoNIClRaotEClBSotUGmBSgtUWqDSApUWqLRA'
+        'pQUqLVBpgUoLVCoSRB5CHkH+gDyKPIZkkT8ijyNPIA8if0JyyAPIn5E8kkF+izyJ/AZ5CikgTysy'
+        '3n18C+8EbW8tFe3/LH9X69pW5S+/oLX84+fMFvCfV94kdkLL7Iupv7f3RYUbR8qXJE6cLe277xC3'
+        'HVtxgBUHWHGAFQdYcYAVB1hxgBUHWHGAFQdYcYAVB1hxgBUHWHGAFQdYcYAVB1hxgBUHWHGAFQdY'
+        'cYAVB1hxgBUHWHGAFQdYcYAVB1hxgBUHWHGAFQdYcYAVB1hxgBUHWHGAFQdYQd8K+lbQt4K+FfSt'
+        'oG8FfSvoW0HfCvpW0LeCvhX0raBvBX0r6FtB3wrzVpi3krOsoG8FfSvoW0HfCvpW0LeCvhX0raBv'
+        'BX0r6Fsxl1Uh66TKrG8RHzO1Mevb4NcGnDZmfRv82uDXBvc23GPDITbyq438aoMuG3TZoMsGXTbo'
+        'skGXDbps0GWDLht02aDLBl026LJBlw26bNBlgy4bdNmgywZdNuiyQZcNumzQZYMuG3TZoMsGXTbo'
+        'skGXDbps0GWDLht02aDLBl026LJBlw26bNBlI7/agMwGZDYgswGZDchsQGYDMhuQ2YDMBmQ2ILMB'
+        'mQ3IbEBmAzIbkNmAzAYCNlizwZoNyGxAZgMyG5DZgMwGZDYgswGZDchsQGYDMhv51UZGtZFRbWRU'
+        'GxnVRiq1kUptpFIbOdRGDrWRPG0kTxvp0kaetJEnbeRJm0LzyS2zr7TdKl5pe7jyg1Nm72s4VcmQ'
+        'p+q+h1G59en48jr3YFvTPuG9b5nKN6BVl7anVdLCBSIt2EkLdtKCnbRgJy3YSQt20oKdtGAnLdhJ'
+        'C3bSgp20YCct2EkLdtKCnbRgJy3YSQt20oKdtGAnLdhJC3bSgp20YCct2EkLdtKCnbRgJy3YSQt2'
+        '0oKdtGAnLdhJC3bSgp20YCct2EkLdtKCnbRgJy3YSQt20oKdtGAnLdhJC3bSgp20YCct2EkLdtKC'
+        'nbRgJy3YSQt20oKdtGAnLdhJC3bSgp20YCct2EkLdtKCnbRgJy3YSQt20oKdtGAnLdhJC3bSgp20'
+        'YCct2EkLdtKCnbRgJy3YSQt20oKdtGAnLdhJC3bSgp20YCct2EkLdtKCnbRgJy3YSQt20oKdtGAn'
+        'LdhJC3bSgp20YCct2EkLdtKCnbRQlvHx89686LBFypc4pvbYxoKuQLC/9P9B99jUS6e8L7Icdlj3'
+        'uy1je6xu31Dt8fZFY+O7PrNn5WZXYMzj29kZGPUFS782Nb7rC3dMrSnlFOvG940p8n7kA8gHkRjy'
+        'IeTDyEeQjyIfQz6OfAKJI59EEsinkE8jn0E+i3wO+TzyBeSLyJeQLyNfQb6KfA1JIl9HUsg3kG8i'
+        '30K+jXwH+S7yPeT7yA+QHyI/Qn6M/AT5KfIz5OfI/cgvkDTyS+RXyK+RB5DfIBnkt8iDyENIFvkd'
+        '8jDye+QR5A/Io8hjyB+Rx5EnkD8hOeTPSB55EnkKKSBPI39B/or8Dfk7MoP8A/kn8i+kiPxbke7D'
+        'FqGLhFqELhbaIrRV6BKhbUKXCl0m1Cp0uVCb0BVCDxe6UugqoUcIPVLoUULtQo8WeozQY4UeJ/R4'
+        'oc8ReoLQE4WeJPRkoacIPVXoaUJXCz1d6HOFniH0eULPFLpG6FlC1wo9W+g5Qs8Vep7QdULPF3qB'
+        '0AuFXiT0YqGXCL1U6GVCLxd6hdArhT5f6FVCrxZ6jdBrhb5AaLvQ64SuF7pBaIfQTqHXC71BaJfQ'
+        'FwrdKHST0G6hPUJ7hW4WeqPQPqFbhG4Vuk3oTUJvFnqL0FuFOoTeJvR2oXcIdQrtFzog1CV0u9BB'
+        'oUNC3UJ3CN0pdJdQj1Cv0DuFDgsdEeoTOirUL/RFQgNCx4QGhY4LvUvobqEhoXcLvUfoi4W+ROhL'
+        'hb5M6MuFvkLoK4W+Suirhb5G6ITQ1wp9ndB7hd4n9PVCw0L3CP0PoW8Q+kah/yn0TUL/S+ik0Cmh'
+        'bxb630LfIvR/hL5V6NuEvl3o/xP6DqH/K/SdQv9P6LuERoS+W+i00PcIjQp9r9D3CX2/0A8I/aDQ'
+        'mNAPCf2w0I8I/ajQjwn9uNBPCI0L/aTQhNBPCf200M8I/azQzwn9vNAvCP2i0C8J/bLQrwj9qtCv'
+        'CU0K/brQlNBvCP2m0G8J/bbQ7wj9rtDvCf2+0B8I/aHQHwn9sdCfCP2p0J8J/bnQ+4X+Qmha6C+F'
+        '/kror4U+IPQ3QjNCfyv0QaEPCc0K/Z3Qh4X+XugjQv8g9FGhjwn9o9DHhT4h9E9Cc0L/LDQv9Emh'
+        'TwktCH1a6F+E/lXo34T+XeiM0H8I/afQfwktCv230MMsYv4XahG6WGiL0FahS4S2CV0qdJlQq9Dl'
+        'Qm1CVwg9XOhKoauEHiH0SKFHCbULPVroMUKPFXqc0OOFPkfoCUJPFHqS0JOFniL0VKGnCV0t9HSh'
+        'zxV6htDnCT1T6BqhZwldK/RsoecIPVfoeULXCT1f6AVCLxR6kdCLhV4i9FKhlwm9XOgVQq8U+nyh'
+        'Vwm9Wug1Qq8V+gKh7UKvE7pe6AahHUI7hV4v9AahXUJfKHSj0E1Cu4X2CO0VulnojUL7hG4RulXo'
+        'NqE3Cb1Z6C1Cb7WMufe0jfqDnlFfeaG1Zk/rkHv7+M6p+/YsGQsGPIPB0j+tvNPt9ve7hof7g6N3'
+        'uku/d98eazDgdvcPDrvGxqZ69rQOugZ3uUuHVyj/0L8z4BoZcQWm7tu12Bssrdz2tA67Q+7A1K5P'
+        '71keDLh8YztGAyOlf+9R1nV3sLxz7VnqD3hGA57g3VN7lvhKv+EantqzzDWy3bNzXDnY4hoPjk7t'
+        'aQ24d7pDpb92lD8w6nftLK0R+/2jYx76cO+elcof6x8sBbzdNXhnuVt7jhxx3b299GvDrkH3rtHh'
+        'IXeg/JuHu4c8wf6gOzDi8bmGSz3Z9cmNh+1K3LfHNhoo/Yq7tAJ1B8u/aPOM+EdLC1W/K7hrbOqO'
+        'qT3Lx0bHA4Nu5UBpAJaWWh7f6VGGsLxEbdnkCtw5Nb6nZcQ9Mloe1o2Hlce2xecacU/tabu+r6N9'
+        'a0df6Z9K/33pz/sY+btcw+OlHy+6ptTHHcOuncpfWhxw7S79/+prVk+VGrZu5j/YEgxMjXuvajns'
+        'sFLAn9mzfKvowwb3jqnxjYvK9xxuLv2wFEjHli1T3r7SP5ePbS0fW3TVlPemFmXcbyn/++LVV5Xb'
+        '9jpK/1Jp03tb+V83WmabWiGi7u+4cVv7ppo2LddcPbfRltXXXK3d6uLZVq3lANWbvEpq8qo6TbbM'
+        'NrlEaa2215arpeaurtNc62xzy3p6t6oHeJrU4ml1WlxSCXDL1r6unutrmlu5+jbn6jvWrn7Jmbc5'
+        'z7xj7Zlz2z5iXc2P15VM0r/bM1Ti744SX5bXLztM/G+Ru0TEMgFKX8eUFEnbbCTLe7Z1X1c6pVtv'
+        '3dxRE84S3/jI9pJH50SxdDVHtXu5tDJuWztu2arWckvQHQrObXfJ6vIx7VaXzba6uH3Lxpr2FrvG'
+        '7pzbXOvq0iHt1qyV1ra031rb2pjr7trWSoe0W1s+25qlq7MWEc+OWkQ8O7SbslV827FpizRu7uEx'
+        'd+24lY9pN7hitsHWm2/o2lTbYuvuXZ7hmibbVisHtds8vDJ6nb19taNXyuy1o1c6pN3ayqrR65FG'
+        'zyeNnk+7qVWVwDZ01J6JxUPuHbWBlQ5pt3ZE5Vx0butZX3sudoz7BmvPRfmYdoNHVs7F+k3tUlZu'
+        'ZTKtORfKQe02j6rklL6Ordv6akdwScAdHA/4ak3MUe1m7ZVQrysl/VrDtW4PuF131oaqHNRu8+jZ'
+        'Npeu7+3Z2tWzrZbGpYOjvqDHN14DpHX13uPajR9TOVmb5aFt8Usju2S1v+7AHls9sJtL8548sH63'
+        'KygPbPmodrPHVeWxng1SHvMNSXnMN6Td2vEV70hGtNT6sGV1PRs+pxLY9R21nV280x2sDax0SLu1'
+        'E6pOR++WrdLpGB2T8n/5mHaDJ1bC27xNCs8/LoVXOqTd2kmVk7uhY1PHVmnqG3IPu4Pu2pPLUe1m'
+        'T64EWSoZaoP0jUpBlg5pt3ZK1SQln5Ex+YyM1Tsjp1bOSE97d22Hj7nNde497ec6+u8Q/3D+uVf0'
+        '37F27l84bp36b62b8r5C+bU1GxfNLUK8r1IL5bTK6FN91ASz/Pahs9fcfl7p/8+6dm4EK9ZV/ajR'
+        'P7u6kn/6ezpu3tTVUzsKy9esuNZ626nL7lh71tlz//CqdWtuD1x7u++2U28Pln/a6N8+fe/f3hWv'
+        'yaTlP1fzx5auU/5Mw3/kuZVs0C4Vv66x2mzgqpP9zqjQsqF9a3utf4dcQVetf8vHtBt8XqXBF27p'
+        'rZ2lWrxjo77aBsvHtBs8s2p27uvtlmbnwOiINDuXjmk3uKbS4M1dW2+obXC3p1Rn1zRYPqbd4FmV'
+        '07G1t/Z0lJaxNacjOKrd1NqqyqF3kzR8i66sXc9dqd3W2ZW22rfcKtU1ra6xu2sLm7bVykHtNs+p'
+        'Wm5ubq/186I1teGt0W7q3EpTfSpNnVXb1FnaTZ1XyTPrlZVrbZYfLBUscpbnqHaz6yoRdrdvlGr0'
+        'EdedUo1ePqbd4PnVs1GnnJZKs9EOj09lNiof1W72gsr8sbVPWuQEA9Iip3RIu7ULq1bXt6zv2CzV'
+        'Q+7QoNsv1UMc1W72otlm20o9b9+0qTbQth3lXY3hmmCXrRaHtVu+uMJ5d/vW9bWGbh1xBQd31XKu'
+        'HNRu85LKqV/fLi/PBl3y8qx8TLvBSytBqm0wLLq6Fvc62wuXVc1v/e09vT3959dmnbOl/Yqz6zR4'
+        'udTgBbUNnis1eG6dBq+QGrywtsG1UoNr6zR4pdTgRbUNrpMaXFenwedLDV5ca5x1tS22rl5Xr8mr'
+        'pCYvqY3xDCnGM+o0eLXU4KW1Ma5dK8W4tt44XlOVv7vkcn3YI5fr5WPaDV5bVT90rZcaHCpvK9fW'
+        'D6Vj2g2+oLJfWG6wq7enXcpp1nITnlGfqza12VZXfqL9J9orXty6bbO8VRIc98tbJcpB7Tavq1ru'
+        'bZCXe0Pycm+oznJvfSUHt2/e3CGtH5e4/H537RJy6WqOaje7odJsV8+Wjj4ptXt8Y+6AlNo5qt1s'
+        'R4WBrh6pAmrx+GproCWry8e0G+ysXpJ3997UIS/JR0bvcstL8vJR7Wavr8S5VWU+D6rM58G68/kN'
+        'lZPeK69VR+W16mi9tWpXVV3a3iVZabfLI1mpfEy7wRdWON/cvk2axVr9rvExiXPloHabGyttbtnU'
+        '0bG5ts2xYbfbX9umclC7zU2VNkuLdGmbtrW0Gq/dqG1brRzUbrO7Um5s6Vjf27Ohdp3UNuYeHPUN'
+        'jdWWG+Kwdss9VZv7Ssu1cNJCLZwc1W62t4r59p4N0kJnScDlG6pd6pSYV45qN7u5Mg7XdWy9uaOj'
+        'dknRtt0d3O12+2rHQRzWbvnGqp2frvUbpZ0fz+Cd0s5P6Zh2g31VVfwNvb1b5Cp+1+jomFzFK0e1'
+        'm91Sfb42dUhzVOl8DbsHg/L5Kh/VbnZrpftb2qUM1TLmuktKJuVj2g1uq9rA7+vaKm/gBzxBeQO/'
+        'fFC7zZuq3Lq1t09qcyw4GpDaVA5qt3lz1Xpcvs7QskO6zFBaj9e9ynBL1UKwo73WTi2lRdpQbYPl'
+        'Y9oN3lpV5PTKDQ6Pyg2Wj2k36Kg02LtZclDLqN8t7WmUj2k3eFvVjt+2bmnHb3xE2vEbr+Px26uc'
+        'uGmbvCU+PC5viZeOaTd4R6Xw3LLtuq197ZJplo6Nbw8GXLW2sa7ee1y7cWfVcq2rRwq3dcTjG5cu'
+        'jigHtdvsrwTcvW3T1q7N0upy6cj4cNDjr11eWlfvPa7d+EBVudjV3SEFHPSMuKWAlYPabboqW0bX'
+        '1YZq2X537Sphe53wtldtKnTd1LVB3lTw3OUZkjcVlKPazQ5W7eP1dsn7eKMeeR9vtN41u6HKTLS+'
+        't/s6efejbXB0ZLu0/bFstTis3bK7coK2bZGvtreOlx8hqD1BykHtNndUZc7Nm6RqrHXMP1xbjpUy'
+        'Z/mgdps7q2zVsbm9T96oWjrm9rsC0lZVyVbiuHbju6TF4mXSRBcMSANRmuiUo9oNeyqX+beV1iJ9'
+        'Kvshy8ZLC4+AvCmyfPXsD7Tb91advXL70tkrNyGdvfJB7TbvrMS8qfdm9ZiHR3erxzz7A+32hysx'
+        'K+3Xxqw0URuzclC7zZGqS3zSzQWj0s0Fo3UuaPsqKWFTR8/10h73kmG3b2ftLvfS1RzVbna0quTp'
+        'csglj+ceueQpHdNu0F+9272tRzLZ4Oi4TzKZclC7zRdVLUa3dkiXC0rlknS5oHxMu8FAJcjOrj5p'
+        'z6R1hycwJgWpHNRuc6yqQmlX2YZxqWzDuOo1GKwk176Omzr6JNzbAu673IExKbmKw9otj1eVe5u6'
+        'Nkvl3rDHL5V7pWPaDd5VRVGvtAXRMjYakPpePqbd4O7KCert2yCbUbnBr/YEKQe12wxVb4J3bdm6'
+        'Rd4E94wFx+RN8PJR7WbvrpoDt/X1dUjItw2OBwLuWuhLcyCHtVu+p2pvo6tb3tsolSPS3kbpmHaD'
+        'L55zYbBD5cKgW+XCYJ0GX1J9zfxm+Zr5bvma+W7t1l5aVZT1bpD3DIKjQ/KegXJQu82XVd2TdYu8'
+        'AVM6uRKZ5WPaDb68cro39/Ve39dem47a/IHR8h20tadbHNZu+RWVUG/cJof6onE51PIx7QZfWeXK'
+        'rb2SzUtrQsnm5WPaDb6qcrrlrafF0sZT6+q6206vrtq57N7cq7Jzqdy1K+1cKke1m31NddosDWSf'
+        'StosjVtAJW0qh7Vbnqi03NWzftM2qSxv8/gGh8eHpJbFYe2WXysVepdL979eI93/eo12g6+TGrxC'
+        'uvojNXhunQbvrXjz1q6OTbUL8Na7Pe7hoVpvKge127xvjpU2bFvfoWKlofFBt4qVyoe1W359pfvX'
+        'd/R0qFXlO90+t1pVvve4duPhqmvwKpu6rS55V7dttav+tu6eSpt97V3ytm7A5ZG3dZWD2m3+R1U6'
+        'vaFPSs+twV2B2gRdSqflg9ptvqHqkmdfn3TbWqs7EBiV5mXloHabb6yuGLu7a+9XWXRO7WXUc7Tb'
+        '+s+qiyxb1K6GuMbUroZwVLvZN1WFeEOHtDHaOrjLPSjdUakc1G7zvyqhloq7rs7a6W5JqYjz7Li7'
+        'NlSOajc7WVXl9GzZJmW/JW7f2HhA2jrgqHazU9XXCLrWy7uOw55BedexfFC7zTdXVnR7L1FLF72v'
+        'lK6uXlnnUuh/VyaoLqkOW+zxSRdvPPXqr7dU7ehtlW6VLq2xpR29YB3M/6dqzbGpt11ecwyPuuQ1'
+        'R/mgdptvrczw1/X21t6A0LJ9dHS4doYvH9Nu8G1VNxr2Srs5LT2jPqlCLB/TbvDt8jmuvQ9h0dm1'
+        'Bj9bu73/J7dXexvConNr2ztXu713VNdI8h1La2ubWqvd1P9WW6R9S+0CfdG62rbWabf1Trmb8s0R'
+        '66SbI+q0+H9Vk21H33p5mbLojNr4ztBu7V1yfBdLd4Osle4GqTN6karb/6XbbxedVxvbedotvbtq'
+        'Ib7lxutqm7qttqnbtJuarrqModLUHbVN3aHd1Huq9m+u62uXMuiiF9c29mLtxqJVFxZVG3tpbWMv'
+        '1W7svZW7M7b1lNbaW9bLV5UW9dc22K/d4PvKj8MtGQ14dnp8VfOG8rKY8lNwy0spY+8Tb1Pje5a5'
+        'Q36Xb8wz6pu6o/Lrh/f383aZ8mWN/vPLf2zz0lLrrr2L/43lUmvY4xqb6vFeIGK9pKT37WlTGhy6'
+        'YOpeJbKePSuD7hH/cPlBQ577m+rZs6J0JHh3v8c3VJqixqbOKofVNz7s7hXPUiqPAZYPTI1vfH+5'
+        '6e6l/AmgV15tM1Je1O+Ny3vjUuVu38rDWWOllcpw6U8GRyq/pXIX8x7rDs9w0B3oL99bcG/pzy6t'
+        'jI3bu21peWi9N5WkppveW0rHRA+9tyo/d5T+/6zyaSj/qZLeXtaNH2gg/L2/4t1e+tfZISeKRYai'
+        '+KCOKPasGBwtrfbGlXcJVY2iCMhiKKCYFJB1+/Do4J1z/5Tu0+p1l+Mo/cKO8i+YciI/1EjEs2fy'
+        'HrPP5If1hNHUU/kRKaKjRlyDgdH+ne5gf/nW9n7ljnLNc8pDM+UTdt/eEzY7fM8vvyZ0zrmc/dH1'
+        'mj+qPCOq3ugl2v+leMBjzn+3T3rum8cgfdTYIHn/c6mI2aQx8k5JDbr3hed8+vmx5vWz3aR+zoMD'
+        '71u0RsdiaHQ+fuCPjujnYkP9/ES9fpafVjaQEl7f8gxJCXFjg+T9nDYMusbI+6XmpIRPSv08kn6W'
+        'H1uE+uCoNgviKciGc98W3TB0a/+XtvLd0P3DnlLFWKoQawuQ/YJRwtDwen+sa2LRHlzvz7Ub1B5Y'
+        'b7qqTjKFuk8dPMNSZx76dXPmoU8f8INjyjT0maZ1s30/WcMQMy2GBvOzz7jBFMPSamhYPnfwDIse'
+        'ZpYYGpzPH/CDI7rZZqibX6jbTaWU013h1CnlmlLhHICF8hcNDa/3vGV66uQ6FF24TE/muWRZU6rr'
+        'Lx08g1Mn/1y+rCl1zpcP+MExpc75itTNI0Q3x+exwOKtMIfWVxqD+1Ujg+t1LjO5VN6uK/m4l5m8'
+        'vPraQTMqdbLOruZkneSBPjamJJ2vN6uX7fvJF4aIMba2Sj3TxtKUpdU3DppR0UOMsZXVNw/0sTFl'
+        'YfUtrV7yOrl9XEWYfUGdek8PrqsF3zYyFN7Pap/wOhcEvtCcJct35EvYdKXuJey6V8pcZgzxd43G'
+        'JV+0cZkxXt/TFVe9nRaXGWXO9w2HVbsAc5lRl/xAV1h1sqfLjBn+h0aiUrO4y4wZ9kdSVKo32NSG'
+        'pRa6KQ78sb54lo657laNxpjvfqIzGtfYnQ3eZjOfaH6qL5rlrrExz06fakDGjPYzfQEd7xrfWb7t'
+        'zD3UT2jlf1ENz5jjfq5zvHi/s2pAxsx2v06zKe+GVo3HWAn5C33xrNj7RmnVkIzVe2l9IS0rv49a'
+        'NZylhsL5pc4zpjx5pRrPMkPx/EpnPMrjT6rxWA3F82ud8SiPTqnGs9xQPA/oT5HugPoA2QwF9Bud'
+        'PGuerxWGwsnoTYnKK7FUAzrcUEC/1TnDjmvgs9JQNA/qi2ZVuS7rFx+5UYtqlaGoHtLJUPktk6rh'
+        'HGEonKzOcJSNfbVwjjQUzu90piDl5ZOq8RxlKJ6H9VawbvXRsRuK5vc6iXYNDZVWQP2aCB1tKKpH'
+        '9EV1NG+jVJZB2qEdYyi0P+jESXnWUjWeYw3F86jOjL3bNRwYVy+JjjMU0GP6Ajo8eLff3b/Lo1Hp'
+        'H28opj/qHKRh18j2IZdqQM8xFNDjOgep/DrD/vKr/VRjOsFQTE/ojKn8YkDtmE40FNOfdM4l5a/T'
+        'qYZzkqFwcvrCWVnO3XVW2ScbCurP+oKyjd09FnSP9Cs7NbURnWIoorwUkcbTRdLWn/IphP7yl57K'
+        'j/n1l78qZer20ZN6I7PVi8nYJtJTemNapny+Si0gY/tIBb0BtXl2NGEX6Wm94ViVT601YePoL3oj'
+        'WrFjNNDvdg3uasLm0V/1BrWcz2o1Yf/ob7rdVv664og/2IQNpL/rpmmw/PmKJuwhzejPSXymown7'
+        'SP/QPUojmqNkbCfpn/qzpKspW0n/0h1Q+ctGTdhKKuoN6PDyi5O1KzhjO0r/lqKSr8XINxwqHw5V'
+        'vRpdfiecPzBVcxuJoaqg+7BFcpDSJRo5SOVbqepBKv95eUUjP4Kudv1/H7cVmNLJRXo66d2wXPO2'
+        'gM7lKndG3bC8GTcEdFtMP0P6T4Oh4qp7sa7TcKv2abhteTNu3utu0YhzDtRSKTHng8dzgppTvlc+'
+        'f6wvuFY9wVV/MVktNAjd+/1kfYEtkQOTimIJU+XDxuogLit/wEL59Lp8q/Ot2vcYab3movpbNBuU'
+        'Vwyp/9lV/f0ial7vcoGcxpZs6KjXgrX85eR+5b0T5ubqNh0j7H2xtn1eqpbFtIfW+4rlmj96lfZf'
+        'eY3aX3ltc3LlUnmE1M6GhOFR/f2VX1Ne7tN/ocr0xaez1bvZPCRVR1ADQlM4W6ZvFL3v0IagDlX/'
+        'p01VpEGq3tMcqqwq46Gyvpao2vtl9AMpvy04TMvlwdPYCpBrGOUr8DpqGOWD7/MpoZ+JA26TB1x1'
+        'm0O+I3jv98g1CsO931R+xue/FfII1tudlfJgv/ZQLN7Q0akHaa+7zv3Y5W91jIzJUN+pnXSfQWfr'
+        '8KadLW9Oe/7Ja/9I+1TpOyPev2nPkDMNzpD/as4MuVI+B7Z5jf4hQ5hviFV6T4b3KJsmTUfbFo73'
+        'E22aPzrZ1hjvp9mawvsRunlv6dxW/jS6mYN8nE2l4wfuyBvbQzpSN9yXPnvgNrb9dZRqASnf961W'
+        'QG7d1tezgLvX9sZCnR25rdLImXE5u/toORyVC9USmamWhp6Ym88UuNzj2+UOeIIu36D72ToPHmP2'
+        '2fAO2fRscNyp7fiRBh3vb850dqy+kXqRdp/1DWKdZLvTvEluIc6HsUnuuAPkfOznQTQ2jR2vbxB3'
+        'H4La1ozXOHQ/5wA5H/t5EA3d6dR9gr5BfOkhqG3NeNNE94kHyPnYz4No6L607pNU1nSqd8FJ4/jq'
+        'Z0Uhe7LK9SeVO/Kk0bmvVd+64hKd/90zaMhPMX3IvY/qcm9O2735Bt1baM7i4VTzh2o/j4ex4v00'
+        'tR0qtbtVpRF547Mim61epPa2j33z8uY6WWmhL+qWbxipxMyNQhdNLeQonq5WeEh3+0qD+HbtIWnz'
+        'l+fcwMLejbB16cLC91yVYZPvSZaGrbth9g7AOXShx/oMs8fae92Kxm5Yu2GF5o9euEJzslAbJ2/3'
+        'iqZMns+Tx0jziTmVW8U1PwRTH7J3zRdnUzg4U2WTfl79O4D6sEbuwzxe1dNYj967oD06y5Qeee/S'
+        '9tGHtI159wpz37jbvbbpvflEQ70xVkKe3fTefKah3hjbiD2n6b35UkO9MbaNeW7Te/P1hnpjbD/x'
+        'vKb35jsN9cbYbtw6laWFygvCaq8G/1jacjPjgevu8xepPZWm9nqw2oB+0ZyALlApyOSXg9UG85vm'
+        'BHOhSjDye0sk0n6ks66uUy7YlD9b+1p9UybZi/R1ss6FPO3+e7+mbcJ31dlvNnsqvlhfn3fv3z4b'
+        'm7AvUemz/E4nqc/3NwFm1W9EmALzpfo6+YD2eXhI19l72GxiL9PXsTouvX8B+myM2Mv19Xn3/u2z'
+        'sUL0CpXyQOVVZ1Kns+bbdAV/tyk+vVJnN+vwrD0CXuvhes7tisNN9vDzdXZ69/7ttDETX6XyLLD0'
+        'rjypy3bzcV5e/qtNgflqXV2sg7J2771n6Tqr55iN8jW6urx7/3bZGMjXyl3Wfs2i1PVHG96d37Lw'
+        '36jofkGT+ui94XCV/ep/aP/+xsObspXdbqh/uQb7t0VH/4wxet2C9k/P+TNWHa031D/LApw/Yxt3'
+        'Gxa0f3rOn7GtvA5D/Xt6Ac6fsc29zgXtn57zZ+wuuOvl/u3jpb5SJxctaXQivH4/TIQ3GO/oUu2z'
+        '819qZ7POZ5ze3JzZsMt4J9uWaK8kljS//8ZmyxeqXfyXXtwvP4GqTfA+3j9wtvRfmgLrRrP74f2o'
+        'dsl9gVYfjLG4SV8fjtfVB83zYIyn7oXsg+Z5MFZh9ejrwynmngdjVVTvQvZB8zwYq5Q26+vDGeae'
+        'B2PV0I0L2QfN82Cs4ulTe3pX5WsqUi8u0+7Fa7Qfn7je1G0C8+/I2XKgDIf3KbUa4jHtpv5i9hbY'
+        '1iYMxdVLGutvnRXOX8ze/9p2APS3sfNrbCa8SW9/12t3amFc0BgVxubamw/aUWqMJWOz+S16R+kv'
+        'LQcVS8bqhVsP2lFqjCVjFYlD7yh1HVx5ydBb+7tvO2hHqTGWDH1HoPt2vaPUe3CxZOjbBt13HLSj'
+        '1BhLhj640O2UR0nre1jSQG3THo3Xt5i3IvLurLN117xX+/cv9Mh4X7ayscsF2uPifdXKpuw9DxwY'
+        'YxJvMXVMjK2wXAbG5LYljXV8i7kwGFtqbV/AjpvsAmOrp8EF7LjJqBtbEA01x/4LgbqxNY57ATtu'
+        'MurGli07FrDjJqNubCWy00DHXfsXdWOLi10L2HGTUTe2XvAsYMdNRt3YEsCr0nGNz89KHR9ZYl7V'
+        'rvcNB6ZU+3caGIQxPYPg/cdKzati2gPgLTansB820P2/6Fr5LtzIGCvvR1RGRuPTftLI3L1QFngm'
+        'vuTD15SBr8fdCav0cHfyKj1v3zptleaPTl/V2AtEnreqKSlh1MD4jxwaf8OJx29g/McOjb/h7Y0X'
+        'qb9NbFfNt91rP4i4VPkd19CQqd9Y7w7oi2aF8jtj49uDAddg0NRPrHePGQlpZHw46PEP323qR9a7'
+        'g/pCWq78zpDnLs+Q29TPrHePqzxxJQFiwmNHj7Us5P1Ed5ncK+/uVWovxtL+/XtWmXxb0O559+jN'
+        '33vnYcr/qrv28iWNda3OFR6VrhnzREjXyWq0R42dLGOmultXjyaaeo6M7SjfsyA9auwcGdsqfrHK'
+        'K2rU5yKpW2FTnzUxP/u9RH/X3qR9xj6yqrGnKz5udgp8qVa3pKla6tZbGj5j716ykGfsZfq79g7t'
+        'M/Y1tTOm3TFvyuwz9nKVOxzUKhmpU+8/wM/XK1RedDwWDHh8O/dVyInf8o56fObW36/UG9Le3xrz'
+        'D3tMLsBfZTSmcb/fHTC3An+10ZiGR3fLMRmrF16j4hM1UCSffKRhn3Qv6Ew0YX7HvEW1rPY57d9f'
+        'dITJWe21C9WpdzfUKWO2eJ3eTn2ywU7VqfFUOmXMV/cuVKcaw89YKX7fQnWqMfyMVeOv187Kc+cl'
+        'qVdfOcBLhbDunn1De/wvPaKx83WF2Tlwj3av5s7ZUq9+YsI9maacmP9oRhe+p/2jjWafgzc0owMb'
+        'zZ5Y3qg7yrSu+zE3mj2J/GczOtAYJ8YmjDc1owMbzZ4B/ks7yrkVtxRl5kDJKJPN6EIdUu4xO6NM'
+        'NaMD95idUd6sO8qHdWWUe8zOKP/djA40xomxjPKWZnTgHrMzyv+oXGtT3j2zjy0a3ont9u0M7jJ3'
+        'i+at+gLid3Z4AmMmb8+8TV88vNJ62CWHY8zXb9cXDu8wD7jvcgfGTL44+v+MDNDYaEAaIGO2e4fK'
+        'yk8NVsl1eW3X/XFBF0P/24QefFg7c3/X7AnynU2IP95Q/MYs9n9NiP+7Zk+P79Ib5F/1YK4WvzGb'
+        'RpoQf2OQG5s3392E+BuD3NizMNNNiF8lSGPPrbxHb5D/MgtyY4+fRJsQf2OQG3uK5L1NiL8xyI09'
+        'DPK+JsSvEqSxBzfer1U/zS1mpRiXtWnGuLhNx/A3o5T5wIL2rY61zz7S5CLngwvaM5XwjdU4MfPD'
+        'V4nRWInzIa0PBc1ZVUkhrjwIfPHhhexaHVt0m22Ljyxkx7rNdsVHTY++22xTfExlV0l1bS9FeXTb'
+        'QhL+cd1xnqA9miNm4/oJzW+RVe9LSCGetqBDGdcX5Jna4/gSs8fxkyrTifKAS/09oCOU33GHSp0Z'
+        'q/lVU/YSE0bCGnIPu4Nu9bCMjdan5LDqjIR0Ys9t0/O0bhPA/LSxftR5huncBg1m7Hx8Rqsfqgg0'
+        '8rL5hT0fnzXWj0VLTOuHsfPxORXbDrn23YGLtI1xRVtT3v7+efMjvbatKe94/0JDkc5G09Gm8XFX'
+        'Y4XWF/VFs1ErGmM11ZfUrtTdPRZ0j+zrPN6ofR5vbg5xX9Yd6x06YjXG3Fd0xzqoI1ZjRH5V5dmd'
+        '8bF9PaHradP3gP/+eDfG10zuoffxI5vyxHpSV5yjjcQ5nweic0c25Xnwrze/d6asM1O64qzzxLrJ'
+        'Z8HY1advNL93plxl+qauOMcXzAvGrkF9q/m9M+Uy1Ld1xfniBTsLxi5Sfaf5vTPlYtR3Vb7vpnwq'
+        'yzPiHw3s68Mm1+t8Fc/oQTTDf69JI+S95ihNXuvMTO1HNaU++P5+6GWdzN9+lB4vbziqKdXFDw70'
+        'sTGlNvnhfujleNtCEWCssvnRgT42ptRFP1a7sO8a2T7kqt/B+jn7lQu6rf+TpvThdQu6c/pTlX2c'
+        'uz3u4aF9cPYfCzrSP9MZ5aQ21286yuQrKD/XGeNbG4rR2Oxyv84Yv6t9y0+d17P8oqWRnhmbUX6h'
+        '0jPXPD6X984F5TitEmXA5dlnrf6eBY3ylzqj/KA2yZ82222/Mn0kvR9rKHxjRvy1+UPcWPjG3PaA'
+        'ysznGhtz77M8+UJbo48xf2pB0f+N+R3z3m82+xm9QX5tfkHOY+y9vzTbEb9tcqdM4f5BvUF+q6kj'
+        'b2zB8VCTO2XKeiGrN8gfNHXkjW2f/q7JnTJl7/RhlalqbNgzuK+p6mc6990O9I/4/l7lpO12DQfG'
+        'x4ys+n61oNPcIyrvNA7e7Xf37/L4gka6Uee95yuVP+Dy+UaDrqBn1Cefx3ct6Hn8g/4x8J5v1/Ou'
+        '5YvsJhcCj8pd0Bzl2lvk1E6jKbfsPaY/KO+DWreHGBunPxoI6ZHm3D/zuIGQnmjOTTRPGAjpKa2Q'
+        'jJUmfzIQ0o9aNUIyVojkDIR0v1ZIxsqIPxsIKasVkrGiIW8gJLtWSMaukj5pIKS/a+Ft7ILoUyr3'
+        'hQ+6hoeNzMDuOpOoK7BzTJ5272xtyn1uBV2d875Ke2rV7pp2H4xNHE/rO0GrXMFgwLN9PFiCa3DQ'
+        'PaYy6HX6MmFXWZZodtDYNPQXfSfpzWoh6jk9xmasv6pFP+ob8tStfKzDozs9pU72jwbm/7DCvfMI'
+        '529qj+TJf0t+E4v4HZdvyNyA/t5QQGvq/tLsDy29fRq5R70nc4y4p2000K/U8jq7NKN2zU3lr2oO'
+        'cinXmzvI/2gsojX1f2v2p4vbezbsc5yrOzN3nJeWGjU00P+s063qPyu5a3B0xO8KeMZGfeaO8790'
+        'BtTiCo6OzP/xn/mEUmwslMopX9zTq/VdL9WBm5Pj9ywttW3onP67GXHPHd85ed14xIdZ5AymMk5y'
+        'iTQnqMrb5iv/bf+oX/65al+MlUGL5B7M/SumLMznM5aWRiNZ0rOt+7qOPvVYjDloccOxqH6nb59L'
+        '8fnE0jLPWNbMq8ZW36LcRwG0x1qi0u0zZJXWRod0xY5x32C5UuovV3zzf4fXfIJZ0mgw2iXzPlft'
+        '84mnrdF4bGPj28cGAx7/nFJyn8v1+cSytOFYeILdE3QHXNJ5ajMUy7JGY1H7jNc+l+fzicTa+BlS'
+        '+5zBPtfl84llecOjovK6PNe+3n8zn0hsDUei8nS0a18vuZlPJCsajkTlcUARic1QJIfLkWjM67Uh'
+        'tV3f19G+VWtGMzbPr9QdVcumji1bGp1k5xPSKt0hrRAD1d9x47b2TY1OuvOJ7QjdsVnLw1UvMGN7'
+        'CkfqDmyJEpPGmTS2D36U7qCWlSr3eoNlbDPcrpIU5hRAteEsHhsfMXdZeHSjIdiGPIOas6mxqvYY'
+        'OZY5HZbykT8wOjQ+aPKGxLHzi2KN+k9nS9Z/a1+RluKeu/ewuPy1PJ3BH2dO8K1LGw5eLLJL7W3X'
+        'G/zxcvDSX5vX9oQxAJ4z/zDWaP/G7FguX1rnioLKenkvBSPjw3oH8gRze3BEgz3Yi8KQ5y69PTjR'
+        '3B4c22AP9u6/7BgeHQ0Y6MZJ5nbjpAa70bIXpVHdCeVkc3tweoM9aBU98I/u1tuDU1Qmf/Wl+zy3'
+        'wQ6ca4Sn6u6a98mjTboEZazGPk1tWVQ9hPI5Ud0h2rOiv7/83/WPBV2B/ovN3YNcPc8gK9PnMZXB'
+        'NWUpcnrjw1TvIve7Gt2Amzu8l0yZeuvycxvtnNd+jOZFbu2ueY89xuTbmc8wCV7v8ceYfE/y8xqO'
+        'zKac3rtcAfUE1naMyTckn9mop86XPWXstp81Zp29Oo9YqI+qKfcVn2X2Ka7TjcPv3F2vI8ZuLFrb'
+        'IAma0ZhyT9HZcjTq4yYlpXp1frNeeHCOHK3W6Ejxnr4f4j1Xjlf7ykVjc9pZ+6E756nAonrho7Gu'
+        'rFva6PWxS5Y2pb5cZ9F4h23t9o8EV+NdqJ5hmt2v85vQL+/LG+qAsXrwgmZ0QDNWY+XdhSqxqu4h'
+        'SrE+vw5EfpdHpUw9ur+/umnK1Utl2Nqbw9VFTeiq93/UuGpvDlcXN6MD7WZwdd+9971uSor3EpXa'
+        'YQ4ZUuJVvxFiPg/gNOEZmksbDl/n00PeTx5j8rMzl6lsPQTH/cPufaPS+O0fqnNDnScNm7Tdcnkz'
+        '+uxNmdU5Yyf0iqZ0zpT7rtW9f6VF5QvnboPTSgP8NWkOeb753fI+tIBTyFUq8Xt8u9wBT9DlG3Tr'
+        'S2177P39VY0wr19mbjK+urHAK89uSZtRpmz5XSOHs8RfWtON6F0gPS1PAcYG7Np5Rzgbg+XYpozV'
+        'C9QuUpTWle5AnQc451jdlHtY2hsPw3v90qY8snmdjhER6b7210y5X2W9jnhY0WiEY2zndoPmZKcR'
+        '1LyqF6lHsz85pr9/TvMksMsX7EJRRzP66z3n2EaetDIGdKfWinefHVi3tPET5j3v2IXbjbi+CV3z'
+        'Xnvswu1G3CB1wLt1aeXPS/dUleAPukfcvqC56bdrXmGsUf3h7MHeY01eKL1Qjuo1y7UHx7p9eHTw'
+        'zrnPD5oyOhvnFcca1R/OHrzN7NHZJEf19jqjs7S/p+PmTV09osi519RbULvnFcsa1R9WPhRzbFMs'
+        '1iPHtmZFHYsNumrfhWbKEPXOK4w1qj+svC/XbIg2y1FVr9ikqBb2nWg3Nhhdo5sdrzB7OPvkgI/X'
+        'O5ym3IVgymnY0mCvjm/wNLzhWD33JLzJ7JO3Ve7m2/SevDlbkaachG0NRve2Bk/Cu8wezpvkgJ82'
+        '0QumDOrNDcb4dIOD+pFjm/Ia+1vksKur7kaGVqrjTRnXWxsMUHXNUGdcv2AyrOPj5/1//R7qBA=='
+    ),
+    'b6dbe19e4674340ad8733a4421b2cc11c15810ab9aacc33ed86379d0ccf101f3': (
+        'eNrs3Xt8m2d9/3+ak6pUqqqqd++q6klq1XPdo3o+OYnTuE7kxE6oOAY3casERQlRjFqgQiBOAjFO'
+        'whgQR4FmDvPsgTfP9g4+TRtbOQgwBoZnTWzY0zSmiZ3YtP3u635dvmz4ff8Yg0HLw308dL/vyo4j'
+        'S8/PQfIhya3v//vzX2D+90z22syWoz1nerLibNupntOx3tPm+fZI71O9pw8fORl9wvx/65ne0yeO'
+        'RXsisezLstc+k82c9XC24wWxZ7Lh7R1nEZuIzcQWYiuxjbAQZxNWYjtxDmEj7MS5hIM4j3AS5xMu'
+        '4gJCIy4kdOIiwk1cTHiIS4hLicuIy4krCC/hI64kriL8xNXENcS1xHXE9cQNxI3ETUQLcTNxC3Er'
+        'cRtxO3EHESDuJO4i7ibuIe4l7iPuJx4gHiQeIh4mWokdxE5iF9FG7CYeIfYQ7cSjRAexl9hHBIlO'
+        'Yj9xgOgiuomDxCHihcRjRIh4EfFi4iXES4mXES8nDhOvIHqIx4kjxFGil3iCeJIIE8eI48QriQhx'
+        'gogSJ4lTxKuI00SMOEP0Ea8m4sRTxNPEa4jXEq8jniESxOuJJPEG4o1EingT8WbiLcRbibcRaeLt'
+        'xDuIDPFO4jeIdxHvJt5DvJd4H5El3k/0Ex8gBogPEh8iPkzkiI8QHyU+Rnyc+ATxSSJPfIr4NFEg'
+        'fpMYJD5DfJb4HPF54reIIeK3iWFiJNab2XbsyejJ071Gs8tsP3y4/ZFgZ1fb4VuyPRn7k4dP9z7Z'
+        '+9ThJyI9T8aMHpix9sV6Dz/+9JneWDa92jfPPH2q1/iTRvs80/vUmb6eSDZz9mHz2sOHsxnrXvFO'
+        'O0Vv7cucQ9dda7VbT/dFemWbNW7N73CjvkB8kRglfpf4PWKM+H1inJggJok/IP6Q+CPij4kpYpqY'
+        'IWaJOeJPiCLxp8SfEV8i/pz4C+JZ4svEV4ivEl8jSsTXiW8Q3yTmiW8RC8S3ie8Q3yX+kvgesUj8'
+        'FbFElIm/JirE94m/If6W+AGxTKwQf0dUib8nasQ/ED8k/pGoE/9ENIgfEf9M/Avxr8S/Ef9O/Jj4'
+        'D+I/iSbxX8R/m7HvBQzgfWfJ3CRzs8wtMrfK3CbTIvNsmVaZ22WeI9Mm0y7zXJkOmefJdMo8X6ZL'
+        '5gUyNZkXytRlXiTTLfNimR6Zl8i8VOZlMi+XeYVMr0yfzCtlXiXTL/NqmdfIvFbmdTKvl3mDzBtl'
+        '3iSzRebNMm+ReavM22TeLvMOmQGZd8q8S+bdMu+Rea/M+2TeL/MBmQ/KfEjmwzJbZe6QuVPmLplt'
+        'MnfLfETmHpntMh+VKRe7fXtl7pMZlNkpc7/MAzK7ZHbLPCjzkMwXynxMZkjmi2S+WOZLZL5U5stk'
+        'vlzmYZmvkNkj83GZR2Qeldkr8wmZT8oMyzwm87jMV8qMyDwhMyrzpMxTMl8l87TMmMwzMvtkvlpm'
+        'XOZTMp+W+RqZr5X5OpnPyEzIfL3MpMw3yHyjzJTMN8l8s8y3yHyrzLfJTMt8u8x3yMzIfKfM35D5'
+        'Lpnvlvkeme+V+T6ZWZnvl9kv8wMyB2R+UOaHZH5YZk7mR2R+VObHZH5c5idkflJmXuanZH5aZkHm'
+        'b8oclPkZmZ+V+TmZn5f5WzKHZP62zGGZIzJ/R+YXZH5R5qjM35X5ezLHZP6+zHGZEzInZf6BzD+U'
+        '+Ucy/1jmlMxpmTMyZ2XOyfwTmUWZfyrzz2R+Seafy/wLmc/K/LLMr8j8qsyvySzJ/LrMb8j8psx5'
+        'md+SuSDz2zK/I/O7Mv9S5vdkLsr8K5lLMssy/1pmReb3Zf6NzL+V+QOZyzJXZP6dzKrMv5dZk/kP'
+        'Mn8o8x9l1mX+k8yGzB/J/GeZ/yLzX2X+m8x/l/ljmf8h8z9lNmX+l8z/lvmCTXL+y9wkc7PMLTK3'
+        'ytwm0yLzbJlWmdtlniPTJtMu81yZDpnnyXTKPF+mS+YFMjWZF8rUZV4k0y3zYpkemZfIvFTmZTIv'
+        'l3mFTK9Mn8wrZV4l0y/zapnXyLxW5nUyr5d5g8wbZd4ks0XmzTJvkXmrzNtk3i7zDpkBmXfKvEvm'
+        '3TLvkXmvzPtk3i/zAZkPynxI5sMyW2XukLlT5i6ZbTJ3y3xE5h6Z7TIflSlf0dm3V+Y+mUGZnTL3'
+        'yzwgs0tmt8yDMg/JfKHMx2SGZL5I5otlvmST8URsa+xMz+kzxrOh47FNL3hBj3q6xDOsLZGeyOls'
+        'eCazfb95Nc+pwpvF8yj7qZ4jr+w9etj4AOK52Y53tW17QXLr+ze94KzV1746jIPxvCzY9tje9mBb'
+        '1vi7wseeOJM90PHAW7KxjrPMJ2Mvam/buyub2Xa692jfkV7jbVMH3pLNbG7dtSsbPjuzrXX//rYg'
+        'p12twV2d+8Tp2bvaund2te9oE/+z9ZGuzkP7jbPwJuP/tnQa72++e1uw+1AX7/FYV/tB82zL/r2d'
+        'B82TA4fazZOzH2kLtnW18uat3Xvb2sSHylj2d3XuOrRTXnuwkw+0bVfbbvGJiNP2ffs7uw7y4fe0'
+        '7+U9u1rbu3lza3d3G2/esre9m5Pu1heab9z8SNtBPqO2fZ1ctWVvZ6v5WW7d33qID7F1517jg5hn'
+        '+1oP7tzD7ZdXGX90f1srH/axVj6V7bvadx5s7wy2dr3I/Mx2dgYPtgcPcXt2drXJT3LLwdYO+Rfs'
+        'advZIT+vXW1B84NsNj5F8712HwruNK/Y3dllZner+WG37mrby9m27ra9bTu5C3YYH76Dd+Nz23rw'
+        '0H7ulC07W+V90h5cvU+2tYV2tu3nL2zt7uDe2dP5GH9yTxdnW/a3c/ssxr3eunfvi+Rt3dsmH67W'
+        '1U992wvbutp3m2/fIu4F88S4Sdylrd0v4nOxtAd37j20iwdh/yHeLdi6j9v5WPtB807e1M490BZq'
+        'X32YDh7qAtXOPZ2dfDZb9sm7cfNB7m8DTztgLF1tBi/IbJaP5hYD0X7u2C4Qb+4+ZOa23e17D7aZ'
+        '9/GWq7De17HJKJwtXftbjas3H9j3mc2iXkTRhbeFLQeMRduokbA1/OLwduNyjnGxGRe7cdlkXM41'
+        'Lg7jcp5xcRqX842Ly7hcYFw043KhcdGNy0XGxW1cLjYuHuNyiXG51LhcZlwuNy5XGBevcfEZlyuN'
+        'y1XGxW9crjYu1xiXa43LdcbleuNyg3G50bjcZFxajMvNxuUW43KrcbnNuNxuXO4wLgHjcqdxucu4'
+        '3G1c7jEu9xqX+4zL/cblAePyoHF5yLg8bFxajcsO47LTuOwyLm3GZbdxecS47DEu7cblUePSYVz2'
+        'Gpd9xiVoXDqNy37jcsC4dBmXbuNy0LgcCr+4r2OLuCPd4o6NnWX0mu1n+k5Feo02duKMeW83jCuN'
+        'P2ScnRJnF4uzj4kznzj7sji7UJx9TpztFmcv3WSc3SHO3i3O7hZnrxJne8XZp8XZdnH2enF2hTj7'
+        'unGWOTfW8+rew08cW/+Xf0S8y13i7OPi7FFxlhK38pzTvWf6TkfX3vPfDBTG42iczYn3vFmcOcVN'
+        'OlecfVG89VrjrKNhnBwQV91jXJWxHj125MzaB3mF+KMPiLM/E291xHrPHO6JxY49ue4v6hN//bkn'
+        'T/VGf+q2JsUnsT0e/okrt4mb8JA4+4D42DvE2dnirEWc1cXNukCcvUP8ffYjJ0+cOtkXPbr252fE'
+        'e5wjzr4nznaKs1bx5x8WZ58XZzeJs0vEW88TZ2lx3X3i7LvmDYpFjh1Zd4PuEVee3RN75dpVXxSf'
+        '0dnic1VX/Yf4IA5xdkJ8ApeKs5vE2T5x5hYf4/ye2NPRI4ef6IseOXPsZPTw0d4nzD/6PfPhiR07'
+        '8ROKZsXtu1qcXSc+jFOcXSr+Ek2cPWne0sdP9/asu1nvE3/kHnGmiz9ynTjbvMU485hn4g7bfqLn'
+        'zJHw2h/ZYT425uue4WPRdZ/PtzHTEz168sTatSnx12qne0+cFPBOG2+KHIut+1NnxC24SJz9i7gF'
+        '14uzLeLsFnH2JnHWad5b4v12ibPfEtfZxFlG/I2WY0+sfbSceNtl5sMuzg6KswfFezlO9Bw5ffJw'
+        'LHwyfjjc23PUfO9bxfvsEWdHxN1kF2cXi/e2HumJrbtjzz/L7H3G2UvE2TXirEecXS7Otouzq8xi'
+        'E2dt4qxdfJTzzE/XeJBOnl73Cf+heKcOU5H5TtywJ0+f7Dt12Py6nVnAZpc43XNs/c0oij95vjjr'
+        'FmdXirOvibPbxVkZYT1Pr/2BT4g33ibOfizr+VRvz7qbcpP4rFvF2X+Zn3X82Jl1D/SF4q2XiLML'
+        'xNmD4uwqcfaIODsozm4U1T5vnNwqrjopHupz4sb61hdb+zDXbTLv0IhR48rvn4sbdqd5E80/E+k5'
+        '8fjRnrU/Myw++L3i7EPi7bYnxJcpI+s+s6+Jd+g2W6f54eM9x9Z9XtPmB/3ppnKNEOQXZ+eYrp8+'
+        '1htZ1wWuFFee13PmzOljj/ed6T3cc+RIbyxmvumKzZiIRNbePWBe95OWu83rTonPVF2XF7fF/sTJ'
+        '04d7e9aX0Vspx8jJI2vl2PFa8cnGno6d6T1x2HRhvmtYfFh3T9+TJ3qjZ4ztl09M/M/ah/uA+OSC'
+        '4uy14qxdnH1D3ElecfaU+Qn3/OS9NCeudMLvVOTkmcNHTkb6TkTNt+3dLO/B3vV0C+JDu8xa37xW'
+        'U5GTPUfNNm2+zx+I97lBnP2IO/To0cNnTv5U0R8wG2TfetzD4r1dfMSjvbEjxqPQq+qh48d07uiZ'
+        'Y9G+dX+oTXyG94uz0lm0KrPIV998mYnHeEh7T5xa97d/U/ypgDi7Xjjcb97HZ63dGcbncsZ4OqKK'
+        '8VZzchqN8+hPTaO/Mh/DIz/ZH//SfG95S/pOrH2YPvHXbhNnI6D+6a5+2ri6r2OrsYcZeyvbsfGp'
+        'v0csYtuMZ0+PmfVg7mUWsU78g7kbiLvbHX5p+GXhlxsbxGFjd3iFsTX0GPvC48amcMTYEY4a20Gv'
+        'sRc8YWwETxq7QDh8LHzcGPivNEZ9JHwiHDVG+kljmJ8yxvirjAF+2pjdsfCZcJ8xpV8djoefCj8d'
+        'fk34teHXGTP2GWO6Joy5+npjoibDbwi/0ZibKWNivsmYlW82puRbjPn4VmMyvi2cDr89/I5wJvzO'
+        '8G8YQ+5dxnh7tzHY3hN+b/h94Wz4/cac6jcm1AfCHwx/yJhPA8YQ+rAxfnLG4PlI+KPhj4U/Hv5E'
+        '+JPhfPhT4U8b46FgDIbfNEbCoDEMPmOMgc8aA+Bz4c+Hf8to9kNGm//t8HB4xGjlv2M08S+Evxge'
+        'Ndr17xqN+veMFj1mNOffN9ryeHgiPGl03j8I/2H4j8J/HJ4yeum00UVnjP45G54L/4nRKovhPw3/'
+        'mdESvxT+8/BfGM3vWaPtfdloeF8xOtzXwqXw18PfCH/T6Fzz4W+FF4wO9e3wd8LfNRrRX4a/F14M'
+        '/1V4yWgw5fBfhyvh74f/Jvy34R+El8Mr4b8LV8N/H66F/zFcD/9TuGHU6Y+MCv1nozb/Jfyv4X8L'
+        '/3v4x+H/CP+nUVrN8H+F/zt8w3HxhDZz3uHDcrYZ9Wm01FtNJecZSo6fZbz9+CZx2CwOW8Rhqzhs'
+        'EweLOJxtHML3H7eK8+3icI442MTBLt4UOH6uiP3HHeKq88TBKQ7ni4NLHC4QB00cLhQHXbz7tuMX'
+        'iXO3OFxsHPo6zjZobhJQg0KmVT1jeIBnDMevEX9sO3EOYSPsxCbiXMJBnEc4ifMJF3EBoREXEjpx'
+        'EeEmLiY8xCXEpcRlxOXEFYSX8BFXElcRfuJq4hriWuI64nriBuJG4iaihbiZuIW4lbiNuJ24gwgQ'
+        'dxJ3EXcT9xD3EvcR9xMPEA8SDxEPE63EDmInsYtoI3YTjxB7iHbiUaKD2EvsI4JEJ7GfOEB0Ed3E'
+        'QeKQGX0d25/JHr9EXGEYulcYOsd8qUe1RzF3Tfn7RY/esre122yM+y5XW8lDa7PYWDNowyvmOtTd'
+        'ZjyhNV+FEIva5tVnTyHzI/WcOXmCaSf+d9veHV2tO3nPd4srNhvdm1Ev/s9mfvjTva/uPR1j0m0R'
+        'XXzL/r2Hus3//Y64EVt3dh6ib+/bsWl1abzXfMfu9hfzwf/JfMe9nY+18VS7xRzOxpjoXTfzHzJX'
+        '252d+3aYr/6IobF5deWJbjbvh+4DO7gd5sfr7NrFx+v4D/Otq0/k3y7+8m3BQ/t2yL/upebn/mhn'
+        'e9D8309tWttjjD3VvG7MvO7Q/v1tXbySYlz3pdXnAuF1t/IPN5t3XFvwEfE6hnHFO82bfer0yaN9'
+        'R/hYy+YuZv65o8defewo993d4v22mn+D+f93bl7dpj+52dyBjC0s+uS6v+nN66+OnIz3njavjptj'
+        '37z1a+/7r+bNN+9gdfN/Z5N5fx7q6pJzdd8PzTumLdTefZAH0LJF3KZ97UH5gP5IvMPWg+372vj/'
+        '28x9ydwAep8y/sbYur/ytWtEIseM5aEHsSfMD7G7vUuS/c9N6z6LvlOn5Gdxm2l136G9B9v3i5ec'
+        'jKteZpLc1f7C9l18At81H/Ru8wVAwXv9/RE7Zfyl5mP/I/FOu/e27zff6RzxQezmfR/re/zM6R75'
+        'mORNMQc7d7Xyl/2N+bF3my8pimcS4sH4vllxm9UHONEXOXPsVORp8z1et9ksrkM7Dholww3askXd'
+        'O0d7I70/gfkHLPnmvdMbffJM2Ly2apZF71OnzDuh41r1SD5x7LQs4nvF32PpanthW5d8HJ81H7Xu'
+        'g13twUfMK7zmXWq+xLDunu/4G3EDzRtuLKC8omXeCHmPHT95jEX3O2alB8Wrf8b/HePx6Xtc7J+n'
+        'RPdhYTSVmZ/b2ic1ahLu3r+3nTtg6CyxvdnMV5h3du7tpLy+v9lc+iziST7zcIh5OMQ8HGIeDjEP'
+        'h5iHQ8zDIebhEPNwiHk4xDwcYh4OMQ+HmIdDzMMh5uEQ83CIeTjEPBxiHg4xD4eYh0PMwyHm4RDz'
+        'cIh5OMQ8HGIeDjEPh5iHQ8zDIebhEPNwiHk4xDwcYh4OMQ+HmIdDzMMh5uEQ83CIeTjEPBxiHg4x'
+        'D4eYh0PMwyHm4RDzcIh5OMQ8HGIeDjEPh5iHQ8zDIebhEPNwiHk4xDwcYh4OMQ+HmIdDzMMh5uEQ'
+        '83CIeTjEPBxiHg4xD4eYh0PMwyHm4RDzcIh5OMQ8HGIeDjEPh5iHQ+Y8tKsVyibJDENmGDLDkBmG'
+        'zDBWhrEyjJVhrAxjZRgrw1gZxsowVoaxMoyVYawMY2UYK8NYGcbKMFaGsTKMlWGsDGNlGCvDWBnG'
+        'yjBWhrEyjJVhrAxjZRgrw1gZxsowVoaxMoyVYawMY2UYK8NYGcbKMFaGsTKMlWGsDGNlGCvDWBnG'
+        'yjBWhrEyjJVhrAxjZRgrw1gZxsowVoaxMoyVYawMY2UYK8NYGcbKMFaGsTKMlWGsDGNlGCvDWBnG'
+        'yrBp5VxeV/7VPP270Zyam8wXT3/2J4GrTwDFkz/xJPA5/AQwYzW/4ChecWFT2Gy+CvYV5tgDm8wX'
+        'wH7ZTw9/Ec8B3yBu/1HzRRDzaaB8UvhzPBt0qOZ1r2xeYzSvMZrXGM1rjOY1xrwbo4eN0cPG6GFj'
+        '9LAxetgYPWyMHjZGDxujh43Rw8boYWP0sDF62Bg9bIweNkYPG6OHjdHDxuhhY/SwMXrYGD1sjB42'
+        'Rg8bo4eN0cPG6GFj9LAxetgYPWyMHjZGDxujh43Rw8boYWP0sDF62Bg9bIweNsZjMUYPG6OHjdHD'
+        'xuhhY/SwMXrYGA/0GD1sjB42Rg8bo4eN0cPG6GFj9LAxetgYPWyMHjZGDxujh43Rw8boYWP0sDF6'
+        '2Bg9bIweNkYPG6OHjdHDxuhhY/SwMXrYGD1szCRzniLzqCQzDplxyIxDZhwy45AZh8w4ZMYhMw6Z'
+        'cciMQ2YcMuOQGYfMOGTGITMOmXHIjENmHDLjkBmHzDhkxiEzDplxyIxDZhwy45AZh8w4ZMYhMw6Z'
+        'cciMQ2YcMuOQGYfMOGTGITMOmXHIjENmHDLjkBmHzDhkxiEzDplxyIxDZhwy45AZh8w4ZMYhMw6Z'
+        'cciMQ2YcMuOQGYfMOGTGITMOmXHIjENmHDLjkBmHzDhkxiEzDplxyIxDZhwy45AZN8k4FZk7JZlJ'
+        'yExCZhIyk5CZhMwkZCYhMwmZSchMQmYSMpOQmYTMJGQmITMJmUnITEJmEjKTkJmEzCRkJiEzCZlJ'
+        'yExCZhIyk5CZhMwkZCYhMwmZSchMQmYSMpOQmYTMJGQmITMJmUnITEJmEjKTkJmEzCRkJiEzCZlJ'
+        'yExCZhIyk5CZhMwkZCYhMwmZSchMQmYSMpOQmYTMJGQmITMJmUnITEJmEjKTkJmEzCRkJiEzCZlJ'
+        'yExCZhIyk5CZhMykSeZ8g8zxG8SgulEcbhKHFj6Dm8X5LeJwqzjcJg63cyPvEOcBcbhTHO4Sh7vF'
+        '4R5xuFcc7hOH+8XhAXF4UBweEoeHxYewHm8V5zvEYac47BKHNnHYLQ6PiMMecWjntj8qzjvEYa84'
+        '7BOHoDh0isN+cTggDl3i0C0OB8XhkDi8UBweE4eQOLxIHF4sDi8Rh5eKw8vE4eXicFgcXiEOPeLw'
+        'OEyPiPOj4tArDk+Iw5PiEBaHY+JwXBxeKQ4RcTghDlFxOCkOp8ThVeJwWhxi4nBGHPrE4dXiEBeH'
+        'p8ThaXF4jTi8VhxeJw7PiENCHF4vDklxeIM4vF++RtjxluzxN4orUuLwJnF4szi8RRzeKg5vE4e0'
+        'OLxdHN4h/uD3j2fE+TvF4TfE4V3i8G5xeI84vFcc3icOWXH4gDgMiMMHxeFD4vBhcciJw0fE4aPi'
+        '8DFx+Lg4fEIcPikOeXH4lDh8WhwK4vCb4jAoDp8Rh8+aJl3PZM0PKj6rr4tXPi9Qfe1h2dem6WvT'
+        '9LVp+to0fW2avjZNX5umr03T16bpa9P0tWn62jR9bZq+Nk1fm6avTdPXpulr0/S1afraNH1tmr42'
+        'TV+bBsw0fW2avjZNX5umr03T16bpa9P0tWn62jR9bZq+Nk1fm6avTdPXpulr0/S1afraNH1tmr42'
+        'TV+bpq9N09em6WvT9LVp+to0fW2avjZNX5umr03T16bpa9N0hWn62jR9bZq+Nk1fm6avTdPXpulr'
+        '07SMafraNH1tmr42TV+bpq9N09em6WvT9LVp+to0fW2avjZNX5umN0zT16bpa9OmIU2R2SHJzEJm'
+        'FjKzkJmFzCxkZiEzC5lZyMxCZhYys5CZhcwsZGYhMwuZWcjMQmYWMrOQmYXMLGRmITMLmVnIzEJm'
+        'FjKzkJmFzCxkZiEzC5lZyMxCZhYys5CZhcwsZGYhMwuZWcjMQmYWMrOQmYXMLGRmITMLmVnIzEJm'
+        'FjKzkJmFzCxkZiEzC5lZyMxCZhYys5CZhcwsZGYhMwuZWcjMQmYWMrOQmYXMLGRmITMLmVnIzEJm'
+        'FjKzkJmFzCxkZk0yF5pfPT7uNR+3/91rB8d9tK191rPMbxnb+Dryc/fryM+lLxbra1/r2/d281sZ'
+        'Llr31b8PiCvcG4va83xR+z9azlb3v48Y+98veVG7eB3SPQKpZ93mtiSuuGR1DHf8AVO4xBQuMYVL'
+        'TOESU7jEFC4xhUtM4RJTuMQULjGFS0zhElO4xBQuMYVLTOESU7jEFC4xhUtM4RJTuMQULjGFSwAq'
+        'MYVLTOESU7jEFC4xhUtM4RJTuMQULjGFS0zhElO4xBQuMYVLTOESU7jEFC4xhUtM4RJTuMQULjGF'
+        'S7SaElO4xBQuMYVLTOESU7jEFC7RtkpM4RJdosQULjGFS0zhElO4xBQuMYVLTOESLaTEFC4xhUtM'
+        '4RJTuMQULjGFS0zhElO4xBQu0SBLTOESU7hErygxhUtM4ZJp6lKD0OclobggdJna5F4iN7l5DM1j'
+        'aB5D8xiax9A8huYxNI+heQzNY2geQ/MYmsfQPIbmMTSPoXkMzWNoHkPzGJrH0DyG5jE0j6F5DM1j'
+        'aB5D8xiax9A8huYxNI+heQzNY2geQ/MYmsfQPIbmMTSPoXkMzWNoHkPzGJrH0DyG5jE0j6F5DM1j'
+        'aB5D8xiax9A8huYxNI+heQzNY2geQ/MYmsfQPIbmMTSPoXkMzWNoHkPzGJrH0DyG5jE0j6F5DM1j'
+        'aB5D8xiax9C8aehyReYOSWYBMguQWYDMAmQWILMAmQXILEBmATILkFmAzAJkFiCzAJkFyCxAZgEy'
+        'C5BZgMwCZBYgswCZBcgsQGYBMguQWYDMAmQWILMAmQXILEBmATILkFmAzAJkFiCzAJkFyCxAZgEy'
+        'C5BZgMwCZBYgswCZBcgsQGYBMguQWYDMAmQWILMAmQXILEBmATILkFmAzAJkFiCzAJkFyCxAZgEy'
+        'C5BZgMwCZBYgswCZBcgsQGYBMguQWYDMAmQWILNgkrli9dv1rhM9x/v/+vqh+XW9L/HjJ7+cryT+'
+        'mn/98PgXxCrxRfOBFl81PD5qanx+fsnw+O+uPRP4+b9e6FMd7IjsYIt0sEU62CIdbJEOtkgHW6SD'
+        'LdLBFulgi3SwRTrYIh1skQ62SAdbpIMt0sEW6WCLdLBFOtgiHWyRDrZIB1ukgy3SwRbpYIt0sEU6'
+        '2CIdbJEOtkgHW6SDLdLBFulgi3SwRTrYIh1skQ62SAdbpIMt0sEW6WCLdLBFOtgiHWyRDrbIY7FI'
+        'B1ukgy3SwRbpYIt0sEU62CKP8iIdbJEOtkgHW6SDLdLBFulgi3SwRTrYIh1skQ62SAdbpIMt0sEW'
+        '6WCLdLBFOtgiHWyRDrZIB1vE0yIdbJEOtkgHW6SDLdLBFk0yV6pVewYxS4hZQswSYpYQs4SYJcQs'
+        'IWYJMUuIWULMEmKWELOEmCXELCFmCTFLiFlCzBJilhCzhJglxCwhZgkxS4hZQswSYpYQs4SYJcQs'
+        'IWYJMUuIWULMEmKWELOEmCXELCFmCTFLiFlCzBJilhCzhJglxCwhZgkxS4hZQswSYpYQs4SYJcQs'
+        'IWYJMUuIWULMEmKWELOEmCXELCFmCTFLiFlCzBJilhCzhJglxCwhZgkxS4hZQswSYpYQs4SYJVPM'
+        'Vb/K75LZmG2/5NnG/jKx+S3Z58yU8697/eBzYu+6+tfxRa7VF2iWjXt+4wWv591XI69Rq1hYrmLL'
+        'DNZlBusyg3WZwbrMYF1msC4zWJcZrMsM1mUG6zKDdZnBusxgXWawLjNYlxmsywzWZQbrMoN1mcG6'
+        'zGBdZrAuY2KZwbrMYF1msC4zWJcZrMsM1mUG6zKDdZnBusxgXWawLjNYlxmsywzWZQbrMoN1mcG6'
+        'zGBdZrAuM1iXGazLNIxlBusyg3WZwbrMYF1msC4zWJdpRcsM1mWawDKDdZnBusxgXWawLjNYlxms'
+        'ywzWZTrEMoN1mcG6zGBdZrAuM1iXGazLDNZlBusyg3WZprfMYF1msC7TCpYZrMsM1mWTzLWCzGOC'
+        'zKFNB/jxl337WrPH/85863Xrut71outdv24OZ849fNj8PTD8bNst5rdSfm6z+XsQ/s8GtDmsxF/0'
+        '7+IvWp3Wq5NaTO2fZ1o/X74EtfH8c20y37Dx1aaN4bu6uNxvLC7PgUF84/PNpOiobxD79k+yNH9h'
+        'hrj6Z5aZsZwSP7V/mh+/+rH4iedfhdWMnd/Ts/7GPHWWcWN+ZsPyZwPXf6DzxT3zXNkrM9sPBXe1'
+        'dXXvNH/tmHHrlsR9/j81Lutnn1t8Sv8L8Df9kp6f81y1Lm7txuz/eWf/8R/KR/0L4isFz/tFoMX8'
+        '5zK65M+AGxvtY2KjPV41b94m8R43r1tne8U6e8uv8mWlX8T3TD0PXl76hX3P1D+Ef/jLQsoLUHvE'
+        'oPjFfwfVrepZ+pfls/Ttm8xn6WacQ9gIO7GJOJdwEOcRTuJ8wkVcQGjEhYROXES4iYsJD3EJcSlx'
+        'GXE5cQXhJXzElcRVhJ+4mriGuJa4jrieuIG4kbiJaCFuJm4hbiVuI24n7iACxJ3EXcTdxD3EvcR9'
+        'xP3EA8SDxEPEw0QrsYPYSewi2ojdxCPEHqKdeJToIPYS+4gg0UnsJw4QXUQ3cZA4ZEZfx22KzFcl'
+        'GRtkbJCxQcYGGRtkbJCxQcYGGRtkbJCxQcYGGRtkbJCxQcYGGRtkbJCxQcYGGRtkbJCxQcYGGRtk'
+        'bJCxQcYGGRtkbJCxQcYGGRtkbJCxQcYGGRtkbJCxQcYGGRtkbJCxQcYGGRtkbJCxQcYGGRtkbJCx'
+        'QcYGGRtkbJCxQcYGGRtkbJCxQcYGGRtkbJCxQcYGGRtkbJCxQcYGGRtkbJCxQcYGGRtkbJCxQcYG'
+        'GRtkbCaZ29ULO4+sjcFzjTdltnSJ3ztinpvfvmSe9XXcsW44psRwDCh0fyXRuUDnAp0LdC7QuUDn'
+        'Ap0LdC7QuUDnAp0LdC7QuUDnAp0LdC7QuUDnAp0LdC7QuUDnAp0LdC7QuUDnAp0LdC7QuUDnAp0L'
+        'dC7QuUDnAp0LdC7QuUDnAp0LdC7QuUDnAp0LdC7QuUDnAp0LdC7QuUDnAp0LdC7QuUDnAp0LdC7Q'
+        'uUDnAp0LdC7QuUDnAp0LdC7QuUDnAp0LdC7QuUDnAp0LdC7QuUDnAp0LdC7QuUDnMg3dqciUJBkN'
+        'MhpkNMhokNEgo0FGg4wGGQ0yGmQ0yGiQ0SCjQUaDjAYZDTIaZDTIaJDRIKNBRoOMBhkNMhpkNMho'
+        'kNEgo0FGg4wGGQ0yGmQ0yGiQ0SCjQUaDjAYZDTIaZDTIaJDRIKNBRoOMBhkNMhpkNMhokNEgo0FG'
+        'g4wGGQ0yGmQ0yGiQ0SCjQUaDjAYZDTIaZDTIaJDRIKNBRoOMBhkNMhpkNMhokNEgo5lk7lJkfiDJ'
+        '6JDRIaNDRoeMDhkdMjpkdMjokNEho0NGh4wOGR0yOmR0yOiQ0SGjQ0aHjA4ZHTI6ZHTI6JDRIaND'
+        'RoeMDhkdMjpkdMjokNEho0NGh4wOGR0yOmR0yOiQ0SGjQ0aHjA4ZHTI6ZHTI6JDRIaNDRoeMDhkd'
+        'MjpkdMjokNEho0NGh4wOGR0yOmR0yOiQ0SGjQ0aHjA4ZHTI6ZHTI6JDRIaNDRoeMDhndJHO3eHWt'
+        'Kp+7toqvA5hz7mEx5/o67vmVvva2+kLkYWPkbrw2vPGFWV4eu3fj5bGfeqVh9bWnDq/5a5s3vkz2'
+        'f/3q2H3rflghKtb7+9XgfakcvD4Gr4/B62Pw+hi8Pgavj8HrY/D6GLw+Bq+Pwetj8PoYvD4Gr4/B'
+        '62Pw+hi8Pgavj8HrY/D6GLw+Bq+Pwetj8PoYvD4Gr4/B62Pw+hi8Pgavj8HrY/D6GLw+Bq+Pwetj'
+        '8PoYvD4Gr4/B62Pw+hi8Pgavj8HrY/D6GLw+Bq+Pwetj8PoYvD4Gr4/B62Pw+hi8Pgavj8HrY/D6'
+        'GLw+Bq+Pwetj8PoYvD4Gr4/B62Pw+hi8Pgavj8HrY/D6GLw+Bq+Pwetj8PoYvD4Gr4/B62Pw+hi8'
+        'Pgavzxy8D6x7inihMPSgMHSjMLRfDF/jHrjafMeH1v1w1RfEOz68+j3rW8X/ta5Z3PfVTeKaHeID'
+        'WcUHusf8QOccbwFVC6haQNWCnxb8tCCmBSotUGmBSgscWuDQwiPfwiPfwmPdwoPcwqPbwqPbwiPY'
+        'wqPUwqPUwsPTwsPTwsPTwkPQwkPQwn3fwt3cwt3cwh3bwh3bwj1qxjZiO2Ej7MQm4lzCQZxHXEBo'
+        'xIWEm7iYuIS4gvASPuJK4mriGuJa4gbiRqKFuIW4nbiDCBB3EncT9xD3EvcRDxI7iJ3ELuIQ0Ubs'
+        'IR4lOoi9RCexn+g2o69jp9jzHJtA9rvyFQ4h6vHNYg3cta7fjQlibarfnZT9LsBDEKDfBXgkAjwS'
+        'AR6CAA9BgIcggMkAJgOYDPC4BHhcAjwuAaAGgBrgUQrwKAVgG+DBCqA3gN4AegM8ggEewQCPYIBH'
+        'MIDsALIDPJ4BHs8Aj2cA7gG4B3h0Azy6AfAHeJAD1ECAxzpAKQQohQCPfIBHPsAjH+CRD1AmAQAE'
+        'ABAAQAAAAUooQAkF4BCgkgJUUoBKCmAkgJEARgLgCFBlAaosAJUAxRZATAAxAcQEqMAAFRjATwA/'
+        'AeoxQD0G0BSgLAOYDJi2dgtbqx3q0bNWcRl2tpovpplr+d3ixTTr4cOtwc7g4Vtvzf7UFbfJK7Z2'
+        '723t3vPTb739p6+4Q15hEb+yV/yGW/53S/fB1i7Oj2/eJP/Wvo5HNr7pZeOJza/qic3qc9y/NCph'
+        '3ZOcPc+JJznqi9rNs37OX2u58c2Az79nOe3yX9noKIiR/+i6ffX74oqO9a8cPWj+auzDh3tOPxkz'
+        'v5H18B38BnTz5w7kYvFhsUvsVavDxXJ1CLI6BFkdgqwOQVaHIKtDkNUhyOoQZHUIsjoEWR2CrA5B'
+        'Vocgq0OQ1SHI6hBkdQiyOgRZHYKsDkFWhyCrQ5DVIcjqEGR1CLI6BFkdgqwOQVaHIKtDkNUhyOoQ'
+        'ZHUIsjoEWR2CrA5BVocgq0OQ1SHI6hBkdQiyOgRZHYKsDkFWhyCrQ5DVIcjqEGR1CLI6BFkdgqwO'
+        'QVaHIKtDkNUhyOoQZHUIsjoEWR2CrA5BVocgq0OQ1SHI6hBkdQiyOgRZHYKsDkFWhyCrQ5DVIcjq'
+        'EGR1CLI6BFkdgqwOQVaHoDmZ961fHd5h/m7yXZ38fvFvie/IWv1uu4VN67aKzWtbxUEx5O/ZtHp2'
+        'rzq7T53dr84eUGcPqrOH1Nnm1bO+juC6ShgSldCpSF8uSYcgHYJ0CNIhSIcgHYJ0CNIhSIcgHYJ0'
+        'CNIhSIcgHYJ0CNIhSIcgHYJ0CNIhSIcgHYJ0CNIhSIcgHYJ0CNIhSIcgHYJ0CNIhSIcgHYJ0CNIh'
+        'SIcgHYJ0CNIhSIcgHYJ0CNIhSIcgHYJ0CNIhSIcgHYJ0CNIhSIcgHYJ0CNIhSIcgHYJ0CNIhSIcg'
+        'HYJ0CNIhSIcgHYJ0CNIhSIcgHYJ0CNIhSIcgHYJ0CNIhSIdMPPufka+wXy+YxjoO/Py/fWrjF049'
+        't3/h1OovB4s8x/6poq51A7yjaNy2R+WcLok53f3rAVPd+5vF7yXfUPp8+LVoB9dvlq/6/22WAXMB'
+        'uF99rfJqvlZ5aPVl0UdFX30h//LInlb+hZiOz8h/eKTjT5nQESZ0hAkdYUJHmNARXjmMMKgjDOoI'
+        'gzrCoI4wqCMM6giDOsKgjjCoIwzqCIM6wqCOMKgjDOoIgzrCoI4wqCMM6giDOsKgjjCoIwzqCIM6'
+        'wqCOMKgjDOoIgzrCoI4wqCMM6giDOsKgjjCoIwzqCIM6wqCOMKgjDOoIgzrCoI4wqCMM6giDOsKg'
+        'jjCoIwzqCIM6wqCOMKgjDOoIgzrCoI4wqCMM6giDOsKgjjCoIwzqCIM6wqCOMKgjDOoIgzrCoI4w'
+        'qCMM6giDOsKgjjCoIwzqCIM6wqCOmIP6MbXUvVAudVHIRCEThUwUMlHIRCEThUwUMlHIRCEThUwU'
+        'MlHIRCEThUwUMlHIRCEThUwUMlHIRCEThUwUMlHIRCEThUwUMlHIRCEThUwUMlHIRCEThUwUMlHI'
+        'RCEThUwUMlHIRCEThUwUMlHIRCEThUwUMlHIRCEThUwUMlHIRCEThUwUMlHIRCEThUwUMlHIRCET'
+        'hUwUMlHIRCEThUwUMlHIRCEThUwUMlHIRCEThUwUMlHIRE0yoXUvkx8STehFopEdl1P1W6sd6E/g'
+        'FINTDE4xOMXgFINTDE4xOMXgFINTDE4xOMXgFINTDE4xOMXgFINTDE4xOMXgFINTDE4xOMXgFINT'
+        'DE4xOMXgFINTDE4xOMXgFINTDE4xOMXgFINTDE4xOMXgFINTDE4xOMXgFINTDE4xOMXgFINTDE4x'
+        'OMXgFINTDE4xOMXgFINTDE4xOMXgFINTDE4xOMXgFINTDE4xOMXgFINTDE4xOMXgFINTDE4xOMXg'
+        'FINTzOT04nXPM38oOL1EtaQXy5YUx1AcQ3EMxTEUx1AcQ3EMxTEUx1AcQ3EMxTEUx1AcQ3EMxTEU'
+        'x1AcQ3EMxTEUx1AcQ3EMxTEUx1AcQ3EMxTEUx1AcQ3EMxTEUx1AcQ3EMxTEUx1AcQ3EMxTEUx1Ac'
+        'Q3EMxTEUx1AcQ3EMxTEUx1AcQ3EMxTEUx1AcQ3EMxTEUx1AcQ3EMxTEUx1AcQ3EMxTEUx1AcQ3EM'
+        'xTEUx1AcQ3EMxTEUx1AcQ3EMxTEUx1DcNPRScw1qO3Coda+5Nb3c/AFE8VpG16bVryZ0i7Oqer1E'
+        'vXISfuwX+AJKX8fL1Ne3D8ivb7/OvP7lSvWKVJ1AdQLVCVQnUJ1AdQLVCVQnUJ1AdQLVCVQnUJ1A'
+        'dQLVCVQnUJ1AdQLVCVQnUJ1AdQLVCVQnUJ1AdQLVCVQnUJ1AdQLVCVQnUJ1AdQLVCVQnUJ1AdQLV'
+        'CVQnUJ1AdQLVCVQnUJ1AdQLVCVQnUJ1AdQLVCVQnUJ1AdQLVCVQnUJ1AdQLVCVQnUJ1AdQLVCVQn'
+        'UJ1AdQLVCVQnUJ1AdQLVCVQnUJ1AdQLVCVQnUJ1AdcIkc1iReZkkk4RMEjJJyCQhk4RMEjJJyCQh'
+        'k4RMEjJJyCQhk4RMEjJJyCQhk4RMEjJJyCQhk4RMEjJJyCQhk4RMEjJJyCQhk4RMEjJJyCQhk4RM'
+        'EjJJyCQhk4RMEjJJyCQhk4RMEjJJyCQhk4RMEjJJyCQhk4RMEjJJyCQhk4RMEjJJyCQhk4RMEjJJ'
+        'yCQhk4RMEjJJyCQhk4RMEjJJyCQhk4RMEjJJyCQhk4RMEjJJyCQhk4RM0iTzivWr2OnVVexL6Emh'
+        'J4WeFHpS6EmhJ4WeFHpS6EmhJ4WeFHpS6EmhJ4WeFHpS6EmhJ4WeFHpS6EmhJ4WeFHpS6EmhJ4We'
+        'FHpS6EmhJ4WeFHpS6EmhJ4WeFHpS6EmhJ4WeFHpS6EmhJ4WeFHpS6EmhJ4WeFHpS6EmhJ4WeFHpS'
+        '6EmhJ4WeFHpS6EmhJ4WeFHpS6EmhJ4WeFHpS6EmhJ4WeFHpS6EmhJ4WeFHpS6EmhJ4WeFHpS6Emh'
+        'J2Xq6eEHgIwB+t7VLzUcv9V8y+Orr+fewOu5R1RrelK2pjS40uBKgysNrjS40uBKgysNrjS40uBK'
+        'gysNrjS40uBKgysNrjS40uBKgysNrjS40uBKgysNrjS40uBKgysNrjS40uBKgysNrjS40uBKgysN'
+        'rjS40uBKgysNrjS40uBKgysNrjS40uBKgysNrjS40uBKgysNrjS40uBKgysNrjS40uBKgysNrjS4'
+        '0uBKgysNrjS40uBKgysNrjS40uBKgysNrjS40uBKgysNrjS40iaho+tb05WrrWkWPRn0ZNCTQU8G'
+        'PRn0ZNCTQU8GPRn0ZNCTQU8GPRn0ZNCTQU8GPRn0ZNCTQU8GPRn0ZNCTQU8GPRn0ZNCTQU8GPRn0'
+        'ZNCTQU8GPRn0ZNCTQU8GPRn0ZNCTQU8GPRn0ZNCTQU8GPRn0ZNCTQU8GPRn0ZNCTQU8GPRn0ZNCT'
+        'QU8GPRn0ZNCTQU8GPRn0ZNCTQU8GPRn0ZNCTQU8GPRn0ZNCTQU8GPRn0ZNCTQU8GPRn0ZEw9vRtf'
+        'QHouvTSvvt7gE69P/3q/Tv/ExjfObXzj3K/6G+cu+8lvnHtyw+Qv3OTqXZ0w7uoNnz/7T6yF1XOC'
+        'o/I5QZatLstWl2Wry7LVZdnqsmx1Wba6LFtdlq0uy1aXZavLstVl2eqybHVZtrosW12WrS7LVpdl'
+        'q8uy1WXZ6rJsdVm2uixbXZatLstWl2Wry7LVZdnqsmx1Wba6LFtdlq0uy1aXZavLstVl2eqybHVZ'
+        'trosW12WrS7LVpdlq8uy1WXZ6rJsdVm2uixbXZatLstWl2Wry7LVZdnqsmx1Wba6LFtdlq0uy1aX'
+        'ZavLstVl2eqybHVZtrosW12WrS7LVpdlq8uy1WXZ6rJsdVm2uixbXZatLstWl2Wry7LVZdnqsuZW'
+        'd0yRuVKS6YdMP2T6IdMPmX6s9GOlHyv9WOnHSj9W+rHSj5V+rPRjpR8r/Vjpx0o/Vvqx0o+Vfqz0'
+        'Y6UfK/1Y6cdKP1b6sdKPlX6s9GOlHyv9WOnHSj9W+rHSj5V+rPRjpR8r/Vjpx0o/Vvqx0o+Vfqz0'
+        'Y6UfK/1Y6cdKP1b6sdKPlX6s9GOlHyv9WOnHSj9W+rHSj5V+rPRjpR8r/Vjpx0o/Vvqx0o+Vfqz0'
+        'Y6UfK/1Y6cdKP1b6sdKPlX7TynFl5QlpZQArA1gZwMoAVgZoLwOQGYDMAGQGIDMAmQHIDEBmADID'
+        'kBmAzABkBiAzAJkByAxAZgAyA5AZgMwAZAYgMwCZAcgMQGYAMgOQGYDMAGQGIDMAmQHIDEBmADID'
+        'kBmAzABkBiAzAJkByAxAZgAyA5AZgMwAZAYgMwCZAcgMQGYAMgOQGYDMAGQGIDMAmQHIDEBmADID'
+        'kBmAzABkBiAzAJkByAxAZgAyA5AZgMwAZAYgMwCZAcgMQGYAMgMmmVfK75XZ13mWeNEqogQ9JgXl'
+        'EJRDUA5BOQTlEJRDUA5BOQTlEJRDUA5BOQTlEJRDUA5BOQTlEJRDUA5BOQTlEJRDUA5BOQTlEJRD'
+        'UA5BOQTlEJRDUA5BOQTlEJRDUA5BOQTlEJRDUA5BOQTlEJRDUA5BOQTlEJRDUA5BOQTlEJRDUA5B'
+        'OQTlEJRDUA5BOQTlEJRDUA5BOQTlEJRDUA5BOQTlEJRDUA5BOQTlEJRDUA5BOQTlEJRDUA5BOQTl'
+        'EJQzBZ3YeNnhf/Oyg3p54Fzx8sDGtwf+b152iK5+o98donedfCZ7/GnxVebXGIdYxynVynbLVpan'
+        'leVpZXlaWZ5WlqeV5WlleVpZnlaWp5XlaWV5WlmeVpanleVpZXlaWZ5WlqeV5WlleVpZnlaWp5Xl'
+        'aWV5WlmeVpanleVpZXlaWZ5WlqeV5WlleVpZnlaWp5XlaWV5WlmeVpanleVpZXlaWZ5WlqeV5Wll'
+        'eVpZnlaWp5XlaWV5WlmeVpanleVpZXlaWZ5WlqeV5WlleVpZnlaWp5XlaWV5WlmeVpanleVpZXla'
+        'WZ5WlqeV5WlleVpZnlaWp5XlaWV5WlmeVpanleVpZXlaWZ5WlqeV5c1W9qp1P2XS8Ur5+vu+iORT'
+        'gE8BPgX4FOBTgE8BPgX4FOBTgE8BPgX4FOBTgE8BPgX4FOBTgE8BPgX4FOBTgE8BPgX4FOBTgE8B'
+        'PgX4FOBTgE8BPgX4FOBTgE8BPgX4FOBTgE8BPgX4FOBTgE8BPgX4FOBTgE8BPgX4FOBTgE8BPgX4'
+        'FOBTgE8BPgX4FOBTgE8BPgX4FOBTgE8BPgX4FOBTgE8BPgX4FOBTgE8BPgX4FOBTgE8BPgX4FOBT'
+        'gE/B5HNa/QNcf4aYQcQMImYQMYOIGUTMIGIGETOImEHEDCJmEDGDiBlEzCBiBhEziJhBxAwiZhAx'
+        'g4gZRMwgYgYRM4iYQcQMImYQMYOIGUTMIGIGETOImEHEDCJmEDGDiBlEzCBiBhEziJhBxAwiZhAx'
+        'g4gZRMwgYgYRM4iYQcQMImYQMYOIGUTMIGIGETOImEHEDCJmEDGDiBlEzCBiBhEziJhBxAwiZhAx'
+        'g4gZRMwgYgYRM4iYQcQMImYQMYOIGUTMoCkmJhqO+UORRp+5e+03Sn7WfOuZjVcwN15V/5++arn6'
+        'u+Zv3fz//gX1/ADvDuONv6DXMvvW271rze5vm3Zfrbavq+T4HKEZjtAMR2iGIzTDEbrgCF1whC44'
+        'QhccoQuO0AVH6IIjdMERuuAIXXCELjhCFxyhC47QBUfogiN0wRG64AhdcIQuOEIXHKELjtAFR+iC'
+        'I3TBEbrgCF1whC44QhccoQuO0AVH6IIjdMERuuAIXXCELjhCFxyhC47QBUfogiN0wRG64AhdcIQu'
+        'OEIXHKELjtAFR+iCI3TBEbrgCF1whC44QhccoQuO0AVH6IIjdMERuuAIXXCELjhCFxyhC47QBUfo'
+        'giN0wRG64AhdcIQuOEIXHKELjtAFR+iCI3TBEdNKfHWNv1is8U8pOT4pZxQ5o8gZRc4ockaRM4qc'
+        'UeSMImcUOaPIGUXOKHJGkTOKnFHkjCJnFDmjyBlFzihyRpEzipxR5IwiZxQ5o8gZRc4ockaRM4qc'
+        'UeSMImcUOaPIGUXOKHJGkTOKnFHkjCJnFDmjyBlFzihyRpEzipxR5IwiZxQ5o8gZRc4ockaRM4qc'
+        'UeSMImcUOaPIGUXOKHJGkTOKnFHkjCJnFDmjyBlFzihyRpEzipxR5IwiZxQ5o8gZRc4ockZNOU9v'
+        '/EsDay86iN+u3/EOo2I2/smB/8sXHV5jdKvdYtJevlm0q9eq37G2T/6OtQm6zwTdZ4LuM0GjmaDR'
+        'TNBaJugpE/SUCXrKBH1jgr4xQYuYoEVM0BQm6AYTtIEJ2sAEpT5BOU9QzhPU8QR1PEEdT1CrE9Tq'
+        'BEU6QT1OUI8TVOAEFThB6U3wO9YmaMcT9OEJ+vAEfXiCPjxBH56g5U7QcidouRM02Qma7ATddYJG'
+        'OkEjnaCRTtBIJ2idE7TOCVrnBM1ygmY5QZecoD1O0BAnaIgTNMQJGuIEnXCCTjhBJ5ygE07Q+yZo'
+        'cxO0uQna3ARtboLGNkFHm6CjTdDRJuhhE/SwCbrWhNmnXrfuV/NdZrJ5ZvUnW4+7zR+wEIAe5MdX'
+        'E2oAHpQDcIp7fIoBOMUdP8UdP8XzyCnu/ynu/ynu/ykkTiFxColTPChTPChTPChT8JyC5xQP0RQP'
+        '0RRYp3ikpjA7hdkpzE7x8E3x8E3x8E3x8E3heQrPUzyYUzyYUzyYUyCfAvkUD+0UD+0U5Kd4hKeQ'
+        'P8UDPUUBTFEAUzzsUzzsUzzsUzzsUxTHFI/+FI/+FI/+FI/+FIUzReFMYWGK+pmifqaonymATAFk'
+        'CiBTAJmitqaorSm4TFFiU6iZQs0UaqaouynqbgpDUxiaogqnqMIpRE1RjFPMwSnT1+sVmeOSzAxk'
+        'ZiAzA5kZyMxAZgYyM5CZgcwMZGYgMwOZGcjMQGYGMjOQmYHMDGRmIDMDmRnIzEBmBjIzkJmBzAxk'
+        'ZiAzA5kZyMxAZgYyM5CZgcwMZGYgMwOZGcjMQGYGMjOQmYHMDGRmIDMDmRnIzEBmBjIzkJmBzAxk'
+        'ZiAzA5kZyMxAZgYyM5CZgcwMZGYgMwOZGcjMQGYGMjOQmYHMDGRmIDMDmRnIzEBmBjIzkJmBzAxk'
+        'ZiAzA5kZyMxAZsYkk1RkXinJzEFmDjJzkJmDzBxk5iAzB5k5yMxBZg4yc5CZg8wcZOYgMweZOcjM'
+        'QWYOMnOQmYPMHGTmIDMHmTnIzEFmDjJzkJmDzBxk5iAzB5k5yMxBZg4yc5CZg8wcZOYgMweZOcjM'
+        'QWYOMnOQmYPMHGTmIDMHmTnIzEFmDjJzkJmDzBxk5iAzB5k5yMxBZg4yc5CZg8wcZOYgMweZOcjM'
+        'QWYOMnOQmYPMHGTmIDMHmTnIzEFmDjJzkJmDzBxk5kwyb1Bk2iSZImSKkClCpgiZImSKkClCpgiZ'
+        'ImSKkClCpgiZImSKkClCpgiZImSKkClCpgiZImSKkClCpgiZImSKkClCpgiZImSKkClCpgiZImSK'
+        'kClCpgiZImSKkClCpgiZImSKkClCpgiZImSKkClCpgiZImSKkClCpgiZImSKkClCpgiZImSKkClC'
+        'pgiZImSKkClCpgiZImSKkClCpgiZImSKkClCpgiZImSKkClCpgiZImSKJpk3rv3k8r7rzMUntfHl'
+        '4ufzL5BRX7a2id+i8/x65vYm9dtkjBaWOUv9crhn+RHnZ9WPOD+rfsT5WfUjzs+qH3F+Vv2I87Pq'
+        'R5yfVT/i/Kz6HXHP8nTJDCuxnTiHsBF2YhNxLuEgziOcxPmEi7iA0IgLCZ24iHATFxMe4hLiUuIy'
+        '4nLiCsJL+IgriasIP3E1cQ1xLXEdcT1xA3EjcRPRQtxM3ELcStxG3E7cQQSIO4m7iLuJe4h7ifuI'
+        '+4kHiAeJh4iHiVZiB7GT2EUcItqI3cQjxB6inXiU6CD2EvuIINFJ7CcOEF1EN3EQMo5VMplNBzuz'
+        'nG1uDe6Sp9vMn9zvlv+3aceLOOOfGjOvswY7Dx7m5/u5Yvvetu7un7hmU3tQnm0Rb1u9trNr9dr2'
+        'oPq77Y90tbUebOv6iQ+w9VB3e/AR+T8W+R6rH6ZVfsC+jjerfyXtJWtfF/ie+iy/Z77TW54T/6LM'
+        '1zb+RZmN789XX9N66/oJ8Ya1CVFmQpTVhCirCVFWE6KsJkRZTYiymhBlNSHKakKUmRBlJkSZCVFm'
+        'QpSZEGUmRJkJUWZClJkQZSZEmQlRZkKUmRBlJkSZCVFmQpSZEGUmRJkJUWZClJkQZSZEmQlRZkKU'
+        'mRBlJkSZCVFmQpSZEGUmRJkJUWZClJkQZSZEmQlRZkKUmRBlJkSZCVFmQpSZEGUmRJkJUWZClJkQ'
+        'ZSZEmQlRZkKUmRBlJkSZCVFmQpSZEGUmRJkJUWZClJkQZSZEmQlRZkKUmRBlJkSZCVFmQpSZEGUm'
+        'RJkJUWZClJkQZSZEmQlRZkKUmRBlJkSZCVFmQpSZEGUmRJkJUVa90zz7sjr7ijr7qjr7mjr7/Krd'
+        '4yV13dfV2TfU2TfV2bw6+5Y6W1Bn31Zn31Fn31096+t42/rqeWateipUT0VVT0VVT0VVT0VVT0VV'
+        'T0VVT0VVT0VVT4XqqVA9FaqnQvVUqJ4K1VOheipUT4XqqVA9FaqnQvVUqJ4K1VOheipUT4XqqVA9'
+        'FaqnQvVUqJ4K1VOheipUT4XqqVA9FaqnQvVUqJ4K1VOheipUT4XqqVA9FaqnQvVUqJ4K1VOheipU'
+        'T4XqqVA9FaqnQvVUqJ4K1VOheipUT4XqqVA9FaqnQvVUqJ4K1VOheipUT4XqqVA9FaqnQvVUqJ4K'
+        '1VOheipUT4XqqVA9FaqnQvVUqJ4K1VOheipUT4XqqVA9FaqnQvVUqJ4K1VOheiqqeiqqeiqqeiqq'
+        'eiqqeiqqeiqqeiqqeiqqeiqqeiqqeiqqeiqqeiqqeiqqeiqqeipm9aR/vZ8YqyeOfy2eOG78mtXn'
+        '0hPjt6t9vX1tX/+BqpofqGr4gSn1Hep1QK98HXCF5rtC812h+a7QfFfouit03RW67gpdd4Wuu0LX'
+        'XaHrrtB1V+i6K3TdFbruCl13ha67Qtddoeuu0HVX6LordN0Vuu4KXXeFrrtC112h667QdVfouit0'
+        '3RW67gpdd4Wuu0LXXaHrrtB1V+i6K3TdFbruCl13ha67Qtddoeuu0HVX6LordN0Vuu4KXXeFrrtC'
+        '112h667QdVfouit03RW67gpdd4Wuu0LXXaHrrtBuV2i3K7TbFdrtCu12hXa7Qrtdod2u0G5XaLcr'
+        'tNsV2u0K7XaFdrtCu12h3a7Q5VdMK5n1O0FybSeoshNU1U5QVTtBVe0EVbUTVNVOUFU7QVXtBFW1'
+        'E1TZCarsBFVYVmFZhWUVllV2gio6q+isorOKzio6q+isorOKzio6q+isorOKzio6q+isorOKzio6'
+        'q+isorOKzio6q+isorOKzio6q+isorOKzio6q+isorOKzio6q+isorOKzio6q+isorOKzio6q+is'
+        'orOKzio6q+isorOKzio6q+isorOKzio6q+isorOKlipIqyCtgrQK0ipIqyCtgrQK0ipIqyCtgrQK'
+        '0ipIqyCtgrQK0qrqblW1E1TVTlBVO0FV7QRV1QWraieoqp2gqnaCqtoJqmonqKqdoKp2gqraCapq'
+        'J6iqnaBqVs8711fP59eqp0b11FT11FT11FT11FT11FT11FT11FT11FT11KieGtVTo3pqVE+N6qlR'
+        'PTWqp0b11KieGtVTo3pqVE+N6qlRPTWqp0b11KieGtVTo3pqVE+N6qlRPTWqp0b11KieGtVTo3pq'
+        'VE+N6qlRPTWqp0b11KieGtVTo3pqVE+N6qlRPTWqp0b11KieGtVTo3pqVE+N6qlRPTWqp0b11Kie'
+        'GtVTo3pqVE+N6qlRPTWqp0b11KieGtVTo3pqVE+N6qlRPTWqp0b11KieGtVTo3pqVE+N6qlRPTWq'
+        'p0b11KieGtVTo3pqVE+N6qlRPTWqp6aqp6aqp6aqp6aqp6aqp6aqp6aqp6aqp6aqp6aqp6aqp6aq'
+        'p6aqp6aqp6aqp6aqp2ZWz2+sfl/pn4ovPL1rfS29fq2W6tRSXdVSXdVSXdVSXdVSXdVSXdVSXdVS'
+        'XdVSnVqqU0t1aqlOLdWppTq1VKeW6tRSnVqqU0t1aqlOLdWppTq1VKeW6tRSnVqqU0t1aqlOLdWp'
+        'pTq1VKeW6tRSnVqqU0t1aqlOLdWppTq1VKeW6tRSnVqqU0t1aqlOLdWppTq1VKeW6tRSnVqqU0t1'
+        'aqlOLdWppTq1VKeW6tRSnVqqU0t1aqlOLdWppTq1VKeW6tRSnVqqU0t1aqlOLdWppTq1VKeW6tRS'
+        'nVqqU0t1aqlOLdWppTq1VKeW6tRSnVqqU0t1aqlOLdWppTq1VKeW6qqW6qqW6qqW6qqW6qqW6qqW'
+        '6qqW6qqW6qqW6qqW6qqW6qqW6qqW6qqW6qqW6qqW6mYtvXt99XxurXoaVE9DVU9DVU9DVU9DVU9D'
+        'VU9DVU9DVU9DVU+D6mlQPQ2qp0H1NKieBtXToHoaVE+D6mlQPQ2qp0H1NKieBtXToHoaVE+D6mlQ'
+        'PQ2qp0H1NKieBtXToHoaVE+D6mlQPQ2qp0H1NKieBtXToHoaVE+D6mlQPQ2qp0H1NKieBtXToHoa'
+        'VE+D6mlQPQ2qp0H1NKieBtXToHoaVE+D6mlQPQ2qp0H1NKieBtXToHoaVE+D6mlQPQ2qp0H1NKie'
+        'BtXToHoaVE+D6mlQPQ2qp0H1NKieBtXToHoaVE+D6mlQPQ2qp0H1NKieBtXToHoaqnoaqnoaqnoa'
+        'qnoaqnoaqnoaqnoaqnoaqnoaqnoaqnoaqnoaqnoaqnoaqnoaqnoaZvW8Z+ObHp5vL+eo16tc4vWq'
+        '5+9rO++V367ecatYgt63AfHX4rtvzjvreffdN9nnxD9k++vwb9eu/mO8HecaCDb+Hdv/OcH3r19i'
+        'E2tLbJMltqmW2KZaYptqiW2qJbapltimWmKbaoltqiW2yRLbZIltssQ2WWKbLLFNltgmS2yTJbbJ'
+        'EttkiW2yxDZZYpsssU2W2CZLbJMltskS22SJbbLENllimyyxTZbYJktskyW2yRLbZIltssQ2WWKb'
+        'LLFNltgmS2yTJbbJEttkiW2yxDZZYpsssU2W2CZLbJMltskS22SJbbLENllimyyxTZbYJktskyW2'
+        'yRLbZIltssQ2WWKbLLFNltgmS2yTJbbJEttkiW2yxDZZYpsssU2W2CZLbJMltskS22SJbbLENlli'
+        'myyxTZbYJktskyW2yRLbZIltssQ2WWKbLLFNltgmS2xTLbFNtcQ21RLbVEtsUy2xTbXENtUS21RL'
+        'bFMtsU21xDbVEttUS2xTLbFNtcQ21RLbVEts01xi+zd+2PJ/3r7FD2Pu+wuxOm78tOXP07I/8LMv'
+        'rGpJGhdL0sb2uvFV8f8dvYHnwjeo7ktu3vgO1Y3vUFXfofpB9a0ad6x9q8bWzasrpzgzKJthJbYT'
+        '5xA2wk5sIs4lHMR5hJM4n3ARFxAacSGhExcRbuJiwkNcQlxKXEZcTlxBeAkfcSVxFeEnriauIa4l'
+        'riOuJ24gbiRuIlqIm4lbiFuJ24jbiTuIAHEncRdxN3EPcS9xH3E/8QDxIPEQ8TDRSuwgdhK7iENE'
+        'G7GbeITYQ7QTjxIdxF5iHxEkOon9xAGii+gmDkLGsUqGldM8+4o6+6o6+5o661TcHlTXfUudfV69'
+        '9SF1XUmdPaDOvq7OvqHO7lFn31RnC+rs2+rsPnV2vzqbV2f3qrPvqLPvrp71dXxI/bKG++Uva7BA'
+        '3QJ1C9QtqLag2oJjC4AtALYA2AJSC0gteLTg0YJAC/QsmLNgzoIrC3Ys2LGAxgIaC2gsiLAgwgIF'
+        'C4+6hUfdwuNs4XG28ABb6AQWWoCF2rdQ+xZq30LtW6h9C7VvocwtlLmFMrdQ2BYK20JFWyheC8Vr'
+        'oXgtFK+FcrVQrhbK1UKBWihQC5VpoSQtFKGFIrRQhBaK0EL1Wag+C9Vnofos1JuF0rJQWhZKy0Jp'
+        'WSgtC8VkoYosVJGFKrJQNxbqxkKlWEwyH1ZkHpBkrJCxQsYKGStkrJCxQsYKGStkrJCxQsYKGStk'
+        'rJCxQsYKGStkrJCxQsYKGStkrJCxQsYKGStkrJCxQsYKGStkrJCxQsYKGStkrJCxQsYKGStkrJCx'
+        'QsYKGStkrJCxQsYKGStkrJCxQsYKGStkrJCxQsYKGStkrJCxQsYKGStkrJCxQsYKGStkrJCxQsYK'
+        'GStkrJCxQsYKGStkrJCxQsYKGStkrJCxQsYKGStkrJCxmmRyGy+y/7o/TZFPMTu2GCvYc+gpy0fU'
+        'd+Yekt+Za6eY7ayAdmraTk3bqWk7NW2npu3UtJ0mZ6fJ2WlydgrdTqHbKXQ7nc9O57NT9nbK3k4f'
+        'tFP9dtqhnXZopx3aaQl2WoKdlmCnJdhplXZapZ0GYadB2GkQdvqnnf5pp13YaRd2uqmdrmGnqdpp'
+        'HnZ6q53eaqeV2GkldlqJnVZip+/a6Sh2OoqdjmKno9jpyXZ6sp3+Yqc122nNdlqznaZjp+nYaTp2'
+        'uo2dtm2nbdvpPXa6t50WZKcF2WlBdlq6nZZupyHZaUh2GrydBm+nPdnp83aanN1sVh9d/5r4W9de'
+        'E3dsNl8Td6jdzKH2K4fawxxqD3OoDc+htkOH2gQd6gmKgxnj4AmKA50OdDrQ6UCnA50OdDrQ6UCn'
+        'A50OdDrQ6UCnA50OdDrQ6UCnA50OdDrQ6UCnA50OdDrQ6UCnA50OdDrQ6UCnA50OdDrQ6UCnA50O'
+        'dDrQ6UCnA50OdDrQ6UCnA50OdDrQ6UCnA50OdDrQ6UCnA50OdDrQKeL9W0TbeoHJ1AFTB0wdMHXA'
+        '1AFTB0wdMHXA1AEbB1odaHWg1YFWB1odaHWg1YFWB1odaHWg1YFWB1odaHWg1YFWh3qm4lDPVBzq'
+        'mYpDPVNxqGcqDvVcxKGegTjU8w6Het7hUM82HOpZhEM9o3GoZyAO9QzEoZ5ZONQzC4dZRh9bX0Zv'
+        'WysjJ2XkVGXkVGXkVGXkVGXkVGXkVGXkVGXkVGXkpIyclJGTMnJSRk7KyEkZOSkjJ2XkpIyclJGT'
+        'MnJSRk7KyEkZOSkjJ2XkpIyclJGTMnJSRk7KyEkZOSkjJ2XkpIyclJGTMnJSRk7KyEkZOSkjJ2Xk'
+        'pIyclJGTMnJSRk7KyEkZOSkjJ2XkpIyclJGTMnJSRk7KyEkZOSkjJ2XkpIyclJGTMnJSRk7KyEmT'
+        'd1I9TqrHSfU4qR4n1eOkepxUj5PqcVI9TqrHSfU4qR4n1eOkepxUj5PqcVI9TqrHSfU4qR4n1eOk'
+        'epxUj5PqcVI9TlU9TlU9TlU9TlU9TlU9TlU9TlU9TlU9TlU9TlU9TlU9TlU9TlU9TlU9TlU9TlU9'
+        'TrN6Pv6zfGnJ/D2Xnc/Rl/Z/mV9j2vjK0s+zK39C/bb+cVZljS6q0UU1uqhGF9XoohpdVKOLanRR'
+        'jS6q0UU1uqhGF9XoohpdVKOLanRRjS6q0UU1uqhGF9XoohpdVKOLanRRjS6q0UU1uqhGF9Xoohpd'
+        'VKOLanRRjS6q0UU1uqhGF9XoohpdVKOLanRRjS6q0UU1uqhGF9XoohpdVKOLanRRjS6q0UU1uqhG'
+        'F9XoohpdVKOLanRRjS6q0UU1uqhGF9VonxrtU6N9arRPjfap0T412qdG+9RonxrtU6N9arRPjfap'
+        '0T412qdG+9To2prZpT65fsa/ZW3G68x4Xc14Xc14Xc14Xc14Xc14Xc14Xc14Xc14nRmvM+N1dOro'
+        '1NGpo1NHp45OHZ06OnV06ujU0amjU0enjk4dnTo6dXTq6NTRqaNTR6eOTh2dOjp1dOro1NGpo1NH'
+        'p45OHZ06OnV06ujU0amjU0enjk4dnTo6dXTq6NTRqaNTR6eOTh2dOjp1dOro1NGpo1NHp45OHZ06'
+        'OnV06ujU0amjU0eLDlIdpDpIdZDqINVBqoNUB6kOUh2kOkh1kOog1UGqg1QHqa5mvK5mvK5mvK5m'
+        'vK5mvK5mvK5mvK5mvK5mvK5mvK5mvK5mvK5mvK5mvK5mvK5mvG5WT169NtEhX5twQ9oNaTek3ZB2'
+        'Q9oNaTek3ZB2Q9oNaTek3ZB2Q9oNaTek3ZB2Q9oNaTek3ZB2Q9oNaTek3ZB2Q9oNaTek3ZB2Q9oN'
+        'aTek3ZB2Q9oNaTek3ZB2Q9oNaTek3ZB2Q9oNaTek3ZB2Q9oNaTek3ZB2Q9oNaTek3ZB2Q9oNaTek'
+        '3ZB2Q9oNaTek3ZB2Y9mNZTeW3Vh2Y9mNZTeW3Vh2Y9mNZTeW3Vh2Y9mNZTeW3Vh2U0Juk8ynFJlj'
+        'kowHMh7IeCDjgYwHMh7IeCDjgYwHMh7IeCDjgYwHMh7IeCDjgYwHMh7IeCDjgYwHMh7IeCDjgYwH'
+        'Mh7IeCDjgYwHMh7IeCDjgYwHMh7IeCDjgYwHMh7IeCDjgYwHMh7IeCDjgYwHMh7IeCDjgYwHMh7I'
+        'eCDjgYwHMh7IeCDjgYwHMh7IeCDjgYwHMh7IeCDjgYwHMh7IeCDjgYwHMh7IeCDjgYwHMh7IeCDj'
+        'gYwHMh6TzKdXv939TvHt7oW137vd8efiit9UotqlKC+ivIjyIsqLKC+ivIjyIsqLKC+ivIjyIsqL'
+        'KC+ivIjyIsqLKC+ivIjyIsqLKC+ivIjyIsqLKC+ivIjyIsqLKC+ivIjyIsqLKC+ivIjyIsqLKC+i'
+        'vIjyIsqLKC+ivIjyIsqLKC+ivIjyIsqLKC+ivIjyIsqLKC+ivIjyIsqLKC+ivIjyIsqLKC+ivIjy'
+        'IsqLKC+ivIjyIsqLKC+ivIjyIsqLKC+ivIjyIsqLKC+ivKaowfX/zk3X2jddXMnWd6Uavlea7/4Z'
+        '9bSiCDA/wPwA8wPMDzA/wPwA8wPMDzA/wPwA8wPMDzA/wPwA8wPMDzA/wPwA8wPMDzA/wPwA8wPM'
+        'DzA/wPwA8wPMDzA/wPwA8wPMDzA/wPwA8wPMDzA/wPwA8wPMDzA/wPwA8wPMDzA/wPwA8wPMDzA/'
+        'wPwA8wPMDzA/wPwA8wPMDzA/wPwA8wPMDzA/wPwA8wPMDzA/wPwA8wPMDzA/wPwA8wPMDzA/wPwA'
+        '8wPMDzA/wPymmM+ua1K/JZrU/8fevUfFn9/3fffuSrGRLAmBhO7W/Tq6jdBIQtJIGkkjNFqNVrMw'
+        'DCSFyXo88bAeS4pmIYHEKaatTxKWcHqicKYnJPQAbTmtQhJ8mZa6KXRI0kuCxxijG0kIpkkKoR47'
+        'adyUJvQ384APP6XHsXW1tOIfvb+/3/5Wuzuf5+v5fn++n+93+G/uzg//ffdCwvOdj7ae77x75vHb'
+        'eVPki/dvcadvt7gRsouELW4kbHEjYYsbCVvcSNjiRsIWNxK2uJGwxY3Y4kZscSNMGWHKCFNGmDLC'
+        'lBGmjDBlhCkjTBlhyghTRpgywpQRpowwZYQpI0wZYcoIU0aYMsKUEaaMMGWEKSNMGWHKCFNGmDLC'
+        'lBGmjDBlhCkjTBlhyghTRpgywpQRpowwZYQpI0wZYcoIU0aYMsKUEaaMMGWEKSNMGWHKCFNGmDLC'
+        'lBGmjDBlhCkjTBlhyghTRpgywlwRwowQZoQwI4QZIcwIYUYIM0KYEcKMEGaEMCOEGSHMCGFGCDNC'
+        'mJHQZSNhixsJW9xI2OJGwhY3Era4kbDFjYQtbiRscSNhixsJW9xI2OJGwhY3Era4kbDFjYQtbqRt'
+        '8r9284UTv9zS+Mb/X+NBXc3WD32+c/rdo+vfGY3/9fs1PnWr8SiNR4PGo0Hj0aDxaNB4NGg8GjQe'
+        'DRqPBo1HaTxK41Eaj9J4lMajNB6l8SiNR2k8SuNRGo/SeJTGozQepfEojUdpPErjURqP0niUxqM0'
+        'HqXxKI1HaTxK41Eaj9J4lMajNB6l8SiNR2k8SuNRGo/SeJTGozQepfEojUdpPErjURqP0niUxqM0'
+        'HqXxKI1HaTxK41Eaj9J4lMajNB6l8SiNR2k8SuNRGo/SeJTGozQepfEojUdpPErjURqP0niUxqM0'
+        'HqXxKI1HaTxK41Eaj9J4lMajNB6l8WjQeDRoPBo0Hg0ajwaNR4PGo0Hj0aDxaNB4NGg8GjQeDRqP'
+        'Bo1Hg8ajQePRoPFoW+N/Izzy+d7rRz57odkLzV5o9qKwF4W9uOsFXC/gegHXC6peUPXipxc/vYjp'
+        'hUovRnox0ouDXmvda617LXKvRe61yL1WsNcK9lq6XqvUa5V6rUuvdem1IL2S2yuyvbLaK6u9stor'
+        'q72y2iurvWLZK5a9YtkriL2C2CuBvcLWK2y9wtYrbL3i1SteveLVK1C9AtUrSb0i1Cs0vULTKzS9'
+        'QtMrLb3S0istvdLSKx+9otArCr2i0CsKvaLQC/5e1Peivhf1vTjvxXkvsnvbyPzN+4X752+FGyPc'
+        'WBBuLAg3FoQbC8KNBeHGgnBjQbixINyYZYsRbszqxQg3ZhFjFjFmEWMWMWYRYxYxhuoYqmOojlnZ'
+        'mJWNWdkY1GNQj1nnmHWOAT9muWP4j+E/hv8YBmIYiGEghoGYbMRkI4aIGCJiiIgJTExgYviI4SMm'
+        'PjGYxKQohpaYMMWEKYadGHZi2IlhJyZoMQjFIBSDUAxCMSGMCWEMUDFZjMliTBZjKIuhLIayGMpi'
+        'KIuJa0xcY5iLSW0MejHoxaAXE+WYKMeAGANiTLBjgh2DZUy+Y0G4sSDcWBBuLAg3FoQbC8KNBeHG'
+        'gnBjQbixINxYEG4sCDcWhBsLwo0F4caCcGPt9Gz+IP+g85ufRPFH7jnj7kW775kX7X4+nBT8+PVJ'
+        'QR/N9tFsH8320WwfzfbRbB/N9tFsH8320WwfzfbRbB/N9tFsH8320WwfzfbRbB/N9tFsH8320Wwf'
+        'zfbRbB/N9tFsH8320WwfzfbRbB/N9tFsH8320WwfzfbRbB/N9tFsH8320WwfzfbRbB/N9tFsH832'
+        '0WwfzfbRbB/N9tFsH8320WwfzfbRbB/N9tFsH8320WwfzfbRbB+/9vFrH7/28Wsfv/bxax+/9vFr'
+        'H7/28Wsfv/bxax+/9vFrH7/28Wsfrfe1NfYLP8gae0qo6+al6z/beun6qeGxX7x/Mp27nUzjJtN4'
+        'mEzjYTKNh8k0HibTeJhM42EyjYfJNB4m07jJNG4yjVNmnDLjlBmnzDhlxikzTplxyoxTZpwy45QZ'
+        'p8w4ZcYpM06ZccqMU2acMuOUGafMOGXGKTNOmXHKjFNmnDLjlBmnzDhlxikzTplxyoxTZpwy45QZ'
+        'p8w4ZcYpM06ZccqMU2acMuOUGafMOGXGKTNOmXHKjFNmnDLjlBmnzDhlxikzTplxyoxTZpwy45QZ'
+        'p8w4hcWZM86cceaMM2ecOePMGWfOOHPGmTPOnHHmjDNnnDnjzBlnzjhzxsNkGg+TaTxMpvEwmcbD'
+        'ZBoPk2k8TKbxMJnGw2QaD5NpPEym8TCZxsNkGg+TaTxMpvEwmcbbSv+l8Lr9x29Pfj8Y/tU/GP6V'
+        'Ptj+47X7w/YnbsOWELZECFsihC0RwpYIYUuEsCVC2BIhbIkQtoSwJYQtIWwJYUsIW0LYEsKWELaE'
+        'sCWELSFsCWFLCFtC2BLClhC2hLAlhC0hbAlhSwhbQtgSwpYQtoSwJYQtIWwJYUsIW0LYEsKWELaE'
+        'sCWELSFsCWFLCFtC2BLClhC2hLAlhC0hbAlhSwhbQtgSwpYQtoSwJYQtIWwJYUsIW0LYEsKWELaE'
+        'sCWELSFsCWFLCFtC2BLClhC2hLAlhC0hbAlhSwhbQtgSwpYQtoSwJYQtIWwJYUsIW0LYEsKWCMQm'
+        'QtgSIWyJELZECFsikJ0IYUuEsCVC2BIhbIkQtkQIWyKELRHClghhS4SwJdrp+W9vjk9e2Do++e/u'
+        'z9Kfu81SUpaSIUvJkKVkyFIyZCkZspQMWUqGLCVDlpKylJSlpCwlZSkpS0lZSspSUpaSspSUpaQs'
+        'JWUpKUtJWUrKUlKWkrKUlKWkLCVlKSlLSVlKylJSlpKylJSlpCwlZSkpS0lZSspSUpaSspSUpaQs'
+        'JWUpKUtJWUrKUlKWkrKUlKWkLCVlKSlLSVlKylJSlpKylJSlpCwlZSkpS0lZSspSUpaSspSUpaQs'
+        'JWUpKUtJWUrKUlKWkrKUlKWkLCVlKSlLSVlKylJSlpKylJSlpCwlZSkpS0lZSspSMmQpGbKUDFlK'
+        'hiwlQ5aSIUvJkKVkyFIyZCkZspQMWUqGLCVDlpIhS8mQpWTIUrKdpa2wfX3/9fa1H9L9kO6HdD+k'
+        '+yHdD+l+SPdDuh/S/ZDuh3Q/pPsh3Q/pfkj3Q7of0v2Q7od0P6T7Id0P6X5I90O6H9L9kO6HdD+k'
+        '+yHdD+l+SPdDuh/S/ZDuh3Q/pPsh3Q/pfkj3Q7of0v2Q7od0P6T7Id0P6X5I90O6H9L9kO6HdD+k'
+        '+yHdD+l+SPdDuh/S/ZDuh3Q/pPux3I/lfiz3Y7kfy/1Y7sdyP5b7sdyP5X4s92O5H8v9WO7Hcj+W'
+        '+0Wov43Mf3+/cP/UrXBThJsKwk0F4aaCcFNBuKkg3FQQbioINxWEmyLcFOGm0JlCZwqdKXSm0JlC'
+        'ZwqdKXSm0JlCZwqdKXSm0JlCZwqdKXSm0JlCZwqdKXSm0JlCZwqdKXSm0JlCZwqdKXSm0JlCZwqd'
+        'KXSm0JlCZwqdKXSm0JlCZwqdKXSm0JlCZwqdKXSm0JlCZwqdKXSm0JlCZwqdKXSm0JlCZwqdKXSm'
+        '0JlCZwqdKXSm0JICaQqkKZCmQJoCaQqkKZCmQJoCaQqkKZCmQJoCaQqkKZCmQJoKwk0F4aaCcFNB'
+        'uKkg3FQQbioINxWEmwrCTQXhpoJwU0G4qSDcVBBuKgg3FYSbaqfnl29/0v3Df7E1v/wPwcDvuTZw'
+        'GuNpjKcxnsZ4GuNpjKcxnsZ4GuNpjKcxnsZ4GuNpjKcxnsZ4GuNpjKcxnsZ4GuNpjKcxnsZ4GuNp'
+        'jKcxnsZ4GuNpjKcxnsZ4GuNpjKcxnsZ4GuNpjKcxnsZ4GuNpjKcxnsZ4GuNpjKcxnsZ4GuNpjKcx'
+        'nsZ4GuNpjKcxnsZ4GuNpjKcxnsZ4GtxpcKfBnQZ3GtxpcKfBnQZ3GtxpcKfBnQZ3GtxpcKfBnQZ3'
+        'WqbSbYb+1t03rN69/foNPCHkW2aPWzcrv/lnhf7H+9v+n7xt+xltPxPafia0/Uxo+5nQ9jOh7WdC'
+        '28+Etp8JbT+j7We0/QwlZigxQ4kZSsxQYoYSM5SYocQMJWYoMUOJGUrMUGKGEjOUmKHEDCVmKDFD'
+        'iRlKzFBihhIzlJihxAwlZigxQ4kZSsxQYoYSM5SYocQMJWYoMUOJGUrMUGKGEjOUmKHEDCVmKDFD'
+        'iRlKzFBihhIzlJihxAwlZigxQ4kZSsxQYoYSM5SYocQMJWYoMUOJGUrMUFSGGTPMmGHGDDNmmDHD'
+        'jBlmzDBjhhkzzJhhxgwzZpgxw4wZZswwYya0/Uxo+5nQ9jOh7WdC28+Etp8JbT8T2n4mtP1MaPuZ'
+        '0PYzoe1nQtvPhLafCW0/E9p+pq3s7dDl89ddfgDSA5AegPQApAcgPQDpAUgPQHoA0gOQHoD0AKQH'
+        'ID0A6QFID0B6ANIDkB6A9ACkByA9AOkBSA9AegDSA5AegPQApAcgPQDpAUgPQHoA0gOQHoD0AKQH'
+        'ID0A6QFID0B6ANIDkB6A9ACkByA9AOkBSA9AegDSA5AegPQApAcgPQDpAUgPQHoA0gOQHoD0AKQH'
+        'sDyA5QEsD2B5AMsDWB7A8gCWB7A8gOUBLA9geQDLA1gewPIAlgdEaKCNzM79wp2/FW6WcLNBuNkg'
+        '3GwQbjYINxuEmw3CzQbhZoNws4SbJdwsOrPozKIzi84sOrPozKIzi84sOrPozKIzi84sOrPozKIz'
+        'i84sOrPozKIzi84sOrPozKIzi84sOrPozKIzi84sOrPozKIzi84sOrPozKIzi84sOrPozKIzi84s'
+        'OrPozKIzi84sOrPozKIzi84sOrPozKIzi84sOrPozKIzi84sOrPozKIzi84sWrIgzYI0C9IsSLMg'
+        'zYI0C9IsSLMgzYI0C9IsSLMgzYI0C9IsSLNBuNkg3GwQbjYINxuEmw3CzQbhZoNws0G42SDcbBBu'
+        'Ngg3G4SbDcLNBuFmg3Cz7fT8T/en50/fpicnPbmQnlxITy6kJxfSkwvpyYX05EJ6ciE9OenJSU9O'
+        'enLSk5OenPTkpCcnPTnpyUlPTnpy0pOTnpz05KQnJz056clJT056ctKTk56c9OSkJyc9OenJSU9O'
+        'enLSk5OenPTkpCcnPTnpyUlPTnpy0pOTnpz05KQnJz056clJT056ctKTk56c9OSkJyc9OenJSU9O'
+        'enLSk5OenPTkpCcnPTnpyUlPTnpy0pOTnpz05KQnJz056clJT056ctKTk56c9OSkJyc9OenJSU9O'
+        'enLSk5OenPTkpCcX0pML6cmF9ORCenIhPbmQnlxITy6kJxfSkwvpyYX05EJ6ciE9uZCeXEhPLqQn'
+        '105PPYwr774eV0YgPQLpEUiPQHoE0iOQHoH0CKRHID0C6RFIj0B6BNIjkB6B9AikRyA9AukRSI9A'
+        'egTSI5AegfQIpEcgPQLpEUiPQHoE0iOQHoH0CKRHID0C6RFIj0B6BNIjkB6B9AikRyA9AukRSI9A'
+        'egTSI5AegfQIpEcgPQLpEUiPQHoE0iOQHoH0CKRHID0C6RFIj0B6BMsjWB7B8giWR7A8guURLI9g'
+        'eQTLI1gewfIIlkewPILlESyPYHlEhEbayOzed2Prp1s3tv72/QZ++4PBwKMMPBoMPBoMPBoMPBoM'
+        'PBoMPBoMPBoMPBoMPMrAoww8CtdRuI7CdRSuo3AdhesoXEfhOgrXUbiOwnUUrqNwHYXrKFxH4ToK'
+        '11G4jsJ1FK6jcB2F6yhcR+E6CtdRuI7CdRSuo3AdhesoXEfhOgrXUbiOwnUUrqNwHYXrKFxH4ToK'
+        '11G4jsJ1FK6jcB2F6yhcR+E6CtdRuI7CdRSuo3AdhesoXEfhOgrXUbiOwnUUrqPwGUXtKGpHUTuK'
+        '2lHUjqJ2FLWjqB1F7ShqR1E7itpR1I6idhS1o6gdDQYeDQYeDQYeDQYeDQYeDRYdDS4eDS4eDS4e'
+        'DS4eDS4eDd4dDd4dDX4eDQYeDQYebcfp79yfnr9xO7/kpScf0pMP6cmH9ORDevIhPfmQnnxITz6k'
+        'Jy89eenJS09eevLSk5eevPTkpScvPXnpyUtPXnry0pOXnrz05KUnLz156clLT1568tKTl5689OSl'
+        'Jy89eenJS09eevLSk5eevPTkpScvPXnpyUtPXnry0pOXnrz05KUnLz156clLT1568tKTl5689OSl'
+        'Jy89eenJS09eevLSk5eevPTkpScvPXnpyUtPXnry0pOXnrz05KUnLz156clLT1568tKTl5689OSl'
+        'Jy89eenJS09eevLSk5eevPTkQ3ryIT35kJ58SE8+pCcfMpMPmcmHzORDZvIhM/mQj3xIXj7kKB9y'
+        'lA/pyYf05Nvp+bt3j9h+mx6xvXntYP2egO7eFPhGn7At5Vqf3d+499nd96jt/3zfpHTQmpT+l+sv'
+        'I0o/+GDrl//r/er/67fqL1F/Kai/FNRfCuovBfWXgvpLQf2loP5SUH+J+kvUX6L+EvWXqL9E/SXq'
+        'L1F/ifpL1F+i/hL1l6i/RP0l6i9Rf4n6S9Rfov4S9Zeov0T9JeovUX+J+kvUX6L+EvWXqL9E/SXq'
+        'L1F/ifpL1F+i/hL1l6i/RP0l6i9Rf4n6S9Rfov4S9Zeov0T9JeovUX+J+kvUX6L+EvWXqL9E/SXq'
+        'L1F/ifpL1F+i/hL1l6i/RP0l6i9Rf4n6S9Rfov4S9Zeov0T9JeovUX+J+kvUX6L+EvWXqL9E/SXq'
+        'LwX1l4L6S0H9paD+UlB/Kai/FNRfCuovBfWXgvpLQf2loP5SUH8pqL8U1F8K6i+11f+/3Twd+I9b'
+        'Wfp792fplbebkLIslUOWyiFL5ZClcshSOWSpHLJUDlkqhyyVZaksS2VZKstSWZbKslSWpbIslWWp'
+        'LEtlWSrLUlmWyrJUlqWyLJVlqSxLZVkqy1JZlsqyVJalsiyVZaksS2VZKstSWZbKslSWpbIslWWp'
+        'LEtlWSrLUlmWyrJUlqWyLJVlqSxLZVkqy1JZlsqyVJalsiyVZaksS2VZKstSWZbKslSWpbIslWWp'
+        'LEtlWSrLUlmWyrJUlqWyLJVlqSxLZVkqy1JZlsqyVJalsiyVZaksS2VZKstSWZbKslSWpXLIUjlk'
+        'qRyyVA5ZKocslUMeyiFV5ZCqckhVOaSqHFJVDgkqhwSVQ9LKIUvlkKVyO0t//156nnxa8pMDyS+0'
+        '8vNI+zX3Bx//bPsv7t10rZ95qJW0Xwm3jH7k+pZRBf4V+FfgX4F/BfcV3FdwX8F9BfcV3FdwX8F9'
+        'BfcV3FdwX8F9BfcV3FdwX8F9BfcV3FdwX8F9BfcV3FdwX8F9BfcV3FdwX8F9BfcV3FdwX8F9BfcV'
+        '3FdwX8F9BfcV3FdwX8F9BfcV3FdwX8F9BfcV3FdwX8F9BfcV3FdwX8F9BfcV3FdwXwF8BfAVwFcA'
+        'XwF8BfAVwFcAXwF8BfAVwFcAXwF8BfAVwFcAX5GzShudxt14fvfy7u93JG/tQB7/4oPf2dfffjXY'
+        'a/jaXpPsNclek+w1yV6TmvckiU2S2CSJTZLYJIlNktgkiU2S2CSJTZLYJIlNktgkiU2S2CSJTZLY'
+        'JIlNktgkiU2S2CSJTZLYJIlNktgkiU2S2CSJTZLYJIlNktgkiU2S2CSJTZLYJIlNktgkiU2S2CSJ'
+        'TZLYJIlNktgkiU2S2CSJTZLYJIlNktgkiU2S2CSJTZLYJIlNktgkiU2S2CSJTZLYJIlNktgkiU2S'
+        '2CSJTZLYJIlNktgkiU2S2CSJTZLYJIlNkthkW2L7P+M9r9as+USrA/5aYOiPXjM0jaFpDE1jaBpD'
+        '0xiaxtA0hqYxNI2haQxNY2gaQ9MYmsbQNIamMTSNoWkMTWNoGkPTGJrG0DSGpjE0jaFpDE1jaBpD'
+        '0xiaxtA0hqYxNI2haQxNY2gaQ9MYmsbQNIamMTSNoWkMTWNoGkPTGJrG0DSGpjE0jaFpDE1jaBpD'
+        '0xiaxtA0hqYxNI2haQxNY2gaQ9MYmsbQNIamMTSNoWkMTWNoGkPTGJrG0DSGpjE0jaFpDE1jaBpD'
+        '0xiabjN0cPcVnj8gPwIwvfvA99bPAPz18Mrq4O0rq3+mTeVhENkLr0U2Q2QzRDZDZDNENsNgMww2'
+        'w2AzDDbDYDMMNsNgMww2w2AzDDbDYDMMNsNgMww2w2AzDDbDYDMMNsNgMww2w2AzDDbDYDMMNsNg'
+        'Mww2w2AzDDbDYDMMNsNgMww2w2AzDDbDYDMMNsNgMww2w2AzDDbDYDMMNsNgMww2w2AzDDbDYDMM'
+        'NsNgMww2w2AzDDbDYDMMNsNgMww2w2AzDDbDYDMMNsNgMww2w2AzDDbDYDMMNsNgMww2w2AzDDbD'
+        'YDMMNtNm5Uvhe6z/NlRmoTILlVmozEJlVs+bRcwsYmYRM4uYWcTMImYWMbOImUXMLGJmETOLmFnE'
+        'zCJmFjGziJlFzCxiZhEzi5hZxMwiZhYxs4iZRcwsYmYRM4uYWcTMImYWMbOImUXMLGJmETOLmFnE'
+        'zCJmFjGziJlFzCxiZhEzi5hZxMwiZhYxs4iZRcwsYmYRM4uYWcTMImYWMbOImUXMLGJmETOLmFnE'
+        'zCJmFjGziJlFzCxiZhEzi5hZxMwiZhYxs4iZbRPz5XtzU+t+R0uKF+1bB19pMdS+Z/f374noMw+Z'
+        'qb76c1+YePir933p9V9o/dmvBTf942s3zQFuDnBzgJsD3Bzg5gA3B7g5wM0Bbg5wc4CbA9wc4OYA'
+        'Nwe4OcDNAW4OcHOAmwPcHODmADcHuDnAzQFuDnBzgJsD3Bzg5gA3B7g5wM0Bbg5wc4CbA9wc4OYA'
+        'Nwe4OcDNAW4OcHOAmwPcHODmADcHuDnAzQFuDnBzgJsD3Bzg5gA3B7g5wM0Bbg5wc4CbA9wc4OYA'
+        'Nwe4OcDNAW4OcHOAmwPcHODmADcHuDnAzQFuDnBzgJsD3Bzg5trAHQVkxq6RmYfMPGTmITMPmXnI'
+        'zENmHjLzkJmHzDxk5iEzD5l5yMxDZh4y85CZh8w8ZOYhMw+ZecjMQ2YeMvOQmYfMPGTmITMPmXnI'
+        'zENmHjLzkJmHzDxk5iEzD5l5yMxDZh4y85CZh8w8ZOYhMw+ZecjMQ2YeMvOQmYfMPGTmITMPmXnI'
+        'zENmHjLzkJmHzDxk5iEzD5l5yMxDZh4y85CZh8w8ZOYhMw+ZecjMQ2YeMvOQmYfMPGTmITMPmXnI'
+        'zLeR+QdP1Tes2j8U8Vn3QnD3qtX32pcx/8MWc+0b6l+81xWffNrnHhv//Bday/XWe03xL1/vIl7x'
+        'YKsr/qP7f9bI0O34vtiG9zj47rFr31X5rsp3Vb6r8l2V76p8V+W7Kt9V+a7Kd1W+q/Jdle+qfFfl'
+        'uyrfVfmuyndVvqvyXZXvqnxX5bsq31X5rsp3Vb6r8l2V76p8V+W7Kt9V+a7Kd1W+q/Jdle+qfFfl'
+        'uyrfVfmuyndVvqvyXZXvqnxX5bsq31X5rsp3Vb6r8l2V76p8V+W7Kt9V+a7Kd1W+q/Jdle+qfFfl'
+        'uyrfVfmuyndVvqvyXZXvqnxX5bsq31X5rsp3Vb6r8l2V76ptZP7xfY8kDLTGrJP7z02jt+emS85N'
+        'l8K56VI4N10K56ZL4dx0KZybLoVz06VwbroUzk2XnJsuOTddgusSXJfgugTXJbguwXUJrktwXYLr'
+        'ElyX4LoE1yW4LsF1Ca5LcF2C6xJcl+C6BNcluC7BdQmuS3BdgusSXJfgugTXJbguwXUJrktwXYLr'
+        'ElyX4LoE1yW4LsF1Ca5LcF2C6xJcl+C6BNcluC7BdQmuS3BdgusSXJfgugTXJbguwXUJrktwXYLr'
+        'ElyX4LoE1yX4LKF2CbVLqF1C7RJql1C7hNol1C6hdgm1S6hdQu0SapdQu4TaJdQuhXPTpXBuuhTO'
+        'TZfCuelSODddCuemS+HcdCmcmy6Fc9OlcG66FM5Nl8K56VI4N10K56ZL4dx0KZybLrXj9But9LT3'
+        'MffS86nrU9O/2v5Lp3d3/L4f5opw2+4Pt34Cx1Pjpz387+GO3wtuR4aV4OAV8l1h3RUuXeHSFS5d'
+        'oc0V2lwhyhWGXGHIFYZcYcEVFlwhvBXCW6G4FW5bIbUVUlshrhVyWiGnFVZaYaUVVlqhnBXKWeGa'
+        'FVpZoZUVIlkhkhUGWdFqVvSYFc1lRXNZ0VxWNJcVzWVFc1nRR1b0kRV9ZEXnWNE5VrSMFd1hRXdY'
+        '0R1WdIcV/WBFP1jRD1Z0gBUdYIX6Vzh/heVXWH6F5VdYfoXeV+h9hd5X6H2F0Fe4e4W7V7h7hbtX'
+        'uHuFrVdoeoWmV2h6hZhXiHmFileCg1eCg1eCg1eCg1eCg1eCeVdC818JDl4JQ8JKsPFKsPFKsPFK'
+        'GDBWwoCxEmy8EgaR9tUj4Z/2gfB7XwpXfeHqy+HqK+Hqq+HqazdXEw//kzBVv+96ql6D0JrArCFp'
+        'DUlrSFpD0hqS1pC0JlprorUmWmvwWoPXGrzW5G1N3tbAtga2Nelbw9yaEK4J4ZoQrgFxDYhrQFwD'
+        '4pqArgnoGizXYLkGyzWpXZPaNZCugXRNhtewuibKa5Bdk+g1iV4D8BqA1wC8BuA1aV/D8RqO13C8'
+        'huM1JlhjgjVUrxHCGiGsEcIa1Negvgb1NYyvkcUaWawhfo0z1oC/Bvw14K8RyRqRrInBmhis0coa'
+        'rawJxRq7rInWWhuZf/q7POYSvj94pNVc7p55uXvm5bv4Rc//LHhs5Npj6zy2zmPrPLbOY+s8ts5j'
+        '6zy2zmPrPLbOY+s8ts5j6zy2zmPrPLbOY+s8ts5j6zy2zmPrPLbOY+s8ts5j6zy2zmPrPLbOY+s8'
+        'ts5j6zy2zmPrPLbOY+s8ts5j6zy2zmPrPLbOY+s8ts5j6zy2zmPrPLbOY+s8ts5j6zy2zmPrPLbO'
+        'Y+s8ts5j6zy2zmPrPLbOY+s8ts5j6zy2zmPrPLbOY+s8ts5j6zy2zmPrPLbOY+s8ts5j6zy2zmPr'
+        'PLbOY+s8tt722P9x80j1a1u3Bs7uvn3q7pbod27H4suqntv6sqr79i7nd0+Mfpe7582LX4/eW4jv'
+        't07afu0q/dEH7/2rf1d66j9v0fm16zPtv9r6ccPtJyL+lv66qb9u6q+b+uum/rqpv27qr5v666b+'
+        'uqm/buqvm/rrpv66qb9u6q+b+uum/rqpv27qr5v666b+uqm/buqvm/rrpv66qb9u6q+b+uum/rqp'
+        'v27qr5v666b+uqm/buqvm/rrpv66qb9u6q+b+uum/rqpv27qr5v666b+uqm/buqvm/rrpv66qb9u'
+        '6q+b+uum/rqpv27qr5v666b+uqm/buqvm/rrpv66qb9u6q+b+uum/rqpv27qr5v666b+uqm/buqv'
+        'm/rrpv66qb9u6q+b+uum/rqpv262++tFq6O2T+Ym7wHTUv0vtH4x2jrq+T/DuPY71+NaDU41ONXg'
+        'VINTDU41ONXgVINTDU41ONXgVINTDU41ONXgVINTDU41ONXgVINTDU41ONXgVINTDU41ONXgVINT'
+        'DU41ONXgVINTDU41ONXgVINTDU41ONXgVINTDU41ONXgVINTDU41ONXgVINTDU41ONXgVINTDU41'
+        'ONXgVINTDU41ONXgVINTDU41ONXgVINTDU41ONXgVINTDU41ONXgVINTDU41ONXgVINTDU61Nk6/'
+        '+V0a0B7/+ZYBf6vl25tR7WZMa41s38yY9v12d/kLj/9i6z//D+Cx0t+8voXwjKd9ex4r/dnHf+m+'
+        'Lww1wH0L95qbNy+H7bVfaf6tb218a/0fvbv1/Oz317R2d4fjG7vD8S3NYL993xH2n2sx9y9C53zH'
+        'defc0Tl3dM4dnXNH59zROXd0zh2dc0fn3NE5d3TOHZ1zR+fc0Tl3dM4dnXNH59zROXd0zh2dc0fn'
+        '3NE5d3TOHZ1zR+fc0Tl3dM4dnXNH59zROXd0zh2dc0fn3NE5d3TOHZ1zR+fc0Tl3dM4dnXNH59zR'
+        'OXd0zh2dc0fn3NE5d3TOHZ1zR+fc0Tl3dM4dnXNH59zROXd0zh2dc0fn3NE5d3TOHZ1zR+fc0Tl3'
+        'dM4dnXNH59zROXd0zh2dc0fn3NE5d3TOHZ1zR+fc0Tl3dM4dnXNH59zROXfanfNf3v/Uw390+80L'
+        'dU891MPRQT0cNtTDoUQ9HErUw4FGPRxA1MPBRz2cuNUdRdUdvNXRWUdnHZ11dNbRWUdnHZ11dNbR'
+        'WUdnHZ11dNbRWUdnHZ11dNbRWUdnHZ11dNbRWUdnHZ11dNbRWUdnHZ11dNbRWUdnHZ11dNbRWUdn'
+        'HZ11dNbRWUdnHZ11dNbRWUdnHZ11dNbRWUdnHZ11dNbRWUdnHZ11dNbRWUdnHZ11dNbRWUdnHZ11'
+        'dNbRUgdpHaR1kNZBWgdpHaR1kNZBWgdpHaR1kNZBWgdpHaR1kNZBWg8nbvVw4lYPJ271cOJWDydu'
+        '9XDiVg/nbPVwulYPp2v1cLpWDydp9XBWVg8nZPVwQlYPJ2T1cEJWb6fn/7rX89sb7y+1n+r+Vzcj'
+        'wOEDrV/+Titbn7jeI489+HPh5bl0prVhbp9Lv7F1Lj3x8P99/x/9C60/+pzrX3zw5u97PPVg6x/5'
+        'r4Pjn3Xt+IYUNaSoIUUNKWqIT0N8GuLTEJ+G+DTEpyE+DfFpiE9DfBri0xCfhvg0xKchPg3xaYhP'
+        'Q3wa4tMQn4b4NMSnIT4N8WmIT0N8GuLTEJ+G+DTEpyE+DfFpiE9DfBri0xCfhvg0xKchPg3xaYhP'
+        'Q3wa4tMQn4b4NMSnIT4N8WmIT0N8GuLTEJ+G+DTEpyE+DblpyE1Dbhpy05Cbhtw05KYhNw25achN'
+        'Q24actOQm4bcNOSmITcNcW208fx/wpsqDajsQ2UfKvtQ2YfKPuHuI2YfMfuI2UfMPmL2EbOPmH3E'
+        '7CNmHzH7iNlHzD5i9hGzj5h9xOwjZh8x+4jZR8w+YvYRs4+YfcTsI2YfMfuI2UfMPmL2EbOPmH3E'
+        '7CNmHzH7iNlHzD5i9hGzj5h9xOwjZh8x+4jZR8w+YvYRs4+YfcTsI2YfMfuI2UfMPmL2EbOPmH3E'
+        '7CNmHzH7iNlHzD5i9hGzj5h9xOwjZh8x+4jZR8w+YvYRs4+YfcTst4m5vLvp/BT5Qb1fePAp84N6'
+        '/9/Q8rqvW94hjx3y2CGPHfLYIYEdEtghgR0S2CGBHRLYIYEdEtghgR0S2CGBHRLYIYEdEtghgR0S'
+        '2CGBHRLYIYEdEtghgR0S2CGBHRLYIYEdEtghgR0S2CGBHRLYIYEdEtghgR0S2CGBHRLYIYEdEtgh'
+        'gR0S2CGBHRLYIYEdEtghgR0S2CGBHRLYIYEdEtghgR0S2CGBHRLYIYEdEtghgR0S2CGBHRLYIYEd'
+        'EtghgR0S2CGBHRLYIYEdEtghgR0S2CGBHRLYYVtg/+Znrgert7YGq8rD/7Y9kt379R96oP3rq8DS'
+        'zjVLR1g6wtIRlo6wdKQnHkHqCFJHkDqC1BGkjiB1BKkjSB1B6ghSR5A6gtQRpI4gdQSpI0gdQeoI'
+        'UkeQOoLUEaSOIHUEqSNIHUHqCFJHkDqC1BGkjiB1BKkjSB1B6ghSR5A6gtQRpI4gdQSpI0gdQeoI'
+        'UkeQOoLUEaSOIHUEqSNIHUHqCFJHkDqC1BGkjiB1BKkjSB1B6ghSR5A6gtQRpI4gdQSpI0gdQeoI'
+        'UkeQOoLUEaSOIHUEqSNItcpE+oce+JkvtLcYLa1etib79AMPtDDqaGH0222Mnvn4MRyO4dAqj0+1'
+        'NgrHwDjGwDEGjq36seU+ttzHlvvYkh5b0mOrd2z1jq3XsYU6tkLHVujYKhz7pI990sc+4mMf8bGP'
+        '+NjHeOxjPPb5Hfuojn1Uxz6cYx/OsU/l2Ob9WGCOJeVYUo4l5VhSjiXlWFKOheJYKI6F4lgMjsXg'
+        'GP/HUD+G+jHUj6F+DO5jcB+D+xjOx3A+xvExgI8hewzZY8geQ/YYq8dYPcbqMVaP0XkMxGMgHgPx'
+        'GBjHeDxG4DH0jqF3DL1jsB2D7Rhex22gHnzg/psu/9XtTZcTN11Owk2Xk3DT5STcdDkJN11Owk2X'
+        'k3DT5STcdDkJN11OrNuJmy4nlu+E706s4olVPLGKJ1bxxCqeWMUTgJ8A/ATWJ5b2xNKeWNoTrJ9g'
+        '/cRCn1joE+SfWO8TATgRgBMBOAHBCQhOQHACghPhOBGOE0icQOIEEicScyIxJwA5AciJ/Jzg5ESM'
+        'TuByIk0n0nQCnhPwnIDnBDwnknaCoRMMnWDoBEMnUngihSeIOhHGE2E8EcYTmJ3A7ARmJzA7gdmJ'
+        'vJ7I6wnoTsT2BHsn2DvB3oksn8jyCRJPkHgi2SeSfYLLEwE/CTddTsJNl5Nw0+Uk3HQ5CTddTsJN'
+        'l5Nw0+Uk3HQ5CTddTsJNl5Nw0+Uk3HQ5CTddTsJNl5Nw0+Uk3HQ5acfnoQfCtvaXtPBTSJ9C+hTS'
+        'p5A+xfIplk+xfIrlUyyfYvkUy6dYPsXyKZZPsXyK5VMsn2L5FMunWD7F8imWT7F8iuVTLJ9i+RTL'
+        'p1g+xfIplk+xfIrlUyyfYvkUy6dYPsXyKZZPsXyK5VMsn2L5FMunWD7F8imWT7F8iuVTLJ9i+RTL'
+        'p1g+xfIplk+xfIrlUyyfYvkUy6cgPgXxKYhPQXwK4lMQn4L4FMSnID4F8SmIT0F8CuJTEJ+C+BTE'
+        'p21InnYPkicfeiQ72HqfNP2Z1pFc+ukP3O1uv6d2tzd71X/Y2qv+gD6dfG9jEnT2O3R2TmfndHZO'
+        'Z+d0dk5n53R2TmfndHZOZ+d0dk5n53R2TmfndHZOZ+d0dk5n53R2TmfndHZOZ+d0dk5n53R2Tmfn'
+        'dHZOZ+d0dk5n53R2TmfndHZOZ+d0dk5n53R2TmfndHZOZ+d0dk5n53R2TmfndHZOZ+d0dk5n53R2'
+        'TmfndHZOZ+d0dk5n53R2TmfndHZOZ+d0dk5n53R2TmfndHZOZ+d0dk5n53R2TmfndHZOZ+d0dk5n'
+        '53R2TmfndHZOZ+dGgfO21X74lpWfx8oFVi6wcoGVC6xcYOUCKxdYucDKBVYusHKBlQusXGDlAisX'
+        'WLnAygVWLrBygZULrFxg5QIrF1i5wMoFVi6wcoGVC6xcYOUCKxdYucDKBVYusHKBlQusXGDlAisX'
+        'WLnAygVWLrBygZULrFxg5QIrF1i5wMoFVi6wcoGVC6xcYOUCKxdYucDKBVYusHKBlQusXGDlAisX'
+        'WLnAygVWLrBygZULrFxg5QIrF1i5wMoFVi6wcoGVC6xctFn5kd+j2z35zPJnf3K88Fg5/5nPPtHu'
+        'kn+xpeHfx3MpxdaXNTz0qUf01r/24Lf5KZXbf7HHPvMT7X9ET+uloe90W3zyGYXP/vTnHvv8eOWz'
+        'n2n/U3+t9fjN3QMt370HWtIdD9y9aPH9+6JF+y2Gf9aK6vfVS+LpZ9xtC+7eU/yGvpu7Bfofb3WH'
+        '7+C24Jl3VP6uVN6swVdao8cdot/FzeqP3lF558pv1JUP/53vrCqf1Yby4PqE7qAl5i9d/+KvtV6q'
+        'vPnq1cS9vzKRfnb7T19/w2r66S2F3LzHtt76qrn0c+4/79to3znsvBtMv8nBtD0UfrQ1FN69C/yN'
+        'DqbPfeDmedKtNoVdt3d//q27P89+WvvuT7s8U/lR5VnKs5XnKJ3Kc5UupVt5nvJ8pUd5gfJC5UXK'
+        'i5WXKC9VXqb8mPJy5RXKK5VXKa9WXqO8Vnmd8nrlDcoblTcpEeXNyluUtypvU96uRJV3KL3KO5WY'
+        '8i7l3cp7lD7lvcr7lPcrceUDygeVDykJ5cPKR5SPKknlY0q/8nElpXxCeVj5pJJWPqU8onxaySiP'
+        'KgPKoJJtl4l09wP3v6A7fvOCbvpvXz/18lzkPBc5z0XOc5HTLg8qz1aeo3Qqz1W6lG7lecrzlR7l'
+        'BcoLlRcpL1ZeorxUeZnyY8rLlVcor1RepbxaeY3yWuV1yuuVNyhvVN6kRJQ3K29R3qq8TXm7ElXe'
+        'ofQq71RiyruUdyvvUfqU9yrvU96vxJUPKB9UPqQklA8rH1E+qiSVjyn9yseVlPIJ5WHlk0pa+ZTy'
+        'iPJpJaM8qgwog0q2XSbSzwuySb/1mpluzHRjphsz3Zjpxkw3Zrox042Zbsx0Y6YbM92Y6cZMN2a6'
+        'MdONmW7MdGOmGzPdmOnGTDdmujHTjZluzHRjphsz3Zjpxkw3Zrox042Zbsx0Y6YbM92Y6cZMN2a6'
+        'MdONmW7MdGOmGzPdmOnGTDdmujHTjZluzHRjphsz3Zjpxkw3Zrox042Zbsx0Y6YbM92Y6cZMN2a6'
+        'MdONmW7MdGOmGzPdmOnGTDdmujHTjZluzHRjphsz3Zjpxkx3m5nntxrWoy3h/EbrfYh0z9c96NJ7'
+        '+52qL3ha+0GXVvGgS/vqveHqfeHq/eEqHq4+EK4+GK4eurm610fbpUN5hvJM5UeVZykPKs9WnqN0'
+        'Ks9VupRu5XnK85Ue5QXKC5UXKS9WXqK8VHmZ8mPKy5VXKK9UXqW8WnmN8lrldcrrlTcob1TepESU'
+        'NytvUd6qvE15uxJV3qH0Ku9UYsq7lHcr71H6lPcq71Per8SVDygfVD6kJJQPKx9RPqpklaTyMaVf'
+        '+biSUj6hPKx8Ukkrn1IeUT6tZJRHlQFlEDLPCfDshatfCVeNcPWr4epL4eqLNxR75KV99Wvh6iBc'
+        '/Xq4+nK4+kq4OgxXXw1XX7u5mki/oBWfJzsGk8OD+cGRTyfbpxI/cW8UNBT+o3tN/ckfeazyU/kn'
+        'pj5XbP/Fd937i08+81PZ9IeTj4a/5eF/29rVvPCB6680Sj+/nc0XPXD97tLDf6/1yxeHWfM57Scc'
+        'X3K30X8qbvRv7pz9sda++Pvv9tNLH7jvlecfbnH6ssBttb1H+rHQctrvy7XfqXv874fn2vbaR6Mv'
+        'b/3fPHL9USy14/CKO96fKm++TD70VHnzJf3KB+77YUA/1OL0VT+AnN4s7H/dWti7u7Hfg5y+usXp'
+        'zc2Gf9oeIF7TBvXmPuw/f+C++7CR9m3W1z7wrX9Dyh962t03pNw9UPK7c/m6MB28tj0dvP7bwFzt'
+        '7lt57pj79zD3hsDcm9vMvbHlxsw1PDvtYfNN4Y/8dtuVkbvh8ykyfD78tafM7PnmNpS3UP2V6//C'
+        '57Sa91u+T4m9GSWf3Tr2/YHH90VP82nstz6Np9pM+taWd2/mzz/cVvHbgndf1f712++8+70P7o1Z'
+        'v3yP0R+EvVT09pT/V527DTrIGHSQMeggY9BBxqCDjEEHGYMOMgYdZAw6yBh0kDHoIGPQQcagg4xB'
+        'BxmDDjIGHWQMOsgYdJAx6CBj0EHGoIOMQQcZgw4yBh1kDDrIGHSQMeggY9BBxqCDjEEHGYMOMgYd'
+        'ZAw6yBh0kDHoIGPQQcagg4xBBxmDDjIGHWQMOsgYdJAx6CBj0EHGoIOMQQcZgw4yBh1kDDrIGHSQ'
+        'MeggY9BBxqCDjEEHGYMOMgYdZAw6yBh0kDHoIGPQQcagE4xBJxiDTjAGnWAMOsEYdIIx6ARj0AnG'
+        'oBOMQScYg04wBp1gDDrBGHSCMegEY9AJxqCDk8H2QcE7vu6c7T++faF8yDnbUDhnGwrnbEPhnG0o'
+        'nLMNhXO2oXDONhTO2YbCOduQc7Yh52xD8ByC5xA8h+A5BM8heA7BcwieQ/AcgucQPIfgOQTPIXgO'
+        'wXMInkPwHILnEDyH4DkEzyF4DsFzCJ5D8ByC5xA8h+A5BM8heA7BcwieQ/AcgucQPIfgOQTPIXgO'
+        'wXMInkPwHILnEDyH4DkEzyF4DsFzCJ5D8ByC5xA8h+A5BM8heA7BcwieQ/AcgucQPIfgOQSXIZQO'
+        'oXQIpUMoHULpEEqHUDqE0iGUDqF0CKVDKB1C6RBKh1A6hNKhcM42FM7ZhsI521A4ZxsK52xD4XRt'
+        'KJyuDYXTtaFwujYUTteGwknaUDijGwonbkPhxG0onLMNhXO2oXZ8er8uPr98G59h8RkO8RkO8RkO'
+        '8RkO8RkO8RkO8RkO8RkO8RkWn2HxGRafYfEZFp9h8RkWn2HxGRafYfEZFp9h8RkWn2HxGRafYfEZ'
+        'Fp9h8RkWn2HxGRafYfEZFp9h8RkWn2HxGRafYfEZFp9h8RkWn2HxGRafYfEZFp9h8RkWn2HxGRaf'
+        'YfEZFp9h8RkWn2HxGRafYfEZFp9h8RkWn2HxGRafYfEZFp9h8RkWn2HxGRafYfEZFp9h8RkWn2Hx'
+        'GRafYfEZFp9h8RkWn2HxGRafYfEZFp9h8RkWn2HxGRafYfEZFp9h8RkWn+EQn+EQn+EQn+EQn+EQ'
+        'n+EQn+EQn+EQn+EQn+EQn+EQn+EQn+EQn+EQn+EQn+EQn+F2fN7ZGrSvf1rzwzOtuTrWDlTf9ez9'
+        'ztbu4r3Xv/jwQzfffNlz+xMZx0I0xmRiTBjGID4G8TGIj6F5DM1j+B0D7hhwx4A7Bs4xcI7hcAyH'
+        'Y8gbg9wY1sawNoanMcyMYWYMLGNgGQPLGBLGkDAGgTGrPWa1x6zvmPUds7BjDDAm+mMyPybzYzI/'
+        'JvNjMj8m82PiPSbeY+I9JtBjAj0myWNCOya0Y0I7JrRjYjompmNiOiaYY4I5JpFjojgmfGPCNyZ8'
+        'Y8I3JnVjUjcmdWNSNyZnYyI1JlJjIjUmUmMiNSZEY9IzJj1j0jMmL2PyMiYhYyEaYyEaYyEaYyEa'
+        'YyEaYyEaY8HJYyEkY8HdYyEuYyEuYyEuY8H7Y8H7YyFC7atHwj/jA+H3vhSuvhyuvhKuvhquvnZz'
+        'NZF+193m9Af2cO/mNtXnW2cN31O703e3qbx5diIbvtT4ntBf0f6pz7nHC2FcKoRxqRBiUwixKYTI'
+        'FUJYCiGahdATCmRZ0BoKnFnQIQrUWaDOAnUWqLNAnQXqLOglBb2koJcU+LTApwU+LWgwBQ2mwK4F'
+        'di1oNwWSLeg6BV2noOsUmLfAvAXmLTBvQUcq6EgFHi7wcIGHC9pUQZsqsHKBlQuaVoGcC3pXgaML'
+        'WlhBCyswdoGxC4xdYOyC9lYg7gJxF4i7QNwFra+g9RVovKADFnTAgg5Y4PYCtxe4vcDtBW4vaJIF'
+        'TbLA9AW9skD4BcIvEH5BAy1ooAX6L9B/QTstaKcFzaCgqxZCTyiEnlAIPaEQekIh9IRC6AmF0AkK'
+        'wf+F4P9C8H8huL4QvF4IXi8ErxeC1wvB64W219/zdbuNydvdRtFuoxjiUwzxKYb4FEN8iiE+xRCf'
+        'YohPMcSnKD5F8SmKT1F8iuJTFJ+i+BTFpyg+RfEpik9RfIriUxSfovgUxacoPkXxKYpPUXyK4lMU'
+        'n6L4FMWnKD5F8SmKT1F8iuJTFJ+i+BTFpyg+RfEpik9RfIriUxSfovgUxacoPkXxKYpPUXyK4lMU'
+        'n6L4FMWnKD5F8SmKT1F8iuJTFJ+i+BTFpyg+RfEpik9RfIriUxSfovgUxacoPkXxKYpPUXyK4lMU'
+        'n6L4FMWnKD5F8SmKT1F8iuJTFJ+i+BRDfIohPsUQn2KITzHEpxjiUwzxKYb4FEN8iiE+xRCfYohP'
+        'McSnGOJTDPEphvgU2/HpuxuL7p55+j0moZvx6eihb/DHIf6lH2q9A/hD38J89N7b12Y+ev3azDjl'
+        'jlPuOOWOU+445Y5T7jjljlPuOOWOU+445Y5T7jjljlPuOOWOU+445Y5T7jjljlPuOOWOU+445Y5T'
+        '7jjljlPuOOWOU+445Y5T7jjljlPuOOWOU+445Y5T7jjljlPuOOWOU+445Y5T7jjljlPuOOWOU+44'
+        '5Y5T7jjljlPuOOWOU+445Y5T7jjljlPuOOWOU+445Y5T7jjXjnPtONeOc+04145z7TjXjnPtONeO'
+        'c+04145z7TjXjnPtONeOc+04xY+3lfa+O6XdKe3bvrm7keDPtvaQ34TJ3n//Q/L59nNL8fsev0+/'
+        'pf1bHwhH6mftR5k++HXT7XNuX/mqmG4rYbqthOm2EqbbSphuK2G6rYTpthKm20qYbium24rptkK1'
+        'FaqtUG2FaitUW6HaCtVWqLZCtRWqrVBthWorVFuh2grVVqi2QrUVqq1QbYVqK1RbodoK1VaotkK1'
+        'FaqtUG2FaitUW6HaCtVWqLZCtRWqrVBthWorVFuh2grVVqi2QrUVqq1QbYVqK1RbodoK1VaotkK1'
+        'FaqtUG2FaitUW6HaCtVWqLZCtRWqrVBthWor1Fdh3ArjVhi3wrgVxq0wboVxK4xbYdwK41YYt8K4'
+        'FcatMG6FcSuMWwnTbSVMt5Uw3VbCdFsJ020lTLeVMN1WwnRbCdNtJUy3lTDdVsJ0WwnTbSVMt5Uw'
+        '3VbCdFtpt4IP3Y4PR9fjwwSmJzA9gekJTE9gegLTE5iewPQEpicwPYHpCUxPYHoC0xOYnsD0BKYn'
+        'MD2B6QlMT2B6AtMTmJ7A9ASmJzA9gekJTE9gegLTE5iewPQEpicwPYHpCUxPYHoC0xOYnsD0BKYn'
+        'MD2B6QlMT2B6AtMTmJ7A9ASmJzA9gekJTE9gegLTE5iewPQEpicwPYHpCUxPgHkCzBNgngDzBJgn'
+        'wDwB5gkwT4B5AswTYJ4A8wSYJ8A8AeYJME/I0ESbmUTLyn/+2spn7QebPnz7DMm/QdEUiqZQNIWi'
+        'KRRNwWcKPlPwmYLPFHym4DMFnyn4TMFnCj5T8JmCzxR8puAzBZ8p+EzBZwo+U/CZgs8UfKbgMwWf'
+        'KfhMwWcKPlPwmYLPFHym4DMFnyn4TMFnCj5T8JmCzxR8puAzBZ8p+EzBZwo+U/CZgs8UfKbgMwWf'
+        'KfhMwWcKPlPwmYLPFHym4DMFnyn4TMFnCj5T8JmCzxR8puAzBZ8p+EzBZwo+U/CZgs8UfKbgMwWf'
+        'KfhMtfH5yH3vGKX/dbuJf/T+m7wPn//cF5581hMTnysX8+XxJ4qff6zcfqv0n7SeA022/+TtSDh5'
+        '/fc8t/UXP9Z+f/WZ458pFT8//sRjnyl4STUd3mD9L9svgvTfjb8/cONveKovd4+F78Wn8D7eZrc7'
+        'ny+WK8X8j5c/W/ipfOWJxz6ff0cb/q/8nJepH/6Ne+F4xu2faf/FX7k3837mIf99H7354pWO63a+'
+        'QMQLRLxAxAtEvEDEC0S8QMQLRLxAxAtEvEDEC0S8QMQLRLxAxAtEvEDEC0S8QMQLRLxAxAtEvEDE'
+        'C0S8QMQLRLxAxAtEvEDEC0S8QMQLRLxAxAtEvEDEC0S8QMQLRLxAxAtEvEDEC0S8QMQLRLxAxAtE'
+        'vEDEC0S8QMQLRLxAxAtEvEDEC0S8QMQLRLxAxAtEvEDEC0S8QMQLRLxAxAtEvEDEC0S8QMQLRLxA'
+        'xAtEvEDEC0S8QMQLRLxAxAtEvNAWcerb7MGbDeBrWhvAOyne3RP4pkT4ibvufAfi7+9++8MT3+Dt'
+        '9m8ayoe/7tvNdh68brIP/7Ieu6jHLuqxi3rsoh67aMu8qNUuarWLWu2iVruo1S5qtYta7aJWu6jV'
+        'Lmq1i1rtola7qNUuarWLWu2iVruo1S5qtYta7aJWu6jVLmq1i1rtola7qNUuarWLWu2iVruo1S5q'
+        'tYta7aJWu6jVLmq1i1rtola7qNUuarWLWu2iVruo1S5qtYta7aJWu6jVLmq1i1rtola7qNUuarWL'
+        'Wu2iVruo1S5qtYta7aJWu6jVLmq1i1rtola7qNUuarWLWu2iVruo1S5qtYta7aJWu6jVLmq1i1rt'
+        'ola72G61nwwbnMd/vHUH5uZ+5UuuH2GphruU1XCXshruUlbDXcpquEtZDXcpq+EuZTXcpay6S1l1'
+        'l7IKzyo8q/CswrMKzyo8q/CswrMKzyo8q/CswrMKzyo8q/CswrMKzyo8q/CswrMKzyo8q/CswrMK'
+        'zyo8q/CswrMKzyo8q/CswrMKzyo8q/CswrMKzyo8q/CswrMKzyo8q/CswrMKzyo8q/CswrMKzyo8'
+        'q/CswrMKzyo8q/CswrMKzyo8q/CswrMKlypKqyitorSK0ipKqyitorSK0ipKqyitorSK0ipKqyit'
+        'orSK0mq4S1kNdymr4S5lNdylrIa7lNVwl7Ia7lJWw13KarhLWQ13KavhLmU13KWshruU1XCXshru'
+        'UlbDXcpqOz7p320mePLBRz7W3uP/kZaS7waE75MB4earkx9pnZffbBs+9JT5AdLpT93eVf/U9TZ8'
+        'mYOXOXiZg5c5eJmDlzl4mYOXOXiZg5c5eJmDlzl4mYOXOXiZg5c5eJmDlzl4mYOXOXiZg5c5eJmD'
+        'lzl4mYOXOXiZg5c5eJmDlzl4mYOXOXiZg5c5eJmDlzl4mYOXOXiZg5c5eJmDlzl4mYOXOXiZg5c5'
+        'eJmDlzl4mYOXOXiZg5c5eJmDlzl4mYOXOXiZg5c5eJmDlzl4mXyXyXeZfJfJd5l8l8l3mXyXyXeZ'
+        'fJfJd5l8l8l3mXyXyXeZfJfJd5nzl9uOe+T+rxr7Quuu6Ke/7mjzh2+PNlcdba6GoWE1DA2rYWhY'
+        'DUPDahgaVsPQsBqGhtUwNKwaGlYNDauAXQXsKmBXAbsK2FXArgJ2FbCrgF0F7CpgVwG7CthVwK4C'
+        'dhWwq4BdBewqYFcBuwrYVcCuAnYVsKuAXQXsKmBXAbsK2FXArgJ2FbCrgF0F7CpgVwG7CthVwK4C'
+        'dhWwq4BdBewqYFcBuwrYVcCuAnYVsKuAXQXsKmBXAbsK2FXArgJ2FbCrgF0F7CpgVwG7CqBV3K7i'
+        'dhW3q7hdxe0qbldxu4rbVdyu4nYVt6u4XcXtKm5XcbuK29UwNKyGoWE1DA2rYWhYDUPDahgaVsPQ'
+        'sBqGhtUwNKyGoWE1DA2rYWhYDUPDahgaVsPQsBqGhtV2oDJ/oDcSnnz2T/2Jxz7/k5X85GOfb9X2'
+        'jdofv5fgp9L88Jfaf89D39+3GuLXw8hyaxj5HhgeHr372Q/fxz+UrPUTH9o/g+JzrR3J98/Pfhho'
+        '/fziH/70o4/0P5pIt7dUv9h+3mrwdpT96vUou2Ey2DAZbJgMNkwGGyaDDZPBhslgw2SwYTLYMBls'
+        'mAw2TAYbJoMNk8GGyWDDZLBhMtgwGWyYDDZMBhsmgw2TwYbJYMNksGEy2DAZbJgMNkwGGyaDDZPB'
+        'hslgw2SwYTLYMBlsmAw2TAYbJoMNk8GGyWDDZLBhMtgwGWyYDDZMBhsmgw2TwYbJYMNksGEy2DAZ'
+        'bJgMNkwGGyaDDZPBhslgw2SwYTLYMBlsmAw2TAYbRoINI8GGkWDDSLBhJNgwEmwYCTaMBBtGgg0j'
+        'wYaRYMNIsGEk2DASbBgJNowEGyaRjXbnzbbPMn94IPmRRz710YE2TI+2foTnH/I77d9Ybh/FD4Wn'
+        '+d7Tpi33dSPvf377rkrNyFsLI28tjLy1MPLWwshbCyNvLYy8tTDy1sLIWzPy1oy8NWDXgF0Ddg3Y'
+        'NWDXgF0Ddg3YNWDXgF0Ddg3YNWDXgF0Ddg3YNWDXgF0Ddg3YNWDXgF0Ddg3YNWDXgF0Ddg3YNWDX'
+        'gF0Ddg3YNWDXgF0Ddg3YNWDXgF0Ddg3YNWDXgF0Ddg3YNWDXgF0Ddg3YNWDXgF0Ddg3YNWDXgF0D'
+        'dg3YNWDXgF0Ddg3YNaDV8F3Ddw3fNXzX8F3Ddw3fNXzX8F3Ddw3fNXzX8F3Ddw3fNXzXwshbCyNv'
+        'LYy8tTDy1sLIWwsjby2MvLUw8tbCyFsLI28tjLy1MPLWwshbCyNvLYy8tTDy1trBG27HJ9P6jUcf'
+        'vBkeBx68vuH8+OCDN8Nj6+penNq/0Y5T++q94ep94er94Soerj4Qrj4Yrh66uboXp3bpUJ6hPFP5'
+        'UeVZyoPKs5XnKJ3Kc5UupVt5nvJ8pUd5gfJC5UXKi5WXKC9VXqb8mPJy5RXKK5VXKa9WXqO8Vnmd'
+        '8nrlDcoblTcpEeXNyluUtypvU96uRJV3KL3KO5WY8i7l3cp7lD7lvcr7lPcrceUDygeVDykJ5cPK'
+        'R5SPKlklqXxM6Vc+rqSUTygPK59U0sqnlEeUTysZ5VFlQBmEzHMCPHvh6lfCVSNc/Wq4+mKgeD/8'
+        '3q+Fq4Nw9evh6jBcfSlcfTlcfSVcfTVcfe3maiI9cjv7/IPr2WdLi9jSIra0iC0tYkuL2NIitrSI'
+        'LS1iS4vY0iK2tIgtLWJLi9jSIra0iC0tYkuL2NIitrSILS1iS4vY0iK2tIgtLWJLi9jSIra0iC0t'
+        'YkuL2NIitrSILS1iS4vY0iK2tIgtLWJLi9jSIra0iC0tYkuL2NIitrSILS1iS4vY0iK2tIgtLWJL'
+        'i9jSIra0iC0tYkuL2NIitrSILS1iS4vY0iK2tIgtLWJLb9jSG7b0hi29YUtv2NIbtvSGLb1hS2/Y'
+        '0hu29IYtvWFLb9jSG7b0hi29YUtL2mor+A+HH3vxZ9uPNv6Ru8cZvv2nFTdHBr/ROjK4e8jmG7/H'
+        '8B983Zz9tNtby9vm7O0wZ2+HOXs7zNnbYc7eDnP2dpizt8OcvR3m7G1z9rY5e5tEt0l0m0S3SXSb'
+        'RLdJdJtEt0l0m0S3SXSbRLdJdJtEt0l0m0S3SXSbRLdJdJtEt0l0m0S3SXSbRLdJdJtEt0l0m0S3'
+        'SXSbRLdJdJtEt0l0m0S3SXSbRLdJdJtEt0l0m0S3SXSbRLdJdJtEt0l0m0S3SXSbRLdJdJtEt0l0'
+        'm0S3SXSbRLdJdJtEt0l0m0S3SXSbRLdJdJvUtrl0m0u3uXSbS7e5dJtLt7l0m0u3uXSbS7e5dJtL'
+        't7l0m0u3uXSbS7fDnL0d5uztMGdvhzl7O8zZ22HO3g5z9naYs7fDnL0d5uztMGdvhzl7O8zZ22HO'
+        '3g5z9naYs7fbkh+9k/rdM2rfJo/f9LJ06/bztyT1sfa42tEy+j9vj6vPfHyXMXcZs1Uen2phvMud'
+        'uzS5S5O7xLjLiLuMuMuIu6y3y3q7BLdLcLuUtstluyS2S2K7RLVLRrtktMtCuyy0y0K7FLNLMbvc'
+        'sksjuzSySxy7xLHLGLtay66esquZ7Gomu5rJrmayq5nsaia7+sauvrGrb+zqFLs6xa4Wsasb7OoG'
+        'u7rBrm6wy/+7/L/L/7uMv8v4u1S/y/G7rL7L6rusvsvqu3S+S+e7dL5L57sEvsvVu1y9y9W7XL3L'
+        '1bvsvEvLu7S8S8u7RLxLxLvUu9t2Wv7+t7r+i/bduD96/5s6f7f9W4+FG3Z/tf3rH7/vu/jSb2//'
+        'VuF21/T3rndNexZnT8Pfs0Z71mjPGu1Zoz1rtGeN9uC7B9890O5ZuD0Lt2fh9pC8h+Q9y7hnGfdw'
+        'vWc19+C9B+89eO9Z4j1LvGeJ9yzxHvT3oL9nwfcs+J4F35OHPXnYs/x7ln9POvZQsCcke2DYk5U9'
+        'WdmDxh409qCxB409OdpDyB5C9hCyh5A9GduTsT287InanqjtidoeiPZAtAeiPfTsieGeGO5haU8a'
+        '9yC1B6k9SO2J6J6I7gFsD2B7ArsnsHtw25PbPdDuteH7idv3B38RMg3INCDTgEwDMg2sNLDSwEoD'
+        'Kw2sNLDSwEoDKw2sNLDSwEoDKw2sNLDSwEoDKw2sNLDSwEoDKw2sNLDSwEoDKw2sNLDSwEoDKw2s'
+        'NLDSwEoDKw2sNLDSwEoDKw2sNLDSwEoDKw2sNLDSwEoDKw2sNLDSwEoDKw2sNLDSwEoDKw2sNLDS'
+        'wEoDKw2sNLDSwEoDKw2sNLDSwEoDKw2sNLDSwEoDKw2sNLDSwEoDK402K8Uf4J9I9iNPu/uJZN+b'
+        'O+o/dtv16tdd74DCDijsgMIOKOxA1ztgsgMmO2CyAyY7YLIDJjtgsgMmO2CyAyY7YLIDJjtgsgMm'
+        'O2CyAyY7YLIDJjtgsgMmO2CyAyY7YLIDJjtgsgMmO2CyAyY7YLIDJjtgsgMmO2CyAyY7YLIDJjtg'
+        'sgMmO2CyAyY7YLIDJjtgsgMmO2CyAyY7YLIDJjtgsgMmO2CyAyY7YLIDJjtgsgMmO2CyAyY7YLID'
+        'JjtgsgMmO2CyAyY7YLIDJjtgsgMmO2CyAyY7YLIDJjtom+wn77aRf3DyulHql1tvK96Z7NZkpTDi'
+        'd7fvYI+HX//l9q8fv6P2e7Xl3rwXN3YP6R8saH+q3X5/ofUf/4Gf+0LrPfqffuyJQilfeeKnn8h/'
+        'rjxRyfe2n8C8uNeZ31U6nEiXv1tP2T3+861/y99qfXA3z9vdPGvXeu7um3nW7uY5u9Yzdq1n7a6f'
+        's3vy6a0vDHii/XjNr7a+9r71zF3r2bvvwHN3j//mtT7/0j0nfEsP4X3h8V9s/V99O57F+3efw/vO'
+        'P333s4//0u3Td9fP4n0LD+H99B+sWm9a4t984Cn2nPLd1uZbcetnvg0/xPbTD979ENu7H2L7uzP2'
+        '2dvt86PX2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz'
+        '2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz'
+        '2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz'
+        '2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz2+cz'
+        '2+cz2+cz2+cz2+ez9vb5c2FjUmt/Cd0fb/360dav/0r7IOLzX/eQw396+zBx00MOzfCQQzM85NAM'
+        'Dzk0w0MOzfCQQzM85NAMDzk0w0MOTSdRTQ85NOHbhG8Tvk34NuHbhG8Tvk34NuHbhG8Tvk34NuHb'
+        'hG8Tvk34NuHbhG8Tvk34NuHbhG8Tvk34NuHbhG8Tvk34NuHbhG8Tvk34NuHbhG8Tvk34NuHbhG8T'
+        'vk34NuHbhG8Tvk34NuHbhG8Tvk34NuHbhG8Tvk34NuHbhG8Tvk34NuHbhG8Tvk34NuHURHETxU0U'
+        'N1HcRHETxU0UN1HcRHETxU0UN1HcRHETxU0UN1HcDA85NMNDDs3wkEMzPOTQDA85NMNDDs3wkEMz'
+        'POTQDA85NMNDDs3wkEMzPOTQDA85NMNDDs3wkEMzPOTQbMer8nu1/d9svfjVfOj3MZb+VusP/Xbr'
+        'f/7FQ9/mff7j/9IXn6X/Tut9m+/4UPCvWv/+v/PQd2E8eLKj8NnP/MT4E+Of/Ux7R/eR1lD+bR4Z'
+        'nnxG+bM/OV54rJz/7Ofb/5Bf+h54B/9bmiOeuHX+vd3+P7z3X/OQ1/se/s9a75tM3J4z/pYp45Km'
+        'L2n6kqYvafqSpi9p+pKmL2n6kqYvafqSpi9p+pKmL2n6kqYvafqSpi9p+pKmL2n6kqYvafqSpi9p'
+        '+pKmL2n6kqYvafqSpi9p+pKmL2n6kqYvafqSpi9p+pKmL2n6kqYvafqSpi9p+pKmL2n6kqYvafqS'
+        'pi9p+pKmL2n6kqYvafqSpi9p+pKmL2n6kqYvafqSpi9p+pKfL/n5kp8v+fmSny/5+ZKfL/n5kp8v'
+        '+fmSny/5+ZKfL/n5kp8v+flSW7hsa3AyTBn19u3PP/F1U8V/cjtVXJkqrsJUcRWmiqswVVyFqeIq'
+        'TBVXYaq4ClPFVZgqrkwVV6aKK7hewfUKrldwvYLrFVyv4HoF1yu4XsH1Cq5XcL2C6xVcr+B6Bdcr'
+        'uF7B9QquV3C9gusVXK/gegXXK7hewfUKrldwvYLrFVyv4HoF1yu4XsH1Cq5XcL2C6xVcr+B6Bdcr'
+        'uF7B9QquV3C9gusVXK/gegXXK7hewfUKrldwvYLrFVyv4HoF1yu4XsH1Cq5XcL2CzxVqr1B7hdor'
+        '1F6h9gq1V6i9Qu0Vaq9Qe4XaK9ReofYKtVeovULtVZgqrsJUcRWmiqswVVyFqeIqTBVXYaq4ClPF'
+        'VZgqrsJUcRWmiqswVVyFqeIqTBVXYaq4ClPFVTtOf7Jt4PYP5Pzo7Q/kfODpN//u7asv3vzeRHrq'
+        'dmP4luuN4UNPb2egXZ6p/KjyLOVB5dnKc5RO5blKl9KtPE95vtKjvEB5ofIi5cXKS5SXKi9Tfkx5'
+        'ufIK5ZXKq5RXK69RXqu8Tnm98gbljcqblIjyZuUtyluVtylvV6LKO5Re5Z1KTHmX8m7lPUqf8l7l'
+        'fcr7lbjyAeWDyoeUhPJh5SPKR5Wk8jGlX/m4klI+oTysfFJJK59SHlE+rWSUR5UBZVDJtstEevrf'
+        '+ba1L17L+sE2cG18n/70m2A8vf23/Kmvs3rt1uo//PS21VuF1dtX7w1X7wtX7w9X8XD1gXD1wXD1'
+        '0M3VPau3S4fyDOWZyo8qz1IeVJ6tPEfpVJ6rdCndyvOU5ys9yguUFyovUl6svER5qfIy5ceUlyuv'
+        'UF6pvEp5tfIa5bXK65TXK29Q3qi8SYkob1beorxVeZvydiWqvEPpVd6pxJR3Ke9W3qP0Ke9V3qe8'
+        'X4krH1A+qHxISSgfVj6ifFTJKknlY0q/8nElpXxCeVj5pJJWPqU8onxaySiPKgPKIGSeE+DZC1e/'
+        'Eq4a4epXw9UXb9hl9fbVr4Wrg3D16+HqMFx9KVx9OVx9JVx9NVx97eZqIv2nby39pWtLd2C6A9Md'
+        'mO7AdAemOzDdgekOTHdgugPTHZjuwHQHpjsw3YHpDkx3YLoD0x2Y7sB0B6Y7MN2B6Q5Md2C6A9Md'
+        'mO7AdAemOzDdgekOTHdgugPTHZjuwHQHpjsw3YHpDkx3YLoD0x2Y7sB0B6Y7MN2B6Q5Md2C6A9Md'
+        'mO7AdAemOzDdgekOTHdgugPTHZjuwHQHmDvA3AHmDjB3gLkDzB1g7gBzB5g7wNwB5g4wd4C5A8wd'
+        'YO4Ac4cMdbSZ+Zmv26q9uf1juu9d9P7cF57syed9///nHnviieLnP+Ob0N/TPsF9rLWP+zO3j7o3'
+        'rx9178RNJ25axaPunQjqBEsnWDrh0YmLTlx04qLT2nda+07L3GmZOy1spxXttJSdlrLTcnVakk5L'
+        '0mktOq1Fp7Xo9Hl3+rw7fdCdPtNOn2mnT7HTp9jp4+vUNDolq1OkOkWqU6Q6RapTpDpFqlN6OqWn'
+        'U3o65aVTXjoFpVMmOmWiUyY6ZaJTCjqloFMKOnHfiftOwHcivRPbndjuxHYntjtB3QnqTlB3groT'
+        'xp2I7URsJ2I7EdQJ3E6odmK0E6OdGO1EZScqO3HY2SbvP7y1Ve+1rbp8pl1s1eWj7fLRdvlou3y0'
+        'XT7aLh9tF+q6UNeFtS6fd5fPu8vn3QXALgB2+fS7fPpdcOyyCF2o7EJlFyq7rEyXlemyMl1Wpgux'
+        'XYjtsk5d1qnLOnXBuAvGXVaty6p1gbrL4nVhu8sadkG8C+JdVrTLinZZ0S4r2gX/LgvbZWG7LGyX'
+        'he0SjS7R6LLMXRLSJSFdEtJl7busfZe177LoXdLTJT1dEOgSoi4kdCGhCwldktUlWV246MJFl5x1'
+        'yVkXSrrErQtrXW1mZu6eevr+PI2/eajhF1q3Np9qR/M/e2uyf3Ztsh4m62GyHibrYbIeJuthsh4m'
+        '62GyHibrYbIeJuthsh4m62GyHibrYbIeJuthsh4m62GyHibrYbIeJuthsh4m62GyHibrYbIeJuth'
+        'sh4m62GyHibrYbIeJuthsh4m62GyHibrYbIeJuthsh4m62GyHibrYbIeJuthsh4m62GyHibrYbIe'
+        'Juthsh4m62GyHibrYbIeJuthsh4m62GyHibrYbIeJuthsh4m62GyHibrYbIeJuthsh4m62GyHibr'
+        'YbKe/4+9uw+Md73rOs/5nXOKbQnlKRRomgIB2iEtJeWh9OHuMKXJpD2dHpocrAkxMT7GyJYxUmfi'
+        'NogBNdHGqGE2jINmXbKSKFkdJK7ZKDBGdjTKdJACA0nGGCVmAxINw6C7ru6Z+5Vc+R2W8tTT0542'
+        '//S6Mvmd8zud6/15f7/Xdd9zD5N9bmyyxXCZ9Mviy6Tf+Ulotg/ePPPvHQ9+J5+nCE6pdq453d8T'
+        '8lHWHL99buy3F832EFsPsfUQWw+x9RBbD7H1EFsPsfUQWw+x9RBbD7H1EFsPsfUQWw+x9RBbD7H1'
+        'EFsPsfUQWw+j9TBaD6P1MFoPo/UwWg+j9TBaD6P1MFoPo/UwWg+j9TBaD6P1MFoPo/UwWg+j9TBa'
+        'D6P1MFoPo/UwWg+j9TBaD6P1MFoPo/UwWg+V9VBZD5X1UFkPlfVQWQ+V9XBYD4f1cFgPh/VwWA+H'
+        '9XBYD4f1cFgPh/VwWA+H9ZBXD3n1xPL6rvs27P6myOdYSbe2/+7OJ/R/3Tbsz3583Lc7f3/f7n3V'
+        'vKPyz9278h7EZ/cpJU9sfKQPKfnznQdGzN+0378v3oAsPfzNB9/beWW5s0V5cedP/KX4nou/EO7B'
+        '+N74Ts+/eE/2PdmByT/x8fHc9g8ESPdjSFc+HKTh62/+yCPP8y8tum08vqfTGd3j+1vB96895i37'
+        'V5237Fm29MxrO//mV33ED5L6Sx0h9978h/5YbODVZ+EzQH/10fvPAN1/BujDY/eXY8Zu7tfN/IMO'
+        'LX/15ubu/s7HWYdm/8qjt3/bdz/a+Sf+yjO+lvOlt1/LmfnnN2fhkbPwyJFR5MgocmQUOTKKHBlF'
+        'jowiR0aRI6PIkVHkyChyZBQ5MoocGUWOjCJHRpEjo8iRUeTIKHJkFDkyihwZRc7CIydHkZOjyMlR'
+        '5OQocnIUOTmKnBxFTo4iJ0eRk6PIyVHk5ChychQ5OYqcHEVOjiInR5GTo8jJUeTkKHJyFDk5ipwc'
+        'RU6OIidHkZOjyMlR5OQocnIUOTmKnIVHDpAiB0iRA6TIAVLkAClygBQ5QIqchUfOkSLnSJFzpMg5'
+        'UuQcKXKOFDlHipwjRc6RIudIkXOkyDlS5Cw8cpwUOU6K4uOkvxoD9PduVPeuzv75B29+eG38BQVr'
+        'Dz/fbCtuV787/mduW9jZR26hu7yBbhB0g6AbBN0g6AZBNwi6QdANgm4QdIOgGwTdIOgGQTcIukHQ'
+        'DYJuEHSDoBsE3SDoBkE3CLpB0A2CbhB0g6AbBN0g6AZBNwi6QdANgm4QdIOgGwTdIOgGQTcIukHQ'
+        'DYJuEHSDoBsE3SDoBkE3CLpB0A2CbhB0g6AbBN0g6AZBNwi6QdANgm4QdIOgGwTdIOgGQTcIukHQ'
+        'DYJuEHSDoBsE3SDoBkE3CLpB0A2CbhB0g6AbBN0g6AZBNxhDV/iYfsHPR/LAgefBF/t43MIPdRJ7'
+        '/3SBh58uMPNNnU+9/OC7O1b7n57ZzX3g0/5/31T2q0+b8Dfo8W4b/9OOMR9q+DqvjXWuqT0LX6D2'
+        '2O1/TOZlD+7PNT+23WHo0n7N96bNfv9jv2nHmLyplL/3wc0tfpkvevTZ+972m2r9JzuI/Dr95fsy'
+        '63e3SHz5TYUeVaFHVehRFXpUhR5VoUdV6FEVelSFHlWhR1XoURV6VIUeVaFHVehRFXpUhR5VoUdV'
+        '6FEVelSFHlWhR1XoURV6VIUeVaFHVehRFXpUhR5VoUdV6FEVelSFHlWhR1XoURV6VIUeVaFHVehR'
+        'FXpUhR5VoUdV6FEVelSFHlWhR1XoURV6VIUeVaFHVehRFXpUhR5VoUdV6FEVelSFHlWhR1XoURV6'
+        'VIUeVaFHVehRFXpUhR5VoUdV6FEVelSFHlWhR1XoURV6VIUeVaFHVehRFXpUhR5VoUfjCv099+eL'
+        '9+eLv+WN8G0x/PGO1j6KB4zFmMqfudHpt3b+ttrND4V4s/LX7lSXuFHdONWNU9041Y1T3TjVjVPd'
+        'ONWNU9041Y1T3TjVjVPdONWNU9041Y1T3TjVjVPdONWNU9041Y1T3TjVjVPdONWNU9041Y1T3TjV'
+        'jVPdONWNU9041Y1T3TjVjVPdONWNU9041Y1T3TjVjVPdONWNU9041Y1T3TjVjVPdONWNU9041Y1T'
+        '3TjVjVPdONWNU9041Y1T3TjVjVPdONWNU9041Y1T3TjVjVPdONWNU9041Y1T3TjVjVPdONWNU904'
+        '1Y1T3TjVjceqK90x809vmJnAzARmJjAzgZkJzExgZgIzE5iZwMwEZiYwM4GZCcxMYGYCMxOYmcDM'
+        'BGYmMDOBmQnMTGBmAjMTmJnAzARmJjAzgZkJzExgZgIzE5iZwMwEZiYwM4GZCcxMYGYCMxOYmcDM'
+        'BGYmMDOBmQnMTGBmAjMTmJnAzARmJjAzgZkJzExgZgIzE5iZwMwEZiYwM4GZCcxMYGYCMxOYmcDM'
+        'BGYmMDOBmQnMTGBmAjMTmJnAzARmJjAzgZkJzEzEzHzv3afo25CZhMwkZCYhMwmZSaxMYmUSK5NY'
+        'mcTKJFYmsTKJlUmsTGJlEiuTWJnEyiRWJrEyiZVJrExiZRIrk1iZxMokViaxMomVSaxMYmUSK5NY'
+        'mcTKJFYmsTKJlUmsTGJlEiuTWJnEyiRWJrEyiZVJrExiZRIrk1iZxMokViaxMomVSaxMYmUSK5NY'
+        'mcTKJFYmsTKJlUmsTGJlEiuTWJnEyiRWJrEyiZVJrExiZRIrk1iZxMokViaxMomVyZiVvx6zcnN0'
+        'e3Oc+8S//nPf/fAx7t+4vXL2RE/ngG3jk7r7CjfzdHY0963Yh23FPvD44MjIkyPxAcH3d96r5/hy'
+        '7//cORn+iZv+6zC+4vs377z4IV6c5cVZXpzlxVlenFVKZ+lxlh5n6XGWHmfpcZYeZ+lxlh5n6XGW'
+        'HmfpcZYeZ+lxlh5n6XGWHmfpcZYeZ+lxlh5n6XGWHmfpcZYeZ+lxlh5n6XGWHmfpcZYeZ+lxlh5n'
+        '6XGWHmfpcZYeZ+lxlh5n6XGWHmfpcZYeZ+lxlh5n6XGWHmfpcZYeZ+lxlh5n6XGWHmfpcZYeZ+lx'
+        'lh5n6XGWHmfpcZYeZ+lxlh5n6XGWHmfpcZYeZ+lxlh5n6XGWHmfpcZYeZ2M9/i/PwnXVP/XI/XXV'
+        '++uqH95U33d/mvHRLKG3Bfsvdzbk93en/lap3LzbeL7zZuOZVS2zqmVWtcyqllnVMqtaZlXLrGqZ'
+        'VS2zqmVWtcyqllnVMqtaZlXLrGqZVS2zqmVWtcyqllnVMqtaZlXLrGqZVS2zqmVWtcyqllnVMqta'
+        'ZlXLrGqZVS2zqmVWtcyqllnVMqtaZlXLrGqZVS2zqmVWtcyqllnVMqtaZlXLrGqZVS2zqmVWtcyq'
+        'llnVMqtaZlXLrGqZVS2zqmVWtcyqllnVMqtaZlXLrGqZVS2zqmVWtcyqllnVMqtaZlXLrGqZVS2z'
+        'qmVWtcyqllnVMhtXy//1rsGqQWYOMnOQmYPMHGTmIDMHmTnIzEFmDjJzkJmDzBxk5iAzB5k5yMxB'
+        'Zg4yc5CZg8wcZOYgMweZOcjMQWYOMnOQmYPMHGTmIDMHmTnIzEFmDjJzkJmDzBxk5iAzB5k5yMxB'
+        'Zg4yc5CZg8wcZOYgMweZOcjMQWYOMnOQmYPMHGTmIDMHmTnIzEFmDjJzkJmDzBxk5iAzB5k5yMxB'
+        'Zg4yc5CZg8wcZOYgMweZOcjMQWYOMnOQmYPMHGTmIDMXI/O37ovfhy1+t5XrhZ1vlbpvxJ7D4vf9'
+        '91Ten2qEG9j3Pj5uYN96xjPQCnfPQMt7Blo+PAMtH56Blg/PQMuHZ6DlwzPQ8uEZaPnwDLR8eAZa'
+        '3uNs8p6BllfJ8yp5XiXPq+R5lTyvkudV8rxKnlfJ8yp5XiXPq+R5lTyvkudV8rxKnlfJ8yp5XiXP'
+        'q+R5lTyvkudV8rxKnlfJ8yp5XiXPq+R5lTyvkudV8rxKnlfJ8yp5XiXPq+R5lTyvkudV8rxKnlfJ'
+        '8yp5XiXPq+R5lTyvkudV8rxKnlfJ8yp5XiXPq+R5lTyvkudV8rxKnlfJ8yp5XiXPq+R5lTWvoOcV'
+        '9LyCnlfQ8wp6XkHPK+h5BT2voOcV9LyCnlfQ8wp6XkHPK+h5BT0fnoGWD89Ay4dnoOXDM9Dy4Rlo'
+        '+fAMtHx4Blo+PAMtH56Blg/PQMuHZ6DlwzPQ8uEZaPnwDLR8eAZaPjwDLR93Gtu/I6d38p95Vm6Y'
+        '+vi2epz4Nzz+2/d755rB7Bsf/xiavqPp2R/+KDYfN/cXPzH0m55iP0um/9v37cd9+/GbtBy3zcm3'
+        'PHv36v3GUP6d3wzK2+1Ks3PefU/o/U7tuaDyBx5+SmXm+8KnPf7dzZnlorZ1Udu6qG1d1LYualsX'
+        'ta2L2tZFbeuitnVR27qobV3Uti5qWxe1rYva1kVt66K2dVHbuqhtXdS2LmpbF7Wti9rWRW3rorZ1'
+        'Udu6qG1d1LYualsXta2L2tZFbeuitnVR27qobV3Uti5qWxe1rYva1kVt66K2dVHbuqhtXdS2Lmpb'
+        'F7Wti9rWRW3rorZ1Udu6qG1d1LYualsXta2L2tZFbeuitnVR27qobV3Uti7qVxf1q4v61UX96qJ+'
+        'dVG/uqhfXdSvLupXF/Wri/rVRf3qon51Ub+6qF9d1K8uapMX47ZwJ3ws+I/GHx/63+5r773ZQi07'
+        'f+TjY+//d+8eqPufbh6ou8RQSwy1FB6ou8RVS7S0REtLRLTEQEsMtMRASyyzxDJLhLJEKEsUssQd'
+        'S6SxRBpLxLAk/EvCvyT1S1K/JPVLkr0k2UsivSS9S9K7JK9L8rokqEtOIJY4fIm8l8h7ibyXyHuJ'
+        'vJfIe4mnl3h6iaeXmHmJmZcoeYl9l9h3iX2X2HeJb5f4dolvlxh2iWGXqHWJU5dYdIlFl1h0iUWX'
+        '6HOJPpfoc4k+lwhziRuXuHGJG5e4aokil0hxiQ2X2HCJDZf4b4n/lhhvKXbc3+vcC/MDNw3j13cs'
+        'V35G2dwLn8w9vymbK97yFWVzxTu/4p1f8c6veOdXvPMr3vkVUK6AcgWKK5ZjxXKsWI4VfK7gc8Xi'
+        'rFicFbSuWKMV0K6AdgW0KxZuxcKtWLgVC7cC6BVAr1jGFcu4YhlXUL6C8hWLumJRVzC/Ym1XoL9i'
+        'iVckYEUCViz4igVfseArFnxFOlas+4p1X7HuK9Z9RXJWJGcFBSsCtCJAKwK0Ao0VaKxAYwUTK8K1'
+        'IlwrCFmRsRWgrABlBSgrgrcieCuwWYHNihiuiOEKiFakcQWKKzFSP3gnpF+4EdKqtV+19qtBSKso'
+        'WLXgqxZ81RKvWttVa7tqbVet36r1W7VUq5Zq1eKsWpVVy7FqOVa95ave1lVv66r3c9X7uer9XPWe'
+        'rXrPVr1Zq96XVe/Lqndi1Tux6i1YJaRV6VgVi1WxWBWLVbFYFYtVsViVgFUJWJWAVcyvYn4V7Ku4'
+        'XsX1Kq5Xcb2K5FUkryJ5Fbur2F0F7SpaV/G5is9VfK7icxWYq8BcBeYqMFehuIq6VdStom4VBavg'
+        'W4XbKs5WcbaKs1VkrSJrFUurMT1///4jtr+Fj9i+uuPm44/gC7zvP2z7Yb/K+4fublX4KSVvTajX'
+        'lLw12V6T7TXZXpPtNdlek+012lujvTWyWxP4NYFfE/g1BlxjwDXxXxP/NT5cY4E1WlyjxTVaXKOG'
+        'NWpYo4Y1alijzDXKXCOKNaJYI4o1Hl3j0TXaWKONNVZdY481cl0jkTWOXePYNUpZo5Q1SlmjlDX+'
+        'XWOWNWZZY5Y1Zlnj5jVuXuOZNYpeo+g1il4jnzXyWSOfNdZZo+81+l7joDUWX6OiNSpao6I1al+j'
+        '9jViWiOmNaJfI/o1mlrj+zWyW4ultfuM62+f/iBcfyu4/lYI198K4fpbIVx/K4Trb4Vw/a0Qrr8V'
+        'wvW3Qrj+VlBsCq6/FeBZgGcBngV4FuBZgGcBngV4FuBZgGcBngV4FuBZgGcBngV4FuBZgGcBngV4'
+        'FuBZgGcBngV4FuBZgGcBngV4FuBZgGcBngV4FuBZgGcBngV4FuBZgGcBngV4FuBZgGcBngV4FuBZ'
+        'gGcBngV4FuBZgGcBngV4FuBZgGcBngV4FuBZgGcBngV4FuBSQGkBpQWUFlBaQGkBpQWUFlBaQGkB'
+        'pQWUFlBaQGkBpQWUFlBaCNffCuH6WyFcfyuE62+FcP2tEK6/FcL1t0K4/lYI198K4fpbIVx/K4Tr'
+        'b4Vw/a0Qrr8VwvW3Qrj+Vojj8w+eEZ/tu8vX6+KzHuKzHuKzHuKzHuKzHuKzHuKzHuKzHuKzLj7r'
+        '4rMuPuvisy4+6+KzLj7r4rMuPuvisy4+6+KzLj7r4rMuPuvisy4+6+KzLj7r4rMuPuvisy4+6+Kz'
+        'Lj7r4rMuPuvisy4+6+KzLj7r4rMuPuvisy4+6+KzLj7r4rMuPuvisy4+6+KzLj7r4rMuPuvisy4+'
+        '6+KzLj7r4rMuPuvisy4+6+KzLj7r4rMuPuvisy4+6+KzLj7r4rMuPuvisy4+6+KzLj7r4rMuPuvi'
+        'sy4+6+KzLj7r4rMuPuvisy4+6+KzLj7rIT7rIT7rIT7rIT7rIT7rIT7rIT7rIT7rIT7rIT7rIT7r'
+        'IT7rIT7rIT7rIT7rIT7rcXz+91/zpXm3Qerp1KGn41MM8SmG+BRDfIohPsUQn2KITzHEpxjiUxSf'
+        'ovgUxacoPkXxKYpPUXyK4lMUn6L4FMWnKD5F8SmKT1F8iuJTFJ+i+BTFpyg+RfEpik9RfIriUxSf'
+        'ovgUxacoPkXxKYpPUXyK4lMUn6L4FMWnKD5F8SmKT1F8iuJTFJ+i+BTFpyg+RfEpik9RfIriUxSf'
+        'ovgUxacoPkXxKYpPUXyK4lMUn6L4FMWnKD5F8SmKT1F8iuJTFJ+i+BTFpyg+RfEpik9RfIriUxSf'
+        'ovgUxacoPkXxKYpPUXyKIT7FEJ9iiE8xxKcY4lMM8SmG+BRDfIohPsUQn2KITzHEpxjiUwzxKYb4'
+        'FEN8inF8/uHdecUv3ZxXlLBZwmYpnFeUUFoCZAmQJQiWsFfCXgl7JXyV8FWCUglKJfCUUFOCSwku'
+        'JUiULHvJspesd8l6l6x3yWKWLGbJKpYsWMmClSxRyRKVrE1JiEvSWxLbktiWxLYktiWxLYltSUJL'
+        'ElqS0JJMlmSyJIwluSvJXUnuSnJXkrSSpJUkrSRbJdkqCVVJmkryU5KfkvyU5KckOCXBKQlOSXBK'
+        'olKSipJUlKSiJBUlqSjJQUkASgJQEoAS5EuQL4G8FNOz93HxAPknnrp/ztL9pe9wTej/+Jgeov2Z'
+        'mcXf0UHad88Unk/Pq4sPzp6NE7NfmrlyoFfsXGx57s/PnJjdnJ99BAdn+894yk3p4afc/O5HOk+5'
+        '+Ud3lfbqptJuqrSbKu1mqLSbKu2mSrup0m6qtJsq7aZKu6nSbqq0myrtpkq7qdJuqrSbKu2mSrup'
+        '0m6qtJsq7aZKu6nSbqq0myrtpkq7qdJuqrSbKu2mSrup0m6qtJsq7aZKu6nSbqq0myrtpkq7qdJu'
+        'qrSbKu2mSrup0m6qtJsq7aZKu6nSbqq0myrtpkq7qdJuqrSbKu2mSrup0m6qtJsq7aZKu6nSbqq0'
+        'myrtpkq7qdJuqrSbKu2mSrup0m6qtJsq7aZKu6nSbqq0myrtpkq7qdJuqrSbKu2mSrup0m7GlfYf'
+        'd27HeNApdv+0c53yh++Oaf+tY9ot7/CWnciWN3rLG73ljd7yRm95o7e80VsY3MLgFvK2vPtb3v0t'
+        '7/4WHLfguGUttqzFFji3LMkWRrcwuoXRLeu0ZZ22rNOWddrC7xZ+t6zallXbsmpboN4C9ZY13LKG'
+        'WxDfspRbSN+yoluA3wL8lvXdsr5b1nfL+m4Jw5Zl3rLMW5Z5yzJvCcqWoGxZ9C152ZKXLXnZQsIW'
+        'EraQsAWBLVnakqUtQGyJ1BYutnCxhYstOduSsy2UbKFkS+q2pG4LM1vCt4W8rZigH3n4Gyxe/FiH'
+        'oh/tvPQXbi52/5v4WRCVWGM318Qz44/cHEZ1fhiKNfZP7jT2H240VoZQGULloLEymMq4KeOmjJQy'
+        'RMoQKUOkDIMyDMpWvGzFy9a4bHHLVrVsVctWrmx1ylanbFnKlqVsWcre+rK3vuw9L3t7y97esje0'
+        '7A0teyfLNFYWsrJ0laWrLF1l6SpLV1m6yoJUFqSyIJVFpyw6ZZkpi0dZPMriURaPskCUBaIsEGUR'
+        'KItAGftl0JdhXoZ5GeZlmJfxXcZ3Gd9lfJcRXQZvGbxl8JbBVMZwGbVluJbhWoZrGaBlgJYhWY4h'
+        'PHgYwkdiCP/pfbv2HLdrcbv1453rpx9p4/b8bdd+7PbbRJ/4oQ6E/+fdp/oPb2712ZP1PQV1T+T3'
+        'RH5P5PdEfk/k90R+jw332HCPA/d4YI8H9nhgjxj3iHGPFfZYYY8m98hhjy332HKPLfcYY48x9hhj'
+        'jzH2mHSPSff4Y48/9vhjj1736HWPTfbYZI9s90hlj3P3uGWPeveod49p9phmj2n2mGaPlvcIZ49w'
+        '9ghnj3D2KHuPsvfoZ4+595h7j7n3OGmPk/Y4aY+M9lh9j9X3qGmP3PcYao+h9hhqj/H3GH+Pr/b4'
+        'ao//9/h/j732lIE9DtyLXVa968GakNmHzD5k9iGzD5l9yOxDZh8y+5DZh8w+ZPYhsw+ZfcjsQ2Yf'
+        'MvuQ2YfMPmT2IbMPmX3I7ENmHzL7kNmHzD5k9iGzD5l9yOxDZh8y+5DZh8w+ZPYhsw+ZfcjsQ2Yf'
+        'MvuQ2YfMPmT2IbMPmX3I7ENmHzL7kNmHzD5k9iGzD5l9yOxDZh8y+5DZh8w+ZPYhsw+ZfcjsQ2Yf'
+        'MvuQ2YfMPmT2IbMPmX3I7ENmHzL7kNmHzD5k9iGzD5l9yOzHyPyzuLuau7lE8dkPYPOPH789U4ln'
+        '3xVm3xdm33I7e/r/a/zCdvjVt4fZN4fZk2E2GmbfEWZLYTYdZqthlgl/1ZAX8uFXrwuzYpglw+w9'
+        'YVYK/4pXeOHd4VdvC7NsmL0/zN4bZq8Js9kwe2uYDYfZE+GvGvVCFH71+tvZ+zL/PDyp7zM6tj+8'
+        's/0rb2xfEd2K6FZEtyK6FZmtyGxFZisyW5HZisxWZLYisxWZrchsRWYrMluR2YrMVmS2IrMVma14'
+        'AysyW5HZisxWZLYisxWZrchsRWYrMluR2YrMVmS2IrMVma3IbEVmKzJbkdmKzFZktiKzFZmtyGxF'
+        'ZisyW5HZisxWZLYisxWZreC4IrMVma3IbEVmKzJbkdmKzFZAWZHZisxWZLYisxWZrchsRWYrMluR'
+        '2YrMVmS2IrMVBFVktiKzlZidf3Gn+V/BygFWDrBygJUDrBxg5QArB1g5wMoBVg6wcoCVA6wcYOUA'
+        'KwdYOcDKAVYOsHKAlQOsHGDlACsHWDnAygFWDrBygJUDrBxg5QArB1g5wMoBVg6wcoCVA6wcYOUA'
+        'KwdYOcDKAVYOsHKAlQOsHGDlACsHWDnAygFWDrBygJUDrBxg5QArB1g5wMoBVg6wcoCVA6wcYOUA'
+        'KwdYOcDKAVYOsHKAlQOsHGDlACsHWDnAygFWDrBygJUDrBzErPzL+w/JPD+vgdx+ruVLO+e2n2gX'
+        'RH787sjmRTdHNlVGqjJSlZGq5FMlnyrdVHmmyjNVnqlySZVLqrRRpY0qUVQZokoNVWqoin9VxKsi'
+        'XpXtqmxXZbsqv1X5rQpuVUarMlqVyqpUVsWx6qCmStFVbq5yc5Wbq9xc5eYqDVdpuErDVeKtEm+V'
+        'cavkWiXXKrlWybVKp1U6rdJplUCrBFplziplVkmySpJVkqySZJUdq+xYZccqO1b5sEp9VeqrUl+V'
+        'iqoMWOW8KtlVya5KdlV6q9JbldCqscJq4XN/lfgbFD94e/Cc+c74c4D1WHG3Xy02/OjtJ2QevWmk'
+        'at75muJYswA1C1CzB6pZh5p1qFmHGiJriKwhsmZxahanZnFqMK3BtGapapaqBtqaFatht4bdGnZr'
+        'lrFmGWuWsWYZa7iu4bpmUWsWtWZRa2Cvgb1miWuWuAb9mpWuSUDNgtcEoSYINctfs/w1y1+z/DUh'
+        'qaGghoIaCmooqAlQTYBqmKjJUU2OanJUA0oNKDWg1BBSk7GajNXwUhO1GmxqsKnBpiZ/NfmrgagG'
+        'opo01qSxBqmaUNaAWYsB+4nnRY0MFeGXOudk9wXzE/2mgX8Vvrr7A/F1kJ+8uw7ytNz+W3xXbnyj'
+        '1YfCLVwfinH+0MPXUP5i/M/+1DPu6H3h3Q3xDXf0NsItiY1wS2Ij3JLYCLckNsItiY1wS2Ij3JLY'
+        'CLckNtS8hlsSGwTcIOAGATcIuEHADQJuEHCDgBsE3CDgBgE3CLhBwA0CbhBwZyg81jnY/ZTYxA0m'
+        'bjBxg4kbTNxg4gYTN5i4wcQNJm4wcYOJG0zcYOIGEzeYuMHEDSZuMHGDiRtM3GDiBhM3mLjBxA0m'
+        'bjBxg4kbTNxg4gYTN5i4wcQNJm4wcYOJG0zcYOIGEzeYuMHEDSZuMHGDiRtM3GDGBiE3CLlByA1C'
+        'bhByg5AbhNwg5AYhNwi5QcgNQm4QcoOQG4TcIORGuDexEe5NbASwG+HexEa4N7ER7k1shHsTG+He'
+        'xEa4N7ER7k1shHsTG+HexEa4N7ER7k1shHsTG+HexEYcrZ/uROv26uN/jqP1M8+I1tbdzfLHonUc'
+        'onUconUconUconUconUconUconUconUsWseidSxax6J1LFrHonUsWseidSxax6J1LFrHonUsWsei'
+        'dSxax6J1LFrHeptjiTqWqGOJOpaoY4k6lqhjiTqWqGOJOpaoY4k6lqhjiTqWqGOJOpaoY4k6lqhj'
+        'iTqWqGOJOpaoY4k6lqhjiTqWqGOJOpaoY4k6lqhjiTqWqGOJOpaoY4k6lqhjiTqWqGOJOpaoY4k6'
+        'lqhjiTqWqGOJOpaoY4k6lqhjiTqWqGOJOpaoY4k6lqhjiTqWqGOJOpaoY4k6lqhjiToOiToOiToO'
+        'iToOiToOiToOiToOiToOiToOiToOiToOiToOiToOiToOiToOiToOiTqOE9V4Rnz+5l18muLTDPFp'
+        'hvg0Q3yaIT7NEJ9miE8zxKcZ4tMUn6b4NMWnKT5N8WmKT1N8muLTFJ+m+DTFpyk+TfFpik9TfJri'
+        '0xSfpvg0xacpPk3xaYpPU3ya4tMUn6b4NMWnKT5N8WmKT1N8muLTFJ+m+DTFpyk+TfFpik9TfJri'
+        '0xSfpvg0xacpPk3xaYpPU3ya4tMUn6b4NMWnKT5N8WmKT1N8muLTFJ+m+DTFpyk+TfFpik9TfJri'
+        '0xSfpvg0xacpPk3xaYpPU3ya4tMUn6b4NMWnKT5N8WmKT1N8miE+zRCfZohPM8SnGeLTDPFphvg0'
+        'Q3yaIT7NEJ9miE8zxKcZ4tMM8WmG+DRDfJpxfH727ij4F+12TyF9CulTSJ9C+hTSp5A+hfQppE8h'
+        'fQrpU0ifQvoU0qeQPoX0KaRPIX0K6VNIn0L6FNKnkD6F9CmkTyF9CulTSJ9C+hTSp5A+hfQppE8h'
+        'fQrpU0ifQvoU0qeQPoX0KaRPIX0K6VNIn0L6FNKnkD6F9CmkTyF9CulTSJ9C+hTSp5A+hfQppE8h'
+        'fQrpU0ifQvoUy6dYPsXyKZZPsXyK5VMsn2L5FMunWD7F8imWT7F8iuVTLJ9i+VSETmNkfu4Zxl28'
+        'M+4Z454F454F454F454F454F454F454F454F454x7hnjnsHzDJ5n8DyD5xk8z+B5Bs8zeJ7B8wye'
+        'Z/A8g+cZPM/geQbPM3iewfMMnmfwPIPnGTzP4HkGzzN4nsHzDJ5n8DyD5xk8z+B5Bs8zeJ7B8wye'
+        'Z/A8g+cZPM/geQbPM3iewfMMnmfwPIPnGTzP4HkGzzN4nsHzDJ5n8DyD5xk8z+B5Bs8zeJ7B8wye'
+        'Z/A8g+cZXM5QeobSM5SeofQMpWcoPUPpGUrPUHqG0jOUnqH0DKVnKD1D6RlKz4Jxz4Jxz4Jxz4Jx'
+        'z4Jxz4Jxz4Jxz4Jxz4Jxz4Jxz4Jxz4Jxz4Jxz4Jxz4Jxz4Jxz+L4HD30hJ7M7463AMd3F2+/7ObM'
+        '8Rzm5zA/h/k5zM/xfY7vc3yf4/sc3+f4Psf3Ob7P8X2O73N8n+P7HN/n+D7H9zm+z/F9ju9zfJ/j'
+        '+xzf5/g+x/c5vs/xfY7vc3yf4/sc3+f4Psf3Ob7P8X2O73N8n+P7HN/n+D7H9zm+z/F9ju9zfJ/j'
+        '+xzf5/g+x/c5vs/xfY7vc3yf4/sc3+f4Psf3ObDPgX0O7HNgnwP7HNjnwD4H9jmwz4F9DuxzYJ8D'
+        '+xzY58A+B/a5PJ3H/JzcVexfxsoFVi6wcoGVC6xcYOUCKxdYucDKBVYusHKBlQusXGDlAisXWLnA'
+        'ygVWLrBygZULrFxg5QIrF1i5wMoFVi6wcoGVC6xcYOUCKxdYucDKBVYusHKBlQusXGDlAisXWLnA'
+        'ygVWLrBygZULrFxg5QIrF1i5wMoFVi6wcoGVC6xcYOUCKxdYucDKBVYusHKBlQusXGDlAisXWLnA'
+        'ygVWLrBygZULrFxg5QIrF1i5wMoFVi6wcoGVC6xcxKw041J9+6GNH+3c+nz7cY4f6XxR34dufvjF'
+        '+EuL//UzroP86XAd5PEbJ13h7ApnVzi7wtmV0nsFtyu4XcHtCm5XcLuC2xXcruB2BbcruF3B7Qpu'
+        'V3C7gtsV3K7gdgW3K7hdwe0Kbldwu4LbFdyu4HYFtyu4XcHtCm5XcLuC2xXcruB2BbcruF3B7Qpu'
+        'V3C7gtsV3K7gdgW3K7hdwe0Kbldwu4LbFdyu4HYFtyu4XcHtCm5XcLuC2xXcruB2BbcruF3B7Qpu'
+        'V3C7gtsV3K7gdgW3K7hdwe0Kbldwu4LbFdyu4HYV43YaA/SOG6je3iHsD9788Ps7P9w+hO7fdS5A'
+        'vKeD1pd0TpLfl/k3dwVw4Aa2NtjaYGuDrQ22NtjaYGuDrQ22NtjaYGuDrQ22NtjaYGuDrQ22Ntja'
+        'YGuDrQ22NtjaYGuDrQ22NtjaYGuDrQ22NtjaYGuDrQ22NtjaYGuDrQ22NtjaYGuDrQ22NtjaYGuD'
+        'rQ22NtjaYGuDrQ22NtjaYGuDrQ22NtjaYGuDrQ22NtjaYGuDrQ22NtjaYGuDrQ22NtjaYGuDrQ22'
+        'NtjaYGuDrQ22NtjaYGuDrQ22NtjaMWxnMTPpDk+/p3OLwwdvSPvsRztE/dv721ae71fhbj8Kvf/0'
+        '4n5iXJH7d7/j76WYeC6+l+Ltj3vDv/Hpv+z5hWj8vRDTj34iXzKOD0WefPy5QvXnwz0yUXzPzPnD'
+        '37H8V+LbZv59uAP55Z0fLzp/ouemwv+R+E/8X884Kfreu5Oi3/WC+KSoMzgpimdvDLM3hdmbwywK'
+        's7eEWTLMHr2dzbzA8ELDiwwvNnyaocvwwPDphpcYPsPwmYbPMny24XMM3YbPNbzU8HmGzzd8geFl'
+        'hh7Dyw29hlcYvtDwRYYvNvQZvsTwpYYvM7zS8CpDwvDlhn7Dqw2vMXyF4bWGrzQMGF5n+CrDVxu+'
+        'xvC1htcbvs7wBsMbDW8yvNkQGd5iSBq+3pAyvNXwDYa3Gb7JMGgYMqQNw4a3G95heMLwTkPG8C7D'
+        'k4ZvNLzbMGIYNTwFmZcEeGph9sEwq4fZT4TZD9yy66Qonv1kmH0ozH4qzH46zH4mzBph9rNh9nNh'
+        'dnQ7e1/m8un4fODx9wwPjgzG363+5+LDol+4u/WxdXPrYxdiuxDbGXxatQu7XTDtgmkXMLsQ2YXI'
+        'LkR2oa4LdV0A6wJYF6S6sNQFoi4QdQGlCwxdYOhCQRcKulDQZYm7LHGXte2yjF2WscvCdVm4LivW'
+        'JdpdMt0lzF3C3CXMXcLcJcxdwtwlt11y2yW3XZLaJaldItoljV3S2CWNXdLYJX9d8tclf10S1yVx'
+        'XaLWJWNdUtUlVV1S1SVVXeLUJU5d4tQlTl0C1CUrXbLSJStdstIlK13S0SUWXWLRJRZdgtAlCF3Q'
+        '74qZ+sUg7WwHpv/Qkfbtjr8vNv0vPXw++Ssxcld327PMzfas20J0k2u39ei2Ht3Wo9t6dFuPbuvR'
+        'DdVuqHYDtNsidVukbovUjdpu1HZbsm5L1o3hbivXDeVuKHdDudtydlvObsvZbTm7Yd4N826L221x'
+        'uy1uN/a7sd9tqbstdbckdFvxboHotvDdctEtF90w6IZBNwy6YdAtM91o6EZDNxq60dAtT93y1I2N'
+        'brHqFqtuseoGTDdgugHTjZRukesWuW7cdEteN3y64dMNn25x7BbHbjB1g6lbOLuFsxta3TLaDdDu'
+        'GLT/ePcQu4XOQ+y+/THN5Qs7u7P/FAPV+axq5gc7x0zxXWqvjTdu1w9/nPptMZG/fHfieY6+XvT1'
+        'oq8Xfb3o60VfL/p60deLvl709aKvF3296OtFXy/6etHXi75e9PWirxd9vejrRV8v+nrR14u+XvT1'
+        'oq8Xfb3o60VfL/p60deLvl709aKvF3296OtFXy/6etHXi75e9PWirxd9vejrRV8v+nrR14u+XvT1'
+        'oq8Xfb3o60VfL/p60deLvl709aKvF3296OtFXy/6etHXi75e9PWirxd9vejrRV8v+nrR14u+XvT1'
+        'oq8Xfb3o60Vfb0xf6xnPfPhjDx565sNifNb5K3dKG75RWh+o+kDVB6o+UPWBqg9UfaDqA1UfqPpA'
+        '1QeqPlD1gaoPVH2g6gNVH6j6QNUHqj5Q9YGqD1R9oOoDVR+o+kDVB6o+UPWBqg9UfaDqA1UfqPpA'
+        '1QeqPlD1gaoPVH2g6gNVH6j6QNUHqj5Q9YGqD1R9oOoDVR+o+kDVB6o+UPWBqg9UfaDqA1UfqPpA'
+        '1QeqPlD1gaoPVH2g6gNVH6j6QNUHqj5Q9YGqD1R9oOoDVR+o+kDVB6o+UPWBqi+Gqh0+R/DDcVn8'
+        '1fDz6+Ptzn9+xnaneLfdSdjuJMJ2JxG2O4mw3UmE7U4ibHcSYbuTCNudRNjuJPRECdudBHwT8E3A'
+        'NwHfBHwT8E3ANwHfBHwT8E3ANwHfBHwT8E3ANwHfBHwT8E3ANwHfBHwT8E3ANwHfBHwT8E3ANwHf'
+        'BHwT8E3ANwHfBHwT8E3ANwHfBHwT8E3ANwHfBHwT8E3ANwHfBHwT8E3ANwHfBHwT8E3ANwHfBHwT'
+        '8E3ANwHfBHwT8E3ANwHfBJwSKE6gOIHiBIoTKE6gOIHiBIoTKE6gOIHiBIoTKE6gOIHiBIoTYbuT'
+        'CNudRNjuJMJ2JxG2O4mw3UmE7U4ibHcSYbuTCNudRNjuJMJ2JxG2O4mw3UmE7U4ibHcScbz+Szhy'
+        '+Kw4Xv93uH/9b8Q//z8P9apP/GLnlf96J/G33Eh8QAoGpGBACgakYEAKBqRgQAoGpGBACgakYEAK'
+        'BqRgQAoGpGBACgakYEAKBqRgQAoGpGBACgakYEAKBqRgQAoGpGBACgakYEAKBqRgQAoGpGBACgak'
+        'YEAKBqRgQAoGpGBACgakYEAKBqRgQAoGpGBACgakYEAKBqRgQAoGpGBACgakYEAKBqRgQAoGpGBA'
+        'CgakYEAKBqRgAP4D8B+A/wD8B+A/AP8B+A/AfwD+A/AfgP8A/AfgPwD/AfgPwH9A6gZiyv7f++8j'
+        '+eg9k+c3/haS+CE973/wET6k53n/fST/LbQNPxJvb/77R+1S1e0HvrY6F/7vr1vdf3rst3EB4FMe'
+        'PJ8+0/hE4f4jjZ8EUD7y4KEW8JUdeT54EFrA1E0LGGkBIy1gpAWMtICRFjDSAkZawEgLGGkBIy1g'
+        'pAWMtICRFjDSAkZawEgLGGkBIy1gpAWMtICRFjDSAkZawEgLGGkBIy1gpAWMtICRFjDSAkZawEgL'
+        'GGkBIy1gpAWMtICRFjDSAkZawEgLGGkBIy1gpAWMtICRFjDSAkZawEgLGGkBIy1gpAWMtICRFjDS'
+        'AkZawEgLGGkBIy1gpAWMtICRFjDSAkZawEgLGGkBIy1gpAWMtICRFjDSAkZawEgLGGkBIy1gpAWM'
+        'tICRFjCKW8BHH9w/nvH59TTt56jn06H+t87dRM/+4xkfe/Dw6dBfvzsdSjkdSoXToVQ4HUqF06FU'
+        'OB1KhdOhVDgdSoXToVQ4HUo5HUo5HUqRYooUU6SYIsUUKaZIMUWKKVJMkWKKFFOkmCLFFCmmSDFF'
+        'iilSTJFiihRTpJgixRQppkgxRYopUkyRYooUU6SYIsUUKaZIMUWKKVJMkWKKFFOkmCLFFCmmSDFF'
+        'iilSTJFiihRTpJgixRQppkgxRYopUkyRYooUU6SYIsUUKaZIMUWKKVJMkWKKFFOkmCLFFEmluDHF'
+        'jSluTHFjihtT3JjixhQ3prgxxY0pbkxxY4obU9yY4sYUN6bC6VAqnA6lwulQKpwOpcLpUCqcDqXC'
+        '6VAqnA6lwulQKpwOpcLpUCqcDqXC6VAqnA6lwulQKpwOpWJpP/7g9nTo78aHrS+I4/Tum17gkZt7'
+        'lZ/4J3qAIbgPwX0I7kNwH4L7ENyH4D4E9yG4D8F9CO5DcB+C+xDch+A+BPchuA/BfQjuQ3AfgvsQ'
+        '3IfgPgT3IbgPwX0I7kNwH4L7ENyH4D4E9yG4D8F9CO5DcB+C+xDch+A+BPchuA/BfQjuQ3AfgvsQ'
+        '3IfgPgT3IbgPwX0I7kNwH4L7ENyH4D4E9yG4D8F9CO5DcB/C+RDOh3A+hPMhnA/hfAjnQzgfwvkQ'
+        'zodwPoTzIZwP4XwI50M4HxKvoRinT73rG//4Td84jJlhzAxjZhgzw2AZBsswWIbBMgyWYbAMg2UY'
+        'LMNgGQbLMFiGwTIMlmGwDINlGCzDYBkGyzBYhsEyDJZhsAyDZRgsw2AZBsswWIbBMgyWYbAMg2UY'
+        'LMNgGQbLMFiGwTIMlmGwDINlGCzDYBkGyzBYhsEyDJZhsAyDZRgsw2AZBsswWIbBMgyWYbAMg2UY'
+        'LMNgGQbLMFiGwTIMlmGwDINlGCzDYBkGyzBYhsEyDJZhsAyDZRgswzEsv+vBQw9EeVN8GP3Cp1/6'
+        'wAu+4cl3flPmXfHNOe+IrfSiB/e3HT988vSezpXX+23zx3jb/OKYyjuq/vpN1fzHnSvhn/ZxuRuK'
+        'O/EPdu4Nud8XfSI+rL4rpi4V93Od5q2nM/v2p2cfeMm3zWf/0NT0e9/7rd82/W1/9FvfG9v1uzt/'
+        '5qs7s5WnjfKBR9/+rqfi1yc7r8dn6T/Y+WcfH3rnkym/+Yednx9765NPvjP+8R/FP77ryXe5lfIX'
+        'Ov/c18Tf2ND5xaOjT43Er/+T+AtBPv3Bw1989C8f/uKjqUce+tjcpzzW+dMvCZ3pP4tLw2fcHy98'
+        'jGIUSyPfucD0yReoz4ype8/sjz360DfGvtXH6z7rwUO35r8wblQ++x7S3wakHbCe+K9Pc3Uv/Y+E'
+        '0c95cHvl88/HVz677zZh6ZtNWM4mLGcTlrMJy9mE5Wzcc/ZiOXuxnL1Yzl4sZy+WsxfL2Yvl7MVy'
+        '9mI5e7GcvVjOXixnL5azF8vZi+XsxXL2Yjl7sZy9WM5eLGcvlrMXy9mL5ezFcvZiOXuxnL1Yzl4s'
+        'Zy+WsxfL2Yvl7MVy9mI5e7GcvVjOXixnL5azF8vZi+XsxXL2Yjl7sZy9WM5eLGcvlrMXy9mL5ezF'
+        'cvZiOXuxnL1Yzl4sZy+WsxfL2Yvl7MVy9mI5e7GcvVjOXixnL5azF8vZi+XsxXL2Yjl7sZy9WM5e'
+        'LGcvlrMXy9mL5ezFcvFe7HMDM0/8d8jMQ2YeMvOQmYfMPFbmsTKPlXmszGNlHivzWJnHyjxW5rEy'
+        'j5V5rMxjZR4r81iZx8o8VuaxMo+VeazMY2UeK/NYmcfKPFbmsTKPlXmszGNlHivzWJnHyjxW5rEy'
+        'j5V5rMxjZR4r81iZx8o8VuaxMo+VeazMY2UeK/NYmcfKPFbmsTKPlXmszGNlHivzWJnHyjxW5rEy'
+        'j5V5rMxjZR4r81iZx8o8VuaxMo+VeazMY2UeK/NYmcfKfMzKS4NvXh4Xvc+7882rbnyzAJ4F8CyA'
+        'ZwE8C3yzgKEFDC1gaAFDCxhawNAChhYwtIChBQwtYGgBQwsYWsDQAoYWMLSAoQUMLWBoAUMLGFrA'
+        '0AKGFjC0gKEFDC1gaAFDCxhawNAChhYwtIChBQwtYGgBQwsYWsDQAoYWMLSAoQUMLWBoAUMLGFrA'
+        '0AKGFjC0gKEFDC1gaAFDCxhawNAChhYwtIChBQwtYGgBQwsYWsDQAoYWMLSAoQUMLWBoAUMLGFrA'
+        '0AKGFjC0EDP0+Q8e+jjMz8dl6wsCVq3455d1fn5Pp0X4pc6PPbe/fuLTOj++PPzpF8bbg947gf0k'
+        'BpcxuIzBZQwuY3AZg8sYXMbgMgaXMbiMwWUMLmNwGYPLGFzG4DIGlzG4jMFlDC5jcBmDyxhcxuAy'
+        'BpcxuIzBZQwuY3AZg8sYXMbgMgaXMbiMwWUMLmNwGYPLGFzG4DIGlzG4jMFlDC5jcBmDyxhcxuAy'
+        'BpcxuIzBZQwuY3AZg8sYXMbgMgaXMbiMwWUMLmNwGYPLGFzG4DIGlzG4jMFlDC5jcBmDyxhcxuAy'
+        'BpcxuIzBZQwuY3AZg8sxg6+4P1V8ru+/uT3A/IXO5j+cKn7gsbc/NZiJTwoWO7+4P2S8O2T8wltR'
+        'zr7+wad8yp/IfFG43j37dQ9uEejMnt6kxi/E17rj2RvD7E1h9uYwi8LsLWGWDLNHb2dP7zfi4YWG'
+        'FxlebPg0Q5fhgeHTDS8xfIbhMw2fZfhsw+cYug2fa3ip4fMMn2/4AsPLDD2Glxt6Da8wfKHhiwxf'
+        'bOgzfInhSw1fZnil4VWGhOHLDf2GVxteY/gKw2sNX2kYMLzO8FWGrzZ8jeFrDa83fJ3hDYY3Gt5k'
+        'eLMhMrzFkDR8vSFleKvhGwxvM3yTYdAwZEgbhg1vN7zD8IThnYaM4V2GJw3faHi3YcQwangKMi8J'
+        '8NTC7INhVg+znwizHwgU/6vw2k+G2YfC7KfC7KfD7GfCrBFmPxtmPxdmR7ez92W++MFDn4Fsxq1r'
+        '30N3vmV240biS+6rwv1dmc+S+W/L3X/vVLWPqAx86cPszsfsftltf5z5e3G//Mpn3An1w3d3QpXc'
+        'CVUKd0KVwp1QpXAnVCncCVUKd0KVwp1QpXAnVCncCVVyJ1TJnVAl3XZJt13SbZd02yXddkm3XdJt'
+        'l3TbJd12Sbdd0m2XdNsl3XZJt13SbZd02yXddkm3XdJtl3TbJd12Sbdd0m2XdNsl3XZJt13SbZd0'
+        '2yXddkm3XdJtl3TbJd12Sbdd0m2XdNsl3XZJt13SbZd02yXddkm3XdJtl3TbJd12Sbdd0m2XdNsl'
+        '3XZJt13SbZd02yXddkm3XdJtl3TbJd12Sbdd0m2XdNsl3W9J013SdJc03SVNd0nTXdJ0lzTdJU13'
+        'SdNd0nSXNN0lTXdJ013SdJc03SVNdyncCVUKd0KVwp1QpXAnVCncCVUKdzOVwj1RpXBPVCncE1UK'
+        '90SVwj1RpXD/Uync/1QK90mVwp1QpXAnVCneDbzq4dP8PxgnLHG3p/wFe8oNlG+gfAPlGyjfQPkG'
+        'yjdQvoHyDZRvoHwD5Rso30D5Bso3UL6B8g2Ub6B8A+UbKN9A+QbKN1C+gfINlG+gfAPlGyjfQPkG'
+        'yjdQvoHyDZRvoHwD5Rso30D5Bso3UL6B8g2Ub6B8A+UbKN9A+QbKN1C+gfINlG+gfAPlGyjfQPkG'
+        'yjdQvoHyDZRvoHwD5Rso34D3Brw34L0B7w14b8B7A94b8N6A9wa8N+C9Ae8NeG/AewPeG/DekKqN'
+        'mKIvfxAen/f9nWuaP3uj7Hd1KsDtg56+Lf6sfH840PgzHdhe/dCJyBNf2HnlNXf4/Rf4bcNvG37b'
+        '8NuG3zbutnG3jbtt3G3jbht327jbxt027rZxt427bdxt424bd9u428bdNu62cbeNu23cbeNuG3fb'
+        'uNvG3TbutnG3jbtt3G3jbht327jbxt027rZxt427bdxt424bd9u428bdNu62cbeNu23cbeNuG3fb'
+        'uNvG3TbutnG3jbtt3G3jbht327jbxt027rZxt427bdxt424bd9u428bdNu62cbeNu23cbeNuG3fb'
+        'uNvG3XbM3Vfcd633XetH1LXe9qoPOtp6lg4vXnt3ZeDJmysDOxS2Q2E7FLZDYTsq6A6T7TDZDpPt'
+        'MNkOk+0w2Q6T7TDZDpPtMNkOk+0w2Q6T7TDZDpPtMNkOk+0w2Q6T7TDZDpPtMNkOk+0w2Q6T7TDZ'
+        'DpPtMNkOk+0w2Q6T7TDZDpPtMNkOk+0w2Q6T7TDZDpPtMNkOk+0w2Q6T7TDZDpPtMNkOk+0w2Q6T'
+        '7TDZDpPtMNkOk+0w2Q6T7TDZDpPtMNkOk+0w2Q6T7TDZDpPtMNkOk+0w2Q6T7TDZDpPtMNkOk+0w'
+        '2U5ssq98uA/7Y/HOZuCuEP44isooKqOojKIyisooKqOojKIyisooKqOojKIyisooKqOojKIyisoo'
+        'KqOojKIyisooKqOojKIyisooKqOojKIyisooKqOojKIyisooKqOojKIyisooKqOojKIyisooKqOo'
+        'jKIyisooKqOojKIyisooKqOojKIyisooKqOojKIyisooKqOojKIyisooKqOojKIyisooKqOojKIy'
+        'isooKqOojKIyisooKqOojKIyisooKscUvS5cHjqLW/mvesbm+G/dbY53bY53w+Z4N2yOd8PmeDds'
+        'jnfD5ng3bI53w+Z4N2yOd22Od22Od+G6C9dduO7CdReuu3DdhesuXHfhugvXXbjuwnUXrrtw3YXr'
+        'Llx34boL11247sJ1F667cN2F6y5cd+G6C9dduO7CdReuu3DdhesuXHfhugvXXbjuwnUXrrtw3YXr'
+        'Llx34boL11247sJ1F667cN2F6y5cd+G6C9dduO7CdReuu3DdhesuXHfhugvXXbjuwnUXPruo3UXt'
+        'Lmp3UbuL2l3U7qJ2F7W7qN1F7S5qd1G7i9pd1O6idhe1u2FzvBs2x7thc7wbNse7YXO8G7bEu2FL'
+        'vBu2xLthS7wbtsS7Yfu7GzbWu2GbvBu2ybthc7wbNse7cZy++llpL58PreTvvak8f7dzi/1dX3nf'
+        'Tf72usmPqG38miDv74qP5L82/FyP+4HX32927jc7v2U8bzc2/6KT6I/ildqvC5T+atxyvOGua73U'
+        'tVa0ARVtQEUbUNEGVLQBFW1ARRtQ0QZUtAEVbUBFG1DRBlS0ARVtQEUbUNEGVLQBFW1ARRtQ0QZU'
+        'tAEVbUBFG1DRBlS0ARVtQEUbUNEGVLQBFW1ARRtQ0QZUtAEVbUBFG1DRBlS0ARVtQEUbUNEGVLQB'
+        'FW1ARRtQ0QZUtAEVbUBFG1DRBlS0ARVtQEUbUNEGVLQBFW1ARRtQ0QZUtAEVbUBFG1DRBlTU/4r6'
+        'X1H/K+p/Rf2vqP8V9b+i/lfU/4r6X1H/K+p/Rf2vqP8V9b+i/le0HZW4zL7xXmwf/2K79cnbO0e6'
+        'nwy3oLzp4Yvk/yGuyG++O9hp3xzsVMmtSm5VcquSW5XcquRWJbcquVXJrUpuVXKrkluV3KrkViW3'
+        'KrlVya1KblVyq5Jbldyq5FYltyq5VcmtSm5VcquSW5XcquRWJbcquVXJrUpuVXKrkluV3KrkViW3'
+        'KrlVya1KblVyq5Jbldyq5FYltyq5VcmtSm5VcquSW5XcquRWJbcquVXJrUpuVXKrkluV3KrkViW3'
+        'KrlVya1KblVyq5Jbldyq5FYltyq5VcmtSm5VcquSW5XcqrHcopiZ+BNdnxoeLPBD4DkEzyF4DsFz'
+        'CJ5D1Byi5hA1h6g5RM0hag5Rc4iaQ9QcouYQNYeoOUTNIWoOUXOImkPUHKLmEDWHqDlEzSFqDlFz'
+        'iJpD1Byi5hA1h6g5RM0hag5Rc4iaQ9QcouYQNYeoOUTNIWoOUXOImkPUHKLmEDWHqDlEzSFqDlFz'
+        'iJpD1Byi5hA1h6g5RM0hag5Rc4iaQ9QcouYQNYeoOUTNIWoOUXOImkPUHKLmEDWHqDlEzSFqDlFz'
+        'iJrDmJq3xCVx7ubg5nMe4OVfvuDWmvHsu8Ls+8LsW25nT/9/jV/YDr/69jD75jB7MsxGw+w7wmwp'
+        'zKbDbDXMMuGvGvJCPvzqdWFWDLNkmL0nzErhX/EKL7w7/OptYZYNs/eH2XvD7DVhNhtmbw2z4TB7'
+        'IvxVo16Iwq9efzt7Xyb5jAOz1z0IB2Y1B2a1cGBWCwdmtXBgVgsHZrVwYFYLB2a1cGBWCwdmNQdm'
+        'NQdmNT6o8UGND2p8UFNMarRQo4UaLdRooUYLNVqo0UKNFmq0UKOFGi3UaKFGCzVaqNFCjRZqtFCz'
+        'RjVaqNFCjRZqtFCjhRot1GihRgs1WqjRQo0WarRQo4UaLdRooUYLNVqo0UKNFmq0UKOFGi3UaKFG'
+        'CzVaqNFCjRZqtFCjhRot1ESlRgs1WqjRQo0WarRQo4WamNbYoQb/GjvU2KHGDjV2qLFDjR1q7FBj'
+        'hxo71Nihxg41dqhhtcYOtXBgVgsHZrVwYFYLB2a1cGBWC4detXB0VgtHZ7VwdFYLR2e1cHRWC8dk'
+        'tXBMVgvHabVwYFYLB2a1OD5f/4z47NydN9fFpx7iUw/xqYf41EN86iE+9RCfeohPPcSnLj518amL'
+        'T1186uJTF5+6+NTFpy4+dfGpi09dfOriUxefuvjUxacuPnXxqYtPXXzq4lMXn7r41MWnLj518amL'
+        'T1186uJTF5+6+NTFpy4+dfGpi09dfOriUxefuvjUxacuPnXxqYtPXXzq4lMXn7r41MWnLj518amL'
+        'T1186uJTF5+6+NTFpy4+dfGpi09dfOriUxefuvjUxacuPnXxqYtPXXzq4lMXn7r41MWnLj518amL'
+        'T1186uJTF5+6+NRDfOohPvUQn3qITz3Epx5CUw+hqYfQ1ENo6iE09RCQeohePQSpHoJUD/Gph/jU'
+        '4/ikOmcpr+ncCdPubDfe+km4L/5rvtkl8xWdY6vf/ib5tZ1/drjzof2P+nb5dkP8ZOe/9DfeO98+'
+        '4uEPP/gk2Tt/QwfkzjfyPPE9HZDf9iB8y9ibHviWsSPOPeLcI849otcjej0i1CMmPWLSIyY9Yssj'
+        'tjwixiNiPKLCIw48Ir8j8jsiuCMSOyKxI/Y6Yq8j9jqipiNqOuKkI/o5op8jwjkinCOmOVKSjtSi'
+        'I0XoSBE6UoSOFKEjRehIETpSb47UmyP15kiFOVJhjpSWI1XkSBU5UkWOVJEjdeNI3ThSN45UiiOV'
+        '4kiJOFIbjlSDI9XgSDU4Ug2OlIEjZeBIGThSBo6I/4jjjzj+iOOPOP6I449Y/YjOj+j8iM6PCPyI'
+        'wI8o+yh24eDdOfLP2f2ceEtPlPcT7+yJd/bEO3vinT3xzp54Z0+gdgK1E6ideLtPvN0n3u4T/J3g'
+        '78Sbf+LNP0HjiTU4AeUJKE9AeWJhTizMiYU5sTAngD0B7IllOrFMJ5bpBMUnKD6xaCcW7QTTJ9bu'
+        'BNonlvAE4ScIP7GgJxb0xIKeWNAT9J9Y1xPremJdT6zriWScSMaJVT4RkBMBORGQE0t/YulPLP2J'
+        'NT8RnhPhOUHAiQydAOEECCdAOBGsE8E6gcUJLE7E7ETMTkByIm0nUDuJkRm6tU7mg/FxXTpY6N93'
+        'fhy+P2a+v372nFTH29bgZzo3Ff4mpfLtd1ump0Gt336XfZ+H7byjg/CrOv+uq/jq2hPP2GD9/bsN'
+        '1qUN1mXYYF2GDdZl2GBdhg3WZdhgXYYN1mXYYF2GDdalanZpg3XJwJcMfMnAlwx8ycCXDHzJwJcM'
+        'fMnAlwx8ycCXDHzJwJcMfMnAlwx8ycCXDHzJwJcMfMnAlwx8ycCXDHzJwJcMfMnAlwx8ycCXDHzJ'
+        'wJcMfMnAlwx8ycCXDHzJwJcMfMnAlwx8ycCXDHzJwJcMfMnAlwx8ycCXDHzJwJcMfMnAlwx8ycCX'
+        'DHzJwJcMfMnAlwx8ycCXDHzJiJdEfEnEl0R8ScSXRHxJxJdEfEnEl0R8ScSXRHxJxJdEfEnEl0R8'
+        'ScSXYYN1GTZYl2GDdRk2WJdhg3UZNliXYYN1GTZYl2GDdRk2WJdhg3UZNliXYYN1GTZYl2GDdRk2'
+        'WJdxhXhn55rOS3TjT/xYJ1CZ8LiF93d+fNd9jfhYfTj+cx55+MPx95+Gf6hGPPkM6//tO+tfs/51'
+        'sP51sP51sP51sP51sP51sP51sP51sP4161+z/jXrX7P+Netfs/4161+z/jXrX7P+Netfs/4161+z'
+        '/jXrX7P+Netfs/4161+z/jXrX7P+Netfs/4161+z/jXrX7P+Netfs/4161+z/jXrX7P+Netfs/41'
+        '61+z/jXrX7P+Netfs/4161+z/jXrX7P+Netfs/4161+z/jXrX7P+Netfs/4161+z/jXrX7P+Netf'
+        's/4161+z/jXrX7P+Netfs/4161+z/jXrX7P+Netfs/4161+z/jXrX7P+Netfs/41618H618H618H'
+        '618H618H618H618H618H618H618H618H618H618H618H618H618H61/H1v/GB+Hbg3//Yw890PDl'
+        '8VnEe2ZbIT6tEJ9WiE8rxKcV4tMK8WmF+LRCfFri0xKflvi0xKclPi3xaYlPS3xa4tMSn5b4tMSn'
+        'JT4t8WmJT0t8WuLTEp+W+LTEpyU+LfFpiU9LfFri0xKflvi0xKclPi3xaYlPS3xa4tMSn5b4tMSn'
+        'JT4t8WmJT0t8WuLTEp+W+LTEpyU+LfFpiU9LfFri0xKflvi0xKclPi3xaYlPS3xa4tMSn5b4tMSn'
+        'JT4t8WmJT0t8WuLTEp+W+LTEpyU+LfFpiU9LfFri0xKflvi0xKclPi3xaYlPK8SnFeLTCvFphfi0'
+        'QnxaIT6tEJ9WiE8rxKcV4tMK8WmF+LRCfFohPq0Qn1aITyuOz7vvTmIunMS0Id2GdBvSbUi3Id2G'
+        'dBvSbUi3Id2GdBvSbUi3Id2GdBvSbUi3Id2GdBvSbUi3Id2GdBvSbUi3Id2GdBvSbUi3Id2GdBvS'
+        'bUi3Id2GdBvSbUi3Id2GdBvSbUi3Id2GdBvSbUi3Id2GdBvSbUi3Id2GdBvSbUi3Id2GdBvSbUi3'
+        'Id2GdBvSbUi3sdzGchvLbSy3sdzGchvLbSy3sdzGchvLbSy3sdzGchvLbSy3RagdIzMSI/NLs1/U'
+        'Me3z+bmwnWfCdp4N+8nwDPDf5qNgv/jmyGL+6Wb04+ixsKPP+x3c7bcQ/uhtl39/4vd838A99Ql5'
+        'rHC7c/+pzi3B91Q+76j8pl9D5dsff/p/3vH4b8xnISbk8V9D6jsff26/qTXzOPQ+/5H7r2r96JAa'
+        'OHmI2Xjv+/2P/ab0xvvhJx9/9jju/JXv7ix5/OCvH33017+s8r7M77799ownXto5zX3PM87N1u/O'
+        'zR791PjcrDPY+MezN4bZm8LszWEWhdlbwiwZZo/ezp5uSeLhhYYXGV5s+DRDl+GB4dMNLzF8huEz'
+        'DZ9l+GzD5xi6DZ9reKnh8wyfb/gCw8sMPYaXG3oNrzB8oeGLDF9s6DN8ieFLDV9meKXhVYaE4csN'
+        '/YZXG15j+ArDaw1faRgwvM7wVYavNnyN4WsNrzd8neENhjca3mR4syEyvMWQNHy9IWV4q+EbDG8z'
+        'fJNh0DBkSBuGDW83vMPwhOGdhozhXYYnDd9oeLdhxDBqeAoyLwnw1MLsg2FWD7OfCLMfuGXXxj+e'
+        '/WSYfSjMfirMfjrMfibMGmH2s2H2c2F2dDt7X+b3dK6WHN3cu/Sq+DOoY3GiYtOOdv7g7bP59jqH'
+        '9+/uvDLy4OaEbfap8KDWpzyo9anwoNanwoNanwoPan0qPKj1qfCg1qfCg1qfCg9qfSp+quV4+Njh'
+        'dXyt/5vvL9zcN1W/blm63U6tPE3oc9xgTcRQ3mbk73S+bOqFU1Opdz35rqmBr4wf/PymTm5uHwjf'
+        '1fkDv+vmD3xt/PvveeShl94Qv/SHHn7pa+KXvviRm8LW+eHdjz70+6+Kf/9nH/5HXhe/9LKHXxqI'
+        'X3rDwy99dfzSux7+L/Jf/M8fPJz08Muvi3/5HfE3Xv3ekM2XxjctTN49vPnn4wtW8XcmuMFhKjwO'
+        '7o93/ujvuztr/Hlnjf2qaL8q2q+K9qui/apovyrar4r2q6L9qmi/Ktqvivarov2qaL8q2q+K9qui'
+        '/apovyrar4r2q6L9qmi/Ktqvivarov2qaL8q2q+K9qui/apovyrar4r2q6L9qmi/Ktqvivarov2q'
+        'aL8q2q+K9qui/apovyrar4r2q6L9qmi/Ktqvivarov2qaL8q2q+K9qui/apovyrar4r2q6L9qmi/'
+        'Ktqvivarov3KZ7/y2a989iuf/cpnv/LZr3z2K5/9yme/8tmvfPYrn/3KZ7/y2a989iuf/ap2f1yl'
+        'pu/Nf2/+38j8me969LlX/+9/xm1df+r2tq5Xst4f+HDMzv7yzf3v7+t8W+UNwFedb2H7j4/+FlD+'
+        'T50/dN35n19+9Nnecrfif/djzwXK7c5f9auPPh9R/pXOVrX92PP8UTR/UFX+1M5nlt/dqct/qPMN'
+        'xY8ND6beFtf5F8Q99x9+Xpn31gb/oNMs3Wv4E/ZU84/c9wP3IIa0v7+T9o8DKmfuHh0yd/PokMjO'
+        'JrKziexsIjubyJYmsqWJbGkiW5rIliaypYlsaSJbmsiWJrKliWxpIluayJYmsqWJbGkiW5rIliay'
+        'pYlsaSJbmsiWJrKliWxpIluayJYmsqWJbGkiW5rIliaypYlsaSJbmsiWJrKliWxpIluayJYmsqWJ'
+        'bGkiW5rIliaypYlsaSJbmsiWJrKliWxpIluayJYmsqWJbGkiW5rIliaypYlsaSJbmsiWJrKliWxp'
+        'IluayJYmsqWJbGkiW5rIliaypYlsaSJbmsiWJrKliWxpIluaKN7S/NFnnFv/yN25ddK5dTKcWyfD'
+        'uXUynFsnw7l1MpxbJ8O5dTKcWyfDuXXSuXXSuXUSl0lcJnGZxGXSjjsJzyQ8k/BMwjMJzyQ8k/BM'
+        'wjMJzyQ8k/BMwjMJzyQ8k/BMwjMJzyQ8k/BMwjMJzyQ8k/BMwjMJzyQ8k/BMwjMJzyQ8k/BMwjMJ'
+        'zyQ8k/BMwjMJzyQ8k/BMwjMJzyQ8k/BMwjMJzyQ8k/BMwjMJzyQ8k/BMwjMJzyQ8k/BMwiWJ0iRK'
+        'kyhNojSJ0iRKkyhNojSJ0iRKkyhNojSJ0iRKkyhNojQZzq2T4dw6Gc6tk+HcOhnOrZPh7DkZTrCT'
+        '4QQ7GU6wk+EEOxlOsJPhtDoZTquT4VQ7Gc6tk+HcOhnHZzacP/2B+ND6j4XvVL+If/6W+6+r/nVu'
+        'S4q/lvqdT1emj9f7k57fX1f9PzzD6S+6e7JMmtPTwenp4PR0cHo6OD0dnJ4OTk8Hp6eD09Ocnub0'
+        'NKenOT3N6WlOT3N6mtPTnJ7m9DSnpzk9zelpTk9zeprT05ye5vQ0p6c5Pc3paU5Pc3qa09Ocnub0'
+        'NKenOT3N6WlOT3N6mtPTnJ7m9DSnpzk9zelpTk9zeprT05ye5vQ0p6c5Pc3paU5Pc3qa09Ocnub0'
+        'NKenOT3N6WlOT3N6mtPTnJ7m9DSnpzk9zelpTk9zeprT05ye5vQ0p6c5Pc3paU5Pc3qa09Ocnub0'
+        'NKenOT3N6WlOT3N6Ojg9HZyeDk5PB6eng9PTweTpYPJ0MHk6mDwdTJ4O1k6HepAOdk8Hu6eD09PB'
+        '6enY6e+939V9NHd1t9ulV3eOSu/PGn6ru7pv7Vwhf/fNe/eS+GJX9m6j9/KbjV6GfDPkmyHfDPlm'
+        'WDfDuhnWzbBuhnUzrJth3QzrZlg3w7oZ1s2wboZ1M6ybYd0M62ZYN8O6GdbNsG6GdTOsm2HdDOtm'
+        'WDfDuhnWzbBuhnUzrJth3QzrZlg3w7oZ1s2wboZ1M6ybYd0M62ZYN8O6GdbNsG6GdTOsm2HdDOtm'
+        'WDfDuhnWzbBuhnUzrJth3QzdZug2Q7cZus3QbYZuM3SbodsM3WboNkO3GbrN0G2GbjN0m6HbDMtn'
+        'Yqv98dhqt9d/P69zM1vct356fB117u5iaAtJI0gaQdIIkkaQNIKkESSNIGkESSNIGkHSCJJGkDSC'
+        'pBEkjSBpBEkjSBpB0giSRpA0gqQRJI0gaQRJI0gaQdIIkkaQNIKkESSNIGkESSNIGkHSCJJGkDSC'
+        'pBEkjSBpBEkjSBpB0giSRpA0gqQRJI0gaQRJI0gaQdIIkkaQNIKkESSNIGkESSNIGkHSCJJGkDSC'
+        'pBEkjSBpBEkjSBpB0giSRpA0gqQRJI0gaQRJI0gaQdIIkkaQNBKT9CfuvoHt33cc/sGbmw7+bUzS'
+        't8Wc3d4Jsfv07+8r6f1B/ce4eL7vTm8fpLcxehujtzF6G6O3MbuUMZYbY7kxlhtjuTGWG2O5MZYb'
+        'Y7kxlhtjuTGWG2O5MZYbY7kxlhtjuTGWG2O5MZYbY7kxlhtjuTGWG2O5MZYbY7kxlhtjuTGWG2O5'
+        'MZYbY7kxlhtjuTGWG2O5MZYbY7kxlhtjuTGWG2O5MZYbY7kxlhtjuTGWG2O5MZYbY7kxlhtjuTGW'
+        'G2O5MZYbY7kxlhtjuTGWG2O5MZYbY7kxlhtjuTGWG2O5MZYbY7kxlhtjuTGWG2O5sdhyf9LTGp7u'
+        'rV79IL4umXvoa7OeeE3nlfxd//Wym/5rClZTsJqC1RSspvA0hacpPE3haQpPU3iawtMUnqbwNIWn'
+        'KTxN4WkKT1N4msLTFJ6m8DSFpyk8TeFpCk9TeJrC0xSepvA0hacpPE3haQpPU3iawtMUnqbwNIWn'
+        'KTxN4WkKT1N4msLTFJ6m8DSFpyk8TeFpCk9TeJrC0xSepvA0hacpPE3haQpPU3iawtMUnqbwNIWn'
+        'KTxN4WkKT1N4msLTFJ6m8DSFpyk8TeFpCk9TeJrC0xSepmKe5u9gObqBZRos02CZBss0WKY5aBoz'
+        '05iZxsw0ZqYxM42ZacxMY2YaM9OYmcbMNGamMTONmWnMTGNmGjPTmJnGzDRmpjEzjZlpzExjZhoz'
+        '05iZxsw0ZqYxM42ZacxMY2YaM9OYmcbMNGamMTONmWnMTGNmGjPTmJnGzDRmpjEzjZlpzExjZhoz'
+        '05iZxsw0ZqYxM42ZacxMY2YaM9OYmcbMNGamMTONmWnMTGNmGjPTmJnGzDRmpjEzjZlpzExjZjpm'
+        '5k8949Hcn3XzaO4/8Km39TaefVeYfV+Yfcvt7On/r/EL2+FX3x5m3xxmT4bZaJh9R5gthdl0mK2G'
+        'WSb8VUNeyIdfvS7MimGWDLP3hFkp/Cte4YV3h1+9LcyyYfb+MHtvmL0mzGbD7K1hNhxmT4S/atQL'
+        'UfjV629n78v8j3d3kb748Zsjq471/8LT3WyXjwM98Q2dZvf9d6HO3oR6RqhnhHpGqGeEekaaZ6R5'
+        'RppnpHlGmmekeUaaZ6R5RppnpHlGmmekeUaaZ6R5RppnpHlGmme8tTPSPCPNM9I8I80z0jwjzTPS'
+        'PCPNM9I8I80z0jwjzTPSPCPNM9I8I80z0jwjzTPSPCPNM9I8I80z0jwjzTPSPCPNM9I8I80z0jwj'
+        'zTMIn5HmGWmekeYZaZ6R5hlpnpHmGbjOSPOMNM9I84w0z0jzjDTPSPOMNM9I84w0z0jzjDTPYGtG'
+        'mmekeSamaiFcK3okPr759piy73QX3hMv6GzIZ//sY50/+ac/7D17t4dn+4/c3bN3v4m630Q9F5uo'
+        '77iT3afcyC5Ldlmyy5JdluyyZJcluyzZZckuS3ZZssuSXZbssmSXJbss2WXJLkt2WbLLkl2W7LJk'
+        'lyW7LNllyS5Ldlmyy5JdluyyZJcluyzZZckuS3ZZssuSXZbssmSXJbss2WXJLkt2WbLLkl2W7LJk'
+        'lyW7LNllyS5Ldlmyy5JdluyyZJcluyzZZckuS3ZZssuSXZbssmSXJbss2WXJLkt2WbLLkl2W7LJk'
+        'lyW7LNllyS5Ldlmyy5Jdluyysez+THgQUkdXP//goc+eNB7tlM7FZ9jvwUP2+867zfq/gVkOZjmY'
+        '5WCWg1lOo5xDWw5tObTl0JZDWw5tObTl0JZDWw5tObTl0JZDWw5tObTl0JZDWw5tObTl0JZDWw5t'
+        'ObTl0JZDWw5tObTl0JZDWw5tObTl0JZDWw5tObTl0JZDWw5tObTl0JZDWw5tObTl0JZDWw5tObTl'
+        '0JZDWw5tObTl0JZDWw5tObTl0JZDWw5tObTl0JZDWw5tObTl0JZDWw5tuf+PvXsPiD2v7/vv7nhZ'
+        'RV1vK17Bu2h0VFQcdWS9ox7HcQRJSy9GgvTrdqJW3E4KBEobLCU235LETAZLJsmEBjK2U5pSmrZp'
+        'Si8pndLcNF4JDWl6mbTk0iBJxIm/M98HfDibn6lNXM2u8s95f885ez08X8/36/uZLzNoK6GthLYS'
+        '2kpoK6GtlND2nZ1784tvfvqt5MmLxUtbfe7cVjMwmoHRDIxmYDQDoxkYzcBoBkYzMJqB0QyMZmA0'
+        'A6MZGM3AaAZGMzCagdEMjGZgNAOjGRjNwGgGRjMwmoHRDIxmYDQDoxkYzcBoBkYzMJqB0QyMZmA0'
+        'A6MZGM3AaAZGMzCagdEMjGZgNAOjGRjNwGgGRjMwmoHRDIxmYDQDoxkYzcBoBkYzMJqB0QyMZmA0'
+        'A6MZGM3AaAZGMzCagdEMjGZgNAOjGRjNwGgGRjMwmoHRDIxmYDQDo5kEow92MHrz/WH0vQlGf+tS'
+        'Rr+HonkUzaNoHkXzKJqHzzx85uEzD595+MzDZx4+8/CZh888fObhMw+fefjMw2cePvPwmYfPPHzm'
+        '4TMPn3n4zMNnHj7z8JmHzzx85uEzD595+MzDZx4+8/CZh888fObhMw+fefjMw2cePvPwmYfPPHzm'
+        '4TMPn3n4zMNnHj7z8JmHzzx85uEzD595+MzDZx4+8/CZh888fObhMw+fefjMw2cePvPwmYfPPHzm'
+        '4TMPn3n4zMNnHj7z8JlP8Fm6enDg3t7UL1632r3eV74+WvvfvoLyTwLlxY32QzoP9V/dS97dVC5f'
+        'UXl1qPHH/YDxa5/76n6++Hfd8DG815Ijug91fqXn/Ptkh5LvRPw7lx8w9Ds3+YCh71LwvkvB64zk'
+        'XsQvPNLoNh5jPN54otFj9BpPM55uPMt4tvFc43nGC4x+4yVG1niFcbvxSuNVxuuNIeONRs54i1Ew'
+        '3maMGPc3HmQ82HiIcbPxUONW42HGo4zbjEcbjzUeZzzBeJLxZOMpxlONZxjPNPqMbzKeY6SN5xsv'
+        'NF5kvNgYMDLGS42XGS83Bo1XG68xXmu83Xid8QbjTcY1481G3nirMZyMO3PfnXjv4vWEX73Oc3iv'
+        'ijtz8V2e2/6ey+/FiT23HYfntuPw3HYcntuOw3PbcXhuOw7Pbcfhue04PLcd+6LGntuOfW1j9zWx'
+        'L3HsSxz7Ese+xLEvcexLHKM/Rn+M+djXPfZ1j33dY0GIBSFGQYyCWCxiMMTSEUtHLB0xQmKExAiJ'
+        'ERJLTiw5MV5ivMR4icUpFqcYPTF6YuGKQRTLWIylWNRiUYuRFSMrRlaMrFgMY4DFAIsBFgMsFtFY'
+        'RGO4xZIaS2osqTEGYwzGGIwxGGMwFuZYmGNExjIdAzMGZgzMWNBjQY9hGsM0FvtY7GPQxtIfh+e2'
+        '4/Dcdhye247Dc9txeG47Ds9tx+G57Tg8tx2H57bj8Nx2HJ7bjsNz23F4bjsOz23H4bntODy3HSfZ'
+        '+rvh9ZUfTeS9Ej6j6T6Jub8nMXfySMfrk++JSKL34fD/9uHw3/zh5J/3vUkcO/9Jnb/lC0kck//h'
+        'cvgLy8lf+H13ye0/vcxtRW4rIbeVkNtKyG0l5LYSclsJua2E3FZCbityW5HbitxW5LYitxW5rcht'
+        'RW4rcluR24rcVuS2IrcVua3IbUVuK3JbkduK3FbktiK3FbmtyG1FbityW5HbitxW5LYitxW5rcht'
+        'RW4rcluR24rcVuS2IrcVua3IbUVuK3JbkduK3FbktiK3FbmtyG1FbityW5HbitxW5LYitxW5rcht'
+        'RW4rcluR24rcVuS2IrcVua3IbUVuK3JbkduK3FbktiK3FbmtyG1FbityW5HbitxW5LYitxW5rcht'
+        'JbBdCbmthNxWQm4rIbeVgHYl5LYSclsJua2E3FZCbisht5WQ20rIbSXkthJyW0ni8+GQ29uSnH7/'
+        '5cntp89PbtcwvobxNYyvYXwN42sYX8P4GsbXML6G8TWMr2F8DeNrGF/D+BrG1zC+hvE1jK9hfA3j'
+        'axhfw/gaxtcwvobxNYyvYXwN42sYX8P4GsbXML6G8TWMr2F8DeNrGF/D+BrG1zC+hvE1jHfGh2/u'
+        'fFPafRLY18C+BvY1sK+BfQ3sa2BfA/sa2NfAvgb2NbCvgX0N7GtgXwP7GtjXUL6G8jWUr6F8DeVr'
+        'KF9D+RrK11C+hvI1lK+hfA3layhfQ/kayteEay2BqXx1Y3l1Y/nHvbHMjdz01b2z/IEbX5/6W0k7'
+        'qVzeR3ad30fW2KrGVjW2qhFTjZhqVFTjoBoH1TioxjM1nqlRSo1SaiRSY48abdRoo8YINamvSX1N'
+        '3GviXhP3mkjXRLomyzWxrYltTVBrglqT0JrCUmPxGn3X6LvG2zXervF2jaJrFF2j6Bop10i5xsY1'
+        '4q0Rb414a8Rbo9oa1daotkauNXKtsWqNTmsEWlMSarxZ480aYdYIs0aYNcKsUWSNDWtsWGPDGjvV'
+        'SLFGgzX+q/Ffjf9qjFdjvBrH1RKrrYYV+a5kRX7kynJXlvu/vhHd0J/CG9H9vcvi9jPnxW1T5DcV'
+        't03J35T8TcVtkwA2CWCTADapcJMKN6lwkxU2WWGTFTb5cZMfNzlikyM22XKTKjZJc5M0N0lzkz82'
+        '+WOTPzb5Y5NQNwl1k0022WSTTTZZdpNlN7llk1s2OXeTYjapd5NpNhl4k4E3eWeTdzZ5Z5N3Ntl5'
+        'k3426WeTfjbpZ5O5N5l7k4w2CXyTwDcJfJOhNhlqk6E2qWmT3DfJfZOoNjl+k682+WqTrzaJf5P4'
+        'N9lrk702rYFNa2CTyzZtg01G3EzMtnb5+vpvQKYOmTpk6pCpQ6YOmTpk6pCpQ6YOmTpk6pCpQ6YO'
+        'mTpk6pCpQ6YOmTpk6pCpQ6YOmTpk6pCpQ6YOmTpk6pCpQ6YOmTpk6pCpQ6YOmTpk6pCpQ6YOmTpk'
+        '6pCpQ6YOmTpk6pCpQ6YOmTpk6pCpQ6YOmTpk6pCpQ6YOmTpk6pCpQ6YOmTpk6pCpQ6YOmTpk6pCp'
+        'Q6YOmTpk6pCpQ6YOmTpk6pCpQ6YOmTpk6pCpQ6YOmXqCzA/eeCj/mmQfVi/NUzg3TwNGDRg1YNSA'
+        'UQNGDRg1YNSAUQNGDRg1YNSAUQNGDRg1YNSAUQNGDRg1YNSAUQNGDRg1YNSAUQNGDRg1YNSAUQNG'
+        'DRg1YNSAUQNGDRg1YNSAUQNGDRg1YNSAUQNGDRg1YNSAUQNGDRg1YNSAUQNGDRg1YNSAUQNGDRg1'
+        'YNSAUQNGDRg1YNSAUQNGDRg1YNSAUQNGDRg1YNSAUQNGDRg1YNSAUQNGDRg1YNSAUQNGjQSjH7rq'
+        'UPfUDnVRYiqd27JvrBfGf/jeR+XnvgSVp/ciKn+/88Pn/2Qd/6zzwxfuUXC2Oz/8wR8H0+Rzlr74'
+        'xwH2d88D+orOXcYN9P5I+IjzH++s5dplufusrbxjK+/Yyju28o6tvGMr79jKO7byjq28Yyvv2Mo7'
+        'tvKOrbxjK+/Yyju28o6tvGMr79jKO7byjq28Yyvv2Mo7tvKOrbxjK+/Yyju28o6tvGMr79jKO7by'
+        'jq28Yyvv2Mo7tvKOrbxjK+/Yyju28o6tvGMr79jKO7byjq28Yyvv2Mo7tvKOrbxjK+/Yyju28o6t'
+        'vGMr79jKO7byjq28Yyvv2Mo7tvKOrbxjK+/Yyju28o6tvGMr79jKO7byjq28Yyvv2Mo7tvKOrbxj'
+        'K+/Yyju28o6tvGMr7yRb+UfvZv9drJL/1CH1akVfPa72J9rK64nIXtwB6cWdb1V5Sufqc533zX9V'
+        '56q/82tP6Gjvt65fvKjzS09M3gzl79/lrfl/9oPf96FHveMd735P9K73v/sD73zPt77rHVMfeOf7'
+        '3/GSzhudX/uOizfuv90b9//Yn24TuAjOn+10sKskXCVBEjbCSfS3JN8fsXmXZx+mLp99aHr2oRme'
+        'fWiGZx+a4dmHZnj2oRmefWiGZx+a4dmHZnj2oemlhKZnH5rqRFOdaKoTTXWiqU401YmmOtFUJ5rq'
+        'RFOdaKoTTXWiqU401YmmOtFUJ5rqRFOdaKoTTXWiqU401YmmOtFUJ5rqRFOdaKoTTXWiqU401Ymm'
+        'OtFUJ5rqRFOdaKoTTXWiqU401YmmOtFUJ5rqRFOdaKoTTXWiqU401YmmOtFUJ5rqRFOdaKoTTXWi'
+        'qU401YmmOtFUJ5rqRFOdaKoTTXWiab03tYqmVtHUKppaRVOraGoVTa2iqVU0tYqmVtHUKppaRVOr'
+        'aGoVTa2iqVU0w7MPzfDsQzM8+9AMzz40w7MPzfDsQzM8+9AMzz40w7MPzfDsQzM8+9AMzz40w7MP'
+        'zfDsQzM8+9AMzz40k7rz45cHV7efH1ztY3of0/uY3sf0Pqb3Mb2P6X1M72N6H9P7mN7H9D6m9zG9'
+        'j+l9TO9jeh/T+5jex/Q+pvcxvY/pfUzvY3of0/uY3sf0Pqb3Mb2P6X1M72N6H9P7mN7H9D6m9zG9'
+        'j+l9TO9jeh/T+5jex/Q+pvcxvY/pfUzvY3of0/uY3sf0Pqb3Mb2P6X1M72N6H9P7mN7H9D6Y98G8'
+        'D+Z9MO+DeR/M+2DeB/M+mPfBvA/mfTDvg3kfzPtg3gfzvgztJ8zUrw6urrrAH/sRh9Wv8iMOH72i'
+        '8stTGb4aH+28f8cVol/1uvoPvkIqO1+rf9t584J7F4RXQrw7P8Gs8xlxHRB++eYv/WHgNwL3D2/4'
+        'HqLcteQWqZEw+PLzp7/e0/HwK86/AeS3r19nz3/j6Z3fGDz/Sdz5ye3nP3nmTRdHA4+9fG79INxY'
+        'HYQbq4Nwm3TgNunAbdKBSnmgUh6olAcq5YFKeaBSHqiUByrlgUp5oFIeqJQHKuWBSnmgUh6olAcq'
+        '5YFKeaBSHqiUByrlgUp5oFIeqJQHKuWBSnmgUh6olAcq5YFKeaBSHqiUByrlgUp5oFIeqJQHKuWB'
+        'SnmgUh6olAcq5YFKeaBSHqiUByrlgUp5oFIeqJQHKuWBSnmgUh6olAcq5YFKeaBSHqiUByrlgUp5'
+        'oFIeqJQHKuWBinegWR5olgea5YFmeaBZHmiWB5rlgWZ5oFkeaJYHmuWBZnmgWR5olgea5YFmeRBu'
+        'kw7CbdJBuE06CLdJB+E26SDcJh2E26SDcJt0EG6TDsJt0kG4TToI7zZ3EG6YDsIN00G4YToIN0wH'
+        '4YbpICm//+jyJYVj90uH4D4E9yG4D8F9CO5DcB+C+xDch+A+BPchuA/BfQjuQ3AfgvsQ3IfgPgT3'
+        'IbgPwX0I7kNwH4L7ENyH4D4E9yG4D8F9CO5DcB+C+xDch+A+BPchuA/BfQjuQ3AfgvsQ3IfgPgT3'
+        'IbgPwX0I7kNwH4L7ENyH4D4E9yG4D8F9CO5DcB+C+xDch+A+BPchuA/BfYjqQ1QfovoQ1YeoPkT1'
+        'IaoPUX2I6kNUH6L6ENWHqD5E9SGqD1F9KEyHCTJbV8306n4pNO87UveMT+n7x3+Iyov/vt/qlIwr'
+        'RO8GRB97/ojYFzt/ovc2XsOn3ScvDuW+eA/5bMmfCN9T+fyk2/6Ty/PLj5+fX7bs45Z93LKPW/Zx'
+        'yz5u2cct+7hlH7fs45Z93LKPW/Zxyz5u2cct+7hlH7fs45Z93LKPW/Zxyz5u2cct+7hlH7fs45Z9'
+        '3LKPW/Zxyz5u2cct+7hlH7fs45Z93LKPW/Zxyz5u2cct+7hlH7fs45Z93LKPW/Zxyz5u2cct+7hl'
+        'H7fs45Z93LKPW/Zxyz5u2cct+7hlH7fs45Z93LKPW/Zxyz5u2cct+7hlH7fs45Z93LKPW/Zxyz5u'
+        '2cct+7hlH7fs45Z93LKPW/Zxyz5uJft4u3OL9Nnze5tHJd8M808vv9X2+q/dctPFuwVex+r3b0pe'
+        'Dd1JQHtS57e/o/Nqa75z9dOdV2Af07n6ieQ9Bf/ZXV6M+sHLF6NOvBh1Eu6ZTsI900l4MeokvBh1'
+        'El6MOgkvRp2EF6NOwl3WibusE3dZJ8A/Af4J8E+AfwL8E+CfAP8E+CfAPwH+CfBPgH8C/BPgnwD/'
+        'BPgnwD8B/gnwT4B/AvwT4J8A/wT4J8A/Af4J8E+AfwL8E+CfAP8E+CfAPwH+CfBPgH8C/BPgnwD/'
+        'BPgnwD8B/gnwT4B/AvwT4J8A/wT4J8A/Af4J8E+AfwL8E+CfAP8E+CfAPwH+CfBPgH8CxBP8n+D/'
+        'BP8n+D/B/wn+T/B/gv8T/J/g/wT/J/g/wf8J/k/wf4L/k3CXdRLusk7CXdZJuMs6CXdZJ+Eu6yTc'
+        'ZZ2Eu6yTcJd1Eu6yTsJd1km4tzoJ91Yn4d7qJNxbnYR7q5MkmD/5DVOUL8rWv+yUwavWfI8+wv3n'
+        'nXXx8fPV8JLkcf9/kYB6sUIynX2QnAj8aw3kjIjPiPiMiM+I+IyIz4j4jIjPiPiMiM+I+IyIz4j4'
+        'jIjPiPiMiM+I+IyIz4j4jIjPiPiMiM+I+IyIz4j4jIjPiPiMiM+I+IyIz4j4jIjPiPiMiM+I+IyI'
+        'z4j4jIjPiPiMiM+I+IyIz4j4jIjPiPiMiM+I+IyIz4j4jIjPiPiMiM+I+IyIz4j4jIjPiPiMiM+I'
+        '+IyIz4j4jIHPGPiMgc8Y+IyBzxj4jIHPGPiMgc8Y+IyBzxj4jIHPGPiMgc8Y+Iz4zxLR/cu79IR/'
+        'eNkT2npCO/SEdugJ7dAT2qEntENPaIee0A49oR16QltPaOsJbXi24dmGZxuebXi24dmGZxuebXi2'
+        '4dmGZxuebXi24dmGZxuebXi24dmGZxuebXi24dmGZxuebXi24dmGZxuebXi24dmGZxuebXi24dmG'
+        'ZxuebXi24dmGZxuebXi24dmGZxuebXi24dmGZxuebXi24dmGZxuebXi24dmGZxuebXi24dmGZxue'
+        'bbi0UdpGaRulbZS2UdpGaRulbZS2UdpGaRulbZS2UdpGaRulbZS2Q09oh57QDj2hHXpCO/SEdugJ'
+        '7dAT2qEntENPaIee0A49oR16Qjv0hHboCe3QE9qhJ7ST+PzUjfq9tn5u39zHzm8A73NLwncyuowH'
+        'Gw8xbjYeatxqPMx4uPEI45HGo4zbjEcb3cZjjMcajzMebzzBeKLRY/QaTzKebDzFeKrxNOPpxjOM'
+        'Zxp9xrOMZxvfZDzHeK6RNp5nPN94gdFvvNB4kfFiY8B4iZExXmq8zHi5kTVeYQwatxuvNF5lvNp4'
+        'jfFa43XG640h4w3GG403GdeMNxs54y1G3nirUTDeZgwbI8bbk3Fn7l/dZX0v33QB0H84BygFoBSA'
+        'UgBKASgFoBSAUgBKASgFoBSAUgBKASgFoBSAUgBKASgFoBSAUgBKASgFoBSAUgBKASgFoBSAUgBK'
+        'ASgFoBSAUgBKASgFoBSAUgBKASgFoBSAUgBKASgFoBSAUgBKASgFoBSAUgBKASgFoBSAUgBKASgF'
+        'oBSAUgBKASgFoBSAUgBKASgFoBSAUgBKASgFoBSAUgBKASgFoBSAUgBKASgFoBSAUgBKASgFoFQC'
+        '0E93KuHyeYf/N8kJwr9Ozgd+444nd371sdGfj/5C9Bejt0XviB4XfUv0lOid0aOj8ej10bdGL4om'
+        'okz0rujN0WT0oOgvRU+Koujd0R3RS6K/HL0pKkbfFr0n6o7eGz0vel/00OivRH3R+6NCNBV9ILoz'
+        'ekX0V6NS9O3RX4umo5loNro9+o7o1dFclI7mo0dFfz1aiP5G1BX9zeg10XdGr4wWo+dGH4weFv2t'
+        '6OXRUvS3o+Xou6IPRX8n+u7o1iiOnhj93SgXrUTfE31v9H3Rh6NnRN8fPTwqR5VoNbot+oHopdFH'
+        'omdFfy96fLQW/WBUjX4o+uHoR6LaHU85/98e7Zx9/Gi0Hj0m+vvRs6Mfi54fbUT5aDN6bfTj0YOj'
+        'evTR6B9EPdE/jEaiRvSPoq3oDdE/jh4S/UT0T6Lt6IHRP42eGe1EvdE/i54W/WT0uuifR/8i+pfR'
+        'teinon8V/XT0r6Pd6BHRv4meGv3b6IXRv4v+ffQzUX/0H6K96D9Gr4qa0X+K9qMnRP85Gox+NhqK'
+        'fi56QfQL0S9GH4s+Hv1SNBB9Ivpk9KnoZdGno89En42Go4Pol6PD6L9EvxI9PTqKfjX6r9GvRf8t'
+        '+u/R/4j+Z9SKfj36X9H/jo6j34p+O/o/0e9Eb4lOojdGn4ueHJ1Gvxv9XvT70eejs+gL0SOjdvQH'
+        '0Rc7ru2su5s6P9zc+SHV+eG+nR/u1/nh/p0fHtD54ZabEsQf2Ll+UPJhTp0fHtz54SE3JXF56E0J'
+        'eLd2fulhnR8e3vnhEZ0fHtn54VGdH27r/PDozg/dNyU97jHJ6XLnh8cldyi74Znof5fcnvyby9co'
+        'f4XRuhiti9G6GK2L0boYrYvRuhiti9G6GK2L0boYrYvRuhiti9G6GK2L0boYrYvRuhiti9G6GK2L'
+        '0boYrYvRuhiti9G6GK2L0boYrYvRuhiti9G6GK2L0boYrYvRuhiti9G6GK2L0boYrYvRuhiti9G6'
+        'GK2L0boYrYvRuhiti9G6GK2L0boYrYvRuhiti9G6GK2L0boYrYvRuhiti9G6GK2L0boYrYvRuhit'
+        'i9G6GK2L0boYrYvRuhiti9G6GK2L0boYrSsx2r9NVuLHzlfi3k0XNyTj9z0vYZ1ffmHntOJT5z+Z'
+        '7ryq8fPnPxm8/pMPPeRb3/tt73vn+9899d73vOO970teNviRzj/oF8//oqd1/vZfOv/Jr6duOGO9'
+        'KXmsJOmEt91y0TZvS/7D/t0ly/8Cy91Y7sZyN5a7sdyN5W4sd2O5G8vdWO7GcjeWu7HcjeVuLHdj'
+        'uRvL3VjuxnI3lrux3I3lbix3Y7kby91Y7sZyN5a7sdyN5W4sd2O5G8vdWO7GcjeWu7HcjeVuLHdj'
+        'uRvL3VjuxnI3lrux3I3lbix3Y7kby91Y7sZyN5a7sdyN5W4sd2O5G8vdWO7GcjeWu7HcjeVuLHdj'
+        'uRvL3VjuxnI3lrux3I3lbix3Y7kby91Y7sZyN5a7sdyN5e4EmX/f0WHyHVKPS3T4MwnbF58S/b9v'
+        'BO/zNwXwnpD8vf/h8vWk287bYA/eevDWg7cevPXgrQdvPXjrwVsP3nrw1oO3Hrz14K0Hbz1468Fb'
+        'D9568NaDtx689eCtB289eOvBWw/eevDWg7cevPXgrQdvPXjrwVsP3nrw1oO3Hrz14K0Hbz1468Fb'
+        'D9568NaDtx689eCtB289eOvBWw/eevDWg7cevPXgrQdvPXjrwVsP3nrw1oO3Hrz14K0Hbz1468Fb'
+        'D9568NaDtx689eCtB289eOvBWw/eevDWg7cevPXgrSdhZu+GD+bN/U7SBv/j1SMfV4fXX+bw+uI1'
+        'gHJnR35NTrKb32ivr1z70NXLK/f0l1f+U8ee5x/Nd+2Wjjz3L3dwz/kO7rOD++zgPju4zw7us3z7'
+        'LN8+y7fP8u2zfPss3z7Lt8/y7bN8+yzfPsu3z/Lts3z7LN8+y7fP8u2zfPss3z7Lt8/y7bN8+yzf'
+        'Psu3z/Lts3z7LN8+y7fP8u2zfPss3z7Lt8/y7bN8+yzfPsu3z/Lts3z7LN8+y7fP8u2zfPss3z7L'
+        't8/y7bN8+yzfPsu3z/Lts3z7LN8+y7fP8u2zfPss3z7Lt8/y7bN8+yzfPsu3z/Lts3z7LN8+y7fP'
+        '8u2zfPss3z7Lt8/y7bN8+yzfPsu3z/LtS5bvf77atPdOj12sv85Hb37dSe1nb3y/3dclT6r93BWo'
+        '9wRQL5rB0nXqrpbvz3dulW/uQFpKbpV/4fK05Qs2b7/N22/z9tu8/TZvv83bb/P227z9Nm+/zdtv'
+        '8/bbvP02b7/N22/z9tu8/TZvv83bb/P227z9Nm+/zdtv8/bbvP02b7/N22/z9tu8/TZvv83bb/P2'
+        '27z9Nm+/zdtv8/bbvP02b7/N22/z9tu8/TZvv83bb/P227z9Nm+/zdtv8/bbvP02b7/N22/z9tu8'
+        '/TZvv83bb/P227z9Nm+/zdtv8/bbvP02b7/N22/z9tu8/TZvv83bb/P227z9Nm+/zdtv8/bbvP02'
+        'b7/N22/z9tu8/TZvf7J5f/FKaH+k0C6W22c6y+3qduJraLSPJQZLXgxZ6dxYX3wrZLrzk4uX7MaT'
+        'N0f6eGdJ188/APyLHf390qX+Pk9/WfrL0l+W/rL0l6W/LP1l6S9Lf1n6y9Jflv6y9Jelvyz9Zekv'
+        'S39Z+svSX5b+svSXpb8s/WXpL0t/WfrL0l+W/rL0l6W/LP1l6S9Lf1n6y9Jflv6y9Jelvyz9Zekv'
+        'S39Z+svSX5b+svSXpb8s/WXpL0t/WfrL0l+W/rL0l6W/LP1l6S9Lf1n6y9Jflv6y9Jelvyz9Zekv'
+        'S39Z+svSX5b+svSXpb8s/WXpL0t/WfrL0l+W/rL0l03094mLF92uvaqDzifDa3C/nWzST13Z8ep8'
+        'JeyBN998z/j2mU/f5cHDf3L54OFrb0kePOwMDx4mVy8LVy8PV9lw9YpwNRiubg9XqYur6P7GA40H'
+        'GV3Gg42HGDcbDzVuNR5mPNx4hPFI41HGbcajjW7jMcZjjccZjzeeYDzR6DF6jScZTzaeYjzVeJrx'
+        'dOMZxjONPuNZxrONbzKeYzzXSBvPM55vvMDoN15ovMh4sTFgvMTIGC81Xma83MgarzAGjduNVxqv'
+        'Ml5tvMZ4rfF243XG640h4w3GG403GdeMNxs54y1G3nirUTDeZgwbI5C5NcDzs+Hq58LVz4erXwhX'
+        'H71g14OHydXHwtXHw9UvhatPhKtPhqtPhatPh6vPhKvPXlzdeb3OdeJz8Sz4j3VeSfzZ85/8UOcn'
+        'nzz/ybXku4E+ey9dARfSemWnMl3tg7AP3nU/fy5//6avmw9nP7gsvGcKb46jcxyd4+gcR+fIOUfO'
+        'OXLOkXOOnHPknCPnHDnnyDlHzjlyzpFzjpxz5Jwj5xw558g5R845cs6Rc46cc+ScI+ccOefIOUfO'
+        'OXLOkXOOnHPknCPnHDnnyDlHzjlyzpFzjpxz5Jwj5xw558g5R845cs6Rc46cc+ScI+ccOefIOUfO'
+        'OXLOkXOOnHPknCPnHCvnWDnHyjlWzrFyjpVzrJxj5Rwr51g5x8o5Vs6xco6Vc6ycY+WcZZBL5PfL'
+        'ic4unpy4z+UjO/ng6XzyFx7epWT85GXJKCgZhVAyCqFkFELJKISSUQgloxBKRiGUjEIoGQUlo6Bk'
+        'FABcAHABwAUAF5SMAo4LOC7guIDjAo4LOC7guIDjAo4LOC7guIDjAo4LOC7guIDjAo4LOC7guIDj'
+        'Ao4LOC7guIDjAo4LOC7guIDjAo4LOC7guIDjAo4LOC7guIDjAo4LOC7guIDjAo4LOC7guIDjAo4L'
+        'OC7guIDjAo4LOC7guIDjAo4LOC7guICrApwLcC7AuQDnApwLcC7AuQDnApwLcC7AuQDnApwLcC7A'
+        'uQDnQigZhVAyCgHeQigZhVAyCqFkFELJKISSUQgloxBKRiGUjEIoGYVQMgqhZBRCySiEklFI4vNf'
+        'Lp38m5w8DOlhSA9DehjSw5AehvQwpIchPQzpYUgPQ3oY0sOQHob0MKSHIT0M6WFID0N6GNLDkB6G'
+        '9DCkhyE9DOlhSA9DehjSw5AehvQwpIchPQzpYUgPQ3oY0sOQHob0MKSHIT0M6WFID0N6GNLDkB6G'
+        '9DCkhyE9DOlhSA9DehjSw5AehvQwpIchPQzpYUgPQ3oY0sNYHsbyMJaHsTyM5WEsD2N5GMvDWB7G'
+        '8jCWh7E8jOVhLA9jeRjLwyI0nCDzK5efLP2ay3foenvA/e0B47cnf/3RDW8Sdu1HO8cVv5r8E+7N'
+        'z613nlnvPLv+Rzy3fq99VP05ycO2nYftv9RD678R/ea9+MH1/5o0hfNbqGv/8YY7qAcnd1C/dvFx'
+        'HrnF5FDtvzncvWOx81Ty3zx/e5X7J3/pf798aOTF5w+NjNPmOG2O0+Y4bY7T5jhtjtPmOG2O0+Y4'
+        'bY7T5jhtjtPmOG2O0+Y4bY7T5jhtjtPmOG2O0+Y4bY7T5jhtjtPmOG2O0+Y4bY7T5jhtjtPmOG2O'
+        '0+Y4bY7T5jhtjtPmOG2O0+Y4bY7T5jhtjtPmOG2O0+Y4bY7T5jhtjtPmOG2O0+Y4bY7T5jhtjtPm'
+        'OG2O0+Y4bY7T5jhtjtPmOG2O0+Y4bY7T5jhtjtPmOG2O0+Y4bY7T5jhtjtPmOG2O0+Y4bY7T5nii'
+        'wf9xl6L6zy6L6oSiOhGK6kQoqhOhqE6EojoRiupEKKoToahOhKI6oahOKKoT8JyA5wQ8J+A5Ac8J'
+        'eE7AcwKeE/CcgOcEPCfgOQHPCXhOwHMCnhPwnIDnBDwn4DkBzwl4TsBzAp4T8JyA5wQ8J+A5Ac8J'
+        'eE7AcwKeE/CcgOcEPCfgOQHPCXhOwHMCnhPwnIDnBDwn4DkBzwl4TsBzAp4T8JyA5wQ8J+A5Ac8J'
+        'eE7AcwKeE/CcgOcEPCfgOQGXCZROoHQCpRMonUDpBEonUDqB0gmUTqB0AqUTKJ1A6QRKJ1A6gdKJ'
+        'sLknQlGdCEV1IhTViVBUJ8KGnwhFdSIU1YlQVCdCUZ0IRXUiFNWJUFQnQlGdCEV1IhTViSQ+/zO8'
+        'r+gdnwzfiP6p8M3pnw7fkv6Z8C3pn02+v72Ttsdc9pTJELPJELPJEJpJoZkUmkmhmRSaSaGZFJpJ'
+        'oZkUmkmhmRSaSaGZFJpJoZkUmkmhmRSaSaGZFJpJoZkUmkmhmRSaSaGZFJpJoZkUmkmhmRSaSaGZ'
+        'FJpJoZkUmkmhmRSaSaGZFJpJoZkUmkmhmRSaSaGZFJpJoZkUmkmhmRSaSaGZFJpJoZkUmkmhmRSa'
+        'SaGZFJpJoZkUmkmhmRSaSaGZFJpJoZkUmkmhmRSaSaGZFJpJoZkUmkmhmRSaSaGZFJpJoZkUmkmh'
+        'mRSaSaGZFJpJoZkMoZkMoZkMoZkMoZkMoZkMoZkMoZkMoZkMoZkMoZkMoUmu8uHv/WT4tU+Fq0+H'
+        'q8+Eq89eXN2Za91l+9Qut09k+0QhFlGIRRS2TxS2TxS2TxS2TxS2TxSCFAlSJEiRIEWCFAlSJEiR'
+        'IEWCFAlSJEiRIEWCFAlSJEiRIEWCFAlSJEiRIEWCFAlSJEiRIEWCFAlSJEiRIEWCFAlSJEiRIEWC'
+        'FAlSJEiRIEWCFAlSJEiRIEWCFAlSJEiRIEWCFAlSJEiRIEWCFAlSJEiRIEWCFAlSJEiRIEWCFAlS'
+        'JEiRIEWCFAlSJEiRIEWCFAlSJEiRIEWCFAlSJEiRIEWCFAlSJEiRIEWCFAlSJEiRIEUhSFEIUhSC'
+        'FIUgRSFIUQhSFIIUhSBFIUhRCFIUghSF+EQhPlGITxTiE4X4REl8fv3Ge9indO4O/tddArV6Gaii'
+        'QBVDoIohUMUQqGIIVDEEqhgCVQyBKoZAFQWqKFBFgSoKVFGgigJVFKiiQBUFqihQRYEqClRRoIoC'
+        'VRSookAVBaooUEWBKgpUUaCKAlUUqKJAFQWqKFBFgSoKVFGgigJVFKiiQBUFqihQRYEqClRRoIoC'
+        'VRSookAVBaooUEWBKgpUUaCKAlUUqKJAFQWqKFBFgSoKVFGgigJVFKiiQBUFqihQRYEqClRRoIoC'
+        'VRSookAVBaooUEWBKgpUUaCKAlUUqKJAFQWqKFBFgSoKVFGgigJVFKhiCFQxBKoYAlUMgSqGQBVD'
+        'oIohUMUQqGIIVDEEqhgCVQyBKoZAFUOgiiFQxRCoYhKo/33jmxq8KHlm+fjGd0p8R3IL/ht3ee+V'
+        '77l464yfO7/nnpKCKSmYkoIpKZiSgikpmJKCKSmYkoIpKZiSgikpmJKCKSmYkoIpKZiSgikpmJKC'
+        'KSmYkoIpKZiSgikpmJKCKSmYkoIpKZiSgikpmJKCKSmYkoIpKZiSgikpmJKCKSmYkoIpKZiSgikp'
+        'mJKCKSmYkoIpKZiSgikpmJKCKSmYkoIpKZiSgikpmJKCKSmYkoIpKZiSgikpmIL/FPyn4D8F/yn4'
+        'T8F/Cv5T8J+C/xT8p+A/Bf8p+E/Bfwr+U/CfkrqphLLf7PDzofuOvDH3uuQ7xF+X+uD3fei+r33V'
+        'iJ8+8+bOYc5v3cXk339p8mkmnw4mnw4mnw4mnw4mnw4mnw4mnw4mnw4mn2byaSafxvA0hqcxPI3h'
+        'aQxPY3gaw9MYnsbwNIanMTyN4WkMT2N4GsPTGJ7G8DSGpzE8jeFpDE9jeBrD0xiexvA0hqcxPI3h'
+        'aQxPY3gaw9MYnsbwNIanMTyN4WkMT2N4GsPTGJ7G8DSGpzE8jeFpDE9jeBrD0xiexvA0hqcxPI3h'
+        'aQxPY3gaw9MYnsbwNIanMTyN4WlMTUN5GsrTUJ6G8jSUp6E8DeVpKE9DeRrK01CehvI0lKehPA3l'
+        'aShPB5NPB5NPB5NPB5NPB5NPB5NPB5NPB5NPB5NPB5NPB5NPB5NPB5NPB5NPB5NPB5NPJxn77SQ+'
+        '+fP4PO/yTntWfGZDfGZDfGZDfGZDfGZDfGZDfGZDfGZDfGbFZ1Z8ZsVnVnxmxWdWfGbFZ1Z8ZsVn'
+        'VnxmxWdWfGbFZ1Z8ZsVnVnxmxWdWfGbFZ1Z8ZsVnVnxmxWdWfGbFZ1Z8ZsVnVnxmxWdWfGbFZ1Z8'
+        'ZsVnVnxmxWdWfGbFZ1Z8ZsVnVnxmxWdWfGbFZ1Z8ZsVnVnxmxWdWfGbFZ1Z8ZsVnVnxmxWdWfGbF'
+        'Z1Z8ZsVnVnxmxWdWfGbFZ1Z8ZsVnVnxmxWdWfGbFZ1Z8ZsVnVnxmxWdWfGbFZ1Z8ZsVnVnxmxWdW'
+        'fGbFZzbEZzbEZzbEZzbEZzbEZzZEYDYEaTYEaTYEaTYEaTYEaTaEZjaEZjaEazbEZzbEZzaJz/+5'
+        'fAH2J7WaOUjPQXoO0nOQnoP0HKTnID0H6TlIz0F6DtJzkJ6D9Byk5yA9B+k5SM9Beg7Sc5Ceg/Qc'
+        'pOcgPQfpOUjPQXoO0nOQnoP0HKTnID0H6TlIz0F6DtJzkJ6D9Byk5yA9B+k5SM9Beg7Sc5Ceg/Qc'
+        'pOcgPQfpOUjPQXoO0nOQnoP0HKTnID0H6TlIz0F6DtJzkJ7D8hyW57A8h+U5LM9heQ7Lc1iew/Ic'
+        'luewPIflOSzPYXkOy3NYnhOhuQSZ3wlPf98nKc4nd8ujfxcP4q10nh6+ehT86ntjvsKn/T4Xvtvv'
+        '+cm93Kku/qq3ve5VySeAj16v4qlXv+ptyU/+bKeXv+GNwyPJz76l87M3v/EtSUu/NtEp6b97l5L+'
+        'kJtDSY+1jDi0jDi0jDi0jDi0jDi0jDi0jDi0jDi0jFjLiLWMmJJjSo4pOabkmJJjSo4pOabkmJJj'
+        'So4pOabkmJJjSo4pOabkmJJjSo4pOabkmJJjSo4pOabkmJJjSo4pOabkmJJjSo4pOabkmJJjSo4p'
+        'OabkmJJjSo4pOabkmJJjSo4pOabkmJJjSo4pOabkmJJjSo4pOabkmJJjSo4pOabkmJJjSo4pOabk'
+        'mCJjZo6ZOWbmmJljZo6ZOWbmmJljZo6ZOWbmmJljZo6ZOWbmmJnj0DLi0DLi0DLi0DLi0DLi0C3i'
+        '0C3i0C3i0C3i0C3i0CPi0FDi0Dfi0Dfi0DLi0DLiZGX83uU3qn0+9UGPOVx7+fWY3f9973z/O79t'
+        'KgnaGztB+/0b3l/oWqET3M9fPu8zdtnufyD8f/9A8m84u+wx/0OPWRWaVaFZFZpVoVkVmlWhWRWa'
+        'VaFZFZpVoVkVmlWhWRWaVaFZFZpVoVkVmlWhWRWaVaFZFZpVoVkVmlWhWRWaVaFZFZpVoVkVmlWh'
+        'WRWaVaFZFZpVoVkVmlWhWRWaVaFZFZpVoVkVmlWhWRWaVaFZFZpVoVkVmlWhWRWaVaFZFZpVoVkV'
+        'mlWhWRWaVaFZFZpVoVkVmlWhWZWWVWlZlZZVaVmVllVpWZWWVWlZlZZVaVmVllVpWZWWVWlZlZZV'
+        'aVkV0tUEmS9cfdfa3V9VPnR/NS530z3ic6DCZ090WuW9r8S071I7ti/PBqtqRzXUjmqoHdVQO6qh'
+        'dlRD7aiG2lENtaMaakdV7aiqHVUGrTJolUGrDFpl0CqDVhm0yqBVBq0yaJVBqwxaZdAqg1YZtMqg'
+        'VQatMmiVQasMWmXQKoNWGbTKoFUGrTJolUGrDFpl0CqDVhm0yqBVBq0yaJVBqwxaZdAqg1YZtMqg'
+        'VQatMmiVQasMWmXQKoNWGbTKoFUGrTJolUGrDFpl0CqDVhm0yqBVBq0yaJVBqwxaZbQqkVaJtEqk'
+        'VSKtEmmVSKtEWiXSKpFWibRKpFUirRJplUirRFol0mpYv9VQO6qhdlRD7aiG2lENtaMaakc11I5q'
+        'qB3VUDuqoXZUQ+2ohtpRDbWjGmpHNdSOamL4P7i4B7j2oE6T+OKXE/6FLd7Z+f62K/tf3ah+LRx/'
+        'n9RVDbkC8U8dxPBmUT/duQ27KXXjp0a8KHXx0vcvnL/0vaEabKgGG6rBhmqwoRpsqAYbqsGGarCh'
+        'GmyoBhuqwYZqsKEabKgGG6rBhmqwoRpsqAYbqsGGarChGmyoBhuqwYZqsKEabKgGG6rBhmqwoRps'
+        'qAYbqsGGarChGmyoBhuqwYZqsKEabKgGG6rBhmqwoRpsqAYbqsGGarChGmyoBhuqwYZqsKEabKgG'
+        'G6rBhmqwoRpsqAYbqsGGarChGmyoBhuqwYZqsKETbOgEGzrBhk6woRNs6AQbOsGGTrChE2zoBBs6'
+        'wYZOsKETbOgEGzrBhk6woYpsJKv35tQNTyx9a2f7pq4897X23EWfKXb6zJX0vtT2ve+fLpUXX6Ge'
+        'zu3y1Sq+V1F56/l2fHTna/dVRPR+qfDdXsPn63fL+t2yfres3y3rd8v63bJ+t6zfLet3y/rdsn63'
+        'rN8t63fL+t2yfres3y3rd8v63bJ+t6zfLet3y/rdsn63rN8t63fL+t2yfres3y3rd8v63bJ+t6zf'
+        'Let3y/rdsn63rN8t63fL+t2yfres3y3rd8v63bJ+t6zfLet3y/rdsn63rN8t63fL+t2yfres3y3r'
+        'd8v63bJ+t6zfLet3y/rdsn63rN8t63fL+t2yfres3y3rd8v63bJ+t6zfLet3y/rdsn63rN8t63fL'
+        '+t2yfres3y3rd8v63UrW7/1T599MeO3PdHbvAxKEHthB6FrnDP06NNtQ2IbCNhS2fdW3fdW3fZ23'
+        'fYG3fYG3fYG3fRG3fRG3fb22fb22fYW2fWm2fU22fU22/blv+7Pd9me77Q912x/qtj/UbX9w2/7g'
+        'tv2JbfvD2faHs+2PY9sfx7Y/h21nWNsisi0b27KxLRTbQrEtFNv438b/Nv63Eb+N+G2ob6N6G9Xb'
+        'qN5G9TaOt3G8jeNt5G4jdxuy21jdRuc2OrfRuY3ObVhuw3Ibltuw3AbiNua2MbeNuW3MbaNsG17b'
+        '8NqG1zagtgG1DaFt7Gwn7NySujg1+Rsddh6Y+sb4sK9v5M/3Ov+cs2u/fH2T3YO+ZfpBV7cM96C3'
+        'kc7Npa7eR/o6lV2dW9vC+Z/JZ5NHoB6cunh/zNs6P33IZWN76Xlj27WOdjW2XVtp11ba1dh2Ladd'
+        'y2nXctq1pnet6V1retfG2rWxdm2sXbt71+7etb927a9dm3zXGtu10Hct9F0Lfddu27Xbdu22Xbtt'
+        '17Lftex3bbpdm27XptvVAHY1gF17b9fe29UHdq2/XbVg1xbc1Q52tYNdO3HXTty1E3ftxF3NYddq'
+        '3LUad63GXatxV6vY1Sp2Lcpd5WJXudhVLnZtz13bc9f23LU9dxWPXcVj1y7d1T92rdRdK3XXSt1V'
+        'SnaVkl0LdteC3VVRdlWUXet2V1PZtXV3k6370NTd8aYkyRtofFvnuO7q7Um+Npv23v2mJLcmG/Yf'
+        'n7+7yP06gv9H5z95b/K+0Q+7VNmnzlW2R2V7VLZHZXtUtkdle1S2R2V7VLZHZXtUtkdle1S2R2V7'
+        'VLZHZXtUtkdle1S2R2V7VLZHZXtUtkdle1S2R2V7VLZHZXtUtkdle1S2R2V7VLZHZXtUtkdle1S2'
+        'R2V7VLZHZXtUtkdle1S2R2V7VLZHZXtUtkdle1S2R2V7VLZHZXtUtkdle1S2R2V7VLZHZXtUtkdl'
+        'e1S2R2V7VLZHZXtUtkdle1S2R2V7VLZHZXtUtkdle1S2R2V7VLZHZXtUtkdle4nKHn7JzBPOmWli'
+        'pomZJmaamGmCpQmWJliaYGmCpQmWJliaYGmCpQmWJliaYGmCpQmWJliaYGmCpQmWJliaYGmCpQmW'
+        'JliaYGmCpQmWJliaYGmCpQmWJliaYGmCpQmWJliaYGmCpQmWJliaYGmCpQmWJliaYGmCpQmWJlia'
+        'YGmCpQmWJliaYGmCpQmWJliaYGmCpQmWJliaYGmCpQmWJliaYGmCpQmWJliaYGmCpQmWJliaYGkm'
+        'sDwiFR7ve93l43374fmC/fDcwH7y1z/y6p7g6oz2broNuHjJs3Edu6/oluBRF/0/t5d8JOZtqRs+'
+        'JfM1yS89OnXxwax3PP4C6Q70Z5efyvrxBPDuy0A89zIQn0h+7zHh37OQPNT+WH/tHe+9//W/JPnr'
+        'kqskOMnVRy9+7c7c4+5Vwbn40vzg9T+AqxB93d5LPz51+YGIuZ9K7qWfEBjPJj9/4mWb2DtvE0fa'
+        'xJE2caRNHGkTRxrokVJxpFQcKRVHSsWRUnGkVBwpFUdKxZFScaRUHCkVR0rFkVJxpFQcKRVHSsWR'
+        'UnGkVBwpFUdKxZFScaRUHCkVR0rFkVJxpFQcKRVHSsWRUnGkVBwpFUdKxZFScaRUHCkVR0rFkVJx'
+        'pFQcKRVHSsWRUnGkVBwpFUdKxZFScaRUHCkVR0rFkVJxpFQcKRVHSsWRUnGkVBwpFUdKxZFScaRU'
+        'HCkVR0rFkVJxpFQcKRVHSsWRUnGkVBwpFUdKxZFScaRUHCkVR0rFUeLJnnCE/bwOQr2py0+ou9bV'
+        '+ZUndX4lf87d9yecPfmSs98756yFsxbOWjhr4ayFsxbOWjhr4ayFsxbOWjhr4ayFsxbOWjhr4ayF'
+        'sxbOWjhr4ayFsxbOWjhr4ayFsxbOWjhr4ayFsxbOWjhr4ayFsxbOWjhr4ayFsxbOWjhr4ayFsxbO'
+        'Wjhr4ayFsxbOWjhr4ayFsxbOWjhr4ayFsxbOWjhr4ayFsxbOWjhr4ayFsxbOWjhr4ayFsxbOWjhr'
+        '4ayFsxbOWjhr4ayFsxbOWjhr4ayFs1bC2VNS38jvJJscNn28c9h0dWjztTy0eWow1bUDojomqmOi'
+        'OiaqY6I6JqpjojomqmOiOiaqY6I6JqpjojomqmOiOiaqY6I6JqpjojomqmOiOiaqY6I6Jqpjojom'
+        'qmOiOiaqY6I6JqpjojomqmOiOiaqY6I6JqpjojomqmOiOiaqY6I6JqpjojomqmOiOiaqY6I6Jqpj'
+        'ojomqmOiOiaqY6I6JqpjojomqmOiOiaqY6I6JqpjojomqmOiOiaqY6I6JqpjojomqmOiOiaqY6I6'
+        'JqpjojomqmOiOiaqY6I6JqrjRFRPS8r/+8/vOW67GTa/ectFQUyuvjNc1cJV8eLq+v9r8gub4bfm'
+        'wtWfC1f5cDUcrv56uFoKV+8MV3G4yoV/1ev9wreH3+oPV5VwdXu4+uZw9ZHwj+j1C4XwW68NV+8L'
+        'V7Ph6j3h6rnh6o5w9epw9YZwdS38q4b9wivCb73k4urO3NNTN7zpc26o86TQz53/5MeT89Vn3JPv'
+        'yi5e+Lv5vtf/u6/ONr5xbsueeblhPkEVpzbMqQ1zasOc2jCnNsypDXNqw5zaMKc2zKkNc2rDnNow'
+        'pzbMqQ1zasOc2jCnNsypDXNqw5zaMKc2zKkNcyrupzbMqQ1zasOc2jCnNsypDXNqw5zaMKc2zKkN'
+        'c2rDnNowpzbMqQ1zasOc2jCnNsypDXNqw5zaMKc2zKkNc2rDnNowpzbMqQ1zasOc2jCnNsypDXPK'
+        'uqc2zKkNc2rDnNowpzbMqQ1zasOcUuipDXNqw5zaMKc2zKkNc2rDnNowpzbMqQ1zasOc2jCnNswp'
+        '353aMKc2zGliur6rc9l7u7sudP/NXz+f+fWsq4fX/n8vqYenvX79utm/zh5kuwfdpT374gwq94Tk'
+        'fOmbOih+6LZ3vGPi3d/6gXcU3/2Bd73/ncV3TH3gne9/x0DydpAfuOn8sL/zk7XOT1LnVbGdfOrH'
+        'czr/wLd1fv6TySsKz71i+8s+LhJY/6HrrF+xfXexnb6bl/2vPQDoI50HUK42/9fzXctFyfi9juAe'
+        'e/6s0YNu/up+C83zOsf9Pef/sr+R6Pj5qRve7vkJyaupL0ioTqTb+V6byxdfb31g8m4bneG11c7V'
+        'nbn+q8p7Bf4fG/wf+ip/u9gL73LU97Dzo75HPvDi/yK5+s5wVQtXxYur6/gmv7AZfmsuXP25cJUP'
+        'V8Ph6q+Hq6Vw9c5wFYerXPhXvd4vfHv4rf5wVQlXt4erbw5XHwn/iF6/UAi/9dpw9b5wNRuu3hOu'
+        'nhuu7ghXrw5XbwhX18K/atgvvCL81ksuru7MvSg8A97fkcmLL49QfsuXoPuByRFKMrqMBxsPMW42'
+        'HmrcajzMeLjxCOORxqOM24xHG93GY4zHGo8zHm88wXii0WP0Gk8ynmw8xXiq8TTj6cYzjGcafcaz'
+        'jGcb32Q8x3iukTaeZzzfeIHRb7zQeJHxYmPAeImRMV5qvMx4uZE1XmEMGrcbrzReZbzaeI3xWuN1'
+        'xuuNIeMNxhuNNxnXjDcbOeMtRt54q1Ew3mYMGyPG25NxZ27gap8k++SiFQx0TPlVWi4XjfO7O43z'
+        'XrJpwmfVd/6b7wGHKy+54bGK3MeSe9LM5UMUrzl/iKKX9nppr5f2emmvl/Z6aa+X9nppr5f2emmv'
+        'l/Z6aa+X9nppr5f2emmvl/Z6aa+X9nppr5f2emmvl/Z6aa+X9nppr5f2emmvl/Z6aa+X9nppr5f2'
+        'emmvl/Z6aa+X9nppr5f2emmvl/Z6aa+X9nppr5f2emmvl/Z6aa+X9nppr5f2emmvl/Z6aa+X9npp'
+        'r5f2emmvl/Z6aa+X9nppr5f2emmvl/Z6aa+X9nppr5f2emmvl/Z6aa+X9nppr5f2emmvl/Z6E+29'
+        'tINR/Tzzk0k5f1nqxve9+8jl+949VRPvDO97l1y9LFy9PFxlw9UrwtVguLo9XKUurq7f5ibjgcaD'
+        'jC7jwcZDjJuNhxq3Gg8zHm48wnik8SjjNuPRRrfxGOOxxuOMxxtPMJ5o9Bi9xpOMJxtPMZ5qPM14'
+        'uvEM45lGn/Es49nGNxnPMZ5rpI3nGc83XmD0Gy80XmS82BgwXmJkjJcaLzNebmSNVxiDxu3GK41X'
+        'Ga82XmO81ni78Trj9caQ8QbjjcabjGvGm42c8RYjb7zVKBhvM4aNEcjcGuD52XD1c+Hq58PVL4Sr'
+        'j16w633vkquPhauPh6tfClefCFefDFefClefDlefCVefvbi6M/fyqyJxdWP6p9YQLh7djq9L+4a2'
+        'kA1Ov+N54ZNRn965Pb0z94obHwO+NTmMGbxi+O5i+MPJ35O6ovkr7Lu3p2740LgH37dD6SvvUlS+'
+        '97KopBWVdCgq6VBU0qGopENRSYeikg5FJR2KSjoUlbSiklZU0opKWlFJKyppRSWtqKQVlbSiklZU'
+        '0opKWlFJKyppRSWtqKQVlbSiklZU0opKWlFJKyppRSWtqKQVlbSiklZU0opKWlFJKyppRSWtqKQV'
+        'lbSiklZU0opKWlFJKyppRSWtqKQVlbSiklZU0opKWlFJKyppRSWtqKQVlbSiklZU0opKWlFJKypp'
+        'RSWtqKQVlbSiklZU0opKWlFJKyppRSWtqKQVlbSiklZU0opKWlFJKyppRSWtqKQVlbSiklZU0opK'
+        'WlFJKyppRSWtqKRDUUmHopIORSUdiko6FJV0KCrpUFTSoaikQ1FJh6KSDkUlHYpKOhSVdCgq6VBU'
+        '0qGopJOi8qrwvR7/Jbl9fPXdIv17l+Avtf4XztVS6tzfX/WU/xezf0U+f83XyQvoFy9y5/5551n8'
+        'q7c5uje8gv7ay4Oyh58flA3Y5gO2+YBtPmCbD1jjA9b4gDU+YI0PWOMD1viANT5gjQ9Y4wPW+IA1'
+        'PmCND1jjA9b4gDU+YI0PWOMD1viANT5gjQ9Y4wPW+IA1PmCND1jjA9b4gDU+YI0PWOMD1viANT5g'
+        'jQ9Y4wPW+IA1PmCND1jjA9b4gDU+YI0PWOMD1viANT5gjQ9Y4wPW+IA1PmCND1jjA9b4gDU+YI0P'
+        'WOMD1viANT5gfw/Y3wP294D9PWB/d8aHUx3Q7pMs8gGLfMAiH7DIByzyAYt8wCIfsMgHLPIBi3zA'
+        'Ih/QHwaSffm6u9TNn7qsmxl1MxPqZibUzUyom5lQNzOhbmZC3cyEupkJdTOjbmbUzQxAMwDNADQD'
+        '0Iy6mcFpBqcZnGZwmsFpBqcZnGZwmsFpBqcZnGZwmsFpBqcZnGZwmsFpBqcZnGZwmsFpBqcZnGZw'
+        'msFpBqcZnGZwmsFpBqcZnGZwmsFpBqcZnGZwmsFpBqcZnGZwmsFpBqcZnGZwmsFpBqcZnGZwmsFp'
+        'BqcZnGZwmsFpBqcZnGbgkoFrBq4ZuGbgmoFrRt3MoDSD0gxKMyjNoDSD0gxKMyjNoDSD0kyom5lQ'
+        'NzOhbmZC3cyEupkJlTETimcmFM9MKJ6ZUDwzoXhmQsnMhJKZCWU0E+pmJtTNTBKf13du4H7h/AWL'
+        'OGmcQ3dJ1PplorISlQ2JyoZEZUOisiFR2ZCobEhUNiQqGxKVlaisRGUlKitRWYnKSlRWorISlZWo'
+        'rERlJSorUVmJykpUVqKyEpWVqKxEZSUqK1FZicpKVFaishKVlaisRGUlKitRWYnKSlRWorISlZWo'
+        'rERlJSorUVmJykpUVqKyEpWVqKxEZSUqK1FZicpKVFaishKVlaisRGUlKitRWYnKSlRWorISlZWo'
+        'rERlJSorUVmJykpUVqKyEpWVqKxEZSUqK1FZicpKVFaishKVlaisRGUlKitRWYnKSlRWorIhUdmQ'
+        'qGxIVDYkKhsSlQ05yoYcZUOOsiFH2ZCjbMhMNqQxG7KVDdnKhkRlQ6KySaLecFljbj6vMYOYHsT0'
+        'IKYHMT2I6UFMD2J6ENODmB7E9CCmBzE9iOlBTA9iehDTg5gexPQgpgcxPYjpQUwPYnoQ04OYHsT0'
+        'IKYHMT2I6UFMD2J6ENODmB7E9CCmBzE9iOlBTA9iehDTg5gexPQgpgcxPYjpQUwPYnoQ04OYHsT0'
+        'IKYHMT2I6UFMD2J6ENODmB7E9CCmBzE9COZBMA+CeRDMg2AeBPMgmAfBPAjmQTAPgnkQzINgHgTz'
+        'IJgHwTwoQ4MJM29MmBlKPkA2dcM3xFWSp5zfdMMHB+R+OHH0tRvO3a49vvMrb758uOYXUTeEuiHU'
+        'DaFuCHVDqBtC3RDqhlA3hLoh1A2hbgh1Q6gbQt0Q6oZQN4S6IdQNoW4IdUOoG0LdEOqGUDeEuiHU'
+        'DaFuCHVDqBtC3RDqhlA3hLoh1A2hbgh1Q6gbQt0Q6oZQN4S6IdQNoW4IdUOoG0LdEOqGUDeEuiHU'
+        'DaFuCHVDqBtC3RDqhlA3hLoh1A2hbgh1Q6gbQt0Q6oZQN4S6IdQNoW4IdUOoG0LdEOqGUDeEuiHU'
+        'DaFuCHVDqBtKqMvduPtfnnD1lquXGK5eJrub30pq6yt9K6n8FZRXUH5NXu26QPbvXkf2y0D51rvc'
+        'Jd1y+fHXeXdJ+XCXlA93Sflwl5QPd0n5cJeUD3dJ+XCXlA93SXl3SXl3SXm7PW+35+32vN2et9vz'
+        'dnvebs/b7Xm7PW+35+32vN2et9vzdnvebs/b7Xm7PW+35+32vN2et9vzdnvebs/b7Xm7PW+35+32'
+        'vN2et9vzdnvebs/b7Xm7PW+35+32vN2et9vzdnvebs/b7Xm7PW+35+32vN2et9vzdnvebs/b7Xm7'
+        'PW+35+32vN2et9vzdnvebs/b7Xm7PW+35+32vN2et2vzVnzeis9b8XkrPm/F5634vBWft+LzVnze'
+        'is9b8XkrPm/F5634vBWft+Lz4S4pH+6S8uEuKR/ukvLhLikf7pLy4S4pH+6S8uEuKR/ukvLhLikf'
+        '7pLy4S4pH+6S8uEuKR/ukvJJ9yj8Iae/8X7Xf3jT/f7vdk9etb92vz/k+Tff72vg+eSTQ3LZm6/e'
+        '9eGrbfzLj9+7dH/ixx+775fdApx5v7vsg9z9FNxf+4q/oarz7y/c70v3lTtzb7u873/r+X3/CEuP'
+        'sPQIS4+w9AhLj7D0CEuPsPQIS4+w9AhLj7D0CEuPsPQIS4+w9AhLj7D0CEuPsPQIS4+w9AhLj7D0'
+        'CEuPsPQIS4+w9AhLj7D0CEuPsPQIS4+w9AhLj7D0CEuPsPQIS4+w9AhLj7D0CEuPsPQIS4+w9AhL'
+        'j7D0CEuPsPQIS4+w9AhLj7D0CEuPsPQIS4+w9AhLj7D0CD2P0PMIPY/Q8wg9j9DzCD2P0PMIPY/Q'
+        '8wg9j9DzCD2P0PMIPY/Q84itMJJYcPjypv3XIDMKmVHIjEJmFDKjkBmFzChkRiEzCplRyIxCZhQy'
+        'o5AZhcwoZEYhMwqZUciMQmYUMqOQGYXMKGRGITMKmVHIjEJmFDKjkBmFzChkRiEzCplRyIxCZhQy'
+        'o5AZhcwoZEYhMwqZUciMQmYUMqOQGYXMKGRGITMKmVHIjEJmFDKjkBmFzChkRiEzCplRyIxCZhQy'
+        'o5AZhcwoZEYhMwqZUciMQmYUMqOQGYXMKGRGITMKmVHIjEJmFDKjkBlNkBm5uhm6uhn6kmvw4nth'
+        'vtA5QfwaPwf49rvcDcWXrxmNuRsaC3dDY+FuaCzcDY2Fu6GxcDc0Fu6GxsLd0Fi4GxpzNzTmbmiM'
+        'NMdIc4w0x0hzjDTHSHOMNMdIc4w0x0hzjDTHSHOMNMdIc4w0x0hzjDTHSHOMNMdIc4w0x0hzjDTH'
+        'SHOMNMdIc4w0x0hzjDTHSHOMNMdIc4w0x0hzjDTHSHOMNMdIc4w0x0hzjDTHSHOMNMdIc4w0x0hz'
+        'jDTHSHOMNMdIc4w0x0hzjDTHSHOMNMdIc4w0x0hzjDTHSHOMxMa4c4w7x7hzjDvHuHOMO8e4c4w7'
+        'x7hzjDvHuHOMO8e4c4w7x7hzjDvHwt3QWLgbGgt3Q2Phbmgs3A2NhbuhsXA3NBbuhsbC3dBYuBsa'
+        'C3dDY+FuaCzcDY2Fu6GxcDc0Fu6GxhKpj35Dv2nqveERq84bu1579/WK9vXznqnfnDj74lsMbkl9'
+        '8PLtn+du7rzu9GfuER8EfO2jV58DfPUdB6Fp/Nkb3z702gcvXyy99owOs2N3u0mTt3T++c5jpFdO'
+        'vXr76S+t0j/3h0z5u+ce/Y7Ot+vfC+7QPvclVHl6L1Ll73d++PyfTJpnnR++cI/SZ7vzwx/ceE/3'
+        '8K/yu0H9+atThav1/jV9ifVHvvxLrH/hLqv+L92w6h/bWfV/8YrZK2a/ImYvWPyl62jdTSJ9R9I/'
+        'X3/Hyi0Xrxk+PjmOu4XHfyS5sfqWhNxLIv7q+X9Hb+c333mXo7TvuzxKKzlKK4WjtFI4SiuFo7RS'
+        'OEorhaO0UjhKK4WjtFI4Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5'
+        'Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5'
+        'Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5'
+        'Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5'
+        'Sis5Sis5Sis5Sis5Sis5Sis5Sis5Sis5SiuFo7RSOEorhaO0UjhKK4WjtFI4SiuFo7RSOEorhaO0'
+        'UjhKK4WjtFI4SiuFo7RSOEorhaO0UjhKKyVHaeP35K1wfl9wbfGPfIzgqonfQ5v4/2vnSZ5R+eKf'
+        'cHt86w1Pel+LOg/kTtwLvyE3vMP08z/4fV/rd7e++n7cu+1Q412JSRNVPyR8kNH4fS/E+9BbLrR8'
+        '6y0X6n9Y5+rhnR8eccuF8B95y4XcH3Xjh7x+8fJDXufDEplPFD55+STNc86fpFlQSxbUkgW1ZEEt'
+        'WVBLFtSSBbVkQS1ZUEsW1JIFtWRBLVlQSxbUkgW1ZEEtWVBLFtSSBbVkQS1ZUEsW1JIFtWRBLVlQ'
+        'SxbUkgW1ZEEtWVBLFtSSBbVkQS1ZUEsW1JIFtWRBLVlQSxbUkgW1ZEEtWVBLFtSSBbVkQS1ZUEsW'
+        '1JIFtWRBLVlQSxbUkgW1ZEEtWVBLFtSSBbVkQS1ZUEsW1JIFtWRBLVnQRxb0kQV9ZEEfWdBHFvSR'
+        'BX1kQR9Z0EcW9JEFfWRBH1nQRxb0kQV9ZEEfWVCDFhJm/tLVO//f69wY9sT3X8/4vdeT0eVDXP+H'
+        'rRbZapGtFtlqka0W2WqRrRbZapGtFtlqka0W2WqRrRbZapGtFtlqka0W2WqRrRbZapGtFtlqka0W'
+        '2WqRrRbZapGtFtlqka0W2WqRrRbZapGtFtlqka0W2WqRrRbZapGtFtlqka0W2WqRrRbZapGtFtlq'
+        'ka0W2WqRrRbZapGtFtlqka0W2WqRrRbZapGtFtlqka0W2WqRrRbZapGtFtlqka0W2WqRrRbZapGt'
+        'Ftlqka0W2WqRrRbZapGtFtlqka0W2WoxsdW7k9V68Vb7d9x8nZpk3f3n83W3BKAlAC0BaAlASwBa'
+        'AtASgJYAtASgJQAtAWgJQEsAWgLQEoCWALQEoCUALQFoCUBLAFoC0BKAlgC0BKAlAC0BaAlASwBa'
+        'AtASgJYAtASgJQAtAWgJQEsAWgLQEoCWALQEoCUALQFoCUBLAFoC0BKAlgC0BKAlAC0BaAlASwBa'
+        'AtASgJYAtASgJQAtAWgJQEsAWgLQEoCWALQEoCUALQFoCUBLAFoC0BKAlgC0BKAlAC0BaAlASwBa'
+        'SgC647IifeKcmWXMLGNmGTPLmFnGzDJmljGzjJllzCxjZhkzy5hZxswyZpYxs4yZZcwsY2YZM8uY'
+        'WcbMMmaWMbOMmWXMLGNmGTPLmFnGzDJmljGzjJllzCxjZhkzy5hZxswyZpYxs4yZZcwsY2YZM8uY'
+        'WcbMMmaWMbOMmWXMLGNmGTPLmFnGzDJmljGzjJllzCxjZhkzy5hZxswyZpYxs4yZZcwsY2YZM8uY'
+        'WcbMMmaWMbOMmWXMLGNmGTPLmFnGzHLCzF/+cicjF8ehzevF/Ors/Ors/GvxOEfx8rS787HzqYtN'
+        '+CvnVotZLWa1mNViVotZLWa1mNViVotZLWa1mNViVotZLWa1mNViVotZLWa1mNViVotZLWa1mNVi'
+        'VotZLWa1mNViVotZLWa1mNViVotZLWa1mNViVotZLWa1mNViVotZLWa1mNViVotZLWa1mNViVotZ'
+        'LWa1mNViVotZLWa1mNViVotZLWa1mNViVotZLWa1mNViVotZLWa1mNViVotZLWa1mNViVotZLWa1'
+        'mNViVotZLU6s9m2Xm/AR58ysYGYFMyuYWcHMClhWwLIClhWwrIBlBSwrYFkBywpYVsCyApYVsKyA'
+        'ZQUsK2BZAcsKWFbAsgKWFbCsgGUFLCtgWQHLClhWwLIClhWwrIBlBSwrYFkBywpYVsCyApYVsKyA'
+        'ZQUsK2BZAcsKWFbAsgKWFbCsgGUFLCtgWQHLClhWwLIClhWwrIBlBSwrYFkBywpYVsCyApYVsKyA'
+        'ZQUsK2BZAcsKWFbAsgKWFbCsgGUFLCtgWQHLSgLLe/6oFRgetPjVm64jdPX68dUO/BruwPeGt3z9'
+        'XPJRD++7yyvA3335CnDZK8Dl8ApwObwCXA6vAJfDK8Dl8ApwObwCXA6vAJfDK8BlrwCXvQJcZs8y'
+        'e5bZs8yeZRu3TKJlEi2TaJlEyyRaJtEyiZZJtEyiZRItk2iZRMskWibRMomWSbRMomUSLZNomUTL'
+        'JFom0TKJlkm0TKJlEi2TaJlEyyRaJtEyiZZJtEyiZRItk2iZRMskWibRMomWSbRMomUSLZNomUTL'
+        'JFom0TKJlkm0TKJlEi2TaJlEyyRaJtEyiZZJrcylZS4tc2mZS8tcWubSMpeWubTMpWUuLXNpmUvL'
+        'XFrm0jKXlrm0HF4BLodXgMvh8L4cXgEuh1eAy+EV4HJ4BbgcXgEuh1eAy+EV4HJ4BbgcXgEuh1eA'
+        'y+EV4HJ4BbgcXgEuJ5L/K+FTx97bSdP7kzR94vwjDNtJmpL/3o+E/7aPJH/f1NXzRF8nH9d97Ye/'
+        'bj6t+wOXh8st7bbKz1V+rvJzlZ+r/Fzl5yo/V/m5ys9Vfq7yc5Wfq/xc5ecqP1f5ucrPVX6u8nOV'
+        'n6v8XOXnKj9X+bnKz1V+rvJzlZ+r/Fzl5yo/V/m5ys9Vfq7yc5Wfq/xc5ecqP1f5ucrPVX6u8nOV'
+        'n6v8XOXnKj9X+bnKz1V+rvJzlZ+r/Fzl5yo/V/m5ys9Vfq7yc5Wfq8RcJeYqMVeJuUrMVWKuEnOV'
+        'mKvEXCXmKjFXiblKzFVirhJzlZir9kE18didN35yyM8kb+v1V+/SKH70slHUNIpaaBS10ChqoVHU'
+        'QqOohUZRC42iFhpFLTSKmkZR0yhqiK0htobYGmJriK0htobYGmJriK0htobYGmJriK0htobYGmJr'
+        'iK0htobYGmJriK0htobYGmJriK0htobYGmJriK0htobYGmJriK0htobYGmJriK0htobYGmJriK0h'
+        'tobYGmJriK0htobYGmJriK0htobYGmJriK0htobYGmJriK0htobYGmJrCKoBtwbcGnBrwK0Btwbc'
+        'GnBrwK0BtwbcGnBrwK0BtwbcGnBrwK2FRlELjaIWGkUtNIpaaBS1sLVroVHUQqOohUZRC42iFhpF'
+        'LTSKWmgUtdAoaqFR1EKjqCWJKiXxSbLwyQdcZOHTD7jIwqcecJGFzzzgIgufDZ/n87jLD01eDzFb'
+        'DzFbD6FZF5p1oVkXmnWhWReadaFZF5p1oVkXmnWhWReadaFZF5p1oVkXmnWhWReadaFZF5p1oVkX'
+        'mnWhWReadaFZF5p1oVkXmnWhWReadaFZF5p1oVkXmnWhWReadaFZF5p1oVkXmnWhWReadaFZF5p1'
+        'oVkXmnWhWReadaFZF5p1oVkXmnWhWReadaFZF5p1oVkXmnWhWReadaFZF5p1oVkXmnWhWReadaFZ'
+        'F5p1oVkXmnWhWReadaFZF5p1oVkXmnWhWReadaFZF5r1EJr1EJr1EJr1EJr1EJr1EJr1EJr1EJr1'
+        'EJr1EJr1EJr18MnG6yE+6yE+6yE+6yE+6yE+60l8vr2zkArnC+l7klvcv/aln4DO/ffk+ejpyzO9'
+        'J52f6dXFoS4OdXGoi0NdDupyUJeDuhzU5aAuB3U5qMtBXQ7qclCXg7oc1OWgLgd1OajLQV0O6nJQ'
+        'l4O6HNTloC4HdTmoy0FdDupyUJeDuhzU5aAuB3U5qMtBXQ7qclCXg7oc1OWgLgd1OajLQV0O6nJQ'
+        'l4O6HNTloC4HdTmoy0FdDupyUJeDuhzU5aAuB3U5qAtAXQDqAlAXgLoA1AWgLgB1AagLQF0A6gJQ'
+        'F4C6ANQFoC4AdQGoy109oWsmnJ78RPIpabN36Tp3Xnadhq7TCBJuBAk3QtdphK7TCF2nEbpOI3Sd'
+        'RtB2g7YbtN3AaQOnDZw2cNqg7QZcG3BtwLUB1wZcG3BtwLUB1wZcG3BtwLUB1wZcG3BtwLUB1wZc'
+        'G3BtwLUB1wZcG3BtwLUB1wZcG3BtwLUB1wZcG3BtwLUB1wZcG3BtwLUB1wZcG3BtwLUB1wZcG3Bt'
+        'wLUB1wZcG3BtwLUB1wZcG3BtwLUB1wZcG3BtwLUBnwZqG6htoLaB2gZqG6htoLaB2gZqG6htoLaB'
+        '2gZqG6htoLaB2kbQdiNouxG03QjabgRtN4K2G0HbjaDtRtB2I2i7EbTdCLJuBFk3gqwbQdaNIOtG'
+        'EqfvSNybNJc/c9lctpLfm7vxDYOXkrTNX6r6vueq3haBbRHYFoFtEdgWgW0R2BaBbRHYFoFtEdgW'
+        'gW0R2BaBbRHYFoFtEdgWgW0R2BaBbRHYFoFtEdgWgW0R2BaBbRH4/9g788A2zjr9N4lzK00PlVIE'
+        'dQkUWlVVMFCM66pFTdw6KIpTK6GU0vVvIiuKXUf22rLacq1ZzprsAruCBbMsYlmW5VwucxljqNCB'
+        'uS9xLQYJH7AYlftYrp9mPq9fyRqNE2skN23NH3zVsfP6PT7P837f950ZjSOBcSQwjgTGkcA4EhhH'
+        'AuNIYBwJjCOBcSQwjgTGkcA4EhhHAuNIYBwJjCOBcSQwjgTGkcA4EhhHAuNIYBwJjCOBcSQwjgTG'
+        'kcA4EhhHAuNIYBwJjCOBcSQwDvvjsD8O++OwPw7747A/DvvjsD8O++OwPw7747A/DvvjsD8O++Ow'
+        'P47kxjWMRjSHXnrHuU99tHXpIb+b1en/xWfHeyd+X+V7J9Yf4Tj9Rt3SA/LP37i2O3XF5zkw4m31'
+        '3b37+7OCZO9HNz1kX6HyDeEid6pNXJnrMfF96hb1pQzrJ5GVeH2JOsE/WlDzaW2Cf+mydPoTxXQ6'
+        'Tjodl+l0XKbTcZlOx2U6HZfpdFym03GZTsdlOh0nnY6TTsfJJeLkEnFyiTi5RJxcIk4uESeXiJNL'
+        'xMkl4uQScXKJOLlEnFwiTi4RJ5eIk0vEySXi5BJxcok4uUScXCJOLhEnl4iTS8TJJeLkEnFyiTi5'
+        'RJxcIk4uESeXiJNLxMkl4uQScXKJOLlEnFwiTi4RJ5eIk0vEySXi5BJxcok4uUScXCJOLhEnl4iT'
+        'S8TJJeLkEnFyiTi5RJxcIk4uESeXiJNLxMkl4uQScXKJOLlEnLk9TkoRJ6WIk1LESSnipBRxUoo4'
+        'KUWclCJOShEnpYiTUsRJKeKkFHFSijgpRZyUIi7T6bhMp+MynY7LdDou0+m4TKfjMp2Oy3Q6LtPp'
+        'uEyn4zKdjst0Oi7T6bhMp+MynY7LdDqu5TovWyYfS/E18Qnkk5DySUj5JKR8ElI+CSmfhJRPQson'
+        'IeWTQD4J5JNAPgnkk0A+CeSTQD4J5JNAPgnkk0A+CeSTQD4J5JNAPgnkk0A+CeSTQD4J5JNAPgnk'
+        'k0A+CeSTQD4J5JNAPgnkk0A+CeSTQD4J5JNAPgnkk0A+CeSTQD4J5JNAPgnkk0A+CeSTQD4J5JNA'
+        'Pgnkk0A+CeSTQD4J5JNAPgnkk0A+CeSTQD4J5JNAPgnkk0A+CeSTQD4J5JNAPgnkk0A+CeSTQD4J'
+        '5JNAPgnkk0A+CeSTQD4J5JNAPgnkk0A+CeSTQD4JKZ+ElE9Cyich5ZOQ8klI+SSkfBJSPgkpn4SU'
+        'T0LKJyHlk5DySUj5JKR8ElI+CU0+L18mn9cUZ58U8klJ+aSkfFJSPikpn5SUT0rKJyXlk5LySSGf'
+        'FPJJIZ8U8kkhnxTySSGfFPJJIZ8U8kkhnxTySSGfFPJJIZ8U8kkhnxTySSGfFPJJIZ8U8kkhnxTy'
+        'SSGfFPJJIZ8U8kkhnxTySSGfFPJJIZ8U8kkhnxTySSGfFPJJIZ8U8kkhnxTySSGfFPJJIZ8U8kkh'
+        'nxTySSGfFPJJIZ8U8kkhnxTySSGfFPJJIZ8U8kkhnxTySSGfFPJJIZ8U8kkhnxTySSGfFPJJIZ8U'
+        '8kkhnxTySSGfFPJJIZ8U8kkhnxTySSGflJRPSsonJeWTkvJJSfmkpHxSUj4pKZ+UlE9Kyicl5ZOS'
+        '8klJ+aSkfFJSPikpn5Qmn1eo8jm1cygQ7urrCQcGlb6ourK1FlTULFa5F6gr7lcue9POVSVv2mlR'
+        'f3zv+p0x63dK1vZbobwDm8x+LdTo+iO/a/bIr3xU91Mvj66/GsH7qtITzaPaieapZZnKRDFTyZCp'
+        'ZGSmkpGZSkZmKhmZqWRkppKRmUpGZioZmalkyFQyZCoZMpUMmUqGTCVDppIhU8mQqWTIVDJkKhky'
+        'lQyZSoZMJUOmkiFTyZCpZMhUMmQqGTKVDJlKhkwlQ6aSIVPJkKlkyFQyZCoZMpUMmUqGTCVDppIh'
+        'U8mQqWTIVDJkKhkylQyZSoZMJUOmkiFTyZCpZMhUMmQqGTKVDJlKhkwlQ6aSIVPJkKlkyFQyZCoZ'
+        'MpUMmUqGTCVDppIhU8mQqWTIVDJkKhkylQyZSoZMJUOmkiFTyZCpZMhUMmQqGTKVDJlKhkwlQ6aS'
+        'IVPJkKlkyFQyZCoZMpUMmUqGTCVDppIhU8nITCUjM5WMzFQyMlPJyEwlIzOVjMxUMjJTychMJSMz'
+        'lYzMVDIyU8nITCUjM5WMzFQyMlPJaJnKP2jy2SSyjrGlc6e5LeoP/3E9/1jPP06TfyzlFa9WTxTW'
+        'ZLP01WVULp0bveLB8c7fdUIfijv4rymex/9InMfPkBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvM'
+        'kBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvM'
+        'kBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvM'
+        'kBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvMkBvMkBTMkBTMkBTMkBTMkBTMkBTM'
+        'kBTMkBTMkBTMkBTMkBTMkBTMkBTMkBTMkBTMkBTMkIvMaHPva9en13XzOrPp1fPStZpd/0mDsvjO'
+        'uaWVVaN6hFJYT+Xkeion11M5uZ7KyfVUTq6ncnI9lZPrqZxcT+VYT+VYT+XwzByemcMzc3hmDs/M'
+        '4Zk5PDOHZ+bwzByemcMzc3hmDs/M4Zk5PDOHZ+bwzByemcMzc3hmDs/M4Zk5PDOHZ+bwzByemcMz'
+        'c3hmDs/M4Zk5PDOHZ+bwzByemcMzc3hmDs/M4Zk5PDOHZ+bwzByemcMzc3hmDs/M4Zk5PDOHZ+bw'
+        'zByemcMzc3hmDs/M4Zk5PDOHZ+bwzByemcMzc3hmDg/LYZ05rDOHdeawzhzWmcM6c1hnDuvMYZ05'
+        'rDOHdeawzhzWmcM6c1hnDuvMyfVUTq6ncnI9lZPrqZxcT+Xkeion11M5uZ7KyfVUTq6ncnI9lZPr'
+        'qZxcT+Xkeion11M5uZ7KaZ7+z8Xnxr5DGjAL0rMgPQvSsyA9C9KzID0L0rMgPQvSsyA9C9KzID0L'
+        '0rMgPQvSsyA9C9KzID0L0rMgPQvSsyA9C9KzID0L0rMgPQvSsyA9C9KzID0L0rMgPQvSsyA9C9Kz'
+        'ID0L0rMgPQvSsyA9C9KzID0L0rMgPQvSsyA9C9KzID0L0rMgPQvSsyA9C9KzID0L0rMgPQvSsyA9'
+        'C9KzID0Ly7OwPAvLs7A8C8uzsDwLy7OwPAvLs7A8C8uzsDwLy7OwPAvLs7A8i4RmNWSixdRxg0gd'
+        '52FmHmbmYWYeZuZhZh5m5mFmHmbmYWYeZuZhZh5m5mFmHmbmYWYeZuZhZh5m5mFmHmbmYWYeZuZh'
+        'Zh5m5mFmHmbmYWYeZuZhZh5m5mFmHmbmYWYeZuZhZh5m5mFmHmbmYWYeZuZhZh5m5mFmHmbmYWYe'
+        'ZuZhZh5m5mFmHmbmYWYeZuZhZh5m5mFmHmbmYWYeZuZhZh5m5mFmHmbmYWYeZuZhZh5m5mFmHmbm'
+        'YWYeZuZhZh5m5mFmHmbmYWYeZuZhZl5j5nUPw9RxaafhJ+pOw3oeeRYugl+/vqA5+0FcWlFcU1DR'
+        'wwHKfylmZN9idl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1k'
+        'dl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1k'
+        'dl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1k'
+        'dl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1kdl1k'
+        'dl1kdl1kdl1kdl1kdl3UZtc3LDtT/PfimWKeM8W8XAPn5Ro4L9fAebkGzss1cF6ugfNyDZyXa+A8'
+        'a+A8a+A8eObBMw+eefDMg2cePPPgmQfPPHjmwTMPnnnwzINnHjzz4JkHzzx45sEzD5558MyDZx48'
+        '8+CZB888eObBMw+eefDMg2cePPPgmQfPPHjmwTMPnnnwzINnHjzz4JkHzzx45sEzD5558MyDZx48'
+        '8+CZB888eObBMw+eefDMg2cePPPgmQfPPHjmwTMPnnnwzINLHkrzUJqH0jyU5qE0D6V5KM1DaR5K'
+        '81Cah9I8lOahNA+leSjNQ2leroHzcg2cl2vgvFwD5+UaOC/XwHm5Bs7LNXBeroHzcg2cl2vgvFwD'
+        '5+UaOC/XwHm5Bs7LNXBek88b19OA9Xz0jKf+pXzko/X9psWx0rez2LW3s7xJPsF8rXYryb+WfIeY'
+        '/OawJ6gvCde+UOyxG9R78t4s33L1DvXf/Jta7D3iYZid2pMbb5G/8Wf1P2Pqb4yKRl6oXnnrsreQ'
+        '/3bpLeSez5OebNyh+b8WdhIshF2EjYRzCbsJ5xHOJ1xAuJBgJVxEeAThYsIjCZcQHkWwER5NeAzh'
+        'UkIj4TLCYwl7CI8jPJ5wOeEJhCcSriBcSbATriI4CFcTnIS9hCcRmghPJjyF8FTCNYSnEZoJTye0'
+        'EK4ltBKuI7gI1xNuIDyD4CbcSNhH2E9oI9xEuJnQTjhAeCbBQzhI8BIOEToIhwm3EDoJPsIRwlEt'
+        'DHv/vYQob15D+W3LMpZwMWPZskPLWNRAxqJ9ulZ+apWfrpOfXPLT9fLTDfLTpqVPhYxFC9sJOwg7'
+        'CRbCLsJGwrmE3YTzCOcTLiBcSLASLiI8gnAx4ZGESwiPItgIjyY8hnApoZFwGeGxhD2ExxEeT7ic'
+        '8ATCEwlXEK4k2AlXERyEqwlOwl7CkwhNhCcTnkJ4KuEawtMIzYSnE1oI1xJaCdcRXITrCTcQnkFw'
+        'E24k7CPsJxwltBFuItxMaCccIDyT4CEcJHgJhwgdhMOEWwidBB/hCMjslvB8SX76svz0Ffnpq/LT'
+        'e5bYJWPRPn1dfvqG/PRN+SkjP31Lfvq2/PQd+em78tP3lj4Ne/+j1MU3N6iKenvpV4L1qlf+s7iQ'
+        '/AFObYF7C9xb4N4C9xa4t8C9Be4tcG+BewvcW+DeAvcWuLfAvQXuLXBvgXsL3Fvg3gL3Fri3wL0F'
+        '7i1wb4F7C9xb4N4C9xa4t8C9Be4tcG+BewvcW+DeAvcWuLfAvQXuLXBvgXsL3Fvg3gL3Fri3wL0F'
+        '7i1wb4F7C9xb4N4C9xa4t8C9Be4tcG+BewvcW+DeAvcWgLcAvAXgLQBvAXgLwFsA3gLwFoC3ALwF'
+        '4C0AbwF4C8BbAN4C8BZ0ZtG4ekfp3H+DCtF/lX251+m/0ktFcki9abvCt3oNe99ZktZ4fqL+hXcV'
+        'jxP2iuMEK5xa4dQKp1Y4tcKpFU6tcGqFUyucWuHUCqdWOLXCqRVOrXBqhVMrnFrh1AqnVji1wqkV'
+        'Tq1waoVTK5xa4dQKp1Y4tcKpFU6tcGqFUyucWuHUCqdWOLXCqRVOrXBqhVMrnFrh1AqnVji1wqkV'
+        'Tq1waoVTK5xa4dQKp1Y4tcKpFU6tcGqFUyucWuHUCqdWOLXCqRVOrXBqhVMrnFrh1AqnVji1wqkV'
+        'Tq1waoVTK5xa4dQKp1Y4tcKpVeP03RozD9S9/NXcx790D796/756H//ZfA//h9TJ7MOqRtU7+KO9'
+        '4+rHam/kd6hCbyvI+oG9o//FvR8p3tEv7u83cWP/e5ZsrPdwwduGvO8tTXH9Wor7vmUp7luKKa6N'
+        'FNcmU1ybTHFtMsW1yRTXJlNcm0xxbTLFtckU10aKayPFtWGhNizUhoXasFAbFmrDQm1YqA0LtWGh'
+        'NizUhoXasFAbFmrDQm1YqA0LtWGhNizUhoXasFAbFmrDQm1YqA0LtWGhNizUhoXasFAbFmrDQm1Y'
+        'qA0LtWGhNizUhoXasFAbFmrDQm1YqA0LtWGhNizUhoXasFAbFmrDQm1YqA0LtWGhNizUhoXasFAb'
+        'FmrDQm1YqA0LtWGhNizUhoXasFAblmbDSW04qQ0nteGkNpzUhpPacFIbTmrDSW04qQ0nteGkNpzU'
+        'hpPacFIbTmqTKa5Nprg2meLaZIprkymuTaa4Npni2mSKa5Mprk2muDaZ4tpkimuTKa5Nprg2meLa'
+        'ZIpr0yz+v0tfMdGpbVS8v5jQ5kgUGqG8EcobobwRyhuhvBHKG6G8EcobobwRyhuhvBHKG6G8Ecob'
+        'obwRyhuhvBHKG6G8EcobobwRyhuhvBHKG6G8EcobobwRyhuhvBHKG6G8EcobobwRyhuhvBHKG6G8'
+        'EcobobwRyhuhvBHKG6G8EcobobwRyhuhvBHKG6G8EcobobwRyhuhvBHKG6G8EcobobwRyhuhvBHK'
+        'G8G7EbwbwbsRvBvBuxG8G8G7EbwbwbsRvBvBuxG8G8G7EbwbwbsRvBtRVaNG0QfWt3YfIu9q99o3'
+        'PmRe1v7B0mzhcZq3fUju7ea1//6wBq5Yz3ufrbZ96R/8TNvXHS8um+4TyyY7bmjHDe24oR03tOOG'
+        'dtzQjhvacUM7bmjHDe24oR03tOOGdtzQjhvacUM7bmjHDe24oR03tOOGdtzQjhvacUM7bmjHDe24'
+        'oR03tOOGdtzQjhvacUM7bmjHDe24oR03tOOGdtzQjhvacUM7bmjHDe24oR03tOOGdtzQjhvacUM7'
+        'bmjHDe24oR03tOOGdtzQjhvacUM7bmjHDe24oR03tOOGdtzQjhvacUM7bmjHDe24oR03tOOGdtzQ'
+        'jhvacUM7bmjHDe24oR03tOOGds0NP1J8Z+PTiu9sdMgU0kEK6SCFdICTA5wc4OQAJwc4OcDJAU4O'
+        'cHKAkwOcHODkACcHODnAyQFODnBygJMDnBzg5AAnBzg5wMkBTg5wcoCTA5wc4OQAJwc4OcDJAU4O'
+        'cHKAkwOcHODkACcHODnAyQFODnBygJMDnBzg5AAnBzg5wMkBTg5wcoCTA5wc4OQAJwc4OcDJAU4O'
+        'cHKAkwOcHODkACcHw+uAKgdUOaDKAVUOqHJAlQOqHFDlgCoHVDmgygFVDqhyQJUDqhxQ5ZAppEOm'
+        'kA6ZQjpkCumQKaT2qUPidr289i356T3ypzfIa1+Tn1zy09flp2/ITy3y0zflp2/LT9+Rn1rlp+vk'
+        'p4z8dK389F356XtLn4a9H122ovtAcUXnZEXnlDVxytKc8q865V91yvY4ZV84ZbudUo5O5OhEjk7k'
+        '6ESOTuToRI5O5OhEjk7k6ESOTuToRI5O5OhEjk7k6ESOTuToRI5O5OhEjk7k6ESOTuToRI5O5OhE'
+        'jk7k6ESOTuToRI5O5OhEjk7k6ESOTuToRI5O5OhEjk7k6ESOTuToRI5O5OhEjk7k6ESOTuToRI5O'
+        '5OhEjk7k6ESOTuToRI5O5OhEjk7k6ESOTuToRI5O5OhEjk7k6ESOTuToRI5O5OhEjk7k6ESOTuTo'
+        'RI5O5OhEjk7k6ESOTuToRI5O5OiUcnRKOTqlHJ1Sjk4pR6cUnFPKzCnF5ZTickpJOaVUnFK2Tikz'
+        'p5SZU8rHKeXj1OTzsWXHyPPyKzw/L9KXJgBvAvAmAG8C8CYAbwLwJgBvAvAmAG8C8CYAbwLwJgBv'
+        'AvAmAG8C8CYAbwLwJgBvAvAmAG8C8CYAbwLwJgBvAvAmAG8C8CYAbwLwJgBvAvAmAG8C8CYAbwLw'
+        'JgBvAvAmAG8C8CYAbwLwJgBvAvAmAG8C8CYAbwLwJgBvAvAmAG8C8CYAbwLwJgBvAvAmAG8C8CYA'
+        'bwLwJshuguwmyG6C7CbIboLsJshuguwmyG6C7CbIboLsJshuguwmyG6C7CYE1aQB9HF5o8Lb1BT5'
+        'Ew/oJnAtXujyINgMrtlLXPIn7l+rbV/2nO8uzM61f6PLRHHZdbnwrWZ8qxnfasa3mvGtZgyrGcNq'
+        'xrCaMaxmDKsZw2rGsJoxrGYMqxnDasawmjGsZgyrGcNqxrCaMaxmDKsZw2rGsJoxrGYMqxnDasaw'
+        'mjGsZgyrGcNqxrCaMaxmDKsZw2rGsJoxrGYMqxnDasawmjGsZgyrGcNqxrCaMaxmDKsZw2rGsJox'
+        'rGYMqxnDasawmjGsZgyrGcNqxrCaMaxmDKsZw2rGsJoxrGYMqxnDasawmjGsZgyrGcNqxrCaMaxm'
+        'DKsZw2rGsJoxrGYMqxnDasawmjGsZs2wPlmEZU7A0gIsLcDSAiwtwNLCJNcCMy0w0wIzLTDTAjMt'
+        'MNMCMy0w0wIzLTDTAjMtMNMCMy0w0wIzLTDTAjMtMNMCMy0w0wIzLTDTAjMtMNMCMy0w0wIzLTDT'
+        'AjMtMNMCMy0w0wIzLTDTAjMtMNMCMy0w0wIzLTDTAjMtMNMCMy0w0wIzLTDTAjMtMNMCMy0w0wIz'
+        'LTDTAjMtMNMCMy0w0wIzLTDTAjMtMNMCMy0w0wIzLTDTAjMtMNMCMy0w0wIzLTDTAjMtMNOiMTNZ'
+        '3OT+Asi0gkwryLSCTCvItIJMK8i0gkwryLSCTCvItIJMK8i0gkwryLSCTCvItIJMK8i0gkwryLSC'
+        'TCvItIJMK8i0gkwryLSCTCvItIJMK8i0gkwryLSCTCvItIJMK8i0gkwryLSCTCvItIJMK8i0gkwr'
+        'yLSCTCvItIJMK8i0gkwryLSCTCvItIJMK8i0gkwryLSCTCvItIJMK8i0gkwryLSCTCvItIJMK8i0'
+        'gkwryLSCTCvItIJMK8i0gkwryLSCTCvItIJMq4bMp5atS3cW3x3sYl3qkutSl1yXuuS61CXXpS65'
+        'LnXJdalLrktdcl3qYl3qYl3qAk8XeLrA0wWeLvB0gacLPF3g6QJPF3i6wNMFni7wdIGnCzxd4OkC'
+        'Txd4usDTBZ4u8HSBpws8XeDpAk8XeLrA0wWeLvB0gacLPF3g6QJPF3i6wNMFni7wdIGnCzxd4OkC'
+        'Txd4usDTBZ4u8HSBpws8XeDpAk8XeLrA0wWeLvB0gacLPF3g6QJPF3i6wNMFni5wcUGpC0pdUOqC'
+        'UheUuqDUBaUuKHVBqQtKXVDqglIXlLqg1AWlLih1yXWpS65LXXJd6pLrUpdcl7rkutQl16UuuS51'
+        'yXWpS65LXXJd6pLrUpdcl7rkutQl16UuuS51afKZklvvk9rW+6eXyWlPUU5u5OSWcnJLObmlnNxS'
+        'Tm4pJ7eUk1vKyS3l5EZObuTkRk5u5ORGTm7k5EZObuTkRk5u5ORGTm7k5EZObuTkRk5u5ORGTm7k'
+        '5EZObuTkRk5u5ORGTm7k5EZObuTkRk5u5ORGTm7k5EZObuTkRk5u5ORGTm7k5EZObuTkRk5u5ORG'
+        'Tm7k5EZObuTkRk5u5ORGTm7k5EZObuTkRk5u5ORGTm7k5EZObuTkRk5u5ORGTm7k5EZObuTkRk5u'
+        '5ORGTm7k5EZObuTkRk5u5ORGTm7k5EZObuTkRk5u5ORGTm7k5EZObiknt5STW8rJLeXklnJyS0m4'
+        'pbDcUlhuKSy3FJZbCsstReSWInJLsbmlnNxSTm5NTp/R5PN+8SUa/6F+icYHxX/cr51c3Vd6p+rf'
+        'qYqLF3Oej5HztKOCdlTQjgraUUE7+LeDfzv4t4N/O/i3g387+LeDfzv4t4N/O/i3g387+LeDfzv4'
+        't4N/O/i3g387+LeDfzv4t4N/O/i3g387+LeDfzv4t4N/O/i3g387+LeDfzv4t4N/O/i3g387+LeD'
+        'fzv4t4N/O/i3g387+LeDfzv4t4N/O/i3g387+LeDfzv4t4N/O/i3g387+LfDfTvct8N9O9y3w307'
+        '3LfDfTvct8N9O9y3w3073LfDfTvct8N9O9y3a1x9VoNko8rRpg1Lj6B8FFw84OIBFw+4eMDFAy4e'
+        'cPGAiwdcPODiARcPuHjAxQMuHnDxgIsHXDzg4gEXD7h4wMUDLh5w8YCLB1w84OIBFw+4eMDFAy4e'
+        'cPGAiwdcPODiARcPuHjAxQMuHnDxgIsHXDzg4gEXD7h4wMUDLh5w8YCLB1w84OIBFw+4eMDFAy4e'
+        'cPGAiwdcPODiARcPuHjAxQMuHnDxgIsHXDzg4gEXD7h4wMUDLh5w8YCLB1w84OIBFw+4eDRcEkVP'
+        '+T6QeIHECyReIPECiZeZ1QsrXljxwooXVryw4oUVL6x4YcULK15Y8cKKF1a8sOKFFS+seGHFCyte'
+        'WPHCihdWvLDihRUvrHhhxQsrXljxwooXVryw4oUVL6x4YcULK15Y8cKKF1a8sOKFFS+seGHFCyte'
+        'WPHCihdWvLDihRUvrHhhxQsrXljxwooXVryw4oUVL6x4YcULK15Y8cKKF1a8sOKFFS+seGHFCyte'
+        'WPHCihdWvLDihRUvrHiZyb0aMkk1EdQM5gotEUwt/bfnl+p/pou7OSGxm+MDKR9I+UDKB1I+kPKB'
+        'lA+kfCDlAykfSPlAygdSPpDygZQPpHwg5QMpH0j5QMoHUj6Q8oGUD6R8IOUDKR9I+UDKB1I+kPKB'
+        'lA+kfCDlAykfSPlAygdSPpDygZQPpHwg5QMpH0j5QMoHUj6Q8oGUD6R8IOUDKR9I+UDKB1I+kPKB'
+        'lA+kfCDlAykfSPlAygdSPpDygZQPpHwg5QMpH0j5QMoHUj6Q8oGUD6R8IOUDKR9I+UDKB1I+kPJp'
+        'SH2u9CnOL2tPbU4/sLekzW4Vj3E+dL/rrdb3p10i0td7N9X+FSTy9raXq+ehZ+PNap/XeP2OOLZ9'
+        '1Cbtxf6FT89Ve2PpS15frmX2Xyi9r22jdhf8F4um+SRhmgqmqWCaCqapYJoKpqlgmgqmqWCaCqap'
+        'YJoKpqlgmgqmqWCaCqapYJoKpqlgmgqmqWCaCqapYJoKpqlgmgqmqWCaCqapYJoKpqlgmgqmqWCa'
+        'CqapYJoKpqlgmgqmqWCaCqapYJoKpqlgmgqmqWCaCqapYJoKpqlgmgqmqWCaCqapYJoKpqlgmgqm'
+        'qWCaCqapYJoKpqlgmgqmqWCaCqapYJoKpqlgmgqmqWCaCqapYJoKpqlgmgqmqWCaCqapYJoKpqlo'
+        'pvkljZntKjMHtbd47uz1M/Z+xt7P2PsZZj/D7Gdg/YyonxH1M6J+Rs3PqPkZID8D5GdI/IyFn0Hw'
+        'Mwh+OtpPZ/rpTD+96KcX/fSin57y01N+ushPb/jpDT/t99N+Pw33s/njRxN+xOBHDH5U4EcFflTg'
+        'B3g/wPsB3g/ifhD3w7YfjP1g7AdjPxj7AdcPuH7A9YOqH1T9MOoHTj84+sHRD45+cPTDoR8O/XDo'
+        'h0M/5PmBzA9kfiDzA5kfrPzw5IcnPzz5IcgPQX6Y8WuUfLnoLOcJZwnQiwGcJUBnBujMAJ0ZoDMD'
+        'dGYArAJgFQCrAD0coIcD9HAA1gKwFqC/A/R3APICdHsAAAMAGADAAGMRYCwCjEWAsQgAZwA4A4xM'
+        'gJEJMDIBiA1AbIBxCjBOAfgNMFwBMA4wagFoDkBzgDEMMIYBxjDAGAYgPcBQBhjKAEMZYCgDqCCA'
+        'CgIMbAAxBBBDADEEGO0Aox1gtAOMdgChBBBKgLEPoJcACARAIAACAUQUQEQBgAgARABJBZBUADwC'
+        'KCuApQQ0WL5ShOUSAUsQWILAEgSWILAEgSUILEFgCQJLEFiCwBIEliCwBIElCCxBYAkCSxBYgsAS'
+        'BJYgsASBJQgsQWAJAksQWILAEgSWILAEgSUILEFgCQJLEFiCwBIEliCwBIElCCxBYAkCSxBYgsAS'
+        'BJYgsASBJQgsQWAJAksQWILAEgSWILAEgSUILEFgCQJLEFiCwBIEliCwBIElCCxBYAkCSxBYgsAS'
+        'BJYgsASBJQgsQWAJAksQWILAEgSWILAENVi+WoDF+7X1J0eqycyX0tn3qdnh+hsra52Mf12j8nPb'
+        '6eR3bRRf0Nf7ee1FVt8outzFwuVCuFwIlwvhciFcLoTLhXC5EC4XwuVCuFwIlwvhciFcLoTLhXC5'
+        'EC4XwuVCuFwIlwvhciFcLoTLhXC5EC4XwuVCuFwIlwvhciFcLoTLhXC5EC4XwuVCuFwIlwvhciFc'
+        'LoTLhXC5EC4XwuVCuFwIlwvhciFcLoTLhXC5EC4XwuVCuFwIlwvhciFcLoTLhXC5EC4XwuVCuFwI'
+        'lwvhciFcLoTLhXC5EC4XwuVCuFwIlwvhciFcLoTLhXC5EC4XwuVCuFwIlwvhciFcLqS53Dc1lJb2'
+        'Jv6iorR0b25mo7qayxTPQQvXrlrac/fmBFph0AqDVhi0wqAVZh0XhrAwhIUhLAxhYQgLQ1gYwsIQ'
+        'FoawMISFISwMYWEIC0NYGMLCEBaGsDCEhSEsDGFhCAtDWBjCwhAWhrAwhIUhLAxhYQgLQ1gYwsIQ'
+        'FoawMISFISwMYWEIC0NYGMLCEBaGsDCEhSEsDGFhCAtDWBjCwhAWhrAwhIUhLAxhYQgLQ1gYwsIQ'
+        'FoawMISFISwMYWEIC0NYGMLCEBaGsDCEhSEsDGFhCAtDWBjCwhAW1gj71rKD9C3Fg/QIB+kReZAe'
+        'kQfpEXmQHpEH6RF5kB6RB+kReZAekQfpEdZSEQ7SI+AZAc8IeEbAMwKeEfCMgGcEPCPgGQHPCHhG'
+        'wDMCnhHwjIBnBDwj4BkBzwh4RsAzAp4R8IyAZwQ8I+AZAc8IeEbAMwKeEfCMgGcEPCPgGQHPCHhG'
+        'wDMCnhHwjIBnBDwj4BkBzwh4RsAzAp4R8IyAZwQ8I+AZAc8IeEbAMwKeEfCMgGcEPCPgGQHPCHhG'
+        'wDMCLhEojUBpBEojUBqB0giURqA0AqURKI1AaQRKI1AagdIIlEagNAKlEXmQHpEH6RF5kB6RB+kR'
+        'eZAekcfnEXl8HpHH5xF5fB6Rx+cReVQekYfwEXmkHpFH6hF5kB6RB+kRTT7flscRf9COI76znpGe'
+        'DXvFSxnueWqGu56RfnedygfNO9S9QxsfJi9R/946leuv9K05iEsyukm1/iqo/J/i+vwqsYgaIUsd'
+        'IUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsd'
+        'IUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsd'
+        'IUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsdIUsd'
+        'IUsdIUsdIT0dIT0dIT0dIT0dIT0dIT0dIT0dIT0dIT0dIT0dIT0dIT0dIT0dIT0dIT0dIT0dISse'
+        '0bLA76vMnNp6Y9uRW9vaDkVV/L6g3lN5qTiUvkg7eZ0pfgveC9VvwXsRP/V8Qv3hD4qvfbit+NqH'
+        'V2rF/7CI5LkCyVGQHAXJUZAcBclRWByFxVFYHIXFUVgchcVRWByFxVFYHIXFUVgchcVRWByFxVFY'
+        'HIXFUVgchcVRWByFxVFYHIXFUVgchcVRWByFxVFYHIXFUVgchcVRWByFxVFYHIXFUVgchcVRWByF'
+        'xVFYHIXFUVgchcVRWByFxVFYHIXFUVgchcVRWByFxVFYHIXFUVgchcVRWByFxVFYHIXFUVgchcVR'
+        'WByFxVFYHIXFUVgchcVRWByFxVFYHIXFUVgchcVRDZaser4fEiaoaIuSXOmbaB3aDS4/Wp97Defe'
+        'pRnkDnUGWZ+I1zAjnJU38z1HhXRu2d7Up4vv8oiyNxWVe1NRuTcVlXtTUbk3FZV7U1G5NxWVe1NR'
+        'uTcVZW8qyt5UFIuNYrFRLDaKxUaZ9aM4bRSnjeK0UZw2itNGcdooThvFaaM4bRSnjeK0UZw2itNG'
+        'cdooThvFaaM4bRSnjeK0UZw2itNGcdooThvFaaM4bRSnjeK0UZw2itNGcdooThvFaaM4bRSnjeK0'
+        'UZw2itNGcdooThvFaaM4bRSnjeK0UZw2itNGcdooThvFaaM4bRSnjeK0UZw2itNGcdooThvF+aIY'
+        'bhTDjWK4UQw3iuFGMdwohhvFcKMYbhTDjWK4UQw3iuFGMdwohhvFcKNybyoq96aicm8qKvemonJv'
+        'Kir3l6Jylyoqd6micpcqKneponKXKip3pKJyRyoqd66icm8qKvemotpMMC+fmUpqnr9QW89/3Q1t'
+        '52j/W194Pez8fun7Ve4rOHJtvH/4Cu+Pi2muVaS5Y3jwGB48hgeP4cFjmO8Y5juG+Y5hvmOY7xjm'
+        'O4b5jmG+Y5jvGOY7hvmOYb5jmO8Y5juG+Y5hvmOY7xjmO4b5jmG+Y5jvGOY7hvmOYb5jmO8Y5juG'
+        '+Y5hvmOY7xjmO4b5jmG+Y5jvGOY7hvmOYb5jmO8Y5juG+Y5hvmOY7xjmO4b5jmG+Y5jvGOY7hvmO'
+        'Yb5jmO8Y5juG+Y5hvmOY7xjmO4b5juG6Y7juGK47huuO4bpjuO4YrjuG647humO47hiuO4brjuG6'
+        'Y7juGK47huuOYfZjmrn95GH8ZaV/Xv+y0rM0gf1fjcpBkbGevxEX+7cdSxXXPr1Ufnqb/NS39KmA'
+        'r3bhnfJHL5KfbpefOuQnn/w0Ij+9Un5S5KdXy09e+adu4sLd8kdPlp/eKD/dID/dKj+9SRbRyIVb'
+        '5I/2y08D8tML5KeQ/HS1/NQrP90oP7XLTx75p3xccMkfNS99Gvb+dNlK4YPFlUKMlUJMrhRicqUQ'
+        'kyuFmFwpxORKISZXCjG5UojJlUKMlUKMlUKMWSrGLBVjlooxS8VYKcSYrGJMVjEmqxiTVYzJKsZk'
+        'FWOyijFZxZisYkxWMSarGJNVjMkqxmQVY7KKMVnFmKxijFGMySrGZBVjsooxWcWYrGJMVjEmqxiT'
+        'VYzJKsZkFWOyijFZxZisYkxWMSarGJNVjMkqxmQVY7KKMVnFmKxiTFYxJqsYk1WMySrGZBVjsoox'
+        'WcWYrGJMVjGkEmOyijFZxZisYkxWMSarGJNVjMkjxpwVA/8Yc1aMOSvGnBVjzooxZ8WYs2LMWTHm'
+        'rBhzVow5K8acFWPOisFqjDkrJlcKMblSiMmVQkyuFGJypRCT64OYXB/E5PogJtcHMbk+iMm1QEyu'
+        'MmJyzRCTa4aYXCnE5Eohpsln0exk+otNhf/7pfp/v9r0IFkG3L+JyXRQ3eUpTqG/Vev/u03rU+iq'
+        'p1BTE+fP1vcjHyLvgPc0P2ReAZ9fh3KtoVxa4jxFPT5bX2NUovL+dSpPT6UE6fXqN+GuT9t1p/Ln'
+        '6y/6Pctf9Ku9cPcPZV/ytoZv/K3Di35/IU84GrUTjl+ezhq/IQ7B36TuoK375JnO3nJWVrvtYeCT'
+        'Y+K+nddtqvz98QWPKvz0sg01O/3w/mqt7JMvjvyF2oglI10yUdVQzXxtpmqeqomusYH23i8WHo8v'
+        'eNtqzdTkF2c+pL4v89frieXZugZfMuCMakgPr8TyN3KOv1V7Wc1v1yldP+s7DZhLcjmqymVNKP1d'
+        '8U2GUxz6TXAoNMGh0ASHQhMcCk1wKDTBodAEh0ITHApNcCg0waHQBIdCExwKTXAoNMGh0ASHQhMc'
+        'Ck1wKDTBodAEh0ITHApNcCg0waHQBIdCExwKTXAoNMGh0ASHQhMcCk1wKDTBodAEh0ITHApNcCg0'
+        'waHQBIdCExwKTXAoNMGh0ASHQhMcCk1wKDTBodAEh0ITHApNcCg0waHQBIdCExwKTXAoNMGh0ASH'
+        'QhMcCk1wKDTBodAEh0ITHApNcCg0waHQBIdCExwKTXAaNMFp0ASnQROcBk1wGjTBadAEp0ETnAZN'
+        'cBo0wWnQBKdBE5wGTXAaNMFp0ASnQROcBk1wCDWhHbr8vojMt0FmEmQmQWYSZCZBZhJkJkFmEmQm'
+        'QWYSZCZBZhJkJkFmEmQmQWYSZCZBZhJkJkFmEmQmQWYSZCZBZhJkJkFmEmQmQWYSZCZBZhJkJkFm'
+        'EmQmQWYSZCZBZhJkJkFmEmQmQWYSZCZBZhJkJkFmEmQmQWYSZCZBZhJkJkFmEmQmQWYSZCZBZhJk'
+        'JkFmEmQmQWYSZCZBZhJkJkFmEmQmQWYSZCZBZhJkJkFmEmQmQWYSZCZBZhJkJkFmEmQmQWYSZCZB'
+        'ZhJkJjVk/lB86dYzxUu3phj7KcZ+irGfYpinGOYpBnaKEZ1iRKcY0SlGbYpRm2KAphigKYZkirGY'
+        'YhCmGIQpOnqKzpyiM6foxSl6cYpenKKnpuipKbpoit6YojemaP8U7Z+i4VMcsU+hiSnEMIUYplDB'
+        'FCqYQgVTAD8F8FMAPwXiUyA+BdtTYDwFxlNgPAXGU4A7BbhTgDsFqlOgOgWjU8A5BY5T4DgFjlPg'
+        'OAWHU3A4BYdTcDgFeVNANgVkU0A2BWRTYDUFT1PwNAVPUxA0BUFTMDMFLFMaLP+nJUr38SpJz9OX'
+        'Hin5jHpBe87ErSI07P2jTLA+piVYf1p2L8UbivdSJLmXIinvpUjKeymS8l6KpLyXIinvpUjKeymS'
+        '8l6KpLyXIslAJ7mXIsl4J/HAJMOeZNiTeGCS0U8y+klGP4kOkuggiQ6SIJEEiSRIJBFHEnEkASQJ'
+        'IEmkkoSTJIpJopgkikkCTxJ4ksCTBJ4kakqipiQoJUEpCUpJJJZEYknASgJWEsEl4SuJ7pJglkR+'
+        'SeSXBLok0CWBLgl0SaSZhL0k7CVhLwl7SWSbRLZJSEyi3iTqTaLeJHgmwTMJnkkwS0JpEoEnEXgS'
+        'ZpPoPAm6SdBNgm4S8ScRfxKQk4CcxAqSWEESrJM4QlLeS5GU91Ik5b0USXkvRVLeS5GU91Ik5b0U'
+        'SXkvRVLeS5GU91Ik5b0USXkvRVLeS5GU91Ik5b0USXkvRVKT3Z+LD3JdU3yQKy1xT4N7GtzT4J4G'
+        '9zS4p8E9De5pcE+Dexrc0+CeBvc0uKfBPQ3uaXBPg3sa3NPgngb3NLinwT0N7mlwT4N7GtzT4J4G'
+        '9zS4p8E9De5pcE+Dexrc0+CeBvc0uKfBPQ3uaXBPg3sa3NPgngb3NLinwT0N7mlwT4N7GtzT4J4G'
+        '9zS4p8E9De5pcE+Dexrc0+CeBvc0uKfBPQ3uaXBPg3sa3NPgngb3NLinwT0N7mlwT4N7GtzT4J4G'
+        '9zS4p8E9De5piXta4p6WuKcl7mmJe1reGpiWjpuWGKelGNLShdNSFmnp1mkpkLQUSFp6flpKJS1l'
+        'kZaySMt5IC3ngbSUVFrOF2kpn7SUT1qTz1+KN4HvFjeBT6ORaTQyjUam0cg04phGHNOIYxpxTCOO'
+        'acQxjTimEcc04phGHNOIYxpxTCOOacQxjTimEcc04phGHNOIYxpxTCOOacQxjTimEcc04phGHNOI'
+        'YxpxTCOOacQxjTimEcc04phGHNOIYxpxTCOOacQxjTimEcc04phGHNOIYxpxTCOOacQxjTimEcc0'
+        '4phGHNOIYxpxTCOOacQxjTimUcU0qphGFdOoYhpVTKOKaVQxjSqmUcU0qphGFdOoYhpVTKOKaVQx'
+        'jSqmEeO0Bstf1dSlU01dPqed/5zTUPJu4w3as48bGtRsprjd82bx012b1Nxno/bTL3Mq5DlecOsv'
+        'ic8fVH+8Sf3xiT3q7z9Sfafyo9VPT1BfsnWN+mmv+smtfoqon56qfvqd9qhvQ8P6JlXNN6nkk/3q'
+        'KdT6Gf3qN6k214xKdRjeqR5/1RfMpRF/pDri61upEsyld0v+SR2ChxqlWxrkaxKOqa9JWFqJXqrt'
+        'eNzam5W5SFbmE1mZd2Rl3pGVGU1WZkNZmflkZUKeJSHPkpBnSTayJBtZko0syUaWhDxLzpEl58iS'
+        'c2TJObLkHFlyjiw5R5acI0vOkSXnyJJzZMk5suQcWXKOLDlHlpwjS86RJefIknNkyTmy5BxZco4s'
+        'OUeWnCNLzpEl58iSc2TJObLkHFlyjiw5R5acI0vOkSXnyJJzZMk5suQcWXKOLDlHlpwjS86RJefI'
+        'knNkyTmy5BxZco4sOUeWnCNLzpEl58iSc2TJObLkHFlyjiw5R5YcIEvqkSX1yJJ6ZEk9sqQeWVKP'
+        'LKlHltQjS+qRJfXIknpkST2ypB5ZUo8sqUeW1CMrE/KsTMizMiHPyoQ8KxPyrEy5szLRzsr0OivT'
+        '66xMqrMyWc7KxD0rE+2sTLSzMoHOygQ6q+VEW0tzoM1aWrStQebU3xQ59RyYz4H5HJjPgfkcmM+B'
+        '+RyYz4H5HJjPgfkcmM+B+RyYz4H5HJjPgfkcmM+B+RyYz4H5HJjPgfkcmM+B+RyYz4H5HJjPgfkc'
+        'mM+B+RyYz4H5HJjPgfkcmM+B+RyYz4H5HJjPgfkcmM+B+RyYz4H5HJjPgfkcmM+B+RyYz4H5HJjP'
+        'gfkcmM+B+RyYz4H5HJjPgfkcmM+B+Rx8z8H3HHzPwfccfM/B9xx8z8H3HHzPwfccfM/B9xx8z8H3'
+        'HHzPwfccsprTMNpeZGZGMLMAMwswswAzCzCzADMLMLMAMwswswAzCzCzADMLMLMAMwswswAzCzCz'
+        'ADMLMLMAMwswswAzCzCzADMLMLMAMwswswAzCzCzADMLMLMAMwswswAzCzCzADMLMLMAMwswswAz'
+        'CzCzADMLMLMAMwswswAzCzCzADMLMLMAMwswswAzCzCzADMLMLMAMwswswAzCzCzADMLMLMAMwsw'
+        'swAzCzCzADMLMLMAMwswswAzCzCzADMLMLMAMwswswAzCzCzADMLGjM7Gh7Ie0DN3Lqk3hvpPaHe'
+        'KvwguAuUW7g+rFr8+i1My29h2ll5te+Jq4tyywO7KF9azJxa/1Kv9UV58b0Xztedo4qp8L/oKctQ'
+        'WBkMdxX+PxwYihbyuKFCXuft2zB0akcg1F1+/aubhoZPxE/tPqwMDvWEgjcN9ofChV+LDp9I3RG9'
+        '4oXREzs8HxzSwocIHyaMEz5C+CjhY4SPEz5BmCB8kjBJ+BRhivBpwmcI9xHihM8SEoQkIUVIEz5H'
+        'mCZ8nvAFwhcJXyJ8mfAVwlcJXyN8nfANwjcJGcK3CN8mfIfwXcL3CP9D+D5hhvADwg8JWUKO8CPC'
+        'LGGOME9YIPyY8BPC/xJ+Slgk/IyQJ9xP+DnhF4RfEn5F+DXhN4TfEn5H+D3hD4T/I/yR8CfCnwl/'
+        'IfxVC95zNhA3iLhRxE0iNoi4WcQtIm4VcZuI20XcIeJOES0i7hLxXBF3i3ieiOeLeIGIF4poFfEi'
+        'ER8h4sUiPlLES0R8lIg2ER8t4mNEvFTERhEvE/GxIu4R8XEiPl7Ey0V8gohPFPEKEa8U0S7iVSI6'
+        'RLxaRKeIe0V8kohNIj5ZxKeI+FQRrxHxaSI2i/h0EVtEvFbEVhGvE9El4vUi3iDiM0R0i3ijiPtE'
+        '3C9im4g3iXiziO0iHhDxmSJ6RDwoolfEQyJ2iHhYxFtE7BTRJ+IREY+K+CwRbxXx2SLeJuJzRLxd'
+        'xOeKeIeIfyNil4j/T0RFxGMi+kXsFjEg4nERgyKeELFHxF4R7xSxT8STIoZE7BdxQMS/FXFQxCER'
+        'wyIOixgR8S4R7xbxHhGfJ+LzRXyBiC8U8UUi/p2IIyK+WMS/F/ElIr5UxJeJ+HIRXyHiK0W8V8RR'
+        'EV8l4ikR/0HEfxTx1SK+RsTXivhPIv6ziFERXyfi60X8FxHfIOIbRRwT8U0i/quIbxbx30R8i4gx'
+        'Ed8q4r+L+DYR/0PEt4v4nyK+Q8T/EvGdIr5LxHeL+B4R3yvi+0T8bxHfL+IHRPygiB8S8cMijov4'
+        'ERE/KuLHRPy4iJ8QcULET4o4KeKnRJwS8dMifkbE+0SMi/hZERMiJkVMiZgW8XMiTov4eRG/IOIX'
+        'RfySiF8W8SsiflXEr4n4dRG/IeI3RcyI+C0Rvy3id0T8rojfE/F/RPy+iDMi/kDEH4qYFTEn4o9E'
+        'nBVxTsR5ERdE/LGIPxHxf0X8qYiLIv5MxLyI94v4cxF/IeIvRfyViL8W8Tci/lbE34n4exH/IOL/'
+        'ifhHEf8k4p9F/IuIfxXxnI1i/hdxo4ibRGwQcbOIW0TcKuI2EbeLuEPEnSJaRNwl4rki7hbxPBHP'
+        'F/ECES8U0SriRSI+QsSLRXykiJeI+CgRbSI+WsTHiHipiI0iXibiY0XcI+LjRHy8iJeL+AQRnyji'
+        'FSJeKaJdxKtEdIh4tYhOEfeK+CQRm0R8sohPEfGpIl4j4tNEbBbx6SK2iHitiK0iXieiS8TrRbxB'
+        'xGeI6BbxRhH3ibhfxDYRbxLxZhHbRTwg4jNF9Ih4UESviIdE7BDxsIi3iNgpok/EIyIeFfFZIt4q'
+        '4rNFvE3E54h4+8ahwKmt/QPhnv6QumS64tTm7sCx4WD03lNbhsKDPf5w4dPuOwOBgS6lr68r3H9n'
+        'oPB7957aER4MBLr8fcrQUPTQqc1+xX8iULi8S/vQFRxUTp5UBqP3ntjUGymswU5t7gvcHRiMnrjv'
+        '1M7woBIaOt4/eLLw34e0FdodLNSUU9sGBnv6B3vC90RPbQkVfkPpi57arpw81hMc1i42KMPh/uip'
+        'zYOBYODuwl+7cGCwf0AJFlZ7XQP9Qz204ZWndmt/rMtfqPAxxX+n2qxTF5xU7jlW+LU+xR840d/X'
+        'HRhUf/PcQHdPuCscGDzZE1L6Ci05MeU558Sn7z1l6R8s/EqgsJYMhNVftPScHOgvLDkHlPCJoegd'
+        '0VM7h/qHB/0B7UKhA7YVSh4O9mhdqC42Gw4qg3dGh081nAyc7Fe71XOO2rcNIeVkIHpq682dbe4j'
+        'bZ2FT4V/X/jzIXo+ovQNF3684fpCG4/3KUHtL20aVO4q/P+e6/dECwXvOMw/8IUHo8O9T2s455xC'
+        'heOndh4RbdgfOB4d9mxQd3CeWfhhoSJtPl+092Dhs3rtkHptw3XR3sMNWr93qv+9ac91atm9Rwr/'
+        'USyz96j6n56NsqhdotZdbbccdR8sK3Pj9a7lhTbsud5lXOomWeoOtYKVi7xOV+R1KxTZIIvcopVW'
+        '3uqNLl1xrhWK2yyL236o40jlCj5WV+JjVyhxS7GCviOdBw7dXFbc7j23/82eO+x7XvDE2//miXfY'
+        'n7i87PP3lv14b0EkXXf1dBf4u6PA18bR7eeI/20IFIjYLkDpbIvqarJV1mTnoaPeGwtDeuS2w21l'
+        '1dkSGj55rKDRZbXYtoerxq3cVuy3I23PPlKp5IZw4O7w8nK37FGvGZe6XZa6ye3zlJW3SRm6c3lx'
+        'm/cULhmXtqNYms99W3lpQ8o95aUVLhmXtlOWtvHATeWI9BwvR6TnuHFRlqJu2w76dP0W6BsKlPeb'
+        'es24wF2ywM23th84WF7i5rtO9PSVFbl1j3bRuMxzi713U0dnee8VnL289wqXjEvbXdJ7h3S9F9L1'
+        'Xsi4qPOKFdvfVj4Sm7oDx8srVrhkXNr5xbG46eihfeVjcXw45C8fC/WacYEXFMdi30G3zpU3M5mW'
+        'jYV20bjMC4ue0tl25GhneQ9uGQyEhwdD5SLmqnGx1mJVbyyYfrngNh8bDCh3lldVu2hc5kWyzG37'
+        'Og4dOXDoaDmN2/z9oXBPaLgMyB17lq4bF/6I4mAd1ndtw4CuZ7fsGVixYy8u7djDhXlP37EDASWs'
+        '71j1qnGxjyzxsUP7dT4W6tb5WKjbuLRLitrRCXFjuQ4b9qwkw0cVK3ZzW3ljNwUD4fKKFS4Zl2Yr'
+        'lnb4qK60gWFdaYVLxqU9ujgW+9sOth3RzVTdgb5AOFA+Flw1LvYxxUoWZvjySob6dZUsXDIu7dKS'
+        'OUXfgUP6DhxaqQMbizwfcnvLG/yI25Wrn+e++jldd4gPT7q6pesO+/K/8Mi9lX9rb7T3edqvXeHZ'
+        'sDxn6H1BpapcVux9koWyyux8bvdVVzzXWfj/K29YXoNde0t+tNo/+9iiXXQdarv14IFD5b2w84pd'
+        'N+y4/bLtd9ivvGr5Hz5v7xXPHbzhuaHbL3tuWP3pav/2nqW/feJTZcan/rmyP7Ztr/ZnVv1HHleS'
+        'o3e4y72goa9f6S63LPWaMTOPLxZ44NCRjvICe0KFtVNZgeo14wIvL478TQcOHtGN/JbjPX1hfYbI'
+        'VeNin1Cak7R1VshJCisvfU5SuGhc5hOLVd3XcfCoVzcP+vv7hk/q5kGuGhd7RdFg3br1hDJUbrDK'
+        'ChPKlcVW39zZcfRweauDg/3DA+Wt1i4al2kvVu/G8jR247F7yqt3bIUk9qoS+zrq1dnX8EmdfQ2f'
+        'NC7NURTv/jbfvs4DN+rm+u7AkH+w55hurl+6blz41UXOfe0dt5ZzPnSi/65yztVrxgU6iwW2t+mV'
+        'eCKgV6J6zbjAvSWZXru784gu0zuhDIZ1mZ560bjMJ5XYhd4LG/p6QrqlgXrNuMCm4ojf6Nal8ccU'
+        'XRpfuGRc2pOL1XMXMsby6imF3LC8euo14wKfUjIoB3xHdIPSM6RbQqrXjAt8akmKeFA33zcM9PXr'
+        'ClSvGRd4TckodxzsKLecDdeW77Jca1zW04pluX236VYbm5Whe8qXG1v3aBeNy2wuIeawboQ3XFFe'
+        'vSuMi3p6sajOCkVdWV7UlcZFtZQ4tbafpHPqAhb6ZI6rxsVeW6yh1+3RyeOkcqdOHuo14wJbS5PO'
+        'm/SKKySdx3WaU5PO4yuq7rqi6o506rYewoO6rYfCJePSXCV7Xs/e13ZYt0oJ3O0PDOhWKVw1LvZ6'
+        'WezWQsvdBw+WV3TrcXWvsa+sstv3iMvGJd9Q5NzrPrKvvZzzk0rYf6Kcc+2icZnPKA79Prd+08Sv'
+        '6DdN1GvGBbqLBd564Eh5HRvu6gmfKC9QvWZc4I3FVlfaR9zgKtfPCruI+0ry4i73oY5DXU8qn/mv'
+        '0m1LXrVCgft1BTaVF3i1rsCrVyiwTVfgk8sLtOsKtK9Q4E26Ap9SXuBeXYF7VyjwZl2BTy1X4t7y'
+        'Ejfv2btSke26Iq8pr+PlujpevkKBB3QFPq28jna7ro72lfrxmaUphH5K7aswpfatOKV6igXuP7BP'
+        'V2C3enpUVqB6zbjAg8VjAbXAAx2H3DqT3KEW0dMfUsq90rKn+BPjP+EtavHI0cP6HdHw8IB+R1S7'
+        'aFzmoZJdnf36XZ1u/a5O9wrZY0fR1N2HD7fptom2KAMDgfKdom17uGpc7OFisQcO+dp0WemWntBQ'
+        'YFA3V3DVuNhbimsQ3ZpzY/mKs2HPSuvNztI9N2/Hs9r0e24n+yMB/Z6betW4WF+R0iMVUoNwhdQg'
+        'vGJqcKQ43B363a1+/e5W/0q7W0dL9pk7O7y6febB/pO6febCNeMCn1UyfbkP6FR5l9KjU6V6zbjA'
+        'W4uSOew+qpthNw8ow0M6yWgXjct8drFM38G2Nt1yeKgvENAth7WLxmXeVixzf9tB3cHO5u5AX/nR'
+        'ztY92kXjMp9TTIV8bfs6Du0v3wbYOhTw94e6h8pTIXHZuOTbS44DtZLLaaeEctq5alzsc0tE5D60'
+        'XwfUlkEl1F2OVEFE2lXjYu8o9sPS13eX9cOxQPiuQCBU3g/isnHJf1OyLjuwz6Nbl/X479StywrX'
+        'jAvsKllhtHd0+PQrjBP9/UP6FYZ21bjY/1c6XgfbdNNdYbz6Av6wfrzUq8bFKiW7GW6d5TUMKRGd'
+        'O6nXjAs8VrK91nngiH57bbAnrN9eUy8al+kvUeuRDv2W3VC4X79lp100LrO7xPf0J5MNx3UHk1vU'
+        'ncUVCgyULFIrbOMMVtjGGVxxG+d4scCOwzrgG/oHymnfske9ZlxgsHQL4qj+lKpvWH9KVbhmXOCJ'
+        'YpLoO3rjkU63jsptQ8PHwoNKOZc79ixdNy68p2StduCQrrqbT/aEhnXnldpF4zJ7ixX2Hj145MBh'
+        '3dJy28nhvnDPQPnacseepevGhd9Zktod8LbpKhzuORnQVVi7aFxmX8k2wIFnHdiv3wboifR067cB'
+        'tKvGxZ4skvDMDt25d0Nvf48OLfWacYGhoj/v6/DeqN+v2OrvP3lMt2GxfY+4bFxyf7FXj/r0d61s'
+        'HlYfqinvVe2icZkDJX5y+KAuR9k8NNDXo9sg1S4al/m3JVpoO+zu1G8tbRsKDCiDus2lghbEdePC'
+        'B3WrsWad/YcHdR1RsH/tqnHBQ8XbZY4Wkv3OCjsY24cLmf2gfhtj5x75A+PywyWjp5avGz21CN3o'
+        'qReNyxwu1vlgx62V69zXf1flOssfGJcfKdZZK7+8zloR5XXWLhqXeVfJUbnuJp1+3U06/SvcGHJ3'
+        '0RIOth26WbdBtKUvEAqWbxFt28NV42LvKUkEDjxHnwj0PE+fCBSuGRf4vNL96aOH9KcQ/cMh/SmE'
+        'etG4zOeXnDEeadMtVgpJhG6xol4zLvAFxUredKBTtymx+XjP4JCuktpF4zJfWLLP4a6wz6FU2OdQ'
+        'VirwRUVz7Wx7VlunDvetg4FIYHBIZ67isnHJf1eSBB08cFiXBPX1DOiSoMI14wJHSijq0K3xG4b6'
+        'B3VtV68ZF/ji4gB1dO7Xi1G7UbZ8gLSLxmX+fem29QHfEZ9+27pnKDyk37ZWrxoX+5KSOfBoZ2eb'
+        'Dvmt/uHBwUA59IU5kMvGJb+0ZAvhgFe/hVDIIXRbCIVrxgW+rGTnTD9RNXTrJqkte7pXnKBeXnoz'
+        'y636m1nu0t/MssKJ6CtKMqmO/fqVdLi/W7+S1i4al/nKknsbn63fligMro5M9ZpxgfcWh/twZ8fN'
+        'ne5yO9o6MNiv3olePtzisnHJo8Wq3nJUX9W/HdZXVb1mXOCrSlR5pEMn88JKSSdz9ZpxgaeKw63f'
+        'kNmk247ZvGfFzZh/KNka9B7uqLA1qN39rtsa1K4aF/uPpbZZ6MjOCrZZ6LfBCrapXTYu+dXFkg8c'
+        '2nfwqC4t39oT8vcNd+tKFpeNS36NLtF7uu4+8ut195Ffb1zga3UFtuiOV3QFXr1Cgf9U1OZtB9oO'
+        'lq9zN9/TE+jrLtemdtG4zH9eJqX9R/e1VZBS97A/UEFK6mXjkqPF5t/cdqitUlYeDIQClbLypevG'
+        'hb+u5NS8wlbnZkW/17l1j7LyZufri2V2ug/oNzsHlR79Zqd20bjMfymx0/ZOnT1vDp8YLDfogp2q'
+        'F43LfEPJmWJnp+72z82BwcF+3bysXTQu842lGaPXW34XxwZH+Tmlw7issZJTDF+l4wZlqNJxA1eN'
+        'i31T6a01bbrtws3+EwH/nfpbawIrbRj+a7GqheTuwE3l092WQhLXc/ye8qpy1bjYN5dkOYd8R3Xu'
+        'tyUQGhoe1G0dcNW42H8r3Tk/sE+/F9fX49fvxakXjct8S3FFt3QGrDtVvlZ3fHntCmeNseIEdUCX'
+        'h23qCenOSHpWyr/eWnJ32hHdvUqFNbbu7rTwCpj/e8ma42CHW7/m6OtX9GsO9aJxmW8rzvA3dnSU'
+        'n/A3HOvv7yuf4dVrxgX+R8kdwB36+70O9evv91KvGRf4dv0Ylx/0b7iqXOBXGZf3n/ryys/5N1xd'
+        'Xt7VxuW9ozRH0t9jZC8vym5c1H+VSsTtK1+gb9hbXtZe47LeqW+m/u6Dvbq7D1Yo8V0lk21b5z79'
+        'MmXD5eX1u9y4tHfr6/dU3e0Wdt3tFiv03ntKHqPR3Se3wVleN6dxSe8tWYj7brmxvKjby4u63bio'
+        '95Vs7lco6o7you4wLuq/S/Zvbux06xx0w/PLC3u+cWHvLzluq1jYC8sLe6FxYR8o3v5w9FBhre3b'
+        'pz9r2dBVXmCXcYEfVB8r3dI/2BPsCRUzsc3a65PUp0l3Fixj6cnR6PCp7YG7B5TQUE9/KHpH8dfP'
+        '7erifUvqWUTXk9Q/9vJthdKVpcW/R021+nqUoeih3qtEXfcW4r2ntmoFdjdFX6nV7NCp3eHAyYE+'
+        '9YFdnp+NHjq1q3AlfE9XT6i7MEUNRa9Uq9U53BfoEM8ka4/Tqheiw54PqUW/ZBt/Aui1lz2dVBf1'
+        'S/XqfcU27Tb84kOOQ4WVSl/hT4ZPFn+rwuMFp3Zw63qXeoT/ysKf3Vbsm0Dvq7apXdt7qhDKmtn7'
+        'j4VrooW9r9Z+/prC/xda0vta9U8V4j+p0fPhVVR/6Vd631D4T9nl1GKDqVqMV1GLU7v8/YXV3rD2'
+        'dq2SXhQV2miqQh/RVWjHsb5+/53L/1TVw9r7JrUehV/4V/UXajKQH11NjeVIvr/WI/mxaqpR16H8'
+        'uK5Gu08q/sH+LvXRlS7tTNdoPHuv3Ky+N650rPQPTKs/vrf8x717jf+leHxq2b87LQL3nkFLP6Fr'
+        '6fm0VHhItxJWjNt6zepqLP9dq+G/63VX230AoQz2DPWHuvoH9FJqKLj4oLxck96b0PXeefSe9sTL'
+        'aTrPW2Xn+aoG7OYHALBP1qeLenPbxI9W00G9c7p/FTidg51JIyd1jTyXRg4NnzxNE297WFDwqXp0'
+        'UO8fqmLgT/VhYErXxAtp4tKjYKdpZ1eVIDwQw/npurW197ztdRmdzxjN6OozdV3as3GGtQ1UOTJ3'
+        'riDRpWeQaz8299Wlpb17thtqTd/OmgxZ3Cg1UZ9n6xJPwho25dVVDpq7Dr7ae5fxj/7WqPPMUfDZ'
+        'OnVe7zXGHBh3Xe/Tjf/VqrqtJmAlHgp988IqkNpoqtuSD81uE32zyVTfpB4KffOSKpBqMNVt6Ydm'
+        't4m+2Wyqbz73UOibe6tAaoupbpt+aHab6Jutpvrm82d734hWbjPVyi/otxNFArzSdqLhBp9Si3Ts'
+        'i1XVaYWtOKUWidCXqqqV8f6NUos048tVVcpoO0Gpxez+laqqtOKSWKnF9PlVM6Trl4NKLaatr5kh'
+        'vZIPKbWYFb6uq1XFY5fyalWqek384BvV1WfbkHJPxdqY84FvVlkbZejOVR6+nEltMtXVZqcyNNQT'
+        'DFWskDn5f6u6Cl2iDAfVw8hAdxdVU/+jYvXMucC3q+wv3p5ZsULmLOA7VYpNe/NmxfqYE/93q6vP'
+        'rqX3dVaskrlM7HvVVWm7+rbPitUxlzL9T5Ujpt2PW7E+203V5/tV1ke7KbZifXaYqs9MlfXRbqit'
+        'WJ+dpurzg+otMjBYuYMspir0wyp5NhyvXaaqk63WErXXB1Ss0LmmKpSrcoYdNsBnt6na/Ki62pyn'
+        'vrCjS3yFQKVanWeqVrNVMqS+3Kdidc43VZ25Kqujvr2nYnUuMFWd+SotSHvnT8X6XGiqPgvVZrCB'
+        'yr1jNVWbH1dJtNLd3RUurPqNELrIVK1+Ul2tLuJVQF2a3Ayr9ghTVfvfKnHS7sCvWJ+LTdXnp1U6'
+        '9l1K3+Bw5ZTokaYqtFhdhc4N3zMQ6DrRY5DpX2KqTj+rspP6lJPHupWKFXqUqQrlq+wk9dUv2i5b'
+        'xTrZTNXp/irrpL5ExbhOjzZVp59XOZeo3/1TsTqPMVWdX1RXnd2qd6+wyr7UVKV+WV2lLEP3DIUD'
+        'J7u0nZryGjWaqtGvdDUyuOe0vE4XaK+07VK/R0O9+btL/c6Omm4f/bramllWqpO5TaTfVFun7dqX'
+        'g1SqkLl9pN9WW6GtPcfrsIv0u2qrs0P7Ips6bBz9vtoa7TreP9gVUPwn6rB59IdqK7WTLy2pw/7R'
+        '/1WtNvW7q04OhOuwgfTHqmnyq68hrsMe0p+q9yRet1yHfaQ/V91LJw17ydxO0l+qd0mlLltJf626'
+        'QurLomu/leQ9Z0O1NTpXfW2dcQpnakvJu0FfLf1pjO7hHr6YrfLzCrV/HsG7sUIldYc0+kpq30VX'
+        'uZLaP1fXNBWep1jhNkqDeyVr0shN1TSy9+KdhrcoXLKz+ECTvGjbWY/7kL0NNR+h6ofBVHrl3VzV'
+        'MDiMh8Fp1OOm8i7vFoN6LoNal0ws+0LJZZValsAXv16yusptraZypd9IWalqELr0/ZTVVWybvmK6'
+        'tFiHqfbFkZVB3K6+7lf7aludkfS+zviWa6PHH0tfAr5fe/S88p89r6tL1JrHfpv0NrZlf9tKJexQ'
+        'v5myS3sesbZevb2KHu49ZCyfw5VczLhre307DX901Piv3Frpr9xWH6/coe+hSqOhw/DCrq7ir2kP'
+        'fXc9ucL0xVeTVm5m/ZCs2IMGENaEs53V9WLvgDEEK1A1ZEzV8Cqpurs+VFkq9EeFFbaOqqVvnj2b'
+        '/G3NYdpVITmvvBmgz2G0b9mtIofRvlD3TFLoh2KHn6vv8IobHbrult/3apAYVnwA7aHYg7v1PbjS'
+        '/qzOB99k3BV8P/Pqke596woPmanvcD45pIf6Hcam+xAarfPqNlq99xnPP581/pHxUFU3Ir2fN54h'
+        'v7jKGfIr9Zkhz9ePgeWMen9dELUXxAXVDkbvvDFNP15D3u835v0Xq+T91/Xh/cKqeW+46aj6JZe1'
+        '7OSfVmr42dvz5vaQrFXDvd3ysIHb3PbXRRUTSP2d35USyCNHOw+t4e71I1ZXVdlzT9SxUIsDbe/F'
+        '+upUOKrWkfnphupePLDCFLizJ3QiMNgTVkL+wMN1HnxkrUejt9lSzQbH9RbDHz3DsjrF77PUZTq7'
+        'pLqeeq9xm6vrxBXM9lpLzSa5tRgPc5Pco86S8XiAO9HcNGarrhM/tA610XiYunfI++izZDwe4E40'
+        'da+T9zHVdeLH16E2Gg9TN3p5Lz1LxuMB7kRTd6Z5Gyus6SreB6frx6mHRSJ7WYXzpwr35Ol6J7E2'
+        '7wd8KHb5Y2ve5b2frEq99xmr97OrVG+qPouHPbXvqge4P8wl74+rtENV6X5VXY98/mHhZo/fUOl9'
+        'H6fn5asruNJaH+qqN4wU68yNQk+JrmUvXl4p8dDd76vrxG8Zd8nWAXXOHVzbuxFGt60tfE+o0G36'
+        'u5J13fb9VbN3Fs6ha93XT6x1X/detGt1N6zZdhn+6DG7DCeLSv3Ue9muukyeV+j7yPCZuQq3ircd'
+        'qers9EdninNNOLiywib9GbXvLGqDXd+GM3hZz+pa9JM1bdFVNWlR7wFjHd1vLMyDJUKuiY4cdW/N'
+        'b1bVGnMp5NV1b80fV9Uacxuxzrq3ZsOW1bTG3Dbm3rq3ZuuqWmNuP/FJdW/NrlW1xtxuXFOFpUWF'
+        'V4SVnwZ/QbflVotHrr1PrvhYWqUXhJVX6Gv1qdBTKiRk+teDlVfm2/WpzFMrVEb/5hIdaRduqS6v'
+        'XiFdsGh/tq+nsPhR+mo7yV5TXSNXOMgzbn/v641FaNz63jfWeip+WnVt/tAD22ZzE3ZzhTbr3+qk'
+        'a/MldYBZ+7N1gfnp1TWy0Xj0xqsavY/VmtiW6hq2gkovWYM2myP22ura/KEHts3mEtHWCulBhZed'
+        '6Rp9ee1luou/WxedXldlM1fg2bgHer9f1dj+sNYadlXZ6A89sI02J+LrK71hIHA6DW/bXHOcd6p/'
+        'tS4w31BVE1dAedsKX/NW1aj+tdYoP6OqJn/ogW2yOZDd+iYbv2hR1/Srtqx2d961Zc2/Ac97Y53a'
+        '2Gs7t8J+tfE3w/Zeem5dtrL3mWpf0yrbZzyCxu0zx+j+NW1fNeNnLjtqM9W+3zbUf/zMbdzdtKbt'
+        'q2b8zG3l3Wyqfc1roD9zm3vta9q+asbP3F1wB/TtO81rfXWN3LfqifDoAzARPtN8Q/9krMZApdE0'
+        'bmbvifrMhh7zjTxgXOmOLfVvv7nZ8mClw3/dq/t1bb59yyq/ALf4GpEt9fhWVK+31u3ofcm5hin3'
+        'PVvq8e2l3kPVtUGpqg2G42COp461bIPhOJjLsA5X14ZgbcfBXBZ1y1q2wXAczGVKndW14WRtx8Fc'
+        'NuRbyzYYjoO5jOdIpad3K3yfiq4Vf2fcihcZZwZHa7pNUPs7co6eLd3Rm6yUQ8waF/W5c2u8Bfas'
+        'OnTFy1bZ3hVWOBXaa252u/UsaO/qxtfcTPjsatv7KuNGrY0KVkeFubn2tgdtL62OJXOz+XOq7aWf'
+        'NzyoWDKXL9z+oO2l1bFkLiN5brW99NoHly+Zem+/944HbS+tjiVT3yTg/Ztqe+lfHlwsmfp2A2/X'
+        'g7aXVseSqa9c8P4/fS8ZfSOWrqPebNyulzbUbkXU+98rbN3V79X+ylr3TO8tu1d3XGDcL71Hd9dl'
+        '7/nY2dEn72uoaZ+YW2H5TfTJ27asruFVicS44eaWWt1r2PAaq8Dc6imwhg2vMermFkTH6yP/tUDd'
+        '3BonuIYNrzHq5pYtJ9aw4TVG3dxKpMdEw9/5wKJubnHRu4YNrzHq5tYLd65hw2uMurklQF+Fhht8'
+        'Aa2u4eM1zNqrfcNBTbL9kyY64cqqMP7SbsNTMeMO6P1qfRL7kInm/7yqle/a9Yy59L6/Qs8YfLef'
+        'rmcm1koCD8WXfAzUpeNX4i5fFXe/2F3N27d+vdvwR7/dvboXiPyhPpbwtyb6f3y9/00bz6CJ/q9u'
+        'Rnqo9b+57Y2hym8TO1H27e7lX4i4Tfsdpbu7pt+y7g1XV5td2u8MDR8LDyr+cE2/ZN07bKZKJ4f7'
+        'wj0DfffU9GvWvZHqqrRT+53unkhPd6CmX7TuvavCE1c6QGrw2NFsw1reT3R3jVvV+8zzKuh6hdd1'
+        'ec+r8W1B91TVots2r65FKxzsVGiROSk8b01atLoxMqel51fVos9sqecYmdtIfsGatGh1Y2Ruh/iF'
+        'Fd5MU3kK0jUrVdNHTGpvei+qvmlfNB6xvz9vdQ9VvKzWzvd3Rs3SzdC6Zn191SPmW9MX0Y1U37Tv'
+        'rPBimEoj5lvhlTC1HrEXV7ixoVICo2vUDwwb9brfv+Ec7X9nx8D9fYUXHQ+FB3tCwdMlcuK3evt7'
+        'QrXNv19SbZWWfmtooK+nxgn4S83WaXhgIDBY2wz8ZWbr1Nd/l75O5hKHl1cQTCVQdIKZW7XBfX9N'
+        'dfKK2jes96uV7O0Xxr//jVrb2yvXqlErePY3ap2N31tto366ykZ9f1WNMqer0bVq1OrwM5eTv2qt'
+        'GrU6/Myl5aeMXXn5vKRr1e/O8hzvH6pu2Z+Nx2v7+asbL8v5NfbAfzRu1fI5W/9dpFvN35NZk4F5'
+        'dT2asMn4R5fWegxeU48GVKiluYnltVXXcnc1pFRqgLlJ5J/q0YDVcWJuwvjnejSgQi3NzQBR41ou'
+        'z7h1tbzobHGU19WjCSuQ4q21o7y+Hg3w1tpR/qXqWtqqchRvrR3lDfVowOo4Mecob6xHA7y1dpSx'
+        'Cmdt2rtnTrNFwzuxA6Fg+ERtt2jeVF2F+J3jPYNDNd6e+dfq6sMrrfsUfXXM6frN1VWHd5gPBiKB'
+        'waEaH47+m5kOGuof1HWQOdm9pcLKrxKsOtU90Vh1j926ljNkrA4t+C9j535LrSfIt9ah/u9bVf3N'
+        'Sezf61D/t9R6enxbtZW8uhrMK9XfnEz/ow71Xx3k5ubNt9eh/quD3NyzMP9Zh/pXqKS551beUW0l'
+        'n1IryM09fvJfdaj/6iA39xTJO+tQ/9VBbu5hkHfVof4VKmnuwY13G+VPy5NZXR1vMK5jSzXdX49U'
+        '5j1r2rYVpP2XWic5713Tlv2l1jnO+2pf/b/UOsX5b6MvClq2qtJVse1BoIv3r2XTVpDFZRfUWBYf'
+        'WMuGVai9OVV8sOa1r1BFc6L4UIVdpYpre10tPWu6iP1w1fW8xbg3n1FrXMcNv4usdF9CV8Vb17Qr'
+        'P1JdJe8w7seOWvfjRytMJ9oDLivvAZ2v/U7g7kJjhsp+tSZ7iR8zU63uQF8gHKhcLXO99XF9tVbo'
+        'Cd3A+rdW87RuHcD8hLl2rPAMk3+VAjM3HhNG7aiIwGpeNr+24/FJc+3Yt6Vm7TA3HpMVZNutnL4B'
+        'PcbC6N9al7e/f6r2NR3eWpd3vE+tqqayNs/favDlruYSrU9XV5sXG9XGXE71mUondfcMhQMnTzeO'
+        'rzAex3+oD3H3VV3Xf66iruaYi1dd1zdWUVdzRH62wkM8w0One0L3LVure8D/gXg3RqLGLeyduqAu'
+        'T6wnq6rn21dTzzN5IPq+C+ryPHiq/q2ryTozXVU9V3hivcajYO706XP1b11NTpmmq6rnu9dMC+bO'
+        'oD5f/9bV5BjqC1XV8wNrNgrmDqm+WP/W1eQw6ksVvt9N+6qsnpMD/YOn+2KTo1V+R/PbH0Qz/Jfr'
+        '1EO9519oyOsKM5P1wrrkB195AFq5gvNbL6xGyxdfWJfs4qtne9/UJDf52gPQyndvXSsCzGU2Xz/b'
+        '+6YmedE3Kh3sKyePdSsrN3Blz/7omm7rf7MubZhc053TTIV9nHt6An3dp+EsvqY9/a0qa/k5Y667'
+        'L6zxCcq3q6zjl1dVR3Ozy3eqrGPSeIN8hfe0fK1hNS0zN6N8t0LLlDP4urxvrinH36tQy0Gl57S5'
+        '+vfWtJb/U2Uts8Ykv6rWavt+zXuyd2FV1TcnxJnad/Hqqm9ObT+oMPMpQ0OB06Ynv9q62seYf7am'
+        '6P+w9g3rfVet2c9WW8k/nFklz6Dve99ba0Xk6tyomnD/o2or+de69ry5BcdsnRtVk/XCXLWV3Lyt'
+        'nj1vbvt0vs6Nqsne6UKFqWqor8d/uqlq57bq9t3O9i/x/XGFQbtL6RscHjKz6jt/21q24ScV3mkc'
+        'vmcg0HWiJxQ204wV3nu+W/sDSijUH1bCPf0h/Tj+aE3fWPK/1fdB7yZrNe9a3mKtcSLwU30TDHu5'
+        '/Ba5SsNYk1v2FquvVO/F2wxuDzHXTz8zUaXHbKvL/TN5E1V63La63ERzv4kqXWlUJXOpyc9NVOnC'
+        'LQZVMpeI/MJElS4xqpK5NOKXJqp0uVGVzCUNvzJRpW2bDapk7pT01yaqtNcIb3MHor+pcF+4X+nr'
+        'MzMDv3WFSVQZDA7pp913bK7LfW6/rapxvUeNp1bjphm3wdzE8bvqBug8JRwe7Dk2HC7A5fcHhip0'
+        '+gpteba1wrLEsIHmpqHfVzdIJypVsZrhMTdj/aFS7ftD3T0rZj47+vqDPYVGdvUPnvnDCq88g+r8'
+        'X6VH8vR/S/8mFvE7Sqi7thX646oqdMWKvyR/uLGj08B7KrdkmRBPbe0f7NJy+Sqb9KdKZ24V/qph'
+        'Jxe8vrad/OfV1eiKlX9L/nST+9D+0/ZzaWOW9/O2QqGmOvovKzSr9M/q1OXvPzmgDPYM9Ydq289/'
+        'rbJCDUq4/+SZP/5zJlU5Z+OqqlIc8k2HOoy+16tixy3z+FPbCmWbGtMN9aj38v5d5uvma7xRX+NK'
+        '/aRPkZZVqvja+eK/7eof0P+8YlvMpUGb9C1Y/ldqsjA/k75sWG1Nthw66r2xrbNyXcwpaPOq61Lx'
+        'e/pOuxQ/k7psOcO6XHFGOXblLcrTJECndhSoDIRMSWXrart01/HhkF/NlLrUjO/M3+F1JpXZttrK'
+        'GKfMp121n0l9tq+2Ppah4WND/sGegWWp5GmX62dSlx2rrgtPsPeEA4OKbpy2mqrLztXWpdLXeJ12'
+        'eX4mNbGsfoQqfZ3BadflZ1KXXavulQqvy1NO9/6bM6nJuauuSYWno5XTveTmTGqye9U1qfA4oKiJ'
+        'xVRNztPXxGBeL6/S1ps729xHjGY0c/P8+VXXquFgm8+32kn2TKp0QdVV2iU6qqvtlqPug6uddM+k'
+        'bhdWXbcdanetVDFzewrWqiu2RauTwUia2we/qOpKbS9k7it1lrnN8EdUMIVlCVB5dTYNDZ+s7bLw'
+        '4tVWwdLd4zecTc1ltY/U12VZg3V+NDDY3z3sr/GGxCVnVosrKv9UpqzXGJ9I6+q9fO9hk/q1eVVW'
+        '/lG1qXzr6isvFtmF8o5VW3mbvvK6v3ZG2xPmAHj0mVfjCuPfkH3pXuHWhErr5SUKTg73VduRj6lt'
+        'C25eZQuWUPj/zVzJctNAEC3WUkHgQCH5xhI2s5ktG2ENkEAgMRADxnBQGUcUHq84cnziwgWHyoFD'
+        'LnwIn0CVP4HKlQNVlP+AAwTsyEu3FPWoR+Eqxcp7r3tmunt6Zj67KMvgAC+DWSKD9frL63ypVAlA'
+        '4yAvjQSRxvZ1VypJTyiHeBmkiAx2tBmUSzVZBoeRxR9P3X2Wwf6fPcJBaWriq860BRUsxj6CpUXd'
+        'EkKboBWi5T2m+fd35oKdrphDvDXIoz5BOmJ96xKXJRU5RpfJa5P7O7UA1yvv8Apr6/JxKjnxQ3fd'
+        '5HanJn7qzO3MJ5icVzR15p7kKBnZwD/zLqYr+AS2qjM3JJ+kjqltBhhTwdp+TnFZz+OIBa4qS1/x'
+        'aW4Te9DYm6t5EQnWWHSG6AmuaFh6is5CNLhuYFKa0MK/8CAG0bqpA/CmNgHvOYjXfeeCtqaZm0Dn'
+        'POIs6MYHjYqlUffHcpqS+PLCVpc7bPvLP8C56BRWsYBUEa+LCniJOYNCIFg8eEkFAVeswcK7IQQr'
+        'WkMEWN96OFE5nUXCVN00uz/dCldHoLPV1PjVsAKqIof5VU2NX42oIFDj8Kul+tKHFYB3FIkdejwD'
+        'TLx4I4SfAzgKztCMkeFLnh4SdYP57MxlpPRgV8t5a2NXobd/oGuDx0lDReWWcRWcxWeDiVwwg15R'
+        'Qo6l7xof+1eRbrwFK+CyQvA/RWvINX5a4kuIS8h1BH+2+MaqZO10MWPJTW3L+02z6yOtdX2UdzK+'
+        'QQPeudzF6C9GsZT8bkI4O8trOV1BNkFqwCUgmGATvhF2rotRo9UtbJNiLa+0Kh4HOHuGOksPy206'
+        'DPFOzZHNOxKKtKf7/j9j6VeZlMDTymhc4ASr3E65LnYuoHxFL4CR88YwzZ7PtyawsdA2iu6q4Ct+'
+        'G5STVsEc+p5bxrshAUujG0xsiYRXjZhWQE3si4RXjbgPCIiPWuffg56qNee3rYJVtHmn3we+YETR'
+        'l87DwQhzojQDUSV3u4uz61W+lMn1nh9kUWfWF44o+tJ5GONWJw5RFT3U0cz4ZHJmOt4OcuqsLagP'
+        'fWGJoi+dh+MRJUPsEcT2a8BjiGXS/XehsUj02BeMKPrSeTjF7URzEFV3xgZQhXsnWoKIjlrsSHDL'
+        '+QQCbsrKydKFwGKGp0RWTaIZ0hGZnoR5buM9gzQLhqTxekqRLEZIEtEViLUxm1vO5xBww+AbCyyi'
+        'pogYG0RR30eUXGP/AsLujrop0oI4nkXXl0SAaM7goesnZmetVmN/APhRIyM='
+    ),
+    '5125005aba84909900cdba73c696999ff4411dbe2f3dd5d9b0c34cee299b9178': (
+        'eNrs3Qt8mvd97/HElyeJQ8j9RpwLIYTcE0IIuROMZVuRELZkE0IpQjEimGJMdWlISyjrJWqH17Wr'
+        'uzFN3aVTN0pVbd26rR29afdua9dt6rpupi2lVUsAt/S2Zzvb0fn/n8/fsrtzzk7Pea07beO8Xg/f'
+        'R0jG0vO8f7/fn0eYlLa+47LLzjL+e/7YLUe3JCZmJo7JPS03MTU9OWXsb8tM5ienxg8eySaNj8+b'
+        'mZw6fCg7kZk+9vJjtzx/7OjZjx8bOmv6+WOpbUNnE5uIzcQWYiuhEecQ5xLnEduI8wkTcQFhJi4k'
+        'LiIuJi4hLiUuIy4nriCuJK4iriYsxDXEduJa4jrieuIGwkrcSNiImwg7cTPhIG4hbiVuI24n7iDu'
+        'JO4i7ibuIZzEvYSLuI9wE/cTHuIB4kHiIeJh4hHiUeIxwks8TviIHYSf2EkMELuI3cQeYpB4ghgi'
+        'hokAMUIEib3EPmKUGCP2EweIEPEkESaeIiLEy4go8XIiRowTcWKCeJo4SCSISSJJPEOkiENEmngF'
+        'kSEOE1niCJEjXklMEdPEDDFLvIp4lsgTzxGvJl5DFIjniSLxWqJE/ATxOuL1xBuINxIvEHPEm4g3'
+        'Ez9JlImjxE8RbyF+mngr8TbiZ4i3E8eIdxA/S/wcUSF+npgnfoFYIN5J/CLxS8QvE79CvIv4VWKR'
+        'eDfxa8SvE1XiPUSNeC+xRLyPWCZ+g/hN4v3EbxG/TXxgevKoduiZ7JGpSdEBj24bHx/cPRIcHRi/'
+        '59jE0QueGZ+afGYyP57MTDwzLRrj0fNmpyfHn35uZnL62JtPNtOZ53KT4k+KnjozmZ+ZncgcO3ru'
+        'uHHv+Pixo+cNyy/yy4Y7e/R8WvGp/rt1ajYzqXqv+G5+h2/qd4nfIz5IfIj4faJOfJj4CPFR4mPE'
+        'x4kV4g+IPyT+iPhj4k+IPyX+jPgE8efEXxB/SXyS+BTxV8Snib8m/ob4W2KV+Azxd8Rnib8nPkf8'
+        'A/GPxHGiQXye+ALxRaJJfIloEV8mvkKsEV8lvka0iReJDtElesQJ4uvEN4g+8U3iW8S3ie8Q3yX+'
+        'idCJfyb+hfhvxL8S/0b8d2LdiMBZDODA2So3qdyscovKrSo1leeoPFfleSq3qTxfpUnlBSrNKi9U'
+        'eZHKi1VeovJSlZepvFzlFSqvVHmVyqtVWlReo3K7ymtVXqfyepU3qLSqvFGlTeVNKu0qb1bpUHmL'
+        'yltV3qbydpV3qLxT5V0q71Z5j0qnyntVulTep9Kt8n6VHpUPqHxQ5UMqH1b5iMpHVT6m0qvycZU+'
+        'lTtU+lXuVDmgcpfK3Sr3qBxU+YRKtbALDKsMqBxRGVS5V+U+laMqx1TuV3lAZUjlkyrDKp9SGVH5'
+        'MpVRlS9XGVM5rjKuckLl0yoPqkyonFSZVPmMypTKQyrTKl+hMqPysMqsyiMqcypfqXJK5bTKGZWz'
+        'Kl+l8lmVeZXPqXy1yteoLKh8XmVR5WtVllT+hMrXqXy9yjeofKPKF1TOqXyTyjer/EmVZZVHVf6U'
+        'yreo/GmVb1X5NpU/o/LtKo+pfIfKn1X5cyorKn9e5bzKX1C5oPKdKn9R5S+p/GWVv6LyXSp/VeWi'
+        'yner/DWVv66yqvI9Kmsq36tySeX7VC6r/A2Vv6ny/Sp/S+Vvq/yAyt9R+bsqf0/lB1V+SOXvq6yr'
+        '/LDKj6j8qMqPqfy4yhWVf6DyD1X+kco/VvknKv9U5Z+p/ITKP1f5Fyr/UuUnVX5K5V+p/LTKv1b5'
+        'Nyr/VuWqys+o/DuVn1X59yo/p/IfVP6jyuMqGyo/r/ILKr+osqnySypbKr+s8isq11R+VeXXVLZV'
+        'vqiyo7KrsqfyhMqvq/yGyr7Kb6r8lspvq/yOyu+q/CeVusp/VvkvKv+byn9V+W8q/7vKdZVnbVLz'
+        'X+UmlZtVblG5VaWm8hyV56o8T+U2leerNKm8QKVZ5YUqL1J5scpLVF6q8jKVl6u8QuWVKq9SebVK'
+        'i8prVG5Xea3K61Rer/IGlVaVN6q0qbxJpV3lzSodKm9ReavK21TervIOlXeqvEvl3SrvUelUea9K'
+        'l8r7VLpV3q/So/IBlQ+qfEjlwyofUfmoysdUelU+rtKncodKv8qdKgdU7lK5W+UelYMqn1CprugE'
+        'hlUGVI6oDKrcq3KfylGVYyr3qzygMqTySZVhlU+pjKh8mcqoyperjKkcVxlXOaHyaZUHVSZUTqpM'
+        'qnxGZUrlIZVpla9QmVF5WGVW5RGVOZWvVDmlclrljMpZla9S+azKvMrnVL5a5WtUFlQ+r7Ko8rUq'
+        'S5vEc9Ot0zMTUzPiCWK6sumssyY2nkHypHNLZiIzdSz1J0e37TXu5mlmarN8anlBbuLgKyYT4+IB'
+        '5NPVHd1/3XpWaes7tpx19slrhEPGhcKtA/sO+IaPib8pdSg5c2xfoLbpBfHRU4MDwzuPHdWmJhOz'
+        'ByfF3Rdu2ifu3+zbufNY6pyjmm/v3oERdkd9IzuDAbl77s6BMf/o4I4B+cHW3aPBA3uNu8dHBp4c'
+        'Hhwx7t6yNzi239gJikcwHmBgZOzAKH/mydHB/erLhoN82b4Dg8bOubsHRgZGfXx669jwwIDx4Ofs'
+        'HQ3uPOBX9+4P8kDazoFd6i/UBgN7g6P7efg9g8N85ahvcIxP+8bGBvj0luFB9a2N+ULGJzfvHtjP'
+        'zzgQCHLXluGgz/i5t+71HeAhtvqHxYMYewHffv8evn91l/ijewd8POyTPn6UbTsH/fsHgyO+0aeM'
+        'n8wfHNk/OHKA78c/OqB+yC37fUPqL9gz4B9SP9fOgRHjQTaLH9H4ql0HRvzGHbuCo0aO+YyH3bpz'
+        'YJg9bWxgeMDPIdghHn6IL+Nn27r/wF4Oyha/Tx2TwZGTx0QbCPsH9vIX+saGODp7gk/yJ/eMsrdl'
+        '7yDf3zniqPuGh59S3+vwgDpdvpM/uhYaGB3cZXx+izwKxo74ljikvrGn+FnOGRzxDx/YyUnYe4Av'
+        'G/EF+D6fHNxvHORNgxyBgfDgydO0/8AoqPx7gkF+mi0BdRg37+d4CzyDgDlnVOgfhMxmdTa3CER7'
+        'ObCjsN48dsBIbdfg8P4B4xhvuQn9s0NniyJKbU1p+8RAFhWSOjcVTp0ntm1iO19sJrFdIDaz2C4U'
+        '20Viu1hsl4jtUrFdJrbLxXaF2K4U21Viu1psFrFdI7btYrtWbNeJ7Xqx3SA2q9huFJtNbDeJzS62'
+        'm8XmENstYrtVbLeJ7Xax3SG2O8V2l9juFts9YnOK7V6xucR2n9jcYrtfbB6xPSC2B8X2kNgeFtsj'
+        'YntUbI+JzSu2x8XmE9sOsfnFtlNsA2LbJbbdYtsjtkGxPSG2IbENiy0gthGxBcW2V2z7xDYqtjGx'
+        '7RfbAbGFUuHZoU1G50rOZg/OHDqSHT84kckcS23eF/gV2ZO2iCrbb3xYER+Kb0bsFeQnzsscmp4Z'
+        'z0xMzxiffVbed+7YwF4f3ULctfNs8Qd2y72XGY80MXPksPGJd8sPteEdoz6/8ZVDvymb3PQsn/2I'
+        '/KzJePSpyVdNihZr3L1gPMbe4QNjxof3GA3THzwwwnf3b2cbDMRe52z5hWODEb6Lz8oPtw4Hn5SG'
+        'xMe/Lz/elhD9efzwxMGpI8ady/LOc/zBwA6jf4l7viAfb7/xFxuPNzy2b4fxiVcbjxcc3akeL8un'
+        'xc9tfHhQfqiNHAjsUJ+PGp9/Ijg4Ynw4dfbGsZs+MsWx+4Zx3wHR3EdpBuK+3ca3eXhiJnXat+ky'
+        'Hnx4YGS3LEVxx17j+85NHRHzgsf6lDwu5xt/LnHoVYcSHLw7jG/a+BuMj78lf7ob5N5D8jOm6Zmp'
+        'Q9lnTvubbjz97syRZyenjLs/YXxXxnd/6mu3G9++cYQ3vn0HB/TA6OgAJ2ioL7910TPG9nMCrza+'
+        'pYDowHx8tnFC9w8GBvj4M/LzFycPZSbHJ/PiL5w+9TcOfWpDSObQzOTUhOF16PPyAXYNjuJ16LdO'
+        '+wlmczl+gqE3S6aBA8P7B/fKhinuea38xnYOhgZ3gvGYwccYXuKjd8qPJvM5fv7EptMedDon/nbj'
+        'i94iv2jX8OBe46Oa+OgC4wxMzz49MzWhzszb+AGDO338vb9h/CFjNIrP/qz87EUTM+Khn54VNicO'
+        'HpycnjY+9fObNh7w8Gxm5lAu85xx/zspuQM79otCogretWnjoCUmM5Pfa9yQwVGbzD4zkzLuXdy0'
+        'cUaTh6ZUMX9A3inatBgb6nx+yCjZsf2jgyO7kWAcicShg99zDgKmLfJ7Mr7XiUTCuOvDxt+rjln6'
+        'yKGsce9fyXs3j8hJJj76W47r7NPTB6cO5WQbMu7+e+ObM36cUz/H54zjOLZ3eJCfuSE+nh3avDER'
+        'PnQ2E+G4mAjHxUQ4LibCcTERjouJcFxMhONiIhwXE+G4mAjHxUQ4niqK7VKxXSa2y8V2Req4WOEI'
+        'zYbd42JCHBcT4riYEMfFhDguJsRxMSGOiwlxXEyI42JCHJcDTHaA46KqjotRcVyMiuNiVBwXo+K4'
+        'GBXHxag4LkbFcTEqjotRcVyMiuNiVBw/et74uG8kODLuvE/+6TvEdqfY7hLb3WK7R2xOsd0rNpfY'
+        '7hObW2z3i80jtgfE9qDYHhLbw2J7RGyPiu0xsXnF9rjYfKf/LU75t+wQm19sO8U2ILaQ2HaJbbfY'
+        '9ohtUGxPiG1IbMPiT4vZ7RsTHee0x3HJxwmIbURsQbHtFdu+07/iXvkVo2IbE9t+sR2QjyR6bMAn'
+        'H0kzlsBjcnfTjqdkbBkc2R88xhcNB0eMz3DHllGjvR4XqyG5ABB/yUhw/zhraOPTRnM+fnTb8MDY'
+        '2Kn7Nw0aD7JF3it3LthtrPJGT33F1gNjBmjxtUHjLzhHfYlxl8/4U9qoGlTHZ4e2bCgbVMp0oUwX'
+        'ynShTBfKdCFMF8J0IUwXwnQhTBe6dKFLF7p0oUsXonQhSheidCFKF6J0IUoXonQhSheidAFJF5B0'
+        'AUkXkHQBSReQdAFJF5B0AUkXkHQBSReQdEFHF3R0QUcXdHRBRxd0dEFHF3R0QUcXdHRBRxd0dEFH'
+        'F3R0QUcXdHRBRxd0dEFHF3R0QUcXdHSBRRdYdIFFF1h0AUUXUHQBRRdQdAFFF1B0AUUXIHQBQhcg'
+        'dAFCFyB0QUAXBHRBQBcEdIFNnx3aKg9kUZbvTbJjXDAzmxNFfnon+cRmWdaa/Lovy4+t4utSL8pD'
+        'PyyXfLND55w8F0N/YJyK9NniSVbqPGIbcT5hIi4gzMSFxEXExcQlxKXEZcTlxBXElcRVxNWEhbiG'
+        '2E5cS1xHXE/cQFiJGwkbcRNhJ24mHMQtxK3EbcTtxB3EncRdxN3EPYSTuJdwEfcRbuJ+wkM8QDxI'
+        'PEQ8TDxCPEo8RniJxwkfsYPwEzuJAWIXsZvYQwwSTxBDxDARIEaIILGX2EeMEmPEfuIAETJiduhc'
+        'CSeSelkqmnq5kB5LjafiqYnU00L1wVQiNZlKpp5JpVKHUunUK1KZ1OFUNnVEVHou9crUVGo6NZOa'
+        'Tb0q9WwqL0Q/l3p16jWpQup5Yfm1qVLqJ1KvS70+9YbUG1MvpOZSb0q9OfWTqXLqaOqnUm9J/XTq'
+        'ram3iar+mdTbxeh9R+pnUz+XqqR+PjWf+oXUQuqdqV9M/VLql1O/knpX6ldTi6n3S/NOueR+d+rX'
+        'Ur+eqqbek6ql3ptaSr0vtZz6jdRvpn479YHU76R+N/V7qQ+mPpT6/VQ99eHUR1IfTX0s9fHUSuoP'
+        'Un+Y+qPUH6f+JPWnqT9LfSL156m/SP1l6pOpT6X+KvXp1F+n/ib1t6nV1GdSf5f6bOrvU59L/cPs'
+        '0HnyuHzNWIvJ5aGszqGQrLRtPwoH7ORhMg7cnfLA/cAP2PnPHxNfJI7S+144Nj1kkkfpO/Jvv1S2'
+        'qj3GMljuGT3qM/QoMz3KTI8y06PM9CgzPcpMjzLTo8z0KDM9ykyPMtOjzPQoMz3KTI8y06PM9Cgz'
+        'PcpMjzLTo8z0KDM9ykyPMtOjzPQoMz3KTI8y06PM9CgzPcpMjzLTo8z0KDM9ykyPMtOjzPQoMz3K'
+        'TI8y06PM9CgzPcpMjzLTo8z0KDM9ykyPMtOjzPQoMz3KTI8y06PM9CgzPcpMjzLTo8z0KDM9ykyP'
+        'MtOjzPQoMz3KTI8y06PMNCczzclMczLTnMw0JzPNyUxzMtOczDQnM83JTHMy05zMNCczzclsNKcL'
+        'jFcMPp05cvAV49Mzh1mP3yvr0SL3vmKsiJmWG5/+N6l9zHgmKfeukXubxfgUo1rsbZN7NuMpl9y7'
+        'Uu5dvPnkU/N75J5b7t0q9x40Rq3cC8i9++TeeXLPLffMcs8n96xy71Gxd9Q8PfGqyXFjjb7xDXnk'
+        'Jy41luzjz0zOjMuXRY4np9TT/wH5AA/IvT1yb0ju7ZN/4vypyZnZqeypx3lKfv4quReQe/fIvZfL'
+        'vQvlXlzu3Wo86ZZ7o3LvGfk45xlPSzYeJS0/+5jcO7z55CWMnPy6C6fF9zYxPX3omdP+zueMH+pI'
+        'bjL7736oafmJbc+mvufOr8lHfFzudeWeX+79k9y7W+59W+5dLvdOyD98wcEjh3NHZrOJjT8/dI/4'
+        'gm3yC3T5pTvl3r/IPZ9xXuXeXXLvAtlHLpZ758q9R+TetXLhtG06c+jgad/PDcbzr4np0/BcYdwl'
+        'f9SNu26UD3KR3LPLvevk3t1yb0TuPSz/wCUT089lD45vXBVKTCY5tVuMZ3OHDn+PwJQE6jAuUciH'
+        'uUTuPWZ8f09PTU6c9s08Lj99hcFI7j0k9/xy7za590r5MNuNy0knL38cTJ06WGZ5ZozXeKUOZU/7'
+        'cd5ytoFnIps4cvjUva+T914+NXn4iPQp8I1z1WXjRMu/7Gq5d0zu3W5c45J7Trn3C3Jvr9z7Nbk3'
+        'YDzhlnvny733yse+BOC5I+JR5avQxmd4gvo+49rHoeSpv+r98g9eL/d+R+4dMJ5Ry6+6kIeYTh15'
+        'djw1OcET5o/IrxmUeytyzyT3/tG4xnJwYvq0g/7XG5e8/lju3SL3vrtxYedFuWeXe1uNiwL8Teqq'
+        'wEYtXmlcdjCOjjilR6ZOOz4m2UuG5Z7F+CJVzlNHZnNGQRtfdJ3Rj6YmDp3+jd0o/+Slcu9muXeT'
+        '0V3k3n0GAeOyxfTEc6f+wB3yky65t2sTfSA3OXHatzIoP79D7gWNS4/PHpo5xSLwpPzstXIvtunk'
+        '4H1a7t1rlK3xiM9OZKZmp0/9mUnjcQ5mRPVv0H7DaccpN6u6ljqnb5KP55F7R7mMMnH46cTEqcf7'
+        'Zfn5h+XeTxuXMpLy9d2Z037E6qaT1xPfaxzN8XEFZDyXEd+Y0wAeNn64iUOn/ejvN/66f9+kPigf'
+        '7Wa593HjBDx3aDJzqqsE/kx++iNy79P8nOJ7OfXZt28+dQny5H2fNb4uJw/Hxn3HjetOySNT45MT'
+        'p5Vh4EtcrHluemby8GnXZb4m7756YvaZw5PZmcmEaqzyg1N/9IT8xoJyry/3npB735F7N8q9fzZ+'
+        'lonvPQBnbz7trGSOzIwfPJKZPWxcHxqqq2MzebpbTT7eZfLT556qsMyRiYTRz40/ZxFfcYfc2WZc'
+        'dEskxGn+3u4wdLdEOnua6qFbTs20xKS8TvX05EYdDN1Ae8/OHMrOnvZn3OIvelTuPEg7M4r95Ccf'
+        'lYdxYkYcxdxpf/EO8UfulzsjYmef3Bn8d73mNJdD+04dHPHTiWfPp76lp2S3FN038b1zbCguv5WD'
+        '39tZE/Jr1bc3e/jUYySN5avYSX/vQDfa3ckmMvScIf7fTYqhrHzqYN64YHIjF0zSDVbADVbADVbA'
+        'DVbADZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+'
+        'DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+'
+        'DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+DZa+'
+        'DZa+DZa+DZ6eN1gBN1gBN1gBN1gBN1gBN1gBN1gBN1gBN1gBN1gBN1gBN1gBN1gBN1gBN4wV8IU/'
+        'DM825bPIoStf+P6fdv7An2xeJA9LUza4V8gG9yW5Z5Mz/gvyW/2q2GnInY+Lnc8bzxk2qaeeAS+/'
+        'Ik2vUXlrVN4albdG5a3x3HONAlyjANcowDUKcI0CXKMA1yjANQpwjQJcowDXKMA1CnCNAlyjANco'
+        'wDUKcI0CXKMA1yjANQpwjQJcowDXKMA1CnCNAlyjANcowDUKcI0CXKMA1yjANQpwjQJcowDXKMA1'
+        'CnCNAlyjANcowDUKcI0CXKMA1yjANQpwjQJcowDXKMA1CnCNAlyjANcowDUK0IgvEjsIP7GTGCBC'
+        'xC5iN7GHGCSeIIaIYSJAjBBBYi+xj2gRo8QYsZ84QHyZ+AqxRhSJrxJfI9rEi0SH6BI94gTxdeIb'
+        'RJ/4JvEt4tvEd4jvGjE7dPHz8hKwwP3EJnnF5RJZEudK4lcaxLelX8Toixg1YhNxGXEVcTWxnbiO'
+        'uJ64gbATNxO3EbcTdxH3EPcSLuIB4lHiMeJxwkfsIHYTe4gniBEiSIwSY8QBYitxHnE+YSIuIMzE'
+        'hcRFxMXE5cQVxJWEhbiGuJawEjcSNuImwkHcQtxK3EHcSdxNOIn7CDdxP+EhHiQeIh4mHiG8hJ/Y'
+        'SQwQIWIXMUgMEcNEgNhL7CP2GzE7dOnG6iSmViddjmyXHtnlAHc5wF0OcJcD3OUAdznAXQ5wF39d'
+        '/HWB1+WodznqXY56F41dNHY5B13OQRebXU5FF6JdiHYh2uX8dDk/Xc5Pl/PThW8Xvl3OVpez1eVs'
+        'dTHdxXSXc9fl3HUR3uUUdoHe5Ux28d7Fe5fz2uW8djmvXc5rl1rocnq7nN4up7fL6e1SJ13qpMvJ'
+        '7lIuXcqlS7l0EdBFQBcBXU59l1LqUkpdIHSpqC4eunjo4qFLmXUpsy46uujoUnRdiq6LlS6110Vc'
+        '15Bz2YacTyg5J5BzAjknkHMCOSeQcwI5J5BzAjknkHMCOSdorycAdAJAJwB0AkBGNIgriauIqwkL'
+        'cQ2xnbiWuI64nvg8cQNhJW4kbMRNhJ24mXAQtxC3ErcRtxNfIO4g7iTuIu4m7iGcxL2Ei7iPcBP3'
+        'Ex7iAeJB4iHiYeIR4lHiMcJLPE74iC8SOwg/sZMYIELELmI3sYcYJJ4ghohhokl8iQgQI0SQ2Evs'
+        'I1rEKDFG7CcOEF8mvkKsEV8lvka0iReJDtElesQJ4uvEN4g+8U3iW8S3ie8Q3zViduhyyd6SvkR8'
+        'kL5U3lzGN3w54K4wzrUc0BG5+tyVvhJJV2H1ag6jhTN7DSdxO8foWsrnOkrkejzeIP8Kq7y5Ud7Y'
+        '5M1NELBz2G+WdznkzS0Uwq3Iuo0aux2fd3B075Rfd5e8uRsd96DDKe+6V9645M198sYtb+6XNx7s'
+        'PACTBwH8ECX5MNX+GHa88Hoc6j4Kewcs/fKhdsqbAXmzS97sljd75M0gveAJSnQIL8PyMwF5M0LR'
+        '7aNHjMq7xuTNfjrCAeogRBU+SdWH5Rc8JW8i8uZl8iYqb14ub2LyZlzexOkcE9Tu01TkQYwmKIZJ'
+        'mllSfvkz8iYlbw7JmzTd5BVIzci7DsubLDVyhP6Xk3e9Ut5MyTvOTU/TPmboPrN0mFfJL3hW3uTl'
+        'zXPy5tWU1WvkfkHePC9vivLmtfTIEl3qJ+gar5Ofeb28eQPd5I1y/wV5M0e5v0nuv1ne/CR9sSzi'
+        '6HnGK7blxSrjGtLzxoXE9FH5ZUH5ZeK+knFJMf1T8r63yJufljdvlTdvkzc/I2/eTp86JvffIW9+'
+        'lub0c3K/Im9+ntqel/vvlDe/KG9+Sd78Mi32V+T+u+TNr8o7PpJelPvvlje/Jm9+Xd5U5c175E1N'
+        '3rxX3izJm/fJm2V58xvy5jdpOu+nWf0WDf635Wc+IG9+R978rrz5PXnzQXnzIabO78v9urz5MJ38'
+        'I3L/o/LmY/Lm4/JmRd78gbz5Q3nzR/Lmj+nAfyL3/1Te/Jm8+YS8+XN58wgHdGhAXuBK/yUN/i/k'
+        'Zz4pbz4lb/5K3nxa3vy1vPkbefO38mZV3nxG3vwda+HPyv2/lzefkzf/IG/+0WhWV/wo/dr6/+X6'
+        'gfGr7vMky/+rKwlXbqxd/kitXXSar0430yl3ndrVWbvoNGadvqrTr3RanE5f0lm76NSljiKdRqnT'
+        'qXTWLjrzQKdl63QgnbWLzijR6WI6NarTGHW6jc7aRad76MwKHdo6E0enK+h0Fp3C0mmjOs1HZzbo'
+        'dE2d/qezdtERr7N20WnoOq1fZ8LodEqdtYtOt9HpQjoTToe2Tk/QGVw6Y0+nZ+u0B50hoVM5OtNJ'
+        'ZzrpzB+d4aKzdtFpZjpDSWf+6LRrnbWLztpFZ+jqrF10+rJOO9AZojpNVmftorN20ZnLOrNIp43o'
+        'zAWdtYvO2kVnuuosBXT6m85E0Fm76KxddNYuOmsXnbWLztpFZ+2is3bRWbvorF101i46axedtYvO'
+        '2kVn7aKzdtFZu+isXXTWLrrRDq76cW8H328TMK5tfkwUvtENrv4+lnQvjYWcMZjSj/7XLemMpUV6'
+        '70tmcWc8NRj65AvH/j+t8tSK7kdgEXeRWnOOnS0O1g/9ik4t39Ri7j95FWfZeJlvn8XKOg1mnTpd'
+        'h+86FtdZrKzTfNbpHetU4jrFu06dreNqnSOzThdYp+TW6XLrNKJ1amid5ck6bXGdOlwH1zpFvk69'
+        'rAN/nda3zglap4Gu43idoljHyjodYJ26WafVrVPw65TuOidsnQXJOu1onRa2Tqdcp7rXEb5OYaxT'
+        'MOt06nVO1jq+12nA67TvdfrMOtTXaXHrnPh1uuw6XXadPrpOa1yn4Nbpquu0zXV6yzrDY51xsU4J'
+        'rtM91vG7TvtfpwOsM0PW6ZbrSF+nX61DbJ0RsM6UWqcQ12lR66x81g041zx/TP6byp3qHyAFPnq2'
+        '/J3B9g1Oq3DassngZMQ24nzCRFxAmIkLiYuIi4lLiEuJy4jLiSuIK4mriKsJC3ENsZ24lriOuJ64'
+        'gbASNxI24ibCTtxMOIhbiFuJ24jbiTuIO4m7iLuJewgncS/hIu4j3MT9hId4gHiQeIh4mHiEeJR4'
+        'jPASjxM+YgfhJ3YSA8QuYjexhxgkniCGiGEiQIwQQWIvsY8YJcaI/cQBImTE7NC1G8+adqhnTRpy'
+        'NORoyNGQo0FGg4wGGQ0yGmQ0yGiQ0SCjQUaDjAYZDTIaZDTIaJDRIKNBRoOMBhkNMhpkNMhokNEg'
+        'o0FGg4wGGQ0yGmQ0yGiQ0SCjQUaDjAYZDTIaZDTIaJDRIKNBRoOMBhkNMhpkNMhokNEgo0FGg4wG'
+        'GQ0yGmQ0yGiQ0SCjQUaDjAYZDTIaZDTIaJDRIKNBRoOMBhkNMhpkNMhokNEgo0FGM8hc9/wxXk/v'
+        '2ixbz/XPH0ufvYnBfsz4BeYNG83oO5AyQcoEKROkTJAy0YxMyDIhy4QsE7JMyDIhy4QsE7JMyDIh'
+        'y4QsE7JMyDIhy4QsE7JMyDIhy4QsE7JMyDIhy4QsE7JMyDIhy4QsE7JMyDIhy4QsE7JMyDIhy4Qs'
+        'E7JMyDIhy4QsE7JMyDIhy4QsE7JMyDIhy4QsE7JMyDIhy4QsE7JMyDIhy4QsE7JMyDIhy4QsE7JM'
+        'yDIhy4QsE7JMyDIhy4QsE7JMyDIhy4QsE7JMyDIZsqwb/ywqI18j/F3jpX7GP5i68czTuR/1p3M8'
+        'TQqIlf+Zi/Y/Pk/n0v/2I3F1/gf6XM4m/3HLpePjkxn5jq7q37hMTI3fayzQvy5fzXaBtP838iWq'
+        'p77I+GzAeB+FgWH+QfrQfSdf3XaXWo1ZGJ0WRqeF0WlhdFqYmRZmpoWZaWFmWpiZFmamhZlpYWZa'
+        'mJkWZqaFmWlhZlqYmRZmpoWZaWFmWpiZFmamhZlpYWZamJkWZqaFmWlhZlqYmRZmpoWZaWFmWpiZ'
+        'FmamhZlpYWZamJkWZqaFmWlhZlqYmRZmpoWZaWFmWpiZFmamhZlpYWZamJkWZqaFmWlhZlqYmRZm'
+        'poWZaWFmWpiZFmamhZlpYWZamJkWZqaFmWlhZlqYmRZmpoWZaWFmWpiZFmamhZlpYWZamJkWZqaF'
+        'mWlhZlqYmRZjZt60sYD/gCKzHTLbIbMdMtshs53V1nbkbEfOduRsR8525BhRJC4lLiMuJ64gGsSV'
+        'xFXE1YSFuIbYTlxLXEdcT3yeuIGwEjcSNuImwk7cTDiIW4hbiduI24kvEHcQdxJ3EXcT9xBO4l7C'
+        'RdxHuIn7CQ/xAPEg8RDxMPEI8SjxGOElHid8xBeJHYSf2EkMECFiF7Gb2EMMEk8QQ8Qw0SS+RASI'
+        'ESJI7CX2ES1ilBgj9hMHiC8TXyHWiK8SXyPaxItEh+gSPeIE8XXiG0Sf+CbxLeLbxHeI7xoxO2SX'
+        '7DuygzblUrEtm+dVcqV480Y9bFMvELZSD1bqwUo9WKkHK/VgpR6s1IOVerBSD1bqwUohWCkEK4Vg'
+        'pRCsVICVCrBSAVYqwEoFWKkAKxVgpQKsVIAV+lboW6Fvhb4V+lboW6Fvhb4V+lboW6Fvhb4V81bM'
+        'WzFvxbwV81bMWzFvxbwV81bMWzFvxbwV81bMWzFvxbwV81bMWzFvxbwV81bMW8FuBbsV7FawW1Fu'
+        'RbkV5VaUW1FuRbkV5VZcW3FtxbUV11ZcWwFtBbQV0FZAWykuq0HKsSHnzaqT2pBjQ44NOTbk2JBj'
+        'Q44NOTbk2JBjQ44NOTbk2JBjQ44NOTbk2JBjQ44NOTbk2JBjQ44NOTbk2JBjQ44NOTbk2JBjQ44N'
+        'OTbk2JBjQ44NOTbk2JBjQ44NOTbk2JBjQ44NOTbk2JBjQ44NOTbk2JBjQ44NOTbk2JBjQ44NOTbk'
+        '2JBjQ44NOTbk2JBjQ44NOTbk2JBjQ44NOTbk2JBjQ44NOTbk2JBjQ44NOTbk2JBjQ47NkHPLhpxz'
+        'lBw7cuzIsSPHjhw7cuzIsSPHjhw7cuzIsSPHjhw7cuzIsSPHjhw7cuzIsSPHjhw7cuzIsSPHjhw7'
+        'cuzIsSPHjhw7cuzIsSPHjhw7cuzIsSPHjhw7cuzIsSPHjhw7cuzIsSPHjhw7cuzIsSPHjhw7cuzI'
+        'sSPHjhw7cuzIsSPHjhw7cuzIsSPHjhw7cuzIsSPHjhw7cuzIsSPHjhw7cuzIsSPHjhw7cuzIsSPH'
+        'jhw7cuzIsRtybt2QM6HkOJDjQI4DOQ7kOJDjQI4DOQ7kOJDjQI4DOQ7kOJDjQI4DOQ7kOJDjQI4D'
+        'OQ7kOJDjQI4DOQ7kOJDjQI4DOQ7kOJDjQI4DOQ7kOJDjQI4DOQ7kOJDjQI4DOQ7kOJDjQI4DOQ7k'
+        'OJDjQI4DOQ7kOJDjQI4DOQ7kOJDjQI4DOQ7kOJDjQI4DOQ7kOJDjQI4DOQ7kOJDjQI4DOQ7kOJDj'
+        'QI4DOQ7kOJDjQI4DOQ7kOJDjQI7DkHPb8zyrDASNXwDdrj4ceqv86I4zl8vOvPrhh+gqGa+efrf8'
+        'tf+Z62Uv+etld75UX7JmvETtfjHm/5cvYL1rYy2QU2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sB'
+        'J2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sB'
+        'J2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sB'
+        'J2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sB'
+        'J2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBJ2sBp7EWuHtDzgVKjgs5LuS4kONC'
+        'jgs5LuS4kONCjgs5LuS4kONCjgs5LuS4kONCjgs5LuS4kONCjgs5LuS4kONCjgs5LuS4kONCjgs5'
+        'LuS4kONCjgs5LuS4kONCjgs5LuS4kONCjgs5LuS4kONCjgs5LuS4kONCjgs5LuS4kONCjgs5LuS4'
+        'kONCjgs5LuS4kONCjgs5LuS4kONCjgs5LuS4kONCjgs5LuS4kONCjgs5LuS4kONCjgs5LuS4DDn3'
+        'bPyqvg4cN3DcwHEDxw0cN2LciHEjxo0YN2LciHEjxo0YN2LciHEjxo0YN2LciHEjxo0YN2LciHEj'
+        'xo0YN2LciHEjxo0YN2LciHEjxo0YN2LciHEjxo0YN2LciHEjxo0YN2LciHEjxo0YN2LciHEjxo0Y'
+        'N2LciHEjxo0YN2LciHEjxo0YN2LciHEjxo0YN2LciHEjxo0YN2LciHEjxo0YN2LciHEjxo0YN2Lc'
+        'iHEjxo0Yt0HFudFk3q6ajAcrHqx4sOLBiocm44GMBzIeyHgg44GMBzIeyHgg44GMBzIeyHgg44GM'
+        'BzIeyHgg44GMBzIeyHgg44GMBzIeyHgg44GMBzIeyHgg44GMBzIeyHgg44GMBzIeyHgg44GMBzIe'
+        'yHgg44GMBzIeyHgg44GMBzIeyHgg44GMBzIeyHgg44GMBzIeyHgg44GMBzIeyHgg44GMBzIeyHgg'
+        '44GMBzIeyHgg44GMBzIeyHgg46HJeAw594rnpnW59Nkln5u61MuHhm6XH9138sVELzOexro3+tE6'
+        'xrwY82LMizEvxrwY82LMizEvxrwY82LMizEvxrwY82LMizEvxrwY82LMizEvxrwY82LMizEvxrwY'
+        '82LMizEvxrwY82LMizEvxrwY82LMizEvxrwY82LMizEvxrwY82LMizEvxrwY82LMizEvxrwY82LM'
+        'izEvxrwY82LMizEvxrwY82LMizEvxrwY82LMizEvxrwY82LMizEvxrwY82LMizEvxrwY82LMizEv'
+        'xrwY82LMaxi7/9QSSP3ax4ccH3J8yPEhx4ccH3J8yPEhx4ccH3J8yPEhx4ccH3J8yPEhx4ccH3J8'
+        'yPEhx4ccH3J8yPEhx4ccH3J8yPEhx4ccH3J8yPEhx4ccH3J8yPEhx4ccH3J8yPEhx4ccH3J8yPEh'
+        'x4ccH3J8yPEhx4ccH3J8yPEhx4ccH3J8yPEhx4ccH3J8yPEhx4ccH3J8yPEhx4ccH3J8yPEhx4cc'
+        'H3J8yPEhx4ccH3J8yPEhx4ccH3J8hhzPhpyMmmt+5PiR40eOHzl+5PiR40eOHzl+5PiR40eOHzl+'
+        '5PiR40eOHzl+5PiR40eOHzl+5PiR40eOHzl+5PiR40eOHzl+5PiR40eOHzl+5PiR40eOHzl+5PiR'
+        '40eOHzl+5PiR40eOHzl+5PiR40eOHzl+5PiR40eOHzl+5PiR40eOHzl+5PiR40eOHzl+5PiR40eO'
+        'Hzl+5PiR40eOHzl+5PiR40eOHzl+5PiR40eOHzl+5PiR4zfkPPCDvI5h/CvYnnzt0I/SP8IzLmQ8'
+        '+Lx699e+8QLhh14ql3uMU/YB+XKE7+swPXzaC6ffYrxw+pGNVvSIakUBWlGAVhSgFQVoRQF6UIAe'
+        'FKAHBehBAXpQgB4UoAcF6EEBelCAHhSgBwXoQQF6UIAeFKAHBehBAXpQgB4UoAcF6EEBelCAHhSg'
+        'BwXoQQF6UIAeFKAHBehBAXpQgB4UoAcF6EEBelCAHhSgBwXoQQF6UIAeFKAHBehBAXpQgB4UoAcF'
+        '6EEBelCAHhSgBwXoQQF6UIAeFKAHBehBAXpQgB4UoAcF6EEBelCAHhSgBwXoQQF6UIAeFKAHBehB'
+        'AXpQgB4UoAcF6EEBelCAHhSgBwXoQQF6UMDoQY9uLJh1xAQRE0RMEDFBxAQZXkHgBIETBE4QOEHg'
+        'BIETBE4QOEHgBIETBE4QOEHgBIETBE4QOEHgBIETBE4QOEHgBIETBE4QOEHgBIETBE4QOEHgBIET'
+        'BE4QOEHgBIETBE4QOEHgBIETBE4QOEHgBIETBE4QOEHgBIETBE4QOEHgBIETBE4QOEHgBIETBE4Q'
+        'OEHgBIETBE4QOEHgBIETBE4QOEHgBIETBE4QOEHgBIETBE4QOEHgBA04j/Fae9Fr8saCuZfex2u2'
+        '9vEyq33GV3l/5H6RaPym6dflu0ec+ZXimXfLOfOLxB/nXyQ+fvL/TTL0ppP/Q5IXmYIhpmCIKRhi'
+        'CoaYgiGmYIgpGGIKhpiCIaZgiCkYYgqGmIIhpmCIKRhiCoaYgiGmYIgpGGIKhpiCIaZgiCkYYgqG'
+        'mIIhpmCIKRhiCoaYgiGmYIgpGGIKhpiCIaZgiCkYYgqGmIIhpmCIKRhiCoaYgiGmYIgpGGIKhpiC'
+        'IaZgiCkYYgqGmIIhpmCIKRhiCoaYgiGmYIgpGGIKhpiCIaZgiCkYYgqGmIIhpmCIKRhiCoaYgiGm'
+        'YIgpGGIKhpiCIaZgiCkYYgqGmIIhpmCIKRhiCoaYgiGmYIgpGDLmm29jxf0OteIOIyeMnDBywsgJ'
+        'QyYMmTBkwpAJQyYMmTBkwpAJQyYMmTBkwpAJQyYMmTBkwpAJQyYMmTBkwpAJQyYMmTBkwpAJQyYM'
+        'mTBkwpAJQyYMmTBkwpAJQyYMmTBkwpAJQyYMmTBkwpAJQyYMmTBkwpAJQyYMmTBkwpAJQyYMmTBk'
+        'wpAJQyYMmTBkwpAJQyYMmTBkwpAJQyYMmTBkwpAJQyYMmTBkwpAJQyYMmTBkwpAJQyZskNmxQeZ6'
+        'RSYCmQhkIpCJQCYCmQhkIpCJQCYCmQhkIpCJQCYCmQhkIpCJQCYCmQhkIpCJQCYCmQhkIpCJQCYC'
+        'mQhkIpCJQCYCmQhkIpCJQCYCmQhkIpCJQCYCmQhkIpCJQCYCmQhkIpCJQCYCmQhkIpCJQCYCmQhk'
+        'IpCJQCYCmQhkIpCJQCYCmQhkIpCJQCYCmQhkIpCJQCYCmQhkIpCJQCYCmQhkIpCJQCYCmQhkIpCJ'
+        'QCYCmYhBxr/xJO1riIkiJoqYKGKiiIkynqLAiQInCpwocKLAiQInCpwocKLAiQInCpwocKLAiQIn'
+        'CpwocKLAiQInCpwocKLAiQInCpwocKLAiQInCpwocKLAiQInCpwocKLAiQInCpwocKLAiQInCpwo'
+        'cKLAiQInCpwocKLAiQInCpwocKLAiQInCpwocKLAiQInCpwocKLAiQInCpwocKLAiQInCpwocKLA'
+        'iQInCpwocKLAiQInCpwocKLAiRpwdm70mqjqNTHkxJATQ04MOTHkxJATQ04MOTHkxJATQ04MOTHk'
+        'xJATQ04MOTHkxJATQ04MOTHkxJATQ04MOTHkxJATQ04MOTHkxJATQ04MOTHkxJATQ04MOTHkxJAT'
+        'Q04MOTHkxJATQ04MOTHkxJATQ04MOTHkxJATQ04MOTHkxJATQ04MOTHkxJATQ04MOTHkxJATQ04M'
+        'OTHkxJATQ04MOTHkxJATQ04MOTHkxJATQ04MOTHkxJATM+QMbLScDwInDpw4cOLAiQMnjpg4YuKI'
+        'iSMmjpg4YuKIiSMmjpg4YuKIiSMmjpg4YuKIiSMmjpg4YuKIiSMmjpg4YuKIiSMmjpg4YuKIiSMm'
+        'jpg4YuKIiWMkjpg4fuKIiSMmjpg4YuKIiSMmjpg4YuKIiSMmjpg4YuKIiSMmjpg4YuKIiSMmjpg4'
+        'YuKIiSMmjpg4YuKIiSMmjpg4YuKIiSMmjpg4YuKIiSMmjpg4YuKIiSMmjpi4IWaX+t8+Bq7cIq9F'
+        '795oPU+o1pNAUAJBCQQlEJRAUAJBCQQlEJRAUAJBCQQlEJRAUAJBCQQlEJRAUAJBCQQlEJRAUAJB'
+        'CQQlEJRAUAJBCQQlEJRAUAJBCQQlEJRAUAJBCQQlMJNAUAJPCQQlEJRAUAJBCQQlEJRAUAJBCQQl'
+        'EJRAUAJBCQQlEJRAUAJBCQQlEJRAUAJBCQQlEJRAUAJBCQQlEJRAUAJBCQQlEJRAUAJBCQQlEJRA'
+        'UAJBCQQlEJRAUMIQtGeDTECRSUImCZkkZJKQSTKtkshJIieJnCRykshJIieJnCRykshJIieJnCRy'
+        'kshJIieJnCRykshJIieJnCRykshJIieJnCRykshJIieJnCRykshJIieJnCRykshJIieJnCRykshJ'
+        'IieJnCRykshJIieJnCRykshJIieJnCRykshJIieJnCRykshJIieJnCRykshJIieJnCRykshJIieJ'
+        'nCRykshJIieJnCRykshJIieJnCRykshJGnIGn1f/386PGr8xfGID0qyClAZSGkhpIKWBlAZSGkhp'
+        'IKWBlAZSGkhpIKWBlAZSGkhpIKWBlAZSGkhpIKWBlAZSGkhpIKWBlAZSGkhpIKWBlAZSGkhpIKWB'
+        'lAZSGkhpIKWBlAZSGkhpIKWBlAZSGkhpIKWBlAZSGkhpIKWBlAZSGkhpIKWBlAZSGkhpIKWBlAZS'
+        'GkhpIKWBlAZSGkhpIKWBlAZSGkhpIKWBlAZSGkhpIKWBlAZSGkhpIKWBlAZSGkhpA9LQhpxPKTkZ'
+        '5GSQk0FOBjkZ5GSQk0FOBjkZ5GSQk+HdEDIAygAoA6AMgDK8G0IGRxkcZXCUwVEGRxkcZXCUwVEG'
+        'RxneDSEDpwycMnDKwCkDpwycMnDKwCkDpwycMnDKwCnDuyFkUJVBVQZVGVRlUJVBVQZVGVRlUJVB'
+        'VQZVGVRlUJVBVQZVGVRlUJVBVQZVGVRlUJVBVYZ3Q8iAKwOuDLgy4MpwsjMYy2Asg7EMxjIYy2As'
+        'g7EM74aQ4d0QMojLIC6DuAziMojL8G4IGeBlgJcBXgZ4Gd4NIcO7IWR4N4QM74aQ4d0QMrwbQobf'
+        'rGV4N4QM74aQ4d0QMrwbQoZ3Q8jwbggZ3g0hw7shZHg3hAzvhpDh3RAy/JouY7Af3mCfVeyzsM/C'
+        'Pgv7LOyzsM/CPgv7LOyzsM/CPov3LN6zeM/iPQv0LNCzQM8CPQv0LNCzQM8CPQv0LMKzCM8iPIvw'
+        'LMKzCM8iPIvwLMKzCM8iPIvwLLSz0M5COwvtLLSz0M5COwvtLLSz0M5COwvtLLSz0M5COwvtLLSz'
+        '0M5COwvtLLSz0M5iOovpLKazmM6COQvmLJizYM6COQvmLJiz8M3CNwvfLHyz8M3iNovbLG6zuM1S'
+        'Q1lDTmBDjlPJySEnh5wccnLIyUEmB5kcZHKQyUEmB5kcZHKQyUEmB5kcZHKQyUEmB5kcZHKQyUEm'
+        'B5kcZHKQyUEmB5kcZHKQyUEmB5kcZHKQyUEmB5kcZHKQyUEmB5kcZHKQyUEmB5kcZHKQyUEmB5kc'
+        'ZHKQyUEmB5kcZHKQyUEmB5kcZHKQyUEmB5kcZHKQyUEmB5kcZHKQyUEmB5kcZHKQyUEmB5kcZHKQ'
+        'yUEmB5kcZHKQyUEmZ5AZOblY22S8aCkoBPEbyYt5L+Ez/+r4zEsEfkxfIpD+BfUO5ofP3vg/6Zz5'
+        'n+f8kL9KYO+p11kOvUt2rH0b10Z7jLw8Iy/PyMsz8vKMvDyLpTyTL8/kyzP58ky+PJMvz+TLM/ny'
+        'TL48ky/P5Msz+fJMvjyTL8/kyzP58ky+PJMvz+TLM/nyTL48ky/P5Msz+fJMvjyTL8/kyzP58ky+'
+        'PJMvz+TLM/nyTL48ky/P5Msz+fJMvjyTL8/kyzP58ky+PJMvz+TLM/nyTL48ky/P5Msz+fJMvjyT'
+        'L8/kyzP58ky+PJMvz+TLM/nyTL48ky/P5Msz+fJMvjyTL8/kyzP58ky+PJMvz+TLM/nyTL48ky/P'
+        '5Msz+fJMvjyTL29MvlF1iXTIJBmNbTD6PIwKMCrAqACjAowKMCrAqACjAowKMCrAqACjAowKMCrA'
+        'qACjAowKMCrAqACjAowKMCrAqACjAowKMCrAqACjAowKMCrAqACjAowKMCrAqACjAowKMCrAqACj'
+        'AowKMCrAqACjAowKMCrAqACjAowKMCrAqACjAowKMCrAqACjAowKMCrAqACjAowKMCrAqACjAowK'
+        'MCrAqACjAowKMCrAqACjAowKMCrAqACjAowKMCrAqGAw2r+x5r5PrbmLyCkip4icInKKkClCpgiZ'
+        'ImSKkClCpgiZImSKkClCpgiZImSKkClCpgiZImSKkClCpgiZImSKkClCpgiZImSKkClCpgiZImSK'
+        'kClCpgiZImSKkClCpgiZImSKkClCpgiZImSKkClCpgiZImSKkClCpgiZImSKkClCpgiZImSKkClC'
+        'pgiZImSKkClCpgiZImSKkClCpgiZImSKkClCpgiZImSKkClCpgiZImSKkCkaZA5skPlLRaYEmRJk'
+        'SpApQaZEsykhp4ScEnJKyCkhp8R1rRKASgAqAagEoBLXtUo4KuGohKMSjko4KuGohKMSjko4KnFd'
+        'qwSnEpxKcCrBqQSnEpxKcCrBqQSnEpxKcCrBqcR1rRKqSqgqoaqEqhKqSqgqoaqEqhKqSqgqoaqE'
+        'qhKqSqgqoaqEqhKqSqgqoaqEqhKqSqgqcV2rBK4SuErgKoGrxMkuYayEsRLGShgrYayEsRLGSlzX'
+        'KnFdq4S4EuJKiCshroS4Ete1SsArAa8EvBLwSlzXKnFdq8R1rRLXtUpc1ypxXavEda0S17VKXNcq'
+        'cV2rxHWtEte1SlzXKnFdq8R1rRLXtUpc1ypxXavEda2SwT4k31n5/EPZ1OTUoZmJ7MFJ4z2T/1H+'
+        'ExvjGei1Z8u3/Hxy42Wgnzv5MtC/oEjmKJI5imSOIpmjSOYokjmKZI4imaNI5iiSOYpkjuqYozrm'
+        'qI45qmOOspijLOYoiznKYo6ymKMs5iiLOcpijrKYox7mqIc56mGOepijHuaohznqYY56mKMe5qiH'
+        'OephjnqYoxDmKIQ5CmGOQpijEOYohDkKYY5CmKMQ5iiEOQphjkKYoxDmKIQ5CmGOQpijEOYohDkK'
+        'YY5CmKMQ5iiEOSpgjgqYowLmqIA56M9Bfw76c9Cfg/4c9OegPwf2ObDPgX0O7HNgn0P5HMrnUD6H'
+        '8jkqbs5wFj7zfmlnrlxw5YL/TcEjLxw7868czvwrhx+K6xdPbTzP/CZTrcxUKzPVyky1MlOtzFQr'
+        'M9XKTLUyU63MVCsz1cpMtTJTrcxUKzPVyky1MlOtzFQrM9XKTLUyU63MVCsz1cpMtTJTrcxUKzPV'
+        'yky1MlOtzFQrM9XKTLUyU63MVCsz1cpMtTJTrcxUKzPVyky1MlOtzFQrM9XKTLUyU63MVCsz1cpM'
+        'tTJTrcxUKzPVyky1MlOtzFQrM9XKTLUyU63MVCsz1cpMtTJTrcxUKzPVyky1MlOtzFQrM9XKTLUy'
+        'U63MVCsz1cpMtTJTrcxUKzPVyky1MlOtzFQrM9XKxlSL/DD9w2vjH0f75crt//u/T3+ZPC7yHeMD'
+        'H5OXceW7yA89IBeS0ZfCMqCvLmF/WZyL/3lN8D2LAbVCOGoeN/6HJjPjuczs9Pg9xiL8k/KfWP7X'
+        'LBHO/ErjB78eYBn2rTO/z/hPWQ+wiv72qSWBWiD8J68MXq7eWCsQMt48K7Zxkehb6iJRhZVChZVC'
+        'hZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVC'
+        'hZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVC'
+        'hZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVC'
+        'hZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVChZVC'
+        'xVgpjG/IcSk588iZR848cuaRMw+ZecjMQ2YeMvOQmYfMPGTmITMPmXnIzENmHjLzkJmHzDxk5iEz'
+        'D5l5yMxDZh4y85CZh8w8ZOYhMw+ZecjMQ2YeMvOQmYfMPGTmITMPmXnIzENmHjLzkJmHzDxk5iEz'
+        'D5l5yMxDZh4y85CZh8w8ZOYhMw+ZecjMQ2YeMvOQmYfMPGTmITMPmXnIzENmHjLzkJmHzDxk5iEz'
+        'D5l5yMxDZh4y85CZh8w8ZOYhMw+ZeYNMfIPMZYrMAmQWILMAmQXILNBsFpCzgJwF5CwgZwE5C8hZ'
+        'QM4CchaQs4CcBeQsIGcBOQvIWUDOAnIWkLOAnAXkLCBnATkLyFlAzgJyFpCzgJwF5CwgZwE5C8hZ'
+        'QM4CchaQs4CcBeQsIGcBOQvIWUDOAnIWkLOAnAXkLCBnATkLyFlAzgJyFpCzgJwF5CwgZwE5C8hZ'
+        'QM4CchaQs4CcBeQsIGcBOQvIWUDOAnIWkLOAnAXkLCBnATkLyFlAzgJyFpCzYMiZEFOrKKdW3Zha'
+        'T/9nPEsxnl38qlyS/ii+L/j/8lnKwTPXJM9ckzzzhis/cpcijevH14pO9ON8TTKxMf1vUNN/kem/'
+        'yPRfZPovMv0XGfuLjP1Fxv4iY3+Rsb/I2F9k7C8y9hcZ+4uM/UXG/iJjf5Gxv8jYX2TsLzL2Fxn7'
+        'i4z9Rcb+ImN/kbG/yNhfZOwvMvYXGfuLjP1Fxv4iY3+Rsb/I2F9k7C8y9hcZ+4uM/UXG/iJjf5Gx'
+        'v8jYX2TsLzL2Fxn7i4z9Rcb+ImN/kbG/yNhfZOwvMvYXGfuLjP1Fxv4iY3+Rsb/I2F9k7C8y9hcZ'
+        '+4uM/UXG/iJjf5Gxv8jYX2TsLzL2Fxn7i4z9Rcb+ImN/kbG/yNhfZOwvMvYXGfuLxtifPPM64TOT'
+        '7cxk+yGbbOoFzUNXv3DsJf5rtuTGr9m+zUSrMtGqTLQqE63KRKvyfLbKYKsy2KoMtiqDrcpgqzLY'
+        'qgy2KoOtymCrMtiqDLYqg63KYKsy2KoMtiqDrcpgqzLYqgy2KoOtymCrMtiqDLYqg63KYKsy2KoM'
+        'tiqDrcpgqzLYqgy2KoOtymCrMtiqDLYqg63KYKsy2KoMtiqDrcpgqzLYqgy2KoOtymCrMtiqDLYq'
+        'g63KYKsy2KoMtiqDrcpgqzLYqgy2KoOtymCrMtiqDLYqg63KYKsy2KoMtiqDrcpgqzLYqgy2KoOt'
+        'ymCrMtiqDLYqg63KYKsag+2ZjbXQb6u1UA05NeTUkFNDTg05NeTUkFNDTg05NeTUeG1eDUA1ANUA'
+        'VANQjdfm1XBUw1ENRzUc1XBUw1ENRzUc1XBU47V5NTjV4FSDUw1ONTjV4FSDUw1ONTjV4FSDUw1O'
+        'NV6bV0NVDVU1VNVQVUNVDVU1VNVQVUNVDVU1VNVQVUNVDVU1VNVQVUNVDVU1VNVQVUNVDVU1XptX'
+        'A1cNXDVw1cBV42TXMFbDWA1jNYzVMFbDWA1jNV6bV+O1eTXE1RBXQ1wNcTXE1XhtXg14NeDVgFcD'
+        'Xo3X5tV4bV6N1+bVeG1ejdfm1XhtXo3X5tV4bV6N1+bVeG1ejdfm1XhtXo3X5tV4bV6N1+bVeG1e'
+        'jdfm1XhtXo3X5tUM9qkN9s8o9kuwX4L9EuyXYL8E+yXYL8F+CfZLsF+C/RLel/C+hPclvC8BfQno'
+        'S0BfAvoS0JeAvgT0JaAvAX0J4UsIX0L4EsKXEL6E8CWELyF8CeFLCF9C+BLCl6C9BO0laC9Bewna'
+        'S9BegvYStJegvQTtJWgvQXsJ2kvQXoL2ErSXoL0E7SVoL0F7CdpL0F7C9BKmlzC9hOklMC+BeQnM'
+        'S2BeAvMSmJfAvATfJfguwXcJvkvwXcLtEm6XcLuE2yVqaMmQc2hj0n4JOMvAWQbOMnCWgbMMnGXg'
+        'LANnGTjLwFkGzjJwloGzDJxl4CwDZxk4y8BZBs4ycJaBswycZeAsA2cZOMvAWQbOMnCWgbMMnGXg'
+        'LANnGTjLwFkGzjJwloGzDJxl4CwDZxk4y8BZBs4ycJaBswycZeAsA2cZOMvAWQbOMnCWgbMMnGXg'
+        'LANnGTjLwFkGzjJwloGzDJxl4CwDZxk4y8BZBs4ycJaBswycZeAsA2cZOMvAWQbOMnCWgbMMnGXg'
+        'LBtw0j+u/ycB4/L11fLy9f/TpeJX8F7e4jE68gU2L8q9N4q9o1eMj8/M5jKT47mJmZnJqazxMo7x'
+        'B4wXcEQ3y5e8ZE7+/5eSxjuvHD75b3urxofZjR5/terxdUq1TqnWKdU6pVqnRuvUaJ0arVOjdWq0'
+        'To3WqdE6NVqnRuvUaJ0arVOjdWq0To3WqdE6NVqnRuvUaJ0arVOjdWq0To3WqdE6NVqnRuvUaJ0a'
+        'rVOjdWq0To3WqdE6NVqnRuvUaJ0arVOjdWq0To3WqdE6NVqnRuvUaJ0arVOjdWq0To3WqdE6NVqn'
+        'RuvUaJ0arVOjdWq0To3WqdE6NVqnRuvUaJ0arVOjdWq0To3WqdE6NVqnRuvUaJ0arVOjdWq0To3W'
+        'qdE6NVqnRutGjR4RgsakoM3G24jlTv5vql9v/GPxV26A+o4CtQKoFUCtAGoFUCv0/hVcreBqBVcr'
+        'uFrB1QquVnC1gqsVXK3gagVXK7hawdUKrlZwtYKrFVyt4GoFVyu4WsHVCq5WcLWCqxVcreBqBVcr'
+        'uFrB1QquVnC1gqsVXK3gagVXK7hawdUKrlZwtYKrFVyt4GoFVyu4WsHVCq5WcLWCqxVcreBqBVcr'
+        'uFrB1QquVnC1gqsVXK3gagVXK7hawdUKrlZwtYKrFVyt4GoFVyu4WsHVCq5WcLWCqxVcrRiups5c'
+        'Pjxz+fDM5cOX1ivxTr7dQlr+n+N/yK8fTqtJN/QhOehmzvz2/kyT+iFqUvxa+j2ijM78Gv8l/y+K'
+        'ZjeeL3rFqvzoBePjE1PPTPPk8D755HDoE/K54avklxlPDtfk00rjNVt/aPyL22flZ86Vy/iLjf95'
+        '1Lb0p1mHf5p1uBGbiMuIq4irie3EdcT1xA2EnbiZuI24nbiLuIe4l3ARDxCPEo8RjxM+Ygexm9hD'
+        'PEGMEEFilBgjDhBbifOI8wkTcQFhJi4kLiIuJi4nriCuJCzENcS1hJW4kbARNxEO4hbiVuIO4k7i'
+        'bsJJ3Ee4ifsJD/Eg8RDxMPEI4SX8xE5igAgRu4hBYogYJgLEXmIfsd+I2aH8yTeb1o3XAD63cUWw'
+        'y7PCVY7zKs8KVzncqxzuVQ73Kod7lcO9yuFe5XCvonEVjaswXOUcrHIOVjkHq9hcxeYqZ2SVM7KK'
+        '1FVOzCpgVwG7CthVztYqZ2uVs7XK2VoF8yqYVzl3q5y7Vc7dKsJXEb7KmVzlTK7ifZUTugr7Vc7r'
+        'KvpX0b/KWV7lLK9yllc5y6tUxione5WTvcrJXuVkr1I1q1TNKqd+leJZpXhWKZ5VPKziYRUPq0BY'
+        'pbBWKaxVWKxSX6voWEXHKjpWKbpVim4VK6tYWaUEVynBVeSsUomr+Fs1HL36/3xFUCBzyStr3+91'
+        'QXktbmiP+AP/hRcIj54/PTkznjk0Mzk1kTEa8DvEN/ADeVnpa+QR2yOPyt2yqcu3TQhs2XLyfRM+'
+        'Qfk1KL8G5deg/BqUX4Pya1B+DcqvQfk1KL8G5deg/BqUX4Pya1B+DcqvQfk1KL8G5deg/BqUX4Py'
+        'a1B+DcqvQfk1KL8G5deg/BqUX4Pya1B+DcqvQfk1KL8G5deg/BqUX4Pya1B+DcqvQfk1KL8G5deg'
+        '/BqUX4Pya1B+DcqvQfk1KL8G5deg/BqUX4Pya1B+DcqvQfk1KL8G5deg/BqUX4Pya1B+DcqvQd01'
+        'qLsGddeg7hrUXYO6a1B3DequQd01qLsGddeg7hrUXYO6axh1V5BvzLHVv8c3ut/g+ncnAX0FQE0A'
+        'NQHUBFATQE0ANQHUBFATQE0ANQHUBFATQE0ANQHUBFATQE0ANQHUBFATQE0ANQHUBFATQE0ANQHU'
+        'BFATQE0ANQHUBFATQE0ANQHUBFATQE0ANQHUBFATQE0ANQHUBFATQE0ANQHUBFATQE0ANQHUBFAT'
+        'QE0ANQHUBFATQE0ANQHUBFATQE0ANQHUBFCT/t3EURNHTRw1cdTEURNHTRw1cdTEURNHTRw1cdTE'
+        'URNHTcPR8xvXg2fU9eAWclrIaSGnhZwWclrIaSGnhZwWclrIaSGnhZwWclrIaSGnhZwWclrIaSGn'
+        'hZwWclrIaSGnhZwWclrIaSGnhZwWclrIaSGnhZwWclrIaSGnhZwWclrIaSGnhZwWclrIaSGnhZwW'
+        'clrIaSGnhZwWclrIaSGnhZwWclrIaSGnhZwWclrIaSGnhZwWclrIaSGnhZwWclrIaSGnhZwWclrI'
+        'aSGnhZwWclrIaSGnhZwWclrIaRlyimeuB5+51HLmevBL83rw7i0//NeDX/vj+mKF/+hph/FCht+V'
+        'T7f+t09AShvXji5S147azOw2M7vNtaM2o7vNlG4zpdvM5TYDuc1AbjOQ2wzdNkO3zXxtM1/bTNQ2'
+        'o7TNDG0zQ9vMyTazsM0sbDME2wzBNkOwzaBrM+jaTLg2w6zNMGszvtqMrzZzq821ozYrmzZLmjZL'
+        'mjZLmjZLmjZLmjZLmjZLmjarlzarlzarlzbrlTbrlTYLlTZrkjZrkjZrkjZrkjarkDarkDarkDbr'
+        'jjbrjjYLjjYrjTZrizZrizZrizZrizaLijaLijaLijaLijbLiDYrhjYrhjYrhjYTvM3Coc1Soc0a'
+        'oc0aoc0aoc2qoM2qoM06oG1M/p/YWDN21Jqxw5HtsGbscIA7HOAOB7jDAe5wgDsc4A4HuIO/Dv46'
+        'wOtw1Dsc9Q5HvYPGDho7nIMO56CDzQ6nogPRDkQ7EO1wfjqcnw7np8P56cC3A98OZ6vD2epwtjqY'
+        '7mC6w7nrcO46CO9wCjtA73AmO3jv4L3Dee1wXjuc1w7ntUMtdDi9HU5vh9Pb4fR2qJMOddLhZHco'
+        'lw7l0qFcOgjoIKCDgA6nvkMpdSilDhA6VFQHDx08dPDQocw6lFkHHR10dCi6DkXXwUqH2usgrmPI'
+        'ed1G63latZ4ep77Hqe9x6nuc5R5nucd57XFCe5zQHie0x0nrcdJ6nJ8e56fHGelxKnqcgx7noMdx'
+        '7nEsexzLHgexx0HscRB7HKgeB6rHEepxMHocjB4/fo8fv8fP3aPn9KiMHiXRoyR6lESPkuhREj1K'
+        'okdJ9NDfQ38P/T289/DeA3oP0z1M9zDdw3QPxT0U91Dcw20Ptz3A9pDaw2YPmz1s9rDZA2UPlD1Q'
+        '9kDZg2EPcT3E9RDXQ0APeD2o9TDWw1gPYz1U9VDVw1HPkPP654+l1uRs+7bxMqY3bFyv/jgdqM9x'
+        '7tOB+hzuPoe7z+Huc7j7HO4+h7vP4e7DsA/DPgz7nIM+56DPOehjs4/NPmekzxnpI7XPiekDtg/Y'
+        'PmD7nK0+Z6vP2epztvpg7oO5z7nrc+76nLs+wvsI73Mm+5zJPt77nNA+7Puc1z76++jvc5b7nOU+'
+        'Z7nPWe5TGX1Odp+T3edk9znZfaqmT9X0OfV9iqdP8fQpnj4e+njo46EPhD6F1aew+rDoU199dPTR'
+        '0UdHn6LrU3R9rPSx0qcE+5RgHzl9KrGPv77h6I3f76LQWEg9It+e7Mdpefi/XRS+8JJdLF+95T9a'
+        'LM+dfD3uduPVlG+Sl123+EYHfMZLeOeFj6Obd/hGjWuwBfHBlj2DY1yRXZcfDQ+ODBhf+WHj17Zv'
+        '3lg5vUetnDZtNvqWEduI8wkTcQFhJi4kLiIuJi4hisSlxGXE5cQVRIO4kriKuJqwENcQ24lrieuI'
+        '64nPEzcQVuJGwkbcRNiJmwkHcQtxK3EbcTvxBeIO4k7iLuJu4h7CSdxLuIj7CDdxP+EhHiAeJB4i'
+        'HiYeIR4lHiO8xOOEj/gisYPwEzuJASJE7CJ2E3uIQeIJYogYJprEl4gAMUIEib3EPqJFjBJjxH7i'
+        'APFl4ivEGvFV4mtEm3iR6BBdokecIL5OfIPoE98kvkV8m/gO8V0jZod+8qXaXIae+Y96S3mjG/ye'
+        '6gYa3UCjG2h0A41uoNENNLqBRjfQ6AYa3UCjG2h0A41uoNENNLqBRjfQ6AYa3UCjG2h0A41uoNEN'
+        'NLqBRjfQ6AYa3UCjG2h0A41uoNENNLqBRjfQ6AYa3UCjG2h0A41uoNENNLqBRjfQ6AYa3UCjG2h0'
+        'A41uoNENNLqBRjfQ6AYa3UCjG2h0A41uoNENNLqBRjfQ6AYa3UCjG2h0A41uoNENNLqBRjfQ6AYa'
+        '3UCjG2h0A41uoNENNLqBRjfQ6AYa3UCjG2h0A41uoNENNLqBRjfQ6AYa3UDGO8466+yz5H+iLWi0'
+        'BY22oNEWNNqCRlvQaAsabUGjLWi0BY22oNEWNNqCRlvQaAsabUGjLWi0BY22oNEWNNqCRlvQaAsa'
+        'bUEz2sLRM79BOPMbhB/gbxA23luhKprrmd8mnPn/1v1f/gLhp06u/c83rjm8ZWNcV9W4NjGuTYxr'
+        'E+PaxLg2Ma5NjGsT49rEuDYxrk2MaxPj2vQ/2Lv3uNjz+77v3ZXseH1GQrJBCJBkZkYekEZohIRA'
+        'N3TbRUIaHY2EVmRC7dkqjsd4jSdG0g5OcMYFT10/qNI2xp10SkgzKQml0yYNTkhiSGjjOCEeppmp'
+        '49RtiD3gu+PrGNuJAbdnfk8OZ92HZMuyLrta9M9nz2W15/x+r/fl+/195zfiOiSuQ+I6JK5D4jok'
+        'rkPiOiSuQ+I6JK5D4jokrkPiOiSuQ+I6JK5D4jokrkPiOiSuQ+I6JK5D4jokrkPiOiSuQ+I6JK5D'
+        '4jokrkPiOiSuQ+I6JK5D4jokrkPiOiSuQ+I6JK5D4jokrkPiOiSuQ+I6JK5D4jokrkPiOiSuQ+I6'
+        'JK5D4jokrkPiOiSuQ+I6JK5D4jokrkPiOiSuQ+I6JK5D4jokrkPiOiSuQ+I6JK5DyntISoekdEhK'
+        'h6R0SEqHpHRISoekdEhKh6R0SEqHpHRISoekdEhKh6R0SEqHpHRISoekdEhKh6R0SEqHgpT+r+5/'
+        'QPW9wSdS/+sHX+Z491eDs6N/6f/f7oPm2znb9lyo+Z+x3X//c3HR8+muRrDL8hUdHoLrsn7/y6Lu'
+        'hh++f2jtX/LTXn7ay097+WkvP+3lp738tJef9vLTXn7ay097GWkvI+1lpL2MtJeD9nLQXg7ay0F7'
+        'OWgvB+3loL0ctJeD9rLOXtbZyzp7WWcv6+xlnb2ss5d19rLOXtbZyzp7WWcvz+zlmb08s5dn9vLM'
+        'Xp7ZyzN7eWYvz+zlmb08s5dn9vLMXp7ZyzN7eWYvz+zlmb08s5dn9vLMXp7Zyyx7mWUvs+xllr1c'
+        'spdL9nLJXi7ZyyV7uWQvl+zli718sZcv9vLFXr7YyxB7GWIvQ+xliL3MuTewpB94rkorcNbvuaeV'
+        'T+s4/81NQfmm64IyQFADBDVAUAMENUBQAwQ1QFADBDVAUAMENUBQAwQ1QFADBDVAUAMENUBQAwQ1'
+        'QFADBDVAUAMENUBQAwQ1QFADBDVAUAMENUBQAwQ1QFADBDVAUAMENUBQAwQ1QFADBDVAUAMENUBQ'
+        'AwQ1QFADBDVAUAMENUBQAwQ1QFADBDVAUAMENUBQAwQ1QFADBDVAUAMENUBQAwQ1QFADBDVAUAME'
+        'NUBQAwQ1QFADBDVAUAMENUBQAwQ1QFADBDVAUAMENUBQAwQ1EAiq9LRvaP6VTqb/5efKF7E8+f0P'
+        'f7ql+af7FpbbL1t5ph3kW7/uoT94r0jcfvPKc+qbV/7bm6ybu866sKwLy7qwrAvLurCsC8u6sKwL'
+        'y7qwrAvLurCsC8u6sKwLy7qwrAvLurCsC8u6sKwLy7qwrAvLurCsC8u6sKwLy7qwrAvLurCsC8u6'
+        'sKwLy7qwrAvLurCsC8u6sKwLy7qwrAvLurCsC8u6sKwLy7qwrAvLurCsC8u6sKwLy7qwrAvLurCs'
+        'C8u6sKwLy7qwrAvLurCsC8u6sKwLy7qwrAvLurCsC8u6sKwLy7qwrAvLurCsC8u6sKwLy7qwrAvL'
+        'urCsC8u6cJB15RtyfvKanChyosiJIieKnChyosiJIieKnChyosiJ2saJAigKoCiAogCK2saJ4iiK'
+        'oyiOojiK4iiKoyiOojiK4ihqGycKpyiconCKwikKpyiconCKwikKpyiconCKwilqGyeKqiiqoqiK'
+        'oiqKqiiqoqiKoiqKqiiqoqiKoiqKqiiqoqiKoiqKqiiqoqiKoiqKqiiqorZxouCKgisKrii4om52'
+        'FGNRjEUxFsVYFGNRjEUxFrWNE7WNE0VcFHFRxEURF0Vc1DZOFHhR4EWBFwVe1DZO1DZO1DZO1DZO'
+        '1DZO1DZO1DZO1DZO1DZO1DZO1DZO1DZO1DZO1DZO1DZO1DZO1DZO1DZO1DZONMD+v7t92PIMfthy'
+        '/1z9eKfJ3Fa+26ctz72nLRs3uZy9zuUhuTwkl4fk8pBcHpLLQ3J5SC4PyeUhuTwkl4cE8pBAHhLI'
+        'QwJ5SBIPSeIhSTwkiYck8ZAkHpLEQ5J4SBIPieAhETwkgodE8JAIHhLBQyJ4SAQPieAhETwkgodE'
+        '8JDsHZK9Q7J3SPYOyd4h2Tske4dk75DsHZK9Q7J3SPYOyd4h2Tske4dk75DsHZK9Q7J3SPYOyd4h'
+        '2TskdIeE7pDQHRK6Q9J2SNoOSdshaTskbYek7ZC0HZKvQ/J1SL4Oydch+TokWIcE65BgHRKsQ0J+'
+        'KIi2v/K03YsXdHYvNr9Y+4PB1vZ3draxnxWPJP5q5/Tin/jI1KOpDz72keBY4mXnJaVf6WeCn/ip'
+        '4KWk//2X2wZrcKPe3znN+8e6gH/txqOS1x41xqPGeNQYjxrjUWPMaYw5jTGnMeY0xpzGmNMYcxpj'
+        'TmPMaYw5jTGnMeY0xpzGmNMYcxpjTmPMaYw5jTGnMeY0xpzGmNMYcxpjTmPMaYw5jTGnMeY0xpzG'
+        'mNMYcxpjTmPMaYw5jTGnMeY0xpzGmNMYcxpjTmPMaYw5jTGnMeY0xpzGmNMYcxpjTmPMaYw5jTGn'
+        'MeY0xpzGmNMYcxpjTmPMaYw5jTGnMeY0xpzGmNMYcxpjTmPMaYw5jTGnMeY0xpzGmNMYcxpjTmPM'
+        'aSwwp8oNMvPXyIxDZhwy45AZh8y4WBtHzjhyxpEzjpxx5IwjZxw548gZR844csaRM46cceSMI2cc'
+        'OePIGUfOOHLGkTOOnHHkjCNnHDnjyBlHzjhyxpEzjpxx5IwjZxw548gZR844csaRM46cceSMI2cc'
+        'OePIGUfOOHLGkTOOnHHkjCNnHDnjyBlHzjhyxpEzjpxx5IwjZxw548gZR844csaRM46cceSMI2cc'
+        'OePIGUfOOHLGkTOOnHHkjCNnHDnjyBlHznhAzl9/Rq7Y7p+p+pF7C5Xb1dvtHv3tgu25umD7H27f'
+        'sHrrRLdO9PudKHjN691/0Hld8u0rVr+U7rT1tHOKmeCc4t+4/00I3xIc5/2bHfv6zc6PX9tZwP9C'
+        'p6K/ovOp9KeS253m9RPX//LrO58PDN5i+F8Ga+P/8Qthe8HLgf/uvf/Qrf/d+t9tE7t1vc/R9XZu'
+        'dhvedb3bMG23Ydpuw7Tdhmm7DdO2GaZtM0zbZpi2zTBtm2HaNsO0bYZp2wzTthmmbTNM22aYts0w'
+        'bZth2jbDtG2GadsM07YZpm0zTNtmmLbNMG2bYdo2w7RthmnbDNO2GaZtM0zbZpi2zTBtm2HaNsO0'
+        'bYZp2wzTthmmbTNM22aYts0wbZth2jbDtG2GadsM07YZpm0zTNtmmLbNMG2bYdo2w7RthmnbDNO2'
+        'GaZtM0zbZpi2zTBtm2HaNsO0bYZp2wzTthmmbTNM22aYts0wbZth2jbDtG2GadsM07YZpm0zTNtm'
+        'mLbNMG2bYdo2w7RthmnbDNO2GaaDbYb/6Uu11xvsyf5eZ0/2GblZXr3+3EPy1Z228D/f+9HDnT/w'
+        'K4Mu8b/cvMT3lTcv8f0nz7t/nL1JejOkN0N6M6Q3Q3ozNvpmKHCGAmcocIYCZyhwhgJnKHCGAmco'
+        'cIYCZyhwhgJnKHCGAmcocIYCZyhwhgJnKHCGAmcocIYCZyhwhgJnKHCGAmcocIYCZyhwhgJnKHCG'
+        'AmcocIYCZyhwhgJnKHCGAmcocIYCZyhwhgJnKHCGAmcocIYCZyhwhgJnKHCGAmcocIYCZyhwhgJn'
+        'KHCGAmcocIYCZ0hvhvRmSG+G9GZIb4b0ZkhvhvRmSG+G9GZIb4b0ZkhvhvRmAun9rdtTts+KU7af'
+        '+orONzN8MnhA9m2dpd1NgbzfKJ8tPfL+idmf7vwtvqSl8vbU7bPw1O3fvqmXP3tdL9MyLi3j0jIu'
+        'LePSMi4t49IyLi3j0jIuLePSzk6mRV1a1KVFXVrUpZ2dTEu8tMRLS7y0xEtLvLTES0u8tMRLS7y0'
+        's5NpwZcWfGnBlxZ8acGXFnxpwZcWfGnBlxZ8acGXFnxpZyfT8i8t/9LyLy3/0vIvLf/S8i8t/9Ly'
+        'Ly3/0vIvLf/S8i8t/9LyLy3/0vIvLf/S8i8t/9LyLy3/0s5OpsVgWgymxWBaDKalU1oapqVhWh9N'
+        'C8W0UEwLxbRQTDs7mXZ2Mi0i0yIyLSLTIjItItPOTqYlZVpSpiVlWlKmnZ1MOzuZdnYy7exk2tnJ'
+        'tLOTaWcn085Opp2dTDs7mXZ2Mu3sZNrZybSzk2lnJ9POTqadnUw7O5l2djId5PT/2sH+tzu++Tud'
+        'Fz49/zs+9q0fD8LgBZ2do+Aj4m/t9NjgC1V6gjc9/Z37nx1/LPjU7O4z7EDFp57/vsen7gZ/h/nO'
+        '3+FzadpBf/9o5+/9eevcP3jjLz967S9Z/pLlL1n+kuUvWf6S5S9Z/pLlL1n+kuUvWf6S5S9Z/pLl'
+        'L1n+kuUvWf6S5S9Z/pLlL1n+kuUvWf6S5S9Z/pLlL1n+kuUvWf6S5S9Z/pLlL1n+kuUvWf6S5S9Z'
+        '/pLlL1n+kuUvWf6S5S9Z/pLlL1n+kuUvWf6S5S9Z/pLlL1n+kuUvWf6S5S9Z/pLlL1n+kuUvWf6S'
+        '5S9Z/pLlL1n+kuUvWf6S5S9Z/pLlL1n+kuUvWf6S5S9Z/pLlL1n+kuUvWf6S5S9Z/pLlL1n+kuUv'
+        'Wf6S5S9Z/pLlL1n+kuUvWf6S5S9Z/pLlL1n+kuUvWf6S5S9Z/pLlL1n+kuUvWf6S5S9Z/pLlL1n+'
+        'kg385e/eYP/YNfbzsJ+H/Tzs52E/j/d5vM/jfR7v83ifB/o80OeBPg/0eYTPI3we4fMIn0f4PMLn'
+        'ET6P8HmEz0N7Htrz0J6H9jy056E9D+15aM9Dex7a89Ceh/Y8pucxPY/peUzPY3oe0/OYnsf0PKbn'
+        'MT2P6XlMz2N6HtPzmJ7H9Dym5zE9j+l5TM9jeh7T82CeB/M8mOfBPI/ieRTPo3gexfMonkfxPIrn'
+        'cTuP23nczuN2HrfzgJ0H7Dxg5wE7TzzzATJ/7/63PL8gyJe9G4Lee03QAoIWELSAoAUELSBoAUEL'
+        'CFpA0AKCFhC0gKAFBC0gaAFBCwhaQNACghYQtICgBQQtIGgBQQsIWkDQAoIWELSAoAUELSBoAUEL'
+        'CFpA0AKCFhC0gKAFBC0gaAFBCwhaQNACghYQtICgBQQtIGgBQQsIWkDQAoIWELSAoAUELSBoAUEL'
+        'CFpA0AKCFhC0gKAFBC0gaAFBCwhaQNACghYQtICgBQQtIGgBQQsIWkDQAoIWELSAoAUELSBoISDo'
+        '798gc3CNTA4yOcjkIJODTE7W5pCTQ04OOTnk5JCTk7U5AOUAlANQDkA5WZvDUQ5HORzlcJTDUQ5H'
+        'ORzlcJTDUU7W5uCUg1MOTjk45eCUg1MOTjk45eCUg1MOTjk45WRtDlU5VOVQlUNVDlU5VOVQlUNV'
+        'DlU5VOVQlUNVDlU5VOVQlUNVDlU5VOVQlUNVDlU5VOVkbQ5cOXDlwJUDV87NzmEsh7EcxnIYy2Es'
+        'h7EcxnKyNidrc4jLIS6HuBzicojLydoc8HLAywEvB7ycrM3J2pyszcnanKzNydqcrM3J2pyszcna'
+        'nKzNydqcrM3J2pyszcnanKzNydqcrM0F2P+Dm9ePrNy8fuQf4X8R/4v4X8T/Iv4X8b+I/0X8L+J/'
+        'Ef+L+F8E/iLwF4G/CPxFxC8ifhHxi4hfRPwi4hcRv4j4RcQvQn0R6otQX4T6ItQXob4I9UWoL0J9'
+        'EeqLUF+E+iLGFzG+iPFFjC9ifBHjixhfxPgixhcxvojxRYwvYnwR44sYX8T4IsYXMb6I8UWML2J8'
+        'EeOL4F4E9yK4F8G9iOpFVC+iehHVi6heRPUiqhdxvIjjRRwv4ngRx4sAXgTwIoAXAbxITIsBQv/w'
+        'aZ83+HgnfX/o/sOBlwYPB/ZvXk7+O8BaAtYSsJaAtQSsJWAtAWsJWEvAWgLWErCWgLUErCVgLQFr'
+        'CVhLwFoC1hKwloC1BKwlYC0BawlYS8BaAtYSsJaAtQSsJWAtAWsJWEvAWgLWErCWgLUErCVgLQFr'
+        'CVhLwFoC1hKwloC1BKwlYC0BawlYS8BaAtYSsJaAtQSsJWAtAWsJWEvAWgLWErCWgLUErCVgLQFr'
+        'CVhLwFoC1hKwloC1BKwlYC0BawlYS8BaAtYSsJaAtQSsJWAtAWspAOvgHke/1OGoO3jZ9D+6Sehv'
+        'vE7oZSAtA2kZSMtAWgbSMpCWgbQMpGUgLQNpGUjLQFoG0jKQloG0DKRlIC0DaRlIy0BaBtIykJaB'
+        'tAykZSAtA2kZSMtAWgbSMpCWgbQMpGUgLQNpGUjLQFoG0jKQloG0DKRlIC0DaRlIy0BaBtIykJaB'
+        'tAykZSAtA2kZSMtAWgbSMpCWgbQMpGUgLQNpGUjLQFoG0jKQloG0DKRlIC0DaRlIy0BaBtIykJaB'
+        'tAykZSAtA2kZSMtAWgbSMpCWA5D+cecA049e7/X/550tml/p/NNGJ/E6XzudnOvsUR3e8PU913yt'
+        '4GsFXyv4WsHXCr5W8LWCrxV8reBrBV8r+FrB1wq+VvC1gq8VfK3gawVfK/hawdcKvlbwtYKvFXyt'
+        '4GsFXyv4WsHXCr5W8LWCrxV8reBrBV8r+FrB1wq+VvC1gq8VfK3gawVfK/hawdcKvlbwtYKvFXyt'
+        '4GsFXyv4WsHXCr5W8LWCrxV8reBrBV8r+FrB1wq+VvC1gq8VfK3gawVfK/hawdcKvlbwtYKvFXyt'
+        '4GsFXyv4WsHXCr5W8LUS8PW//cHbmfdQ++rP5zcnfCk/UPcZ9yr/96cfEvyqjrKyTz4WXJ1/8nnY'
+        '7P3Un/iOj33yk9/88VywR1vsXM0HV+zez/x657CB63bvR3+y86PPw2frPvWCTz71HQvf/MTT/9vf'
+        '1PmrfZor+6nQwrd+4pO/77d+pPNbP8cL/qmv/ugHH5ua+cijqRnfmPBE5//s070A7e7Uw5/pDWg/'
+        'fNO8/ilDW2do6wxtnaGtM7R1hrbO0NYZ2jpDW2do6wxtnaGtM7R1hrbO0NYZ2jpDW2do6wxtnaGt'
+        'M7R1hrbO0NYZ2jpDW2do6wxtnaGtM7R1hrbO0NYZ2jpDW2do6wxtnaGtM7R1hrbO0NYZ2jpDW2do'
+        '6wxtnaGtM7R1hrbO0NYZ2jpDW2do6wxtnaGtM7R1hrbO0NYZ2jpDW2do6wxtnaGtM7R1hrbO0NYZ'
+        '2jpDW2do6wxtnaGtM7R1hrbO0NYZ2jpDW2do6wxtnaGtM7R1hrbO0NYDyf7T58IbBQPx/NmOlXzW'
+        'D2R+5PYzHrdnnG/POD97zjgHHyT49XsSfw4cdv5nN+uXH7lev5TFfVncl8V9WdyXxX1Z3JfFfVnc'
+        'l8V9WdyX7WCXpX5Z6pelflnql+1gl4V/WfiXhX9Z+JeFf1n4l4V/WfiXhX/ZDnZZByjrAGUdoKwD'
+        'lHWAsg5Q1gHKOkBZByjrAGUdoKwDlO1gl1WBsipQVgXKqkBZFSirAmVVoKwKlFWBsipQVgXKqkBZ'
+        'FSirAmVVoKwKlFWBsipQVgXKqkBZFSirAmU72GWNoKwRlDWCskZQltBlxaCsGJQVg7JiUFYMyopB'
+        'WTEo28Eu28EuqwllNaGsJpTVhLKaULaDXdYWytpCWVsoawtlO9hlO9hlO9hlO9hlO9hlO9hlO9hl'
+        'O9hlO9hlO9hlO9hlO9hlO9hlO9hlO9hlO9hlO9hlO9hlO9jloKv88xvsh66x34D9Buw3YL8B+w3Y'
+        'b8B+A/YbsN+A/QbsN/C+gfcNvG/gfQPoG0DfAPoG0DeAvgH0DaBvAH0D6BsI30D4BsI3EL6B8A2E'
+        'byB8A+EbCN9A+AbCNxC+Ae0NaG9AewPaG9DegPYGtDegvQHtDWhvQHsD2hvQ3oD2BrQ3oL0B7Q1o'
+        'b0B7A9ob0N6A9gamNzC9gekNTG+AeQPMG2DeAPMGmDfAvAHmDfhuwHcDvhvw3YDvBm43cLuB2w3c'
+        'btDQRkDO0Q0577gmZxM5m8jZRM4mcjYhswmZTchsQmYTMpuQ2YTMJmQ2IbMJmU3IbEJmEzKbkNmE'
+        'zCZkNiGzCZlNyGxCZhMym5DZhMwmZDYhswmZTchsQmYTMpuQ2YTMJmQ2IbMJmU3IbEJmEzKbkNmE'
+        'zCZkNiGzCZlNyGxCZhMym5DZhMwmZDYhswmZTchsQmYTMpuQ2YTMJmQ2IbMJmU3IbEJmEzKbkNmE'
+        'zCZkNiGzCZlNyGxCZhMym5DZhMwmZDYhsxkg8y/+gh3Du43g0caP3hC0d01QBUEVBFUQVEFQhfdU'
+        'gFQBUgVIFSBVgFQRuRU8VfBUwVMFTxWRW4FVBVYVWFVgVYFVBVYVWFVgVYFVReRW0FVBVwVdFXRV'
+        '0FVBVwVdFXRV0FVBVwVdFXRVRG4FZBWQVUBWAVkFZBWQVUBWAVkFZBWQVUBWAVkFZBWQVUBWAVkF'
+        'ZBWQVUBWAVkFZBWQVURuBWsVrFWwVsFaxb2vQK4CuQrkKpCrQK4CuQrkKiK3InIrAKwAsALACgAr'
+        'AKyI3AoOKzis4LCCw4rIrYjcisitiNyKyK2I3IrIrYjcisitiNyKyK2I3IrIrYjcisitiNyKyK2I'
+        '3IrIrQQqqN1/aJz89vvPjH8M/lvw34L/Fvy34L8F/y34b8F/C/5b8N+C/xbut3C/hfst3G8Bfgvw'
+        'W4DfAvwW4LcAvwX4LcBvAX4L6VtI30L6FtK3kL6F9C2kbyF9C+lbSN9C+hbStyC+BfEtiG9BfAvi'
+        'WxDfgvgWxLcgvgXxLYhvQXwL4lsQ34L4FsS3IL4F8S2Ib0F8C+JbEN/C9ha2t7C9he0tUG+BegvU'
+        'W6DeAvUWqLdAvQXjLRhvwXgLxlsw3sLvFn638LuF3y1a2goIOr4h6C/eJ+ifI2gbQdsI2kbQNoK2'
+        'EbSNoG0EbSNoG0HbCNpG0DaCthG0jaBtBG0jaBtB2wjaRtA2grYRtI2gbQRtI2gbQdsI2kbQNoK2'
+        'EbSNoG0EbSNoG0HbCNpG0DaCthG0jaBtBG0jaBtB2wjaRtA2grYRtI2gbQRtI2gbQdsI2kbQNoK2'
+        'EbSNoG0EbSNoG0HbCNpG0DaCthG0jaBtBG0jaBtB2wjaRtA2grYRtI2gbQRtI2gbQdsI2kbQNoK2'
+        'EbSNoO2AoPpN9D56Hb07yNlBzg5ydpCzA5kdyOxAZgcyO5DZgcwOZHYgswOZHcjsQGYHMjuQ2YHM'
+        'DmR2ILMDmR3I7EBmBzI7kNmBzA5kdiCzA5kdyOxAZgcyO5DZgcwOZHYgswOZHcjsQGYHMjuQ2YHM'
+        'DmR2ILMDmR3I7EBmBzI7kNmBzA5kdiCzA5kdyOxAZgcyO5DZgcwOZHYgswOZHcjsQGYHMjuQ2YHM'
+        'DmR2ILMDmR3I7EBmBzI7kNmBzA5kdiCzA5mdAJn/4waZk2tkqpCpQqYKmSpkqsymipwqcqrIqSKn'
+        'ipyqtlYFUBVAVQBVAVTV1qo4quKoiqMqjqo4quKoiqMqjqo4qmprVThV4VSFUxVOVThV4VSFUxVO'
+        'VThV4VSFUxVOVW2tiqoqqqqoqqKqiqoqqqqoqqKqiqoqqqqoqqKqiqoqqqqoqqKqiqoqqqqoqqKq'
+        'iqoqqqraWhVcVXBVwVUFV9XNrmKsirEqxqoYq2KsirEqxqraWlVbqyKuirgq4qqIqyKuqq1VgVcF'
+        'XhV4VeBVtbWqtlbV1qraWlVbq2prVW2tqq1VtbWqtlbV1qraWlVbq2prVW2tqq1VtbWqtlbV1qoB'
+        '9v+yg31h/nfnLzp5+6rOUYfG7Sdtb7/P5kv/9OL+x2/jnY/f3n6y9vaTtTfPMprP5gfQwYPleOc9'
+        'WZ/3t3D8n51TNi/tyOZei/lE5/Vc9yrKDwY2/2OdS/ZLnZ//c8HP/8yTfy/4+X91/wtLZ4P3fP34'
+        '014E9oFgE+tf35wS+RmtaF8r2teK9rWifa1oXyva14r2taJ9rWhfK9rXivbVoX11aF8d2leH9vWg'
+        'fT1oXw/a14P29aB9PWhfD9rXg/b1oH0FaF8B2leA9hWgfQVoXwHaV4D2FaB9BWhfAdpXgPYVoH3N'
+        'Z1/z2dd89jWffc1nX/PZ13z2NZ99zWdf89nXfPY1n33NZ1/z2dd89jWffc1nX/PZ13z2NZ99zWdf'
+        '89lXefZVnn2VZ1/l2dd19nWdfV1nX9fZ13X2dZ19XWdfu9nXbva1m33tZl+72Vdr9tWafbVmX63Z'
+        'V7H2A7L+r/uvhPmODkY/cYPRP4TRIYwOYXQIo0MYHeLnED+H+DnEzyF+DvFziJ9D/Bzi5xA/h/g5'
+        'xM8hfg7xc4ifQ/wc4ucQP4f4OcTPIX4O8XOIn0P8HOLnED+H+DnEzyF+DvFziJ9D/Bzi5xA/h/g5'
+        'xM8hfg7xc4ifQ/wc4ucQP4f4OcTPIX4O8XOIn0P8HOLnED+H+DnEzyF+DvFziJ9D/Bzi5xA/h/g5'
+        'xM8hfg7xc4ifQ/wc4ucQP4f4OcTPIX4O8XOIn0P8HAbg/N/3Pw1+N7Ck/+fGub772rl+WP394eB3'
+        '/5unOdYHA8c6uf73k6/t/Ojf+jj6vX/9u67/9X8R/Hs/ebPcSzyMyBoia4isIbKGyBpjqwGzBswa'
+        'MGvArAGzZrlXw2cNnzV81vBZs9yrwbQG0xpMazCtwbQG0xpMazCtwbRmuVdDaw2tNbTW0FpDaw2t'
+        'NbTW0FpDaw2tNbTW0Fqz3KuBtgbaGmhroK2BtgbaGmhroK2BtgbaGmhroK2BtgbaGmhroK2Btgba'
+        'GmhroK2BtgbamuVeDbs17NawW8NujRfVIFyDcA3CNQjXIFyDcA3CNcu9muVeDdA1QNcAXQN0DdA1'
+        'y70armu4ruG6huua5V7Ncq9muVez3KtZ7tUs92qWezXLvZrlXg3vNcu9muVezXKvZrlXs9yrWe7V'
+        'LPdqlns1y71agP1PPfjs6zX2ddjXYV+HfR32ddjXYV+HfR32ddjXYV+HfR32ddjXYV+HfR32ddjX'
+        'YV+HfR32ddjXYV+HfR32ddjXYV+HfR32ddjXYV+HfR32ddjXYV+HfR32ddjXYV+HfR32ddjXYV+H'
+        'fR32ddjXYV+HfR32ddjXYV+HfR32ddjXYV+HfR32ddjXYV+HfR32ddjXYV+HfR32ddjXYV+HfR32'
+        'ddjXYV+HfR32ddjXYV+HfR32ddjXYV+HfR32ddjXYV+HfR32ddjXYV+HfR32ddjXYV+HfR32ddjX'
+        'YV+HfR32ddjXYV+HfR32ddjXYV+HfR32ddjXA+xb16+zTf6HTiac3ojgo9ciaBJBkwiaRNAkgiYR'
+        'NImgSQRNImgSQZMImkTQJIImETSJoEkETSJoEkGTCJpE0CSCJhE0iaBJBE0iaBJBkwiaRNAkgiYR'
+        'NImgSQRNImgSQZMImkTQJIImETSJoEkETSJoEkGTCJpE0CSCJhE0iaBJBE0iaBJBkwiaRNAkgiYR'
+        'NImgSQRNImgSQZMImkTQJIImETSJoEkETSJoEkGTCJpE0CSCJhE0iaBJBE0iaBJBkwiaRNAkgiYR'
+        'NImgSQRNImgSQZMImkTQJIImETSJoEkETSJoEkGTCJpE0CSCJhE0iaBJBE0iaBJBkwiaRNAkgiYR'
+        'NImgSQRNImgSQTMQwdl9EfyVjgh+uiOC4EXO0UAEv/nkj/sv/3jwm3/m2bDGDtbS39P5PMcX7U2X'
+        'P/tcOPzeuRqda5u8+jQfK/m0l+XnniuX5elXI8DvqQ5+n/G6/Pwf+uGv9pf9h79+4fbbVG8/IfHH'
+        'ecZw8z1Kn7wnldtPS9x+N8/n93HCL94sB37j+sn/qeXAqeXAqeXAqeXAqeXAqeXAqeXAqeXAqeXA'
+        'qeXAqXXAqXXAqXXAqXXAqQXAqQXAqQXAqQXAqQXAqQXAqQXAqQXAqQXAqeZ/qvmfav6nmv+p5n+q'
+        '+Z9q/qea/6nmf6r5n2r+p5r/qcp/qvKfqvynKv+pyn+q8p+q/Kcq/6nKf6ryn6r8pyr/qcp/qvKf'
+        'qvynKv+pyn+q8p+q/Kcq/6nKf6ryn+r6p7r+qa5/quufKvmnSv6pkn+q5J8q+adK/qmSf6rWn6r1'
+        'p2r9qVp/qtaf6vOn+vypPn+qz59aW5wGJfmX7m9VzgTvoPh3tx8AvI232w8A3n7JyWcTbj59GP3e'
+        'H/gipdwve47SeVnA84I3m3xl58udgq9w+pVOQV/Use5mO2/t/donnvj2j33ym+af+MQnv/2TT3zH'
+        'wlOfeOINwYsGZjqvE3Bjn0r+6tPPDt39nYc7/1+/1vm5n5n/PY9s3u8/8Os3Cfvm64RtS9i2hG1L'
+        '2LaEbYvWtmhti9a2aG2L1rZobYvWtmhti9a2aG2L1rZobYvWtmhti9a2aG2L1rZobYvWtmhti9a2'
+        'aG2L1rZobYvWtmhti9a2aG2L1rZobYvWtmhti9a2aG2L1rZobYvWtmhti9a2aG2L1rZobYvWtmht'
+        'i9a2aG2L1rZobYvWtmhti9a2aG2L1rZobYvWtmhti9a2aG2L1rZobYvWtmhti9a2aG2L1rZobYvW'
+        'tmhti9a2aG2L1rZobYvWdhCtv9H5+u3nP/6+u15wEet89/bzH3vX4374SwFr7Xvxu9/54YeDJ4W/'
+        'eUPZk9eUXaDsAmUXKLtA2YUedwG2C7BdgO0CbBdguwDbBdguwHYBtguwXYDtAmwXYLsA2wXYLsB2'
+        'AbYLsF2A7QJsF2C7ANsF2C7AdgG2C7BdgO0CbBdguwDbBdguwHYBtguwXYDtAmwXYLsA2wXYLsB2'
+        'AbYLsF2A7QJsF2C7ANsF2C7AdgG2C7BdgO0CbBdguwDbBdguwHYBtguwXYDtAmwXYLsA2wXYLsB2'
+        'AbYLsF2A7QJsF2C7ANsF2C7AdgG2iwC28xtyfueanCvkXCHnCjlXyLlCzhVyrpBzhZwr5Fwh5wo5'
+        'V8i5Qs4Vcq6Qc4WcK+RcIecKOVfIuULOFXKukHOFnCvkXCHnCjlXyLlCzhVyrpBzhZwr5Fwh5wo5'
+        'V8i5Qs4Vcq6Qc4WcK+RcIecKOVfIuULOFXKukHOFnCvkXCHnCjlXyLlCzhVyrpBzhZwr5Fwh5wo5'
+        'V8i5Qs4Vcq6Qc4WcK+RcIecKOVfIuULOFXKukHOFnCvkXCHnCjlXyLlCzhVyrgJyfutpxw9+MDh+'
+        '8Ns3LK1es/TQ8wOWgvHVxh0jZLzAeKHRZbzIeLHxNcbXGt1Gj/ESo9d4qdFn9BsDxsuMlxuvML7O'
+        'GDTCRsSIGq80vt6IGUPGsPEq49VG3HiNMWK81kgYrzNGjdcbbzDGjDca48aE8SbjzcZbjLcabzMm'
+        'jbcb7zDeabzLeLfxqPGYMWW8x3ivMW28z3i/kTQ+YNw1PmikjA8ZHzZmjI8YjxsfNWaD8VTyd572'
+        'qsxCB6V//1x61nD3Tz/vs33Y8B+edqG+oXOhfvdGc3/vWnOP0NwjNPcIzT1Cc4/Q3CM09wjNPUJz'
+        'j9DcIzQXjILxtUa30WO8xPi3Rq/xUqPP6DcGjJcZLzdeYXyd8ZPGoBE2IkbUeKXx9UbMGDKGjVcZ'
+        'rzbixk8ZrzFGjNcaCeN1xqjxeuMNxpjxRmPcmDDeZLzZeIvxVuNtxqTxduMdxjuNdxkt493Go8Zj'
+        'xpQxa7zHeK8xbbzPeL+RND5gnBpnxl3jg0bK+JDxYeOnjRnjI8bjxkeNnzF+1vg54+eNXzB+0fgl'
+        '498Zv2z8ivGrxq8Zv278htE2ftM4N37L+O1gPJW8eC4+dPsMrsBDXvz8zrrg8va6uC7BNXlF5wFj'
+        '4JtXNzb5wWub7GKTXWyyi012sckuNtnFJrvYZBeb7GKTXWyyiz928ccu/tjFH7sYYxdj7GKMXYyx'
+        'izF2McYuxtjFGLsYYxdH7OKIXRyxiyN2ccQujtjFEbs4YhdH7OKIXRyxiyN2scIuVtjFCrtYYRcr'
+        '7GKFXaywixV2scIuVtjFCrtYYRcr7GKFXaywixV2scIuVtjFCrtYYRcr7GKFXTywiwd28cAuHtjF'
+        '/LqYXxfz62J+Xcyvi/l1Mb8udtfF7rrYXRe762J3XXyui8918bkuPtfFc7sCp/m9z1VRAYHRTrJ/'
+        'GXrOU8n/t7Nz9lPXVeTR+x9W/0Xi6iaubuLqJq5u4uomrm7i6iaubuLqJq5u4uomrm7i6iaubuLq'
+        'Jq5u4uomrm7i6iaubuLqJq5u4uomrm7i6iaubuLqJq5u4uomrm7i6iaubuLqJq5u4uomrm7i6iau'
+        'buLqJq5u4uomrm7i6iaubuLqJq5u4uomrm7i6iaubuLqJq5u4uomrm7i6iaubuLqJq5u4uomrm7i'
+        '6iaubuLqJq5u4uomrm7i6iaubuLqJq5u4uomrm7i6iaubuLqJq5u4uomrm7i6oyn7v5HD90+N7p9'
+        'bvTFeW4UPHW4++jDX+pvNL19gvRsOR5x96GHrs+N3v2Bztdn3X34oZvPcv1jQdcv6PoFXb+g6xd0'
+        '/YKuX9D1C7p+Qdcv6PoFXb+g6xd0/YKuX9D1C7p+Qdcv6PoFXb+g6xd0/YKuX9D1C7p+Qdcv6PoF'
+        'Xb+g6xd0/YKuX9D1C7p+Qdcv6PoFXb+g6xd0/YKuX9D1C7p+Qdcv6PoFXb+g6xd0/YKuX9D1C7p+'
+        'Qdcv6PoFXb+g6xd0/YKuX9D1C7p+Qdcv6PoFXb+g6xd0/YKuX9D1C7p+Qdcv6PoFXb+g6xd0/YKu'
+        'X9D1C7p+Qdcv6PoFXb+g6xd0/YKuX9D1B0H3vIf+WDXyo1+uNfLu8x+6f5DkE5095LtfcSOxu999'
+        'vVIbpLFBGhuksUEaG6SxQRobpLFBGhuksUEaG6SxQRobpLFBGhuksUEaG6SxQRobpLFBGhuksUEa'
+        'G6SxQRobpLFBGhuksUEaG6SxQRobpLFBGhuksUEaG6SxQRobpLFBGhuksUEaG6SxQRobpLFBGhuk'
+        'sUEaG6SxQRobpLFBGhuksUEaG6SxQRobpLFBGhuksUEaG6SxQRobpLFBGhuksUEaG6SxQRobpLFB'
+        'GhuksUEaG6SxQRobpLFBGhuksUEaG6SxQRobDDT2lQ/QaV2jE4FOBDoR6ESgE4FOBDoR6ESgE4FO'
+        'BDoRe6ERBEUQFEFQBEERe6ERIEWAFAFSBEgRIEWAFAFSBEgRIEXshUbwFMFTBE8RPEXwFMFTBE8R'
+        'PEXwFMFTBE8RPEXshUZgFYFVBFYRWEVgFYFVBFYRWEVgFYFVBFYRWEVgFYFVBFYRWEVgFYFVBFYR'
+        'WEVgFYFVxF5oBF0RdEXQFUFXxN2OgCwCsgjIIiCLgCwCsgjIIvZCI/ZCI5CLQC4CuQjkIpCL2AuN'
+        'IC+CvAjyIsiL2AuN2AuN2AuN2AuN2AuN2AuN2AuN2AuN2AuN2AuN2AuN2AuN2AuN2AuN2AuN2AuN'
+        '2AuN2AuN2AuNBNz/iY6FBt8p/f1BS/mqh+5/z9hu53DA3UcetJZjshgmi2GyGCaLYbIYJothshgm'
+        'i2GyGCaLYbIYpodhehimh2F6GCaEYUIYJoRhQhgmhGFCGCaEYUIYJoRhChimgGEKGKaAYQoYpoBh'
+        'ChimgGEKGKaAYQoYpoBh6A9Dfxj6w9Afhv4w9IehPwz9YegPQ38Y+sPQH4b+MPSHoT8M/WHoD0N/'
+        'GPrD0B+G/jD0hzE/jPlhzA9jfhjsw2AfBvsw2IfBPgz2YbAPw3sY3sPwHob3MLyHcT2M62FcD+N6'
+        'mMaGA7K++iHHnO6h9Fefd73Fc/ex6w8OxkEUB1EcRHEQxUEUB1EcRHEQxUEUB1EcRHEQxUEUB1Gc'
+        'qcaxFMdSHEtxLMWxFMdSHEtxLMWxFGeqcUjFIRWHVBxScUjFIRWHVBxScUjFIRWHVBxScaYaR1Yc'
+        'WXFkxZEVR1YcWXFkxZEVR1YcWXFkxZEVR1YcWXFkxZEVR1YcWXFkxZEVR1YcWXGmGgdYHGBxgMUB'
+        'FnfD4ziL4yyOszjO4jiL4yyOszhTjTPVOOriqIujLo66OOriTDUOvjj44uCLgy/OVONMNc5U40w1'
+        'zlTjTDXOVONMNc5U40w1zlTjTDXOVONMNc5U40w1zlTjTDXOVOMB+nceCr5k7ys731b04Y6Lhh60'
+        'i6+6VkCCAhIUkKCABAUkKCBBAQkKSFBAggISFJCggAQFJCggQQEJ6Cegn4B+AvoJ6Cegn4B+AvoJ'
+        '6Ccwn8B8AvMJzCcwn8B8AvMJzCcwn8B8AvMJzCfAngB7AuwJsCfAngB7AuwJsCfAngB7AuwJsCfA'
+        'ngB7AuwJsCfAngB7AuwJsCfAngB7AuUJlCdQnkB5At4JeCfgnYB3At4JeCfgnQB0AtAJQCcAnQB0'
+        'AskJJCeQnEBygqoSAUsveIDOe66L6Sh0RqEzCp1R6IxiZhQzo5gZxcwoZkYxM4qZUcyMYmYUM6OY'
+        'GcXMKGZGMTOKmVHMjGJmFDOjmBnFzChmRjEziplRzIxiZhQzo5gZxcwoZkYxM4qZUcyMYmYUM6OY'
+        'GcXMKGZGMTOKmVHMjGJmFDOjmBnFzChmRjEziplRzIxiZhQzo5gZxcwoZkYxM4qZUcyMYmYUM6OY'
+        'GcXMKGZGMTOKmVHMjGJmFDOjmBnFzChmRjEziplRzIxiZjRg5oUBM1/VYaYnsJuvfvIN7v0b3Ptg'
+        'PGx0Gy81+oyXGa8wvs4YNL7eiBmvNuLGa43XGa833mC8yZg03m6803iX8W7jvca08X7jg0bKmDE+'
+        'YnzU+ArjEeOOETJeYLzQ6DJeZLzY6DFeYvQa/caA8XIjbESMqPFKY8gYNl5lvMYYMRLGqDFmvNEY'
+        'NyaMNxtvMd5qvM14h/Go8ZgxZcwa7zHeZySNDxh3jQ8ZHzYeD8ZTd7sees58Wdlbnv9H+LKyuy96'
+        'IK2PXUtrgrQmSGuCpiZoaoKmJmhqgqYmaGqCpiZoaoKmJmhqgqYmaGqCpiZoaoKmJmhqgqYmaGqC'
+        'piZoaoKmJmhqgqYmaGqCpiZoaoKmJmhqgqYmaGqCpiZoaoKmJmhqgqYmaGqCpiZoaoKmJmhqgqYm'
+        'aGqCpiZoaoKmJmhqgqYmaGqCpiZoaoKmJmhqgqYmaGqCpiZoaoKmJmhqgqYmaGqCpiZoaoKmJmhq'
+        'gqYmaGqCpiZoaoKmJmhqgqYmaGqCpiZoaoKmJmhqItDUix+6/UD37ZPLZ+Yn3q4/KX73u76QL429'
+        '/UT3M/yR5dd01q2db/FOnnZWrV/7YOnxvddLj0lZMGnpMSkSJkXCpEiYFAmTImFSJEyKhElROSkq'
+        'J0XlpJyYlBOTcmJSfk7Kz0mpMSk1JqXppPCYFKqTQnVSqE5KlEmJMilRJiXKpMCdFLiT8mVSvkzK'
+        'l0kpPCmFJ6XNpLSZlMmTQmdSNE/KnkkJPSmhJyXRpCSalESTkmhSek8KpEmBNCmQJgXSpGSflOyT'
+        '4mlSwE8K+EkBPymzJmXWpMyaFFaTwn9S+E+KrkkdYFKCTUqwSQk2qRhMKgaT8mxSnk2qCZNqwqR0'
+        'm9QWJmXkZJB13Q897QMePxzsJPc8dP+dueHgYd1L/tCK+fl8u8unOlS/6B7Dz7TXvNztfaCyP3Wt'
+        'sikqm6KyKSqborIpKpuisikqm6KyKSqborIpKpuisikqm6KyKSqborIpKpuisikqm6KyKSqborIp'
+        'Kpuisikqm6KyKSqborIpKpuisikqm6KyKSqborIpKpuisikqm6KyKSqborIpKpuisikqm6KyKSqb'
+        'orIpKpuisikqm6KyKSqborIpKpuisikqm6KyKSqborIpKpuisikqm6KyKSqborIpKpuisikqm6Ky'
+        'KSqborIpKpuisikqm6KyKSqborIpKpuisqlAZS996Ll2Yjt4u9aP3RPJH7hI63vo/idcvzewmv4H'
+        'EvvL1xJLkliSxJIkliSxJG0laStJW0naStJWkraStJWkrSRtJWkrSVtJ2krSVpK2krSVpK0kbSVp'
+        'K0lbSdpK0laStpK0laStJG0laStJW0naStJWkraStJWkrSRtJWkrSVtJ2krSVpK2krSVpK0kbSVp'
+        'K0lbSdpK0laStpK0laStJG0laStJW0naStJWkraStJWkrSRtJWkrSVtJ2krSVpK2krSVpK0kbSVp'
+        'K0lbSdpK0laStpK0laStJG0lA20NPD3BXhE8G33ZA4xef72Ln4JRCkYpGKVglOLUKTSl0JRCUwpN'
+        'KTSlnBFIgSoFqhSoUqBKeZyVwlYKWylspbCVwlYKWylspbCVwlbK46wUxFIQS0EsBbEUxFIQS0Es'
+        'BbEUxFIQS0EsBbGUx1kppKWQlkJaCmkppKWQlkJaCmkppKWQlkJaCmkppKWQlkJaCmkppKWQlkJa'
+        'CmkppKWQlvI4KwW4FOBSgEsBLgWAFO5SuEvhLoW7FO5SuEvhLuVxVsrjrBQKUyhMoTCFwhQKUx5n'
+        'pcCYAmMKjCkwpjzOSnmclfI4K+VxVsrjrJTHWSmPs1IeZ6U8zkp5nJXyOCvlcVbK46yUx1kpj7NS'
+        'HmelPM5KeZyV8jgrFUjh5Q95OcU9IRQ77xPofuKJb83Nf/PHv/WTH8t90zc/8YlPfuzjT0wE7xf4'
+        'cGcvLXjw9WeCN1jcfcUDyfyn1847SzKzJDNLMrMkM0sysyQzSzKzJDNLMrMkM0srs7QySyuztDJL'
+        'JLNEMksks0QySySzRDJLJLNEMksks9QxSx2z1DFLHbPUMUsds9QxSx2z1DFLHbPUMUsds2QxSxaz'
+        'ZDFLFrNkMUsWs2QxSxazZDFLFrNkMUsWs2QxSxazZDFLFrNkMUsWs2QxSxazZDFLFrP0MEsPs/Qw'
+        'Sw+zhDBLCLOEMEsIs4QwSwizhDAL/Vnoz0J/Fvqz0J/F/CzmZzE/i/lZ+psNqPu6h27eYP/nr19B'
+        'nw5+YfDBFuxLr7dg50AxB4o5TzfmsDEHgzkYzLnxc+74nDs+547Puatz7uqcGzjnBs65ZXPu1Zyb'
+        'NOcmzbkRcy72nIs95yrPucpzrvKcKznnSs65hHOu1pyrNef6zLk+cy7MnJ3YOdKZo5k5mpmjmTma'
+        'maOZOZqZo5k58pgjjznymCOIOYKYo4Q50M+Bfg70c6Cfg/kczOdgPgfsOWDPIXoOynPgnQPvHHjn'
+        'wDuH2jnUzqF2DrVzOJ2D5Bwk5yA5B5E5ZM5hcQ6EcyCcA+Ec7OZgNwe0uYCg8HPn6caH/khPNyIP'
+        '7Hr0uuFkMJdh1xnoZaCXgV4GehnoZaCXgV6GMjMaToZAM5SZgWUGlhkNJ4PODNVmqDaD1QxWMzSc'
+        'gWyGlDOknNFwMhSdgXMGzhk4Z+CcofYMtWfAnQF3BtwZFpBhARkNJ4P4DOIzfCED/Ax7yOA/wyUy'
+        'XCJDDRlqyFBDhhoyHCRDFBmiyBBFhigy3CXDXTIkkmEyGSaT0XAyvCZDPhnyyZBPhnwy5JNhRxl2'
+        'lCGmDFfK0FSGpjIaTkbDyVBYhnFlGFeG3jL0ltFwMtwsw80yRJhhahkNJ6PhZDScjIaT0XAyGk5G'
+        'w8loOBkNJ6PhZDScjIaT0XAyGk5Gw8loOBkNJ6PhZDScTGAI0Yf+0PcNv+7L/X3Dd18ZXITOH/9v'
+        'dP7Cb+t8Jvzu1998iiUfLKVjDxzijdeFLsshshwiyyGyHCLLGrKsIcsasqwhyxqyPCHLE7I8IcsT'
+        'sswgywyyzCDLDLLMIMsMsswgywyyzCDLBbJcIMsFslwgywWyXCDLBbJcIMsFslwgywWyXCBL/lny'
+        'z5J/lvyz5J8l/yz5Z8k/S/5Z8s+Sf5b8s+SfJf8s+WfJP0v+WfLPkn+W/LPknyX/LN1n6T5L91m6'
+        'zxJ8luCzBJ8l+CzBZwk+S/BZEs+SeJbEsySeJfEsbWdpO0vbWdrO8plsoK6hG3UFkZTtvAvvGRK8'
+        'n3rk8an04088/qc+FLwgLfmX7v3RPk8C/NRXPfHEuz6Y+qClUfI/u/f//Dl9yGX4wQnsE4LLEVyO'
+        '4HIElyO4nEjO0V2O7nJ0l6O7HN3l6C5Hdzm6y9Fdju5ydJejuxzd5eguR3c5usvRXY7ucnSXo7sc'
+        '3eXoLkd3ObrL0V2O7nJ0l6O7HN3l6C5Hdzm6y9Fdju5ydJejuxzd5eguR3c5usvRXY7ucnSXo7sc'
+        '3eXoLkd3ObrL0V2O7nJ0l6O7HN3l6C5Hdzm6y9Fdju5ydJejuxzd5eguR3c5usvRXY7ucnSXo7sc'
+        '3eXoLkd3ObrL0V0u0N2rntE1N/CC5U6qftE/N/bqTqj9Vue//84g1OK3nyS/+d7e2y/sfda/bdiX'
+        'NLdvv633DzyC4UXC7/3eH3iGf23v3dc8qNwb15U7rwHkNYC8BpDXAPIaQF4DyGsAeQ0grwHkNYC8'
+        'RXleEcgrAnlFIK8I5C3K8/pAXh/I6wN5fSCvD+T1gbw+kNcH8vpA3qI8rxbk1YK8WpBXC/JqQV4t'
+        'yKsFebUgrxbk1YK8WpBXC/IW5XntIK8d5LWDvHaQ1w7y2kFeO8hrB3ntIK8d5LWDvHaQ1w7y2kFe'
+        'O8hrB3ntIK8d5LWDvHaQ1w7y2kHeojyvJOSVhLySkFcS8kI7ryvkdYW8rpDXFfK6Ql5XyOsKeYvy'
+        'vEV5XnPIaw55zSGvOeQ1h7xFeV6ByCsQeQUir0DkLcrzFuV5i/K8RXneojxvUZ63KM9blOctyvMW'
+        '5XmL8rxFed6iPG9Rnrcoz1uU5y3K8xbleYvyfFBfRm6e4k4GKf3am6XoQnCgJPHQs/37rJP/7Avw'
+        'ddZ3X+eDd0++Otg07tjGo9d7eQW2UWAbBbZRYBsFtlFgGwW2UWAbBbZRYBsFflHgFwV+UeAXBX5R'
+        '4BcFflHgFwV+UeAXBX5R4BcFflHgFwV+UeAXBX5R4BcFflHgFwV+UeAXBX5R4BcFflHgFwV+UeAX'
+        'BX5R4BcFflHgFwV+UeAXBX5R4BcFflHgFwV+UeAXBX5R4BcFflHgFwV+UeAXBX5R4BcFflHgFwV+'
+        'UeAXBX5R4BcFflHgFwV+UeAXBX5R4BcFflHgFwV+UeAXBX5R4BcFflHgFwV+UeAXBX5R4BcFflHg'
+        'FwV+UeAXBX5R4BcFflHgFwV+UeAXBX5R4BcFflHgFwV+UeAXBX5R4BcFflHgFwV+UeAXhcAvRn3q'
+        '7p4//M3gcf3rHzwnWrx+TrSK4FUEryJ4FaWrKF3F5SogVwG5isRVtK2ibRVYq8BaxdAqeFZRs4qa'
+        'VWSsuvur7v6q277qtq+636tu5qqbueourrpFq27Rqrux6m6sug2rHhCtEvgqZa9S9ipJr5L0Kkmv'
+        'kvQq9a5S7yrZrhLqKqGuUugqFa5S4SoVrlLhKt2t0t0q3a2S2CqJrdLWKlGtktEqGa2S0SoZrdLP'
+        'Kv2s0s8q/axSzCpVrFLFKlWsksMqAawifxX5q1hfRfcquleBvBrA84YHJet1125ZdDGL3LLomhZd'
+        '0yK3LLq0RZe26NIWXdoi1opKVhFyRcgVXfaiy15kmkVXvwjHIhyL7kXRvSiCs+iWFDFaxGiRaRah'
+        'WnS7im5X0e0qul1FGBdhXHTzim5e0c0rYruI7SLTLLqjRXe0CPiiG1vEfdH9LcK/CP+iu110t4vu'
+        'dtHdLpJG0U0vuulFN73ophfJpkg2RQgUqadIPUWmWSSiIjyK8CjCo8g0iygp0lmRzoqYKZJbETpF'
+        '6BSZZpFpFoFUpMgiRRZhVYRVkWkWybRIpkWsFam1yDSLTLPINItMs8g0i0yzyDSLTLPINItMs8g0'
+        'i0yzyDSLTLPINItMs8g0i0yzyDSLAfdj99/3kPzVjme+8YEMQtcy+D4y+D4yCMadeyvDe0uTe//z'
+        '45DxAuOFRpfxIuPFxtcYX2t0Gz3GS4xe46VGn9FvDBgvM15uvML4OmPQCBsRI2q80vh6I2YMGcPG'
+        'q4xXG3HjNcaI8VojYbzOGDVeb7zBGDPeaIwbE8abjDcbbzHearzNmDTebrzDeKfxLuPdxqPGY8aU'
+        '8R7jvca08T7j/UbS+IBx1/igkTI+ZHzYmDE+YjxufNSYDcZTd8cfMLRyvV5dw9AahtZY6Rp01qCz'
+        'Bp016KxBZw06a9BZg84adNagswadNeisQWcNOmvQWYPOGnTWoLMGnTXorEFnDTpr0FmDzhp01qCz'
+        'Bp016KxBZw06a9BZg84adNagswadNeisQWcNOmvQWYPOGnTWoLMGnTXorEFnDTpr0FmDzhp01qCz'
+        'Bp016KxBZw06a9BZg84adNagswadNeisQWcNOmvQWYPOGnTWoLMGnTXorEFnDTpr0FmDzhp01qCz'
+        'Bp21AJ2JL9uDGcFu99c89Lk+BHrT/bVvcqBj02++3bC+3bD+Qr3mNPnXvmRvOb3duf6Cfnjwi7Rh'
+        '/ZabjbtXBRt3b7355Fci2Lh724OC8EPXBaGkIJQUhJKCUFIQSgpCSUEoKQglBaGkIJQUhJK1VklP'
+        'KOkJJT2hpCeUrLVK6kJJXSipCyV1oaQulNSFkrpQUhdK6kLJWqukNZS0hpLWUNIaSlpDSWsoaQ0l'
+        'raGkNZS0hpLWUNIaStZaJeWhpDyUlIeS8lBSHkrKQ0l5KCkPJeWhpDyUlIeS8lBSHkrKQ0l5KCkP'
+        'JeWhpDyUlIeS8lBSHkrKQ8laq6RDlHSIkg5R0iFKMr2kSpRUiZIqUVIlSqpESZUoqRIla62StVZJ'
+        'sSgpFiXFoqRYlBSLkrVWSb8o6Rcl/aKkX5SstUrWWiVrrZK1Vslaq2StVbLWKllrlay1StZaJWut'
+        'krVWyVqrZK1VstYqWWuVrLVK1lola61S0G4mb961txVsUL298+OPdH78ePDjd9zo5OcD3bzz/utN'
+        'k6OdH77r5pf/fvDb3x28T2Dm+T6i8kPBt1M++eHgL9GRVtYJ/Edv3pH6cPB/+tizomIFdek/dOrS'
+        'F+1QwNSXd/f8led9rt3zPbfvrfhyf2/F/dc//Gjn9Q+3Bylu31vx7HpvxXs/V+t+8tuu0/PbH/7S'
+        'vSP9yW/1h0iu3fsz/GGeHjw2/t17v/GPlXXTwQULTsCNP//+u1n//XUX39XFd3XxXV18Vxff1cV3'
+        'dfFdXXxXF9/VxXd18V0lfFcJ31XCd5XwXe17V/ve1b53te9d7XtX+97Vvne1713te1ft3lW7d9Xu'
+        'XbV7V+3eVbt31e5dtXtX7d5Vu3fV7l21e1ff3tW3d/XtXX17V9/e1bd39e1dfXtX397Vt3f17V19'
+        'e1ff3tW3d/XtXX17V9/e1bd39e1dfXtX397Vt3cV7V1Fe1fR3lW0dzXsXQ17V8Pe1bB3NexdDXtX'
+        'w97VqXd16l2delen3tWpd5XpXWV6V5neVaZ3FfvdoM6+77YX3L7P6rYKPMeqwP2q+FTnu5Ce4b3g'
+        '/Q82mpavw21PuO0Jtz3htifc9oTbnnDbE257wm1PuO0Jtz3htifc9oTbnnDbE257wm1PuO0Jtz3h'
+        'tifc9oTbnnDbE257wm1PuO0Jtz3htifc9oTbnnDbE257wm1PuO0Jtz3htifc9oTbnnDbE257wm1P'
+        'uO0Jtz3htifc9oTbnnDbE257wm1PuO0Jtz3htifc9oTbnnDbE257wm1PuO0Jtz3htifc9oTbnnDb'
+        'E257wm1PuO0Jtz3htifc9oTbnnDbE257wm1PuO0Jtz3htifc9oTbnnDbC8ItefPA5cc7uyYfeE48'
+        'cAl237//4U+Xdb//mct18t0+evlyybVn1XOW9eu38ry5s1tx+9BF1t19kHUj11l3IOsOZN2BrDuQ'
+        'dQdC7kDIHQi5AyF3IOQOhNyBkDsQcgdC7kDIHQi5AyF3IOQOhNyBkDsQcgdC7kDIHQi5AyF3IOQO'
+        'hNyBkDsQcgdC7kDIHQi5AyF3IOQOhNyBkDsQcgdC7kDIHQi5AyF3IOQOhNyBkDsQcgdC7kDIHQi5'
+        'AyF3IOQOhNyBkDsQcgdC7kDIHQi5AyF3IOQOhNyBkDsQcgdC7kDIHQi5AyF3IOQOhNyBkDsQcgdC'
+        '7kDIHQi5AyF3IOQOhNyBkDsQcgdC7iAIuQ/eruC+nFZw96v513Sq+W3s3S7nnv07u6mnv4XvXwUP'
+        'MD/0+zZ7f63zC8/vPNv6fD+xC56a/ZvOvvCX6Nndpx5OvSd4dUDXvT/DH7bV+7rgeEXngeln3PT9'
+        '8IOG8G3XDeFIQzjSEI40hCMN4chq+EhROFIUjhSFI0XhSFE4UhSOFIUjReFIUThSFI4UhSNF4UhR'
+        'OFIUjhSFI0XhSFE4UhSOFIUjReFIUThSFI4UhSNF4UhROFIUjhSFI0XhSFE4UhSOFIUjReFIUThS'
+        'FI4UhSNF4UhROFIUjhSFI0XhSFE4UhSOFIUjReFIUThSFI4UhSNF4UhROFIUjhSFI0XhSFE4UhSO'
+        'FIUjReFIUThSFI4UhSNF4UhROFIUjhSFI0XhSFE4UhSOFIUjReFIUThSFI4UhSNF4UhROAqKwsyD'
+        'd7H9het3sf1o8AsfefAZm49ff8bmGBTHoDgGxbH7f+z+H7vjx271sVt97FYfu53HbuexO3fszh27'
+        'V8du0rG7c+zuHLsDx67ysat87PIeu7zHLu+xS3jsEh67dscu07HLdOzCHLswx67Isc/YHNPMMbEc'
+        'E8sxlRxTyTGVHFPJMUEcE8QxQRyTwDEJHGP/GObHMD+G+THMj4F9DOxjYB9D+RjKxxg+Bu8xXI/h'
+        'egzXY7ge4/QYp8c4PcbpMTKPQXgMwmMQHoPwGHbHeDvG2zHejhF2jLBjTB0HsDx+81mDP98x8o8+'
+        '8KMfu/ajhmvb4EcNl7jhEjf4UcOVbrjSDVe64Uo3oNdwDKyBwAYCG+5Cw11oOAbWcDMa6Gygs+HW'
+        'NNyaBlYb7lADsg3INhwDayC34e413L2Gu9dw9xqobqC64V423MuGe9mAegPqDcfAGm5www1u4L/h'
+        'PjfIoOF2N6ihQQ0NN7/h5jfc/Iab36CUBgYaGGhgoIGBBhU1qKiBiAYxNYip4RhYg6YaaGmgpYGW'
+        'BgtpgKZBdg2ya0CoQX0NJDWQ1HAMrOEYWANXDQJtEGgDZQ2UNRwDa1Btg2ob0GsQb8MxsIZjYA3H'
+        'wBqOgTUcA2s4BtZwDKzhGFjDMbCGY2ANx8AajoE1HANrOAbWcAys4RhYwzGwhmNgDcfAGoEMZm+O'
+        'gb0sOMf1J29OaA0HBSf9nHk7YfK/+KO8nPBPeQ3tk7udOtj5loq7c/eu35N/97od/q3ndY67zT14'
+        'sv0ND18/2U7+MHc54S4n3OWEu5xwlxPucsJdTrjLCXc54S4n3OWErZywlRO2csJWTvjJCT854Scn'
+        '/OSEn5zwkxN+csJPTvjJCSM5YSQnjOSEkZwwkhNGcsJIThjJCSM5YSQnjOSEkZxwkBMOcsJBTjjI'
+        'CQc54SAnHOSEg5xwkBMOcsJBTjjICQc54SAnHOSEg5xwkBMOcsJBTjjICQc54SAnrOOEdZywjhPW'
+        'ccIzTnjGCc844RknPOOEZ5zwjBMuccIlTrjECZc44RIn7OGEPZywhxP2cMKqTgKB/sc3LxoYCAT5'
+        'DQ+C6lXXH4prQakFpRaUWlBqQakFpRaUWlBqQakFpZagaiGqhagWolqIagmqFrBawGoBqwWsFrBa'
+        'wGoBqwWsFrBagqqFrxa+Wvhq4auFrxa+Wvhq4auFrxa+Wvhq4aslqFowa8GsBbMWzFowa8GsBbMW'
+        'zFowa8GsBbMWzFowa8GsBbMWzFowa8GsBbMWzFowa8GsJahaaGuhrYW2Ftpa7n4LdC3QtUDXAl0L'
+        'dC3QtUDXElQtQdWCYAuCLQi2INiCYEtQtZDYQmILiS0ktgRVS1C1BFVLULUEVUtQtQRVS1C1BFVL'
+        'ULUEVUtQtQRVS1C1BFVLULUEVUtQtQRVK9DBNz7gfuK6oJ3h/gz3Z7g/w/0Z4M8Afwb4M8CfAf4M'
+        '6WdIP0P6GdLPIH4G8TOIn0H8DOJnED+D+BnEzyB+hu0zbJ9h+wzbZ9g+w/YZts+wfYbtM2yfYfsM'
+        '22egPgP1GajPQH0G6jNQn4H6DNRnoD4D9Rmoz0B9BuozUJ+B+gzUZ6A+A/UZqM9AfQbqM1CfofkM'
+        'zWdoPkPzGYzPYHwG4zMYn8H4DMZnMD4D7hlwz4B7Btwz4J4h9gyxZ4g9Q+wZ9ZwFzGRut5RvDwXd'
+        '7iJ/8XeRrzf/k++4V4lvd5Q/847yEzflLhl8GO0/+VxXW5964bctfezj3/KJJ/If+3hnBl+A8brn'
+        'f4HOEf+dJ/9iZ53z+VyN/VTnD/ydn/PHQj72nPvyqc7lCJ4KvP55f9A++5++v75PDnUA+6bnzHUK'
+        'rs3PdVbdnxVAf+ZBvey/Xla11cu2etlWL9vqZduyqq1ltrXMtpbZ1jLbWmZby2xrmW0ts61ltrXM'
+        'tpbZ1jLbWmZby2xrmW0ts61ltrXMtpbZ1jLbWmZby2xrmW0ts61ltrXMtpbZ1jLbWmZby2xrmW0t'
+        's61ltrXMtpbZ1jLbWmZby2xrmW0ts61ltrXMtpbZ1jLbWmZby2xrmW0ts61ltrXMtpbZ1jLbWmZb'
+        'y2xrmW0ts61ltrXMtpbZ1jLbWmZby2xrmW0ts61ltrXMtpbZ1jLbWmZby2xrmW0ts61ltoOW+c0P'
+        '3on9E8g5R845cs6Rc46cc+ScI+ccOefIOUfOOXLOkXOOnHPknCPnHDnnyDlHzjlyzpFzjpxz5Jwj'
+        '5xw558g5R845cs6Rc46cc+ScI+ccOefIOUfOOXLOkXOOnHPknCPnHDnnyDlHzjlyzpFzjpxz5Jwj'
+        '5xw558g5R845cs6Rc46cc+ScI+ccOefIOUfOOXLOkXOOnHPknCPnHDnnyDlHzjlyzpFzjpxz5Jwj'
+        '5xw558g5R845cs6Rc46cc+ScI+c8ICcbkDPSMZ2nAtOZePK3g1/4luAXgo/XvqnzGDXYQnzpw509'
+        'xfngl4LDoD9xf0vxh2B3CbtL2F3C7hJ2l3i7xNsl3i7xdom3S7xd4u0Sb5d4u8TbJd4u8XaJt0u8'
+        'XeLtEm+XeLvE2yXeLvF2ibdLvF3i7RJvl3i7xNsl3i7xdom3S7xd4u0Sb5d4u8TbJd4u8XaJt0u8'
+        'XeLtEm+XeLvE2yXeLvF2ibdLvF3i7RJvl3i7xNsl3i7xdom3S7xd4u0Sb5d4u8TbJd4u8XaJt0u8'
+        'XeLtEm+XeLvE2yXeLvF2ibdLvF3i7RJvlwFP3/rgkem3XT8y/T17M79nF+f3gt/25O2bXG5XyX/s'
+        'VbL3thzdW/rdLpc/H4eugv2rq9vF8rfdc6e7CzfPKyvB45Bvv7WsW8u63di7dao/llOJrCfuRdbn'
+        '17Jyz/q3wt+9ePgL8Vr4P/tgu+W7rp/mPfIVgfEG46uNO0bIeIHxQqPLeJHxYuNrjK81uo0e4yVG'
+        'r/FSo8/oNwaMlxkvN15hfJ0xaISNiBE1Xml8vREzhoxh41XGq4248RpjxHitkTBeZ4warzfeYIwZ'
+        'bzTGjQnjTcabjbcYbzXeZkwabzfeYbzTeJfxbuNR4zFjyniP8V5j2nif8X4jaXzAuGt80EgZHzI+'
+        'bMwYHzEeNz5qzAbjqbvf8eCUZ+b6lOcd9/6Oe3/Hvb/jNt9xm++4sXfc0Tvu6B139I67dsddu+MG'
+        '3XGD7rgld9yLO27CHTfhjgt9x8W842LecRXvuIp3XMU7rtQdV+qOS3TH1bjjatzx97/j73/HXzwY'
+        'X2E8YtwxQsYLjBcaXcaLjBcbPcZLjF6j3xgwXm6EjYgRNV5pDBnDxquM1xgjRsIYNcaMNxrjxoTx'
+        'ZuMtxluNtxnvMB41HjOmjFnjPcb7jKTxAeOu8SHjw8bjwXjq7mKATrRja2/v7Jq/vPNPq51/Gu/8'
+        '0+92rO7dnX/6SOfn3tj5p3JwkOvjn5WPB355p/Ovfrk9aPiMPv6JB3uf/5qN92C1h433QLYHsj2Q'
+        '7YFsD2R7INsD2R5S7iHlHlLuwXEPjntw3EPfPfTdg+oeVPdQew+4e4i+h+h7iL4H8T2I70F8D+J7'
+        'GEIPQ+jBfw/+e/DfwyV6uEQPNfRQQw/P6CGKHtbRQxs9HKSHg/RQSg+l9FBKD6X0cJcegukhmB6C'
+        '6SGYHs7Tw3l6yKeHAfUwoB4G1ENTPTTVQ1M9xNTDnHqYUw9p9fCoHgrrobAeCuthXD2Mq4feeuit'
+        'h431sLEe6uvhZj003BNo8ZM3jz7/erCQe+pBI5i7fgDTB6U+KPVBqQ9KfVDqg1IflPqg1AelPij1'
+        'QakPSn1Q6oNSH5T6oNQHpT4o9UGpD0p9UOqDUh+U+qDUB6U+KPVBqQ9KfVDqg1IflPqg1AelPij1'
+        'QakPSn1Q6oNSH5T6oNQHpT4o9UGpD0p9UOqDUh+U+qDUB6U+KPVBqQ9KfVDqg1IflPqg1AelPij1'
+        'QakPSn1Q6nNr+xDVh6g+RPUhqg9RfYjqQ1QfovoQ1YeoPkT1IaoPUX2I6kNUH6KC8TPGzxo/ZxSM'
+        'f2v8vPELxi8av2T8pPHvjF82fsX4KeNXjV8zWsavG79htI1T48z4TeOnjXPjt4zfDsZTd/NP/1DZ'
+        'K4NTAEvP/K/K/NvP+1J8VeZ33mz+FALP+HMPPOOF16uIMM8I84wwzwjzjDDPCPOMMM8I84wwzwjz'
+        'jDDPCPOMMM8I84wwzwjzjDDPCPOMMM8I84wwzwjzjDDPCPOMMM8I84wwzwjzjDDPCPOMMM8I84ww'
+        'zwjzjDDPCPOMMM8I84wwzwjzjDDPCPOMMM8I84wwzwjzjDDPCPOMMM8I84wwzwjzjDDPCPOMMM8I'
+        '84wwzwjzjDDPCPOMMM8IM4swswgzizCzCDOLMLMIM4swswgzizCzCDOLMLMIM4swswgzizCzCPOo'
+        'cCC7P/85ayzg/+Hnfele0fc5ayz4mMJXPe+zPRKx/EBdp9fqilFXjLpi1BWjrhh1xagrRl0x6opR'
+        'V4y6Ygw6RmQxIosRWYzIYsw7RmsxWovRWozWYrQWo7UYrcVoLUZrMf4eI7kYycVILkZyMZKLkVyM'
+        '5GIkFyO5GMnFSC5GcjHxEKO8GOXFKC9GeTHKi1FejPJilBejvBjlxSgvRnkxyotRXozyYpQXo7wY'
+        '5cUoL0Z5McqLUV5MVMUIMEaAMQKMEWCMIGJ0GKPDGB3G6DBGhzE6jNFhTNLFJF2MKmNUGaPKGFXG'
+        'qDImBWPEGSPOGHHGiDMmyWOSPCbJY7I7Jrtjsjsmu2NCOya0Y0I7Jq1j0jompmNiOiamY4I5JpFj'
+        'EjkmkWOBNXzXM/ORQmeL8u43dk4D3D5cuH24cPtw4bn6GPQv+ORhxw0OO1kenOqY9n79woPI/r7r'
+        'yB4R2SMie0Rkj4jsEZE9IrJHRPaIyB4R2SMie0RWj8jqEVk9IqtHhPSIkB4R0iNCekRIjwjpESE9'
+        'IqRHhPSIdB6RziPSeUQ6j0jnEek8Ip1HpPOIdB6RziPSeUQ6j4jlEbE8IpZHxPKIWB4RyyNieUQs'
+        'j4jlEbE8IpZHxPKIWB4RyyNieUQsj4jlEbE8IpZHxPKIWB4RyyPyeEQej8jjEXk8IohHBPGIIB4R'
+        'xCOCeEQQjwjiEdE7InpHRO+I6B0RvSMyd0TmjsjcEZk7Iv9HgtT77gfoTF+jk4BOAjoJ6CSgk8BM'
+        'AjMJzCQwk8DM/8fe/QfGmtf1oWfPLlH5cQgBAgRYfrOwPCSB8OzwY/gxsAO7LLMPYRbGW2uZvZpq'
+        'jsqGQJK55pd6DWnjZuJUjTFe09rbxnQ63qbpNW0zqe00xkap3qi3Gtsr6gAhHHQUY5haG3vPPK/s'
+        'yaJX2IvsyrL5h8/+OGfZnXm9P5/P93memfQw08NMDzM9zPQw08NMDzM9zPQw08NMDzM9zPQw08NM'
+        'DzM9zPQw08NMDzM9zPQw08NMDzM9zPQw08NMDzM9zPQw08NMDzM9zPQw08NMDzM9zPQw08NMDzM9'
+        'zPQw08NMDzM9zPQw08NMDzM9zPQw08NMDzM9zPQw08NMDzM9zPQw08NMDzM9zPQw08NMDzM9zPQw'
+        '08NMDzM9zPTEZr4nNvPCViv62da18/fEnyNv/dGzW3/0vTe0etL3Xv9E+Xh8deP7zqG1nUFLgJYA'
+        'LQFaArSEHpXgLcFbgrcEbwneErwleEvwluAtwVuCtwRvCd4SvCV4S/CW4C3BW4K3BG8J3hK8JXhL'
+        '8JbgLcFbgrcEbwneErwleEvwluAtwVuCtwRvCd4SvCV4S/CW4C3BW4K3BG8J3hK8JXhL8JbgLcFb'
+        'grcEbwneErwleEvwluAtwVuCtwRvCd4SvCV4S/CW4C3BW4K3BG8J3hK8JXhL8JbgLRF7+1+v/yyn'
+        'KzGl7z9/rPF7zh5rfKODwBvjXz9z/YfU/Lv4etFHHzW34+MvJPixa/9Fj8h1tdn4dYkvDwz6yT23'
+        'xq/f37ke3R+JX7+/ex7dvbPopkU3Lbpp0U2Lblp006KbFt206KZFNy26aVcE0hKcluC0BKclOO2K'
+        'QFqQ04KcFuS0IKcFOS3IaUFOC3JakNOuCKTlOS3PaXlOy3NantPynJbntDyn5Tktz2l5Tstz2hWB'
+        'tFinxTot1mmxTot1WqzTYp0W67RYp8U6LdZpsU6LdVqs02KdFuu0WKfFOi3WabFOi3VarNOuCKSl'
+        'Oy3daelOS3da2tJCnhbytJCnhTwt5GkhTwt52hWBtCsCaZFPi3xa5NMinxb5tCsCaclPS35a8tOS'
+        'n3ZFIO2KQNoVgbQrAmlXBNKuCKRdEUi7IpB2RSCtEaRdEUi7IpB2RSDtikDaFYG0KwJpVwTSrgik'
+        'XRFIxzmYiz9H/KzWRfpr9D8St5onX3ln/Pd+4LwHfddZD7rT//Wd/iXvjH/Z/eeP+o+ePep/V/w3'
+        '5i8eYLy4xnBxjeHiGsNDusbgQcV7PvrDj9DFhuL5xH/q2cSPTPzIxI9M/MjEj0z8yMSPTPzIxI9M'
+        '/MjEj4z6yKiPjPrIqI/M+MiMj8z4yIyPzPjIjI/M+MiMj8z4yHCPDPfIcI8M98hwjwz3yHCPDPfI'
+        'cI8M98hwjwz3yFSPTPXIVI9M9chUj0z1yFSPTPXIVI9M9chUj0z1yFSPTPXIVI9M9chUj0z1yFSP'
+        'TPXIVI9M9cg4j4zzyDiPjPPIHI/M8cgcj8zxyByPzPHIHI9M7sjkjkzuyOSOTO7IyI6M7MjIjozs'
+        'yPoQxYNt4fw5vaedPafX773v997H5ZLydOVZyrOV5yo3K89XXqC8VHmZcqvySqVb6VVeo/Qpr1Pe'
+        'pLxZeauSUt6mvFO5Q3mXcrcSKe9Vssr7lMcr36A8UXmS8mTlsvIUpV15qvIMpVN5ptKlPEd5nvJC'
+        '5UXKi5WXKLcoL1deoQTKq5Qe5dXKa5VQuU1JKK9X3qC8UUkqb1HertyupJX3K+9Q7lTuUt6tZJT3'
+        'KP3KPXEZyfzg1/yH1eN7yUHryPX/67xWil+Y1n/8L7X+Ac+/qXWd5e+d5y1/lrecvOXkLSdoOUHL'
+        'CVpO0HKClhO0nKDlBC0naDlBywlaTtBygpYTtJyg5QQtJ2g5QcsJWk7QcoKWE7ScoOUELSdoOUHL'
+        'CVpO0HKClhO0nKDlBC0naDlBywlaTtBygpYTtJyg5QQtJ2g5QcsJWk7QcoKWE7ScoOUELSdoOUHL'
+        'CVpO0HKClhO0nKDlBC0naDlBywlaTtBygpYTtJyg5QQtJ2g5QcsJWk7QcoKWE7ScoOUELSdoOUHL'
+        'CVpO0HJx0H7owc8g1eOj/g9fP/pX4u+F/JEHvi71Gr7Wny+eH3vee3bs+UD8z/rR67/xafFvXLr2'
+        '5/ffGL3vnvgrSX4i/ms/dv1nCVdaf7ocH69+++z//4PXvynx0xaOQe/yoIVj0Js96M0e9GYPerMH'
+        'vdmD3uxBb/agEAwKwaAQDBIwSMAgAYOSMSgZgzwM8jAoJ4NYDIrLoLgMissgK4OsDLIyyMqgKA2K'
+        '0iA5g+QMkjMoX4PyNcjRIEeD0jaI06DQDVI1KHuDsjfI2CBjg4wNMjYol4OoDaI2iNogaoMyOyiz'
+        'g+ANiu6g6A6K7iCNgzQO0jiI4aBYD4r1IJSD0j3I5iCbg2wOivygyA+SOkjqoAYwqAEMcjuoDwzS'
+        'PxjL+/HH5HfA/PkhEY+UamukXB8X/9sXvDDxL/gflx6GL6l/1D29/hPXe9W/ivvSyvU///X4+vLf'
+        'j1+4qSu3xh+Sb/W6W+Jed3zlw641fTiG9w/OD0mDZ4ekET1rRM8a0bNG9KwRPWtEzxrRs0b0rBE9'
+        'a0TPGtGzRvSsET1rRM8a0bNG9KwRPWtEzxrRs0b0rBE9a0TPGtGzRvSsET1rRM8a0bNG9KwRPWtE'
+        'zxrRs0b0rBE9a0TPGtGzRvSsET1rRM8a0bNG9KwRPWtEzxrRs0b0rBE9a0TPGtGzRvSsET1rRM8a'
+        '0bNG9KwRPWtEzxrRs0b0rBE9a0TPGtGzRvSsET1rRM8a0bNG9KwRPWtEzxrRs0b0rBE9a0TPGtGz'
+        'RvSsET1rRM8a0bNG9KwRPWtEzxqJ6fzkOZ0fOKMzhs4YOmPojKEzhs4YOmPojKEzhs4YOmPojKEz'
+        'hs4YOmPojKEzhs4YOmPojKEzhs4YOmPojKEzhs4YOmPojKEzhs4YOmPojKEzhs4YOmPojKEzhs4Y'
+        'OmPojKEzhs4YOmPojKEzhs4YOmPojKEzhs4YOmPojKEzhs4YOmPojKEzhs4YOmPojKEzhs4YOmPo'
+        'jKEzhs4YOmPojKEzhs4YOmPojKEzhs4YOmPojKEzhs4YOmMxnX/44KXtX8ZL2f9+rmnxTNM4TeM0'
+        'jdM0TtM4RuMYjWM0jtE4RuMYjWM0jtE4RuMYjWM0jtE4RuMYjWM0jtE4RuMYjWM0jtE4RuMYjWM0'
+        'jtE4RuMYjWM0jtE4RuMYjWM0jtE4RuMYjWM0jtE4RuMYjWM0jtE4RuMYjWM0jtE4RuMYjWM0jtE4'
+        'RuMYjWM0jtE4RuMYjWM0jtE4RuMYjWM0jtE4RuMYjWM0jtE4RuMYjWM0jtE4RuMYjWM0jtE4RuMx'
+        'o3/UmnlXW4Z+OZ6B//jc0G1nhqYZmmZomqFphqYZmmZomqFphqYZmmZomqFphqYZmmZomqFphqYZ'
+        'mmZomqFphqYZmmZomqFphqYZmmZomqFphqYZmmZomqFphqYZmmZomqFphqYZmmZomqFphqYZmmZo'
+        'mqFphqYZmmZomqFphqYZmmZomqFphqYZmmZomqFphqYZmmZomqFphqYZmmZomqFphqYZmmZomqFp'
+        'hqYZmmZomqFphqYZmmZomqFphqYZmo4NrV7fm/55bOinWn/+mdaf/+f4z9fOTX33makZpmaYmmFq'
+        'hqkZU24GrRm0ZtCaQWsGrRm0ZtCaQWsGrRm0ZtCaQWsGrRm0ZtCaQWsGrRm0ZtCaQWsGrRm0ZtCa'
+        'QWsGrRm0ZtCaQWsGrRm0ZtCaQWsGrRm0ZtCaQWsGrRm0ZtCaQWsGrRm0ZtCaQWsGrRm0ZtCaQWsG'
+        'rRm0ZtCaQWsGrRm0ZtCaQWsGrRm0ZtCaQWsGrRm0ZtCaQWsGrRm0ZtCaQWsGrRm0ZtCaQWsGrZmY'
+        '1j85/4DpNjmz5MySM0vOLDmz5MySM0vOLDmz5MySM0vOLDmz5MySM0vOLDmz5MySM0vOLDmz5MyS'
+        'M0vOLDmz5MySM0vOLDmz5MySM0vOLDmz5MySM0vOLDmz5MySM0vOLDmz5MySM0vOLDmz5MySM0vO'
+        'LDmz5MySM0vOLDmz5MySM0vOLDmz5MySM0vOLDmz5MySM0vOLDmz5MySM0vOLDmz5MySM0vOLDmz'
+        '5MySM0vOLDmz5MySMxvLKV98+ffFLfaH5Rb79a+3/pa4IV3cbr/4cZJfzr31f3p9a7oz3pIq51vS'
+        'Z862pHmzbt6smzfr5s26ebNu3qybN+vmzbp5s27erJs36+bNunmzbt6smzfr5s26ebNu3qybN+vm'
+        'zbp5s27erJs36+bNunmzbt6smzfr5s26ebNu3qybN+vmzbp5s27erJs36+bNunmzbt6smzfr5s26'
+        'ebNu3qybN+vmzbp5s27erJs36+bNunmzbt6smzfr5s26ebNu3qybN+vmzbp5s27erJs36+bNunmz'
+        'bt6smzfr5s26ebNu3qybN+vmzbp5s27erJs36+bNunmzbt6smzfr5s26ebNu3qybj2fdT59vSQ1y'
+        'FshZIGeBnAVyFshZIGeBnAVyFshZIGeBnAVyFshZIGeBnAVyFshZIGeBnAVyFshZIGeBnAVyFshZ'
+        'IGeBnAVyFshZIGeBnAVyFshZIGeBnAVyFshZIGeBnAVyFshZIGeBnAVyFshZIGeBnAVyFshZIGeB'
+        'nAVyFshZIGeBnAVyFshZIGeBnAVyFshZIGeBnAVyFshZIGeBnAVyFshZIGeBnAVyFshZIGeBnAVy'
+        'FshZIGchlvN/nDed15597UYJnRI6JXRK6JTQKaFTQqeETgmdEjolj/SWCCoRVCKoRFDJI70lkEog'
+        'lUAqgVQCqQRSCaQSSCWQSh7pLfFU4qnEU4mnEk8lnko8lXgq8VTiqcRTiaeSR3pLWJWwKmFVwqqE'
+        'VQmrElYlrEpYlbAqYVXCqoRVCasSViWsSliVsCphVcKqhFUJq5JHekt0legq0VWiq+TdLkFWgqwE'
+        'WQmyEmQlyEqQlTzSW/JIbwm5EnIl5ErIlZAreaS3RF6JvBJ5JfJKHukteaS35JHekkd6S56WLXmk'
+        't+SR3pLbLCWP9JY8V1vySG/JI70lj/SWPNJb8khvySO9JY/0ljzSW/JIbyl2/89i9/E1ite3fkzG'
+        'Z1t/1Bl/2dP6eTPdl4hFiViUiEWJWJSIRYlYlIhFiViUiEWJWJSIRVFYFIVFUVgUhUUZWJSBRRlY'
+        'lIFFGViUgUUZWJSBRRlYhH8R/kX4F+FfhH8R/kX4F+FfhH8R/kX4F+FfpH6R+kXqF6lfpH6R+kXq'
+        'F6lfpH6R+kXqF6lfpH6R+kXqF6lfpH6R+kXqF6lfpH6R+kXcF3FfxH0R90XOFzlf5HyR80XOFzlf'
+        '5HyR7EWyF8leJHuR7EWkF5FeRHoR6UXxWoxR/fPzZvqcsw1uCZ0ldJbQWUJniZklZpaYWWJmiZkl'
+        'ZpaYWWJmiZklZpaYWWJmiZklZpaYWWJmiZklZpaYWWJmiZklZpaYWWJmiZklZpaYWWJmiZklZpaY'
+        'WWJmiZklZpaYWWJmiZklZpaYWWJmiZklZpaYWWJmiZklZpaYWWJmiZklZpaYWWJmiZklZpaYWWJm'
+        'iZklZpaYWWJmiZklZpaYWWJmiZklZpaYWWJmiZklZpaYWWJmiZml2MzG9Wul3xifAv7FxWWLi8sW'
+        'F58MeIxdqnjgitKLPvrDX+2XLf7PB993Pol71s+0etb9N92euicVP+X3M63Hj57Q+qOF1g9FHrzJ'
+        'L7732p/cf9O7stHd8a/abP2qbOuP/ij+ySabD/4H78U3tP/lRTO8aIYXzfDR0wyvN7LgWrYfA9dw'
+        '/9X5xv/Ws42/YuOv2PgrNv6Kjb9i46/Y+Cs2/oqNv2Ljr9j4Kzb+io2/YuOv2PgrNv6Kjb9i46/Y'
+        '+Cs2/oqNv2Ljr9j4Kzb+io2/YuOv2PgrNv6Kjb9i46/Y+Cs2/oqNv2Ljr9j4Kzb+io2/YuOv2Pgr'
+        'Nv6Kjb9i46/Y+Cs2/oqNv2Ljr9j4Kzb+io2/YuOv2PgrNv6Kjb9i46/Y+Cs2/oqNv2Ljr9j4Kzb+'
+        'io2/YuOv2PgrNv6Kjb9i46/Y+Cs2/oqNv2Ljr9j4Kzb+io2/YuOv2PgrNv6Kjb9i46/EG/+/vn7d'
+        '/1/E03ProTy3fOU7zobozKWvke+Xjp9DvuXSg/aD//SQf1pjNX7J4tfwbTd81PNLd/Vd2y7ahu4d'
+        'vve7/PjT9fhqzvaDP1xw1+ADny34hLBuCeuWsG4J65awbrmysyWzWzK7JbNbMrsls1syuyWzWzK7'
+        'JbNbMrsls1syuyWzWzK7JbNbMrsls1syuyWzWzK7JbNbMrsls1syuyWzWzK7JbNbMrsls1syuyWz'
+        'WzK7JbNbMrsls1syuyWzWzK7JbNbMrsls1syuyWzWzK7JbNbMrsls1syuyWzWzK7JbNbMrsls1sy'
+        'uyWzWzK7JbNbMrsls1syuyWzWzK7JbNbMrsls1syuyWzWzK7JbNbMrsls1syuyWzW3Fm/835NcHP'
+        'k7NNzjY52+Rsk7NNzjY52+Rsk7NNzjY52+Rsk7NNzjY52+Rsk7NNzjY52+Rsk7NNzjY52+Rsk7NN'
+        'zjY52+Rsk7NNzjY52+Rsk7NNzjY52+Rsk7NNzjY52+Rsk7NNzjY52+Rsk7NNzjY52+Rsk7NNzjY5'
+        '2+Rsk7NNzjY52+Rsk7NNzjY52+Rsk7NNzjY52+Rsk7NNzjY52+Rsk7NNzjY52+Rsk7NNzjY52+Rs'
+        'k7NNzjY527Gcn704wlwcYS6OMI/N6zmZwxu++i/o/Nu/2ldhf/rR+FXYD2nL/HcP/IiKu5qtPb32'
+        '4Nfp/m/4lvs++K2DHxm874Pxsvkfb/SBuvuf+J33fdvgt9z7nR/44H0fif/OD7a22i98RW9sfYnQ'
+        'tW31xrsjH4u9vfVrvsRCf/5PvveD3xr/rn/fWn0f4it9/xO+5b7vurYcD37Yv/Bdn7j2e79Cr/z9'
+        'T3jg3+y+4fifvfpl/siwv/Sd+PfxSx/fo+1uvdDxZ/Gef/ZZvF+L5+xOPGe/7+zyYaX1gr7zyvdf'
+        'av2tn4t/d/wzlN9+wwMHgH9rjTuwxh1Y4w6scQfWuANr3IE17sAad2CNO7DGHVjjDqxxB9a4A2vc'
+        'gTXuwBp3YI07sMYdWOMOrHEH1rgDa9yBNe7AGndgjTuwxh1Y4w6scQfWuANr3IE17sAad2CNO7DG'
+        'HVjjDqxxB9a4A2vcgTXuwBp3YI07sMYdWOMOrHEH1rgDa9yBNe7AGndgjTuwxh1Y4w6scQfWuANr'
+        '3IE17sAad2CNO7DGHVjjDqxxB9a4A2vcgTXuwBp3YI07sMYdWOMOrHEH1rgDa9yBNe7AGndgjTuw'
+        'xh1Y4w6scQfWuANr3IE17iDmtftV9+HiuPn+WisNf61N8udbTfLT8Vk+vprxH/5K0+Sul36tDpO9'
+        'i3PAI38OuH45+rPXWF2cCS7OBBePo/+lx4BfOL+VUT67lVG3HNUtR3XLUd1yVLcc1S1HdctR3XJU'
+        'txzVLUd1T4LW7Uh1O1LdjlS3I9U9CVq3KtWtSnWrUt2qVLcq1a1KdatS3apUtyrVPQlatzHVbUx1'
+        'G1PdxlS3MdVtTHUbU93GVLcx1W1MdRtT3cZU9yRo3eJUtzjVLU51i1Pd4lS3ONUtTnWLU93iVLc4'
+        '1S1OdYtT3eJUtzjVLU51i1Pd4lS3ONUtTnWLU93iVLc41T0JWrc/1e1PdftT3f5Ut8/UrVF1a1Td'
+        'GlW3RtWtUXVrVN0aVfckaN2ToHVLVd1SVbdU1S1VdUtV3ZOgdbtV3W5Vt1vV7VZ1T4LWPQla9yRo'
+        '3ZOgdU+C1j0JWvckaN2ToHVPgtY9CVr3JGjdk6B1T4LWPQla9yRo3ZOgdU+C1j0JWvckaD3e7H7x'
+        '4gtYLy7LXYzgR2gE+zFG063LYhc/7uWhjOWPnY/lN52N5UNj+dBYPjSWD43lQ/P40Dw+NI8PzeND'
+        '8/jQID40iA8N4kOD+NAEPjSBD03gQxP40AQ+NIEPTeBDE/jQBD40eg+N3kOj99DoPTR6D43eQ6P3'
+        '0Og9NHoPjd5Do/fQ6D00cw/N3EMz99DMPTRzD83cQzP30Mw9NHMPzdxDM/fQzD00cw/N3EMz99DM'
+        'PTRzD83cQzP30Mw9NHMPzdxDw/bQsD00bA8N20NT9tCUPTRlD03ZQ1P20JQ9NGUPzdVDc/XQXD00'
+        'Vw/N1UMD9dBAPTRQDw3UQ8P9MB5p//HczPefmTli5oiZI2aOmDmyyh2hc4TOETpH6Byhc4TOETpH'
+        '6Byhc4TOETpH6Byhc4TOETpH6Byhc4TOETpH6Byhc4TOETpH6Byhc4TOETpH6Byhc4TOETpH6Byh'
+        'c4TOETpH6Byhc4TOETpH6Byhc4TOETpH6Byhc4TOETpH6Byhc4TOETpH6Byhc4TOETpH6Byhc4TO'
+        'ETpH6Byhc4TOETpH6Byhc4TOETpH6Byhc4TOETpH6ByhcxTT+aVH7DpXfP0qan325lFx/eaXr39n'
+        '5Te0LnP9X+cR+/mziDVErCFiDRFriFhDxBoi1hCxhog1RKwhYg2npYakNSStIWkNSWs4LTUEriFw'
+        'DYFrCFxD4BoC1xC4hsA1BK7htNSQu4bcNeSuIXcNuWvIXUPuGnLXkLuG3DXkriF3Daelhvg1xK8h'
+        'fg3xa4hfQ/wa4tcQv4b4NcSvIX4N8WuIX0P8GuLXEL+G+DXEryF+DfFriF9D/BpOSw0pbEhhQwob'
+        'UtiQioYwNoSxIYwNYWwIY0MYG8LYcFpqOC01RLMhmg3RbIhmQzQbTksNCW1IaENCGxLacFpqOC01'
+        'nJYaTksNp6WG01LDaanhtNRwWmo4LTWclhpOSw2npYbTUsNpqeG01HBaajgtNZyWGnF/2H/MfMlm'
+        'fDn6zQ96Ii3+kqyh1g2kL9oofuW8M7z4rDMc6wzHOsOxznCsMxxrCcdawrGWcKwlHGsJx3rBsV5w'
+        'rBcc6wXHmsCxJnCsCRxrAseawLEmcKwJHGsCx5rAsfQfS/+x9B9L/7H0H0v/sfQfS/+x9B9L/7H0'
+        'H0v/sdgfi/2x2B+L/bHYH4v9sdgfi/2x2B+L/bHYH4v9sdgfi/2x2B+L/bHYH4v9sdgfi/2x2B+L'
+        '/bG8H8v7sbwfy/uxoB8L+rGgHwv6saAfC/qxoB+L9rFoH4v2sWgfi/axTB/L9LFMH8v0sf5yHKfq'
+        'V8+/u/vpZ9/dfeK9P/Hen/iu/BMETrzbJ97tE+/viTf2xBt74o098eadePNOvE8n3qcT78yJt+TE'
+        'e3HivTjxep94TU+8pidezBMv5okX88QLduIFO/FKnXhRTrwoJ16GEy/Dif/+E1/hfSIaJzJxIhMn'
+        'puWJaJyIxolonIjGiRScSMGJFJxwf8L9CfAnbJ+wfcL2CdsnNJ/QfELzCb8n/J6Ae0LsCaMnjJ4w'
+        'esLoCZwncJ7AeQLnCY4n5J2Qd0LeCQknAJ4gd8LaCWsnrJ3QdULXCU8nsaBfe/BX1cbNJ3X2cf6m'
+        'V7ip+TS90E0vdNML3fRCN73QTS900wvd5LDJYRPAple/6dVv2kea3oQmnE04m96SprekiWrTO9Mk'
+        'tkls0z7SBLfpXWt615retaZ3rQl1E+qm97DpPWx6D5ukN0lv2kea3timN7aJf9P725SCpre5KQxN'
+        'YWh605ve9KY3velNbwpK03vf9N43vfdN731TiJpC1CShKUtNWWraR5oi1aSkSUmTkiYlTUqaUteU'
+        'uiYzTeFrotNEp2kfadpHmiA15bMpn02smlg17SNNoW0KbZO1puw27SNN+0jTPtK0jzTtI037SNM+'
+        '0rSPNO0jTftI0z7StI807SNN+0jTPtK0jzTtI037SNM+0ozd/98Xt1W/mq/jPvAc3Hzrgt/FRd2L'
+        '+6qPvQu4/+kxdWLKHN3wUD/E8+vnB6VLZ7vKqV3l1K5yalc5tauc2lVO7SqndpVTu8qpXeXUrnJq'
+        'Vzm1q5zaVU7tKqeWlFNLyqkl5dSScmpJObWknFpSTi0pp5aUU9vJqe3k1HZyajs5tZ2c2k5ObSen'
+        'tpNT28mp7eTUdnJqOzm1lpxaS06tJafWklNryam15NRacmotObWWnFpLTq0lp9aSU2vJqbXk1Fpy'
+        'ai05tZacWktOrSWn1pJTa8mpteTUPnJqHzm1j5zaR04tIqcWkVOLyKlF5NQicmoRObWInFo9Tq0e'
+        'p1aPU6vHqdXj1M5xauc4tXOc2jlO7T+n8dT/jb+QqT9o2fvYX3zU9pFNV5yAX2n9WzyMObvyc2ef'
+        'l3vTgz8v19v6Kx+/9KWuThx8TXaj+FrNL177b/+yL+/+5qP6dYndffzGL/Ox6y/6wvzn8y79XWeX'
+        's76+Le7ScXmC8kTlScqTlcvKU5R25alKh/I05enKM5RO5ZnKs5RnK13Kc5TnKs9Tblaer7xAeaHy'
+        'IuXFykuUlyovU25RXq68QrlVeaUSKK9SupUepVd5tfIapU95rRIqtykJ5XXK65U3KG9UksqblDcr'
+        'b1HeqqSUtylvV25X0so7lHcqdyh3Ku9S7lLerWSUu5VIeY/Sr7xXySr3KO9T3h+Xkcx/uf5B5534'
+        '0eD/5/pXHf33+Mfr/NY5rX9zRusyWpfRuozWZbQuo3UZrctoXUbrMlqX0YrLlPI05enKM5RO5beU'
+        'ZyrPUp6tdCnPUZ6rPE+5WXm+8nHlBcoLlRcpL1ZeorxUeZlyi/Jy5RXKrcorld9WAuVVSrfSo/Qq'
+        'r1Zeo/Qpr1VC5TYlobxOeb3yBuWNSlJ5k/Jm5S3KW5WU8jvK25S3K7craeX9yjuUdyp3KHcq71Lu'
+        'Ut6t/K5SVzLK3UqkvEfpVz6hvFfJKvco71M+qXxKOVQ+rRwpn1GuKp9Vfk/5faWh/IHyh8rnlD9S'
+        'jpU/Vk6Uz8dlJPPxBz5XlPmh+FtufvvRP3s+f+nhmD2/42P+V775xtbVgBttPXe0bhl/7MrfurH1'
+        'Uv7ueQu576yFdGohnVpIpxbSqYV0aiGdWkinFtKphXRqIZ1aSKfe0al3dOodnXpHp6bRqWl0ahqd'
+        'mkanptGpaXRqGp2aRqem0albdOoWnbpFp27RqVt06hadukWnbtGpW3TqFp26Radu0alNdGoTndpE'
+        'pzbRqU10ahOd2kSnNtGpTXRqE53aRKc20alNdGoTndpEpzbRqU10ahOd2kSnNtGpTXRqE536Q6f+'
+        '0Kk/dOoPnRpDp8bQqTF0agydGkOnxtCpMXRqBZ1aQadW0KkVdGoFnXpApx7QqQd06gGd+lFnnML6'
+        'Y+K5z8/F14Eu/X9dOfyCS4YPXEd8ZK4XXjzt+fBfGHRN9vjiEmHrP/DsY6Gdl74iH8d2ff2Pzy8Z'
+        'nl1A/ApfOfzExZPp19vTRV961Pcls+iPHsYO9SOXHnftfx/3GL+b8Yh0p29/f+tD9D/T3/qKrU9e'
+        'P+c/Iz7nf+r8aZZnnz3NcrOt+mZbdVwuKU9XnqU8W3mucrPyfOUFykuVlym3Kq9UupVe5TVKn/I6'
+        '5U3Km5W3Kinlbco7lTuUdyl3K5HyXiWrvE95vPINyhOVJylPVi4rT1Halacqz1A6lWcqXcpzlOcp'
+        'L1RepLxYeYlyi/Jy5RVKoLxK6VFerbxWCZXblITyeuUNyhuVpPIW5e3K7Upaeb/yDuVO5S7l3UpG'
+        'eY/Sr9wTl5HM4cXku/hM1pczDeNPFz25dQvy4kb+V370XXwmy2L+6etfDHTSmndHrT89jH+USDz/'
+        'PuPbaq786uMf+LHxLzj7qpqXxd3t6mPriYDfuPGhPhHw2UfdCxP/B97buvj5sH745PfOL3P+6tll'
+        'zsCqEbjMGdg4AhtHYOMIbByBjSOwcQQ2jsBCFrhTEtjLAgtZYBsJbCOBOyWBpSSwrAWWtcCKElhR'
+        'AqtbYFMJbHCBDS5wpySwyAW2mMAWE9hiAltMYMkLLHmBnSaw0wR2msDmF9j8AndKAotOYNEJrIOB'
+        'fSewFQbWnsByGFgOA0tQYAkKLEGBJSiwOAZ2ocAuFNiFArtQYKkMLJWBzSiwWwZ2y8CdksCKGdia'
+        'AltTYGsKbE2BrSmwhQa20MAOFVhGA6tUYJUK3CkJ3CkJLFaBfTWwrwbWrMCaFbhTElhiA0tsYPcK'
+        '7LKBOyWBOyWBOyWBOyWBOyWBOyWBOyWBOyWBOyWBOyWBOyWBOyWBOyWBOyWBOyWBOyWBOyWBOyWB'
+        'OyVB3Cl//9z91Jn7bu67ue/mvpv7bu67ue/mvpv7bu67ue8Gvhv4buC7ge8mvZv0btK7Se8mvZv0'
+        'btK7Se8mvRvxbsS7Ee9GvBvxbsS7Ee9GvBvxbsS7Ee9GvJvtbra72e5mu5vtbra72e5mu5vtbra7'
+        '2e5mu5vtbra72e5mu5vtbra72e5mu5vtbra7oe6Guhvqbqi7ae6muZvmbpq7ae6muZvmbn67+e3m'
+        't5vfbn67we0GtxvcbnC7hag7ptO4eDD44jBx8Szwo+9HR2S++dJj42dH/EE83OLnAOZaj8c/6+wm'
+        'xcwNrYtqf3g++nbORl9o9IVGX2j0hUZfaPSFRl9o9IVGX2j0hUZfaOULTcDQBAxNwNAEDK18oUEY'
+        'GoShQRgahKFBGBqEoUEYGoShQRha+ULzMDQPQ/MwNA9D8zA0D0PzMDQPQ/MwNA9D8zA0D0MrX2gs'
+        'hsZiaCyGxmJoLIbGYmgshsZiaCyGxmJoLIbGYmgshsZiaCyGxmJoLIbGYmgshsZiaCyGxmJo5QtN'
+        'x9B0DE3H0HQMTavQkAwNydCQDA3J0JAMDcnQkAytfKGVLzQyQyMzNDJDIzM0MkMrX2hyhiZnaHKG'
+        'Jmdo5QutfKGVL7TyhVa+0MoXWvlCK19o5QutfKGVL7TyhVa+0MoXWvlCK19o5QutfKGVL4zn9udi'
+        '941WED7VOjiefaTtj1t/4c9af+FzrT/6TOuPPtX6o0s3ffSH73/y+ZfbfuC+ofjLcX+l9St+r/VH'
+        'z2n1kz9s/VF46YHvjn3Z2YH8Lf473hL/X//RX/gMXfrsufSU5KUkLyV5KclLSV5K8lKSl5K8lOSl'
+        'JC8lcimRS4lcSuRSIpcSuZTIpUQuJXIpkUuJXErkUiKXErmUyKVELiVyKZFLiVxK5FIilxK5lMil'
+        'RC4lcimRS4lcSuRSIpcSuZTIpUQuJXIpkUuJXErkUiKXErmUyKVELiVyKZFLiVxK5FIilxK5lMil'
+        'RC4lcimRS4lcSuRSIpcSuZTIpUQuJXIpkUuJXErkUiKXErmUyKVELiVyKZFLiVxK5FIilxK5lMil'
+        'RC4lcimRS4lcSuRSIpcSuZTIpUQuJXIpkUuhmhK5lMilRC4lcimRS4lcSuRSIpcSuZTIpUQuFbs/'
+        'fqQvu1z/iS8HrSu1D+EazPWffvONrd/wlbhSFV+4+b5WP/iyLsj88SP7NSl/euOj5WtSTv5qX//7'
+        '+a/Vr//9/PV7pLX4GnHzfL37prMhkzFkMoZMxpDJGDIZQyZjyGQMmYwhkzFkMoZMxpDJGDIZQyZj'
+        'yGRMl4zpkjFdMqZLxnTJmC4Z0yVjumRMl4yxkjFWMsZKxljJGCsZYyVjrGSMlYyxkjFWMsZKxljJ'
+        'mCcZ8yRjnmTMk4x5kjFPMuZJxjzJmCcZ8yRjnmTMk4x5kjFPMuZJxjzJmCcZ8yRjnmTMk4x5kjFP'
+        'MgZJxiDJGCQZgyRjkGQMkoxBkjFIMgZJxiDJGCQZgyRjdGSMjozRkTE6MkZHxszImBkZMyNjZmTM'
+        'jIyZkTEzMvb5jAUiY4JkTJCMCZIxQTK2g4xBkjFIMgZJxnjPmCcZ8yRjpGaMlYyxkjFWMmZixkzM'
+        'GDIZcy9j1mTMmoxZk4lnzX89d3//2bEm4j7iPuI+4j7iPuI+4j7iPuI+4j7iPuI+4j7iPuI+4j7i'
+        'PuI+4j7iPuI+4j7iPuI+4j7iPuI+4j7iPuI+4j7iPuI+4j7iPuI+4j7iPuI+4j7iPuI+4j7iPuI+'
+        '4j7iPuI+4j7iPuI+4j7iPuI+4j7iPuI+4j7iPuI+4j4CPgI+Aj4CPgI+Aj4CPgI+Aj4CPgI+Aj4C'
+        'PgI+Aj4CPpKzKKbzJ9dvs/1m/Nj8f3v0Pzb/rpsejsfm/zR+Ye5o/R9cbi0O8U+++OlLD/zki12x'
+        'y4ldTuxyYpcTu5zY5cQuJ3Y5scuJXU7scmKXE7uc2OXELid2ObHLiV1O7HJilxO7nNjlxC4ndjmx'
+        'y4ldTuxyYpcTu5zY5cQuJ3Y5scuJXU7scmKXE7uc2OXELid2ObHLiV1O7HJilxO7nNjlxC4ndjmx'
+        'y4ldTuxyYpcTu5zY5cQuJ3Y5scuJXU7scmKXE7uc2OXELid2OXnLyVtO3nLylpO3nLzl5C0nbzl5'
+        'y8lbTt5y8paTt5y85eK8/ffr33j3/a24nT5Scbv++dbXXfpLtt74s67/pPV3H2oK47T9TOt3PDiP'
+        '8YeGlx/2u7d/dj7zfvNs5uWFLy98eeHLC19e+PLClxe+vPDlhS8vfHmjPy+DeRnMy2BeBvPWgrwo'
+        '5kUxL4p5UcyLYl4U86KYF8W8KOZtDnmJzEtkXiLzEpmXyLxE5iUyL5F5icxLZF4i8xKZt3jkBTMv'
+        'mHnBzAtmXjDzgpkXzLxg5gUzL5h5wcwLZl4w84KZF8y8YOYFMy+YecHMC2ZeMPOCmbcE5eUzL595'
+        '+czLZ15s8mKaF9O86ZiX1ry05qU1L615O1TeDpWX3bzs5mU3L7t52c3br/IinBfhvAjnRThvR8zb'
+        'EfN2xLytMG8rzNsK87bCvHUwbx3MWwfz9sC8PTBvAcxbAPMWwLyVL2/Xy9v18na9fNxA/scX/Eim'
+        'J9z0oB/J9LhLX6uPwMSd5rYbvtwLCzd8yRcmPif/zLV//tfKQ0IP6XW5dO11+fZLrf/0x7eG0Y2X'
+        '/ko/s+7WSw/jdYZ4qgxf+sIfzPTAULvrDdf++iP+6t0Uv1zxle8XnV35/qDYfzBO6uMvXZ9Q33g2'
+        'oYZMqCETasiEGjKhhkyoIRNqyIQaMqGGTKghE2rIaBoymoaMpiGjachMGjKThsykITNpyEwaMpOG'
+        'zKQhM2nITBoyjIYMoyHDaMgwGjKMhgyjIcNoyDAaMoyGDKMhw2jIMBoyhYZMoSFTaMgUGjKFhkyh'
+        'IVNoyBQaMoWGTKEhU2jIFBoyhYZMoSFTaMgUGjKFhkyhIVNoyBQaMoWGTKEh42fI+BkyfoaMnyFz'
+        'Z8jcGTJ3hsydIXNnyNwZMneGTJohk2bIpBkyaYZMmiEjZsiIGTJihoyYIeNuKKbTdk7npjM6w+gM'
+        'ozOMzjA6w+gMozOMzjA6w+gMozOMzjA6w+gMozOMzjA6w+gMozOMzjA6w+gMozOMzjA6w+gMozOM'
+        'zjA6w+gMozOMzjA6w+gMozOMzjA6w+gMozOMzjA6w+gMozOMzjA6w+gMozOMzjA6w+gMozOMzjA6'
+        'w+gMozOMzjA6w+gMozOMzjA6w+gMozOMzjA6w+gMozOMzjA6w+gMozOMzjA6w+gMozOMzjA6w+gM'
+        'ozMc0/m6mM4nr9waf0lgS1DmUvyBkq8/N/WtZ6ZGmRplapSpUaZGmRplapSpUaZGmRplapSpUaZG'
+        'mRplapSpUaZGmRplapSpUaZGmRplapSpUaZGmRplapSpUaZGmRplapSpUaZGmRplapSpUaZGmRpl'
+        'apSpUaZGmRplapSpUaZGmRplapSpUaZGmRplapSpUaZGmRplapSpUaZGmRplapSpUaZGmRplapSp'
+        'UaZGmRplapSpUaZGmRplapSpUaZGmRplapSpUaZGmRplajQ29Q3ndH77jE4BnQI6BXQK6BTQKaBT'
+        'QKeATgGdAjoFZ60CQQWCCgQVCCo4axVAKoBUAKkAUgGkAkgFkAogFUAqOGsVeCrwVOCpwFOBpwJP'
+        'BZ4KPBV4KvBU4KnAU8FZq4BVAasCVgWsClgVsCpgVcCqgFUBqwJWBawKWBWwKmBVwKqAVQGrAlYF'
+        'rApYFbAqOGsV6CrQVaCrQFfBu12ArABZAbICZAXICpAVICs4axWctQrIFZArIFdAroBcwVmrQF6B'
+        'vAJ5BfIKzloFZ62Cs1bBWavgrFVw1io4axUsXQVnrYKzVsFZq+CsVXDWKjhrFZy1Cs5aBWetgrNW'
+        'wVmrELt/wiN6oIqX6Me3Djlf9QeHJ15vCHf9vH4woR9M6AcT+sGEfjChH0zoBxP6wYR+MKEfTOgH'
+        'ExrBhEYwoRFMaAQTOsCEDjChA0zoABM6wIQOMKEDTOgAEzrAhOhPiP6E6E+I/oToT4j+hOhPiP6E'
+        '6E+I/oToT4j+hMxPyPyEzE/I/ITMT8j8hMxPyPyEzE/I/ITMT8j8hMxPyPyEzE/I/ITMT8j8hMxP'
+        'yPyEzE/I/ISwTwj7hLBPCPuElE9I+YSUT0j5hJRPSPmElE/I9YRcT8j1hFxPyPWEQE8I9IRATwj0'
+        'hOYyEUfqSeej5OvPRskUOlPoTKEzhc4UOlPoTKEzhc4UOlPoTKEzhc4UOlPoTKEzhc4UOlPoTKEz'
+        'hc4UOlPoTKEzhc4UOlPoTKEzhc4UOlPoTKEzhc4UOlPoTKEzhc4UOlPoTKEzhc4UOlPoTKEzhc4U'
+        'OlPoTKEzhc4UOlPoTKEzhc4UOlPoTKEzhc4UOlPoTKEzhc4UOlPoTKEzhc4UOlPoTKEzhc4UOlPo'
+        'TKEzhc4UOlPoTKEzhc4UOlPoTMV0ntyic/8zPvCBbx38lo984DsHPzIwfO93fuDDH7l3+AO3xT8h'
+        '/YXXOH2y1UR/p9VEP9/6o5H4sc/LX6SPX/tF97Xu5zzEbn7/k+4d/rYPf2D03uFWjR+K+wet3/4V'
+        '+7LLK/OtS3sPV4f/eOtf+M7WRcOH3Oufcp7Y+bPEzknsnMTOSeycxM5J7JzEzknsnMTOSeycxM5J'
+        '7JzEzknsnMTOSeycxM5J7JzEzknsnMTOSeycxM5J7JzEzknsnMTOSeycxM5J7JzEzknsnMTOSeyc'
+        'xM5J7JzEzknsnMTOSeycxM5J7JzEzknsnMTOSeycxM5J7JzEzknsnMTOSeycxM5J7JzEzknsnMTO'
+        'SeycxM5J7JzEzknsnMTOSeycxM5J7JzEzknsnMTOSeycxM5J7JzEzknsnMTOSeycxM5J7JzEzsWJ'
+        'bb/0wHeyPeem1gXGp55T+o0zSkWUiigVUSqiVESpiFIRpSJKRZSKKBWdI4pEFYkqElUkqugcUQSr'
+        'CFYRrCJYRbCKYBXBKoJVBKvoHFHkq8hXka8iX0W+inwV+SryVeSryFeRryJfReeIImZFzIqYFTEr'
+        'YlbErIhZEbMiZkXMipgVMStiVsSsiFkRsyJmRcyKmBUxK2JWxKzoHFGkrUhbkbYibUXvfhG6InRF'
+        '6IrQFaErQleErugcUXSOKCJYRLCIYBHBIoJF54giiUUSiyQWSSw6RxSdI4rOEUXniKJzRNE5ougc'
+        'UXSOKDpHFJ0jis4RReeIonNE0Tmi6BxRdI4oOkcUnSOKzhHFOAcdly6+eeHiw1IXH5Z6eD4sFX89'
+        'xR2tW0MX37zwZX1m6mnX2tOVG87uKJfjx8Cefukx9W0KP/WQv03hGZce9c/HfffD8rWynRcz7q/1'
+        'e/W0wa6LHwn06PuGvYsv1nv4v/bzmedXrP/QyXPZyXPZyXPZyXPZyXPZyXPZyXPZyXPZyXPZyXPZ'
+        'yXPZkXPZkXPZkXPZkXPZWXPZWXPZWXPZWXPZWXPZWXPZWXPZWXPZWXPZIXPZIXPZIXPZIXPZIXPZ'
+        'IXPZIXPZIXPZIXPZIXPZIXPZIXPZ6XLZ6XLZ6XLZ6XLZ6XLZ6XLZ6XLZ6XLZ6XLZ6XLZ6XLZ6XLZ'
+        '6XLZ6XLZ6XLZ6XLZ6XLZ6XLZ6XLZ6XLZ6XLZ6XLZsXLZsXLZsXLZsXLZeXLZeXLZeXLZeXLZeXLZ'
+        'eXLZeXLZCXLZCXLZCXLZCXLZCXLZ0XHZ0XHZ0XHZ0XHZMXY5Prw969IDT+ze3NqMnn1+DeNPz65h'
+        'rJC0QtIKSSskrZC0QtIKSSskrZC0QtIKSSskrZC0QtIKSSskrZC0QtIKSSskrZC0QtIKSSskrZC0'
+        'QtIKSSskrZC0QtIKSSskrZC0QtIKSSskrZC0QtIKSSskrZC0QtIKSSskrZC0QtIKSSskrZC0QtIK'
+        'SSskrZC0QtIKSSskrZC0QtIKSSskrZC0QtIKSSskrZC0QtIKSSskrZC0QtIKSSskrZC0QtIKSSsk'
+        'rZC0QtJKLKmrJekJrTH9c/HH1Z4TU/rJFqU3nH1c7R+2fn1V+Rnl15QfV96i/Kby08qcMqV8n/LP'
+        'lH+t/KBSUyaUdyo/pdyr/ILyQeWjyseUFyjfo3xY+fvKP1V+Qvmbyo8pH1LGlO9W7lG+U/nbcRnJ'
+        'PPeBuGXuiE8izzvP2/POXqRVeVuVt1V5W5W3VXlblbdVeVuVt1V5W5W3VXlblbdVeVuVt1V5W5W3'
+        'VXlblbdVeVuVt1V5W5W3VXlb9VqtytuqvK3K26q8rcrbqrytytuqvK3K26q8rcrbqrytytuqvK3K'
+        '26q8rcrbqrytytuqvK3K26q8rcrbqrytytuqvK3K26q8rcrbqrytIrgqb6vytipvq/K2Km+r8rYq'
+        'b6u0rcrbqrytytuqvK3K26q8rcrbqrytytuqvK3K26q8raK0Km+r8rYaU7r5fOYfk7NGzho5a+Ss'
+        'kbNGzho5a+SskbNGzho5a+SskbNGzho5a+SskbNGzho5a+SskbNGzho5a+SskbNGzho5a+SskbNG'
+        'zho5a+SskbNGzho5a+SskbNGzho5a+SskbNGzho5a+SskbNGzho5a+SskbNGzho5a+SskbNGzho5'
+        'a+SskbNGzho5a+SskbNGzho5a+SskbNGzho5a+SskbNGzho5a+SskbNGzho5a+SskbNGzho5a7Gc'
+        '5583nV86G/JldMrolNEpo1NGp4xOGZ0yOmV0yuiU9ekyQWWCygSVCSq7UVEGqQxSGaQySGWQyiCV'
+        'QSqDVAap7EZFmacyT2WeyjyVeSrzVOapzFOZpzJPZZ7KPJXdqChjVcaqjFUZqzJWZazKWJWxKmNV'
+        'xqqMVRmrMlZlrMpYlbEqY1XGqoxVGasyVmWsym5UlOkq01Wmq0xX2btdhqwMWRmyMmRlyMqQlSEr'
+        'u1FRdqOijFwZuTJyZeTKyJXdqCiTVyavTF6ZvLIbFWU3KspuVJTdqCi7UVF2o6LsRkXZjYqyGxVl'
+        'NyrKblSU3agou1FRdqOi7EZF2Y2KshsVZTcqym5UlGP3Lzh3/2dn7ivcV7ivcF/hvsJ9hfsK9xXu'
+        'K9xXuK8AXwG+AnwF+ArpFdIrpFdIr5BeIb1CeoX0CukVxCuIVxCvIF5BvIJ4BfEK4hXEK4hXEK8g'
+        'XmG7wnaF7QrbFbYrbFfYrrBdYbvCdoXtCtsVtitsV9iusF1hu8J2he0K2xW2K2xXoK5AXYG6AnWF'
+        '5grNFZorNFdortBcobnCb4XfCr8Vfiv8VsCtgFsBtwJuRYgqMZ0XXt/bbojv9b7onNKNZ5TWUVpH'
+        'aR2ldZTWUVpHaR2ldZTWUVpHaR2ldZTWUVpHaR2ldZTWUVpHaR2ldZTWUVpHaR2ldZTWUVpHaR2l'
+        'dZTWUVpHaR2ldZTWUVpHaR2ldZTWUVpHaR2ldZTWUVpHaR2ldZTWUVpHaR2ldZTWUVpHaR2ldZTW'
+        'UVpHaR2ldZTWUVpHaR2ldZTWUVpHaR2ldZTWUVpHaR2ldZTWUVpHaR2ldZTWUVpHaR2ldZTWUVpH'
+        'aT2m9OJzOr9/RmcDnQ10NtDZQGcDnQ10NtDZQGcDnQ10NtDZQGcDnQ10NtDZQGcDnQ10NtDZQGcD'
+        'nQ10NtDZQGcDnQ10NtDZQGcDnQ10NtDZQGcDnQ10NtDZQGcDnQ10NtDZQGcDnQ10NtDZQGcDnQ10'
+        'NtDZQGcDnQ10NtDZQGcDnQ10NtDZQGcDnQ10NtDZQGcDnQ10NtDZQGcDnQ10NtDZQGcDnQ10NtDZ'
+        'QGcDnQ10NtDZQGcDnQ10NmI6L7l08QWlF/fcL+65f5XdhXjgW0gf17o99di+2f7S8+H2mrPhtmm4'
+        'bRpum4bbpuG2aaptmmqbptqmqbZpqm2aapum2qaptmmqbZpqm6bapqm2aaptmmqbptqmqbZpqm2a'
+        'apum2qaptmmqbZpqm6bapqm2aaptmmqbptqmqbZpqm2aapum2qaptmmqbZpqm6bapqm2aaptmmqb'
+        'ptqmqbZpqm2aapum2qaptmmqbZpqm6bapqm2aaptmmqbptqmqbZpqm2aapum2qaptmmqbZpqm6ba'
+        'pqm2aaptmmqbptqmqbZpqm2aapum2qaptmmqbZpqm6bapqm2aaptxlPtZdfM3P9173lv9M73pjLx'
+        'M8c/GV9AvuXc0s+eWaqyVGWpylKVpapFqYpUFakqUlWkqkhVXaaoklUlq0pWlayqyxRVwKqAVQGr'
+        'AlYFrApYFbAqYFXAqi5TVDmrclblrMpZlbMqZ1XOqpxVOatyVuWsylnVZYoqblXcqrhVcaviVsWt'
+        'ilsVtypuVdyquFVxq+JWxa2KWxW3Km5V3Kq4VXGr4lbFreoyRZW6KnVV6qrUVSmowleFrwpfFb4q'
+        'fFX4qvBVXaaoukxRRbGKYhXFKopVFKsuU1SJrBJZJbJKZNVliqrLFFWXKaouU1Rdpqi6TFF1maLq'
+        'MkXVZYqqyxRVlymqLlNUXaaoukxRdZmi6jJF1WWKqssUVZcpqnEeXn79ueKnxT/z/BVfsYdy4gdk'
+        'dltPA31NfMHDrecN4tfPGkRNg6hpEDUNoqZB1DSImgZR0yBqGkRNg6hpEDUNoqZB1DSImgZR0yBq'
+        'GkRNg6hpEDUNoqZB1DSImgZR0yBqGkRNg6hpEDUNoqZB1DSImgZR0yBqGkRNg6hpEDUNoqZB1DSI'
+        'mgZR0yBqGkRNg6hpEDUNoqZB1DSImgZR0yBqGkRNg6hpEDUNoqZB1DSImgZR0yBqGkRNg6hpEDUN'
+        'oqZB1DSImgZR0yBqGkRNg6hpEDUNoqZB1DSImgZR0yBqGkRNg6hpEDUNoqZB1DSImgZR0yBqGkRN'
+        'g6hpEDUNoqZB1DSImgZR0yBqGkRNg6hpEDUNoqZB1DSImgZR0yBqGkRNg6hpEDUNoqZB1DSImgZR'
+        '0yBqGkRNg6jFDeKV5+5nztzvcL/D/Q73O9zvcL/D/Q73O9zvcL/D/Q7wO8DvAL8D/A7pO6TvkL5D'
+        '+g7pO6TvkL5D+g7pO4jvIL6D+A7iO4jvIL6D+A7iO4jvIL6D+A7iO2zvsL3D9g7bO2zvsL3D9g7b'
+        'O2zvsL3D9g7bO2zvsL3D9g7bO2zvsL3D9g7bO2zvsL0D9Q7UO1DvQL1D8w7NOzTv0LxD8w7NOzTv'
+        '8LvD7w6/O/zu8LsD7g64O+DugLsjRDsxneD8puGfkLNLzi45u+TskrNLzi45u+TskrNLzi45u+Ts'
+        'krNLzi45u+TskrNLzi45u+TskrNLzi45u+TskrNLzi45u+TskrNLzi45u+TskrNLzi45u+TskrNL'
+        'zi45u+TskrNLzi45u+TskrNLzi45u+TskrNLzi45u+TskrNLzi45u+TskrNLzi45u+TskrNLzi45'
+        'u+TskrNLzi45u+TskrNLzi45u+TskrNLzi45u+TskrNLzi45u7GcV/nmjdYG8d9uOPteyMzXnT2z'
+        'sAfRHkR7EO1BtAfRHkR7EO1BtAfRHkR7EO1BtAfRHkR7EO1BtAfRHkR7EO1BtAfRHkR7EO1BtAfR'
+        'HkR7EO1BtAfRHkR7EO1BtAfRHkR7EO1BtAfRHkR7EO1BtAfRHkR7EO1BtAfRHkR7EO1BtAfRHkR7'
+        'EO1BtAfRHkR7EO1BtAfRHkR7EO1BtAfRHkR7EO1BtAfRHkR7EO1BtAfRHkR7EO1BtAfRHkR7EO1B'
+        'tAfRHkR7MaLuP7/KXvn5x7euUrS+zeULltore62//gut//nF1t/8EpvtlY893iWYz9zw0JfbK7/U'
+        '+sf/cut3/nWuuH/petvztf2Fd9M3frlfeNd76VH5Mx9/9GH/1tBXny+Gp2eL4b7OvK8z7+vM+zrz'
+        'vs68rzPv68z7OvO+zryvM+/rzPs6877OvK8z7+vM+zrzvs68rzPv68z7OvO+zryvM+/rzPs6877O'
+        'vK8z7+vM+zrzvs68rzPv68z7OvO+zryvM+/rzPs6877OvK8z7+vM+zrzvs68rzPv68z7OvO+zryv'
+        'M+/rzPs6877OvK8z7+vM+zrzvs68rzPv68z7OvO+zryvM+/rzPs6877OvK8z7+vM+zrzvs68rzPv'
+        '68z7OvO+zryvM+/rzPs6877OvK8z7+vM+zrzvs68rzPvx535NV8iU9f8/lqrt36lEvVV2XH7vvg3'
+        'Kdx800P/JoUvq718/srfuLH1NOtffF2ufNONrXtFN34ZX54Q956lGx/ip6I+1vrV39v61Q9+1b5o'
+        '13lt/Kq9rfUbP9Rqcc+Lv0X8Gpb7n/KR/2Vo4AP3fvCD933k3o8M3vfB+HssHnftl4StX/KC1i+5'
+        '8c6774n/8thHz55D/55rf/Xx73h3lIr/emah9atuelsUvTv+01+N//Tu6O50/Kefapm8rfXbOlr/'
+        'sOw9743/8t+71PpijPD8CeTbzhbVq55AvuoJ5KueQL7qCeSrAnvVE8hXPYF81RPIV10RuuoJ5Kue'
+        'QL7qCeSrnkC+6gnkq55AvirFVz2BfNUTyFc9gXzVE8hXPYF81RPIV/XBq55AvuoJ5KueQL7qCeSr'
+        'nkC+6gnkq55AvuoJ5KueQL7qCeSrgn7VE8hXPYF8NQ76bRefZLu4c3xx5/ir487xV/1ntOPPXd61'
+        '+dEffoTuHyfOr0/t6dgNC2zDAtuwwDYssA0LbMMC27DANiywDQtswwLbsMA2LLANC2zDAtuwwDYs'
+        'sA0LbMMC27DANiywDQtswwLbsMA2NO6GBbZhgW1YYBsW2IYFtmGBbVhgGxbYhgW2YYFtWGAbFtiG'
+        'BbZhgW1YYBsW2IYFtmGBbVhgGxbYhgW2YYFtWGAbFtiGBbZhgW1YYBsW2IYFtmGBbZiHDQtswwLb'
+        'sMA2LLANC2zDAtuwwDaMvoYFtmGBbVhgGxbYhgW2YYFtWGAbFtiGBbZhgW1YYBsW2Ia51rDANiyw'
+        'jXiuve4x85n+B9bY+Fvd33ctJF90O3t9625itvVLP9m6mfiGx9zL9OdfnXgffltrlf+C1+mN8QvT'
+        '+o//pdaL9bTWApm8/tTva+NPa73p0iP6I/z+7g2Plh/h9+bWCxUfHX4+vmX9lq8qZQ/zt849lFfp'
+        'auu1+ZHW6Sh+vd56fqHm/WcXah73dfGci8sTlCcqT1KerFxWnqK0K09VOpSnKU9XnqF0Ks9UnqU8'
+        'W+lSnqM8V3mecrPyfOUFyguVFykvVl6ivFR5mXKL8nLlFcqtyiuVQHmV0q30KL3Kq5XXKH3Ka5VQ'
+        'uU1JKK9TXq+8QXmjklTepLxZeYvyViWlvE15u3K7klbeobxTuUO5U3mXcpfybiWj3K1EynuUfuW9'
+        'Sla5R3mf8v64jGRSragdtTj94/gpqbfFlOKvQp+KD7mfvHJT/Avffm7sdWfG2hhrY6yNsTbG2uBq'
+        'g6sNrja42uBqg6sNrja42uBqg6sNrja42uBqg6sNrja42uBqg6sNrja42uBqg6sNrja42uBqg6sN'
+        'rja42uBqg6sNrja42uBqg6sNrja42uBqg6sNrja42uBqg6sNrja42uBqg6sNrja42uBqg6sNrja4'
+        '2uBqg6sNrja42uBqg6sNrja42uBqg6sNrja42uBqg6sNrja42uBqg6sNrja42uBqi83c/qWvAn7u'
+        'a/AqYHwnqPUfN3Tpz68FafG6cnRj/PhHXH5fOYrLSOYd1z/4/ok4ke88D97BWfAuC95lwbsseJcF'
+        '77Lmfln+LsvfZfm7LH+X5S8uU8rTlKcrz1A6ld9Snqk8S3m20qU8R3mu8jzlZuX5yseVFygvVF6k'
+        'vFh5ifJS5WXKLcrLlVcotyqvVH5bCZRXKd1Kj9KrvFp5jdKnvFYJlduUhPI65fXKG5Q3KknlTcqb'
+        'lbcob1VSyu8ob1PertyupJX3K+9Q3qncodypvEu5S3m38rtKXckodyuR8h6lX/mE8l4lq9yjvE/5'
+        'pPIp5VD5tHKkfEa5qnxW+T3l95WG8gfKHyqfU/5IOVb+WDlRPh+Xkcwd5+7TZ+7buW/nvp37du7b'
+        'gW8Hvh34duDbgW8nvZ30dtLbSW9HvB3xdsTbEW9HvB3xdsTbEW9HvJ3tdrbb2W5nu53tdrbb2W5n'
+        'u53tdrbb2W5nux3qdqjboW6Huh3qdqjboW6Huh3qdqjboW6Huh3qdqjboW6Huh3qdqjboW6Huh3q'
+        'dqjbaW6nuZ3mdprbMW7HuB3jdozbMW7HuB3jdnDbwW0Htx3cdnDbiW0ntp3YdmLbpac9NnPnuZmb'
+        'z8x0MNPBTAczHcx0MNPBTAczHcx0MNPBTAczHcx0MNPBTAczHcx0MNPBTAczHcx0MNPBTAczHcx0'
+        'MNPBTAczHcx0MNPBTAczHcx0MNPBTAczHcx0MNPBTAczHcx0MNPBTAczHcx0MNPBTAczHcx0MNPB'
+        'TAczHcx0MNPBTAczHcx0MNPBTAczHcx0MNPBTAczHcx0MNPBTAczHcx0MNPBTAczHcx0MNPBTAcz'
+        'Hcx0MNMRm3nX9Q34P8SHzbse9AWPdy23/sq7r3+p0Ydaf5o5v6j4i4x1MdbFWBdjXYx1mcddqHWh'
+        '1oVaF2pdqHWh1oVaF2pdqHWh1oVaF2pdqHWh1oVaF2pdqHWh1oVaF2pdqHWh1oVaF2pdqHWh1oVa'
+        'F2pdqHWh1oVaF2pdqHWh1oVaF2pdqHWh1oVaF2pdqHWh1oVaF2pdqHWh1oVaF2pdqHWh1oVaF2pd'
+        'qHWh1oVaF2pdqHWh1oVaF2pdqHWh1oVaF2pdqHWh1oVaF2pdqHWh1oVaF2pdqHXF1O6+uFn21/q1'
+        'jxc3xh5LX/boSz7XrzX1i699fEh3y6Lr16evxifP93xVXtyPr2U/qXXZ4K/t+nT/9evT98cv1Hvj'
+        'Fyq+t9m6EXDG+kNnn+O9P/6xKtnzC2tXzi6s3eK0dItz1S3xiLjn4oZK6zXr/gs3VN4XvzAnrdf4'
+        '6tnz4nf9F+tXYP0KrF+B9SuwfgXWr8D6FVi/AutXYP0KrF+B9SuwfgXWr8D6FVi/AutXYP0KrF+B'
+        '9SuwfgXWr8D6FVi/AutXYP0KrF+B9SuwfgXWr8D6FVi/AutXYP0KrF+B9SuwfgXWr8D6FVi/AutX'
+        'YP0KrF+B9SuwfgXWr8D6FVi/AutXYP0KrF+B9SuwfgXWr8D6FVi/AutXYP0KrF+B9SuwfgXWr8D6'
+        'FVi/AutXYP0KrF+B9SuwfgXWr8D6FVi/AutXYP0KrF+B9SuwfgXWr8D6FcTZev/1T0I+Pb7/ljs/'
+        'Lb7k7LTYi1IvSr0o9aLUy1AvQ70M9TLUy1AvQ70M9TLUy1AvQ70M9TLUy1AvQ70M9TLUy1AvQ70M'
+        '9TLUy1AvQ70M9TLUy1AvQ70M9TLUy1AvQ70M9TLUy1AvQ70M9TLUy1AvQ70M9TLUy1AvQ70M9TLU'
+        'y1AvQ70M9TLUy1AvQ70M9TLUy1AvQ70M9TLUy1AvQ70M9TLUy1AvQ70M9TLUy1AvQ70M9TLUy1Av'
+        'Q70M9TLUy1BvbOgbr7ehzMaND3xupXGmp4+ePnr66Omjp08j6oOoD6I+iPog6oOoD6I+iPog6oOo'
+        'D6I+iPog6oOoD6I+iPog6oOoD6I+iPog6oOoD6I+iPog6oOoD6I+iPog6oOoD6I+iPog6oOoD6I+'
+        'iPog6oOoD6I+iPog6oOoD6I+iPog6oOoD6I+iPog6oOoD6I+iPog6oOoD6I+iPog6oOoD6I+iPog'
+        '6oOoD6I+iPog6oOoD6I+iPog6oOoD6I+iPog6oOoL0b0P8WIfvfK794QX73+xA3xFdz6DfHF9k/e'
+        'EF8t/1S8rbV0vfnsYdOQrpCukK6QrpCukK6QrpCukK6QrpCukK6QrpCukK6QrpCukK6QrpCukK6Q'
+        'rpCukK6QrpCukK6QrpCukK6QrpCukK6QrpCukK6QrpCukK6QrpCukK6QrpCukK6QrpCukK6QrpCu'
+        'kK6QrpCukK6QrpCukK7Qlf0QshCyELIQstCbHrIWshayFrIWshayFrIWshayFrIWshayFrqWHyIX'
+        'IhciFyIXupYfupYfupYfuukTuqQfWj1Dl/RDl/RDl/RDl/RDS2rokn7okn7okn7okn7okn7okn7o'
+        'kn7okn7okn4Yu/8b5wP33WctMwF1AuoE1AmoEzQnaE7QnKA5QXOC5gTNCZoTNCdoTtCcoDlBc4Lm'
+        'BM0JmhM0J2hO0JygOUFzguYEzQmaEzQnaE7QnKA5QXOC5gTNCZoTNCdoTtCcoDlBc4LmBM0JmhM0'
+        'J2hO0JygOUFzguYEzQmaEzQnaE7QnKA5gXEC4wTGCYwT/Cb4TfCb4DfBb4LfBL8JfhP8JvhN8Jvg'
+        'NwFuAtwEuAlwE2KTiM18U/yDLG+8PfL8fltr6H53648S1z82+vKzBplkKclSkqUkS0kNMolUEqkk'
+        'UkmkkkglJSRJVpKsJFlJspJuiyYBSwKWBCwJWBKwJGBJwJKAJQFLui2a5CzJWZKzJGdJzpKcJTlL'
+        'cpbkLMlZkrMkZ0m3RZO4JXFL4pbELYlbErckbknckrglcUvilsQtiVsStyRuSdySuCVxS+KWxC2J'
+        'WxK3pOaZpC5JXZK6JHVJCpLwJeFLwpeELwlfEr4kfEm3RZNuiyZRTKKYRDGJYhLFpFaaJDJJZJLI'
+        'JJFJrTSplSa10qQemtRDk3poUg9N6qFJPTSphyb10KQemtRDk3poUg9N6qFJPTSphyb10GSch795'
+        '/WbE17XOMN98cUn5y/v8RXxx8GWtHnLxSYyLT2I85j6J8Qh9AONvXb+k/CfxldIPnF8F/fazq6C3'
+        'a463a6O3x00u3/pt8SH73fFvuzf+bXe0ut6fXvtNn239wX9tXVX9nx/Wy6XxpcjHtS5FPuq+zOpb'
+        'zl/owbMXOuOFznihM/EL/a3n97J/0xIVWaIiS1RkiYosUZElKrJERZaoyBIVWaIiS1Rke4psT5Ht'
+        'KbI9RdamyNoUWZsia1NkbYqsTZG1KbI2RdamyL4U2Zci+1JkX4rsS5F9KbIvRfalyL4U2Zci+1Jk'
+        'X4osSpFFKbIoRRalyKIUWZQii1JkUYosSpFFKbIoRRalyKIUWZQii1JkUYosSpFFKbIoRRalyKIU'
+        'WZQiG1JkQ4psSJENKbIaRVajyGoUWY0iq1FkNYqsRpFlKLIMRZahyDIUWYYiW1BkC4psQZEtKLKR'
+        'RbGcgfOzXPvZWa4fnX50+tHpR6cfnX50+tHpR6cfnX50+tHpR6cfnX50+tHpR6cfnX50+tHpR6cf'
+        'nX50+tHpR6cfnX50+tHpR6cfnX50+tHpR6cfnX50+tHpR6cfnX50+tHpR6cfnX50+tHpR6cfnX50'
+        '+tHpR6cfnX50+tHpR6cfnX50+tHpR6cfnX50+tHpR6cfnX50+tHpR6cfnX50+tHpR6cfnX50+tHp'
+        'R6cfnX50+tHpR6cfnX50+mM6f/ucTvWMThadLDpZdLLoZNHJopNFJ4tOFp0sOllHtyxBWYKyBGUJ'
+        'yjq6ZUHKgpQFKQtSFqQsSFmQsiBlQco6umV5yvKU5SnLU5anLE9ZnrI8ZXnK8pTlKctT1tEti1UW'
+        'qyxWWayyWGWxymKVxSqLVRarLFZZrLJYZbHKYpXFKotVFqssVlmsslhlsco6umXpytKVpStLV9a7'
+        'nYUsC1kWsixkWciykGUhyzq6ZR3dsshlkcsil0Uui1zW0S1LXpa8LHlZ8rKObllHt6yjW9bRLWsU'
+        'Zh3dso5uWUe3rKNb1tDMOrplHd2yjm5ZR7eso1vW0S3r6JZ1dMs6umVj99/24CfLfrS113z7g9eX'
+        'Kz93kxvGP9g6lTzabv3+Qevf/A2tB97jren3bng4fm7uYGsvrLb++T8QP6t35fqN+KfFd/S+40t/'
+        '4OCHLn2tf+3Idz6Y2UDrZfmux8RDBfEHWF9y7d19yJw+eL79HppDA+bQgDk0YA4NmEMD5tCAOTRg'
+        'Dg2YQwPm0IA5NGAADRhAAwbQgAE0YPIMmDwDJs+AyTNg8gyYPAMmz4DJM2DyDBg5A0bOgJEzYOQM'
+        'GDkDRs6AkTNg5AwYOQNGzoCRM2DkDJg1A2bNgFkzYNYMmDUDZs2AWTNg1gyYNQNmzYBZM2DWDJg1'
+        'A2bNgFkzYNYMmDUDZs2AWTNg1gyYNQNmzYAhM2DIDBgyA4bMgOkyYLoMmC4DpsuA6TJgugyYLgPm'
+        'yYB5MmCeDJgnA+bJgEEyYJAMGCQDBsmAoTYQt/L7HkjUlY+2adp/1Low/eB4xW3wO1p/9fo3/vz4'
+        'jV/8G3/uv+ne4W/7cHyd+x+1+udXc/quBShO4G9fudoaWw8O4sev/J34O2tb/x3Pu/TFA3nl6Gzo'
+        '/eiN50/8jGSG4tf3qLUivjQ+vh5fuc9cvi9+/T8U//2vb/39zvjvP+HKh2TvQ7IXl0vK05VnKc9W'
+        'nqvcrDxfeYHyUuVlyq3KK5VupVd5jdKnvE55k/Jm5a1KSnmb8k7lDuVdyt1KpLxXySrvUx6vfIPy'
+        'ROVJypOVy8pTlHblqcozlE7lmUqX8hzlecoLlRcpL1ZeotyivFx5hRIor1J6lFcrr1VC5TYlobxe'
+        'eYPyRiWpvEV5u3K7klber7xDuVO5S3m3klHeo/Qr98RlJDP8F2ZiHNhXthg+1h65+4Kh+OHWTvU9'
+        'rdfit+Jrbx+JX6jGlYTvrLr1pni/fZ0vmX69769+w7Vy5Y2t/0n6fuo3+SrqN8ffZB0/YHWW4jEp'
+        'Hovfg5GLmxcXXx712LhlEd9u+lhrqF/cvHi03LwYjdvT51vvXPsN8SX0Wx/f+utj59evamfXryZN'
+        '5UnnhknDedJwnjScJw3nScN50nCeNJwn7S6Trl9NWmEm7S6TBvekwT3p+tWk+T1pr5m010ya5pOm'
+        '+aQtZ9JQn7TsTFp2Jl2/mrTzTBr4kwb+pIE/aeBP2ocm7UOTxv+k8T9p/E9akiYtSZOuX03aCSbt'
+        'BJM2p0mrwaQFatKGMGmPmrRHTdoXJu0Lk/aFSfvCpB1r0towaW2YtDZMWhv+X/buPz72/a4LPLcz'
+        'qYYAoQxwEKzl5/CrYSiE0E4ndApTfp0OkynNJLrrNmTjomf3YfbhBHU2nsao24SmJEKIo86YURMl'
+        '/ph1dYwxalbFH1HHyahrjCJMJ01IAwU6lGHWjVH3zPeZm9wiSMu2pbe9//Rzzzm3t73zfb5e7/f3'
+        'm8nkqf3rqf3rqSXiqTXsqTXsqedXT21jTy0YTy0YTy0YTy0YTy0YTy1sTy1sT60bT+1tT20dT20d'
+        'Tz2/eur51VM7yFOr3VOr3VMbyVMbyVPPr57a957a955aU55a+556fvXU86unnl899fzqqedXTz2/'
+        'eur51VMT9qnnV089v3rq+dVTz6+een711POrp55fPfX86qnnV089v3rq+dXTYFz//gf3P3bnfon7'
+        'Je6XuF/ifon7Je6XuF/ifon7Je6XuF/ifon7Je6XuF/ifon7Je6XuF/ifon7Je6XuF/ifon7Je6X'
+        'uF/ifon7Je6XuF/ifon7Je6XuF/ifon7Je6XuF/ifon7Je6XuF/ifon7Je6XuF/ifon7Je6XuF/i'
+        'fon7Je6XuF/ifon7Je6XuF/ifon7Je6XuF/ifon7Je6XuF/ifon7Je6XuF/ifon7Je6XuF/ifon7'
+        'Je6XuF/ifon7Je6XuF/ifon7Je6XuF/ifon7Je6XuF/ifon7Je6XuF/ifon7Je6XuF/ifon7Je6X'
+        'uF/ifon7pcB94cH9++/cL3O/zP0y98vcL3O/zP0y98vcL3O/zP0y8MvALwO/DPwy6cukL5O+TPoy'
+        '6cukL5O+TPoy6cuILyO+jPgy4suILyO+jPgy4suILyO+jPgy4stsL7O9zPYy28tsL7O9zPYy28ts'
+        'L7O9zPYy28tsL7O9zPYy28tsL7O9zPYy28tsL7O9DPUy1MtQL0O9TPMyzcs0L9O8TPMyzcs0L/O7'
+        'zO8yv8v8LvO7DO4yuMvgLoO7LETLAZ3/LaDzU8H7CF52986F9C8G3xC2+PCdBL/n/jsJune+Vvha'
+        '4WuFrxW+Vvha4WuFrxW+Vvha4WuFrxW+Vvha4WuFrxW+Vvha4WuFrxW+Vvha4WuFrxW+Vvha4WuF'
+        'rxW+Vvha4WuFrxW+Vvha4WuFrxW+Vvha4WuFrxW+Vvha4WuFrxW+Vvha4WuFrxW+Vvha4WuFrxW+'
+        'Vvha4WuFrxW+Vvha4WuFrxW+Vvha4WuFrxW+Vvha4WuFrxW+Vvha4WuFrxW+Vvha4WuFrxW+Vvha'
+        '4Wsl8PUH7r8g8heDm/WnD8/F/te752JrLKyxsMbCmsu+5rKvudBrrvCaK7zmCq+5imuu4poLtuaC'
+        'rblEa67Nmouy5qKseeHXvLhrXtw1r+qaV3XNq7rmlVvzyq15yda8OmtenTWvx5rXY80LseaB2Jqo'
+        'rMnImoysCceacKwJx5pwrMnBmhysycEa+WvkryG/Rvca3Wt0r9G9xvMaz2s8rxG8RvAaumvMrlG6'
+        'RukapWuUruG5hucanmt4rgG5xt4ae2vsrbG3RtsaZmuYrWG2BtYaWGsorTG0Fhh6+0MRvfllzxdR'
+        '766I1r2664po3Yu87kVeV0TrXut1r/W613rda70O3zp86/CtuwDrLsC6C7BO5DqR6y7Husuxzue6'
+        'q7KO6Tqm65iuu1TrLtW6S7XuUq0jvI7wugu37sKtu3DrXK9zve4yrruM65Svu5rrsK+7qOvMrzO/'
+        '7hKvu8TrLvG6S7wuD+uu9Lorve5Kr7vS67KyLivrrvu6yKyLzLrIrMOwDsM6DOswrIvTujito7Eu'
+        'VeuErBOyTsi6qK2L2jov67ysC9664K3Tsy5/6xCtB4iW7r8SOxx8ZfYPBqiCb7Z8//PT7fEBU5tM'
+        'bTK1ydQmU5swbcK0CdMmTJswbcK0CdMmTJswbcK0CdMmTJswbcK0CdMmTJswbcK0CdMmTJswbcK0'
+        'CdMmTJswbcK0CdMmTJswbcK0CdMmPpswbaK1CdMmTJswbcK0CdMmTJswbcK0CdMmTJswbcK0CdMm'
+        'TJswbcK0CdMmTJswbcK0CdMmTJswbcK0CdMmTJswbcK0CdMmTJswbcK0CdMmTJswbcK0CdMmTJsw'
+        'bQaYlu/fNfoXgi/r/6GHBfxv3vVSkaEiQ0WGigwV9VIRpSJKRZSKKBVRKrrxLBJVJKpIVJGoohvP'
+        'IlhFsIpgFcEqglUEqwhWEawiWEU3nkW+inwV+SryVeSryFeRryJfRb6KfBX5KvJVdONZxKwIVhGz'
+        'InRFzIqYFTErYlbErIhZEbMiZkXMipgVMStiVsSsiFkRsyJmRcyKmBXdeBZpK9JWpK1IW9HVL0JX'
+        'hK4IXRG6InRF6IrQFd14Ft14FhEsIlhEsIhgEcGiG88iiUUSiyQWSSy68Sy68Sy68Sy68Sy68Sy6'
+        '8Sy68Sy68Sy68Sy68Sy68Sy68Sy68Sy68Sy68Sy68Sy68Sy68Sy68SwGOfjDL3gnR/oVQRT+yEMU'
+        'Pv8uCiVRKIlCSRRKolCSgZIMlGSgJAMlGSjBX4K/BH8J/hL1JepL1JeoL1Ffor5EfYn6EvUl3Eu4'
+        'l3Av4V7CvYR7CfcS7iXcS7iXcC/hXuK8xHmJ8xLnJc5LnJc4L3Fe4rzEeYnzEuclzkuclzgvcV7i'
+        'vMR5ifMS5yXOS5yXAC8BXgK8BHiJ7BLZJbJLZJfILpFdIrvEconlEssllksslyAuQVyCuARxSaBK'
+        'AaP//RP+7T/Bl25/4rlf8mOGftUvdb7jIUxvvfsewoowVYSpIkwVYaqYKxWZqshURaYqMlWRqYq5'
+        'UhGtimhVRKsiWhVzpSJhFQmrSFhFwioSVpGwioRVJKwiYRVzpSJoFUGrCFpF0CqCVhG0iqBVBK0i'
+        'aBVBqwhaRdAq5kpF3iryVpG3irxV5K0ibxV5q8hbRd4q8laRt4q8VeStIm8VeavIW0XeKvJWkbeK'
+        'vFXkrSJvFXOlInYVsauIXUXsKmJQkb6K9FWkryJ9FemrSF9F+irmSsVcqchiRRYrsliRxYosVsyV'
+        'ikhWRLIikhWRrJgrFXOlYq5UzJWKuVIxVyrmSsVcqZgrFXOlYq5UzJWKuVIxVyrmSsVcqZgrFXOl'
+        'Yq5UgkJYCdz3g/zn+u+Z++P9x1GrD++Fe78o7IjCjijsiMKOKOyIwo4o7IjCjijsiMKOKOzIwI4M'
+        '7MjAjgzswL8D/w78O/DvwL8D/w78O/DvwL9D/Q71O9TvUL9D/Q71O9TvUL9D/Q71O9TvUL+D+w7u'
+        'O7jv4L6D+w7uO7jv4L6D+w7uO7jv4L6D+w7uO7jv4L6D+w7uO7jv4L6D+w7uO5zvcL7D+Q7nO4Dv'
+        'AL4D+A7gO4DvAL4D+A7SO0jvIL2D9A7SOyzvsLzD8g7LO3K1E2j6/k+aj6wK3mH6vzwLx4c0Xd75'
+        'wu3tO4Ltbe3+Lvmrg7vkd31kX7on39//IPHg1Xvyzv5ffgRewCdr/R8V+K7+P+2XeSmf/ED/T9f7'
+        'f/prfFGfbPT/CX+0/0/4pa/qX33yg/3f/iUv7pOVkJf0jfc//+IH+i/rVfDwIXiZ1z8p3lcUfPri'
+        'D73sl3uH0Qd/1Obd+41e+sTN/+a7iZ5s3r1l/nOesXrxvLPo4+szN1/6pM0P6Z1FG/cPuP51MAf+'
+        '6MPbnb/o7o2SNdtfLRixP/hwo/In7u76921n+7azfdvZvu1s33a2bzvbt53t2872bWf7trN9Nyr7'
+        'lrR9S9q+JW3fkrbvRmXfrrZvV9u3q+3b1fbtavt2tX272r5dbd+utu9GZd/Ktm9l27ey7VvZ9q1s'
+        '+1a2fSvbvpVt38q2b2Xbt7LtW9n23ajs29z2bW77Nrd9m9u+zW3f5rZvc9u3ue3b3PZtbvs2t32b'
+        '277Nbd/mtm9z27e57dvc9m1u+za3fZvbvs1t3+a270Zl3wK3b4Hbt8DtW+D2LVT79rh9e9y+PW7f'
+        'Hrdvj9u3x+3b4/bdqOy7Udm31e3b6vZtdfu2un1b3b4blX3L3b7lbt9yt2+523ejsu9GZd+Nyr4b'
+        'lX03KvtuVPbdqOyjuu9GZd+Nyr4blX03KvtuVPbdqOy7Udl3o7LvRmXfjcq+G5X9wP0PPXw587Pu'
+        'vpx5AO4BsQfe5n8A7gGcB3Ae4HjA4QGHBwAeQHYA2QFPBzwdoHPAzAEsB7AcAHHgoh+46Aeu9oGr'
+        'feAyH7iGB67hgYt34MocuDIHLsKBi3Dg1T/wVc0D8T6Q6wO5PpDrA7k+kOsDuT6Q6wPZPZDdA6E9'
+        'ENMDMT2QzwMZPJDBAxk8kMEDqTuQugOpOxCwAwE7kKwDkToQogMhOhCiAyE6kJ4D6TmQngPpOZCX'
+        'A5k4kIkDmTiQiQOZOJCCA/wP8D8A/gDxA8QPaD4IBG0Ggu7eth4U6DffPek59AofKtBDL/ShF/rQ'
+        'C33ohT70Qh96oQ+90IccHnJ4COChV//Qq3+oOQ9dhEM4D+E8dEkOXZJDVA9dmUNiD4k91JyH4B66'
+        'aoeu2qGrduiqHUJ9CPWha3joGh66hoekH5J+qDkPXdhDF/YQ/0PX91AKDl3mQ2E4FIZDF/3QRT90'
+        '0Q9d9ENBOXTtD137Q9f+0LU/FKJDITok4VCWDmXpUHMeitQhJYeUHFJySMkhJYdSdyh1h8wcCt8h'
+        'OofoHGrOQ815CNKhfB7K5yFWh1gdas5DoT0U2kPWDmX3UHMeas5DzXmoOQ8156HmPNSch5rzUHMe'
+        'as5DzXmoOQ8156HmPNSch5rzUHMeas5DzXkYuP/hvnvv5H7Fc34iyQfdDD0p3X069Wv7H2/y0ndc'
+        'fOTvjJ5t2M/+81Ne+taLlz4t6kV/W/RR/TaLrYcl7213S96R4XpkuB4ZrkcG6JEBemRkHpmVR2bl'
+        'kSF5ZBAeGYRHZt6RmXdkvB2Za0cG2pGBdmRoHRlMRwbTkYl0ZCIdGUVH5syROXNkwByZHkemx5FB'
+        'cWRQHJkQR7a7I7vHkaXjyNJxZOk4snQcWTqOLB1Hlo4j+8WR/eLIYnFklTiyShzZIY7sCUf2hCN7'
+        'wpE94chmcGQzOLIZHFkCjiwBR6b/kbF/ZNAfGfRHBv2RQX9kwh+Z8Ecm/JEJf2SmH5nbR+b2kbl9'
+        'ZG4fmdtHJvWREX1kRB8ZykfG8JExfGTiHgVT7o/176P/VP+hzef2b6OL9x8Tlv5Hz7/b9vG/7H91'
+        '449/XD+jDr58+Yr+/+M/8zv/7JPZu+ebof5vfEy/9fNPPDxmGLnbko9JPbYlHwN7DOwxsMfAHgN7'
+        'DOwxsMeCfOwxw7E8H8vzMczHMB9blo+ZPpb1Y1k/JvyY8GPJPwb9WAEcK4Bjy/KxHjgWgmMhOBaC'
+        'YyE41hHHOuJYJI5F4lgkjhXHseI4tiwfy8mxnBxrk2NxOVYqx1JzrFuOdcuxDB3L0LEMHcvQsd45'
+        'FqVjUToWpWNROtZJxzrpWLCOVdOxajq2LB9rqGOhOxa6Y6E7FrpjoTtWYsdK7FgEj3XZsSQeS+Kx'
+        'ZfnYsnwsl8fq7ljdHUvpsZQeW5aPdeCxDjwW3WNVeGxZPrYsH1uWjy3Lx5blY8vysWX52LJ8bFk+'
+        'tiwfW5aPLcvHluVjy/KxZfnYsnxsWT62LB9blo+DGvmTH9F2CL5K9Dj4mOIX+beClx76YOquD+r6'
+        'oK4P6vqgrg/q+qCuD+r6oK4P6vqgrg/q+qCuD+r6oK4P6vqgrg/q+qCuD+r6oK4P6vqgrg/q+qCu'
+        'D+r6oK4P6vqgrg/q+qCuD+r6oK4P6vqgrg/q+qCuD+r6oK4P6vqgrg/q+qCuD+r6oK4P6vqgrg/q'
+        '+qCuD+r6oK4P6vqgrg/q+qCuD+r6oK4P6vqgrg/q+qCuD+r6oK4P6vqgrg/q+qCuD+r6oK4P6vqg'
+        'rg/q+qCuD+r6oK4P6vqgrg/q+qCuD+r6oK4P6vqgrg/q+qCuD+r6oK4P6vqgrg/q+qCuD+r6oK4P'
+        '6vqgrg/q+qCuD+r6oK4P6vqgrg/q+qCuD+r6oK4P6vqgHvRB+cH9j949bm9w3+C+wX2D+wb3De4b'
+        '3De4b3Df4L7BfYP7BvcN7hvcN7hvcN/gvsF9g/sG9w3uG9w3uG9w3+C+wX2D+wb3De4b3De4b3Df'
+        '4L7BfYP7BvcN7hvcN7hvcN/gvsF9g/sG9w3uG9w3uG9w3+C+wX2D+wb3De4b3De4b3Df4L7BfYP7'
+        'BvcN7hvcN7hvcN/gvsF9g/sG9w3uG9w3uG9w3+C+wX2D+wb3De4b3De4b3Df4L7BfYP7BvcN7hvc'
+        'N7hvcN/gvsF9g/sG9w3uG9w3uG9w3+C+wX2D+wb3De4b3De4b3DfCNz/qQf3f/LOfZP7JvdN7pvc'
+        'N7lvct/kvsl9k/sm903um9w3uW9y3+S+yX2T+yb3Te6b3De5b3Lf5L7JfZP7JvdN7pvcN7lvct/k'
+        'vsl9k/sm903um9w3uW9y3+S+yX2T+yb3Te6b3De5b3Lf5L7JfZP7JvdN7pvcN7lvct/kvsl9k/sm'
+        '903um9w3uW9y3+S+yX2T+yb3Te6b3De5b3Lf5L7JfZP7JvdN7pvcN7lvct/kvsl9k/sm903um9w3'
+        'uW9y3+S+yX2T+yb3Te6b3De5b3Lf5L7JfZP7JvdN7pvcN7lvct/kvsl9k/tm4H47cB/chf2B/jer'
+        'fDL/+L0PWgAr/fvr4HO8xsP9G+w//VAQn3VXEKcK4lRBnCqIUwVxqiBOFcSpgjhVEKcK4lRBnGqG'
+        'U81wqhlONcOpSjhVCacq4VQlnKqEU5VwqhJOVcKpSjjVBae64FQXnOqCU11wqgtOdcGpLjjVBae6'
+        '4FQXnOqCUyVwqgROlcCpEjhVAqdK4FQJnCqBUyVwqgROlcCpEjhVAqdK4FQJnCqBUyVwqgROlcCp'
+        'EjhVAqdK4FT6T6X/VPpPpf9U7E/F/lTsT8X+VOxPxf5U7E8F/VTQTwX9VNBPBf1Uwk8l/FTCTyX8'
+        'VNucBhn7Mw90Xn13L3GGzhk6Z+icoXOGzhk6Z+icoXOGzhk6Z2bLGUFnBJ0RdEbQmdlyBtIZSGcg'
+        'nYF0BtIZSGcgnYF0BtKZ2XLG0xlPZzyd8XTG0xlPZzyd8XTG0xlPZzyd8XRmtpxhdYbVGVZnWJ1h'
+        'dYbVGVZnWJ1hdYbVGVZnWJ1hdYbVGVZnWJ1hdYbVGVZnWJ1hdYbVmdlyRtcZXWd0ndF15mqfQXYG'
+        '2RlkZ5CdQXYG2RlkZ2bLmdlyhtwZcmfInSF3htyZ2XJG3hl5Z+SdkXdmtpyZLWdmy5nZcma2nJkt'
+        'Z2bLmdlyZracmS1nZsuZ2XJmtpyZLWdmy5nZcma2nJktZ2bLWeD+z37cPXkM5tzr+g8Xf11ny07w'
+        'wgSPaG+f/X8JPiPhU1/Wf1i7+1AVf/duyrRURUtVtFRFS1W0VEVLVbRURUtVtFRFS1W0VEVLVbRU'
+        'RUtVtFRFS1W0VEVLVbRURUtVtFRFS1W0VEVLVbRURUtVtFRFS1W0VEVLVbRURUtVtFRFS1W0VEVL'
+        'VbRURUtVtFRFS1W0VEVLVbRURUtVtFRFS1W0VEVLVbRURUtVtFRFS1W0VEVLVbRURUtVtFRFS1W0'
+        'VEVLVbRURUtVtFRFS1W0VEVLVbRURUtVtFRFS1W0VEVLVbRURUtVtFRFS1W0VEVLVbRURUtVtFRF'
+        'S1W0VEVLVbRURUtVtFRFS1W0VEVLVbRURUtVtFRFS1W0VEVLVbRURUtVtFRFS1W0VEVLVbRURUtV'
+        'tFRFK6iKP/dfvVcleTcp2/i38W/j38a/jX8b/zb+bfzb+Lfxb3Pf5r7NfZv7Nvdt7tvct7lvc9/m'
+        'vs19m/s2923u29y3uW9z3+a+zX2b+zb3be7b3Le5b3Pf5r7NfZv7Nvdt7tvct7lvc9/mvs19m/s2'
+        '923u29y3uW9z3+a+zX2b+zb3be7b3Le5b3Pf5r7NfZv7Nvdt7tvct7lvc9/mvs19m/s2923u29y3'
+        'uW9z3+a+zX2b+zb3be7b3Le5b3Pf5r7NfZv7Nvdt7tvct7lvc9/mvs19m/s2923u29y3uW9z3+a+'
+        'zX2b+zb3be7bgfs///ABFPH+7VfwBbyvuP/UgIYMXMrApQxcysClDFzKwKUMXMrApQxcysClDFzK'
+        'wKUMXMrApQxcwn8J/yX8l/Bfwn8J/yX8l/Bfwn9J/SX1l9RfUn9J/SX1l9RfUn9J/SX1l9RfUn+J'
+        '+yXul7hf4n6J+yXul7hf4n6J+yXul7hf4n6J+yXul7hf4n6J+yXul7hf4n6J+yXul5xfcn7J+SXn'
+        'l4BfAn5J9iXZl2Rfkn3J8iXLlyxfsnzJ8iXElxBfQnwJ8aVAXQaMfuRhbfimu7XhipkrZq6YuWLm'
+        'CpYrWK5guYLlCpYrWK5guYLlCpYrWK5guYLlCpYrWK5guYLlCpYrWK5guYLlCpYrWK5guYLlCpYr'
+        'WK5guYLlCpYrWK5guYLlCpYrWK5guYLlCpYrWK5guYLlCpYrWK5guYLlCpYrWK5guYLlCpYrWK5g'
+        'uYLlCpYrWK5guYLlCpYrWK604RUzV8xcMXPFzBUzV8xcMXPFzBUzV8xcMXPFzBUzV8xcBWb2Hsx8'
+        '0Z2Za2aumblm5pqZa2aumblm5pqZa2aumblm5pqZa2aumblm5pqZa2aumblm5pqZa2aumblm5pqZ'
+        'a2aumblm5pqZa2aumblm5pqZa2aumblm5pqZa2aumblm5pqZa2aumblm5pqZa2aumblm5pqZa2au'
+        'mblm5pqZa2aumblm5pqZa2aumblm5pqZa2aumblm5pqZa2aumblm5pqZa2aumblm5pqZa2aumblm'
+        '5pqZa2auAzN/4ZPm+x1/pfu44A7yVS97+MB+d3R/8UX1wgT/Er3+lvFRv9X9S/ff7vOtwWPUv3z/'
+        'WPXtwae2Ve9/pus/6P/y/3gopZ+4K6WuUuoqpa5S6iqlruWnq5u6uqmrm7q6qaubuu5/uyqqq6K6'
+        'KqqrorruA7qaqqupupqqq6m6mqqrqbqaqqupupqq6z6gq7C6CqursLoKq6uwugqrq7C6CqursLoK'
+        'q6uwugqr6z6gq7e6equrt7p6q6u3unqrq7e6equrt7p6q6u3unqrq7e6equrt7p6q6u3unqrq7e6'
+        'equrt7p6q+s+oKu+uuqrq7666qurTrparKvFulqsq8W6WqyrxbparOs+oOs+oKvTujqtq9O6Oq2r'
+        '07ruA7qqravauqqtq9q67gO67gO67gO67gO67gO67gO67gO67gO67gO67gO67gO67gO67gO67gO6'
+        '7gO67gO67gO67gO67gO6QbH+lYcPyzzt5/K9/UR84Nlf9H+21OOv6z8a+j8fovHDd9G4EY0b0bgR'
+        'jRvRuJGJG5m4kYkbmbiRiRthuBGGG2G4EYYbKbiRghspuJGCGym4kYIbKbiRghspuMH/Bv8b/G/w'
+        'v8H/Bv8b/G/wv8H/Bv8b/G/wv+H+hvsb7m+4v+H+hvsb7m+4v+H+hvsb7m+4v+H+hvsb7m+4v+H+'
+        'hvsb7m+4v+H+hvsb4G+AvwH+Bvgb0m9IvyH9hvQb0m9IvyH9hu0btm/YvmH7hu0bqG+gvoH6Buob'
+        'AbsJWP3VBzMDd2Zumbll5paZW2Zu1ektOrfo3KJzi84tOrfo3KJzi84tOrfo3KJzi84tOrfo3KJz'
+        'i84tOrfo3KJzi84tOrfo3KJzi84tOrfo3KJzi84tOrfo3KJzi84tOrfo3KJzi84tOrfo3KJzi84t'
+        'Orfo3KJzi84tOrfo3KJzi84tOrfo3KJzi84tOrfo3KJzi84tOrfo3KJzi84tOrfo3KJzi84tOrfo'
+        '3KJzi84tOrfo3KJzi84tOrcBnb/2SfOD09Kveu7D+clptZd+csv9xysEP9pj57ngGxde+oSFF/k3'
+        'DflUjQ+89PkKL+rPV/jrDyP/792N/Jf9xqBgguNTHUOOT3N8uuMzHMOOz3S8wvFZjrc7Io7PdnyO'
+        '43MdP+F45Pg8x29yfL7jCxy/2fFKx29xvMrRcnyh44scX+z4EseXOr7MEXV8ueMrHF/p+CrHVzve'
+        '7Xi1Y8TxNY6Y42sdr3F8nePrHaOOb3CMOb7R8VrH6xxxx+sdCce445scb3AkHW90tB3f7PgWR8rx'
+        'JkfO8a2Ob3N8u+M7HN/peOx4s+Pc8R5H2vFdjoxjwpF1XDje4vhux1sdk45Lx086rhzvdVw7fsrx'
+        '0473OX7G8bOOn3O839Fx/LzjA45fcHQdv+joBcf3pfcf3Dfv3Ie5D3Mf5j7MfZj7MPdh7sPch7kP'
+        'cx/mPsx9mPsw92Huw9yHuQ9zH+Y+zH2Y+zD3Ye7D3Ie5D3Mf5j7MfZj7MPdh7sPch7kPcx/mPsx9'
+        'mPsw92Huw9yHuQ9zH+Y+zH2Y+zD3Ye7D3Ie5D3Mf5j7MfZj7MPdh7sPch7kPcx/mPsx9mPsw92Hu'
+        'w9yHuQ9zH+Y+zH2Y+zD3Ye7D3Ie5D3Mf5j7MfZj7MPdh7sPch7kPcx/mPsx9mPsw92Huw9yHuQ9z'
+        'H+Y+zH2Y+zD3Ye7D3Ie5D3Mf5j7MfZj7MPdh7sPch7kPB+7/xvMfAPb4h/oP0A4evqB4+9zzX0b8'
+        '+/IwKA+D8jAoD4PyMCgPg/IwKA+D8jAoD4PyMCgIg4IwKAiDgjAoAYMSMCgBgxIwKAGDEjAoAYMS'
+        'MCgBg+gPoj+I/iD6g+gPoj+I/iD6g+gPoj+I/iD6g8wPMj/I/CDzg8wPMj/I/CDzg8wPMj/I/CDz'
+        'g8wPMj/I/CDzg8wPMj/I/CDzg8wPMj8I+yDsg7APwj5I+SDlg5QPUj5I+SDlg5QPcj3I9SDXg1wP'
+        'cj0I9CDQg0APAj0oXIMBqb/58HmY/5GcIXKGyBkiZ4icIXKGyBkiZ4icIXKGyBkiZ4icIXKGyBki'
+        'Z4icIXKGyBkiZ4icIXKGyBkiZ4icIXKGyBkiZ4icIXKGyBkiZ4icIXKGyBkiZ4icIXKGyBkiZ4ic'
+        'IXKGyBkiZ4icIXKGyBkiZ4icIXKGyBkiZ4icIXKGyBkiZ4icIXKGyBkiZ4icIXKGyBkiZ4icIXKG'
+        'yBkiZ4icIXKGyBkiZ4icIXKGyBkiZ4icIXKGyBkK5By+aB8aBA8Cvq3/dZ2PypdB/tbDdvIpd29s'
+        'GpapYZkalqlhmRqWqWGZGpapYZkalqlhmRqWqWGZGpapYZkalqlhmRqWqWGZGpapYZkalqlhmRqW'
+        'qWGZGpapYZkalqlhmRqWqWGZGpapYZkalqlhmRqWqWGZGpapYZkalqlhmRqWqWGZGpapYZkalqlh'
+        'mRqWqWGZGpapYZkalqlhmRqWqWGZGpapYZkalqlhmRqWqWGZGpapYZkalqlhmRqWqWGZGpapYZka'
+        'lqlhmRqWqWGZGpapYZkalqlhmRqWqWGZGg4y9bfvv4L2zcEH5v2dB0p//G7RjaAUQSmCUgSlCEoR'
+        'lCIoRVCKoBRBKWLRjRAVISpCVISoiEU3AlYErAhYEbAiYEXAioAVASsCVsSiG+ErwleErwhfEb4i'
+        'fEX4ivAV4SvCV4SvCF8Ri24EswhmEcwimEUwi2AWwSyCWQSzCGYRzCKYRTCLYBbBLIJZBLMIZhHM'
+        'IphFMItgFrHoRmiL0BahLUJbxNWPQBeBLgJdBLoIdBHoItBFLLoRi24EwQiCEQQjCEYQjFh0IyRG'
+        'SIyQGCExYtGNWHQjFt2IRTdi0Y1YdCMW3YhFN2LRjVh0IxbdiEU3YtGNWHQjFt2IRTdi0Y1YdCMW'
+        '3UiQg6PAfbsfhM/rf4nsov9Xn9vfcYPPT3n93eenPIL5EcWPKH5E6iNSH7H5CMpHUD6i8RFxj4h7'
+        'BNcjuB5x9AigR+Q8IucRHY8IeETAI5f+kUv/yDV/5II+ckEfuZKPXKZHLtMjV+SRK/LIpQiOAceg'
+        'Y8jxaY5Pd3yGY9jxmY5XOD7H8bmOR47Pd3yB45WOL3J8seNLHF/q+HLHVzi+0vFqx4gj5niNY9Tx'
+        'DY4xxzc6XueIO17vSDje4PgWR8rxJkfO8a2O73A8drzZkXZMOLKOtzouHT/puHK83fETjvc6rh0/'
+        '5fhpR8vxPsfPOH7W8W7Hzzne7+g4ft7xAce54z2OX3B0Hb/o6AXH96X/r/sp8PZgCvzdj/jnNqR/'
+        '9mWfCB/c8Pf6L9Qf7P/7/FTwQv394IX6tid/pP9p0X/o7nOOX9H/gvqP3r/15G/1/8Z/8Kt8bNxL'
+        'nxT3sfgKz0sfEPfSB8R9LL+uc/dZkI933vHDH+8fFvcP70dANvio/3/0SfdmzGBMrfSXv//mCPjH'
+        'wQvzc0++8eXBOH3ty4PB+7qXB/M+/ux48vqXu+r9ifczT8ZfHgzob3p5/1U+7r/K/R/e+Hi3/yL/'
+        'k4e7refu7rZGbGAj7rZGLGIjFrERi9iIRWzEIjZiERuxiI1YUEcsqCMW1BHb2YjtbMR2NmJrHbG1'
+        'jtjVRuxqI3bYESvbiFV2xCo7YpUdsceN2ONG7HEj9rgRa+6INXfEVjdiqxux1Y3YfUfsviN2vBE7'
+        '3ohNeMSqN2IhHrHxjdiLR+zFI/a/EfvfiP1vxP43YmcesQaOWANHrIEj1sAR+/SIfXrEUjhirR6x'
+        'Vo9Yq0dsiiM2xRGb4ogVccTKPWLlHrEwjti8R+yNI/bGEXvjiHV8xDo+YoscsUWOWM5HLOcjdsoR'
+        'O/qIzXQkWNn+6QOdr7p75hNDJ4ZODJ0YOjF0YujE0ImhE0Mnhk7MrhojKEZQjKAYQTF7bAykGEgx'
+        'kGIgxUCKgRQDKQZSDKSYVTfGU4ynGE8xnmI8xXiK8RTjKcZTjKcYTzGeYjblGFYxrGJYxbCKYRXD'
+        'KoZVDKsYVjGsYljFsIphFcMqhlUMqxhWMaxiWMWwimEVwyrmRj1GV4yuGF0xumKudgyyGGQxyGKQ'
+        'xSCLQRaDLGb3j9n9Y8jFkIshF0MuhlzMjXqMvBh5MfJi5MXc1MTc1MTc1MTcxsTcxsTcxsTcxsTc'
+        'v8Tcv8Tcv8TcuMTcuMTcuMTcuMTcuMTcqsTcqsTcqsTcqsQC9//smft3vfxbMm+eTH/XD/cb+z3B'
+        'O73rnxQ/iu9x7cP9SXz//KEmCncTZkxNjKmJMTUxpibG1MSYmhhTE2NqYkxNjKmJMf0wph/G9MOY'
+        'fhhTDGOKYUwxjCmGMcUwphjGFMOYYhhTDGMaYUwjjGmEMY0wphHGNMKYRhjTCGMaYUwjjGmEMY0w'
+        'pgrGVMGYKhhTBWOqYEwVjKmCMVUwpgrGVMGYKhhTBWOqYEwVjKmCMVUwpgrGVMGYKhhTBWOqYEwV'
+        'jOmAMR0wpgPGdMCY8I8J/5jwjwn/mPCPCf+Y8I+J+5i4j4n7mLiPifuYnI/J+Zicj8n5mM4ZC5LW'
+        'eOmtiPdvRXzpDYifVG9ADN56+viNz+7aXnon4sfpOxFPgnY6f3L+XLDqXTwXrDvveS7YTC+fC1bL'
+        'n3zu+c97GL9bkeNmX9zsi5t9cbMvbvbFzb642Rc3++JmX9zsi5t9cbMvbvbFzb642Rc3++JmX9zs'
+        'i5t9cbMvbvbFzb642Rc3++JmX9zsi5t9cbMvbvbFzb642Rc3++JmX9zsi5t9cbMvbvbFzb642Rc3'
+        '++JmX9zsi5t9cbMvbvbFzb642Rc3++JmX9zsi5t9cbMvbvbFzb642Rc3++JmX9waHDcC40Zg3AiM'
+        'G4FxIyluEsZNwrhJGDcJ4yZh3CSMm4RxkzBuEsZNwrhJGDcJ4xbfuIEYNxDjBmLcQIxbfOMW37jF'
+        'N+4OKW7/jdt/4/bfuP03bv+N23/j9t+4/Tdu/43bf+P237j9N27/jdt/4/bfuP03Hkzl5sNC9yN3'
+        'C10C6gTUCagTUCegTkCdgDoBdQLqBNQJ/1YJthNsJ9hOsJ1w35dAPIF4AvEE4gnEE4gnEE8gnkA8'
+        '4b4vQXqC9ATpCdITpCdIT5CeID1BeoL0BOkJ0hPu+xLAJ4BPAJ8APgF8AvgE8AngE8AngE8AnwA+'
+        'AXwC+ATwCeATwCeATwCfAD4BfAL4BPAJ4BPAJ4BPAJ8APgF8AvgE8AngE8AngE8An3Dfl3Dfl8A/'
+        'gX8C/wT+CfwT+CfwT+CfwD+BfwL/BP4J/BPcJ7hPcJ/gPsF9gvsE9wnuE9wnuE9wn+A+wX2C+wT3'
+        'Ce4Tgft/0X9y9vb+Dd988JWXf/mQg/pdDpJykJSDpBwk5SApB0k5SMpBUg6ScpCUg6QcJOUgKQdJ'
+        'OUjKQVIOknKQlIOkHCTlICkHSTlIykFSDpJykJSDpBwk5SApB0k5SMpBUg6ScpCUg6QcJOUgKQdJ'
+        'OUjKQVIOknKQlIOkHCTlICkHSTlIykFSDpJykJSDpBwk5SApB0k5SMpBUg6ScpCUg6QcJOUgKQdJ'
+        'OUjKQVIOknKQlIOkHCTlICkHSTlIykFSDpJykJSDpBwk5SApB0k5SMpBUg6ScpCUg6QcJOUgKQdJ'
+        'OUjKQVIOknKQlIOkHCTlICkHSTlIykFSDpJykJSDpBwk5SApB0k5SMpBUg6ScpAMcvCv7p/T/+Xg'
+        'Of3//ZCDy7scpOQgJQcpOUjJQUoOUnKQkoOUHKTkICUHKTlIyUFKDlJykJKDlByk5CAlByk5SMlB'
+        'Sg5ScpCSg5QcpOQgJQcpOUjJQUoOUnKQkoOUHKTkICUHKTlIyUFKDlJykJKDlByk5CAlByk5SMlB'
+        'Sg5ScpCSg5QcpOQgJQcpOUjJQUoOUnKQkoOUHKTkICUHKTlIyUFKDlJykJKDlByk5CAlByk5SMlB'
+        'Sg5ScpCSg5QcpOQgJQcpOUjJQUoOUnKQkoOUHKTkICUHKTlIyUFKDlJykJKDlByk5CAlByk5SMlB'
+        'Sg5ScpCSg5QcpOQgJQcpOUjJQUoOUnKQkoOUHKTkIBXk4F/3nwOGv/1Nb0wFTwF/d/AU8PRj/hQw'
+        'eCp38Cx2H9dvW/g3/dJ4Wf//6o/0X6azh84YvOuMtM5I64y0zkjrjLTOSOuMtM5I64y0zkjrjLSy'
+        'SCuLtLJIK4u0lkhribSWSGuJtJZIa4m0lkhribSWSKuHtHpIq4e0ekirh7R6SKuHtHpIq4e0ekir'
+        'h7R6SOuFtF5I64W0XkjrhbReSOuFtF5I64W0XkjrhbReSOuFtF5I64W0XkjrhbReSOuFtF5I64W0'
+        'XkgrhLRCSCuEtEJIa4K0JkhrgrQmSGuCtCZIa4K07KdlPy37adlPy35a6NNCnxb6tNCnFVA6iN2/'
+        'faDzNXf31Bl0Muhk0Mmgk0Eng04GnQw6GXQy6GSMmwxBGYIyBGUIyhg3GZAyIGVAyoCUASkDUgak'
+        'DEgZkDLGTYanDE8ZnjI8ZXjK8JThKcNThqcMTxmeMjxljJsMVhmsMlhlsMpglcEqg1UGqwxWGawy'
+        'WGWwymCVwSqDVQarDFYZrDJYZbDKYJXBKmPcZOjK0JWhK0NXxtXOQJaBLANZBrIMZBnIMpBljJuM'
+        'cZNBLoNcBrkMchnkMsZNhrwMeRnyMuRljJuMcZMxbjLGTca4yRg3GeMmY9xkjJuMcZMxbjLGTca4'
+        'yRg3GeMmY9xkjJuMcZMxbjKB+3/34P7r79xnuc9yn+U+y32W+yz3We6z3Ge5z3Kf5T7LfZb7LPdZ'
+        '7rPcZ7nPcp/lPst9lvss91nus9xnuc9yn+U+y32W+yz3We6z3Ge5z3Kf5T7LfZb7LPdZ7rPcZ7nP'
+        'cp/lPst9lvss91nus9xnuc9yn+U+y32W+yz3We6z3Ge5z3Kf5T7LfZb7LPdZ7rPcZ7nPcp/lPst9'
+        'lvss91nus9xnuc9yn+U+y32W+yz3We6z3Ge5z3Kf5T7LfZb7LPdZ7rPcZ7nPcp/lPst9lvss91nu'
+        's9xnuc9yn+U+y32W+yz3We6z3Ge5zwbuf+z5jerJO/pvbfne/od4vHC3+qtPfmf/t4IV68nv6v/l'
+        'h7plBR/T9cf6b7f5ePuq67OVKVi13v3kp/sfGPzCjav1ZLX/dp5ni9eTJ7/BTxP8Z/1/hV9hC3ty'
+        'He5/taT/d97tY9+X/vcPTXJ8t3zlNElOk+Q0SU6T5DRJTpPkNElOk+Q0SU6T5DRJTpPkNElOk+Q0'
+        'SU6T5DRJTpPkNElOk+Q0SU6T5DRJTpPkNElOk+Q0SU6T5DRJTpPkNElOk+Q0SU6T5DRJTpPkNElO'
+        'k+Q0SU6T5DRJTpPkNElOk+Q0SU6T5DRJTpPkNElOk+Q0SU6T5DRJTpPkNElOk+Q0SU6T5DRJTpPk'
+        'NElOk+Q0SU6T5DRJTpPkNElOk+Q0SU6T5DRJTpPkNElOk+Q0SU6T5DRJTpPkNElOk+Q0SU6T5DRJ'
+        'TpPkNElOk+Q0SU6T5DRJTpPkNElOk+Q0SU6T5DRJTpPkNElOk+Q0SU6T5DRJTpPkNElOk+Q0SS5o'
+        'kh9/wTep3bmf5n6a+2nup7mf5n6a+2nup7mf5n6a+2ngp4GfBn4a+GnSp0mfJn2a9GnSp0mfJn2a'
+        '9GnSpxGfRnwa8WnEpxGfRnwa8WnEpxGfRnwa8WnEp9meZnua7Wm2p9meZnua7Wm2p9meZnua7Wm2'
+        'p9meZnua7Wm2p9meZnua7Wm2p9meZnsa6mmop6Gehnqa5mmap2mepnma5mmap2me5nea32l+p/md'
+        '5nca3Glwp8GdBndaiKYDOj/xCfvmnuA9pz/Qf6Por+m+vvWifmGCZyef/ezf/SP+vOPdv+bXJbgg'
+        'w+Fn/6c+IX/uVPvF/S3U/yb00foW6vOH6RS6u7+bNZ1mTadZ02nWdJo1nWZNp1nTadZ0mjWdZk2n'
+        'WdNp1nSaNZ1mTadZ02nWdJo1nWZNp1nTadZ0mjWdZk2nWdNp1nSaNZ1mTadZ02nWdJo1nWZNp1nT'
+        'adZ0mjWdZk2nWdNp1nSaNZ1mTadZ02nWdJo1nWZNp1nTadZ0mjWdZk2nWdNp1nSaNZ1mTadZ02nW'
+        'dJo1nWZNp1nTadZ0mjWdZk2nWdNp1nSaNZ1mTadZ02nWdJo1nWZNp1nTadZ0mjWdZk2nWdNp1nSa'
+        'NZ1mTadZ02nWdJo1nWZNp9lgOr3ngc4r7xabOXTm0JlDZw6dOWbmmJljZo6ZOWbmmJljZo6ZOWbm'
+        'mJljZo6ZOWbmmJljZo6ZOWbmmJljZo6ZOWbmmJljZo6ZOWbmmJljZo6ZOWbmmJljZo6ZOWbmmJlj'
+        'Zo6ZOWbmmJljZo6ZOWbmmJljZo6ZOWbmmJljZo6ZOWbmmJljZo6ZOWbmmJljZo6ZOWbmmJljZo6Z'
+        'OWbmmJljZo6ZOWbmmJljZo6ZOWbmmJljZo6ZOWbmAjMX9w/km/0H8pf9Xwafz1sOvo7xk7+0pp/8'
+        '44H+u62e/ccHF/aTf9L//X/a/49/1v/DX6W1n9T7f+c/7/+dH2J/P2n0/xsn/f/Gh9jiT/7hgBvj'
+        'N/S/e/pXmXBPmv1//L/o/zd+LZX+K9b5VfBB4E/eG/qUT8mn33v/rZhv7r+41w95fXSX13l5nZfX'
+        'eXmdl9d5VT8vtvNiOy+282I7L7bzYjsvtvNiOy+282I7L7bzYjsvtvNiOy+282I7L7bzYjsvtvNi'
+        'Oy+282I7L7bzYjsvtvNiOy+282I7L7bzYjsvtvNiOy+282I7L7bzYjsvtvNiOy+282I7L7bzYjsv'
+        'tvNiOy+282I7L7bzYjsvtvNiOy+282I7L7bzYjsvtvNiOy+282I7L7bzYjsvtvNiOy+282I7L7bz'
+        'YjsvtvNiOy+282I7L7bzYjsvtvNBbH+qL+m6j/vvBDn96QdKF3eU8ijlUcqjlEcpj1IepTxKeZTy'
+        'KOVRynuWkycqT1SeqDxRec9y8mDlwcqDlQcrD1YerDxYebDyYOU9y8nzlecrz1eerzxfeb7yfOX5'
+        'yvOV5yvPV56vvGc5eczymOUxy2OWxyyPWR6zPGZ5zPKY5THLY5bHLI9ZHrM8ZnnM8pjlMctjlscs'
+        'j1nes5w8bXna8rTlacu7+nno8tDloctDl4cuD10eurxnOXnPcvII5hHMI5hHMI9g3rOcPIl5EvMk'
+        '5knMe5aT9ywn71lO3rOcvGc5ec9y8p7l5D3LyXuWk/csJ+9ZTt6znLxnOXnPcvKe5eQ9y8l7lpP3'
+        'LCfvWU4+yMH7ft1uI4LbgL/Snywfl/dXP/Oiu78KbsL7r+dH9XX52Yei/Mt3RVlQlAVFWVCUBUVZ'
+        'UJQFRVlQlAVFWVCUBUVZUJQFRVlQlAVFWVCUBUVZUJQFRVlQlAVFWVCUBUVZUJQFRVlQlAVFWVCU'
+        'BUVZUJQFRVlQlAVFWVCUBUVZUJQFRVlQlAVFWVCUBUVZUJQFRVlQlAVFWVCUBUVZUJQFRVlQlAVF'
+        'WVCUBUVZUJQFRVlQlAVFWVCUBUVZUJQFRVlQlAVFWVCUBUVZUJQFRVlQlAVFWVCUBUVZUJQFRVlQ'
+        'lAVFWVCUBUVZUJQFRVlQlAVFWVCUBUVZUJQFRVlQlAVFWVCUBUVZUJQFRVlQlAVFWVCUBUVZUJQF'
+        'RVlQlAVFWVCUBUVZUJQFRVlQlAVFWVCUhaAof+7hww5vsV/EfhH7RewXsV/EfhH7RewXsV/EfhH7'
+        'Rd4XeV/kfZH3RdAXQV8EfRH0RdAXQV8EfRH0RdAXCV8kfJHwRcIXCV8kfJHwRcIXCV8kfJHwRcIX'
+        '0V5EexHtRbQX0V5EexHtRbQX0V5EexHtRbQX0V5EexHtRbQX0V5EexHtRbQX0V5Ee5HpRaYXmV5k'
+        'ehHmRZgXYV6EeRHmRZgXYV7EdxHfRXwX8V3Ed5HbRW4XuV3kdlGGFgM57/+EeOYdjOvP6z9O/YiN'
+        'ks79G2D/YPAG2J+///U3Bb/+QP/Xf7v/6/8QvFH8Fz6uX8jgBfru8K9+p/yRn8nd+xcm+D/xr/rP'
+        'Vj9Zf/DaB70wv/jshXnyN32IR/rVwQ8W6wWvVfDzU9/UX5Y+0N+a3vEOn42c3g5+uvb/87DjzN7t'
+        'OBvKfkPZbyj7DWW/oew3lP2Gst9Q9hvKfkPZbyj7DWW/oew3lP2Gst9Q9hvKfkPZbyj7DWW/oew3'
+        'lP2Gst9Q9hvKfkPZbyj7DWW/oew3lP2Gst9Q9hvKfkPZbyj7DWW/oew3lP2Gst9Q9hvKfkPZbyj7'
+        'DWW/oew3lP2Gst9Q9hvKfkPZbyj7DWW/oew3lP2Gst9Q9hvKfkPZbyj7DWW/oew3lP2Gst9Q9hvK'
+        'fkPZbyj7DWW/oew3lP2Gst9Q9hvKfkPZbyj7DWW/oew3lP1GUPb/od9Z9T6lrwo67P+9/5ixHw+e'
+        'M9zcd9xF0Gn/8YHav7+jVkStiFoRtSJqRdSKqBVRK6JWRK2IWtE6XSSuSFyRuCJxRet0EbwieEXw'
+        'iuAVwSuCVwSvCF4RvKJ1ushfkb8if0X+ivwV+SvyV+SvyF+RvyJ/Rf6K1ukihkUMixgWMSxiWMSw'
+        'iGERwyKGRQyLGBYxLGJYxLCIYRHDIoZFDIsYFjEsYljEsGidLtJYpLFIY5HGIh1FKItQFqEsQlmE'
+        'sghlEcqidbponS4iWkS0iGgR0SKiRet0kdQiqUVSi6QWrdNF63TROl20Thet00XrdNE6XbROF63T'
+        'Ret00TpdtE4XrdNF63TROl20Thet00XrdNE6XQxycnufkz8f5OA/PeRg6C4HJTkoyUFJDkpyUJKD'
+        'khyU5KAkByU5KMlBSQBKAlASgJIAlMgvkV8iv0R+ifwS+SXyS+SXyC8hX0K+hHwJ+RLyJeRLyJeQ'
+        'LyFfQr6EfAn5Eusl1kusl1gvsV5ivcR6ifUS6yXWS6yXWC+xXmK9xHqJ9RLrJdZLrJdYL7FeYr0E'
+        'eQnyEuQlyEt0l+gu0V2iu0R3ie4S3SWeSzyXeC7xXOK5BHIJ5BLIJZBLQlUKKP3nT56fQPb3Qh/O'
+        'TyD7L/erzuP//Oy/977+X1z195tPCT1bi567+4zLf9GP33Oh+/i97C5+u+K3K3674rcrfrvityt+'
+        'u+K3K3674rcrfrvityt+u+K3K3674rcrfrvityt+u+K3K3674rcrfrvityt+u+K3K3674rcrfrvi'
+        'tyt+u+K3K3674rcrfrvityt+u+K3K3674rcrfrvityt+u+K3K3674rcrfrvityt+u+K3K3674rcr'
+        'frvityt+u+K3K3674rcrfrvityt+u+K3K3674rcrfrvityt+u+K3K3674rcrfrvityt+u+K3K367'
+        '4rcrfrvityt+u0H8XhbQuXyyFOp/6bL/6alPQ8GceHuo/8eh0McynUFK/lb/XVi/Djl918Cb3vKW'
+        'zFuC72LLhT7cz3cKhz7eayx4cZv9m6aP6U3cwEM37d51U1U3VXVTVTdVdVNVN1V1U1U3VXVTVTdV'
+        'dVPVilxVUVUVVVVRVRVVtSJXNVVVU1U1VVVTVTVVVVNVNVVVU1U1VdWKXFVYVYVVVVhVhVVVWFWF'
+        'VVVYVYVVVVhVhVVVWFWFVbUiV/VWVW9V9VZVb1X1VlVvVfVWVW9V9VZVb1X1VlVvVfVWVW9V9VZV'
+        'b1X1VlVvVfVWVW9V9VZVb1WtyFX1VVVfVfVVVV9VdVLVYlUtVtViVS1W1WJVLVbVYlUrctWKXNVp'
+        'VZ1W1WlVnVbVaVUrclW1VVVbVbVVVVvVily1IletyFUrctWKXLUiV63IVSty1YpctSJXrchVK3LV'
+        'ily1IletyFUrctWKXLUiV63I1aBYXx56/lbxHcGK/BtCzz8Omw1uLX/jQy6m797oVpOLmlzU5KIm'
+        'FzW5qMlFTS5qclGTi5pc1OSiJhc1uajJRU0uanJRk4uaXNTkoiYXNbmoyUVNLmpyUZOLmlzU5KIm'
+        'FzW5qMlFTS5qclGTi5pc1OSiJhc1uajJRU0uanJRk4uaXNTkoiYXNbmoyUVNLmpyUZOLmlzU5KIm'
+        'FzW5qMlFTS5qclGTi5pc1OSiJhc1uajJRU0uanJRk4uaXNTkoiYXNbmoyUVNLmpyUZOLmlzU5KIm'
+        'FzW5qMlFTS5qclGTi5pc1OSiJhc1uajJRU0uanJRk4uaXNTkoiYXNbmoyUVNLmpyUZOLmlzU5KIm'
+        'FzW5qMlFTS5qclGTi1qQi8Hnc/H4z/Rj8Kkf0twMZtfv6w/lX2aCPvnTd290+pxf4e3CT3bv/obP'
+        'D38ifPb9UPCS9Z98pv9uf1cKnoa+9WXPPwT9nuf6NwmfFnr+Dn0yqJ9P/4jtJ8G1+JP9a/EJ8ZD5'
+        'M4IXpv8v3+j/i/224NUbvn/1/m3w3O8zX3DLlf7WoL9f8V+9oN4S0b8On9RP7T/rfvD9WPBCRYIX'
+        'KnizVuv5n1WY/qG7VfDEyDsx8k6MvBMj78TIOzHyToy8EyPvxMg7MfJOzLoTs+7ErDsx604MuRND'
+        '7sSQOzHkTgy5E0PuxJA7MeRODLkT0+3EdDsx3U5MtxPT7cR0OzHdTky3E9PtxHQ7Md1OTLcTY+3E'
+        'WDsx1k6MtRNj7cRYOzHWToy1E2PtxFg7MdZOjLUTY+3EWDsx1k6MtRNj7cRYOzHWToy1E2PtxFg7'
+        'Mc9OzLMT8+zEPDsxyE4MshOD7MQgOzHITgyyE4PsxOg6MbpOjK4To+vE6Doxs07MrBMz68TMOjE/'
+        'T4Kp8dn3gfy9QSA/5wHV1/RRBR9I9V+C7H5u6JPhE4jTe899uLeoj0J3n3n/rM76r+Hn/aov1Efi'
+        'BXpX/3/wtz5/T//r2Vq/4gvzm+5Xkt/bf10+P/T8J5wlgtfpC+7/+Lv7v/zND4v7yl2LnWuxcy12'
+        'rsXOtdi5FjvXYuda7FyLnWuxcy12rsXOtdi5FjvXYuda7FyLnWuxcy12rsXOtdi5FjvXYuda7FyL'
+        'nWuxcy12rsXOtdi5FjvXYuda7FyLnWuxcy12rsXOtdi5FjvXYuda7FyLnWuxcy12rsXOtdi5FjvX'
+        'Yuda7FyLnWuxcy12rsXOtdi5FjvXYuda7FyLnWuxcy12rsXOtdi5FjvXYuda7FyLnWuxcy12rsXO'
+        'tdi5FjvXYuda7FyLnWuxcy12rsXOtdi5FjvXYudBi73ygc71HZ0LdC7QuUDnAp0LdC7QuUDnAp0L'
+        'dC7QuUDnAp0LdC7QuUDnAp0LdC7QuUDnAp0LdC7QuUDnAp0LdC7QuUDnAp0LdC7QuUDnAp0LdC7Q'
+        'uUDnAp0LdC7QuUDnAp0LdC7QuUDnAp0LdC7QuUDnAp0LdC7QuUDnAp0LdC7QuUDnAp0LdC7QuUDn'
+        'Ap0LdC7QuUDnAp0LdC7QuUDnAp0LdC7QuUDnAp0LdC7QuUDnAp0LdC7QuQjo/JbQR/XnVj3/E3LS'
+        'Q/1bpJd+iNVLP8TqpR9i9Yn3keAf1R9c9ar7Ff0Nwdr0hfdr0y/0f/lFDxv72/qra3CH+L3Bxv7F'
+        '93eMfzq4Y/yShzFZuRuTHWOyY0x2jMmOMdkxJjvGZMeY7BiTHWOyY0x2PBrtmJYd07JjWnZMy45H'
+        'ox1Ds2NodgzNjqHZMTQ7hmbH0OwYmh1Ds+PRaMfs7JidHbOzY3Z2zM6O2dkxOztmZ8fs7JidHbOz'
+        'Y3Z2PBrtGKEdI7RjhHaM0I4R2jFCO0ZoxwjtGKEdI7RjhHaM0I4R2jFCO0ZoxwjtGKEdI7RjhHaM'
+        '0I4R2jFCOx6NdkzSjknaMUk7JmnHZOsYqB0DtWOgdgzUjoHaMVA7BmrHo9GOR6Md47VjvHaM147x'
+        '2jFeOx6NdkzZjinbMWU7pmzHo9GOR6Mdj0Y7Ho12PBrteDTa8Wi049Fox6PRjkejHY9GOx6Ndjwa'
+        '7Xg02vFotOPRaMej0Y5Hox2PRjvBjP/SwH3/MdTjzWfqn92mfl/6y/rZ+Mp+NnaCVEUfsvGeu2z0'
+        'ZKMnGz3Z6MlGTzZ6stGTjZ5s9GSjJxs92ejJRk82erLRk42ebPRkoycbPdnoyUZPNnqy0ZONnmz0'
+        'ZKMnGz3Z6MlGTzZ6stGTjZ5s9GSjJxs92ejJRk82erLRk42ebPRkoycbPdnoyUZPNnqy0ZONnmz0'
+        'ZKMnGz3Z6MlGTzZ6stGTjZ5s9GSjJxs92ejJRk82erLRk42ebPRkoycbPdnoyUZPNnqy0ZONnmz0'
+        'ZKMnGz3Z6MlGTzZ6stGTjZ5s9GSjJxs92ejJRk82erLRk42ebPRkoycbPdnoyUZPNnqy0ZONnmz0'
+        'ZKMnGz3Z6MlGTzZ6stGTjZ5s9GSjF2Tjy+9nxO8IZsRXPD9tHk/1f/mV93/81uCPvyqIyXv7v/HF'
+        '/UfVwfd0D4b60+arHxL0r+8S9NxgkKDg+FTHkOPTHJ/u+AzHsOMzHa9wfJbj7Y6I47Mdn+P4XMdP'
+        'OB45Ps/xmxyf7/gCx292vNLxWxyvcrQcX+j4IscXO77E8aWOL3NEHV/u+ArHVzq+yvHVjnc7Xu0Y'
+        'cXyNI+b4WsdrHF/n+HrHqOMbHGOOb3S81vE6R9zxekfCMe74JscbHEnHGx1txzc7vsWRcrzJkXN8'
+        'q+PbHN/u+A7HdzoeO97sOHe8x5F2fJcj45hwZB0Xjrc4vtvxVsek49Lxk44rx3sd146fcvy0432O'
+        'n3H8rOPnHO93dBw/7/iA4xccXccvOnrB8X3pVz+4/5d37kPch7gPcR/iPsR9iPsQ9yHuQ9yHuA9x'
+        'H+I+xH2I+xD3Ie5D3Ie4D3Ef4j7EfYj7EPch7kPch7gPcR/iPsR9iPsQ9yHuQ9yHuA9xH+I+xH2I'
+        '+xD3Ie5D3Ie4D3Ef4j7EfYj7EPch7kPch7gPcR/iPsR9iPsQ9yHuQ9yHuA9xH+I+xH2I+xD3Ie5D'
+        '3Ie4D3Ef4j7EfYj7EPch7kPch7gPcR/iPsR9iPsQ9yHuQ9yHuA9xH+I+xH2I+xD3Ie5D3Ie4D3Ef'
+        '4j7EfYj7EPch7kPch7gPcR/iPsR9iPsQ9yHuQ9yHAvcjD+7/y537Ae4HuB/gfoD7Ae4HuB/gfoD7'
+        'Ae4HuB8AfgD4AeAHgB8gfYD0AdIHSB8gfYD0AdIHSB8gfQDxAcQHEB9AfADxAcQHEB9AfADxAcQH'
+        'EB9AfIDtAbYH2B5ge4DtAbYH2B5ge4DtAbYH2B5ge4DtAbYH2B5ge4DtAbYH2B5ge4DtAbYHoB6A'
+        'egDqAagHaB6geYDmAZoHaB6geYDmAX4H+B3gd4DfAX4HwB0AdwDcAXAHhGggoPM1/+2vkHyYH/ry'
+        'oXy5JPh8mf6uEr77ismH/7kvH9uvncQe7ln++fP3LF8b/F7wqTo/+Y4fftfg2972xu/KfNfbXvO1'
+        '/fdWPh55x91Hd4w++1d812+8+8Ox4H2Xn/3C33pd8Fvd517wW98Q/Fbj/it+P/bCv//rgz989wt/'
+        '6+uC33r/C3/rNcFvvSb8gt8aDX7rF174dwX/V9P/+dlvPXndb3h2AeLP/uP+D18b/GE7+Gaz1wTP'
+        'ZUdC3o39nc/+/pi/Tr8z2Da/7qF9qnftE9U+Ue0T1T5R7RPVPlHtE9U+Ue0T1T5R7RM1daNKKKqE'
+        'okooqoSipm5UF0V1UVQXRXVRVBdFdVFUF0V1UVQXRU3dqEqKqqSoSoqqpKhKiqqkqEqKqqSoSoqq'
+        'pKhKiqqkqKkb1UxRzRTVTFHNFNVMUc0U1UxRzRTVTFHNFNVMUc0U1UxRzRTVTFHNFNVMUc0U1UxR'
+        'zRTVTFHNFDV1owoqqqCiCiqqoKIKI6qnonoqqqeieiqqp6J6KqqnoqZu1NSNaq2o1opqrajWimqt'
+        'qKkbVV5R5RVVXlHlFTV1o6Zu1NSNmrpRUzdq6kZN3aipGzV1o6Zu1NSNmrpRUzdq6kZN3aipGzV1'
+        'o6Zu1NSNBtX59c9/sfnxv+/fj40GMRgLvqjab7Yv6f/VST/H39z/q9X+X72y/1d/ov9X3xB8M2fw'
+        'bPAbPqiCg698f1X/hu6T/ptjx+7veM+DO95vfCiayF3RjCqaUUUzqmhGFc2oohlVNKOKZlTRjCqa'
+        'UUUzqmFGNcyohhnVMKOqZVS1jKqWUdUyqlpGVcuoahlVLaOqZVSnjOqUUZ0yqlNGdcqoThnVKaM6'
+        'ZVSnjOqUUZ0yqlNGlcmoMhlVJqPKZFSZjCqTUWUyqkxGlcmoMhlVJqPKZFSZjCqTUWUyqkxGlcmo'
+        'MhlVJqPKZFSZjCqTUS0yqkVGtcioFhlVH6PqY1R9jKqPUfUxqj5G1ceowhhVGKMKY1RhjCqMUU0x'
+        'qilGNcWophjVWqNBVl/78LDks+4flvylYHy97mPyZpog1v+u/z/9oolf/D5+g0H8Xv8Qv/hd/MbF'
+        'b1z8xsVvXPzGxW9c/MbFb1z8xsVvXPzGxW9c/MbFb1z8xsVvXPzGxW9c/MbFb1z8xsVvXPzGxW9c'
+        '/MbFb1z8xsVvXPzGxW9c/MbFb1z8xsVvXPzGxW9c/MbFb1z8xsVvXPzGxW9c/MbFb1z8xsVvXPzG'
+        'xW9c/MbFb1z8xsVvXPzGxW9c/MbFb1z8xsVvXPzGxW9c/MbFb1z8xsVvXPzGxW9c/MbFb1z8xsVv'
+        'XPzGxW9c/MbFb1z8xsVvXPzGxW9c/MaD+CUCOt/25K/3N/2/cbf/v6Y/B/s/muHxRj+H4/6e/p9M'
+        '9+dn8HW2f9z/e4JvKfjsIKzfdG/yDcGHJbyh/+tf7P8zVvq/TIZe1J85/IMftc8cfmOww/+usFf+'
+        'x5+9qvfvGP+R/i+ef3/5Xws2km9+SPrEXdInJH1C0ickfULSJyR9QtInJH1C0ickfULSJyR9QtIn'
+        'JH1C0ickfULSJyR9QtInJH1C0ickfULSJyR9QtInJH1C0ickfULSJyR9QtInJH1C0ickfULSJyR9'
+        'QtInJH1C0ickfULSJyR9QtInJH1C0ickfULSJyR9QtInJH1C0ickfULSJyR9QtInJH1C0ickfULS'
+        'JyR9QtInJH1C0ickfULSJyR9QtInJH1C0ickfULSJyR9QtInJH1C0ickfULSJyR9QtIngqR/i2+2'
+        '7NP5fcH3/Pzsk7dYxN9id35L8Lel7r9U/vjPPf+G6R+8ozaJ2iRqk6hNojaJ2iRqk6hNojaJ2iRq'
+        'k6hNojaJ2iRqk6hNojaJ2iRqk6hNojaJ2iRqk6hNojaJ2iRqk6hNojaJ2iRqk6hNojaJ2iRqk6hN'
+        'ojaJ2iRqk6hNojaJ2iRqk6hNojaJ2iRqk6hNojaJ2iRqk6hNojaJ2iRqk6hNojaJ2iRqk6hNojaJ'
+        '2iRqk6hNojaJ2iRqk6hNojaJ2iRqk6hNojaJ2iRqk6hNojaJ2iRqk4GhN9231OP3kTNFzhQ5U+RM'
+        'kTNFzhQ5U+RMkTNFzhQ5U+RMkTNFzhQ5U+RMkTNFzhQ5U+RMkTNFzhQ5U+RMkTNFzhQ5U+RMkTNF'
+        'zhQ5U+RMkTNFzhQ5U+RMkTNFzhQ5U+RMkTNFzhQ5U+RMkTNFzhQ5U+RMkTNFzhQ5U+RMkTNFzhQ5'
+        'U+RMkTNFzhQ5U+RMkTNFzhQ5U+RMkTNFzhQ5U+RMkTNFzhQ5U+RMkTNFzhQ5U+RMkTNFzhQ5U4Gc'
+        'b+1vDd/dn3fvC75z6Nvu7+Qn+r/89hfVFhFsDq/tbw4f9TuC7whemP66lf6C0F1tP3637M3I3ozs'
+        'zcjejOzNyN6M7M3I3ozszcjejOzNyN6M7M3I3ozszcjejOzNyN6M7M3I3ozszcjejOzNyN6M7M3I'
+        '3ozszcjejOzNyN6M7M3I3ozszcjejOzNyN6M7M3I3ozszcjejOzNyN6M7M3I3ozszcjejOzNyN6M'
+        '7M3I3ozszcjejOzNyN6M7M3I3ozszcjejOzNyN6M7M3I3ozszcjejOzNyN6M7M3I3ozszcjejOzN'
+        'yN6M7M3I3ozszcjejOzNyN6M7M0E2fvOwND7+2H77c/fiP+u/r4f3Jz/4WD/fHz/PruXB1v+m++3'
+        '/jcGd6Lp/q+D52uXwa+/6/4bj39/8OvMfb7HgncUTTz/68c/3v9l9mOW7/4nmqS/rB+VXy7pQXJf'
+        '3//Tj7N7f/vY64N9bPDJgkgviPSCSC+I9IJIL4j0gkgviPSCSC+I9IJIL4j0gkgviPSCSC+I9IJI'
+        'L4j0gkgviPSCSC+I9IIsL8jygiwvyPKCLC/I8oIsL8jygiwvyPKCLC/I8oIsL8jygiwvyPKCLC/I'
+        '8oIsL8jygiwvyPKCLC/I8oIsL8jygiwvyPKCLC/I8oIQLwjxghAvCPGCEC8I8YIQL0jvgvQuSO+C'
+        '9C5I74L0LkjvgvQuSO+C9C5I74L0LojtgtguBLF9iwg+Y/HVfRb59Hc/PB0KMvrW0Ivx46jTly/7'
+        'aH8e9eTdHdGz/7Ef7X/97dPf9rbv+T3fm39bfuF7fo+v9j1+f/Ag5Nlr+7h/y/R96Vzo/9fPlPo3'
+        'z32i/kypqedfmCcrd1+O/J8/Up8k+uT7+//E4NV58s7+X34EXqAna/2PHHpX/5/2y7xUT36g/6fr'
+        '/T/9Nb5oTzb6/4Q/2v8nBJ+t/jO/8o8H/eDXcfp+wP7HYGD+1odbqf9knVu1zq3q/lXdv6r7V3X/'
+        'qu5f1f2run9V96/q/lXdv6r7V3X/qu5f1f2run9V96/q/lXdv6r7V3X/qu5f1f2r1rlVI2DVCFg1'
+        'AlaNgFUjYNUIWDUCVo2AVSNg1QhYNQJWjYBVI2DVCFg1AlaNgFUjYNUIWDUCVo2AVSNg1QhYNQJW'
+        'jYBVI2DVCFg1AlaNgFUjYNUIWLXOrZoEqybBqkmwahKsmgSrJsGqSbBqnVs1EFYNhFUDYdVAWDUQ'
+        'Vg2EVQNh1UBYNRBWDYRVA2HVQFi1zq2aC6vmwmowF35bICcor98dPO+5fPJOX2N9p6/GvjP42/67'
+        '+/HxauPjv7/77/W3v35d9fvx8Y/2y++33w+WuWB5+x/uv1d1JBg0b3t4OPnVd58qswXrFqxbsG7B'
+        'ugXrFqxbsG7BugXrFqxb3m6wxewWs1vMbjG75e0GW+huobuF7ha6W+huobuF7ha6W+huebvBFsFb'
+        'BG8RvEXwFsFbBG8RvEXwFsFbBG8RvEXwlrcbbIG8BfIWyFsgb4G8BfIWyFsgb4G8BfIWyFsgb4G8'
+        'BfIWyFsgb4G8BfIWyFsgb4G8BfKWtxts8bzF8xbPWzxv8bWF9RbWW1hvYb2F9RbWW1hvebvBlrcb'
+        'bEG+BfkW5FuQb0G+5e0GW6xvsb7F+hbrW95usOXtBlvebrDl7QZbgG95u8GWp5xb3m6w5e0GW6Kw'
+        '5e0GW95usOXtBlvebrDl7QZb3m6w5e0GW95usOWR6VYQoZnAfVDaMy97/qsirwq+KvI99/c7lSAy'
+        'sw8RKd89VC2LSFlEyiJSFpGyiJRFpCwiZREpi0hZRMoiUhaRsoiURaQsImURKYtIWUTKIlIWkbKI'
+        'lEWkLCJlESmLSFlEyiJSFpGyiJRFpCwiZREpi0hZRMoiUhaRsoiURaQsImURKYtIWUTKIlIWkbKI'
+        'lEWkLCJlESmLSFlEyiJSFpGyiJRFpCwiZREpi0hZRMoiUhaRsoiURaQsImURKYtIWUTKIlIWkbKI'
+        'lEWkLCJlESmLSFlEyiJSFpGyiJRFpCwiZREpi0hZRMoiUhaRsoiURaQsImURKYtIWUTKIlIWkbKI'
+        'lEWkLCJlESmLSFlEyiJSFpGyiJRFpCwiZREpi0g5iMj/+OB+6s79Nvfb3G9zv839Nvfb3G9zv839'
+        'Nvfb3G8Dvw38NvDbwG+Tvk36NunbpG+Tvk36NunbpG+Tvo34NuLbiG8jvo34NuLbiG8jvo34NuLb'
+        'iG8jvs32NtvbbG+zvc32NtvbbG+zvc32NtvbbG+zvc32NtvbbG+zvc32NtvbbG+zvc32NtvbUG9D'
+        'vQ31NtTbNG/TvE3zNs3bNG/TvE3zNr/b/G7zu83vNr/b4G6Duw3uNrjbQrQd0JnrV2j/qVT6+4NH'
+        'wr/jfgv5ymDr+J/uHxG/qv/L7w294HP7XxmU7u98wPfc3V6yB98efHvw7cG3B98efHvw7cG3B98e'
+        'fHvw7cG3B98efHvw7cG3B98efHvw7cG3B98efHvw7cG3B98efHvw7cG3B98efHvw7cG3B98efHvw'
+        '7cG3B98efHvw7cG3B98efHvw7cG3B98efHvw7cG3B98efHvw7cG3B98efHvw7cH3/7F39/Gx//ec'
+        '8Jv2xC8mNidExDTsII1k0PyU3KiUuGlDjdNpRo3LFYTs2sscWYP05zaNIbsIHTo2WOMSg4hjjFDr'
+        'ZtzNxqwYBpEVYtir0robRIzjpsme2Jvf9/vMSbqPi+tqV/UG/vh+zjm/X1tn5vl6fd7z/U6+3wfw'
+        'PYDvAXwP4HsA3wP4HsD3AL4H8D2A7wF8D+B7AN8D+B7A9wC+B/A9gO8BfA/gewDfA/gehPgyt3TS'
+        '13TK6JTRKaNTRqeMThmdMjpldMrolNEp26/LBJUJKhNUJqhsvy6DVAapDFIZpDJIZZDKIJVBKoNU'
+        'tl+XeSrzVOapzFOZpzJPZZ7KPJV5KvNU5qnMU9l+XcaqjFUZqzJWZazKWJWxKmNVxqqMVRmrMlZl'
+        'rMpYlbEqY1XGqoxVGasyVmWsyliV7ddlusp0lekq01X2bpchK0NWhqwMWRmyMmRlyMr267L9uoxc'
+        'GbkycmXkysiV7ddl8srklckrk1e2X5ft12X7ddl+XbZfl+3XZft12X5dtl+X7ddl+3XZfl22X5ft'
+        '12X7ddl+XbZfl+3XZft1OXR//9Z95Hq/rnBf4b7CfYX7CvcV7ivcV7ivcF/hvgJ8BfgK8BXgK6RX'
+        'SK+QXiG9QnqF9ArpFdIrpFcQryBeQbyCeAXxCuIVxCuIVxCvIF5BvIJ4he0K2xW2K2xX2K6wXWG7'
+        'wnaF7QrbFbYrbFfYrrBdYbvCdoXtCtsVtitsV9iusF2BugJ1BeoK1BWaKzRXaK7QXKG5QnOF5gq/'
+        'FX4r/Fb4rfBbAbcCbgXcCrgVIaqEdD47/EJT8/p+ha8IvsP0ind0SvAdrk8n3Ot75uPzqi92XnXl'
+        '+mtonxqcNlu8PoP4muC7Zvc/LbwX+L9+1uOHrg6Fe/rnhP+B8OkoT9x5fMHzdaRWSa2SWiW1SmqV'
+        '1CqpVVKrpFZJrZJaJbVKapXUKqlVUqukVkmtkloltUpqldQqqVVSq6RWSa2SWiW1SmqV1CqpVVKr'
+        'pFZJrZJaJbVKapXUKqlVUqukVkmtkloltUpqldQqqVVSq6RWSa2SWiW1SmqV1CqpVVKrpFZJrZJa'
+        'JbVKapXUKqlVUqukVkmtkloltUpqldQqqcHyjZW/fkb4f0+TrSJbRbaKbBXZKrJVZKvIVkOyWT8z'
+        'dP+pQN/Nj9x81pfcn30ibOQXPBFu1uHyx5bXWn7X8jrL71hOLa+x/Ha4PHXvc9/sl2HC8wqJ4Crl'
+        '28Olg/ACSDL4//ZvPfn9ebe7zl9f7zo1Wa7Jck2Wa7Jck+WaLNdkuSbLNVmuyXJNlmuyXJPlmizX'
+        'ZLkmyzVZrslyTZZrslyT5Zos12S5Jss1Wa7Jck2Wa7Jck+WaLNdkuSbLNVmuyXJNlmuyXJPlmizX'
+        'ZLkmyzVZrslyTZZrslyT5Zos12S5Jss1Wa7Jck2Wa7Jck+WaLNdkuSbLNVmuyXJNlmuyXJPlmizX'
+        'ZLkmyzVZrslyTZZrslyT5Zos1+w6NRGuiXBNhGsiXBPhmgjXRLgWRvjzb27482nB9rB6K2n0WlKd'
+        'pDpJdZLqJNURqiNUR6iOUB2hOkJ1hOoI1RGqI1RHqI5QHaE6QnWE6gjVEaojVEeojlAdoTpCdYTq'
+        'CNURqiNUR6iOUB2hOkJ1hOoI1RGqI1RHqI5QHaE6QnWE6gjVEaojVEeojlAdoTpCdYTqCNURqiNU'
+        'R6iOUB2hOkJ1hOoI1RGqI1RHqI5QHaE6QnWE6gjVEaojVEeojlAdoTpCdYTqCNURqoeEXn57Ofgv'
+        'Hn+H6l7v9ae+A3oO6Dmg54CeAz10ANEBRAcQHUB0ANEBRAcQHUB0ANEBRAcQHUB0ANEBRAcQHUB0'
+        'ANEBRAcQHUB0ANEBRAcQHUB0ANEBRAcQHUB0ANEBRAcQHUB0ANEBRAcQHUB0ANEBRAcQHUB0ANEB'
+        'RAcQHUB0ANEBRAcQHUB0ANEBRAcQHUB0ANEBRAcQHUB0ANEBRAcQHUB0ANEBRAcQHUB0ANEBRAcQ'
+        'HUB0ANEBRAcQHUB0ANFBiOip2+LZvi6eBjoNdBroNNBpoNNAp4FOA50GOg10Gk4YNAhqENQgqEFQ'
+        'wwmDBkgNkBogNUBqgNQAqQFSA6QGSA0nDBo8NXhq8NTgqcFTg6cGTw2eGjw1eGrw1OCp4YRBA6sG'
+        'Vg2sGlg1sGpg1cCqgVUDqwZWDawaWDWwamDVwKqBVQOrBlYNrBpYNbBqYNVwwqBBV4OuBl0Nuhre'
+        '7QZkDcgakDUga0DWgKwBWcMJg4YTBg3kGsg1kGsg10Cu4YRBg7wGeQ3yGuQ1nDBoOGHQcMKg4YRB'
+        'wwmDhhMGDScMGk4YNJwwaDhh0HDCoOGEQcMJg4YTBg0nDBpOGDScMGg4YdBwwqARuv+Cxz/uc++b'
+        'w+8tfOHtj/X97DMff5vwvcJrYl90cwK3N/xXv/g2Mu92HZkjkTkSmSORORKZI5E5EpkjkTkSmSOR'
+        'ORKZI1k5kpUjWTmSlSMhORKSIyE5EpIjITkSkiMhORKSIyE5ko4j6TiSjiPpOJKOI+k4ko4j6TiS'
+        'jiPpOJKOI+k4EosjsTgSiyOxOBKLI7E4EosjsTgSiyOxOBKLI7E4EosjsTgSiyOxOBKLI7E4Eosj'
+        'sTgSiyOxOJKHI3k4kocjeTgShCNBOBKEI0E4EoQjQTgShCP0j9A/Qv8I/SP0j5g/Yv6I+SPmj+Tv'
+        'KFT3Jbdb9kuf+XjLfsfrLfsYomOIjiE6hugYomOIjiE6hugYomOIjiE6hugYomOIjiE6hugYomOI'
+        'jiE6hugYomOIjiE6hugYomOIjiE6hugYomOIjiE6hugYomOIjiE6hugYomOIjiE6hugYomOIjiE6'
+        'hugYomOIjiE6hugYomOIjiE6hugYomOIjiE6hugYomOIjiE6hugYomOIjiE6hugYomOIjiE6hugY'
+        'omOIjiE6hugYomOIjiE6hugYomOIjkNEX3p7+f5VN3Pf+1030QlEJxCdQHQC0QlEJxCdQHQC0QlE'
+        'JxCdQHQC0QlEJxCdQHQC0QlEJxCdQHQC0QlEJxCdQHQC0QlEJxCdQHQC0QlEJxCdQHQC0QlEJxCd'
+        'QHQC0QlEJxCdQHQC0QlEJxCdQHQC0QlEJxCdQHQC0QlEJxCdQHQC0QlEJxCdQHQC0QlEJxCdQHQC'
+        '0QlEJxCdQHQC0QlEJxCdQHQC0QlEJxCdQHQC0QlEJxCdQHQC0QlEJxCdhIjWbjexH7ym00KnhU4L'
+        'nRY6LXRa6LTQaaHTQqeFTsvc1yKoRVCLoBZBLXNfC6QWSC2QWiC1QGqB1AKpBVILpJa5r8VTi6cW'
+        'Ty2eWjy1eGrx1OKpxVOLpxZPLZ5a5r4WVi2sWli1sGph1cKqhVULqxZWLaxaWLWwamHVwqqFVQur'
+        'FlYtrFpYtbBqYdXCqmXua9HVoqtFV4uulne7BVkLshZkLchakLUga0HWMve1zH0t5FrItZBrIddC'
+        'rmXua5HXIq9FXou8lrmvZe5rmfta5r6Wua9l7muZ+1rmvpa5r2Xua5n7Wua+lrmvZe5rmfta5r6W'
+        'ua9l7muZ+1qh+1fc/NDIved2Pf5ZkSdubuTwknDiW3988j7xO8HA92Xhf+b1QVY+9fqbia8N/8ty'
+        'b7VvqocnJ18XjBBvk9+u/nI/lHv/I++Eb/yTbpf7pBu6Puleqk+6B+uT7sH6pLvRPumuuU+67e2T'
+        'bmr6ZHhT06+4GcO/N7yisnHbYN953WBtDdbWYG0N1tZgbQ3W1mBtDdbWYG0N1tZgbQ3W1mBtDdbW'
+        'YG0N1tZgbQ3W1mBtDdbWYG0N1tZgbQ3W1mBtDdbWYG0N1tZgbQ3W1mBtDdbWYG0N1tZgbQ3W1mBt'
+        'DdbWYG0N1tZgbQ3W1mBtDdbWYG0N1tZgbQ3W1mBtDdbWYG0N1tZgbQ3W1mBtDdbWYG0N1tZgbQ3W'
+        '1mBtDdbWYG0N1tZgbQ3W1mBtDdbWYG0N1tZgbQ3W1mBtDdbWYG0N1tZgbQ3W1mBtDdbWYG0N1tZg'
+        'bQ3W1mBtDdbWYG0N1tZgbQ3W1mBtDdbWYG0N1tZgbQ3W1mBtDdbWYG0N1tZgbQ3W1mBtDdbWYG0N'
+        '1g5L59/c5CAVfhz9t7ffm165bqcz/3Nn/h87C/9jXxl8z+h5Pa5yfnj4zaSvuk3Qd1wnqCNBHQnq'
+        'SFBHgjoS1JGgjgR1JKgjQR0J6khQR4I6EtSRoI4EdSSoI0EdCepIUEeCOhLUkaCOBHUkqCNBHQnq'
+        'SFBHgjoS1JGgjgR1JKgjQR0J6khQR4I6EtSRoI4EdSSoI0EdCepIUEeCOhLUkaCOBHUkqCNBHQnq'
+        'SFBHgjoS1JGgjgR1JKgjQR0J6khQR4I6EtSRoI4EdSSoI0EdCepIUEeCOhLUkaCOBHUkqCNBHQnq'
+        'SFBHgjoS1JGgjgR1JKgjQR0J6khQR4I6EtSRoI4EdSSoI0EdCeqA2pGgjgR1JKgjQR2kOxLUkaCO'
+        'BHUkqCNBHQnqSFBHgjoS1Amj8NW353pee7Pz/3zwq3Au+B/hDLD51t3bP+5Zb6t7+9fctsYXXLfG'
+        'hda40BoXWuNCa1xojQutcaE1LrTGhda40BoX6uJCXVyoiwt1caEnLvTEhZ640BMXeuJCT1zoiQs9'
+        'caEnLhTEhYK4UBAXCuJCQVwoiAsFcaEgLhTEhYK4UBAXCuJCM1xohgvNcKEZLjTDhWa40AwXmuFC'
+        'M1xohgvNcKEZLjTDhWa40AwXmuFCM1xohgvNcKEZLjTDhWa4UAkXKuFCJVyohAtdcKELLnTBhS64'
+        '0AUXuuBCF1xI/4X0X0j/hfRfSP+F2F+I/YXYX4j9hQq6CIP3tTcXPf8o2H9eeSvp668lXZF0RdIV'
+        'SVckXZF0RdIVSVckXZF0RdIVSVckXZF0RdIVSVckXZF0RdIVSVckXZF0RdIVSVckXZF0RdIVSVck'
+        'XZF0RdIVSVckXZF0RdIVSVckXZF0RdIVSVckXZF0RdIVSVckXZF0RdIVSVckXZF0RdIVSVckXZF0'
+        'RdIVSVckXZF0RdIVSVckXZF0RdIVSVckXZF0RdIVSVckXZF0RdIVSVckXZF0RdIVSVckXZF0RdJV'
+        'KCl/80SDaiDp696uH2P56vu/Hnz/+83e1F//9Kvyyt6XfOK9j3pRaulln/zSF4W34p0Mv4X+qtvs'
+        'xR/f4D7iBvcRN7iPuMF9xA3uI25wH3GD+4gb3Efc4D7iBvcRN7iPuLN9xJ3tI+5sH3Fn+4hb2kfc'
+        '0j7ilvYRt7SPuKV9xC3tI25pH3FL+4hb2kfcyz7iXvYR97KPuJd9xL3sI+5lH3Ev+4h72Ufcyz7i'
+        'XvYR97KPuJd9xE3sI25iH3ET+4ib2EfcxD7iJvYRN7GPuIl9xE3sI25iH3ET+4ib2EfcxD7iJvYR'
+        'N7GPuIl9xE3sI25iH3ET+4ib2EfcxD7iJvYRd6+PuHt9xN3rI+5eH3Hb+ojb1kfctj7itvURt62P'
+        'uG19xG3rI25UH3Gj+ogb1UfcqD7iRvURd6iPuEN9xB3qI+5QH3G3/EiQvUJIJxiaEt/+NJzgzhSJ'
+        'nw1Gpm+4NfV116Z6mOphqoepHqZ6mOphqoepHqZ6mOphqoepHqZ6mOphqoepHqZ6mOphqoepHqZ6'
+        'mOphqoepHqZ6mOphqoepHqZ6mOphqoepHqZ6mOphqoepHqZ6mOphqoepHqZ6mOphqoepHqZ6mOph'
+        'qoepHqZ6mOphqoepHqZ6mOphqoepHqZ6mOphqoepHqZ6mOphqoepHqZ6mOphqoepHqZ6mOphqoep'
+        'HqZ6mOphqoepHqZ6mOphqic09e9u6Qxe04mgE0Engk4EnQg6EXQi6ETQiaATQSeCTgSdCDoRdCLo'
+        'RNCJoBNBJ4JOBJ0IOhF0IuhE0ImgE0Engk4EnQg6EXQi6ETQiaATQSeCTgSdCDoRdCLoRNCJoBNB'
+        'J4JOBJ0IOhF0IuhE0ImgE0Engk4EnQg6EXQi6ETQiaATQSeCTgSdCDoRdCLoRNCJoBNBJ4JOBJ0I'
+        'OhF0IuhE0ImgE0Engk4EnQg6EXQiIZ2tN3jcfOIPg73tG28xfeE1pj6Y+mDqg6kPpj6Y+mDqg6kP'
+        'pj6Y+mDqg6kPpj6Y+mDqg6kPpj6Y+mDqg6kPpj6Y+mDqg6kPpj6Y+mDqg6kPpj6Y+mDqg6kPpj6Y'
+        '+mDqg6kPpj6Y+mDqg6kPpj6Y+mDqg6kPpj6Y+mDqg6kPpj6Y+mDqg6kPpj6Y+mDqg6kPpj6Y+mDq'
+        'g6kPpj6Y+mDqg6kPpj6Y+mDqg6kPpj6Y+mDqg6kPpj6Y+mDqg6kPpj6Y+mDqCzF90y2d4evL8v3o'
+        '9KPTj04/Ov3o9KPTj04/Ov3o9KPTj04/Ov3o9KPTj04/Ov3o9KPTj04/Ov3o9KPTj04/Ov3o9KPT'
+        'j04/Ov3o9KPTj04/Ov3o9KPTj04/Ov3o9KPTj04/Ov3o9KPTj04/Ov3o9KPTj04/Ov3o9KPTj04/'
+        'Ov3o9KPTj04/Ov3o9KPTj04/Ov3o9KPTj04/Ov3o9KPTj04/Ov3o9KPTj04/Ov3o9KPTj04/Ov3o'
+        '9KPTH9L55uAjSXgaduGZ4Y0p/r0ve9z/suBb+o9/vuQLgms2rw+q6iuCkelbbk7mfnw4lhdv/X3X'
+        'dXVF+YvyF+Uvyl+Uvyh/Uf6i/EX5i/IXLuuWAcu7WgYt72Z5jWXI8u6WqOXZlmHLe1je0/LPLTHL'
+        'b1vey/LelvexjFieYxm1vK9lzDJuiVvez/L+llPLB1iea5mwPGn5QMvzLB9k+WDLpGXKMm2ZsXyI'
+        '5fmWD7XMWl5g+TDLh1vmLB9h+UjLay0fZfloywstL7KkLfOWj7F8rOXFlo+zJCwfb3md5Xcs9ywv'
+        'sSQtL7UsWH7XkrJ8guVllk+0/J7l9y1/YGlb/tDyR5Y/tpxZ/sRybvlTS8fyZ5aHlj+3/IXlLy1/'
+        'ZXl9uDx171tD99c/wBI8DOfes7re8HEyb64favm/375PFAQvzFRw2frNfq7g294mX5jwL/zS4FT4'
+        'W+109/bNjcK+8h2Cx4YHmt7wJXr1/c8K/ih8pe5ngl++CS/W/ftPmFt/6um/4tvSfdWCWzcGL9np'
+        '/T8OLuG/4Sv32/e/Ojhb9f/xAt7/wzvB49PDoAZ/udOn/3LXr+lT97795oZhPxZehCzdbJtJ2+Z3'
+        '3G6B7estcNwWOG4LHLcFjtsCx22B47bAcVvguC1w3BY4bgsct/eN2/vG7X3j9r5xm964TW/cpjdu'
+        '0xu36Y3b9MZteuM2vXGb3rjdbtxuN263G7fbjdvtxu1243a7cbvduN1u3G43brcbt9uN2+bGbXPj'
+        'trlx29y4bW7cNjdumxu3zY3b5sZtc+O2uXHb3Lhtbtw2N26bG7fNjdvmxm1z47a5cdvcuG1u3DY3'
+        'bn8bt7+N29/G7W/jNrZxG9u4jW3cxjZuYxu3sY3b2MZtZeO2snFb2bitbNxWNm4PG7eHjdvDxu1h'
+        '4/bT8XAX+c6bW2vMBpK+663aaWF3vdcz3/buyfrUvZ3biH3NdcQmRGxCxCZEbELEJkRsQsQmRGxC'
+        'xCZEbELEJkRsQsQmRGxCxCZEbELEJkRsQsQmRGxCxCZEbELEJkRsQsQmRGxCxCZEbELEJkRsQsQm'
+        'RGxCxCZEbELEJkRsQsQmRGxCxCZEbELEJkRsQsQmRGxCxCZEbELEJkRsQsQmRGxCxCZEbELEJkRs'
+        'QsQmRGxCxCZEbELEJkRsQsQmRGxCxCZEbELEJkRsQsQmRGxCxCZEbELEJkRsQsQmRGxCxCZEbELE'
+        'JkRsQsQmwoh99+OI3XtG+C2s3Zufcx8Nv43yPbe0PvHxk7XQmkRrEq1JtCbRmkRrEq1JtCbRmkRr'
+        'Eq1JtCbRmkRrEq1JtCbRmkRrEq1JtCbRmkRrEq1JtCbRmkRrEq1JtCbRmkRrEq1JtCbRmkRrEq1J'
+        'tCbRmkRrEq1JtCbRmkRrEq1JtCbRmkRrEq1JtCbRmkRrEq1JtCbRmkRrEq1JtCbRmkRrEq1JtCbR'
+        'mkRrEq1JtCbRmkRrEq1JtCbRmkRrEq1JtCbRmkRrEq1JtCbRmkRrMqT14PbWob9KzjQ50+RMkzNN'
+        'zjQ50+RMkzNNzjQ50+RMkzNNzjQ50+RMkzNNzjQ50+RMkzNNzjQ50+RMkzNNzjQ50+RMkzNNzjQ5'
+        '0+RMkzNNzjQ50+RMkzNNzjQ50+RMkzNNzjQ50+RMkzNNzjQ50+RMkzNNzjQ50+RMkzNNzjQ50+RM'
+        'kzNNzjQ50+RMkzNNzjQ50+RMkzNNzjQ50+RMkzNNzjQ50+RMkzNNzjQ50+RMkzNNzjQ50+RMh3K+'
+        'Nyih8FPjV4UzZfnvdtfjd/gHe9fj77v5AsZM8DpVbp/C8P03P0nyJ9e1PSd8c8I3J3xzwjcnfHPC'
+        'Nyd8c8I3J3xzwjcnfHPCNyd8c8I3J3xzwjcnfHPCNyd8c8I3J3xzwjcnfHPCNyd8c8I3J3xzwjcn'
+        'fHPCNyd8c8I3J3xzwjcnfHPCNyd8c8I3J3xzwjcnfHPCNyd8c8I3J3xzwjcnfHPCNyd8c8I3J3xz'
+        'wjcnfHPCNyd8c8I3J3xzwjcnfHPCNyd8c8I3J3xzwjcnfHPCNyd8c8I3J3xzwjcnfHPCNyd8c8I3'
+        'J3xzwjcnfHPCNxeG7/tvTH15YGovNHUemPra8Ha8978+/MbGD9z+6Nuf3PzoW/f1OfZ51uZZm2dt'
+        'nrV51uZZm2dtnrV51uZZm2dtnrV51uZZm2dtnrV51uZZm2dtnrV51uZZm2dtnrV51uZZm2dtnrV5'
+        '1uZZm2dtnrV51uZZm2dtnrV51uZZm2dtnrV51uZZm2dtnrV51uZZm2dtnrV51uZZm2dtnrV51uZZ'
+        'm2dtnrV51uZZm2dtnrV51uZZm2dtnrV51uZZm2dtnrV51uZZm2dtnrV51uZZm2dtnrV51uZZmw+t'
+        '/aCTBU9b+77A2qtv+6tx019/dt1fCaYSTCWYSjCVYCrBVIKpBFMJphJMJZhKMJVgKsFUgqkEUwmm'
+        'EkwlmEowlWAqwVSCqQRTCaYSTCWYSjCVYCrBVIKpBFMJphJMJZhKMJVgKsFUgqkEUwmmEkwlmEow'
+        'lWAqwVSCqQRTCaYSTCWYSjCVYCrBVIKpBFMJphJMJZhKMJVgKsFUgqkEUwmmEkwlmEowlWAqwVSC'
+        'qQRTCaYSTCWYSjCVYCrBVCI09UM3l2BGwuHhPwTfmur+pI99Ucr3pb4y/Jzzw7efa379GlgKsBRg'
+        'KcBSgKUASwGWAiwFWAqwFGApF2ZSnKU4S3GW4izlwkwKtxRuKdxSuKVwS+GWwi2FWwq3lAszKepS'
+        '1KWoS1GXoi5FXYq6FHUp6lLUpahLUZdyYSYFXwq+FHwp+FLwpeBLwZeCLwVfCr4UfCn4UvCl4EvB'
+        'l4IvBV8KvhR8KfhS8KXgS7kwk2IwxWCKwRSDKSZSKKZQTKGYQjGFYgrFFIopF2ZSLsykwEyBmQIz'
+        'BWYKzJQLMyk+U3ym+EzxmXJhJuXCTMqFmZQLMykXZlIuzKRcmEm5MJNyYSblwkzKhZmUCzMpF2ZS'
+        'LsykXJhJuTCTcmEm5cJMyoWZVJiOH7m5IXg+zMGP3vx+Krxg+WM35wN+OPz8X72t5K+9qeQ/v07M'
+        'osQsSsyixCxKzKLELErMosQsSsyixCxKzKKoLIrKoqgsisqijCzKyKKMLMrIoowsysiijCzKyKKM'
+        'LArHonAsCseicCwKx6JwLArHonAsCseicCwKx6JwLErFolQsSsWiVCxKxaJULErFolQsSsWiVCxK'
+        'xaJULErFolQsSsWiVCxKxaJULErFolQsSsWiVCyKw6I4LIrDojgsysGiHCzKwaIcLMrBohwsysEi'
+        '+YvkL5K/SP4i+YvILyK/iPwi8ovitxii+/GbawS/GKL7idvZ8Sdv7sT4me7E+JO3xfy+18yWMVvG'
+        'bBmzZcyWMVvGbBmzZcyWMVvGbBmzZcyWMVvGbBmzZcyWMVvGbBmzZcyWMVvGbBmzZcyWMVvGbBmz'
+        'ZcyWMVvGbBmzZcyWMVvGbBmzZcyWMVvGbBmzZcyWMVvGbBmzZcyWMVvGbBmzZcyWMVvGbBmzZcyW'
+        'MVvGbBmzZcyWMVvGbBmzZcyWMVvGbBmzZcyWMVvGbBmzZcyWMVvGbBmzZcyWMVvGbBmzZcyWMVvG'
+        'bDlk9lM33fVzIbOfvjmXOR5OArXbLvvVm48sf3yNLANZBrIMZBnIMpBlIMtAloEsA1kGsgxkGcgy'
+        'kGUgy0CWgSwDWQayDGQZyDKQZSDLQJaBLANZBrIMZBnIMpBlIMtAloEsA1kGsgxkGcgykGUgy0CW'
+        'gSwDWQayDGQZyDKQZSDLQJaBLANZBrIMZBnIMpBlIMtAloEsA1kGsgxkGcgykGUgy0CWgSwDWQay'
+        'DGQZyDKQZSDLQJaBLANZBrIMZBnIMpBlIMuEyP7j2/U3Dt6UM1Cvvv9nwbO/36gTUfu3rZ28DtSK'
+        'QK0I1IpArQjUikCtCNSKQK0I1IpArQjUikCtCNSKQK0I1IpArQjUikCtCNSKQK0I1IpArQjUikCt'
+        'CNSKQK0I1IpArQjUikCtCNSKQK0I1IpArQjUikCtCNSKQK0I1IpArQjUikCtCNSKQK0I1IpArQjU'
+        'ikCtCNSKQK0I1IpArQjUikCtCNSKQK0I1IpArQjUikCtCNSKQK0I1IpArQjUikCtCNSKQK0I1IpA'
+        'rQjUikCtCNSKQK0I1IpArQjUikCtCNRKGKifuTnZ+2tha9dvPr/9YDiB/qfg938Q/P6dwn/+s8H3'
+        'g58R8fW7Xwn/6OCm6N83HGJ/7g2/QpwM/qRx81/6xeFW8PM3zwVdCf9HfuHW76df+13nd53fdX7X'
+        '+V3nd53fdX7X+V3nd53fdX7X+V3nd53fdX7X+V3nd53fdX7X+V3nd53fdX7X+V3nd53fdX7X+V3n'
+        'd53fdX7X+V3nd53fdX7X+V3nd53fdX7X+V3nd53fdX7X+V3nd53fdX7X+V3nd53fdX7X+V3nd53f'
+        'dX7X+V3nd53fdX7X+V3nd53fdX7X+V3nd53fdX7X+V3nd53fdX7X+V3nd53fdX7X+V3nd53f9dBv'
+        '8/E5rHv/MqT0i7dTxid1Pb4z+GuY2mBqg6kNpjaY2mBqg6kNpjaY2mBqg6kNpjaY2mBqg6kNpjaY'
+        '2mBqg6kNpjaY2mBqg6kNpjaY2mBqg6kNpjaY2mBqg6kNpjaY2mBqg6kNpjaY2mBqg6kNpjaY2mBq'
+        'g6kNpjaY2mBqg6kNpjaY2mBqg6kNpjaY2mBqg6kNpjaY2mBqg6kNpjaY2mBqg6kNpjaY2mBqg6kN'
+        'pjaY2mBqg6kNpjaY2mBqg6kNpjaY2mBqg6mN0NQv3RTai8JC++XQVDBY/HJQaS8MPigd3lbWe1yf'
+        'dt/EaxOvTbw28drEaxOvTbw28drEaxOvTbw28drEaxOvTbw28drEaxOvTbw28drEaxOvTbw28drE'
+        'axOvTbw28drEaxOvTbw28drEaxOvTbw28drEaxOvTbw28drEaxOvTbw28drEaxOvTbw28drEaxOv'
+        'Tbw28drEaxOvTbw28drEaxOvTbw28drEaxOvTbw28drEaxOvTbw28drEaxOvTbw28drEaxOvTbw2'
+        '8drEaxOvzZDXr9yc9BkMd8OjW0qffE0pj1IepTxKeZTyKOVRyqOURymPUh6lPEp5lPIo5VHKo5RH'
+        'KY9SHqU8SnmU8ijlUcqjlEcpj1IepTxKeZTyKOVRyqOURymPUh6lPEp5lPIo5VHKo5RHKY9SHqU8'
+        'SnmU8ijlUcqjlEcpj1IepTxKeZTyKOVRyqOURymPUh6lPEp5lPIo5b21eaLyROWJyhOVJypPVJ6o'
+        'PFF5ovJE5YnKE5UnKk9Unqg8UXknNfNOauad1Mw7+513hjvvFGfeKc68U5x5pzjzTl/nnenMO9OZ'
+        'd6Yz7/xz3gnPvBOeeed888575p33zDvvmXfSNu+kbd5Z0LwTs3knQ/NOhuadDM2HOfjP/z+f5YLH'
+        'JgZb+Jvrk9xb83sEf+tHt1+9Df/u9ehbEP6C8BeEvyD8BeEvCH9B+AvCXxD+gvAXWCjogIIOKOiA'
+        'gg4ocFJQBQVVUFAFBVVQUAUFVVBQBQVVUFAFBZQKGqGgEQoaoaARChqhoBEKGqGgEQoaoaARChqh'
+        'oBEKJBYUQ0ExFBRDQTEUFENBMRQUQ0ExFBRDQTEUFENBMRQUQ0ExFBRDQTEUFENBMRQUQ0ExFBRD'
+        'QTEUpKKgHwr6oaAfCvqhoB8K+qGgHwr6oaAfCvqhoB8K+qEgVAWhKmiLgrYoaIuCtihoi4LAFZRG'
+        'QWkUlEZBaRSURkFpFJRGQU0U1ERBTRTUREE/FPRDQT8UFENBMRQ0QkEjFDRCQQcUhL8g/AXhL4Th'
+        'P775sfd7I3ce3zkwcScYrX7tfx23fjr4s1+/+cT4RDjmn9zG5r9ex6YoNkWxKYpNUWyKYlMUm6LY'
+        'FMWmKDZFsSnKS1FeivJSlJeioBQFpSgoRUEpCkpRUIqCUhSUoqAUJaQoIUUJKUpIUUKKElKUkKKE'
+        'FCWkKCFFCSlKSFE0iqJRFI2iaBRFoygaRdEoikZRNIqiURSNomgURaMoGkXRKIpGUTSKolEUjaJo'
+        'FEWjKBpFmSjKRFEmijJRFIaiMBSFoSgMRWEoCkNRGIr4F/Ev4l/Ev4h/kfsi90Xui9wXZbAYyvuN'
+        'm/GrHY5frcf3Lk+8Ovjtb97K+u5rWSWySmSVyCqRVSKrRFaJrBJZJbJKZJUUcgmwEmAlwEqAlRRy'
+        'ibMSZyXOSpyVOCtxVuKsxFmJs5JCLuFWwq2EWwm3Em4l3Eq4lXAr4VbCrYRbCbeSQi5RV6KuRF2J'
+        'uhJ1JepK1JWoK1FXoq5EXYm6EnUl6krUlagrUVeirkRdiboSdSXqSgq5BF8JvhJ8JfhKMJQYLDFY'
+        'YrDEYInBEoMlBksKuaSQS0SWiCwRWSKyRGRJIZfALIFZArMEZkkhlxRySSGXFHJJIZcUckkhlxRy'
+        'SSGXFHJJIZcUckkhlxRySSGXFHJJIZcUckkhl8JY/NbNPYC+NIjBf7n5btCvBb/9f8LHuj3Xo9nu'
+        '9T3d0/efvH5O2yuCfn5N+M+v/+jeuwT//PG//I3hDeB++zZWP/T4kYJiVRGrilhVxKoiVhWxqohV'
+        'RawqYlURq4pYVcSqIlYVsaqIVUWsKmJVEauKWFXEqiJWFbGqiFVFrCpiVRGrilhVxKoiVhWxqohV'
+        'RawqYlURq4pYVcSqIlYVsaqIVUWsKmJVEauKWFXEqiJWFbGqiFVFrCpiVRGrilhVxKoiVhWxqohV'
+        'RawqYlURq4pYVcSqIlYVsaqIVUWsKmJVEauKWFXEqiJWFbGqiFVFrCpiVRGrilhVxKoiVhWxqohV'
+        'RawqYlURq4pYVcSqIlYVsaqIVUWsKmJVEauKWFXEqiJWFbGqiFVFrCpiVRGrilhVxKoiVhWxqohV'
+        'RawqYlUJY3V66/7zr93vcb/H/R73e9zvcb/H/R73e9zvcb/H/R7we8DvAb8H/B7pe6Tvkb5H+h7p'
+        'e6Tvkb5H+h7pe4jvIb6H+B7ie4jvIb6H+B7ie4jvIb6H+B7ie2zvsb3H9h7be2zvsb3H9h7be2zv'
+        'sb3H9h7be2zvsb3H9h7be2zvsb3H9h7be2zvsb0H9R7Ue1DvQb1H8x7NezTv0bxH8x7NezTv8bvH'
+        '7x6/e/zu8bsH7h64e+DugbsnRHshndc+nnkTXxRU8Ov+Xi59hl/R/6XgY/bb7dfwf+dm5/qI4HX6'
+        '3Te8QjUensD9vfCl6wlCmA3PsEXuV6WoKkVVKaoKTFVgqiJSlY2qbFRlo8p/lf8q6lXUq3BXqa7i'
+        'XMW5imwVyyqWVR6rPFZ5rDJXZa4KW5WrKldVkqokVREKl27LO1p6Le9k6bPctfRb3tkyaHk3y5Dl'
+        '2ZZhy3ta3tvyPpYRy3MsY5ZxS9zyAZbnWp60PM8yaZmyTFtmLM+3fKhl1vICy5zloy0vtLzIMm95'
+        'sSVh+XjLPctLLQuWl1nS4fLUvd8PzXxHYOZDrs/K/kTwz3/S8iOWY8u3WuYsv2n5fsvXWNYtX2H5'
+        'AcuPW15l+RnLmuVjLN9j+QzLL1g+x/KVll+0vJclZ1m1fLvl+yzfZvkUy7dYPs/yhZYvsbzMsmL5'
+        'V+Hy1L0/uPmOz9eEn53at7vbKx4/shO8mt2txl+Nv5rdrYZhDcMahjUMa3JZk8uaXNbYrLFZY7Mm'
+        'rDVhrZFaI7UmujVgaxJck+Ca16pGcY3iGsU1imvSXZPuGtM1pmtM10S+JvI1wmuE1xRADfSaHqjx'
+        'XlMHNXVQo79Gf43+Gv01VVETgpoQ1ISgJgQ1NVJTIzUEa9qkpk1q2qQmJzU5qclJTU5qtNU0TU1q'
+        'agqnJjw14akJT00L1bRQTZRqolTTSTWdVEOppppq8hUsTz01fu8P3+AS2jWefXj24dmHZx+efWr2'
+        'qdmnZp+afWr2qdmnZp+afWr2qdmnZp+afWr2qdmnZp+afWr2qdmnZp+afWr2qdmnZp+afWr2qdmn'
+        'Zp+afWr2qdmnZp+afWr2qdmnZp+afWr2qdmnZp+afWr2qdmnZp+afWr2qdmnZp+afWr2qdmnZp+a'
+        'fWr2qdmnZp+afWr2qdmnZp+afWr2qdmnZp+afWr2qdmnZp+afWr2qdmnZp+afWr2wwL6o9tWnrlu'
+        '5bpWrmvlulaua+W6v1xdK9e1cl0r17VyXSvXtXJdK9e1cl0r17Vy3d+4rpXrWrmuletaua6V61q5'
+        'zkxdK9e1cl0r17VyXSvXtXJdK9e1cl0r17Vy3YtS18p1rVwPX5Q/vvkOzy+HX8g5e/NOivc3g0/y'
+        '4dWV+18T/PJvmBLvf9X12YDfevo9eRMnxvtfG9zS65XBf8HfMDvezwf/9OuCf/q/OUXe//rgv+FV'
+        'z/obvk336vuF4I//xrHyT/7xfNUwfH5P8PMFb9S8fX7b23vXvd3U20293dTbTb3dtOk31XdTfTfV'
+        'd1N9N9V3UyKbWrypxZtavKnFm07lNJV5U5k3lXlTmTeVeVOZN5V5U5k3lXnTqZymfDZ1elOnN3V6'
+        'U6c3dXpTpzd1elOnN3V6U6c3dXrTqZymam+q9qZqb6r2pmpvqvamam+q9qZqb6r2pmpvqvamam+q'
+        '9qZqb6r2pmpvqvamam9qv6Zqb6r2plM5TQ3f1PBNDd/U8E2N21T0TbXXVPRNRd9U9E1F31T0Tady'
+        'mk7lNNV+U+031X5T7TfVftOpnKb2b2r/pqJrav+mUzlNp3KaTuU0ncppOpXTdCqn6VRO06mcplM5'
+        'Tadymk7lNJ3KaTqV03Qqp+lUTtOpnKZTOU2ncppO5TTDmv3ToGZzQVaeF9Zs5/YOCz8qBodicCgG'
+        'h2JwKAaH/B/yf8j/If+H/B+Cfwj+IfiH4B8Sf0j8IfGHxB8Sf0j8IfGHxB8Sf4j6IeqHqB+ifoj6'
+        'IeqHqB+ifoj6IeqHqB+ifsj4IdWHjB8Sf8j4IeOHjB8yfsj4IeOHjB8yfsj4IeOHjB8yfsj4IeOH'
+        'jB8yfsj4IeOHcB/CfQj3IdyHVB9SfUj1IdWHVB9SfUj1IceHHB9yfMjxIceHAB8CfAjwIcCHwnQY'
+        'Evqzv9OtFBK1v+1OCm/MFv2W2JYfjwH3PvlNvK3eG+zR5/ef80Z/8f3hG5zrSWSDUP55eCHi8f1B'
+        'nwh+0CT8SadP73r8k04v8ZNOf/EW2d7Dt+19n/6ffrs5m/aXN9/VfnbYcn8Vvk7Pvv8uXU+/QQPB'
+        '4V2Dw7+7foVfErzCn3B/sCusoHfrCsM11BUWy7t3ufdpVxi1Z3eFeR/uCqP9Hl1hqt6zK2zMf94V'
+        'lmOsK6yn9wr+B947OLxPcBgJDs/pCothtCuM5vsGfzQWHMa7wkKMd4V9835dYbu+f1dYVx/QFcby'
+        'ucG/NxEcnuwKO+MDu8LOeF7wRx8UHD44OEwGh6ng8DA4fMPTf8H708GvZrrCbvmQrrDnPrQrrOXZ'
+        'rrBbnt8VVv2Hd7mBRFdYPx/RFVbhR3aF5f5RXWFtfXTwX/XC4PCi4DAfHD4mOHxscHhxV7gffFyX'
+        'H2nvCrvm44N/ci84vKQrbOOFLj/kHPzRJwSHl3WFm8MndoU9me4K6/mTusJ94P8I/oVPDg7/Z3BY'
+        'DA6fEhw+NTh8WnBYCg6f3hXuJZ/R5QffusLG/hddYb/9y66wMz+zK9zJ/lXwr/9fweGzgkMmONzv'
+        'CveXz+7yowXBH/3r4PA5XWGjZrvCze9zgz/6vODw+cEf9Nxf7Qr3lZd3hdvSU13h1vMFwb/whcHh'
+        'i4LDFweHL+kKS/hLg1+vBYdXBIf14PBlXeF2mesKt68v7wp3la8I/slGcPg3XeFu82+DX39lcPiq'
+        'rnBX+Org15vB4Wu6wp3ya7vCPeCVwR8lg8NfdPl6YfDrrwsOXx8cXhUcCiGNMABd4Ya1Ffz6G4PD'
+        'N3WFu9Q3B7/+98HhW7p8ByH49bcFh+3g8O3BodQVbrLfEfz6O4PDdwV/8NP3d4Jff3dw2A0O3xMc'
+        'HgSH7w0O5eDwfcGhEhy+PzjsBYcfCA4/2BXuTK/uCvewH+oKt/j/EPyTHw4OPxIcfjQ4/FhwqAaH'
+        'H+8KJ42fCH79k8Hhp7rCLf2ng1/XgsN/DA77weFngkM9OPyn4PCzweGgK9yKfy74dSM4/Hxw+IXg'
+        '0AwOLwgOf9kV7pG/1BXu878Y/NEvB4fD4PArweEoOPzn4PCrweE4OPxacPj14HDSFZ7Q/o3g163g'
+        '8JvB4beCw3/pCjbV199+Hum7PidwahA7NYidGsRODWKnPo+cmsdOzWOn5rFT89ipeezUPHZqHjs1'
+        'j52ax07NY6fmsVPz2Kl57NQ8dmoeOzWPnZrHTs1jp+axU/PYqXns1Dx2ah47NY+dmsdOzWOn5rFT'
+        '89ipeezUPHZqHjs1gZ2ax05NZ6fmsVPz2Kl57NQ8dmoeOzWPnZrHTs1jp+axU/PYqXns1Dx2ah47'
+        'NY+dmsdOzWOn5rFT89ipeezUPHZqHjs1j52ax07NY6fmsVPz2Kl57NQ8dmoeOzWPnZrHTs1jp+ax'
+        'U/PYqXns1Dx2ah47NY+dmsdOw3ns4uZrZXfDze4yoPTKJz7qRS/7pBe96CXhDSs+4ul/cHM5aT78'
+        'LsN/vTnf8pLw8tKj4PcTwe+7w99f3YJ8dP0B+QzIMyDPgDwD8gzIMyDPgDwD8gzIMyDPgDwD8gzI'
+        'MyDPgDwD8gzIMyDPgDwD8gzIMyDPgDwD8gzIMyDPgDwD8gzIMyDPgDwD8gzIMyDPgDwD8gzIMyDP'
+        'gDwD8gzIMyDPgDwD8gzIMyDPgDwD8gzIMyDPgDwD8gzIMyDPgDwD8gzIMyDPgDwD8gzIMyDPgDwD'
+        '8gzIMyDPgDwD8gzIMyDPgDwD8gzIMyDPgDwD8gzIMyDPQpB/fUvn867pnKNzjs45OufonKNzjs45'
+        'OufonKNzjs45OufonKNzjs45OufonKNzjs45OufonKNzjs45OufonKNzjs45OufonKNzjs45Oufo'
+        'nKNzjs45OufonKNzjs45OufonKNzjs45OufonKNzjs45OufonKNzjs45OufonKNzjs45OufonKNz'
+        'js45OufonKNzjs45OufonKNzjs45OufonKNzjs45OufonKNzjs45OufonKNzjs55SOe/vfXvz/sl'
+        'z3pbvD/vf7+9ZjB1PR88dM3goWsGD10zeOiawUPv+kPXDB66ZvDQNYOHzlA+dM3goWsGD10zeOia'
+        'wUPXDB66ZvAQhYeuGTx0zeChawYPXTN46JrBQ9cMHgrTQ9cMHrpm8NA1g4euGTx0zeChawYPXTN4'
+        '6JrBQ9cMHrpm8JCWh64ZPHTN4GGo5X/c7HxfFl7Jfcad8BnjwR98Z/Auhj9B+cLw+9hdd27Ocx16'
+        '+S5V0qVKulRJlyrpUiVdqqRLlXSpki5V0qVKulRJlyrpUiVdqqRLlXSpki5V0qVKulRJlyrpUiVd'
+        'qqRLlXTpVbxUSZcq6VIlXaqkS5V0qZIuVdKlSrpUSZcq6VIlXaqkS5V0qZIuVdKlSrpUSZcq6VIl'
+        'XaqkS5V0qZIuVdKlSrpUSZcq6VIlXaqkS5V0qZIu4bxUSZcq6VIlXaqkS5V0qZIuVdIlh5cq6VIl'
+        'XaqkS5V0qZIuVdKlSrpUSZcq6VIlXaqkS5V0CdmlSrpUSZchsmfeuUne86+T90jyHkneI8l7JHmP'
+        '/OUeSd4jyXskeY8k75HkPZK8R5L3SPIeSd4jyXvkb/xI8h5J3iPJeyR5jyTvkeQ9YuaR5D2SvEeS'
+        '90jyHkneI8l7JHmPJO+R5D2SvEdelEeS90jyHoUvyrPuvGFPhyeIFp9+af4hX2B6o2r6zp3HJ55m'
+        'wkbqfvz7xGcEv32HOzc/2H3n5ge7f+P6WZu9nrXZ61mbvZ612etZm72etdnrWZu9nrXZ61mbvZ61'
+        '2etZm72etdnrWZu9nrXZ61mbvZ612etZm72etdnrWZu9nrXZ61mbvZ612etZm72etdnrWZu9nrXZ'
+        '61mbvZ612etZm72etdnrWZu9nrXZ61mbvZ612etZm72etdnrWZu9nrXZ61mbvZ612etZm72etdnr'
+        'WZu9nrXZ61mbvZ612etZm72etdnrWZu9nrXZ61mbvZ612etZm72etdnrWZu9nrXZ61mbvZ612etZ'
+        'm72etdnrWZu9nrXZ61mbvZ612etZm72etdnrWZu9nrXZ61mbvZ612etZm72etdnrWZu9nrXZ61mb'
+        'vZ612etZm72etdnrWZu9QfSeuN3JXktONznd5HST001ONznd5HST001ONznd5HST001ONznd5HST'
+        '001ONznd5HST001ONznd5HST001ONznd5HST001ONznd5HST001ONznd5HST001ONznd5HST001O'
+        'Nznd5HST001ONznd5HST001ONznd5HST001ONznd5HST001ONznd5HST001ONznd5HST001ONznd'
+        '5HST001ONznd5HST001ONznd5HST001ONznd5HSHcnruvC18GSAcsl8RjGdvM639jncenwuZDVs7'
+        'cufx/Th+Ojyj0nvnb7p88A/tisH/6zrB9ZWB/+VygdOhH/aWu2LgbPZL/+nawVvk2sHbwRWD/uDw'
+        '34L/4HODhN4Lfkzrbf4qwvVFg+tLCG/mawfvdOfmJwNecP2TAXft6Xft6Xft6Xdt33dt33dt2Hft'
+        '1Hft1Hft1HftxnftxndtvHdtvHdttXftsXdtrndtrndtoHdtkndtknftjnftjnftjnftgHftgHdt'
+        'fXftcnftcnfta3fta3dtaOHSbXlHS6/lnSz/zNJnuWvpt7yzZdDybpYhy7Mtw5b3tLy35X0sI5bn'
+        'WMYs45a45QMsz7U8aXmeZdIyZZm2zFieb/lQy6zlBZY5y0dbXmh5kSVtmbe82JKwfLzlnuWllgXL'
+        'yyy/Z/l9yx9Y1i2vsbQtf2j5I8sfW37bcmb5E8u55dTyp5aO5bWWP7M8tPy55XWW37H8heV3LX9p'
+        '+SvL68PlqXv/7ObD1qeF23TfzWR8b/X6vPMAJwNG4wFcBnAZwGUAlwFcBnAZwGVAjAbEaECMBhga'
+        'YGiAoQHZGpCtAaIGiBqQtAGwBgRuQOAGBG6AtgHaBmgboG1AGAeEcYC9AfYG2BuQ0AEJHSBxgMQB'
+        'eR0AckBsB7gckN4B6R2gdIDSAUoHKB2Q7AFYB2AdgHUA1gGpH5D6AXQHhH9A+AeEf4DnAZ4HeB4A'
+        'eUAxDCiGAawH9MMA3QN0D9A9oDQGlMYA6wOsD6iQARUyQP6AJhmQn4GQ0t1bOqlrOoPoDKIziM4g'
+        'OoPoDKIziM4gOoPoDKIziM4gOoPoDKIziM4gOoPoDKIziM4gOoPoDKIziM4gOoPoDKIziM4gOoPo'
+        'DKIziM4gOoPoDKIziM4gOoPoDKIziM4gOoPoDKIziM4gOoPoDKIziM4gOoPoDKIziM4gOoPoDKIz'
+        'iM4gOoPoDKIziM4gOoPoDKIziM4gOoPoDKIziM4gOoPoDKIziM4gOoPoDKIziM4gOoPoDKIzGNLp'
+        'v919n+yy+w5574e890Pe+yFv85C3ecgbO+QdHfKODnlHh7xrQ961IW/QkDdoyFsy5L0Y8iYMeROG'
+        'vNBDXswhL+aQV3HIqzjkVRzySg15pYa8RENejSGvxpC//5C//5C/+JDdd0g0hmRiSCaGhGFIGIaE'
+        'YUgYhrgf4n6I+yHSh0gfQnyI5iGah2geonmI3yF+h/gdInaI2CFUhxgdonKIyiEqh6gcwnEIxyEc'
+        'h3AcAnCItSHWhlgb8t4PITcE2RBdQ3QN0TXE0xBPQwQNhWbe+bZuvu3xM729plF1E/XSRr20UXUT'
+        '9QpHvcJRr3DUKxxFLmoDj5IXJS/q1Y969aM296g3IUpllMqotyTqLYkyGvXORFGNohq1/0eJjXrX'
+        'ot61qHct6l2L0hylOeo9jHoPo97DKOJRxKPGh6g3NuqNjXIf9f5G8Y96m6NSEJWCqDc96k2PetOj'
+        '3vSohES991HvfdR7H/XeR6UnKj1REqJCFBWiqFEmKktRSqKURCmJUhKlJCpuUXGLMhOVuig6UXSi'
+        'JqGoSSgKUlQwo4IZxSqKVdSUFJXWqLRGWYsKbdSkFzXpRU16UbNd1GwXNdtFzXZRQ13UUBc11EVN'
+        'c1HTXNQYFzXGRY1xUYNb1MQWNbFFTWzR0P273Lr/omv3w9wPcz/M/TD3w9wPcz/M/TD3w9wPcz8M'
+        '/DDww8APAz9M+jDpw6QPkz5M+jDpw6QPkz5M+jDiw4gPIz6M+DDiw4gPIz6M+DDiw4gPIz6M+DDb'
+        'w2wPsz3M9jDbw2wPsz3M9jDbw2wPsz3M9jDbw2wPsz3M9jDbw2wPsz3M9jDbw2wPQz0M9TDUw1AP'
+        '0zxM8zDNwzQP0zxM8zDNw/wO8zvM7zC/w/wOgzsM7jC4w+AOC9FwSGfg5krKewSz/rveSpq/vioX'
+        'IylGUoykGEkxkmIkxUiKkRQjKUZSTIPGgIoBFQMqBlRMg8a4inEV4yrGVYyrGFcxrmJcxbiKadAY'
+        'XjG8YnjF8IrhFcMrhlcMrxheMbxieMXwimnQGGUxymKUxSiLURajLEZZjLIYZTHKYpTFKItRFqMs'
+        'RlmMshhlMcpilMUoi1EWoyymQWOwxWCLwRaDLebNjzEXYy7GXIy5GHMx5mLMxTRoTIPGCIwRGCMw'
+        'RmCMwJgGjYEYAzEGYgzEmAaNadCYBo1p0JgGjWnQmAaNadCYBo1p0JgGjWnQmAaNadCYBo1p0JgG'
+        'jWnQmAaNhTEYDGIQ3HEu0RvE4N1uLwY9koIRKRiRghEpGJGCESkYkYIRKRiRghEpGJGCEfxH8B/B'
+        'fwT/Ee5HuB/hfoT7Ee5HuB/hfoT7Ee5HgB8BfgT4EeBHgB8BfgT4EeBHgB8BfgT4EeBHSB8hfYT0'
+        'EdJHSB8hfYT0EdJHSB8hfYT0EdJHSB8hfYT0EdJHSB8hfYT0EdJHSB8hfQTxEcRHEB9BfITtEbZH'
+        '2B5he4TtEbZH2B6heYTmEZpHaB6heQTjEYxHMB7BeESkRkJIQ7cF+qrrrXgUnVF0RtEZRWcUnVF0'
+        'RtEZRWcUnVF0RtEZRWcUnVF0RtEZRWcUnVF0RtEZRWcUnVF0RtEZRWcUnVF0RtEZRWcUnVF0RtEZ'
+        'RWcUnVF0RtEZRWcUnVF0RtEZRWcUnVF0RtEZRWcUnVF0RtEZRWcUnVF0RtEZRWcUnVF0RtEZRWcU'
+        'nVF0RtEZRWcUnVF0RtEZRWcUnVF0RtEZRWcUnVF0RtEZRWcUnVF0RtEZRWcUnVF0RkM6735LZ+Ga'
+        'zhg6Y+iMoTOGzhg6Y+iMoTOGzhg6Y+iMoTOGzhg6Y+iMoTOGzhg6Y+iMoTOGzhg6Y+iMoTOGzhg6'
+        'Y+iMoTOGzhg6Y+iMoTOGzhg6Y+iMoTOGzhg6Y+iMoTOGzhg6Y+iMoTOGzhg6Y+iMoTOGzhg6Y+iM'
+        'oTOGzhg6Y+iMoTOGzhg6Y+iMoTOGzhg6Y+iMoTOGzhg6Y+iMoTOGzhg6Y+iMoTOGzhg6Y+iMoTOG'
+        'zhg6Y+iMhXSit3R+4JpOHJ04OnF04ujE0YmjE0cnjk4cnTg6cWNbnKA4QXGC4gTFjW1xkOIgxUGK'
+        'gxQHKQ5SHKQ4SHGQ4sa2OE9xnuI8xXmK8xTnKc5TnKc4T3Ge4jzFeYob2+JYxbGKYxXHKo5VHKs4'
+        'VnGs4ljFsYpjFccqjlUcqzhWcaziWMWximMVxyqOVRyruLEtTlecrjhdcbri3u04ZHHI4pDFIYtD'
+        'FocsDlnc2BY3tsWRiyMXRy6OXBy5uLEtTl6cvDh5cfLixra4sS1ubIsb2+LGtrixLW5sixvb4sa2'
+        'uLEtbmyLG9vixra4sS1ubIsb2+LGtrixLW5si4fun30ztqWCsW34zhs8XeaVwZ+8x53rxzUkXhv8'
+        '9j3f7F/VCL928VnB1y7egl+wu/+gx8+c5J71pv0o7Rv3vY1/7vu+97fuPOMZ95//xNOHD30i/Obi'
+        '7BPhO/+CJ8JSCJfXWn7X8jrL71hOLa+x/Lbl9eHy1L3YbWUtXVfWlMqaUllTKmtKZU2prCmVNaWy'
+        'plTWlMqaUllTumpKV03pqildNaWkppTUlJKaUlJTSmpKSU0pqSklNaWkprTTlHaa0k5T2mlKO01p'
+        'pyntNKWdprTTlHaa0k5T2mlKLU2ppSm1NKWWptTSlFqaUktTamlKLU2ppSm1NKWWptTSlFqaUktT'
+        'amlKLU2ppSm1NKWWptTSlFqa0kdT+mhKH03poylFNKWIphTRlCKaUkRTimhKEU2pninVM6V6plTP'
+        'lOqZ0jlTOmdK50zpnCn9NxWm/r1u6dy9pjODzgw6M+jMoDODzgw6M+jMoDODzgw6M+jMoDODzgw6'
+        'M+jMoDODzgw6M+jMoDODzgw6M+jMoDODzgw6M+jMoDODzgw6M+jMoDODzgw6M+jMoDODzgw6M+jM'
+        'oDODzgw6M+jMoDODzgw6M+jMoDODzgw6M+jMoDODzgw6M+jMoDODzgw6M+jMoDODzgw6M+jMoDOD'
+        'zgw6M+jMoDODzgw6M+jMoDODzgw6M+jMoDODzgw6MyGd9765tt0T3iv+fW4pvdM1pVmUZlGaRWkW'
+        'pVmUZlGaRWkWpVmUZlGaRWkWpVmUZlGaRWkWpVmUZlGaRWkWpVmUZlGaRWkWpVmUZlGaRWkWpVmU'
+        'ZlGaRWkWpVmUZlGaRWkWpVmUZlGaRWkWpVmUZlGaRWkWpVmUZlGaRWkWpVmUZlGaRWkWpVmUZlGa'
+        'RWkWpVmUZlGaRWkWpVmUZlGaRWkWpVmUZlGaRWkWpVmUZlGaRWkWpVmUZlGaRWkWpVmUZlGaDSmN'
+        '3Jw5/dZA0nPuvC3fEir8UYKnnvb95voSaPg1zm8Ivmz/Ro8Vo3f+Ljc4uffyZ/1tdzh5e//phve9'
+        'c33nzMQ3BZLGwtcpfL7FLz79V376RXnq3vidxw8maIS9FQ//nfDGto3Hz8sdvy6whAJLKLCEAkso'
+        'sIQCSyiwhAJLKLCEAksosIQCSyiwhAJLKLCEAksosIQCSyiwhAJLKLCEAksosIQCSyiwhAJLKLCE'
+        'AksosIQCSyiwhAJLKLCEAksosIQCSyiwhAJLKLCEAksosIQCSyiwhAJLKLCEAksosIQCSyiwhAJL'
+        'KLCEAksosIQCSyiwhAJLKLCEAksosIQCSyiwhAJLKLCEAksosIQCSyiwhAJLKLCEAksosIQCSyiw'
+        'hAJLKLCEAksosIQCSyiwRFhg7/f4s9G9RGjq/W/3wtI1pSRKSZSSKCVRSqKURCmJUhKlJEpJlJJO'
+        'IiSJShKVJCpJVNJJhCRYSbCSYCXBSoKVBCsJVhKsJFhJJxGSfCX5SvKV5CvJV5KvJF9JvpJ8JflK'
+        '8pXkK+kkQhKzJGZJzJKYJTFLYpbELIlZErMkZknMkpglMUtilsQsiVkSsyRmScySmCUxS2KWdBIh'
+        'SVuStiRtSdqS3v0kdEnoktAloUtCl4QuCV3SSYSkkwhJBJMIJhFMIphEMOkkQpLEJIlJEpMkJp1E'
+        'SDqJkHQSIekkQtJJhKSTCEknEZJOIiSdREg6iZB0EiHpJELSSYSkkwhJJxGSTiIknURIOomQdBIh'
+        'GebgA27d/8G1+wXuF7hf4H6B+wXuF7hf4H6B+wXuF7hfAH4B+AXgF4BfIH2B9AXSF0hfIH2B9AXS'
+        'F0hfIH0B8QXEFxBfQHwB8QXEFxBfQHwB8QXEFxBfQHyB7QW2F9heYHuB7QW2F9heYHuB7QW2F9he'
+        'YHuB7QW2F9heYHuB7QW2F9heYHuB7QW2F6BegHoB6gWoF2heoHmB5gWaF2heoHmB5gV+F/hd4HeB'
+        '3wV+F8BdAHcB3AVwF4RoIaTz3JDOx9z/4eCuZOETUX7jK7fu/2i3szPf/szgR6Qnbnl93zWvNF5p'
+        'vNJ4pfFK45XGK41XGq80Xmm80mo1TVmasjRlacrSajUNWxq2NGxp2NKwpWFLw5aGLQ1bWq2mmUsz'
+        'l2YuzVyauTRzaebSzKWZSzOXZi7NXFqtptFLo5dGL41eGr00emn00uil0Uujl0YvjV4avTR6afTS'
+        '6KXRS6OXRi+NXhq9NHpptZomME1gmsA0gWki0iCmQUyDmAYxDWIaxDSIabWaVqtpLNNYprFMY5nG'
+        'Mq1W03Sm6UzTmaYzrVbTajWtVtNqNa1W02o1rVbTajWtVtNqNa1W02o1rVbTajWtVtNqNa1W02o1'
+        'rVbTYTae/Ps51/rVb8FzrfczdyR5M/gf/XuZ/T/Qz8Q9XQ4vDb5vs3rveXf+MdxaOHwrP+pZb8rH'
+        'xw+67dHPvO7RJT26pEeX9OiSHl3So0t6dEmPLunRJT26pEeXFOiSAl1SoEsKdElzLmnOJc25pDmX'
+        'NOeS5lzSnEuac0lzLqnMJZW5pDKXVOaSylxSmUsqc0llLqnMJZW5pDKXVOaSrlzSlUu6cklXLunK'
+        'JV25pCuXdOWSrlzSlUu6cklXLunKJV25pCuXdOWSrlzSlUu6cklXLunKJV25pCSXlOSSklxSkkva'
+        'cUk7LmnHJe24pB2XtOOSdlzSh0v6cEkfLunDJX24pAiXFOGSIlxShEtKeSmsog++c3133sR2ELHJ'
+        'xx+mE8vBb6fuXD8j5t7Php+Dpm9O7Pxl8NuZW3fvfu0uw12Guwx3Ge4ywGWAywCXAS4DXAa4DHAZ'
+        '4DLAZYDLAJcBLgNcBrgMcBngMsBlgMsAlwEuA1wGuAxwGeAywGWAywCXAS4DXAa4DHAZ4DLAZYDL'
+        'AJcBLgNcBrgMcBngMsBlgMsAlwEuA1wGuAxwGeAywGWAywCXAS4DXAa4DHAZ4DLAZYDLAJcBLgNc'
+        'BrgMcBngMsBlgMsAlwEuA1wGuAxwGeAywGVCcB/yTz/Z/E8/2fxPP9n8FvrJZj+xPPr0p6039mec'
+        '/5H/ZPPz3+ZmTI+aC+4X/VY9E/+ht3v9q6/3+qy9Pmuvz9rrs/b6rBkza8vP2vKztvysLT9ry8/6'
+        'rJ6182ft/Fk7f9bOn/VZPWsAyBoAsgaArAEgawDIGgCyBoCsASBrAMj6rJ41B2TNAVlzQNYckDUH'
+        'ZM0BWXNA1hyQNQdkzQFZc0DWHJD1WT1rHMgaB7LGgaxxIGscyBoHssaBrHEgaxzIGgeyxoGscSBr'
+        'HMgaB7LGgaxxIGscyBoHssaBrHEgaxzIGgeyPqtnTQVZU0HWVJA1FWTt0lnDQdZwkDUcZA0HWcNB'
+        '1nCQNRxkfVbP+qyeNSpkjQpZo0LWqJA1KmR9Vs+aGLImhqyJIWtiyPqsnvVZPeuzetZn9azP6lmf'
+        '1bM+q2d9Vs/6rJ71WT3rs3rWZ/Wsz+pZn9WzPqtnfVbP+qye9Vk967N6NpxXZm8uBfSHd2p5wW0O'
+        'Fq9zsCoHq3KwKgercrAqB6tysCoHq3KwKgercrAqAKsCsCoAqwKwSv4q+avkr5K/Sv4q+avkr5K/'
+        'Sv4q8qvIryK/ivwq8qvIryK/ivwq8qvIryK/ivwq66usr7K+yvoq66usr7K+yvoq66usr7K+yvoq'
+        '66usr7K+yvoq66usr7K+yvoq66usr0K+Cvkq5KuQr9K9Svcq3at0r9K9Svcq3as8r/K8yvMqz6s8'
+        'r4K8CvIqyKsgrwrVakjpw24ovTz8NPXhN9+4aIa05kJa68Ef/EzQ9+GX81aDE6UfcftDF/+duTXm'
+        '1phbY26NuTXm1phbY26NuTXm1phbY26NuTXm1phbY26NuTXm1phbY26NuTXm1phbY26NuTXm1phb'
+        'Y26NuTXm1phbY26NuTXm1phbY26NuTXm1phbY26NuTXm1phbY26NuTXm1phbY26NuTXm1phbY26N'
+        'uTXm1phbY26NuTXm1phbY26NuTXm1phbY26NuTXm1phbY26NuTXm1phbY26NuTXm1phbY26NuTXm'
+        '1phbC8195D/Yc2bhXPR5wXmy/6155qNue/zousdzMpWTqZxM5WQqJ1M5mcrJVE6mcjKVk6mceSYn'
+        'WjnRyolWTrRy5pmchOUkLCdhOQnLSVhOwnISlpOwnITlzDM5QcsJWk7QcoKWE7ScoOUELSdoOUHL'
+        'CVpO0HKCljPP5OQtJ285ecvJW07ecvKWk7ecvOXkLSdvOXnLyVtO3nLylpO3nLzl5C0nbzl5y8lb'
+        'Tt5y8pYzz+TELid2ObHLiV1ODHLSl5O+nPTlpC8nfTnpy0lfzjyTM8/kZDEnizlZzMliThZz5pmc'
+        'SOZEMieSOZHMmWdy5pmceSZnnsmZZ3LmmZx5JmeeyZlncuaZnHkmZ57JmWdy5pmceSZnnsmZZ3Lm'
+        'mZx5JhcWwkcH7m/O3i8G+Qm3oC99+lev7PmM1c9eevkXf+5nhvfw/8w3vId/KryH/wtvtqz3C+/Z'
+        '/6LH38+596PhljYf/P4Pgt//eHiDnI/5p7M9/3S25x/n2R6nXvqDm8W97d7R7h/52Z6PDevp9cEQ'
+        '8KXhz/T/3v1XhS354pue+6aw1z7udlp4h+sf/t8yLWyZFrZMC1umhS3TwpZpYcu0sGVa2DItbJkW'
+        'towJW8aELWPCljFhy3ywZT7YMh9smQ+2zAdb5oMt88GW+WDLfLBlMNgyGGwZDLYMBlsGgy2DwZbB'
+        'YMtgsGUw2DIYbBkMtgwGWyaCLRPBlolgy0SwZSLYMhFsmQi2TARbJoItE8GWiWDLRLBlItgyEWyZ'
+        'CLZMBFsmgi0TwZaJYMtEsGUi2DIRbBkFtowCW0aBLaPAlhlgywywZQbYMgNsmQG2zABbZoAtu/6W'
+        'XX/Lrr9l19+y62/Z7rds91u2+y3b/ZbRYyuklLi5ZvZZgaSPf3zn18TPBL+9d3svpw+8vpdTkYwi'
+        'GUUyihAUISh624ve76L3u+j9LnpPi97Torev6O0resOK3qmit6joLSp6G4pe6qKXuug1LnqNi17j'
+        'otex6HUsegGLXqui16ro1Sl6dYpelqJ7ORUFpygxRYkpikpRVIqiUhSVolQUpaIoFUU5KMpBUQCK'
+        'rBdZL7JeZL1Id5HuIt1Fnos8F0EuElxktshskdkis0VYi7AWYS3CWsSzSGKRxCKJRTKKQBYRLLJX'
+        'ZK/IXpG2Im1FvoqhqJeEZoLPYt8dNNRQVzCZJW8b6mXXn2e2vdDbGmrb673t9d7WUNte9m0v+7aX'
+        'fdvLvs3hNofbHG57L7a9F9vei204t+Hc9s5se2e2Ud32Bm0Tu03sNrHb3rVt79q2d23bu7ZN8zbN'
+        '297Dbe/htvdwG/FtxLe9o9ve0W3gt72x29xve3+38d/Gf9u7ve3d3vZub3u3t0Vj25u+7U3f9qZv'
+        'e9O3xWZbbLYR2JaebenZlp5tLra52OZiG4htydqWrG08tgVsm5JtSrYp2Za6banbZmabmW0Z3JbB'
+        'bYK2RXGbw+3Q00tvd8FPud4FS+E/WAj/we/dXwqfERz883/hKaCp2/NRv8XaDms7rO2wtsPaDms7'
+        'rO2wtsPaDms7rO2wtsPaDms7rO2wtsPaDms7rO2wtsPaDms7rO2wtsPaDms7rO2wtsPaDms7rO2w'
+        'tsPaDms7rO2wtsPaDms7rO2wtsPaDms7rO2wtsPaDms7rO2wtsPaDms7rO2wtsPaDms7rO2wtsPa'
+        'Dms7rO2wtsPaDms7rO2wtsPaDms7rO2wtsPaDms7rO2wtsPaDms7rO2wtsPaDms7rO2EpD7htqY+'
+        '4bqmdtHZRWcXnV10dtHZRWcXnV10dtHZRWcXnV10dtHZRWcXnV10dtHZRWcXnV10dtHZRWcXnV10'
+        'dtHZRWcXnV10dtHZRWcXnV10dtHZRWcXnV10dtHZRWcXnV10dtHZRWcXnV10dtHZRWcXnV10dtHZ'
+        'RWcXnV10dtHZRWcXnV10dtHZRWcXnV10dtHZRWcXnV10dtHZRWcXnV10dtHZRWcXnV10dtHZRWcX'
+        'nV10dtHZRSdYnnpq4huf8Yynp/an/2/rle+0+vLP+PyXLz19fPlnrv7P9q48MI6q/jdp7ibpTVtu'
+        'whVaSrmPCoVtsm1Ds7thk9BCW5bJ7iSZ6V7M7jYtt4jYYsSDFS+8L1Tkp6iICMgtgiIqoigIAiqg'
+        'Iih4Iv7m+DYzme97k8x7b7ZplT/4tG+n3/l8v+/73vu+7zumfElZ/WD1tGlrbyqMNsnZlKs4srmq'
+        'UBp+YHRmj6QVlOzQKi2XLeqPlUvDD20qt+vhWNPabxRMuMWCb1pwqwXfsuA2C75twe0W3GHBnRZ8'
+        'x4K7LLjbgnssuNeC+yy434IHLPiuBQ9a8D0LHrLgYQu+b8EPLHjEgh9a8KgFP7Lgxxb8xILHLPip'
+        'BY9b8DMLfm7BExb8woJfWvCkBU9Z8CsLnrbgGQt+bcGzFjxnwfMW/MaC31rwOwtesOBFC16y4PcW'
+        '/MGCP1rwsgV/suAVC1614M8W/MWC1yx43YK/WvA3C/5uwT8s+KcF/7LgDQv+bcGbFvzHhMi0Kgur'
+        'AKsBpwPWANYC1gHWAzYANgI2Ac4AbAZsAWwFnAk4C3A24BzAuYDzAOcD7gW4AHAh4CLAvQH3AdwX'
+        'cD/A/QEPADwQ8CDANsCDAQ8BPBTwMMDDAdsBjwBcDLgE8EjApYBHAS4DPBrwGMBjAY8DPB7wBMAT'
+        'AU8CPBnwFMDlgG8BPBXwNMAVgKcDngEYAlwJ2AHYCRgGXAW4GnANYBfgmYBrAbsBI4BRwBhgD+BZ'
+        'gHHAXsA+wH7AswHXAa4HPAfwXMANgBsBNwGeB5gAPB9QAhwATAKmAGXAQcAhwGFABVAF3AyYBswA'
+        'ZgFzgHnACwA1wAJgEbAEuAVwBHAr4DbACwEvArwY8BLASwEvA7wc8K2AVwC+DfBKwLcDXgX4DsDt'
+        'gDsArwZ8J+Ao4LsArwF8N+B7AN8L+D7AawHLgO8HvA7wA4AfBPwQ4IcBPwJ4PeBHAT8G+HHATwB+'
+        'EvBTgJ8G/AzgZwE/B/h5wBsAvwD4RcAvAd4I+GXAmwD/D/ArgF8FvBnwa4BfB/wG4C2A3wS8FfBb'
+        'gLcBfhvwdsA7AO8E/A7gXYB3A94DeC/gfYD3Az4A+F3ABwG/B/gQ4MOA3wf8AeAjgD8EfBTwR4A/'
+        'BvwJ4GOAPwV8HPBngD8HfALwF4C/BHwS8CnAXwE+DfgM4K8BnwV8DvB5wN8A/hbwd4AvAL4I+BLg'
+        '7wH/APhHwJcB/wT4CuCrgH8G/Avga4CvA/4V8G+Afwf8B+A/Af8F+AbgvwHfBPwP4LRqGP8BqwGn'
+        'A9YA1gLWAdYDNgA2AjYBzgBsBmwBbAWcCTgLcDbgHMC5gPMA5wPuBbgAcCHgIsC9AfcB3BdwP8D9'
+        'AQ8APBDwIMA2wIMBDwE8FPAwwMMB2wGPAFwMuATwSMClgEcBLgM8GvAYwGMBjwM8HvAEwBMBTwI8'
+        'GfAUwOWAbwE8FfA0wBWApwOeARgCXAnYAdgJGAZcBbgacA1gF+CZgGsBuwEjgFHAGGAP4FmAccBe'
+        'wD7AfsCzAdcBrgc8B/BcwA2AGwE3AZ4HmAA8H1ACHABMAqYAZcBBwCHAYUAFUAXcDJgGzABmAXOA'
+        'ecALADXAAmARsAS4BXAEcCvgNsALAS8CvBjwEsBLAS8DvLy6II/W5/JFJZc1ZpHto7UpeaA0VN4x'
+        'WlcoakqyqP9p5mZZziekdDpRzG2W9ed2jDYVNVlOJNNSoVCOjtYmpeSwrBe3mH9IDGlSJiNp5R3D'
+        '09WP6NPS0dq0vFXWysP3j84oalK2MJjTMvrfo+akdZM1d5VGG/KaktOU4rbyaF1Wf0JKl0cbpcyA'
+        'MlQyC2ukUjFXHq3V5CF5q/62uXktl5eG9AlwIp8rKJYO20dnmi9LJHXCA1Jys6HW6JyMtG1Afywt'
+        'JeXhXDola8aTrXJKKSaKspZRslJa12T4nrXThu/dMdqc0/RHZH16LReNB5uVTD6nT8LzUnG4UN5U'
+        'Hp1RyJW0pGwW6AZo0CWXhhTThMb8u6Zb0jaXS6M1GTmTM8y6dpph25qslJHLo/Wr4+FQXziu/0n/'
+        '9/rrs5blt0jpkv5z1Qpdx8G0NGS+abomjej/b1vRVtYFN/VY/6C3qJVL6iU106bphB8YndEHOnTK'
+        'g+XS2ipj38N79R91IuHe3rJ6rf5no+z9RlnVqWX1AzWm3T9k/H1626mGbPUj+l9smer1xl/XVo+J'
+        'agHWifBZ/aFul8zqFaeNF1rTtuI0utTpY1KbDIJkkacikad6iKwZE1lnSnNrXX0aEneah7jaMXGN'
+        '0VgfmeBBSOJBHhLrbIK9ffGu6GqXuJltG85r27S47eLDN5x3+KbFh4+XPXuZ6+dleiNJjCgp3f82'
+        '6f5VfXXjNPivStY9ohEcJR4uIyb1Y0xmRPsjK/Uq7TunJ+yiU5ctZQb0NjqORUObVUrXssG2W194'
+        'fR9Jck1R3locL7euzSijS20ckzo91LvWJW+6VNg8Xlxtm15El9ZkS+sNneOWVpC2uaXpRXRpM8ak'
+        'VXetcruIMuh2EWWQLqrZbrfh7l5kNzldkN12M8roAlvGBNauW9PV7ZZYOzKspF0i69vMQrrMVtt6'
+        'q2Jxt/X0nt1tPb2ILm2mw3pRZL0ssl6WLmqWTawz7K6J6Sl50E1ML6JLm23Xxar+aIe7LgZL2aS7'
+        'LowyusA5dl10dIdQr1xrDaauujAL6TLn2n1KPNzXH3dbsE6TiyUt627EVild7Dyb6kq903c3uNoB'
+        'TZY2u6mahXSZ88dkNnTEon1d0X63NzYkc9miki25HLKpbWc5XfhedmX1YNPW5JFl69rynoZd4DRs'
+        'jz7uYcPmZamIDWuU0sUudPRj0U7Uj2VTqB/LpujSFtltBzXEanc7rGnzaoZ728RWh93KTh+Si25i'
+        'ehFd2j6O6oj19qHqyBVQ/2+U0QXua9Pr6Uf08iVETy+iS9vPrtzOcHe4Dw19KTktF2V35VqldLH7'
+        '2yT1kMFNMptDJPUiurQDHIMUrpECrpGCV40caNdINBRxK7zXBmnphaGl5yY2wR+OXnpKYtPi8W9Y'
+        'uIz81LKyerf5WPvaqvFBiHovicpBtvWt6MNFZsbG1JL2jUfp/z/i9PEMWpY5fvL72ja7/0lEw+u6'
+        'u6JuK8xobzm9acOBjZsWH7Fk/ItnLWvfqJ2+MbvhwI1F41e/7z5457uH73b1pMbrXC9rWGa+xvdL'
+        'DrF7gxAKfqWCuzeQPHq/Q21v6Qz1hdztNyUVJXf7NcroAg+zBZ7ZG3OPUjVqIZd1CzTK6AIPd4zO'
+        '8VgEjc5aLoNGZ72MLrDdFriuq2+NW+CIosfZLoFGGV3gEXZ19MXc1aFPY13VUczRRS12TOdiIfew'
+        'UZPOSSk3N6OMLnCJLbAritjVKFk3v7o2o4wu8Ei7Ta/q6u5DbbpuUEkX8WTCKqWLXeoMX8NxQviq'
+        'T9Jx+KoX0mUeZVPtiHX3R1DIlMylSxkUMlmldLHLbKqr47H+HjfVIS1XyrupmoV0mUfbLrTSPU2p'
+        'HtjmdqEBj0nKMY7RpD+CRpNSBo0mJY/Gcqzdl3aGezviXStRLJeSC0lNGUCx3M5yuvDjbOfsXRNb'
+        '53bOwnBuxO2cRhld4PG2wDVh3HyGZdx8jDK6wBMckfyaULwPRfLDklZEkbxRSJd5oqON46GpJq1k'
+        '0dTPKKMLPMmu8ZUhNE0bkNA0TS+iSzvZphfSZwRuepIe+7vpGWV0gac4KqULh4jDCg4RjTK6wOWO'
+        'mLM7hmPOdA7HnGmvAOwtjlqOdaNBq2q5O4u2nC7rVFtWqPccNJuslQrb3NPJ+jazkC7zNIfH9KAa'
+        'rmp302uni1phi4oTRB3hFnUEXdTpju7VzBei7lV3CxxbW6V0sWfYDCOhtah5ZKTNqHkYZXSBIecc'
+        'YBVucfocYBC1OWMOMOjZ6lbara4vjlJLRQ2llvQiurQOR05zfUe4B81C5a1JOY9moVYpXWznmNh6'
+        'XfNQd7ebaP2gkUtOu8g2tkExXXLY9vNIqK/DHUbVZqRictjt52YhXeYqu+o7QjgplpRwUswoowtc'
+        'bZMkpXWrTnO7u0dSd41jVpEIRWPRxNHugXoJyhIv8RDYhQQe4xa4FAlc6iHwTCTwWLfAxUjgYg+B'
+        'a5HA49wClyGByzwEdiOBx7sbzjK3xNq2ZV4iI0jkCW6OhyKOh3oIjCKBJ7o5Ll6MOC72smPMOeLj'
+        'ETBNGAHTniNgj2PW1tWBBKaMxTz3rE0vows8y16lMQR2xaIh1Kc1GSKUXFZyd23NbfYv9FfE7bbY'
+        '19+DE9TFUh4nqM1CusxeR5KtEyfZUjjJlvII9vrsPjjU0xNGWbs6KZ+X3Ym7hjarlC623xbbFe0N'
+        'oyCyTskWZA117VYpXezZzrxlJHZ2GOctM7ktMs5bGqV0sets1+ojDL9FwvBb9Bx+19t1FMMJvRxO'
+        '6OW8EnrnOCbvoS7k+SOSgjzfKKMLPNd2y55QPxp0avNSqYDc0iyky9xgy+ztDofRDLGQlmU0QzQL'
+        '6TI32jI7w91oLas2Jafdq1n1bWYhXeYmOzroDXfEop3uZFJ9QU7msqmCOzqAYrrk8xwroKZkt3Na'
+        'EtzOaZXSxSYcPh+KdqJsUJ0mZVPufJDu82YpXez5th1WhvvWhcPuGUD9gFwckeWs2w5QTJcsOaYq'
+        'XR1r0VRFSW5GUxW9jC5wwBF0r4nFenHQPZzLFXDQbZbSxSad9dUdRkOKXl9pOVnE9WWU0sWmHBP8'
+        'EOqhagrSFtSZGGV0gbIjTRTv6sNpIk0p4jSRUUiXOehorX0xnHoqFHM49WQW0mUOOZKWeDG2ZhCt'
+        'xdYZGTIPgcOOeRshs6ERMhuaZ2ZDsQXGepDD1+TyMsrTGmV0gapzVt6PF+bSJbwwp5fRBW62A7He'
+        '/pV98RDyyoZCaaCoSW6/bGrbWU4XnnZMX7qiiG5tRsmW0BKtWUiXmbEJR/q7+7p60GyrIVNKF5W8'
+        'e7rV1LaznC486wifuiJhRLioZGRE2Cyky8w5ZsZdZ3d14pmxskVJ4ZmxWUoXm3csAcS68BJATsFL'
+        'ADmv5f4L7P65IxZZiafw9clcZgDN4RvboJguWbOt2t+LN+rUloyjVW6rmoV0mQVHf9LTjWKU2kI+'
+        'raCcoVlIl1l0tIVwTyiOsy0NBTkvaSjforcFKKcLL6EZz0mo+y9qyBB692+W0gVvsXcI9esBdZww'
+        'qW8s6dGzhmf2M9rGfqDLH3HUniEf1Z4hAtWeUUiXudXm3B1bR+aczo2QOY/9QJe/zeZsyndzNkW4'
+        'OZuFdJkXOnYHoH1JObQvKeexF+Yiu0voDkdXo+WxurScHXIvkDW0WaV0sRc7AoGuc3EgoFyIAwG9'
+        'jC7wEmfKtj+KE/O5UhYn5o1CusxLHWtlfWG00qgHEWil0SijC7zMJrmqK44m/rWDilZAJM1CuszL'
+        'HbmEECGXIBFyCZKXwLfanWs8fHY4jty9XpO3yFoBda5QTJd8hSMI6u7qQUFQWsmjIEgvowt8m8OL'
+        'YmgeXVPIaUh3o4wu8Eq7gmLxTtwYzb3B7goyC+ky3+7M5Hb19vXiTK5SKBZwJtcopYu9yjEG9sfj'
+        'YeTy9cmSpslup9fHQKuYLvkdjhl/VwTP+PUYAs349TK6wO3j9hSECXsKZMKeAg+BO5zbbdbh7TYj'
+        'eLuNxyLh1Y5IKtaJZ9LFXArPpM1Cusx3OrZzrsdpCb1ykWcaZXSBo3Z198Rjq+Mhd3dUn9dyxuZ7'
+        'd3VDMV3yu2yqZ/VjqheUMFWjjC7wGker7IuhZq7PlFAzN8roAt9tVzdOyExH6ZjaNs9kzHsc6bdI'
+        'T4yQfjM3/KP0m1lKF/teZ7epGzJO6DZ1u2mEbtMspkt+ny25K9rR3Y/C8nolm0yXUkgyFNMlX4sC'
+        'vZPR1vkVaOv8CrrAMhJ4ClrCQAKXegh8v902z+kKd7vnubXbFDmdcrdNs5Au87pxTamzvyNMaEqp'
+        'UlImNCWjmC75A7b6q8PRMCkqH5KzMikq31lOF/5Bx0IyIdVZK+FcZ32b5J3s/JAtMx7qwslOTVJw'
+        'stMspMv8sKM7XRNH3XNtcVhzd9B6d2oU0mV+xLFuF4+jHa+1sqbl0LhsFtJlXu+MGCMR98aGqiPd'
+        'a4FH0mV91LFS0EtK6UsFUkrfKqWL/Zhzt0kYpQtrk8NycjPebSJ7JQw/blPVg7uuVe7hrk4P4pTB'
+        'bW6qVild7CccUU60tx/1fnVytlDSUOrAKqWL/aQzc97VgXNxaSWJc3FGIV3mp+wZ3c51VrRyuxwt'
+        'ES73WM/7tD1AdaE4bLqSRUsailf89RnHhq0+tH1Hn2OjDVtFDzf/rGPO0R0L4TlHOifhOYdRSJf5'
+        'OXuEXxmLuVfRawZyubR7hDfK6AI/79ijHMNboKI5vAXKKKMLvAHXsXsxvWqJu4Evocv7ApbnXkuv'
+        'WuqWt5Qu74vOGAlvu1nsFrWYLupLziYS6nVP0KuWuWUto8u6EauJV/iXoRV+D4lfdgy24XgHnqZU'
+        'Hermdyhd2k2Y3/FoS8NitKXBw3r/5zg5hLaOVR3l5nYUXdJXHBPx3rNWukVtcIvaQBf1VUdynyBq'
+        'k1vUJrqomx35m5XxEOpBqy5yC7uILuxrjuU2orBL3MIuoQv7ur3FoD+qz7V7O/BaS1XCLTBBF/gN'
+        '4yRtXU5ThpSsHYjWmndoGQdoZ+hdxs7DsuXSaKO8NS9lC0ouW95kP96aSFiXbhlrEYmjjZc93aBL'
+        'l3ZO/tcaoVZakQrlqKoB1y067hitNwWmjilvN5lFR2cW5Uw+bZxRto4Ml6OjLXpJcVtCyab0IapQ'
+        'PsKgFS+l5RgcwzZPEBsF5dLaWwzRTzZYr7Cc3rzyK2NM6nfyUp9pMA8K2Oc6C/pMJa2/spixnyIc'
+        'gBhtsrZgJ4wV9+36axts28jq8w2GadXf6OBSU/2dXgYaqi+Yv7+o/1/XRH3JeJWOvzdw7Td90N/5'
+        'iPqq/tcxk1ssqrhY3MrAYrQlmdNneyXzjjWHFYFQNRehbyFCTQPpXHLz+FcxV6v6msFDf+B14wEh'
+        'FXmbH8ZjNdnYKLgmv81CI9CqvB0xmpuRklouMSQXE8apmIR5GIVap9Z5O6PCduyssDHzXVyr/29c'
+        'XY79tJ36k328nCx0C/1fwtmwcf9uQu/ZMQkj3cFnJPWARuAsyEbqwUigPJF7TkbPO4PT8wpBek7C'
+        'D9TDaNap5rLOd6a+dUDP6Vx63uWlp3HRAUeX8HDNHtIl3M1nJPVMujMw2UiNBtMl3IP0nGPpaZx4'
+        'try+mKP7Ahyg9t33lZmd4Rr6v2w2tvQm0ooeMeoRojsA2SVudC+XeVWJaWChG1eV6QLphlWHHXGS'
+        'EK+7b/cxi8c4tDmYcej+KW8cIcPQA4GpecUuahpcPlPDZczv7nHGBLPUcpnlwd3HLCw+U8dlnO9N'
+        'eeOAmvVcaj7kqaYZyjFHOB6hXCARzhQMlB/mMq96B1Oc7OFFdzP1PPcFE11/f/cxjkf/891g4pwf'
+        'THnjCIlzHkFqzgY1S5OYYFkXSv1vfkUx7g95jKv+UXSo/CpT5/Oa6OnVo7uNVTx6nb8F0+v8aKrb'
+        'Rkin8+OgtLxiF7ULLo/hm1v9ZE+zpZCp1WO7jVVYPIZvZvXTqW4bIROrx2laWjdRTrCKMHa3JVnT'
+        '3Wu14Gc8plC7mqgV7rEg0N0UyJTl50iVmZYqxp19CfMQMFWRDzNX2id2QaU9Qas02HRi3iNJ1fVz'
+        '/hiP/bsb6TV6M6v5rB0EkqYUctlELo/3XtTIW/Na2dX/81nvF8h6s2CBzLg1cALj3cpovDt3q17h'
+        'l8GYSL2Q3l/QDaReEkx/8SRSstVSslDKTKDiff8VXvBUEAZS38vkA+VgfOBXtMXynddpTqDnQ4yO'
+        'sCuq8+nAdFVvCKZ2nqGN6Ma9pAnzflEq20cZa+Zxjya681pt8XXz60A0VW+jtzWsp5Aqe5Y6gUjn'
+        'igm4Apiqyj8ZK+3mAPpV9Vn6T0/SjMfnBc8FZDz1B3Q/oJtOfbSJZWb6bDCO9fyeYJsXGFyKL2n4'
+        'mz3TbEJSjb/dE2zzMoNL8WUVf7dnmk1IbvGFPcE2rzG4FF/a8cU902xCkpUvTXXbgJYNXFr+Hp8/'
+        'gQDY6/yJ5zZ3SURI9gdeXnjHtSQiHPojEy+vbVKSiHDjZW5a7t0TkoiR/k9MtDyWPiQRA+krPKxI'
+        '+XlJxBD2KhMraqpdEjE+/JnHUqSkuCSiZ/4LEyt6JlUS0ZG+xkSKltgDSo1clF7n6UPJySng1cTF'
+        '6688no4TM8BpBhenv3H1VISIAFg1c7H6O2JFPDHrpkWiLmRU/gcbn4aCtI3Ihm8s/icjG6mw2ee5'
+        '2cmw+RcbmxlSoaAMZYmE+AbfN9gILZJKQ8Y5cjmVsKgZfyHS4xuF/81oL+tbr0RCfAPwm4yNzfxO'
+        'LJEP3+D7HzY+LTu/LkukxDXyRqZVsXFqND5OS+TDNehGqhj5NJmXqREJcQ25kWpWQuaVZkRCXGNt'
+        'ZDorIfM+NCIhroE2UlPF3k/KGtlEXINspJbVqalV1sLFp47VQtYHIIiMWrkY1TMyaihRXGgmF50G'
+        'RjqzjElbwrrykkhrFhetRlY/Mr6CROQzm4tPEysfc9M+ic8cLj4zWLsi8/NIREJzuQg1s7p1QSbb'
+        'Zx4XnRZWt5ZSqUQxl6C60XwuWq2MtOZb32AyMyV0bntxcZvJ6lLmZYpEQgu4CM1i7btHpLRWIodI'
+        'C7kYzWZk1FrclpcTwwol9l/ERWoOq5nSUmYgJREZ7c3FaC6rmYwv+ZiZNyKpfbhIzWMlZXwUh05q'
+        'Xy5S81mHlaSUThP57MfFZy9GPjONXtxj8r0/F6sFjKyaC9sKRTmTMDM4bkoHcFFaiClR7hFD6wTm'
+        'l3sTg6Ws+QHEREoeFJpXiixiptbsRYorvRTZm5lUYzJtzHcJjLhSTJF9mBnVK4PiM0yRfZn5NI0M'
+        '03onrqxSZD9mSi2DOS0hS8lh8amlyP7MrGZocl6WiuLTS5ED2NucVDTuAC0GkGA6kN2jksZXlwPI'
+        'MR3E0TdZn5cOIM/Uxm6nDNVOfJmmgzm6SymQVNMh7IxGlOJwAKmmQ5kZtRqfJaSHdHwZp8MwLbxk'
+        'gy8a6DW+KkM+XiT++FDkcAJJtJKDSYZ619JImv/cmOYQjj957HqmbG0WomQ7i5LqE83UHUW/bCac'
+        'iH6qOYhjA5EjhNcQezXwBVqLmarhZXo1vNIcxKH9yBIKz3FOjUIK6zhFou+cHrdtxwXzo3XZUmbA'
+        '+DIYG7kjWcg19oXX93lQszx0tMbYrsRKbCkmhuJj5KbVXatojthofM5ZMSYh+IqTaXXUExK0662d'
+        'H1LvND8tQH7trEQCWFvXuh+Du7G6zrCXhCY5rQ+85n3TYvvqoxgsrM5qoTafOS2EXoxuWnV+C/Wn'
+        'BfS3LCK9ZZ+WQPrKZdhCpNpAbjg3kbAfMy/1TxxLGL7C3b3UQzvBuSTRghQnFOJnR7NZUT2W7gQe'
+        'XnUC3atO8ulVy4PxqmMI9iDMtJFX1a5bY36/eyr1bxV3pmMJwTk5J4BjmFWxOFMMU218OHoyIfSe'
+        'aPDjCDlSUroD3wQSD/eEQ9RhjXxedE+04PHYgl65WtQP1tFNMb0zvIrFpdVmusw64xvdmQJ26jn0'
+        'TncPqq0TAqst9Ur6+HMV/Sd6VbHViPou+gj5bp8j5PuCGSFPxHXQPCnr/69BiG8QJ7FWhnoD3Zu+'
+        'WEF//yrd37/m099vCcbfT2b295pV/dGOslAjf5mk+NS1PF8O6RRm5374v8e5+dJfy4kBJN4eTgog'
+        '+/rj0Qpmr9/ij+qY5V5ElhOytn0qpkNYtEaeWc94T4jHEDhDyQ7LmlKUskn5v3UcPE10baj/YEpw'
+        'TGul/lTd6q/F17YGMpytYLPUQrrObEb06GzfEDfIVaI++Aa506dIfexiI/INY2ewGXH//zl1axDX'
+        'N0dCU6Q+drER+bY8rWQz4iH/c+rWIG6YjnRMkfrYxUbk257WSZjTETfDITsu/q8IZMOE9SfCvjxk'
+        'naPrKnKd555o8lXCTa5e2srSeq+kt96rfLbeHcFMHlaLN9Uutgdf8L6GlKEibVlFFjnxv6I366oi'
+        'XQoysb+c6tGbVXpR19gwYnO2NgodV66kFc8kBR5owy8y4kq6SerzxpirVXY3wnMNlXW+tQSz4V3J'
+        'yGweH+Oi+N4UHEMrbetu0bZWf9bqb8PaU/TB4mn6YEGyk/psMINnBNuIeoKOsFWc+gF4bydbM9mu'
+        'VIgfRAlJ+knpN4V0iGEdJnGjjz+NohXVqEeIRuqMmdR21EdvmK0zxX5pL3JW4Nqc60sbvhAyHrg2'
+        '5/vShi8R2xu4NoO+tOFLY/YFrk3alzZ8+cT+wLXRfGnDl407mzC1INwj5l4NnosiDiHHr9cRj6WR'
+        'bhFzE1oUDKH1hIAMXyHmJnNAMGTOIZDB95kgT9vKmNPyCBeazde6P6crZJA9l01Jj4U8uv7qenoj'
+        'pGuvbhA9FG9g03n/Xasz34C9kaAzvu8J6XxpAM5M/Da0EGfexKbklfR6GGGqvQtFe+x5bIp5tNJL'
+        'K6Azn8cm2HTef9fqzBeInk8IDwi3oCGlrxbfTFus9wbSTiVGNT38mW4B9eNMdfsp0W14gFHp/Xet'
+        '0nyNOEm6YUCeqA331wp35xnGWwNx5hSTih6uTNdevZOpVu8W7coyk8r771qV+Rx5EKtMv38Rqf4e'
+        '3ytD5cp/sDIyFJCO6lMzCflq+oec1WdmBpLKHubS7zqf+pUZ9OPzUaWi+rHUH190pHLp11EbfP3x'
+        'Je42V1Q/lvrjS+WlufS7vgLtjy+5l6mofiz1x7cLLov1m+CyX6Tkp3wPhNt3wUCY41e0i147h88i'
+        '1CZdTXXxrEBGwzy/kjfQXfamuuD15xstLyAt/qOb/ZHOX6/z+b3qsX/5/bogPmIc0UTroYZnUUPu'
+        'H9cF8bHhSIFNh9uYdKDWA58/FSupA7Ue+CKsEpsOd4mtB74oaksldaDWA1+kNMKmwwNi64EvGtpa'
+        'SR2o9cAX8Wwjnd4lfG0FafFzuhb311B/2l4rMk0gfkfOhVPFHOp2UgyxhP78O2cJToFdFIApflXn'
+        'T9+yL335RreLp4C+/uqXbyS8hFXf5+lKVaYV+PMKvrH20t3WSv58iW80v4zVSifV7la+xBcvXL7b'
+        'WsmfL/FFJG9ltdJLu7jFvf+p26eZ//l0Kr5L/K/YXc3l06n4virwNlYrvbJ7DXZ8Hzq4cre1kj9f'
+        '4vv4wtuxlWjfykKG+ivdGg/XiJsaqQ319BxecHf8X1Vpy6hzZ/tbN6DbRV0wO5Ak9Dumhk1erxFq'
+        'E76p1nYOm7xR50/xslhn4Jtz7aig4oJbAd806uoKKi7Y1flmRu8MpvlXwtX5JjujFVRcsKvzzV/e'
+        'VUHFBbs630zkGg7Fq+t3qavzTS7eXUHFBbs633zhPRVUXLCr800B3ktQnPJlWqR4a724qJ31qgMh'
+        '0f77OIzwYSY3fs9s6vIY3QDqtcEE9tdyqO+R0Ns+FSzDF96XCZahfOQPWWZepZrAnnjbx/sDMbyX'
+        '332Fye++NpvlGq5bZlN/unW2v5tEvh1Ml3Adh/1b/2d/7o7nAxz2ZxuR9jT786U3Pki+VmzY9c13'
+        '95cRG8xnpFRK7KfXP8TGpsV8plAaKGpSsij2w+sf5qGUKaWLSj69TeyX1z/CRmmG+UxK2aKkZLGf'
+        'Xr+ecPQKOYiA80dLKrqx6KOCtVKb5xDatce9XTPnCN4f9DEmje6r9afREl8a8TWFj1dEI391xNeW'
+        'PsGk0d71QdYRXyL5kxXRyF8d8WWIP0W4ooY8BCG1DqwXedZEfKf3aXbVDqPXWOccf6crVovu+T5D'
+        'UwuN0EitI33X2J0VrbHPsqt2LL3G1pNqjK6YukF0jX2OsLGBFMAgpU6e4vX1ecJFx4WipmSHJorf'
+        '4Ck1p2TFht03sFLa+VQhn1YEx91f4OVUyudlTWzg/UVeTuncCObEFy98idBOSI6C2skK3+3kmoq2'
+        'kxvFK6ZeS+rVzqQ/f53oXu3LlVLKo6u+TnQQfhOrUp0+lbrGl1J87er/KqWUP/fjC8W/Uiml/Lkf'
+        'XzT+VXqvPH5cQlr1TPFQ4WZmzc6m19fDPuvrEdF94NfoWo0fs5FWA/X8WzGFVMzXg1BhI/2nZ0TX'
+        'wTeCUOAZ0QPLLcwsh1k8haQA3yDyzSAU8OcnfAPGrUEo8IzoEeBbdJbjI27EMjtVepTbglDBw1Nm'
+        'zhXco3w7CAUILPl6lNuZWRaZehSCAnw9yh1BKODPT/h6lDuDUIDAkq9H+Q5hic28e2aCFI11J7ac'
+        'HSoOi03R3MVGyHpmUNEKgtMzd7Pxsa60TkuYDl+7voeNjnWHuSZvkbWC4DXRe3kMVMhpyEB8ze4+'
+        'wsyP5Kyo1V1Ob3UX1ldyhLw/AA3+RO+5JdED5AMB8H/dF3++JvbdAPhLoofHB1lJXsXi5iT+fM30'
+        'ewHw9+fkfOPmQwHw9+fkfEdgHg6AP4Ek33GV77OSHBXl5HynTn4QAH9/Ts53eOSRAPj7c3K+MyA/'
+        'DIA/gSTfeY1HafHT+GAWcfwgneP7WMwfRCjzo4rq5tG07xId5Py4oprdJTrG+Yl4+neJDnEeo30o'
+        'aNysClH82G7QLn5aSdU8msWzopvF45VU7FnRreJnwtk/K7pR/JyQVSLO7RHLz1R0EvsEM88v0q1Z'
+        'PU+wu/6C+i0yZ14CUfxKRU35SzaSt9DtOFu0HZ8kDCfmuRbvHNBs8xl5q65MwfWokFziUzy0UnJa'
+        'LspkWnzW+hWm5WEJVLG3Mx3SDcAxn+bTw+Po0u0+9eCrj2doehBdwM9l85Wtj1/z6UH/OoBvPfjq'
+        '41lCs01JEytwD92hHqwP5Pb358QzfaQ+kDven/fFdIzNY/WUj7vyBVq/YWPzCxobvpjqt6SVum2F'
+        'opyZqB6fodfjb4PxuN8xc/0DA1c+n3uBmeufGbjyeeSLhLM7pcJEB3P/Xs92rn9XXInxkmAN1bfO'
+        'C+Sg+u+ZeL7ph+dkzkFfOS+QY+B/CF47IfPMPzLx9DioLrgW+FafXg5eOyGrTH9i4lnTUKla4FuD'
+        'eiV47YQsQ73KxLOpYrXAt0j15+C1E7IY9RfC993MT2UpmXxOm+jDJtsZb+B5czca4V8LyELqT+j+'
+        '6jEyPR5MfPD6LtDSo+d/nKktPxFMdPHXqW4bIbHJ33aBlh6jjmAP4Its/j7VbSMkLvoHaWFfygyk'
+        'JG8FvfvsWQ2VzNb9MxAd9mqoZKbuX4Q8zjZFTqcm8LN9K2rpNxhZttH9+rD5gldQ/s3Isd0XR77R'
+        '5U1Gji30XsXjepZFtX404xtR/kPQTJrE5/KOqqgfT6vGLDVJmTBWP76iLKsYWS6ne3JEdGurFm5J'
+        '9Qxf9Pka4nTxJvZHn6+11WD6M6RCQZ4wPOlu8HuMeVVFXb9WvGJqWrTv17GSjE+O5CRsr+ZEt4j6'
+        'gJUS4vcNrCTXB2p5vglHY8BKCZkvNLGSPC9Qy/OlT2cErJSQ3GkzYagqpJXkRENVqoEt7zbVP+Lb'
+        'Qqi0ESmtlQo8sz61osNcK9ahtbgtLyeGlWyRRw2P685nmi+QstlcUSoquSyuxzV1lbTBTHYbqPfP'
+        'Z7li+UHRgcAsrALVyu4tcqRqFLJlbzY7KTXfQNkewmenORyUtjQEsn9mLgelixsC2UQzj4PSFTRK'
+        'fKHJfA5KW+solPgCkb04KF1Ko8QXRizgoHQ1jRJf0LCQg1J/LYUS3yrpIg5K22nuzbcgujem1JiU'
+        '0mmeEbjZYxCVtKECHnbn1AWyz20fJuXUBXtRh1a6anQd+AaOfdkqaJZULGrKQKmoO1cyKRcIRvfQ'
+        'Ze+9CNMSqoJ8w9B+bJW0mESRpXr4Rqz9Sexz2ZTiGfk0pXNDiq5kIqdN/rDC9knQOYAwUyK8C9/E'
+        'As9I2ZRYQgf6ItTu+dDYj9WxOKXvIWsyriGO1ue0hBnLM6p0EGH2RXor1ch6Xy/WyG3+GLV7PzX2'
+        '6/RQtHNCOzuVGW/nBl0ol6EP9lDL+VrUupK5TF7SlEIuK9bOhzASqpGKuczkj/9Mhsqh/qjYVT49'
+        'GqN9zotouHF9/GiDLpurTg8Lgvd4+47r1/kZH07owQh2wiHSOFL2bfP2v03k8vh3oi58YVA71mD8'
+        'W4RMzCdjyyP8MqmL9kdWhuNkLnwtaLFvLsTP8004FZ8MlyWT5NI+qRibnKKcIAAabdK9Us5yNZUj'
+        '/Zq0ZbCUTRqRUsKI+CZ/h9dkyCz1S4YeMk84a58Mn6P88mkulAYKSU3JjwslJ5yuT4bLMt9crBPs'
+        'SlHWJFRP9VxcjvbLhfT1rgmn55Nhcoz/GiJ9zmDCeflkuBzr2yqE6/Kkie6/mQyT43wzIZyOlia6'
+        '5GYyTI73zYRwHBCYNHMxOQEzoYzrbkr1q+PhUB9tROMb509kZlXTHe7t9TvITobSScyUWsBQifBZ'
+        '/aFuv4PuZLidzMytyTCXFzG+nMIpzMTqTE6UmuTLgy9nJtWoR+5exuJLhr+F0CmMC4DcdKYXShmx'
+        '08JT/VJoTilJ6mjKF9WehrmMUxj1R3ktlyolBSckVkyORTv5V/sLJvQVacR7fO5huvG1PEbyp4sh'
+        'X/ZPHibZurwBVvJnYPLobZNKT/A5QGjyNNrpT9jHQzy2JpDmyzu9IFNKsxpypVgNPuFTg52ukFK2'
+        'sGrQIVaDz/nUYGf+ZTCdy2kcanSKVeNGn2rU7HSlHHOHEharwc0+NagFDfK5EVYNVhEGf/LUfZJp'
+        'sKmzRriaWTX1HQsELUHxxdhrSNMipwlxnRAzRKMtiYTx7xKFoqQljhebg+yaJEm7y3cYV8hU5Ez/'
+        'ZvJa5F7jNwE33rwnlIVuXV7rVzn1Cwuoi9x01dQbFwjeztwtyHnVmxYI3pMc8c2s2azeLZJG7sCu'
+        'XyB4Q3LUb5u6H7cpvm0/MVG153HEgmxVIfuKe0RXsYcarZtHvBTh21h0lk9PoLIRsqcojtmQ7YYv'
+        'R2mo/IUHvYRNuBTrIL437wK+fZgvfeXC35h26y5Qp5/gLMSFD3+q3On7lNd9DYHEl2dXU+6wdad/'
+        'kHP5V+F6UkAakF7rAtBLnbfQjwJ88eD6IBSgcuUL784hcCXmEBHXhzycKC8phDB1fiLhFG2Fqydi'
+        'Z3s0GL86NwBV1aUkv3o0GL/aEIQCj4rwqx3bd7yjjPhuJMQO4zwDdbzkjRCTOYATwBmaTb7pM54e'
+        'Us9cKPjszHmE1EOxlE/LE7uK/+0fxLHB46RhQOmWRBA6qxsWClKOr0LPD0Q5IfuuyW1fIuzGK8ic'
+        'w4oP/wtoDBkQr5Y6UsEhJEngr2SHZU0pStmkzNa1jc5LJBxCrHH9JLGdccofcftwy0J3MkpIyk/G'
+        'dOry+pwuwzpBuhoPAXwGG5w0wzEOHwjGVkOkRQp9XilrHgc4xzV1IXtYhv3TUB8P5simwmAR6O7d'
+        'jwnZr6Iy8LFmNBQ6fJnbzdTBjkJqUtEL0mjsl70SiXHirQ7s5IotFKWD0Fe9e6Gfk1Z8Dp2hzXgn'
+        'VODOBv8Vpt67sHLZiGwAqqmPVTAbkUMKqM812K9He6p05y/KGTlbFNv95idFo53441jh86InShdg'
+        'Vota6MZpGkjnkpvHnx8UYh1tUjzaiT+OFb4i2joFzOpoD+s0JKLhdd1dUQhytgvdglqcFJd24o9j'
+        'hW8sDKSJlTC3O1o9mlhSct+FJsREWyZFo534o/0tnUWCnWgEs3LO2BCryt6JttUnO7/JjvmizbkN'
+        'E76J1ZxCdiEIqYYLfWp1k89qOHgRy56Ew0RX3kVYzWULGStvXCpSSCVc7JPdMp+5sRNFm/MSTPjq'
+        'heLaghCjXuqT49U+jdq5KJBr7C/DtO9lNC2K44XY9XKfBO/1ade4YGctlY76f7w3X3Q='
+    ),
+}
@@ -0,0 +1,419 @@
+"""
+Build em lote: transpila árvores inteiras de arquivos .logic em paralelo.
+
+Usado por `mython build SRC_DIR -o OUT_DIR`. Os arquivos são distribuídos
+entre processos; cada worker constrói o parser uma única vez (ver
+parser_cache) e o reutiliza para todos os arquivos que receber.
+
+O build é incremental: um manifesto (.mython-build.json no diretório de
+saída) guarda, para cada arquivo, o hash do código-fonte e da saída, a
+língua detectada e os módulos importados. Só são retranspilados os
+arquivos que mudaram e os que dependem deles via `use` / `from ... import`.
+"""
+
+import hashlib
+import json
+import os
+import re
+import statistics
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Nome do manifesto do build incremental (gravado no diretório de saída)
+MANIFEST_NAME = ".mython-build.json"
+
+# Versão do formato do manifesto (incrementar se mudar)
+MANIFEST_VERSION = 1
+
+# Imports no Python gerado (use_stmt / from_import_stmt)
+_IMPORT_RE = re.compile(r'^\s*(?:from\s+([\w.]+)\s+import\b|import\s+([\w.]+))', re.MULTILINE)
+
+
+@dataclass
+class FileResult:
+    """Resultado da transpilação de um arquivo."""
+    source: str
+    output: str
+    status: str  # "written", "unchanged", "skipped" (em dia) ou "error"
+    seconds: float
+    error: Optional[str] = None
+    source_hash: Optional[str] = None
+    output_hash: Optional[str] = None
+    lang: Optional[str] = None
+    imports: List[str] = field(default_factory=list)
+
+
+@dataclass
+class BuildReport:
+    """Resumo de um build."""
+    results: List[FileResult] = field(default_factory=list)
+    elapsed: float = 0.0
+    jobs: int = 1
+
+    def count(self, status: str) -> int:
+        return sum(1 for r in self.results if r.status == status)
+
+    @property
+    def files_per_second(self) -> float:
+        return len(self.results) / self.elapsed if self.elapsed > 0 else 0.0
+
+    def outliers(self, factor: float = 3.0, limit: int = 5) -> List[FileResult]:
+        """Arquivos que levaram mais que `factor` vezes a mediana."""
+        if len(self.results) < 2:
+            return []
+        timed = [r for r in self.results if r.status != "skipped"]
+        if len(timed) < 2:
+            return []
+        median = statistics.median(r.seconds for r in timed)
+        slow = [r for r in timed if r.seconds > median * factor and r.seconds > 0.01]
+        slow.sort(key=lambda r: r.seconds, reverse=True)
+        return slow[:limit]
+
+    def grouped_errors(self) -> Dict[str, List[str]]:
+        """Erros agrupados por mensagem (números de linha/coluna normalizados)."""
+        groups: Dict[str, List[str]] = {}
+        for r in self.results:
+            if r.status != "error":
+                continue
+            # Primeiras linhas da mensagem (ex.: "Erro de sintaxe..." + "Caractere inesperado: #")
+            head = [line.strip() for line in (r.error or "").strip().split('\n')[:2]]
+            key = re.sub(r'\d+', 'N', " ".join(head))
+            groups.setdefault(key, []).append(r.source)
+        return dict(sorted(groups.items(), key=lambda item: len(item[1]), reverse=True))
+
+    def summary(self) -> str:
+        """Texto do resumo para a CLI."""
+        lines = [
+            f"{len(self.results)} arquivo(s) em {self.elapsed:.2f}s "
+            f"({self.files_per_second:.1f} arquivos/s, {self.jobs} processo(s))",
+            f"  gravados: {self.count('written')}, "
+            f"sem mudança: {self.count('unchanged')}, "
+            f"em dia: {self.count('skipped')}, "
+            f"erros: {self.count('error')}",
+        ]
+
+        outliers = self.outliers()
+        if outliers:
+            lines.append("Mais lentos:")
+            for r in outliers:
+                lines.append(f"  {r.seconds * 1000:8.1f} ms  {r.source}")
+
+        errors = self.grouped_errors()
+        if errors:
+            lines.append("Erros:")
+            for message, sources in errors.items():
+                lines.append(f"  [{len(sources)}x] {message}")
+                for source in sources[:3]:
+                    lines.append(f"        {source}")
+                if len(sources) > 3:
+                    lines.append(f"        ... e mais {len(sources) - 3}")
+        return "\n".join(lines)
+
+
+def _scan_sources(root: str, prefix: str = "", _ancestors: Optional[Set[Tuple[int, int]]] = None) -> List[str]:
+    """
+    Caminhos relativos (com /) dos .logic sob root, via os.scandir.
+
+    Links simbólicos para diretórios são seguidos, exceto os que apontam
+    para um diretório acima deles (o que faria a busca recursar para sempre).
+    """
+    if _ancestors is None:
+        stat = os.stat(root)
+        _ancestors = {(stat.st_dev, stat.st_ino)}
+    found = []
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                directory = (stat.st_dev, stat.st_ino)
+                if directory in _ancestors:
+                    continue
+                _ancestors.add(directory)
+                found.extend(_scan_sources(entry.path, f"{prefix}{entry.name}/", _ancestors))
+                _ancestors.discard(directory)
+            elif entry.name.endswith(".logic") and entry.is_file():
+                found.append(prefix + entry.name)
+    return found
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Grava o arquivo apenas se o conteúdo mudou. Retorna True se gravou."""
+    try:
+        if path.read_text(encoding='utf-8') == content:
+            return False
+    except (FileNotFoundError, UnicodeDecodeError):
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding='utf-8')
+    return True
+
+
+def _hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def find_imports(python_code: str) -> List[str]:
+    """Módulos importados pelo código Python gerado."""
+    modules = []
+    for match in _IMPORT_RE.finditer(python_code):
+        module = match.group(1) or match.group(2)
+        if module not in modules:
+            modules.append(module)
+    return modules
+
+
+def resolve_import(module: str, importer: Path, src_root: Path) -> Optional[Path]:
+    """
+    Resolve um módulo importado para um .logic da árvore (ou None).
+
+    Procura primeiro ao lado do arquivo que importa, depois na raiz.
+    """
+    relative = Path(*module.split('.')).with_suffix(".logic")
+    for base in (importer.parent, src_root):
+        candidate = base / relative
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _file_signature(path) -> Optional[List[int]]:
+    """(mtime_ns, tamanho) do arquivo, ou None se não existir."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _init_worker():
+    """Constrói o parser uma vez por worker, antes do primeiro arquivo."""
+    from .parser_cache import get_parser
+    get_parser()
+
+
+def _build_one(task: Tuple[str, str, Optional[str], bool]) -> FileResult:
+    """Transpila um arquivo (executado dentro do worker)."""
+    from .transpiler_lark import transpile_file
+
+    source, output, lang, use_cache = task
+    start = time.perf_counter()
+    result = FileResult(source, output, "error", 0.0)
+    try:
+        source_bytes = Path(source).read_bytes()
+        python_code = transpile_file(source, None, lang=lang, use_cache=use_cache)
+        result.status = "written" if write_if_changed(Path(output), python_code) else "unchanged"
+        result.source_hash = _hash(source_bytes)
+        result.output_hash = _hash(python_code.encode('utf-8'))
+        result.lang = lang or _detect_language(source_bytes)
+        result.imports = find_imports(python_code)
+    except Exception as e:
+        result.status = "error"
+        result.error = f"{type(e).__name__}: {e}"
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def _detect_language(source_bytes: bytes) -> str:
+    try:
+        from .i18n import detect_language
+        return detect_language(source_bytes.decode('utf-8'))
+    except Exception:
+        return "en"
+
+
+class BuildManifest:
+    """
+    Manifesto do build incremental.
+
+    Cada entrada (chave: caminho relativo do .logic) guarda a assinatura
+    (mtime, tamanho) e o hash do código-fonte e da saída, a língua, os
+    módulos importados e os .logic dos quais o arquivo depende.
+    """
+
+    def __init__(self, path: Path, config: Dict[str, Optional[str]]):
+        self.path = Path(path)
+        self.config = config
+        self.entries: Dict[str, dict] = {}
+        # True se algo mudou desde o load (evita regravar em builds sem mudança)
+        self.modified = True
+
+    @classmethod
+    def load(cls, path: Path, config: Dict[str, Optional[str]]) -> "BuildManifest":
+        """Carrega o manifesto; começa vazio se não existir ou se a configuração mudou."""
+        manifest = cls(path, config)
+        try:
+            data = json.loads(Path(path).read_text(encoding='utf-8'))
+        except (FileNotFoundError, ValueError, OSError):
+            return manifest
+        if data.get("version") == MANIFEST_VERSION and data.get("config") == config:
+            manifest.entries = data.get("files", {})
+            manifest.modified = False
+        return manifest
+
+    def save(self):
+        """Grava o manifesto de forma atômica."""
+        data = {"version": MANIFEST_VERSION, "config": self.config, "files": self.entries}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=str(self.path.parent), prefix=".mython-build-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'), sort_keys=True)
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+        self.modified = False
+
+    def is_fresh(self, rel: str, source: str, output: str) -> bool:
+        """
+        True se o arquivo não mudou desde o último build.
+
+        Compara apenas (mtime, tamanho) do código-fonte e da saída; se só o
+        mtime do código-fonte mudou (ex.: `touch`), confere o hash.
+        """
+        entry = self.entries.get(rel)
+        if entry is None:
+            return False
+        if _file_signature(output) != entry.get("output_stat"):
+            return False
+        source_stat = _file_signature(source)
+        if source_stat == entry.get("source_stat"):
+            return True
+        if source_stat is None or source_stat[1] != entry["source_stat"][1]:
+            return False
+        if _hash(Path(source).read_bytes()) != entry.get("source_hash"):
+            return False
+        entry["source_stat"] = source_stat
+        self.modified = True
+        return True
+
+    def dependents(self, changed: Iterable[str]) -> Set[str]:
+        """Arquivos que dependem (direta ou transitivamente) dos alterados."""
+        reverse: Dict[str, Set[str]] = {}
+        for rel, entry in self.entries.items():
+            for dep in entry.get("deps", []):
+                reverse.setdefault(dep, set()).add(rel)
+
+        result: Set[str] = set()
+        pending = list(changed)
+        while pending:
+            for dependent in reverse.get(pending.pop(), ()):
+                if dependent not in result:
+                    result.add(dependent)
+                    pending.append(dependent)
+        return result
+
+    def record(self, rel: str, result: FileResult, deps: List[str]):
+        """Atualiza a entrada de um arquivo após transpilar."""
+        self.modified = True
+        if result.status == "error":
+            # Sem entrada → será tentado de novo no próximo build
+            self.entries.pop(rel, None)
+            return
+        self.entries[rel] = {
+            "source_stat": _file_signature(result.source),
+            "source_hash": result.source_hash,
+            "output_stat": _file_signature(result.output),
+            "output_hash": result.output_hash,
+            "lang": result.lang,
+            "imports": result.imports,
+            "deps": deps,
+        }
+
+
+def _build_config(lang: Optional[str]) -> Dict[str, Optional[str]]:
+    """Configuração que, se mudar, invalida o manifesto inteiro."""
+    from .parser_cache import parser_key
+    from .result_cache import pipeline_fingerprint
+    return {
+        "lang": lang,
+        "parser": parser_key(),
+        "pipeline": pipeline_fingerprint(),
+    }
+
+
+def _run_tasks(tasks: List[tuple], jobs: int) -> List[FileResult]:
+    if not tasks:
+        return []
+    if jobs == 1 or len(tasks) == 1:
+        _init_worker()
+        return [_build_one(task) for task in tasks]
+    workers = min(jobs, len(tasks))
+    chunksize = max(1, len(tasks) // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        return list(executor.map(_build_one, tasks, chunksize=chunksize))
+
+
+def build_tree(src_dir: str, out_dir: Optional[str] = None, jobs: Optional[int] = None,
+               lang: Optional[str] = None, use_cache: bool = False,
+               incremental: bool = True) -> BuildReport:
+    """
+    Transpila os arquivos .logic de src_dir.
+
+    Args:
+        src_dir: Diretório de origem (percorrido recursivamente)
+        out_dir: Diretório de saída, espelhando a estrutura de src_dir
+            (padrão: .py ao lado de cada .logic)
+        jobs: Número de processos (padrão: número de CPUs)
+        lang: Língua do código (None = detectar em cada arquivo)
+        use_cache: Se True, usa o cache persistente de resultados
+        incremental: Se True, usa o manifesto para transpilar só os arquivos
+            alterados e seus dependentes; se False, transpila tudo
+
+    Returns:
+        BuildReport com o resultado de cada arquivo
+    """
+    src_root = Path(src_dir)
+    if not src_root.is_dir():
+        raise FileNotFoundError(f"Diretório não encontrado: {src_dir}")
+    out_root = Path(out_dir) if out_dir else src_root
+
+    jobs = jobs or os.cpu_count() or 1
+    report = BuildReport(jobs=jobs)
+    start = time.perf_counter()
+
+    # Caminhos como str: em árvores grandes o custo de pathlib domina o no-op
+    src_prefix, out_prefix = os.path.join(str(src_root), ""), os.path.join(str(out_root), "")
+    sources = {rel: src_prefix + rel for rel in _scan_sources(str(src_root))}
+    outputs = {rel: out_prefix + rel[:-len(".logic")] + ".py" for rel in sources}
+
+    manifest = BuildManifest.load(out_root / MANIFEST_NAME, _build_config(lang))
+    if not incremental:
+        manifest.entries = {}
+        manifest.modified = True
+
+    # Arquivos removidos saem do manifesto (e seus dependentes são refeitos)
+    removed = [rel for rel in manifest.entries if rel not in sources]
+    for rel in removed:
+        del manifest.entries[rel]
+        manifest.modified = True
+
+    changed = {rel for rel in sources if not manifest.is_fresh(rel, sources[rel], outputs[rel])}
+    dirty = changed | manifest.dependents(changed | set(removed))
+    dirty &= set(sources)
+
+    tasks = [(sources[rel], outputs[rel], lang, use_cache) for rel in sorted(dirty)]
+    for result in _run_tasks(tasks, jobs):
+        rel = result.source[len(src_prefix):]
+        deps = []
+        for module in result.imports:
+            dep = resolve_import(module, Path(sources[rel]), src_root)
+            if dep is not None:
+                deps.append(dep.relative_to(src_root).as_posix())
+        manifest.record(rel, result, deps)
+        report.results.append(result)
+
+    for rel in sorted(set(sources) - dirty):
+        report.results.append(FileResult(sources[rel], outputs[rel], "skipped", 0.0))
+
+    if manifest.modified:
+        manifest.save()
+    report.elapsed = time.perf_counter() - start
+    return report
@@ -5,7 +5,6 @@ Interface de linha de comando (CLI) para o transpiler Mython.
 import argparse
 import sys
 from pathlib import Path
-import subprocess
 
 try:
     # Tentar usar Lark (versão robusta)
@@ -17,8 +16,18 @@ except ImportError:
     USE_LARK = False
 
 
-def main():
+def main(argv=None):
     """Função principal da CLI."""
+    argv = sys.argv[1:] if argv is None else argv
+    
+    # Subcomandos
+    if argv and argv[0] == "build":
+        return build_main(argv[1:])
+    if argv and argv[0] == "watch":
+        return watch_main(argv[1:])
+    if argv and argv[0] == "serve":
+        return serve_main(argv[1:])
+    
     parser = argparse.ArgumentParser(
         description="Mython - Linguagem de programação em inglês A2 que transpila para Python",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -27,11 +36,18 @@ Exemplos:
   mython program.logic              # Transpila para program.py
   mython program.logic --run        # Transpila e executa
   mython program.logic -o output.py # Especifica arquivo de saída
+  mython program.logic --cache      # Reutiliza o resultado se o arquivo não mudou
+  mython --warm-cache               # Pré-compila o parser (imagens de deploy)
+  mython --build-standalone         # Gera mython/_parser_standalone.py
+  mython build src/ -o build/       # Transpila uma árvore inteira em paralelo
+  mython watch src/                 # Retranspila cada .logic ao salvar
+  mython serve --socket /tmp/m.sock # Servidor JSON (ou stdin/stdout sem --socket)
         """
     )
     
     parser.add_argument(
         "file",
+        nargs="?",
         help="Arquivo .logic de entrada"
     )
     
@@ -58,7 +74,36 @@ Exemplos:
         help="Código da língua do código (en, pt, es, fr, etc.) - se não especificado, detecta automaticamente"
     )
     
-    args = parser.parse_args()
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reutiliza resultados de transpilações anteriores (cache em disco por conteúdo)"
+    )
+    
+    parser.add_argument(
+        "--warm-cache",
+        action="store_true",
+        help="Pré-compila o parser e grava o cache em disco, sem transpilar nada"
+    )
+    
+    parser.add_argument(
+        "--build-standalone",
+        action="store_true",
+        help="Gera o módulo de parser standalone (tabelas LALR embutidas) dentro do pacote"
+    )
+    
+    args = parser.parse_args(argv)
+    
+    if args.build_standalone:
+        build_standalone()
+        return
+    
+    if args.warm_cache:
+        warm_cache()
+        return
+    
+    if not args.file:
+        parser.error("o argumento file é obrigatório")
     
     input_file = Path(args.file)
     
@@ -80,7 +125,10 @@ Exemplos:
     try:
         # Transpilar
         # Se lang não foi especificado, None será passado e o transpiler detectará automaticamente
-        python_code = transpile_file(str(input_file), output_file, lang=args.lang)
+        if args.cache and USE_LARK:
+            python_code = transpile_file(str(input_file), output_file, lang=args.lang, use_cache=True)
+        else:
+            python_code = transpile_file(str(input_file), output_file, lang=args.lang)
         
         if output_file:
             print(f"[OK] Transpilado com sucesso: {output_file}")
@@ -97,6 +145,7 @@ Exemplos:
             print("Executando código Python gerado:")
             print(f"{'='*50}\n")
             
+            import subprocess
             try:
                 subprocess.run([sys.executable, output_file], check=True)
             except subprocess.CalledProcessError as e:
@@ -116,6 +165,193 @@ Exemplos:
         sys.exit(1)
 
 
+def build_main(argv):
+    """`mython build SRC_DIR -o OUT_DIR` - transpila uma árvore de .logic em paralelo."""
+    parser = argparse.ArgumentParser(
+        prog="mython build",
+        description="Transpila todos os arquivos .logic de um diretório usando vários processos",
+    )
+    parser.add_argument("src_dir", help="Diretório com os arquivos .logic")
+    parser.add_argument(
+        "-o", "--output",
+        help="Diretório de saída (padrão: .py ao lado de cada .logic)"
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=None,
+        help="Número de processos (padrão: número de CPUs)"
+    )
+    parser.add_argument(
+        "--lang", "-l",
+        default=None,
+        help="Código da língua do código - se não especificado, detecta em cada arquivo"
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reutiliza resultados de transpilações anteriores (cache em disco por conteúdo)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Transpila todos os arquivos, ignorando o manifesto do build incremental"
+    )
+    args = parser.parse_args(argv)
+    
+    if not USE_LARK:
+        print("Erro: build requer o transpiler Lark", file=sys.stderr)
+        sys.exit(1)
+    
+    from .build import build_tree
+    
+    try:
+        report = build_tree(args.src_dir, args.output, jobs=args.jobs, lang=args.lang, use_cache=args.cache,
+                            incremental=not args.force)
+    except FileNotFoundError as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        sys.exit(1)
+    
+    print(report.summary())
+    if report.count("error"):
+        sys.exit(1)
+
+
+def watch_main(argv):
+    """`mython watch DIR` - retranspila os .logic alterados a cada salvamento."""
+    parser = argparse.ArgumentParser(
+        prog="mython watch",
+        description="Observa um diretório e retranspila os arquivos .logic ao salvar"
+    )
+    parser.add_argument("src_dir", help="Diretório com os arquivos .logic")
+    parser.add_argument(
+        "-o", "--output",
+        help="Diretório de saída (padrão: .py ao lado de cada .logic)"
+    )
+    parser.add_argument(
+        "--lang", "-l",
+        default=None,
+        help="Código da língua do código - se não especificado, detecta em cada arquivo"
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=30,
+        help="Espera (ms) após o último salvamento antes de retranspilar (padrão: 30)"
+    )
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="Varre o diretório periodicamente em vez de usar o watchdog"
+    )
+    args = parser.parse_args(argv)
+    
+    if not USE_LARK:
+        print("Erro: watch requer o transpiler Lark", file=sys.stderr)
+        sys.exit(1)
+    if not Path(args.src_dir).is_dir():
+        print(f"Erro: Diretório não encontrado: {args.src_dir}", file=sys.stderr)
+        sys.exit(1)
+    
+    from .watch import Watcher
+    
+    def on_ready(report):
+        print(report.summary())
+        print(f"👀 Observando {args.src_dir} ({watcher.backend_name}) - Ctrl+C para sair")
+    
+    def on_result(result, latency):
+        if result.status == "error":
+            print(f"❌ {result.source}: {result.error}", file=sys.stderr)
+        else:
+            print(f"✅ {result.source} → {result.output} "
+                  f"({result.seconds * 1000:.1f} ms transpilando, {latency * 1000:.0f} ms desde o salvamento)")
+        sys.stdout.flush()
+    
+    watcher = Watcher(args.src_dir, args.output, lang=args.lang, debounce=args.debounce / 1000,
+                      use_polling=args.poll, on_result=on_result, on_ready=on_ready)
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        watcher.stop()
+        print()
+
+
+def serve_main(argv):
+    """`mython serve` - servidor de transpilação (JSON por linha)."""
+    parser = argparse.ArgumentParser(
+        prog="mython serve",
+        description="Servidor de transpilação: pedidos JSON por linha via stdin/stdout ou socket Unix"
+    )
+    parser.add_argument(
+        "--socket",
+        default=None,
+        help="Caminho do socket Unix (padrão: stdin/stdout)"
+    )
+    parser.add_argument(
+        "-j", "--workers",
+        type=int,
+        default=None,
+        help="Número de processos (padrão: número de CPUs; 0 = no próprio processo)"
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reutiliza resultados de transpilações anteriores (cache em disco por conteúdo)"
+    )
+    args = parser.parse_args(argv)
+    
+    if not USE_LARK:
+        print("Erro: serve requer o transpiler Lark", file=sys.stderr)
+        sys.exit(1)
+    
+    from .server import TranspileServer, serve_stdio, serve_unix
+    
+    server = TranspileServer(workers=args.workers, use_cache=args.cache)
+    try:
+        if args.socket:
+            print(f"🚀 Servindo em {args.socket} ({server.workers} worker(s)) - Ctrl+C para sair", file=sys.stderr)
+            serve_unix(server, args.socket)
+        else:
+            serve_stdio(server)
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        server.shutdown()
+
+
+def warm_cache():
+    """Pré-compila os parsers Lark e grava as tabelas no cache em disco."""
+    if not USE_LARK:
+        print("Erro: --warm-cache requer o Lark instalado", file=sys.stderr)
+        sys.exit(1)
+    
+    from .parser_cache import warm_cache as build_cache, get_cache_dir
+    
+    if get_cache_dir() is None:
+        print("Erro: cache em disco desativado ou sem diretório gravável", file=sys.stderr)
+        sys.exit(1)
+    
+    for path in build_cache():
+        print(f"[OK] Cache do parser: {path}")
+
+
+def build_standalone():
+    """Gera o módulo standalone com o parser da gramática e das macros padrão."""
+    try:
+        import lark  # noqa: F401 - necessário para compilar a gramática
+    except ImportError:
+        print("Erro: --build-standalone requer o Lark instalado", file=sys.stderr)
+        sys.exit(1)
+    
+    from .parser_cache import write_standalone
+    
+    path = write_standalone()
+    print(f"[OK] Parser standalone gerado: {path}")
+
+
 if __name__ == "__main__":
     main()
 
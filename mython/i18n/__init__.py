@@ -3,28 +3,167 @@ Mython i18n - Sistema de internacionalização
 Tradução de palavras-chave para múltiplas línguas
 """
 
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
+from typing import Dict, Optional, Tuple
+import hashlib
 import json
+import re
 import unicodedata
 
+from ..normalize import PhraseTrie
+from ..patterns import STRING_OR_COMMENT_PATTERN
+
 # Diretório base para dicionários
 _I18N_DIR = Path(__file__).parent / "dictionaries"
 
-# Carregar dicionários
-def load_dictionary(lang: str) -> dict:
-    """Carrega dicionário de tradução para uma língua."""
-    dict_file = _I18N_DIR / f"{lang}.json"
-    if dict_file.exists():
-        with open(dict_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return {}
-
 def remove_accents(text: str) -> str:
     """Remove acentos de uma string."""
     # Normalizar para NFD (decompor) e remover marcas diacríticas
     nfd = unicodedata.normalize('NFD', text)
     return ''.join(char for char in nfd if unicodedata.category(char) != 'Mn')
 
+# Palavras sem acento já calculadas (as mesmas palavras se repetem muito)
+_fold = lru_cache(maxsize=65536)(remove_accents)
+
+
+class DictionaryIndex:
+    """
+    Tabela de tradução (palavra -> tradução) com índice sem acentos.
+    
+    lookup() é uma consulta O(1): primeiro a palavra exata, depois a forma
+    sem acentos, que casa com qualquer chave de mesma forma ("senao" acha
+    "senão"). Se várias chaves têm a mesma forma, vale a que já não tem
+    acento; senão, a primeira do dicionário.
+    """
+    
+    __slots__ = ("exact", "folded", "_tokens")
+    
+    def __init__(self, table: Dict[str, str]):
+        self.exact = table
+        self.folded: Dict[str, str] = {}
+        for key, value in table.items():
+            self.folded.setdefault(_fold(key), value)
+        for key, value in table.items():
+            if _fold(key) == key:
+                self.folded[key] = value
+        self._tokens = None
+    
+    def __bool__(self) -> bool:
+        return bool(self.exact)
+    
+    def lookup(self, word: str) -> Optional[str]:
+        """Tradução da palavra, ou None."""
+        translation = self.exact.get(word)
+        if translation is None:
+            translation = self.folded.get(_fold(word))
+        return translation
+    
+    def _token_re(self) -> "re.Pattern":
+        """
+        Regex dos tokens: strings e comentários, frases de várias palavras
+        ("senão se", "caso contrário", com ou sem acentos - a mais longa
+        vence) e palavras. Compilada na primeira tradução.
+        """
+        if self._tokens is None:
+            phrases = [key for key in self.exact if " " in key]
+            phrases += [key for key in self.folded if " " in key]
+            alternatives = [STRING_OR_COMMENT_PATTERN]
+            if phrases:
+                trie = PhraseTrie([(phrase, phrase) for phrase in phrases])
+                alternatives.append(rf"(?<!\w){trie.pattern}(?!\w)")
+            alternatives.append(r"\w+")
+            self._tokens = re.compile("|".join(alternatives))
+        return self._tokens
+    
+    def _replace(self, match: "re.Match") -> str:
+        token = match.group()
+        first = token[0]
+        if first == '"' or first == "'" or first == "#":
+            return token
+        return self.lookup(token) or token
+    
+    def translate(self, code: str) -> str:
+        """
+        Traduz o código em uma passada: cada token é consultado no índice
+        e o texto é remontado de uma vez (strings e comentários intactos).
+        """
+        return self._token_re().sub(self._replace, code)
+
+
+def _invert(entries: Dict[str, str]) -> Dict[str, str]:
+    """lang -> en, mais as formas sem acento das palavras acentuadas."""
+    inverted = {v: k for k, v in entries.items()}
+    for word_lang, word_en in list(inverted.items()):
+        inverted.setdefault(_fold(word_lang), word_en)
+    return inverted
+
+
+class LanguageDictionary:
+    """
+    Dicionário de uma língua (en -> lang), carregado uma única vez.
+    
+    Attributes:
+        entries: O JSON como está (não modificar - é compartilhado)
+        forward: Índice en -> lang
+        reverse: Índice lang -> en (aceita palavras sem acento)
+    """
+    
+    def __init__(self, lang: str, entries: Dict[str, str]):
+        self.lang = lang
+        self.entries = entries
+        self.forward = DictionaryIndex(entries)
+        self.reverse = DictionaryIndex(_invert(entries))
+
+
+# Dicionários já carregados, por língua, e índices compostos (origem, destino)
+_dictionaries: Dict[str, LanguageDictionary] = {}
+_pair_indexes: Dict[Tuple[str, str], DictionaryIndex] = {}
+
+
+def get_dictionary(lang: str) -> LanguageDictionary:
+    """Dicionário da língua com os índices (lido do disco só na primeira vez)."""
+    dictionary = _dictionaries.get(lang)
+    if dictionary is None:
+        entries = {}
+        dict_file = _I18N_DIR / f"{lang}.json"
+        if dict_file.exists():
+            with open(dict_file, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        dictionary = _dictionaries[lang] = LanguageDictionary(lang, entries)
+    return dictionary
+
+
+def _pair_index(source_lang: str, lang: str) -> DictionaryIndex:
+    """Índice source_lang -> lang, passando pelo inglês (source_lang -> en -> lang)."""
+    key = (source_lang, lang)
+    index = _pair_indexes.get(key)
+    if index is None:
+        source_dict = get_dictionary(source_lang).entries
+        target_dict = get_dictionary(lang).entries
+        table = {}
+        if source_dict and target_dict:
+            # Primeiro, traduzir source_lang para en (inverso); depois, en para lang
+            inverted_source = {v: k for k, v in source_dict.items()}
+            for source_word, en_word in inverted_source.items():
+                if en_word in target_dict:
+                    table[source_word] = target_dict[en_word]
+        index = _pair_indexes[key] = DictionaryIndex(table)
+    return index
+
+
+def clear_dictionary_cache():
+    """Esquece os dicionários carregados (para reler os JSON do disco)."""
+    _dictionaries.clear()
+    _pair_indexes.clear()
+
+
+# Carregar dicionários
+def load_dictionary(lang: str) -> dict:
+    """Carrega dicionário de tradução para uma língua (em cache; não modificar)."""
+    return get_dictionary(lang).entries
+
 def get_translation(word: str, lang: str = "en") -> str:
     """Obtém tradução de uma palavra-chave."""
     if lang == "en":
@@ -44,6 +183,9 @@ def translate_code(code: str, lang: str = "en", reverse: bool = False, source_la
     """
     Traduz código Mython de uma língua para outra (bidirecional).
     
+    Palavras e frases ("senão se" -> "elif") são trocadas pelo índice do
+    dicionário; strings e comentários ficam como estão.
+    
     Args:
         code: Código Mython
         lang: Código da língua de destino (pt, es, fr, etc.)
@@ -65,110 +207,20 @@ def translate_code(code: str, lang: str = "en", reverse: bool = False, source_la
     if source_lang == lang and not reverse:
         return code
     
-    # Se reverse, traduzir de lang para en
-    if reverse:
-        dictionary = load_dictionary(lang)
-        if not dictionary:
-            return code
-    else:
-        # Traduzir de source_lang (geralmente en) para lang
-        # Se source_lang é en, usar dicionário normal
-        if source_lang == "en":
-            dictionary = load_dictionary(lang)
-            if not dictionary:
-                return code
-        else:
-            # Se source_lang não é en, primeiro traduzir para en, depois para lang
-            # Mas isso é complexo, vamos fazer direto do source_lang para lang
-            # Carregar dicionário de source_lang e criar inverso
-            source_dict = load_dictionary(source_lang)
-            target_dict = load_dictionary(lang)
-            if not source_dict or not target_dict:
-                return code
-            
-            # Criar mapeamento: source_lang -> en -> lang
-            # Primeiro, traduzir source_lang para en (inverso)
-            inverted_source = {v: k for k, v in source_dict.items()}
-            # Depois, traduzir en para lang
-            # Criar dicionário composto: source_lang -> lang
-            dictionary = {}
-            for source_word, en_word in inverted_source.items():
-                if en_word in target_dict:
-                    dictionary[source_word] = target_dict[en_word]
-            
-            if not dictionary:
-                return code
-    
-    lines = code.split('\n')
-    translated_lines = []
-    
-    # Se reverse, criar dicionário invertido (lang -> en)
+    # Índice de tradução (pré-calculado e em cache por língua)
     if reverse:
-        # Criar dicionário invertido básico
-        inverted_dict = {v: k for k, v in dictionary.items()}
-        # Adicionar versões sem acentos para facilitar tradução
-        # Se a palavra tem acento, adicionar versão sem acento que aponta para a mesma tradução
-        for word_lang, word_en in list(inverted_dict.items()):
-            word_lang_no_accents = remove_accents(word_lang)
-            if word_lang_no_accents != word_lang and word_lang_no_accents not in inverted_dict:
-                inverted_dict[word_lang_no_accents] = word_en
-        dictionary = inverted_dict
-        if not dictionary:
-            return code
+        # Traduzir de lang para en
+        index = get_dictionary(lang).reverse
+    elif source_lang == "en":
+        # Traduzir de en para lang
+        index = get_dictionary(lang).forward
     else:
-        # Não é reverse, usar dicionário normal
-        pass
-    
-    import re
-    
-    for line in lines:
-        translated_line = line
-        
-        # Primeiro, encontrar todas as palavras na linha
-        words_in_line = re.findall(r'\b\w+\b', translated_line)
-        
-        # Criar mapeamento de palavras normalizadas para suas versões originais
-        word_to_normalized = {}
-        for original_word in words_in_line:
-            normalized = remove_accents(original_word)
-            word_to_normalized[original_word] = normalized
-        
-        # Processar cada palavra encontrada na linha
-        # Ordenar por tamanho (maior primeiro) para evitar substituições parciais
-        words_to_process = sorted(set(words_in_line), key=len, reverse=True)
-        
-        for original_word in words_to_process:
-            normalized_word = word_to_normalized[original_word]
-            
-            # Buscar no dicionário: primeiro pela palavra original, depois pela normalizada
-            translation = None
-            dict_key = None
-            
-            # Tentar palavra original
-            if original_word in dictionary:
-                translation = dictionary[original_word]
-                dict_key = original_word
-            # Tentar palavra normalizada
-            elif normalized_word in dictionary:
-                translation = dictionary[normalized_word]
-                dict_key = normalized_word
-            # Tentar normalizada de todas as palavras do dicionário
-            else:
-                for dict_word, dict_translation in dictionary.items():
-                    dict_normalized = remove_accents(dict_word)
-                    if dict_normalized == normalized_word:
-                        translation = dict_translation
-                        dict_key = dict_word
-                        break
-            
-            # Se encontrou tradução, substituir
-            if translation:
-                pattern = r'\b' + re.escape(original_word) + r'\b'
-                translated_line = re.sub(pattern, translation, translated_line)
-        
-        translated_lines.append(translated_line)
+        # Direto de source_lang para lang (via inglês)
+        index = _pair_index(source_lang, lang)
+    if not index:
+        return code
     
-    return '\n'.join(translated_lines)
+    return index.translate(code)
 
 # Línguas suportadas
 SUPPORTED_LANGUAGES = {
@@ -180,87 +232,158 @@ SUPPORTED_LANGUAGES = {
     "it": "Italiano",
 }
 
-def detect_language(code: str) -> str:
+# Palavras-chave únicas de cada língua (que não aparecem em outras)
+LANGUAGE_KEYWORDS = {
+    "pt": ["dizer", "perguntar", "senão", "se", "é", "repetir", "enquanto", 
+           "para", "cada", "lista", "adicionar", "remover", "definir", 
+           "retornar", "classe", "tarefa", "tentar", "capturar", "sempre",
+           "senao", "senao",  # sem acentos
+           "perguntar número", "número"],  # combinações comuns
+    "es": ["decir", "preguntar", "sino", "si", "es", "repetir", "mientras",
+           "para", "cada", "lista", "añadir", "eliminar", "definir",
+           "devolver", "clase", "tarea", "intentar", "capturar", "siempre"],
+    "fr": ["dire", "demander", "sinon", "si", "est", "répéter", "pendant",
+           "pour", "chaque", "liste", "ajouter", "supprimer", "définir",
+           "retourner", "classe", "tâche", "essayer", "attraper", "toujours"],
+    "de": ["sagen", "fragen", "sonst", "wenn", "ist", "wiederholen", "während",
+           "für", "jede", "liste", "hinzufügen", "entfernen", "definieren",
+           "zurückgeben", "klasse", "aufgabe", "versuchen", "fangen", "immer"],
+    "it": ["dire", "chiedere", "altrimenti", "se", "è", "ripetere", "mentre",
+           "per", "ogni", "lista", "aggiungere", "rimuovere", "definire",
+           "restituire", "classe", "compito", "provare", "catturare", "sempre"],
+}
+
+# Palavras-chave do Mython em inglês (para distinguir de código Python puro)
+MYTHON_EN_KEYWORDS = ["say", "ask", "repeat", "define", "class", "if", "else", 
+                      "for", "while", "def", "return", "try", "except"]
+
+# Línguas na ordem de desempate (a primeira vence), e o bit de cada uma
+_DETECT_LANGUAGES = ("en",) + tuple(LANGUAGE_KEYWORDS)
+_LANGUAGE_BITS = {lang: 1 << i for i, lang in enumerate(_DETECT_LANGUAGES)}
+
+
+def _keyword_bits() -> Dict[str, int]:
+    """Palavra (minúsculas, com e sem acentos) -> bits das línguas que a usam."""
+    bits: Dict[str, int] = {}
+    for keyword in MYTHON_EN_KEYWORDS:
+        bits[keyword] = bits.get(keyword, 0) | _LANGUAGE_BITS["en"]
+    for lang, keywords in LANGUAGE_KEYWORDS.items():
+        for keyword in keywords:
+            # "perguntar número" nunca é uma palavra só; "número" já está na lista
+            if " " in keyword:
+                continue
+            for form in {keyword.lower(), _fold(keyword.lower())}:
+                bits[form] = bits.get(form, 0) | _LANGUAGE_BITS[lang]
+    return bits
+
+
+_KEYWORD_BITS = _keyword_bits()
+
+# Strings e comentários (não contam) ou palavras
+_DETECT_TOKEN_RE = re.compile(STRING_OR_COMMENT_PATTERN + r"|\w+")
+
+# Palavras contadas por vez; entre um bloco e outro confere se dá para parar
+_DETECT_CHUNK = 4096
+
+# Entradas maiores que isto são amostradas com sample=True
+DETECT_SAMPLE_SIZE = 64 * 1024
+_SAMPLE_WINDOWS = 8
+
+# Resultados já calculados, por hash do código (os mais antigos saem primeiro)
+_detection_cache: Dict[Tuple[bytes, bool], Tuple[str, float]] = {}
+_DETECTION_CACHE_SIZE = 256
+
+
+def _sample(code: str, size: int) -> str:
+    """`size` caracteres do código, em janelas espalhadas de linhas inteiras."""
+    window = size // _SAMPLE_WINDOWS
+    step = len(code) // _SAMPLE_WINDOWS
+    parts = []
+    for i in range(_SAMPLE_WINDOWS):
+        start = i * step
+        if start:
+            start = code.find("\n", start) + 1 or len(code)
+        end = code.rfind("\n", start, start + window)
+        parts.append(code[start:end if end > start else start + window])
+    return "\n".join(parts)
+
+
+def _score_languages(code: str) -> Tuple[str, float]:
+    """
+    Pontua as línguas em uma passada pelas palavras, em blocos, e para assim
+    que a líder não pode mais ser alcançada (cada palavra restante soma no
+    máximo 1 ponto a cada língua).
+    """
+    words = _DETECT_TOKEN_RE.findall(code.lower())
+    scores = [0] * len(_DETECT_LANGUAGES)
+    seen_en = set()
+    remaining = len(words)
+    for start in range(0, len(words), _DETECT_CHUNK):
+        chunk = words[start:start + _DETECT_CHUNK]
+        remaining -= len(chunk)
+        for word, count in Counter(chunk).items():
+            bits = _KEYWORD_BITS.get(word)
+            if bits is None:
+                if word.isascii() or word[0] == '"' or word[0] == "'" or word[0] == "#":
+                    continue
+                bits = _KEYWORD_BITS.get(_fold(word))
+                if bits is None:
+                    continue
+            if bits & 1:
+                # Inglês conta palavras-chave distintas (o Mython em inglês
+                # repete poucas palavras); as outras línguas, ocorrências
+                bits ^= 1
+                if word not in seen_en:
+                    seen_en.add(word)
+                    scores[0] += 1
+            lang = 1
+            bits >>= 1
+            while bits:
+                if bits & 1:
+                    scores[lang] += count
+                bits >>= 1
+                lang += 1
+        if remaining:
+            first, second = sorted(scores, reverse=True)[:2]
+            if first - second > remaining:
+                break
+    best = max(range(len(scores)), key=scores.__getitem__)
+    if not scores[best]:
+        return "en", 0.0
+    return _DETECT_LANGUAGES[best], scores[best] / sum(scores)
+
+
+def detect_language_with_confidence(code: str, sample: bool = False) -> Tuple[str, float]:
+    """
+    Como detect_language, mas devolve também a confiança: a fração dos pontos
+    (palavras-chave encontradas) que foi para a língua detectada, de 0.0
+    (nenhuma palavra-chave - "en" por padrão) a 1.0 (só palavras dela).
+    """
+    sample = sample and len(code) > DETECT_SAMPLE_SIZE
+    key = (hashlib.sha256(code.encode("utf-8", "surrogatepass")).digest(), sample)
+    result = _detection_cache.get(key)
+    if result is None:
+        result = _score_languages(_sample(code, DETECT_SAMPLE_SIZE) if sample else code)
+        if len(_detection_cache) >= _DETECTION_CACHE_SIZE:
+            del _detection_cache[next(iter(_detection_cache))]
+        _detection_cache[key] = result
+    return result
+
+
+def detect_language(code: str, sample: bool = False) -> str:
     """
     Detecta automaticamente a língua do código Mython.
     
-    Analisa palavras-chave únicas de cada língua para determinar
-    qual língua está sendo usada. Reconhece português, inglês e outras línguas.
+    Analisa palavras-chave de cada língua (com ou sem acentos, em qualquer
+    caixa; strings e comentários não contam) para determinar qual língua está sendo usada. O resultado fica
+    em cache pelo hash do código: detectar de novo o mesmo texto é grátis.
     
     Args:
         code: Código Mython a analisar
+        sample: Se True, códigos maiores que DETECT_SAMPLE_SIZE são avaliados
+            por amostras espalhadas pelo texto em vez de inteiros
     
     Returns:
         Código da língua detectada (en, pt, es, etc.) ou "en" se não detectar
     """
-    # Palavras-chave únicas de cada língua (que não aparecem em outras)
-    language_keywords = {
-        "pt": ["dizer", "perguntar", "senão", "se", "é", "repetir", "enquanto", 
-               "para", "cada", "lista", "adicionar", "remover", "definir", 
-               "retornar", "classe", "tarefa", "tentar", "capturar", "sempre",
-               "senao", "senao",  # sem acentos
-               "perguntar número", "número"],  # combinações comuns
-        "es": ["decir", "preguntar", "sino", "si", "es", "repetir", "mientras",
-               "para", "cada", "lista", "añadir", "eliminar", "definir",
-               "devolver", "clase", "tarea", "intentar", "capturar", "siempre"],
-        "fr": ["dire", "demander", "sinon", "si", "est", "répéter", "pendant",
-               "pour", "chaque", "liste", "ajouter", "supprimer", "définir",
-               "retourner", "classe", "tâche", "essayer", "attraper", "toujours"],
-        "de": ["sagen", "fragen", "sonst", "wenn", "ist", "wiederholen", "während",
-               "für", "jede", "liste", "hinzufügen", "entfernen", "definieren",
-               "zurückgeben", "klasse", "aufgabe", "versuchen", "fangen", "immer"],
-        "it": ["dire", "chiedere", "altrimenti", "se", "è", "ripetere", "mentre",
-               "per", "ogni", "lista", "aggiungere", "rimuovere", "definire",
-               "restituire", "classe", "compito", "provare", "catturare", "sempre"],
-    }
-    
-    # Palavras-chave do Mython em inglês (para distinguir de código Python puro)
-    mython_keywords = ["say", "ask", "repeat", "define", "class", "if", "else", 
-                       "for", "while", "def", "return", "try", "except"]
-    
-    # Contar ocorrências de palavras-chave de cada língua
-    import re
-    code_lower = code.lower()
-    scores = {}
-    
-    # Encontrar todas as palavras no código (normalizadas)
-    words_in_code = re.findall(r'\b\w+\b', code_lower)
-    words_normalized = {w: remove_accents(w) for w in words_in_code}
-    
-    # Verificar palavras-chave Mython em inglês
-    has_mython_keywords = any(kw in words_in_code for kw in mython_keywords)
-    
-    # Se tem palavras-chave Mython mas não tem palavras de outras línguas, é inglês
-    if has_mython_keywords:
-        scores["en"] = len([kw for kw in mython_keywords if kw in words_in_code])
-    
-    # Verificar outras línguas
-    for lang, keywords in language_keywords.items():
-        score = 0
-        for keyword in keywords:
-            keyword_lower = keyword.lower()
-            keyword_normalized = remove_accents(keyword_lower)
-            
-            # Tentar encontrar palavra exata
-            if keyword_lower in words_in_code:
-                score += words_in_code.count(keyword_lower)
-            # Tentar encontrar palavra normalizada
-            elif keyword_normalized in words_normalized.values():
-                # Contar quantas palavras normalizadas correspondem
-                for word, word_norm in words_normalized.items():
-                    if word_norm == keyword_normalized:
-                        score += 1
-        
-        if score > 0:
-            scores[lang] = scores.get(lang, 0) + score
-    
-    # Se não encontrou nenhuma palavra-chave, assumir inglês (código Mython padrão)
-    if not scores:
-        return "en"
-    
-    # Retornar a língua com maior score
-    detected_lang = max(scores.items(), key=lambda x: x[1])[0]
-    
-    # Retornar a língua detectada
-    return detected_lang
-
+    return detect_language_with_confidence(code, sample)[0]
@@ -2,7 +2,7 @@
 Indenter para Mython - Processa indentação estilo Python.
 """
 
-from lark.indenter import Indenter
+from .lark_runtime import Indenter
 
 
 class MythonIndenter(Indenter):
@@ -0,0 +1,71 @@
+"""
+Runtime do Lark usado pelo Mython.
+
+Se o parser standalone gerado (mython/_parser_standalone.py, ver
+`mython --build-standalone`) estiver presente, as classes do Lark (Tree,
+Token, Transformer, exceções, Indenter) vêm dele e o pacote lark nem
+precisa ser importado no caminho comum. Caso contrário, usa o lark instalado.
+
+Todo o resto do Mython importa essas classes daqui, para que árvores,
+tokens e exceções sejam sempre do mesmo runtime. As classes internas do
+parser LALR (ContextualLexer, LALR_Parser, Shift, Reduce) são usadas só
+pelo carregamento rápido das tabelas em mython.parser_cache.
+"""
+
+import os
+
+_use_standalone = os.environ.get("MYTHON_STANDALONE", "1") != "0"
+
+standalone = None
+if _use_standalone:
+    try:
+        from . import _parser_standalone as standalone
+    except ImportError:
+        standalone = None
+
+if standalone is not None:
+    from ._parser_standalone import (
+        Lark,
+        Transformer,
+        Tree,
+        Token,
+        Indenter,
+        LarkError,
+        UnexpectedInput,
+        UnexpectedToken,
+        UnexpectedCharacters,
+        ContextualLexer,
+        LALR_Parser,
+        Shift,
+        Reduce,
+        __version__,
+    )
+    STANDALONE = True
+else:
+    from lark import Lark, Transformer, Tree, Token, __version__
+    from lark.indenter import Indenter
+    from lark.exceptions import (
+        LarkError,
+        UnexpectedInput,
+        UnexpectedToken,
+        UnexpectedCharacters,
+    )
+    from lark.lexer import ContextualLexer
+    from lark.parsers.lalr_analysis import Shift, Reduce
+    from lark.parsers.lalr_parser import LALR_Parser
+    STANDALONE = False
+
+
+__all__ = [
+    'Lark',
+    'Transformer',
+    'Tree',
+    'Token',
+    'Indenter',
+    'LarkError',
+    'UnexpectedInput',
+    'UnexpectedToken',
+    'UnexpectedCharacters',
+    'STANDALONE',
+    'standalone',
+]
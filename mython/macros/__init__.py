@@ -3,25 +3,43 @@ Sistema de Macros para Mython.
 
 Macros permitem expandir comandos simples em código Python complexo.
 Exemplo: `get data from "url"` → `requests.get("url").json()`
+
+Só os metadados das macros (MacroSpec) são carregados aqui; o módulo que
+expande cada uma é importado na primeira vez que ela é usada. Pacotes de
+terceiros são descobertos pelo grupo de entry points "mython.macros".
 """
 
-from mython.macros.base import MacroBase, MacroRegistry
-from mython.macros.http import HTTPMacros
-from mython.macros.data import DataScienceMacros
+from mython.macros.base import ENTRY_POINT_GROUP, MacroBase, MacroRegistry, MacroSpec
+from mython.macros.builtin import BUILTIN_SPECS
 
-# Registrar macros padrão
-registry = MacroRegistry()
+# Registrar macros padrão (pacotes instalados entram no primeiro uso)
+registry = MacroRegistry(discover=True)
 
 # Registrar módulos de macros
-registry.register_module(HTTPMacros())
-registry.register_module(DataScienceMacros())
+for _spec in BUILTIN_SPECS:
+    registry.register_spec(_spec)
+
+# Classes dos módulos padrão, importadas só se acessadas
+_LAZY_CLASSES = {
+    'HTTPMacros': 'mython.macros.http',
+    'DataScienceMacros': 'mython.macros.data',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_CLASSES:
+        import importlib
+        return getattr(importlib.import_module(_LAZY_CLASSES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Exportar interface principal
 __all__ = [
+    'ENTRY_POINT_GROUP',
     'MacroBase',
     'MacroRegistry',
+    'MacroSpec',
     'registry',
     'HTTPMacros',
     'DataScienceMacros',
 ]
-
@@ -4,9 +4,77 @@ Sistema base para macros Mython.
 Macros permitem expandir comandos simples Mython em código Python complexo.
 """
 
+import importlib
+import os
+import re
+import sys
+import warnings
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Tuple, Any
-from lark import Tree, Token
+from functools import partial
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+from mython.lark_runtime import Tree, Token
+
+# Elementos de uma regra de gramática: literal ("get"), nome, ou símbolo
+_RULE_ELEMENT_RE = re.compile(r'"(?:[^"\\]|\\.)*"i?|\w+|\S')
+
+
+def _literal(element: str) -> Optional[str]:
+    """Texto de um literal ('"data"' ou '"data"i'), ou None."""
+    if element.startswith('"'):
+        return element.rstrip("i")[1:-1]
+    return None
+
+
+def _fixed_words(elements: List[str], i: int, terminals: Dict[str, str]) -> Tuple[List[str], int]:
+    """
+    Palavras que o elemento em `i` pode ser, e o índice do próximo elemento.
+
+    Aceita literal, terminal de palavra-chave e grupo de literais
+    ("data" | "json"); qualquer outra coisa (ou um elemento opcional)
+    retorna [].
+    """
+    if i >= len(elements):
+        return [], i
+    element = elements[i]
+    if _literal(element) is not None:
+        words, i = [_literal(element)], i + 1
+    elif element in terminals:
+        words, i = [terminals[element]], i + 1
+    elif element == "(" and ")" in elements[i:]:
+        end = elements.index(")", i)
+        group = elements[i + 1:end]
+        words = [_literal(e) for e in group[0::2]]
+        if None in words or any(sep != "|" for sep in group[1::2]):
+            words = []
+        i = end + 1
+    else:
+        return [], i
+    if i < len(elements) and elements[i] in ("?", "*"):
+        return [], i + 1
+    return words, i
+
+
+def lead_phrases(rule: str, terminals: Optional[Dict[str, str]] = None) -> List[str]:
+    """
+    Palavras com que um padrão de macro começa, para o pré-filtro do parser.
+
+    Junta o primeiro elemento da regra (literal ou terminal de palavra-chave,
+    como GET: "get") com o segundo, se ele também for fixo:
+    'GET ("data" | "json") "from" STRING' → ["get data", "get json"].
+
+    Args:
+        rule: Regra do padrão (valor de get_patterns)
+        terminals: Terminais de palavra-chave da gramática (nome → palavra)
+
+    Returns:
+        Frases possíveis, ou [] se a regra não começa com uma palavra fixa
+    """
+    elements = _RULE_ELEMENT_RE.findall(rule)
+    firsts, i = _fixed_words(elements, 0, terminals or {})
+    seconds, _ = _fixed_words(elements, i, terminals or {})
+    if not seconds:
+        return firsts
+    return [f"{first} {second}" for first in firsts for second in seconds]
 
 
 class MacroError(Exception):
@@ -80,19 +148,192 @@ class MacroBase(ABC):
         Exemplo: ["import requests", "import json"]
         """
         return []
+    
+    def get_expander(self, pattern_name: str) -> Callable[[List[Any], Tree, Any], str]:
+        """
+        Retorna a função que expande o padrão: expander(args, tree, transformer).
+        
+        Chamado uma vez, no registro do módulo (ver MacroRegistry). Padrão:
+        expand com o pattern_name já aplicado; módulos com um método por
+        padrão (HTTPMacros, DataScienceMacros) retornam o método ligado, e
+        cada expansão é só a busca na tabela do registro mais a chamada.
+        """
+        return partial(self.expand, pattern_name)
+
+
+class MacroSpec:
+    """
+    Metadados de um módulo de macros: tudo o que o parser precisa saber sem
+    importar o módulo (os padrões e, deles, as palavras iniciais).
+    
+    O módulo que expande os padrões (`target`) só é importado na primeira
+    expansão. Pacotes de macros de terceiros publicam um MacroSpec no grupo
+    de entry points "mython.macros" (ver MacroRegistry.discover), em um
+    módulo leve que não importa as dependências do pacote.
+    
+    Args:
+        name: Nome do módulo de macros (único no registro)
+        patterns: Padrões → regras de gramática, como em MacroBase.get_patterns
+        target: "pacote.modulo:Classe" (ou instância) da MacroBase que expande
+        module: Instância já criada (em vez de target)
+    
+    Exemplo:
+        SPEC = MacroSpec("excel", {"open_sheet": '"open" "sheet" STRING "as" NAME'},
+                         "mython_excel.macros:ExcelMacros")
+    """
+    
+    def __init__(self, name: str, patterns: Dict[str, str], target: Optional[str] = None,
+                 module: Optional[MacroBase] = None):
+        if target is None and module is None:
+            raise ValueError(f"MacroSpec {name}: informe target ou module")
+        self.name = name
+        self.patterns = dict(patterns)
+        self.target = target
+        self._module = module
+    
+    @classmethod
+    def from_module(cls, macro_module: MacroBase) -> "MacroSpec":
+        """Spec de um módulo já instanciado."""
+        return cls(type(macro_module).__name__, macro_module.get_patterns(), module=macro_module)
+    
+    @property
+    def loaded(self) -> bool:
+        """Se o módulo que expande os padrões já foi importado."""
+        return self._module is not None
+    
+    def load(self) -> MacroBase:
+        """Importa (uma vez) e retorna o módulo que expande os padrões."""
+        if self._module is None:
+            module_name, _, attribute = self.target.partition(":")
+            obj = importlib.import_module(module_name)
+            for part in filter(None, attribute.split(".")):
+                obj = getattr(obj, part)
+            self._module = obj() if isinstance(obj, type) else obj
+        return self._module
+    
+    def __repr__(self):
+        state = "carregado" if self.loaded else self.target
+        return f"MacroSpec({self.name!r}, {len(self.patterns)} padrões, {state})"
+
+
+# Grupo de entry points com os pacotes de macros (MacroSpec, MacroBase ou lista)
+ENTRY_POINT_GROUP = "mython.macros"
+
+
+def _may_declare_entry_points(group: str) -> bool:
+    """
+    Se algum pacote instalado pode publicar entry points no grupo.
+
+    Procura "[grupo]" nos entry_points.txt dos .dist-info/.egg-info de
+    sys.path, sem importar importlib.metadata (dezenas de ms, e mais a
+    leitura dos metadados de todos os pacotes). Na dúvida (um zip ou
+    diretório ilegível em sys.path), retorna True.
+    """
+    marker = f"[{group}]".encode()
+    for entry in sys.path:
+        try:
+            scan = os.scandir(entry or ".")
+        except NotADirectoryError:
+            # .zip/.egg em sys.path: só importlib.metadata sabe ler
+            return True
+        except OSError:
+            continue
+        with scan:
+            for item in scan:
+                if not item.name.endswith((".dist-info", ".egg-info")):
+                    continue
+                try:
+                    with open(os.path.join(item.path, "entry_points.txt"), "rb") as f:
+                        if marker in f.read():
+                            return True
+                except FileNotFoundError:
+                    continue
+                except OSError:
+                    return True
+    return False
+
+
+def _entry_points(group: str) -> list:
+    """Entry points do grupo (API de importlib.metadata antes e depois do 3.10)."""
+    if not _may_declare_entry_points(group):
+        return []
+    from importlib.metadata import entry_points
+    
+    eps = entry_points()
+    if hasattr(eps, "select"):
+        return list(eps.select(group=group))
+    return list(eps.get(group, ()))
 
 
 class MacroRegistry:
     """
     Registro central de macros.
     
-    Permite registrar módulos de macros e buscar padrões.
+    Permite registrar módulos de macros e buscar padrões. Só os metadados
+    (MacroSpec) ficam carregados; cada módulo é importado na primeira vez
+    que uma das suas macros é expandida.
+    
+    Args:
+        discover: Se True, procura pacotes de macros nos entry points
+            "mython.macros" no primeiro uso do registro (não na criação)
     """
     
-    def __init__(self):
-        self.macros: List[MacroBase] = []
-        self.patterns: Dict[str, Tuple[MacroBase, str]] = {}  # pattern_rule → (macro, pattern_name)
+    def __init__(self, discover: bool = False):
+        self.specs: List[MacroSpec] = []
         self.grammar_rules: List[str] = []  # Regras de gramática para adicionar
+        self._module_rules: List[List[str]] = []  # Regras de cada spec (mesma ordem de specs)
+        self._rule_specs: Dict[str, Tuple[MacroSpec, str]] = {}  # pattern_rule → (spec, pattern_name)
+        # pattern_rule → (macro, pattern_name, expander, imports), montado quando o módulo é importado
+        self.rules: Dict[str, Tuple[MacroBase, str, Callable, Tuple[str, ...]]] = {}
+        self._fingerprint: Tuple[str, ...] = ()
+        self._imports: FrozenSet[str] = frozenset()
+        self._prefilter = None  # (regex das frases iniciais, frase → specs), montado sob demanda
+        self._discover = discover
+    
+    def _ensure_discovered(self):
+        if self._discover:
+            self._discover = False
+            self.discover()
+    
+    def discover(self, group: str = ENTRY_POINT_GROUP) -> List[MacroSpec]:
+        """
+        Registra os pacotes de macros publicados no grupo de entry points.
+        
+        Cada entry point aponta para um MacroSpec (recomendado: o pacote só
+        é importado na primeira expansão), uma MacroBase (classe ou
+        instância) ou uma lista deles. Nomes já registrados são ignorados;
+        um entry point com erro gera um aviso e é pulado.
+        
+        Desativado com MYTHON_MACRO_PLUGINS=0.
+        
+        Returns:
+            Specs registrados
+        """
+        if os.environ.get("MYTHON_MACRO_PLUGINS", "1") == "0":
+            return []
+        try:
+            entry_points = _entry_points(group)
+        except Exception:
+            return []
+        
+        registered = []
+        names = {spec.name for spec in self.specs}
+        for entry_point in entry_points:
+            try:
+                loaded = entry_point.load()
+                for item in loaded if isinstance(loaded, (list, tuple)) else [loaded]:
+                    if isinstance(item, type) and issubclass(item, MacroBase):
+                        item = item()
+                    spec = MacroSpec.from_module(item) if isinstance(item, MacroBase) else item
+                    if not isinstance(spec, MacroSpec):
+                        raise TypeError(f"esperado MacroSpec ou MacroBase, não {type(spec).__name__}")
+                    if spec.name not in names:
+                        self.register_spec(spec)
+                        names.add(spec.name)
+                        registered.append(spec)
+            except Exception as e:
+                warnings.warn(f"Pacote de macros {entry_point.name!r} ignorado: {e}")
+        return registered
     
     def register_module(self, macro_module: MacroBase):
         """
@@ -101,29 +342,145 @@ class MacroRegistry:
         Args:
             macro_module: Instância de MacroBase com padrões e expansões
         """
-        self.macros.append(macro_module)
+        self.register_spec(MacroSpec.from_module(macro_module))
+    
+    def register_spec(self, spec: MacroSpec):
+        """
+        Registra um módulo de macros pelos metadados (importado só quando usado).
+        
+        Args:
+            spec: MacroSpec com os padrões e o módulo que os expande
+        """
+        self.specs.append(spec)
+        rules = []
         
         # Registrar padrões deste módulo
-        patterns = macro_module.get_patterns()
-        for pattern_name, grammar_rule in patterns.items():
+        for pattern_name, grammar_rule in spec.patterns.items():
             rule_name = f"macro_{pattern_name}"
             
             # Adicionar regra de gramática
             grammar_rule_full = f"{rule_name}: {grammar_rule}"
             self.grammar_rules.append(grammar_rule_full)
+            rules.append(grammar_rule_full)
             
-            # Registrar mapeamento
-            self.patterns[rule_name] = (macro_module, pattern_name)
+            # Registrar mapeamento (a expansão é resolvida em _load)
+            self._rule_specs[rule_name] = (spec, pattern_name)
+        
+        self._module_rules.append(rules)
+        self._fingerprint = tuple(self.grammar_rules)
+        self._prefilter = None
+        if spec.loaded:
+            self._load(spec)
+    
+    def _load(self, spec: MacroSpec) -> MacroBase:
+        """Importa o módulo do spec e indexa as expansões e imports dos padrões."""
+        macro_module = spec.load()
+        for pattern_name in spec.patterns:
+            imports = tuple(macro_module.get_required_imports(pattern_name) or ())
+            self.rules[f"macro_{pattern_name}"] = (
+                macro_module, pattern_name, macro_module.get_expander(pattern_name), imports,
+            )
+            self._imports |= frozenset(imports)
+        return macro_module
+    
+    def _entry(self, rule_name: str) -> Optional[Tuple[MacroBase, str, Callable, Tuple[str, ...]]]:
+        """Entrada da regra na tabela, importando o módulo na primeira vez."""
+        entry = self.rules.get(rule_name)
+        if entry is None:
+            self._ensure_discovered()
+            found = self._rule_specs.get(rule_name)
+            if found is None:
+                return None
+            self._load(found[0])
+            entry = self.rules.get(rule_name)
+        return entry
+    
+    @property
+    def macros(self) -> List[MacroBase]:
+        """Módulos de macros já importados."""
+        return [spec.load() for spec in self.specs if spec.loaded]
+    
+    @property
+    def fingerprint(self) -> Tuple[str, ...]:
+        """Regras registradas, em tupla (chave do cache de parsers)."""
+        self._ensure_discovered()
+        return self._fingerprint
+    
+    @property
+    def module_rules(self) -> List[List[str]]:
+        """Regras de cada módulo registrado."""
+        self._ensure_discovered()
+        return self._module_rules
     
     def get_grammar_rules(self) -> List[str]:
         """
         Retorna lista de regras de gramática para adicionar à gramática principal.
         """
+        self._ensure_discovered()
         return self.grammar_rules
     
+    def _build_prefilter(self):
+        """
+        Regex com as frases iniciais de todos os padrões e, para cada frase,
+        os módulos que a usam. Módulos com algum padrão sem palavra inicial
+        fixa ficam em `always` (entram em toda gramática com macros).
+        """
+        from mython.parser_cache import load_grammar
+        
+        # Terminais de palavra-chave da gramática (GET: "get")
+        terminals = dict(re.findall(r'^([A-Z_][A-Z0-9_]*)\s*:\s*"(\w+)"\s*$', load_grammar(), re.M))
+        phrases: Dict[str, set] = {}
+        always = set()
+        for index, rules in enumerate(self._module_rules):
+            for rule in rules:
+                leads = lead_phrases(rule.split(":", 1)[1], terminals)
+                if not leads:
+                    always.add(index)
+                for phrase in leads:
+                    phrases.setdefault(phrase.lower(), set()).add(index)
+        
+        pattern = None
+        if phrases:
+            # Frases mais longas primeiro; espaços entre as palavras são livres
+            alternatives = sorted(phrases, key=len, reverse=True)
+            pattern = re.compile(
+                r"(?<!\w)(?:" + "|".join(r"\s+".join(map(re.escape, p.split())) for p in alternatives) + r")(?!\w)",
+                re.IGNORECASE,
+            )
+        return pattern, phrases, always
+    
+    def get_grammar_rules_for(self, code: str) -> Tuple[str, ...]:
+        """
+        Regras só dos módulos de macros que o código pode usar.
+        
+        Pré-filtro barato: procura no código as palavras com que os padrões
+        começam (`load`, `get data`, `plot`...). Um módulo sem nenhuma delas
+        no código não pode ser usado e fica fora da gramática; sem nenhum
+        módulo, retorna () (gramática base). Pode incluir módulos a mais
+        (a palavra aparece em outro contexto), nunca a menos. Usa só os
+        metadados: nenhum módulo de macros é importado aqui.
+        
+        Args:
+            code: Código já traduzido para inglês e normalizado
+        """
+        self._ensure_discovered()
+        if self._prefilter is None:
+            self._prefilter = self._build_prefilter()
+        pattern, phrases, always = self._prefilter
+        total = len(self.specs)
+        used = set(always)
+        if pattern is not None:
+            for match in pattern.finditer(code):
+                used |= phrases[" ".join(match.group().lower().split())]
+                if len(used) == total:
+                    break
+        if len(used) == total:
+            return self._fingerprint
+        return tuple(rule for index, rules in enumerate(self._module_rules) if index in used for rule in rules)
+    
     def find_macro(self, rule_name: str) -> Optional[Tuple[MacroBase, str]]:
         """
-        Busca macro por nome de regra.
+        Busca macro por nome de regra (importando o módulo, se preciso).
         
         Args:
             rule_name: Nome da regra (ex: "macro_get_data_from")
@@ -131,7 +488,8 @@ class MacroRegistry:
         Returns:
             Tupla (MacroBase, pattern_name) ou None se não encontrado
         """
-        return self.patterns.get(rule_name)
+        entry = self._entry(rule_name)
+        return (entry[0], entry[1]) if entry else None
     
     def expand_macro(self, rule_name: str, args: List[Any], tree: Tree, transformer=None) -> str:
         """
@@ -149,11 +507,14 @@ class MacroRegistry:
         Raises:
             MacroError: Se macro não encontrada ou erro na expansão
         """
-        result = self.find_macro(rule_name)
-        if result is None:
+        try:
+            entry = self.rules.get(rule_name) or self._entry(rule_name)
+        except Exception as e:
+            raise MacroError(f"Erro ao carregar macro {rule_name}: {str(e)}")
+        if entry is None:
             raise MacroError(f"Macro não encontrada: {rule_name}")
         
-        macro, pattern_name = result
+        macro, pattern_name, expander, _ = entry
         
         # Validar argumentos
         if not macro.validate(pattern_name, args):
@@ -161,28 +522,23 @@ class MacroRegistry:
         
         # Expandir
         try:
-            return macro.expand(pattern_name, args, tree, transformer)
+            return expander(args, tree, transformer)
         except Exception as e:
             raise MacroError(f"Erro ao expandir macro {pattern_name}: {str(e)}")
     
     def get_all_imports(self) -> List[str]:
         """
         Retorna lista de todos os imports necessários de todas as macros.
+        
+        Importa todos os módulos de macros registrados.
         """
-        imports = set()
-        for macro in self.macros:
-            patterns = macro.get_patterns()
-            for pattern_name in patterns.keys():
-                pattern_imports = macro.get_required_imports(pattern_name)
-                imports.update(pattern_imports)
-        return sorted(list(imports))
+        self._ensure_discovered()
+        for spec in self.specs:
+            if not spec.loaded:
+                self._load(spec)
+        return sorted(self._imports)
 
     def get_imports_for_rule(self, rule_name: str) -> List[str]:
         """Retorna apenas os imports necessários para a regra informada."""
-        result = self.find_macro(rule_name)
-        if not result:
-            return []
-        macro, pattern_name = result
-        imports = macro.get_required_imports(pattern_name)
-        return imports if imports else []
-
+        entry = self._entry(rule_name)
+        return list(entry[3]) if entry else []
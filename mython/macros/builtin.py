@@ -0,0 +1,35 @@
+"""
+Metadados dos módulos de macros que vêm com o Mython.
+
+Ficam separados das classes (http.py, data.py) para que registrar as
+macros não importe os módulos que as expandem: cada um é importado na
+primeira expansão de uma das suas macros (ver MacroSpec).
+"""
+
+from mython.macros.base import MacroSpec
+
+# Padrões HTTP (ver HTTPMacros.get_patterns)
+HTTP_PATTERNS = {
+    "get_data_from": 'GET ("data" | "json") "from" STRING ("as" NAME)?',
+    "get_text_from": 'GET "text" "from" STRING ("as" NAME)?',
+    "post_data_to": 'POST ("data" | "json") "to" STRING ("with" dict_literal)? ("as" NAME)?',
+    "post_text_to": 'POST "text" "to" STRING ("with" STRING)? ("as" NAME)?',
+    "put_data_to": 'PUT ("data" | "json") "to" STRING ("with" dict_literal)? ("as" NAME)?',
+    "delete_from": 'DELETE "from" STRING ("as" NAME)?',
+}
+
+# Padrões Data Science (ver DataScienceMacros.get_patterns)
+DATA_PATTERNS = {
+    "load_file": '"load" STRING "into" NAME',
+    "filter_data": '"filter" NAME "where" "column" STRING comparison_op expr',
+    "group_data": '"group" NAME "by" STRING ("as" NAME)?',
+    "sum_data": '"sum" NAME "by" STRING ("as" NAME)?',
+    "describe_data": '"describe" NAME ("as" NAME)?',
+    "show_head": '"show" NAME "head" NUMBER?',
+    "plot_column": '"plot" NAME "column" STRING ("as" ("line" | "bar" | "area" | "hist") ("chart")?)?',
+}
+
+BUILTIN_SPECS = [
+    MacroSpec("http", HTTP_PATTERNS, "mython.macros.http:HTTPMacros"),
+    MacroSpec("data", DATA_PATTERNS, "mython.macros.data:DataScienceMacros"),
+]
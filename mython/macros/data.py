@@ -11,8 +11,9 @@ Permite trabalhar com dados de forma simples:
 
 import ast
 from typing import Dict, List, Any
-from lark import Tree, Token
+from mython.lark_runtime import Tree, Token
 from mython.macros.base import MacroBase, MacroError
+from mython.macros.builtin import DATA_PATTERNS
 
 
 class DataScienceMacros(MacroBase):
@@ -30,36 +31,20 @@ class DataScienceMacros(MacroBase):
         
         IMPORTANTE: Usar palavras-chave específicas para evitar conflitos.
         """
-        return {
-            "load_file": '"load" STRING "into" NAME',
-            "filter_data": '"filter" NAME "where" "column" STRING comparison_op expr',
-            "group_data": '"group" NAME "by" STRING ("as" NAME)?',
-            "sum_data": '"sum" NAME "by" STRING ("as" NAME)?',
-            "describe_data": '"describe" NAME ("as" NAME)?',
-            "show_head": '"show" NAME "head" NUMBER?',
-            "plot_column": '"plot" NAME "column" STRING ("as" ("line" | "bar" | "area" | "hist") ("chart")?)?',
-        }
+        return dict(DATA_PATTERNS)
 
     def expand(self, pattern_name: str, args: List[Any], tree: Tree, transformer=None) -> str:
         """
         Expande padrão Data Science em código Python.
         """
-        if pattern_name == "load_file":
-            return self._expand_load_file(args, transformer)
-        elif pattern_name == "filter_data":
-            return self._expand_filter_data(args, transformer)
-        elif pattern_name == "group_data":
-            return self._expand_group_data(args)
-        elif pattern_name == "sum_data":
-            return self._expand_sum_data(args)
-        elif pattern_name == "describe_data":
-            return self._expand_describe_data(args)
-        elif pattern_name == "show_head":
-            return self._expand_show_head(args)
-        elif pattern_name == "plot_column":
-            return self._expand_plot_column(args)
-        else:
+        return self.get_expander(pattern_name)(args, tree, transformer)
+
+    def get_expander(self, pattern_name: str):
+        """Método _expand_* do padrão, já ligado à instância (tabela do registro)."""
+        expander = self._EXPANDERS.get(pattern_name)
+        if expander is None:
             raise MacroError(f"Padrão desconhecido: {pattern_name}")
+        return expander.__get__(self)
 
     # =============================
     # Utilidades internas
@@ -77,7 +62,7 @@ class DataScienceMacros(MacroBase):
                 return text[1:-1]
             return text
 
-    def _expand_load_file(self, args: List[Any], transformer=None) -> str:
+    def _expand_load_file(self, args: List[Any], tree: Tree = None, transformer=None) -> str:
         """Expande load "file.csv" into data"""
         file_path_token = None
         var_name = None
@@ -109,7 +94,7 @@ class DataScienceMacros(MacroBase):
             # Tentar CSV por padrão
             return f"{var_name} = pd.read_csv({file_literal})"
     
-    def _expand_filter_data(self, args: List[Any], transformer=None) -> str:
+    def _expand_filter_data(self, args: List[Any], tree: Tree = None, transformer=None) -> str:
         """Expande filter data where column "age" is over 18"""
         df_name = None
         column = None
@@ -157,7 +142,7 @@ class DataScienceMacros(MacroBase):
         python_op = op_map.get(operator, operator)
         return f"{df_name} = {df_name}[{df_name}[{column}] {python_op} {value}]"
     
-    def _expand_group_data(self, args: List[Any], transformer=None) -> str:
+    def _expand_group_data(self, args: List[Any], tree: Tree = None, transformer=None) -> str:
         """Expande group data by "category" as grouped"""
         df_name = None
         column = None
@@ -182,7 +167,7 @@ class DataScienceMacros(MacroBase):
         result_var = var_name or f"{df_name}_grouped"
         return f"{result_var} = {df_name}.groupby({column})"
     
-    def _expand_sum_data(self, args: List[Any], transformer=None) -> str:
+    def _expand_sum_data(self, args: List[Any], tree: Tree = None, transformer=None) -> str:
         """Expande sum data by "category" as summed"""
         df_name = None
         column = None
@@ -207,7 +192,7 @@ class DataScienceMacros(MacroBase):
         result_var = var_name or f"{df_name}_summed"
         return f"{result_var} = {df_name}.groupby({column}).sum()"
 
-    def _expand_describe_data(self, args: List[Any]) -> str:
+    def _expand_describe_data(self, args: List[Any], tree: Tree = None, transformer=None) -> str:
         """Gera resumo estatístico com pandas.describe."""
         df_name = None
         target_var = None
@@ -226,7 +211,7 @@ class DataScienceMacros(MacroBase):
             return f"{target_var} = {df_name}.describe()"
         return f"print({df_name}.describe())"
 
-    def _expand_show_head(self, args: List[Any]) -> str:
+    def _expand_show_head(self, args: List[Any], tree: Tree = None, transformer=None) -> str:
         """Mostra as primeiras linhas de um dataframe."""
         df_name = None
         rows = None
@@ -244,7 +229,7 @@ class DataScienceMacros(MacroBase):
         row_count = rows or "5"
         return f"print({df_name}.head({row_count}))"
 
-    def _expand_plot_column(self, args: List[Any]) -> str:
+    def _expand_plot_column(self, args: List[Any], tree: Tree = None, transformer=None) -> str:
         """Cria gráfico simples de uma coluna usando pandas + matplotlib."""
         df_name = None
         column_token = None
@@ -284,3 +269,13 @@ class DataScienceMacros(MacroBase):
             imports.append("import matplotlib.pyplot as plt")
         return imports
 
+    # Padrão → método que o expande (ver get_expander)
+    _EXPANDERS = {
+        "load_file": _expand_load_file,
+        "filter_data": _expand_filter_data,
+        "group_data": _expand_group_data,
+        "sum_data": _expand_sum_data,
+        "describe_data": _expand_describe_data,
+        "show_head": _expand_show_head,
+        "plot_column": _expand_plot_column,
+    }
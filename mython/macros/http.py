@@ -7,8 +7,9 @@ Permite fazer requisições HTTP de forma simples:
 """
 
 from typing import Dict, List, Any
-from lark import Tree, Token
+from mython.lark_runtime import Tree, Token
 from mython.macros.base import MacroBase, MacroError
+from mython.macros.builtin import HTTP_PATTERNS
 
 
 class HTTPMacros(MacroBase):
@@ -24,14 +25,7 @@ class HTTPMacros(MacroBase):
         - `post data to STRING with dict_literal? as NAME` → POST com JSON
         - `post data to STRING as NAME` → POST sem corpo
         """
-        return {
-            "get_data_from": 'GET ("data" | "json") "from" STRING ("as" NAME)?',
-            "get_text_from": 'GET "text" "from" STRING ("as" NAME)?',
-            "post_data_to": 'POST ("data" | "json") "to" STRING ("with" dict_literal)? ("as" NAME)?',
-            "post_text_to": 'POST "text" "to" STRING ("with" STRING)? ("as" NAME)?',
-            "put_data_to": 'PUT ("data" | "json") "to" STRING ("with" dict_literal)? ("as" NAME)?',
-            "delete_from": 'DELETE "from" STRING ("as" NAME)?',
-        }
+        return dict(HTTP_PATTERNS)
     
     def expand(self, pattern_name: str, args: List[Any], tree: Tree, transformer=None) -> str:
         """
@@ -43,20 +37,14 @@ class HTTPMacros(MacroBase):
             tree: Árvore completa
             transformer: Instância do transformer para processar expressões (opcional)
         """
-        if pattern_name == "get_data_from":
-            return self._expand_get_data(args, transformer)
-        elif pattern_name == "get_text_from":
-            return self._expand_get_text(args, transformer)
-        elif pattern_name == "post_data_to":
-            return self._expand_post_data(args, transformer)
-        elif pattern_name == "post_text_to":
-            return self._expand_post_text(args, transformer)
-        elif pattern_name == "put_data_to":
-            return self._expand_put_data(args, transformer)
-        elif pattern_name == "delete_from":
-            return self._expand_delete(args, transformer)
-        else:
+        return self.get_expander(pattern_name)(args, tree, transformer)
+
+    def get_expander(self, pattern_name: str):
+        """Método _expand_* do padrão, já ligado à instância (tabela do registro)."""
+        expander = self._EXPANDERS.get(pattern_name)
+        if expander is None:
             raise MacroError(f"Padrão desconhecido: {pattern_name}")
+        return expander.__get__(self)
     
     def _extract_args(self, args: List[Any], transformer=None) -> Dict[str, Any]:
         """
@@ -95,7 +83,12 @@ class HTTPMacros(MacroBase):
         pairs = []
         for child in tree.children:
             if isinstance(child, Tree) and child.data == "pair":
-                key = child.children[0].value if isinstance(child.children[0], Token) else str(child.children[0])
+                key = child.children[0]
+                if isinstance(key, Token):
+                    # Chave sem aspas ({name: ...}) vira string
+                    key = f'"{key.value}"' if key.type == "NAME" else key.value
+                else:
+                    key = str(key)
                 value = str(child.children[1])
                 pairs.append(f"{key}: {value}")
         return "{" + ", ".join(pairs) + "}"
@@ -108,7 +101,7 @@ class HTTPMacros(MacroBase):
             return transformer._expr(tree)
         return str(tree.children[0]) if tree.children else ""
     
-    def _expand_get_data(self, args: List[Any], transformer=None) -> str:
+    def _expand_get_data(self, args: List[Any], tree: Tree = None, transformer=None) -> str:
         """Expande GET data from "url" as var_name"""
         extracted = self._extract_args(args, transformer)
         url = extracted["url"]
@@ -119,7 +112,7 @@ class HTTPMacros(MacroBase):
         
         return f"{var_name} = requests.get({url}).json()"
     
-    def _expand_get_text(self, args: List[Any], transformer=None) -> str:
+    def _expand_get_text(self, args: List[Any], tree: Tree = None, transformer=None) -> str:
         """Expande GET text from "url" as var_name"""
         extracted = self._extract_args(args, transformer)
         url = extracted["url"]
@@ -130,7 +123,7 @@ class HTTPMacros(MacroBase):
         
         return f"{var_name} = requests.get({url}).text"
     
-    def _expand_post_data(self, args: List[Any], transformer=None) -> str:
+    def _expand_post_data(self, args: List[Any], tree: Tree = None, transformer=None) -> str:
         """Expande POST data to "url" with {"key": "value"} as var_name"""
         extracted = self._extract_args(args, transformer)
         url = extracted["url"]
@@ -145,7 +138,7 @@ class HTTPMacros(MacroBase):
         else:
             return f"{var_name} = requests.post({url}).json()"
     
-    def _expand_post_text(self, args: List[Any], transformer=None) -> str:
+    def _expand_post_text(self, args: List[Any], tree: Tree = None, transformer=None) -> str:
         """Expande POST text to "url" with "body" as var_name"""
         extracted = self._extract_args(args, transformer)
         url = extracted["url"]
@@ -160,7 +153,7 @@ class HTTPMacros(MacroBase):
         else:
             return f"{var_name} = requests.post({url}).text"
     
-    def _expand_put_data(self, args: List[Any], transformer=None) -> str:
+    def _expand_put_data(self, args: List[Any], tree: Tree = None, transformer=None) -> str:
         """Expande PUT data to "url" with {"key": "value"} as var_name"""
         extracted = self._extract_args(args, transformer)
         url = extracted["url"]
@@ -175,7 +168,7 @@ class HTTPMacros(MacroBase):
         else:
             return f"{var_name} = requests.put({url}).json()"
     
-    def _expand_delete(self, args: List[Any], transformer=None) -> str:
+    def _expand_delete(self, args: List[Any], tree: Tree = None, transformer=None) -> str:
         """Expande DELETE from "url" as var_name"""
         extracted = self._extract_args(args, transformer)
         url = extracted["url"]
@@ -190,3 +183,13 @@ class HTTPMacros(MacroBase):
         """Retorna imports necessários para macros HTTP."""
         return ["import requests"]
 
+    # Padrão → método que o expande (ver get_expander)
+    _EXPANDERS = {
+        "get_data_from": _expand_get_data,
+        "get_text_from": _expand_get_text,
+        "post_data_to": _expand_post_data,
+        "post_text_to": _expand_post_text,
+        "put_data_to": _expand_put_data,
+        "delete_from": _expand_delete,
+    }
+
@@ -0,0 +1,235 @@
+"""
+Normalização de condições em linguagem natural para operadores Python.
+
+    if idade is greater than or equal to 18:   ->   if idade >= 18:
+    while x is not in itens:                   ->   while x not in itens:
+
+Tudo em uma passada: uma regex compilada localiza as linhas com
+if/elif/while/when/whenever (as outras linhas não são tocadas) e as
+condições encontradas são reescritas juntas por um único `sub`, cujo
+padrão é a trie das frases ("is (?:greater than(?: or equal to)?|...)")
+mais as regras de "is" e as strings literais, que casam inteiras e
+voltam sem alteração. A frase mais longa sempre vence ("is greater than
+or equal to" antes de "greater than"). Comentários ('#' fora de strings)
+ficam fora das condições e também não são tocados.
+"""
+
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .patterns import STRING_PATTERN
+
+# Frases naturais -> operador. Cada frase exige espaço antes e depois,
+# como nas substituições com str.replace que esta tabela substitui.
+CONDITION_PHRASES: Tuple[Tuple[str, str], ...] = (
+    ("is greater than or equal to", ">="),
+    ("greater than or equal to", ">="),
+    ("is less than or equal to", "<="),
+    ("less than or equal to", "<="),
+    ("is greater than", ">"),
+    ("greater than", ">"),
+    ("is less than", "<"),
+    ("less than", "<"),
+    ("is at least", ">="),
+    ("is at most", "<="),
+    ("is over", ">"),
+    ("is above", ">"),
+    ("above", ">"),
+    ("is under", "<"),
+    ("is below", "<"),
+    ("is not equal to", "!="),
+    ("not equal to", "!="),
+    ("equals", "=="),
+    ("equal to", "=="),
+)
+
+# Variante do transformer (aceita também "below" sozinho)
+TRANSFORMER_CONDITION_PHRASES = CONDITION_PHRASES + (("below", "<"),)
+
+# Palavras que abrem uma condição terminada por ':'
+CONDITION_KEYWORDS = frozenset(("if", "elif", "while", "when", "whenever"))
+
+# Depois de "is", palavras (prefixos) que impedem a troca por "=="
+_IS_FOLLOWERS = ("not", "in", "over", "under", "above", "below", "greater", "less", "at", "equal")
+
+# Candidatas: if/elif/while/when/whenever seguido de espaço (começando com
+# um caractere fixo, o `re` pula direto para as posições possíveis)
+_KEYWORD_RE = re.compile(r'[iIeEwW](?<!\w.)(?i:f|lif|hile|hen|henever)\s')
+
+# Primeira condição da linha: da palavra-chave até o primeiro ':'
+# (as linhas com aspas ou '#' são conferidas de novo fora das strings e
+# comentários)
+_CONDITION_LINE_RE = re.compile(
+    r'^[^\n]*?\b(?:if|elif|while|when|whenever)[^\S\n]+([^\n]+?)[^\S\n]*:',
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Strings (sem fechar = até o fim da linha), comentários, palavras, espaços e
+# outros caracteres
+_TOKEN_RE = re.compile(STRING_PATTERN + r'|#[^\n]*|\w+|\s+|.')
+
+# Strings ou sequências de espaços (para colapsar espaços fora das strings)
+_SPACES_RE = re.compile(STRING_PATTERN + r'|[^\S\n]+')
+
+
+class PhraseTrie:
+    """
+    Trie de frases (sequências de palavras) -> operador.
+
+    `pattern` é a trie escrita como regex, com os prefixos comuns fatorados
+    e as continuações mais longas tentadas primeiro.
+    """
+
+    def __init__(self, phrases: Sequence[Tuple[str, str]]):
+        self.root: Dict[Optional[str], dict] = {}
+        self.operators: Dict[str, str] = {}
+        for phrase, operator in phrases:
+            node = self.root
+            for word in phrase.split():
+                node = node.setdefault(word, {})
+            # A primeira ocorrência vence, como na tabela sequencial
+            node.setdefault(None, operator)
+            self.operators.setdefault(" ".join(phrase.split()), operator)
+        self.pattern = self._pattern(self.root)
+
+    @classmethod
+    def _pattern(cls, node: dict) -> str:
+        alternatives = []
+        for word in sorted((w for w in node if w is not None), key=len, reverse=True):
+            child = node[word]
+            alternative = re.escape(word)
+            if len(child) > 1 or None not in child:
+                rest = cls._pattern(child)
+                alternative += f"(?: {rest})?" if None in child else f" {rest}"
+            alternatives.append(alternative)
+        if len(alternatives) == 1:
+            return alternatives[0]
+        return "(?:" + "|".join(alternatives) + ")"
+
+
+def _rule_pattern(trie: PhraseTrie, ignore_case: bool) -> "re.Pattern":
+    """
+    Regex de uma passada sobre as condições. Alternativas, em ordem:
+    strings (voltam intocadas), " frase" seguida de espaço, e "is not in",
+    "is not", "is in" ou "is" sozinho. Toda alternativa começa com um
+    caractere fixo, o que deixa o `re` pular direto para os candidatos.
+    """
+    followers = "|".join(_IS_FOLLOWERS)
+    # "is" vira "==", a menos que venha seguido de not/in/over/...; uma
+    # frase logo depois ("is  greater than") é trocada antes e não conta
+    lone = rf"\b(?:(?![^\S\n]+(?i:{followers}))|(?=[^\S\n]* {trie.pattern} ))"
+    starts = "iI" if ignore_case else "i"
+    s = "[sS]" if ignore_case else "s"
+    words = "(?i:{})" if ignore_case else "{}"
+    is_rules = [
+        rf"{c}{s}(?<!\w..)(?: {words.format('not in')}\b| {words.format('not')}\b| {words.format('in')}\b|{lone})"
+        for c in starts
+    ]
+    return re.compile("|".join([STRING_PATTERN, rf" {trie.pattern}(?= )"] + is_rules))
+
+
+_IS_REPLACEMENTS = {"is not in": " not in ", "is not": " != ", "is in": " in ", "is": " == "}
+
+
+class ConditionNormalizer:
+    """Reescreve condições com uma tabela de frases (ver CONDITION_PHRASES)."""
+
+    def __init__(self, phrases: Sequence[Tuple[str, str]] = CONDITION_PHRASES, ignore_case: bool = True):
+        self.trie = PhraseTrie(phrases)
+        self._rules = _rule_pattern(self.trie, ignore_case)
+        self._operators = {" " + phrase: f" {operator} " for phrase, operator in self.trie.operators.items()}
+
+    def _replace(self, match: "re.Match") -> str:
+        text = match.group()
+        first = text[0]
+        if first == '"' or first == "'":
+            return text
+        if first == " ":
+            return self._operators[text]
+        return _IS_REPLACEMENTS[" ".join(text.lower().split())]
+
+    def rewrite(self, conditions: str) -> str:
+        """Troca frases e "is" (várias condições, uma por linha; sem colapsar espaços)."""
+        return self._rules.sub(self._replace, conditions)
+
+    def __call__(self, condition: str) -> str:
+        """"x is greater than 5" -> "x > 5" (espaços colapsados fora das strings)."""
+        return _collapse_spaces(self.rewrite(condition))
+
+
+def _collapse_spaces(text: str) -> str:
+    if '"' in text or "'" in text:
+        return _SPACES_RE.sub(_collapse, text).strip()
+    return " ".join(text.split())
+
+
+def _collapse(match: "re.Match") -> str:
+    text = match.group()
+    return " " if text.isspace() else text
+
+
+normalize_condition = ConditionNormalizer()
+
+
+def _quoted_condition_span(line: str) -> Optional[Tuple[int, int]]:
+    """
+    Início e fim da condição numa linha com aspas ou comentário (palavra-chave
+    e ':' fora de strings e comentários).
+    """
+    tokens = _TOKEN_RE.findall(line)
+    pos = 0
+    for i in range(len(tokens) - 2):
+        if tokens[i].lower() in CONDITION_KEYWORDS and tokens[i + 1].isspace():
+            start = i + 2
+            pos += len(tokens[i]) + len(tokens[i + 1])
+            break
+        pos += len(tokens[i])
+    else:
+        return None
+    # A condição vai até o primeiro ':' (com ao menos um token), sem os espaços finais
+    begin = end = pos
+    for token in tokens[start:]:
+        if token == ":" and end > begin:
+            return begin, begin + len(line[begin:end].rstrip())
+        end += len(token)
+    return None
+
+
+def normalize_conditions(code: str, normalizer: ConditionNormalizer = normalize_condition) -> str:
+    """
+    Normaliza as condições de todas as linhas com if/elif/while/when/whenever.
+
+    As condições são reescritas juntas, em um único `sub` (uma por linha).
+    """
+    spans: List[Tuple[int, int]] = []
+    line_end = -1
+    for keyword in _KEYWORD_RE.finditer(code):
+        if keyword.start() < line_end:
+            continue
+        line_start = code.rfind("\n", 0, keyword.start()) + 1
+        line_end = code.find("\n", keyword.start())
+        if line_end < 0:
+            line_end = len(code)
+        match = _CONDITION_LINE_RE.match(code, line_start, line_end)
+        if match is None:
+            continue
+        begin, end = match.span(1)
+        line = code[line_start:line_end]
+        if '"' in line or "'" in line or "#" in line:
+            span = _quoted_condition_span(line)
+            if span is None:
+                continue
+            begin, end = line_start + span[0], line_start + span[1]
+        spans.append((begin, end))
+    if not spans:
+        return code
+
+    conditions = normalizer.rewrite("\n".join([code[begin:end] for begin, end in spans])).split("\n")
+    parts: List[str] = []
+    last = 0
+    for (begin, end), condition in zip(spans, conditions):
+        parts.append(code[last:begin])
+        parts.append(_collapse_spaces(condition))
+        last = end
+    parts.append(code[last:])
+    return "".join(parts)
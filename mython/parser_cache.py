@@ -0,0 +1,683 @@
+"""
+Cache de parsers Lark compilados.
+
+Construir o parser LALR a partir de grammar.lark leva segundos, o que domina
+o tempo de transpilação de programas pequenos. Este módulo carrega as
+tabelas de cada parser uma única vez por processo e as reutiliza em todas
+as chamadas seguintes de transpile_file / transpile_string.
+
+Uma instância de Lark não é segura entre threads: o MythonIndenter (postlex)
+guarda a pilha de indentação durante o parse. Por isso get_parser entrega a
+cada thread a sua própria instância, criada a partir das tabelas
+compartilhadas; o parser retornado deve ser usado só pela thread que o pediu.
+
+A chave do cache cobre o texto da gramática e as regras de macros ativas,
+então o cache é invalidado automaticamente quando grammar.lark ou o
+conteúdo do MacroRegistry mudam.
+
+Além do cache em memória, as tabelas LALR são salvas em disco (ver
+get_cache_dir) para que novos processos (CLI, workers do Streamlit) não
+precisem compilar a gramática de novo. O arquivo é versionado pelo hash da
+gramática, das macros, da configuração do MythonIndenter e pela versão do
+Lark.
+
+Os parsers da gramática padrão também podem vir embutidos no módulo
+standalone gerado por write_standalone (`mython --build-standalone`). Nesse
+caminho o pacote lark não é importado: ele só é necessário para compilar
+gramáticas novas.
+
+Em todos os casos o parser é carregado a partir das tabelas serializadas
+(ver compile_grammar), usando o runtime de mython.lark_runtime. A tabela
+LALR vai em um pickle próprio, carregado sem a desserialização genérica do
+Lark, e os lexers de cada estado só são montados quando o estado aparece
+no parse: carregar o parser fica na casa de poucos milissegundos.
+"""
+
+import base64
+import copy
+import hashlib
+import io
+import os
+import pickle
+import sys
+import threading
+import warnings
+import zlib
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from . import lark_runtime
+from .lark_runtime import Lark
+from .indenter import MythonIndenter
+
+# Caminho da gramática principal
+GRAMMAR_PATH = Path(__file__).parent / "grammar.lark"
+
+# Módulo standalone gerado por write_standalone
+STANDALONE_PATH = Path(__file__).parent / "_parser_standalone.py"
+
+# Versão do formato das tabelas serializadas, em disco e no standalone
+# (incrementar se mudar)
+CACHE_FORMAT_VERSION = 2
+
+# Tabelas LALR carregadas: chave (hash da gramática + macros) → tabelas
+# serializadas (ver compile_grammar), compartilhadas por todas as threads
+_payloads: Dict[str, bytes] = {}
+
+# Parsers por thread: o MythonIndenter (postlex) guarda o estado da
+# indentação durante o parse, então uma instância de Lark não pode ser usada
+# por duas threads ao mesmo tempo. Cada thread cria o seu a partir das
+# tabelas de _payloads. `generation` muda em clear_cache.
+_local = threading.local()
+_generation = 0
+
+# Contadores de uso do cache
+_stats: Dict[str, int] = {
+    "hits": 0,
+    "misses": 0,
+    "disk_hits": 0,
+    "standalone_hits": 0,
+}
+
+# Gramática lida do disco e a assinatura do arquivo (mtime, tamanho)
+_grammar_text: Optional[str] = None
+_grammar_signature: Optional[tuple] = None
+
+# Chaves já calculadas para a gramática atual: regras de macros → grammar_key
+# (a tupla de regras, como MacroRegistry.fingerprint, é a chave do dicionário)
+_keys: Dict[tuple, str] = {}
+_keys_grammar: Optional[str] = None
+
+_lock = threading.RLock()
+
+
+def load_grammar() -> str:
+    """
+    Retorna o texto de grammar.lark, relendo o arquivo apenas se ele mudou.
+
+    Raises:
+        FileNotFoundError: Se a gramática não existir
+    """
+    global _grammar_text, _grammar_signature
+
+    try:
+        stat = GRAMMAR_PATH.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Gramática não encontrada: {GRAMMAR_PATH}")
+
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        if _grammar_text is None or signature != _grammar_signature:
+            _grammar_text = GRAMMAR_PATH.read_text(encoding='utf-8')
+            _grammar_signature = signature
+        return _grammar_text
+
+
+def compose_grammar(grammar: str, macro_rules: Sequence[str] = ()) -> str:
+    """
+    Insere as regras de macros na gramática principal.
+
+    As macros ficam antes de simple_stmt para terem precedência sobre os
+    outros statements.
+
+    Args:
+        grammar: Texto da gramática principal
+        macro_rules: Regras no formato "macro_nome: ..." (ver MacroRegistry)
+
+    Returns:
+        Gramática com as regras de macros (ou a original se não houver macros)
+    """
+    if not macro_rules or "simple_stmt:" not in grammar:
+        return grammar
+
+    macro_grammar = "\n".join(["\n// Macros (geradas dinamicamente)"] + list(macro_rules) + [""])
+
+    # Criar regra macro_stmt que agrupa todas as macros
+    macro_stmt_rule = "macro_stmt: " + " | ".join([rule.split(":")[0] for rule in macro_rules]) + "\n"
+
+    return grammar.replace(
+        "simple_stmt:",
+        macro_grammar + macro_stmt_rule + "\nsimple_stmt: macro_stmt\n           | "
+    )
+
+
+def grammar_key(grammar: str, macro_rules: Sequence[str] = ()) -> str:
+    """Calcula a chave do cache para uma gramática e um conjunto de macros."""
+    digest = hashlib.sha256(grammar.encode('utf-8'))
+    for rule in macro_rules:
+        digest.update(b"\0")
+        digest.update(rule.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def compile_grammar(grammar: str) -> bytes:
+    """
+    Compila a gramática com o Lark instalado e serializa as tabelas LALR.
+
+    Única etapa que precisa do pacote lark. O resultado pode ser carregado
+    com load_parser por qualquer runtime (lark ou standalone).
+
+    Args:
+        grammar: Texto completo da gramática (já com macros, se houver)
+
+    Returns:
+        Tabelas serializadas (formato de Lark.save, com a tabela LALR
+        empacotada por _pack_tables)
+    """
+    import lark
+
+    if lark_runtime.STANDALONE and lark.__version__ != lark_runtime.__version__:
+        warnings.warn(
+            f"Parser standalone gerado com Lark {lark_runtime.__version__}, "
+            f"mas o Lark instalado é {lark.__version__}. "
+            "Regenere com `mython --build-standalone`."
+        )
+
+    parser = lark.Lark(
+        grammar,
+        start='start',
+        parser='lalr',  # LALR para usar com indenter (mais eficiente)
+        postlex=MythonIndenter(),  # ESSENCIAL: processa indentação automaticamente
+        propagate_positions=True,  # Manter posições para erros
+    )
+    buffer = io.BytesIO()
+    # O postlex não é serializável - é recriado em load_parser
+    parser.save(buffer, exclude_options=('postlex',))
+    return _pack_tables(buffer.getvalue())
+
+
+class _Persistent:
+    """Referência a um objeto do runtime dentro do pickle da tabela LALR."""
+
+    __slots__ = ("pid",)
+
+    def __init__(self, pid):
+        self.pid = pid
+
+
+_SHIFT = _Persistent("shift")
+_REDUCE = _Persistent("reduce")
+
+
+def _pack_tables(saved: bytes) -> bytes:
+    """
+    Troca a tabela LALR da saída de Lark.save por um pickle que carrega rápido.
+
+    No formato do Lark cada uma das dezenas de milhares de ações passa pela
+    desserialização genérica (Rule.deserialize por ação). Aqui as ações
+    iguais viram uma tupla só, e Shift, Reduce e as regras (índices do memo)
+    são referências persistentes, resolvidas por _unpack_states.
+    """
+    saved = pickle.loads(saved)
+    table = saved['data']['parser']['parser']
+    tokens = table['tokens']
+    actions: Dict[tuple, tuple] = {}
+
+    def action(kind: int, arg) -> tuple:
+        key = (kind, arg['@'] if kind == 1 else arg)
+        if key not in actions:
+            actions[key] = (_REDUCE, _Persistent(key[1])) if kind == 1 else (_SHIFT, arg)
+        return actions[key]
+
+    states = {
+        state: {tokens[token]: action(kind, arg) for token, (kind, arg) in state_actions.items()}
+        for state, state_actions in table['states'].items()
+    }
+    buffer = io.BytesIO()
+    pickler = pickle.Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL)
+    pickler.persistent_id = lambda obj: obj.pid if type(obj) is _Persistent else None
+    pickler.dump(states)
+    saved['data']['parser']['parser'] = {
+        'packed_states': buffer.getvalue(),
+        'start_states': table['start_states'],
+        'end_states': table['end_states'],
+    }
+    return pickle.dumps(saved, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _unpack_states(packed: bytes, memo: dict) -> dict:
+    """Estados da tabela LALR empacotada por _pack_tables, com os objetos do runtime."""
+    runtime = {"shift": lark_runtime.Shift, "reduce": lark_runtime.Reduce}
+    unpickler = pickle.Unpickler(io.BytesIO(packed))
+    unpickler.persistent_load = lambda pid: memo[pid] if isinstance(pid, int) else runtime[pid]
+    return unpickler.load()
+
+
+class _PackedLALRParser(lark_runtime.LALR_Parser):
+    """LALR_Parser que lê a tabela empacotada (plugin de Lark._load)."""
+
+    @classmethod
+    def deserialize(cls, data, memo, callbacks, debug=False):
+        empty = {'tokens': [], 'states': {}, 'start_states': data['start_states'], 'end_states': data['end_states']}
+        parser = super().deserialize(empty, memo, callbacks, debug)
+        # _Parser guarda a tabela e só lê os estados no parse
+        parser._parse_table.states = _unpack_states(data['packed_states'], memo)
+        return parser
+
+
+class _LazyLexers(dict):
+    """Lexer de cada estado do parser, montado no primeiro uso do estado."""
+
+    def __init__(self, build):
+        super().__init__()
+        self._build = build
+
+    def __missing__(self, state):
+        lexer = self[state] = self._build(state)
+        return lexer
+
+
+class _LazyContextualLexer(lark_runtime.ContextualLexer):
+    """
+    ContextualLexer que monta o BasicLexer de um estado só quando o parse
+    chega nele (o original monta os de todos os estados ao carregar).
+    """
+
+    def __init__(self, conf, states, always_accept=()):
+        self._conf = conf
+        self._states = states
+        self._extra = set(conf.ignore) | set(always_accept)
+        self._by_tokens: Dict[frozenset, object] = {}
+        self._root_lexer = None
+        self.lexers = _LazyLexers(self._state_lexer)
+
+    def _state_lexer(self, state):
+        key = frozenset(self._states[state])
+        lexer = self._by_tokens.get(key)
+        if lexer is None:
+            terminals_by_name = self._conf.terminals_by_name
+            lexer_conf = copy.copy(self._conf)
+            lexer_conf.terminals = [terminals_by_name[n] for n in key | self._extra if n in terminals_by_name]
+            lexer = self._by_tokens[key] = self.BasicLexer(lexer_conf)
+        return lexer
+
+    @property
+    def root_lexer(self):
+        # Só usado para montar a mensagem de erro de um token inesperado
+        if self._root_lexer is None:
+            root_conf = copy.copy(self._conf)
+            root_conf.terminals = list(self._conf.terminals)
+            root_conf.skip_validation = True
+            self._root_lexer = self.BasicLexer(root_conf)
+        return self._root_lexer
+
+
+# Plugins de Lark._load usados por load_parser
+_LOAD_PLUGINS = {'LALR_Parser': _PackedLALRParser, 'ContextualLexer': _LazyContextualLexer}
+
+
+def load_parser(payload: bytes) -> Lark:
+    """Cria o parser a partir das tabelas serializadas por compile_grammar."""
+    data = pickle.loads(payload)
+    return Lark._load_from_dict(data['data'], data['memo'], postlex=MythonIndenter(), _plugins=_LOAD_PLUGINS)
+
+
+def build_parser(grammar: str) -> Lark:
+    """
+    Cria um parser LALR com o indenter do Mython.
+
+    Args:
+        grammar: Texto completo da gramática (já com macros, se houver)
+    """
+    return load_parser(compile_grammar(grammar))
+
+
+def _indenter_config() -> tuple:
+    """Configuração do MythonIndenter que afeta o parser gerado."""
+    return (
+        MythonIndenter.NL_type,
+        tuple(MythonIndenter.OPEN_PAREN_types),
+        tuple(MythonIndenter.CLOSE_PAREN_types),
+        MythonIndenter.INDENT_type,
+        MythonIndenter.DEDENT_type,
+        MythonIndenter.tab_len,
+    )
+
+
+def disk_key(key: str) -> str:
+    """
+    Chave do arquivo em disco para uma chave de gramática.
+
+    Cobre também a versão do Lark, a configuração do indenter e a versão do
+    formato, já que tabelas serializadas não são compatíveis entre elas.
+    """
+    digest = hashlib.sha256()
+    for part in (str(CACHE_FORMAT_VERSION), lark_runtime.__version__, repr(_indenter_config()), key):
+        digest.update(part.encode('utf-8'))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def get_cache_dir() -> Optional[Path]:
+    """
+    Retorna o diretório do cache em disco (criando-o se necessário).
+
+    Ordem: $MYTHON_CACHE_DIR, diretório de cache do usuário e, por último,
+    uma pasta ao lado do pacote. Retorna None se o cache em disco estiver
+    desativado (MYTHON_DISK_CACHE=0) ou se nenhum diretório for gravável.
+    """
+    if os.environ.get("MYTHON_DISK_CACHE", "1") == "0":
+        return None
+
+    candidates = []
+    if os.environ.get("MYTHON_CACHE_DIR"):
+        candidates.append(Path(os.environ["MYTHON_CACHE_DIR"]))
+    else:
+        if sys.platform == "win32":
+            base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+            candidates.append(Path(base) / "mython" / "Cache")
+        elif sys.platform == "darwin":
+            candidates.append(Path.home() / "Library" / "Caches" / "mython")
+        else:
+            base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+            candidates.append(Path(base) / "mython")
+        candidates.append(Path(__file__).parent / ".cache")
+
+    for directory in candidates:
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            continue
+        if os.access(directory, os.W_OK):
+            return directory
+    return None
+
+
+def _disk_path(key: str) -> Optional[Path]:
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return None
+    return cache_dir / f"parser-{disk_key(key)[:32]}.lark.pickle"
+
+
+def _load_from_disk(key: str) -> Optional[bytes]:
+    """Lê tabelas serializadas do disco, ou None se não existir / for inválido."""
+    path = _disk_path(key)
+    if path is None or not path.exists():
+        return None
+    try:
+        with open(path, 'rb') as f:
+            header = pickle.load(f)
+            if header != {"format": CACHE_FORMAT_VERSION, "key": disk_key(key)}:
+                return None
+            return f.read()
+    except Exception:
+        # Arquivo corrompido ou de outra versão - reconstruir
+        return None
+
+
+def _save_to_disk(key: str, payload: bytes) -> Optional[Path]:
+    """Salva as tabelas em disco (escrita atômica). Retorna o caminho ou None."""
+    path = _disk_path(key)
+    if path is None:
+        return None
+    import tempfile
+
+    try:
+        fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), prefix=".parser-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump({"format": CACHE_FORMAT_VERSION, "key": disk_key(key)}, f)
+                f.write(payload)
+            # Legível por outros usuários (cache pré-gerado em imagens de deploy)
+            os.chmod(tmp_name, 0o644)
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+        return path
+    except Exception:
+        # Cache em disco é opcional - falhar silenciosamente
+        return None
+
+
+def _load_from_standalone(key: str) -> Optional[bytes]:
+    """Tabelas embutidas no módulo standalone para esta chave, se houver."""
+    standalone = lark_runtime.standalone
+    if standalone is None or getattr(standalone, "PARSERS_FORMAT", 1) != CACHE_FORMAT_VERSION:
+        return None
+    blob = getattr(standalone, "PARSERS", {}).get(key)
+    if blob is None:
+        return None
+    return zlib.decompress(base64.b64decode(blob))
+
+
+def _load_or_compile(key: str, grammar: str, macro_rules: Sequence[str]) -> tuple:
+    """
+    Busca as tabelas no standalone e no disco; compila só se necessário.
+
+    Returns:
+        (tabelas serializadas, parser carregado a partir delas)
+    """
+    payload = _load_from_standalone(key)
+    if payload is not None:
+        _stats["standalone_hits"] += 1
+        return payload, load_parser(payload)
+
+    payload = _load_from_disk(key)
+    if payload is not None:
+        try:
+            parser = load_parser(payload)
+            _stats["disk_hits"] += 1
+            return payload, parser
+        except Exception:
+            # Tabelas incompatíveis com o runtime atual - recompilar
+            pass
+
+    payload = compile_grammar(compose_grammar(grammar, macro_rules))
+    _save_to_disk(key, payload)
+    return payload, load_parser(payload)
+
+
+def _cached_key(grammar: str, macro_rules: tuple) -> str:
+    """grammar_key memorizado por tupla de regras (sem hashear a gramática de novo)."""
+    global _keys_grammar
+    key = _keys.get(macro_rules) if grammar is _keys_grammar else None
+    if key is None:
+        key = grammar_key(grammar, macro_rules)
+        with _lock:
+            if grammar is not _keys_grammar:
+                _keys.clear()
+                _keys_grammar = grammar
+            _keys[macro_rules] = key
+    return key
+
+
+def parser_key(macro_rules: Optional[Sequence[str]] = None) -> str:
+    """Chave do parser que get_parser usaria, sem construí-lo."""
+    return _cached_key(load_grammar(), tuple(macro_rules or ()))
+
+
+def _thread_parsers() -> Dict[str, Lark]:
+    """Parsers da thread atual (descartados quando clear_cache é chamado)."""
+    parsers = getattr(_local, "parsers", None)
+    if parsers is None or _local.generation != _generation:
+        parsers = _local.parsers = {}
+        _local.generation = _generation
+    return parsers
+
+
+def get_parser(macro_rules: Optional[Sequence[str]] = None) -> Lark:
+    """
+    Retorna o parser para a gramática atual, construindo-o só na primeira vez.
+
+    Procura no cache em memória, depois no módulo standalone e no cache em
+    disco; só compila a gramática se nenhum deles tiver o parser.
+
+    O parser retornado é da thread atual: as tabelas LALR são carregadas uma
+    vez por processo, mas cada thread recebe sua própria instância de Lark
+    (com seu próprio MythonIndenter), já que o postlex guarda estado durante
+    o parse. Não passe o parser para outra thread.
+
+    Args:
+        macro_rules: Regras de macros a incluir (None = gramática base); de
+            preferência uma tupla, como MacroRegistry.fingerprint
+
+    Returns:
+        Instância de Lark pronta para parse()
+    """
+    macro_rules = tuple(macro_rules or ())
+    grammar = load_grammar()
+    key = _cached_key(grammar, macro_rules)
+    parsers = _thread_parsers()
+
+    with _lock:
+        parser = parsers.get(key)
+        if parser is not None:
+            _stats["hits"] += 1
+            return parser
+
+        payload = _payloads.get(key)
+        if payload is not None:
+            # Tabelas já carregadas por outra thread
+            _stats["hits"] += 1
+            parser = load_parser(payload)
+        else:
+            _stats["misses"] += 1
+            payload, parser = _load_or_compile(key, grammar, macro_rules)
+            _payloads[key] = payload
+        parsers[key] = parser
+        return parser
+
+
+def _default_macro_rules_sets() -> List[tuple]:
+    """
+    Gramática base, cada módulo de macros padrão sozinho e todos juntos.
+
+    São as gramáticas que o seletor de parser do transpiler (ver
+    MacroRegistry.get_grammar_rules_for) mais usa.
+    """
+    rules_sets = [()]
+    try:
+        from .macros import registry
+        if len(registry.module_rules) > 1:
+            rules_sets.extend(tuple(rules) for rules in registry.module_rules if rules)
+        rules_sets.append(registry.fingerprint)
+    except ImportError:
+        pass
+    return rules_sets
+
+
+def warm_cache(macro_rules_sets: Optional[Sequence[Optional[List[str]]]] = None) -> List[Path]:
+    """
+    Pré-compila os parsers e grava o cache em disco.
+
+    Útil em imagens de deploy (`mython --warm-cache`), para que o primeiro
+    processo já encontre as tabelas prontas.
+
+    Args:
+        macro_rules_sets: Conjuntos de regras de macros a compilar. Padrão:
+            gramática base, cada módulo de macros e todas as macros.
+
+    Returns:
+        Caminhos dos arquivos de cache gravados
+    """
+    if macro_rules_sets is None:
+        macro_rules_sets = _default_macro_rules_sets()
+
+    paths = []
+    grammar = load_grammar()
+    for macro_rules in macro_rules_sets:
+        macro_rules = tuple(macro_rules or ())
+        key = grammar_key(grammar, macro_rules)
+        path = _disk_path(key)
+        if path is None:
+            continue
+        if _load_from_disk(key) is None:
+            payload = _load_from_standalone(key)
+            if payload is None:
+                payload = compile_grammar(compose_grammar(grammar, macro_rules))
+            path = _save_to_disk(key, payload)
+        if path is not None:
+            paths.append(path)
+    return paths
+
+
+def write_standalone(path: Optional[Path] = None,
+                     macro_rules_sets: Optional[Sequence[Optional[List[str]]]] = None) -> Path:
+    """
+    Gera o módulo standalone com o runtime do Lark e as tabelas LALR embutidas.
+
+    Com esse módulo no pacote, o caminho comum (gramática padrão e macros
+    padrão) não importa o lark nem compila nada. Deve ser regenerado sempre
+    que grammar.lark, as macros padrão ou a versão do Lark mudarem; uma
+    versão desatualizada é simplesmente ignorada (a chave não bate).
+
+    Args:
+        path: Arquivo de saída (padrão: mython/_parser_standalone.py)
+        macro_rules_sets: Conjuntos de regras de macros a embutir. Padrão:
+            gramática base, cada módulo de macros e todas as macros.
+
+    Returns:
+        Caminho do módulo gerado
+    """
+    import lark
+    from lark.tools.standalone import EXTRACT_STANDALONE_FILES, extract_sections, strip_docstrings
+    from functools import partial
+
+    path = Path(path) if path else STANDALONE_PATH
+    if macro_rules_sets is None:
+        macro_rules_sets = _default_macro_rules_sets()
+
+    grammar = load_grammar()
+    parsers = {}
+    for macro_rules in macro_rules_sets:
+        macro_rules = tuple(macro_rules or ())
+        key = grammar_key(grammar, macro_rules)
+        payload = compile_grammar(compose_grammar(grammar, macro_rules))
+        parsers[key] = base64.b64encode(zlib.compress(payload, 9)).decode('ascii')
+
+    lark_dir = Path(lark.__file__).parent
+    out = io.StringIO()
+    out.write(f"# Gerado por `mython --build-standalone` com Lark v{lark.__version__} - NÃO EDITAR\n")
+    out.write(f'__version__ = "{lark.__version__}"\n\n')
+
+    # Runtime do Lark (mesmo código que lark.tools.standalone extrai)
+    for i, pyfile in enumerate(EXTRACT_STANDALONE_FILES):
+        with open(lark_dir / pyfile, encoding='utf-8') as f:
+            code = extract_sections(f)['standalone']
+            if i:
+                code = strip_docstrings(partial(next, iter(code.splitlines(True))))
+            out.write(code)
+            out.write("\n")
+
+    # Tabelas LALR: chave da gramática (grammar_key) → pickle comprimido
+    out.write("\n# Parsers pré-compilados: grammar_key → tabelas LALR (zlib + base64)\n")
+    out.write(f"PARSERS_FORMAT = {CACHE_FORMAT_VERSION}\n")
+    out.write("PARSERS = {\n")
+    for key, blob in parsers.items():
+        out.write(f"    {key!r}: (\n")
+        for start in range(0, len(blob), 76):
+            out.write(f"        {blob[start:start + 76]!r}\n")
+        out.write("    ),\n")
+    out.write("}\n")
+
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(out.getvalue(), encoding='utf-8')
+    os.replace(tmp_path, path)
+    return path
+
+
+def get_cache_stats() -> Dict[str, int]:
+    """
+    Retorna os contadores do cache.
+
+    Returns:
+        {"hits": ..., "misses": ..., "disk_hits": ..., "size": número de gramáticas em memória}
+    """
+    with _lock:
+        return {**_stats, "size": len(_payloads)}
+
+
+def clear_cache():
+    """Descarta todos os parsers em memória e zera os contadores."""
+    global _grammar_text, _grammar_signature, _keys_grammar, _generation
+    with _lock:
+        _payloads.clear()
+        _generation += 1
+        _keys.clear()
+        _keys_grammar = None
+        for name in _stats:
+            _stats[name] = 0
+        _grammar_text = None
+        _grammar_signature = None
@@ -0,0 +1,26 @@
+"""
+Padrões regex compartilhados pelo pipeline de transpilação.
+
+Compilados uma única vez, na importação. Os laços quentes (por linha ou
+por palavra, em i18n, translator e normalize) usam estes objetos
+em vez de montar padrões a cada chamada; as tabelas de frases ficam
+junto de quem as usa (normalize.CONDITION_PHRASES, i18n.LANGUAGE_KEYWORDS).
+"""
+
+import re
+
+# Uma palavra (identificador, palavra-chave ou número)
+WORD_RE = re.compile(r'\b\w+\b')
+
+# String literal de uma linha, com aspas simples ou duplas (sem fechar = até o
+# fim da linha). Texto do padrão, para compor com outras alternativas.
+STRING_PATTERN = r'''"(?:[^"\\\n]|\\.)*"?|'(?:[^'\\\n]|\\.)*'?'''
+
+# O que os tradutores de palavras-chave não tocam: strings (inclusive as de
+# três aspas, que podem ocupar várias linhas) e comentários
+STRING_OR_COMMENT_PATTERN = (
+    r'"""[\s\S]*?(?:"""|\Z)|'
+    + r"'''[\s\S]*?(?:'''|\Z)|"
+    + STRING_PATTERN
+    + r'|#[^\n]*'
+)
@@ -0,0 +1,245 @@
+"""
+Cache persistente de resultados de transpilação.
+
+Guarda o Python gerado em disco, endereçado pelo conteúdo: a chave cobre os
+bytes do código-fonte, a língua, o hash da gramática + macros (ver
+parser_cache.grammar_key) e a versão do pipeline (código do transformer,
+normalização e dicionários). Um acerto pula detecção de língua, tradução,
+normalização, parsing e transformação.
+
+O armazenamento é um diretório com um arquivo por entrada, com limite de
+tamanho e remoção LRU (o mtime de cada arquivo é atualizado a cada acerto).
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from . import __version__
+
+# Limite padrão do cache (em bytes) - pode ser alterado com MYTHON_RESULT_CACHE_MB
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+
+# Módulos e dados cujo conteúdo afeta o código gerado: todo o pacote, para
+# que um módulo novo do pipeline não fique de fora
+_PIPELINE_FILES = [
+    "*.py",
+    "i18n/*.py",
+    "i18n/dictionaries/*.json",
+    "macros/*.py",
+]
+
+# Módulos que não mudam o código gerado: este cache, as interfaces (CLI,
+# build, watch, servidor) e o standalone (as tabelas já estão na chave da
+# gramática; o arquivo muda a cada regeneração)
+_NOT_PIPELINE_FILES = {
+    "result_cache.py",
+    "cli.py",
+    "build.py",
+    "watch.py",
+    "server.py",
+    "_parser_standalone.py",
+}
+
+_pipeline_fingerprint: Optional[str] = None
+
+
+def pipeline_files() -> List[Path]:
+    """Arquivos do pacote que entram em pipeline_fingerprint, em ordem estável."""
+    base = Path(__file__).parent
+    paths = []
+    for pattern in _PIPELINE_FILES:
+        for path in sorted(base.glob(pattern)):
+            if path.parent == base and path.name in _NOT_PIPELINE_FILES:
+                continue
+            paths.append(path)
+    return paths
+
+
+def pipeline_fingerprint() -> str:
+    """
+    Versão do pipeline de transpilação (hash dos módulos que geram código).
+
+    Qualquer mudança no transformer, na normalização, nos dicionários ou nas
+    macros invalida os resultados em cache, sem precisar de versão manual.
+    """
+    global _pipeline_fingerprint
+    if _pipeline_fingerprint is None:
+        base = Path(__file__).parent
+        digest = hashlib.sha256(__version__.encode('utf-8'))
+        for path in pipeline_files():
+            digest.update(b"\0" + path.relative_to(base).as_posix().encode('utf-8') + b"\0")
+            digest.update(path.read_bytes())
+        _pipeline_fingerprint = digest.hexdigest()
+    return _pipeline_fingerprint
+
+
+def result_key(source: bytes, lang: Optional[str], parser_key: str, options: Iterable[str] = ()) -> str:
+    """
+    Calcula a chave de um resultado.
+
+    Args:
+        source: Bytes do código Mython
+        lang: Língua informada pelo usuário (None = detecção automática)
+        parser_key: Chave da gramática + macros (parser_cache.grammar_key)
+        options: Outras opções que afetam a saída
+
+    Returns:
+        Hash hexadecimal
+    """
+    digest = hashlib.sha256(source)
+    for part in (lang or "auto", parser_key, pipeline_fingerprint(), *options):
+        digest.update(b"\0")
+        digest.update(str(part).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Cache em disco de código Python gerado, com limite de tamanho e LRU.
+
+    Seguro entre processos: entradas são gravadas de forma atômica e uma
+    entrada removida por outro processo é tratada como falta.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.stats: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "evictions": 0,
+        }
+        self._lock = threading.Lock()
+        # Tamanho estimado (varredura completa só quando passar do limite)
+        self._approx_size: Optional[int] = None
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.py"
+
+    def get(self, key: str) -> Optional[str]:
+        """Retorna o código em cache para a chave, ou None."""
+        path = self._path(key)
+        try:
+            code = path.read_text(encoding='utf-8')
+        except (FileNotFoundError, OSError, UnicodeDecodeError):
+            with self._lock:
+                self.stats["misses"] += 1
+            return None
+
+        # Marcar como usado recentemente (LRU)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            self.stats["hits"] += 1
+        return code
+
+    def put(self, key: str, code: str):
+        """Grava o código gerado e aplica o limite de tamanho."""
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), prefix=".", suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(code)
+                os.replace(tmp_name, path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError:
+            # Cache é opcional - falhar silenciosamente
+            return
+        with self._lock:
+            self.stats["writes"] += 1
+            if self._approx_size is None:
+                self._approx_size = self.size()
+            else:
+                self._approx_size += len(code.encode('utf-8'))
+            over_limit = self._approx_size > self.max_bytes
+        if over_limit:
+            self.evict()
+
+    def _entries(self):
+        for shard in self.directory.iterdir():
+            if not shard.is_dir():
+                continue
+            for entry in shard.glob("*.py"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                yield stat.st_mtime, stat.st_size, entry
+
+    def size(self) -> int:
+        """Tamanho total das entradas em bytes."""
+        if not self.directory.exists():
+            return 0
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """Remove as entradas usadas há mais tempo até caber no limite."""
+        if not self.directory.exists():
+            return
+        entries = list(self._entries())
+        total = sum(size for _, size, _ in entries)
+        if total > self.max_bytes:
+            total = self._remove_oldest(entries, total)
+        with self._lock:
+            self._approx_size = total
+
+    def _remove_oldest(self, entries, total: int) -> int:
+        """Remove entradas por ordem de mtime; retorna o tamanho restante."""
+        entries.sort(key=lambda entry: entry[0])
+        for _, size, entry in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                entry.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            with self._lock:
+                self.stats["evictions"] += 1
+        return total
+
+    def clear(self):
+        """Remove todas as entradas."""
+        if not self.directory.exists():
+            return
+        for _, _, entry in list(self._entries()):
+            try:
+                entry.unlink()
+            except FileNotFoundError:
+                pass
+        with self._lock:
+            self._approx_size = 0
+
+
+_default_cache: Optional[ResultCache] = None
+
+
+def get_result_cache() -> Optional[ResultCache]:
+    """
+    Retorna o cache de resultados padrão (em <cache dir>/results).
+
+    Retorna None se o cache em disco estiver desativado.
+    """
+    global _default_cache
+    if _default_cache is None:
+        from .parser_cache import get_cache_dir
+
+        cache_dir = get_cache_dir()
+        if cache_dir is None:
+            return None
+        max_bytes = DEFAULT_MAX_BYTES
+        if os.environ.get("MYTHON_RESULT_CACHE_MB"):
+            max_bytes = int(float(os.environ["MYTHON_RESULT_CACHE_MB"]) * 1024 * 1024)
+        _default_cache = ResultCache(cache_dir / "results", max_bytes=max_bytes)
+    return _default_cache
@@ -0,0 +1,270 @@
+"""
+Servidor de transpilação de longa duração (`mython serve`).
+
+Mantém o parser compilado, os dicionários de i18n e o registro de macros
+carregados em um pool de workers, e atende pedidos JSON (um por linha)
+via stdin/stdout ou socket Unix:
+
+    → {"id": 1, "code": "say \\"hi\\"", "lang": "en"}
+    ← {"id": 1, "python": "print(\\"hi\\")", "timings": {...}, "errors": []}
+
+Outras operações: {"op": "stats"} (contadores de vazão e latência) e
+{"op": "ping"}. Os tempos são em milissegundos.
+"""
+
+import json
+import os
+import socketserver
+import stat
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Union
+
+# Quantas latências recentes guardar para os percentis
+LATENCY_WINDOW = 1000
+
+
+def _init_worker():
+    """Carrega parser, dicionários e macros antes do primeiro pedido."""
+    from .transpiler_lark import transpile_string
+    try:
+        transpile_string('say "warm"', lang="en")
+    except Exception:
+        pass
+
+
+def _transpile(code: str, lang: Optional[str], use_cache: bool) -> dict:
+    """Executa um pedido de transpilação (no worker)."""
+    from .transpiler_lark import transpile_string
+
+    timings: Dict[str, float] = {}
+    response = {"python": None, "timings": timings, "errors": []}
+    try:
+        response["python"] = transpile_string(code, lang=lang, use_cache=use_cache, timings=timings)
+    except Exception as e:
+        response["errors"].append({"type": type(e).__name__, "message": str(e)})
+    for stage, seconds in timings.items():
+        timings[stage] = round(seconds * 1000, 3)
+    return response
+
+
+class ServerStats:
+    """Contadores de vazão e latência do servidor (thread-safe)."""
+
+    def __init__(self):
+        self.started = time.time()
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.total_seconds = 0.0
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+        self._lock = threading.Lock()
+
+    def begin(self):
+        with self._lock:
+            self.in_flight += 1
+
+    def end(self, seconds: float, failed: bool):
+        with self._lock:
+            self.in_flight -= 1
+            self.requests += 1
+            self.errors += failed
+            self.total_seconds += seconds
+            self._latencies.append(seconds)
+
+    def snapshot(self) -> dict:
+        """Contadores atuais (latências em ms)."""
+        with self._lock:
+            uptime = time.time() - self.started
+            latencies = sorted(self._latencies)
+            data = {
+                "uptime": round(uptime, 3),
+                "requests": self.requests,
+                "errors": self.errors,
+                "in_flight": self.in_flight,
+                "requests_per_second": round(self.requests / uptime, 3) if uptime else 0.0,
+                "mean_ms": round(self.total_seconds / self.requests * 1000, 3) if self.requests else 0.0,
+            }
+        for name, q in (("p50_ms", 0.5), ("p95_ms", 0.95), ("p99_ms", 0.99)):
+            data[name] = round(latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000, 3) if latencies else 0.0
+        return data
+
+
+class TranspileServer:
+    """
+    Atende pedidos de transpilação com um pool de workers pré-aquecidos.
+
+    Args:
+        workers: Número de processos (0 = transpilar no próprio processo,
+            com threads; útil quando há uma única CPU)
+        use_cache: Se True, usa o cache persistente de resultados
+    """
+
+    def __init__(self, workers: Optional[int] = None, use_cache: bool = False):
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.use_cache = use_cache
+        self.stats = ServerStats()
+        if self.workers > 0:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+            # Forçar o aquecimento de todos os workers agora, não no primeiro pedido
+            for future in [self._executor.submit(_init_worker) for _ in range(self.workers)]:
+                future.result()
+        else:
+            _init_worker()
+            self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="mython-serve")
+
+    def submit(self, request: dict) -> "Future[dict]":
+        """Agenda um pedido; o Future resolve para o dicionário de resposta."""
+        op = request.get("op", "transpile")
+        if op != "transpile":
+            future: "Future[dict]" = Future()
+            future.set_result(self._control(op))
+            return self._with_id(future, request)
+
+        code = request.get("code")
+        if not isinstance(code, str):
+            future = Future()
+            future.set_result(_error_response("campo 'code' ausente"))
+            return self._with_id(future, request)
+
+        self.stats.begin()
+        start = time.perf_counter()
+        inner = self._executor.submit(_transpile, code, request.get("lang"), self.use_cache)
+        outer: "Future[dict]" = Future()
+
+        def done(f):
+            try:
+                response = f.result()
+            except Exception as e:
+                response = {"python": None, "timings": {}, "errors": [{"type": type(e).__name__, "message": str(e)}]}
+            seconds = time.perf_counter() - start
+            response["timings"]["total"] = round(seconds * 1000, 3)
+            self.stats.end(seconds, bool(response["errors"]))
+            outer.set_result(response)
+
+        inner.add_done_callback(done)
+        return self._with_id(outer, request)
+
+    def handle(self, request: dict) -> dict:
+        """Atende um pedido de forma síncrona."""
+        return self.submit(request).result()
+
+    def _control(self, op: str) -> dict:
+        if op == "stats":
+            return {"stats": self.stats.snapshot()}
+        if op == "ping":
+            return {"pong": True}
+        return _error_response(f"operação desconhecida: {op}")
+
+    @staticmethod
+    def _with_id(future: "Future[dict]", request: dict) -> "Future[dict]":
+        if "id" not in request:
+            return future
+        tagged: "Future[dict]" = Future()
+        future.add_done_callback(lambda f: tagged.set_result({"id": request["id"], **f.result()}))
+        return tagged
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
+
+
+def _parse_line(line: Union[str, bytes]) -> dict:
+    try:
+        request = json.loads(line)
+    except ValueError as e:
+        return {"op": "invalid", "_error": f"JSON inválido: {e}"}
+    if not isinstance(request, dict):
+        return {"op": "invalid", "_error": "o pedido deve ser um objeto JSON"}
+    return request
+
+
+def _error_response(message: str) -> dict:
+    """Resposta de um pedido rejeitado, com o mesmo formato de uma transpilação."""
+    return {"python": None, "timings": {}, "errors": [{"type": "ValueError", "message": message}]}
+
+
+def serve_stdio(server: TranspileServer, stdin=None, stdout=None):
+    """
+    Atende pedidos de stdin e responde em stdout (uma linha JSON cada).
+
+    Pedidos são processados em paralelo; as respostas saem na ordem em que
+    ficam prontas (use o campo "id" para associá-las).
+    """
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    lock = threading.Lock()
+    pending: List[Future] = []
+
+    def write(response: dict):
+        line = json.dumps(response, ensure_ascii=False)
+        with lock:
+            stdout.write(line + "\n")
+            stdout.flush()
+
+    for line in stdin:
+        if not line.strip():
+            continue
+        request = _parse_line(line)
+        if request.get("op") == "invalid":
+            write(_error_response(request["_error"]))
+            continue
+        future = server.submit(request)
+        future.add_done_callback(lambda f: write(f.result()))
+        pending.append(future)
+        pending = [f for f in pending if not f.done()]
+
+    for future in pending:
+        future.result()
+
+
+class _UnixHandler(socketserver.StreamRequestHandler):
+    """Uma conexão: pedidos e respostas JSON, uma linha cada, em ordem."""
+
+    def handle(self):
+        server: TranspileServer = self.server.transpile_server
+        for raw in self.rfile:
+            if not raw.strip():
+                continue
+            # json.loads decodifica os bytes; UTF-8 inválido vira erro do pedido
+            request = _parse_line(raw)
+            if request.get("op") == "invalid":
+                response = _error_response(request["_error"])
+            else:
+                response = server.handle(request)
+            self.wfile.write((json.dumps(response, ensure_ascii=False) + "\n").encode('utf-8'))
+            self.wfile.flush()
+
+
+def _unix_server(server: TranspileServer, path: str) -> "socketserver.ThreadingUnixStreamServer":
+    """
+    Cria o servidor no socket `path`.
+
+    Um socket antigo no caminho (de uma execução anterior) é substituído;
+    qualquer outro tipo de arquivo gera FileExistsError.
+    """
+    if not hasattr(socketserver, "ThreadingUnixStreamServer"):
+        raise OSError("Sockets Unix não são suportados nesta plataforma (use stdin/stdout)")
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        pass
+    else:
+        if not stat.S_ISSOCK(mode):
+            raise FileExistsError(f"{path} já existe e não é um socket; escolha outro caminho para --socket")
+        os.unlink(path)
+    unix_server = socketserver.ThreadingUnixStreamServer(path, _UnixHandler)
+    unix_server.daemon_threads = True
+    unix_server.transpile_server = server
+    return unix_server
+
+
+def serve_unix(server: TranspileServer, path: str):
+    """Atende clientes concorrentes em um socket Unix até Ctrl+C."""
+    with _unix_server(server, path) as unix_server:
+        try:
+            unix_server.serve_forever()
+        finally:
+            os.unlink(path)
@@ -2,9 +2,11 @@
 Transformer para converter AST do Lark em código Python.
 """
 
-from lark import Transformer, Token, Tree
+from .lark_runtime import Transformer, Token, Tree
 from typing import List, Any, Optional, Set
 
+from .normalize import TRANSFORMER_CONDITION_PHRASES, ConditionNormalizer
+
 # Importar sistema de macros modular
 try:
     from mython.macros import registry as macro_registry
@@ -16,6 +18,45 @@ except ImportError:
     MacroError = None
 
 
+# Tabela de _condition (inclui "below" sozinho; "is" só em minúsculas)
+_normalize_condition = ConditionNormalizer(TRANSFORMER_CONDITION_PHRASES, ignore_case=False)
+
+
+class CodeBlock(list):
+    """
+    Código gerado por um comando composto, renderizado uma única vez em start().
+    
+    É uma lista de linhas já indentadas (str - podem ter várias linhas, que
+    são emitidas como estão, preservando espaços em strings multilinha) e de
+    blocos aninhados (CodeBlock). Os comandos compostos apenas referenciam
+    os blocos filhos, então montar a saída é linear no tamanho do código, e
+    não proporcional a profundidade × tamanho.
+    """
+    
+    __slots__ = ()
+    
+    def render(self, out: List[str]) -> List[str]:
+        """Acrescenta as linhas renderizadas em `out` (iterativo, sem recursão)."""
+        stack = [iter(self)]
+        while stack:
+            for item in stack[-1]:
+                if isinstance(item, CodeBlock):
+                    stack.append(iter(item))
+                    break
+                if item and not item.isspace():
+                    out.append(item)
+            else:
+                stack.pop()
+        return out
+    
+    def __str__(self) -> str:
+        return "\n".join(self.render([]))
+
+
+# Strings de indentação por nível (evita recriar "    " * n a cada statement)
+_INDENTS = [""]
+
+
 class MythonTransformer(Transformer):
     """Transforma a árvore de parse do Mython em código Python."""
     
@@ -34,9 +75,40 @@ class MythonTransformer(Transformer):
             'sys': False,
         }
     
+    def transform(self, tree) -> str:
+        """
+        Transforma a árvore em código Python.
+        
+        Se o programa tem um único comando composto, o Lark embute `start`
+        e o resultado é um CodeBlock - renderizado aqui.
+        """
+        result = super().transform(tree)
+        if isinstance(result, CodeBlock):
+            return str(result)
+        return result
+    
     def indent(self) -> str:
         """Retorna a indentação atual."""
-        return "    " * self.indent_level
+        level = self.indent_level
+        if level <= 0:
+            return ""
+        while level >= len(_INDENTS):
+            _INDENTS.append("    " * len(_INDENTS))
+        return _INDENTS[level]
+    
+    def _compound(self, header: str, blocks: List[Any]) -> CodeBlock:
+        """
+        Monta um comando composto: cabeçalho no nível atual + corpo.
+        
+        Os statements do corpo já chegam com a indentação certa (o
+        indent_level é ajustado pelos tokens INDENT/DEDENT durante a
+        transformação) e são apenas referenciados - sem copiar nem
+        re-indentar o corpo a cada nível de aninhamento.
+        """
+        indent = self.indent()
+        block = CodeBlock([indent + header])
+        block.extend(blocks or [indent + "    pass"])
+        return block
     
     # ============================================
     # Statements
@@ -75,21 +147,16 @@ class MythonTransformer(Transformer):
             lines.extend(imports)
             lines.append("")
         
-        # Cada statement já foi transformado em string pelos métodos filhos
-        # Apenas juntar as linhas
+        # Cada statement já foi transformado pelos métodos filhos (str já
+        # indentada ou CodeBlock) - renderizar tudo uma única vez
+        body = []
         for stmt in statements:
-            if stmt and isinstance(stmt, str) and stmt.strip():
-                # Adicionar linhas preservando indentação
-                for line in stmt.split('\n'):
-                    if line.strip():
-                        lines.append(line)
-            elif stmt and not isinstance(stmt, str):
+            if isinstance(stmt, (str, CodeBlock)):
+                body.append(stmt)
+            elif stmt:
                 # Se não é string, converter (não deveria acontecer)
-                stmt_str = str(stmt)
-                if stmt_str.strip():
-                    for line in stmt_str.split('\n'):
-                        if line.strip():
-                            lines.append(line)
+                body.append(str(stmt))
+        CodeBlock(body).render(lines)
         
         return "\n".join(lines) + "\n"
     
@@ -140,8 +207,8 @@ class MythonTransformer(Transformer):
         if isinstance(result, Tree):
             return str(result)
         
-        # Se é string, retornar diretamente
-        if isinstance(result, str):
+        # Se é string (ou bloco composto), retornar diretamente
+        if isinstance(result, (str, CodeBlock)):
             return result
         
         # Fallback: converter para string
@@ -170,8 +237,8 @@ class MythonTransformer(Transformer):
         if isinstance(result, Tree):
             return str(result)
         
-        # Se é string, retornar diretamente
-        if isinstance(result, str):
+        # Se é string (ou bloco composto), retornar diretamente
+        if isinstance(result, (str, CodeBlock)):
             return result
         
         # Fallback: converter para string
@@ -181,45 +248,32 @@ class MythonTransformer(Transformer):
         """
         block_stmt: simple_stmt _NEWLINE? | compound_stmt
         
-        CORRIGIDO: Processa o filho já transformado e indenta o conteúdo.
+        Processa o filho já transformado - que já vem indentado no nível do
+        bloco (indent_level, ajustado por INDENT/DEDENT).
         NÃO chama self.transform() - o Lark já transformou o filho.
         """
-        if not children:
-            return "    pass"
-        
         # Filtrar _NEWLINE se presente
         filtered = [c for c in children if not (isinstance(c, Token) and c.type == '_NEWLINE')]
         
         if not filtered:
-            return "    pass"
+            return self.indent() + "pass"
         
         # O primeiro child já foi transformado pelo Lark em string
         result = filtered[0]
         
-        # Se ainda é Tree (não deveria acontecer), converter para string
-        if isinstance(result, Tree):
-            result = str(result)
+        # Blocos compostos seguem como estão
+        if isinstance(result, CodeBlock):
+            return result
         
-        # Se não é string, converter
+        # Se não é string (não deveria acontecer), converter
         if not isinstance(result, str):
             result = str(result)
         
         # Se está vazio, retornar pass indentado
         if not result.strip():
-            return "    pass"
-        
-        # Indentar SOMENTE o conteúdo interno (linha por linha)
-        # IMPORTANTE: Não indentar se já começa com "else:" (isso seria erro)
-        lines = result.split('\n')
-        indented_lines = []
-        for line in lines:
-            if line.strip():
-                # Adicionar indentação de 4 espaços
-                indented_lines.append("    " + line.strip())
-            else:
-                indented_lines.append("")
+            return self.indent() + "pass"
         
-        return "\n".join(indented_lines)
+        return result
     
     def compound_stmt(self, children: List[Any]) -> str:
         """
@@ -238,8 +292,8 @@ class MythonTransformer(Transformer):
         if isinstance(result, Tree):
             return str(result)
         
-        # Se é string, retornar diretamente
-        if isinstance(result, str):
+        # Se é string (ou bloco composto), retornar diretamente
+        if isinstance(result, (str, CodeBlock)):
             return result
         
         # Fallback: converter para string
@@ -262,42 +316,29 @@ class MythonTransformer(Transformer):
     def block(self, statements: List[Any]) -> str:
         """
         Bloco de código.
-        NOTA: Com INDENT/DEDENT, os statements já vêm indentados corretamente.
-        Precisamos apenas processá-los mantendo a indentação.
+        NOTA: Com INDENT/DEDENT, os statements já vêm indentados corretamente
+        (e já transformados); basta juntá-los.
         """
         result_lines = []
         for stmt in statements:
-            if stmt:
-                # Ignorar tokens INDENT/DEDENT/_NEWLINE - já foram processados
-                if isinstance(stmt, str) and stmt.strip() in ['INDENT', 'DEDENT', '_NEWLINE', '']:
-                    continue
-                
-                # Se for Tree object, transformar recursivamente
-                if not isinstance(stmt, str):
-                    if hasattr(stmt, 'children'):
-                        stmt = self.transform(stmt)
-                    else:
-                        stmt = str(stmt)
-                
-                # Garantir que é string
-                if not isinstance(stmt, str):
-                    stmt = str(stmt)
-                
-                # Se stmt está vazio após strip, pular
-                if not stmt.strip():
-                    continue
-                
-                # Processar statement com indentação correta
-                # O indent_level já está ajustado pelos tokens INDENT/DEDENT
-                lines = stmt.split('\n')
-                for line in lines:
-                    stripped = line.strip()
-                    if stripped:
-                        # Adicionar indentação apropriada baseada no indent_level atual
-                        result_lines.append(self.indent() + stripped)
-        
-        result = "\n".join(result_lines)
-        return result if result_lines else ""
+            if not stmt:
+                continue
+            
+            if isinstance(stmt, CodeBlock):
+                result_lines.extend(stmt.render([]))
+                continue
+            
+            # Nós que o Lark deixou como Tree já têm os filhos transformados
+            if not isinstance(stmt, str):
+                stmt = self._expr(stmt)
+            
+            # Ignorar tokens INDENT/DEDENT/_NEWLINE - já foram processados
+            if stmt.strip() in ['INDENT', 'DEDENT', '_NEWLINE', '']:
+                continue
+            
+            result_lines.append(stmt)
+        
+        return "\n".join(result_lines)
     
     # ============================================
     # Chamada de Função
@@ -526,7 +567,7 @@ class MythonTransformer(Transformer):
                 continue
             
             # Se é string, é um block_stmt já transformado
-            if isinstance(arg, str) and arg.strip():
+            if isinstance(arg, CodeBlock) or (isinstance(arg, str) and arg.strip()):
                 blocks.append(arg)
             # Se é Tree, pode ser block_stmt não transformado (não deveria acontecer)
             elif isinstance(arg, Tree):
@@ -534,16 +575,8 @@ class MythonTransformer(Transformer):
             
             i += 1
         
-        # Construir bloco if
-        if blocks:
-            block_code = "\n".join(blocks)
-        else:
-            block_code = "    pass"
-        
         # Construir resultado
-        code = f"if {condition}:"
-        if block_code:
-            code += "\n" + block_code
+        code = self._compound(f"if {condition}:", blocks)
         
         # Adicionar else_block se existir
         if else_part:
@@ -560,7 +593,7 @@ class MythonTransformer(Transformer):
         Retorna "else:" sem indentação extra (mesmo nível do if).
         """
         if not children:
-            return "else:\n    pass"
+            return self._compound("else:", [])
         
         # Filtrar tokens INDENT, DEDENT, _NEWLINE, ELSE, ":"
         # Manter apenas block_stmt+ (strings já transformadas)
@@ -575,24 +608,14 @@ class MythonTransformer(Transformer):
                     continue
             
             # Se é string, é um block_stmt já transformado
-            if isinstance(arg, str) and arg.strip():
+            if isinstance(arg, CodeBlock) or (isinstance(arg, str) and arg.strip()):
                 blocks.append(arg)
             # Se é Tree, pode ser block_stmt não transformado (não deveria acontecer)
             elif isinstance(arg, Tree):
                 blocks.append(str(arg))
         
-        # Construir bloco else
-        if blocks:
-            block = "\n".join(stmt for stmt in blocks if stmt.strip())
-        else:
-            block = "    pass"
-        
-        # Construir resultado: else: SEM indentação extra (mesmo nível do if)
-        result = "else:"
-        if block:
-            result += "\n" + block
-        
-        return result
+        # Construir resultado: else: no mesmo nível do if
+        return self._compound("else:", blocks)
     
     # ============================================
     # Loops
@@ -634,7 +657,7 @@ class MythonTransformer(Transformer):
                 continue
             
             # Depois vem block_stmt+ (strings já transformadas)
-            if isinstance(arg, str) and arg.strip():
+            if isinstance(arg, CodeBlock) or (isinstance(arg, str) and arg.strip()):
                 blocks.append(arg)
             # Se é Tree, pode ser block_stmt não transformado (não deveria acontecer)
             elif isinstance(arg, Tree):
@@ -642,18 +665,7 @@ class MythonTransformer(Transformer):
             
             i += 1
         
-        # Construir bloco while
-        if blocks:
-            block_code = "\n".join(blocks)
-        else:
-            block_code = "    pass"
-        
-        # Construir resultado
-        code = f"while {condition}:"
-        if block_code:
-            code += "\n" + block_code
-        
-        return code
+        return self._compound(f"while {condition}:", blocks)
     
     def for_each_stmt(self, children: List[Any]) -> str:
         """
@@ -697,7 +709,7 @@ class MythonTransformer(Transformer):
                 continue
             
             # Depois vem block_stmt+ (strings já transformadas)
-            if isinstance(arg, str) and arg.strip():
+            if isinstance(arg, CodeBlock) or (isinstance(arg, str) and arg.strip()):
                 blocks.append(arg)
             # Se é Tree, pode ser block_stmt não transformado
             elif isinstance(arg, Tree):
@@ -711,18 +723,7 @@ class MythonTransformer(Transformer):
         if not expr_value:
             expr_value = "[]"
         
-        # Construir bloco for
-        if blocks:
-            block_code = "\n".join(blocks)
-        else:
-            block_code = "    pass"
-        
-        # Construir resultado
-        code = f"for {var_name} in {expr_value}:"
-        if block_code:
-            code += "\n" + block_code
-        
-        return code
+        return self._compound(f"for {var_name} in {expr_value}:", blocks)
     
     def repeat_stmt(self, children: List[Any]) -> str:
         """
@@ -758,7 +759,7 @@ class MythonTransformer(Transformer):
                     continue
             
             # Depois vem block_stmt+ (strings já transformadas)
-            if isinstance(arg, str) and arg.strip():
+            if isinstance(arg, CodeBlock) or (isinstance(arg, str) and arg.strip()):
                 blocks.append(arg)
             # Se é Tree, pode ser block_stmt não transformado
             elif isinstance(arg, Tree):
@@ -770,18 +771,7 @@ class MythonTransformer(Transformer):
         if not number_value:
             number_value = "1"
         
-        # Construir bloco repeat
-        if blocks:
-            block_code = "\n".join(blocks)
-        else:
-            block_code = "    pass"
-        
-        # Construir resultado
-        code = f"for _ in range({number_value}):"
-        if block_code:
-            code += "\n" + block_code
-        
-        return code
+        return self._compound(f"for _ in range({number_value}):", blocks)
     
     def break_stmt(self, children: List[Any]) -> str:
         """
@@ -842,23 +832,15 @@ class MythonTransformer(Transformer):
                 continue
             
             # Se é string, é um block_stmt já transformado
-            if isinstance(arg, str) and arg.strip():
+            if isinstance(arg, CodeBlock) or (isinstance(arg, str) and arg.strip()):
                 blocks.append(arg)
             elif isinstance(arg, Tree):
                 blocks.append(str(arg))
             
             i += 1
         
-        # Construir bloco elif
-        if blocks:
-            block_code = "\n".join(blocks)
-        else:
-            block_code = "    pass"
-        
         # Construir resultado
-        code = f"elif {condition}:"
-        if block_code:
-            code += "\n" + block_code
+        code = self._compound(f"elif {condition}:", blocks)
         
         # Adicionar else_block se existir
         if else_part:
@@ -900,51 +882,8 @@ class MythonTransformer(Transformer):
         # Primeiro converter Tree/Token para string usando _expr
         cond_str = self._expr(cond)
         
-        # Normalizar expressões naturais para operadores Python (ordem importa!)
-        # Fazer as mais longas primeiro para evitar substituições parciais
-        replacements = [
-            (" is greater than or equal to ", " >= "),
-            (" greater than or equal to ", " >= "),
-            (" is less than or equal to ", " <= "),
-            (" less than or equal to ", " <= "),
-            (" is greater than ", " > "),
-            (" greater than ", " > "),
-            (" is less than ", " < "),
-            (" less than ", " < "),
-            (" is not equal to ", " != "),
-            (" not equal to ", " != "),
-            (" is at least ", " >= "),
-            (" is at most ", " <= "),
-            (" is over ", " > "),
-            (" is above ", " > "),
-            (" above ", " > "),
-            (" is under ", " < "),
-            (" is below ", " < "),
-            (" below ", " < "),
-            (" equals ", " == "),
-            (" equal to ", " == "),
-        ]
-        
-        for old, new in replacements:
-            if old in cond_str:
-                cond_str = cond_str.replace(old, new)
-        
-        # Substituir "is not in" primeiro (antes de "is not")
-        import re
-        cond_str = re.sub(r'\bis not in\b', ' not in ', cond_str)
-        cond_str = re.sub(r'\bis not\b', ' != ', cond_str)
-        
-        # Substituir "is in" por "in" (mas não "is not in" que já foi processado)
-        cond_str = re.sub(r'\bis in\b', ' in ', cond_str)
-        
-        # Se ainda contém "is" simples (que não foi processado), substituir por ==
-        # Mas só se não for parte de palavras já processadas
-        cond_str = re.sub(r'\bis\b(?!\s+(?:not|in|over|under|above|below|greater|less|at|equal))', ' == ', cond_str)
-        
-        # Limpar espaços múltiplos
-        cond_str = re.sub(r'\s+', ' ', cond_str).strip()
-        
-        return cond_str
+        # Expressões naturais -> operadores Python (ver normalize.py)
+        return _normalize_condition(cond_str)
     
     def comparison(self, args: List[Any]) -> str:
         """
@@ -1229,7 +1168,7 @@ class MythonTransformer(Transformer):
                 continue
             
             # Depois vem block_stmt+ (strings já transformadas)
-            if isinstance(arg, str) and arg.strip():
+            if isinstance(arg, CodeBlock) or (isinstance(arg, str) and arg.strip()):
                 blocks.append(arg)
             # Se é Tree, pode ser block_stmt não transformado
             elif isinstance(arg, Tree):
@@ -1241,18 +1180,7 @@ class MythonTransformer(Transformer):
         if not func_name:
             func_name = "func"
         
-        # Construir bloco da função
-        if blocks:
-            block_code = "\n".join(blocks)
-        else:
-            block_code = "    pass"
-        
-        # Construir resultado
-        code = f"def {func_name}({params_str}):"
-        if block_code:
-            code += "\n" + block_code
-        
-        return code
+        return self._compound(f"def {func_name}({params_str}):", blocks)
     
     def return_stmt(self, children: List[Any]) -> str:
         """
@@ -1886,87 +1814,65 @@ class MythonTransformer(Transformer):
         return f"{func_name}({func_args})"
     
     def _expr(self, expr: Any) -> str:
-        """Converte expressão para string."""
+        """
+        Converte expressão para string.
+        
+        Nós Tree que chegam aqui são regras sem método próprio: o Lark
+        (bottom-up) já transformou os filhos e só deixou o nó como Tree.
+        Os filhos são apenas juntados - sem chamar self.transform() de novo,
+        que revisitaria a subárvore inteira a cada nível de aninhamento.
+        """
         if isinstance(expr, Token):
-            # Se é um Token STRING, retornar diretamente (não processar como string Python)
-            if expr.type == 'STRING':
-                return expr.value
             return expr.value
         elif isinstance(expr, str):
             return expr
         elif hasattr(expr, 'children'):
-            # É um nó da árvore - transformar recursivamente
-            try:
-                # Tentar transformar recursivamente
-                transformed = self.transform(expr)
-                if isinstance(transformed, str):
-                    # Se a string transformada parece quebrada, tentar corrigir
-                    if '\n' in transformed:
-                        lines = transformed.split('\n')
-                        # Se todas as linhas têm apenas um caractere, pode ser uma string quebrada
-                        if all(len(line.strip()) == 1 for line in lines if line.strip()):
-                            # Verificar se juntando forma uma string Python válida
-                            joined = "".join(line.strip() for line in lines if line.strip())
-                            if (joined.startswith('"') and joined.endswith('"')) or (joined.startswith("'") and joined.endswith("'")):
-                                return joined
-                    return transformed
-                else:
-                    # Se não retornou string, tentar transformar children
-                    if hasattr(expr, 'children') and expr.children:
-                        parts = []
-                        for child in expr.children:
-                            part = self._expr(child)
-                            if part:
-                                parts.append(part)
-                        
-                        # Se temos apenas uma parte e é uma string completa, retornar diretamente
-                        if len(parts) == 1 and isinstance(parts[0], str):
-                            return parts[0]
-                        
-                        # Se todos os parts são strings de um caractere, pode ser uma string quebrada
-                        if parts and all(isinstance(p, str) and len(p) == 1 for p in parts):
-                            # Pode ser uma string quebrada - tentar juntar
-                            joined = "".join(parts)
-                            # Se parece com uma string Python (começa e termina com aspas), retornar
-                            if (joined.startswith('"') and joined.endswith('"')) or (joined.startswith("'") and joined.endswith("'")):
-                                return joined
-                        
-                        # Se temos apenas uma string completa entre aspas, retornar diretamente
-                        if len(parts) == 1 and isinstance(parts[0], str) and ((parts[0].startswith('"') and parts[0].endswith('"')) or (parts[0].startswith("'") and parts[0].endswith("'"))):
-                            return parts[0]
-                        
-                        # Juntar as partes normalmente (mas não se for uma string quebrada)
-                        joined = "".join(parts) if parts else str(expr)
-                        # Se o resultado final parece ser uma string Python quebrada, tentar corrigir
-                        if isinstance(joined, str) and '\n' in joined:
-                            lines = joined.split('\n')
-                            if all(len(line.strip()) == 1 for line in lines if line.strip()):
-                                fixed = "".join(line.strip() for line in lines if line.strip())
-                                if (fixed.startswith('"') and fixed.endswith('"')) or (fixed.startswith("'") and fixed.endswith("'")):
-                                    return fixed
-                        return joined
-                    return str(expr)
-            except Exception as e:
-                # Se falhar, tentar transformar children diretamente
-                if hasattr(expr, 'children') and expr.children:
-                    parts = []
-                    for child in expr.children:
-                        part = self._expr(child)
-                        if part:
-                            parts.append(part)
-                    
-                    if len(parts) == 1 and isinstance(parts[0], str):
-                        return parts[0]
-                    
-                    if parts and all(isinstance(p, str) and len(p) == 1 for p in parts):
-                        joined = "".join(parts)
-                        if (joined.startswith('"') and joined.endswith('"')) or (joined.startswith("'") and joined.endswith("'")):
-                            return joined
-                    return "".join(parts) if parts else str(expr)
-                return str(expr)
+            if isinstance(expr, Tree) and getattr(self, expr.data, None) is not None:
+                # Regra com método, mas ainda não transformada (ex.: árvore
+                # montada fora do transform) - transformar uma única vez
+                try:
+                    transformed = self.transform(expr)
+                    if isinstance(transformed, str):
+                        return self._join_broken_string(transformed)
+                except Exception:
+                    pass
+            
+            parts = []
+            for child in expr.children:
+                part = self._expr(child)
+                if part:
+                    parts.append(part)
+            
+            # Se temos apenas uma parte, retornar diretamente
+            if len(parts) == 1:
+                return parts[0]
+            
+            # Se todos os parts são strings de um caractere, pode ser uma string quebrada
+            if parts and all(len(p) == 1 for p in parts):
+                joined = "".join(parts)
+                if self._is_quoted(joined):
+                    return joined
+            
+            # Juntar as partes normalmente
+            joined = "".join(parts) if parts else str(expr)
+            return self._join_broken_string(joined)
         else:
             return str(expr)
     
+    @staticmethod
+    def _is_quoted(text: str) -> bool:
+        """True se o texto parece uma string Python entre aspas."""
+        return (text.startswith('"') and text.endswith('"')) or (text.startswith("'") and text.endswith("'"))
+    
+    def _join_broken_string(self, text: str) -> str:
+        """Junta uma string Python quebrada em linhas de um caractere."""
+        if '\n' in text:
+            lines = [line.strip() for line in text.split('\n') if line.strip()]
+            if all(len(line) == 1 for line in lines):
+                joined = "".join(lines)
+                if self._is_quoted(joined):
+                    return joined
+        return text
     
     def params(self, children: List[Any]) -> str:
         """
@@ -2079,27 +1985,30 @@ class MythonTransformer(Transformer):
         return "[" + ", ".join(items) + "]"
     
     def dict_literal(self, args: List[Any]) -> str:
-        """Dicionário literal usando pair (STRING ":" expr)."""
+        """Dicionário literal usando pair ((STRING | NAME) ":" expr)."""
+        # "{}" chega como [None] (o [pair ...] opcional da gramática)
+        args = [arg for arg in args if arg is not None]
         if not args:
             return "{}"
-        # args é uma lista de pair (cada pair é uma Tree com 2 filhos: STRING e expr)
+        # args é uma lista de pair (já transformados em "chave: valor", ou
+        # Trees com 2 filhos quando chamado por macros com a árvore crua)
         items = []
         for pair in args:
             if isinstance(pair, Tree) and len(pair.children) == 2:
-                key = self._expr(pair.children[0])  # STRING
-                value = self._expr(pair.children[1])  # expr
-                items.append(f"{key}: {value}")
+                items.append(self.pair(pair.children))
             else:
                 # Fallback para formato antigo (se ainda existir)
                 items.append(str(pair))
         return "{" + ", ".join(items) + "}"
     
     def pair(self, args: List[Any]) -> str:
-        """Pair (chave: valor) em dict_literal."""
-        # Este método não é necessário se dict_literal processar diretamente os pairs
-        # Mas pode ser útil para debug
+        """Pair (chave: valor) em dict_literal; chave NAME ganha aspas: {name: 1} -> {"name": 1}."""
         if len(args) == 2:
-            key = self._expr(args[0])
+            key = args[0]
+            if isinstance(key, Token) and key.type == "NAME":
+                key = f'"{key.value}"'
+            else:
+                key = self._expr(key)
             value = self._expr(args[1])
             return f"{key}: {value}"
         return ""
@@ -3,7 +3,7 @@ Transformer para converter AST do Lark em código Python.
 Versão simplificada e corrigida - garante que retorna strings, não Trees.
 """
 
-from lark import Transformer, Token, Tree
+from .lark_runtime import Transformer, Token, Tree
 from typing import List, Any
 
 
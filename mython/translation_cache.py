@@ -0,0 +1,234 @@
+"""
+Cache persistente de traduções de palavras-chave.
+
+Guarda, para cada (língua de origem, palavra), a keyword em inglês que ela
+virou - ou que ela não é keyword (entrada negativa), para que
+identificadores não voltem ao backend de tradução a cada transpilação.
+
+O armazenamento é um banco SQLite (<cache dir>/translations.sqlite3) em
+modo WAL, seguro entre processos. Entradas expiram depois do TTL e, acima
+do limite de entradas, as usadas há mais tempo são removidas (LRU). Sem
+cache em disco (MYTHON_DISK_CACHE=0), o mesmo cache fica só na memória.
+
+O sqlite3 só é importado quando o banco é aberto: transpilar código em
+inglês não passa por aqui.
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, Mapping, Optional, Union
+
+if TYPE_CHECKING:
+    import sqlite3
+
+# Limites padrão - podem ser alterados com MYTHON_TRANSLATION_CACHE_ENTRIES
+# e MYTHON_TRANSLATION_CACHE_DAYS
+DEFAULT_MAX_ENTRIES = 200_000
+DEFAULT_TTL = 30 * 24 * 3600.0
+
+# O "último uso" de uma entrada só é regravado se tiver mais que isto (evita
+# uma escrita no banco a cada acerto)
+_TOUCH_INTERVAL = 3600.0
+
+# Palavras por consulta (limite de parâmetros do SQLite)
+_BATCH = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    source_lang TEXT NOT NULL,
+    word TEXT NOT NULL,
+    keyword TEXT,
+    created REAL NOT NULL,
+    used REAL NOT NULL,
+    PRIMARY KEY (source_lang, word)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS translations_used ON translations (used);
+"""
+
+
+class TranslationCache:
+    """
+    Cache (língua de origem, palavra) -> keyword ou None, com TTL e LRU.
+
+    Seguro entre processos (transações do SQLite, com espera em vez de erro
+    quando outro processo está gravando) e entre threads (uma conexão por
+    cache, protegida por lock). Erros do banco viram faltas: o cache é
+    opcional.
+    """
+
+    def __init__(self, path: Union[str, Path] = ":memory:", max_entries: int = DEFAULT_MAX_ENTRIES,
+                 ttl: Optional[float] = DEFAULT_TTL):
+        self.path = str(path)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stats: Dict[str, int] = {
+            "hits": 0,
+            "negative_hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "evictions": 0,
+        }
+        self._lock = threading.Lock()
+        self._db: Optional["sqlite3.Connection"] = None
+
+    def _connect(self) -> Optional["sqlite3.Connection"]:
+        import sqlite3
+
+        if self._db is None:
+            try:
+                if self.path != ":memory:":
+                    Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+                db = sqlite3.connect(self.path, timeout=10, isolation_level=None, check_same_thread=False)
+                if self.path != ":memory:":
+                    db.execute("PRAGMA journal_mode=WAL")
+                    db.execute("PRAGMA synchronous=NORMAL")
+                db.executescript(_SCHEMA)
+            except (sqlite3.Error, OSError):
+                return None
+            self._db = db
+        return self._db
+
+    def get_many(self, source_lang: str, words: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Entradas válidas das palavras: {palavra: keyword ou None (negativa)}.
+
+        Palavras ausentes ou expiradas ficam de fora (são faltas).
+        """
+        import sqlite3
+
+        words = list(dict.fromkeys(words))
+        found: Dict[str, Optional[str]] = {}
+        if not words:
+            return found
+        now = time.time()
+        oldest = now - self.ttl if self.ttl is not None else float("-inf")
+        with self._lock:
+            db = self._connect()
+            if db is not None:
+                try:
+                    stale = []
+                    for start in range(0, len(words), _BATCH):
+                        chunk = words[start:start + _BATCH]
+                        rows = db.execute(
+                            "SELECT word, keyword, used FROM translations WHERE source_lang = ? "
+                            f"AND created >= ? AND word IN ({','.join('?' * len(chunk))})",
+                            (source_lang, oldest, *chunk),
+                        )
+                        for word, keyword, used in rows:
+                            found[word] = keyword
+                            if used < now - _TOUCH_INTERVAL:
+                                stale.append(word)
+                    if stale:
+                        db.executemany(
+                            "UPDATE translations SET used = ? WHERE source_lang = ? AND word = ?",
+                            [(now, source_lang, word) for word in stale],
+                        )
+                except sqlite3.Error:
+                    found = {}
+            negatives = sum(1 for keyword in found.values() if keyword is None)
+            self.stats["hits"] += len(found) - negatives
+            self.stats["negative_hits"] += negatives
+            self.stats["misses"] += len(words) - len(found)
+        return found
+
+    def put_many(self, source_lang: str, translations: Mapping[str, Optional[str]]):
+        """Grava keywords (ou None para "não é keyword") e aplica os limites."""
+        import sqlite3
+
+        if not translations:
+            return
+        now = time.time()
+        with self._lock:
+            db = self._connect()
+            if db is None:
+                return
+            try:
+                db.execute("BEGIN IMMEDIATE")
+                try:
+                    db.executemany(
+                        "INSERT OR REPLACE INTO translations (source_lang, word, keyword, created, used) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        [(source_lang, word, keyword, now, now) for word, keyword in translations.items()],
+                    )
+                    evicted = self._evict(db, now)
+                    db.execute("COMMIT")
+                except BaseException:
+                    db.execute("ROLLBACK")
+                    raise
+            except sqlite3.Error:
+                # Cache é opcional - falhar silenciosamente
+                return
+            self.stats["writes"] += len(translations)
+            self.stats["evictions"] += evicted
+
+    def _evict(self, db: "sqlite3.Connection", now: float) -> int:
+        """Remove as expiradas e, acima do limite, as usadas há mais tempo."""
+        removed = 0
+        if self.ttl is not None:
+            removed += db.execute("DELETE FROM translations WHERE created < ?", (now - self.ttl,)).rowcount
+        excess = db.execute("SELECT COUNT(*) FROM translations").fetchone()[0] - self.max_entries
+        if excess > 0:
+            removed += db.execute(
+                "DELETE FROM translations WHERE (source_lang, word) IN "
+                "(SELECT source_lang, word FROM translations ORDER BY used LIMIT ?)",
+                (excess,),
+            ).rowcount
+        return removed
+
+    def __len__(self) -> int:
+        import sqlite3
+
+        with self._lock:
+            db = self._connect()
+            if db is None:
+                return 0
+            try:
+                return db.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+            except sqlite3.Error:
+                return 0
+
+    def clear(self):
+        """Remove todas as entradas."""
+        import sqlite3
+
+        with self._lock:
+            db = self._connect()
+            if db is None:
+                return
+            try:
+                db.execute("DELETE FROM translations")
+            except sqlite3.Error:
+                pass
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+_default_cache: Optional[TranslationCache] = None
+
+
+def get_translation_cache() -> TranslationCache:
+    """
+    Retorna o cache de traduções padrão (em <cache dir>/translations.sqlite3).
+
+    Com o cache em disco desativado, retorna um cache só em memória.
+    """
+    global _default_cache
+    if _default_cache is None:
+        from .parser_cache import get_cache_dir
+
+        max_entries = DEFAULT_MAX_ENTRIES
+        if os.environ.get("MYTHON_TRANSLATION_CACHE_ENTRIES"):
+            max_entries = int(os.environ["MYTHON_TRANSLATION_CACHE_ENTRIES"])
+        ttl = DEFAULT_TTL
+        if os.environ.get("MYTHON_TRANSLATION_CACHE_DAYS"):
+            ttl = float(os.environ["MYTHON_TRANSLATION_CACHE_DAYS"]) * 24 * 3600
+        cache_dir = get_cache_dir()
+        path = cache_dir / "translations.sqlite3" if cache_dir is not None else ":memory:"
+        _default_cache = TranslationCache(path, max_entries=max_entries, ttl=ttl)
+    return _default_cache
@@ -1,11 +1,25 @@
 """
 Mython Keyword Translator - Sistema híbrido de tradução
-PRIMARY: LibreTranslate (mais rápido, mais idiomas)
-FALLBACK: Argos Translate (100% offline)
+PADRÃO: dicionários do i18n e Argos Translate (100% offline)
+OPCIONAL: LibreTranslate, só com MYTHON_LIBRETRANSLATE_URL definida
+
+As palavras candidatas de um arquivo inteiro são resolvidas de uma vez
+(translate_keywords_batch), em uma chamada ao backend configurado
+(set_backend): dicionário local, LibreTranslate (inclusive um servidor
+local, via MYTHON_LIBRETRANSLATE_URL) ou Argos. Sem a variável, nenhuma
+palavra do código sai da máquina. Palavras que não são keywords também
+ficam no cache (persistente, ver translation_cache), para nunca serem
+consultadas de novo.
 """
 
+import os
 import re
-from typing import Optional, Set, Dict
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from .patterns import STRING_OR_COMMENT_PATTERN
+from .translation_cache import get_translation_cache
 
 # Palavras-chave do Mython em inglês
 MYTHON_KEYWORDS: Set[str] = {
@@ -27,8 +41,18 @@ MYTHON_KEYWORDS: Set[str] = {
     "with", "match", "case", "lambda",
 }
 
-# Cache de traduções para evitar chamadas repetidas
-_translation_cache: Dict[str, str] = {}
+# Servidor LibreTranslate dos backends criados sem url nem
+# MYTHON_LIBRETRANSLATE_URL. O backend padrão (get_backend) só usa o
+# LibreTranslate quando a variável está definida.
+DEFAULT_LIBRETRANSLATE_URL = "https://libretranslate.com"
+
+
+def libretranslate_url() -> str:
+    """Servidor LibreTranslate configurado em MYTHON_LIBRETRANSLATE_URL ("" = nenhum)."""
+    return os.environ.get("MYTHON_LIBRETRANSLATE_URL", "").strip()
+
+# Strings e comentários (nunca traduzidos) ou palavras
+_CODE_TOKEN_RE = re.compile(STRING_OR_COMMENT_PATTERN + r"|\w+")
 
 
 def translate_libre(word: str, source_lang: str = "auto", target_lang: str = "en") -> Optional[str]:
@@ -72,6 +96,9 @@ def translate_argos(word: str, source_lang: str = "auto", target_lang: str = "en
     """
     Traduz palavra usando Argos Translate (offline).
     
+    Usa o ArgosBackend compartilhado (modelos carregados uma vez); para
+    várias palavras, prefira get_argos_backend().translate_batch.
+    
     Args:
         word: Palavra a traduzir
         source_lang: Idioma de origem (padrão: "auto" para detectar)
@@ -81,122 +108,449 @@ def translate_argos(word: str, source_lang: str = "auto", target_lang: str = "en
         Palavra traduzida ou None em caso de erro
     """
     try:
-        import argostranslate.translate
-        
-        # Se source_lang é "auto", tentar detectar
-        if source_lang == "auto":
-            # Lista de idiomas comuns do Argos
-            common_langs = ["pt", "es", "fr", "de", "it", "ru", "zh", "ja"]
-            for lang in common_langs:
-                try:
-                    translated = argostranslate.translate.translate(word, lang, target_lang)
-                    if translated.lower() in MYTHON_KEYWORDS:
-                        return translated.lower()
-                except:
-                    continue
-            # Tentar tradução genérica
-            translated = argostranslate.translate.translate(word, source_lang, target_lang)
-        else:
-            translated = argostranslate.translate.translate(word, source_lang, target_lang)
-        
-        return translated.strip().lower() if translated else None
-    except ImportError:
-        # Argos não instalado
-        return None
+        return get_argos_backend().translate_batch([word], source_lang, target_lang).get(word)
     except Exception:
-        # Falha na tradução
+        # Argos não instalado ou falha na tradução
         return None
 
 
-def translate_keyword(word: str, use_cache: bool = True) -> str:
+class BackendUnavailable(Exception):
+    """O backend de tradução não pôde responder (sem rede, sem modelo...)."""
+
+
+class TranslationBackend:
+    """
+    Backend de tradução em lote: recebe todas as palavras de uma vez.
+    
+    translate_batch devolve {palavra: tradução} só com as palavras que
+    conseguiu traduzir (as outras ficam de fora). Se o backend não pôde
+    responder (sem rede, sem modelo), levanta uma exceção: as palavras não
+    entram no cache negativo e podem ser consultadas de novo depois.
+    """
+    
+    name = "backend"
+    
+    @property
+    def identity(self) -> str:
+        """Identifica o backend e a configuração que muda as traduções (para caches)."""
+        return self.name
+    
+    def translate_batch(self, words: Sequence[str], source_lang: str = "auto",
+                        target_lang: str = "en") -> Dict[str, str]:
+        raise NotImplementedError
+
+
+class DictionaryBackend(TranslationBackend):
+    """Dicionários do i18n (offline, sem dependências)."""
+    
+    name = "dictionary"
+    
+    def translate_batch(self, words, source_lang="auto", target_lang="en"):
+        from .i18n import SUPPORTED_LANGUAGES, get_dictionary
+        
+        if target_lang != "en":
+            return {}
+        langs = [source_lang] if source_lang != "auto" else [lang for lang in SUPPORTED_LANGUAGES if lang != "en"]
+        indexes = [get_dictionary(lang).reverse for lang in langs]
+        translations = {}
+        for word in words:
+            for index in indexes:
+                translated = index.lookup(word)
+                if translated:
+                    translations[word] = translated
+                    break
+        return translations
+
+
+class LibreTranslateBackend(TranslationBackend):
+    """
+    LibreTranslate: todas as palavras em um único POST (`q` como lista).
+    
+    Args:
+        url: Servidor (padrão: $MYTHON_LIBRETRANSLATE_URL ou libretranslate.com)
+        timeout: Timeout da requisição, em segundos
+    """
+    
+    name = "libretranslate"
+    
+    def __init__(self, url: Optional[str] = None, timeout: float = 5):
+        if url is None:
+            url = os.environ.get("MYTHON_LIBRETRANSLATE_URL", DEFAULT_LIBRETRANSLATE_URL)
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+    
+    @property
+    def identity(self) -> str:
+        return f"{self.name}:{self.url}"
+    
+    def translate_batch(self, words, source_lang="auto", target_lang="en"):
+        if not self.url or not words:
+            return {}
+        import requests
+        
+        words = list(words)
+        response = requests.post(
+            f"{self.url}/translate",
+            json={"q": words, "source": source_lang, "target": target_lang, "format": "text"},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        translated = response.json().get("translatedText", [])
+        if isinstance(translated, str):
+            translated = [translated]
+        return {
+            word: text.strip().lower()
+            for word, text in zip(words, translated)
+            if text and text.strip()
+        }
+
+
+class WordBackend(TranslationBackend):
+    """Adapta uma função de uma palavra (como translate_libre) para o lote."""
+    
+    def __init__(self, translate_word, name: str = "word"):
+        self.translate_word = translate_word
+        self.name = name
+    
+    def translate_batch(self, words, source_lang="auto", target_lang="en"):
+        translations = {}
+        for word in words:
+            translated = self.translate_word(word, source_lang, target_lang)
+            if translated:
+                translations[word] = translated
+        return translations
+
+
+class ArgosBackend(TranslationBackend):
+    """
+    Argos Translate (offline) com os modelos carregados uma vez por processo.
+    
+    Cada par de línguas é resolvido (e o modelo carregado) na primeira vez
+    que é usado; as palavras de um lote vão em uma única tradução por par,
+    uma por linha. Com source_lang="auto" (língua não detectada), tenta as
+    línguas de AUTO_LANGUAGES em ordem, um lote por língua, só com as
+    palavras que ainda não viraram keyword.
+    
+    `stats` separa o tempo de carregar modelos (load_seconds) do tempo de
+    traduzir (translate_seconds).
+    """
+    
+    name = "argostranslate"
+    AUTO_LANGUAGES = ("pt", "es", "fr", "de", "it", "ru", "zh", "ja")
+    
+    def __init__(self):
+        # (origem, destino) -> tradução do Argos, ou None se o par não está instalado
+        self._translations: Dict[Tuple[str, str], object] = {}
+        self._installed: Optional[bool] = None
+        self._lock = threading.Lock()
+        self.stats = {
+            "pairs": 0,
+            "load_seconds": 0.0,
+            "batches": 0,
+            "words": 0,
+            "translate_seconds": 0.0,
+        }
+    
+    def _translation(self, source_lang: str, target_lang: str):
+        key = (source_lang, target_lang)
+        with self._lock:
+            if key not in self._translations:
+                if self._installed is None:
+                    try:
+                        import argostranslate.translate  # noqa: F401
+                        self._installed = True
+                    except ImportError:
+                        self._installed = False
+                if not self._installed:
+                    raise BackendUnavailable("argostranslate não instalado")
+                import argostranslate.translate
+                start = time.perf_counter()
+                languages = {lang.code: lang for lang in argostranslate.translate.get_installed_languages()}
+                translation = None
+                if source_lang in languages and target_lang in languages:
+                    translation = languages[source_lang].get_translation(languages[target_lang])
+                    if translation is not None:
+                        # Carregar o modelo agora, para não contar como tradução
+                        translation.translate("a")
+                        self.stats["pairs"] += 1
+                self.stats["load_seconds"] += time.perf_counter() - start
+                self._translations[key] = translation
+            return self._translations[key]
+    
+    def _translate_lines(self, translation, words: List[str]) -> List[str]:
+        start = time.perf_counter()
+        lines = translation.translate("\n".join(words)).split("\n")
+        if len(lines) != len(words):
+            # O modelo juntou ou quebrou linhas: uma palavra por vez
+            lines = [translation.translate(word) for word in words]
+        self.stats["batches"] += 1
+        self.stats["words"] += len(words)
+        self.stats["translate_seconds"] += time.perf_counter() - start
+        return [line.strip().lower() for line in lines]
+    
+    def translate_batch(self, words, source_lang="auto", target_lang="en"):
+        words = list(words)
+        if not words:
+            return {}
+        if source_lang != "auto":
+            translation = self._translation(source_lang, target_lang)
+            if translation is None:
+                raise BackendUnavailable(f"argostranslate: par {source_lang}->{target_lang} não instalado")
+            return {word: line for word, line in zip(words, self._translate_lines(translation, words)) if line}
+        
+        translations = {}
+        pending = words
+        answered = False
+        for lang in self.AUTO_LANGUAGES:
+            if not pending:
+                break
+            translation = self._translation(lang, target_lang)
+            if translation is None:
+                continue
+            answered = True
+            for word, line in zip(pending, self._translate_lines(translation, pending)):
+                if line in MYTHON_KEYWORDS:
+                    translations[word] = line
+            pending = [word for word in pending if word not in translations]
+        if not answered:
+            raise BackendUnavailable("argostranslate: nenhum par de línguas instalado")
+        return translations
+
+
+_argos_backend: Optional[ArgosBackend] = None
+
+
+def get_argos_backend() -> ArgosBackend:
+    """ArgosBackend compartilhado pelo processo (modelos carregados uma vez)."""
+    global _argos_backend
+    if _argos_backend is None:
+        _argos_backend = ArgosBackend()
+    return _argos_backend
+
+
+class ChainBackend(TranslationBackend):
+    """
+    Backends em sequência: cada um recebe só as palavras que os anteriores
+    não traduziram para uma keyword. Um backend que falha é pulado.
+    """
+    
+    name = "chain"
+    
+    def __init__(self, backends: Iterable[TranslationBackend]):
+        self.backends = list(backends)
+    
+    @property
+    def identity(self) -> str:
+        return f"{self.name}({','.join(backend.identity for backend in self.backends)})"
+    
+    def translate_batch(self, words, source_lang="auto", target_lang="en"):
+        pending = list(words)
+        translations = {}
+        answered = False
+        for backend in self.backends:
+            if not pending:
+                break
+            try:
+                found = backend.translate_batch(pending, source_lang, target_lang)
+            except Exception:
+                continue
+            answered = True
+            for word, translated in found.items():
+                translations[word] = translated
+            pending = [word for word in pending if translations.get(word) not in MYTHON_KEYWORDS]
+        if self.backends and not answered:
+            raise BackendUnavailable("nenhum backend de tradução respondeu")
+        return translations
+
+
+_backend: Optional[TranslationBackend] = None
+
+
+def get_backend() -> TranslationBackend:
+    """
+    Backend atual. Padrão: só backends locais - dicionários do i18n, depois
+    Argos (se instalado). O LibreTranslate assíncrono (palavras em paralelo,
+    conexões reaproveitadas, disjuntor - ver translator_async) entra entre
+    os dois apenas se MYTHON_LIBRETRANSLATE_URL estiver definida: sem ela,
+    nenhum identificador do código é enviado pela rede.
+    """
+    global _backend
+    if _backend is None:
+        backends: List[TranslationBackend] = [DictionaryBackend()]
+        url = libretranslate_url()
+        if url:
+            from .translator_async import AsyncLibreTranslateBackend
+            backends.append(AsyncLibreTranslateBackend(url))
+        backends.append(get_argos_backend())
+        _backend = ChainBackend(backends)
+    return _backend
+
+
+def backend_identity() -> str:
+    """identity do backend atual (entra na chave do cache de resultados)."""
+    return get_backend().identity
+
+
+def set_backend(backend: Optional[TranslationBackend]):
+    """Troca o backend de tradução (None = voltar ao padrão)."""
+    global _backend
+    _backend = backend
+
+
+def translate_keywords_batch(words: Iterable[str], source_lang: str = "auto", target_lang: str = "en",
+                             backend: Optional[TranslationBackend] = None,
+                             use_cache: bool = True) -> Dict[str, str]:
+    """
+    Resolve de uma vez as palavras candidatas de um arquivo.
+    
+    Só as palavras que não estão no cache (persistente - ver
+    translation_cache) vão ao backend, em uma única chamada; as que não
+    viram keyword são guardadas como negativas. As entradas do cache são
+    separadas por backend (identity): trocar de backend não reaproveita
+    respostas de outro.
+    
+    Args:
+        words: Palavras candidatas (repetidas são ignoradas)
+        source_lang: Idioma de origem ("auto" = o backend decide)
+        target_lang: Idioma de destino (padrão: "en")
+        backend: Backend a usar (padrão: get_backend())
+        use_cache: Se True, consulta e preenche o cache
+    
+    Returns:
+        {palavra: keyword em inglês} só para as palavras que são keywords
+    """
+    backend = backend or get_backend()
+    cache_lang = f"{backend.identity}/{source_lang}"
+    resolved: Dict[str, str] = {}
+    pending: List[str] = []
+    for word in dict.fromkeys(word.strip().lower() for word in words):
+        if word in MYTHON_KEYWORDS:
+            resolved[word] = word
+        else:
+            pending.append(word)
+    
+    if pending and use_cache:
+        cached = get_translation_cache().get_many(cache_lang, pending)
+        for word, keyword in cached.items():
+            if keyword is not None:
+                resolved[word] = keyword
+        pending = [word for word in pending if word not in cached]
+    
+    if pending:
+        try:
+            found = backend.translate_batch(pending, source_lang, target_lang)
+        except Exception:
+            # Backend indisponível: sem tradução agora, sem cache negativo
+            return resolved
+        answers = {}
+        for word in pending:
+            translated = found.get(word)
+            answers[word] = keyword = translated if translated in MYTHON_KEYWORDS else None
+            if keyword is not None:
+                resolved[word] = keyword
+        if use_cache:
+            get_translation_cache().put_many(cache_lang, answers)
+    return resolved
+
+
+def translate_keyword(word: str, use_cache: bool = True, source_lang: str = "auto") -> str:
     """
     Traduz uma palavra para keyword do Mython (inglês).
     
     Sistema híbrido:
     1. Verifica se já é keyword em inglês
-    2. Verifica cache
-    3. Tenta LibreTranslate (online)
-    4. Fallback para Argos Translate (offline)
-    5. Se não traduzir, retorna palavra original (identificador)
+    2. Verifica cache (inclusive de palavras que não são keywords)
+    3. Consulta o backend (LibreTranslate e, como fallback, Argos Translate)
+    4. Se não traduzir, retorna palavra original (identificador)
+    
+    Para um arquivo inteiro, prefira translate_keywords_batch (uma chamada
+    ao backend para todas as palavras).
     
     Args:
         word: Palavra a traduzir
         use_cache: Se True, usa cache de traduções anteriores
+        source_lang: Idioma de origem ("auto" para detectar)
     
     Returns:
         Keyword traduzida em inglês ou palavra original se não for keyword
     """
     # Normalizar: minúsculas, sem espaços
     word = word.strip().lower()
-    
-    # 1. Já é keyword em inglês?
-    if word in MYTHON_KEYWORDS:
-        return word
-    
-    # 2. Verificar cache
-    if use_cache and word in _translation_cache:
-        cached = _translation_cache[word]
-        if cached in MYTHON_KEYWORDS:
-            return cached
-    
-    # 3. Tentar LibreTranslate (PRIMARY - online)
-    translated = translate_libre(word)
-    if translated and translated in MYTHON_KEYWORDS:
-        _translation_cache[word] = translated
-        return translated
-    
-    # 4. Fallback Argos Translate (offline)
-    translated = translate_argos(word)
-    if translated and translated in MYTHON_KEYWORDS:
-        _translation_cache[word] = translated
-        return translated
-    
-    # 5. Não é keyword → é variável/identificador normal
-    return word
+    return translate_keywords_batch([word], source_lang, use_cache=use_cache).get(word, word)
+
 
+def _is_candidate(word: str) -> bool:
+    # Só palavras que parecem keyword (não é número, não começa com maiúscula)
+    return word.isalpha() and not word[0].isupper() and word.lower() not in MYTHON_KEYWORDS
 
-def translate_code(code: str, use_cache: bool = True) -> str:
+
+def translate_code(code: str, use_cache: bool = True, source_lang: str = "auto", target_lang: str = "en",
+                   backend: Optional[TranslationBackend] = None) -> str:
     """
     Traduz código Mython multilíngue para inglês.
     
-    Apenas palavras-chave são traduzidas. Identificadores, strings
-    e outros tokens permanecem inalterados.
+    Apenas palavras-chave são traduzidas. Identificadores, strings,
+    comentários e outros tokens permanecem inalterados.
+    
+    1. Se a língua de origem tem dicionário (pt, es), ele traduz primeiro
+       (i18n.translate_code, local).
+    2. As palavras que sobraram vão todas juntas ao backend, em uma única
+       chamada (translate_keywords_batch).
     
     Args:
         code: Código Mython em qualquer língua
         use_cache: Se True, usa cache de traduções
+        source_lang: Idioma de origem ("auto" = detectar)
+        target_lang: Idioma de destino (só "en": as keywords são em inglês)
+        backend: Backend para as palavras fora do dicionário (padrão: get_backend())
     
     Returns:
         Código traduzido para inglês (apenas keywords)
     """
-    lines = code.split('\n')
-    translated_lines = []
+    if target_lang != "en":
+        raise ValueError(f"keywords do Mython são em inglês, não '{target_lang}'")
     
-    for line in lines:
-        # Encontrar todas as palavras na linha
-        words = re.findall(r'\b\w+\b', line)
-        
-        # Traduzir cada palavra
-        translated_line = line
-        for word in words:
-            # Tentar traduzir apenas se parece ser keyword (não é número, não começa com maiúscula após primeira letra)
-            if word.isalpha() and not word[0].isupper():
-                translated_word = translate_keyword(word, use_cache=use_cache)
-                # Substituir apenas se diferente (foi traduzido)
-                if translated_word != word.lower():
-                    # Substituir palavra mantendo maiúsculas/minúsculas originais
-                    pattern = r'\b' + re.escape(word) + r'\b'
-                    translated_line = re.sub(pattern, translated_word, translated_line, count=1)
-        
-        translated_lines.append(translated_line)
+    try:
+        from . import i18n
+    except ImportError:
+        i18n = None
+    known = {}
+    if i18n is not None:
+        if source_lang == "auto":
+            source_lang = i18n.detect_language(code)
+        if source_lang == "en":
+            return code
+        known = i18n.load_dictionary(source_lang)
+        if known:
+            code = i18n.translate_code(code, lang=source_lang, reverse=True)
+    
+    # Palavras em inglês vindas do dicionário não precisam ir ao backend
+    candidates = {token for token in _CODE_TOKEN_RE.findall(code) if _is_candidate(token) and token not in known}
+    if not candidates:
+        return code
+    translations = translate_keywords_batch(candidates, source_lang, target_lang, backend, use_cache)
+    if not translations:
+        return code
+    
+    def translate_word(match):
+        word = match.group()
+        if _is_candidate(word):
+            return translations.get(word.lower(), word)
+        return word
     
-    return '\n'.join(translated_lines)
+    # Uma passada só sobre o código (strings e comentários intactos)
+    return _CODE_TOKEN_RE.sub(translate_word, code)
 
 
 def clear_cache():
-    """Limpa o cache de traduções."""
-    global _translation_cache
-    _translation_cache.clear()
+    """Limpa o cache de traduções (inclusive o persistente)."""
+    get_translation_cache().clear()
+
+
+def cache_stats() -> Dict[str, int]:
+    """Acertos (positivos e negativos), faltas, gravações, remoções e entradas do cache."""
+    cache = get_translation_cache()
+    return dict(cache.stats, entries=len(cache))
 
 
 def is_keyword(word: str) -> bool:
@@ -212,10 +566,18 @@ def is_keyword(word: str) -> bool:
     return word.lower() in MYTHON_KEYWORDS
 
 
-def get_available_translators() -> Dict[str, bool]:
+# Resultado de get_available_translators: (momento da verificação, status)
+_available_translators: Optional[Tuple[float, Dict[str, bool]]] = None
+AVAILABILITY_TTL = 60.0
+
+
+def get_available_translators(refresh: bool = False) -> Dict[str, bool]:
     """
     Verifica quais tradutores estão disponíveis.
     
+    O resultado é reaproveitado por AVAILABILITY_TTL segundos (a verificação
+    do LibreTranslate é uma requisição de rede); refresh=True força uma nova.
+    
     Returns:
         Dicionário com status de cada tradutor:
         {
@@ -223,19 +585,31 @@ def get_available_translators() -> Dict[str, bool]:
             "argostranslate": True/False
         }
     """
+    global _available_translators
+    now = time.monotonic()
+    if not refresh and _available_translators is not None and now - _available_translators[0] < AVAILABILITY_TTL:
+        return dict(_available_translators[1])
+    
     available = {
         "libretranslate": False,
         "argostranslate": False,
     }
     
-    # Verificar LibreTranslate
-    try:
-        import requests
-        # Testar se consegue fazer uma requisição
-        response = requests.get("https://libretranslate.com", timeout=2)
-        available["libretranslate"] = response.status_code < 500
-    except:
-        pass
+    # Verificar LibreTranslate: só o servidor configurado (sem
+    # MYTHON_LIBRETRANSLATE_URL, nenhuma requisição); com o disjuntor
+    # aberto, nem tenta
+    breaker = getattr(_backend_libre(), "breaker", None)
+    url = libretranslate_url()
+    if url and (breaker is None or breaker.state != "open"):
+        from urllib.error import HTTPError
+        from urllib.request import urlopen
+        try:
+            with urlopen(url, timeout=2) as response:
+                available["libretranslate"] = response.status < 500
+        except HTTPError as e:
+            available["libretranslate"] = e.code < 500
+        except Exception:
+            pass
     
     # Verificar Argos Translate
     try:
@@ -244,5 +618,14 @@ def get_available_translators() -> Dict[str, bool]:
     except ImportError:
         pass
     
-    return available
+    _available_translators = (now, available)
+    return dict(available)
+
 
+def _backend_libre() -> Optional[TranslationBackend]:
+    """O backend LibreTranslate da cadeia padrão, se já foi criado."""
+    backends = _backend.backends if isinstance(_backend, ChainBackend) else [_backend]
+    for backend in backends:
+        if backend is not None and backend.name.startswith("libretranslate"):
+            return backend
+    return None
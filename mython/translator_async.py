@@ -0,0 +1,316 @@
+"""
+Backend assíncrono do LibreTranslate para o tradutor de palavras-chave.
+
+As palavras de um arquivo são consultadas ao mesmo tempo (até
+`concurrency` requisições em voo), por um cliente HTTP/1.1 com conexões
+keep-alive reaproveitadas entre chamadas: o tempo total fica perto de uma
+ida e volta ao servidor, em vez de uma por palavra.
+
+Um disjuntor (CircuitBreaker) para de chamar um servidor fora do ar: depois
+de `failure_threshold` falhas seguidas, as chamadas falham na hora durante
+`cooldown` segundos; então uma única requisição de sonda decide se ele volta
+a fechar (as outras continuam falhando na hora até a resposta dela).
+
+Só usa a biblioteca padrão (asyncio); o laço de eventos roda em uma thread
+própria, então o backend pode ser usado de código síncrono (translator).
+As conexões ociosas e o laço são fechados por close(), chamado também na
+saída do processo (atexit).
+"""
+
+import asyncio
+import atexit
+import json
+import os
+import socket
+import ssl
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from .translator import DEFAULT_LIBRETRANSLATE_URL, BackendUnavailable, TranslationBackend
+
+
+class CircuitBreaker:
+    """
+    Disjuntor: fechado (chamadas passam), aberto (falham na hora) ou
+    meio-aberto (passado o cooldown, só uma chamada de sonda passa e a
+    resposta dela decide).
+    """
+
+    def __init__(self, failure_threshold: int = 3, cooldown: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.cooldown:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        """
+        Se uma chamada pode ser feita agora. No meio-aberto, só a primeira
+        chamada (a sonda) recebe True até registrar sucesso ou falha.
+        """
+        with self._lock:
+            state = self.state
+            if state == "half-open" and not self._probing:
+                self._probing = True
+                return True
+            return state == "closed"
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            # No meio-aberto as falhas já passaram do limite: reabre na hora
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+class HTTPConnectionPool:
+    """
+    Conexões HTTP/1.1 keep-alive para um servidor (um laço de eventos só).
+
+    Uma conexão ociosa que o servidor fechou é descartada e a requisição é
+    repetida uma vez em uma conexão nova.
+    """
+
+    def __init__(self, url: str, size: int = 8, timeout: float = 5.0):
+        parts = urlsplit(url)
+        self.https = parts.scheme == "https"
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port or (443 if self.https else 80)
+        self.base_path = parts.path.rstrip("/")
+        self.size = size
+        self.timeout = timeout
+        self.stats: Dict[str, int] = {"connections": 0, "requests": 0, "reused": 0}
+        self._host_header = self.host if parts.port is None else f"{self.host}:{self.port}"
+        self._ssl = ssl.create_default_context() if self.https else None
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+
+    async def _connect(self):
+        self.stats["connections"] += 1
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port, ssl=self._ssl), self.timeout
+        )
+        # Requisições pequenas de ida e volta: sem esperar pelo algoritmo de Nagle
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return reader, writer
+
+    async def request(self, method: str, path: str, body: bytes = b"") -> Tuple[int, bytes]:
+        """Faz a requisição e retorna (status, corpo)."""
+        self.stats["requests"] += 1
+        while self._idle:
+            reader, writer = self._idle.pop()
+            if reader.at_eof() or writer.is_closing():
+                writer.close()
+                continue
+            self.stats["reused"] += 1
+            try:
+                return await self._send((reader, writer), method, path, body)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                # O servidor fechou a conexão ociosa - tentar em uma nova
+                break
+        return await self._send(await self._connect(), method, path, body)
+
+    async def _send(self, connection, method: str, path: str, body: bytes) -> Tuple[int, bytes]:
+        try:
+            status, data, keep_alive = await asyncio.wait_for(
+                self._roundtrip(connection, method, path, body), self.timeout
+            )
+        except BaseException:
+            connection[1].close()
+            raise
+        if keep_alive and len(self._idle) < self.size:
+            self._idle.append(connection)
+        else:
+            connection[1].close()
+        return status, data
+
+    async def _roundtrip(self, connection, method: str, path: str, body: bytes):
+        reader, writer = connection
+        head = (
+            f"{method} {self.base_path}{path} HTTP/1.1\r\n"
+            f"Host: {self._host_header}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: keep-alive\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError("conexão fechada pelo servidor")
+        version, status = status_line.decode("latin-1").split(None, 2)[:2]
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        keep_alive = version != "HTTP/1.0" and headers.get("connection", "").lower() != "close"
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            data = b"".join(chunks)
+        elif "content-length" in headers:
+            data = await reader.readexactly(int(headers["content-length"]))
+        else:
+            data = await reader.read()
+            keep_alive = False
+        return int(status), data, keep_alive
+
+    def close(self):
+        while self._idle:
+            self._idle.pop()[1].close()
+
+    async def aclose(self):
+        """Fecha as conexões ociosas e espera o transporte terminar (no laço do pool)."""
+        idle, self._idle = self._idle, []
+        for _, writer in idle:
+            writer.close()
+        for _, writer in idle:
+            try:
+                await writer.wait_closed()
+            except (OSError, asyncio.IncompleteReadError):
+                pass
+
+
+class AsyncLibreTranslateBackend(TranslationBackend):
+    """
+    LibreTranslate com uma requisição por palavra, todas ao mesmo tempo.
+
+    Args:
+        url: Servidor (padrão: $MYTHON_LIBRETRANSLATE_URL ou libretranslate.com)
+        concurrency: Máximo de requisições em voo (e de conexões no pool)
+        timeout: Timeout de cada requisição, em segundos
+        breaker: Disjuntor (padrão: 3 falhas seguidas abrem por 30 s)
+    """
+
+    name = "libretranslate-async"
+
+    def __init__(self, url: Optional[str] = None, concurrency: int = 8, timeout: float = 5.0,
+                 breaker: Optional[CircuitBreaker] = None):
+        if url is None:
+            url = os.environ.get("MYTHON_LIBRETRANSLATE_URL", DEFAULT_LIBRETRANSLATE_URL)
+        self.url = url.rstrip("/")
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.breaker = breaker or CircuitBreaker()
+        self.pool: Optional[HTTPConnectionPool] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def identity(self) -> str:
+        return f"{self.name}:{self.url}"
+
+    def _event_loop(self) -> asyncio.AbstractEventLoop:
+        """Laço de eventos do backend (em uma thread daemon, criado uma vez)."""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="mython-translator", daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+                # Conexões keep-alive abertas na saída viram avisos do
+                # StreamWriter.__del__ com o interpretador já desmontado
+                atexit.register(self.close)
+        return self._loop
+
+    async def _translate_word(self, word: str, source_lang: str, target_lang: str,
+                              semaphore: asyncio.Semaphore, failed: List[str]) -> Optional[str]:
+        async with semaphore:
+            if not self.breaker.allow():
+                failed.append(word)
+                return None
+            body = json.dumps({"q": word, "source": source_lang, "target": target_lang, "format": "text"})
+            try:
+                status, data = await self.pool.request("POST", "/translate", body.encode("utf-8"))
+                if status >= 500:
+                    raise ConnectionError(f"HTTP {status}")
+                translated = json.loads(data).get("translatedText", "") if status == 200 else ""
+            except (OSError, ValueError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+                self.breaker.record_failure()
+                failed.append(word)
+                return None
+            self.breaker.record_success()
+        # Resposta 4xx ou vazia: o servidor respondeu, só não há tradução
+        return translated.strip().lower() if isinstance(translated, str) and translated.strip() else None
+
+    async def translate_many(self, words: Sequence[str], source_lang: str = "auto",
+                             target_lang: str = "en") -> Dict[str, str]:
+        """Versão assíncrona de translate_batch (rodar no laço do backend)."""
+        if self.pool is None:
+            self.pool = HTTPConnectionPool(self.url, size=self.concurrency, timeout=self.timeout)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        failed: List[str] = []
+        words = list(words)
+        results: List[Optional[str]] = []
+        if words and self.breaker.state != "closed":
+            # Meio-aberto: a primeira palavra sonda o servidor sozinha; se ele
+            # voltou, as demais seguem normalmente, senão falham na hora
+            results.append(await self._translate_word(words[0], source_lang, target_lang, semaphore, failed))
+        results += await asyncio.gather(*(
+            self._translate_word(word, source_lang, target_lang, semaphore, failed) for word in words[len(results):]
+        ))
+        if failed:
+            # Sem resposta para algumas palavras: nada vai para o cache negativo
+            raise BackendUnavailable(f"{self.url}: {len(failed)} palavra(s) sem resposta")
+        return {word: translated for word, translated in zip(words, results) if translated}
+
+    def translate_batch(self, words, source_lang="auto", target_lang="en"):
+        if not self.url or not words:
+            return {}
+        if self.breaker.state == "open":
+            raise BackendUnavailable(f"{self.url}: disjuntor aberto")
+        future = asyncio.run_coroutine_threadsafe(
+            self.translate_many(list(words), source_lang, target_lang), self._event_loop()
+        )
+        return future.result()
+
+    def close(self, timeout: float = 2.0):
+        """Fecha as conexões, espera o laço de eventos parar e o encerra."""
+        with self._lock:
+            loop, self._loop = self._loop, None
+            thread, self._thread = self._thread, None
+        pool, self.pool = self.pool, None
+        if loop is None:
+            return
+        atexit.unregister(self.close)
+        if pool is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(pool.aclose(), loop).result(timeout)
+            except Exception:
+                # Laço travado: fechar os sockets daqui mesmo
+                pool.close()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
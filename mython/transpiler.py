@@ -2,8 +2,9 @@
 Transpiler principal: converte código .logic para Python.
 """
 
+import re
 from pathlib import Path
-from typing import List
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 
 def normalize_condition(text: str) -> str:
@@ -75,79 +76,90 @@ def translate_expression(
     return translated.strip()
 
 
-def translate_line(line: str, in_class: bool = False, has_staticmethod: bool = False, has_classmethod: bool = False) -> str:
-    """
-    Traduz uma linha de código .logic para Python.
-    
-    Args:
-        line: Linha do arquivo .logic (com indentação preservada)
-        in_class: Se estamos dentro de uma classe (para adicionar self aos métodos)
-        
-    Returns:
-        Linha Python equivalente
-    """
-    indent_size = len(line) - len(line.lstrip(" "))
-    indent = " " * indent_size
-    stripped = line.strip()
-    
-    # Linha vazia
-    if stripped == "":
-        return ""
-    
-    # Comentário
-    if stripped.startswith("#"):
-        return indent + stripped
-    
+class _Line:
+    """Linha sendo traduzida: indentação, texto sem espaços nas pontas e contexto."""
+
+    __slots__ = ("indent", "indent_size", "stripped", "in_class", "has_staticmethod", "has_classmethod")
+
+    def __init__(self, line: str, in_class: bool, has_staticmethod: bool, has_classmethod: bool):
+        self.indent_size = len(line) - len(line.lstrip(" "))
+        self.indent = " " * self.indent_size
+        self.stripped = line.strip()
+        self.in_class = in_class
+        self.has_staticmethod = has_staticmethod
+        self.has_classmethod = has_classmethod
+
+    def expr(self, text: str) -> str:
+        """Traduz uma subexpressão no mesmo contexto."""
+        return translate_expression(
+            text,
+            in_class=self.in_class,
+            has_staticmethod=self.has_staticmethod,
+            has_classmethod=self.has_classmethod,
+        )
+
+
+# Tradutores de construções, na ordem em que são tentados: (função, primeiras
+# palavras). Cada função retorna a linha Python ou None (não é com ela).
+# Funções sem primeiras palavras (o padrão pode estar em qualquer lugar da
+# linha, como " += ") são tentadas em todas as linhas.
+_HANDLERS: List[Tuple[Callable[[_Line], Optional[str]], Tuple[str, ...]]] = []
+
+# Primeira palavra de uma linha: até o primeiro espaço ou "(" ("init(x):" → "init")
+_FIRST_WORD_RE = re.compile(r"[^ (]*")
+
+
+def _handles(*first_words: str):
+    """Registra um tradutor para as linhas que começam com estas palavras."""
+    def register(func):
+        _HANDLERS.append((func, first_words))
+        return func
+    return register
+
+
+@_handles("say", "print", "show", "display", "tell")
+def _say(line: _Line) -> Optional[str]:
     # say / print / show / display / tell
+    stripped = line.stripped
     if stripped.startswith("say ") or stripped.startswith("print ") or stripped.startswith("show ") or stripped.startswith("display ") or stripped.startswith("tell "):
         # Extrair o comando usado
-        if stripped.startswith("say "):
-            content = stripped[len("say "):]
-        elif stripped.startswith("print "):
-            content = stripped[len("print "):]
-        elif stripped.startswith("show "):
-            content = stripped[len("show "):]
-        elif stripped.startswith("display "):
-            content = stripped[len("display "):]
-        else:  # tell
-            content = stripped[len("tell "):]
-        content_py = translate_expression(
-            content,
-            in_class=in_class,
-            has_staticmethod=has_staticmethod,
-            has_classmethod=has_classmethod,
-        )
-        return indent + f"print({content_py})"
-    
+        content = stripped.split(" ", 1)[1]
+        return line.indent + f"print({line.expr(content)})"
+    return None
+
+
+@_handles("ask", "get", "read")
+def _ask_number(line: _Line) -> Optional[str]:
     # ask number / ask for number / get number / read number
+    stripped = line.stripped
     if stripped.startswith("ask number ") or stripped.startswith("ask for number ") or stripped.startswith("get number ") or stripped.startswith("read number "):
         # ask number age "your age"
         # ask for number age "your age"
-        if stripped.startswith("ask number "):
-            parts = stripped.split(" ", 3)
-        elif stripped.startswith("ask for number "):
+        if stripped.startswith("ask for number "):
             parts = stripped[len("ask for number "):].split(" ", 1)
             if len(parts) == 2:
                 parts = ["ask", "number", parts[0], parts[1]]
             else:
                 parts = ["ask", "number", parts[0], '""']
-        elif stripped.startswith("get number "):
+        else:  # ask number / get number / read number
             parts = stripped.split(" ", 3)
             parts[0] = "ask"
-        else:  # read number
-            parts = stripped.split(" ", 3)
-            parts[0] = "ask"
-        
+
         if len(parts) >= 4:
             var_name = parts[2]
             question = parts[3]
-            return indent + f'{var_name} = int(input({question}))'
+            return line.indent + f'{var_name} = int(input({question}))'
         # Fallback se não tiver aspas
         var_name = parts[2] if len(parts) > 2 else "value"
-        return indent + f'{var_name} = int(input())'
-    
+        return line.indent + f'{var_name} = int(input())'
+    return None
+
+
+@_handles("ask", "get", "read", "prompt")
+def _ask(line: _Line) -> Optional[str]:
     # ask / ask for / get / read / prompt
-    if stripped.startswith("ask ") or stripped.startswith("ask for ") or stripped.startswith("get ") or stripped.startswith("read ") or stripped.startswith("prompt "):
+    stripped = line.stripped
+    if stripped.startswith("ask ") or stripped.startswith("get ") or stripped.startswith("read ") or stripped.startswith("prompt "):
         # ask name "your name"
         # ask for name "your name"
         if stripped.startswith("ask for "):
@@ -156,48 +168,42 @@ def translate_line(line: str, in_class: bool = False, has_staticmethod: bool = F
                 parts = ["ask", parts[0], parts[1]]
             else:
                 parts = ["ask", parts[0], '""']
-        elif stripped.startswith("get "):
-            parts = stripped.split(" ", 2)
-            parts[0] = "ask"
-        elif stripped.startswith("read "):
-            parts = stripped.split(" ", 2)
-            parts[0] = "ask"
-        elif stripped.startswith("prompt "):
-            parts = stripped.split(" ", 2)
-            parts[0] = "ask"
         else:
             parts = stripped.split(" ", 2)
-        
+
         if len(parts) >= 3:
             var_name = parts[1]
             question = parts[2]
-            return indent + f'{var_name} = input({question})'
+            return line.indent + f'{var_name} = input({question})'
         # Fallback se não tiver aspas
         var_name = parts[1] if len(parts) > 1 else "value"
-        return indent + f'{var_name} = input()'
-    
+        return line.indent + f'{var_name} = input()'
+    return None
+
+
+@_handles("if", "when", "whenever")
+def _if(line: _Line) -> Optional[str]:
     # if / when / whenever
+    stripped = line.stripped
     if (stripped.startswith("if ") or stripped.startswith("when ") or stripped.startswith("whenever ")) and stripped.endswith(":"):
-        if stripped.startswith("if "):
-            condition_text = stripped[len("if "):-1]
-        elif stripped.startswith("when "):
-            condition_text = stripped[len("when "):-1]
-        else:  # whenever
-            condition_text = stripped[len("whenever "):-1]
+        condition_text = stripped.split(" ", 1)[1][:-1]
         condition_py = normalize_condition(condition_text)
-        condition_expr = translate_expression(
-            condition_py,
-            in_class=in_class,
-            has_staticmethod=has_staticmethod,
-            has_classmethod=has_classmethod,
-        )
-        return indent + f"if {condition_expr}:"
-    
+        return line.indent + f"if {line.expr(condition_py)}:"
+    return None
+
+
+@_handles("else:", "otherwise:")
+def _else(line: _Line) -> Optional[str]:
     # else / otherwise
-    if stripped == "else:" or stripped == "otherwise:":
-        return indent + "else:"
-    
+    if line.stripped == "else:" or line.stripped == "otherwise:":
+        return line.indent + "else:"
+    return None
+
+
+@_handles("elif", "else", "or")
+def _elif(line: _Line) -> Optional[str]:
     # elif / else if / or if
+    stripped = line.stripped
     if (stripped.startswith("elif ") or stripped.startswith("else if ") or stripped.startswith("or if ")) and stripped.endswith(":"):
         if stripped.startswith("elif "):
             condition_text = stripped[len("elif "):-1]
@@ -206,47 +212,44 @@ def translate_line(line: str, in_class: bool = False, has_staticmethod: bool = F
         else:  # or if
             condition_text = stripped[len("or if "):-1]
         condition_py = normalize_condition(condition_text)
-        condition_expr = translate_expression(
-            condition_py,
-            in_class=in_class,
-            has_staticmethod=has_staticmethod,
-            has_classmethod=has_classmethod,
-        )
-        return indent + f"elif {condition_expr}:"
-    
+        return line.indent + f"elif {line.expr(condition_py)}:"
+    return None
+
+
+@_handles("repeat", "do", "loop")
+def _repeat(line: _Line) -> Optional[str]:
     # repeat / do / loop
+    stripped = line.stripped
     if (stripped.startswith("repeat ") or stripped.startswith("do ") or stripped.startswith("loop ")) and (" times:" in stripped or " time:" in stripped):
         # repeat 3 times: / do 3 times: / loop 3 times:
-        if stripped.startswith("repeat "):
-            base = stripped[len("repeat "):]
-        elif stripped.startswith("do "):
-            base = stripped[len("do "):]
-        else:  # loop
-            base = stripped[len("loop "):]
-        
+        base = stripped.split(" ", 1)[1]
+
         if " times:" in base:
             middle = base[:-len(" times:")].strip()
         else:  # time:
             middle = base[:-len(" time:")].strip()
-        middle_expr = translate_expression(
-            middle,
-            in_class=in_class,
-            has_staticmethod=has_staticmethod,
-            has_classmethod=has_classmethod,
-        )
-        return indent + f"for _ in range({middle_expr}):"
-    
+        return line.indent + f"for _ in range({line.expr(middle)}):"
+    return None
+
+
+@_handles("list", "create", "make")
+def _list(line: _Line) -> Optional[str]:
     # list / create list / make list
-    if stripped.startswith("list ") or stripped.startswith("create list ") or stripped.startswith("make list "):
+    stripped = line.stripped
+    if stripped.startswith("list "):
         # list names = ["ana","bob"] / create list names = [...] / make list names = [...]
-        if stripped.startswith("list "):
-            return indent + stripped[len("list "):]
-        elif stripped.startswith("create list "):
-            return indent + stripped[len("create list "):]
-        else:  # make list
-            return indent + stripped[len("make list "):]
-    
+        return line.indent + stripped[len("list "):]
+    if stripped.startswith("create list "):
+        return line.indent + stripped[len("create list "):]
+    if stripped.startswith("make list "):
+        return line.indent + stripped[len("make list "):]
+    return None
+
+
+@_handles("add", "append", "put", "insert")
+def _add_to_list(line: _Line) -> Optional[str]:
     # add to list / append to / put into / insert into
+    stripped = line.stripped
     if (stripped.startswith("add ") or stripped.startswith("append ") or stripped.startswith("put ") or stripped.startswith("insert ")) and (" to " in stripped or " into " in stripped):
         # add "carlos" to names / append "carlos" to names / put "carlos" into names
         if stripped.startswith("add ") and " to " in stripped:
@@ -268,15 +271,14 @@ def translate_line(line: str, in_class: bool = False, has_staticmethod: bool = F
 
         value = before.strip()
         list_name = after.strip()
-        value_expr = translate_expression(
-            value,
-            in_class=in_class,
-            has_staticmethod=has_staticmethod,
-            has_classmethod=has_classmethod,
-        )
-        return indent + f"{list_name}.append({value_expr})"
-    
+        return line.indent + f"{list_name}.append({line.expr(value)})"
+    return None
+
+
+@_handles("remove", "delete", "take")
+def _remove_from_list(line: _Line) -> Optional[str]:
     # remove from list / delete from / take out from
+    stripped = line.stripped
     if (stripped.startswith("remove ") or stripped.startswith("delete ") or stripped.startswith("take out ")) and " from " in stripped:
         # remove "ana" from names / delete "ana" from names / take out "ana" from names
         if stripped.startswith("remove "):
@@ -287,131 +289,85 @@ def translate_line(line: str, in_class: bool = False, has_staticmethod: bool = F
             before, after = stripped[len("take out "):].split(" from ", 1)
         value = before.strip()
         list_name = after.strip()
-        value_expr = translate_expression(
-            value,
-            in_class=in_class,
-            has_staticmethod=has_staticmethod,
-            has_classmethod=has_classmethod,
-        )
-        return indent + f"{list_name}.remove({value_expr})"
-    
+        return line.indent + f"{list_name}.remove({line.expr(value)})"
+    return None
+
+
+@_handles("for", "loop", "iterate")
+def _for_each(line: _Line) -> Optional[str]:
     # for each / for every / loop through / iterate over
+    stripped = line.stripped
     if ((stripped.startswith("for each ") or stripped.startswith("for every ") or stripped.startswith("loop through ") or stripped.startswith("iterate over ")) and " in " in stripped and stripped.endswith(":")) or (stripped.startswith("for ") and " in " in stripped and stripped.endswith(":") and not stripped.startswith("for each")):
         # for each name in names: / for every item in items: / loop through items: / iterate over items:
         if stripped.startswith("for each "):
             middle = stripped[len("for each "):-1]
         elif stripped.startswith("for every "):
             middle = stripped[len("for every "):-1]
-        elif stripped.startswith("loop through "):
-            middle = stripped[len("loop through "):-1]
-            if " as " in middle:
-                list_name, var_name = [p.strip() for p in middle.split(" as ", 1)]
-                list_expr = translate_expression(
-                    list_name,
-                    in_class=in_class,
-                    has_staticmethod=has_staticmethod,
-                    has_classmethod=has_classmethod,
-                )
-                return indent + f"for {var_name} in {list_expr}:"
-            else:
-                list_name = middle.strip()
-                var_name = "item"
-                list_expr = translate_expression(
-                    list_name,
-                    in_class=in_class,
-                    has_staticmethod=has_staticmethod,
-                    has_classmethod=has_classmethod,
-                )
-                return indent + f"for {var_name} in {list_expr}:"
-        elif stripped.startswith("iterate over "):
+        elif stripped.startswith("loop through ") or stripped.startswith("iterate over "):
             # iterate over names as name:
-            middle = stripped[len("iterate over "):-1]
+            middle = stripped.split(" ", 2)[2][:-1]
             if " as " in middle:
                 list_name, var_name = [p.strip() for p in middle.split(" as ", 1)]
-                list_expr = translate_expression(
-                    list_name,
-                    in_class=in_class,
-                    has_staticmethod=has_staticmethod,
-                    has_classmethod=has_classmethod,
-                )
-                return indent + f"for {var_name} in {list_expr}:"
             else:
                 list_name = middle.strip()
                 var_name = "item"
-                list_expr = translate_expression(
-                    list_name,
-                    in_class=in_class,
-                    has_staticmethod=has_staticmethod,
-                    has_classmethod=has_classmethod,
-                )
-                return indent + f"for {var_name} in {list_expr}:"
+            return line.indent + f"for {var_name} in {line.expr(list_name)}:"
         else:  # for ... in ...:
             middle = stripped[len("for "):-1]
 
         var_name, list_name = [p.strip() for p in middle.split(" in ", 1)]
-        list_expr = translate_expression(
-            list_name,
-            in_class=in_class,
-            has_staticmethod=has_staticmethod,
-            has_classmethod=has_classmethod,
-        )
-        return indent + f"for {var_name} in {list_expr}:"
-    
+        return line.indent + f"for {var_name} in {line.expr(list_name)}:"
+    return None
+
+
+@_handles("define", "function", "to", "create")
+def _define(line: _Line) -> Optional[str]:
     # define / function / to / create function
+    stripped = line.stripped
     if (stripped.startswith("define ") or stripped.startswith("function ") or stripped.startswith("to ") or stripped.startswith("create function ")) and stripped.endswith(":"):
         # define greet(name): / function greet(name): / to greet(name): / create function greet(name):
-        if stripped.startswith("define "):
-            function_header = stripped[len("define "):]
-        elif stripped.startswith("function "):
-            function_header = stripped[len("function "):]
-        elif stripped.startswith("to "):
-            function_header = stripped[len("to "):]
-        else:  # create function
+        if stripped.startswith("create function "):
             function_header = stripped[len("create function "):]
-        return indent + f"def {function_header}"
-    
+        else:
+            function_header = stripped.split(" ", 1)[1]
+        return line.indent + f"def {function_header}"
+    return None
+
+
+@_handles("return", "give", "send")
+def _return(line: _Line) -> Optional[str]:
     # return / give back / send back
+    stripped = line.stripped
     if stripped.startswith("return ") or stripped.startswith("give back ") or stripped.startswith("send back "):
         if stripped.startswith("return "):
             value = stripped[len("return "):]
-        elif stripped.startswith("give back "):
+        else:  # give back / send back
             value = stripped[len("give back "):]
-        else:  # send back
-            value = stripped[len("send back "):]
-        value_expr = translate_expression(
-            value,
-            in_class=in_class,
-            has_staticmethod=has_staticmethod,
-            has_classmethod=has_classmethod,
-        )
-        return indent + f"return {value_expr}"
-    
+        return line.indent + f"return {line.expr(value)}"
+    return None
+
+
+@_handles("wait", "pause", "sleep", "delay")
+def _wait(line: _Line) -> Optional[str]:
     # wait / pause / sleep / delay
+    stripped = line.stripped
     if (stripped.startswith("wait ") or stripped.startswith("pause ") or stripped.startswith("sleep ") or stripped.startswith("delay ")) and (" seconds" in stripped or " second" in stripped):
         # wait 3 seconds / pause 3 seconds / sleep 3 seconds / delay 3 seconds
-        if stripped.startswith("wait "):
-            base = stripped[len("wait "):]
-        elif stripped.startswith("pause "):
-            base = stripped[len("pause "):]
-        elif stripped.startswith("sleep "):
-            base = stripped[len("sleep "):]
-        else:  # delay
-            base = stripped[len("delay "):]
-        
+        base = stripped.split(" ", 1)[1]
+
         if " seconds" in base:
             number = base[:-len(" seconds")].strip()
         else:  # second
             number = base[:-len(" second")].strip()
-        number_expr = translate_expression(
-            number,
-            in_class=in_class,
-            has_staticmethod=has_staticmethod,
-            has_classmethod=has_classmethod,
-        )
-        return indent + f"time.sleep({number_expr})"
-    
+        return line.indent + f"time.sleep({line.expr(number)})"
+    return None
+
+
+@_handles()
+def _random(line: _Line) -> Optional[str]:
     # random number from A to B / random between A and B / pick random number from A to B / get random number from A to B
-    if ("random number from " in stripped or "random between " in stripped or "pick random number from " in stripped or "get random number from " in stripped) and (" to " in stripped or " and " in stripped):
+    stripped = line.stripped
+    if ("random number from " in stripped or "random between " in stripped) and (" to " in stripped or " and " in stripped):
         # Caso 1: atribuição: number = random number from 1 to 10
         if " = " in stripped:
             var_part, random_part = stripped.split(" = ", 1)
@@ -419,302 +375,295 @@ def translate_line(line: str, in_class: bool = False, has_staticmethod: bool = F
             if random_part.strip().startswith("random number from "):
                 middle = random_part.strip()[len("random number from "):]
                 left, right = [p.strip() for p in middle.split(" to ", 1)]
-                left_expr = translate_expression(
-                    left,
-                    in_class=in_class,
-                    has_staticmethod=has_staticmethod,
-                    has_classmethod=has_classmethod,
-                )
-                right_expr = translate_expression(
-                    right,
-                    in_class=in_class,
-                    has_staticmethod=has_staticmethod,
-                    has_classmethod=has_classmethod,
-                )
-                return indent + f"{var_name} = random.randint({left_expr}, {right_expr})"
+                return line.indent + f"{var_name} = random.randint({line.expr(left)}, {line.expr(right)})"
         # Caso 2: sozinho: random number from 1 to 10
         elif stripped.startswith("random number from "):
             middle = stripped[len("random number from "):]
             left, right = [p.strip() for p in middle.split(" to ", 1)]
-            left_expr = translate_expression(
-                left,
-                in_class=in_class,
-                has_staticmethod=has_staticmethod,
-                has_classmethod=has_classmethod,
-            )
-            right_expr = translate_expression(
-                right,
-                in_class=in_class,
-                has_staticmethod=has_staticmethod,
-                has_classmethod=has_classmethod,
-            )
-            return indent + f"random.randint({left_expr}, {right_expr})"
-    
+            return line.indent + f"random.randint({line.expr(left)}, {line.expr(right)})"
+    return None
+
+
+@_handles("save", "write", "store")
+def _save_to_file(line: _Line) -> Optional[str]:
     # save text to file / write to file / save to file / store in file
+    stripped = line.stripped
     if (stripped.startswith("save text ") or stripped.startswith("write ") or stripped.startswith("save ") or stripped.startswith("store ")) and (" to file " in stripped or " into file " in stripped or " in file " in stripped):
         # save text TEXT to file "name.txt" / write TEXT to file "name.txt" / save TEXT to file "name.txt"
-        if stripped.startswith("save text "):
-            base = stripped[len("save text "):]
-            if " to file " in base:
-                parts = base.split(" to file ", 1)
-            elif " into file " in base:
-                parts = base.split(" into file ", 1)
-            else:
-                parts = base.split(" in file ", 1)
-        elif stripped.startswith("write "):
-            base = stripped[len("write "):]
-            if " to file " in base:
-                parts = base.split(" to file ", 1)
-            elif " into file " in base:
-                parts = base.split(" into file ", 1)
-            else:
-                parts = base.split(" in file ", 1)
-        elif stripped.startswith("save "):
-            base = stripped[len("save "):]
-            if " to file " in base:
-                parts = base.split(" to file ", 1)
-            elif " into file " in base:
-                parts = base.split(" into file ", 1)
-            else:
-                parts = base.split(" in file ", 1)
-        else:  # store
+        if stripped.startswith("store "):
             base = stripped[len("store "):]
-            if " in file " in base:
-                parts = base.split(" in file ", 1)
-            elif " into file " in base:
-                parts = base.split(" into file ", 1)
-            else:
-                parts = base.split(" to file ", 1)
-        
+            separators = (" in file ", " into file ", " to file ")
+        else:  # save text / write / save
+            base = stripped[len("save text "):] if stripped.startswith("save text ") else stripped.split(" ", 1)[1]
+            separators = (" to file ", " into file ", " in file ")
+        separator = next((s for s in separators[:2] if s in base), separators[2])
+        parts = base.split(separator, 1)
+
         if len(parts) == 2:
-            text_content = parts[0].strip()
-            file_path = parts[1].strip()
-            text_expr = translate_expression(
-                text_content,
-                in_class=in_class,
-                has_staticmethod=has_staticmethod,
-                has_classmethod=has_classmethod,
-            )
-            path_expr = translate_expression(
-                file_path,
-                in_class=in_class,
-                has_staticmethod=has_staticmethod,
-                has_classmethod=has_classmethod,
-            )
+            text_expr = line.expr(parts[0].strip())
+            path_expr = line.expr(parts[1].strip())
+            indent = line.indent
             return (
                 indent
                 + f'with open({path_expr}, "w", encoding="utf-8") as f:\n{indent}    f.write(str({text_expr}))'
             )
-    
+    return None
+
+
+@_handles("read", "load", "get")
+def _read_file(line: _Line) -> Optional[str]:
     # read file / load file / get from file
+    stripped = line.stripped
     if (stripped.startswith("read file ") or stripped.startswith("load file ") or stripped.startswith("get from file ")) and " as " in stripped:
         # read file "name.txt" as data / load file "name.txt" as data / get from file "name.txt" as data
-        if stripped.startswith("read file "):
-            base = stripped[len("read file "):]
-        elif stripped.startswith("load file "):
-            base = stripped[len("load file "):]
-        else:  # get from file
+        if stripped.startswith("get from file "):
             base = stripped[len("get from file "):]
-        
+        else:  # read file / load file
+            base = stripped[len("read file "):]
+
         parts = base.split(" as ", 1)
         if len(parts) == 2:
-            file_path = parts[0].strip()
+            path_expr = line.expr(parts[0].strip())
             var_name = parts[1].strip()
-            path_expr = translate_expression(
-                file_path,
-                in_class=in_class,
-                has_staticmethod=has_staticmethod,
-                has_classmethod=has_classmethod,
-            )
-            return indent + f'with open({path_expr}, "r", encoding="utf-8") as f:\n{indent}    {var_name} = f.read()'
-    
+            return line.indent + f'with open({path_expr}, "r", encoding="utf-8") as f:\n{line.indent}    {var_name} = f.read()'
+    return None
+
+
+@_handles("class")
+def _class(line: _Line) -> Optional[str]:
     # class (com ou sem herança)
+    stripped = line.stripped
     if stripped.startswith("class ") and stripped.endswith(":"):
         # class Engine:
         # class Child(Parent):
         class_def = stripped[len("class "):-1].strip()
-        # Se já tem parênteses (herança), não adiciona nada
-        if "(" in class_def and ")" in class_def:
-            return indent + f"class {class_def}:"
-        else:
-            return indent + f"class {class_def}:"
-    
+        return line.indent + f"class {class_def}:"
+    return None
+
+
+@_handles("init")
+def _init(line: _Line) -> Optional[str]:
     # init method (constructor)
+    stripped = line.stripped
     if stripped.startswith("init(") and stripped.endswith("):"):
         # init(name):
         params = stripped[len("init("):-2]
-        # Adiciona indentação extra se estiver dentro de uma classe
-        if indent_size > 0:
-            return indent + f"def __init__(self, {params}):"
-        else:
-            return indent + f"def __init__(self, {params}):"
-    
+        return line.indent + f"def __init__(self, {params}):"
+    return None
+
+
+@_handles("set")
+def _set(line: _Line) -> Optional[str]:
     # set (atribuição) - mas não se já tem operador aumentado
+    stripped = line.stripped
     if stripped.startswith("set ") and not any(op in stripped for op in [" += ", " -= ", " *= ", " /= ", " //= ", " %= ", " **= "]):
         # set self.name = value
         # set x = 10
         assignment = stripped[len("set "):]
         if " = " in assignment:
             target, value = assignment.split(" = ", 1)
-            value_expr = translate_expression(
-                value,
-                in_class=in_class,
-                has_staticmethod=has_staticmethod,
-                has_classmethod=has_classmethod,
-            )
-            return indent + f"{target.strip()} = {value_expr}"
-    
+            return line.indent + f"{target.strip()} = {line.expr(value)}"
+    return None
+
+
+@_handles("task")
+def _task(line: _Line) -> Optional[str]:
     # task (método/função)
-    if stripped.startswith("task ") and stripped.endswith(":"):
-        # task greet(name):
-        method_def = stripped[len("task "):-1]  # Remove o : final
-        # Se está dentro de uma classe e o método não tem parâmetros ou não começa com self
-        if in_class:
-            # Extrair nome do método e parâmetros
-            if "(" in method_def:
-                method_name, params = method_def.split("(", 1)
-                method_name = method_name.strip()
-                params = params.rstrip(")").strip()  # Remove o ) final
-                
-                # Se tem @staticmethod, não adiciona self
-                if has_staticmethod:
-                    if params:
-                        return indent + f"def {method_name}({params}):"
-                    else:
-                        return indent + f"def {method_name}():"
-                # Se tem @classmethod, adiciona cls como primeiro parâmetro
-                elif has_classmethod:
-                    if params and not params.strip().startswith("cls"):
-                        return indent + f"def {method_name}(cls, {params}):"
-                    elif not params or params.strip() == "":
-                        return indent + f"def {method_name}(cls):"
-                    else:
-                        return indent + f"def {method_name}({params}):"
-                # Método normal, adiciona self
-                elif params and not params.strip().startswith("self") and not params.strip().startswith("cls"):
-                    return indent + f"def {method_name}(self, {params}):"
-                elif not params or params.strip() == "":
-                    return indent + f"def {method_name}(self):"
-            else:
-                # Sem parênteses, método sem parâmetros
-                method_name = method_def.strip()
-                if has_staticmethod:
+    stripped = line.stripped
+    if not (stripped.startswith("task ") and stripped.endswith(":")):
+        return None
+    # task greet(name):
+    indent = line.indent
+    method_def = stripped[len("task "):-1]  # Remove o : final
+    # Se está dentro de uma classe e o método não tem parâmetros ou não começa com self
+    if line.in_class:
+        # Extrair nome do método e parâmetros
+        if "(" in method_def:
+            method_name, params = method_def.split("(", 1)
+            method_name = method_name.strip()
+            params = params.rstrip(")").strip()  # Remove o ) final
+
+            # Se tem @staticmethod, não adiciona self
+            if line.has_staticmethod:
+                if params:
+                    return indent + f"def {method_name}({params}):"
+                else:
                     return indent + f"def {method_name}():"
-                elif has_classmethod:
+            # Se tem @classmethod, adiciona cls como primeiro parâmetro
+            elif line.has_classmethod:
+                if params and not params.strip().startswith("cls"):
+                    return indent + f"def {method_name}(cls, {params}):"
+                elif not params or params.strip() == "":
                     return indent + f"def {method_name}(cls):"
                 else:
-                    return indent + f"def {method_name}(self):"
-        return indent + f"def {method_def}:"
-    
+                    return indent + f"def {method_name}({params}):"
+            # Método normal, adiciona self
+            elif params and not params.strip().startswith("self") and not params.strip().startswith("cls"):
+                return indent + f"def {method_name}(self, {params}):"
+            elif not params or params.strip() == "":
+                return indent + f"def {method_name}(self):"
+        else:
+            # Sem parênteses, método sem parâmetros
+            method_name = method_def.strip()
+            if line.has_staticmethod:
+                return indent + f"def {method_name}():"
+            elif line.has_classmethod:
+                return indent + f"def {method_name}(cls):"
+            else:
+                return indent + f"def {method_name}(self):"
+    return indent + f"def {method_def}:"
+
+
+@_handles("async")
+def _async_task(line: _Line) -> Optional[str]:
     # async task
+    stripped = line.stripped
     if stripped.startswith("async task ") and stripped.endswith(":"):
         # async task fetch(url):
-        method_def = stripped[len("async task "):]
-        return indent + f"async def {method_def}"
-    
-    # await
-    if stripped.startswith("await "):
-        # await some_async_function()
-        expr = stripped[len("await "):]
-        return indent + f"await {expr}"
-    
-    # decorator
+        return line.indent + f"async def {stripped[len('async task '):]}"
+    return None
+
+
+@_handles("await")
+def _await(line: _Line) -> Optional[str]:
+    # await some_async_function()
+    if line.stripped.startswith("await "):
+        return line.indent + f"await {line.stripped[len('await '):]}"
+    return None
+
+
+@_handles("decorator")
+def _decorator(line: _Line) -> Optional[str]:
+    # decorator cache:
+    stripped = line.stripped
     if stripped.startswith("decorator ") and stripped.endswith(":"):
-        # decorator cache:
-        decorator_name = stripped[len("decorator "):-1].strip()
-        return indent + f"@{decorator_name}"
-    
+        return line.indent + f"@{stripped[len('decorator '):-1].strip()}"
+    return None
+
+
+@_handles("attempt:", "try:", "attempt")
+def _try(line: _Line) -> Optional[str]:
     # attempt / try / attempt to
-    if stripped == "attempt:" or stripped == "try:" or stripped == "attempt to:":
-        return indent + "try:"
-    
+    if line.stripped == "attempt:" or line.stripped == "try:" or line.stripped == "attempt to:":
+        return line.indent + "try:"
+    return None
+
+
+@_handles("catch", "except", "handle", "on")
+def _except(line: _Line) -> Optional[str]:
     # catch / except / handle / on error
+    stripped = line.stripped
     if stripped.startswith("catch ") or stripped.startswith("except ") or stripped.startswith("handle ") or stripped.startswith("on error "):
         # catch error: / except error: / handle error: / on error:
-        if stripped.startswith("catch "):
-            exception_part = stripped[len("catch "):-1].strip()
-        elif stripped.startswith("except "):
-            exception_part = stripped[len("except "):-1].strip()
-        elif stripped.startswith("handle "):
-            exception_part = stripped[len("handle "):-1].strip()
-        else:  # on error
+        if stripped.startswith("on error "):
             exception_part = stripped[len("on error "):-1].strip()
-        
+        else:  # catch / except / handle
+            exception_part = stripped.split(" ", 1)[1][:-1].strip()
+
         if " as " in exception_part:
             exc_type, exc_var = exception_part.split(" as ", 1)
-            return indent + f"except {exc_type.strip()} as {exc_var.strip()}:"
+            return line.indent + f"except {exc_type.strip()} as {exc_var.strip()}:"
         elif exception_part:
-            return indent + f"except {exception_part}:"
+            return line.indent + f"except {exception_part}:"
         else:
-            return indent + "except:"
-    
+            return line.indent + "except:"
+    return None
+
+
+@_handles("finally:", "always:", "in")
+def _finally(line: _Line) -> Optional[str]:
     # finally / always / in the end
-    if stripped == "finally:" or stripped == "always:" or stripped == "in the end:":
-        return indent + "finally:"
-    
+    if line.stripped == "finally:" or line.stripped == "always:" or line.stripped == "in the end:":
+        return line.indent + "finally:"
+    return None
+
+
+@_handles("open", "read", "load")
+def _open(line: _Line) -> Optional[str]:
     # open / open file / read file / load file
-    if (stripped.startswith("open ") or stripped.startswith("open file ") or stripped.startswith("read file ") or stripped.startswith("load file ")) and " as " in stripped and stripped.endswith(":"):
+    stripped = line.stripped
+    if (stripped.startswith("open ") or stripped.startswith("read file ") or stripped.startswith("load file ")) and " as " in stripped and stripped.endswith(":"):
         # open "file.txt" as f: / open file "file.txt" as f: / read file "file.txt" as f:
         if stripped.startswith("open file "):
             base = stripped[len("open file "):-1]
-        elif stripped.startswith("read file "):
-            base = stripped[len("read file "):-1]
-        elif stripped.startswith("load file "):
-            base = stripped[len("load file "):-1]
-        else:  # open
+        elif stripped.startswith("open "):
             base = stripped[len("open "):-1]
-        
+        else:  # read file / load file
+            base = stripped[len("read file "):-1]
+
         parts = base.split(" as ", 1)
         if len(parts) == 2:
             file_path = parts[0].strip()
             var_name = parts[1].strip()
-            return indent + f'with open({file_path}, "r", encoding="utf-8") as {var_name}:'
-    
+            return line.indent + f'with open({file_path}, "r", encoding="utf-8") as {var_name}:'
+    return None
+
+
+@_handles("use")
+def _use(line: _Line) -> Optional[str]:
     # use (import) - mas não processa se já está no header
-    if stripped.startswith("use "):
+    if line.stripped.startswith("use "):
         # use math
         # use json as j
-        module_part = stripped[len("use "):].strip()
+        module_part = line.stripped[len("use "):].strip()
         if " as " in module_part:
             module, alias = module_part.split(" as ", 1)
-            return indent + f"import {module.strip()} as {alias.strip()}"
-        else:
-            return indent + f"import {module_part}"
-    
-    # from import
-    if stripped.startswith("from ") and " import " in stripped:
-        # from math import sqrt
-        # from transformers import AutoModel
-        return indent + stripped
-    
+            return line.indent + f"import {module.strip()} as {alias.strip()}"
+        return line.indent + f"import {module_part}"
+    return None
+
+
+@_handles("from")
+def _from_import(line: _Line) -> Optional[str]:
+    # from math import sqrt
+    # from transformers import AutoModel
+    if line.stripped.startswith("from ") and " import " in line.stripped:
+        return line.indent + line.stripped
+    return None
+
+
+@_handles("load")
+def _load_model(line: _Line) -> Optional[str]:
     # load model (IA macro)
+    stripped = line.stripped
     if stripped.startswith("load model ") and " as " in stripped:
         # load model "gpt2" as m
         parts = stripped[len("load model "):].split(" as ", 1)
         if len(parts) == 2:
             model_name = parts[0].strip()
             var_name = parts[1].strip()
-            return indent + f'{var_name} = AutoModelForCausalLM.from_pretrained({model_name})'
-    
-    # agent (IA macro)
-    if stripped.startswith("agent ") and stripped.endswith(":"):
-        # agent jarvis:
-        agent_name = stripped[len("agent "):-1].strip()
-        return indent + f"# Agent: {agent_name}"
-    
-    # goal (para agentes)
-    if stripped.startswith("goal "):
-        # goal "help the user"
-        goal_text = stripped[len("goal "):].strip()
-        return indent + f"# Goal: {goal_text}"
-    
-    # tool (para agentes)
-    if stripped.startswith("tool "):
-        # tool browser
-        tool_name = stripped[len("tool "):].strip()
-        return indent + f"# Tool: {tool_name}"
-    
+            return line.indent + f'{var_name} = AutoModelForCausalLM.from_pretrained({model_name})'
+    return None
+
+
+@_handles("agent")
+def _agent(line: _Line) -> Optional[str]:
+    # agent jarvis:
+    if line.stripped.startswith("agent ") and line.stripped.endswith(":"):
+        return line.indent + f"# Agent: {line.stripped[len('agent '):-1].strip()}"
+    return None
+
+
+@_handles("goal")
+def _goal(line: _Line) -> Optional[str]:
+    # goal "help the user" (para agentes)
+    if line.stripped.startswith("goal "):
+        return line.indent + f"# Goal: {line.stripped[len('goal '):].strip()}"
+    return None
+
+
+@_handles("tool")
+def _tool(line: _Line) -> Optional[str]:
+    # tool browser (para agentes)
+    if line.stripped.startswith("tool "):
+        return line.indent + f"# Tool: {line.stripped[len('tool '):].strip()}"
+    return None
+
+
+@_handles("while", "as", "keep", "continue")
+def _while(line: _Line) -> Optional[str]:
     # while / as long as / keep doing / continue while
+    stripped = line.stripped
     if (stripped.startswith("while ") or stripped.startswith("as long as ") or stripped.startswith("keep doing ") or stripped.startswith("continue while ")) and stripped.endswith(":"):
         # while condition: / as long as condition: / keep doing while condition:
         if stripped.startswith("while "):
@@ -729,463 +678,360 @@ def translate_line(line: str, in_class: bool = False, has_staticmethod: bool = F
         else:  # continue while
             condition = stripped[len("continue while "):-1]
         condition_py = normalize_condition(condition)
-        condition_expr = translate_expression(
-            condition_py,
-            in_class=in_class,
-            has_staticmethod=has_staticmethod,
-            has_classmethod=has_classmethod,
-        )
-        return indent + f"while {condition_expr}:"
-    
+        return line.indent + f"while {line.expr(condition_py)}:"
+    return None
+
+
+# Linhas inteiras que viram uma palavra-chave do Python (break, continue, ...)
+_FIXED_LINES = {
     # break / stop / exit loop / leave loop / quit loop
-    if stripped == "break" or stripped == "stop" or stripped == "exit loop" or stripped == "leave loop" or stripped == "quit loop":
-        return indent + "break"
-    
+    "break": "break", "stop": "break", "exit loop": "break", "leave loop": "break", "quit loop": "break",
     # continue / skip / next / go to next / proceed
-    if stripped == "continue" or stripped == "skip" or stripped == "next" or stripped == "go to next" or stripped == "proceed":
-        return indent + "continue"
-    
+    "continue": "continue", "skip": "continue", "next": "continue", "go to next": "continue",
+    "proceed": "continue",
     # pass / do nothing / skip this / ignore
-    if stripped == "pass" or stripped == "do nothing" or stripped == "skip this" or stripped == "ignore":
-        return indent + "pass"
-    
-    # raise
-    if stripped.startswith("raise "):
-        # raise Exception("error")
-        exception = stripped[len("raise "):]
-        return indent + f"raise {exception}"
-    
-    # assert
-    if stripped.startswith("assert "):
-        # assert condition
-        condition = stripped[len("assert "):]
-        condition_py = normalize_condition(condition)
-        condition_expr = translate_expression(
-            condition_py,
-            in_class=in_class,
-            has_staticmethod=has_staticmethod,
-            has_classmethod=has_classmethod,
-        )
-        return indent + f"assert {condition_expr}"
-    
-    # lambda (expressão)
-    if " => " in stripped:
-        # x => x * 2
-        parts = stripped.split(" => ", 1)
-        if len(parts) == 2:
-            params = parts[0].strip()
-            expr = parts[1].strip()
-            return indent + f"lambda {params}: {expr}"
-    
-    # dict (dicionário)
-    if stripped.startswith("dict ") and " = " in stripped:
-        # dict data = {"key": "value"}
-        assignment = stripped[len("dict "):]
-        return indent + assignment
-    
-    # tuple (tupla)
-    if stripped.startswith("tuple ") and " = " in stripped:
-        # tuple data = (1, 2, 3)
-        assignment = stripped[len("tuple "):]
-        return indent + assignment
-    
-    # set (conjunto)
-    if stripped.startswith("set ") and " = " in stripped and not stripped.startswith("set self."):
-        # set data = {1, 2, 3}
-        assignment = stripped[len("set "):]
-        return indent + assignment
-    
-    # Operadores de atribuição aumentada (remover "set " se presente)
-    if " += " in stripped:
-        # x += 1 ou set x += 1
-        if stripped.startswith("set "):
-            stripped = stripped[len("set "):]
-        var, value = stripped.split(" += ", 1)
-        return indent + f"{var.strip()} += {value.strip()}"
-    
-    if " -= " in stripped:
-        if stripped.startswith("set "):
-            stripped = stripped[len("set "):]
-        var, value = stripped.split(" -= ", 1)
-        return indent + f"{var.strip()} -= {value.strip()}"
-    
-    if " *= " in stripped:
-        if stripped.startswith("set "):
-            stripped = stripped[len("set "):]
-        var, value = stripped.split(" *= ", 1)
-        return indent + f"{var.strip()} *= {value.strip()}"
-    
-    if " /= " in stripped:
-        if stripped.startswith("set "):
-            stripped = stripped[len("set "):]
-        var, value = stripped.split(" /= ", 1)
-        return indent + f"{var.strip()} /= {value.strip()}"
-    
-    if " //= " in stripped:
-        if stripped.startswith("set "):
-            stripped = stripped[len("set "):]
-        var, value = stripped.split(" //= ", 1)
-        return indent + f"{var.strip()} //= {value.strip()}"
-    
-    if " %= " in stripped:
-        if stripped.startswith("set "):
-            stripped = stripped[len("set "):]
-        var, value = stripped.split(" %= ", 1)
-        return indent + f"{var.strip()} %= {value.strip()}"
-    
-    if " **= " in stripped:
-        if stripped.startswith("set "):
-            stripped = stripped[len("set "):]
-        var, value = stripped.split(" **= ", 1)
-        return indent + f"{var.strip()} **= {value.strip()}"
-    
+    "pass": "pass", "do nothing": "pass", "skip this": "pass", "ignore": "pass",
+}
+
+
+@_handles("break", "stop", "exit", "leave", "quit", "continue", "skip", "next", "go", "proceed",
+          "pass", "do", "ignore")
+def _fixed_line(line: _Line) -> Optional[str]:
+    keyword = _FIXED_LINES.get(line.stripped)
+    return line.indent + keyword if keyword else None
+
+
+@_handles("raise")
+def _raise(line: _Line) -> Optional[str]:
+    # raise Exception("error")
+    if line.stripped.startswith("raise "):
+        return line.indent + f"raise {line.stripped[len('raise '):]}"
+    return None
+
+
+@_handles("assert")
+def _assert(line: _Line) -> Optional[str]:
+    # assert condition
+    if line.stripped.startswith("assert "):
+        condition_py = normalize_condition(line.stripped[len("assert "):])
+        return line.indent + f"assert {line.expr(condition_py)}"
+    return None
+
+
+@_handles()
+def _lambda(line: _Line) -> Optional[str]:
+    # lambda (expressão): x => x * 2
+    if " => " in line.stripped:
+        params, expr = line.stripped.split(" => ", 1)
+        return line.indent + f"lambda {params.strip()}: {expr.strip()}"
+    return None
+
+
+@_handles("dict", "tuple", "set")
+def _collection_assignment(line: _Line) -> Optional[str]:
+    # dict data = {"key": "value"} / tuple data = (1, 2, 3) / set data = {1, 2, 3}
+    stripped = line.stripped
+    if " = " in stripped and (stripped.startswith("dict ") or stripped.startswith("tuple ") or (stripped.startswith("set ") and not stripped.startswith("set self."))):
+        return line.indent + stripped.split(" ", 1)[1]
+    return None
+
+
+@_handles()
+def _augmented_assignment(line: _Line) -> Optional[str]:
+    # Operadores de atribuição aumentada (remover "set " se presente): x += 1 ou set x += 1
+    stripped = line.stripped
+    for op in (" += ", " -= ", " *= ", " /= ", " //= ", " %= ", " **= "):
+        if op in stripped:
+            if stripped.startswith("set "):
+                stripped = stripped[len("set "):]
+            var, value = stripped.split(op, 1)
+            return line.indent + f"{var.strip()}{op}{value.strip()}"
+    return None
+
+
+@_handles("yield")
+def _yield(line: _Line) -> Optional[str]:
     # yield (generator)
-    if stripped.startswith("yield "):
-        value = stripped[len("yield "):]
-        return indent + f"yield {value}"
-    
+    if line.stripped.startswith("yield "):
+        return line.indent + f"yield {line.stripped[len('yield '):]}"
+    return None
+
+
+@_handles("match", "case")
+def _match(line: _Line) -> Optional[str]:
     # match/case (Python 3.10+)
-    if stripped.startswith("match ") and stripped.endswith(":"):
-        expr = stripped[len("match "):-1]
-        return indent + f"match {expr}:"
-    
-    if stripped.startswith("case ") and stripped.endswith(":"):
-        pattern = stripped[len("case "):-1]
-        return indent + f"case {pattern}:"
-    
-    # Herança de classes
-    if stripped.startswith("class ") and "(" in stripped and ")" in stripped and stripped.endswith(":"):
-        # class Child(Parent):
-        class_def = stripped[len("class "):-1]
-        return indent + f"class {class_def}:"
-    
-    # @staticmethod (decorator)
-    if stripped == "staticmethod:" or stripped == "@staticmethod":
-        return indent + "@staticmethod"
-    
-    # @classmethod (decorator)
-    if stripped == "classmethod:" or stripped == "@classmethod":
-        return indent + "@classmethod"
-    
-    # @property (decorator)
-    if stripped == "property:" or stripped == "@property":
-        return indent + "@property"
-    
-    # @abstractmethod (decorator)
-    if stripped == "abstractmethod:" or stripped == "@abstractmethod":
-        return indent + "@abstractmethod"
-    
-    # @dataclass (decorator)
-    if stripped == "dataclass:" or stripped == "@dataclass":
-        return indent + "@dataclass"
-    
-    # Comprehensions (list, dict, set)
-    # list comprehension: list [x*2 for x in range(10)]
-    if stripped.startswith("list [") and " for " in stripped and " in " in stripped:
-        comp = stripped[len("list "):]
-        return indent + comp
-    
-    # dict comprehension: dict {k: v*2 for k, v in data.items()}
-    if stripped.startswith("dict {") and " for " in stripped and " in " in stripped:
-        comp = stripped[len("dict "):]
-        return indent + comp
-    
-    # set comprehension: set {x*2 for x in range(10)}
-    if stripped.startswith("set {") and " for " in stripped and " in " in stripped and not stripped.startswith("set self."):
-        comp = stripped[len("set "):]
-        return indent + comp
-    
-    # Slicing (já funciona via Python puro, mas vamos adicionar sintaxe simplificada)
+    stripped = line.stripped
+    if (stripped.startswith("match ") or stripped.startswith("case ")) and stripped.endswith(":"):
+        keyword, rest = stripped.split(" ", 1)
+        return line.indent + f"{keyword} {rest[:-1]}:"
+    return None
+
+
+# Decorators escritos com ou sem @ (staticmethod: / @staticmethod)
+_DECORATORS = {
+    f"{prefix}{name}{suffix}": f"@{name}"
+    for name in ("staticmethod", "classmethod", "property", "abstractmethod", "dataclass")
+    for prefix, suffix in (("", ":"), ("@", ""))
+}
+
+
+@_handles(*_DECORATORS)
+def _decorator_line(line: _Line) -> Optional[str]:
+    decorator = _DECORATORS.get(line.stripped)
+    return line.indent + decorator if decorator else None
+
+
+@_handles("list", "dict", "set")
+def _comprehension(line: _Line) -> Optional[str]:
+    # Comprehensions: list [x*2 for x in range(10)] / dict {k: v*2 for k, v in data.items()} /
+    # set {x*2 for x in range(10)}
+    stripped = line.stripped
+    if (stripped.startswith("list [") or stripped.startswith("dict {") or stripped.startswith("set {")) and " for " in stripped and " in " in stripped:
+        return line.indent + stripped.split(" ", 1)[1]
+    return None
+
+
+@_handles("slice")
+def _slice(line: _Line) -> Optional[str]:
     # list slice: slice list from 1 to 5
+    stripped = line.stripped
     if stripped.startswith("slice ") and " from " in stripped and " to " in stripped:
-        # slice list from 1 to 5
         parts = stripped[len("slice "):].split(" from ", 1)
         if len(parts) == 2:
             var_name = parts[0].strip()
             range_part = parts[1].split(" to ", 1)
             if len(range_part) == 2:
-                start = range_part[0].strip()
-                end = range_part[1].strip()
-                start_expr = translate_expression(
-                    start,
-                    in_class=in_class,
-                    has_staticmethod=has_staticmethod,
-                    has_classmethod=has_classmethod,
-                )
-                end_expr = translate_expression(
-                    end,
-                    in_class=in_class,
-                    has_staticmethod=has_staticmethod,
-                    has_classmethod=has_classmethod,
-                )
-                return indent + f"{var_name}[{start_expr}:{end_expr}]"
-    
+                start = line.expr(range_part[0].strip())
+                end = line.expr(range_part[1].strip())
+                return line.indent + f"{var_name}[{start}:{end}]"
+    return None
+
+
+# Prefixos que a atribuição simples não trata (são de outras construções)
+_NOT_ASSIGNMENT_PREFIXES = (
+    "if ", "elif ", "for ", "while ", "when ", "whenever ", "list ", "dict ", "tuple ", "set ",
+    "create list ", "create dict ", "create tuple ", "create set ",
+    "make list ", "make dict ", "make tuple ", "make set ",
+)
+
+
+@_handles("set", "assign", "let", "make", "put", "store", "save", "create", "initialize")
+def _assignment(line: _Line) -> Optional[str]:
     # set / assign / let / make / put / store / save / create / initialize (atribuição simples)
-    # IMPORTANTE: Verificar antes do fallback final
-    if " = " in stripped and not stripped.startswith("if ") and not stripped.startswith("elif ") and not stripped.startswith("for ") and not stripped.startswith("while ") and not stripped.startswith("when ") and not stripped.startswith("whenever ") and not stripped.startswith("list ") and not stripped.startswith("dict ") and not stripped.startswith("tuple ") and not stripped.startswith("set ") and not stripped.startswith("create list ") and not stripped.startswith("create dict ") and not stripped.startswith("create tuple ") and not stripped.startswith("create set ") and not stripped.startswith("make list ") and not stripped.startswith("make dict ") and not stripped.startswith("make tuple ") and not stripped.startswith("make set "):
-        # set x = 10 / assign x = 10 / let x = 10 / make x = 10 / put x = 50 / store x = 60 / save x = 70 / create x = 80 / initialize x = 90
-        assignment = None
-        if stripped.startswith("set "):
-            assignment = stripped[len("set "):]
-        elif stripped.startswith("assign "):
-            assignment = stripped[len("assign "):]
-        elif stripped.startswith("let "):
-            assignment = stripped[len("let "):]
-        elif stripped.startswith("make ") and not stripped.startswith("make list ") and not stripped.startswith("make dict ") and not stripped.startswith("make tuple ") and not stripped.startswith("make set ") and not stripped.startswith("make class "):
-            assignment = stripped[len("make "):]
-        elif stripped.startswith("put ") and " into " not in stripped and " to " not in stripped:
-            assignment = stripped[len("put "):]
-        elif stripped.startswith("store ") and " in file " not in stripped and " in " not in stripped:
-            assignment = stripped[len("store "):]
-        elif stripped.startswith("save ") and " to file " not in stripped and " in file " not in stripped:
-            assignment = stripped[len("save "):]
-        elif stripped.startswith("create ") and not stripped.startswith("create list ") and not stripped.startswith("create dict ") and not stripped.startswith("create tuple ") and not stripped.startswith("create set ") and not stripped.startswith("create class ") and not stripped.startswith("create function "):
-            assignment = stripped[len("create "):]
-        elif stripped.startswith("initialize "):
-            assignment = stripped[len("initialize "):]
-
-        if assignment:
-            target, value = assignment.split(" = ", 1)
-            value_expr = translate_expression(
-                value,
-                in_class=in_class,
-                has_staticmethod=has_staticmethod,
-                has_classmethod=has_classmethod,
-            )
-            return indent + f"{target.strip()} = {value_expr}"
-    
-    # ============================================
-    # MACROS E ATALHOS COMUNS (Palavras Simples)
-    # ============================================
-    
-    # Operações matemáticas comuns
+    stripped = line.stripped
+    if " = " not in stripped or stripped.startswith(_NOT_ASSIGNMENT_PREFIXES):
+        return None
+    # assign x = 10 / let x = 10 / make x = 10 / put x = 50 / store x = 60 / save x = 70 / create x = 80 / initialize x = 90
+    assignment = None
+    if stripped.startswith("assign ") or stripped.startswith("let ") or stripped.startswith("initialize "):
+        assignment = stripped.split(" ", 1)[1]
+    elif stripped.startswith("make ") and not stripped.startswith("make class "):
+        assignment = stripped[len("make "):]
+    elif stripped.startswith("put ") and " into " not in stripped and " to " not in stripped:
+        assignment = stripped[len("put "):]
+    elif stripped.startswith("store ") and " in file " not in stripped and " in " not in stripped:
+        assignment = stripped[len("store "):]
+    elif stripped.startswith("save ") and " to file " not in stripped and " in file " not in stripped:
+        assignment = stripped[len("save "):]
+    elif stripped.startswith("create ") and not stripped.startswith("create class ") and not stripped.startswith("create function "):
+        assignment = stripped[len("create "):]
+
+    if assignment:
+        target, value = assignment.split(" = ", 1)
+        return line.indent + f"{target.strip()} = {line.expr(value)}"
+    return None
+
+
+# ============================================
+# MACROS E ATALHOS COMUNS (Palavras Simples)
+# ============================================
+
+# Operações com dois operandos: palavra → (separador, formato com {a} e {b})
+_BINARY_SHORTCUTS = {
     # add x and y / sum x and y / plus x and y
-    if (stripped.startswith("add ") and " and " in stripped) or (stripped.startswith("sum ") and " and " in stripped) or (stripped.startswith("plus ") and " and " in stripped):
-        if stripped.startswith("add "):
-            parts = stripped[len("add "):].split(" and ", 1)
-        elif stripped.startswith("sum "):
-            parts = stripped[len("sum "):].split(" and ", 1)
-        else:  # plus
-            parts = stripped[len("plus "):].split(" and ", 1)
-        if len(parts) == 2:
-            a, b = parts[0].strip(), parts[1].strip()
-            return indent + f"({a} + {b})"
-    
+    "add": (" and ", "({a} + {b})"),
+    "sum": (" and ", "({a} + {b})"),
+    "plus": (" and ", "({a} + {b})"),
     # subtract x from y / minus x from y
-    if (stripped.startswith("subtract ") and " from " in stripped) or (stripped.startswith("minus ") and " from " in stripped):
-        if stripped.startswith("subtract "):
-            parts = stripped[len("subtract "):].split(" from ", 1)
-        else:  # minus
-            parts = stripped[len("minus "):].split(" from ", 1)
-        if len(parts) == 2:
-            a, b = parts[0].strip(), parts[1].strip()
-            return indent + f"({b} - {a})"
-    
+    "subtract": (" from ", "({b} - {a})"),
+    "minus": (" from ", "({b} - {a})"),
     # multiply x by y / times x by y
-    if (stripped.startswith("multiply ") and " by " in stripped) or (stripped.startswith("times ") and " by " in stripped):
-        if stripped.startswith("multiply "):
-            parts = stripped[len("multiply "):].split(" by ", 1)
-        else:  # times
-            parts = stripped[len("times "):].split(" by ", 1)
-        if len(parts) == 2:
-            a, b = parts[0].strip(), parts[1].strip()
-            return indent + f"({a} * {b})"
-    
+    "multiply": (" by ", "({a} * {b})"),
+    "times": (" by ", "({a} * {b})"),
     # divide x by y
-    if stripped.startswith("divide ") and " by " in stripped:
-        parts = stripped[len("divide "):].split(" by ", 1)
-        if len(parts) == 2:
-            a, b = parts[0].strip(), parts[1].strip()
-            return indent + f"({a} / {b})"
-    
-    # Operações de string comuns
+    "divide": (" by ", "({a} / {b})"),
     # join list with separator / combine list with separator
-    if (stripped.startswith("join ") and " with " in stripped) or (stripped.startswith("combine ") and " with " in stripped):
-        if stripped.startswith("join "):
-            parts = stripped[len("join "):].split(" with ", 1)
-        else:  # combine
-            parts = stripped[len("combine "):].split(" with ", 1)
+    "join": (" with ", "{b}.join({a})"),
+    "combine": (" with ", "{b}.join({a})"),
+}
+
+
+@_handles(*_BINARY_SHORTCUTS)
+def _binary_shortcut(line: _Line) -> Optional[str]:
+    word, space, rest = line.stripped.partition(" ")
+    if not space or word not in _BINARY_SHORTCUTS:
+        return None
+    separator, template = _BINARY_SHORTCUTS[word]
+    if separator in line.stripped:
+        parts = rest.split(separator, 1)
         if len(parts) == 2:
-            list_name, separator = parts[0].strip(), parts[1].strip()
-            return indent + f"{separator}.join({list_name})"
-    
+            return line.indent + template.format(a=parts[0].strip(), b=parts[1].strip())
+    return None
+
+
+@_handles("split", "separate")
+def _split(line: _Line) -> Optional[str]:
     # split string by separator / separate string by separator
-    if (stripped.startswith("split ") and " by " in stripped) or (stripped.startswith("separate ") and " by " in stripped):
-        if stripped.startswith("split "):
-            parts = stripped[len("split "):].split(" by ", 1)
-        else:  # separate
-            parts = stripped[len("separate "):].split(" by ", 1)
+    stripped = line.stripped
+    if (stripped.startswith("split ") or stripped.startswith("separate ")) and " by " in stripped:
+        parts = stripped.split(" ", 1)[1].split(" by ", 1)
         if len(parts) == 2:
-            string_name, separator = parts[0].strip(), parts[1].strip()
-            string_expr = translate_expression(
-                string_name,
-                in_class=in_class,
-                has_staticmethod=has_staticmethod,
-                has_classmethod=has_classmethod,
-            )
-            separator_expr = translate_expression(
-                separator,
-                in_class=in_class,
-                has_staticmethod=has_staticmethod,
-                has_classmethod=has_classmethod,
-            )
-            return indent + f"{string_expr}.split({separator_expr})"
-    
+            string_expr = line.expr(parts[0].strip())
+            separator_expr = line.expr(parts[1].strip())
+            return line.indent + f"{string_expr}.split({separator_expr})"
+    return None
+
+
+# Atalhos com um operando: prefixo → formato com {x} (a expressão traduzida)
+_UNARY_SHORTCUTS = {
     # uppercase string / to uppercase string
-    if stripped.startswith("uppercase ") or stripped.startswith("to uppercase "):
-        if stripped.startswith("uppercase "):
-            var_name = stripped[len("uppercase "):].strip()
-        else:  # to uppercase
-            var_name = stripped[len("to uppercase "):].strip()
-        var_expr = translate_expression(
-            var_name,
-            in_class=in_class,
-            has_staticmethod=has_staticmethod,
-            has_classmethod=has_classmethod,
-        )
-        return indent + f"{var_expr}.upper()"
-    
+    "uppercase ": "{x}.upper()",
+    "to uppercase ": "{x}.upper()",
     # lowercase string / to lowercase string
-    if stripped.startswith("lowercase ") or stripped.startswith("to lowercase "):
-        if stripped.startswith("lowercase "):
-            var_name = stripped[len("lowercase "):].strip()
-        else:  # to lowercase
-            var_name = stripped[len("to lowercase "):].strip()
-        var_expr = translate_expression(
-            var_name,
-            in_class=in_class,
-            has_staticmethod=has_staticmethod,
-            has_classmethod=has_classmethod,
-        )
-        return indent + f"{var_expr}.lower()"
-    
+    "lowercase ": "{x}.lower()",
+    "to lowercase ": "{x}.lower()",
     # length of list / size of list / count items in list
-    if (stripped.startswith("length of ") or stripped.startswith("size of ") or stripped.startswith("count items in ")):
-        if stripped.startswith("length of "):
-            var_name = stripped[len("length of "):].strip()
-        elif stripped.startswith("size of "):
-            var_name = stripped[len("size of "):].strip()
-        else:  # count items in
-            var_name = stripped[len("count items in "):].strip()
-        var_expr = translate_expression(
-            var_name,
-            in_class=in_class,
-            has_staticmethod=has_staticmethod,
-            has_classmethod=has_classmethod,
-        )
-        return indent + f"len({var_expr})"
-    
-    # Operações de lista comuns
+    "length of ": "len({x})",
+    "size of ": "len({x})",
+    "count items in ": "len({x})",
     # first item in list / last item in list
-    if stripped.startswith("first item in ") or stripped.startswith("last item in "):
-        if stripped.startswith("first item in "):
-            var_name = stripped[len("first item in "):].strip()
-            var_expr = translate_expression(
-                var_name,
-                in_class=in_class,
-                has_staticmethod=has_staticmethod,
-                has_classmethod=has_classmethod,
-            )
-            return indent + f"{var_expr}[0]"
-        else:  # last item in
-            var_name = stripped[len("last item in "):].strip()
-            var_expr = translate_expression(
-                var_name,
-                in_class=in_class,
-                has_staticmethod=has_staticmethod,
-                has_classmethod=has_classmethod,
-            )
-            return indent + f"{var_expr}[-1]"
-    
+    "first item in ": "{x}[0]",
+    "last item in ": "{x}[-1]",
     # reverse list / flip list
-    if stripped.startswith("reverse ") or stripped.startswith("flip "):
-        if stripped.startswith("reverse "):
-            var_name = stripped[len("reverse "):].strip()
-        else:  # flip
-            var_name = stripped[len("flip "):].strip()
-        var_expr = translate_expression(
-            var_name,
-            in_class=in_class,
-            has_staticmethod=has_staticmethod,
-            has_classmethod=has_classmethod,
-        )
-        return indent + f"list(reversed({var_expr}))"
-    
+    "reverse ": "list(reversed({x}))",
+    "flip ": "list(reversed({x}))",
     # sort list / order list
-    if stripped.startswith("sort ") or stripped.startswith("order "):
-        if stripped.startswith("sort "):
-            var_name = stripped[len("sort "):].strip()
-        else:  # order
-            var_name = stripped[len("order "):].strip()
-        var_expr = translate_expression(
-            var_name,
-            in_class=in_class,
-            has_staticmethod=has_staticmethod,
-            has_classmethod=has_classmethod,
-        )
-        return indent + f"sorted({var_expr})"
-    
-    # Operações de arquivo comuns
+    "sort ": "sorted({x})",
+    "order ": "sorted({x})",
     # exists file "path" / file exists "path"
-    if (stripped.startswith("exists file ") or stripped.startswith("file exists ")):
-        if stripped.startswith("exists file "):
-            file_path = stripped[len("exists file "):].strip()
-        else:  # file exists
-            file_path = stripped[len("file exists "):].strip()
-        path_expr = translate_expression(
-            file_path,
-            in_class=in_class,
-            has_staticmethod=has_staticmethod,
-            has_classmethod=has_classmethod,
-        )
-        return indent + f"os.path.exists({path_expr})"
-    
+    "exists file ": "os.path.exists({x})",
+    "file exists ": "os.path.exists({x})",
     # delete file "path" / remove file "path"
-    if (stripped.startswith("delete file ") or stripped.startswith("remove file ")):
-        if stripped.startswith("delete file "):
-            file_path = stripped[len("delete file "):].strip()
-        else:  # remove file
-            file_path = stripped[len("remove file "):].strip()
-        path_expr = translate_expression(
-            file_path,
-            in_class=in_class,
-            has_staticmethod=has_staticmethod,
-            has_classmethod=has_classmethod,
-        )
-        return indent + f"os.remove({path_expr})"
-    
-    # Operações de data/hora comuns
+    "delete file ": "os.remove({x})",
+    "remove file ": "os.remove({x})",
+}
+
+# Primeira palavra → prefixos de _UNARY_SHORTCUTS que começam com ela
+_UNARY_BY_WORD: Dict[str, List[str]] = {}
+for _prefix in _UNARY_SHORTCUTS:
+    _UNARY_BY_WORD.setdefault(_prefix.split(" ", 1)[0], []).append(_prefix)
+
+
+@_handles(*_UNARY_BY_WORD)
+def _unary_shortcut(line: _Line) -> Optional[str]:
+    stripped = line.stripped
+    for prefix in _UNARY_BY_WORD.get(stripped.split(" ", 1)[0], ()):
+        if stripped.startswith(prefix):
+            var_expr = line.expr(stripped[len(prefix):].strip())
+            return line.indent + _UNARY_SHORTCUTS[prefix].format(x=var_expr)
+    return None
+
+
+# Linhas inteiras de data/hora e sistema
+_FIXED_EXPRESSIONS = {
     # current time / now / current date
-    if stripped == "current time" or stripped == "now" or stripped == "current date":
-        return indent + "datetime.datetime.now()"
-    
-    # today / current date
-    if stripped == "today":
-        return indent + "datetime.date.today()"
-    
-    # Operações de sistema comuns
+    "current time": "datetime.datetime.now()",
+    "now": "datetime.datetime.now()",
+    "current date": "datetime.datetime.now()",
+    # today
+    "today": "datetime.date.today()",
     # exit program / quit program / stop program
-    if stripped == "exit program" or stripped == "quit program" or stripped == "stop program":
-        return indent + "sys.exit()"
-    
+    "exit program": "sys.exit()",
+    "quit program": "sys.exit()",
+    "stop program": "sys.exit()",
+}
+
+
+@_handles("current", "now", "today", "exit", "quit", "stop")
+def _fixed_expression(line: _Line) -> Optional[str]:
+    expression = _FIXED_EXPRESSIONS.get(line.stripped)
+    return line.indent + expression if expression else None
+
+
+def _build_dispatch():
+    """
+    Tabela primeira palavra → tradutores a tentar, na ordem original.
+
+    Cada lista tem os tradutores daquela palavra mais os que valem para
+    qualquer linha; palavras fora da tabela só passam pelos gerais.
+    """
+    words = {word for _, first_words in _HANDLERS for word in first_words}
+    table = {
+        word: tuple(func for func, first_words in _HANDLERS if not first_words or word in first_words)
+        for word in words
+    }
+    generic = tuple(func for func, first_words in _HANDLERS if not first_words)
+    return table, generic
+
+
+_DISPATCH, _GENERIC_HANDLERS = _build_dispatch()
+
+
+def translate_line(line: str, in_class: bool = False, has_staticmethod: bool = False, has_classmethod: bool = False) -> str:
+    """
+    Traduz uma linha de código .logic para Python.
+
+    A primeira palavra da linha escolhe, em uma consulta à tabela
+    _DISPATCH, os poucos tradutores que podem tratá-la; eles são tentados
+    na ordem original, e a linha sem tradutor é copiada como Python puro.
+
+    Args:
+        line: Linha do arquivo .logic (com indentação preservada)
+        in_class: Se estamos dentro de uma classe (para adicionar self aos métodos)
+
+    Returns:
+        Linha Python equivalente
+    """
+    return _translate(_Line(line, in_class, has_staticmethod, has_classmethod))
+
+
+def _translate(current: _Line) -> str:
+    """translate_line para uma linha já medida (indentação e strip feitos)."""
+    stripped = current.stripped
+    indent = current.indent
+
+    # Linha vazia
+    if stripped == "":
+        return ""
+
+    # Comentário
+    if stripped.startswith("#"):
+        return indent + stripped
+
+    first_word = _FIRST_WORD_RE.match(stripped).group()
+    for handler in _DISPATCH.get(first_word, _GENERIC_HANDLERS):
+        result = handler(current)
+        if result is not None:
+            return result
+
     # Operador in/not in (normalização)
     if " is in " in stripped:
         stripped = stripped.replace(" is in ", " in ")
     if " is not in " in stripped:
         stripped = stripped.replace(" is not in ", " not in ")
-    
+
     # Walrus operator (Python 3.8+): set x := value
     if " := " in stripped:
         # Já funciona como Python puro, mas vamos garantir
         return indent + stripped
-    
+
     # Métodos especiais (magic methods)
     # __str__, __len__, __repr__, etc. - já funciona via Python puro
     # Mas vamos adicionar sintaxe simplificada
     if stripped.startswith("magic ") and "(" in stripped:
         # magic __str__(): return "string"
         method_def = stripped[len("magic "):]
-        if in_class:
+        if current.in_class:
             # Adicionar self se necessário
             if "(" in method_def and ")" in method_def:
                 method_name, params = method_def.split("(", 1)
@@ -1196,149 +1042,163 @@ def translate_line(line: str, in_class: bool = False, has_staticmethod: bool = F
                 else:
                     return indent + f"def {method_def}"
             return indent + f"def {method_def}"
-    
-    # Múltipla herança: class Child(Parent1, Parent2):
-    # Já funciona via Python puro, mas vamos garantir
-    
-    # Type hints: já funciona via Python puro
-    # def func(x: int) -> str: - funciona como Python puro
-    
-    # Funções aninhadas: já funciona via Python puro
-    
-    # Context managers customizados: já funciona via Python puro
-    
-    # Import relativo: from .module import - já funciona via Python puro
-    
-    # Argumentos padrão: define func(x=10): - já funciona via Python puro
-    # *args e **kwargs: define func(*args, **kwargs): - já funciona via Python puro
-    
+
+    # Múltipla herança, type hints, funções aninhadas, context managers,
+    # imports relativos, argumentos padrão e *args/**kwargs já funcionam
+    # como Python puro
+
     # Fallback: Python puro (copia como está)
     return indent + stripped
 
 
+# Frases que pedem imports no cabeçalho, em qualquer lugar da linha (também
+# em strings e comentários): frase → import. Procuradas na linha em minúsculas.
+_FEATURE_PHRASES = {
+    "exists file ": "os",
+    "file exists ": "os",
+    "delete file ": "os",
+    "remove file ": "os",
+    "current time": "datetime",
+    "current date": "datetime",
+    "exit program": "sys",
+    "quit program": "sys",
+    "stop program": "sys",
+    "transformers": "transformers",
+}
+
+# Frases que só contam escritas exatamente assim ("wait " só pede time se a
+# linha também tiver " seconds")
+_EXACT_FEATURE_PHRASES = {
+    "random number from ": "random",
+    "load model ": "transformers",
+    "AutoModel": "transformers",
+    "await ": "async",
+    "wait ": "time",
+}
+_EXACT_BY_LOWER = {phrase.lower(): (phrase, feature) for phrase, feature in _EXACT_FEATURE_PHRASES.items()}
+
+
+def _phrase_regex(phrases) -> str:
+    """
+    Alternativa de regex com as frases organizadas em trie: prefixos comuns
+    ("current t|ime", "current d|ate") são testados uma vez só.
+    """
+    trie: Dict[str, dict] = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if len(branches) == 1 and "" not in node:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")" + ("?" if "" in node else "")
+
+    return build(trie)
+
+
+# Todas as frases em uma regex: uma busca na linha encontra qualquer uma
+_FEATURE_RE = re.compile(_phrase_regex(list(_FEATURE_PHRASES) + list(_EXACT_BY_LOWER)))
+
+# today/now como palavra, com pontuação colada ("(now)", "today:")
+_DATE_WORD_RE = re.compile(r"(?<!\S)[:,()\[\]]*(?:today|now)[:,()\[\]]*(?!\S)")
+
+# Linhas que marcam a próxima task como @staticmethod / @classmethod
+_STATICMETHOD_LINES = frozenset(("@staticmethod", "staticmethod:"))
+_CLASSMETHOD_LINES = frozenset(("@classmethod", "classmethod:"))
+
+# Imports do cabeçalho, na ordem em que são escritos
+_FEATURE_IMPORTS = [
+    ("os", "import os"),
+    ("datetime", "import datetime"),
+    ("sys", "import sys"),
+    ("time", "import time"),
+    ("random", "import random"),
+    ("async", "import asyncio"),
+    ("transformers", "from transformers import AutoModelForCausalLM, AutoTokenizer"),
+    ("transformers", "import torch"),
+]
+
+
+def _add_line_features(stripped: str, features: Set[str]):
+    """Adiciona a `features` os imports pedidos por uma linha (não vazia)."""
+    lowered = stripped.lower()
+    match = _FEATURE_RE.search(lowered)
+    while match is not None:
+        phrase = match.group()
+        if phrase in _FEATURE_PHRASES:
+            features.add(_FEATURE_PHRASES[phrase])
+        else:
+            exact, feature = _EXACT_BY_LOWER[phrase]
+            if exact in stripped and (feature != "time" or " seconds" in stripped):
+                features.add(feature)
+        # As frases podem se sobrepor ("await " contém "wait ")
+        match = _FEATURE_RE.search(lowered, match.start() + 1)
+    if ("now" in lowered or "today" in lowered) and _DATE_WORD_RE.search(lowered):
+        features.add("datetime")
+    if stripped.startswith("async "):
+        features.add("async")
+
+
 def transpile_file(input_path: str, output_path: str = None) -> str:
     """
     Transpila um arquivo .logic para Python.
-    
+
+    Cada linha é medida uma vez (_Line): o mesmo objeto serve para rastrear
+    classes, detectar os imports do cabeçalho e traduzir.
+
     Args:
         input_path: Caminho do arquivo .logic
         output_path: Caminho do arquivo .py de saída (opcional)
-        
+
     Returns:
         Código Python gerado
     """
     src_path = Path(input_path)
-    
+
     if not src_path.exists():
         raise FileNotFoundError(f"Arquivo não encontrado: {input_path}")
-    
+
     lines = src_path.read_text(encoding="utf-8").splitlines()
     py_lines: List[str] = []
-    
-    needs_time = False
-    needs_random = False
-    needs_async = False
-    needs_transformers = False
-    needs_torch = False
-    needs_os = False
-    needs_datetime = False
-    needs_sys = False
-    
+    features: Set[str] = set()
+
     # Rastrear contexto (se estamos dentro de uma classe)
     in_class = False
     class_indent = 0
     previous_line = ""  # Para detectar decorators
-    
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-        indent_size = len(line) - len(line.lstrip(" "))
-        lowered = stripped.lower()
-        tokens = [token.strip(":,()[]") for token in lowered.split()]
+
+    for line in lines:
+        # Verificar se linha anterior tem decorator
+        current = _Line(
+            line,
+            in_class,
+            has_staticmethod=previous_line in _STATICMETHOD_LINES,
+            has_classmethod=previous_line in _CLASSMETHOD_LINES,
+        )
+        stripped = current.stripped
 
         # Detectar início/fim de classe
         if stripped.startswith("class ") and stripped.endswith(":"):
             in_class = True
-            class_indent = indent_size
-        elif in_class and indent_size <= class_indent and stripped and not stripped.startswith("#"):
+            class_indent = current.indent_size
+        elif in_class and current.indent_size <= class_indent and stripped and not stripped.startswith("#"):
             # Sair da classe se a indentação voltar ao nível da classe
             in_class = False
-        
-        # Verificar linha anterior para decorators
-        has_staticmethod = i > 0 and lines[i-1].strip() in ["@staticmethod", "staticmethod:"]
-        has_classmethod = i > 0 and lines[i-1].strip() in ["@classmethod", "classmethod:"]
-        
-        # Atualizar previous_line
+        current.in_class = in_class
+
+        if stripped:
+            _add_line_features(stripped, features)
+        py_lines.append(_translate(current))
         previous_line = stripped
-        
-        # Detectar uso de os
-        if (
-            "exists file " in lowered
-            or "file exists " in lowered
-            or "delete file " in lowered
-            or "remove file " in lowered
-        ):
-            needs_os = True
-
-        # Detectar uso de datetime
-        if (
-            "current time" in lowered
-            or "current date" in lowered
-            or "today" in tokens
-            or "now" in tokens
-        ):
-            needs_datetime = True
-
-        # Detectar uso de sys
-        if (
-            "exit program" in lowered
-            or "quit program" in lowered
-            or "stop program" in lowered
-        ):
-            needs_sys = True
-        
-        # Detectar uso de time
-        if "wait " in stripped and " seconds" in stripped:
-            needs_time = True
-        
-        # Detectar uso de random
-        if "random number from " in stripped:
-            needs_random = True
-        
-        # Detectar async
-        if stripped.startswith("async ") or "await " in stripped:
-            needs_async = True
-        
-        # Detectar uso de modelos de IA
-        if "load model " in stripped or "AutoModel" in stripped or "transformers" in stripped.lower():
-            needs_transformers = True
-            needs_torch = True
-        
-        # Verificar se linha anterior tem decorator
-        has_staticmethod = i > 0 and lines[i-1].strip() in ["@staticmethod", "staticmethod:"]
-        has_classmethod = i > 0 and lines[i-1].strip() in ["@classmethod", "classmethod:"]
-        
-        py_line = translate_line(line, in_class=in_class, has_staticmethod=has_staticmethod, has_classmethod=has_classmethod)
-        py_lines.append(py_line)
-    
+
     # Montar código final
-    header: List[str] = []
-    if needs_os:
-        header.append("import os")
-    if needs_datetime:
-        header.append("import datetime")
-    if needs_sys:
-        header.append("import sys")
-    if needs_time:
-        header.append("import time")
-    if needs_random:
-        header.append("import random")
-    if needs_async:
-        header.append("import asyncio")
-    if needs_transformers:
-        header.append("from transformers import AutoModelForCausalLM, AutoTokenizer")
-    if needs_torch:
-        header.append("import torch")
-    
+    header: List[str] = [statement for feature, statement in _FEATURE_IMPORTS if feature in features]
+
     if header:
         full_code = "\n".join(header + [""] + py_lines) + "\n"
     else:
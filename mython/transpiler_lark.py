@@ -3,12 +3,13 @@ Transpiler usando Lark - Versão robusta e formal.
 """
 
 from pathlib import Path
-from lark import Lark, Tree
-from lark.exceptions import LarkError, UnexpectedToken, UnexpectedCharacters
-import re
+import time
 
+from .lark_runtime import Tree, LarkError, UnexpectedToken, UnexpectedCharacters
 from .transformer_lark import MythonTransformer
-from .indenter import MythonIndenter
+from .normalize import normalize_conditions
+from .parser_cache import get_parser, parser_key
+from .result_cache import get_result_cache, result_key
 
 # Importar sistema de i18n
 try:
@@ -20,12 +21,13 @@ except ImportError:
 
 # Importar sistema de tradução híbrido (LibreTranslate + Argos Translate)
 try:
-    from .translator import translate_code as translate_keywords, get_available_translators
+    from .translator import translate_code as translate_keywords, get_available_translators, backend_identity
     HYBRID_TRANSLATOR_AVAILABLE = True
 except ImportError:
     HYBRID_TRANSLATOR_AVAILABLE = False
     translate_keywords = None
     get_available_translators = None
+    backend_identity = None
 
 # Importar sistema de macros modular
 try:
@@ -50,152 +52,17 @@ def auto_fstring(code: str) -> str:
     return code
 
 
-def dict_sem_aspas(code: str) -> str:
-    """
-    Permite dict literals sem aspas nas chaves: {name: "John"} -> {"name": "John"}
-    
-    Inspirado nos exemplos do Lark: syntax sugar para estruturas de dados.
-    """
-    lines = code.split('\n')
-    normalized_lines = []
-    
-    for line in lines:
-        # Buscar padrões como {key: value} onde key é um NAME (não uma string)
-        # Padrão: { name : value } ou {name:value} (com ou sem espaços)
-        # IMPORTANTE: Não aplicar se já for {"key": value} ou se key já estiver entre aspas
-        
-        # Buscar dict literals que não tenham aspas nas chaves
-        # Exemplo: {name: "John", age: 30}
-        def replace_dict_key(match):
-            # match.group(0) = {name: "John", ...}
-            content = match.group(1)  # name: "John", age: 30
-            
-            # Processar cada par chave:valor
-            pairs = []
-            # Split por vírgulas, mas cuidado com vírgulas dentro de strings
-            current_pair = ""
-            depth = 0  # Para rastrear parênteses, colchetes, etc.
-            in_string = False
-            string_char = None
-            
-            for char in content:
-                if char in ('"', "'") and (not in_string or char == string_char):
-                    in_string = not in_string
-                    if in_string:
-                        string_char = char
-                    else:
-                        string_char = None
-                elif not in_string:
-                    if char in ('(', '[', '{'):
-                        depth += 1
-                    elif char in (')', ']', '}'):
-                        depth -= 1
-                    elif char == ',' and depth == 0:
-                        pairs.append(current_pair.strip())
-                        current_pair = ""
-                        continue
-                
-                current_pair += char
-            
-            if current_pair.strip():
-                pairs.append(current_pair.strip())
-            
-            # Processar cada par
-            new_pairs = []
-            for pair in pairs:
-                if ':' in pair:
-                    key, value = pair.split(':', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    # Se a chave não começar com aspas e for um NAME válido, adicionar aspas
-                    if re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', key):
-                        new_pairs.append(f'"{key}": {value}')
-                    else:
-                        new_pairs.append(pair)
-                else:
-                    new_pairs.append(pair)
-            
-            return '{' + ', '.join(new_pairs) + '}'
-        
-        # Buscar dict literals na linha
-        # Padrão: { ... } onde ... pode conter name: value
-        line = re.sub(r'\{([^}]*)\}', replace_dict_key, line)
-        
-        normalized_lines.append(line)
-    
-    return '\n'.join(normalized_lines)
-
-
 def normalize_operators(code: str) -> str:
     """
     Normaliza expressões naturais para operadores Python simples ANTES do parsing.
     Isso simplifica o transformer e garante que o Lark receba código já normalizado.
     
-    Também aplica melhorias de syntax sugar inspiradas nos exemplos do Lark:
-    - Dict sem aspas: {name: "John"} -> {"name": "John"}
+    (Dicts sem aspas nas chaves, {name: "John"}, são aceitos pela própria
+    gramática - ver pair em grammar.lark - e não passam mais por aqui.)
     """
-    # Aplicar dict sem aspas (isso funciona bem antes do parsing)
-    code = dict_sem_aspas(code)
-    
-    lines = code.split('\n')
-    normalized_lines = []
-    
-    for line in lines:
-        # Normalizar condições em if/elif/while
-        # Buscar padrões como "if X is over Y:", "if X is greater than Y:", etc.
-        if re.search(r'\b(if|elif|while|when|whenever)\s+', line, re.IGNORECASE):
-            # Extrair a condição (tudo entre "if/elif/while" e ":")
-            match = re.search(r'\b(if|elif|while|when|whenever)\s+(.+?)\s*:', line, re.IGNORECASE)
-            if match:
-                keyword = match.group(1)
-                condition = match.group(2)
-                
-                # Normalizar a condição - substituir expressões naturais por operadores Python
-                # Ordem importa: mais longas primeiro
-                # IMPORTANTE: manter espaços ao redor dos operadores para o parser reconhecer
-                replacements = [
-                    (" is greater than or equal to ", " >= "),
-                    (" greater than or equal to ", " >= "),
-                    (" is less than or equal to ", " <= "),
-                    (" less than or equal to ", " <= "),
-                    (" is greater than ", " > "),
-                    (" greater than ", " > "),
-                    (" is less than ", " < "),
-                    (" less than ", " < "),
-                    (" is at least ", " >= "),
-                    (" is at most ", " <= "),
-                    (" is over ", " > "),
-                    (" is above ", " > "),
-                    (" above ", " > "),
-                    (" is under ", " < "),
-                    (" is below ", " < "),
-                    (" is not equal to ", " != "),
-                    (" not equal to ", " != "),
-                    (" equals ", " == "),
-                    (" equal to ", " == "),
-                ]
-                
-                for old, new in replacements:
-                    condition = condition.replace(old, new)
-                
-                # Substituir "is not in" primeiro (antes de "is not")
-                condition = re.sub(r'\bis not in\b', ' not in ', condition, flags=re.IGNORECASE)
-                condition = re.sub(r'\bis not\b', ' != ', condition, flags=re.IGNORECASE)
-                condition = re.sub(r'\bis in\b', ' in ', condition, flags=re.IGNORECASE)
-                
-                # Substituir "is" simples por "==" (mas não se for parte de outras expressões)
-                condition = re.sub(r'\bis\b(?!\s+(?:not|in|over|under|above|below|greater|less|at|equal))', ' == ', condition, flags=re.IGNORECASE)
-                
-                # Limpar espaços múltiplos
-                condition = re.sub(r'\s+', ' ', condition).strip()
-                
-                # Reconstruir a linha
-                line = line[:match.start(2)] + condition + line[match.end(2):]
-        
-        normalized_lines.append(line)
-    
-    return '\n'.join(normalized_lines)
+    # Condições de if/elif/while: "is greater than" -> ">", "is not" -> "!=", ...
+    # (uma passada só, sem tocar em strings literais; ver normalize.py)
+    return normalize_conditions(code)
 
 
 def preprocess_indentation(code: str) -> str:
@@ -341,7 +208,48 @@ def preprocess_indentation(code: str) -> str:
     return '\n'.join(processed_lines)
 
 
-def transpile_file(input_path: str, output_path: str = None, lang: str = None) -> str:
+def _all_macro_rules() -> tuple:
+    """Regras de todas as macros registradas (chave do cache de resultados)."""
+    if MACROS_AVAILABLE and macro_registry:
+        return macro_registry.fingerprint
+    return ()
+
+
+def select_parser(code: str):
+    """
+    Retorna o parser para o código já traduzido e normalizado.
+    
+    Sem nenhuma palavra inicial de macro no código (`load`, `get data`,
+    `plot`...), usa a gramática base; senão, a gramática com só os módulos
+    de macros referenciados (ver MacroRegistry.get_grammar_rules_for).
+    Todos os parsers ficam em cache (ver parser_cache).
+    """
+    macro_rules = ()
+    if MACROS_AVAILABLE and macro_registry:
+        macro_rules = macro_registry.get_grammar_rules_for(code)
+    try:
+        return get_parser(macro_rules)
+    except ImportError:
+        # Sem o pacote lark só há os parsers embutidos no standalone, que
+        # cobrem cada módulo padrão sozinho e todos juntos
+        if not macro_rules:
+            raise
+        return get_parser(_all_macro_rules())
+
+
+def _cache_options(use_hybrid_translator: bool) -> list:
+    """
+    Opções da chave do cache de resultados: o backend de tradução entra na
+    chave, já que backends diferentes (dicionário, LibreTranslate, Argos)
+    podem traduzir o mesmo código de formas diferentes.
+    """
+    if use_hybrid_translator and HYBRID_TRANSLATOR_AVAILABLE and backend_identity:
+        return ["hybrid=True", f"translator={backend_identity()}"]
+    return [f"hybrid={bool(use_hybrid_translator)}"]
+
+
+def transpile_file(input_path: str, output_path: str = None, lang: str = None,
+                   use_cache: bool = False) -> str:
     """
     Transpila um arquivo .logic para Python usando Lark.
     
@@ -349,6 +257,7 @@ def transpile_file(input_path: str, output_path: str = None, lang: str = None) -
         input_path: Caminho do arquivo .logic
         output_path: Caminho do arquivo .py de saída (opcional)
         lang: Código da língua do código (en, pt, es, etc.) - se None, detecta automaticamente
+        use_cache: Se True, consulta o cache persistente de resultados (ver result_cache)
         
     Returns:
         Código Python gerado
@@ -362,32 +271,22 @@ def transpile_file(input_path: str, output_path: str = None, lang: str = None) -
     if not src_path.exists():
         raise FileNotFoundError(f"Arquivo não encontrado: {input_path}")
     
-    # Carregar gramática
-    grammar_path = Path(__file__).parent / "grammar.lark"
-    if not grammar_path.exists():
-        raise FileNotFoundError(f"Gramática não encontrada: {grammar_path}")
-    
-    with open(grammar_path, 'r', encoding='utf-8') as f:
-        grammar = f.read()
-    
-    # Criar parser com indenter para processar indentação estilo Python
-    try:
-        parser = Lark(
-            grammar,
-            start='start',
-            parser='lalr',  # LALR para usar com indenter (mais eficiente)
-            postlex=MythonIndenter(),  # ESSENCIAL: processa indentação automaticamente
-            propagate_positions=True,  # Manter posições para erros
-        )
-    except Exception as e:
-        raise RuntimeError(f"Erro ao criar parser: {e}")
-    
     # Ler arquivo
     try:
-        code = src_path.read_text(encoding='utf-8')
+        source = src_path.read_bytes()
+        code = source.decode('utf-8')
     except Exception as e:
         raise IOError(f"Erro ao ler arquivo: {e}")
     
+    # Consultar cache de resultados (acerto pula todo o pipeline)
+    cache = get_result_cache() if use_cache else None
+    if cache is not None:
+        cache_key = result_key(source, lang, parser_key(_all_macro_rules()), options=_cache_options(True))
+        python_code = cache.get(cache_key)
+        if python_code is not None:
+            _save_output(output_path, python_code)
+            return python_code
+    
     # Detectar língua automaticamente se não especificada
     if lang is None and I18N_AVAILABLE and detect_language:
         try:
@@ -469,6 +368,14 @@ def transpile_file(input_path: str, output_path: str = None, lang: str = None) -
     # NÃO precisamos mais pré-processar indentação - o Indenter faz isso automaticamente!
     # code = preprocess_indentation(code)  # REMOVIDO - não é mais necessário
     
+    # Obter parser (gramática base ou com as macros usadas; em cache)
+    try:
+        parser = select_parser(code)
+    except FileNotFoundError:
+        raise
+    except Exception as e:
+        raise RuntimeError(f"Erro ao criar parser: {e}")
+    
     # Parsear
     try:
         tree = parser.parse(code)
@@ -500,7 +407,17 @@ def transpile_file(input_path: str, output_path: str = None, lang: str = None) -
     except Exception as e:
         raise RuntimeError(f"Erro ao transformar código: {e}")
     
+    if cache is not None:
+        cache.put(cache_key, python_code)
+    
     # Salvar arquivo se output_path foi fornecido
+    _save_output(output_path, python_code)
+    
+    return python_code
+
+
+def _save_output(output_path: str, python_code: str):
+    """Salva o código gerado em output_path (se fornecido)."""
     if output_path:
         try:
             out_path = Path(output_path)
@@ -508,11 +425,10 @@ def transpile_file(input_path: str, output_path: str = None, lang: str = None) -
             out_path.write_text(python_code, encoding='utf-8')
         except Exception as e:
             raise IOError(f"Erro ao salvar arquivo: {e}")
-    
-    return python_code
 
 
-def transpile_string(code: str, lang: str = None, use_hybrid_translator: bool = True) -> str:
+def transpile_string(code: str, lang: str = None, use_hybrid_translator: bool = True,
+                     use_cache: bool = False, timings: dict = None) -> str:
     """
     Transpila código Mython de uma string.
     
@@ -520,6 +436,9 @@ def transpile_string(code: str, lang: str = None, use_hybrid_translator: bool =
         code: Código Mython como string
         lang: Código da língua do código (en, pt, es, etc.) - se None, detecta automaticamente
         use_hybrid_translator: Se True, usa sistema híbrido (LibreTranslate + Argos Translate)
+        use_cache: Se True, consulta o cache persistente de resultados (ver result_cache)
+        timings: Se informado, recebe o tempo (em segundos) de cada etapa
+            (cache, detect, translate, normalize, parser, parse, transform)
         
     Returns:
         Código Python gerado
@@ -527,41 +446,27 @@ def transpile_string(code: str, lang: str = None, use_hybrid_translator: bool =
     Raises:
         SyntaxError: Se houver erro de sintaxe
     """
-    # Carregar gramática
-    grammar_path = Path(__file__).parent / "grammar.lark"
-    if not grammar_path.exists():
-        raise FileNotFoundError(f"Gramática não encontrada: {grammar_path}")
-    
-    with open(grammar_path, 'r', encoding='utf-8') as f:
-        grammar = f.read()
-    
-    # Adicionar regras de macros à gramática se disponível
-    if MACROS_AVAILABLE and macro_registry:
-        macro_rules = macro_registry.get_grammar_rules()
-        if macro_rules:
-            # Adicionar regras de macros antes de simple_stmt
-            # IMPORTANTE: Macros devem estar antes de outros statements para precedência
-            macro_grammar = "\n".join(["\n// Macros (geradas dinamicamente)"] + macro_rules + [""])
-            
-            # Criar regra macro_stmt que agrupa todas as macros
-            macro_stmt_rule = "macro_stmt: " + " | ".join([rule.split(":")[0] for rule in macro_rules]) + "\n"
-            
-            # Inserir antes de simple_stmt
-            if "simple_stmt:" in grammar:
-                # Encontrar a linha simple_stmt: e inserir antes
-                grammar = grammar.replace(
-                    "simple_stmt:",
-                    macro_grammar + macro_stmt_rule + "\nsimple_stmt: macro_stmt\n           | "
-                )
-    
-    # Criar parser com indenter para processar indentação estilo Python
-    parser = Lark(
-        grammar,
-        start='start',
-        parser='lalr',  # LALR para usar com indenter (mais eficiente)
-        postlex=MythonIndenter(),  # ESSENCIAL: processa indentação automaticamente
-        propagate_positions=True,
-    )
+    if timings is None:
+        timings = {}
+    start = time.perf_counter()
+    
+    def lap(stage):
+        nonlocal start
+        now = time.perf_counter()
+        timings[stage] = timings.get(stage, 0.0) + now - start
+        start = now
+    
+    # Consultar cache de resultados (acerto pula todo o pipeline)
+    cache = get_result_cache() if use_cache else None
+    if cache is not None:
+        cache_key = result_key(
+            code.encode('utf-8'), lang, parser_key(_all_macro_rules()),
+            options=_cache_options(use_hybrid_translator),
+        )
+        python_code = cache.get(cache_key)
+        lap("cache")
+        if python_code is not None:
+            return python_code
     
     # Detectar língua automaticamente se necessário
     # IMPORTANTE: Sempre detectar se lang é None para garantir tradução automática
@@ -579,6 +484,7 @@ def transpile_string(code: str, lang: str = None, use_hybrid_translator: bool =
                 lang = "en"  # Default para inglês em caso de erro
         else:
             lang = "en"  # Default para inglês se i18n não estiver disponível
+        lap("detect")
     
     # Traduzir código para inglês se necessário (antes de parsear)
     # PRIORIDADE: Sistema híbrido (LibreTranslate + Argos Translate)
@@ -603,22 +509,34 @@ def transpile_string(code: str, lang: str = None, use_hybrid_translator: bool =
                 code = translate_code(code, lang=lang, reverse=True)
             except Exception:
                 pass  # Continuar com código original se falhar
+        lap("translate")
     
     # Normalizar operadores ANTES do parsing (simplifica o transformer)
     code = normalize_operators(code)
+    lap("normalize")
     
     # NÃO precisamos mais pré-processar indentação - o Indenter faz isso automaticamente!
     # code = preprocess_indentation(code)  # REMOVIDO - não é mais necessário
     
+    # Parser com as regras só das macros usadas no código (fica em cache)
+    parser = select_parser(code)
+    lap("parser")
+    
     # Parsear
     try:
         tree = parser.parse(code)
     except (UnexpectedToken, UnexpectedCharacters, LarkError) as e:
         raise SyntaxError(f"Erro de sintaxe: {e}")
+    lap("parse")
     
     # Transformar
     transformer = MythonTransformer(source_code=code)
     python_code = transformer.transform(tree)
+    lap("transform")
+    
+    if cache is not None:
+        cache.put(cache_key, python_code)
+        lap("cache")
     
     return python_code
 
@@ -0,0 +1,221 @@
+"""
+Modo watch: retranspila arquivos .logic assim que são salvos.
+
+Usado por `mython watch DIR`. O parser, o transformer e os dicionários
+ficam carregados no processo, então cada retranspilação custa só o
+trabalho do próprio arquivo. Eventos do sistema de arquivos vêm do
+watchdog (inotify/FSEvents/...) quando instalado; sem ele, o diretório
+é varrido periodicamente (os.scandir + stat).
+
+Salvamentos em rajada são agrupados (debounce) e o lote é entregue ao
+build incremental (ver build.py), que refaz os arquivos alterados e os
+que dependem deles.
+"""
+
+import os
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from .build import BuildReport, FileResult, _scan_sources, build_tree
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+# Espera após o último evento antes de retranspilar (segundos)
+DEFAULT_DEBOUNCE = 0.03
+
+# Intervalo entre varreduras quando o watchdog não está disponível (segundos)
+DEFAULT_POLL_INTERVAL = 0.05
+
+
+class _PollingBackend:
+    """Detecta mudanças comparando (mtime, tamanho) dos .logic a cada varredura."""
+
+    def __init__(self, root: str, interval: float):
+        self.root = root
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[str, tuple]:
+        snapshot = {}
+        for rel in _scan_sources(self.root):
+            try:
+                stat = os.stat(os.path.join(self.root, rel))
+            except FileNotFoundError:
+                continue
+            snapshot[rel] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def start(self, events: "queue.Queue[str]", stop: threading.Event):
+        def loop():
+            while not stop.wait(self.interval):
+                try:
+                    current = self._scan()
+                except OSError:
+                    # Diretório mudou durante a varredura - tentar na próxima
+                    continue
+                for rel in current.keys() | self._snapshot.keys():
+                    if current.get(rel) != self._snapshot.get(rel):
+                        events.put(rel)
+                self._snapshot = current
+
+        threading.Thread(target=loop, name="mython-watch-poll", daemon=True).start()
+
+
+class _WatchdogBackend:
+    """Recebe eventos do watchdog e repassa os caminhos .logic."""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def start(self, events: "queue.Queue[str]", stop: threading.Event):
+        root = os.path.join(os.path.abspath(self.root), "")
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.is_directory:
+                    return
+                for path in (event.src_path, getattr(event, "dest_path", "")):
+                    if path and path.endswith(".logic"):
+                        events.put(os.path.abspath(path)[len(root):].replace(os.sep, "/"))
+
+        observer = Observer()
+        observer.schedule(Handler(), self.root, recursive=True)
+        observer.daemon = True
+        observer.start()
+
+        def stopper():
+            stop.wait()
+            observer.stop()
+
+        threading.Thread(target=stopper, name="mython-watch-stop", daemon=True).start()
+
+
+class Watcher:
+    """
+    Observa um diretório e retranspila os .logic alterados.
+
+    Args:
+        src_dir: Diretório observado (recursivamente)
+        out_dir: Diretório de saída (padrão: .py ao lado de cada .logic)
+        lang: Língua do código (None = detectar em cada arquivo)
+        debounce: Espera após o último evento antes de retranspilar (s)
+        poll_interval: Intervalo da varredura sem watchdog (s)
+        use_polling: Força a varredura mesmo com o watchdog instalado
+        on_result: Chamado com (FileResult, latência em s) para cada arquivo
+            retranspilado; a latência é medida do salvamento (mtime) até a
+            saída gravada
+        on_ready: Chamado com o BuildReport do build inicial, antes de
+            começar a observar
+    """
+
+    def __init__(self, src_dir: str, out_dir: Optional[str] = None, lang: Optional[str] = None,
+                 debounce: float = DEFAULT_DEBOUNCE, poll_interval: float = DEFAULT_POLL_INTERVAL,
+                 use_polling: bool = False,
+                 on_result: Optional[Callable[[FileResult, float], None]] = None,
+                 on_ready: Optional[Callable[[BuildReport], None]] = None):
+        self.src_dir = str(src_dir)
+        self.out_dir = out_dir
+        self.lang = lang
+        self.debounce = debounce
+        self.on_result = on_result or (lambda result, latency: None)
+        self.on_ready = on_ready or (lambda report: None)
+        if WATCHDOG_AVAILABLE and not use_polling:
+            self.backend = _WatchdogBackend(self.src_dir)
+        else:
+            self.backend = _PollingBackend(self.src_dir, poll_interval)
+        self._events: "queue.Queue[str]" = queue.Queue()
+        self._stop = threading.Event()
+        self._last_build = 0.0
+        self._errors: Dict[str, str] = {}
+
+    @property
+    def backend_name(self) -> str:
+        return "watchdog" if isinstance(self.backend, _WatchdogBackend) else "polling"
+
+    def _build(self) -> BuildReport:
+        return build_tree(self.src_dir, self.out_dir, jobs=1, lang=self.lang)
+
+    def build(self) -> List[FileResult]:
+        """Build incremental da árvore; retorna os arquivos retranspilados."""
+        report = self._build()
+        done = time.time()
+        rebuilt = [r for r in report.results if r.status != "skipped"]
+        saved = {}
+        for result in rebuilt:
+            try:
+                saved[result.source] = os.stat(result.source).st_mtime
+            except FileNotFoundError:
+                pass
+        # Dependentes (não salvos neste lote) contam a partir do salvamento mais recente
+        newest = max(saved.values(), default=done)
+        for result in rebuilt:
+            # Arquivos com erro são tentados de novo a cada lote; avisar só uma vez
+            if result.status == "error":
+                if self._errors.get(result.source) == result.error:
+                    continue
+                self._errors[result.source] = result.error
+            else:
+                self._errors.pop(result.source, None)
+            mtime = saved.get(result.source, newest)
+            if mtime < self._last_build:
+                mtime = newest
+            self.on_result(result, done - mtime)
+        self._last_build = done
+        self._errors.pop(self.src_dir, None)
+        return rebuilt
+
+    def stop(self):
+        """Encerra o loop de run()."""
+        self._stop.set()
+
+    def run(self):
+        """Build inicial e, em seguida, retranspila a cada mudança até stop()."""
+        report = self._build()
+        self._errors = {r.source: r.error for r in report.results if r.status == "error"}
+        self._last_build = time.time()
+        self.on_ready(report)
+        self.backend.start(self._events, self._stop)
+
+        pending = False
+        last_event = 0.0
+        while not self._stop.is_set():
+            timeout = self.debounce if pending else 0.5
+            try:
+                self._events.get(timeout=timeout)
+                pending = True
+                last_event = time.perf_counter()
+                continue
+            except queue.Empty:
+                pass
+            if pending and time.perf_counter() - last_event >= self.debounce:
+                pending = False
+                try:
+                    self.build()
+                except Exception as e:
+                    # Um lote com problema (ex.: arquivo apagado durante a
+                    # varredura) não pode encerrar o watch: avisar e seguir
+                    self._report_failure(e)
+
+    def _report_failure(self, error: Exception):
+        """Entrega ao on_result um erro do build do lote inteiro."""
+        message = f"{type(error).__name__}: {error}"
+        if self._errors.get(self.src_dir) != message:
+            self._errors[self.src_dir] = message
+            self.on_result(FileResult(self.src_dir, self.out_dir or "", "error", 0.0, error=message), 0.0)
+
+
+def watch(src_dir: str, out_dir: Optional[str] = None, lang: Optional[str] = None, **options) -> Watcher:
+    """Cria um Watcher e roda até Ctrl+C; retorna o Watcher encerrado."""
+    watcher = Watcher(src_dir, out_dir, lang=lang, **options)
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        watcher.stop()
+    return watcher
@@ -0,0 +1,36 @@
+"""
+Testes da busca de arquivos do `mython build` (mython.build).
+"""
+
+import os
+
+import pytest
+
+from mython.build import _scan_sources
+
+
+def test_scan_finds_nested_sources(tmp_path):
+    (tmp_path / "pkg" / "sub").mkdir(parents=True)
+    (tmp_path / "main.logic").write_text("say 1\n")
+    (tmp_path / "pkg" / "sub" / "util.logic").write_text("say 2\n")
+    (tmp_path / "notes.txt").write_text("")
+    assert sorted(_scan_sources(str(tmp_path))) == ["main.logic", "pkg/sub/util.logic"]
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="sem links simbólicos")
+def test_scan_stops_at_symlink_loops(tmp_path):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "util.logic").write_text("say 1\n")
+    (tmp_path / "linked").mkdir()
+    (tmp_path / "linked" / "extra.logic").write_text("say 2\n")
+    try:
+        os.symlink(tmp_path, tmp_path / "pkg" / "loop")
+        os.symlink(tmp_path / "linked", tmp_path / "pkg" / "shortcut")
+    except OSError:
+        pytest.skip("sem permissão para criar links simbólicos")
+    # O link para um diretório acima é ignorado; os outros são seguidos
+    assert sorted(_scan_sources(str(tmp_path))) == [
+        "linked/extra.logic",
+        "pkg/shortcut/extra.logic",
+        "pkg/util.logic",
+    ]
@@ -0,0 +1,44 @@
+"""
+Testes dos dicts com chaves sem aspas ({name: "John"} -> {"name": "John"}).
+"""
+
+import pytest
+
+from mython import parser_cache
+from mython.transpiler_lark import transpile_string
+
+
+def transpile(source: str) -> str:
+    return transpile_string(source + "\n", lang="en", use_hybrid_translator=False, use_cache=False)
+
+
+@pytest.mark.parametrize("source, expected", [
+    ('dict d = {name: "John", age: 30}', 'd = {"name": "John", "age": 30}'),
+    ('dict d = {"name": "John", age: 30}', 'd = {"name": "John", "age": 30}'),
+    ('dict e = {}', 'e = {}'),
+    ('set s = {a, b}', 's = {a, b}'),
+])
+def test_unquoted_keys_are_quoted(source, expected):
+    assert transpile(source) == expected
+
+
+def test_nested_dicts():
+    source = 'say {a: {b: 1, "c": {d: [1, 2]}}, "e": 2}'
+    assert transpile(source) == 'print({"a": {"b": 1, "c": {"d": [1, 2]}}, "e": 2})'
+
+
+@pytest.mark.parametrize("source, expected", [
+    ('say "use {x: 1} here"', 'print("use {x: 1} here")'),
+    ('say "{x:.2f}"', 'print("{x:.2f}")'),
+    ('say {msg: "a {b: c} d"}', 'print({"msg": "a {b: c} d"})'),
+    ('say {msg: "}", other: "{"}', 'print({"msg": "}", "other": "{"})'),
+])
+def test_braces_inside_strings_are_untouched(source, expected):
+    assert transpile(source) == expected
+
+
+def test_unquoted_key_is_a_name_in_the_tree():
+    # A gramática aceita NAME como chave; as aspas vêm do transformer
+    tree = parser_cache.get_parser().parse('say {name: "a {b}"}\n')
+    pair = next(tree.find_data("pair"))
+    assert [(token.type, str(token)) for token in pair.children] == [("NAME", "name"), ("STRING", '"a {b}"')]
@@ -0,0 +1,122 @@
+"""
+Testes do i18n (mython.i18n): tradução de palavras-chave e detecção da língua.
+"""
+
+import pytest
+
+from mython import i18n
+from mython.i18n import detect_language, detect_language_with_confidence, translate_code
+
+ENGLISH = (
+    "if age > 18:\n"
+    '    say "if you say so, return"  # else while\n'
+    "elif age == 0:\n"
+    "    return 1\n"
+    "else:\n"
+    "    say 'class'\n"
+)
+
+PORTUGUESE = (
+    "se age > 18:\n"
+    '    dizer "if you say so, return"  # else while\n'
+    "senão se age == 0:\n"
+    "    retornar 1\n"
+    "senão:\n"
+    "    dizer 'class'\n"
+)
+
+
+def test_english_to_portuguese_and_back():
+    assert translate_code(ENGLISH, "pt", source_lang="en") == PORTUGUESE
+    assert translate_code(PORTUGUESE, "pt", reverse=True) == ENGLISH
+
+
+def test_detects_source_language():
+    assert translate_code(ENGLISH, "pt") == PORTUGUESE
+    assert translate_code(PORTUGUESE, "es").startswith("si age > 18:")
+
+
+def test_between_two_non_english_languages():
+    assert translate_code(PORTUGUESE, "es", source_lang="pt") == (
+        "si age > 18:\n"
+        '    decir "if you say so, return"  # else while\n'
+        "sino si age == 0:\n"
+        "    devolver 1\n"
+        "sino:\n"
+        "    decir 'class'\n"
+    )
+
+
+def test_phrases_win_over_their_words():
+    # "senão se" é uma frase (elif), não "senão" + "se"
+    code = "senao se x:\n    retornar 1\ncaso contrario:\n    retornar 2\n"
+    assert translate_code(code, "pt", reverse=True) == (
+        "elif x:\n    return 1\notherwise:\n    return 2\n"
+    )
+
+
+@pytest.mark.parametrize("code", [
+    'dizer "se senão enquanto retornar"\n',
+    "dizer 'caso contrário'  # senão se retornar\n",
+    'dizer """\nse x:\n    retornar\n"""\n',
+])
+def test_strings_and_comments_are_untouched(code):
+    english = translate_code(code, "pt", reverse=True)
+    assert english.startswith("say ")
+    assert english[len("say "):] == code[len("dizer "):]
+
+
+def test_english_strings_stay_english_in_portuguese_output():
+    code = 'say "if else while"  # return class\nif x:\n    say "ok"\n'
+    assert translate_code(code, "pt", source_lang="en") == (
+        'dizer "if else while"  # return class\nse x:\n    dizer "ok"\n'
+    )
+
+
+def test_unknown_words_and_identifiers_are_kept():
+    code = "se idade_minima > limite:\n    dizer total\n"
+    assert translate_code(code, "pt", reverse=True) == "if idade_minima > limite:\n    say total\n"
+
+
+def test_english_target_without_reverse_is_unchanged():
+    assert translate_code(PORTUGUESE, "en") is PORTUGUESE
+
+
+@pytest.mark.parametrize("code, lang", [
+    (ENGLISH, "en"),
+    (PORTUGUESE, "pt"),
+    ("si x:\n    decir 1\nsino:\n    devolver 2\n", "es"),
+    ("SENAO SE x:\n    DIZER 1\nSenão:\n    retornar 2\n", "pt"),
+])
+def test_detects_language(code, lang):
+    assert detect_language(code) == lang
+
+
+def test_strings_and_comments_in_another_language_do_not_count():
+    # Código em inglês com textos em português, e vice-versa
+    english = 'if x:\n    say "se senão enquanto retornar para cada"  # senão se dizer\n'
+    portuguese = 'se x:\n    dizer "if else while return class say"  # if else while\n'
+    docstring = 'say """\nse x:\n    dizer senão enquanto\n"""\n'
+    assert detect_language_with_confidence(english) == ("en", 1.0)
+    assert detect_language_with_confidence(portuguese)[0] == "pt"
+    assert detect_language(docstring) == "en"
+
+
+def test_confidence():
+    assert detect_language_with_confidence("x = 1\n") == ("en", 0.0)
+    lang, confidence = detect_language_with_confidence("se x:\n    dizer 1\nsenão:\n    dizer 2\nif y:\n    say 3\n")
+    assert lang == "pt" and 0.5 <= confidence < 1.0
+
+
+def test_result_is_cached(monkeypatch):
+    code = "enquanto x:\n    dizer x\n"
+    assert detect_language(code) == "pt"
+    monkeypatch.setattr(i18n, "_score_languages", lambda code: pytest.fail("não usou o cache"))
+    assert detect_language(code) == "pt"
+
+
+def test_sampling_large_inputs():
+    code = PORTUGUESE * (i18n.DETECT_SAMPLE_SIZE // len(PORTUGUESE) * 3)
+    assert detect_language(code, sample=True) == "pt"
+    assert detect_language(code) == "pt"
+    assert len(i18n._sample(code, i18n.DETECT_SAMPLE_SIZE)) <= i18n.DETECT_SAMPLE_SIZE + i18n._SAMPLE_WINDOWS
@@ -0,0 +1,40 @@
+"""
+Equivalência do transpiler legado (mython.transpiler) com as saídas da
+revisão de referência, gravadas em data/legacy_transpiler_baseline.json
+(regerado por benchmarks/legacy_transpiler.py --write-baseline <revisão>).
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from mython import transpiler
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINE = json.loads(
+    (Path(__file__).parent / "data" / "legacy_transpiler_baseline.json").read_text(encoding="utf-8")
+)["examples"]
+
+# Contextos de translate_line: (in_class, has_staticmethod, has_classmethod)
+CONTEXTS = [(False, False, False), (True, False, False), (True, True, False), (True, False, True)]
+
+
+def test_baseline_covers_every_example():
+    assert sorted(BASELINE) == sorted(path.name for path in (ROOT / "examples").glob("*.logic"))
+
+
+@pytest.mark.parametrize("name", sorted(BASELINE))
+def test_translate_line_matches_baseline(name):
+    lines = (ROOT / "examples" / name).read_text(encoding="utf-8").splitlines()
+    expected = BASELINE[name]["lines"]
+    assert len(lines) == len(expected)
+    for line, outputs in zip(lines, expected):
+        if isinstance(outputs, str):
+            outputs = [outputs] * len(CONTEXTS)
+        assert [transpiler.translate_line(line, *context) for context in CONTEXTS] == outputs, line
+
+
+@pytest.mark.parametrize("name", sorted(BASELINE))
+def test_transpile_file_matches_baseline(name):
+    assert transpiler.transpile_file(str(ROOT / "examples" / name)) == BASELINE[name]["transpile_file"]
@@ -0,0 +1,34 @@
+"""
+Testes do registro de macros (mython.macros).
+"""
+
+import pytest
+
+from mython.macros import DataScienceMacros, HTTPMacros, MacroRegistry
+from mython.macros.base import MacroError
+from mython.transpiler_lark import transpile_string
+
+
+@pytest.mark.parametrize("macro_class", [HTTPMacros, DataScienceMacros])
+def test_registry_table_holds_bound_expanders(macro_class):
+    registry = MacroRegistry()
+    macro = macro_class()
+    registry.register_module(macro)
+    for pattern_name in macro.get_patterns():
+        entry_macro, entry_pattern, expander, _ = registry.rules[f"macro_{pattern_name}"]
+        assert (entry_macro, entry_pattern) == (macro, pattern_name)
+        # O método _expand_* direto, sem passar por expand()
+        assert expander.__self__ is macro
+        assert expander.__func__ is macro_class._EXPANDERS[pattern_name]
+
+
+def test_unknown_pattern_raises_macro_error():
+    with pytest.raises(MacroError):
+        HTTPMacros().get_expander("nope")
+    with pytest.raises(MacroError):
+        DataScienceMacros().expand("nope", [], None)
+
+
+def test_macro_expansion_end_to_end():
+    python = transpile_string('show df head 3\nsay "ok"\n', lang="en", use_cache=False)
+    assert python.splitlines() == ["import pandas as pd", "", "print(df.head(3))", 'print("ok")']
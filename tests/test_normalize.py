@@ -0,0 +1,78 @@
+"""
+Testes da normalização de condições (mython.normalize).
+"""
+
+import pytest
+
+from mython.normalize import ConditionNormalizer, normalize_condition, normalize_conditions
+
+
+@pytest.mark.parametrize("source, expected", [
+    ("if age is greater than or equal to 18:", "if age >= 18:"),
+    ("elif score is less than or equal to 5:", "elif score <= 5:"),
+    ("while count is not equal to 10:", "while count != 10:"),
+    ("if age is at least 18 and age is at most 65:", "if age >= 18 and age <= 65:"),
+    ("if item is not in items:", "if item not in items:"),
+    ("whenever total equals 3:", "whenever total == 3:"),
+    ("if x is over 1 or y is below 2:", "if x > 1 or y < 2:"),
+    ("if name is ana:", "if name == ana:"),
+])
+def test_multi_word_phrases(source, expected):
+    assert normalize_conditions(source + "\n") == expected + "\n"
+
+
+@pytest.mark.parametrize("source, expected", [
+    # A frase mais longa vence a que é seu prefixo
+    ("a is greater than or equal to b", "a >= b"),
+    ("a is greater than b", "a > b"),
+    ("a greater than or equal to b", "a >= b"),
+    ("a less than or equal to b", "a <= b"),
+    ("a is not equal to b", "a != b"),
+    ("a is not b", "a != b"),
+    ("a is not in b", "a not in b"),
+    ("a is in b", "a in b"),
+    ("a is above b", "a > b"),
+])
+def test_longest_phrase_wins(source, expected):
+    assert normalize_condition(source) == expected
+
+
+def test_phrases_inside_strings_are_untouched():
+    code = (
+        'if name is "is greater than" and age is at least 3:\n'
+        "    say 'x is less than y'\n"
+        'say "if a is over b: ok"\n'
+        'if label == "a: b" and x is over 2:\n'
+    )
+    assert normalize_conditions(code) == (
+        'if name == "is greater than" and age >= 3:\n'
+        "    say 'x is less than y'\n"
+        'say "if a is over b: ok"\n'
+        'if label == "a: b" and x > 2:\n'
+    )
+
+
+def test_phrases_inside_comments_are_untouched():
+    code = (
+        "# if x is greater than 5:\n"
+        "x = 1  # while a is b: c\n"
+        "if x is greater than 5:  # when y is less than 3: z\n"
+        'if s == "#" and x is over 2:\n'
+    )
+    assert normalize_conditions(code) == (
+        "# if x is greater than 5:\n"
+        "x = 1  # while a is b: c\n"
+        "if x > 5:  # when y is less than 3: z\n"
+        'if s == "#" and x > 2:\n'
+    )
+
+
+def test_lines_without_conditions_are_untouched():
+    code = "say x is greater than y\ntotal = a is b\n"
+    assert normalize_conditions(code) is code
+
+
+def test_custom_phrase_table_prefers_longer_phrase():
+    normalizer = ConditionNormalizer((("below", "<"), ("below or equal to", "<=")))
+    assert normalizer("a below or equal to b") == "a <= b"
+    assert normalizer("a below b") == "a < b"
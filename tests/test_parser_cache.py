@@ -0,0 +1,88 @@
+"""
+Testes do cache de parsers (mython.parser_cache).
+"""
+
+import os
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mython import parser_cache
+from mython.transpiler_lark import transpile_string
+
+# Blocos aninhados: o MythonIndenter precisa acompanhar a indentação do
+# começo ao fim do parse
+NESTED_BLOCKS = "\n".join([
+    "x = 1",
+    "if x > 0:",
+    "    if x > 1:",
+    "        print(x)",
+    "    else:",
+    "        print(0)",
+    "print(x)",
+] * 30) + "\n"
+
+
+@pytest.fixture
+def fast_thread_switch():
+    """Troca de thread a cada poucas instruções, para expor corridas."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def test_parser_is_reused_within_a_thread():
+    assert parser_cache.get_parser() is parser_cache.get_parser()
+
+
+def test_each_thread_gets_its_own_parser():
+    main_parser = parser_cache.get_parser()
+    parsers = []
+    thread = threading.Thread(target=lambda: parsers.append(parser_cache.get_parser()))
+    thread.start()
+    thread.join()
+    assert parsers[0] is not main_parser
+    assert parsers[0].options.postlex is not main_parser.options.postlex
+
+
+def test_concurrent_parses_match_sequential(fast_thread_switch):
+    expected = transpile_string(NESTED_BLOCKS, use_cache=False)
+
+    def transpile(_):
+        return transpile_string(NESTED_BLOCKS, use_cache=False)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(transpile, range(200)))
+
+    assert results == [expected] * len(results)
+
+
+def test_packed_tables_parse_like_lark():
+    import lark
+
+    grammar = parser_cache.compose_grammar(parser_cache.load_grammar())
+    reference = lark.Lark(grammar, start='start', parser='lalr', postlex=parser_cache.MythonIndenter())
+    packed = parser_cache.build_parser(grammar)
+    code = NESTED_BLOCKS + 'd = {nome: "a {b}", "x": {y: [1, 2]}}\nprint(d)\n'
+    assert packed.parse(code) == reference.parse(code)
+
+
+def test_common_path_defers_sqlite_and_entry_points(tmp_path):
+    # Transpilar em inglês não consulta o cache de traduções nem procura
+    # plugins de macros, se nenhum pacote instalado publica o grupo
+    source = tmp_path / "hello.logic"
+    source.write_text('say "hi"\n', encoding="utf-8")
+    script = (
+        "import sys\n"
+        "from mython.cli import main\n"
+        f"sys.argv = ['mython', {str(source)!r}]\n"
+        "main()\n"
+        "print(sorted({'sqlite3', 'importlib.metadata'} & set(sys.modules)))\n"
+    )
+    env = {**os.environ, "MYTHON_CACHE_DIR": str(tmp_path / "cache")}
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, env=env, check=True)
+    assert result.stdout.splitlines()[-1] == "[]"
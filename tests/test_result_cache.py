@@ -0,0 +1,27 @@
+"""
+Testes do cache de resultados (mython.result_cache).
+"""
+
+from pathlib import Path
+
+from mython import result_cache
+
+PACKAGE = Path(result_cache.__file__).parent
+
+
+def _fingerprinted():
+    return {path.relative_to(PACKAGE).as_posix() for path in result_cache.pipeline_files()}
+
+
+def test_every_pipeline_module_is_fingerprinted():
+    files = _fingerprinted()
+    for name in ("transpiler_lark.py", "transformer_lark.py", "normalize.py", "patterns.py",
+                 "lark_runtime.py", "translator.py", "translator_async.py", "translation_cache.py",
+                 "i18n/translate_keywords.py", "macros/base.py"):
+        assert name in files
+
+
+def test_front_ends_are_not_fingerprinted():
+    files = _fingerprinted()
+    for name in ("result_cache.py", "cli.py", "server.py", "_parser_standalone.py"):
+        assert name not in files
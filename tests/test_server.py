@@ -0,0 +1,154 @@
+"""
+Testes do servidor de transpilação (mython.server).
+"""
+
+import io
+import json
+import os
+import socket
+import threading
+
+import pytest
+
+from mython import server as server_module
+from mython.server import TranspileServer, serve_stdio
+
+needs_unix_sockets = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="sem sockets Unix")
+
+
+@pytest.fixture(scope="module")
+def server():
+    transpile_server = TranspileServer(workers=0)
+    yield transpile_server
+    transpile_server.shutdown()
+
+
+def assert_response_shape(response):
+    assert {"python", "timings", "errors"} <= set(response)
+
+
+def test_handle_echoes_id_and_reports_timings(server):
+    response = server.handle({"id": 7, "code": "say 1", "lang": "en"})
+    assert response["id"] == 7
+    assert response["python"] == "print(1)"
+    assert response["errors"] == []
+    assert response["timings"]["total"] >= response["timings"]["parse"] > 0
+
+
+def test_handle_reports_syntax_errors(server):
+    response = server.handle({"id": "x", "code": "if if if", "lang": "en"})
+    assert response["id"] == "x"
+    assert response["python"] is None
+    assert response["errors"][0]["type"] == "SyntaxError"
+    assert "total" in response["timings"]
+
+
+def test_handle_rejects_requests_without_code(server):
+    response = server.handle({"id": 1})
+    assert_response_shape(response)
+    assert response["errors"][0]["message"] == "campo 'code' ausente"
+
+
+def test_control_ops(server):
+    server.handle({"code": "say 1", "lang": "en"})
+    assert server.handle({"op": "ping", "id": 2}) == {"id": 2, "pong": True}
+    stats = server.handle({"op": "stats"})["stats"]
+    assert stats["requests"] >= 1
+    assert stats["in_flight"] == 0
+    assert stats["p50_ms"] <= stats["p99_ms"]
+    unknown = server.handle({"op": "reload"})
+    assert_response_shape(unknown)
+    assert "reload" in unknown["errors"][0]["message"]
+
+
+def test_submit_returns_future(server):
+    futures = [server.submit({"id": i, "code": f"say {i}", "lang": "en"}) for i in range(5)]
+    assert [f.result()["python"] for f in futures] == [f"print({i})" for i in range(5)]
+
+
+def test_stdio_reports_malformed_lines(server):
+    stdin = io.StringIO('not json\n\n[1, 2]\n{"id": 1, "code": "say 1", "lang": "en"}\n')
+    stdout = io.StringIO()
+    serve_stdio(server, stdin, stdout)
+    responses = [json.loads(line) for line in stdout.getvalue().splitlines()]
+    assert len(responses) == 3
+    for response in responses:
+        assert_response_shape(response)
+    assert "JSON inválido" in responses[0]["errors"][0]["message"]
+    assert "objeto JSON" in responses[1]["errors"][0]["message"]
+    assert responses[2] == {**responses[2], "id": 1, "python": "print(1)", "errors": []}
+
+
+def test_stdio_answers_out_of_order_by_id(server, monkeypatch):
+    fast_done = threading.Event()
+    transpile = server_module._transpile
+
+    def fake_transpile(code, lang, use_cache):
+        # O pedido lento só termina depois do rápido
+        if code == "say 1":
+            assert fast_done.wait(5)
+        response = transpile(code, lang, use_cache)
+        if code == "say 2":
+            fast_done.set()
+        return response
+
+    monkeypatch.setattr(server_module, "_transpile", fake_transpile)
+    stdin = io.StringIO(
+        '{"id": "slow", "code": "say 1", "lang": "en"}\n'
+        '{"id": "fast", "code": "say 2", "lang": "en"}\n'
+    )
+    stdout = io.StringIO()
+    serve_stdio(server, stdin, stdout)
+    responses = [json.loads(line) for line in stdout.getvalue().splitlines()]
+    assert [r["id"] for r in responses] == ["fast", "slow"]
+    assert {r["id"]: r["python"] for r in responses} == {"slow": "print(1)", "fast": "print(2)"}
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    # Caminhos de socket Unix têm limite de ~100 bytes
+    path = tmp_path / "m.sock"
+    if len(str(path)) > 100:
+        pytest.skip("caminho temporário longo demais para um socket Unix")
+    return str(path)
+
+
+@needs_unix_sockets
+def test_unix_socket_serves_requests_after_invalid_utf8(server, socket_path):
+    unix_server = server_module._unix_server(server, socket_path)
+    thread = threading.Thread(target=unix_server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(10)
+            client.connect(socket_path)
+            client.sendall(b'\xff\n{"id": 1, "code": "say 1", "lang": "en"}\n')
+            reader = client.makefile("rb")
+            invalid = json.loads(reader.readline())
+            valid = json.loads(reader.readline())
+    finally:
+        unix_server.shutdown()
+        unix_server.server_close()
+        thread.join()
+    assert_response_shape(invalid)
+    assert "JSON inválido" in invalid["errors"][0]["message"]
+    assert valid["id"] == 1 and valid["python"] == "print(1)"
+
+
+@needs_unix_sockets
+def test_unix_socket_replaces_stale_socket(server, socket_path):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+        stale.bind(socket_path)
+    unix_server = server_module._unix_server(server, socket_path)
+    unix_server.server_close()
+
+
+@needs_unix_sockets
+def test_unix_socket_refuses_to_replace_regular_file(server, socket_path):
+    with open(socket_path, "w") as f:
+        f.write("dados")
+    with pytest.raises(FileExistsError):
+        server_module._unix_server(server, socket_path).server_close()
+    assert os.path.isfile(socket_path)
+    with open(socket_path) as f:
+        assert f.read() == "dados"
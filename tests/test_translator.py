@@ -0,0 +1,59 @@
+"""
+Testes do tradutor de palavras-chave (mython.translator).
+"""
+
+import pytest
+
+from mython import transpiler_lark, translator
+from mython.translator_async import AsyncLibreTranslateBackend
+
+PORTUGUESE = 'idade = 20\nse idade > 18:\n    diga "adulto"\n'
+
+
+@pytest.fixture(autouse=True)
+def default_backend():
+    """Cada teste começa (e termina) com o backend padrão recriado."""
+    translator.set_backend(None)
+    yield
+    translator.set_backend(None)
+
+
+def test_default_backend_is_offline(monkeypatch):
+    monkeypatch.delenv("MYTHON_LIBRETRANSLATE_URL", raising=False)
+    names = [backend.name for backend in translator.get_backend().backends]
+    assert names == ["dictionary", "argostranslate"]
+
+
+def test_default_transpile_sends_nothing_over_the_network(monkeypatch):
+    monkeypatch.delenv("MYTHON_LIBRETRANSLATE_URL", raising=False)
+    sent = []
+    monkeypatch.setattr(AsyncLibreTranslateBackend, "translate_batch",
+                        lambda self, words, *args: sent.extend(words) or {})
+    translator.translate_code(PORTUGUESE, use_cache=False, source_lang="pt")
+    assert sent == []
+
+
+def test_configured_server_receives_unknown_words(monkeypatch):
+    monkeypatch.setenv("MYTHON_LIBRETRANSLATE_URL", "http://127.0.0.1:5000")
+    sent = []
+    monkeypatch.setattr(AsyncLibreTranslateBackend, "translate_batch",
+                        lambda self, words, *args: sent.extend(words) or {})
+    translator.translate_code(PORTUGUESE, use_cache=False, source_lang="pt")
+    assert "idade" in sent
+
+
+def test_libretranslate_only_with_explicit_url(monkeypatch):
+    monkeypatch.setenv("MYTHON_LIBRETRANSLATE_URL", "http://127.0.0.1:5000")
+    backends = translator.get_backend().backends
+    assert [backend.name for backend in backends] == ["dictionary", "libretranslate-async", "argostranslate"]
+    assert backends[1].url == "http://127.0.0.1:5000"
+
+
+def test_result_cache_key_depends_on_backend(monkeypatch):
+    monkeypatch.delenv("MYTHON_LIBRETRANSLATE_URL", raising=False)
+    offline = transpiler_lark._cache_options(True)
+    translator.set_backend(None)
+    monkeypatch.setenv("MYTHON_LIBRETRANSLATE_URL", "http://127.0.0.1:5000")
+    online = transpiler_lark._cache_options(True)
+    assert offline != online
+    assert "libretranslate-async:http://127.0.0.1:5000" in online[-1]
@@ -0,0 +1,224 @@
+"""
+Testes do backend assíncrono do LibreTranslate (mython.translator_async).
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from mython.translator import BackendUnavailable
+from mython.translator_async import AsyncLibreTranslateBackend, CircuitBreaker
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    Servidor LibreTranslate mínimo, com keep-alive. O modo de resposta vem
+    de `self.server.mode`: "length" (Content-Length), "chunked",
+    "close" (sem tamanho, fecha a conexão) ou "error" (HTTP 500).
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        server = self.server
+        query = json.loads(self.rfile.read(int(self.headers["Content-Length"])))["q"]
+        with server.lock:
+            server.requests += 1
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            time.sleep(server.delay)
+            self._reply(server.mode, query)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def _reply(self, mode, query):
+        if mode == "error":
+            self.send_response(500)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        data = json.dumps({"translatedText": "if" if query == "se" else query}).encode()
+        self.send_response(200)
+        if mode == "chunked":
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            # Pedaços de 5 bytes, um com extensão de chunk
+            for start in range(0, len(data), 5):
+                chunk = data[start:start + 5]
+                extension = ";ext=1" if start == 0 else ""
+                self.wfile.write(f"{len(chunk):x}{extension}\r\n".encode() + chunk + b"\r\n")
+            self.wfile.write(b"0\r\n\r\n")
+        elif mode == "close":
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.wfile.write(data)
+            self.close_connection = True
+        else:
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stand_in():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    server.mode = "length"
+    server.delay = 0.0
+    server.lock = threading.Lock()
+    server.requests = server.in_flight = server.max_in_flight = 0
+    server.url = f"http://127.0.0.1:{server.server_port}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def server_url(stand_in):
+    return stand_in.url
+
+
+@pytest.fixture
+def backends():
+    """Cria backends e fecha todos no fim do teste."""
+    created = []
+
+    def make(*args, **kwargs):
+        backend = AsyncLibreTranslateBackend(*args, **kwargs)
+        created.append(backend)
+        return backend
+
+    yield make
+    for backend in created:
+        backend.close()
+
+
+def test_close_releases_connections_and_loop(server_url):
+    backend = AsyncLibreTranslateBackend(server_url)
+    assert backend.translate_batch(["se", "idade"], "pt") == {"se": "if", "idade": "idade"}
+    idle = list(backend.pool._idle)
+    loop, thread = backend._loop, backend._thread
+    assert idle
+
+    backend.close()
+
+    assert all(writer.is_closing() for _, writer in idle)
+    assert not thread.is_alive()
+    assert loop.is_closed()
+
+
+def test_backend_reopens_after_close(server_url):
+    backend = AsyncLibreTranslateBackend(server_url)
+    backend.translate_batch(["se"], "pt")
+    backend.close()
+    assert backend.translate_batch(["se"], "pt") == {"se": "if"}
+    backend.close()
+
+
+@pytest.mark.parametrize("mode", ["length", "chunked", "close"])
+def test_response_framing(stand_in, backends, mode):
+    stand_in.mode = mode
+    backend = backends(stand_in.url, concurrency=2)
+    words = ["se", "enquanto", "para", "retorne"]
+    expected = {"se": "if", "enquanto": "enquanto", "para": "para", "retorne": "retorne"}
+    assert backend.translate_batch(words, "pt") == expected
+    assert backend.translate_batch(words, "pt") == expected
+    if mode == "close":
+        # Sem tamanho: lê até o fim e não reaproveita a conexão
+        assert backend.pool.stats["reused"] == 0
+        assert backend.pool.stats["connections"] == 2 * len(words)
+    else:
+        assert backend.pool.stats["reused"] > 0
+        assert backend.pool.stats["connections"] <= 2
+
+
+def test_concurrency_limit(stand_in, backends):
+    stand_in.delay = 0.05
+    backend = backends(stand_in.url, concurrency=3)
+    words = [f"palavra{i}" for i in range(12)]
+    assert backend.translate_batch(words, "pt") == {word: word for word in words}
+    assert stand_in.requests == len(words)
+    assert stand_in.max_in_flight == 3
+    assert backend.pool.stats["connections"] <= 3
+
+
+def test_breaker_states():
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=0.05)
+    assert breaker.state == "closed" and breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open" and not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.state == "half-open"
+    # Só a sonda passa até registrar o resultado
+    assert [breaker.allow() for _ in range(5)] == [True, False, False, False, False]
+    breaker.record_failure()
+    assert breaker.state == "open" and not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert all(breaker.allow() for _ in range(5))
+
+
+def test_half_open_probe_is_exclusive_across_threads():
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=0.0)
+    breaker.record_failure()
+    barrier = threading.Barrier(8)
+    allowed = []
+
+    def call():
+        barrier.wait()
+        allowed.append(breaker.allow())
+
+    threads = [threading.Thread(target=call) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert allowed.count(True) == 1
+
+
+def test_breaker_stops_calling_dead_endpoint(stand_in, backends):
+    stand_in.mode = "error"
+    backend = backends(stand_in.url, concurrency=1, breaker=CircuitBreaker(failure_threshold=3, cooldown=0.2))
+    words = [f"palavra{i}" for i in range(5)]
+
+    with pytest.raises(BackendUnavailable):
+        backend.translate_batch(words, "pt")
+    # Abriu depois de 3 falhas: as outras palavras nem foram enviadas
+    assert stand_in.requests == 3
+    assert backend.breaker.state == "open"
+
+    with pytest.raises(BackendUnavailable, match="disjuntor aberto"):
+        backend.translate_batch(words, "pt")
+    assert stand_in.requests == 3
+
+    # Meio-aberto com o servidor ainda fora: mesmo com todas as palavras
+    # em paralelo, só a sonda é enviada
+    backend.concurrency = len(words)
+    time.sleep(0.25)
+    with pytest.raises(BackendUnavailable):
+        backend.translate_batch(words, "pt")
+    assert stand_in.requests == 4
+    assert backend.breaker.state == "open"
+
+    # Meio-aberto com o servidor de volta: a sonda fecha o disjuntor e o
+    # lote inteiro é traduzido
+    stand_in.mode = "length"
+    time.sleep(0.25)
+    assert backend.translate_batch(words, "pt") == {word: word for word in words}
+    assert stand_in.requests == 4 + len(words)
+    assert backend.breaker.state == "closed"
@@ -0,0 +1,45 @@
+"""
+Testes do modo watch (mython.watch).
+"""
+
+import threading
+
+from mython import watch
+from mython.build import BuildReport
+
+
+def test_failed_rebuild_is_reported_and_watch_continues(tmp_path, monkeypatch):
+    (tmp_path / "main.logic").write_text("say 1\n")
+    builds = []
+    rebuilt = threading.Event()
+
+    def fake_build_tree(src_dir, out_dir=None, jobs=1, lang=None):
+        builds.append(src_dir)
+        if len(builds) == 2:
+            raise FileNotFoundError("main.logic")
+        if len(builds) == 3:
+            rebuilt.set()
+        return BuildReport()
+
+    monkeypatch.setattr(watch, "build_tree", fake_build_tree)
+    results = []
+    watcher = watch.Watcher(str(tmp_path), use_polling=True, debounce=0.01,
+                            on_result=lambda result, latency: results.append(result))
+    thread = threading.Thread(target=watcher.run, daemon=True)
+    thread.start()
+    try:
+        watcher._events.put("main.logic")
+        # Segundo lote depois do erro: o watch continua rodando
+        for _ in range(200):
+            if len(builds) >= 2:
+                break
+            threading.Event().wait(0.01)
+        watcher._events.put("main.logic")
+        assert rebuilt.wait(5)
+    finally:
+        watcher.stop()
+        thread.join(5)
+
+    assert not thread.is_alive()
+    assert [r.status for r in results] == ["error"]
+    assert "FileNotFoundError" in results[0].error